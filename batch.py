@@ -0,0 +1,142 @@
+import argparse
+import os
+import re
+import sys
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import as_completed
+from concurrent.futures import wait
+
+from textcore import checkReplacement
+from textcore import compilePattern
+from textcore import createPool
+from textcore import iterFiles
+from textcore import replaceFiles
+from textcore import searchFiles
+
+
+FILES_PER_TASK = 32
+MAX_PENDING_TASKS = 64
+
+
+def parseArguments(argv):
+    parser = argparse.ArgumentParser(prog='notepad', description='Блокнот')
+    parser.add_argument('files', nargs='*', help='файлы для открытия')
+    parser.add_argument('--new-window', action='store_true',
+                        help='открыть отдельное окно, а не передавать файлы запущенному')
+    # пакетный режим обходится без окна и без Qt
+    group = parser.add_argument_group('пакетная обработка')
+    group.add_argument('--find', metavar='PATTERN',
+                       help='вывести строки с совпадениями в файлах и каталогах')
+    group.add_argument('--replace', nargs=2, metavar=('PATTERN', 'REPL'),
+                       help='заменить все совпадения в файлах и каталогах')
+    group.add_argument('-r', '--regex', action='store_true', help='PATTERN — регулярное выражение')
+    group.add_argument('-i', '--ignore-case', action='store_true', help='не учитывать регистр')
+    group.add_argument('-w', '--whole-word', action='store_true', help='только слово целиком')
+    group.add_argument('-n', '--dry-run', action='store_true',
+                       help='только посчитать замены, файлы не менять')
+    group.add_argument('-j', '--jobs', type=int, default=None,
+                       help='число процессов (по умолчанию — по числу ядер)')
+    arguments = parser.parse_args(argv)
+    if arguments.find is not None and arguments.replace is not None:
+        parser.error('--find и --replace нельзя указать вместе')
+    if isBatch(arguments) and not arguments.files:
+        parser.error('не указаны файлы')
+    if isBatch(arguments) and not (arguments.find or arguments.replace[0]):
+        parser.error('пустой PATTERN')
+    return arguments
+
+
+def isBatch(arguments):
+    return arguments.find is not None or arguments.replace is not None
+
+
+def expandPaths(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            yield from iterFiles(path)
+        else:
+            yield path
+
+
+def iterBatches(paths):
+    batch = []
+    for path in expandPaths(paths):
+        batch.append(path)
+        if len(batch) == FILES_PER_TASK:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def runTasks(task, paths, arguments, report, jobs=None):
+    if jobs == 1:
+        for batch in iterBatches(paths):
+            report(task(batch, *arguments))
+        return
+    # очередь задач ограничена: обход большого дерева не держит
+    # в памяти все порции сразу
+    pending = set()
+    with createPool(jobs) as pool:
+        for batch in iterBatches(paths):
+            pending.add(pool.submit(task, batch, *arguments))
+            if len(pending) >= MAX_PENDING_TASKS:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    report(future.result())
+        for future in as_completed(pending):
+            report(future.result())
+
+
+def runBatch(arguments, out=None, err=None):
+    out = out or sys.stdout
+    err = err or sys.stderr
+    text = arguments.find if arguments.find is not None else arguments.replace[0]
+    try:
+        pattern = compilePattern(text, arguments.regex, not arguments.ignore_case,
+                                 arguments.whole_word)
+        if arguments.replace is not None:
+            checkReplacement(pattern, arguments.replace[1], arguments.regex)
+    except re.error as error:
+        err.write('notepad: ошибка в выражении: %s\n' % error)
+        return 2
+    # без регулярного выражения и учёта регистра файлы без
+    # совпадений отсеиваются поиском байтов
+    needle = text if not arguments.regex and not arguments.ignore_case else None
+    totals = {'files': 0, 'matched': 0, 'count': 0, 'errors': 0}
+
+    def reportFound(result):
+        count, found = result
+        totals['files'] += count
+        for path, results in found:
+            totals['matched'] += 1
+            totals['count'] += len(results)
+            for number, line in results:
+                out.write('%s:%d:%s\n' % (path, number + 1, line))
+
+    def reportReplaced(result):
+        count, results = result
+        totals['files'] += count
+        for path, replaced in results:
+            if isinstance(replaced, str):
+                totals['errors'] += 1
+                err.write('notepad: %s: %s\n' % (path, replaced))
+                continue
+            totals['matched'] += 1
+            totals['count'] += replaced
+            out.write('%s: %d\n' % (path, replaced))
+
+    if arguments.find is not None:
+        # поиск читает файлы как UTF-8
+        needle = needle.encode('utf-8') if needle is not None else None
+        runTasks(searchFiles, arguments.files, (pattern, needle), reportFound, arguments.jobs)
+        err.write('Просмотрено файлов: %(files)d, совпадений: %(count)d в %(matched)d\n' % totals)
+    else:
+        runTasks(replaceFiles, arguments.files,
+                 (pattern, arguments.replace[1], arguments.regex, needle, arguments.dry_run),
+                 reportReplaced, arguments.jobs)
+        err.write('Просмотрено файлов: %(files)d, замен: %(count)d в %(matched)d, ошибок: %(errors)d\n'
+                  % totals)
+    if totals['errors']:
+        return 2
+    return 0 if totals['matched'] else 1
@@ -0,0 +1,185 @@
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5 import QtCore
+from PyQt5 import QtWidgets
+
+import notepad
+from bench_startup import measureStartup
+
+
+SIZES = '1M,16M,128M,1G'
+REPEAT = 100
+LINE = 'Съешь же ещё этих мягких французских булок, да выпей чаю. needle 0123456789\n'
+UNITS = {'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def parseSize(text):
+    text = text.strip().upper()
+    if text[-1:] in UNITS:
+        return int(float(text[:-1]) * UNITS[text[-1]])
+    return int(text)
+
+
+def generateFile(filename, size):
+    block = LINE.encode('utf-8') * (1024 * 1024 // len(LINE.encode('utf-8')))
+    with open(filename, 'wb') as file:
+        written = 0
+        while written < size:
+            data = block[:size - written]
+            file.write(data)
+            written += len(data)
+
+
+def stubDialogs():
+    # в пакетном прогоне никто не нажмёт кнопку в окне сообщения
+    QtWidgets.QMessageBox.information = staticmethod(lambda *args: QtWidgets.QMessageBox.Ok)
+    QtWidgets.QMessageBox.warning = staticmethod(lambda *args: QtWidgets.QMessageBox.Ok)
+    QtWidgets.QMessageBox.question = staticmethod(lambda *args: QtWidgets.QMessageBox.No)
+
+
+def waitUntil(condition):
+    while not condition():
+        QtWidgets.QApplication.processEvents(QtCore.QEventLoop.AllEvents, 50)
+
+
+def timed(func, repeat=1):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - started) / repeat
+
+
+def benchOpen(window, filename):
+    def openFile():
+        window.openPath(filename)
+        if window.isViewerActive():
+            waitUntil(window.viewer.isIndexed)
+        else:
+            waitUntil(lambda: window.loader is None)
+    return timed(openFile)
+
+
+def benchSearch(window, repeat):
+    window.findText()
+    window.search_text.setText('needle')
+    # фоновый подсчёт совпадений замерялся бы вместе с поиском
+    window.clearHighlight()
+    result = timed(window.searchText, repeat)
+    window.find_dialog.close()
+    return result
+
+
+def benchReplace(window, repeat):
+    window.replace()
+    window.search_text.setText('needle')
+    window.replace_text.setText('pin')
+    window.clearHighlight()
+    replace_text = timed(window.replace_button.click, repeat)
+
+    def replaceAll():
+        window.replace_all_button.click()
+        waitUntil(lambda: window.replacer is None)
+    replace_all = timed(replaceAll)
+    window.replace_dialog.close()
+    return replace_text, replace_all
+
+
+def benchSave(window):
+    def saveFile():
+        window.saveFile()
+        window.waitForSave()
+    return timed(saveFile)
+
+
+def benchKeystroke(window, repeat):
+    window.text.moveCursor(window.text.textCursor().End)
+
+    def keystroke():
+        window.text.insertPlainText('x')
+        QtWidgets.QApplication.processEvents()
+    return timed(window.findEnable, repeat), timed(keystroke, repeat)
+
+
+def benchSize(directory, size, repeat):
+    filename = os.path.join(directory, 'bench_%d.txt' % size)
+    generateFile(filename, size)
+    window = notepad.Notepad()
+    window.show()
+    result = {'bytes': size, 'open': benchOpen(window, filename)}
+    result['searchText'] = benchSearch(window, repeat)
+    if window.isViewerActive():
+        # просмотрщик только читает файл: замена и сохранение недоступны
+        result['viewer'] = True
+    else:
+        result['viewer'] = False
+        result['replaceText'], result['replaceAll'] = benchReplace(window, repeat)
+        result['saveFile'] = benchSave(window)
+        result['findEnable'], result['keystroke'] = benchKeystroke(window, repeat)
+    window.text.document().setModified(False)
+    window.close()
+    window.deleteLater()
+    QtWidgets.QApplication.processEvents()
+    os.remove(filename)
+    return result
+
+
+def currentCommit():
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=REPO_DIR,
+                              stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                              check=True).stdout.decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Замеры производительности блокнота')
+    parser.add_argument('--sizes', default=SIZES, help='размеры документов, например 1M,16M,1G')
+    parser.add_argument('--repeat', type=int, default=REPEAT, help='повторов коротких операций')
+    parser.add_argument('--startup-runs', type=int, default=10, help='запусков для замера старта')
+    parser.add_argument('--output', default='bench_results.json', help='файл с результатами')
+    args = parser.parse_args()
+
+    output = os.path.abspath(args.output)
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+    stubDialogs()
+    report = {
+        'commit': currentCommit(),
+        'date': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'qt': QtCore.QT_VERSION_STR,
+        'platform': platform.platform(),
+        'repeat': args.repeat,
+        'results': [],
+    }
+    if args.startup_runs:
+        report['startup'] = measureStartup(args.startup_runs)
+    # notepad.ini и журналы правок остаются во временном каталоге
+    with tempfile.TemporaryDirectory() as directory:
+        cwd = os.getcwd()
+        os.chdir(directory)
+        try:
+            for size in args.sizes.split(','):
+                result = benchSize(directory, parseSize(size), args.repeat)
+                report['results'].append(result)
+                print(json.dumps(result), flush=True)
+        finally:
+            os.chdir(cwd)
+    with open(output, 'w', encoding='utf-8') as file:
+        json.dump(report, file, indent=2)
+    print('Результаты записаны в %s' % output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+
+RUNS = 10
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def child():
+    started = time.perf_counter()
+    from PyQt5 import QtCore
+    from PyQt5 import QtWidgets
+
+    import notepad
+    imported = time.perf_counter()
+
+    app = QtWidgets.QApplication(sys.argv)
+    window = notepad.Notepad()
+    created = time.perf_counter()
+
+    class PaintWatcher(QtCore.QObject):
+
+        def eventFilter(self, watched, event):
+            if event.type() == QtCore.QEvent.Paint:
+                painted = time.perf_counter()
+                print(json.dumps({
+                    'import': imported - started,
+                    'create': created - imported,
+                    'paint': painted - created,
+                }), flush=True)
+                # закрытие окна записало бы настройки, поэтому выходим сразу
+                os._exit(0)
+            return False
+
+    watcher = PaintWatcher()
+    window.text.viewport().installEventFilter(watcher)
+    window.show()
+    app.exec_()
+
+
+def measureStartup(runs=RUNS):
+    env = dict(os.environ, QT_QPA_PLATFORM='offscreen', PYTHONDONTWRITEBYTECODE='1')
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [REPO_DIR, env.get('PYTHONPATH')]))
+    results = []
+    # пустой рабочий каталог: без notepad.ini каждый запуск одинаков
+    with tempfile.TemporaryDirectory() as directory:
+        for _ in range(runs):
+            started = time.perf_counter()
+            output = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), '--child'], cwd=directory,
+                env=env, stdout=subprocess.PIPE, check=True).stdout
+            total = time.perf_counter() - started
+            result = json.loads(output.decode('utf-8').splitlines()[-1])
+            result['total'] = total
+            results.append(result)
+    return {key: statistics.median(result[key] for result in results)
+            for key in ('import', 'create', 'paint', 'total')}
+
+
+if __name__ == '__main__':
+    if '--child' in sys.argv:
+        child()
+    else:
+        runs = int(sys.argv[1]) if len(sys.argv) > 1 else RUNS
+        for key, value in measureStartup(runs).items():
+            print('%-8s %7.1f мс' % (key, value * 1000))
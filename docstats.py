@@ -0,0 +1,77 @@
+from array import array
+
+from PyQt5 import QtCore
+
+
+def changedBlocks(document, position, added, old_count):
+    # номера блоков, затронутых правкой: первый, последний до правки
+    # и последний после правки (включительно)
+    position = min(position, document.characterCount() - 1)
+    end = min(position + added, document.characterCount() - 1)
+    first = document.findBlock(position).blockNumber()
+    last = document.findBlock(end).blockNumber()
+    return first, last - (document.blockCount() - old_count), last
+
+
+def blockStats(text):
+    words = text.split()
+    return len(words), sum(map(len, words))
+
+
+class DocumentStats(QtCore.QObject):
+
+    changed = QtCore.pyqtSignal()
+
+    def __init__(self, document, parent=None):
+        super(DocumentStats, self).__init__(parent)
+        self.document = document
+        self.reset()
+        document.contentsChange.connect(self.onContentsChange)
+
+    def reset(self):
+        # полный проход выполняется только при подключении к документу
+        self.block_words = array('q')
+        self.block_non_space = array('q')
+        block = self.document.begin()
+        while block.isValid():
+            words, non_space = blockStats(block.text())
+            self.block_words.append(words)
+            self.block_non_space.append(non_space)
+            block = block.next()
+        self.word_count = sum(self.block_words)
+        self.non_space_count = sum(self.block_non_space)
+        self.changed.emit()
+
+    def onContentsChange(self, position, removed, added):
+        first, old_last, last = changedBlocks(
+            self.document, position, added, len(self.block_words))
+
+        self.word_count -= sum(self.block_words[first:old_last + 1])
+        self.non_space_count -= sum(self.block_non_space[first:old_last + 1])
+
+        words = array('q')
+        non_space = array('q')
+        block = self.document.findBlockByNumber(first)
+        for _ in range(last - first + 1):
+            block_words, block_non_space = blockStats(block.text())
+            words.append(block_words)
+            non_space.append(block_non_space)
+            block = block.next()
+
+        self.block_words[first:old_last + 1] = words
+        self.block_non_space[first:old_last + 1] = non_space
+        self.word_count += sum(words)
+        self.non_space_count += sum(non_space)
+        self.changed.emit()
+
+    def characters(self):
+        return self.document.characterCount() - 1
+
+    def lines(self):
+        return self.document.blockCount()
+
+    def words(self):
+        return self.word_count
+
+    def nonSpace(self):
+        return self.non_space_count
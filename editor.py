@@ -0,0 +1,229 @@
+from PyQt5 import QtCore
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+
+from longlines import hasSoftBreaks
+from longlines import isContinuation
+from longlines import textRange
+
+
+CHUNKED_PASTE_SIZE = 1024 * 1024
+# правка с клавиатуры не уходит далеко от выделения: слово или перевод строки
+EDIT_MARGIN = 4096
+GUTTER_PADDING = 4
+
+
+def parseTarget(text):
+    # «строка», «строка:столбец» или «@смещение»; номера с единицы
+    text = text.strip().replace(' ', '')
+    try:
+        if text.startswith('@'):
+            return 'offset', max(0, int(text[1:])), 0
+        line, _, column = text.partition(':')
+        return 'line', max(0, int(line) - 1), max(0, int(column or 1) - 1)
+    except ValueError:
+        return None
+
+
+class LineNumberArea(QtWidgets.QWidget):
+
+    def __init__(self, editor):
+        super(LineNumberArea, self).__init__(editor)
+        self.editor = editor
+
+    def sizeHint(self):
+        return QtCore.QSize(self.editor.lineNumberWidth(), 0)
+
+    def paintEvent(self, event):
+        self.editor.paintLineNumbers(event)
+
+
+class TextEdit(QtWidgets.QPlainTextEdit):
+
+    pasteRequested = QtCore.pyqtSignal(str)
+
+    def __init__(self, parent=None):
+        super(TextEdit, self).__init__(parent)
+        self.history = None
+        self.line_index = None
+        self.dropping = False
+        self.line_numbers = LineNumberArea(self)
+        self.blockCountChanged.connect(self.updateLineNumberWidth)
+        self.updateRequest.connect(self.updateLineNumbers)
+        self.updateLineNumberWidth()
+
+    def setDocument(self, document):
+        super(TextEdit, self).setDocument(document)
+        self.updateLineNumberWidth()
+
+    def setLineIndex(self, line_index):
+        self.line_index = line_index
+        self.line_numbers.update()
+
+    def hasSoftBreaks(self):
+        return self.line_index is not None and hasSoftBreaks(self.document())
+
+    def setLineNumbersVisible(self, visible):
+        self.line_numbers.setVisible(visible)
+        self.updateLineNumberWidth()
+
+    def lineNumberWidth(self):
+        if self.line_numbers.isHidden():
+            return 0
+        # ширина зависит только от числа строк, документ не обходится
+        digits = len(str(max(1, self.blockCount())))
+        return self.fontMetrics().horizontalAdvance('9') * digits + 2 * GUTTER_PADDING
+
+    def updateLineNumberWidth(self, count=0):
+        self.setViewportMargins(self.lineNumberWidth(), 0, 0, 0)
+
+    def updateLineNumbers(self, rect, dy):
+        if dy:
+            self.line_numbers.scroll(0, dy)
+        else:
+            self.line_numbers.update(0, rect.y(), self.line_numbers.width(), rect.height())
+
+    def resizeEvent(self, event):
+        super(TextEdit, self).resizeEvent(event)
+        rect = self.contentsRect()
+        self.line_numbers.setGeometry(QtCore.QRect(
+            rect.left(), rect.top(), self.lineNumberWidth(), rect.height()))
+
+    def paintLineNumbers(self, event):
+        painter = QtGui.QPainter(self.line_numbers)
+        painter.fillRect(event.rect(), self.palette().window())
+        painter.setPen(self.palette().color(QtGui.QPalette.Disabled, QtGui.QPalette.Text))
+        painter.setFont(self.font())
+        # рисуются только видимые блоки; номер первого берётся из дерева
+        # блоков документа, дальше просто увеличивается
+        block = self.firstVisibleBlock()
+        number = block.blockNumber()
+        soft = self.hasSoftBreaks()
+        if soft:
+            # продолжения длинной строки номера не получают
+            number -= self.line_index.softBefore(number)
+        top = self.blockBoundingGeometry(block).translated(self.contentOffset()).top()
+        width = self.line_numbers.width() - GUTTER_PADDING
+        height = self.fontMetrics().height()
+        while block.isValid() and top <= event.rect().bottom():
+            bottom = top + self.blockBoundingRect(block).height()
+            continuation = soft and isContinuation(block)
+            if block.isVisible() and bottom >= event.rect().top() and not continuation:
+                painter.drawText(0, int(top), width, height, QtCore.Qt.AlignRight, str(number + 1))
+            block = block.next()
+            top = bottom
+            if not (soft and isContinuation(block)):
+                number += 1
+
+    def setHistory(self, history):
+        if self.history is not None:
+            self.history.undoAvailable.disconnect(self.undoAvailable)
+            self.history.redoAvailable.disconnect(self.redoAvailable)
+        self.history = history
+        if history is not None:
+            history.undoAvailable.connect(self.undoAvailable)
+            history.redoAvailable.connect(self.redoAvailable)
+
+    def prepareEdit(self, start=None, end=None):
+        if self.history is None:
+            return
+        cursor = self.textCursor()
+        start = cursor.selectionStart() if start is None else start
+        end = cursor.selectionEnd() if end is None else end
+        self.history.prepare(max(0, start - EDIT_MARGIN), end + EDIT_MARGIN)
+
+    def undo(self):
+        if self.history is None:
+            super(TextEdit, self).undo()
+        elif not self.isReadOnly():
+            self.moveTo(self.history.undo())
+
+    def redo(self):
+        if self.history is None:
+            super(TextEdit, self).redo()
+        elif not self.isReadOnly():
+            self.moveTo(self.history.redo())
+
+    def moveTo(self, position):
+        if position is None:
+            return
+        cursor = self.textCursor()
+        cursor.setPosition(position)
+        self.setTextCursor(cursor)
+        self.ensureCursorVisible()
+
+    def keyPressEvent(self, event):
+        if self.history is not None:
+            # встроенные сочетания отмены обращаются к истории документа
+            if event.matches(QtGui.QKeySequence.Undo):
+                self.undo()
+                return
+            if event.matches(QtGui.QKeySequence.Redo):
+                self.redo()
+                return
+            if event.key() in (QtCore.Qt.Key_Backspace, QtCore.Qt.Key_Delete):
+                self.skipSoftBreak(event.key() == QtCore.Qt.Key_Delete)
+            if event.text() or event.key() in (QtCore.Qt.Key_Backspace, QtCore.Qt.Key_Delete):
+                self.prepareEdit()
+        super(TextEdit, self).keyPressEvent(event)
+
+    def skipSoftBreak(self, forward):
+        # мягкий перенос не символ файла: удаляется символ за ним
+        cursor = self.textCursor()
+        if cursor.hasSelection() or not self.hasSoftBreaks():
+            return
+        if forward and cursor.atBlockEnd() and isContinuation(cursor.block().next()):
+            cursor.movePosition(QtGui.QTextCursor.NextCharacter)
+        elif not forward and cursor.atBlockStart() and isContinuation(cursor.block()):
+            cursor.movePosition(QtGui.QTextCursor.PreviousCharacter)
+        else:
+            return
+        self.setTextCursor(cursor)
+
+    def inputMethodEvent(self, event):
+        self.prepareEdit()
+        super(TextEdit, self).inputMethodEvent(event)
+
+    def dropEvent(self, event):
+        # перенос внутри редактора удаляет выделение и вставляет текст
+        # в месте отпускания одной правкой
+        position = self.cursorForPosition(event.pos()).position()
+        if event.source() is self:
+            cursor = self.textCursor()
+            self.prepareEdit(min(position, cursor.selectionStart()),
+                             max(position, cursor.selectionEnd()))
+        else:
+            self.prepareEdit(position, position)
+        self.dropping = True
+        try:
+            super(TextEdit, self).dropEvent(event)
+        finally:
+            self.dropping = False
+
+    def cut(self):
+        self.prepareEdit()
+        super(TextEdit, self).cut()
+
+    def createMimeDataFromSelection(self):
+        # только обычный текст: без копии фрагмента документа и без HTML
+        mime = QtCore.QMimeData()
+        cursor = self.textCursor()
+        mime.setText(textRange(self.document(), cursor.selectionStart(), cursor.selectionEnd(), ''))
+        return mime
+
+    def insertFromMimeData(self, source):
+        # вставка из буфера и перетаскивание проходят здесь
+        if not source.hasText():
+            return
+        text = source.text()
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        if len(text) >= CHUNKED_PASTE_SIZE:
+            self.pasteRequested.emit(text)
+            return
+        if not self.dropping:
+            self.prepareEdit()
+        cursor = self.textCursor()
+        cursor.insertText(text)
+        self.setTextCursor(cursor)
+        self.ensureCursorVisible()
@@ -0,0 +1,130 @@
+import os
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import wait
+
+from PyQt5 import QtCore
+from PyQt5 import QtWidgets
+
+from textcore import createPool
+from textcore import iterFiles
+from textcore import searchFiles
+
+
+FILES_PER_TASK = 32
+MAX_PENDING_TASKS = 64
+
+
+class FileSearch(QtCore.QThread):
+
+    fileMatched = QtCore.pyqtSignal(str, object)
+    progress = QtCore.pyqtSignal(int)
+
+    def __init__(self, directory, pattern, needle=None, parent=None):
+        super(FileSearch, self).__init__(parent)
+        self.directory = directory
+        self.pattern = pattern
+        self.needle = needle
+        self.searched = 0
+
+    def cancel(self):
+        self.requestInterruption()
+
+    def run(self):
+        pending = set()
+        with createPool() as pool:
+            batch = []
+            for path in iterFiles(self.directory):
+                if self.isInterruptionRequested():
+                    break
+                batch.append(path)
+                if len(batch) < FILES_PER_TASK:
+                    continue
+                pending.add(pool.submit(searchFiles, batch, self.pattern, self.needle))
+                batch = []
+                if len(pending) >= MAX_PENDING_TASKS:
+                    pending = self.collect(pending)
+            if batch:
+                pending.add(pool.submit(searchFiles, batch, self.pattern, self.needle))
+            while pending and not self.isInterruptionRequested():
+                pending = self.collect(pending)
+            for future in pending:
+                future.cancel()
+
+    def collect(self, pending):
+        done, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.cancelled() or future.exception() is not None:
+                continue
+            count, found = future.result()
+            for path, results in found:
+                self.fileMatched.emit(path, results)
+            self.searched += count
+        self.progress.emit(self.searched)
+        return pending
+
+
+class FindInFilesPanel(QtWidgets.QDockWidget):
+
+    searchRequested = QtCore.pyqtSignal(str, str)
+    resultActivated = QtCore.pyqtSignal(str, int)
+
+    def __init__(self, parent=None):
+        super(FindInFilesPanel, self).__init__('Найти в файлах', parent)
+        self.setObjectName('findInFilesPanel')
+        self.search_text = QtWidgets.QLineEdit()
+        self.directory = QtWidgets.QLineEdit()
+        browse_button = QtWidgets.QPushButton('...')
+        browse_button.clicked.connect(self.browse)
+        self.search_button = QtWidgets.QPushButton('Найти')
+        self.search_button.setDefault(True)
+        self.search_button.clicked.connect(self.requestSearch)
+        self.search_text.returnPressed.connect(self.requestSearch)
+        self.status_label = QtWidgets.QLabel()
+        self.results = QtWidgets.QTreeWidget()
+        self.results.setHeaderHidden(True)
+        self.results.itemActivated.connect(self.activate)
+        self.results.itemClicked.connect(self.activate)
+
+        controls = QtWidgets.QGridLayout()
+        controls.addWidget(QtWidgets.QLabel('Найти：'), 0, 0)
+        controls.addWidget(self.search_text, 0, 1)
+        controls.addWidget(self.search_button, 0, 2)
+        controls.addWidget(QtWidgets.QLabel('Папка：'), 1, 0)
+        controls.addWidget(self.directory, 1, 1)
+        controls.addWidget(browse_button, 1, 2)
+        layout = QtWidgets.QVBoxLayout()
+        layout.addLayout(controls)
+        layout.addWidget(self.results)
+        layout.addWidget(self.status_label)
+        widget = QtWidgets.QWidget()
+        widget.setLayout(layout)
+        self.setWidget(widget)
+
+    def browse(self):
+        directory = QtWidgets.QFileDialog.getExistingDirectory(
+            self, 'Папка', self.directory.text())
+        if directory:
+            self.directory.setText(directory)
+
+    def requestSearch(self):
+        if self.search_text.text() and os.path.isdir(self.directory.text()):
+            self.searchRequested.emit(self.search_text.text(), self.directory.text())
+
+    def clear(self):
+        self.results.clear()
+        self.status_label.clear()
+
+    def addResults(self, path, results):
+        item = QtWidgets.QTreeWidgetItem(['%s (%d)' % (path, len(results))])
+        item.setData(0, QtCore.Qt.UserRole, path)
+        for number, line in results:
+            child = QtWidgets.QTreeWidgetItem(item, ['%d: %s' % (number + 1, line)])
+            child.setData(0, QtCore.Qt.UserRole, path)
+            child.setData(0, QtCore.Qt.UserRole + 1, number)
+        self.results.addTopLevelItem(item)
+        item.setExpanded(True)
+
+    def activate(self, item):
+        number = item.data(0, QtCore.Qt.UserRole + 1)
+        if number is not None:
+            self.resultActivated.emit(item.data(0, QtCore.Qt.UserRole), number)
@@ -0,0 +1,232 @@
+import re
+
+from PyQt5 import QtCore
+from PyQt5 import QtGui
+
+
+VIEWPORT_MARGIN = 10
+SYNC_LIMIT = 1000
+
+STATE_NONE = 0
+STATE_FATAL = 1
+STATE_ERROR = 2
+STATE_WARNING = 3
+STATE_INFO = 4
+STATE_DEBUG = 5
+
+LEVELS = {
+    'FATAL': STATE_FATAL, 'CRITICAL': STATE_FATAL, 'ERROR': STATE_ERROR,
+    'WARNING': STATE_WARNING, 'WARN': STATE_WARNING, 'INFO': STATE_INFO,
+    'DEBUG': STATE_DEBUG, 'TRACE': STATE_DEBUG,
+}
+LEVEL_KINDS = {
+    STATE_FATAL: 'fatal', STATE_ERROR: 'error', STATE_WARNING: 'warning',
+    STATE_INFO: 'info', STATE_DEBUG: 'debug',
+}
+
+TIMESTAMP = re.compile(
+    r'\[?(?:\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}|[A-Z][a-z]{2} [ \d]\d \d{2}:\d{2}:\d{2}'
+    r'|\d{2}:\d{2}:\d{2})(?:[.,]\d+)?(?:Z|[+-]\d{2}:?\d{2})?\]?')
+LEVEL = re.compile(r'\b(FATAL|CRITICAL|ERROR|WARNING|WARN|INFO|DEBUG|TRACE)\b')
+LEVEL_START = re.compile(r'\[?(?:FATAL|CRITICAL|ERROR|WARNING|WARN|INFO|DEBUG|TRACE)\b')
+SECTION = re.compile(r'\s*\[[^\]]*\]\s*$')
+COMMENT = re.compile(r'\s*[;#]')
+ASSIGNMENT = re.compile(r'\s*([\w.\-]+)\s*=\s*(.*)')
+PAIR = re.compile(r'([A-Za-z_][\w.\-]*)=("[^"]*"|[^\s,;]*)')
+
+# состояние блока в userState: уровень записи, признак строки, не зависящей
+# от предыдущих, и признак наложенного формата; -1 — блок не разобран
+SYNC = 2
+FORMATTED = 1
+
+
+def packState(state, sync, formatted):
+    return state << 2 | (SYNC if sync else 0) | (FORMATTED if formatted else 0)
+
+
+def recordStart(text):
+    # начало записи журнала или строка ini: состояние на выходе
+    # не зависит от предыдущих строк
+    return (TIMESTAMP.match(text) is not None or LEVEL_START.match(text) is not None
+            or SECTION.match(text) is not None or COMMENT.match(text) is not None)
+
+
+def pairRanges(text, start=0):
+    ranges = []
+    for match in PAIR.finditer(text, start):
+        ranges.append((match.start(1), len(match.group(1)), 'key'))
+        if match.group(2):
+            ranges.append((match.start(2), len(match.group(2)), 'value'))
+    return ranges
+
+
+def highlightLine(text, state=STATE_NONE):
+    stamp = TIMESTAMP.match(text)
+    if stamp is not None or LEVEL_START.match(text) is not None:
+        # новая запись журнала: её уровень переходит на строки продолжения
+        ranges = []
+        start = 0
+        if stamp is not None:
+            ranges.append((0, stamp.end(), 'timestamp'))
+            start = stamp.end()
+        level = LEVEL.search(text, start)
+        state = STATE_NONE
+        if level is not None:
+            state = LEVELS[level.group(1)]
+            ranges.append((level.start(1), len(level.group(1)), LEVEL_KINDS[state]))
+            start = level.end()
+        return ranges + pairRanges(text, start), state, True
+    if SECTION.match(text):
+        return [(0, len(text), 'section')], STATE_NONE, True
+    if COMMENT.match(text):
+        return [(0, len(text), 'comment')], STATE_NONE, True
+
+    ranges = []
+    if state in (STATE_FATAL, STATE_ERROR) and text:
+        # трассировка стека после ошибки
+        ranges.append((0, len(text), 'stack'))
+    assignment = ASSIGNMENT.match(text) if state == STATE_NONE else None
+    if assignment is not None:
+        ranges.append((assignment.start(1), len(assignment.group(1)), 'key'))
+        if assignment.group(2):
+            ranges.append((assignment.start(2), len(assignment.group(2)), 'value'))
+    else:
+        ranges.extend(pairRanges(text))
+    return ranges, state, False
+
+
+def charFormat(color, bold=False, italic=False):
+    char_format = QtGui.QTextCharFormat()
+    char_format.setForeground(QtGui.QColor(color))
+    if bold:
+        char_format.setFontWeight(QtGui.QFont.Bold)
+    char_format.setFontItalic(italic)
+    return char_format
+
+
+class LogHighlighter(QtCore.QObject):
+
+    def __init__(self, text, parent=None):
+        super(LogHighlighter, self).__init__(parent)
+        self.text = text
+        self.document = None
+        self.enabled = False
+        self.formatting = False
+        self.formats = {
+            'timestamp': charFormat('darkCyan'),
+            'fatal': charFormat('darkRed', bold=True),
+            'error': charFormat('red', bold=True),
+            'warning': charFormat('darkOrange', bold=True),
+            'info': charFormat('darkGreen'),
+            'debug': charFormat('gray'),
+            'stack': charFormat('darkRed'),
+            'section': charFormat('darkBlue', bold=True),
+            'comment': charFormat('gray', italic=True),
+            'key': charFormat('darkMagenta'),
+            'value': charFormat('darkBlue'),
+        }
+        text.updateRequest.connect(self.onUpdateRequest)
+
+    def setEnabled(self, enabled):
+        if enabled == self.enabled:
+            return
+        document = self.document
+        self.setDocument(None)
+        self.enabled = enabled
+        self.setDocument(document)
+        if enabled:
+            self.highlightViewport()
+
+    def setDocument(self, document):
+        if self.document is not None and self.enabled:
+            self.document.contentsChange.disconnect(self.onContentsChange)
+        self.document = document
+        if document is not None and self.enabled:
+            document.contentsChange.connect(self.onContentsChange)
+
+    def clear(self, document):
+        block = document.firstBlock()
+        while block.isValid():
+            if block.userState() >= 0 and block.userState() & FORMATTED:
+                block.layout().clearFormats()
+                document.markContentsDirty(block.position(), block.length())
+            block.setUserState(-1)
+            block = block.next()
+
+    def onUpdateRequest(self, rect, dy):
+        if self.enabled:
+            self.highlightViewport()
+
+    def onContentsChange(self, position, removed, added):
+        block = self.document.findBlock(position)
+        last = self.document.findBlock(position + added)
+        self.invalidate(block)
+        if removed:
+            # объединённая правка захватывает и старые блоки между краями
+            while block != last and block.isValid():
+                block = block.next()
+                self.invalidate(block)
+        else:
+            # вставленные строки — новые блоки без состояния
+            self.invalidate(last)
+        # дальше состояние могло измениться только у строк продолжения,
+        # первая же независимая или ещё не разобранная строка его останавливает
+        block = last.next()
+        while block.isValid() and block.userState() >= 0 and not block.userState() & SYNC:
+            self.invalidate(block)
+            block = block.next()
+        self.highlightViewport()
+
+    def invalidate(self, block):
+        if block.userState() >= 0 and block.userState() & FORMATTED:
+            block.layout().clearFormats()
+            self.document.markContentsDirty(block.position(), block.length())
+        block.setUserState(-1)
+
+    def highlightViewport(self):
+        if self.formatting or self.document is not self.text.document():
+            return
+        self.formatting = True
+        try:
+            # разбираются только видимые блоки, остальные — при прокрутке к ним
+            rows = self.text.viewport().height() // self.text.fontMetrics().height()
+            block = self.text.firstVisibleBlock()
+            for _ in range(rows + VIEWPORT_MARGIN):
+                if not block.isValid():
+                    break
+                if block.userState() < 0 or not block.userState() & FORMATTED:
+                    self.formatBlock(block)
+                block = block.next()
+        finally:
+            self.formatting = False
+
+    def inputState(self, block):
+        # состояние на входе: из предыдущего блока, а если он не разобран —
+        # проходом от ближайшей разобранной или независимой строки
+        chain = []
+        previous = block.previous()
+        while previous.isValid() and previous.userState() < 0 and len(chain) < SYNC_LIMIT:
+            chain.append(previous)
+            if recordStart(previous.text()):
+                break
+            previous = previous.previous()
+        state = STATE_NONE
+        if previous.isValid() and previous.userState() >= 0:
+            state = previous.userState() >> 2
+        for previous in reversed(chain):
+            _, state, sync = highlightLine(previous.text(), state)
+            previous.setUserState(packState(state, sync, False))
+        return state
+
+    def formatBlock(self, block):
+        ranges, state, sync = highlightLine(block.text(), self.inputState(block))
+        formats = []
+        for start, length, kind in ranges:
+            format_range = QtGui.QTextLayout.FormatRange()
+            format_range.start = start
+            format_range.length = length
+            format_range.format = self.formats[kind]
+            formats.append(format_range)
+        block.layout().setFormats(formats)
+        block.setUserState(packState(state, sync, True))
+        self.document.markContentsDirty(block.position(), block.length())
@@ -0,0 +1,448 @@
+import os
+import struct
+import tempfile
+import zlib
+
+from PyQt5 import QtCore
+from PyQt5 import QtGui
+
+from longlines import insertText
+from longlines import textRange
+
+
+UNDO_BUDGET = 64 * 1024 * 1024
+COMPRESS_SIZE = 64 * 1024
+# служебные данные одной правки в памяти: кортеж и заголовки строк
+CHANGE_OVERHEAD = 64
+# крупная вставка не копируется в окно снимка
+WINDOW_LIMIT = 64 * 1024
+
+MAGIC = b'NPU1'
+HEADER = struct.Struct('<4sQqI')
+CHANGE = struct.Struct('<QII')
+STEP = struct.Struct('<I')
+
+
+def historyPath(filename):
+    directory, name = os.path.split(os.path.abspath(filename))
+    return os.path.join(directory, '.%s.nundo' % name)
+
+
+def changeSize(change):
+    # строки оцениваются как UTF-16, как и текст документа
+    _, removed, inserted = change
+    return (len(removed) + len(inserted)) * 2 + CHANGE_OVERHEAD
+
+
+def packChanges(changes):
+    pieces = []
+    for position, removed, inserted in changes:
+        # одиночные суррогаты - байты файла, не подошедшие кодировке
+        removed_data = removed.encode('utf-8', 'surrogatepass')
+        inserted_data = inserted.encode('utf-8', 'surrogatepass')
+        pieces.append(CHANGE.pack(position, len(removed_data), len(inserted_data)))
+        pieces.append(removed_data)
+        pieces.append(inserted_data)
+    return b''.join(pieces)
+
+
+def unpackChanges(data):
+    changes = []
+    offset = 0
+    while offset < len(data):
+        position, removed_size, inserted_size = CHANGE.unpack_from(data, offset)
+        offset += CHANGE.size
+        removed = data[offset:offset + removed_size].decode('utf-8', 'surrogatepass')
+        offset += removed_size
+        inserted = data[offset:offset + inserted_size].decode('utf-8', 'surrogatepass')
+        offset += inserted_size
+        changes.append((position, removed, inserted))
+    return changes
+
+
+def isTyping(change):
+    # символ, набранный в том числе поверх выделения, или удалённый символ
+    _, removed, inserted = change
+    if inserted:
+        return len(inserted) == 1 and inserted != '\n'
+    return len(removed) == 1 and removed != '\n'
+
+
+def mergeTyping(first, second):
+    # набор и удаление по символу копятся в одном шаге до перевода строки
+    position, removed, inserted = first
+    second_position, second_removed, second_inserted = second
+    if not second_removed and second_position == position + len(inserted):
+        return (position, removed, inserted + second_inserted)
+    if not inserted and not second_inserted:
+        if second_position + len(second_removed) == position:
+            return (second_position, second_removed + removed, '')
+        if second_position == position:
+            return (position, removed + second_removed, '')
+    return None
+
+
+class Step(object):
+
+    def __init__(self):
+        self.changes = []
+        self.chunks = []
+        self.compressor = None
+        self.size = 0
+        self.pending_size = 0
+
+    @staticmethod
+    def unpack(data):
+        step = Step()
+        step.chunks = [data]
+        step.size = len(data)
+        return step
+
+    def add(self, change):
+        size = changeSize(change)
+        self.changes.append(change)
+        self.size += size
+        self.pending_size += size
+        # крупный шаг сжимается по мере накопления, а не целиком в конце
+        if self.pending_size >= COMPRESS_SIZE:
+            self.compress()
+
+    def replaceLast(self, change):
+        size = changeSize(change) - changeSize(self.changes[-1])
+        self.changes[-1] = change
+        self.size += size
+        self.pending_size += size
+
+    def compress(self):
+        if self.compressor is None:
+            self.compressor = zlib.compressobj(1)
+        chunk = self.compressor.compress(packChanges(self.changes))
+        self.chunks.append(chunk)
+        self.size += len(chunk) - self.pending_size
+        self.changes = []
+        self.pending_size = 0
+
+    def close(self):
+        if self.compressor is None:
+            return
+        if self.changes:
+            self.compress()
+        data = b''.join(self.chunks) + self.compressor.flush()
+        self.size += len(data) - sum(len(chunk) for chunk in self.chunks)
+        self.chunks = [data]
+        self.compressor = None
+
+    def items(self):
+        if not self.chunks:
+            return list(self.changes)
+        return unpackChanges(zlib.decompress(self.chunks[0])) + self.changes
+
+    def pack(self):
+        if self.chunks:
+            return self.chunks[0]
+        return zlib.compress(packChanges(self.changes), 1)
+
+
+def writeHistory(path, stamp, steps):
+    fd, temp_name = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            file.write(HEADER.pack(MAGIC, stamp[0], stamp[1], len(steps)))
+            for step in steps:
+                data = step.pack()
+                file.write(STEP.pack(len(data)))
+                file.write(data)
+        os.replace(temp_name, path)
+    except OSError:
+        if os.path.exists(temp_name):
+            os.remove(temp_name)
+        raise
+
+
+def readHistory(path):
+    with open(path, 'rb') as file:
+        head = file.read(HEADER.size)
+        if len(head) < HEADER.size:
+            raise ValueError('not an undo history: %s' % path)
+        magic, size, mtime, count = HEADER.unpack(head)
+        if magic != MAGIC:
+            raise ValueError('not an undo history: %s' % path)
+        steps = []
+        for _ in range(count):
+            head = file.read(STEP.size)
+            if len(head) < STEP.size:
+                raise ValueError('truncated undo history: %s' % path)
+            length, = STEP.unpack(head)
+            data = file.read(length)
+            if len(data) < length:
+                raise ValueError('truncated undo history: %s' % path)
+            steps.append(Step.unpack(data))
+    return (size, mtime), steps
+
+
+class UndoHistory(QtCore.QObject):
+
+    undoAvailable = QtCore.pyqtSignal(bool)
+    redoAvailable = QtCore.pyqtSignal(bool)
+
+    def __init__(self, budget=UNDO_BUDGET, parent=None):
+        super(UndoHistory, self).__init__(parent)
+        self.budget = budget
+        self.document = None
+        self.enabled = True
+        self.applying = False
+        self.grouping = False
+        self.explicit = False
+        self.steps = []
+        # шаги до index применены, после него — отменены
+        self.index = 0
+        self.clean = 0
+        self.size = 0
+        self.open = False
+        self.typing = False
+        self.window = None
+
+    def setDocument(self, document):
+        if self.document is not None:
+            self.document.contentsChange.disconnect(self.onContentsChange)
+            self.document.modificationChanged.disconnect(self.onModificationChanged)
+        self.closeStep()
+        self.window = None
+        self.document = document
+        if document is not None:
+            # встроенная история держит весь удалённый текст без ограничений
+            document.setUndoRedoEnabled(False)
+            document.contentsChange.connect(self.onContentsChange)
+            document.modificationChanged.connect(self.onModificationChanged)
+
+    def setEnabled(self, enabled):
+        # правки в выключенной истории не записываются, но и не стирают её
+        self.closeStep()
+        self.window = None
+        self.enabled = enabled
+
+    def setBudget(self, budget):
+        self.budget = budget
+        self.trim()
+
+    def clear(self):
+        self.steps = []
+        self.index = 0
+        self.size = 0
+        self.open = False
+        self.window = None
+        self.clean = None if self.document is not None and self.document.isModified() else 0
+        self.emitAvailable()
+
+    def setClean(self, clean=True):
+        self.closeStep()
+        self.clean = self.index if clean else None
+
+    def isUndoAvailable(self):
+        return self.index > 0
+
+    def isRedoAvailable(self):
+        return self.index < len(self.steps)
+
+    def emitAvailable(self):
+        self.undoAvailable.emit(self.isUndoAvailable())
+        self.redoAvailable.emit(self.isRedoAvailable())
+
+    def textRange(self, start, end):
+        return textRange(self.document, start, end)
+
+    def prepare(self, start, end):
+        # документ не сообщает удалённый текст, поэтому он запоминается до правки
+        if self.document is None:
+            return
+        end = min(end, self.document.characterCount() - 1)
+        start = max(0, min(start, end))
+        self.window = (start, self.textRange(start, end))
+
+    def beginGroup(self, explicit=False):
+        # все правки группы — один шаг; явная группа получает их через record
+        self.closeStep()
+        self.grouping = True
+        self.explicit = explicit
+
+    def endGroup(self):
+        self.grouping = False
+        self.explicit = False
+        self.closeStep()
+
+    def record(self, position, removed, inserted):
+        if self.enabled and not self.applying:
+            self.addChange((position, removed, inserted))
+
+    def onModificationChanged(self, modified):
+        if not modified and not self.applying:
+            self.setClean()
+
+    def onContentsChange(self, position, removed, added):
+        if self.applying or not self.enabled or self.explicit:
+            return
+        end = min(position + added, self.document.characterCount() - 1)
+        inserted = self.textRange(position, end) if end > position else ''
+        removed_text = self.takeRemoved(position, removed, inserted)
+        if removed_text is None:
+            self.rebase(position, removed, len(inserted))
+            return
+        self.addChange((position, removed_text, inserted))
+
+    def takeRemoved(self, position, removed, inserted):
+        if self.window is None:
+            return None if removed else ''
+        start, text = self.window
+        end = start + len(text)
+        if start <= position and position + removed <= end:
+            offset = position - start
+            removed_text = text[offset:offset + removed]
+            if len(inserted) > WINDOW_LIMIT:
+                self.window = (position + len(inserted), text[offset + removed:])
+            else:
+                self.window = (start, text[:offset] + inserted + text[offset + removed:])
+            return removed_text
+        if removed:
+            return None
+        if position < start:
+            self.window = (start + len(inserted), text)
+        return ''
+
+    def rebase(self, position, removed, added):
+        # удалённый текст неизвестен: саму правку отменить нельзя, но шаги
+        # до неё, которые её не задевают, сдвигаются и остаются в истории
+        self.closeStep()
+        self.size -= sum(step.size for step in self.steps[self.index:])
+        del self.steps[self.index:]
+        kept = []
+        for step in reversed(self.steps):
+            changes = []
+            for change_position, change_removed, change_inserted in reversed(step.items()):
+                if change_position + len(change_inserted) <= position:
+                    # правка позади шага: в документе до шага она правее
+                    position += len(change_removed) - len(change_inserted)
+                elif change_position >= position + removed:
+                    change_position += added - removed
+                else:
+                    break
+                changes.append((change_position, change_removed, change_inserted))
+            else:
+                rebased = Step()
+                for change in reversed(changes):
+                    rebased.add(change)
+                rebased.close()
+                kept.append(rebased)
+                continue
+            # шаг пересекается с правкой: он и всё, что раньше, недостижимы
+            break
+        kept.reverse()
+        self.steps = kept
+        self.index = len(kept)
+        self.size = sum(step.size for step in kept)
+        # ни одно состояние истории больше не совпадает с сохранённым файлом
+        self.clean = None
+        self.window = None
+        self.typing = False
+        self.emitAvailable()
+
+    def addChange(self, change):
+        if self.index < len(self.steps):
+            # новая правка отбрасывает отменённые шаги
+            self.size -= sum(step.size for step in self.steps[self.index:])
+            del self.steps[self.index:]
+            if self.clean is not None and self.clean > self.index:
+                self.clean = None
+        step = self.steps[-1] if self.open else None
+        if step is not None and self.grouping:
+            size = step.size
+            step.add(change)
+            self.size += step.size - size
+        elif step is not None and self.typing and step.changes and isTyping(change) and (
+                mergeTyping(step.changes[-1], change) is not None):
+            size = step.size
+            step.replaceLast(mergeTyping(step.changes[-1], change))
+            self.size += step.size - size
+        else:
+            self.closeStep()
+            step = Step()
+            step.add(change)
+            self.steps.append(step)
+            self.index += 1
+            self.size += step.size
+            self.open = True
+            self.typing = not self.grouping and isTyping(change)
+        self.trim()
+        self.emitAvailable()
+
+    def closeStep(self):
+        if not self.open:
+            return
+        self.open = False
+        step = self.steps[-1]
+        size = step.size
+        step.close()
+        self.size += step.size - size
+        self.trim()
+
+    def trim(self):
+        # первыми вытесняются самые старые шаги, открытый шаг остаётся
+        while self.size > self.budget and self.steps and not (self.open and len(self.steps) == 1):
+            if self.index > 0:
+                step = self.steps.pop(0)
+                self.index -= 1
+                if self.clean is not None:
+                    self.clean = self.clean - 1 if self.clean > 0 else None
+            else:
+                step = self.steps.pop()
+            self.size -= step.size
+        if not self.steps:
+            self.open = False
+
+    def undo(self):
+        if self.document is None or not self.isUndoAvailable():
+            return None
+        self.closeStep()
+        self.index -= 1
+        changes = self.steps[self.index].items()
+        return self.apply([(position, inserted, removed)
+                           for position, removed, inserted in reversed(changes)])
+
+    def redo(self):
+        if self.document is None or not self.isRedoAvailable():
+            return None
+        self.closeStep()
+        changes = self.steps[self.index].items()
+        self.index += 1
+        return self.apply(changes)
+
+    def apply(self, changes):
+        cursor = QtGui.QTextCursor(self.document)
+        self.applying = True
+        try:
+            cursor.beginEditBlock()
+            for position, removed, inserted in changes:
+                cursor.setPosition(position)
+                cursor.setPosition(position + len(removed), QtGui.QTextCursor.KeepAnchor)
+                insertText(cursor, inserted)
+            cursor.endEditBlock()
+        finally:
+            self.applying = False
+        self.window = None
+        self.document.setModified(self.index != self.clean)
+        self.emitAvailable()
+        return cursor.position()
+
+    def snapshot(self):
+        # закрытые шаги не меняются, список можно записать позже
+        self.closeStep()
+        return self.steps[:self.index]
+
+    def restore(self, steps):
+        self.steps = list(steps)
+        self.index = len(self.steps)
+        self.clean = self.index
+        self.size = sum(step.size for step in self.steps)
+        self.open = False
+        self.window = None
+        self.trim()
+        self.emitAvailable()
@@ -0,0 +1,79 @@
+import getpass
+import os
+
+from PyQt5 import QtCore
+from PyQt5 import QtNetwork
+
+
+CONNECT_TIMEOUT = 100
+WRITE_TIMEOUT = 1000
+
+
+def serverName():
+    # у каждого пользователя свой блокнот
+    try:
+        user = getpass.getuser()
+    except (KeyError, OSError):
+        user = ''
+    return 'notepad-%s' % user
+
+
+def forwardFiles(filenames, name=None):
+    # сокет работает без QApplication: второй запуск не загружает виджеты
+    socket = QtNetwork.QLocalSocket()
+    socket.connectToServer(name or serverName())
+    if not socket.waitForConnected(CONNECT_TIMEOUT):
+        return False
+    data = ''.join(os.path.abspath(filename) + '\n' for filename in filenames).encode('utf-8')
+    socket.write(data)
+    written = not data or socket.waitForBytesWritten(WRITE_TIMEOUT)
+    socket.disconnectFromServer()
+    if socket.state() != QtNetwork.QLocalSocket.UnconnectedState:
+        socket.waitForDisconnected(WRITE_TIMEOUT)
+    return written
+
+
+class InstanceServer(QtCore.QObject):
+
+    filesReceived = QtCore.pyqtSignal(list)
+
+    def __init__(self, name=None, parent=None):
+        super(InstanceServer, self).__init__(parent)
+        self.name = name or serverName()
+        self.server = QtNetwork.QLocalServer(self)
+        self.server.newConnection.connect(self.acceptConnections)
+        self.buffers = {}
+
+    def listen(self):
+        if self.server.listen(self.name):
+            return True
+        # другой экземпляр мог запуститься одновременно с этим
+        if forwardFiles([], self.name):
+            return False
+        # сокет остался от аварийно завершённого процесса
+        QtNetwork.QLocalServer.removeServer(self.name)
+        return self.server.listen(self.name)
+
+    def close(self):
+        self.server.close()
+
+    def acceptConnections(self):
+        while self.server.hasPendingConnections():
+            socket = self.server.nextPendingConnection()
+            self.buffers[socket] = bytearray()
+            socket.readyRead.connect(lambda socket=socket: self.readSocket(socket))
+            socket.disconnected.connect(lambda socket=socket: self.finishSocket(socket))
+            if socket.state() == QtNetwork.QLocalSocket.UnconnectedState:
+                self.finishSocket(socket)
+
+    def readSocket(self, socket):
+        if socket in self.buffers:
+            self.buffers[socket] += bytes(socket.readAll())
+
+    def finishSocket(self, socket):
+        if socket not in self.buffers:
+            return
+        data = self.buffers.pop(socket) + bytes(socket.readAll())
+        socket.deleteLater()
+        self.filesReceived.emit([filename for filename in data.decode('utf-8', 'replace').split('\n')
+                                 if filename])
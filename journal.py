@@ -0,0 +1,227 @@
+import os
+import struct
+import tempfile
+
+from PyQt5 import QtCore
+from PyQt5 import QtGui
+
+from longlines import insertText
+from longlines import textRange
+
+
+MAGIC = b'NPJ1'
+HEADER = struct.Struct('<4sQq')
+RECORD = struct.Struct('<QQI')
+FLUSH_INTERVAL = 1000
+COMPACT_SIZE = 1024 * 1024
+
+
+def journalPath(filename):
+    directory, name = os.path.split(os.path.abspath(filename))
+    return os.path.join(directory, '.%s.njournal' % name)
+
+
+def fileStamp(filename):
+    stat = os.stat(filename)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def mergeRecords(first, second):
+    # две правки подряд сливаются, если вторая целиком лежит внутри
+    # вставленного первой текста или целиком его накрывает
+    position, removed, text = first
+    second_position, second_removed, second_text = second
+    if position <= second_position and second_position + second_removed <= position + len(text):
+        offset = second_position - position
+        return (position, removed,
+                text[:offset] + second_text + text[offset + second_removed:])
+    if second_position <= position and position + len(text) <= second_position + second_removed:
+        return (second_position, removed + second_removed - len(text), second_text)
+    return None
+
+
+def compactRecords(records):
+    compacted = []
+    for record in records:
+        merged = mergeRecords(compacted[-1], record) if compacted else None
+        if merged is None:
+            compacted.append(record)
+        else:
+            compacted[-1] = merged
+    return compacted
+
+
+def packRecord(record):
+    position, removed, text = record
+    data = text.encode('utf-8', 'surrogatepass')
+    return RECORD.pack(position, removed, len(data)) + data
+
+
+def readJournal(path, offset=None):
+    with open(path, 'rb') as file:
+        magic, size, mtime = HEADER.unpack(file.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError('not a journal: %s' % path)
+        if offset is not None:
+            file.seek(offset)
+        records = []
+        while True:
+            head = file.read(RECORD.size)
+            if len(head) < RECORD.size:
+                break
+            position, removed, length = RECORD.unpack(head)
+            data = file.read(length)
+            if len(data) < length:
+                # запись, оборванная сбоем, отбрасывается
+                break
+            records.append((position, removed, data.decode('utf-8', 'surrogatepass')))
+    return (size, mtime), records
+
+
+def writeJournal(path, stamp, records):
+    fd, temp_name = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    with os.fdopen(fd, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, stamp[0], stamp[1]))
+        for record in records:
+            file.write(packRecord(record))
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_name, path)
+
+
+def applyRecords(document, records):
+    cursor = QtGui.QTextCursor(document)
+    cursor.beginEditBlock()
+    for position, removed, text in records:
+        end = document.characterCount() - 1
+        cursor.setPosition(min(position, end))
+        cursor.setPosition(min(position + removed, end), QtGui.QTextCursor.KeepAnchor)
+        insertText(cursor, text)
+    cursor.endEditBlock()
+
+
+def isOrphaned(filename):
+    path = journalPath(filename)
+    if not os.path.exists(path):
+        return False
+    lock = QtCore.QLockFile(path + '.lock')
+    lock.setStaleLockTime(0)
+    if not lock.tryLock(0):
+        return False
+    lock.unlock()
+    return True
+
+
+class EditJournal(QtCore.QObject):
+
+    def __init__(self, document, filename, parent=None):
+        super(EditJournal, self).__init__(parent)
+        self.document = document
+        self.filename = filename
+        self.path = journalPath(filename)
+        self.file = None
+        self.pending = None
+        # записи после последней синхронизации с диском
+        self.dirty = False
+        self.mark = None
+        self.compacted_size = 0
+        self.lock = QtCore.QLockFile(self.path + '.lock')
+        self.lock.setStaleLockTime(0)
+        self.timer = QtCore.QTimer(self)
+        self.timer.setInterval(FLUSH_INTERVAL)
+        self.timer.timeout.connect(self.flush)
+
+    def start(self, records=()):
+        # журнал другого запущенного экземпляра не трогаем
+        if not self.lock.tryLock(0):
+            return False
+        try:
+            writeJournal(self.path, fileStamp(self.filename), records)
+            self.file = open(self.path, 'ab')
+        except OSError:
+            self.lock.unlock()
+            return False
+        self.compacted_size = self.file.tell()
+        self.attach(self.document)
+        self.timer.start()
+        return True
+
+    def stop(self, keep=False):
+        if self.file is None:
+            return
+        self.timer.stop()
+        self.detach()
+        self.file.close()
+        self.file = None
+        if not keep:
+            os.remove(self.path)
+        self.lock.unlock()
+
+    def detach(self):
+        # документ выгружен из памяти, журнал и блокировка остаются
+        if self.document is not None:
+            self.document.contentsChange.disconnect(self.onContentsChange)
+            self.document = None
+        self.flush()
+
+    def attach(self, document):
+        self.document = document
+        document.contentsChange.connect(self.onContentsChange)
+
+    def onContentsChange(self, position, removed, added):
+        end = min(position + added, self.document.characterCount() - 1)
+        record = (position, removed, textRange(self.document, position, max(position, end)))
+        self.dirty = True
+        if self.pending is not None:
+            merged = mergeRecords(self.pending, record)
+            if merged is not None:
+                self.pending = merged
+                return
+            self.writePending()
+        self.pending = record
+
+    def writePending(self):
+        if self.pending is not None:
+            self.file.write(packRecord(self.pending))
+            self.pending = None
+
+    def flush(self):
+        # таймер срабатывает и у вкладок без правок: диск не трогается
+        if self.file is None or not self.dirty:
+            return
+        self.writePending()
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.dirty = False
+        # пока идёт сохранение, смещение отметки должно оставаться верным
+        if self.mark is None and self.file.tell() > max(COMPACT_SIZE, 2 * self.compacted_size):
+            self.compact()
+
+    def checkpoint(self):
+        # граница между правками, попавшими в сохраняемый снимок, и последующими
+        self.flush()
+        if self.file is not None:
+            self.mark = self.file.tell()
+
+    def forget(self):
+        self.mark = None
+
+    def rebase(self):
+        # файл на диске теперь совпадает со снимком: в журнале остаются
+        # только правки, сделанные после него
+        if self.file is None or self.mark is None:
+            return
+        self.flush()
+        self.file.close()
+        _, records = readJournal(self.path, self.mark)
+        writeJournal(self.path, fileStamp(self.filename), records)
+        self.file = open(self.path, 'ab')
+        self.compacted_size = self.file.tell()
+        self.mark = None
+
+    def compact(self):
+        self.file.close()
+        stamp, records = readJournal(self.path)
+        writeJournal(self.path, stamp, compactRecords(records))
+        self.file = open(self.path, 'ab')
+        self.compacted_size = self.file.tell()
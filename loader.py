@@ -0,0 +1,128 @@
+import codecs
+import os
+import re
+
+from PyQt5 import QtCore
+
+from longlines import LineSplitter
+from textformat import decodeErrors
+
+
+FIRST_CHUNK_SIZE = 64 * 1024
+CHUNK_SIZE = 1024 * 1024
+LINE_SEARCH_SIZE = 64 * 1024
+# блоки, отправленные в GUI-поток и ещё не вставленные в документ: на
+# медленном GUI-потоке чтение ждёт, а не копит строки в очереди событий
+MAX_PENDING_CHUNKS = 3
+WAIT_INTERVAL = 50
+# следы байтов, которые не удалось декодировать
+INVALID = {
+    'surrogateescape': re.compile('[\udc80-\udcff]'),
+    'replace': re.compile('\ufffd'),
+}
+
+
+class FileLoader(QtCore.QThread):
+
+    chunkLoaded = QtCore.pyqtSignal(str)
+    prefixLoaded = QtCore.pyqtSignal(str)
+    progress = QtCore.pyqtSignal('qint64', 'qint64')
+    failed = QtCore.pyqtSignal(str)
+    # смещение блока с первым байтом, не подошедшим кодировке
+    undecodable = QtCore.pyqtSignal('qint64')
+
+    def __init__(self, filename, encoding='utf-8', offset=0, first_offset=None, parent=None):
+        super(FileLoader, self).__init__(parent)
+        self.filename = filename
+        self.encoding = encoding
+        # длина BOM, который не попадает в текст
+        self.offset = offset
+        # смещение, с которого читать первым; текст до него придёт через prefixLoaded
+        self.first_offset = first_offset
+        self.done = 0
+        self.slots = QtCore.QSemaphore(MAX_PENDING_CHUNKS)
+        self.errors = decodeErrors(encoding)
+        self.invalid_offset = None
+        # весь текст до первой ошибки был ASCII: кодировку по образцу
+        # тогда нельзя считать доказанной
+        self.ascii = True
+
+    def cancel(self):
+        self.requestInterruption()
+
+    def chunkDone(self):
+        # получатель вставил блок и готов к следующему
+        self.slots.release()
+
+    def waitSlot(self):
+        while not self.slots.tryAcquire(1, WAIT_INTERVAL):
+            if self.isInterruptionRequested():
+                return False
+        return True
+
+    def run(self):
+        try:
+            self.readChunks()
+        except (OSError, LookupError) as error:
+            self.failed.emit(str(error))
+
+    def readChunks(self):
+        total = os.path.getsize(self.filename)
+        self.done = self.offset
+        with open(self.filename, 'rb') as file:
+            start = self.offset
+            if self.first_offset is not None and self.first_offset > self.offset:
+                start = self.lineStart(file, min(self.first_offset, total))
+                # начало файла ещё не прочитано
+                self.ascii = start == self.offset
+            if self.readRange(file, start, total, total, self.chunkLoaded):
+                self.readRange(file, self.offset, start, total, self.prefixLoaded)
+
+    def lineStart(self, file, position):
+        # чтение начинается с начала строки, следующей за position;
+        # середина длинной строки не годится: её отрезки разошлись бы
+        # с отрезками при чтении файла с начала
+        file.seek(position)
+        end = file.read(LINE_SEARCH_SIZE).find(b'\n')
+        return position + end + 1 if end != -1 else self.offset
+
+    def readRange(self, file, start, end, total, signal):
+        # инкрементальный декодер сам держит байты символа,
+        # разрезанного границей блока, до следующего чтения
+        decoder = codecs.getincrementaldecoder(self.encoding)(errors=self.errors)
+        file.seek(start)
+        remaining = end - start
+        pending = ''
+        splitter = LineSplitter()
+        size = FIRST_CHUNK_SIZE
+        while not self.isInterruptionRequested():
+            chunk = file.read(min(size, remaining))
+            size = CHUNK_SIZE
+            remaining -= len(chunk)
+            self.done += len(chunk)
+            text = pending + decoder.decode(chunk, not chunk)
+            if self.invalid_offset is None:
+                self.checkText(text, self.done - len(chunk))
+            # '\r' в конце блока может оказаться половиной '\r\n'
+            pending = ''
+            if chunk and text.endswith('\r'):
+                pending = '\r'
+                text = text[:-1]
+            text = splitter.split(text.replace('\r\n', '\n').replace('\r', '\n'), not chunk)
+            if text:
+                if not self.waitSlot():
+                    return False
+                signal.emit(text)
+            self.progress.emit(self.done, total)
+            if not chunk:
+                return True
+        return False
+
+    def checkText(self, text, offset):
+        match = INVALID[self.errors].search(text)
+        if match is None:
+            self.ascii = self.ascii and text.isascii()
+            return
+        self.ascii = self.ascii and text[:match.start()].isascii()
+        self.invalid_offset = offset
+        self.undecodable.emit(offset)
@@ -0,0 +1,271 @@
+from bisect import bisect_left
+from bisect import bisect_right
+
+from PyQt5 import QtCore
+from PyQt5 import QtGui
+
+from docstats import changedBlocks
+
+
+# строка длиннее LONG_LINE показывается отрезками по SEGMENT_SIZE символов:
+# разметка QPlainTextEdit строится для блока целиком, и одна строка
+# в десятки мегабайт останавливает редактор на каждой правке
+LONG_LINE = 16 * 1024
+SEGMENT_SIZE = 4096
+# отрезок по возможности заканчивается после разделителя, чтобы слова
+# и числа не разрывались и находились поиском
+SEGMENT_SLACK = 256
+DELIMITERS = ' \t,;>})]'
+# мягкий перенос в тексте, который уходит в историю правок и журнал;
+# U+FDD0 — не символ Юникода и в файлах не встречается
+SOFT_BREAK = '\ufdd0'
+SOFT_BREAKS_PROPERTY = 'soft_breaks'
+
+
+class Continuation(QtGui.QTextBlockUserData):
+    # метка блока, который продолжает строку предыдущего; метка стоит
+    # на начале блока и остаётся верной при слиянии и разбиении блоков
+    pass
+
+
+def isContinuation(block):
+    return isinstance(block.userData(), Continuation)
+
+
+def hasSoftBreaks(document):
+    return bool(document.property(SOFT_BREAKS_PROPERTY))
+
+
+def hasLongLine(text, column=0):
+    # переводы строк ищутся шагами по LONG_LINE, а не по каждой строке
+    position = 0
+    limit = LONG_LINE - column
+    while len(text) - position > limit:
+        newline = text.rfind('\n', position, position + limit + 1)
+        if newline == -1:
+            return True
+        position = newline + 1
+        limit = LONG_LINE
+    return False
+
+
+def segmentEnd(text, start, limit):
+    low = max(start + 1, limit - SEGMENT_SLACK)
+    cut = max(text.rfind(char, low, limit) for char in DELIMITERS)
+    return cut + 1 if cut != -1 else limit
+
+
+class LineSplitter(object):
+
+    def __init__(self, column=0):
+        # column — длина последнего блока, уже попавшего в документ
+        self.column = column
+        self.long_line = column > LONG_LINE
+        self.pending = ''
+        self.count = 0
+
+    def split(self, text, final=False):
+        # хвост без перевода строки придерживается до следующей порции:
+        # разбиение не зависит от того, как файл порезан на блоки чтения
+        text = self.pending + text
+        self.pending = ''
+        if not self.long_line and not hasLongLine(text, self.column):
+            end = text.rfind('\n') + 1
+            if final:
+                end = len(text)
+            elif end:
+                self.column = 0
+            self.pending = text[end:]
+            return text[:end]
+        pieces = []
+        start = 0
+        while True:
+            newline = text.find('\n', start)
+            end = len(text) if newline == -1 else newline
+            if self.column + end - start > LONG_LINE:
+                self.long_line = True
+            while self.long_line and end > start and self.column + end - start > SEGMENT_SIZE:
+                cut = segmentEnd(text, start, max(start, start + SEGMENT_SIZE - self.column))
+                pieces.append(text[start:cut])
+                pieces.append(SOFT_BREAK)
+                self.count += 1
+                start = cut
+                self.column = 0
+            if newline == -1:
+                break
+            pieces.append(text[start:newline + 1])
+            start = newline + 1
+            self.column = 0
+            self.long_line = False
+        if final:
+            pieces.append(text[start:])
+        else:
+            self.pending = text[start:]
+        return ''.join(pieces)
+
+
+def insertText(cursor, text):
+    # мягкий перенос становится границей блока с меткой продолжения
+    if SOFT_BREAK not in text:
+        cursor.insertText(text)
+        return
+    # в группе правок документ сообщает об изменении после расстановки меток
+    cursor.document().setProperty(SOFT_BREAKS_PROPERTY, True)
+    cursor.beginEditBlock()
+    pieces = text.split(SOFT_BREAK)
+    cursor.insertText(pieces[0])
+    for piece in pieces[1:]:
+        cursor.insertBlock()
+        cursor.block().setUserData(Continuation())
+        cursor.insertText(piece)
+    cursor.endEditBlock()
+
+
+def clearSoftBreaks(document):
+    # текст заменён целиком: отрезки прежних длинных строк ушли вместе с ним
+    document.setProperty(SOFT_BREAKS_PROPERTY, False)
+
+
+def setText(document, text):
+    if SOFT_BREAK in text:
+        insertText(QtGui.QTextCursor(document), text)
+    else:
+        document.setPlainText(text)
+        clearSoftBreaks(document)
+
+
+def textRange(document, start, end, soft=SOFT_BREAK):
+    cursor = QtGui.QTextCursor(document)
+    cursor.setPosition(start)
+    cursor.setPosition(end, QtGui.QTextCursor.KeepAnchor)
+    text = cursor.selectedText()
+    if not hasSoftBreaks(document) or '\u2029' not in text:
+        return text.replace('\u2029', '\n')
+    # у каждого разделителя блоков смотрится метка следующего блока
+    pieces = text.split('\u2029')
+    block = document.findBlock(start)
+    parts = [pieces[0]]
+    for piece in pieces[1:]:
+        block = block.next()
+        parts.append(soft if isContinuation(block) else '\n')
+        parts.append(piece)
+    return ''.join(parts)
+
+
+def documentText(document, soft=''):
+    # текст файла: отрезки длинных строк соединяются обратно
+    if not hasSoftBreaks(document):
+        return document.toPlainText()
+    return textRange(document, 0, document.characterCount() - 1, soft)
+
+
+class LineIndex(QtCore.QObject):
+
+    # строки и смещения файла в документе, где длинные строки разбиты;
+    # номера блоков-продолжений собираются один раз, дальше правка
+    # пересматривает только затронутые блоки
+    def __init__(self, document, parent=None):
+        super(LineIndex, self).__init__(parent)
+        self.document = document
+        self.numbers = []
+        self.block_count = document.blockCount()
+        if hasSoftBreaks(document):
+            block = document.firstBlock()
+            number = 0
+            while block.isValid():
+                if isContinuation(block):
+                    self.numbers.append(number)
+                block = block.next()
+                number += 1
+        document.contentsChange.connect(self.onContentsChange)
+
+    def continuations(self):
+        return self.numbers
+
+    def onContentsChange(self, position, removed, added):
+        if not hasSoftBreaks(self.document):
+            self.block_count = self.document.blockCount()
+            return
+        first, old_last, last = changedBlocks(self.document, position, added, self.block_count)
+        self.block_count = self.document.blockCount()
+        low = bisect_left(self.numbers, first)
+        high = bisect_right(self.numbers, old_last)
+        # удаление от начала блока оставляет объединённому блоку метку
+        # последнего из удалённых, хотя разделитель перед ним прежний
+        block = self.document.findBlockByNumber(first)
+        continuation = first > 0 and low < high and self.numbers[low] == first
+        if isContinuation(block) != continuation:
+            block.setUserData(Continuation() if continuation else None)
+        changed = []
+        for number in range(first, last + 1):
+            if isContinuation(block):
+                changed.append(number)
+            block = block.next()
+        shift = last - old_last
+        self.numbers[low:] = changed + [number + shift for number in self.numbers[high:]]
+
+    def count(self):
+        return len(self.continuations())
+
+    def softBefore(self, number):
+        # число мягких переносов до конца блока number включительно
+        return bisect_right(self.continuations(), number)
+
+    def firstBlock(self, number):
+        # первый блок строки, которой принадлежит блок number
+        numbers = self.continuations()
+        index = bisect_right(numbers, number) - 1
+        if index < 0 or numbers[index] != number:
+            return number
+        # в серии продолжений подряд numbers[i] - i не меняется
+        key = number - index
+        low, high = 0, index
+        while low < high:
+            middle = (low + high) // 2
+            if numbers[middle] - middle < key:
+                low = middle + 1
+            else:
+                high = middle
+        return numbers[low] - 1
+
+    def lineBlock(self, line):
+        # первый блок строки line: номер блока минус переносы до него равен line
+        numbers = self.continuations()
+        low, high = line, line + len(numbers)
+        while low < high:
+            middle = (low + high) // 2
+            if middle - bisect_right(numbers, middle) < line:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def lineColumn(self, position):
+        block = self.document.findBlock(position)
+        number = block.blockNumber()
+        first = self.firstBlock(number)
+        start = self.document.findBlockByNumber(first).position()
+        return number - self.softBefore(number), position - start - (number - first)
+
+    def position(self, line, column=0):
+        line = min(line, self.document.blockCount() - self.count() - 1)
+        start = self.realOffset(self.document.findBlockByNumber(self.lineBlock(line)).position())
+        following = self.document.findBlockByNumber(self.lineBlock(line + 1))
+        if following.isValid():
+            end = following.position() - 1
+        else:
+            end = self.document.characterCount() - 1
+        return self.documentPosition(min(start + column, self.realOffset(end)))
+
+    def realOffset(self, position):
+        return position - self.softBefore(self.document.findBlock(position).blockNumber())
+
+    def documentPosition(self, offset):
+        low, high = offset, offset + self.count()
+        while low < high:
+            middle = (low + high) // 2
+            if self.realOffset(middle) < offset:
+                low = middle + 1
+            else:
+                high = middle
+        return min(low, self.document.characterCount() - 1)
@@ -0,0 +1,201 @@
+from array import array
+
+from PyQt5 import QtCore
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+
+
+FILL_BATCH = 20000
+COUNT_BATCH = 10000
+VIEWPORT_MARGIN = 100
+MAX_SELECTIONS = 5000
+RESTART_DELAY = 300
+REFRESH_DELAY = 50
+
+
+class MatchCounter(QtCore.QThread):
+
+    counted = QtCore.pyqtSignal(object)
+
+    def __init__(self, texts, pattern, parent=None):
+        super(MatchCounter, self).__init__(parent)
+        self.texts = texts
+        self.pattern = pattern
+
+    def cancel(self):
+        self.requestInterruption()
+
+    def run(self):
+        # накопленное число совпадений по блокам, порциями
+        total = 0
+        for start in range(0, len(self.texts), COUNT_BATCH):
+            if self.isInterruptionRequested():
+                return
+            batch = array('q')
+            for text in self.texts[start:start + COUNT_BATCH]:
+                total += len(self.pattern.findall(text))
+                batch.append(total)
+            self.counted.emit(batch)
+
+
+class MatchHighlighter(QtCore.QObject):
+
+    countChanged = QtCore.pyqtSignal()
+
+    def __init__(self, text, engine, parent=None):
+        super(MatchHighlighter, self).__init__(parent)
+        self.text = text
+        self.engine = engine
+        self.pattern = None
+        self.counter = None
+        self.cumulative = array('q')
+        self.fill_block = None
+        self.fill_number = 0
+        self.fill_last = 0
+        self.format = QtGui.QTextCharFormat()
+        self.format.setBackground(QtGui.QColor('yellow'))
+
+        self.restart_timer = QtCore.QTimer(self)
+        self.restart_timer.setSingleShot(True)
+        self.restart_timer.setInterval(RESTART_DELAY)
+        self.restart_timer.timeout.connect(self.restart)
+        self.fill_timer = QtCore.QTimer(self)
+        self.fill_timer.timeout.connect(self.fillSnapshot)
+        self.refresh_timer = QtCore.QTimer(self)
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.setInterval(REFRESH_DELAY)
+        self.refresh_timer.timeout.connect(self.refreshSelections)
+
+        # значение полосы прокрутки не должно попасть в интервал таймера
+        text.verticalScrollBar().valueChanged.connect(lambda value: self.refresh_timer.start())
+        text.cursorPositionChanged.connect(self.countChanged)
+        self.document = text.document()
+        self.document.contentsChange.connect(self.onContentsChange)
+
+    def setEngine(self, engine):
+        # окно сменило документ: подсветка и подсчёт начинаются заново
+        self.document.contentsChange.disconnect(self.onContentsChange)
+        self.engine = engine
+        self.document = engine.document
+        self.document.contentsChange.connect(self.onContentsChange)
+        self.restart()
+
+    def setPattern(self, pattern):
+        self.pattern = pattern
+        self.restart_timer.stop()
+        self.restart()
+
+    def onContentsChange(self, position, removed, added):
+        if self.pattern is None:
+            return
+        self.stopCounting()
+        self.restart_timer.start()
+        self.refresh_timer.start()
+
+    def stopCounting(self):
+        self.fill_timer.stop()
+        self.fill_block = None
+        if self.counter is not None:
+            counter, self.counter = self.counter, None
+            counter.cancel()
+            counter.wait()
+        self.cumulative = array('q')
+
+    def restart(self):
+        self.stopCounting()
+        self.refreshSelections()
+        if self.pattern is not None:
+            self.startFill()
+        self.countChanged.emit()
+
+    def startFill(self):
+        # перечитываются только блоки, изменённые с прошлого снимка
+        if self.engine.unread is None:
+            self.startCounter()
+            return
+        self.fill_number, self.fill_last = self.engine.unread
+        self.fill_block = self.text.document().findBlockByNumber(self.fill_number)
+        self.fill_timer.start()
+
+    def fillSnapshot(self):
+        # текст блоков читается из документа в GUI-потоке короткими порциями,
+        # чтобы поток подсчёта работал с неизменяемыми строками
+        block = self.fill_block
+        number = self.fill_number
+        for _ in range(FILL_BATCH):
+            if not block.isValid() or number > self.fill_last:
+                break
+            self.engine.blockText(block, number)
+            block = block.next()
+            number += 1
+        self.fill_block = block
+        self.fill_number = number
+        if block.isValid() and number <= self.fill_last:
+            return
+
+        self.fill_timer.stop()
+        self.fill_block = None
+        # правка остановила бы заполнение, значит, прочитаны все блоки
+        self.engine.unread = None
+        self.startCounter()
+
+    def startCounter(self):
+        self.counter = MatchCounter(list(self.engine.blocks), self.pattern, self)
+        self.counter.counted.connect(self.addCounts)
+        self.counter.start()
+
+    def addCounts(self, batch):
+        if self.sender() is not self.counter:
+            return
+        self.cumulative.extend(batch)
+        self.countChanged.emit()
+
+    def isCounting(self):
+        return self.pattern is not None and len(self.cumulative) < len(self.engine.blocks)
+
+    def total(self):
+        return self.cumulative[-1] if self.cumulative else 0
+
+    def currentIndex(self):
+        cursor = self.text.textCursor()
+        if self.pattern is None or not cursor.hasSelection():
+            return 0
+        block = self.text.document().findBlock(cursor.selectionStart())
+        number = block.blockNumber()
+        if number >= len(self.cumulative):
+            return 0
+        index = self.cumulative[number - 1] if number else 0
+        offset = cursor.selectionStart() - block.position()
+        for match in self.pattern.finditer(self.engine.blockText(block, number)):
+            index += 1
+            if match.start() == offset:
+                return index
+            if match.start() > offset:
+                break
+        return 0
+
+    def refreshSelections(self):
+        selections = []
+        if self.pattern is not None:
+            # выделяются только совпадения в видимой области и рядом с ней
+            first = self.text.firstVisibleBlock().blockNumber()
+            rows = self.text.viewport().height() // self.text.fontMetrics().height()
+            number = max(0, first - VIEWPORT_MARGIN)
+            block = self.text.document().findBlockByNumber(number)
+            while block.isValid() and number <= first + rows + VIEWPORT_MARGIN:
+                for match in self.pattern.finditer(self.engine.blockText(block, number)):
+                    if match.start() == match.end():
+                        continue
+                    cursor = QtGui.QTextCursor(block)
+                    cursor.setPosition(block.position() + match.start())
+                    cursor.setPosition(
+                        block.position() + match.end(), QtGui.QTextCursor.KeepAnchor)
+                    selection = QtWidgets.QTextEdit.ExtraSelection()
+                    selection.format = self.format
+                    selection.cursor = cursor
+                    selections.append(selection)
+                if len(selections) >= MAX_SELECTIONS:
+                    break
+                block = block.next()
+                number += 1
+        self.text.setExtraSelections(selections)
@@ -1,45 +1,179 @@
 import ctypes
-import configparser
 import os
+import re
 import sys
+import tempfile
+
+if __name__ == '__main__':
+    from batch import isBatch
+    from batch import parseArguments
+    arguments = parseArguments(sys.argv[1:])
+    # пакетный поиск и замена работают без Qt
+    if isBatch(arguments):
+        import batch
+        # рабочие процессы пула заново импортируют главный модуль как
+        # __mp_main__; главным становится batch, и в них не грузятся Qt и окна
+        sys.modules['__main__'] = batch
+        sys.exit(batch.runBatch(arguments))
+    # повторный запуск передаёт файлы открытому блокноту и сразу выходит,
+    # не загружая виджеты
+    from instance import forwardFiles
+    if not arguments.new_window and forwardFiles(arguments.files):
+        sys.exit(0)
 
 from PyQt5 import QtCore
 from PyQt5 import QtGui
 from PyQt5 import QtWidgets
-from PyQt5.QtPrintSupport import QPrintPreviewDialog
-from PyQt5.QtPrintSupport import QPrinter
 
+import resource_rc
+from docstats import DocumentStats
+from editor import TextEdit
+from editor import parseTarget
+from findinfiles import FileSearch
+from findinfiles import FindInFilesPanel
+from highlighter import LogHighlighter
+from history import UNDO_BUDGET
+from history import UndoHistory
+from history import historyPath
+from history import readHistory
+from history import writeHistory
+from journal import EditJournal
+from journal import applyRecords
+from journal import fileStamp
+from journal import isOrphaned
+from journal import journalPath
+from journal import readJournal
+from loader import FileLoader
+from longlines import SOFT_BREAK
+from longlines import LineIndex
+from longlines import LineSplitter
+from longlines import clearSoftBreaks
+from longlines import documentText
+from longlines import hasSoftBreaks
+from longlines import insertText
+from longlines import setText
+from matches import MatchHighlighter
+from paster import Paster
+from profiler import STALL_THRESHOLD
+from profiler import Profiler
+from profiler import ProfilerDialog
+from replacer import Replacer
+from saver import FileSaver
+from search import SearchEngine
+from settings import Settings
+from tabs import MEMORY_BUDGET
+from tabs import DocumentTab
+from tabs import byteOffset
+from tabs import tabsToUnload
+from textcore import checkReplacement
+from textcore import compilePattern
+from textcore import substitute
+from textformat import DEFAULT_FORMAT
+from textformat import FALLBACK_ENCODING
+from textformat import TextFormat
+from textformat import detectFile
+from textformat import formatName
+from textformat import isAsciiCompatible
+from viewer import MappedViewer
+from watcher import FileWatcher
 
 CONFIG_FILE_PATH = "notepad.ini"
-
-ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID("notepad")
+VIEWER_THRESHOLD = 512 * 1024 * 1024
+# обработчики команд, время которых пишет профилировщик
+PROFILED_ACTIONS = (
+    'newFile', 'openFile', 'saveFile', 'saveAsFile', 'findText', 'searchText',
+    'findInFiles', 'replace', 'replaceAll', 'goToLine', 'printDocument',
+    'printReview', 'exportPdf', 'setFont', 'setLineWrap', 'setHighlight')
+
+if sys.platform == 'win32':
+    ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID("notepad")
 QtCore.QTextCodec.setCodecForLocale(QtCore.QTextCodec.codecForName("utf-8"))
 
 
+def tabAttribute(name):
+    return property(lambda self: getattr(self.current_tab, name),
+                    lambda self, value: setattr(self.current_tab, name, value))
+
+
 class Notepad(QtWidgets.QMainWindow):
 
+    # состояние документа хранится во вкладке, окно видит текущую
+    cur_file = tabAttribute('filename')
+    text_format = tabAttribute('text_format')
+    stats = tabAttribute('stats')
+    search_engine = tabAttribute('search_engine')
+    line_index = tabAttribute('line_index')
+    journal = tabAttribute('journal')
+    history = tabAttribute('history')
+    viewer = tabAttribute('viewer')
+
     def __init__(self):
-        self.judgeConfig()
-        self.cur_file = ''
+        self.current_tab = DocumentTab()
+        self.tab_clock = 0
+        self.memory_budget = MEMORY_BUDGET
+        self.undo_budget = UNDO_BUDGET
+        self.stall_threshold = STALL_THRESHOLD
+        self.undo_snapshot = None
         self.default_dir = ''
         self.clipboard = QtWidgets.QApplication.clipboard()
         self.last_search = ''
+        self.loader = None
+        self.replacer = None
+        self.paster = None
+        self.saver = None
+        self.print_job = None
+        self.reload_prompt = False
+        self.last_save_ok = True
+        self.file_search = None
+        self.find_panel = None
+        self.pending_line = None
+        self.pending_records = None
+        self.open_queue = []
+        self.prefix_position = 0
+        self.viewer_threshold = VIEWER_THRESHOLD
+        self.match_case = False
+        self.whole_word = False
+        self.use_regex = False
+        self.search_backward = False
+        self.wrap_around = True
+        self.match_label = None
+        self.in_selection = False
         self.font_family = 'Consolas'
         self.font_size = '16'
         self.font_bold = 'False'
         self.font_italic = 'False'
         self.font_strikeOut = 'False'
         self.font_underline = 'False'
-        self.config = configparser.ConfigParser()
-        self.config.read(CONFIG_FILE_PATH, 'utf-8')
         super(QtWidgets.QMainWindow, self).__init__()
+        self.settings = Settings(CONFIG_FILE_PATH, self)
+        self.profiler = Profiler(self)
+        self.profile_dialog = None
         self.initUI()
 
     def initUI(self):
+        self.profiler.instrument(self, PROFILED_ACTIONS)
         self.setWindowTitle('Без названия - Блокнот')
-        self.setWindowIcon(QtGui.QIcon('resource/notepad.png'))
+        self.setWindowIcon(QtGui.QIcon(':/resource/notepad.png'))
         self.statusBar().showMessage('Ready')
+        self.position_label = QtWidgets.QLabel()
+        self.statusBar().addPermanentWidget(self.position_label)
+        self.stats_label = QtWidgets.QLabel()
+        self.statusBar().addPermanentWidget(self.stats_label)
+        self.format_label = QtWidgets.QLabel()
+        self.statusBar().addPermanentWidget(self.format_label)
+        self.progress_bar = QtWidgets.QProgressBar()
+        self.progress_bar.setMaximumWidth(200)
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.hide()
+        self.statusBar().addPermanentWidget(self.progress_bar)
+        self.cancel_button = QtWidgets.QPushButton('Отмена')
+        self.cancel_button.clicked.connect(self.cancelTask)
+        self.cancel_button.clicked.connect(self.cancelPrint)
+        self.cancel_button.clicked.connect(self.openNextPath)
+        self.cancel_button.hide()
+        self.statusBar().addPermanentWidget(self.cancel_button)
         self.createEditText()
+        self.profiler.watchKeys(self.text)
         self.createActions()
         self.createMenubar()
         self.createToolbar()
@@ -52,21 +186,278 @@ class Notepad(QtWidgets.QMainWindow):
         self.text.copyAvailable.connect(self.copyAction.setEnabled)
         self.text.undoAvailable.connect(self.undoAction.setEnabled)
         self.text.redoAvailable.connect(self.redoAction.setEnabled)
-        self.text.textChanged.connect(self.findEnable)
+        self.text.cursorPositionChanged.connect(self.showPosition)
+        self.showStats()
+        self.showPosition()
+        self.setTextFormat(DEFAULT_FORMAT)
+        QtCore.QTimer.singleShot(0, self.restoreSession)
 
     def findEnable(self):
 
-        if self.text.toPlainText():
+        if self.isViewerActive() or self.stats.characters():
             self.findAction.setEnabled(True)
         else:
             self.findAction.setEnabled(False)
             self.findNextAction.setEnabled(False)
 
+    def showStats(self):
+        if self.isViewerActive():
+            self.stats_label.setText('Байт: %d  Строк: %d%s' % (
+                self.viewer.byteSize(), self.viewer.lineCount(),
+                '' if self.viewer.isIndexed() else ' (индексация…)'))
+            return
+        # мягкие переносы длинных строк не символы и не строки файла
+        soft = self.line_index.count()
+        self.stats_label.setText('Символов: %d  Без пробелов: %d  Слов: %d  Строк: %d%s' % (
+            self.stats.characters() - soft, self.stats.nonSpace(),
+            self.stats.words(), self.stats.lines() - soft,
+            ' (длинные строки разбиты)' if soft else ''))
+
+    def showPosition(self):
+        # номер блока берётся из дерева блоков, документ не обходится
+        if self.isViewerActive():
+            self.position_label.setText('Стр %d' % (self.viewer.currentLine() + 1))
+            return
+        line, column = self.cursorLineColumn()
+        self.position_label.setText('Стр %d, стлб %d' % (line + 1, column + 1))
+
+    def cursorLineColumn(self):
+        cursor = self.text.textCursor()
+        if hasSoftBreaks(self.text.document()):
+            return self.line_index.lineColumn(cursor.position())
+        return cursor.blockNumber(), cursor.positionInBlock()
+
+    def lineCount(self):
+        return self.text.blockCount() - self.line_index.count()
+
     def createEditText(self):
-        self.text = QtWidgets.QPlainTextEdit()
+        self.text = TextEdit()
+        self.text.pasteRequested.connect(self.pasteLarge)
         self.text.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
         self.text.customContextMenuRequested.connect(self.showContextMenu)
-        self.setCentralWidget(self.text)
+        self.createDocument(self.current_tab)
+        self.text.setDocument(self.current_tab.document)
+        self.text.setHistory(self.current_tab.history)
+        self.text.setLineIndex(self.current_tab.line_index)
+        self.match_highlighter = MatchHighlighter(self.text, self.search_engine, self)
+        self.match_highlighter.countChanged.connect(self.showMatchCount)
+        self.log_highlighter = LogHighlighter(self.text, self)
+        self.log_highlighter.setDocument(self.text.document())
+        self.file_watcher = FileWatcher(self)
+        self.file_watcher.appended.connect(self.appendExternal)
+        self.file_watcher.changed.connect(self.fileChanged)
+        self.stack = QtWidgets.QStackedWidget()
+        self.stack.addWidget(self.text)
+
+        self.tab_bar = QtWidgets.QTabBar()
+        self.tab_bar.setTabsClosable(True)
+        self.tab_bar.setMovable(True)
+        self.tab_bar.setDocumentMode(True)
+        self.tab_bar.setExpanding(False)
+        self.tab_bar.setTabData(self.tab_bar.addTab(self.current_tab.title()), self.current_tab)
+        self.tab_bar.currentChanged.connect(self.switchTab)
+        self.tab_bar.tabCloseRequested.connect(self.closeTab)
+
+        layout = QtWidgets.QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+        layout.addWidget(self.tab_bar)
+        layout.addWidget(self.stack)
+        central = QtWidgets.QWidget()
+        central.setLayout(layout)
+        self.setCentralWidget(central)
+
+    def createDocument(self, tab, text=''):
+        document = QtGui.QTextDocument(self)
+        document.setDocumentLayout(QtWidgets.QPlainTextDocumentLayout(document))
+        document.setDefaultFont(self.text.font())
+        if text:
+            setText(document, text)
+        document.modificationChanged.connect(self.updateTabTitles)
+        tab.document = document
+        # история правок переживает выгрузку изменённой вкладки
+        if tab.history is None:
+            tab.history = UndoHistory(self.undo_budget, self)
+        tab.history.setDocument(document)
+        # индекс строк обновляется раньше счётчиков, которые к нему обращаются
+        tab.line_index = LineIndex(document, self)
+        tab.stats = DocumentStats(document, self)
+        tab.stats.changed.connect(self.findEnable)
+        tab.stats.changed.connect(self.showStats)
+        tab.search_engine = SearchEngine(document, self)
+
+    def clearText(self):
+        # документ вкладки используется заново, его признаки сбрасываются
+        self.text.clear()
+        clearSoftBreaks(self.text.document())
+
+    def tabs(self):
+        return [self.tab_bar.tabData(index) for index in range(self.tab_bar.count())]
+
+    def addTab(self):
+        tab = DocumentTab()
+        self.createDocument(tab)
+        index = self.tab_bar.addTab(tab.title())
+        self.tab_bar.setTabData(index, tab)
+        self.tab_bar.setCurrentIndex(index)
+        return tab
+
+    def isPristine(self):
+        return (not self.cur_file and self.viewer is None and self.loader is None
+                and self.text.document().isEmpty() and not self.text.document().isModified())
+
+    def switchTab(self, index):
+        tab = self.tab_bar.tabData(index)
+        if tab is None or tab is self.current_tab:
+            return
+        self.cancelTask()
+        self.waitForSave()
+        if self.current_tab is not None:
+            self.storeView(self.current_tab)
+            self.tab_clock += 1
+            self.current_tab.last_used = self.tab_clock
+        self.current_tab = tab
+        if not tab.isLoaded():
+            self.reloadTab(tab)
+        self.bindDocument(tab)
+        self.enforceBudget()
+
+    def storeView(self, tab):
+        if self.isViewerActive():
+            tab.offset = self.viewer.centerOffset()
+            return
+        cursor = self.text.textCursor()
+        tab.cursor = (cursor.anchor(), cursor.position())
+        tab.scroll = self.text.verticalScrollBar().value()
+        if tab.filename and os.path.isfile(tab.filename):
+            tab.offset = byteOffset(
+                self.text.firstVisibleBlock().position(), tab.document.characterCount(),
+                os.path.getsize(tab.filename), len(tab.text_format.bom))
+
+    def applyView(self, tab):
+        end = tab.document.characterCount() - 1
+        cursor = self.text.textCursor()
+        cursor.setPosition(min(tab.cursor[0], end))
+        cursor.setPosition(min(tab.cursor[1], end), QtGui.QTextCursor.KeepAnchor)
+        self.text.setTextCursor(cursor)
+        self.text.verticalScrollBar().setValue(tab.scroll)
+
+    def bindDocument(self, tab):
+        tab.document.setDefaultFont(self.text.font())
+        self.text.setDocument(tab.document)
+        self.text.setHistory(tab.history)
+        self.text.setLineIndex(tab.line_index)
+        self.match_highlighter.setEngine(tab.search_engine)
+        self.log_highlighter.setDocument(tab.document)
+        self.applyView(tab)
+        self.undoAction.setEnabled(tab.history.isUndoAvailable())
+        self.redoAction.setEnabled(tab.history.isRedoAvailable())
+        self.stack.setCurrentWidget(tab.viewer or self.text)
+        self.setViewerMode(tab.viewer is not None)
+        self.setTextFormat(tab.text_format)
+        self.updateTitle()
+
+    def reloadTab(self, tab):
+        if tab.spill_file is None:
+            # неизменённый документ читается заново из файла
+            self.createDocument(tab)
+            self.text.setDocument(tab.document)
+            self.openDocument(tab.filename, tab.offset)
+            return
+        with open(tab.spill_file, encoding='utf-8', newline='') as file:
+            self.createDocument(tab, file.read())
+        os.remove(tab.spill_file)
+        tab.spill_file = None
+        tab.document.setModified(True)
+        if tab.journal is not None:
+            tab.journal.attach(tab.document)
+
+    def unloadTab(self, tab):
+        document = tab.document
+        # выгруженная вкладка при возврате читает файл целиком
+        self.file_watcher.unwatch(tab.filename)
+        if document.isModified():
+            # изменённый текст уходит во временный файл, а не теряется
+            try:
+                fd, spill_file = tempfile.mkstemp(prefix='notepad-', suffix='.txt')
+                with os.fdopen(fd, 'w', encoding='utf-8', newline='') as file:
+                    file.write(documentText(document, SOFT_BREAK))
+            except OSError:
+                return
+            tab.spill_file = spill_file
+            tab.modified = True
+            if tab.journal is not None:
+                tab.journal.detach()
+        else:
+            tab.modified = False
+            if tab.journal is not None:
+                tab.journal.stop()
+                tab.journal = None
+            # неизменённая вкладка читается заново, её история начнётся с нуля
+            tab.history.clear()
+        tab.history.setDocument(None)
+        tab.document = None
+        for child in (tab.stats, tab.search_engine, tab.line_index, document):
+            child.deleteLater()
+        tab.stats = None
+        tab.search_engine = None
+        tab.line_index = None
+
+    def enforceBudget(self):
+        for tab in tabsToUnload(self.tabs(), self.current_tab, self.memory_budget):
+            if tab.viewer is None:
+                self.unloadTab(tab)
+
+    def releaseTab(self, tab):
+        self.file_watcher.unwatch(tab.filename)
+        if tab.journal is not None:
+            tab.journal.stop()
+            tab.journal = None
+        if tab.viewer is not None:
+            tab.viewer.closeFile()
+            self.stack.removeWidget(tab.viewer)
+            tab.viewer.deleteLater()
+            tab.viewer = None
+            if tab is self.current_tab:
+                self.stack.setCurrentWidget(self.text)
+        if tab.spill_file is not None:
+            os.remove(tab.spill_file)
+            tab.spill_file = None
+
+    def closeTab(self, index):
+        self.tab_bar.setCurrentIndex(index)
+        if not (self.maybeSave() and self.waitForSave()):
+            return False
+        self.cancelTask()
+        tab = self.current_tab
+        if self.tab_bar.count() == 1:
+            self.releaseTab(tab)
+            self.writeJournalList()
+            self.clearText()
+            self.setCurrentFile('')
+            self.setTextFormat(DEFAULT_FORMAT)
+            self.stack.setCurrentWidget(self.text)
+            self.setViewerMode(False)
+            return True
+        self.discardTab(tab)
+        self.writeJournalList()
+        return True
+
+    def discardTab(self, tab):
+        self.releaseTab(tab)
+        if tab is self.current_tab:
+            # закрываемая вкладка не должна сохранять состояние при переключении
+            self.current_tab = None
+        self.tab_bar.removeTab(self.tabs().index(tab))
+        for child in (tab.stats, tab.search_engine, tab.line_index, tab.history, tab.document):
+            if child is not None:
+                child.deleteLater()
+
+    def updateTabTitles(self):
+        for index, tab in enumerate(self.tabs()):
+            if tab is not None:
+                self.tab_bar.setTabText(index, tab.title())
+                self.tab_bar.setTabToolTip(index, tab.filename)
 
     def showContextMenu(self):
         menu = QtWidgets.QMenu(self)
@@ -81,22 +472,34 @@ class Notepad(QtWidgets.QMainWindow):
         menu.exec_(QtGui.QCursor.pos())
 
 
-    def judgeConfig(self):
-
-        if not os.path.exists(CONFIG_FILE_PATH):
-            f = open(CONFIG_FILE_PATH, 'w', encoding='utf-8')
-            f.close()
-
     def readSettings(self):
         # регулировка размера окна
         width = self.getConfig('Display', 'width', 800)
-        height = self.getConfig('Display', 'height ', 600)
+        height = self.getConfig('Display', 'height', 600)
         px = self.getConfig('Display', 'x', 0)
         py = self.getConfig('Display', 'y', 0)
         self.move(int(px), int(py))
-        self.resize(int(width), (height))
+        self.resize(int(width), int(height))
 
         self.default_dir = self.getConfig('Setting', 'dir', '')
+        self.viewer_threshold = int(self.getConfig(
+            'Setting', 'viewer_threshold', VIEWER_THRESHOLD))
+        self.memory_budget = int(self.getConfig('Setting', 'memory_budget', MEMORY_BUDGET))
+        self.undo_budget = int(self.getConfig('Setting', 'undo_budget', UNDO_BUDGET))
+        self.history.setBudget(self.undo_budget)
+        self.persistentUndoAction.setChecked(bool(int(self.getConfig('Setting', 'persistent_undo', 0))))
+        if not int(self.getConfig('Setting', 'wrap', 1)):
+            self.setLineWrap()
+        self.followAction.setChecked(bool(int(self.getConfig('Setting', 'follow', 0))))
+        if int(self.getConfig('Setting', 'highlight', 0)):
+            self.highlightAction.setChecked(True)
+            self.setHighlight(True)
+        self.lineNumbersAction.setChecked(bool(int(self.getConfig('Setting', 'line_numbers', 1))))
+        self.text.setLineNumbersVisible(self.lineNumbersAction.isChecked())
+        self.stall_threshold = int(self.getConfig('Setting', 'stall_threshold', STALL_THRESHOLD))
+        self.profiler.setThreshold(self.stall_threshold)
+        self.profileAction.setChecked(bool(int(self.getConfig('Setting', 'profiling', 0))))
+        self.profiler.setEnabled(self.profileAction.isChecked())
 
         self.font_family = self.getConfig('Font', 'family', 'Consolas')
         self.font_size = self.getConfig('Font', 'size', '10')
@@ -111,15 +514,32 @@ class Notepad(QtWidgets.QMainWindow):
         font.setUnderline(int(self.font_underline))
         self.text.setFont(font)
 
-    def writeSetting(self):
-
+    def writeGeometry(self):
         self.writeConfig('Display', 'width', str(self.size().width()))
         self.writeConfig('Display', 'height', str(self.size().height()))
         self.writeConfig('Display', 'x', str(self.pos().x()))
         self.writeConfig('Display', 'y', str(self.pos().y()))
 
-        self.writeConfig('Setting', 'dir', self.default_dir)
+    def writeSetting(self):
 
+        self.writeGeometry()
+        self.writeConfig('Setting', 'dir', self.default_dir)
+        self.writeConfig('Setting', 'viewer_threshold', self.viewer_threshold)
+        self.writeConfig('Setting', 'memory_budget', self.memory_budget)
+        self.writeConfig('Setting', 'undo_budget', self.undo_budget)
+        self.writeConfig('Setting', 'stall_threshold', self.stall_threshold)
+
+    # вид и шрифт записываются, только когда их меняют в этом окне,
+    # иначе закрытие одного блокнота затирало бы выбор в другом
+    def writeView(self):
+        self.writeConfig('Setting', 'wrap', int(bool(self.text.lineWrapMode())))
+        self.writeConfig('Setting', 'highlight', int(self.highlightAction.isChecked()))
+        self.writeConfig('Setting', 'follow', int(self.followAction.isChecked()))
+        self.writeConfig('Setting', 'line_numbers', int(self.lineNumbersAction.isChecked()))
+        self.writeConfig('Setting', 'profiling', int(self.profileAction.isChecked()))
+        self.writeConfig('Setting', 'persistent_undo', int(self.persistentUndoAction.isChecked()))
+
+    def writeFont(self):
         self.writeConfig('Font', 'family', self.text.font().family())
         self.writeConfig('Font', 'size', str(self.text.font().pointSize()))
         self.writeConfig('Font', 'bold', int(self.text.font().bold()))
@@ -129,23 +549,36 @@ class Notepad(QtWidgets.QMainWindow):
         self.writeConfig('Font', 'underline', int(
             self.text.font().underline()))
 
+    def flushConfig(self):
+        # при выходе оставшиеся изменения записываются сразу
+        return self.settings.sync()
+
+    def resizeEvent(self, event):
+        super(Notepad, self).resizeEvent(event)
+        self.writeGeometry()
 
-        self.config.write(open(CONFIG_FILE_PATH, 'w', encoding='utf-8'))
+    def moveEvent(self, event):
+        super(Notepad, self).moveEvent(event)
+        self.writeGeometry()
 
     def createMenubar(self):
         fileMenu = QtWidgets.QMenu('ФАЙЛ', self)
         fileMenu.addAction(self.newAction)
         fileMenu.addAction(self.openAction)
+        self.recentMenu = fileMenu.addMenu('ПОСЛЕДНИЕ ФАЙЛЫ')
+        self.recentMenu.aboutToShow.connect(self.updateRecentMenu)
         fileMenu.addAction(self.saveAction)
         fileMenu.addAction(self.saveAsAction)
         fileMenu.addSeparator()
         fileMenu.addAction(self.printAction)
         fileMenu.addAction(self.printReviewAction)
+        fileMenu.addAction(self.exportPdfAction)
         fileMenu.addSeparator()
         fileMenu.addAction(self.quitAction)
         editMenu = QtWidgets.QMenu('РЕДАКТИРОВАТЬ', self)
         editMenu.addAction(self.undoAction)
         editMenu.addAction(self.redoAction)
+        editMenu.addAction(self.persistentUndoAction)
         editMenu.addSeparator()
         editMenu.addAction(self.cutAction)
         editMenu.addAction(self.copyAction)
@@ -158,12 +591,19 @@ class Notepad(QtWidgets.QMainWindow):
 
         editMenu.addAction(self.findAction)
         editMenu.addAction(self.findNextAction)
+        editMenu.addAction(self.findInFilesAction)
         editMenu.addAction(self.replaceAction)
+        editMenu.addAction(self.goToLineAction)
 
         styleMenu = QtWidgets.QMenu('ФОРМАТ', self)
         styleMenu.addAction(self.lineWrapAction)
         styleMenu.addAction(self.fontAction)
+        styleMenu.addAction(self.highlightAction)
+        styleMenu.addAction(self.lineNumbersAction)
+        styleMenu.addAction(self.followAction)
         helpMenu = QtWidgets.QMenu('ПОМОЩЬ', self)
+        helpMenu.addAction(self.profileAction)
+        helpMenu.addAction(self.profileReportAction)
         helpMenu.addAction(self.aboutAction)
 
         self.menuBar().addMenu(fileMenu)
@@ -183,78 +623,705 @@ class Notepad(QtWidgets.QMainWindow):
 
     def createActions(self):
         self.undoAction = QtWidgets.QAction(QtGui.QIcon(
-            'resource/undo.png'), "ОТМЕНИТЬ", self, shortcut=QtGui.QKeySequence.Undo, statusTip="ОТМЕНИТЬ ПОСЛЕДНЕЕ ДЕЙСТВИЕ", triggered=self.text.undo)
+            ':/resource/undo.png'), "ОТМЕНИТЬ", self, shortcut=QtGui.QKeySequence.Undo, statusTip="ОТМЕНИТЬ ПОСЛЕДНЕЕ ДЕЙСТВИЕ", triggered=self.text.undo)
         self.redoAction = QtWidgets.QAction(QtGui.QIcon(
-            'resource/redo.png'), 'ВЕРНУТЬ', self, shortcut=QtGui.QKeySequence.Redo, statusTip='ВЕРНУТЬ ОТМЕНЕННОЕ ДЕЙСТВИЕ', triggered=self.text.redo)
+            ':/resource/redo.png'), 'ВЕРНУТЬ', self, shortcut=QtGui.QKeySequence.Redo, statusTip='ВЕРНУТЬ ОТМЕНЕННОЕ ДЕЙСТВИЕ', triggered=self.text.redo)
+        self.persistentUndoAction = QtWidgets.QAction(
+            'СОХРАНЯТЬ ИСТОРИЮ ПРАВОК', self, checkable=True, statusTip='ХРАНИТЬ ИСТОРИЮ ОТМЕНЫ РЯДОМ С ФАЙЛОМ')
         self.cutAction = QtWidgets.QAction(QtGui.QIcon(
-            'resource/cut.png'), "ВЫРЕЗАТЬ", self, shortcut=QtGui.QKeySequence.Cut, statusTip="ВЫРЕЗАТЬ", triggered=self.text.cut)
+            ':/resource/cut.png'), "ВЫРЕЗАТЬ", self, shortcut=QtGui.QKeySequence.Cut, statusTip="ВЫРЕЗАТЬ", triggered=self.text.cut)
         self.copyAction = QtWidgets.QAction(QtGui.QIcon(
-            'resource/copy.png'), "КОПИРОВАТЬ", self, shortcut=QtGui.QKeySequence.Copy, statusTip="КОПИРОВАТЬ В БУФЕР ОБМЕНА", triggered=self.text.copy)
+            ':/resource/copy.png'), "КОПИРОВАТЬ", self, shortcut=QtGui.QKeySequence.Copy, statusTip="КОПИРОВАТЬ В БУФЕР ОБМЕНА", triggered=self.text.copy)
         self.pasteAction = QtWidgets.QAction(QtGui.QIcon(
-            'resource/paste.png'), "ВСТАВИТЬ", self, shortcut=QtGui.QKeySequence.Paste, statusTip="ВСТАВИТЬ ИЗ БУФЕРА ОБМЕНА", triggered=self.text.paste)
+            ':/resource/paste.png'), "ВСТАВИТЬ", self, shortcut=QtGui.QKeySequence.Paste, statusTip="ВСТАВИТЬ ИЗ БУФЕРА ОБМЕНА", triggered=self.text.paste)
         self.selectAllAction = QtWidgets.QAction(QtGui.QIcon(
-            'resource/SelectAll.png'), "ВЫБРАТЬ ВСЁ", self, shortcut=QtGui.QKeySequence.SelectAll, statusTip="ВЫБРАТЬ ВСЁ", triggered=self.text.selectAll)
+            ':/resource/selectAll.png'), "ВЫБРАТЬ ВСЁ", self, shortcut=QtGui.QKeySequence.SelectAll, statusTip="ВЫБРАТЬ ВСЁ", triggered=self.text.selectAll)
         self.newAction = QtWidgets.QAction(QtGui.QIcon(
-            'resource/new.png'), 'НОВЫЙ', self, shortcut=QtGui.QKeySequence.New, statusTip='НОВЫЙ ФАЙЛ', triggered=self.newFile)
+            ':/resource/new.png'), 'НОВЫЙ', self, shortcut=QtGui.QKeySequence.New, statusTip='НОВЫЙ ФАЙЛ', triggered=self.newFile)
         self.openAction = QtWidgets.QAction(QtGui.QIcon(
-            'resource/open.png'), 'ОТКРЫТЬ', self, shortcut=QtGui.QKeySequence.Open, statusTip='ОТКРЫТЬ ФАЙЛ', triggered=self.openFile)
+            ':/resource/open.png'), 'ОТКРЫТЬ', self, shortcut=QtGui.QKeySequence.Open, statusTip='ОТКРЫТЬ ФАЙЛ', triggered=self.openFile)
         self.saveAction = QtWidgets.QAction(QtGui.QIcon(
-            'resource/save.png'), 'СОХРАНИТЬ', self, shortcut=QtGui.QKeySequence.Save, statusTip='СОХРАНИТЬ ФАЙЛ', triggered=self.saveFile)
+            ':/resource/save.png'), 'СОХРАНИТЬ', self, shortcut=QtGui.QKeySequence.Save, statusTip='СОХРАНИТЬ ФАЙЛ', triggered=self.saveFile)
         self.saveAsAction = QtWidgets.QAction(QtGui.QIcon(
-            'resource/save.png'), 'СОХРАНИТЬ КАК', self, shortcut=QtGui.QKeySequence.SaveAs, statusTip='СОХРАНИТЬ ФАЙЛ', triggered=self.saveAsFile)
+            ':/resource/save.png'), 'СОХРАНИТЬ КАК', self, shortcut=QtGui.QKeySequence.SaveAs, statusTip='СОХРАНИТЬ ФАЙЛ', triggered=self.saveAsFile)
         self.quitAction = QtWidgets.QAction(QtGui.QIcon(
-            'resource/exit.png'), 'ВЫХОД', self, shortcut="Ctrl+Q", statusTip='ЗАКРЫТЬ ПРОГРАММУ', triggered=self.close)
+            ':/resource/exit.png'), 'ВЫХОД', self, shortcut="Ctrl+Q", statusTip='ЗАКРЫТЬ ПРОГРАММУ', triggered=self.close)
         self.lineWrapAction = QtWidgets.QAction(QtGui.QIcon(
-            'resource/check.png'), 'ПРОВЕРИТЬ', self, triggered=self.setLineWrap)
+            ':/resource/check.png'), 'ПРОВЕРИТЬ', self, triggered=self.setLineWrap)
+        self.highlightAction = QtWidgets.QAction(
+            'ПОДСВЕТКА ЖУРНАЛОВ', self, checkable=True, statusTip='ПОДСВЕТКА ЖУРНАЛОВ И ФАЙЛОВ НАСТРОЕК', triggered=self.setHighlight)
+        self.followAction = QtWidgets.QAction(
+            'СЛЕДИТЬ ЗА КОНЦОМ ФАЙЛА', self, checkable=True, statusTip='ПРОКРУЧИВАТЬ К ТЕКСТУ, ДОПИСАННОМУ В ФАЙЛ')
+        self.lineNumbersAction = QtWidgets.QAction(
+            'НОМЕРА СТРОК', self, checkable=True, statusTip='ПОКАЗЫВАТЬ НОМЕРА СТРОК СЛЕВА ОТ ТЕКСТА', triggered=self.text.setLineNumbersVisible)
         self.fontAction = QtWidgets.QAction(QtGui.QIcon(
-            'resource/font.png'), 'ШРИФТ', self, statusTip='ИЗМЕНЕНИЕ ШРИФТА', triggered=self.setFont)
+            ':/resource/font.png'), 'ШРИФТ', self, statusTip='ИЗМЕНЕНИЕ ШРИФТА', triggered=self.setFont)
+        self.profileAction = QtWidgets.QAction(
+            'ПРОФИЛИРОВАНИЕ', self, checkable=True, statusTip='ЗАМЕРЯТЬ ВРЕМЯ КОМАНД, ОТКЛИК НА КЛАВИШИ И ЗАВИСАНИЯ', triggered=self.profiler.setEnabled)
+        self.profileReportAction = QtWidgets.QAction(
+            'ПРОИЗВОДИТЕЛЬНОСТЬ', self, statusTip='ПОКАЗАТЬ ЗАМЕРЫ ПРОФИЛИРОВАНИЯ', triggered=self.showProfile)
         self.aboutAction = QtWidgets.QAction(QtGui.QIcon(
-            'resource/about.png'), 'О ПРОГРАММЕ', self, statusTip='О ПРОГРАММЕ', triggered=self.about)
+            ':/resource/about.png'), 'О ПРОГРАММЕ', self, statusTip='О ПРОГРАММЕ', triggered=self.about)
+        # настройки из меню записываются сразу, а не только при выходе
+        self.lineWrapAction.triggered.connect(self.writeView)
+        self.highlightAction.triggered.connect(self.writeView)
+        self.followAction.triggered.connect(self.writeView)
+        self.lineNumbersAction.triggered.connect(self.writeView)
+        self.profileAction.triggered.connect(self.writeView)
+        self.persistentUndoAction.triggered.connect(self.writeView)
+        self.fontAction.triggered.connect(self.writeFont)
         self.findAction = QtWidgets.QAction(QtGui.QIcon(
-            'resource/find.png'), 'НАЙТИ', self, statusTip='НАЙТИ', shortcut='Ctrl+F', triggered=self.findText)
+            ':/resource/find.png'), 'НАЙТИ', self, statusTip='НАЙТИ', shortcut='Ctrl+F', triggered=self.findText)
         self.findNextAction = QtWidgets.QAction(QtGui.QIcon(
-            'resource/find.png'), 'НАЙТИ ДАЛЕЕ', self, statusTip='НАЙТИ ДАЛЕЕ', shortcut='F3', triggered=self.searchText)
+            ':/resource/find.png'), 'НАЙТИ ДАЛЕЕ', self, statusTip='НАЙТИ ДАЛЕЕ', shortcut='F3', triggered=self.searchText)
+        self.findInFilesAction = QtWidgets.QAction(QtGui.QIcon(
+            ':/resource/find.png'), 'НАЙТИ В ФАЙЛАХ', self, statusTip='НАЙТИ В ФАЙЛАХ', shortcut='Ctrl+Shift+F', triggered=self.findInFiles)
         self.replaceAction = QtWidgets.QAction(QtGui.QIcon(
-            'resource/replace.png'), 'ЗАМЕНИТЬ', self, statusTip='ЗАМЕНИТЬ', shortcut='Ctrl+H', triggered=self.replace)
+            ':/resource/replace.png'), 'ЗАМЕНИТЬ', self, statusTip='ЗАМЕНИТЬ', shortcut='Ctrl+H', triggered=self.replace)
         self.printAction = QtWidgets.QAction(QtGui.QIcon(
-            'resource/print.png'), 'ПЕЧАТЬ', self, statusTip='ПЕЧАТЬ', shortcut='Ctrl+P', triggered=self.printDocument)
+            ':/resource/print.png'), 'ПЕЧАТЬ', self, statusTip='ПЕЧАТЬ', shortcut='Ctrl+P', triggered=self.printDocument)
+        self.goToLineAction = QtWidgets.QAction(
+            'ПЕРЕЙТИ', self, statusTip='ПЕРЕЙТИ К СТРОКЕ ИЛИ СМЕЩЕНИЮ', shortcut='Ctrl+G', triggered=self.goToLine)
         self.printReviewAction = QtWidgets.QAction(QtGui.QIcon(
-            'resource/print.png'), 'ПРЕДВАРИТЕЛЬНЫЙ ПРОСМОТР', self, statusTip='ПРЕДВАРИТЕЛЬНЫЙ ПРОСМОТР', triggered=self.printReview)
+            ':/resource/print.png'), 'ПРЕДВАРИТЕЛЬНЫЙ ПРОСМОТР', self, statusTip='ПРЕДВАРИТЕЛЬНЫЙ ПРОСМОТР', triggered=self.printReview)
+        self.exportPdfAction = QtWidgets.QAction(
+            'ЭКСПОРТ В PDF', self, statusTip='СОХРАНИТЬ ДОКУМЕНТ В PDF', triggered=self.exportPdf)
 
 
 
     def closeEvent(self, event):
-        if self.maybeSave():
-
-            self.writeSetting()
-            event.accept()
-        else:
-            event.ignore()
+        for index, tab in enumerate(self.tabs()):
+            if tab.isModified():
+                self.tab_bar.setCurrentIndex(index)
+                if not (self.maybeSave() and self.waitForSave()):
+                    event.ignore()
+                    return
+
+        self.cancelTask()
+        self.cancelFileSearch()
+        if self.print_job is not None:
+            self.print_job.cancel()
+            self.print_job.wait()
+        self.writeSession()
+        for tab in self.tabs():
+            self.releaseTab(tab)
+        self.writeJournalList()
+        self.match_highlighter.setPattern(None)
+        self.profiler.setEnabled(False)
+        self.writeSetting()
+        self.flushConfig()
+        event.accept()
 
     def newFile(self):
-        if self.maybeSave():
-            self.text.clear()
+        self.addTab()
 
     def openFile(self):
-        if self.maybeSave():
-            filename, _ = QtWidgets.QFileDialog.getOpenFileName(
-                self, '', self.default_dir, 'Текст (*.txt);;Все файлы(*.*)')
-            file = QtCore.QFile(filename)
-            if not file.open(QtCore.QFile.ReadOnly | QtCore.QFile.Text):
-                return
-            inf = QtCore.QTextStream(file)
-            self.text.setPlainText(inf.readAll())
-            self.setCurrentFile(filename)
+        filename, _ = QtWidgets.QFileDialog.getOpenFileName(
+            self, '', self.default_dir, 'Текст (*.txt);;Все файлы(*.*)')
+        self.openPath(filename)
+
+    def updateRecentMenu(self):
+        self.recentMenu.clear()
+        for filename in self.settings.recentFiles():
+            self.recentMenu.addAction(filename).triggered.connect(
+                lambda checked=False, filename=filename: self.openRecent(filename))
+        if self.recentMenu.isEmpty():
+            self.recentMenu.addAction('Пусто').setEnabled(False)
+
+    def openRecent(self, filename):
+        if not self.openPath(filename):
+            self.statusBar().showMessage('Не удалось открыть %s' % filename, 3000)
+
+    def findTab(self, filename):
+        path = os.path.normcase(os.path.abspath(filename))
+        for index, tab in enumerate(self.tabs()):
+            if tab.filename and os.path.normcase(os.path.abspath(tab.filename)) == path:
+                return index
+        return -1
+
+    def openPath(self, filename):
+        if not os.path.isfile(filename) or not os.access(filename, os.R_OK):
+            return False
+        if self.loader is not None:
+            return self.queuePath(filename)
+        index = self.findTab(filename)
+        if index != -1:
+            self.tab_bar.setCurrentIndex(index)
+            return True
+        try:
+            text_format = detectFile(filename)
+        except OSError:
+            return False
+        if not self.confirmFullLoad(filename, text_format):
+            return False
+        if not self.isPristine():
+            self.addTab()
+        self.pending_line = None
+        self.setTextFormat(text_format)
+        self.openDocument(filename)
+        return True
+
+    def confirmFullLoad(self, filename, text_format):
+        # просмотрщик ищет переводы строк побайтно и не открывает UTF-16/32:
+        # такой большой файл читается в память целиком, только с согласия
+        size = os.path.getsize(filename)
+        if size < self.viewer_threshold or isAsciiCompatible(text_format):
+            return True
+        answer = QtWidgets.QMessageBox.question(
+            self, 'Блокнот', 'Файл %s в кодировке %s (%.1f МБ) не откроется в режиме '
+            'просмотра и будет целиком загружен в память. Продолжить?' % (
+                filename, text_format.encoding.upper(), size / (1024 * 1024)))
+        return answer == QtWidgets.QMessageBox.Yes
+
+    def openDocument(self, filename, offset=None):
+        # просмотрщик ищет переводы строк побайтно, UTF-16/32 ему не подходят
+        if (os.path.getsize(filename) >= self.viewer_threshold
+                and isAsciiCompatible(self.text_format)):
+            self.openViewer(filename, offset)
+        else:
+            self.pending_records = self.recoverJournal(filename)
+            # начать с видимой области можно, только найдя в байтах начало строки
+            if not isAsciiCompatible(self.text_format):
+                offset = None
+            self.loadFile(filename, offset)
+
+    def queuePath(self, filename, number=None):
+        # смена вкладки прервала бы идущую загрузку и оставила бы её текст
+        # недочитанным, поэтому файл откроется после неё
+        self.open_queue.append((filename, number))
+        self.statusBar().showMessage(
+            'Файл %s откроется после окончания загрузки' % filename, 3000)
+        return True
+
+    def openFileAt(self, filename, number):
+        if self.loader is not None:
+            self.queuePath(filename, number)
+            return
+        if not self.openPath(filename):
+            return
+        if self.loader is None:
+            self.showLine(number)
+        else:
+            # строка покажется, как только загрузчик до неё дойдёт
+            self.pending_line = number
+
+    def loadFile(self, filename, offset=None):
+        self.cancelTask()
+        self.stopJournal()
+        self.closeViewer()
+        # загружаемый текст не должен попадать в историю отмены
+        self.history.clear()
+        self.history.setEnabled(False)
+        self.clearText()
+        self.text.setReadOnly(True)
+        self.file_watcher.unwatch(self.cur_file)
+        self.setCurrentFile(filename)
+
+        self.loader = FileLoader(filename, self.text_format.encoding,
+                                 len(self.text_format.bom), offset, parent=self)
+        self.prefix_position = 0
+        self.loader.chunkLoaded.connect(self.appendChunk)
+        self.loader.prefixLoaded.connect(self.insertPrefix)
+        self.loader.progress.connect(self.showProgress)
+        self.loader.failed.connect(self.loadFailed)
+        self.loader.undecodable.connect(self.loadUndecodable)
+        self.loader.finished.connect(self.loadFinished)
+        # пока документ заполняется, вкладку нельзя сменить
+        self.tab_bar.setEnabled(False)
+        self.newAction.setEnabled(False)
+        self.progress_bar.setValue(0)
+        self.progress_bar.show()
+        self.cancel_button.show()
+        self.statusBar().showMessage('Загрузка %s' % filename)
+        self.loader.start()
+
+    def appendChunk(self, text):
+        if self.sender() is not self.loader:
+            return
+        cursor = QtGui.QTextCursor(self.text.document())
+        cursor.movePosition(QtGui.QTextCursor.End)
+        insertText(cursor, text)
+        self.loader.chunkDone()
+        if self.pending_line is not None and self.pending_line < self.lineCount() - 1:
+            self.showLine(self.pending_line)
+            self.pending_line = None
+
+    def insertPrefix(self, text):
+        if self.sender() is not self.loader:
+            return
+        # текст до видимой области вставляется выше неё, прокрутка
+        # сдвигается на добавленные строки, чтобы вид не прыгал
+        document = self.text.document()
+        scroll_bar = self.text.verticalScrollBar()
+        value = scroll_bar.value()
+        count = document.blockCount()
+        cursor = QtGui.QTextCursor(document)
+        cursor.setPosition(self.prefix_position)
+        insertText(cursor, text)
+        self.loader.chunkDone()
+        self.prefix_position += len(text)
+        scroll_bar.setValue(value + document.blockCount() - count)
+
+    def showProgress(self, done, total):
+        if self.sender() not in (self.loader, self.replacer, self.paster, self.saver,
+                                 self.print_job, self.viewer):
+            return
+        self.progress_bar.setValue(int(done * 100 / total) if total else 100)
+
+    def loadFailed(self, message):
+        if self.sender() is not self.loader:
+            return
+        self.cancelLoad()
+        self.statusBar().showMessage('Ошибка чтения: %s' % message, 5000)
+        self.openNextPath()
+
+    def loadUndecodable(self, offset):
+        if self.sender() is not self.loader:
+            return
+        text_format = self.text_format
+        if text_format.encoding != 'utf-8' or text_format.bom or not self.loader.ascii:
+            return
+        # UTF-8 угадан по ASCII-началу файла, а дальше идут байты другой
+        # кодировки: файл перечитывается целиком в запасной кодировке
+        loader, self.loader = self.loader, None
+        loader.cancel()
+        loader.wait()
+        self.setTextFormat(TextFormat(FALLBACK_ENCODING, b'', text_format.newline))
+        self.loadFile(self.cur_file, loader.first_offset)
+
+    def loadFinished(self):
+        if self.sender() is not self.loader:
+            return
+        loader, self.loader = self.loader, None
+        self.stopLoad()
+        if self.pending_line is not None:
+            self.showLine(self.pending_line)
+            self.pending_line = None
+        elif self.current_tab.offset is not None:
+            self.applyView(self.current_tab)
+        records, self.pending_records = self.pending_records, None
+        if records:
+            applyRecords(self.text.document(), records)
+        self.text.document().setModified(bool(records))
+        self.startJournal(self.cur_file, records or ())
+        if not records and self.persistentUndoAction.isChecked():
+            self.restoreHistory(self.cur_file)
+        # дописанное в файл во время загрузки придёт от наблюдателя
+        self.file_watcher.watch(self.cur_file, self.text_format.encoding, loader.done)
+        self.enforceBudget()
+        if loader.invalid_offset is not None:
+            if isAsciiCompatible(self.text_format):
+                message = 'сохранятся без изменений'
+            else:
+                message = 'заменены знаком \ufffd'
+            self.statusBar().showMessage(
+                'Загружено; байты, не подходящие кодировке %s (с %d), %s' % (
+                    self.text_format.encoding.upper(), loader.invalid_offset, message), 10000)
+        elif hasSoftBreaks(self.text.document()):
+            self.statusBar().showMessage('Загружено; длинные строки показаны частями', 3000)
+        else:
+            self.statusBar().showMessage('Загружено', 1000)
+        self.openNextPath()
+
+    def startJournal(self, filename, records=()):
+        self.stopJournal()
+        journal = EditJournal(self.text.document(), filename, self)
+        if journal.start(records):
+            self.journal = journal
+            self.writeJournalList()
+
+    def stopJournal(self):
+        if self.journal is None:
+            return
+        self.journal.stop()
+        self.journal = None
+        self.writeJournalList()
+
+    def writeJournalList(self):
+        # список файлов с журналами нужен для восстановления после сбоя
+        filenames = [tab.journal.filename for tab in self.tabs()
+                     if tab is not None and tab.journal is not None]
+        self.writeConfig('Journal', 'files', '\n'.join(filenames))
+
+    def recoverJournal(self, filename):
+        if not isOrphaned(filename):
+            return None
+        path = journalPath(filename)
+        try:
+            stamp, records = readJournal(path)
+        except (OSError, ValueError, UnicodeError):
+            stamp, records = None, None
+        # журнал применим, только если файл не менялся после его создания
+        if records and stamp == fileStamp(filename):
+            answer = QtWidgets.QMessageBox.question(
+                self, 'Блокнот', 'Найдены несохранённые правки %s. Восстановить?' % filename)
+            if answer == QtWidgets.QMessageBox.Yes:
+                return records
+        os.remove(path)
+        return None
+
+    def writeHistory(self, filename, steps):
+        try:
+            writeHistory(historyPath(filename), fileStamp(filename), steps)
+        except OSError as error:
+            self.statusBar().showMessage('История правок не сохранена: %s' % error, 3000)
+
+    def restoreHistory(self, filename):
+        path = historyPath(filename)
+        if not os.path.exists(path):
+            return
+        try:
+            stamp, steps = readHistory(path)
+        except (OSError, ValueError):
+            return
+        # история применима, только если файл не менялся после её записи
+        if stamp == fileStamp(filename):
+            self.history.restore(steps)
+
+    def appendExternal(self, filename, text):
+        index = self.findTab(filename)
+        tab = self.tab_bar.tabData(index) if index != -1 else None
+        if tab is not None and tab.viewer is not None:
+            # просмотрщик дочитывает файл сам, по новому отображению
+            tab.viewer.follow = tab is self.current_tab and self.followAction.isChecked()
+            tab.viewer.extendFile()
+            return
+        if tab is None or tab.document is None:
+            self.file_watcher.unwatch(filename)
+            return
+        if tab.document.isModified():
+            # текст разошёлся с файлом: слежение возобновится после сохранения
+            self.file_watcher.unwatch(filename)
+            self.statusBar().showMessage(
+                'Файл %s дополнен другой программой, изменения не подгружены' % filename, 5000)
+            return
+        # дописанное другой программой не попадает в историю отмены
+        tab.history.setEnabled(False)
+        cursor = QtGui.QTextCursor(tab.document)
+        cursor.movePosition(QtGui.QTextCursor.End)
+        splitter = LineSplitter(cursor.block().length() - 1)
+        insertText(cursor, splitter.split(text, True))
+        tab.history.setEnabled(True)
+        tab.document.setModified(False)
+        if tab.journal is not None and hasSoftBreaks(tab.document):
+            # дописанная строка разбита иначе, чем при чтении файла целиком
+            tab.journal.stop()
+            tab.journal = None
+            self.writeJournalList()
+        elif tab.journal is not None:
+            # журнал начинается заново от нового размера файла
+            tab.journal.checkpoint()
+            tab.journal.rebase()
+        if tab is self.current_tab and self.followAction.isChecked():
+            self.text.moveCursor(QtGui.QTextCursor.End)
+            self.text.ensureCursorVisible()
+
+    def fileChanged(self, filename):
+        index = self.findTab(filename)
+        if index == -1:
+            self.file_watcher.unwatch(filename)
+            return
+        # собственное сохранение и уже заданный вопрос не повторяются
+        if self.reload_prompt or (self.saver is not None and self.saver.filename == filename):
+            return
+        if not os.path.isfile(filename):
+            self.statusBar().showMessage('Файл %s удалён или переименован' % filename, 5000)
+            return
+        tab = self.tab_bar.tabData(index)
+        self.tab_bar.setCurrentIndex(index)
+        question = 'Файл %s изменён другой программой. Перезагрузить?' % filename
+        if tab.isModified():
+            question += '\nНесохранённые изменения будут потеряны.'
+        self.reload_prompt = True
+        try:
+            answer = QtWidgets.QMessageBox.question(self, 'Блокнот', question)
+        finally:
+            self.reload_prompt = False
+        if answer != QtWidgets.QMessageBox.Yes or tab is not self.current_tab:
+            # документ остаётся прежним, дописывать к нему чужой текст нельзя
+            self.file_watcher.unwatch(filename)
+            return
+        try:
+            text_format = detectFile(filename)
+        except OSError:
+            return
+        self.pending_line = None
+        self.setTextFormat(text_format)
+        self.openDocument(filename)
+
+    def writeSession(self):
+        self.storeView(self.current_tab)
+        self.settings.removeSection('Session')
+        tabs = [tab for tab in self.tabs() if tab.filename]
+        for number, tab in enumerate(tabs):
+            self.writeConfig('Session', 'file%d' % number, tab.filename)
+            self.writeConfig('Session', 'view%d' % number, '%d %d %d %d' % (
+                tab.cursor[0], tab.cursor[1], tab.scroll,
+                tab.offset if tab.offset is not None else -1))
+        if self.current_tab in tabs:
+            self.writeConfig('Session', 'current', tabs.index(self.current_tab))
+
+    def restoreSession(self):
+        # вкладки создаются без документов: текущая сразу читается с
+        # сохранённой видимой области, остальные - при переключении на них
+        current = int(self.getConfig('Session', 'current', -1))
+        number = 0
+        target = None
+        while self.getConfig('Session', 'file%d' % number, None) is not None:
+            filename = self.getConfig('Session', 'file%d' % number, None)
+            view = self.getConfig('Session', 'view%d' % number, '0 0 0 -1')
+            tab = self.restoreTab(filename, view)
+            if tab is not None and (target is None or number == current):
+                target = tab
+            number += 1
+        # уже начатую загрузку переключение вкладки прервало бы
+        if target is not None and self.loader is None:
+            pristine = self.isPristine()
+            initial = self.current_tab
+            self.tab_bar.setCurrentIndex(self.tabs().index(target))
+            if pristine:
+                self.discardTab(initial)
+        self.recoverStartupJournal()
+
+    def restoreTab(self, filename, view):
+        if self.findTab(filename) != -1:
+            return None
+        try:
+            anchor, position, scroll, offset = (int(value) for value in view.split())
+            text_format = detectFile(filename)
+        except (OSError, ValueError):
+            return None
+        tab = DocumentTab()
+        tab.filename = filename
+        tab.text_format = text_format
+        tab.cursor = (anchor, position)
+        tab.scroll = scroll
+        tab.offset = offset if offset >= 0 else None
+        self.tab_bar.setTabData(self.tab_bar.addTab(tab.title()), tab)
+        self.updateTabTitles()
+        return tab
+
+    def recoverStartupJournal(self):
+        filenames = self.getConfig('Journal', 'files', '').splitlines()
+        self.openPaths([filename for filename in filenames
+                        if filename and os.path.isfile(filename) and isOrphaned(filename)])
+
+    def receiveFiles(self, filenames):
+        # файлы, переданные повторным запуском блокнота
+        self.openPaths(filenames)
+        if self.isMinimized():
+            self.showNormal()
+        self.raise_()
+        self.activateWindow()
+
+    def openPaths(self, filenames):
+        self.open_queue.extend((filename, None) for filename in filenames)
+        self.openNextPath()
+
+    def openNextPath(self):
+        # следующий файл открывается, когда закончилась загрузка предыдущего,
+        # иначе смена вкладки прервала бы её
+        while self.open_queue and self.loader is None:
+            filename, number = self.open_queue.pop(0)
+            if number is None:
+                self.openPath(filename)
+            else:
+                self.openFileAt(filename, number)
+
+    def cancelTask(self):
+        self.cancelLoad()
+        self.cancelReplace()
+        self.cancelPaste()
+        self.cancelViewerSearch()
+
+    def cancelLoad(self):
+        if self.loader is None:
+            return
+        loader, self.loader = self.loader, None
+        loader.cancel()
+        loader.wait()
+        self.stopLoad()
+        # частично загруженный текст не привязан к файлу,
+        # чтобы его сохранение не обрезало оригинал
+        self.cur_file = ''
+        self.setWindowTitle('Без названия - Блокнот')
+        self.text.document().setModified(True)
+        self.history.setClean(False)
+        self.statusBar().showMessage('Загрузка отменена', 2000)
+
+    def openViewer(self, filename, offset=None):
+        self.cancelTask()
+        self.stopJournal()
+        self.clearText()
+        if self.viewer is None:
+            self.viewer = MappedViewer()
+            self.viewer.indexChanged.connect(self.showStats)
+            self.viewer.searchProgress.connect(self.showProgress)
+            self.viewer.searchFinished.connect(self.viewerSearchFinished)
+            self.viewer.verticalScrollBar().valueChanged.connect(self.showPosition)
+            self.stack.addWidget(self.viewer)
+        self.viewer.setFont(self.text.font())
+        self.viewer.openFile(filename, self.text_format.encoding, len(self.text_format.bom))
+        self.file_watcher.watch(filename, self.text_format.encoding)
+        if offset is not None:
+            self.viewer.showOffset(offset)
+        self.stack.setCurrentWidget(self.viewer)
+        self.setCurrentFile(filename)
+        self.setViewerMode(True)
+        self.statusBar().showMessage('Файл открыт только для чтения', 2000)
+
+    def closeViewer(self):
+        if self.viewer is None:
+            return
+        viewer, self.viewer = self.viewer, None
+        viewer.closeFile()
+        self.stack.removeWidget(viewer)
+        viewer.deleteLater()
+        self.stack.setCurrentWidget(self.text)
+        self.setViewerMode(False)
+
+    def isViewerActive(self):
+        return self.viewer is not None and self.stack.currentWidget() is self.viewer
+
+    def setViewerMode(self, enabled):
+        # просмотрщик только читает файл: правка и сохранение недоступны
+        for action in (self.saveAction, self.saveAsAction, self.pasteAction,
+                       self.replaceAction, self.printAction, self.printReviewAction):
+            action.setEnabled(not enabled)
+        self.findEnable()
+        self.showStats()
+        self.showPosition()
+
+    def goToLine(self):
+        # смещение в просмотрщике — в байтах файла, в редакторе — в символах
+        if self.isViewerActive():
+            current = '%d' % (self.viewer.currentLine() + 1)
+            count = self.viewer.lineCount()
+        else:
+            line, column = self.cursorLineColumn()
+            current = '%d:%d' % (line + 1, column + 1)
+            count = self.lineCount()
+        text, ok = QtWidgets.QInputDialog.getText(
+            self, 'Перейти', 'Строка[:столбец] (1–%d) или @смещение:' % count,
+            QtWidgets.QLineEdit.Normal, current)
+        if not ok:
+            return
+        target = parseTarget(text)
+        if target is None:
+            self.statusBar().showMessage('Не понимаю, куда перейти: %s' % text, 2000)
+        elif target[0] == 'offset':
+            self.showOffset(target[1])
+        else:
+            self.showLine(target[1], target[2])
+
+    def showLine(self, number, column=0):
+        if self.isViewerActive():
+            self.viewer.goToLine(number)
+            return
+        cursor = self.text.textCursor()
+        if hasSoftBreaks(self.text.document()):
+            # номер строки и столбец — в файле, а не в отрезках на экране
+            cursor.setPosition(self.line_index.position(number, column))
+        else:
+            block = self.text.document().findBlockByNumber(number)
+            if not block.isValid():
+                block = self.text.document().lastBlock()
+            cursor.setPosition(block.position() + min(column, block.length() - 1))
+        self.text.setTextCursor(cursor)
+        self.text.centerCursor()
+
+    def showOffset(self, offset):
+        if self.isViewerActive():
+            self.viewer.showOffset(min(offset, max(0, self.viewer.byteSize() - 1)))
+            return
+        cursor = self.text.textCursor()
+        if hasSoftBreaks(self.text.document()):
+            cursor.setPosition(self.line_index.documentPosition(offset))
+        else:
+            cursor.setPosition(min(offset, self.text.document().characterCount() - 1))
+        self.text.setTextCursor(cursor)
+        self.text.centerCursor()
+
+    def stopLoad(self):
+        self.tab_bar.setEnabled(True)
+        self.newAction.setEnabled(True)
+        self.progress_bar.hide()
+        self.cancel_button.hide()
+        self.text.setReadOnly(False)
+        self.history.setEnabled(True)
 
     def saveFile(self):
         if not self.cur_file:
             return self.saveAsFile()
-        writer = QtGui.QTextDocumentWriter(self.cur_file)
-        success = writer.write(self.text.document())
+        if self.loader is not None:
+            return False
+        self.waitForEdits()
+        self.waitForSave()
+        # снимок делается в GUI-потоке, кодирование и запись - в фоне
+        self.saver = FileSaver(self.cur_file, documentText(self.text.document()),
+                               self.text_format.encoding, self.text_format.bom,
+                               self.text_format.newline, parent=self)
+        self.saver.progress.connect(self.showProgress)
+        self.saver.finished.connect(self.saveFinished)
+        if self.journal is not None:
+            self.journal.checkpoint()
+        self.undo_snapshot = None
+        # позиции в истории зависят от того, как разбиты длинные строки,
+        # а сохранённый файл при следующем открытии разобьётся заново
+        if self.persistentUndoAction.isChecked() and not hasSoftBreaks(self.text.document()):
+            self.undo_snapshot = (self.cur_file, self.history.snapshot())
         self.setCurrentFile(self.cur_file)
-        if success:
-            self.statusBar().showMessage('Сохранено', 1000)
-        return success
+        self.progress_bar.setValue(0)
+        self.progress_bar.show()
+        self.statusBar().showMessage('Сохранение %s' % self.cur_file)
+        self.saver.start()
+        return True
+
+    def saveFinished(self):
+        if self.saver is None or not self.saver.isFinished():
+            return
+        saver, self.saver = self.saver, None
+        self.progress_bar.hide()
+        self.last_save_ok = saver.error is None
+        if not self.last_save_ok:
+            if saver.filename == self.cur_file:
+                self.text.document().setModified(True)
+                self.history.setClean(False)
+            if self.journal is not None:
+                self.journal.forget()
+            self.statusBar().showMessage('Ошибка сохранения: %s' % saver.error, 5000)
+            return
+        if hasSoftBreaks(self.text.document()):
+            # журнал тоже ведётся в позициях документа; после сохранения
+            # они разойдутся с разбиением файла при восстановлении
+            self.stopJournal()
+        elif self.journal is not None and self.journal.filename == saver.filename:
+            self.journal.rebase()
+        elif saver.filename == self.cur_file:
+            self.startJournal(self.cur_file)
+        if self.findTab(saver.filename) != -1:
+            self.file_watcher.watch(saver.filename, saver.encoding)
+        if self.undo_snapshot is not None and self.undo_snapshot[0] == saver.filename:
+            self.writeHistory(saver.filename, self.undo_snapshot[1])
+        self.undo_snapshot = None
+        size = saver.written / (1024 * 1024)
+        self.statusBar().showMessage('Сохранено: %.1f МБ за %.2f с (%.1f МБ/с)' % (
+            size, saver.elapsed, size / saver.elapsed if saver.elapsed else 0), 3000)
+
+    def waitForSave(self):
+        if self.saver is None:
+            return True
+        # ввод пользователя не обрабатывается, пока идёт ожидание
+        while self.saver is not None and not self.saver.wait(50):
+            QtWidgets.QApplication.processEvents(QtCore.QEventLoop.ExcludeUserInputEvents)
+        self.saveFinished()
+        return self.last_save_ok
+
+    def waitForEdits(self):
+        # замена и большая вставка правят документ порциями по таймеру;
+        # сохраняется результат целиком, а не половина правки
+        while self.replacer is not None or self.paster is not None:
+            QtWidgets.QApplication.processEvents(QtCore.QEventLoop.ExcludeUserInputEvents)
 
     def saveAsFile(self):
         filename, _ = QtWidgets.QFileDialog.getSaveFileName(
@@ -266,11 +1333,7 @@ class Notepad(QtWidgets.QMainWindow):
         return self.saveFile()
 
     def getConfig(self, section, key, default):
-
-        try:
-            return self.config[section][key]
-        except:
-            return default
+        return self.settings.value(section, key, default)
 
     def findText(self):
         self.find_dialog = QtWidgets.QDialog(self)
@@ -285,108 +1348,381 @@ class Notepad(QtWidgets.QMainWindow):
         layout.addWidget(search_label)
         layout.addWidget(self.search_text)
         layout.addWidget(self.search_btn)
+        layout.addLayout(self.createSearchOptions())
+        self.match_label = QtWidgets.QLabel()
+        layout.addWidget(self.match_label)
 
         self.search_btn.clicked.connect(self.searchText)
+        self.search_text.textChanged.connect(self.updateHighlight)
+        self.find_dialog.finished.connect(self.clearHighlight)
+        self.updateHighlight()
         self.find_dialog.setLayout(layout)
         self.find_dialog.show()
 
     def searchText(self):
-        cursor = self.text.textCursor()
-        start = cursor.anchor()
         text = self.search_text.text()
         self.last_search = text
 
         if self.last_search:
             self.findNextAction.setEnabled(True)
-        text_len = len(text)
-        context = self.text.toPlainText()
-
-        index = context.find(text, start)
-        if -1 == index:
+        else:
+            return
+        pattern = self.searchPattern(self.find_dialog)
+        if pattern is None:
+            return
+        if self.isViewerActive():
+            # файл просматривается в фоне, ответ придёт в viewerSearchFinished
+            if self.viewer.find(pattern, self.search_backward, self.wrap_around):
+                self.progress_bar.setValue(0)
+                self.progress_bar.show()
+                self.cancel_button.show()
+                self.statusBar().showMessage('Поиск...')
+            return
+        if not self.findMatch(pattern):
             QtWidgets.QMessageBox.information(
                 self.find_dialog, 'Блокнот', 'Не найдено\"%s\"' % text)
-        else:
-            start = index
-            cursor = self.text.textCursor()
-            cursor.clearSelection()
-            cursor.movePosition(QtGui.QTextCursor.Start,
-                                QtGui.QTextCursor.MoveAnchor)
 
-            cursor.movePosition(QtGui.QTextCursor.Right,
-                                QtGui.QTextCursor.MoveAnchor, start + text_len)
+    def viewerSearchFinished(self, found):
+        if self.sender() is not self.viewer:
+            return
+        self.progress_bar.hide()
+        self.cancel_button.hide()
+        self.statusBar().clearMessage()
+        if not found:
+            QtWidgets.QMessageBox.information(
+                self.find_dialog, 'Блокнот', 'Не найдено\"%s\"' % self.last_search)
 
-            cursor.movePosition(QtGui.QTextCursor.Left,
-                                QtGui.QTextCursor.KeepAnchor, text_len)
-            cursor.selectedText()
-            self.text.setTextCursor(cursor)
+    def cancelViewerSearch(self):
+        if self.viewer is None or not self.viewer.isSearching():
+            return
+        self.viewer.cancelSearch()
+        self.progress_bar.hide()
+        self.cancel_button.hide()
+        self.statusBar().showMessage('Поиск отменён', 2000)
 
+    def searchPattern(self, dialog):
+        try:
+            return compilePattern(self.search_text.text(), self.use_regex,
+                                  self.match_case, self.whole_word)
+        except re.error as error:
+            QtWidgets.QMessageBox.warning(
+                dialog, 'Блокнот', 'Ошибка в выражении: %s' % error)
+            return None
+
+    def findMatch(self, pattern):
+        cursor = self.text.textCursor()
+        if self.search_backward:
+            position = cursor.selectionStart()
+        else:
+            position = cursor.selectionEnd()
+        match = self.search_engine.find(
+            pattern, position, self.search_backward, self.wrap_around)
+        if match is None:
+            return False
+        cursor.setPosition(match[0])
+        cursor.setPosition(match[1], QtGui.QTextCursor.KeepAnchor)
+        self.text.setTextCursor(cursor)
+        return True
 
+    def createSearchOptions(self):
+        options = (
+            ('match_case', 'Учитывать регистр'),
+            ('whole_word', 'Слово целиком'),
+            ('use_regex', 'Регулярное выражение'),
+            ('search_backward', 'Искать назад'),
+            ('wrap_around', 'Циклически'),
+        )
+        layout = QtWidgets.QVBoxLayout()
+        for name, title in options:
+            check = QtWidgets.QCheckBox(title)
+            check.setChecked(getattr(self, name))
+            check.toggled.connect(
+                lambda checked, name=name: setattr(self, name, checked))
+            check.toggled.connect(self.updateHighlight)
+            layout.addWidget(check)
+        return layout
+
+    def findInFiles(self):
+        if self.find_panel is None:
+            self.find_panel = FindInFilesPanel(self)
+            self.find_panel.searchRequested.connect(self.startFileSearch)
+            self.find_panel.resultActivated.connect(self.openFileAt)
+            self.addDockWidget(QtCore.Qt.BottomDockWidgetArea, self.find_panel)
+        if not self.find_panel.search_text.text():
+            self.find_panel.search_text.setText(self.last_search)
+        if not self.find_panel.directory.text():
+            self.find_panel.directory.setText(self.default_dir or os.getcwd())
+        self.find_panel.show()
+        self.find_panel.search_text.setFocus()
+
+    def startFileSearch(self, text, directory):
+        try:
+            pattern = compilePattern(text, self.use_regex, self.match_case, self.whole_word)
+        except re.error as error:
+            QtWidgets.QMessageBox.warning(
+                self.find_panel, 'Блокнот', 'Ошибка в выражении: %s' % error)
+            return
+        # без регулярного выражения и учёта регистра файлы без
+        # совпадений отсеиваются поиском байтов
+        needle = None
+        if not self.use_regex and self.match_case:
+            needle = text.encode('utf-8')
+        self.cancelFileSearch()
+        self.find_panel.clear()
+        self.file_search = FileSearch(directory, pattern, needle, self)
+        self.file_search.fileMatched.connect(self.addFileResults)
+        self.file_search.progress.connect(self.showFileSearchProgress)
+        self.file_search.finished.connect(self.fileSearchFinished)
+        self.find_panel.status_label.setText('Поиск...')
+        self.file_search.start()
+
+    def addFileResults(self, path, results):
+        if self.sender() is self.file_search:
+            self.find_panel.addResults(path, results)
+
+    def showFileSearchProgress(self, searched):
+        if self.sender() is self.file_search:
+            self.find_panel.status_label.setText('Просмотрено файлов: %d' % searched)
+
+    def fileSearchFinished(self):
+        if self.sender() is not self.file_search:
+            return
+        self.file_search = None
+        self.find_panel.status_label.setText('Найдено в файлах: %d' % (
+            self.find_panel.results.topLevelItemCount()))
+
+    def cancelFileSearch(self):
+        if self.file_search is not None:
+            file_search, self.file_search = self.file_search, None
+            file_search.cancel()
+            file_search.wait()
+
+    def updateHighlight(self):
+        pattern = None
+        if self.search_text.text() and not self.isViewerActive():
+            try:
+                pattern = compilePattern(self.search_text.text(), self.use_regex,
+                                         self.match_case, self.whole_word)
+            except re.error:
+                pass
+        self.match_highlighter.setPattern(pattern)
+
+    def clearHighlight(self):
+        self.match_highlighter.setPattern(None)
+
+    def showMatchCount(self):
+        if self.match_label is None:
+            return
+        highlighter = self.match_highlighter
+        if highlighter.pattern is None:
+            self.match_label.clear()
+        elif highlighter.isCounting():
+            self.match_label.setText('Совпадений: %d…' % highlighter.total())
+        elif highlighter.currentIndex():
+            self.match_label.setText('Совпадение %d из %d' % (
+                highlighter.currentIndex(), highlighter.total()))
+        else:
+            self.match_label.setText('Совпадений: %d' % highlighter.total())
 
     def replaceText(self):
-        cursor = self.text.textCursor()
-        start = cursor.anchor()
         text = self.search_text.text()
-        text_len = len(text)
-        context = self.text.toPlainText()
-        index = context.find(text, start)
+        if not text:
+            return
+        pattern = self.searchPattern(self.replace_dialog)
+        if pattern is None:
+            return
         sender = self.sender()
 
         if sender is self.replace_button:
-            if text == cursor.selectedText():
-                position = cursor.anchor()
-                cursor.removeSelectedText()
-                replace_text = self.replace_text.text()
+            cursor = self.text.textCursor()
+            match = self.search_engine.match(
+                pattern, cursor.selectionStart(), cursor.selectionEnd())
+            if cursor.hasSelection() and match:
+                replace_text = substitute(match, self.replace_text.text(), self.use_regex)
+                self.history.prepare(cursor.selectionStart(), cursor.selectionEnd())
                 cursor.insertText(replace_text)
-
-                self.replaceText()
-                return
-        if -1 == index:
+                self.text.setTextCursor(cursor)
+        if not self.findMatch(pattern):
             QtWidgets.QMessageBox.information(
                 self.replace_dialog, 'Блокнот', 'Не найдено\"%s\"' % text)
-        else:
-            start = index
-            cursor = self.text.textCursor()
-            cursor.clearSelection()
-            cursor.movePosition(QtGui.QTextCursor.Start,
-                                QtGui.QTextCursor.MoveAnchor)
-            cursor.movePosition(QtGui.QTextCursor.Right,
-                                QtGui.QTextCursor.MoveAnchor, start + text_len)
-            cursor.movePosition(QtGui.QTextCursor.Left,
-                                QtGui.QTextCursor.KeepAnchor, text_len)
-            cursor.selectedText()
-            self.text.setTextCursor(cursor)
 
     def replaceAll(self):
-        context = self.text.toPlainText()
-        search_word = self.search_text.text()
-        replace_word = self.replace_text.text()
-        new_context = context.replace(search_word, replace_word)
-        doc = self.text.document()
-        curs = QtGui.QTextCursor(doc)
-
-        curs.select(QtGui.QTextCursor.Document)
-
-        curs.insertText(new_context)
+        if not self.search_text.text():
+            return
+        pattern = self.searchPattern(self.replace_dialog)
+        if pattern is None:
+            return
+        replacement = self.replace_text.text()
+        try:
+            checkReplacement(pattern, replacement, self.use_regex)
+        except re.error as error:
+            QtWidgets.QMessageBox.warning(
+                self.replace_dialog, 'Блокнот', 'Ошибка в замене: %s' % error)
+            return
+        self.cancelReplace()
+        start, end = 0, None
+        cursor = self.text.textCursor()
+        if self.in_selection and cursor.hasSelection():
+            start, end = cursor.selectionStart(), cursor.selectionEnd()
+
+        self.replacer = Replacer(self.text.document(), self.search_engine, pattern,
+                                 replacement, self.use_regex, start, end, self)
+        self.replacer.progress.connect(self.showProgress)
+        self.replacer.finished.connect(self.replaceFinished)
+        self.replacer.replaced.connect(self.history.record)
+        self.history.beginGroup(True)
+        self.text.setReadOnly(True)
+        self.tab_bar.setEnabled(False)
+        self.replace_all_button.setEnabled(False)
+        self.progress_bar.setValue(0)
+        self.progress_bar.show()
+        self.cancel_button.show()
+        self.statusBar().showMessage('Замена...')
+        self.replacer.start()
+
+    def replaceFinished(self, count):
+        if self.sender() is not self.replacer:
+            return
+        self.replacer = None
+        self.history.endGroup()
+        self.tab_bar.setEnabled(True)
+        self.progress_bar.hide()
+        self.cancel_button.hide()
+        self.text.setReadOnly(False)
+        self.replaceEnable()
+        self.statusBar().showMessage('Заменено: %d' % count, 3000)
+
+    def pasteLarge(self, text):
+        if self.paster is not None:
+            return
+        cursor = self.text.textCursor()
+        self.paster = Paster(self.text.document(), cursor.selectionStart(),
+                             cursor.selectionEnd(), text, self)
+        self.paster.progress.connect(self.showProgress)
+        self.paster.finished.connect(self.pasteFinished)
+        self.history.beginGroup()
+        self.history.prepare(cursor.selectionStart(), cursor.selectionEnd())
+        self.text.setReadOnly(True)
+        self.tab_bar.setEnabled(False)
+        self.progress_bar.setValue(0)
+        self.progress_bar.show()
+        self.cancel_button.show()
+        self.statusBar().showMessage('Вставка...')
+        self.paster.start()
+
+    def pasteFinished(self, position):
+        if self.sender() is not self.paster:
+            return
+        self.paster = None
+        self.history.endGroup()
+        self.tab_bar.setEnabled(True)
+        self.progress_bar.hide()
+        self.cancel_button.hide()
+        self.text.setReadOnly(False)
+        cursor = self.text.textCursor()
+        cursor.setPosition(position)
+        self.text.setTextCursor(cursor)
+        self.text.ensureCursorVisible()
+        self.statusBar().clearMessage()
+
+    def cancelPaste(self):
+        if self.paster is not None:
+            self.paster.cancel()
+
+    def cancelReplace(self):
+        if self.replacer is not None:
+            self.replacer.cancel()
+
+    def canPrint(self):
+        if self.isViewerActive():
+            self.statusBar().showMessage('Печать недоступна в режиме просмотра', 3000)
+            return False
+        return self.print_job is None
 
     def printDocument(self):
+        # модуль печати нужен редко и заметно удлиняет запуск
+        from PyQt5.QtPrintSupport import QAbstractPrintDialog
+        from PyQt5.QtPrintSupport import QPrintDialog
+        from PyQt5.QtPrintSupport import QPrinter
+        from printing import PageLayout
 
-        document = self.text.document()
-        printer = QPrinter()
-        dlg = QPrintPreviewDialog(printer, self)
+        if not self.canPrint():
+            return
+        text = documentText(self.text.document())
+        printer = QPrinter(QPrinter.HighResolution)
+        dlg = QPrintDialog(printer, self)
+        dlg.setOption(QAbstractPrintDialog.PrintPageRange)
+        dlg.setMinMax(1, PageLayout(text, self.text.font(), printer).pageEstimate())
         if dlg.exec_() != QtWidgets.QDialog.Accepted:
             return
-        document.print_(printer)
-        self.statusBar().showMessage("Печать успешна", 2000)
+        self.print(printer, text)
 
     def printReview(self):
+        from PyQt5.QtPrintSupport import QPrinter
+        from printing import PageLayout
+        from printing import PrintPreview
+
+        if not self.canPrint():
+            return
         printer = QPrinter(QPrinter.HighResolution)
-        review = QPrintPreviewDialog(printer, self)
-        review.setWindowFlags(QtCore.Qt.Window)
-        review.paintRequested.connect(self.print)
+        # страницы размечаются и рисуются только при показе
+        layout = PageLayout(documentText(self.text.document()), self.text.font(), printer)
+        review = PrintPreview(layout, self)
+        review.printRequested.connect(self.printDocument)
         review.exec_()
 
-    def print(self, printer):
-        self.text.print_(printer)
+    def exportPdf(self):
+        from PyQt5.QtPrintSupport import QPrinter
+
+        if not self.canPrint():
+            return
+        name = os.path.splitext(os.path.basename(self.cur_file))[0] or 'Без названия'
+        filename, _ = QtWidgets.QFileDialog.getSaveFileName(
+            self, 'Экспорт в PDF', self.default_dir + name + '.pdf', 'PDF (*.pdf)')
+        if not filename:
+            return
+        printer = QPrinter(QPrinter.HighResolution)
+        printer.setOutputFormat(QPrinter.PdfFormat)
+        printer.setOutputFileName(filename)
+        self.print(printer)
+
+    def print(self, printer, text=None):
+        from printing import PageLayout
+        from printing import PrintJob
+
+        if self.print_job is not None:
+            return
+        if text is None:
+            text = documentText(self.text.document())
+        # страницы в диалоге нумеруются с единицы, 0 — весь документ
+        first = max(printer.fromPage() - 1, 0)
+        last = printer.toPage() - 1 if printer.toPage() else None
+        self.print_job = PrintJob(printer, PageLayout(text, self.text.font(), printer),
+                                  first, last, self)
+        self.print_job.progress.connect(self.showProgress)
+        self.print_job.finished.connect(self.printFinished)
+        self.progress_bar.setValue(0)
+        self.progress_bar.show()
+        self.cancel_button.show()
+        self.statusBar().showMessage('Печать...')
+        self.print_job.start()
+
+    def printFinished(self):
+        if self.sender() is not self.print_job:
+            return
+        job, self.print_job = self.print_job, None
+        self.progress_bar.hide()
+        self.cancel_button.hide()
+        if job.error is not None:
+            self.statusBar().showMessage('Ошибка печати: %s' % job.error, 5000)
+        elif job.isInterruptionRequested():
+            self.statusBar().showMessage('Печать отменена', 2000)
+        else:
+            self.statusBar().showMessage('Напечатано страниц: %d' % job.printed, 3000)
+
+    def cancelPrint(self):
+        if self.print_job is not None:
+            self.print_job.cancel()
 
     def replace(self):
         self.replace_dialog = QtWidgets.QDialog(self)
@@ -404,11 +1740,17 @@ class Notepad(QtWidgets.QMainWindow):
 
         self.replace_button.setEnabled(False)
         self.replace_all_button.setEnabled(False)
+        selection_check = QtWidgets.QCheckBox('В выделенном')
+        selection_check.setChecked(self.in_selection)
+        selection_check.toggled.connect(
+            lambda checked: setattr(self, 'in_selection', checked))
 
         self.find_button.clicked.connect(self.replaceText)
         self.replace_button.clicked.connect(self.replaceText)
         self.replace_all_button.clicked.connect(self.replaceAll)
         self.search_text.textChanged.connect(self.replaceEnable)
+        self.search_text.textChanged.connect(self.updateHighlight)
+        self.replace_dialog.finished.connect(self.clearHighlight)
 
         layout = QtWidgets.QGridLayout()
         layout.addWidget(search_label, 0, 0)
@@ -418,6 +1760,8 @@ class Notepad(QtWidgets.QMainWindow):
         layout.addWidget(self.replace_text, 1, 1)
         layout.addWidget(self.replace_button, 1, 2)
         layout.addWidget(self.replace_all_button, 2, 2)
+        layout.addLayout(self.createSearchOptions(), 2, 1)
+        layout.addWidget(selection_check, 3, 1)
         self.replace_dialog.setLayout(layout)
         self.replace_dialog.show()
 
@@ -445,13 +1789,19 @@ class Notepad(QtWidgets.QMainWindow):
 
             ret = alert.clickedButton()
             if ret == saveButton:
-                return self.saveFile()
+                return self.saveFile() and self.waitForSave()
             elif ret == unSaveButton:
                 return True
             elif ret == cancelButton:
                 return False
         return True
 
+    def showProfile(self):
+        if self.profile_dialog is None:
+            self.profile_dialog = ProfilerDialog(self.profiler, self)
+        self.profile_dialog.show()
+        self.profile_dialog.raise_()
+
     def about(self):
         QtWidgets.QMessageBox.about(
             self, 'О программе', r'<h2>КП по ОП</h2><p> <b>Выполнил студент</b> <br> <b>Группы P3175</b> <br>Головатый А.Д. <br>при использовании PYQT5 и Python3.4</p>')
@@ -459,45 +1809,59 @@ class Notepad(QtWidgets.QMainWindow):
     def setLineWrap(self):
         if not self.text.lineWrapMode():
             self.text.setLineWrapMode(QtWidgets.QPlainTextEdit.WidgetWidth)
-            self.lineWrapAction.setIcon(QtGui.QIcon('resource/check.png'))
+            self.lineWrapAction.setIcon(QtGui.QIcon(':/resource/check.png'))
         else:
             self.text.setLineWrapMode(QtWidgets.QPlainTextEdit.NoWrap)
             self.lineWrapAction.setIcon(QtGui.QIcon(''))
 
+    def setHighlight(self, enabled):
+        self.log_highlighter.setEnabled(enabled)
+        if not enabled:
+            for tab in self.tabs():
+                if tab is not None and tab.document is not None:
+                    self.log_highlighter.clear(tab.document)
+
     def setFont(self):
 
         font, ok = QtWidgets.QFontDialog.getFont(self.text.font(), self, 'Выбор шрифта')
         if ok:
             self.text.setFont(QtGui.QFont(font))
 
+    def setTextFormat(self, text_format):
+        self.text_format = text_format
+        self.format_label.setText(formatName(text_format))
+
     def setCurrentFile(self, filename):
         self.cur_file = filename
         path, _ = os.path.split(filename)
         self.default_dir = path + '/'
-        if not filename:
+        if filename:
+            self.settings.addRecentFile(os.path.abspath(filename))
+            self.writeConfig('Setting', 'dir', self.default_dir)
+        self.updateTitle()
+        self.text.document().setModified(False)
+        self.updateTabTitles()
+
+    def updateTitle(self):
+        if not self.cur_file:
             self.setWindowTitle('Без названия - Блокнот')
         else:
-            self.setWindowTitle('%s - Блокнот' % filename)
-        self.text.document().setModified(False)
+            self.setWindowTitle('%s - Блокнот' % self.cur_file)
 
     def writeConfig(self, section, key, value):
-
-        if not self.config.has_section(section):
-            self.config.add_section(section)
-
-        self.config.set(section, key, str(value))
+        self.settings.setValue(section, key, value)
 
 
 if __name__ == '__main__':
-    app = QtWidgets.QApplication(sys.argv)
+    from instance import InstanceServer
 
-    if len(sys.argv) > 1:
-        locale = sys.argv[1]
-    else:
-        locale = QtCore.QLocale.system().name()
+    app = QtWidgets.QApplication(sys.argv)
 
     notepad = Notepad()
+    if not arguments.new_window:
+        server = InstanceServer(parent=notepad)
+        if server.listen():
+            server.filesReceived.connect(notepad.receiveFiles)
     notepad.show()
+    notepad.openPaths([os.path.abspath(filename) for filename in arguments.files])
     app.exec_()
-
-  
@@ -0,0 +1,51 @@
+from PyQt5 import QtCore
+from PyQt5 import QtGui
+
+
+CHUNK_SIZE = 64 * 1024
+
+
+class Paster(QtCore.QObject):
+
+    progress = QtCore.pyqtSignal('qint64', 'qint64')
+    finished = QtCore.pyqtSignal('qint64')
+
+    def __init__(self, document, start, end, text, parent=None):
+        super(Paster, self).__init__(parent)
+        self.document = document
+        self.text = text
+        self.offset = 0
+        self.edited = False
+        self.cursor = QtGui.QTextCursor(document)
+        self.cursor.setPosition(start)
+        self.cursor.setPosition(end, QtGui.QTextCursor.KeepAnchor)
+        self.timer = QtCore.QTimer(self)
+        self.timer.timeout.connect(self.step)
+
+    def start(self):
+        self.timer.start()
+
+    def cancel(self):
+        self.finish()
+
+    def finish(self):
+        if self.timer.isActive():
+            self.timer.stop()
+            self.text = None
+            self.finished.emit(self.cursor.position())
+
+    def step(self):
+        # каждая порция присоединяется к первой, вся вставка - один шаг отмены
+        if self.edited:
+            self.cursor.joinPreviousEditBlock()
+        else:
+            # первая порция заодно заменяет выделение
+            self.cursor.beginEditBlock()
+            self.edited = True
+        end = min(self.offset + CHUNK_SIZE, len(self.text))
+        self.cursor.insertText(self.text[self.offset:end])
+        self.cursor.endEditBlock()
+        self.offset = end
+        self.progress.emit(self.offset, len(self.text))
+        if self.offset >= len(self.text):
+            self.finish()
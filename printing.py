@@ -0,0 +1,219 @@
+import math
+from array import array
+
+from PyQt5 import QtCore
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5.QtPrintSupport import QPrinter
+
+
+TAB_SIZE = 8
+PREVIEW_MARGIN = 20
+
+
+class PageLayout(object):
+
+    def __init__(self, text, font, printer):
+        self.text = text
+        self.paper = printer.paperRect(QPrinter.DevicePixel)
+        self.page = printer.pageRect(QPrinter.DevicePixel)
+        # размер шрифта в точках устройства: разметка страницы одинакова
+        # для принтера, PDF и предпросмотра в любом масштабе
+        points = font.pointSizeF() if font.pointSizeF() > 0 else font.pixelSize() * 0.75
+        self.font = QtGui.QFont(font)
+        self.font.setPixelSize(max(1, round(points * printer.resolution() / 72)))
+        self.metrics = QtGui.QFontMetricsF(self.font)
+        self.line_height = self.metrics.lineSpacing()
+        self.ascent = self.metrics.ascent()
+        self.char_width = self.metrics.maxWidth()
+        self.rows_per_page = max(1, int(self.page.height() // self.line_height))
+        self.page_starts = array('q', [0])
+        self.complete = not text
+        self.line_count = None
+
+    def rowText(self, start, end):
+        return self.text[start:end].expandtabs(TAB_SIZE)
+
+    def nextRow(self, position):
+        line_end = self.text.find('\n', position)
+        if line_end < 0:
+            line_end = len(self.text)
+        end = line_end
+        width = self.page.width()
+        if (end - position) * self.char_width > width and (
+                self.metrics.horizontalAdvance(self.rowText(position, end)) > width):
+            # длинная строка переносится: наибольший помещающийся префикс
+            low, high = 1, end - position
+            while low < high:
+                middle = (low + high + 1) // 2
+                if self.metrics.horizontalAdvance(self.rowText(position, position + middle)) <= width:
+                    low = middle
+                else:
+                    high = middle - 1
+            end = position + low
+        return end, end + 1 if end == line_end else end
+
+    def hasPage(self, page):
+        # страницы размечаются по мере обращения к ним
+        while len(self.page_starts) <= page and not self.complete:
+            position = self.page_starts[-1]
+            for _ in range(self.rows_per_page):
+                if position >= len(self.text):
+                    break
+                _, position = self.nextRow(position)
+            if position >= len(self.text):
+                self.complete = True
+            else:
+                self.page_starts.append(position)
+        return page < len(self.page_starts)
+
+    def pageCount(self):
+        return len(self.page_starts) if self.complete else None
+
+    def pageEstimate(self):
+        if self.complete:
+            return len(self.page_starts)
+        if self.line_count is None:
+            self.line_count = self.text.count('\n') + 1
+        return max(len(self.page_starts), math.ceil(self.line_count / self.rows_per_page))
+
+    def paintPage(self, painter, page):
+        if not self.hasPage(page):
+            return
+        painter.setFont(self.font)
+        position = self.page_starts[page]
+        y = self.ascent
+        for _ in range(self.rows_per_page):
+            if position >= len(self.text):
+                break
+            end, next_position = self.nextRow(position)
+            painter.drawText(QtCore.QPointF(0, y), self.rowText(position, end))
+            y += self.line_height
+            position = next_position
+
+
+class PrintJob(QtCore.QThread):
+
+    progress = QtCore.pyqtSignal('qint64', 'qint64')
+
+    def __init__(self, printer, page_layout, first=0, last=None, parent=None):
+        super(PrintJob, self).__init__(parent)
+        self.printer = printer
+        self.page_layout = page_layout
+        self.first = first
+        self.last = last
+        self.printed = 0
+        self.error = None
+
+    def cancel(self):
+        self.requestInterruption()
+
+    def run(self):
+        painter = QtGui.QPainter()
+        if not painter.begin(self.printer):
+            self.error = 'не удалось начать печать'
+            return
+        page = self.first
+        while (self.last is None or page <= self.last) and self.page_layout.hasPage(page):
+            if self.isInterruptionRequested():
+                self.printer.abort()
+                break
+            if page > self.first:
+                self.printer.newPage()
+            self.page_layout.paintPage(painter, page)
+            self.printed += 1
+            if self.last is None:
+                total = self.page_layout.pageEstimate() - self.first
+            else:
+                total = self.last - self.first + 1
+            self.progress.emit(self.printed, max(total, self.printed))
+            page += 1
+        painter.end()
+        # снимок текста больше не нужен
+        self.page_layout = None
+
+
+class PageView(QtWidgets.QWidget):
+
+    def __init__(self, page_layout, parent=None):
+        super(PageView, self).__init__(parent)
+        self.page_layout = page_layout
+        self.page = 0
+        self.setMinimumSize(300, 400)
+
+    def setPage(self, page):
+        self.page = page
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QtGui.QPainter(self)
+        painter.fillRect(self.rect(), QtGui.QColor('gray'))
+        paper = self.page_layout.paper
+        scale = min((self.width() - 2 * PREVIEW_MARGIN) / paper.width(),
+                    (self.height() - 2 * PREVIEW_MARGIN) / paper.height())
+        if scale <= 0:
+            return
+        painter.translate((self.width() - paper.width() * scale) / 2,
+                          (self.height() - paper.height() * scale) / 2)
+        painter.scale(scale, scale)
+        painter.fillRect(QtCore.QRectF(0, 0, paper.width(), paper.height()), QtCore.Qt.white)
+        # рисуется только показанная страница
+        painter.translate(self.page_layout.page.topLeft() - paper.topLeft())
+        painter.setRenderHint(QtGui.QPainter.TextAntialiasing)
+        self.page_layout.paintPage(painter, self.page)
+
+
+class PrintPreview(QtWidgets.QDialog):
+
+    printRequested = QtCore.pyqtSignal()
+
+    def __init__(self, page_layout, parent=None):
+        super(PrintPreview, self).__init__(parent)
+        self.page_layout = page_layout
+        self.setWindowTitle('Предварительный просмотр')
+        self.setWindowFlags(QtCore.Qt.Window)
+        self.view = PageView(page_layout)
+        self.previous_button = QtWidgets.QPushButton('<')
+        self.previous_button.clicked.connect(lambda: self.showPage(self.view.page - 1))
+        self.next_button = QtWidgets.QPushButton('>')
+        self.next_button.clicked.connect(lambda: self.showPage(self.view.page + 1))
+        self.page_box = QtWidgets.QSpinBox()
+        self.page_box.setMinimum(1)
+        self.page_box.setKeyboardTracking(False)
+        self.page_box.valueChanged.connect(lambda value: self.showPage(value - 1))
+        self.count_label = QtWidgets.QLabel()
+        print_button = QtWidgets.QPushButton('Печать')
+        print_button.clicked.connect(self.accept)
+        print_button.clicked.connect(self.printRequested)
+
+        controls = QtWidgets.QHBoxLayout()
+        controls.addWidget(self.previous_button)
+        controls.addWidget(self.page_box)
+        controls.addWidget(self.count_label)
+        controls.addWidget(self.next_button)
+        controls.addStretch()
+        controls.addWidget(print_button)
+        layout = QtWidgets.QVBoxLayout()
+        layout.addLayout(controls)
+        layout.addWidget(self.view, 1)
+        self.setLayout(layout)
+        self.resize(600, 800)
+        self.showPage(0)
+
+    def showPage(self, page):
+        page = max(0, page)
+        while page > 0 and not self.page_layout.hasPage(page):
+            page -= 1
+        self.view.setPage(page)
+        count = self.page_layout.pageCount()
+        # пока разметка не дошла до конца, число страниц — оценка
+        self.page_box.blockSignals(True)
+        self.page_box.setMaximum(count or self.page_layout.pageEstimate())
+        self.page_box.setValue(page + 1)
+        self.page_box.blockSignals(False)
+        if count is None:
+            self.count_label.setText('из ≈%d' % self.page_layout.pageEstimate())
+        else:
+            self.count_label.setText('из %d' % count)
+        self.previous_button.setEnabled(page > 0)
+        self.next_button.setEnabled(self.page_layout.hasPage(page + 1))
@@ -0,0 +1,316 @@
+import collections
+import functools
+import inspect
+import json
+import os
+import sys
+import threading
+import time
+import traceback
+
+from PyQt5 import QtCore
+from PyQt5 import QtWidgets
+
+
+HISTORY_SIZE = 10000
+STALL_HISTORY_SIZE = 100
+HEARTBEAT_INTERVAL = 50
+SAMPLE_INTERVAL = 50
+STALL_THRESHOLD = 200
+STACK_DEPTH = 12
+REFRESH_INTERVAL = 1000
+
+
+def positionalCount(func):
+    # сигнал передаёт лишние аргументы (checked у QAction), обработчик их не ждёт
+    count = 0
+    for parameter in inspect.signature(func).parameters.values():
+        if parameter.kind == parameter.VAR_POSITIONAL:
+            return None
+        if parameter.kind in (parameter.POSITIONAL_ONLY, parameter.POSITIONAL_OR_KEYWORD):
+            count += 1
+    return count
+
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+class StallWatchdog(QtCore.QThread):
+
+    stalled = QtCore.pyqtSignal(float, float, object)
+
+    def __init__(self, profiler, thread_id, parent=None):
+        super(StallWatchdog, self).__init__(parent)
+        self.profiler = profiler
+        self.thread_id = thread_id
+
+    def run(self):
+        # поток GUI отмечается таймером; пока отметки нет, снимается его стек
+        stall_beat = None
+        samples = []
+        while not self.isInterruptionRequested():
+            self.msleep(SAMPLE_INTERVAL)
+            beat = self.profiler.beat
+            now = time.perf_counter()
+            if stall_beat is not None and beat != stall_beat:
+                self.stalled.emit(stall_beat, beat, samples)
+                stall_beat = None
+                samples = []
+            if now - beat >= self.profiler.threshold:
+                stall_beat = beat
+                samples.append(self.sample())
+
+    def sample(self):
+        frame = sys._current_frames().get(self.thread_id)
+        if frame is None:
+            return ()
+        return tuple('%s:%d %s' % (os.path.basename(entry.filename), entry.lineno, entry.name)
+                     for entry in traceback.extract_stack(frame)[-STACK_DEPTH:])
+
+
+class Profiler(QtCore.QObject):
+
+    def __init__(self, parent=None):
+        super(Profiler, self).__init__(parent)
+        self.enabled = False
+        self.threshold = STALL_THRESHOLD / 1000
+        self.origin = time.perf_counter()
+        self.spans = collections.deque(maxlen=HISTORY_SIZE)
+        self.keystrokes = collections.deque(maxlen=HISTORY_SIZE)
+        self.stalls = collections.deque(maxlen=STALL_HISTORY_SIZE)
+        self.widgets = []
+        self.key_time = None
+        self.beat = self.origin
+        self.heartbeat = QtCore.QTimer(self)
+        self.heartbeat.setInterval(HEARTBEAT_INTERVAL)
+        self.heartbeat.timeout.connect(self.onHeartbeat)
+        self.watchdog = None
+
+    def setEnabled(self, enabled):
+        if enabled == self.enabled:
+            return
+        self.enabled = enabled
+        for widget in self.widgets:
+            for target in (widget, widget.viewport()):
+                if enabled:
+                    target.installEventFilter(self)
+                else:
+                    target.removeEventFilter(self)
+        self.key_time = None
+        if enabled:
+            self.beat = time.perf_counter()
+            self.heartbeat.start()
+            self.watchdog = StallWatchdog(self, threading.get_ident(), self)
+            self.watchdog.stalled.connect(self.addStall)
+            self.watchdog.start()
+        else:
+            self.heartbeat.stop()
+            self.watchdog.requestInterruption()
+            self.watchdog.wait()
+            self.watchdog = None
+
+    def setThreshold(self, milliseconds):
+        self.threshold = milliseconds / 1000
+
+    def clear(self):
+        self.spans.clear()
+        self.keystrokes.clear()
+        self.stalls.clear()
+
+    def onHeartbeat(self):
+        self.beat = time.perf_counter()
+
+    def instrument(self, owner, names):
+        # подменяются атрибуты экземпляра, поэтому делать это нужно
+        # до подключения сигналов к обработчикам
+        for name in names:
+            setattr(owner, name, self.timed(name, getattr(owner, name)))
+
+    def timed(self, name, func):
+        count = positionalCount(func)
+
+        @functools.wraps(func)
+        def wrapper(*args):
+            args = args[:count] if count is not None else args
+            if not self.enabled:
+                return func(*args)
+            start = time.perf_counter()
+            try:
+                return func(*args)
+            finally:
+                self.spans.append((name, start, time.perf_counter()))
+        return wrapper
+
+    def watchKeys(self, widget):
+        # задержка от нажатия клавиши до отрисовки области текста
+        self.widgets.append(widget)
+        if self.enabled:
+            widget.installEventFilter(self)
+            widget.viewport().installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QtCore.QEvent.KeyPress:
+            if self.key_time is None:
+                self.key_time = time.perf_counter()
+        elif event.type() == QtCore.QEvent.Paint and self.key_time is not None:
+            # отрисовка ещё не началась, конец отмечается в следующем проходе цикла
+            QtCore.QTimer.singleShot(0, self.keyPainted)
+        return False
+
+    def keyPainted(self):
+        if self.key_time is None:
+            return
+        self.keystrokes.append((self.key_time, time.perf_counter()))
+        self.key_time = None
+
+    def addStall(self, start, end, samples):
+        self.stalls.append((start, end, samples))
+
+    def actionSummary(self):
+        rows = {}
+        for name, start, end in self.spans:
+            count, total, longest = rows.get(name, (0, 0.0, 0.0))
+            rows[name] = (count + 1, total + end - start, max(longest, end - start))
+        return sorted(((name,) + row for name, row in rows.items()),
+                      key=lambda row: row[2], reverse=True)
+
+    def keySummary(self):
+        latencies = [end - start for start, end in self.keystrokes]
+        return (len(latencies), percentile(latencies, 0.5), percentile(latencies, 0.95),
+                max(latencies) if latencies else 0.0)
+
+    def topStack(self, samples):
+        stacks = collections.Counter(samples)
+        return list(stacks.most_common(1)[0][0]) if stacks else []
+
+    def milliseconds(self, value):
+        return round((value - self.origin) * 1000, 3)
+
+    def toJson(self):
+        return {
+            'actions': [{'name': name, 'start': self.milliseconds(start),
+                         'duration': round((end - start) * 1000, 3)}
+                        for name, start, end in self.spans],
+            'keystrokes': [{'start': self.milliseconds(start),
+                            'latency': round((end - start) * 1000, 3)}
+                           for start, end in self.keystrokes],
+            'stalls': [{'start': self.milliseconds(start),
+                        'duration': round((end - start) * 1000, 3),
+                        'stacks': [{'stack': list(stack), 'count': count}
+                                   for stack, count in collections.Counter(samples).most_common()]}
+                       for start, end, samples in self.stalls],
+        }
+
+    def toTrace(self):
+        # формат Chrome trace: chrome://tracing, Perfetto
+        pid = os.getpid()
+        events = []
+
+        def add(name, category, start, end, args=None):
+            event = {'name': name, 'cat': category, 'ph': 'X', 'pid': pid, 'tid': 0,
+                     'ts': round((start - self.origin) * 1000000),
+                     'dur': round((end - start) * 1000000)}
+            if args:
+                event['args'] = args
+            events.append(event)
+
+        for name, start, end in self.spans:
+            add(name, 'action', start, end)
+        for start, end in self.keystrokes:
+            add('keystroke', 'input', start, end)
+        for start, end, samples in self.stalls:
+            add('stall', 'stall', start, end, {'stack': self.topStack(samples)})
+        events.sort(key=lambda event: event['ts'])
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def export(self, filename, trace=False):
+        data = self.toTrace() if trace else self.toJson()
+        with open(filename, 'w', encoding='utf-8') as file:
+            json.dump(data, file, ensure_ascii=False, indent=1)
+
+
+class ProfilerDialog(QtWidgets.QDialog):
+
+    def __init__(self, profiler, parent=None):
+        super(ProfilerDialog, self).__init__(parent)
+        self.profiler = profiler
+        self.setWindowTitle('Производительность')
+        # небольшое окно поверх редактора, работе не мешает
+        self.setWindowFlags(QtCore.Qt.Tool)
+        self.table = QtWidgets.QTableWidget(0, 4)
+        self.table.setHorizontalHeaderLabels(['Действие', 'Вызовов', 'Всего, мс', 'Макс, мс'])
+        self.table.verticalHeader().hide()
+        self.table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.key_label = QtWidgets.QLabel()
+        self.stall_text = QtWidgets.QPlainTextEdit()
+        self.stall_text.setReadOnly(True)
+        self.stall_text.setLineWrapMode(QtWidgets.QPlainTextEdit.NoWrap)
+        json_button = QtWidgets.QPushButton('Экспорт JSON')
+        json_button.clicked.connect(lambda: self.exportData(False))
+        trace_button = QtWidgets.QPushButton('Экспорт trace')
+        trace_button.clicked.connect(lambda: self.exportData(True))
+        clear_button = QtWidgets.QPushButton('Очистить')
+        clear_button.clicked.connect(profiler.clear)
+
+        buttons = QtWidgets.QHBoxLayout()
+        buttons.addWidget(json_button)
+        buttons.addWidget(trace_button)
+        buttons.addStretch()
+        buttons.addWidget(clear_button)
+        layout = QtWidgets.QVBoxLayout()
+        layout.addWidget(self.table, 1)
+        layout.addWidget(self.key_label)
+        layout.addWidget(QtWidgets.QLabel('Зависания:'))
+        layout.addWidget(self.stall_text, 1)
+        layout.addLayout(buttons)
+        self.setLayout(layout)
+        self.resize(480, 420)
+        # данные обновляются раз в секунду, а не на каждое событие
+        self.refresh_timer = QtCore.QTimer(self)
+        self.refresh_timer.setInterval(REFRESH_INTERVAL)
+        self.refresh_timer.timeout.connect(self.refresh)
+        self.refresh()
+
+    def showEvent(self, event):
+        super(ProfilerDialog, self).showEvent(event)
+        self.refresh()
+        self.refresh_timer.start()
+
+    def hideEvent(self, event):
+        super(ProfilerDialog, self).hideEvent(event)
+        self.refresh_timer.stop()
+
+    def refresh(self):
+        rows = self.profiler.actionSummary()
+        self.table.setRowCount(len(rows))
+        for number, (name, count, total, longest) in enumerate(rows):
+            for column, value in enumerate((name, str(count), '%.1f' % (total * 1000),
+                                            '%.1f' % (longest * 1000))):
+                self.table.setItem(number, column, QtWidgets.QTableWidgetItem(value))
+        count, median, slow, longest = self.profiler.keySummary()
+        self.key_label.setText('Клавиша → отрисовка: %d нажатий, медиана %.1f мс, 95%% %.1f мс, макс %.1f мс' % (
+            count, median * 1000, slow * 1000, longest * 1000))
+        lines = []
+        for start, end, samples in reversed(self.profiler.stalls):
+            lines.append('%.0f мс, через %.1f с после запуска' % (
+                (end - start) * 1000, start - self.profiler.origin))
+            lines.extend('    ' + frame for frame in reversed(self.profiler.topStack(samples)))
+        self.stall_text.setPlainText('\n'.join(lines))
+
+    def exportData(self, trace):
+        if trace:
+            filename, _ = QtWidgets.QFileDialog.getSaveFileName(
+                self, 'Экспорт trace', 'notepad-trace.json', 'Chrome trace (*.json)')
+        else:
+            filename, _ = QtWidgets.QFileDialog.getSaveFileName(
+                self, 'Экспорт JSON', 'notepad-profile.json', 'JSON (*.json)')
+        if not filename:
+            return
+        try:
+            self.profiler.export(filename, trace)
+        except OSError as error:
+            QtWidgets.QMessageBox.warning(self, 'Производительность', str(error))
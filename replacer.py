@@ -0,0 +1,129 @@
+from bisect import bisect_right
+
+from PyQt5 import QtCore
+from PyQt5 import QtGui
+
+from longlines import textRange
+from textcore import substitute
+
+
+BLOCK_BATCH = 2000
+MAX_BLOCK_EDITS = 16
+
+
+class Replacer(QtCore.QObject):
+
+    progress = QtCore.pyqtSignal('qint64', 'qint64')
+    finished = QtCore.pyqtSignal('qint64')
+    # правки одной порции сливаются в документе в общий диапазон,
+    # поэтому каждая замена сообщается отдельно
+    replaced = QtCore.pyqtSignal('qint64', str, str)
+
+    def __init__(self, document, engine, pattern, replacement, expand=False,
+                 start=0, end=None, parent=None):
+        super(Replacer, self).__init__(parent)
+        self.document = document
+        self.engine = engine
+        self.pattern = pattern
+        self.replacement = replacement
+        self.expand = expand
+        self.range_start = start
+        self.range_end = document.characterCount() - 1 if end is None else end
+        self.count = 0
+        self.edited = False
+        self.open = False
+        self.cursor = QtGui.QTextCursor(document)
+        # строки обходятся с конца, чтобы замены не сдвигали ещё не
+        # обработанный текст
+        self.block = document.findBlock(self.range_end)
+        self.number = self.block.blockNumber()
+        self.first = document.findBlock(start).blockNumber()
+        self.total = self.number - self.first + 1
+        self.timer = QtCore.QTimer(self)
+        self.timer.timeout.connect(self.step)
+
+    def start(self):
+        self.timer.start()
+
+    def cancel(self):
+        self.finish()
+
+    def finish(self):
+        if self.timer.isActive():
+            self.timer.stop()
+            self.finished.emit(self.count)
+
+    def step(self):
+        # каждая порция присоединяется к первой, вся замена - один шаг отмены
+        self.open = False
+        for _ in range(BLOCK_BATCH):
+            if self.number < self.first:
+                break
+            block, number, text, starts = self.engine.lineText(self.block, self.number)
+            previous = block.previous()
+            self.replaceInLine(block, number, text, starts)
+            self.block = previous
+            self.number = number - 1
+        if self.open:
+            self.cursor.endEditBlock()
+        self.progress.emit(self.total - (self.number - self.first + 1), self.total)
+        if self.number < self.first:
+            self.finish()
+
+    def replaceInLine(self, block, number, text, starts):
+        matches = list(self.pattern.finditer(
+            text, self.engine.lineOffset(block, number, self.range_start),
+            min(len(text), self.engine.lineOffset(block, number, self.range_end))))
+        if not matches:
+            return
+        # совпадения внутри одного отрезка длинной строки правятся вместе,
+        # а пересекающее мягкий перенос - отдельно: правка сливает блоки,
+        # и отрезки не должны срастаться в один огромный блок
+        groups = []
+        for match in matches:
+            segment = bisect_right(starts, match.start()) - 1
+            if segment + 1 < len(starts) and match.end() > starts[segment + 1]:
+                segment = None
+            if segment is not None and groups and groups[-1][0] == segment:
+                groups[-1][1].append(match)
+            else:
+                groups.append((segment, [match]))
+        for segment, group in reversed(groups):
+            self.replaceMatches(block, starts, text, group)
+        self.count += len(matches)
+
+    def replaceMatches(self, block, starts, text, matches):
+        if len(matches) > MAX_BLOCK_EDITS:
+            # много совпадений в одной строке заменяются одной правкой
+            pieces = []
+            last = matches[0].start()
+            for match in matches:
+                pieces.append(text[last:match.start()])
+                pieces.append(self.substitute(match))
+                last = match.end()
+            self.replaceSpan(self.engine.linePosition(block, starts, matches[0].start()),
+                             text[matches[0].start():last], ''.join(pieces))
+        else:
+            for match in reversed(matches):
+                start, end = self.engine.lineSpan(block, starts, match)
+                removed = match.group()
+                if end - start != len(removed):
+                    # в удаляемом тексте сохраняется мягкий перенос
+                    removed = textRange(self.document, start, end)
+                self.replaceSpan(start, removed, self.substitute(match))
+
+    def substitute(self, match):
+        return substitute(match, self.replacement, self.expand)
+
+    def replaceSpan(self, start, removed, text):
+        if not self.open:
+            if self.edited:
+                self.cursor.joinPreviousEditBlock()
+            else:
+                self.cursor.beginEditBlock()
+            self.open = True
+            self.edited = True
+        self.cursor.setPosition(start)
+        self.cursor.setPosition(start + len(removed), QtGui.QTextCursor.KeepAnchor)
+        self.cursor.insertText(text)
+        self.replaced.emit(start, removed, text)
@@ -0,0 +1,11108 @@
+# -*- coding: utf-8 -*-
+
+# Resource object code
+#
+# Created by: The Resource Compiler for PyQt5 (Qt v5.15.14)
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt5 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x28\x92\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x80\x00\x00\x00\x80\x08\x06\x00\x00\x00\xc3\x3e\x61\xcb\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x00\x48\x00\x00\
+\x00\x48\x00\x46\xc9\x6b\x3e\x00\x00\x00\x09\x76\x70\x41\x67\x00\
+\x00\x00\x80\x00\x00\x00\x80\x00\x30\xe1\x31\x9a\x00\x00\x27\xbb\
+\x49\x44\x41\x54\x78\xda\xed\x7d\x69\x90\x1c\xd5\x95\xee\x77\x6f\
+\xee\xb5\x57\x57\x2f\xd5\xad\x1d\x49\x8d\x59\x84\x8c\x24\x36\x09\
+\x18\x6b\x90\x8d\x58\x06\x30\x86\x09\xc2\xc1\x18\x03\x22\x6c\xc0\
+\x0f\xfc\x4c\x8c\x63\x6c\x07\x84\x79\x6f\x66\x18\x3b\x5e\x78\x1e\
+\x78\x3c\x66\x99\x87\xc7\x63\x83\x57\x30\x63\x61\x79\xd8\x91\xcd\
+\x6e\x84\x87\x4d\xa2\x5b\x7b\x4b\xbd\x57\x57\xd7\xbe\xe4\x72\xef\
+\xfb\x91\x95\xd9\x59\xd5\xd5\xad\xee\x56\x6b\x2b\xfa\x44\x48\x95\
+\x75\x33\x2b\x3b\xf3\x9c\xef\x9e\x7b\xbe\x73\x37\x60\x4e\xe6\x64\
+\x4e\x3e\xbe\x42\x8e\xf5\x03\x34\x82\x3c\xfc\xf0\xc3\xd2\xfb\xef\
+\xbf\x2f\x84\x42\xa1\xc8\xfe\xfd\xfb\x23\xc1\x60\x50\x5b\xb9\x72\
+\xa5\xfa\xbb\xdf\xfd\x2e\xac\xeb\xba\xf9\xc9\x4f\x7e\x52\xd8\xb6\
+\x6d\x5b\xe9\xb3\x9f\xfd\x6c\x3e\x93\xc9\x24\x8a\xc5\x62\x69\xc1\
+\x82\x05\x23\x84\x10\x6c\xda\xb4\xc9\x38\x96\xcf\x3e\x07\x80\x19\
+\xc8\xa6\x4d\x9b\xa4\xe6\xe6\xe6\x58\x2a\x95\x5a\xca\x18\x3b\xf5\
+\xd4\x53\x4f\x3d\xf3\x13\x9f\xf8\xc4\xa9\xed\xed\xed\xad\xe1\x70\
+\xd8\xef\xf7\xfb\xfd\xb2\x2c\x6b\x94\x52\x93\x52\xaa\x72\xce\x0d\
+\xc6\x18\x2f\x95\x4a\x7a\x36\x9b\xcd\x8d\x8e\x8e\x26\x7a\x7b\x7b\
+\x47\x76\xec\xd8\xf1\x6e\x57\x57\xd7\xce\x15\x2b\x56\xbc\x7d\xf0\
+\xe0\xc1\x5d\x85\x42\xa1\xf8\xe0\x83\x0f\x1e\x55\x40\xcc\x01\x60\
+\x8a\x72\xff\xfd\xf7\xcb\xfd\xfd\xfd\xb1\x1d\x3b\x76\x9c\x77\xc1\
+\x05\x17\x6c\x38\xff\xfc\xf3\xd7\x2d\x5a\xb4\x68\x41\x34\x1a\x8d\
+\x50\x4a\x89\x20\x08\x00\x00\x42\xc6\x54\x4a\x08\x01\xe7\xbc\xea\
+\x3e\xce\x77\xe7\xb3\x54\x2a\x95\x92\xc9\x64\xb1\xbb\xbb\x7b\xef\
+\x1b\x6f\xbc\xf1\xd2\x6b\xaf\xbd\xf6\xd2\xca\x95\x2b\xff\xdc\xdc\
+\xdc\x3c\x70\xd7\x5d\x77\xb1\x23\xfd\x5e\x73\x00\x38\x84\xdc\x76\
+\xdb\x6d\x7e\x42\xc8\x9a\xd6\xd6\xd6\xab\x36\x6c\xd8\x70\xf1\xf2\
+\xe5\xcb\x4f\x0a\x06\x83\x8a\x63\x68\xe7\x93\x31\x06\x5d\xd7\xa1\
+\xeb\x3a\x0c\xc3\x40\xa9\x54\x82\x65\x59\x20\x84\xc0\x34\x4d\xf8\
+\x7c\x3e\x50\x4a\xe1\xf3\xf9\x20\x08\x02\x14\x45\xa9\xfa\xbd\x65\
+\x59\xe0\x9c\x23\x95\x4a\xe5\xba\xbb\xbb\x77\x6c\xd9\xb2\xe5\x77\
+\x3d\x3d\x3d\x4f\xad\x5d\xbb\xb6\xeb\xce\x3b\xef\x2c\x1d\xa9\xf7\
+\x9b\x03\xc0\x04\xf2\xfd\xef\x7f\x3f\xf0\xe4\x93\x4f\x5e\x78\xfd\
+\xf5\xd7\xdf\x72\xe1\x85\x17\x7e\xaa\xb5\xb5\x35\x44\x08\xa1\x94\
+\x52\x00\x80\x69\x9a\x28\x14\x0a\x48\xa7\xd3\x48\x24\x12\xc8\x66\
+\xb3\x28\x95\x4a\xd0\xf5\x32\xf4\xb2\x0e\xc6\x39\x38\x67\x60\x8c\
+\x41\x14\x44\x00\x80\x24\xcb\x10\x04\x01\x9a\xa6\x41\xd3\x34\x84\
+\xc3\x61\x84\xc3\x61\x84\x42\x21\xf8\xfd\x7e\x50\x4a\x61\x59\x96\
+\xf3\xc9\xf6\xec\xd9\x73\xe0\xe9\xa7\x9f\xde\xbc\x79\xf3\xe6\xc7\
+\xae\xbb\xee\xba\x77\xee\xba\xeb\x2e\x7d\xb6\xdf\x73\x0e\x00\x35\
+\xf2\x8f\xff\xf8\x8f\xe2\xbe\x7d\xfb\xce\x3b\xfd\xf4\xd3\xff\xe7\
+\x25\x97\x5c\xb2\xa1\xb9\xb9\x39\x08\xc0\xad\xc9\x85\x42\x01\x23\
+\x23\x23\x18\x19\x19\x41\x3e\x9f\x87\xae\xeb\x60\x8c\xc1\xb4\x18\
+\x2c\xce\x61\x5a\x80\xc5\x01\xce\x01\x8b\x73\x10\x00\x84\x00\x02\
+\x01\x28\x01\x24\x81\x40\x20\x04\x92\x28\x00\x84\x40\x14\x6d\x6f\
+\xe0\xf7\x07\xd0\xd4\xd4\x84\xa6\xa6\x26\xa8\xaa\xea\x3e\x0f\x63\
+\x0c\x07\x0e\x1c\x18\xf8\xc5\x2f\x7e\xf1\xf8\xfb\xef\xbf\xff\xf0\
+\x96\x2d\x5b\xba\x66\xf3\x7d\xe7\x00\xe0\x91\x4b\x2f\xbd\x74\x49\
+\x67\x67\xe7\x97\xbf\xf8\xc5\x2f\x6e\x8a\xc7\xe3\x11\x4a\x29\x75\
+\x0c\x9f\x4a\xa5\x90\x4c\x26\x91\xcf\xe5\xa0\x1b\x06\x74\xd3\x42\
+\xd9\xe4\x28\x31\x01\xa6\xa0\x80\x0b\x1a\x20\xa9\xa0\xb2\x0a\x22\
+\x88\x20\x44\x00\x28\x01\x63\xb6\x27\xb0\x4c\x0b\xdc\xd4\x61\x1a\
+\x25\x50\xb3\x0c\x6a\x16\xa1\x42\x87\x26\x70\x28\x12\x81\x22\x0a\
+\xa0\x82\x08\x49\x92\x10\x08\x04\xd0\xdc\xdc\x8c\x60\x30\x08\xc0\
+\x06\x81\x61\x18\x7c\xfb\xf6\xed\x3b\x1f\x7d\xf4\xd1\xef\x05\xfc\
+\xfe\x9f\xfd\xbf\x47\x1f\xcd\xcc\xc6\x3b\xcf\x01\x00\xc0\x77\xbf\
+\xfb\x5d\xb1\xbb\xbb\xfb\x33\x1b\x37\x6e\xfc\xf6\x9a\x35\x6b\xd6\
+\xc8\xb2\x4c\x00\x5b\xf1\x99\x4c\x06\xa3\xa3\xa3\x28\x97\x4a\x28\
+\x1b\x26\xf2\x06\x47\x81\x49\xb0\x24\x3f\x04\x2d\x04\x49\x0b\x40\
+\x56\x35\x08\x92\x04\x42\x05\x00\x04\x9c\x10\x80\xdb\x35\x9f\x12\
+\x02\xd9\xc6\x02\x98\xc5\xc1\xc0\x51\x28\x19\x30\x0c\x1d\x99\x6c\
+\x0e\xa5\x5c\x16\xa2\x91\x85\xca\xf2\x08\xcb\x1c\x01\x45\x80\x2c\
+\x8a\x20\x94\xc2\xef\xf7\x23\x12\x89\xc0\xe7\xf3\x01\x00\x28\xa5\
+\x48\xa5\x52\xf9\xdf\xfc\xe6\x37\x9b\xd3\xe9\xf4\x3d\xe7\x9c\x73\
+\xce\xae\xab\xaf\xbe\x9a\x1f\xce\xbb\x7f\xec\x01\xf0\xcf\xff\xfc\
+\xcf\xa1\xae\xae\xae\x3b\x6f\xb8\xe1\x86\x3b\xe7\xcf\x9f\x1f\xe3\
+\x9c\x83\x52\x8a\x7c\x3e\x8f\x5c\x2e\x8b\x42\xa1\x88\xa2\x6e\x22\
+\x53\x62\xc8\x53\x1f\x44\x5f\x14\x5a\x28\x6a\x1b\x5d\xb0\xdd\x38\
+\x07\xc0\x99\xad\x4d\x55\x24\x08\xca\x14\x21\x85\x20\xa8\x50\x68\
+\xa2\xad\x62\x91\x12\x88\x14\x30\x19\x20\x0a\x40\xc9\xe4\x30\x2d\
+\x8e\x64\xc1\x42\x5f\xaa\x84\xc1\x64\x1a\xa3\xa3\xa3\x20\xc5\x51\
+\xc4\x64\x13\x31\x9f\x00\x55\x96\x20\x4a\x12\x34\x4d\x43\x20\x10\
+\x80\x28\x8a\x60\x8c\x81\x10\x82\x37\xdf\x7c\xf3\xbd\x07\x1f\x7c\
+\xf0\xee\xf5\xeb\xd7\xff\xee\xee\xbb\xef\xb6\x66\xfa\xfe\x1f\x6b\
+\x00\xdc\x7f\xff\xfd\xf1\x4c\x26\xf3\xbd\x2b\xae\xb8\xe2\xda\x50\
+\x28\x24\x02\x36\x3d\x2b\x14\x0a\x28\x16\x8b\x28\xe9\x06\x46\xf2\
+\x06\x72\xd0\xa0\x84\x5b\xa0\x05\xc3\x90\x64\x15\x04\x15\xa3\x03\
+\x60\x8c\x83\x12\x20\xac\x52\xb4\xf8\x28\x02\x32\x85\x48\xed\x9a\
+\xcf\x61\xd7\x7c\x27\x0e\x20\x20\xf6\xf7\xca\x3f\x0a\x80\x52\xfb\
+\xb3\x64\x02\xa9\x92\x89\x3d\x43\x79\x74\x1d\x18\x84\x91\x19\x41\
+\xbb\x6a\x20\x1e\x52\x20\x4a\x22\x44\x51\x84\xa6\x69\x50\x14\x05\
+\x9c\x73\x70\xce\xd1\xd3\xd3\x33\xf2\xc0\x03\x0f\xdc\x7b\xd6\x59\
+\x67\xfd\xdb\x37\xbf\xf9\xcd\xe2\x4c\x74\x20\x1c\x6b\x23\x1c\x2b\
+\xf9\xcc\x67\x3e\xb3\xf4\x94\x53\x4e\xf9\xf7\x2b\xaf\xbc\xf2\xaf\
+\x14\x45\x11\x00\x9b\x8a\x15\x8b\x45\xe8\xba\x8e\xd1\xbc\x8e\xc1\
+\x92\x00\x84\xdb\x11\x89\xcf\x47\x20\x18\x86\x24\x4a\x36\xb7\xaf\
+\xdc\x83\x00\x88\x28\x14\x0b\x42\x02\x5a\x02\x02\x64\x81\x80\xc0\
+\x06\x86\xfd\x1f\x71\x2f\x24\xee\x57\x02\xcf\x19\x17\x48\x22\x05\
+\x82\x2a\xc5\x82\x26\x0d\x9d\x1d\x4d\x90\xfc\x61\xf4\x64\x19\x46\
+\xd2\x05\xf8\x24\x40\x95\x04\xd7\xf0\x82\x20\x80\x31\x86\x60\x30\
+\xe8\x5b\xbb\x76\xed\xba\xa7\x9e\x7a\x8a\x7c\xfe\xf3\x9f\x7f\xfb\
+\x85\x17\x5e\x98\x76\x12\xe9\x63\x09\x80\x4b\x2e\xb9\xe4\xe4\x6b\
+\xae\xb9\xe6\xb1\xf5\xeb\xd7\xaf\xe3\x9c\x13\x42\x88\x13\x68\xa1\
+\xac\x1b\x38\x98\x2a\x23\x27\x46\x10\x6e\x5b\x88\x60\x24\x02\x51\
+\x90\xec\x76\xdd\xb1\x1a\x01\x04\x0a\xb4\xf9\x29\xda\xfc\x22\x24\
+\xc1\x6e\xf3\x39\xec\x9a\x0d\xcf\xa7\xd7\xc9\x8e\x03\x81\xc7\xff\
+\x92\x0a\x72\x38\x00\x55\xa4\x98\x17\x51\xb0\xb8\x2d\x8a\x3c\xf5\
+\x61\x47\x7f\x0e\x30\x75\x84\x7d\x92\xed\x59\x2a\xcd\x14\x63\x0c\
+\x82\x20\x28\x67\x9f\x7d\xf6\xda\x2d\x5b\xb6\x88\xd7\x5e\x7b\xed\
+\x6b\x2f\xbe\xf8\xa2\x39\x1d\x5d\x7c\xec\x00\xf0\xe9\x4f\x7f\x7a\
+\xf9\xe7\x3e\xf7\xb9\xc7\xd6\xae\x5d\xbb\x06\x00\xa1\x94\xc2\x01\
+\x40\xa6\x50\xc6\x81\xb4\x05\x21\xd2\x8e\x68\x4b\x1c\x8a\x6a\xbb\
+\x7b\x47\x9c\x23\x89\x02\xf3\x43\x02\x7c\x12\x05\x88\x53\xd9\xc7\
+\x6a\x3f\xf1\x00\xc5\xcd\x0c\x7a\x3f\x2a\xff\x8d\x6b\x7f\x2b\x18\
+\xe3\x95\xb3\x9a\x44\xb1\xa4\xd9\x8f\x8e\x96\x28\x76\x8e\x18\x48\
+\xa4\x32\x88\x6a\x63\x41\xa2\xf3\xdc\x84\x10\x71\xcd\x9a\x35\xe7\
+\xfc\xe7\x7f\xfe\x27\xae\xbd\xf6\xda\xd7\x5e\x7a\xe9\xa5\x29\xc7\
+\x04\x1f\x2b\x00\xdc\x72\xcb\x2d\x1d\xe7\x9f\x7f\xfe\x4f\x2e\xb8\
+\xe0\x82\x73\x01\x10\x41\x10\x20\x49\x12\xc0\x81\xa1\x74\x1e\xfd\
+\x05\x82\x60\xeb\x7c\x04\x23\x51\x50\xea\xa8\x86\x80\x78\x0c\x23\
+\x0b\x04\x1d\x41\x01\x02\x21\xe0\x5e\x43\x57\xac\x37\x0e\x04\x98\
+\x1c\x04\x20\x35\x81\x58\x0d\x08\x08\x01\xc2\xaa\x84\x85\xad\x11\
+\x0c\x95\x04\xec\xec\x4b\x21\xaa\x11\xf8\x54\x3b\xa9\xe4\xd0\x54\
+\x4a\xa9\xb0\x72\xe5\xca\xb3\x7f\xf9\xcb\x5f\xe6\xae\xbb\xee\xba\
+\xb7\xb7\x6e\xdd\x3a\xa5\x34\xf2\xc7\x06\x00\xf7\xdd\xf7\x4f\x61\
+\x45\x51\x1e\xde\xb8\x71\xe3\x67\x08\x21\x44\x10\x04\xa8\xaa\x0a\
+\x4a\x28\x06\x52\x39\x0c\x97\x45\x34\xb5\x2f\x80\xe6\x0b\xd8\xb5\
+\xd9\x63\x5c\x07\x04\x12\x05\x5a\xfd\xb6\xd2\x49\x55\xbb\x0e\x17\
+\x04\x5e\xc3\xd7\x1a\xd7\x05\x49\xd5\xbd\x2b\x00\xa9\xf3\x3b\xee\
+\x01\x96\x2a\x52\x2c\x8d\x87\x50\xe0\x0a\xfe\x7b\x5f\x12\x51\x15\
+\xf0\xab\x32\x44\xd1\xce\x32\xea\xba\x0e\x59\x96\xa5\x93\x4f\x3e\
+\x79\xcd\x63\x8f\x3d\xd6\x7d\xdf\x7d\xf7\x7d\xf4\xc4\x13\x4f\x1c\
+\x52\x2f\x1f\x0b\x00\x7c\xfb\xdb\xdf\x96\xf6\xed\xdb\x7b\xcf\xb5\
+\xd7\x5e\x7b\xa3\x20\x08\x54\x10\x04\x04\x02\x01\x08\x82\x80\xfe\
+\xd1\xac\x6d\xfc\xf8\x3c\x28\xaa\x06\xc0\x8e\xca\x6b\x5d\x39\x25\
+\x04\x31\x4d\x80\x50\x31\x20\x47\x7d\x10\xd4\xb1\x7a\xf5\xe9\xda\
+\xf6\xdf\xdb\x1c\xd4\xfc\xae\xea\x7c\x85\x35\x2c\x8c\x69\x80\xac\
+\x61\xdb\x9e\x04\x9a\x54\x02\xbf\x2a\x41\x56\x14\x30\xc6\x50\x2a\
+\x95\x10\x08\x04\x7c\xf1\x78\x7c\xd5\xaf\x7e\xf5\xab\x97\xba\xbb\
+\xbb\x87\x0e\xa5\x9b\x8f\x05\x00\x96\x2f\x5f\xfe\xb9\xab\xae\xba\
+\xea\xef\xc3\xe1\xb0\x4a\x29\x45\x38\x1c\x86\x24\x49\x18\x1a\xcd\
+\x61\xb0\x48\xd1\x1c\x9f\xef\x76\xce\x38\x06\x73\xa3\xf9\xca\x71\
+\x50\x26\x90\x05\xe2\xa9\xb5\xf5\x41\x30\x66\x58\x6f\x1b\x50\x8b\
+\x8d\x49\xd8\x01\x41\x2d\x62\xaa\x9a\x18\x80\xa0\x3d\xac\x02\xa2\
+\x86\x3f\xef\x1d\x46\x6b\x48\x82\x26\x8b\x50\x14\x05\x86\x61\xc0\
+\x30\x0c\xb4\xb4\xb4\x34\x65\xb3\xd9\x05\x0b\x17\x2e\xfc\xfd\x7b\
+\xef\xbd\x37\x69\x47\x12\x3d\xd6\xc6\x39\xd2\x72\xd1\x45\x17\x2d\
+\x5f\xbb\x76\xed\xdf\xb7\xb4\xb4\x04\x01\xc0\xef\xf7\x43\x55\x15\
+\xa4\xf3\x45\xf4\xe7\x2c\xc4\xe2\x1d\x50\x14\xc5\x35\xa4\xcb\xd9\
+\x2b\x35\x8e\x10\x40\x12\x00\x45\x24\x60\x80\x1b\xa9\xdb\xff\x38\
+\x18\xf7\xd2\x3e\x80\x71\x80\xc1\xce\x27\x38\xe5\xdc\x2d\xab\xe4\
+\x0e\x38\xb7\x8f\xb9\x7d\xbd\x5d\x3e\x56\xe6\xfd\x87\xca\x3d\x18\
+\xf8\x18\x20\x09\xc1\xaa\xc5\x11\x74\x2e\x59\x80\x77\xf6\x67\x50\
+\x36\x2c\x08\x82\x80\x48\x24\x82\x4a\xb7\x34\xb9\xe8\xa2\x8b\x36\
+\x66\xb3\xd9\x1b\x0e\xa5\x9f\x86\xf6\x00\x77\xdf\x7d\xb7\x12\x0e\
+\x87\xff\x69\xdd\xba\x75\x1b\x04\x41\x80\xcf\xe7\x43\x2c\x16\x43\
+\x49\x37\xb0\x6b\x20\x87\x48\xeb\x3c\xf8\x34\x1f\x38\x21\x9e\x1a\
+\x56\x11\xcf\x57\x9f\x44\x40\x2b\xed\xbe\xdd\x34\x78\xea\xb1\xc7\
+\x45\x03\xd5\x34\xd0\xcb\x0e\xbc\xe7\x0e\x97\x1d\x38\x4d\xd2\xfc\
+\x26\x1f\xf6\xa7\x2d\x24\x46\x53\x68\x8f\x68\x90\x65\x19\x92\x24\
+\x21\x97\xcb\x01\x80\x10\x8f\xc7\x4f\xcb\xe7\xf3\x2f\xec\xd9\xb3\
+\x67\x70\x22\x1d\x35\x34\x00\xf2\xf9\xfc\xc6\x5b\x6e\xb9\xe5\x7f\
+\xa9\xaa\x2a\x89\xa2\x88\x78\x3c\x0e\x42\x08\x76\xf5\x27\x21\x06\
+\x9b\x11\x0c\x85\xc7\x0c\x34\x41\xfb\x2d\x52\x40\x11\xc7\x1c\x65\
+\x3d\x10\x78\x9b\x03\xb7\xd0\xbd\xdd\xd4\xd8\x41\x6d\x4c\x30\x15\
+\x76\x20\x10\x82\x8e\x26\x3f\xfe\xbc\x3f\x0d\x91\xeb\x88\x85\x6c\
+\x10\x94\xcb\x65\x94\xcb\x65\x34\x35\x35\x85\xfb\xfb\xfb\xa5\x4b\
+\x2f\xbd\x74\xcb\xd6\xad\x5b\xeb\xf6\x19\x34\x2c\x00\xee\xbd\xf7\
+\xde\xf0\x8a\x15\x2b\x1e\x5c\xb6\x6c\xd9\x49\x84\x10\xb4\xb4\xb4\
+\xc0\xef\xf7\x63\x68\x34\x8b\x94\x21\x20\xd6\xdc\x06\x4a\xe9\x04\
+\xd4\x6c\x4c\xf5\x8a\x68\xd7\x7e\xaf\xb8\xb5\xdb\xfd\xcd\xe4\x81\
+\xe1\xb8\x3a\x3d\xa5\xc0\x70\x3c\x3b\x70\xe9\x68\x0d\x3b\x50\x7d\
+\x1a\xde\xde\x3d\x84\x79\x11\x05\x9a\x22\x43\xd3\x34\x64\x32\x19\
+\x18\x86\x81\xb6\xb6\xb6\x65\x2f\xbe\xf8\xe2\x6b\xdb\xb7\x6f\xdf\
+\x57\x4f\x4f\x0d\x0b\x00\x42\xc8\x75\xd7\x5c\x73\xcd\xad\x92\x24\
+\x51\x4d\xd3\xd0\xde\xde\x0e\xdd\x30\xb0\x7b\x30\x83\xa6\x96\x0e\
+\x48\xb2\x3c\x16\x71\x79\x40\xc0\x5d\x03\xda\x85\x4e\xe0\x37\x2e\
+\x21\x54\x27\x62\x9f\x1c\x04\xc0\x54\x02\xc3\x99\xb0\x83\x98\x5f\
+\xc6\x60\x81\x63\x70\x38\x89\x05\xcd\x01\x48\x92\x04\xcb\xb2\x90\
+\xcf\xe7\xe1\xf7\xfb\x95\xde\xde\x5e\xed\xe2\x8b\x2f\xde\xbc\x75\
+\xeb\xd6\x71\x09\xa2\x86\x0c\x02\xaf\xbf\xfe\xfa\xe8\x25\x97\x5c\
+\x72\xab\xa2\x28\x22\x21\x04\xad\xad\xad\xa0\x94\xa2\x77\x24\x0d\
+\x35\x10\xae\x64\xf8\xaa\x3b\x69\xbc\x4d\xb2\x63\x40\x91\x56\x0a\
+\x2b\x41\x9a\x23\x0c\x63\x1e\x80\x63\x2c\xb8\xe3\x95\xa8\xcf\x1b\
+\x18\x3a\xe5\xde\xc0\xd0\x0d\xf2\x6a\xcf\x71\x6f\x10\x39\x16\x18\
+\x32\x6f\xe0\xc9\xbd\x9f\xdc\x0d\x14\xcf\x5e\xd6\x8a\xde\x02\xc5\
+\x50\xaa\x00\x00\x68\x69\x69\x81\x2c\xcb\xb0\x2c\x0b\xe7\x9e\x7b\
+\xee\xc6\x77\xdf\x7d\xf7\xf4\x7a\xba\x6a\x48\x00\x88\xa2\xf8\x97\
+\x27\x9f\x7c\xf2\x2a\x00\x50\x55\x15\xa1\x50\x08\xf9\x52\x19\xe9\
+\x22\x43\x38\x12\x05\xa1\x63\x6d\x6c\x2d\x08\xbc\x65\x1e\xfb\x8f\
+\x03\x81\x37\x4a\xaf\x32\x36\xea\xb3\x83\x5a\x10\x60\x9c\xb1\xeb\
+\xb3\x03\x36\x01\x3b\x70\xef\x51\x79\xaa\x98\x26\xe0\x13\x8b\xda\
+\xb0\xa3\x37\x05\xc6\x39\x24\x49\x42\x24\x12\x01\xe7\x1c\xad\xad\
+\xad\xe1\x70\x38\x7c\xd3\xb7\xbe\xf5\x2d\xb1\x56\x57\x0d\x07\x80\
+\x6f\x7c\xe3\x1b\x4a\x5b\x5b\xdb\xdf\x04\x02\x01\x09\xb0\x6b\x02\
+\xa5\x14\x43\x23\x19\xbb\x3b\x57\x92\x5c\x03\x4f\x08\x02\xa7\xdc\
+\x43\xca\xbd\xc6\x74\x64\xac\xd6\xdb\x86\x04\x88\xfd\x9d\x57\x83\
+\x80\xd7\xf9\x74\x29\xa5\x6b\xfc\xf1\xb5\xdc\x4b\x11\x59\x0d\x00\
+\x98\xe7\x1e\x8c\x73\x58\x1c\x38\xad\x23\x8c\xa1\xb2\x88\x44\xc6\
+\xf6\x02\xcd\xcd\xcd\x10\x45\x11\x9c\x73\xac\x5b\xb7\xee\xd2\xe1\
+\xe1\xe1\xf6\x5a\x7d\x35\x1c\x00\xde\x7e\xfb\xed\xe5\xa7\x9d\x76\
+\xda\x05\x9c\x73\x28\x8a\x82\x70\x38\x8c\xb2\x6e\x20\x55\xb2\x10\
+\x0a\x86\xab\xd2\xb8\x5e\x77\xef\x05\x81\xab\x1c\xf7\x70\x0c\x04\
+\xe3\x86\x79\xc3\x03\x02\x6e\xc7\xe8\x63\x60\x19\xdf\x1c\x30\x4f\
+\xad\x1e\x33\xa0\x07\x18\xde\x66\x02\xa8\x72\xf7\x5e\x8f\xe1\xcd\
+\x2f\xd8\xc7\x1c\x31\xbf\x88\x78\x73\x13\x76\xf5\x67\xc0\x18\x87\
+\xa6\x69\x08\x06\x83\x60\x8c\x21\x1e\x8f\xcf\xef\xea\xea\xba\xb0\
+\x56\x5f\x0d\x05\x80\x87\x1e\x7a\x88\xc8\xb2\xbc\xb1\xad\xad\x2d\
+\x0a\xc0\xcd\xf8\x8d\x66\xf3\x90\x55\x1f\x24\x59\x1e\x33\x36\x2a\
+\x06\x26\xf5\x41\x50\x13\xf8\xbb\xbf\x9a\x0a\x08\xa6\x16\x13\xf0\
+\x6a\x57\xef\x31\x2e\xab\xf4\xfb\xf3\x1a\x70\xd8\x6d\x3e\xaf\x06\
+\x86\x07\x28\x8c\x73\xac\x58\x18\x46\x7f\xce\x42\x51\xb7\x87\x06\
+\xc4\x62\x31\x00\x80\xaa\xaa\xe2\xe9\xa7\x9f\x7e\xe5\x3d\xf7\xdc\
+\x23\x7b\x9f\xbd\xa1\x00\xf0\xfb\xdf\xff\x5e\x59\xb3\x66\xcd\x65\
+\xc4\x16\xc4\x62\x31\x70\xce\x91\x48\xe5\x10\x0c\x85\x2b\xc9\x1c\
+\x32\xd6\x04\x38\x0a\x20\x13\x79\x82\xf1\xd4\xd9\x19\x0d\x64\xd7\
+\x54\x4f\x4c\x80\xb1\xcb\xa7\x1e\x18\x72\x38\x77\xe1\x9e\x1a\x5d\
+\x2f\x30\xac\x6d\x1a\xaa\xbd\xc6\x58\x79\xcc\x2f\x81\xc8\x7e\xf4\
+\x27\xf3\x20\x84\x20\x18\x0c\xda\x3d\x9e\x00\x4e\x3f\xfd\xf4\xb3\
+\x0e\x1c\x38\xd0\xe2\x7d\x9f\x86\x02\x40\x3a\x9d\x5e\xb8\x64\xc9\
+\x92\x33\x00\x3b\xf8\xf3\xfb\xfd\x28\xeb\x06\xca\x8c\x42\x51\x95\
+\xaa\xb6\xdd\x1b\x07\x38\x20\xc0\x84\x20\xa8\x31\x34\xa6\xc9\x0e\
+\x30\x3e\x30\xac\x65\x00\x40\x4d\x8d\x9e\x21\x3b\xf0\xcb\x14\xb1\
+\x48\x10\xfb\x13\x59\x30\xc6\xa1\xaa\x2a\x82\xc1\x20\x38\xe7\x88\
+\xc7\xe3\xed\x6f\xbd\xf5\xd6\x29\x5e\x9d\x35\x14\x00\x72\xb9\xdc\
+\xea\xa6\xa6\xa6\x28\x00\x84\x42\x21\x08\x82\x80\x4c\xbe\x00\x55\
+\xd3\x20\x50\x67\xea\x56\x0d\x08\x2a\xf6\xac\x0a\x0c\xab\x12\x35\
+\xce\xd1\x78\x6f\x30\x25\x76\x30\x41\x60\xe8\x65\x07\x63\x1e\x05\
+\x53\x66\x07\x13\xf6\x1d\x70\xa0\x3d\xe2\x43\xb2\xc0\x51\xaa\x34\
+\x03\xe1\x70\x18\x00\x20\x49\x92\xdc\xd9\xd9\x79\xb6\xf7\x1d\x1a\
+\x06\x00\x3f\xfc\xe1\x0f\xe9\x29\xa7\x9c\xb2\x56\x92\x24\xe2\x7d\
+\xe9\x74\xae\x08\xbf\xdf\x0f\x81\x56\xe7\xe4\x6b\x41\x40\xc8\xf8\
+\xa0\xd0\x91\xfa\x20\x98\x22\x3b\xa8\x09\x0c\xeb\xb1\x03\x56\x53\
+\xeb\x0f\x87\x1d\x58\x1c\x68\x09\x4a\x30\xa9\x8c\x54\xbe\x04\xce\
+\x39\x82\xc1\x20\x08\x21\x10\x04\x81\x2c\x5a\xb4\x68\xf5\xdf\xfd\
+\xdd\xdf\xb9\x09\xc0\x86\x01\xc0\x96\x2d\x5b\xa4\x65\xcb\x96\xad\
+\x02\xec\xf1\xf3\xc1\x60\x10\x8c\x73\x14\xcb\x26\x64\x45\x1d\x5f\
+\xb3\x27\x01\x41\x4d\x36\x78\x12\x99\x06\x3b\xa8\xaa\xf9\xb3\xcf\
+\x0e\xbc\x65\x7e\x99\x42\xd6\x7c\x18\x4e\x17\x40\x08\xb1\x07\xbe\
+\x54\xa6\xb4\xb5\xb5\xb5\x2d\xeb\xe9\xe9\xf1\x3b\xcf\xd9\x30\x00\
+\x88\x46\xa3\x91\xe6\xe6\xe6\x45\x00\x20\x49\x12\x64\x59\x86\x69\
+\x5a\x60\x84\x40\x14\x84\xaa\x6e\x5e\x6f\x36\x75\x1c\x08\xe0\x89\
+\x09\x3c\x32\x71\x53\x30\x45\x76\x80\x69\x04\x86\x33\x60\x07\x63\
+\x5e\x01\x90\x28\x81\xa2\x28\x48\xe6\xed\xa9\x84\xb2\x2c\x43\x96\
+\xed\xe0\xbf\xb9\xb9\xb9\x4d\x55\xd5\x26\xe7\x19\x1b\x06\x00\xc1\
+\x60\xb0\x35\x18\x0c\x46\x01\x3b\x00\x14\x04\x01\xba\x61\x80\x0a\
+\x22\x04\x81\x8e\xeb\xeb\xf7\xd6\xf4\x71\x81\x21\x26\x06\x41\xbd\
+\xc0\xd0\x39\xe7\x80\xe0\x68\xb2\x03\xe6\x3e\x0d\x77\xd9\x01\x21\
+\x80\x24\x89\xc8\x95\x2d\x30\xc6\x41\x08\x71\x07\xbc\xf8\x7c\xbe\
+\xd0\x0b\x2f\xbc\xe0\x32\x81\x86\x01\xc0\xcb\x2f\xbf\xdc\xa6\x56\
+\x66\x55\x3a\x93\x2b\x0d\xc3\x84\x28\x49\xa0\x84\x56\x47\xf8\x40\
+\xfd\x64\x50\x1d\x76\x50\xaf\x29\xa8\xe7\x0d\xbc\xd1\x7f\x5d\x76\
+\x50\x0f\x04\x98\x1a\x3b\xf0\xc6\x04\xce\xb9\xc9\x02\x43\x00\x10\
+\x04\x01\x65\x83\xc3\xac\x4c\x51\x77\x74\xa2\x69\x9a\x1c\x0c\x06\
+\x1b\x0f\x00\x3e\x9f\xaf\x59\x51\x14\xca\x39\x87\x2c\xcb\x20\x84\
+\x40\x37\xcc\xca\xf4\x2d\x80\x7a\x7b\xfd\xbc\x51\x3f\x6a\xcb\xaa\
+\xd9\x01\x30\x75\x10\xd4\x06\x86\xb5\x9e\x60\xa6\xec\xc0\x1b\x13\
+\x54\x35\x25\xc0\x78\x26\xe0\x80\x80\x10\x30\x10\x98\xa6\xdd\x01\
+\xe8\x34\x01\x92\x24\x51\x45\x51\xa2\xce\x73\x35\x0c\x00\x14\x45\
+\x89\x38\x23\x64\x9d\x97\x35\x99\x05\x91\x0a\xae\xf1\xbd\x46\x77\
+\x0c\x4e\xbd\x31\xc1\x04\x81\x21\x30\x73\x10\x78\x65\x26\xec\xc0\
+\xeb\xfa\xc7\x79\x02\x4f\x60\xc8\x30\xe6\x09\x0c\xc6\xc1\x41\xc0\
+\x41\x60\x55\xfe\xa0\xa3\x9b\xca\xb1\x3b\xff\xbc\x21\x00\x70\xff\
+\xfd\xf7\x13\x59\x96\x43\xa4\x92\xe9\x73\x96\x6b\x01\x03\x28\x25\
+\x20\x84\xd7\x6d\xe7\xdd\xe4\xcf\x54\x41\x80\x71\x61\xc1\x04\x32\
+\x7b\xec\xa0\x2a\x30\x04\xea\x07\x86\xa8\xf6\x0a\x86\x55\x49\x2c\
+\x11\x5a\x01\x9a\x67\xf4\x11\x00\x49\x92\x5c\x34\x34\x04\x00\x00\
+\x40\x51\x14\xc9\x55\xbf\x77\x9d\x1e\xbb\x60\xc2\x88\xbf\x2e\x3b\
+\x20\x13\x5c\x5b\x3d\x7e\xa4\x72\xff\x89\xd9\xc1\x64\x81\xe1\x4c\
+\xd9\x41\xdd\xc0\xb0\x86\x1d\xe4\x0c\x5e\x61\x33\xdc\x7d\x3a\xc6\
+\xc6\xe6\x89\x58\x96\xe5\x0e\x0c\x69\x18\x00\x18\x86\x31\x6e\x26\
+\x0c\x15\x08\x38\x67\x20\x9c\x57\x07\x7d\xb5\x7d\xff\xa8\x06\xc1\
+\x64\x81\xe1\xb8\x11\x3a\xce\xfd\x26\x48\x1b\x93\x1a\x37\xef\x3d\
+\x37\x5d\x76\x50\xd5\x19\x34\x09\x3b\xc8\x96\x3d\xef\x5b\xe1\xff\
+\x5e\x00\x18\x86\xe1\xce\x24\x6e\x08\x00\xdc\x79\xe7\x9d\xdc\xb2\
+\xac\x32\x2a\x4a\x70\x5e\x56\x14\x04\x30\x66\x8d\xcf\xf2\x79\x7b\
+\xfc\xea\x00\x01\x98\x00\x04\xce\x09\xcf\x75\x5e\x39\x5c\x76\x00\
+\x8f\x1b\x9f\xce\x90\xf3\x2a\xe6\x00\x8e\x54\xc9\x3e\xa2\x84\x41\
+\xac\x3c\xa8\x69\x9a\xce\x27\x2f\x97\xcb\xee\xea\x22\x0d\x01\x00\
+\x00\xd0\x75\x3d\xeb\x2c\x9e\xa0\xeb\x76\x02\x44\x12\x05\x30\xd3\
+\x1a\xd3\x32\xc6\x83\x60\x26\xec\xe0\x70\x03\xc3\xc9\x9a\x83\xc9\
+\x06\x95\x00\x87\x66\x07\x45\x83\xa3\x6c\xd9\x85\x02\x05\x04\xc1\
+\x36\x71\xb9\x5c\x06\x00\x94\x4a\x25\xb3\x5c\x2e\x8f\x3a\x7f\xbf\
+\x61\x00\x90\xcf\xe7\x07\xcb\xe5\x32\x38\xe7\x28\x95\xec\x1c\xb8\
+\x22\x4b\x30\x2d\x1b\xf9\xf5\xdb\x78\xd4\x67\x07\x64\x1a\xec\xa0\
+\xce\xb3\xcc\x26\x3b\x00\xa6\xd7\x77\x90\x28\xd8\x30\xe2\xcc\x82\
+\x42\x01\x51\xa0\xe0\x9c\x7b\x01\x50\xdc\xb0\x61\x43\xc2\xf9\xdb\
+\x0d\x03\x80\xb6\xb6\xb6\xbe\x72\xb9\xac\x13\x42\xdc\x97\x95\x44\
+\x09\x84\x5b\x76\x1c\x80\x09\x40\x80\xf1\xec\xa0\x36\x4b\xe8\x94\
+\xd5\x05\x41\x9d\xce\xa3\x89\x65\xfa\xec\x60\x4a\x69\x63\x38\x1d\
+\x41\x1c\x23\x45\x0b\x04\x80\x65\x99\x08\xaa\x02\x28\xb1\x97\x9e\
+\x73\xbc\x62\x2e\x97\x4b\x66\xb3\xd9\xa4\xf3\x77\x1b\x06\x00\xf3\
+\xe6\xcd\x1b\xc8\x66\xb3\x69\xc0\x76\x77\x96\x65\x4f\x97\xa2\x60\
+\xb0\x4c\xc3\x55\x7f\x9d\x89\xb8\x53\x63\x07\x04\xd3\x66\x07\xf5\
+\x07\x95\x1c\x39\x76\x90\xc8\x31\x18\x96\x7d\x81\x59\x2e\xa1\x29\
+\xa0\x82\xc3\xae\xfd\x86\x61\xeb\x20\x91\x48\x1c\xcc\xe5\x72\x69\
+\xe7\x6f\x36\x0c\x00\x92\xc9\xe4\xc8\xe8\xe8\x68\x3f\x00\x77\x92\
+\x24\xa5\x04\x8a\x24\xa1\x5c\x2e\x83\x10\x27\xff\x56\x13\x07\xd4\
+\x61\x07\x33\x49\x1b\xd7\x63\x07\x00\x30\x13\x76\xe0\x0d\x1c\xa7\
+\xca\x0e\x4c\x8b\x63\xa8\xc0\xec\x61\x6e\x9c\xc3\xd2\x4b\x68\x0e\
+\xd9\xb3\x9d\x73\xb9\x9c\x1b\x18\xef\xdd\xbb\xf7\xdd\x2b\xae\xb8\
+\xc2\x5d\x4a\xa6\x61\x00\xb0\x71\xe3\xc6\x52\x5f\x5f\xdf\x07\xc0\
+\xd8\x5a\x3f\x9c\x73\x04\x7d\x1a\x8a\x05\x7b\x94\x2c\xf5\x18\xa8\
+\xbe\x51\x3d\x35\x77\x82\xc0\xf0\x68\xb0\x83\xe9\x0e\x39\x67\x1c\
+\x18\xc8\x5b\xf6\x57\x42\xc0\x99\x05\x81\xe9\x08\xfb\xed\x84\x5f\
+\x3a\x6d\x57\x78\xc3\x30\x78\x57\x57\xd7\x1b\x37\xde\x78\xa3\xcb\
+\x09\x1b\x06\x00\x5f\xfe\xf2\x97\xf9\xf6\xed\xdb\xff\xe4\x2c\xd0\
+\x9c\x4e\xa7\x41\x08\x81\xdf\xaf\x41\x2f\x15\xc1\x2c\x56\x37\xeb\
+\x07\xcf\xb1\xd7\x2b\x78\x3b\x82\x8e\x16\x3b\xf0\xca\x94\xd9\x01\
+\x80\x4c\x99\x21\xab\x8f\x79\x38\xc3\xd0\x11\x51\x29\x64\xc9\x5e\
+\x4c\x2a\x9b\xcd\x02\x00\x92\xc9\x64\x2a\x14\x0a\xfd\xd9\xfb\x77\
+\x1a\x06\x00\x00\xb0\x7b\xf7\xee\xb7\xd2\xe9\x74\x09\x00\x52\xa9\
+\x14\x2c\xcb\x82\x22\xcb\x90\x28\x50\x2e\x17\x41\xf8\xc4\x59\x3f\
+\xef\x71\x55\xf6\xb0\x86\x1d\x1c\x4e\xda\x98\xd4\x6b\x23\xa6\x13\
+\x18\xd6\xb0\x03\x0e\x20\xaf\x33\x0c\xe7\x99\xfb\x6c\xe0\x1c\xe5\
+\x7c\x16\xf3\x9a\x7c\x00\x08\x8a\xc5\x22\x8a\x45\x3b\xef\xd3\xdb\
+\xdb\xdb\x15\x89\x44\xf6\x7b\xff\x46\x43\x01\xe0\x9c\x73\xce\xd9\
+\x71\xe0\xc0\x81\xdd\x00\x50\x28\x14\x50\x2a\x95\x40\x00\x84\x02\
+\x1a\x72\x99\x0c\x38\x78\x55\x2d\xaf\x6d\x02\x1c\x99\x8c\x1d\x4c\
+\x69\x50\x89\x27\x80\xa8\xcf\x0e\xc6\x07\x86\x4e\xe9\x94\xd9\x01\
+\x80\x82\xce\x90\x28\xb0\x2a\x0f\x65\x59\x06\x88\x51\x40\x5b\x34\
+\x00\x00\x48\x26\x93\xe0\xdc\x1e\x13\xb0\x6d\xdb\xb6\x67\x2e\xb9\
+\xe4\x92\xaa\xf5\x04\x1b\x0a\x00\x3f\xfb\xd9\xcf\x46\xb7\x6f\xdf\
+\xfe\x3c\xe7\x9c\x33\xc6\x90\x4a\xa5\x00\x42\x10\x0c\xf8\x51\x2a\
+\xe6\x61\x1a\x86\x1b\x9b\x13\x8c\xc5\x04\x93\x06\x86\x87\xc3\x0e\
+\x9c\xf3\x9e\x67\x9c\x2d\x76\x90\xd7\x39\x92\x45\x06\xee\x7d\x76\
+\xce\x51\x2a\xe6\xd1\xea\x13\xa0\x29\x32\x18\x63\x18\x1d\xb5\x73\
+\x3e\x23\x23\x23\x79\xc6\xd8\x33\x37\xdd\x74\x53\x55\xca\xbc\xa1\
+\x00\x50\x79\xd1\xa7\x0b\x85\x42\xb1\x72\x0c\xcb\xb2\x20\x4b\x12\
+\x02\x8a\x8c\x6c\x26\x0d\x37\x06\xaf\x58\xe5\x90\x81\xa1\x63\x9a\
+\xa3\xc4\x0e\xbc\x6e\xbe\x5e\xdf\x81\xc5\x39\xd2\x65\x86\x4c\x25\
+\xdf\xef\x3e\x3f\x01\x38\x67\x30\xb2\x29\x2c\x6a\x0d\x01\x00\xb2\
+\xd9\xac\xeb\xfe\x77\xef\xde\xfd\x8e\x2c\xcb\xef\xd6\x3e\x47\xc3\
+\x01\x40\x51\x94\x6d\xdb\xb7\x6f\xff\x90\x52\xea\xae\xe7\x0f\x00\
+\x91\x50\x00\xb9\x4c\x0a\xba\xae\x57\x8c\x3f\x66\xd4\xda\xac\x5f\
+\x45\x9f\xc7\x84\x1d\xc0\x5b\xe2\x89\x0e\x19\x07\x0a\x06\x43\xaa\
+\xc4\x51\xb6\x1c\x2f\x64\xdf\x81\xc2\x86\x4d\x21\x9f\x45\x44\x61\
+\x88\x04\x34\x70\xce\x31\x34\x34\x04\xce\x39\x4c\xd3\x64\xcf\x3d\
+\xf7\xdc\x8f\x6b\xdd\x3f\xd0\x80\xeb\x03\x7c\xf8\xe1\x87\x25\x59\
+\x96\xe5\x55\xab\x56\x5d\x2c\x49\x12\x65\x8c\xa1\xa9\xa9\x09\x84\
+\x52\xe8\xa5\x12\x74\xc3\x82\xcf\xef\x77\x27\x7e\xd6\xab\xa1\xb5\
+\xd1\x3e\x9c\x6b\xc8\x04\x46\xad\x7b\xbd\xb7\x70\x92\xeb\xc7\x45\
+\x1f\x63\x9f\x1c\x00\x63\x80\xce\xec\xfc\xbe\xb7\xbf\x93\x78\xef\
+\x40\xec\xcc\x5f\x2e\x31\x88\xd3\xe6\x85\xe1\x53\x15\x14\x0a\x05\
+\x0c\x0e\x0e\x82\x73\x8e\xee\xee\xee\x5d\xa6\x69\x7e\xeb\x9e\x7b\
+\xee\xc9\xd6\xea\xab\xe1\x3c\x00\x00\xb4\xb5\xb5\x3d\xd5\xd3\xd3\
+\xb3\x9b\x52\x8a\x6c\x36\x8b\x4c\x26\x03\x4a\x08\x22\xe1\x20\xf2\
+\xd9\x14\x4a\xc5\x42\xb5\x7b\xc7\xe4\x81\xe1\x6c\xb2\x03\x00\xd5\
+\x49\x1c\x87\xda\xf1\x4a\x4f\x26\xe7\xb0\x18\x87\x61\x01\x65\x13\
+\x28\x5b\x1c\x26\xb3\xaf\xa7\x15\x7a\x4a\xc9\x78\x0f\x94\x4b\xa7\
+\xd1\xea\x03\x22\x01\x3b\xf9\x33\x34\x34\x64\x6f\x64\x61\x9a\x78\
+\xe6\x99\x67\x1e\x39\xff\xfc\xf3\x07\xea\xe9\xaa\x21\x01\x10\x8b\
+\xc5\xfa\x9f\x79\xe6\x99\x7f\x37\x0c\x83\x71\xce\x91\x48\x24\xc0\
+\x39\x87\x24\x8a\x08\xfa\x34\x8c\x24\x86\xc0\x2d\xcb\xd3\x4e\x57\
+\x83\x00\x18\x0f\x02\xb7\x0c\x87\xc1\x0e\xe0\x99\x90\x5a\xb9\x8e\
+\x03\x60\x20\x60\xdc\x9e\xd4\x61\x31\xfb\x93\xd5\xf9\x7d\xdd\x3c\
+\x06\xe7\x28\x97\x8a\x60\xb9\x24\x96\xb6\x47\x40\x08\x41\x36\x9b\
+\x45\x3e\x6f\xcf\x0d\xdc\xb5\x6b\x57\xf7\xf0\xf0\xf0\xe3\x5f\xf8\
+\xc2\x17\xc6\xb7\x33\x68\x50\x00\x7c\xef\x7b\xdf\x63\xd1\x68\xf4\
+\xc7\x1f\x7d\xf4\xd1\x76\x41\x10\x90\xcf\xe7\x6d\x46\x00\x20\x1c\
+\xf4\x83\x1b\x65\x24\x47\x13\xf6\x40\x11\x47\xb1\x47\x83\x1d\x38\
+\x81\x67\xed\x79\xf7\x9a\xb1\x81\x2a\xee\x35\xa8\x0f\x02\xa7\xed\
+\xe6\xcc\x44\x36\x31\x88\xa5\x2d\x3e\x28\x92\x04\xc3\x30\x30\x3c\
+\x3c\xec\xf4\x00\x9a\x9b\x37\x6f\xfe\xbf\xaf\xbf\xfe\x7a\xef\x44\
+\xba\x6a\x48\x00\x00\x40\x3c\x1e\x1f\x78\xf2\xc9\x27\xef\x2f\x95\
+\x4a\x26\x60\x33\x02\xd3\x34\x41\x08\x41\x53\x38\x84\x74\x72\x04\
+\xd9\x5c\x16\x04\x63\x20\xa8\x0d\x0c\x1d\x39\x12\xec\x60\xb2\x09\
+\xa9\x87\x0a\x2c\x5d\xa0\x31\x86\xd4\x48\x02\xcd\xaa\x85\x96\x88\
+\x1f\x95\x5d\xc7\xdc\x8e\x9f\x37\xdf\x7c\xf3\x8f\xe7\x9d\x77\xde\
+\x63\x93\xe9\xa9\xe1\x82\x40\x47\x5e\x79\xe5\x15\x7e\xeb\xad\xb7\
+\x76\xed\xdc\xb9\xf3\x8a\xce\xce\xce\x36\xce\x39\x2c\xcb\x82\xa6\
+\x69\xa0\x94\x82\x80\x23\x39\x3a\x0a\x4d\xf3\x41\x92\xe4\x31\x8d\
+\x7b\xa2\xfd\x2a\xf7\x4f\xaa\x2e\xa9\xf9\x52\xcd\x0e\xe0\xbd\xa6\
+\xaa\x6c\x7c\x60\x08\x52\x73\x79\x4d\xf2\x80\xd4\xb9\x16\x00\x38\
+\x18\xd2\xa9\x51\xd0\xc2\x08\x96\xb7\x47\x21\x8a\x02\x8a\xc5\x22\
+\x52\xa9\x14\x38\xe7\x18\x1c\x1c\x1c\x7d\xfe\xf9\xe7\x6f\xf9\x97\
+\x7f\xf9\x97\x5d\x93\xe9\xa9\x61\x3d\x00\x00\x2c\x5f\xbe\xbc\x30\
+\x38\x38\xd8\x9f\xc9\xd8\x23\xa0\x8a\xc5\xa2\x9b\x17\xf7\xf9\x34\
+\xf8\x65\x11\x03\x7d\xbd\x28\x97\x8a\x35\x3b\x7b\x4c\xd2\xe6\x7a\
+\x8e\xbd\xb5\x71\xa2\xbe\x83\x43\x05\x86\xb5\x39\x83\x5a\x4f\x50\
+\xd5\xa4\xc0\x59\xac\x92\x23\x97\x4e\xc3\xcc\x0c\x61\x59\x3c\x04\
+\x49\xa0\xee\xc6\x56\x9c\x73\xe8\xba\x6e\x3e\xf6\xd8\x63\xff\xa7\
+\xb3\xb3\xf3\x8d\x43\xe9\xa8\xa1\x01\xf0\xd9\xcf\x7e\x96\xb7\xb7\
+\xb7\xeb\xd1\x68\xd4\x1d\x25\x94\xcd\x66\xed\x01\x23\x9c\xc3\xef\
+\xd3\x20\x53\x8e\xbe\xde\x83\x28\x16\x0a\x15\x3e\xed\x51\x36\x50\
+\xa7\xed\x9f\x1a\x3b\x70\xc1\x33\x55\x10\xd4\x3d\x1e\x43\x9c\x0b\
+\x30\x0e\xe4\x33\x69\x94\x46\x07\xb0\xb4\xc5\x0f\x55\x16\xc1\x2a\
+\x9d\x5f\x8c\x31\x70\xce\xf1\xdc\x73\xcf\x6d\x0e\x06\x83\xff\xfa\
+\x0f\xff\xf0\x0f\x87\xdc\x37\xa0\xa1\x01\x00\x00\xf9\x7c\xbe\xf7\
+\x94\x53\x4e\x81\x69\x9a\xae\x82\xb2\xd9\xac\xdb\x4e\xfa\x7d\x0a\
+\x04\x18\xe8\x3d\xd8\x83\x5c\x3e\x37\xbe\xc6\x61\x06\xec\x00\x35\
+\x86\x9c\x0e\x3b\x98\x24\x26\xe0\x8c\x21\x9d\x4a\xa2\x90\xe8\xc3\
+\xe2\x98\x0a\x4d\x11\xc1\x18\x47\x2e\x97\x83\x69\xda\xb3\xa0\xde\
+\x7f\xff\xfd\x77\xdf\x7c\xf3\xcd\x6f\xfe\xe8\x47\x3f\x4a\x4d\x45\
+\x3f\x0d\x0f\x80\x44\x22\xd1\x2d\xcb\x32\xce\x38\xe3\x0c\x38\x4d\
+\x01\x63\x0c\x85\x42\xa1\x32\x48\x82\xc0\xaf\xa9\x10\xb9\x89\xbe\
+\x03\xfb\x91\x4e\xa5\x80\xc3\x61\x07\x9e\x48\x7e\x76\xd8\x81\x7d\
+\x4f\xcb\x32\x91\x4c\x0c\xa2\x3c\xd2\x87\x85\x51\x19\x9a\x2c\x82\
+\x73\xa0\x54\x2a\x55\x06\xbf\x50\xec\xdd\xbb\x77\xff\x96\x2d\x5b\
+\xfe\xc7\xb3\xcf\x3e\xfb\xd1\x54\xf5\xd3\xf0\x00\x08\x04\x02\x2f\
+\xed\xde\xbd\x3b\xd5\xdc\xdc\x8c\xc5\x8b\x17\x23\x91\xb0\xc7\x43\
+\x5a\x96\x05\x67\x10\x29\x38\xa0\xa9\x0a\x64\xc2\xd0\x7f\x60\x1f\
+\x86\x87\x07\x61\x99\xe6\xcc\xd8\x81\xb7\xd6\xce\x06\x3b\xe0\x1c\
+\xe5\x72\x11\xc3\xfd\x07\x81\xec\x10\xe6\x47\x15\x28\x92\x6d\x7c\
+\xc3\x30\xc0\x18\x03\xa5\x14\x07\x0e\x1c\x18\x78\xfa\xe9\xa7\xef\
+\x78\xf2\xc9\x27\xff\x38\x1d\xfd\x34\x3c\x00\xce\x3d\xf7\xdc\x1d\
+\x2f\xbf\xfc\xf2\x3b\x85\x42\xc1\xdd\x7b\xaf\xa7\xa7\xc7\xdd\x83\
+\xcf\x19\x2f\x0f\x00\xb2\x2c\x41\x93\x28\x12\x03\x07\x71\xa0\x67\
+\x2f\xf2\xb9\x2c\x38\xab\x0c\xb3\xf2\xb0\x83\x7a\x7d\x07\xce\x71\
+\x15\x08\x6a\xd8\x01\x99\xf0\xfa\x6a\x9e\xef\xb4\xf7\x16\x33\x91\
+\x4a\x25\x31\xd4\xb3\x07\x9a\x9e\x42\x5b\x58\x81\x28\x8c\x99\xcc\
+\xd9\x3c\xea\xe0\xc1\x83\x03\x4f\x3f\xfd\xf4\x1d\x97\x5d\x76\xd9\
+\xe6\xe9\xea\xa7\x61\x69\xa0\x23\x1b\x37\x6e\xbc\x20\x1a\x8d\x7e\
+\xc3\xb2\x2c\xb1\xd2\x31\x82\x9e\x9e\x1e\xa4\x52\x29\xcc\x9f\x3f\
+\xdf\xed\x2b\x77\x36\x60\x02\x6c\x03\x14\x0b\x79\x8c\xa6\x46\xc1\
+\x2c\x7b\xd5\x4d\x51\x14\xdd\xfe\x83\xaa\x00\x00\xe3\x8d\x6a\x1f\
+\x60\x3c\xd5\x23\x93\x5d\x3f\x56\xc8\xb8\x85\x42\x2e\x87\xe1\x81\
+\x5e\x94\x92\x03\x88\x2a\x0c\x01\x4d\x86\x40\xed\x3d\x8e\x24\x49\
+\x72\x8d\xbf\x77\xef\xde\x9e\xdf\xfc\xe6\x37\x77\x5c\x7c\xf1\xc5\
+\x4f\xce\x64\x17\x51\x32\xdd\x1f\x9c\x48\xf2\xd3\x9f\xfe\x74\xfd\
+\xbc\x79\xf3\x7e\x7b\xde\x79\xe7\x05\xfa\xfa\xfa\xb0\x7f\xff\x7e\
+\xe4\xf3\x79\x8c\x8c\x8c\x60\xdf\xbe\x7d\xe8\xe8\xe8\xc0\xba\x75\
+\xeb\x20\xcb\xb2\xbb\x0d\x9b\xb3\x6f\xa0\xbd\x8d\x9c\x89\xb2\x6e\
+\x40\x54\x7d\x88\xc4\x5a\x10\x89\x36\x41\x51\x54\x3b\xe2\x27\x63\
+\xb3\x71\x81\xea\x01\x9c\xf0\x1c\x8f\xf5\xef\xd7\x39\x5f\xf5\x9d\
+\xc3\x30\x2d\x14\x0a\x79\xa4\x46\x86\x51\xca\x8e\x42\x85\x81\xa0\
+\x4f\x81\xb3\xb9\x95\xcf\xe7\x73\x8d\x6f\x59\x16\x3e\xf8\xe0\x83\
+\x0f\x7f\xf5\xab\x5f\x7d\xf5\xf1\xc7\x1f\x7f\x7e\xa6\x3a\x6a\x58\
+\x0f\xf0\xd3\x9f\xfe\x74\x7d\x7b\x7b\xfb\x6f\xd7\xae\x5d\x1b\x00\
+\xec\x21\x62\xbb\x76\xed\xc2\xe0\xe0\x20\x0a\x85\x02\xd7\x75\x9d\
+\xec\xde\xbd\x1b\x3d\x3d\x3d\x98\x37\x6f\x1e\x02\x81\x00\x28\xa5\
+\xee\x4a\x1a\x36\x4b\xe0\x00\x67\x30\xf4\x12\x32\xa3\x49\xa4\xd3\
+\x29\x94\x4a\xe5\x8a\xc7\xa0\x10\x28\x71\x77\x08\xad\x4a\xd8\xa0\
+\xa6\x66\x79\x28\x44\x55\xc2\x87\x73\x58\x16\x43\xb9\x5c\x46\x6a\
+\x34\x89\x44\x7f\x2f\x52\x83\x07\x80\x62\x1a\x7e\x91\x43\x91\x04\
+\x50\x2a\xb8\x5b\xcd\x4b\x92\xbd\x71\xa5\xae\xeb\xd6\xb3\xcf\x3e\
+\xfb\xcc\x13\x4f\x3c\x71\xfb\xaf\x7f\xfd\xeb\xd7\x0e\x47\x4f\x0d\
+\xe9\x01\x1e\x7b\xec\xb1\xf5\xf1\x78\xfc\xb7\xeb\xd6\xad\x0b\x00\
+\x40\x4f\x4f\x0f\xb6\x6f\xdf\x8e\xee\xee\x6e\x74\x77\x77\xbf\x6e\
+\x59\xd6\xeb\xc1\x60\xf0\xd3\x94\xd2\xa5\x86\x61\xa8\x9a\xa6\xf1\
+\xab\xae\xba\x8a\x2e\x5c\xb8\x90\x38\x8b\x29\xe9\xba\x8e\x74\x3a\
+\x8d\x7c\x3e\xef\x52\x48\xc3\x34\x61\x59\x0c\x44\x90\xa0\xf8\x02\
+\x08\x84\xc2\xf0\x07\x83\x50\x55\x1f\x44\x49\x82\x20\xd8\xfb\xf9\
+\x71\x6e\xb7\xeb\x4e\x77\xfe\xd8\x8a\x1e\x1c\x96\x69\xc2\x30\xed\
+\x00\xb4\x58\x2c\x20\x97\x49\xa3\x98\x4d\x81\xe9\x25\x88\xc4\x82\
+\x2c\x8a\x10\x45\x01\xce\x0e\x27\xce\x76\xf2\xce\x50\xb1\x44\x22\
+\x91\x7e\xe4\x91\x47\x7e\xf8\xd1\x47\x1f\xdd\xff\xc2\x0b\x2f\x0c\
+\xcc\x50\x45\xae\x34\x1c\x00\x26\x32\x7e\x57\x57\x17\xfa\xfb\xfb\
+\x5f\x59\xbc\x78\xf1\x65\x99\x4c\x26\x7f\xf0\xe0\xc1\xf9\x7b\xf6\
+\xec\x59\xda\xd9\xd9\x39\x6f\x64\x64\xa4\x29\x99\x4c\x36\x5f\x73\
+\xcd\x35\xeb\x2f\xbe\xf8\xe2\x73\x65\x59\x16\x9c\xb8\xa0\x58\x2c\
+\x62\x64\x64\xc4\xdd\x80\xc1\x89\x23\x2c\xc6\xec\xad\xe1\x89\x00\
+\x49\x96\x21\x2a\x2a\x14\x45\x83\x20\x2b\x90\x24\xbb\xbd\x26\x94\
+\x82\x81\x83\x59\x76\xb0\xa9\xeb\x65\x18\xe5\x32\xf4\x72\x01\x86\
+\x5e\x06\x37\x0c\x08\x84\x41\x14\xa8\xbd\x90\x15\xa5\x90\x24\x09\
+\xc1\x60\x10\x4d\x4d\x4d\x08\x06\x83\x6e\xd3\x64\x9a\xa6\xf1\xea\
+\xab\xaf\xbe\xfb\xd0\x43\x0f\xfd\xef\x4f\x7d\xea\x53\xbf\xbf\xe7\
+\x9e\x7b\xa6\xbd\x4d\x6c\x3d\x69\x28\x00\x1c\xca\xf8\x27\x9d\x74\
+\xd2\x65\x77\xdc\x71\x47\xa6\xf6\x77\x0f\x3c\xf0\x00\xb9\xe3\x8e\
+\x3b\xf8\xa6\x4d\x9b\x9a\x0a\x85\xc2\x0d\x9b\x36\x6d\xba\xed\xb4\
+\xd3\x4e\x3b\x89\x52\x4a\x9d\xb5\x06\x8a\xc5\x22\x92\xc9\x24\x92\
+\xc9\x24\x0a\x85\x02\x2c\xcb\x72\x3d\x03\x63\x0c\x96\x65\x55\xcd\
+\xd3\xe7\xb0\x87\xa7\xbb\x6e\x9f\xdb\x1b\x45\x13\x42\x20\x10\x02\
+\x41\x14\x40\x08\x05\xad\x18\x5d\xd3\x34\xc4\x62\x31\x34\x35\x35\
+\x21\x10\xb0\x07\x74\x56\x36\x85\xe4\xdd\xdd\xdd\x07\x9e\x78\xe2\
+\x89\x1f\x5b\x96\xf5\xaf\x0f\x3c\xf0\xc0\x61\xd7\x7a\xaf\x34\x0c\
+\x00\x0e\x65\xfc\x65\xcb\x96\x5d\xf6\x95\xaf\x7c\x25\x73\xa8\xfb\
+\xdc\x7b\xef\xbd\xe2\x3b\xef\xbc\xb3\xec\xd4\x53\x4f\xbd\xe1\xca\
+\x2b\xaf\xbc\xe6\xa4\x93\x4e\x5a\xac\xaa\xaa\xe8\x6c\xdc\x6c\x59\
+\x16\x72\xb9\x9c\xeb\x15\xb2\xd9\x2c\x4a\xa5\x12\x2c\xcb\x72\xb3\
+\x8b\x0e\xb5\x74\x58\x85\x20\xd8\x1b\x3f\x8b\xa2\x08\x4a\x29\x04\
+\x41\x80\xa2\x28\x08\x85\x42\x88\xc5\x62\x88\x44\x22\x08\x06\x83\
+\x90\x65\xd9\xfd\x8d\x65\x59\xd6\xbe\x7d\xfb\x06\x36\x6f\xde\xfc\
+\xd4\xb6\x6d\xdb\x1e\x3a\xff\xfc\xf3\x77\x7c\xfd\xeb\x5f\x9f\xd6\
+\xbe\xc0\x53\x91\x86\x00\xc0\xa1\x8c\x7f\xf2\xc9\x27\x5f\x76\xeb\
+\xad\xb7\x1e\xd2\xf8\x5e\xf9\xce\x77\xbe\x23\xfd\xe9\x4f\x7f\xfa\
+\xc4\x82\x05\x0b\xfe\xfa\xf2\xcb\x2f\xbf\xfc\x8c\x33\xce\x58\xee\
+\xf7\xfb\xfd\x4e\x5b\x2c\x08\x42\xc5\xad\xeb\x76\x10\x57\xe9\x86\
+\x75\x72\xf2\x85\x42\x01\xce\xbe\xc4\x84\x10\x04\x02\x01\xa8\xaa\
+\x0a\x45\x51\x10\x89\x44\xe0\xf3\xf9\xaa\xd8\x87\x43\x47\x33\x99\
+\x8c\xbe\x73\xe7\xce\xdd\xbf\xfd\xed\x6f\x9f\x1c\x1c\x1c\xfc\xf5\
+\x8a\x15\x2b\xde\xff\xdb\xbf\xfd\xdb\x29\xef\x05\x3c\x5d\x39\xe1\
+\x01\xe0\x44\xfb\xb3\x69\xfc\x5a\xf9\xfa\xd7\xbf\xbe\x60\xdf\xbe\
+\x7d\x7f\xb9\x61\xc3\x86\x0d\x67\x9f\x7d\xf6\xd9\xf3\xe7\xcf\x5f\
+\xe4\xf7\xfb\x65\x51\x14\x5d\xfd\x39\xc1\xa3\x67\x43\x67\x37\x70\
+\xa3\x94\x56\x8d\xf7\xe7\x6e\x53\x61\x87\x89\xf9\x7c\xbe\xb8\x7f\
+\xff\xfe\xfe\x37\xde\x78\xe3\xf5\xe7\x9e\x7b\x6e\xcb\x92\x25\x4b\
+\x5e\xee\xe8\xe8\x48\x7c\xed\x6b\x5f\x9b\x95\x76\x7e\x32\x39\xa1\
+\x01\xf0\x93\x9f\xfc\x64\x7d\x47\x47\xc7\x11\x35\xbe\x57\x7e\xf0\
+\x83\x1f\x68\x2f\xbf\xfc\xf2\xbc\x52\xa9\x74\xea\x99\x67\x9e\xb9\
+\x6e\xf5\xea\xd5\xab\x3a\x3b\x3b\x17\x34\x37\x37\x77\x68\x9a\x26\
+\x29\x8a\x22\x57\x16\xa9\xa2\x1e\x83\xf3\x4a\xed\x26\x86\x61\x58\
+\x96\x65\x59\xf9\x7c\xbe\x3c\x34\x34\x34\xb8\x77\xef\xde\xdd\xef\
+\xbc\xf3\xce\xb6\x37\xdf\x7c\xf3\x4f\x67\x9d\x75\xd6\xbb\xbd\xbd\
+\xbd\x7d\x8f\x3c\xf2\x48\xf9\x68\xea\xf0\x84\x05\xc0\x8f\x7f\xfc\
+\xe3\xf5\xf3\xe7\xcf\x3f\x6a\xc6\xaf\x95\x57\x5e\x79\x85\xfc\xfc\
+\xe7\x3f\x57\xdb\xdb\xdb\xdb\x7b\x7b\x7b\x9b\xda\xdb\xdb\x17\x27\
+\x93\xc9\xd6\x68\x34\xba\x28\x16\x8b\x49\x92\x24\xb5\x88\xa2\x58\
+\x04\x40\x13\x89\x44\xbe\x5c\x2e\x0f\x8d\x8c\x8c\x14\x77\xed\xda\
+\xb5\x6f\xe9\xd2\xa5\x7d\xd1\x68\xf4\x60\x36\x9b\x4d\x5f\x7d\xf5\
+\xd5\xb9\x75\xeb\xd6\x4d\x3b\x83\x37\x5b\x72\xc2\x00\xe0\x8e\xaf\
+\x7c\x25\xf0\xf8\xcf\x7f\xbe\xea\xf6\xdb\x6f\x7f\x63\xe9\xd2\xa5\
+\xeb\xe6\xcd\x9b\x77\xcc\x8c\x3f\x91\x6c\xdb\xb6\x8d\xac\x5e\xbd\
+\x9a\x3f\xfa\xe8\xa3\xe2\x4d\x37\xdd\x64\xde\x79\xe7\x9d\xf2\x8a\
+\x15\x2b\x4c\xce\x39\x3e\xf9\xc9\x4f\xf2\xb3\xce\x3a\xeb\x98\x19\
+\xfa\x84\x96\x1b\xbf\xf0\x37\xc1\x9b\x6f\xbe\xf9\xd1\xd1\xd1\xd1\
+\xfc\x95\x57\x5e\xf9\xe0\xb3\xcf\x3e\x9b\x29\x95\x4a\xbc\x54\x2a\
+\xf1\xee\xee\x6e\xfe\xd4\x53\x4f\xf1\xef\x7c\xe7\x3b\xfc\xab\x5f\
+\xfd\xea\x1f\x7f\xf0\x83\x1f\x84\x8e\xf5\xf3\x9e\x48\x72\xdc\xa7\
+\x82\xaf\xbe\xf2\xaf\x82\xbe\x60\xe8\x81\x87\x1f\x7e\xf8\xc6\x74\
+\x3a\x2d\x2d\x5e\xbc\x78\x75\x6f\x6f\xaf\xd2\xd9\xd9\x89\xbe\xbe\
+\xbe\xaa\x9a\xbf\x7c\xf9\xf2\xcb\x6e\xbf\xfd\xf6\xa3\x5e\xf3\x4f\
+\x64\x11\x0f\xff\x16\x33\x97\xb6\x90\x44\x9a\x55\xa6\x31\x4e\xc2\
+\x02\x25\x00\xa1\x06\xa5\x54\x54\x54\xb5\xe0\xf3\x07\x24\x31\xba\
+\xc0\x88\xb5\xc6\xef\x7f\xf0\xc1\x07\xbf\x38\x34\x34\x84\x0f\x3f\
+\xfc\x10\xef\xbd\xf7\x1e\xf9\xe8\xa3\x8f\x30\x34\x34\x84\x65\xcb\
+\x96\x61\xef\xde\xbd\xe8\xef\xef\x7f\xa5\xb3\xb3\xf3\xb2\xdb\x6e\
+\xbb\x6d\xce\xf8\xd3\x94\x63\x16\x03\x2c\x8e\x0a\x72\x8b\x6a\xfd\
+\xf5\x60\x9e\xdc\x6c\x72\xd2\xc1\xa9\x60\x48\x02\x95\x44\x41\x2c\
+\x08\x02\x25\xb2\x48\xf2\xba\xc9\xe5\x2d\x2f\xbe\xba\x26\x10\x6d\
+\x71\x8c\x8f\xae\xae\x2e\x28\x8a\x82\x15\x2b\x56\x60\xfb\xf6\xed\
+\xfc\xe0\xc1\x83\xaf\x6c\xd8\xb0\xe1\xf2\x2f\x7d\xe9\x4b\x73\xc6\
+\x9f\x81\x1c\x93\x26\x60\x51\x44\x90\x9b\x55\xeb\x6b\x1f\x24\xc8\
+\x77\x47\x75\xda\x59\xe2\x72\xcc\x84\xdc\x6a\x52\x35\x66\x0a\x6a\
+\xdc\x92\xfc\x71\x26\x07\x17\x08\xbe\x70\xc7\xeb\x5b\x9f\x45\x5b\
+\xbc\x03\xdd\xbb\x76\xbb\xc6\x5f\xbd\x7a\x35\xd6\xad\x5b\x87\x4b\
+\x2f\xbd\x14\xff\xf5\x5f\xff\xf5\x6f\xba\xae\x6f\x7d\xfd\xf5\xd7\
+\x8f\x58\xb2\xa4\x91\xe5\xa8\x03\xa0\x62\xfc\xbb\xde\x1f\x26\xf7\
+\x98\xa0\x3e\x59\x14\x2b\x83\x1c\xc4\xca\xce\x16\x12\x14\x59\x86\
+\xaa\x28\x50\x15\x05\x45\x9d\xe1\xc3\x6d\xaf\x42\xb7\x18\xfc\x81\
+\x10\x56\xad\x5a\x85\x73\xce\x39\x07\x8b\x17\x2f\x46\x5f\x5f\x1f\
+\x31\x4d\xf3\xf4\x3f\xfc\xe1\x0f\xff\xb1\x7b\xf7\xee\xdc\xb1\x56\
+\xe6\x89\x28\x47\x15\x00\x1e\xe3\xdf\x6d\x81\x6a\x62\xc5\xf8\xa2\
+\x68\x1b\xdf\xd9\xea\x45\x51\x14\x77\x9b\x13\x4d\x53\xc1\x45\x0d\
+\x56\x6e\x18\xe7\x5f\xf0\x17\xb8\x70\xfd\x45\x58\xb4\x70\x21\xf6\
+\xec\xd9\x83\xe7\x9e\x7b\x2e\xf9\xa3\x1f\x3d\x7a\xcb\x2b\xaf\xbc\
+\xfa\xf6\xb1\x56\xe4\x89\x2a\x47\x6d\x4c\xe0\x4c\x8c\x6f\x97\xcb\
+\xd0\x34\x0d\x4c\x8d\x61\xc7\x7f\xbf\x05\xbf\x04\xec\xdb\xb7\x1f\
+\xcf\x3f\xff\x7c\xf2\xdf\x7f\xf4\xe8\xcd\xef\xbc\xf3\xe7\xa7\x8e\
+\xb5\x12\x4f\x64\x39\x2a\x41\xe0\x4c\x8d\xef\x2d\x93\x24\x09\x84\
+\x0a\x58\xd2\x16\x42\xeb\xbc\x25\x89\xff\x78\xfc\xe7\xb7\x7c\xf0\
+\xc1\x07\x4f\x1d\x6b\x05\x9e\xe8\x72\xc4\x01\x30\x5b\xc6\x97\x65\
+\x19\xa2\x28\xc2\xe2\x1c\xbb\xdf\x7a\xe1\xd1\xb7\x76\x0e\xdc\x7c\
+\xac\x95\xd7\x08\x72\x44\x9b\x80\xd9\x36\xbe\x28\x8a\x50\x64\x19\
+\x21\x4d\x10\x6f\xfe\xc2\xe7\x1b\x7e\x48\xfb\xd1\x90\x23\xa6\xc4\
+\x23\x61\x7c\xa1\xb2\xff\x1f\x27\x54\xcd\xe5\xb2\x87\xfd\x8c\x73\
+\x72\x84\x00\x70\xa4\x8c\x0f\xd8\x33\x7a\x00\x22\x9b\x86\x71\xc2\
+\x74\x64\x1d\xcf\x32\xeb\x00\x38\xd2\xc6\x37\x4d\x13\x1c\x90\xcb\
+\x99\xc4\x1c\x00\x66\x41\x66\x15\x00\x47\xc3\xf8\x86\x69\x82\x71\
+\x88\x73\x00\x98\x1d\x99\x35\x00\x1c\x0d\xe3\x3b\x63\xf0\x98\x65\
+\x19\x82\x1a\x64\x87\xf9\xc8\x73\x82\x59\x02\xc0\xd1\x34\x7e\xb1\
+\x50\x80\x55\x4c\xff\x59\x50\x03\x73\x00\x98\x05\x39\x6c\x37\x7a\
+\x54\x8d\x5f\x2c\x22\xd3\xb7\x73\xbb\x58\x18\xfa\xab\xad\x3b\x33\
+\x7b\x8e\xb5\xf2\x1a\x41\x0e\xcb\x03\x1c\x6d\xe3\x67\xfb\x77\x77\
+\x89\x85\xe1\x1b\xe7\x8c\x3f\x7b\x32\xe3\x01\x21\x8b\x23\x82\x1c\
+\x3b\xca\xc6\x17\x72\x83\x37\x6c\xdd\x95\x7e\xeb\x58\x2b\xad\x91\
+\x64\x46\x00\x58\x1c\x15\xe4\x98\x62\xdd\xf5\xc1\xd1\x37\xfe\x9b\
+\xc7\x5a\x61\x8d\x26\xd3\x06\x80\x63\x7c\xa7\xe6\x3b\x73\xd7\xe7\
+\x8c\x7f\x62\xca\xb4\x00\x50\x5b\xf3\x35\x4d\x73\x57\xaa\x98\x33\
+\xfe\x89\x29\x53\x06\x80\xb7\xe6\x73\x2a\x6a\x42\x65\xce\x5b\x30\
+\x18\x84\xae\xeb\xee\xe2\x0a\xb5\x86\x9f\x33\xfe\xf1\x2d\x53\x62\
+\x01\xb5\x6e\x5f\x92\x24\x77\xd1\x02\xce\x39\x5a\x5a\x5a\xdc\xd5\
+\x2b\xe6\x8c\x7f\x62\xc9\x21\x3d\x80\xd7\xf8\x8c\x08\x9a\x50\x99\
+\x04\xe9\xf3\xf9\x20\x08\x82\xbb\x4b\x67\x47\x47\x87\xbb\x3b\x87\
+\xaa\xaa\x76\xd7\xed\x9c\xf1\x8f\x7b\x99\x74\x4c\x60\x6d\x9b\x2f\
+\xcb\x32\x02\x81\x80\x3b\x95\x39\x12\x89\x20\x10\x08\xa0\x58\x2c\
+\x42\x51\x14\x74\x74\x74\x54\xb6\x64\xb1\xa7\x43\xcf\x19\xff\xf8\
+\x97\x09\x01\x50\x5b\xf3\x65\x59\xb6\x77\xe4\x56\x14\x34\x35\x35\
+\xd9\x2b\x62\x30\x86\x68\x34\x8a\x40\x20\x80\x7c\x3e\x0f\x49\x92\
+\xaa\x40\xe0\xf7\xfb\xe7\x8c\x7f\x9c\x4b\x5d\x00\xd4\xa3\x7a\x3e\
+\x9f\x0f\x9a\xa6\xc1\x34\x4d\x48\x92\x84\xd6\xd6\x56\x7b\xad\x1c\
+\xcb\x72\xd7\xb3\xc9\xe7\xf3\x50\x14\x05\xf1\x78\xbc\xb2\x5f\x2f\
+\x81\xa6\x69\x73\xc6\x3f\x8e\x65\x1c\x00\x16\x47\xc5\x71\x54\x8f\
+\x10\x02\x4a\x29\x82\xc1\x20\x34\x4d\x83\xae\xeb\x50\x14\x05\xad\
+\xad\xad\xd0\x75\x1d\x9c\x73\x77\x6d\x9b\x7c\x3e\x0f\x55\x55\x11\
+\x8f\xc7\x51\x2c\x16\x41\x08\x81\xaa\xda\x7b\xd8\xce\x19\xff\xf8\
+\x93\x2a\x00\x2c\x89\x0a\x62\xa5\xe6\xdf\xc3\x88\xe0\x26\x79\x82\
+\xc1\xa0\xbb\xea\x45\x34\x1a\x85\xa6\x69\x28\x97\xcb\xd0\x34\x0d\
+\xf1\x78\xdc\x5d\x8a\x3d\x16\x8b\xc1\xef\xf7\x23\x9b\xcd\x42\x55\
+\x55\xb4\xb6\xb6\xba\x0b\x2a\x51\x4a\xe7\x8c\x7f\x1c\x4a\x15\x00\
+\x3e\xd1\xc4\x2f\x7d\x6f\x98\x7c\xdf\x02\xf5\xa9\xaa\x0a\x49\x92\
+\x00\x00\x8a\xa2\x20\x1a\x8d\xba\x7c\x3f\x16\x8b\x41\xd3\x34\x14\
+\x0a\x05\xf8\x7c\x3e\xb7\xb6\x33\xc6\xd0\xdc\xdc\x0c\x4d\xd3\x90\
+\x4a\xa5\xdc\x95\xaf\x92\xc9\x24\x4a\xa5\x12\x28\xa5\x73\xc6\x3f\
+\xce\xc4\x05\xc0\x82\x88\x48\x09\x67\x5f\x19\x2a\x0a\xeb\x9c\xa0\
+\xcd\x89\xe4\x4d\xd3\x84\xa6\x69\x68\x6d\x6d\xb5\xf7\xe3\x25\x04\
+\x2d\x2d\x2d\xf0\xf9\x7c\xc8\xe5\x72\xf0\xfb\xfd\x88\xc7\xe3\x28\
+\x14\x0a\x30\x4d\xd3\x05\xc1\xd0\xd0\x90\xeb\x35\x46\x47\x47\x2b\
+\x1b\x19\x97\x90\x1b\xdc\xdb\x25\xce\x19\xff\xb8\x10\x17\x00\x99\
+\x12\xe3\x0b\x42\x58\x92\x31\xa5\xcf\x50\x51\x16\x9c\x25\xcd\xa2\
+\xd1\x28\x14\x45\x41\xa9\x54\x72\x6b\x7b\xa1\x50\x00\xe7\x1c\xad\
+\xad\xad\xd0\x34\x0d\x99\x4c\xc6\x3d\x97\xcb\xe5\xa0\xeb\x3a\xc2\
+\xe1\x30\x44\x51\xc4\xc0\xc0\x80\xbb\x57\x4f\xb1\x58\x44\x6e\x60\
+\xcf\x9c\xf1\x8f\x23\xa9\x6a\x02\x02\xaa\xbc\xbd\x45\xb3\xda\x0a\
+\x50\xcf\x14\x65\x85\xc8\x95\xec\x5e\x2c\x16\x83\xa2\x28\x28\x16\
+\x8b\x55\x2e\xdf\xb2\x2c\xd7\x13\x64\x32\x19\xb7\xdd\x77\x96\x58\
+\x75\x92\x45\x23\x23\x23\xc8\xe5\x72\xc8\x0d\xec\xe9\x12\xf2\x43\
+\x73\xc6\x3f\x8e\xa4\x0a\x00\xc9\x82\x65\xc4\x83\xd2\x1f\x22\x92\
+\xd9\xac\x8b\xfe\x33\x65\x59\x21\xb2\x6c\xef\xa8\x15\x8b\xc5\xa0\
+\xaa\x6a\x55\xbb\x9f\xcf\xe7\xc1\x18\x73\x01\x92\x4a\xa5\x20\x49\
+\x12\xc2\xe1\x30\x46\x46\x46\x90\xcf\xe7\x2b\xcb\xa7\x11\xa4\xfb\
+\x76\xcd\xb5\xf9\xc7\xa1\x8c\xa3\x81\x83\x39\xab\x1c\x8b\x04\xff\
+\x18\x25\xb9\x28\x53\xc2\x67\xca\xaa\x46\x15\x0f\x08\x14\x45\x71\
+\x6b\x77\x5b\x5b\x1b\x72\xb9\x9c\x4b\x03\x45\x51\xc4\xf0\xf0\x30\
+\x28\xa5\x08\x85\x42\x48\xa5\x52\xc8\x64\xb2\x48\xf5\x76\x77\x89\
+\xf9\x39\xe3\x1f\x8f\x52\x37\x11\x34\x9c\x29\x95\xdb\x9a\x9b\xfe\
+\xe8\x37\xd3\x31\xe2\x6f\x5a\xa9\x6a\x3e\x41\xf2\x34\x07\xb2\x2c\
+\x23\x9f\xcf\xc3\xef\xf7\xa3\xa5\xa5\x05\xe9\x74\x1a\x96\x65\xb9\
+\x69\xe2\xe1\xe1\x61\x58\x96\x65\xef\x73\x3f\xb8\x67\xae\xe6\x1f\
+\xc7\x32\x61\x2a\x78\x60\x34\x5f\x5e\xd0\xd1\xfa\x8a\x58\x48\xb4\
+\x8a\xc1\xe6\xd3\x55\xcd\x2f\x48\x92\xdd\x77\x14\x8b\xc5\x20\x8a\
+\x22\x32\x99\x0c\xfc\x7e\x3f\x9a\x9a\x9a\x30\x34\x34\x84\x62\xb1\
+\xe8\xe6\x0c\x52\xa9\x14\x52\xbd\x3b\xbb\x48\x76\xe0\x86\x3f\xec\
+\xce\xcc\x19\xff\x38\x95\x49\x3b\x83\x0e\x26\x32\xa5\x93\x16\xce\
+\xdb\xca\xd3\x7d\x6d\x4a\x53\x7c\xa5\xaa\xfa\xa8\x2c\x4b\x6e\xbb\
+\xef\x04\x78\xa2\x28\x22\x1c\x0e\x63\x78\x78\x18\xd9\x6c\x16\x85\
+\x62\x11\xe5\x91\x9e\x2e\x36\xda\x7b\xc3\xab\x7b\x73\x73\xc6\x3f\
+\x8e\xe5\x90\x2b\x84\xec\x1f\x1c\x2d\x77\x2e\x59\xb4\x55\x1f\xde\
+\xd3\xea\x6b\x59\x70\xa6\xa2\xa8\x44\x14\x45\x58\x96\x85\x70\x38\
+\x0c\xc6\x98\xcb\xf7\x35\x4d\x43\x3e\x5f\x40\x76\x60\x77\x97\x31\
+\x72\xe0\x86\xd7\xf7\x17\xe6\x8c\x7f\x9c\xcb\x94\x96\x88\xd9\xd3\
+\x97\x28\x9f\xb2\x7c\xf9\xd6\x5c\xdf\x8e\xa6\x40\xeb\xa2\x33\x65\
+\x55\xa5\xe0\xdc\xa5\x85\x8c\x31\x8c\x8c\x8c\x20\x9b\xcb\x21\x3f\
+\xb4\xb7\xcb\x18\x39\xf0\xc5\xa4\xd8\xfc\x56\xc0\xa7\x12\x55\x16\
+\x89\x24\x50\x42\x01\xc2\x39\x77\x36\xec\x9e\xe9\xbf\x39\x99\x65\
+\x99\x96\x52\x2f\xbf\x60\x75\xb8\x34\x3a\x70\x5f\xfb\xca\x0b\x6f\
+\x11\x64\x55\x34\x0d\xc3\xcd\xf3\xe7\x72\x39\x24\xf6\xef\xd8\x39\
+\xbc\x7f\xe7\x97\x12\x3c\xf4\x27\xd3\x34\x61\x5a\x76\x6f\xa1\x65\
+\xd9\x9b\x2a\xb0\xa9\x2d\x94\xca\xa7\x58\x36\xd9\x79\x3e\x0b\xd7\
+\x1e\xce\x3d\x67\x72\xfd\x74\xce\xcf\x9a\x4c\xbb\x56\x5d\x7e\xe1\
+\xaa\x70\x31\x39\xf8\xdd\xe6\x53\xce\xb9\x91\x08\x8a\x54\xd6\xcb\
+\xf6\xae\xd5\xbd\xbb\x0e\xee\xdf\xb3\xeb\xbe\xfe\x1c\xff\xf0\x10\
+\x2f\x35\xd9\xe7\x64\xc7\xf5\xbe\x4f\x54\x36\x93\x6b\x66\xf2\x0f\
+\xd3\x3c\x37\xd1\xfb\x4c\xa6\x07\xd4\x39\x9e\x35\x99\x91\x5b\xbd\
+\xf8\xbc\x33\x22\x7a\x7a\xe8\x3e\xa5\xbd\xf3\x7a\x93\x53\x35\x33\
+\xb8\x7f\x60\xcf\x9e\x7d\x3f\x4b\x14\xf9\xde\x43\xfc\x74\xba\xc6\
+\x60\x93\x7c\xaf\x3d\x66\x35\xe5\x93\x7d\xb2\x43\xfc\x6e\xb2\xf3\
+\xde\xf2\x89\xfe\xc6\x44\x65\x93\xbd\xdb\x54\x80\x76\x7c\x00\x00\
+\x00\x2e\x58\xb9\x3c\x58\x4c\xec\xbf\x3c\x6b\x90\x93\x06\xd2\xe5\
+\xc1\x74\x19\xb9\x43\xdc\xaf\x16\xcd\x87\x5b\x43\xd9\x0c\xbf\x4f\
+\xc5\x48\x93\x5d\x3b\xd5\xeb\x27\x7a\x16\x78\xca\x0e\xf5\xde\xc0\
+\xf1\x0a\x00\x00\x58\xba\x20\x2e\x0e\x26\x92\xc1\x5c\x51\xf7\x03\
+\x90\xa6\xf1\xd3\xc9\x5c\xdb\xa1\xdc\xdf\xa1\x9a\x12\xe7\x78\xba\
+\xd7\x4d\xf5\x77\x53\xbd\xcf\xa1\xde\x65\x2a\xef\x5d\xef\xfb\xac\
+\xca\x61\x47\xd6\xf3\x5b\x42\xc4\x34\x19\x35\x2c\x0e\xc3\xb4\x88\
+\x5e\xd9\x17\xcf\x9a\x62\xc4\x77\x08\x99\xc9\x4d\x8e\x94\xc2\x0e\
+\xe7\xbe\x73\xfb\x04\xcc\xc9\xf1\x29\xff\x1f\xd6\x35\xd1\x5d\x6f\
+\xfa\x17\x67\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\
+\x63\x72\x65\x61\x74\x65\x00\x32\x30\x31\x30\x2d\x30\x32\x2d\x31\
+\x31\x54\x30\x31\x3a\x30\x35\x3a\x35\x36\x2d\x30\x36\x3a\x30\x30\
+\xc4\xbe\x96\xb2\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\
+\x3a\x6d\x6f\x64\x69\x66\x79\x00\x32\x30\x30\x38\x2d\x30\x33\x2d\
+\x32\x31\x54\x31\x39\x3a\x31\x37\x3a\x34\x32\x2d\x30\x35\x3a\x30\
+\x30\x3b\x8c\x8f\x83\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
+\x82\
+\x00\x00\x06\xc4\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xd9\x04\xdc\xb2\xda\x02\
+\x00\x00\x06\x7b\x49\x44\x41\x54\x58\xc3\xad\x57\x69\x4c\x54\x57\
+\x14\x76\x21\x62\x95\x04\x97\xa8\x25\x18\x52\x1b\x0d\x11\x45\x04\
+\xaa\xa4\x49\xb5\x56\x4d\x6c\x69\xb0\x68\xa3\xb6\xc5\xb2\x46\xfd\
+\xa3\x2c\x61\x51\x48\x24\x08\x64\xc2\x12\xd0\x22\x42\x11\x59\x44\
+\x40\x40\xf6\x91\x7d\x53\x36\x09\xb2\xa9\x08\x0e\x24\x0c\x62\x01\
+\x83\x02\x82\x0b\x08\xa9\x5f\xcf\xb9\x99\x31\xa3\x80\x9d\xb4\xf3\
+\x92\x2f\xf3\xde\xbc\x7b\xce\xf7\xdd\x73\xce\x3d\xf7\xbe\x79\xf3\
+\x54\x2e\x3b\xbb\xe8\x2f\x1c\x1d\x23\x1d\x1d\x1d\x23\x02\x1d\x1c\
+\x2e\x48\xd2\xd3\xab\x25\x97\x2e\x15\x56\x47\x46\xde\xac\x4d\x4c\
+\xac\xa8\xad\xaa\x6a\xbf\x2f\x95\x36\x41\x89\x2b\x57\x4a\xdb\x8d\
+\x8d\xf7\x7c\x49\xa6\xf3\xe7\x69\xe8\x5a\x68\x6f\xff\x47\xa1\xfc\
+\xf1\x73\x4c\xff\x0d\xb5\x10\x10\x98\x3c\x48\x76\xc6\x1a\x13\xc1\
+\x33\xf2\xf4\x4a\x7a\x3d\x36\x09\xa8\x03\xf9\xc0\x38\x2c\x2c\x7e\
+\xce\x21\xd3\xb5\x9a\x8a\xc2\xfc\xc3\x87\xfd\xa3\x8a\xab\x64\x18\
+\x7a\x0d\xb5\xe0\xe3\x1b\x3f\x4a\x76\x3f\x11\x3e\xd3\x88\x82\xed\
+\xdb\x0f\xac\x3d\xeb\x97\x89\xde\x17\x50\x0b\xf9\xe5\x32\x18\x18\
+\x18\xc7\x91\xe9\xe7\x1a\x8b\x82\xad\x6d\x58\x79\x63\xf7\x38\x64\
+\xcf\xf1\xaf\xe0\x71\x16\x16\x07\x5b\xc8\xee\x2b\x82\x96\x46\x14\
+\xd8\xd8\x04\xfb\xa4\x15\xc9\xd0\x3a\x08\xb5\x60\xe7\x18\xf4\x9c\
+\xcc\x7e\x21\x2c\xd1\x88\x00\x4b\x4b\xaf\x8d\xa1\x97\xaa\xd0\xf0\
+\x17\xd4\x42\x08\x8d\x25\x33\x7f\xc2\x0a\x8d\x2d\x49\x17\xf7\xa4\
+\xfe\x4a\x39\xa0\x0e\x22\x92\x9a\xa0\xa7\x67\x28\xd5\xe4\x6a\x98\
+\x47\xcd\xa8\x28\xbf\xfd\x2d\x8a\xba\x31\x27\x0a\xba\x80\xdc\x4e\
+\x20\xb6\x74\x00\x86\x86\x3b\xea\xc9\xcc\x54\x63\x75\x60\x67\x17\
+\x1e\xc4\x8e\xb3\x3a\x80\x8c\x36\x20\xad\x09\x48\x69\x00\x92\xea\
+\x80\x84\x6a\x20\xa6\x1c\xc8\x6c\x04\x4a\x1e\x00\xf5\xed\xe3\x68\
+\x6a\xea\x80\xaf\xaf\xef\x2b\x32\x35\xf8\xdf\xe4\x12\x89\x44\x2e\
+\x95\x96\x20\xab\x70\x00\xa9\x52\x08\x94\x10\x31\x71\x50\xf3\x01\
+\x7a\x9e\x8c\x61\x68\x68\x08\xbd\xbd\xbd\x78\xf8\xf0\x21\x1e\x3c\
+\x78\x20\x7e\x13\x13\x13\xb1\x7b\xf7\xee\xda\x43\x87\x0e\x05\x58\
+\x5a\x5a\x6e\xe4\x54\xfe\x27\x01\xa1\xa1\xa1\x7d\x13\x13\x13\x98\
+\x9c\x9c\xc4\xd4\xd4\x14\xba\xba\xba\x70\xe7\xce\x1d\xdc\xbe\x7d\
+\x1b\xf9\xf9\xf9\x28\x29\x29\x41\x55\x55\x15\xea\xeb\xeb\xd1\xdc\
+\xdc\x2c\x04\x30\x92\x92\x92\x70\xe3\xc6\x0d\xe4\xe5\xe5\x89\xfb\
+\x13\x27\x4e\xdc\xdd\xb1\x63\x87\x99\xda\x42\xec\xec\xec\x96\xd9\
+\xda\xda\x7e\x17\x12\x12\xd2\xce\x33\x54\xa2\xb0\xb0\x50\x38\x56\
+\x25\xcf\xca\xca\x42\x42\x42\x02\xc2\xc3\xc3\x11\x17\x17\x87\xab\
+\x57\xaf\x0a\x81\x7d\x7d\x7d\xe8\xe9\xe9\x11\x36\x75\x75\x75\x38\
+\x7d\xfa\xf4\x84\xb9\xb9\xf9\x6f\xe4\x5e\xfb\x93\xe4\x47\x8f\x1e\
+\xb5\xa7\xc1\x2f\xa2\xa2\xa2\x10\x1d\x1d\x8d\x8c\x8c\x0c\xc4\xc6\
+\xc6\x22\x37\x37\x17\x39\x39\x39\x88\x8c\x8c\x04\x09\x03\xbf\xbf\
+\x76\xed\x1a\x2a\x2a\x2a\x44\xd8\x47\x46\x46\x30\x3c\x3c\x8c\x67\
+\xcf\x9e\x09\xb1\x4f\x9f\x3e\xc5\xe0\xe0\x20\x06\x06\x06\x50\x50\
+\x50\x80\x86\x86\x06\x78\x78\x78\x4c\x6e\xda\xb4\xc9\x69\xce\x76\
+\x6d\x63\x63\xb3\x2b\x2c\x2c\x4c\x84\xba\xa3\xa3\x03\xf7\xee\xdd\
+\x13\xbf\x72\xb9\x5c\x08\xb8\x7c\xf9\xb2\xf8\xef\xd5\xab\x57\x18\
+\x1f\x1f\xc7\xd8\xd8\x18\x46\x47\x47\x3f\x49\xde\xdd\xdd\x8d\xca\
+\xca\x4a\x11\xb9\xb6\xb6\x36\x1c\x38\x70\x60\x88\xa8\xbe\x99\x75\
+\x95\x1c\x39\x72\x24\x4f\x26\x93\x89\xd0\xa9\x8a\x60\x43\x26\xe2\
+\xfc\x96\x95\x95\x7d\x92\x9c\xc5\x36\x36\x36\x8a\xd0\x73\x0d\x30\
+\x79\x6b\x6b\xab\x28\x54\xf6\x1b\x14\x14\x04\x13\x13\x93\xbc\x59\
+\x7b\x05\x55\x6d\x0d\xab\x56\xe6\x4f\x55\x04\x3b\x61\x42\xbe\xe7\
+\x9c\x2a\xc9\x79\xb6\xf7\xef\xdf\x17\xa9\xe0\xda\x60\x81\x2d\x2d\
+\x2d\x82\xf0\xc9\x93\x27\x78\xfc\xf8\x31\x1e\x3d\x7a\x24\x8a\xb4\
+\xa6\xa6\x06\xc1\xc1\xc1\xa0\x5a\xe8\x20\xba\xef\x67\xa4\x82\xc2\
+\x53\xdb\xd9\xd9\x89\xb9\x44\xb4\xb7\xb7\x8b\x99\x73\xf1\x71\x11\
+\x4a\xa5\x52\x14\x17\x17\x8b\x77\x4c\xa6\x0c\x3b\x93\xb2\x60\x26\
+\xe4\x48\x30\x6e\xde\xbc\x29\x0a\xd4\xdd\xdd\x1d\x5b\xb7\x6e\x95\
+\x11\xdd\xef\x04\x9d\x0f\x04\xec\xdf\xbf\xbf\x96\x0a\x50\x38\x9d\
+\x4b\x04\x3f\xf3\xcc\xf9\x9d\x6a\xce\x95\x4b\x94\x0b\x8e\x57\x06\
+\xd7\x4c\x76\x76\xb6\x28\x64\x3f\x3f\x3f\x38\x39\x39\xe1\xd8\xb1\
+\x63\xf0\xf6\xf6\xe6\x14\xb0\x00\xfb\x19\x02\xa8\x69\x14\x14\x15\
+\x15\x21\x26\x26\x06\xce\xce\xce\x48\x49\x49\x11\x8e\x55\x45\x70\
+\x1d\x30\x31\xcf\x92\x43\xcd\x62\xd3\xd2\xd2\x70\xfd\xfa\x75\xb1\
+\x62\x92\x93\x93\x71\xfe\xfc\x79\xae\x78\xb8\xba\xba\x82\x7a\x09\
+\x32\x33\x33\xe1\x1b\xef\x0c\xef\xaa\xc3\x42\x84\xb1\xb1\xf1\xec\
+\x02\xf6\xed\xdb\x17\x74\xf7\xee\x5d\x51\x64\xfd\xfd\xfd\x48\x4f\
+\x4f\x87\x97\x97\x97\x58\x7a\x4c\xa6\x14\xc1\xa1\x8f\x8f\x8f\x17\
+\x4d\x86\x09\x79\x75\x04\x04\x04\x88\xf0\x32\x31\x17\x1a\x0b\xe2\
+\x34\x95\x97\x97\x8b\x94\xf9\x25\xba\xc2\x2b\xe7\x57\xee\x07\xd8\
+\xbc\x79\xf3\xec\x02\xf6\xee\xdd\x2b\x61\xa2\x37\x6f\xde\x08\x11\
+\x1c\x6a\x9e\x29\x3b\x63\x21\x11\x11\x11\x22\xaf\x1c\x62\x9e\xe5\
+\xb9\x73\xe7\x44\xa4\x98\x98\x9f\x79\x1c\x8b\xe3\x9c\xab\x92\xb3\
+\x0d\xe7\x9f\x7b\x01\x17\xa1\x91\x91\xd1\xec\x02\xa8\x7f\x4b\x78\
+\xc9\x4d\x4f\x4f\x7f\x20\x82\xf3\xcc\x35\xc1\x85\xe4\xe9\xe9\x89\
+\xe3\xc7\x8f\xc3\xc7\xc7\x47\x84\x97\xa3\xa0\xcc\xb9\x2a\x39\xa7\
+\x92\xdf\x5d\xb8\x70\x01\x54\x5b\x5c\xf9\xe2\xff\x33\x67\xce\xd0\
+\x8e\x69\x38\xbb\x80\x9d\x3b\x77\x4a\x58\xe9\xbb\x77\xef\xe6\x14\
+\xc1\xc5\xc7\x4d\x45\x99\xf3\x8f\xc9\xb9\x7e\x02\x03\x03\x85\x50\
+\xda\x15\xdf\xb7\x68\x1e\xcf\x4d\xce\xcd\xcd\x0d\xa6\xa6\xa6\x7d\
+\x44\xe7\x34\x43\xc0\x86\x0d\x1b\xf4\x69\x89\x64\x50\x3f\x78\xcb\
+\x61\x9b\x4b\x04\x13\xa9\x92\x73\x24\x4e\x9d\x3a\x05\x6a\x64\xa0\
+\x7d\x04\x2e\x2e\x2e\x1f\x90\x73\x0b\xe7\x0d\x8b\x6d\x79\x53\xa3\
+\x31\xc3\x44\xe7\x46\xd0\x9d\x71\x10\xe5\x7d\x5c\x57\x57\xd7\x63\
+\xcb\x96\x2d\x72\x76\xca\x45\xf7\xb1\x88\xd2\xd2\xd2\xf7\xe4\x1c\
+\x0d\xda\xe9\x60\x6d\x6d\x3d\x2b\x39\x37\x2d\xb6\xe1\xab\xa9\xa9\
+\x09\x27\x4f\x9e\x1c\x25\xff\x7c\x68\xf1\x98\xeb\xe8\x36\x5f\xa1\
+\xcc\x7c\xcd\x9a\x35\xd1\x66\x66\x66\x23\xfe\xfe\xfe\xc2\x89\x52\
+\x04\x77\x3d\x65\xd8\xb3\xb3\xcb\x20\x91\x64\x51\x04\x7c\xde\x93\
+\xf3\xe6\xc5\xdd\xf1\xe5\xcb\x97\xc2\x26\x35\x35\x15\x94\xde\xc1\
+\xa5\x4b\x97\xd6\x92\xdf\x54\xc2\x59\xc5\x7e\xb0\xe8\x93\xe7\x41\
+\xc2\x6a\xc2\x9e\x75\xeb\xd6\x95\xec\xda\xb5\x6b\x8a\x77\x40\x76\
+\x78\xeb\xd6\x2d\xb1\x13\xf2\x0a\xb0\xb2\xb2\xa6\xa2\xf4\xc3\xc5\
+\x8b\xd5\xb4\x4a\x8a\xa9\x5b\x76\x89\xd9\x72\xb8\x49\xcc\x34\x45\
+\xb2\x6f\xf1\xe2\xc5\x95\xe4\xe7\x2a\xc1\x95\xf0\xb5\xc2\xef\x22\
+\x75\xcf\x25\x3c\xd0\x40\x5b\x5b\xdb\x71\xfd\xfa\xf5\x6d\x56\x56\
+\x56\xa0\x2d\x1b\xdb\xb6\x6d\x03\x3d\x0f\xae\x5a\xb5\xaa\x59\x47\
+\x47\xa7\xd2\xc4\xc4\x7c\x88\x85\xa4\xa6\xe6\xc2\xc1\xc1\x61\x42\
+\x4f\x4f\x4f\xa6\xa5\xa5\x55\x40\xb6\x7f\x12\x4e\x28\xce\x89\x2b\
+\xfe\xcf\x59\x91\x2b\xd6\x68\xf9\xf2\xe5\x81\xfa\xfa\xfa\x8d\x0b\
+\x16\x2c\x28\xa2\xe7\x44\x82\x3b\xe1\x07\x8e\xd4\xca\x95\x2b\xe3\
+\x56\xaf\x5e\xdd\x40\xf7\x59\x84\x70\xc5\x37\x82\xa1\x22\xa5\x0b\
+\x35\xf2\xb5\xa4\x98\x05\x87\xf1\x20\x0b\x22\x2c\x53\x9c\x72\xb4\
+\x14\x9f\x65\xdf\x12\x7e\x54\x1c\x4a\x97\xa8\xf3\xc5\xfc\x0f\xd1\
+\xc2\x47\xb4\x63\xf2\xc9\xfc\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
+\x42\x60\x82\
+\x00\x00\x06\xe8\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xd6\xd8\xd4\x4f\x58\x32\
+\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
+\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
+\x79\x71\xc9\x65\x3c\x00\x00\x06\x7a\x49\x44\x41\x54\x58\xc3\xed\
+\x57\x09\x4c\x54\x57\x14\x1d\x6a\xed\xa6\x4d\x69\x69\xb5\x2e\x15\
+\xf7\x1d\xb1\x20\x8a\x0a\x28\x2a\xb2\xa9\x88\xc0\x20\x28\x22\xae\
+\xe0\x30\x08\x6e\x6c\x23\x42\x01\xc5\x71\x41\x76\x71\xa1\x0a\x28\
+\xe2\x5a\xc0\x0a\x5a\x91\x60\xc0\x15\xad\x88\x68\xcd\x18\xd4\xaa\
+\xd4\x5a\xb1\x2e\xe8\x8c\x0a\x9e\x9e\x0f\x3f\x8d\x52\x29\x9a\x9a\
+\x36\x69\x9c\xe4\x64\x32\x33\xff\xdd\x73\xef\x39\xf7\xde\xff\x47\
+\x02\x40\xf2\x5f\x42\xf2\x36\x81\xff\x65\x02\x66\x52\x85\x91\x99\
+\x34\x58\x66\xea\x14\x14\x6f\xea\x18\x98\x66\xea\x18\x90\x3e\xd4\
+\x7e\xc1\xaa\x81\xb6\xde\x93\x25\x12\xc9\xc7\x44\x33\xc9\x9b\x7e\
+\x0d\x9b\x18\xd2\x97\xc4\x11\xc3\x9c\x17\x17\x7b\x2c\xdc\x7c\x39\
+\x60\xf9\xe1\xdb\xa1\xd1\x17\xab\x15\x2b\xae\xa8\x15\xcb\xaf\xa8\
+\x03\xa3\xce\x3c\x90\x29\x76\xdf\x1a\x6c\xe7\x97\x6f\x60\x31\x5d\
+\xc6\x23\x9f\x10\xef\xbe\x01\xe2\xc5\x96\x24\x4d\x99\x34\x37\x59\
+\x15\x91\x50\x76\x37\x3c\x41\x53\x2b\x0f\x07\x26\x2d\x00\xc6\x7a\
+\x02\xa3\xa7\x02\x23\xdd\x00\x6b\x77\xc0\x7d\x1e\x10\x16\x5d\xf9\
+\xc4\xc2\x75\xc9\xb5\xd6\xba\x7a\x52\x1e\xd7\xf9\xc7\xc4\xd3\x17\
+\xa5\x56\x28\x93\xaf\x3e\x0c\x8c\x06\xdc\x02\x49\x24\x03\x4c\xa6\
+\x01\x86\x93\x01\x3d\x29\xd0\xdb\x1e\xe8\x66\x4b\x8c\x06\xfa\xd9\
+\x00\xd2\x39\xc0\x82\xf0\x22\x75\xaf\xc1\x13\x72\x18\xc6\xe0\xf5\
+\x89\x9d\x17\xeb\x12\x8a\x49\xbe\xc9\xaa\x95\x1b\x49\xbc\x06\x70\
+\x0d\x02\x2c\xe4\xc0\x50\x56\x6c\x4c\x0c\x64\x12\x83\xbc\x09\x92\
+\xe9\x7b\x00\x3d\x5d\x80\x4e\x63\x00\x5d\x0b\x60\x88\x13\x10\x10\
+\xa5\x7e\x36\xd0\x56\x56\xc9\x70\x4e\xaf\x45\x3e\x7c\x62\x88\xdc\
+\xc6\x23\xaa\x2c\x3c\xbe\xa4\x2a\x3c\x19\x98\xba\x84\x15\xfb\x01\
+\x66\x73\x89\xf9\x94\x5b\x01\xd8\x47\x01\x93\xa9\xc6\xd4\x38\x26\
+\xc6\xf7\x71\xdf\x50\x11\x5f\xa0\xef\x14\xa0\xab\x1d\x60\xe4\x0c\
+\xcc\xa5\x45\xe6\x4e\x01\x77\x19\xd2\xf7\xb5\xaa\x96\x2d\xd9\x71\
+\x35\x26\x5d\x53\xeb\x4d\x92\xf1\x01\xf4\x96\xa4\x23\xfc\x01\x9b\
+\x08\x92\x92\x70\x7e\x3a\xb0\x7c\x2f\xb0\xbe\x10\xd8\x54\x04\x24\
+\xfc\x00\xf8\x6f\xa5\xec\x2b\xa8\x0e\x13\xed\xc3\x5e\x18\xcc\x5e\
+\xf0\x5d\xc6\xe4\xbc\xe3\xab\x19\x5a\xf1\x0a\xe4\x0a\x27\xa1\xea\
+\xc8\xc4\x92\xaa\x88\x75\x24\x0a\x63\xd5\x24\x1d\x45\xbf\x6d\x22\
+\xd9\x6c\x09\xf4\x74\x1b\x10\x7b\x08\xc8\x2a\x03\xb6\x1e\x54\xd5\
+\x84\xc4\xee\x51\x7b\x2c\x88\x7b\x18\xb9\x2e\x4f\xb3\xbd\x84\x92\
+\x67\x50\x09\x5e\x6b\x4c\x6b\x46\xd1\x2a\x45\x2c\xed\x19\x23\xbf\
+\xc7\xf0\x4b\xfe\x1c\x1f\x8e\x86\x31\xbf\xf8\x88\xd0\x7a\x5e\x72\
+\x07\xcf\x98\x0b\xb1\x69\x37\x35\xf3\xe9\xb5\x53\x08\x60\x49\x99\
+\xad\x59\xb1\x34\x06\x90\xb1\x62\xe5\x01\x60\x57\x29\xb0\xad\x40\
+\x55\x33\xc6\x23\xf4\x41\x5f\xd3\x89\x57\x3b\xf4\x1a\x5a\xac\xd3\
+\xae\xfb\x4e\x36\xda\xb1\xb5\xbb\x4a\x34\x89\xf9\xb4\x24\x91\x7d\
+\x12\x54\x1f\x63\x55\x9a\xfa\x99\x91\xb5\xe7\xed\x3a\x05\x04\xf2\
+\xc4\xd4\xb2\xdf\x0d\x2d\x67\x6d\xea\xd2\xdf\x62\xbc\xb8\x28\xb4\
+\x98\x58\xf0\x0c\xff\xd4\x8a\xd8\x2d\x9a\x5a\x2f\x25\xbd\xe5\x41\
+\x2b\xfa\x69\xbf\x0a\xf0\x48\x61\x15\x39\x40\xca\x31\x20\xfb\xf4\
+\x9d\x5a\x59\xe8\x86\x47\x02\xf1\x97\x9d\xf4\xf3\x79\x76\x39\xe1\
+\x45\x8c\x63\x3c\x7f\xdf\xc8\xf4\xdf\x32\x4f\x02\x3e\xa9\x4c\x9a\
+\x71\x7c\xe3\x81\xc8\xa4\x13\x4f\xba\x1b\x8d\x39\xcf\x6b\xfc\x04\
+\x05\x4a\x0b\x8f\x30\xab\x75\xa7\x1f\xe9\x9b\xbb\x65\xe9\x99\xb9\
+\xc8\xb9\xc1\xb6\xf9\x45\xe4\x5c\x57\x6e\x06\xa6\xd1\x6f\x3b\xca\
+\x6e\xcb\x77\x97\x24\x40\x9e\x09\xac\x2c\x00\xf6\x94\x03\x69\xfb\
+\xcb\x9e\x8e\x70\xf6\xbf\xdf\xa1\xb7\x49\x09\x83\xad\x21\x3c\x09\
+\x73\xa2\x33\xf1\x59\xff\x11\xee\x16\x5e\x21\x29\xd7\x77\xfd\x48\
+\x1b\xb6\x53\x31\x5a\x18\x9f\x45\x05\xdd\x42\x1f\x68\xb7\xea\xb8\
+\x9b\xd7\xb8\x08\x0d\x56\x96\xcb\x80\x2b\xf9\xa3\x97\xe2\x94\xda\
+\x78\x9c\xef\x85\xf0\xa4\xeb\x1a\x7f\x7a\xeb\xb6\x94\xcb\x84\x72\
+\xdb\x0b\x5d\xfd\x2d\x83\xb0\xc1\xd6\x1e\x07\xf2\xca\xd5\xcf\x16\
+\x29\xb7\x70\x96\xed\x2b\x3e\x6f\xdf\x63\x5f\x9d\x97\x12\x89\x1d\
+\xd1\xf5\xf9\x55\x6b\xe2\xb0\x68\xda\xb2\x0d\xfb\x7f\xcd\x64\x1f\
+\x84\x91\x58\xf9\x1d\x10\x9e\x74\xf8\x71\x57\x03\x2b\xa1\xfa\x30\
+\xc2\x58\xb0\xe0\xdc\xae\x5c\x60\x4e\x28\x3b\xdb\x07\x70\x5c\x54\
+\x5d\xeb\x42\x52\x07\x62\x1c\xbb\x55\x4a\xc9\x66\x6d\x01\x42\xe9\
+\x75\x2a\x2b\xc9\x2d\xbb\x53\x3b\x51\xae\xac\xee\xd4\x6f\x44\x29\
+\x03\xc4\x10\x33\x89\x21\x44\xeb\x86\xab\x55\xb8\x17\x64\x1c\xbc\
+\x58\x9d\xce\xa4\xe3\x38\x11\x69\x07\xef\xd4\x9a\x3b\xf9\xdf\x6f\
+\xa1\xdd\x3a\x93\x3f\xbb\x12\x6d\xeb\x12\xd8\xb9\x9f\xbe\x72\xa6\
+\x4d\xbc\x00\x53\x8e\x8b\x55\x58\x7d\xd5\x93\xd6\x03\x9e\x94\x6e\
+\x29\x3b\x3c\x93\x92\xe7\x9c\xba\x51\x23\x4a\x7e\x92\x87\x95\x84\
+\x83\x58\x75\x0b\xe2\x9d\x86\xf7\x06\xa9\x3c\xe6\x42\xf1\x65\x36\
+\x28\x7b\x60\xe7\x51\xf5\x33\x47\x2f\x65\xb5\x78\x36\x98\x30\x24\
+\x3e\xa8\x4b\x60\x0f\x09\x66\x2b\xeb\x67\x7a\x24\x95\xb0\x67\x87\
+\x4f\xa1\xff\x3e\x94\x2c\x92\x33\x9d\x41\xf2\xb5\x59\x27\x9e\x8c\
+\x24\x79\xbb\x6e\x03\x8f\xf0\x60\x24\x31\x96\x68\xdf\xd8\x0d\x45\
+\x68\xee\xf4\xbc\xb2\xbb\x85\x2a\x20\xff\x02\x30\x2f\x72\x8b\x5a\
+\x54\x4d\x48\xdc\x96\xf8\xa2\x6e\xe2\x84\x04\x72\x8a\xd9\x9d\xdc\
+\x6c\x76\x4c\xc2\x81\x92\x4f\xe5\x78\x79\xd3\xb3\x10\xf6\x46\xf2\
+\x19\x56\x70\xec\x46\x0d\x1b\xb4\x52\xbb\x95\x6e\x8e\xb8\x3c\xac\
+\x88\x36\x8d\x91\x0b\xbb\xc3\xc3\x3f\x59\x55\xfe\x0b\x70\xfa\x2a\
+\xf7\xc4\xd2\xad\x8f\x44\xdf\x57\x13\x13\x5e\x48\x5c\x48\x20\xef\
+\x14\xc7\x8a\xdd\xed\xbe\x11\x98\xc1\xa5\x31\x97\xcd\x16\x4c\x55\
+\xa2\x38\x66\x6b\x0a\xea\xc9\xdb\x77\x1f\x54\xc8\xcb\x17\x0a\xd6\
+\x8a\xd9\xbf\xbc\x72\xa7\x20\x1d\x26\xb0\xf3\x50\xe9\x4d\x4d\x79\
+\x25\xc9\xa3\xb6\x3e\x14\xc9\x85\x7e\x11\xee\x80\xba\x2f\x9c\x15\
+\x12\x28\xa2\x44\x71\x5c\x16\x41\x9c\xed\xc5\x6c\xb6\x65\x5c\xa3\
+\xd1\xec\xdc\xb5\xdc\x6c\x99\x97\xb8\x52\xb3\x4e\x3e\xee\x3d\x64\
+\xc2\x51\x9d\xb6\xdd\x3c\xc5\xec\x1b\x7d\xa0\x60\xbc\x39\x71\x19\
+\x45\xb7\x4a\x2a\x34\xb5\xce\xb2\x15\xf7\xba\x19\x5a\x97\x8b\x23\
+\xea\x4c\x74\x24\x9a\x37\x3c\x70\xee\xec\xcf\xc0\xc1\x9f\x48\x56\
+\x5a\xdf\x6c\x7b\xe8\x5b\x76\x05\xb0\x8f\xf2\x15\xdc\x00\xce\x56\
+\x01\xeb\x76\x17\xa9\xfb\x98\x48\x77\xf0\x48\x1f\xe2\xfd\x46\x1e\
+\x4a\xec\x42\x13\xf7\x5e\xcb\x3f\x7d\x53\x33\x76\x7a\xc4\xed\xce\
+\xfa\xa3\x84\xfd\xb0\x52\xbc\xeb\xfd\x95\x5c\x9c\xd5\x8c\xec\xa2\
+\xcb\x9a\xec\xe2\x4b\x4f\xb3\x8a\x54\x35\xd9\x47\x55\x35\x39\xc4\
+\xde\x63\xc4\x71\x55\xcd\xf7\x44\xee\x09\x01\x97\x9e\xba\xfa\xae\
+\xae\x6a\xa5\xab\xe7\x23\xfa\xaf\xd5\xe0\xf9\xa0\x87\x47\xc0\xfa\
+\x8b\xab\xd3\x0a\xab\x0c\x2d\x67\x9e\xfb\xaa\xe7\xe0\x03\xfc\x3a\
+\x82\xb0\x17\x65\x6f\xfe\x52\xc9\x0c\x46\xcf\x70\x19\x60\x35\xbb\
+\xa0\xdf\xf0\xc9\xe7\xf5\xcc\x5c\x2f\x35\x8a\x61\xae\xaa\x36\x5d\
+\x0c\x72\xc4\xb9\xef\xf2\x12\x1b\x9a\x75\x37\xb2\x35\xef\x3d\xd4\
+\x71\xe3\x87\x2d\x3f\x8d\xe2\x67\x39\x31\x92\x68\xd7\xd4\xa3\x97\
+\xb0\xb9\x06\x88\x8b\x61\x76\x13\x70\x13\x44\x13\x1f\xa5\xb4\x1a\
+\xc4\x11\x3e\x6b\x13\x5f\x0b\xf7\x31\xd1\x2a\xed\x57\x79\xee\x6b\
+\x26\x26\xd1\x46\x6c\xb0\xbf\x43\x9b\x26\x9e\x6a\xb5\xea\x96\x8b\
+\x44\xd2\x92\x78\xef\x25\x49\xfe\xfb\xaf\xb7\xff\x8c\xde\x26\xd0\
+\x14\xfe\x00\xc6\x8f\x6d\x5f\x51\xaa\x96\x24\x00\x00\x00\x00\x49\
+\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x03\x54\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xd6\xd8\xd4\x4f\x58\x32\
+\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
+\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
+\x79\x71\xc9\x65\x3c\x00\x00\x02\xe6\x49\x44\x41\x54\x58\xc3\xd5\
+\x97\xcd\x4e\x13\x61\x14\x86\xeb\x35\x94\x95\x7b\x71\xe1\xd2\xc4\
+\xe0\x05\xb8\xe2\x0e\x5c\xb8\xf4\x02\x5c\xb1\x30\xea\x05\x18\x96\
+\x26\x62\x58\xb8\xb0\x91\x58\x20\xd1\x9d\xbf\x89\xa4\x14\xb1\x52\
+\xa4\x48\x45\x94\xfe\xd0\x02\x43\xff\xa6\x9d\x19\xa6\x65\x80\xe3\
+\x79\x7b\xfa\x85\x51\x4a\x82\xc9\x21\x86\x49\xde\x9c\x33\xa7\xf3\
+\xcd\xfb\x9c\xf3\x4d\x9b\x4e\x84\x88\x22\xff\x53\x91\x73\x01\xc0\
+\xc7\xd5\x90\x6e\xff\xa5\xfb\xac\xc7\x3d\x3d\x64\x0d\xa9\x02\xf0\
+\x31\x32\x3c\x3c\xbc\x6a\x34\x3a\x3a\xba\x19\x56\x3c\x1e\xaf\x26\
+\x93\xc9\x56\x3a\x9d\x76\x13\x89\x44\x6b\x60\x60\x20\xcd\x6b\x6e\
+\x68\x02\xa4\x38\xd2\xe1\xe1\x71\x99\xba\xef\xb7\xc9\xb2\x2c\xda\
+\xdf\xdf\x27\x86\xf1\x78\xcd\x18\xeb\x8a\x1a\x40\x3f\xf3\xb0\x1c\
+\xc7\xa5\x4c\x66\xb9\x0b\x14\x04\x01\xc5\x62\xb1\x3a\xaf\x7b\x70\
+\x1a\x88\x53\x01\x1c\x1c\x10\x77\x77\xb2\x6c\xdb\xa1\xf9\xf9\xcf\
+\x64\x0e\xd7\x75\xe9\xf9\xc4\x44\x17\x42\x05\x00\x26\x7b\xc1\xc9\
+\xaa\x37\x1c\x4a\xce\xcd\x53\xf8\x70\x5d\x0f\x8b\x17\x54\x00\x82\
+\x10\x40\x67\x4f\x14\xce\xed\xa6\x47\x1f\x67\x66\xe9\xf5\x9b\xb7\
+\x14\x9f\x9c\xa4\xa9\xa9\x69\x7a\xf7\xfe\x03\x45\xa3\xd1\x65\x5e\
+\x7f\x41\x05\xc0\xef\x10\xed\xb6\x25\x86\x85\x9a\xe3\x05\x94\x5d\
+\xcd\xd1\xe4\xf4\x2b\x7a\x32\xfe\x94\x9e\xc5\x5e\xd0\x4c\x62\x0e\
+\x8b\x17\x55\x00\xda\x81\x18\xf5\x13\x20\x3c\xff\x90\x6a\xcd\x36\
+\x15\x37\xab\x94\x2f\x6e\x53\x89\x63\x8d\xb7\x85\xd7\x7e\x51\x01\
+\xf0\x79\xcc\xcd\x5d\x1e\xb5\xc7\x7b\xdb\xee\x9f\x3b\xbe\xe4\x88\
+\x5d\xb8\xbd\xee\xe2\x94\xca\x33\xe0\x75\xe4\xc6\x75\x57\x62\xd8\
+\x10\x39\xea\xe6\x33\x44\xd4\x01\xa7\x06\xe0\xf4\x3a\xad\x39\x22\
+\x98\x98\x68\x72\x80\x98\x6b\x50\x53\x9d\x00\x00\x2a\x2d\xb9\x31\
+\xe2\x4e\x53\x8c\x10\x0d\x04\xf2\x6d\xfb\x28\xb6\x7c\x45\x00\x9b\
+\x3b\xdb\x6a\xfc\x69\x8e\x3c\x6c\x88\x1a\xae\x39\x13\x80\x3a\x8f\
+\xb7\x54\x23\x2a\xd7\xc5\x04\x06\x06\x00\x35\x28\x9c\x17\xab\xbc\
+\x25\xbb\xca\x13\xc0\x4d\x61\x0e\x15\x2a\x72\x6e\xcc\x7e\x5a\x02\
+\x68\x6a\xdd\xad\xf1\x94\x27\x00\x53\xdc\x1c\x71\x6d\x5b\x40\x60\
+\x9a\xab\x1c\x75\x9e\xeb\x81\x41\x15\x47\x11\xc0\x6a\x89\x31\x0c\
+\xd6\x77\x04\x20\x0c\x64\x26\x62\xb6\x69\x75\x8b\xa8\xaa\x09\x50\
+\xb6\xc5\xbc\xd0\x03\xf8\xbe\x29\x63\x87\x29\x60\x0c\x18\x84\x1c\
+\x00\x5b\x4d\x45\x00\x74\x03\x53\x98\xad\x94\xc5\x1c\xe7\x46\xe6\
+\x1c\x00\xc8\x71\x5d\xa9\xa1\x08\x80\xfd\xfc\x56\x12\x73\x33\x01\
+\x08\x35\x18\x42\xe8\xda\x7c\x8e\x29\xa8\x4e\x00\x5b\x00\x03\xc8\
+\x98\x67\x36\x04\x00\x32\xe6\x85\xde\xf8\x17\x0b\xfc\x2c\xd8\x8a\
+\x00\x18\x67\x3a\x4f\xb4\x54\x14\x23\x98\x02\x00\x02\x0c\x3e\xfb\
+\xc5\x53\x28\xf0\x43\xb8\x66\x49\xf7\x6b\xf9\x52\x87\xd7\xbe\x54\
+\x01\xc8\x55\x8f\xba\x4e\xad\x4b\x0e\x90\xaf\x85\xde\xb7\xc2\x92\
+\x3d\x4f\xa6\xb3\xde\xa3\xb1\x71\xeb\xda\xd0\xf5\x15\x98\xb3\x6e\
+\xa9\x00\x6c\x34\xa4\x6b\x18\xff\xe0\x11\x7f\x5a\x17\x53\xd4\x13\
+\x0b\x59\x6f\xe4\xee\xbd\xe2\xa5\xc1\xcb\x4b\x7c\x6d\x8c\x75\x87\
+\x35\xa8\xfa\xb7\x1c\xdd\x65\xd9\x3c\x8f\x1f\x19\xfe\x9e\xcf\x1e\
+\x37\xbd\xc9\xba\x78\x26\x6f\x46\x00\x68\xf2\xff\x81\x99\x94\x9e\
+\xe9\x3f\xbf\x19\x01\x42\xd3\xf4\xfc\xbd\x9c\x9e\xa5\x7e\x03\x51\
+\x6c\x25\xa1\x92\x95\x0a\x77\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
+\x42\x60\x82\
+\x00\x00\x4f\xc7\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x80\x00\x00\x00\x80\x08\x06\x00\x00\x00\xc3\x3e\x61\xcb\
+\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
+\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\
+\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\
+\x00\x00\x3a\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x00\x06\
+\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\x00\
+\x4d\x4e\x49\x44\x41\x54\x78\xda\xed\xbd\x69\x8c\x64\xd7\x75\x26\
+\xf8\xdd\xfb\x5e\xac\x19\x91\x91\x6b\xe5\x5e\x55\x59\x1b\x8b\x25\
+\x8a\x5a\x28\x51\x2a\xba\x24\x35\x69\x4b\x96\xec\x41\xbb\xd1\x76\
+\xa9\xbd\xf6\x8c\xc6\x1e\x1b\xf6\xb8\xdb\xf0\x60\x0c\xcf\x02\x4c\
+\xc3\x46\x1b\x98\x41\xc3\x70\x4f\x77\xff\x98\x1e\x18\x18\xa0\xd1\
+\xb2\x3d\xea\xb1\xdd\x92\xa5\xb6\xe4\x36\x25\x6a\xa5\x64\x4a\xa4\
+\x28\x89\x14\xb7\x5a\xb2\xd6\xac\xac\x5c\x23\x63\x7b\xef\xdd\x7b\
+\xcf\xfc\x38\xe7\xde\xf7\xb2\x36\x66\x16\x49\x4b\x72\xd7\x23\x02\
+\xac\x8c\x8c\x8c\x88\x77\xcf\xb9\xe7\x7c\xe7\x3b\xcb\x05\xee\x5d\
+\xf7\xae\x7b\xd7\xbd\xeb\xde\x75\xef\xba\x77\xfd\x97\x78\xa9\xef\
+\xf5\x17\xb8\x77\xed\xf1\x3a\xfd\xb1\xf2\xbb\xf6\x67\x6f\x06\x00\
+\xa5\x1d\x7d\xf5\x5f\xfc\xc2\xd3\xaf\xe5\xed\xee\x29\xc0\xf7\xf9\
+\x75\xe2\xd7\xfe\xcd\x74\xad\x5c\x3b\x45\x2a\x3a\x19\xeb\xe8\xbd\
+\x04\xbc\xa3\x14\xe9\xde\xd4\xf8\xb0\x39\x38\x3d\x3e\xbc\x38\x33\
+\xd6\x99\x6c\xd5\xff\xec\x85\xe7\xcf\xfc\xca\xef\x7c\xe4\xd1\xc1\
+\x5e\xdf\x3f\xfe\x5e\xdf\xe0\xdd\x5e\x6f\xfd\xb9\xff\xf9\x44\xa5\
+\x56\xab\x01\xc0\xd7\xfe\xf0\x7f\xfb\xc6\xf7\xfa\xfb\xbc\x5e\xd7\
+\x43\xff\xfd\xbf\x7d\x33\xa2\xd2\xfb\x94\x56\x27\x23\xad\xde\x4b\
+\x4a\xcd\xd7\x2a\xa5\xed\xb9\x7d\xa3\x7a\x71\x7a\x62\xe8\xf0\xec\
+\x18\x46\x1a\xd5\xba\x73\x04\x82\x02\x11\x35\x8c\xb5\xff\xf8\xc0\
+\xe1\x03\x3d\x00\xbf\xba\xd7\xcf\xfb\x81\xb1\x00\x6f\xf9\xc7\xff\
+\xcb\xc3\x25\x15\xbf\x8f\x94\x3e\xa5\xa0\x4e\x69\xad\xc6\xa0\xf8\
+\xeb\x47\x91\x5e\x3f\x7e\xfc\xf8\x57\x47\xe6\x67\x7e\xea\x0f\x3e\
+\xfc\x48\xff\x7b\xfd\x5d\x77\x7b\x9d\x38\xfd\xcf\x1a\xb5\x7d\xd3\
+\x27\x55\x1c\x9f\x04\xd4\x49\xad\xf4\x7b\x48\xa3\x3a\xd6\x6c\xb6\
+\x0f\x4e\x8f\xd5\x0e\xcc\x4c\x54\x17\x67\x46\x51\x29\xc5\xb0\x8e\
+\xe0\x88\x60\x1c\x60\xac\x43\x92\x19\x58\x47\x50\x4a\x81\x9c\x83\
+\x75\xf6\xe5\x5f\xff\x91\xfb\x8e\xed\xf5\x3b\x7c\xdf\x5a\x80\x87\
+\x7e\xe1\x7f\x3d\x05\x1d\xbd\x4f\x29\x9c\x02\xe1\x94\xd6\x51\x03\
+\x0a\x80\xc2\x95\xf1\xd1\xd1\x33\x47\x17\x0f\xbc\x72\xff\xb1\xc5\
+\xf9\x99\x89\x89\x59\xe7\xdc\xd8\x76\xb7\xff\x63\xe7\x96\xd7\x7f\
+\x17\xc0\x6f\x7d\xaf\xbf\xfb\x6d\xef\xe9\x97\xff\xed\x7e\x57\xa6\
+\x93\x5a\xe9\x93\x5a\xab\xf7\x2b\xa5\x4f\x44\x5a\x77\xf7\x8d\xb7\
+\x92\xc5\xe9\x89\xd6\xc1\xb9\xf1\x68\xff\xbe\x11\x10\x61\xd4\x11\
+\xc1\x3a\x60\x90\x66\x68\xf7\x12\xf4\x7b\x7d\xf4\x93\x04\x3a\x2a\
+\x43\x97\x4a\xb0\xd6\xc2\xa4\x29\x8c\x49\xa1\x75\x84\x52\x85\xad\
+\xe1\x5e\xaf\xef\x0f\x0b\x70\xfa\x74\xf9\xed\x95\x43\xa7\xa0\xe2\
+\x53\x5a\xa9\x53\x50\xfa\x94\xd6\xaa\x06\x28\x28\xa5\x2e\x4f\x8c\
+\x8d\x5e\x3b\x7e\xec\x48\xe9\xbe\x43\xfb\xa7\xc7\x47\x46\x26\x1d\
+\x39\x58\x47\xc8\x2c\x01\x4a\xc3\x58\x0b\xad\x80\x4e\x3f\xd9\x7e\
+\x65\xfd\xfc\xc1\x3f\xf8\xf0\x07\xd7\xbf\xd7\xb7\x04\x00\x6f\xf9\
+\x95\x7f\xf5\x70\x1c\x47\xa7\x94\x8a\x4e\x6a\xad\x4e\x41\xa9\xe9\
+\x5a\xad\xbc\x31\x37\x39\xa6\x17\x67\xf7\xb5\x0e\xcd\x4e\x60\xac\
+\x59\x87\x17\xb6\xb1\x16\x89\x75\xc8\x8c\x45\x9a\x1a\xf4\xfb\x7d\
+\x6c\x6f\xb7\x41\x59\x1f\x87\xc6\x6b\x78\xf3\xa1\x59\xbc\x70\xf1\
+\x3a\x9e\x3e\x7f\x1d\xf3\x63\x0d\xcc\x8d\x0e\xe1\xe0\xf4\x28\x86\
+\xea\x75\xfc\xc9\xd7\xce\xbe\xf0\xcf\x7f\xf6\xbd\xf7\xef\xf5\x3b\
+\x7e\x4f\x2c\xc0\xfc\xe9\xd3\xb5\x89\x68\xf1\x94\xd2\xfa\x94\xd2\
+\xfa\x7d\x50\xea\x54\xa4\x75\x04\x28\xc4\x91\xbe\x3c\xb5\x6f\xea\
+\xe5\xfb\x8e\x1c\x28\x1d\x3d\x70\x70\x61\x74\xac\x35\xe7\x1c\xcd\
+\x19\xc7\x42\x6f\x27\x16\xc6\x3a\xa4\x99\x45\x6a\x1c\x1c\x29\x38\
+\xb2\x18\x2a\xc7\x18\xaa\xd5\x9a\x93\xa5\x7d\xbf\x0b\xe0\xd7\xff\
+\xb6\xef\xe9\xc4\x2f\xfe\xfe\x58\xad\x5c\x3a\xa9\x94\x3e\x09\xa5\
+\x4e\x42\xe3\x11\xa5\x74\x69\xac\xd5\x5c\x5f\x98\x9e\xa8\x1d\x9c\
+\x9e\x6c\x2c\xce\x4c\xa0\x5a\x89\x47\x9d\x23\x18\x47\xb0\x8e\xb0\
+\xd9\x4b\x91\x39\x20\x35\x06\xfd\x7e\x82\x5e\xb7\x8b\x5e\xa7\x8d\
+\x2a\x12\x1c\x9f\x69\xe1\xfe\xb7\xcf\xe2\xc4\xe1\xfd\x00\x00\x22\
+\x42\xd6\xdd\xc4\x7b\xde\xf4\x76\x4c\xef\x9b\x0c\x9f\x7d\x71\x79\
+\x15\xfd\x76\x57\xdf\xcd\xf7\xfe\x5b\x51\x80\x87\x4e\xff\x76\x2b\
+\x89\x70\x2a\x82\x3a\x05\x8d\x53\x91\x8e\x4e\x89\xfb\x46\x29\x2e\
+\x5d\x99\x9b\x9d\xfe\xee\xb1\xc3\x87\xaa\x47\x0f\x2c\x1c\x18\x19\
+\x1d\x9e\x33\xc6\xce\x59\x47\xb0\x04\x6c\xf7\x33\x24\xc6\xc0\x58\
+\x20\x73\x04\x6b\x09\x0e\xec\xfb\x00\xc0\x39\x0b\x22\x5e\x50\xe7\
+\x08\xe3\x23\x8d\x8f\xfc\xd2\xbf\xfa\xf8\xef\xff\xe1\x3f\xfd\x89\
+\x73\x6f\xe4\x3d\xbd\xed\x17\x7f\xff\x48\x54\x8a\x4f\x92\x56\xa7\
+\x94\x52\xef\xd1\x4a\xdf\x1f\xc5\x71\x67\x62\xa4\xd9\x3f\x38\xb3\
+\xaf\x79\x70\x76\xa2\xba\x7f\x6a\x0c\x50\x98\x24\x68\xb1\x58\x16\
+\x5b\xfd\x0c\x99\x75\x48\x8d\x43\x66\x0c\x7a\xbd\x2e\x92\x7e\x1f\
+\xbd\xed\x2d\xb4\x62\x8b\xe3\xb3\x23\x78\xe8\xe1\xfb\xb0\x7f\x76\
+\x2a\x08\x9d\x88\xc2\xe7\x8e\x0e\x37\x40\xd6\x60\x7b\x7b\x1b\x59\
+\x96\xa1\x54\x2a\x61\xbb\xdd\x46\x92\xf5\xf6\x1c\x01\xbc\x61\x0a\
+\x30\x7f\xfa\x37\xc7\x86\x11\x9f\xd2\x91\x3a\xa5\xb5\x7e\xcc\x40\
+\x3d\x14\x2b\x05\x05\xa0\x5c\x2e\x5f\x59\x98\x9f\x79\xee\xe8\xe2\
+\xc1\x91\xe3\x47\x16\xe7\xea\xb5\xda\xac\x23\xcc\x5a\x22\x64\xc6\
+\x62\x6b\x60\x90\x59\xc2\x20\x49\x61\x1c\xe0\x00\x38\xeb\xa0\x75\
+\x04\x47\x0e\xce\x39\x90\xe3\x05\xd1\x91\x46\x14\x47\x00\x11\x06\
+\x99\x45\x14\x29\xd4\x2b\xe5\xfa\xd1\xfd\xfb\xff\x19\x80\xff\xe6\
+\xf5\xba\x9f\xd3\xa7\x3f\x16\x9d\x1d\xbd\x70\x52\xe9\xe8\x24\x29\
+\x75\x4a\x2b\xf5\x88\x52\x7a\xa2\x52\x29\xaf\xcd\xed\x1b\xa7\xc5\
+\xb9\xe9\xf1\x03\x33\xe3\x18\x6b\xd6\x1b\x8e\xa8\xe1\x94\x02\x91\
+\x42\xcf\x02\x69\x66\x91\x64\x09\x8c\xa0\xf6\xd4\x18\x64\xfd\x3e\
+\x3a\xdb\x1b\xe8\x6e\xac\x63\x76\xa4\x84\x77\xce\x4f\xe0\xe1\x1f\
+\x79\x18\x63\x23\xad\xf0\x99\x5e\xe8\xce\x39\x18\xc3\xee\x60\x30\
+\x18\xe0\xca\x95\x2b\x88\xe3\x18\xc3\xc3\xc3\x18\x1a\x1a\x82\x73\
+\x0e\x83\x7e\x0f\x49\xb7\x73\x57\xf7\xf6\xba\x60\x80\xe9\xd3\xff\
+\x64\xb2\x85\xda\xfb\x94\xc2\xa9\x48\xa9\xf7\x2b\xad\x4f\x28\x00\
+\x4a\x01\xf5\x4a\xf5\xd2\xc2\xc2\x6c\xff\xe8\xe2\xc1\xd1\x63\x8b\
+\xfb\x27\xea\xb5\x2a\x2c\xb1\xf9\x23\x68\x0c\x32\x03\x63\x09\xc6\
+\x12\xfa\x59\x06\x47\xc4\xc2\xb6\x0e\x4a\x2b\x28\xa5\xe0\xac\x43\
+\x5c\x8a\xf9\x39\xa5\x00\x05\x41\xbe\x0e\x71\x14\xc3\x5a\x03\x00\
+\x28\x97\x22\x34\x2b\x25\x38\x6b\xb2\xe7\xcf\x2e\xbd\xe5\xff\xfc\
+\xef\x3e\xf0\xdd\xbb\xb9\x9f\x23\x1f\xf9\xbd\xc9\xe1\xa8\x74\x4a\
+\x45\xfa\xa4\x82\x3a\x09\xad\x4e\x6a\x68\xdb\x6a\x35\xd7\x17\xa6\
+\x27\x6b\x07\xe7\xa6\x5a\x07\x67\xc6\x51\x2d\x97\x40\x04\x58\x02\
+\x32\xeb\x90\x65\x06\x86\x58\xe8\xc6\x01\xc6\x11\xb2\x2c\x83\x49\
+\x13\x64\x49\x17\xfd\xce\x36\x06\x9d\x2d\x1c\x9f\x69\xe2\xad\x87\
+\xe7\xf1\xc0\xf1\xc3\x18\xaa\xd7\x77\x08\xdd\x39\x87\x2c\xcb\x82\
+\xc0\x7b\xbd\x1e\xd2\x34\x85\x73\x0e\xb5\x5a\x0d\x8d\x46\x23\x08\
+\xde\x5a\x8b\x33\x67\xce\xa0\xdd\xe9\xe1\xdf\x3d\xf1\xdc\x37\x3f\
+\xfa\x7b\xff\xf4\x6d\xb7\xbb\xa7\x87\x7e\xfb\x63\xfb\xfb\x29\xca\
+\xcf\xff\xc1\x87\x5f\x29\x3e\xff\x9a\x2c\xc0\xc1\xd3\xbf\x71\x5f\
+\x05\xd5\x7f\x1d\x69\xfd\x7e\xb0\x5c\xd0\x1c\xaa\x5f\x3a\xb0\x30\
+\x77\xee\xbe\xc3\x8b\x63\x87\x0f\xcc\xb7\x86\xea\xb5\xf9\xcc\x5a\
+\x58\x4b\x48\xad\xc5\x7a\x2f\x0d\x8b\xe3\x08\xc8\x8c\x01\x41\x41\
+\x2b\x0d\x82\x06\xc1\xc1\x11\xf1\x9b\x29\x86\xfd\xd0\x0a\x04\x80\
+\x0a\x9f\x4d\x4a\x01\x8a\x9f\x57\x51\xc4\xfe\xd1\x38\xf4\xb4\xc1\
+\x50\x39\x2a\x4d\x8e\x8e\xfe\xef\x00\x7e\x62\x37\xf7\xf1\xd6\x8f\
+\xfc\xde\x89\x4a\xb5\x72\xca\x58\x77\x4a\x41\x9d\xd4\x51\x74\x44\
+\xeb\x68\x7b\xdf\xd8\x68\x77\x61\x76\xa2\x71\x70\x76\x2a\x3a\x38\
+\x33\x19\x39\xa2\x69\x4b\xec\x6a\x32\x4b\xd8\xe8\xa6\xc8\x2c\x21\
+\x73\x0e\x99\x75\xb0\x96\x40\x20\x24\x83\x01\x5c\x96\xa0\xdf\x69\
+\xa3\xbb\xb5\x8e\xf1\xb2\xc3\x03\x07\x26\xf1\xc0\xdb\x8f\xe2\xe0\
+\xfe\x79\x94\xcb\xe5\xf0\xd9\xc6\x98\x9b\x04\x9e\x24\x09\xb4\xd6\
+\xa8\x56\xab\x18\x1d\x1d\x45\xa5\x52\x81\xb5\x36\x3c\x3a\x9d\x0e\
+\xac\xb5\xc8\xb2\x0c\x6b\x6b\x6b\xd8\xee\xf5\xd1\xdd\x5c\x0d\xef\
+\xf9\xe6\xdf\xf8\xd8\x7d\x65\x9d\x9e\x42\xa4\xde\x07\xa5\x1e\xd2\
+\x4a\x9f\x00\x39\xd4\x63\x67\x4e\xff\x8b\x4f\x9d\x7f\xcf\x9b\xe6\
+\xfe\xfd\x3f\xf9\xd0\x5b\x7e\x57\x29\x45\x77\x6d\x01\x8e\x9c\xfe\
+\x1f\xde\x1f\xa9\xd2\xc7\x15\x51\xe5\xf8\xd1\xc3\x2b\x6f\x3e\x71\
+\x74\xe4\xe8\xfe\xf9\x6a\xa5\x52\x86\x23\xc0\x58\x42\x6a\x0c\x1c\
+\x34\x92\xd4\x20\x23\x8e\x5f\xad\x75\xb2\xcb\x35\xb4\xd6\xb0\xd6\
+\x42\x29\x56\x00\x47\x4e\x14\x81\xfd\x9e\xf7\xf3\x44\x84\x48\x47\
+\x20\x72\xf0\xb1\xbf\x7f\x7e\xc7\x45\x84\x58\x2b\xd4\x2b\x31\x62\
+\x05\xf7\xec\x0b\x2f\xbd\xf7\xdf\xfc\xea\x8f\x7f\xb9\xf8\x92\xf9\
+\xd3\xbf\x59\xdb\x37\x34\x76\x52\x95\x4a\x27\x95\xc2\x49\x90\x7e\
+\x44\x6b\x35\x5a\xae\x94\x57\x67\xf7\xed\x4b\x0f\xce\x4f\x4f\x1c\
+\x9a\xdb\x57\x1e\x6b\x35\x40\xc4\xc8\xdc\x92\x82\x11\x74\xce\x02\
+\x07\x8c\xb1\x30\xc4\xee\xc8\xa4\x29\x06\xfd\x0e\xfa\xdd\x0e\xd2\
+\xed\x4d\x8c\x54\x2c\xe6\x5a\x55\xdc\x7f\x68\x0e\x8b\x0b\x73\x98\
+\x9e\x9e\x86\xd6\x8c\xd1\xac\xb5\x48\x92\x24\x08\xbc\xdb\xed\x22\
+\xcb\x32\x68\xad\x51\xab\xd5\xd0\x6a\xb5\x50\x2e\x97\x61\x8c\xd9\
+\x21\x74\x6b\x2d\xd2\x34\x45\x96\x65\x48\xd3\x14\x69\x9a\x22\x49\
+\x12\xbc\xfc\xf2\xcb\x58\xba\xbe\x85\x27\xce\xf6\xae\xf4\x86\x17\
+\xbf\xae\x80\x93\x4a\x47\x93\x00\xa0\x35\x3a\x33\x63\x8d\xce\x91\
+\xe9\x91\xda\x7d\x73\x63\xad\x83\x53\xc3\x70\xb2\x93\x3a\xfd\xc1\
+\xff\xf5\x93\xef\x3e\xfa\xab\x77\xa5\x00\x87\x4e\xff\x76\x2b\x56\
+\x78\xa1\x1c\xc7\xf5\x5f\xfa\xd9\x9f\x1c\x9e\x9a\x18\x47\x22\xa6\
+\x3c\x35\x16\x99\xec\x10\x63\x2c\xa0\x23\x58\x63\xa0\xb4\x86\x56\
+\x0a\x4e\xcc\x9c\x56\x0a\x3a\x8a\xe0\x9c\xcb\x15\xc0\x39\x44\x51\
+\xc4\x0a\xe0\x5c\xd8\xf1\x44\x84\x28\x8a\x6e\xfe\x22\xe4\x95\x20\
+\x57\x16\x00\xa8\x95\x22\x34\x6a\x65\x6c\xac\x6f\x3c\xfe\xef\xfe\
+\xf4\x3f\xfc\xd7\x71\x54\x3d\xa9\x74\x74\x12\x5a\xbf\x4f\x2b\xfd\
+\x10\x80\x74\x78\xb8\xb9\x32\x3f\xbd\xaf\xb4\xb8\x30\x3b\x75\x70\
+\x66\x0a\xb5\x4a\x89\xfd\xad\x03\x8c\x73\x6c\xbe\x2d\x21\xc9\x32\
+\x76\x51\x8e\x85\x67\x9d\x85\xcb\x52\x0c\xba\x1d\xf4\xbb\x6d\x20\
+\xe9\x61\xac\x46\xd8\xd7\x28\xe3\xc0\xf4\x28\x16\x17\xe6\x30\x3c\
+\x3c\x8c\xc9\xc9\xc9\x60\xd2\x07\x83\x41\x78\xf8\xdd\x5b\xdc\xe1\
+\x91\xac\x83\x31\x26\x08\xde\x5b\x06\x2f\xf0\x24\x49\x90\x24\x09\
+\xb6\xb6\xbb\x58\x5a\xd9\xc2\xd2\x7a\x0f\x97\x3a\x0a\x17\xfb\x15\
+\x18\x68\x00\x0a\x95\x58\x6f\x2e\x4c\x0e\x0f\xee\x9b\x1f\x6b\xde\
+\x37\x37\x3e\x34\x3e\x5c\x05\xa0\x90\x66\x06\x44\x40\x66\x65\xed\
+\x23\x8d\x24\xc9\xd6\x7f\xe6\xd4\xb1\xf1\xbb\x72\x01\x0a\xf4\x8b\
+\x5a\xe9\xe9\x9f\xfe\x07\xff\x55\xd2\x6a\x8d\x60\xa3\x97\xa0\x3b\
+\xc8\x40\xd0\xc8\x8c\xcd\x7d\x37\x11\x62\xa5\x40\x0a\x50\x60\x26\
+\xcb\x9b\x77\x07\x02\x9c\x65\x13\x2e\x7e\x5d\x45\x0a\x96\x2c\x14\
+\x00\x52\xbc\xa3\x89\x3f\x90\x05\xed\x9f\x93\xe7\x95\x52\x20\x10\
+\x22\xad\x83\x62\xf1\xeb\x08\x65\xa3\x31\x3e\xda\x7c\x74\x68\x68\
+\xf4\x2b\xce\xb9\xd6\xf8\xe8\x68\x7b\xff\xc2\x6c\x73\x71\x6e\x06\
+\x07\x67\x27\xcb\x0a\x98\x77\x10\x3f\x6d\x2c\xb6\x53\xcb\x4a\xec\
+\x08\x49\x66\x91\xa4\x19\x0b\xc3\xb0\xb0\x93\x5e\x07\x49\xbf\x8b\
+\x2a\x0c\x0e\xed\x6b\x60\x7e\xb2\x89\x99\xe3\x33\x68\x0c\xd5\x50\
+\x2e\x97\x31\x36\x36\x86\xe1\xe1\x61\x38\xe7\x90\x24\x09\x56\x57\
+\x57\x77\x08\x3c\x8a\x22\xd4\x6a\x35\x4c\x4f\x4f\x23\x8a\xa2\xb0\
+\xab\x93\x24\x09\x82\x2f\xee\xee\x34\x4d\x31\x18\x0c\xb0\xba\xb9\
+\x8d\xf3\x2b\x6d\x5c\xd8\x48\x70\x7e\x3b\xc2\x4a\x5a\x12\xe4\x56\
+\xc3\x58\xb3\x8a\x07\x0f\x8f\xe1\xe8\xdc\x08\xf6\x8f\x37\x31\x5c\
+\x2f\x8f\x90\x52\x20\x07\x58\x47\xe8\xf6\x2d\x32\xe7\x90\x16\x2c\
+\xaf\xb7\x94\x5a\xab\xb1\x7f\xf9\xf1\x27\xa7\xee\x4a\x01\x34\xd4\
+\x07\x6b\xf5\xda\xda\xe8\xd8\xd8\xf8\xf6\xc0\x20\x31\x0e\x83\xd4\
+\xa2\x54\xd2\x61\x67\x6a\xa5\x00\xcd\x9a\x0d\x47\xb0\xb2\x4b\xb5\
+\x52\xd0\x3a\x82\xd2\x0a\xce\x5a\x16\x1a\x08\x4e\xf1\x0e\x60\x79\
+\x2b\x44\x91\x06\x94\x82\x22\xe2\xff\xf3\xf7\x06\x11\xe0\x1c\x31\
+\x44\x88\x34\x9c\xb5\x20\xa5\xe5\x33\x35\x2b\x1f\x80\xfe\x20\x43\
+\x54\x8d\xf5\x2f\xff\xec\x3f\xdc\x5f\x2b\x45\x20\xa0\x45\x60\x45\
+\xe9\xa5\x0e\x83\x34\x13\xe1\x3b\x0c\x92\x0c\x8e\x0c\x06\xfd\x3e\
+\x4c\x9a\x20\xed\x77\xd1\xdd\xde\x46\xc9\x0d\xb0\x30\x31\x84\xb7\
+\x4e\x8d\x61\x66\x72\x0e\xe3\x23\xc3\x1c\x72\x1a\x83\x52\xa9\x84\
+\x89\x89\x09\x54\xab\xd5\x60\xd2\x2f\x5f\xbe\x8c\x6e\xb7\x1b\x04\
+\x3e\x34\x34\x84\xf9\xf9\x79\x10\x51\x10\xf8\x60\x30\x08\x02\xf7\
+\x26\x3d\x49\x92\x20\xf0\x2b\x6b\x6d\x9c\xbd\xd6\xc6\x85\xad\x0c\
+\x17\xbb\x31\xda\x26\x02\xa0\xa0\x75\x15\xd3\xa3\x4d\xfc\xd0\xf4\
+\x08\x8e\xcc\x8c\xe2\xd0\x74\x0b\x71\x1c\xc3\x5a\x87\x54\xac\x6f\
+\x37\x71\x18\x64\x59\x00\xd8\x8e\x72\xe4\x94\x19\xcb\x8b\xc7\xf9\
+\x03\x94\x4a\x31\x54\xa9\x5e\xda\xbb\x02\x9c\x3e\x5d\x53\xc0\xa9\
+\xf9\xb9\xb9\x34\xb3\x0e\x89\x61\x52\x86\xc0\x88\x97\x83\x1d\xc0\
+\x5a\xe5\xcd\x05\xef\x6e\xef\xcf\x15\x40\x8a\x82\xdf\x23\x10\x1c\
+\x39\x78\x38\x12\x97\xe2\xe0\xdb\x09\xe4\x31\x20\xac\xb3\xe2\x47\
+\x09\x5a\x2c\x0c\xb1\xd4\xe1\xc8\x01\x82\x19\x08\x8c\xc8\x11\xc5\
+\xd8\xec\xa7\x28\xc7\x1a\xfd\x2c\x02\x11\x30\x48\x53\x0c\x12\x36\
+\xa7\x69\x92\xc2\xd9\x0c\xd9\xa0\x0f\x65\x07\x68\x95\x80\x91\x32\
+\x70\x70\xb2\x85\xd9\x7d\xd3\x98\x1c\x3b\x8e\x46\xa3\x81\x2c\xcb\
+\xd0\xe9\x74\x60\x8c\x81\xd6\x1a\x63\x63\x63\x00\x80\x7e\xbf\x8f\
+\xf5\xf5\x75\xf4\x7a\x3d\x38\xe7\x10\xc7\x31\xea\xf5\x3a\x16\x16\
+\x16\x6e\x0b\xd8\x8a\xbb\x3b\x49\x12\x74\x7a\x7d\x2c\x5d\xdb\xc4\
+\xd2\x6a\x17\x4b\x5b\x06\x97\x7b\x31\x12\x12\x73\x5e\xaa\x61\x76\
+\xbc\x85\x87\x66\x46\x70\x78\x7a\x14\x87\xa6\x47\x39\x1f\x00\xc0\
+\x3a\x5e\xf7\xce\x60\x20\x84\x98\x15\xa1\x83\xd7\x94\x08\xa4\x2c\
+\xe2\x28\x06\x48\xc1\x18\xc3\xd0\x49\x6b\x28\x05\x10\x29\x0c\xd2\
+\x24\x9d\xe9\x3c\x78\x75\xcf\x0a\x70\x08\xfb\x4f\x2a\xa5\x6a\x07\
+\xe6\xe7\x6a\x54\xdc\xad\x82\x8e\xbd\x89\xf1\x42\x0f\xc2\x24\x62\
+\x65\xf4\x88\xde\xb1\x49\x52\xb2\xbb\xe1\x7d\x39\x38\xf6\x75\x44\
+\x50\x50\x50\xba\x00\x53\x88\x3f\xcf\x91\x0b\x20\x51\xc9\xfb\x2b\
+\x28\xc6\x04\x8e\x35\x7d\x90\x76\x91\x26\x09\xc8\x1a\x18\x9b\xc1\
+\xa6\x19\x62\x65\xd0\x2a\x6b\x4c\x96\x1c\x26\xc6\xaa\x68\xd5\x62\
+\x4c\x8d\xcd\xa3\x5e\xab\xa1\x5e\xaf\xa3\xd5\x6a\xc1\x18\x83\x6e\
+\xb7\x8b\x76\xbb\x8d\x6e\xb7\x8b\x5a\xad\x86\x91\x91\x91\x10\x8b\
+\x5f\xba\x74\x29\x60\x95\x56\xab\x85\xf1\xf1\xf1\x10\x92\x19\x63\
+\xd0\x6e\xb7\x83\xc0\xfd\xee\xf6\x8f\xf5\xad\x0e\xce\xaf\x6c\x62\
+\x69\xb5\x87\x8b\xdb\x0e\x57\xfa\x65\x71\x71\x0a\x8d\xda\x10\x0e\
+\x2d\x8c\xe2\xf0\xec\x18\x8e\xcc\x8e\x61\x62\xb8\xce\xca\x6c\x1c\
+\x8c\xb5\xd8\xec\x26\x30\xd6\xc1\x81\x7d\x39\x47\x4f\x7c\xdf\x44\
+\x1c\x15\xb1\xa5\x71\xf0\x98\x88\x94\x80\xe6\x10\x51\x31\x91\x06\
+\x28\x44\x4a\x9f\xfd\xf0\x87\x95\xdd\xb3\x02\x28\xc4\xef\x07\x80\
+\xb9\xd9\x19\x38\x07\x58\x31\xd1\xce\x31\x43\xb7\xe3\xb5\x92\xa9\
+\x42\x41\x11\xb4\xec\x74\x82\x47\xf7\xec\x36\xbc\x7f\x32\xe2\x16\
+\xb4\xd2\xbc\xf5\xa1\x7c\xda\x93\x71\x81\x62\x5d\xb1\x56\xb0\x82\
+\xb5\x30\x59\x02\x6b\x0d\x8c\xc9\x60\x4d\x86\x98\x2c\xc6\xea\x25\
+\xcc\x0d\x95\x30\xd9\xac\xa0\x55\x6f\x60\xa4\x51\x45\xac\x78\x61\
+\xe2\x38\x46\xb3\xd9\xc4\xd8\xd8\x18\x8c\x31\xe8\xf5\x7a\xe8\x74\
+\x3a\xb8\x70\xe1\x42\x30\xef\x8d\x46\x23\x98\xf6\x6e\xb7\x8b\x72\
+\xb9\x8c\xe1\xe1\x61\x4c\x4c\x4c\x84\xdd\x6d\x0c\x33\x72\x37\xfa\
+\xef\xc1\x60\x80\x24\x49\x70\x75\x6d\x0b\x67\x96\xb7\x70\x71\x63\
+\x80\x0b\xdb\x0a\x9b\x99\x16\x73\xa8\x31\x3e\xdc\xc4\xdb\xf7\x8f\
+\xe3\xf0\xec\x18\x0e\xcf\x8c\xa1\x51\x2b\x87\xf5\xcc\x8c\x43\xbb\
+\x9f\xc2\x39\x16\x76\x62\x32\x58\xeb\xa0\x94\x0e\x9b\x8a\x08\xbc\
+\x39\x48\x09\x48\xd6\x30\xd6\x48\x84\xa5\xa0\xb4\x16\xec\xc5\x6b\
+\x1b\x29\xff\xd9\x0e\x0a\x0a\xc6\xe1\x22\x70\x17\x3c\x80\x02\x1e\
+\xab\x56\x2b\x6b\xb5\x72\x79\x7c\x90\x65\xc8\x0c\x7f\xb8\x15\x4a\
+\xd6\x9b\x7a\x45\x14\x18\x3b\x0f\xdc\x18\xdc\x09\x10\x2c\xf8\x76\
+\x0f\xe0\x94\x66\x85\x21\x47\xa0\x48\x2c\x86\x90\x3e\x59\x96\xc2\
+\x59\x03\x93\xa5\xfc\x48\x33\x44\x64\x31\x31\x5c\xc6\xfe\xe1\x1a\
+\x26\x5b\x43\xd8\xd7\x1a\xc2\x58\xb3\x86\x5a\x39\x46\xbf\xdf\x47\
+\x92\x24\x20\x22\x94\xcb\x65\x8c\x8e\x8e\xa2\xd5\x6a\xc1\x39\x87\
+\x34\x4d\xd1\xed\x76\x71\xe1\xc2\x05\x6c\x6d\x6d\xc1\x5a\x8b\x52\
+\xa9\x84\x7a\xbd\x1e\xc2\xad\x7e\xbf\x8f\x56\xab\x85\xc9\xc9\xc9\
+\x1d\xc8\xbc\xdd\x6e\xdf\xd2\x7f\x77\xba\x3d\x2c\x5d\xdb\xc0\xd2\
+\xf5\x6d\x2c\x6d\x24\xb8\xd4\x05\xfa\x96\xfd\x77\x14\x45\x98\x1a\
+\x6b\xe1\x4d\x33\xe3\x38\x32\x3b\x8e\xc5\x99\x31\x94\xe2\x08\xd6\
+\x59\x18\x43\xb0\x44\xd8\xea\x65\x30\xd6\x32\x9f\xe0\x14\x27\xb8\
+\x22\xc6\x36\xce\xc9\x0e\x16\x60\xad\x3c\x7f\x47\x6a\x87\x0b\x0d\
+\x51\xb1\xe7\x4f\xc8\xbf\x9e\xdd\xa9\x52\x3a\x44\x5b\xd6\xda\x57\
+\xf6\xac\x00\xf3\xa7\x7f\x71\x4c\x01\x0f\xcd\x4e\x4f\xad\x58\xe7\
+\x60\xac\x83\xb7\xec\xde\xcc\x7b\x93\x4e\x00\x40\x0e\x4a\xf3\x07\
+\x0a\x6c\x07\x08\xb0\xc6\x8a\x37\x50\xc1\x12\xf8\xd0\x0f\x44\x48\
+\x07\x03\x18\x93\x81\xac\x01\x59\x03\x38\x87\x89\xe1\x12\xf6\x35\
+\x2a\x98\x9a\x69\x60\x66\x62\x16\xd3\x63\x2d\xb4\x1a\x35\x0c\x06\
+\x03\xf4\xfb\x7d\xf4\xfb\x7d\xf6\xad\xbd\x0e\x34\xd5\x30\x36\x36\
+\x86\x46\xa3\xc1\xd6\x45\x42\xb1\x6b\xd7\xae\x61\x73\x73\x33\x08\
+\xb1\x52\xa9\xa0\x54\x2a\x05\x84\xee\x05\xee\x85\x6d\x8c\xc1\xd6\
+\xd6\xd6\x8e\x70\xcc\xfb\xef\x8d\x76\x07\xe7\xaf\x6d\xe2\xfc\xf5\
+\x36\x2e\x6e\x66\xb8\xd4\x51\x70\x8a\xad\x59\xa5\x54\xc6\xfc\xf4\
+\x28\x16\x67\x26\x71\x64\x6e\x1c\x0b\xfb\x46\x60\x25\xdc\x65\xdc\
+\x64\xd1\x4d\x32\x38\xa7\x38\xda\x70\x0e\x90\x48\x86\x1c\x87\xbc\
+\x8c\x77\x14\xac\xb3\xec\xfa\x94\x0e\xa1\xb1\xd2\x8a\x37\x0c\x67\
+\x4b\xc3\x3d\x06\x61\x3b\x80\xb4\x63\x20\xe8\x2c\xb4\x8e\xc4\x05\
+\x3b\x38\x02\xac\x75\x20\xb8\x73\x7b\x56\x80\x2a\xc6\x1f\x53\x4a\
+\x45\xfb\x17\xe6\xc7\xbc\x46\x12\xb1\x16\x53\x21\xc4\x70\x5e\x11\
+\xb5\x16\xfa\x96\x11\x3b\x39\x12\xb2\x07\x30\x69\x8a\x24\x4b\x41\
+\xe4\xe0\x8c\x81\xcd\xd8\x7c\x4f\x36\x63\xec\x1f\x69\x62\x6a\xb4\
+\x85\x7d\x23\x0d\xcc\x4e\x8e\x62\x7a\x62\x34\x84\x4c\x3e\x9e\xde\
+\xde\x5c\xc3\xc6\xaa\x41\x14\x45\xa8\xd7\xeb\x98\x9a\x9a\x82\x14\
+\x08\x05\xd4\xbd\xb5\xb5\x85\xad\xad\x2d\xac\xae\xae\xa2\xd3\xe9\
+\x20\xcb\x32\xb4\x5a\x2d\xd4\xeb\x75\x54\xab\x55\x8c\x8c\x8c\xa0\
+\xe4\x73\xeb\xb2\xab\xfb\xfd\x7e\x10\x76\xd1\x87\x5f\x5b\x6f\xe3\
+\xdc\xf2\x06\xce\xad\x76\x70\x61\xd3\x60\x2d\xd1\x12\x8e\x29\x34\
+\x6a\x35\x1c\x5f\x1c\xc7\x91\xb9\x49\x1c\x9e\x9b\xc4\xd4\x78\x93\
+\x71\x80\x71\xb0\x44\x18\x64\x2e\x00\xb5\x24\x65\x33\x0d\x01\xb4\
+\xa4\x34\xa2\x58\xcb\x46\x62\xf0\x96\x65\x06\x4a\x29\x44\x71\xc4\
+\x9b\x44\xb3\xaf\x57\x60\x2e\x24\xcb\xb2\x20\x13\x7e\x2b\x0d\xad\
+\x23\x58\x97\x41\x47\x11\x87\xe0\x8e\xd7\x35\x2e\x95\x04\x70\x23\
+\x58\x88\xb8\x14\x21\x1b\x64\x7b\xb7\x00\x04\xf5\x98\x73\x94\x2d\
+\x2e\xcc\x57\xac\xcb\xe3\x6e\xef\x57\xc9\x51\x08\xc3\x9c\x23\x58\
+\x93\x41\x2b\x8d\x24\x19\x80\xac\x85\x35\x19\x4c\x96\x22\xcb\x52\
+\xcc\x34\xab\x18\x6d\x94\x31\x35\x3a\x84\xd9\xb1\x61\xcc\x4e\x8e\
+\x61\x76\xdf\xd8\x0e\x01\xa6\x69\x8a\x5e\xaf\x87\x4b\x97\x2e\xed\
+\x40\xdb\x43\x43\x43\x58\x58\x58\x40\xa9\x54\x0a\xaf\x27\x22\xc9\
+\x9f\x6f\x63\x75\x75\x15\x1b\x1b\x1b\x68\xb7\xdb\x18\x1a\x1a\xc2\
+\xc8\xc8\x08\xe6\xe7\xe7\x31\x32\x32\x12\x62\x70\x63\x0c\x92\x24\
+\x09\x4c\x5c\x71\x77\xf7\x07\x03\x9c\x5f\x5e\x67\xc2\x65\xad\x87\
+\x4b\xdb\x16\x9d\x2c\x84\x33\x98\x18\x19\xc6\x3b\x0f\x4f\xe2\xc8\
+\xfc\x3e\x1c\x9a\x19\x47\xa3\x5e\x01\x41\xf1\xee\x32\x0e\xed\x6e\
+\xc2\x34\xb7\x75\xc8\x32\x0b\x07\xa1\xae\xc1\xd1\x8c\x73\x84\x88\
+\x98\xf7\x30\xce\x40\x2b\x76\x07\x70\xa2\x04\x20\x4e\x72\x79\x73\
+\x4e\x04\x5b\x00\xbe\x51\x14\xc3\x5a\x0b\x27\x7a\xe4\x83\x3d\xa5\
+\x14\xac\x75\x81\x65\xd5\xda\xdb\x62\x02\x54\x84\x28\xf2\xae\x03\
+\x70\x46\x2f\xed\x49\x01\x26\x4f\xff\x5a\x43\x01\xff\x68\x66\x7a\
+\xea\x5a\xb5\x52\x9e\xef\xa5\x06\xd6\xf0\xcd\x41\x7c\xb3\xb3\x06\
+\x36\x63\xf2\xc4\x1a\x23\x3b\xba\x8c\xf9\x46\x05\x53\x23\x0d\xcc\
+\x8c\x4f\x62\x76\x72\x14\xf3\x53\x13\x3b\x15\x4b\x62\xeb\x4e\xa7\
+\x13\x4c\x7a\xb7\xdb\x85\x52\x2a\x00\xb2\xd9\xd9\xd9\x1d\xaf\x27\
+\xa2\xe0\xcb\x37\x36\x36\xb0\xb6\xb6\x86\xf5\xf5\x75\xc4\x71\x8c\
+\x56\xab\x85\xd9\xd9\x59\x9c\x38\x71\x42\x16\xc5\x06\x14\x5f\x04\
+\x6c\xde\x7f\x6f\xb6\xbb\x38\x7f\x6d\x0d\xe7\xae\x6d\xe1\xe2\x7a\
+\x1f\x97\xba\x04\xe3\x58\xe0\x91\xd6\x98\x99\x1c\xc7\xdb\xe7\xa6\
+\x70\x74\xff\x14\x16\x67\xc6\x51\x2a\xc5\xac\xe0\x8e\x43\xe0\xed\
+\x01\xef\xea\xcc\x5a\x38\x52\xc8\x32\x46\xe8\x8e\x08\x8a\x14\x87\
+\x66\xd6\x72\xce\xc2\x9b\x6d\x21\x6c\x9c\x25\xa8\xc8\xe5\x44\x17\
+\x18\x07\x19\xc3\x5c\x82\x47\xf9\xc1\xdc\xcb\x6b\x74\xc4\xd4\xb8\
+\xdf\xd5\xc6\x32\x01\xa7\x01\x10\x39\x58\xc7\x96\xc1\x18\x01\x86\
+\x04\x4e\xa5\x3b\xb6\xc8\x5b\x83\xf5\x97\xf6\xa4\x00\xc3\x18\xfa\
+\x7f\x40\x68\x7e\xe0\xef\xfd\xd0\x98\x92\x98\x7f\xd0\xeb\x22\x4b\
+\x07\x48\x07\x7d\x4c\x36\x2b\x98\x68\x56\x31\x3d\xd5\xc0\xbe\xd1\
+\x49\xcc\x4e\x8c\xe0\xe0\xdc\xd4\xad\x2d\x09\x51\x30\xaf\xde\x7f\
+\x0f\x06\x9c\xce\x2e\x97\xcb\x61\xc7\x16\x85\xed\xa9\xd2\xc1\x60\
+\x80\x76\xbb\x1d\x84\xee\x9c\x43\xa3\xd1\xc0\xf8\xf8\x38\x8e\x1d\
+\x3b\xb6\x23\x24\xeb\x76\xbb\x37\x09\x3c\x49\x12\xac\x6c\x6c\xe3\
+\xfc\xb5\x0d\x9c\x5d\xde\xc4\x85\xf5\x01\x56\xfb\x04\x27\x3b\xb4\
+\x52\x2e\x63\x71\x7e\x12\x87\xe6\xa6\x70\x6c\xff\x34\x0e\xce\x4c\
+\xc0\x58\xc6\x2c\xd6\x11\x8c\xb5\x18\xf4\x52\x90\x52\x1c\xa2\xc9\
+\x26\x50\xf2\x7b\xa5\xbd\x6b\x74\x1e\xf2\xb0\x6f\x27\x4e\x6b\xc3\
+\x9b\xfa\x90\xf0\x62\x6b\x19\x58\x4f\x11\xa8\xb3\x0e\x91\x8e\x42\
+\x64\x25\x86\x00\x70\x94\x83\x3c\x28\x51\x02\xe1\x4b\x34\x83\x4e\
+\x67\x6d\x70\xc9\xd6\xba\x40\xaa\x51\x1e\x5e\x6f\xfc\xce\x87\x1f\
+\xed\xec\x5a\x01\x0e\x9d\xfe\xed\xff\x49\x2b\xf5\x53\x27\xdf\xf1\
+\xb6\xf6\xe4\xe8\x70\xa9\xd3\x4f\xd1\xef\x76\xf0\xbe\xa3\x13\x38\
+\x36\x3f\x8e\x43\xf3\xd3\x41\x58\xb7\xba\x7c\x8a\xb3\x08\xd8\x92\
+\x24\x81\x52\x0a\xf5\x7a\x7d\x07\x60\xcb\xbf\x78\xbe\x6b\x7b\xbd\
+\x1e\xb6\xb6\xb6\xb0\xb9\xb9\x89\x2c\xcb\x50\xad\x56\x31\x36\x36\
+\x86\x03\x07\x0e\xec\x00\x6c\xb7\x42\xe8\xbd\x5e\x1f\x17\xaf\x6f\
+\xe0\xfc\xf2\x46\x00\x6c\xed\xd4\x2f\x22\xd0\x1c\xaa\xe3\xc4\x91\
+\x49\x1c\x3f\x34\x8f\x63\x0b\xd3\x18\x6f\x35\x83\xd0\x9c\x23\x74\
+\x93\x0c\x99\x31\xb0\xc4\x02\xb6\x42\xab\xea\x28\x82\x25\x97\x9b\
+\x54\xc5\x4c\xa4\x15\x66\x53\x41\x07\x05\x20\x21\x69\x84\xc8\x10\
+\x64\xef\x02\xd0\x63\xa1\xe8\x20\x4c\x8f\x9d\x68\xc7\x9a\x4a\xbc\
+\x2f\x18\x8a\xc4\x1d\xf9\x10\x5b\x43\xc3\x5a\xca\x3f\x53\xa2\x03\
+\x8e\x3a\xa3\xb0\x91\xb4\xd2\xd0\x4a\x2d\x79\xd9\xbc\xaa\x02\x1c\
+\x38\xfd\x3f\x7e\x50\x03\xff\xfc\xf0\xc1\xfd\x57\xde\xfb\xf0\x5b\
+\x66\x13\x43\xe8\xa7\x16\xc9\xa0\x8f\x13\x07\xf6\x61\xff\xcc\xe4\
+\x4d\x82\xf7\xfe\xdb\x03\xb6\x5e\xaf\x87\x2c\xcb\x10\xc7\x31\x6a\
+\xb5\xda\x4d\x80\xcd\xff\x4d\x31\x2d\xda\xe9\x74\xd0\x6e\xb7\x91\
+\x65\x19\xca\xe5\x32\x26\x26\x26\x30\x33\x33\xb3\x43\xe0\x9b\x9b\
+\x9b\x41\xe0\x7e\x87\x6f\x75\x7a\x58\x5a\x5e\xc7\xb9\xe5\x0d\x2c\
+\xad\x6d\xe3\xd2\x66\x86\xd4\xf1\x02\x42\x01\x93\x63\x23\x78\xf7\
+\xc2\x0c\x8e\xee\x9f\xc1\xd1\x85\x69\x0c\xd5\x2b\x00\x29\x58\x72\
+\x48\x8d\x41\x77\xc0\xfe\xdb\x92\x42\xe6\x2c\x32\x63\x19\xdb\xc8\
+\xdf\x3b\x08\xef\x01\xde\xb9\x2c\x5c\x07\x90\x82\x52\x3a\x27\xc3\
+\x34\xd7\x2b\x8a\xec\x40\x21\xd1\xe5\x51\x38\x89\xf9\x66\xb2\x4b\
+\x2b\xc5\x18\x80\x08\x4a\x47\x9c\x5a\xa6\x7c\x7d\x54\x20\x73\x34\
+\x0b\x5f\x3e\x46\x29\x8d\x28\x62\xf6\xcf\x0a\x5b\xc9\xc2\x07\x28\
+\xb3\x8c\x03\x24\xab\x09\x00\x91\x56\x20\xb8\xdd\x29\xc0\xe4\xe9\
+\x5f\x6b\xc4\x88\x3e\xda\x6a\x34\x56\xfe\xc1\x07\xfe\xde\xec\x20\
+\x73\xe8\x26\x4c\x3d\x12\x01\xb5\x4a\x39\x98\x5c\x8f\xa0\xbd\xc0\
+\x3d\x5b\xd6\x68\x34\x6e\x02\x6c\x45\x81\xf7\x7a\x3d\xf4\x7a\xbd\
+\x90\x1a\xf5\xe1\xd9\xc8\xc8\x48\x88\xc1\x8b\x02\x2f\x86\x64\x9c\
+\x2c\xe9\xe0\xfc\xf2\x1a\xce\x2e\x6f\x60\x69\xb5\x83\x95\xae\x85\
+\x95\x85\x8d\x22\x8d\xb9\xe9\x7d\x38\xbc\x30\x83\xfb\x0e\xcc\xe2\
+\xe0\xec\x24\xaa\x95\x0a\x9b\x74\x01\x69\xdd\x81\x61\x6a\x34\x4b\
+\xa1\x54\xc4\x98\xc6\x0b\x15\xbc\xab\x9d\x0a\x81\x2e\xc7\xde\x8a\
+\xa0\x95\xe2\x14\xb5\x72\x20\x62\x22\x8c\x88\xb9\x0c\xf6\xbd\x96\
+\x99\x38\x28\x2e\x5c\x89\x39\xdb\xe8\xa4\xde\x81\x01\x5d\x0e\xa4\
+\x8d\x7c\x96\x4f\x1b\xc7\x31\x57\x40\x69\x4f\x86\x05\x81\x2b\xc9\
+\x87\xb8\xf0\x33\x14\x2b\x91\x57\xa8\x38\x8a\x60\x60\x61\xc9\x22\
+\x2e\xc5\x42\x22\xb1\x05\x73\xd6\x41\x47\xb8\xb4\x2b\x05\x68\xa2\
+\xf9\x0b\x1a\x6a\xec\x03\x8f\x9e\xc2\x20\xb3\xe8\x25\x06\x7d\x31\
+\x89\xe9\xa0\x87\xb5\xb5\x55\xf4\x3b\x5b\xe8\xf5\x7a\x00\x10\x00\
+\xdb\xe1\xc3\x87\x77\xe4\xf2\x81\x9d\x85\x0f\xdd\x6e\x37\xb8\x02\
+\x80\xfd\xbe\xa7\x55\xbd\x62\x18\x63\xb0\xb1\xb1\x71\x13\xc3\x76\
+\x71\x65\x13\xe7\x96\xd7\x98\x43\x5f\xef\xa3\x9d\x30\x1a\x06\x14\
+\xaa\xd5\x32\x0e\x1f\x9c\xc5\xe1\x85\x19\x1c\x5f\x9c\xc3\xc1\xd9\
+\x7d\x70\x96\xc2\x6e\xcd\xac\x41\x2f\x35\xc8\x8c\x43\x6a\x32\x58\
+\xc3\x2c\xa5\x52\x1a\xc6\x38\x0e\xc7\x94\x67\x4d\x3d\xc9\xc2\xa8\
+\x9c\x3f\x41\x43\x6b\x02\x91\xe2\x60\x5b\x29\x71\xc9\x0a\x5a\xb3\
+\x29\xb7\x52\xb5\xe4\x73\x15\xde\x3f\xe7\x48\x5d\x43\xc1\xc1\x11\
+\xe3\x07\x22\x46\xfc\x4a\x14\xc5\x92\x45\xa4\x62\x08\xc9\x8b\x9b\
+\xbc\x2a\xb1\x83\x51\x9a\x79\x01\x2f\x5c\x1d\xf1\xce\x37\x36\x83\
+\xb1\xfc\x7d\xa2\x38\x86\x31\x4e\x54\xd7\x7f\x27\xc0\x66\xee\xec\
+\xae\x14\x80\x40\x0f\x2b\xc2\xa0\xd1\x68\x54\xd7\xb7\x3a\x18\xf4\
+\xfb\x48\xfa\x5d\xc4\xca\xe0\xd0\x68\x8c\x08\x84\x46\xa3\x11\x00\
+\xdb\x8d\x6e\xa0\x08\xf2\xba\xdd\x6e\xf0\xfb\x1e\xe8\xdd\xb8\xc3\
+\x37\x36\x36\x76\xf8\xef\x76\xa7\x87\x0b\x2b\x1b\x38\x77\x75\x0d\
+\x4b\xd7\xb6\x70\x71\xb3\x8f\xbe\x11\x7a\x10\xc0\x70\xb3\x81\x07\
+\x0e\x4e\xe3\xfe\x43\xfb\x71\xdf\x81\x39\x4c\x8c\x0e\x33\x3a\x17\
+\x81\xf7\x53\xc3\x26\x5c\xd8\xb4\xd4\x1a\x44\x3a\x82\x71\x96\xd1\
+\xb7\xca\x43\x3b\x1d\xc5\x81\x99\x04\x98\xd6\x26\x9b\x27\x98\xe0\
+\x7d\xaa\x58\x62\x67\x29\xf8\x6c\x5f\xd1\xa4\x00\xd8\x74\x80\xe5\
+\xcb\xe7\xd1\x5e\x5b\x41\x63\x74\x02\x63\xf3\x07\x90\x25\x29\x4c\
+\x6a\x50\x1b\x6a\x20\x2e\x57\xe1\xb9\x7a\x2b\x40\xd1\x89\xc5\x51\
+\xc4\x51\x07\x09\x4b\x1a\x02\x03\x31\xe9\x0a\x6c\x69\xb4\x10\x41\
+\x04\x01\x9d\x44\x1c\x79\x48\xb6\x2f\x14\x9f\x18\x4e\xd2\xe9\x88\
+\xcb\xe9\xc8\x91\xc7\x04\x17\x77\xa5\x00\x0a\xaa\xac\xa2\xb8\x6b\
+\x2c\x55\x2b\xd4\xc7\x8f\xbc\x65\x46\x88\x8e\x91\x9b\x5e\xeb\xf3\
+\xe0\x5e\xe0\x9e\x78\x01\x80\x5a\x8d\x99\xb9\x28\x8a\x82\xb0\x93\
+\x24\x09\x95\xad\xde\x7f\xaf\x6d\x75\xb0\xb4\xbc\x86\xb3\x57\xd7\
+\x70\xee\x5a\x1b\xd7\x3a\x5c\x3e\xe6\xbf\xcd\xe4\xc4\x28\xde\x76\
+\x60\x0e\xc7\x17\x17\x70\x78\x61\x16\xcd\x46\x0d\x20\x0d\x4b\x6c\
+\x56\xfb\xa9\x91\x5d\xc4\x8b\x6a\xac\x65\x06\x4e\x6b\xa1\x4a\x55\
+\x88\x97\x75\xe4\x61\xb5\x20\x76\xad\xc3\x02\x91\xa7\xb1\x55\x48\
+\xb7\x04\xb6\x93\x43\x2a\x1f\xc6\x11\xda\xab\xcb\x58\x5e\x3a\x83\
+\x4b\x67\xbe\x8b\x4b\xaf\x7c\x17\x9b\xd7\xaf\xa2\x5c\x2e\x8b\x55\
+\xd0\x38\x7a\xec\x18\xde\xf5\xc8\x29\xbc\xed\xf8\x71\x7c\xe9\xcc\
+\x65\x8c\xce\x1c\x0c\x40\xcd\x17\x3b\x58\x97\xd7\x3f\xfa\x62\x08\
+\x47\xd8\x11\x15\xb0\xf7\x61\x50\x67\x9d\xc9\xd7\x5d\x14\xc3\x5b\
+\x82\xa0\xa1\x92\x0c\x52\x12\x56\x3a\x9b\x87\x99\x26\x4b\xce\xef\
+\x4a\x01\x72\x53\xe0\x30\x37\x5c\xc1\x23\x0f\x1e\x0d\x66\xdd\x73\
+\xea\xc5\xd2\x26\x5f\xe9\x52\xab\xd5\x30\x33\x33\x03\x00\x41\xc0\
+\x9e\xaa\x2d\x9a\xf3\x2b\x6b\x5b\x38\x73\xf9\x3a\xce\x5d\x5d\xc7\
+\xd2\xea\x36\x36\xfb\x36\x18\xdb\x28\xd6\x98\x9f\x99\xc1\x91\x03\
+\xb3\xb8\x6f\x71\x01\x47\x16\x66\x11\x97\x23\x8e\x9d\xa5\x9e\x30\
+\xc9\xd8\x64\x72\x02\x49\xc2\x45\x84\xc4\xa2\xe4\x1c\xc0\xa9\x66\
+\x95\x67\x16\x99\xae\xe6\x42\x15\x72\x4c\x41\x2b\x4d\x20\xb2\x00\
+\x24\x9d\x0a\x29\x4f\x23\x82\x93\x04\x56\xda\xef\x60\xf9\xe2\x39\
+\x5c\x3d\xf7\x22\x2e\x9e\x79\x01\xd7\x96\xce\xc0\x99\x14\xd5\x6a\
+\x15\xe5\x72\x19\xd3\x93\x93\xf8\xe1\xf7\x3e\x82\x23\x47\x8e\xe0\
+\xd8\xb1\x63\x58\x58\x58\x08\xe8\x5b\x29\x85\x27\xbe\xfb\x45\x90\
+\x75\x20\x01\x6a\xbe\xd8\x05\xc4\xac\x29\x5b\x4e\xc6\x8e\xaa\x50\
+\x3c\xc3\xdb\x56\x56\x46\x2b\x98\x94\xad\x00\xbf\x37\x2b\x2f\x0a\
+\x91\x01\xd3\xea\x0a\x5a\x45\x50\x0a\xc8\xd2\x14\x0e\x52\xa3\xa1\
+\x08\x9d\x6d\x17\x4a\xe6\x5f\x55\x01\x54\xa4\xb4\x73\x16\xbd\xfe\
+\x20\x98\xf6\x4e\xa7\x83\xb5\xb5\xb5\x50\x97\xde\x68\x34\xb0\xb8\
+\xb8\x18\x7e\xef\x77\x74\xb1\x14\x6a\xb3\xbd\x8d\xf3\x57\xd7\x70\
+\xee\xea\x2a\xce\x5e\x5d\xc7\x85\xb5\x0e\xba\xa9\x0d\xe6\xbc\x56\
+\xad\xe2\xe8\xa1\x79\x1c\x3b\x38\x8f\xe3\x8b\x0b\x38\xb0\x30\xcd\
+\x7e\x58\xca\xb3\x38\x9f\xef\x98\x11\x73\x08\xd5\x45\x56\xc0\x10\
+\x51\x1e\x7a\x01\x40\xe6\x0c\x22\xa5\xe1\x34\xf9\xbc\x08\x0b\xd4\
+\x11\x9c\x03\x94\x26\x28\x92\xe7\x05\x9d\x93\x4f\x3e\x11\x9b\xf8\
+\x8d\xb5\xcb\x58\x3e\x7f\x06\x4b\x2f\x7d\x07\x97\xcf\xbe\x88\xad\
+\xd5\xe5\x20\xec\x4a\xa5\x82\x07\x1f\x38\x81\xfb\xef\xbf\x1f\xf7\
+\xdd\x77\x1f\x0e\x1f\x3e\x8c\x89\x89\x89\x00\xea\x3c\x9b\x19\xc2\
+\x2f\xad\x61\x4c\x2a\x21\x62\x40\x74\xe1\xfe\x39\x29\xe6\x98\x25\
+\xd4\x51\x50\x54\x5f\xc0\x21\x5e\x01\x9c\xd6\x57\xb0\x45\xee\xc0\
+\x3a\x00\x5c\x53\x19\xa9\x88\x95\x9a\x98\x26\xb7\x04\x38\xc5\x89\
+\x20\x22\x02\x2c\xba\xbf\xf3\x73\xef\x08\x15\xa4\xbb\xb0\x00\x24\
+\x9a\x23\xbb\x20\x4d\xb1\xb5\xb5\x85\x43\x87\x0e\xe5\xaf\x28\x94\
+\x33\xfb\xdd\xde\xe9\x74\xb0\xd9\xde\xc6\x5f\x7f\xe3\x05\x3c\xf3\
+\xf2\x25\x5c\xb8\xbe\x2d\xad\x5c\x6c\xb2\x46\x5a\x0d\x3c\x78\x78\
+\x16\x6f\x3a\x72\x10\xc7\x0f\x2d\x60\x72\x6c\x84\xd3\xbc\x92\xf0\
+\x48\x53\xe6\xd1\xb9\x4e\xcf\x85\x90\xc8\x89\x94\x94\x66\x53\xa9\
+\xfd\x22\xc9\x6e\x66\x85\xc8\x01\x8f\x8e\x22\xf1\x7f\x85\x9d\x22\
+\xa6\x5d\x56\x9d\x2b\x79\xfb\x7d\x2c\x5f\x38\x83\x4b\x67\x5e\xc0\
+\xd2\xcb\xcf\x63\x59\x76\x77\xad\xc6\x25\x5f\x95\x38\xc6\x63\x8f\
+\x3d\x86\x63\xc7\x8e\xe1\xd8\xb1\x63\x58\x5c\x5c\x44\xa3\xd1\xb8\
+\x89\xa8\xf2\xeb\x51\xac\x83\xf0\x0f\x26\x94\x14\x83\x49\xc5\x48\
+\xdf\x0b\x57\x18\x22\x00\x14\xd2\xe1\x44\x5e\x39\x14\x1c\x18\x34\
+\x96\x4a\x25\x40\x69\x28\xe5\xef\x27\x27\xf9\x5d\xe6\x98\x52\x06\
+\x73\x18\xc6\x59\xb1\x02\x1c\x5d\x28\xa5\x40\x16\x57\x8b\xd2\x7d\
+\x75\x05\xb0\xbc\xdb\xfa\x49\x1a\x4c\xba\x47\xef\xfe\xf2\x37\xef\
+\xc3\xba\x76\xbb\x8d\x6f\xbe\xb4\x84\x3f\xfc\xcb\xbf\xc1\xda\x36\
+\x5b\x8e\x89\xb1\x11\x9c\x38\xb2\x88\x13\x87\xf7\xe3\xd8\xe2\x02\
+\x1a\xf5\x2a\xef\x34\xb0\xe0\xfa\x92\x24\xb1\x2e\x50\x26\x21\xd3\
+\x18\xca\x01\x25\x9e\x57\x21\xdd\x98\x67\x20\x7d\x9d\x20\x57\x17\
+\xf3\x2e\xb2\xd6\x4a\x2e\x95\x01\x1c\x39\x0a\x0b\xb1\xb9\x72\x15\
+\x97\xcf\xbd\x84\xa5\x17\xbf\x83\x8b\x67\x5e\xc0\xe6\x75\xde\xdd\
+\x95\x4a\x05\xe5\x72\x19\x07\x16\xe6\x70\xfc\xf8\xf1\xb0\xbb\x0f\
+\x1f\x3e\xcc\x71\x7c\x41\xa0\xb6\xc0\xb8\x15\x9f\xbf\x9d\x12\xb0\
+\x5b\x12\xa1\x68\x20\x33\x19\x97\xb7\x09\x9e\x50\x9a\x79\x7e\x4e\
+\xa8\x09\x3e\x41\x01\x06\x10\xc2\x46\xe0\xf4\x7b\x41\x6f\xc4\x32\
+\x40\x80\x22\x0a\x39\x83\x38\x8a\x98\xc0\x62\x65\xbf\xbc\x37\x05\
+\x88\x78\x51\x7d\x6a\xf4\xda\xb5\x6b\x58\x5b\x5b\xdb\xb1\xfb\x3d\
+\x97\xef\x77\xfe\x9f\x7f\xf1\x59\xfc\xc9\x13\xdf\x42\x14\x69\x9c\
+\x7a\xe7\x5b\xf0\xe3\xef\x7d\x17\x26\xc7\x5b\xc1\x77\x13\x14\x52\
+\xcb\xe9\x64\xcf\xa9\x07\xae\x8c\x54\x20\x36\x10\x08\x3b\xe5\xeb\
+\x28\x42\x6e\x9b\xa5\xcd\xa1\x99\x75\x2e\x18\x52\x5f\x46\xe6\x42\
+\x98\x26\xf5\x83\x4a\xe3\xfc\xf3\xcf\xe0\x6b\x8f\xff\x05\x2e\xbc\
+\xf2\x22\xe0\x0c\x6a\xb5\x1a\x2a\x95\x0a\x2a\xa5\x12\x1e\x78\xe0\
+\x01\x9c\x38\x71\x02\x47\x8e\x1c\xc1\xfd\xf7\xdf\x8f\xd9\xd9\xd9\
+\x1d\x42\xf5\xbb\x7c\x37\x82\xbe\xd5\xcf\x4a\x30\x48\x48\xcf\x90\
+\x0e\xe4\x10\x08\x30\xb0\x85\x8a\x29\xb9\x4b\x27\x45\x30\x05\x1e\
+\xc0\x58\x69\x0b\xf7\x1b\x01\xec\xdb\x33\xeb\x40\x56\xde\x4f\x31\
+\x70\x55\x12\xe2\x92\x53\x52\x0b\xe0\x60\xed\x5e\x15\x00\x40\x36\
+\xe8\x41\x75\x37\x71\xed\xda\x35\x68\xad\x31\x3e\x3e\x1e\x76\xbe\
+\x17\xbe\x37\xfd\x5f\x78\xf6\x0c\xfe\xf8\x89\x6f\xa1\x5a\x2e\xe1\
+\xd7\x7f\xe1\x1f\xe2\xfe\x43\xfb\x43\x4a\xd4\x5a\x29\x0e\x85\x0f\
+\x7d\x8a\x34\xa9\x5c\x8a\x42\xd8\x86\xa0\x14\x40\xa4\x34\x48\xc9\
+\x6b\x1d\x0b\x5a\x39\x00\x9a\x72\x9e\x1c\x2e\xb7\x0c\xde\xe4\x03\
+\x82\x25\x2c\xce\xbf\xf8\x6d\x2c\xbd\xf8\x1d\x4c\x4c\x4c\x60\x71\
+\x71\x11\x0f\x3c\xf0\x00\x8e\x1d\x3b\x86\xa3\x47\x8f\x62\x74\x74\
+\x74\x47\x3b\x56\x51\xd8\xb7\xdd\xd1\xaf\x22\xf4\xe2\xcf\x79\xc5\
+\xb2\x96\x02\x57\xa1\x7c\x7d\x9b\x9b\x84\x7f\xc6\x5a\x76\x6d\x11\
+\x97\xbe\xe5\x0c\x24\xe3\x15\x67\x04\xd9\x2b\x51\x00\x2d\xae\xcc\
+\x72\x6a\xd0\x05\xba\x59\x73\x5d\x00\x11\x0c\x09\x23\x08\xc0\x91\
+\xdd\x9b\x0b\x20\x0b\xcc\xb5\x62\xfc\xd2\xcf\xfe\x23\x00\x40\xa7\
+\xd3\xc1\x95\x2b\x57\x76\x2c\x56\x91\xc6\xfd\xf8\x97\xbf\x05\x00\
+\xf8\xb9\xbf\xff\x7e\x1c\x3d\x38\x8f\xd4\x32\xc5\xea\x0a\xe6\x9b\
+\x8a\xa6\x4d\xf9\xba\x36\xd9\x1b\x9e\x78\x51\xe4\x7f\x14\xee\x3c\
+\xaf\x68\xf5\xa5\x42\x3e\xdb\xe6\x17\xda\x57\x10\xb1\x22\xf9\x9d\
+\xc4\xff\xb6\xce\x22\x19\x0c\x50\xab\xd5\xf0\x9b\xbf\xf9\x9b\x38\
+\x79\xf2\x64\xf8\xfe\x45\x65\xde\x8d\xb0\xf7\xa2\x04\x3b\x9e\x13\
+\x41\x07\xfe\x5e\x2b\x64\x19\x5b\x3f\x2d\x34\x72\xde\x1c\x23\x55\
+\xbd\x52\xf7\x48\x36\xc7\x2d\xac\x38\x56\xe8\xe7\xbc\xa8\x26\x16\
+\x06\x92\xcd\xbf\xd4\x4e\x42\x2c\xac\xe2\x7e\x0b\x67\xe9\xc2\x9e\
+\x14\x40\x01\xc8\x92\x24\xdc\x84\x2f\x36\x28\xde\xa8\x47\xfe\xe7\
+\xae\xae\x61\xe9\x7a\x1b\xa3\xad\x61\x3c\xf4\xe6\xe3\x48\x33\x0b\
+\xa7\x14\x8c\xf5\x7c\xb6\x0a\x0c\x1b\xef\xef\xbc\xa0\x93\x11\x6f\
+\x9e\x00\xf1\xdc\x37\x1b\x33\x17\xc2\x1d\x45\x10\xe6\xcf\xe5\x3e\
+\xd0\x79\x4d\x29\x80\xc3\x40\xdc\xa8\xb0\x03\xad\x35\x88\xe3\x18\
+\xda\x57\x29\x79\xc5\x79\x1d\x04\xbd\x9b\x9f\x73\x54\x2f\x24\x0f\
+\x01\x51\x1c\x21\x33\x06\x46\xfa\x1b\x39\x2f\x10\x89\x9f\x97\x66\
+\x39\xf9\xfe\x5a\x6b\xa8\x48\x23\xb8\x04\xbf\x79\xc4\xb5\xfa\xb0\
+\xd1\x5b\x18\x9e\x20\x22\x20\x51\x4c\x88\x21\x75\x6d\x6f\x16\x00\
+\x10\xbe\x3c\x37\xd4\xc5\x2e\x1c\x0f\x00\xd3\x34\xc5\x97\x9f\xe3\
+\xf0\xf2\xc1\xe3\x47\xd8\x27\x81\xd9\xa8\x48\x47\xa1\x46\x9d\x28\
+\x2f\x6b\x82\x2b\x00\xb8\x02\xcb\xc6\x14\x2a\x0b\xde\x13\x2a\x41\
+\x31\xb4\x82\x12\xd3\xa6\xa5\x8c\x4a\x47\xb9\x40\x41\x4c\xac\xe4\
+\xe1\x97\x12\xb7\x62\x91\xa5\x29\x17\xae\xdc\xe5\x0e\xdf\xab\xd0\
+\x77\x54\x44\x03\x92\xe1\x93\x34\xaf\x64\x17\x1d\x39\xc4\x51\x04\
+\x07\x0d\xdf\xa8\x67\x1c\xe7\x00\x38\xd7\xc0\x55\x57\x1e\x2c\x93\
+\xb1\xd0\xe2\xe7\x1d\x39\x58\xe3\xa4\x48\x44\x32\x8b\x8e\x79\x4c\
+\x38\x25\x56\x82\x65\x1f\xfb\xe6\x1b\xa2\xf3\x7b\x52\x00\x00\xe8\
+\x49\x04\x50\x14\xbe\xf7\x93\xc5\x72\xaa\x17\x96\x56\x00\x00\x07\
+\xe7\xa6\xc5\x74\x41\x84\xe4\x82\x79\x56\x3a\x92\xbe\x01\x2b\xf5\
+\xfd\x3a\xec\x7c\xad\xbc\xd9\xf2\x95\xcc\xac\xe9\xc6\xd9\x1b\x6c\
+\x92\x70\xdf\x04\xe1\xc3\xf3\x6a\x59\x40\x4a\xd0\x94\x82\x75\x08\
+\x25\xe4\x14\x18\xa2\x82\x72\xdf\x05\xa0\xdb\x8b\xd0\x8b\x0f\x4f\
+\xcf\x66\xc6\x82\x54\x04\xed\x0b\x3d\x34\x5b\x00\x2d\xcd\x2d\xd6\
+\x5a\x38\x10\xb4\x8e\x61\xa5\x85\x8e\x2d\x18\x41\x29\x17\xfa\x26\
+\xac\x71\x92\x2c\xd2\x88\x14\xf3\x06\x61\x33\x88\x3b\x8c\x62\x49\
+\xc0\x99\x4c\x80\xb3\x82\xcb\x06\x17\x8b\x6b\xb0\x3b\x05\xb0\x3b\
+\x7f\x0e\xbb\x0d\x79\xf9\x56\x6f\x90\x60\xb5\xdd\x05\x00\x4c\x4d\
+\x8e\x71\x37\x50\x61\xbd\x25\x85\x01\x1f\xb7\x28\x4f\xb9\xc2\x72\
+\x64\x2c\xcd\xa1\x21\xc5\xae\x08\x1a\x82\x62\x95\xbc\x43\x21\xf4\
+\x73\x81\x2b\x2d\x34\x8b\x16\x65\x4c\x08\xbd\x88\x0a\x3a\x44\x04\
+\x45\xe1\xdc\xe8\xca\x5e\xcb\x6e\x7f\x35\x45\xf0\x26\x9c\x51\x3f\
+\x57\x02\x6b\xad\xe0\x24\xc5\xcc\xb7\x28\x78\xc6\x71\xf5\x8e\x25\
+\x03\x92\xef\xce\xe5\x5c\x9e\x00\xe2\xc8\xcc\xdf\xa7\x71\x2e\x00\
+\xc6\x9c\x57\xc8\x37\x2b\x6f\x32\x0d\xe7\x4c\xfa\xa6\xf8\xca\xde\
+\x5c\x80\x7f\x83\x76\xa7\x8b\xe6\x50\x7d\xc7\x1b\xfb\x1b\x73\xce\
+\xe1\xfa\x56\x17\x69\xc6\x7e\x6c\x7c\xa4\x15\x0a\x43\xfd\xb7\x21\
+\xf9\xf7\x8e\xfc\x36\xbc\x3f\xf7\xf4\x27\xfb\x70\x0f\xde\x28\xcf\
+\xa1\x85\xcf\x25\xf2\xb9\x74\xaf\x45\xf2\x4a\x97\xf3\xe8\x5c\x02\
+\x9d\xd7\xc9\x41\xb2\x73\x59\x92\x0f\xd1\x78\x3d\x76\xfb\x9d\x84\
+\x5e\xfc\xbf\xd6\x1a\xdb\x9d\x0e\xc8\x57\x0b\x01\x20\xa5\x78\xbc\
+\x8d\xb1\x80\x05\xac\xe6\x64\x90\x23\x82\x83\x13\xe5\x97\x34\xf3\
+\x8e\xac\x60\x7e\xdf\x24\x18\x89\x4d\x3b\x77\x30\x2b\x09\x89\x7c\
+\x19\x38\xaf\xb1\x83\x72\x04\x67\xed\xca\x87\x3f\xfc\xe1\x1d\xdb\
+\x79\x97\x0a\x00\xb4\xb7\x3b\x41\x01\x6e\xd4\x6c\x63\x0c\x56\x36\
+\xb6\x91\x5a\x42\xad\x5a\x45\xa5\x5c\x0a\x8c\x9d\x4f\x85\x2a\xe1\
+\x58\xfd\xd3\x44\xbe\xd2\x35\xff\x39\x87\x84\x05\x22\x88\x5c\x6e\
+\xde\x3d\x88\xf2\xef\x48\xca\xc3\xc6\x42\x66\x2f\xa7\x59\x9d\x74\
+\xc9\x68\x95\x2b\x54\x8e\x39\x5e\x7f\xa1\x17\x1f\xfd\x7e\x1f\xcf\
+\xbf\xf8\x32\x2e\x2c\xaf\xe1\xea\xd6\x00\x49\x5c\xc3\xbe\xb9\x83\
+\x5c\xc8\xa9\x14\x34\x71\xc8\xc6\x15\xc2\x4c\x10\xa1\xb0\x73\xad\
+\xe5\x30\x31\x70\x24\x85\x4d\x17\x52\xcd\x4e\xc8\x1f\xe2\xf4\xb0\
+\xb2\x8c\x1d\x3c\x5e\x80\x7f\xad\xcc\x2d\x70\x4a\x5d\xbf\x51\xb6\
+\xbb\x52\x00\x1d\x45\x58\xdb\xdc\xc6\xdc\xf4\xbe\x1d\x0b\x58\xc4\
+\x01\xd7\x36\xb7\x61\x1c\x61\xb2\xd5\xcc\x17\x04\xbe\xaf\x9f\xa4\
+\x07\x80\x02\xb0\x63\x92\xc3\x93\x15\xf2\xb3\x68\x41\xa1\x80\x2a\
+\x24\x71\x98\xce\xe5\x8a\x16\x4f\x8d\x92\xd8\x0a\x85\x88\xe9\x5d\
+\xf2\x1b\x44\x05\x35\x22\x22\x58\xb8\x3b\x0a\xeb\xd5\x94\xe0\x6e\
+\x14\x41\x29\x85\xaf\x9d\x59\x41\x6d\x74\x16\x23\x07\x86\x50\xa9\
+\xd5\x51\xad\x0d\x49\x8d\x3e\xe0\xc0\x26\x9b\xf3\xf8\x80\x76\xc2\
+\x06\xb2\x11\x43\x9a\x1a\xf6\xed\x0a\x81\xca\x25\xe2\x81\x1a\x31\
+\xb4\x00\x5b\x92\x2c\x1f\xb7\x7c\xa3\x60\xf5\x14\x29\x29\xfe\xe0\
+\x42\x54\x1d\x69\x44\x37\x44\x00\xbb\x52\x00\xad\x95\xd6\x51\x8c\
+\x4e\xaf\xbf\x23\x12\xf0\x37\xeb\x15\xe0\xfa\x7a\x07\x44\x5c\x72\
+\x05\xbf\x7b\x3d\xea\x77\x04\x57\xa8\x58\xf1\x29\x56\x5f\x32\xb5\
+\xc3\x2d\x48\xf3\xa2\x0f\xf9\x18\xf0\x08\xf2\x85\xac\x4e\x28\x94\
+\xd4\x02\x26\xbd\x32\x92\x24\x4c\x74\xee\x13\xbd\x49\x24\x87\x2c\
+\x19\xdc\x44\xcc\xbc\x9e\x7e\xbe\xf8\xa8\x54\x2a\x38\x75\x7c\x0e\
+\xcf\x6c\x94\xd0\x68\x8d\x73\xcd\x41\x1c\xe5\xc9\x26\x07\x10\x59\
+\x18\x6b\x84\xd3\x57\xa1\x89\x26\xcb\x0c\xa0\xb8\x88\x26\xd2\x31\
+\x1c\x11\x92\x34\x0b\x55\xd2\x69\x9a\x89\xc0\x29\x6f\x1c\x11\x6b\
+\xa1\xe1\x41\x3a\x93\x6e\x44\x3c\x46\x27\xb3\x06\x0e\xee\xa6\xf1\
+\x79\xbb\x1a\x2d\xa6\xa1\xb0\xb6\xb5\x1d\xcc\xd3\x8d\x18\x20\xcb\
+\x32\x5c\x59\xdb\x02\x00\x4c\x4f\x8e\x87\xba\x74\x92\x98\xdd\x87\
+\x70\x5e\xfc\x05\x14\x18\x6c\x3f\x89\x70\x3d\x5a\x0e\x97\x02\xa2\
+\x98\x2b\x64\x38\x74\xb2\xa1\xd3\xc8\x39\xc7\x26\x5f\x32\x7d\x51\
+\x14\x71\x5e\x1f\x90\x82\x1d\x15\xc8\x24\x82\x20\xec\x82\xe0\x6f\
+\x54\x82\xdd\xfc\x7c\xbb\xe7\x6e\x7c\xde\x18\x83\x07\xee\xbf\x0f\
+\x8d\xc1\x75\xa4\x49\x1f\x80\x82\x49\x2d\xb2\x34\x83\x75\x26\xb0\
+\x9a\x71\x29\xe6\xd8\x5e\x69\x29\x38\x25\xc4\x51\x09\x4a\x69\xfe\
+\xbf\xdc\x8f\x92\xb6\xfa\x2c\x33\xdc\x30\xa2\xb9\xac\x9c\x84\x23\
+\x4f\xd3\x8c\x23\x26\xcb\xe9\x71\x52\x40\x1c\xc5\x70\xd2\x7a\xa6\
+\xa3\x18\xe4\xf2\x52\xb0\x3d\x28\x00\x81\x74\x84\xcd\xed\x5e\x50\
+\x80\xe2\x4d\xfb\x46\xc9\x6b\x1b\xac\x20\x13\x23\xad\x90\xa2\xd5\
+\x3a\xda\xc1\x19\xc0\x67\xc1\x09\x3b\x72\xf3\x01\xc9\xab\x1c\x14\
+\x92\xcb\xc3\x37\x2b\x39\x03\xe5\x13\xa9\xc2\x86\x69\xcd\x8b\x82\
+\xa0\x64\xc8\xc3\x3d\x85\xd0\x8c\x01\xb1\x0a\x44\x08\x7d\x7e\xbb\
+\x15\xf2\x5e\x84\x7e\xe3\xf3\xc6\x18\xbc\xef\xad\xc7\xd0\xbe\x7e\
+\x05\xc6\xa4\xec\x8a\x82\xa9\xe3\xcb\x1a\x61\xf9\xe4\xc6\x8a\x34\
+\xb1\x75\x16\x99\xc9\x42\x59\xba\x4f\x6a\xf1\x67\x48\xf0\x2c\x11\
+\x01\x11\x41\x45\x11\x87\x7a\x92\xf2\xb6\xe2\x6a\x78\xcd\x1d\x94\
+\xc2\xc6\x9e\x15\x80\x08\x88\x22\x8d\xcd\x4e\x3f\xec\xfa\xa2\xd9\
+\x73\xce\x61\xb3\xd3\x47\x37\xe1\xea\x9f\xf1\xb1\x16\x88\xa4\x6b\
+\x18\xb9\x99\x0c\x92\x28\x0a\x0b\x79\x26\x8b\x7f\xed\x53\x9b\x02\
+\xfa\x04\x20\xf1\xef\x28\x44\x05\x39\x40\xf4\x6a\x15\x54\x0b\x84\
+\x9c\x11\xf3\x4a\xc4\x59\x38\x87\x48\x2b\x2c\x2f\x2f\x23\x4d\xd3\
+\x82\xdb\x51\xa1\x48\x65\x37\xbb\x7f\x2f\xcf\x5b\x6b\xd1\x6c\x36\
+\x70\xb8\x91\xa0\xdb\x69\x87\xa6\x4e\xfe\xee\x4a\xd8\x3b\xff\x9d\
+\x45\x50\x5a\x71\xfe\x5e\x2c\x1e\x48\x41\xe5\x70\x39\x07\xc2\x44\
+\x81\x01\xe4\x1a\x41\xae\x03\x50\x4a\x49\xdb\x19\x5b\x58\x5f\x80\
+\x6a\xb8\x97\xf3\x26\x0b\xb0\xcb\x28\x20\xc2\x66\xa7\xb7\x63\xd1\
+\xbc\x12\x38\xe7\xb0\xbc\xb1\x1d\x8a\x0f\x47\x9a\x4d\xd6\x39\x72\
+\xc8\xf7\xac\xf7\xff\x81\x9d\xdf\x41\xca\xf8\xb0\xce\xc3\x44\xa5\
+\x74\x10\xb2\xd7\x1b\x40\xcb\xf6\xf6\x61\x8e\x8f\x9e\x0b\xdd\xb2\
+\xf2\x52\x57\xd8\x49\x21\x84\x52\x0a\xef\xfe\xb1\x0f\xe3\xd8\x3b\
+\xde\x83\xc4\x02\xcf\x3c\xfb\x2d\xbc\x72\xf6\x1c\xce\xbd\xfc\x22\
+\xd2\x34\xc5\x6f\xfd\xd6\x6f\xdd\x32\x1f\xb0\x17\xf0\x78\xab\xdf\
+\x59\x6b\xf1\xf0\x5b\xdf\x8c\x0b\x9f\x7b\x06\xbd\x52\x05\xd5\xfa\
+\x10\x38\x32\x91\x7b\x16\x05\xb7\x82\x59\xb4\xd0\xe5\xbe\xc9\x44\
+\x91\x08\x92\xe1\xb3\xe0\x1c\x56\x76\x27\x51\x96\x15\xa2\xcd\x58\
+\x06\x83\x1c\xfe\x51\x70\x0f\x56\x06\x4c\x5b\x63\x6f\xc2\x00\xbb\
+\x2b\x09\xd3\x1a\xdd\x41\x1a\x84\x5f\xd4\x70\x63\x0c\xd6\xb7\x7b\
+\x30\xc4\x82\x1b\x1e\x6e\x88\x4a\xc3\x97\xaf\x80\x43\x36\xca\xcb\
+\xa0\x04\xb4\x14\xa3\xfd\xe2\xbf\x58\xf8\x62\x05\x42\x1e\xc1\x53\
+\xc8\xd2\x25\x2b\xe1\x54\x98\x98\xed\xdf\xd8\xbf\x93\x2f\xef\x15\
+\x9f\x12\xc5\x31\x66\x0e\x1e\x41\x73\x6c\x12\xe7\x36\xd7\xd1\xbf\
+\xbe\x8e\xa7\x3e\xfd\x57\x68\x56\x34\x7e\xfe\xe7\x7f\x3e\xb8\xb6\
+\xbb\x05\x7d\x77\xfa\x9d\x52\x0a\xef\x3e\x36\x85\xcf\x9e\xbd\x86\
+\x72\xf5\x40\xc8\xfc\xe5\x89\x1f\x05\x45\x3a\x2c\x5b\x21\x9c\xe1\
+\x89\x6b\xce\x57\x0a\x71\xa5\x92\xd5\x4c\xaf\xfb\xfb\x77\x99\xd4\
+\x3e\xfa\xca\x26\x6b\x61\x49\x2a\x8b\x14\x4f\x29\x25\x2e\x09\xbf\
+\x70\x93\x68\x77\x23\xff\x28\x8a\xb0\xd9\xbd\x99\x44\xf1\xa6\xaf\
+\xdb\x4f\x61\x1d\x50\xaf\x55\x43\x85\x8e\x8e\xa3\x80\xdc\x9d\xb3\
+\xf9\x80\x22\xd9\xe7\xce\x59\x38\xc7\x5f\x1c\xe4\x29\x62\x3f\xe0\
+\x48\x7c\x34\xf2\xb0\xc6\x38\xc7\x2d\x4f\x39\xaa\x94\x58\xd8\x05\
+\xe3\xef\xc8\xc1\x38\x1b\x7a\xeb\xac\x28\x8a\x82\x42\x1c\x97\x51\
+\xa9\xd6\x31\x3c\x3e\x89\xe9\x85\x43\x88\x15\xa1\xb7\x79\x1d\xad\
+\x56\x0b\x6f\x79\xcb\x5b\x6e\x02\x88\xbb\xf1\xff\xbb\xfd\x9d\xb5\
+\x16\x33\xd3\x53\x98\x8b\xda\xe8\x6e\x6f\x85\x7b\x53\x2a\x62\xcb\
+\xc9\x3c\x78\x60\x47\xad\x75\x48\xd2\x4c\x42\xe3\x7c\xcd\xd3\xcc\
+\x00\x52\x34\xa2\xa0\x60\xc5\x0d\xaa\x28\xe6\x50\x4f\x8a\x5d\x1c\
+\x72\x5a\x39\x33\x26\x90\x4f\x69\xd5\xde\x14\x06\xee\x4a\x01\x94\
+\x52\xd8\xee\x67\x37\xb9\x00\x6f\xe2\xda\xbd\x01\x1c\x14\x5a\xcd\
+\x46\x88\xe3\xad\x75\x70\xa1\xab\x06\xc1\x14\xe7\xb1\x7e\x81\xe3\
+\x13\x7f\x1d\xc0\xa3\xc4\xbd\x91\x44\x13\x50\x1a\x91\x8e\xa0\x78\
+\x9e\x34\xe7\xc0\x7d\x8f\xbc\x84\x4e\x1c\x19\x70\x02\x45\xeb\x08\
+\xb1\xd4\xda\x2b\xc9\x97\xfb\xb2\xe8\x38\x8a\x51\x2a\x97\xf1\xb5\
+\xbf\xfa\x8f\x68\x34\x1a\xf8\xc0\x07\x3e\x70\x4b\xa5\xbe\x9d\x22\
+\xa4\x69\x7a\xcb\xd7\xbf\x9a\x42\x64\x59\x86\x47\xde\x76\x02\xc9\
+\xda\x25\xf4\x7b\x5d\x48\x80\xcf\x83\xae\xc8\xc2\x49\xc5\x8e\x9f\
+\xa5\x18\xc7\x31\xb2\xcc\xf0\xf7\x56\x1a\x3a\x8a\x11\x97\x62\x16\
+\x99\xe3\x9c\x82\x91\x39\x0b\xe4\x72\x8b\xcc\xd3\xcd\x32\xc1\x41\
+\x9c\x62\xce\xb2\x0c\xc6\xd9\xec\x5f\x7f\xf8\xbd\x37\x11\x41\xbb\
+\x52\x00\x02\x78\xdc\x58\x9a\xee\x48\x06\x79\x17\xb0\x25\x11\x42\
+\x6b\xb8\x11\xd8\x3c\x2e\x62\x70\x81\x9c\xf0\x4f\x7b\x53\xbf\x43\
+\x11\x0a\xe4\x8f\x8f\x0a\x9c\xe3\x9d\xe3\xe4\xc1\x8b\xee\x78\x41\
+\x8c\xe5\xea\x5a\x87\x7c\x0a\x89\x10\x4d\x96\x64\x90\x92\x20\x6b\
+\x55\xf8\x02\x2a\x62\x55\x3c\xff\xdd\x67\xb1\x7e\x75\x09\xe3\xe3\
+\xe3\x78\xe7\x3b\xdf\x79\xc7\xdd\x5f\xc4\x05\x97\x2f\x5f\xc1\x27\
+\x3f\xf9\xc9\x1d\x91\xd0\x8d\xe6\xfe\x76\x0a\xe1\xf3\x0e\x6f\x9f\
+\x1d\x42\xaf\xb3\x1d\x1a\x4d\x3d\x37\xe2\x02\x89\x03\xe1\x47\x98\
+\xd1\xb3\xc4\xca\x6b\x8c\x85\xb5\xb9\x77\x25\x95\x2b\xb7\x55\xec\
+\x2e\x32\xe3\x84\x43\x89\xe0\x94\x46\x66\x79\x38\x84\x58\x8a\x35\
+\xdc\xe2\xda\xe5\x88\x71\xfe\x76\xbe\x03\xc8\xef\x00\xaf\x04\xed\
+\x1e\x47\x08\x7e\xd8\x31\x09\x28\x51\xd0\x52\xae\x2d\x80\x8e\x54\
+\xb8\x39\x5f\xef\x06\xb1\x0a\x1e\xad\x3a\xcf\xed\x07\xc3\xae\x0a\
+\x66\x30\x67\x07\x43\x99\xb7\x56\xe1\x39\x22\x05\xf2\x1d\xb8\x1e\
+\x38\x91\x04\x42\xc4\xd1\x41\x96\x19\x7c\xe1\x13\x7f\x84\xe1\xe1\
+\x61\x7c\xe8\x43\x1f\xba\xed\x6e\xbe\x51\xa8\x00\xf0\x85\x2f\x7e\
+\x11\xcf\x3d\xf7\x1c\xce\x9c\x39\xb3\x03\x0b\xed\xd6\x0a\x18\x63\
+\xb0\x78\x60\x01\x8d\xce\x45\xb4\xb7\x56\x65\xf0\xa4\x43\x16\xa6\
+\x8a\xf1\xa0\x4a\xeb\x78\x2a\x69\xd8\x04\x4e\x00\xa0\xac\x4a\x66\
+\x0d\x7c\x72\xcc\x72\xac\xc7\xd6\x11\xbe\x5a\x9a\xd7\xd5\xfa\x28\
+\x81\xdd\xe5\xea\xad\x24\xbb\x4b\x0b\xc0\x71\x69\xaf\x9f\xb3\x81\
+\xc5\x1b\xdc\xea\x78\x05\x18\x06\x40\xc2\x72\x91\xc4\xf5\x39\xda\
+\xe7\x19\x57\xde\xf0\xfb\x42\x4e\xbf\x58\x5e\x88\x2e\x54\xfa\xf8\
+\xa1\x48\xbe\xef\xcd\xd7\x06\x20\x24\x55\x7c\xcd\x1b\xe5\x9d\x3a\
+\x12\x2e\x92\x2f\x2d\x23\xdf\x47\xe0\x40\xc6\x61\xe9\xbb\xdf\x44\
+\x7b\xe5\x32\xf6\xed\xdb\x87\x77\xbd\xeb\x5d\x61\xf7\xdf\x49\x70\
+\x00\xb0\x72\xfd\x3a\xbe\xfc\xe4\x57\x91\x65\x19\x3e\xf1\x89\x4f\
+\xc0\x18\x73\x5b\x46\xf1\x4e\x4a\x91\x65\x19\xde\xf3\xe0\x11\xf4\
+\xd6\xaf\x21\x4d\x13\x16\x98\xe5\x87\x11\x53\xce\x47\xc3\xf0\x73\
+\x3c\x36\x9f\x72\xeb\x49\x08\xa5\xed\xfe\x18\x19\x92\x50\xb0\x58\
+\x69\x45\x02\xfc\xf2\xb2\x79\xbd\x72\xf7\x16\x80\x80\x28\x2a\x61\
+\x30\x48\xc4\xda\x72\xec\xec\x49\xa0\xad\x1e\x3f\x3f\xd2\x6c\xc0\
+\x7a\x92\xc7\x4f\xab\x50\x3a\xec\x7a\x22\x29\xfb\xf6\x19\x3d\xe4\
+\x58\x80\xed\x8c\x0a\x37\x04\x99\x6e\x11\x6a\x07\x81\x60\x25\xc8\
+\x32\x3d\x4c\xd6\xe6\xf9\x7e\xf2\x83\x10\xbd\xb5\x91\xa4\x8b\x67\
+\x2e\x25\x1d\xfc\xc5\x4f\xfc\x11\x5a\xad\x16\x7e\xf4\x47\x7f\xf4\
+\x26\x01\xde\x6e\x17\x03\xc0\x57\x9e\x79\x1e\xb3\x27\xde\x89\xeb\
+\xd7\xaf\x63\x6d\x6d\x0d\x5f\xfa\xd2\x97\x76\x6d\x05\x6e\xcc\x9b\
+\xc4\x71\x8c\x37\x35\x53\x0c\x3a\x5d\xee\x51\x88\x22\x28\x1d\x4b\
+\x7b\x99\x82\x52\x11\x8f\x8f\x55\x10\xe5\xe7\xce\x5f\x02\xb7\x00\
+\x70\x13\xab\x27\xd0\x14\xac\x6c\x48\xcb\x0d\x0f\x92\x42\x97\x09\
+\xad\x4a\xac\xae\x7e\x4d\x2e\x00\x88\xa3\x08\xbd\xfe\xe0\x96\x37\
+\xd4\x4b\x38\x0d\xdc\x6c\x0c\xe5\x37\x5d\x04\x60\xce\x32\x5d\x2b\
+\xa0\x4e\x09\x4d\xac\x95\x8f\x59\x0b\x31\x3b\x6b\x42\x41\x31\x48\
+\xd8\xad\x9c\xd4\xf1\xef\xa5\x22\x1d\x16\x26\x94\x50\x4b\xa7\x8f\
+\x96\x31\x69\xb6\x30\x45\xe3\xfc\xf3\xcf\xa0\xb3\x76\x0d\xe3\xe3\
+\xe3\x78\xf8\xe1\x87\x77\x65\xba\x89\x08\xed\xf6\x36\xae\x0e\x22\
+\x1c\x7a\xcb\x49\x54\x46\xa7\xd0\xe9\x74\xf0\xd9\xcf\x7e\x36\x54\
+\x47\xef\xd6\x0a\xf8\xd7\x59\x6b\x71\xe2\xd8\x61\x44\x1b\x67\xd1\
+\xd9\x5c\x87\xb1\x16\x69\xe6\xbb\xa6\x0c\xd2\x2c\xcb\xdd\xa2\x28\
+\xb4\x75\xfc\x48\xd3\x54\xfa\x24\xa4\x31\x86\x76\xba\x4a\x27\x56\
+\x04\x4a\x21\x8a\x4b\x50\x51\x24\xa3\x6a\xdc\xf2\xdd\x29\x00\x91\
+\x22\x22\x40\x6b\x24\xe9\xcd\x5c\x40\xb7\x9f\x20\xcd\xd8\xcc\x0c\
+\xd5\x6b\x3b\xfc\xb8\xdf\xf5\x41\xb8\x85\x01\x0b\x4a\x71\xa5\x8f\
+\x91\x98\x95\x27\x60\x7a\x54\xc8\xbe\xdc\xef\x7e\x47\x16\x44\xb9\
+\x50\xfd\x4d\xb2\x60\xf5\x8e\xc5\x82\x62\x05\x33\xd6\x05\x10\xa8\
+\x00\x38\x63\xf1\xc4\x7f\xfc\xf7\x68\x36\x9b\xf8\xd0\x87\x3e\x74\
+\xcb\xb8\xff\x56\xca\xa0\x94\xc2\x57\xbf\xf9\x1d\x8c\xce\x1c\x40\
+\x63\x64\x02\x6f\xfd\xe1\x9f\xc4\xea\xfa\x06\x92\x24\xc1\x27\x3e\
+\xf1\x89\x90\xbb\xb8\x93\xc0\x6f\xc5\x10\xa6\x69\x8a\x93\xc7\xa6\
+\x31\xd8\x5a\x05\xc9\x81\x18\x3a\x8a\x01\x29\x89\xf7\x56\xcc\x91\
+\x02\xc9\x08\x5c\xf1\x83\xbc\xbb\x81\xd0\x06\x47\x72\xc0\x86\xd2\
+\xfc\x3a\x12\xfe\x80\x24\xe9\x14\x47\x31\x74\x54\xba\x7e\x2b\xf1\
+\xee\x0e\x03\xf0\x26\xc4\x40\xe6\xee\x79\x5f\xe6\x43\x40\x2b\x5b\
+\xac\xd9\x1c\x12\x8d\x65\xb4\xee\xac\xcb\x0b\x33\x2d\x0a\x40\x4f\
+\xda\xa8\xe5\x3f\x2d\x0f\x9f\xca\x35\xce\xe6\xd3\x37\x02\x3f\xc8\
+\x89\x0e\x1f\x1b\xfb\xd6\x30\xe5\x89\x26\xdf\x5b\x2f\xa6\x3e\xd4\
+\x00\x08\x0d\x7c\xf6\xf9\xaf\xa3\xb7\xb1\x82\x89\x89\x89\x5b\xee\
+\xfe\xdb\x25\x82\xfa\xfd\x3e\x2e\x76\x23\x34\x47\xc6\x51\xae\xd6\
+\x31\x32\x3d\x8f\x13\xa7\x7e\x1c\xeb\xeb\xeb\x38\x7b\xf6\x2c\x9e\
+\x7d\xf6\xd9\x1d\x0a\xb0\x5b\x3c\x60\xad\x45\x6b\xb8\x89\x83\xa5\
+\x2d\x74\xda\x9b\xa1\xcd\xcd\xef\x5e\x7f\xa8\x46\xfe\x77\xf9\x4e\
+\x77\x32\x9e\xcf\x63\x04\x07\x92\xe1\x57\x5c\x81\x9d\xca\x0c\x85\
+\x10\xdd\x00\x70\x84\xd7\x02\x02\x79\xe6\x5c\x7f\x90\xf3\xe5\xc6\
+\x18\x38\xe7\xd0\x1b\xa4\x70\xa4\x10\xc7\x11\x4a\xd2\xe4\xe0\xab\
+\x72\x02\x0d\x0b\xce\x0d\xdc\x58\x92\x25\x5f\x2c\x08\x33\xb8\x00\
+\x6f\xfe\x29\x07\x34\x3b\x22\x07\x9d\x27\x93\x20\x45\xa4\xa1\x0c\
+\xdc\xfb\xed\x42\xc8\x99\x19\x83\x2f\x7c\xfc\x8f\x31\x3c\x3c\x1c\
+\xe2\xfe\x62\x42\xe8\x76\xc2\x52\x4a\xe1\xa9\x67\x9f\xc3\xd0\xc4\
+\x0c\xe2\x52\x19\xa4\x80\x72\x6d\x08\x87\xde\xf1\x1e\x54\x47\xa7\
+\x31\x18\x0c\xf0\x99\xcf\x7c\x66\x47\x4b\xd8\x5e\xf0\x40\x96\x65\
+\x78\xe8\x4d\x47\xe0\xd6\xce\xa3\xd7\xdd\x96\xc8\x05\x61\xee\x2f\
+\x85\x75\x63\xc1\xdb\xb0\xab\x29\xbc\x06\x61\x0d\xf3\x68\x27\x60\
+\x03\x12\x2b\x01\x02\x99\xec\xda\x2d\x44\xbb\x4b\x05\x70\x4c\xc1\
+\x26\x3b\xe6\xd3\xd1\x0e\x12\xa8\x5e\xab\x06\xd4\x4d\x05\x2a\x96\
+\x42\xd9\xc6\x4e\x02\x88\x82\x22\xb8\x5c\x01\x24\x74\x61\x7b\x20\
+\x95\x2d\xf2\x7c\xb1\x48\x94\x13\x24\x51\x48\xf5\xfa\x06\x6e\xf2\
+\x8b\xe0\xad\x16\x58\xb9\xce\x7d\xfb\x1b\xe8\xae\x5f\xc3\xe8\xe8\
+\x68\xd8\xfd\xaf\x46\xe2\x78\x25\x39\xbb\x91\xa1\x39\x3a\x0e\xf2\
+\x84\x54\x5c\x42\xb5\x36\x8c\xb7\x7d\xf0\x67\xb0\xb9\xd5\x46\xbf\
+\xdf\xc7\xe3\x8f\x3f\x1e\x4a\xcd\xf7\x62\x05\x7c\x68\xf8\xf0\xfe\
+\x06\xb6\xd7\x97\x43\xc8\xec\x47\xcf\x40\xe9\x3c\x9d\x0e\x25\x91\
+\x8e\x9c\xa3\x24\x1b\xc6\x91\x6f\x83\xa7\xd0\x3a\xc7\xf5\x75\xc5\
+\x39\xcd\x80\xd5\xfa\x35\x58\x00\xa9\x4a\xf1\x35\x7f\x00\x42\x18\
+\xd4\xed\x73\x04\x50\xab\x56\xd9\x3f\x13\xfb\x78\x89\xeb\x24\x43\
+\xe5\x35\x75\x07\xb4\x0b\xd8\x00\x80\xd4\xfb\x53\x78\x4e\x49\xe5\
+\x0f\x11\x05\x9f\xc6\x69\x61\x19\x2f\x4f\xec\x26\x48\x72\xdf\x0a\
+\x3b\xd1\xbf\x95\x53\xc4\xc8\x38\x7c\xf9\x53\x7f\x82\xe1\xe1\x61\
+\x7c\xf0\x83\x1f\x0c\x63\xe3\x76\x93\xd9\x7b\xe6\xdb\xcf\xa1\x34\
+\x32\x8d\xa8\x54\xe1\x74\x32\x34\x9c\x53\x88\x4a\x65\xb4\xa6\x66\
+\x71\xdf\x0f\x7d\x08\x59\x96\xe1\x3b\xdf\xf9\x0e\x56\x56\x56\xee\
+\x2a\x2a\x30\xc6\x60\xdf\xc4\x38\xe6\xdd\x2a\x3a\xdb\x1b\xbc\x76\
+\xe2\x02\x94\x34\x76\x42\xe6\x1a\xf0\x1c\x84\xbc\x44\xce\x88\xc9\
+\x37\x86\xfb\x0d\xf9\x54\x13\x49\x77\x23\xdf\x54\x8e\x80\x7e\x9a\
+\xdc\x25\x08\xf4\x26\x58\x47\xe8\x27\xd9\x4d\x2e\x60\xab\xcb\x1c\
+\xc0\x50\xad\x16\x58\x39\x5f\xb3\x66\xad\xc9\x5b\xaf\x91\x13\x3d\
+\x79\xdf\xbd\x4f\xfa\xb0\x92\x45\x91\x96\xfa\x76\x84\xb6\xa6\x40\
+\x1f\x7b\x53\xaf\xc5\xdc\x91\xcf\x1a\x32\x01\x24\x29\x85\x80\x86\
+\x95\x28\xdc\x99\xef\x3c\x85\x8e\xec\xfe\x77\xbc\xe3\x1d\xbb\xe6\
+\xef\xb5\xd6\x78\x69\xa5\x8f\xd1\x89\x29\x44\x51\x49\xfc\xb3\x05\
+\xc1\x09\x6f\xaf\x51\x19\x1e\x85\x2e\x95\x51\x2a\x95\xf0\xe9\x4f\
+\x7f\x9a\x95\x7c\x97\x79\x82\xa2\x15\x48\xd3\x14\xef\x3a\xb1\x88\
+\x74\xfd\x2a\xb2\x34\x09\x3d\x03\x7e\x07\x3b\xb1\xb6\x1e\x1f\xf1\
+\x41\x17\x8c\xad\x22\x1d\x83\x08\x48\x4d\xc6\x58\x20\x8e\xf9\xd0\
+\x2d\x57\x2c\x80\x71\x70\xfd\xce\x2d\x15\xe0\x55\xb2\x81\x14\xb1\
+\x09\x71\x61\x60\x81\x9f\xfa\xe1\xbf\xfc\xb6\x70\x00\xcd\xa1\xba\
+\x98\x7b\xcd\xe9\x4a\x49\xf0\x90\x58\x02\xa5\x22\xa8\xa8\x98\xba\
+\x2d\x94\x73\x7b\x4d\x75\x79\xe1\x83\x92\x61\x4c\x90\x70\xd2\x6b\
+\xbe\xaf\x9c\x65\x84\x8e\xbc\x13\x46\xcc\x8a\xb7\x04\x8e\x00\x93\
+\x19\x7c\xe1\xe3\x1f\x45\xb3\xd9\xc4\xfb\xdf\xff\xfe\x70\x46\xd1\
+\xab\x65\xf0\x94\x52\x78\xfe\xc5\x97\x81\xe6\x3e\xa8\x52\x05\x96\
+\x1c\x92\xde\x36\x56\xce\xbd\x84\xe5\x73\xcf\xe3\xd2\x8b\xdf\x42\
+\x6f\x7d\x19\xcd\x66\x13\xad\x56\x0b\x59\x96\xa1\x56\xab\xe1\xfa\
+\xf5\xeb\x18\x19\x19\xb9\xe9\xfd\x76\x93\x49\x8c\xa2\x08\xef\x18\
+\x37\xf8\x7a\xb7\x8d\xe1\x6a\x1d\x44\xe0\x91\xb1\xfe\xe0\x0c\x25\
+\x55\xbf\x9a\xfb\x02\x94\x94\x88\x13\x5c\x38\x7a\x87\x88\x23\x0c\
+\x44\x3e\x22\x62\x5c\x64\x33\x33\xf8\xe8\x6f\xfc\x58\xfb\x2e\x14\
+\x40\x35\x72\x5b\xa1\x90\x64\x26\xb4\x86\x87\x03\x11\x24\x4d\x5c\
+\xaf\x57\x11\xa6\x6b\x78\xe1\x20\xf7\x43\x08\x00\x85\x05\x19\xe6\
+\xed\x20\xe7\x02\xbc\x90\x77\x48\xd5\x53\xc8\x62\x09\x38\x6f\x8e\
+\x30\xf0\xc0\x15\xac\x84\xff\x28\x6f\x6d\x5e\xf9\xd6\x57\xd1\xdf\
+\x5a\xc5\xc2\xc2\xc2\x0e\xd6\xef\x4e\x82\x20\x22\x94\x4a\x25\x3c\
+\xfd\xca\x65\x0c\x74\x1d\x57\xbe\xfb\x75\x5c\xf8\xee\x33\xd8\x58\
+\xbe\x18\x06\x43\x54\x2a\x15\x1c\x79\xf0\x41\xdc\x7f\xff\xfd\x58\
+\x58\x58\xc0\xcc\xcc\x0c\xa2\x28\x42\x96\x65\x37\xed\xfe\x3b\x7d\
+\x56\xf1\x77\xc6\x18\x1c\x98\x9f\xc1\x4b\xcf\x9c\x41\x27\x2a\xa3\
+\xdc\x68\x72\x6b\x58\x18\x40\x85\x70\xd8\x16\x39\x19\x28\xe5\x77\
+\xb7\xf2\x8d\xa7\xd2\x37\x00\xda\xe1\x3a\x48\xe9\x5b\x0a\x7f\x17\
+\x0a\x90\xef\x50\x10\x97\x78\xf9\x89\x9e\x7e\x31\xdb\x5d\xb6\x00\
+\xf5\x5a\x6d\x67\x35\x0f\xc0\x55\xbf\x00\xfc\x44\x2d\x72\x52\xf3\
+\xae\xb4\x08\x8b\x35\x38\xb0\x3f\xbe\x84\x84\x59\x22\x84\x12\xf0\
+\x10\x3e\x72\xc6\x8f\xa4\xd6\xcf\x77\xd6\x16\xe9\xe4\xd0\x5e\x65\
+\x0c\xbe\xfc\x17\x7f\x12\x90\xbf\x1f\x9b\xfa\x6a\x82\x50\x4a\xe1\
+\xca\x95\x2b\x78\xf6\x89\x4f\xf1\x6e\x02\x50\x8a\x22\x3c\xf8\xe0\
+\x83\x61\x30\xc4\xfc\xfc\x7c\x18\x32\xed\x1f\x59\x96\xbd\xaa\xc0\
+\x77\xf3\xfb\x93\x47\xa7\xf0\x17\x2f\x5f\x41\x54\x3d\x02\x1d\x95\
+\x40\x82\x07\xfc\x46\x70\x32\xbb\x88\xe0\x37\x99\x0e\xa1\x9e\xf6\
+\x96\x99\x78\x9a\xa0\xff\x3b\x02\xdd\xf6\x2c\xe5\x5d\x29\x80\x9f\
+\x9a\x69\xad\x93\xe3\x47\x54\x20\x34\xba\xd2\x38\x3a\x54\xab\xe6\
+\xe1\x97\x56\x85\xbc\x7d\x41\x91\xbc\xa0\x7c\x38\x50\x28\x09\x11\
+\xee\x30\x54\xb7\xa8\xc2\xdf\xf0\x0d\xaa\x50\x07\x1f\x12\x34\x24\
+\x69\x61\xbf\xf3\x3d\x83\xe8\x1c\x5e\x7e\xe6\x49\xf4\xb7\x56\x31\
+\xb9\x7f\x3f\x1e\x7e\xf8\xe1\x80\x59\x5e\x4d\x10\x5a\x6b\x3c\xf9\
+\xe4\x93\x38\x70\xe0\x00\x0e\x1c\x38\x80\xc5\xc5\x45\xcc\xcd\xcd\
+\xa1\x5a\xad\x06\x61\x3b\xc7\xe3\xe7\x5f\xab\xc0\x6f\xfc\x9d\x31\
+\x06\xe5\x72\x19\x27\x6a\xd7\xf0\x52\xa7\x83\x6a\x6b\x6c\x47\xe5\
+\x14\x34\x77\x39\xfb\xb3\x01\x94\x10\x44\x4e\xc2\x1e\x3f\x30\x2a\
+\x84\x80\x8e\xc0\x8d\x48\xaf\x51\x01\x42\xf8\x26\x39\x00\x1f\x02\
+\x3a\xe7\xb0\xdd\x67\x4c\x50\xad\x56\x42\xf8\x05\x40\xbe\x18\x85\
+\x3f\x66\x2b\xe2\x07\x1b\xa8\xd0\xf0\x10\x49\x21\x08\xa4\x04\xca\
+\x15\xfe\xef\x23\x04\x22\x9f\xca\xc5\x8e\x3a\x38\x14\xb0\x01\xf9\
+\x24\x09\xd8\xf7\x7f\xf9\x93\x1c\xf7\x3f\xf6\xd8\x63\x01\xf9\xdf\
+\x49\x50\x01\x70\x39\x87\x47\x1f\x7d\x14\xcd\x66\x33\xdc\xa3\x3f\
+\xec\x69\x37\x02\xdf\xab\xd0\x6f\x7c\x3e\xcb\x32\xbc\xe9\xc8\x01\
+\x9c\xfb\xe6\x19\xf4\xa0\x50\x1d\x1e\x09\x39\x12\x5f\x2f\xe4\xc7\
+\xd9\x11\xe7\xdc\x79\x44\x2d\x49\x07\x75\x14\xcb\xe8\xb9\x02\x08\
+\xb5\xb4\x79\xd7\x0a\x90\x93\x36\xec\x63\xfc\xe1\x49\x9e\xfc\xe8\
+\x25\x19\x80\x18\x95\x72\x19\xc6\x12\x08\x9c\x83\x56\x94\x67\x11\
+\xfd\xf4\xb0\x62\xec\x5f\x44\xb8\x61\x80\xa1\xb5\xa1\xe4\xcb\x1f\
+\x41\xc3\x09\x9d\x08\x59\x6a\x82\x45\xe0\x90\x2c\xcf\x74\xf9\xd1\
+\xea\x4e\x04\xf8\xca\x37\xbf\x8a\xa4\xbd\x8e\x7d\x0b\x0b\x78\xf8\
+\xe1\x87\x6f\x99\xef\xbf\x93\x30\xca\xe5\xf2\xeb\x26\xf0\xdd\x08\
+\xfd\xc6\x47\x92\x24\xf8\xa1\x83\x4d\xfc\xe5\x85\x35\x54\x1a\xc3\
+\x20\x29\x7e\xc9\xd2\x01\xc8\x59\xc4\xd5\x46\xe8\x0d\xf4\x6d\xef\
+\x04\x3f\x64\x82\x4f\x31\xf5\x63\xe1\x88\x08\x99\xb3\x6b\xb7\x93\
+\xef\xee\x30\x00\x38\xb6\x4e\x33\x39\xcf\x47\x6a\xda\x06\xa9\x41\
+\x26\x9d\x66\x95\x6a\x59\xca\x94\x3d\x13\x97\xa7\x7c\xb9\xa9\xd1\
+\x86\x44\x8e\x1c\xf2\x55\xa8\xe5\x03\x7c\x85\x8c\xb3\x36\xfc\x2d\
+\x87\x72\x10\xdf\x9c\x03\x4c\x07\x1e\xe7\x16\x47\xf1\x8e\x4a\x23\
+\x02\x77\xce\x7c\xe5\x2f\x3e\x8a\x56\xab\x85\xc7\x1e\x7b\x2c\xcc\
+\x26\xdc\xad\x30\xdf\xc8\x5d\xbe\x5b\x65\xc8\xb2\x0c\xf5\x5a\x0d\
+\x87\xa3\x4b\x58\xea\xb4\x40\xc6\xc1\x0e\x3a\x18\x31\xab\x18\xd2\
+\x0e\xcb\xc3\xc7\x51\xa9\x37\xe0\xa7\x7f\x46\x71\xa9\x60\x61\x35\
+\x77\x4f\xe5\xbd\xa3\x50\xb8\x35\x0d\xbc\x3b\x05\x10\x55\x73\xc2\
+\x06\x1a\x63\xc2\x49\x97\xdb\xfd\x24\xb8\xf8\x4a\xa9\xc2\x04\x8c\
+\x84\x69\x0c\x48\xe4\x2b\xc8\x90\x63\x08\x6a\x57\x62\xc6\xac\xbc\
+\xce\x5b\x02\x4f\x0d\x2b\x76\xe4\xa1\xae\xdf\x91\x2d\x08\xda\x71\
+\xb7\xaf\xe6\x29\x58\x8a\x14\x73\x03\x72\xac\xfc\x99\x67\xbe\x82\
+\xac\xbb\x85\x7d\x73\x73\x01\xf9\xbf\xd1\x02\xbf\xf1\xf7\xfe\xdf\
+\x77\xaa\x32\xbe\xdd\xf3\xfe\xb9\x34\x4d\xf1\xe6\xc5\x19\xd0\x2b\
+\xdf\xc5\xbe\x56\x1d\x73\x0b\x93\x20\x9a\xc2\xca\xda\x3a\x2e\x6c\
+\x76\x50\xae\x35\x6f\xb2\xa8\xbe\x15\xdf\x87\xc2\x21\x1a\x23\x7a\
+\x8d\x16\x40\x7c\xb9\x9f\xe0\x05\x30\xca\xee\xf6\x13\xf8\x42\xef\
+\x4a\xc5\x6b\xa1\x80\x31\xe1\xa7\xe1\xf2\x52\x2c\x80\xbb\x58\xbd\
+\x3b\xe1\xdd\x4c\xf0\x13\x3c\x3d\x30\x0c\x8d\xa5\x81\x56\x26\x29\
+\x97\x52\x3c\x1f\x48\xa6\x80\x58\xeb\x98\xf5\x94\xb9\x81\x59\x9a\
+\xe0\xc9\x4f\xfe\x31\x9a\xcd\x26\x1e\x7d\xf4\xd1\xdb\x22\xff\x37\
+\x42\xe0\x00\x0a\x1d\x51\x84\xcd\xcd\x4d\x34\x1a\x8d\x5d\x81\xcf\
+\xdb\x3d\xe7\x9c\xc3\x9b\x16\x67\x38\xe7\xd2\xeb\x71\x87\x73\x96\
+\xc1\x39\x13\xd6\x8f\x9c\xef\xbb\x14\x4a\xdc\x93\x64\x90\xb5\x73\
+\x80\x8e\xd5\x2d\x33\x81\xbb\x56\x00\x8f\xd3\x33\xdf\xbb\x2f\x5f\
+\xb2\x3b\x28\x58\x80\x72\x39\xb0\x57\x5e\xc8\x44\x1c\x0a\x6a\xf9\
+\xa2\x50\xbe\xf2\x35\x27\x6b\x76\x44\x09\x82\x07\x72\xca\x58\x92\
+\x3b\x7e\x20\x92\xe4\x07\x40\x08\xc4\x54\x14\x6a\xe7\x1c\x5e\x79\
+\xf6\x49\x64\xdd\x2d\x4c\xce\xce\xe2\x9d\xef\x7c\x67\x58\xfc\xd7\
+\x43\xe0\x37\xbe\xc6\x57\x27\xf9\xff\x2f\x5d\xbc\x84\x2b\xab\x5b\
+\xb8\xda\x4e\xf1\xf2\xb9\x25\x0c\x96\x9e\xc5\x2f\xff\xf2\x2f\x63\
+\x78\x78\x78\xcf\xbb\xbf\xf8\x73\xd1\x82\xf9\x31\x75\xc5\x23\x60\
+\x21\x38\x2b\xca\x77\x10\x10\x56\x4f\xd2\xc6\x96\x5e\x83\x0b\x90\
+\xcf\x71\xe2\x6f\x8a\x7c\x77\x67\x90\xc2\x97\x23\x47\xa5\x92\x4c\
+\xad\x10\x81\x03\x39\x92\xd7\x1e\xbc\x31\xf5\xcb\xb3\x6f\xfc\xb7\
+\x2c\x1c\x1d\x27\x37\xc4\x96\xc4\xeb\xb0\xb0\x01\x56\xda\x9c\x38\
+\x47\x92\x27\x8a\xe4\x6f\xd3\x24\xc5\x57\x05\xf9\x3f\xfa\xe8\xa3\
+\x28\xc9\x61\x49\xaf\x97\xc0\x21\x16\x28\x92\x43\x99\xae\xad\xac\
+\xe0\xdc\xe5\x15\x5c\xd9\x1c\x60\x25\x89\x81\xfa\x30\x6a\xd5\x49\
+\x94\xc6\xeb\x58\x18\x3d\x8a\xb3\x1b\xcb\xf8\xf4\xa7\x3f\x8d\xd3\
+\xa7\x4f\x87\xdd\xbc\x5b\xa1\xdf\xee\x67\xdf\x13\x49\x44\xa1\xa6\
+\x22\xcc\x4c\x20\xde\x70\x39\x7e\x12\x3e\x40\x2b\xa4\xd6\xbd\x36\
+\x05\xe0\xe3\xcc\x1c\xfa\x83\x34\x4f\x44\x18\x83\x6e\x9f\x15\xa0\
+\x5c\x62\xf3\xcf\xf3\x7b\x84\xa4\x01\xfb\x66\x48\x61\xa3\xdf\xfa\
+\xbe\xdf\xdf\x73\x0b\x7e\x1a\x18\x8f\x45\xe1\x0e\x59\x6b\xac\xbc\
+\x8e\x9b\x47\x8c\x71\xa1\x20\x42\x6b\x6e\x74\xe0\x89\x98\x1c\x06\
+\x99\x2c\xc3\xb9\x67\x9f\x84\x1b\x74\xd0\x18\x9d\xc1\xc3\x0f\x3f\
+\x1c\x58\xb9\xd7\x2a\x70\x6f\xd6\xd7\x37\x36\x70\xee\xd2\x32\x2e\
+\xad\x75\xb0\x32\xd0\x30\xe5\x21\x54\x87\x26\x50\x9b\x6a\x61\xaa\
+\xde\x80\xd6\x31\xb2\x7e\x1b\x9b\xe7\x9f\xc3\xd5\x17\xbf\x81\x38\
+\x6d\xa3\xd7\x1b\xc2\x53\x4f\x3d\x85\xb7\xbf\xfd\xed\x77\x2d\xf4\
+\x5b\xfe\x4c\xfe\xe0\x07\xb9\x04\x2d\x3b\x89\xa2\x74\xc4\x13\x41\
+\x94\x94\xc2\x93\x72\x2b\xb7\x93\xed\xae\xcf\x0c\x8a\x4a\x31\x74\
+\x1c\x23\x8e\x63\x6c\x6f\x6f\xb3\x05\x90\x4c\x60\xa5\x52\x16\xd3\
+\x2c\x63\xd0\x25\xa3\xa5\xa1\xd9\x72\xc8\x81\x90\x9e\xb9\x53\x00\
+\xa2\x58\x43\x43\xc1\x42\x66\xf6\x83\x43\x9d\x00\x17\x8a\x6e\x44\
+\xfe\xaf\xb5\x46\x26\xbb\x40\xcb\x79\x3a\xbe\x34\xfd\xab\x9f\x62\
+\xdf\xff\x9e\xf7\xbc\x67\x07\xf2\xdf\xad\xd0\x8b\x02\x57\x4a\x61\
+\x7b\x7b\x1b\xe7\x2f\x5d\xc5\x85\xd5\x36\xae\xf7\x35\xd2\x52\x1d\
+\x95\x5a\x0b\xd5\x7d\xfb\xb1\xaf\xde\x40\x14\x57\xe0\xc0\xcd\xa9\
+\xa4\x80\x33\x4f\xfc\x29\x5e\xf8\xfc\x9f\x63\x74\x74\x14\x0f\x3c\
+\xf0\x00\x8e\x1c\x79\x2b\xe6\xe7\xe7\xd1\x68\x34\x6e\xea\x3b\xdc\
+\x8d\xa0\x6f\xfb\x3b\xf8\xc4\x98\xb7\x2a\x24\x47\xc6\x71\x0b\xbd\
+\x96\xe3\x66\x1c\xb9\x30\x70\xb3\x49\xcd\xab\xb7\x93\xeb\x2e\x15\
+\x40\x21\x06\xcf\xa0\x53\xc2\x05\x00\x08\x0a\x50\xad\x54\x38\x6e\
+\xbf\xe1\x88\x72\x8a\xd8\x5a\xb0\x70\xf9\x7d\x7c\x21\x47\x26\x4d\
+\x0d\x6c\xd3\x3d\xff\xaf\xa4\x93\x45\xe7\x69\x62\x3f\xf6\xc5\x77\
+\xc3\xfa\xce\x22\x01\x3a\xd6\x39\x9c\x79\xfa\xcb\xa0\xa4\x8b\xa1\
+\xd1\x69\xbc\xeb\x5d\xef\xba\x09\x78\xbd\xda\xa2\x47\x51\x84\xc1\
+\x20\xc1\xd2\xa5\xcb\xb8\xb4\xba\x85\xab\x5d\x42\xa2\x87\x10\x57\
+\x87\x50\x1f\x9b\xc5\x68\x75\x08\xaa\x54\xe6\xb2\xad\x72\x59\x68\
+\xd7\x5c\xc9\xb2\x2c\x45\x7b\xfd\x7a\x50\xc0\x47\x1f\x7d\x14\x83\
+\xc1\x60\x07\x81\x74\x37\xbb\xfd\x4e\x0a\xe1\x81\xb9\x2f\x8d\xe3\
+\x2e\x69\x92\x49\x64\x1e\x44\x12\xa0\xc8\xfd\xdf\xbf\xf2\x8e\xad\
+\xd7\xa4\x00\xd6\x59\x90\xe2\x43\x0f\x7d\xd2\x23\xcb\xb2\x90\x09\
+\x2c\x97\x4b\xe1\xa4\xaa\xfc\x3c\x1b\x15\x00\x0b\x97\x6b\x23\x67\
+\x04\xfd\x26\xf7\xd4\xa5\xec\x72\x5f\x03\xb7\x63\x16\xb0\x02\x48\
+\xfb\x59\x78\xfe\x35\xbc\x13\xb4\x52\x30\x59\x8a\xa7\x3e\xfd\xb1\
+\xb0\xf8\xdc\x51\x93\xdd\x71\xe1\x8a\x8f\x38\x8e\xf1\xf9\xa7\x9e\
+\xc5\x2b\xdd\x0a\x2a\xf5\x21\x54\x9a\x87\x31\x32\xd5\x44\x54\xae\
+\x81\xa0\x51\xaa\x94\xa5\x0e\xd1\x33\x8d\xbe\xcf\x51\xf2\x1b\xbe\
+\x9d\xcb\xd9\x30\x83\xd0\x1f\x47\xf7\x7a\x98\xfc\xe2\xbf\xbd\xfb\
+\x55\x7e\x63\x48\x29\x9c\x3f\x5a\xce\x1f\x26\x11\x26\xa8\x90\x43\
+\xac\xe3\xf6\x9d\x64\xbb\x3b\x10\x28\xfe\x05\x02\x3a\xfc\x02\x77\
+\x06\xde\x05\x54\xb8\x78\x11\x08\x2c\x1d\x11\xc1\x99\xbc\x47\x14\
+\x7e\xcc\x2b\xf9\x03\x98\x14\x94\xa4\x7b\x19\x63\xec\xfc\x3c\x20\
+\x9f\xf7\xcf\xff\xce\x41\x9f\xa7\x97\xad\xb3\xb2\xfb\x3b\xa8\x8f\
+\x4e\x07\xce\x7f\xb7\x66\x5f\x29\x85\x4e\xb7\x8b\xf3\xe9\x10\x66\
+\x8f\xdc\x8f\xa8\x54\x11\x33\x1a\xe7\xb4\xb6\x56\xc1\xd4\x7a\xa2\
+\xcb\x41\xf0\x8b\xe6\xa6\x4e\x9f\xbb\x08\xbd\x79\x7b\xb0\x3e\x77\
+\xb3\xf3\x95\xf6\x3e\x00\xf0\x99\x53\x3e\xa4\x9b\xd7\xc6\x0f\x8f\
+\x92\x31\xbc\xaf\x83\x02\x48\xac\xde\x4f\xd2\xfc\x30\x42\xe7\x42\
+\x39\x78\xa5\x52\xe6\x04\x50\x96\x37\x66\xf8\xe2\x46\xae\x4b\xcf\
+\x77\x7d\xa8\xeb\x0b\x45\x43\x7e\xe4\x1b\x2f\x28\x59\xe2\x63\x66\
+\x05\x24\x92\x13\x30\xe8\xe7\x0d\xc2\xb7\x80\x33\x65\xfa\xd4\x5f\
+\xfe\xbf\x18\x6e\x36\x71\xf2\xe4\xc9\x9b\x76\xff\xab\x59\x81\x38\
+\x8e\xf1\xcc\x8b\xe7\x31\x3c\x79\x84\xa3\x18\x6b\x10\x95\xab\x28\
+\x16\xa2\xc2\x5b\x1d\xd9\x75\xce\xf9\x53\xbf\x50\xf8\x2e\x08\x54\
+\xac\xff\xac\xdb\x91\x40\xaf\x45\x09\x00\x84\xa9\x27\x56\x7a\x22\
+\x7c\xda\xcc\x0f\x8b\xb4\xd6\x41\x83\x4f\x0b\xb7\x4c\xab\xbf\x36\
+\x05\xf0\xa8\x53\x8b\x19\xf6\x44\x87\xb5\x16\xed\xee\x00\x40\x8c\
+\x4a\xa5\x22\x5d\xbd\xfe\x9c\x3a\x1d\xb8\x7f\x5f\x07\x20\x05\x2c\
+\x79\x99\x97\x5f\x62\xf2\x93\xc2\xd8\xcf\x43\x33\xc6\xf0\x83\x9e\
+\x49\x14\x88\x84\xfb\xf7\x7f\x6f\x9d\xc5\x99\x6f\x7c\x01\x2a\xeb\
+\xa1\x3e\x36\x85\x77\xbf\xfb\xdd\x01\xf9\xdf\x4e\xe0\x3b\x76\x91\
+\x52\x18\x0c\x06\x58\x4a\x6a\xa8\x95\xb6\xe1\x3a\x97\xd1\xd4\x16\
+\x1b\x63\x6f\x42\xb5\x31\x1c\x0e\x72\xd6\x4a\xf3\x79\x3c\x8a\xa4\
+\x95\x5b\x92\x90\x71\x0c\x92\xa3\x61\xad\xb1\x77\x54\xb6\xdd\x0a\
+\xfd\x46\x61\x03\x8c\x4f\xfc\x63\x30\x48\x70\x6d\xb3\x87\xb8\x51\
+\xe5\xba\x7f\x1d\x87\x75\x76\xce\xc2\x64\x59\x28\x23\x0b\x4d\x28\
+\xa5\x68\xed\x4e\xf2\xdd\x03\x13\xc8\x69\xc7\x70\xf6\xae\x75\xc8\
+\xc4\x54\x97\x4b\x25\x06\x6f\x9e\xfb\x97\x69\x97\xdc\xb3\xe6\x4f\
+\xb4\xf4\x7c\x82\x67\xf9\xfd\xfe\x91\x72\x68\x9f\x45\x94\x81\x06\
+\x7e\x08\x36\x20\xb5\xf1\xce\x86\x12\x30\x28\xc0\xa6\x29\xbe\xf5\
+\xf8\x9f\x63\x78\x78\x18\x8f\x3c\xf2\xc8\x5d\xc5\xfd\x9d\x6e\x17\
+\xef\x9e\x8e\xb0\xb8\x7f\x14\x44\x23\x58\x5b\xdf\xc0\x17\xae\x6f\
+\xa2\x3a\x34\x1c\x5c\x8f\xf1\xf8\x45\x69\xa9\xca\x95\x96\x2d\x6b\
+\x00\x62\xe4\x1d\x45\xc5\x0e\xd8\xbc\x2c\x6c\x37\x82\xbe\x51\xe8\
+\xf9\xb9\xbf\xbc\x01\x2e\x5d\x5d\xc1\xf2\x66\x0f\x97\x7a\x0a\xdd\
+\xa8\x89\xea\xf0\x3c\x5a\x43\xc3\xe1\x04\x71\x67\x78\x5d\x9c\x75\
+\xe1\xac\x01\x3f\x76\x57\x46\xe9\x76\x5e\x9b\x02\x78\x77\x63\x2d\
+\xfa\x94\xe6\x89\x20\xc3\xed\xcc\x50\x40\xb9\x52\xe6\xf3\xee\xbd\
+\xa0\xfd\x1f\x8a\x79\xf7\x6d\xdc\x82\xfa\xf2\xcc\x9f\x52\x3b\xac\
+\x44\xfe\x99\x02\x6a\xc2\x81\xc9\x11\x88\xe4\x4c\x1d\xe7\xe0\x9c\
+\xc1\xcb\x4f\x7d\x16\xda\x0c\x50\x1b\x99\xb8\x65\xbe\xff\xd5\x00\
+\x20\x00\x34\x86\x86\x30\x54\xaf\x87\x2a\xa7\x2c\xcb\x78\x1e\x7f\
+\x08\xb7\xbc\x82\xfa\xe9\x63\x14\xe6\x1b\x73\x89\x96\x42\x24\xc0\
+\xd5\xbb\xbd\x3b\x09\xfe\x56\x4a\xe0\x43\x4f\xbf\xcb\x57\x56\xd7\
+\x70\xe9\xfa\x16\x96\xbb\x06\xd7\xb2\x21\x94\xea\x4d\x54\x87\x66\
+\x51\x99\x6c\xa2\x56\xae\x4a\x91\x08\xaf\xa5\x56\x79\xbd\x60\x14\
+\x46\xf0\xba\xb0\x73\x1c\xe7\x4a\x36\x5f\x93\x02\x28\x84\xf2\x1d\
+\xa0\x70\xe2\x46\xa7\x9f\x84\x70\xa3\x54\x2a\xc3\x85\x2e\xde\xfc\
+\x80\x06\xef\xda\x09\x0e\x91\x2f\xfc\x91\x2c\x60\x3e\x49\x14\xf0\
+\xa5\x4b\xcc\x15\xf9\xe6\x50\x7e\x5e\xda\x4a\xc2\xf7\x49\xfb\x5d\
+\xbc\xfc\xb5\xc7\xf1\xc2\x97\x3e\x89\xd1\x56\x0b\xef\x7e\xf7\xbb\
+\x65\x74\xda\xce\xbe\xfd\xdd\x5a\x01\xff\xf0\x8a\x8d\x02\xd9\xe2\
+\xc2\xe1\x91\x9e\x6b\xe1\x36\x6e\xa5\x48\xca\xb3\x7c\xad\x3e\x03\
+\x1a\x5f\x30\x72\xa7\xcf\xf5\x6c\xa2\xd6\x1a\x71\x1c\xa3\xd3\xed\
+\xe2\xdc\xe5\x6b\xb8\xbc\x99\x60\x39\x2d\xc3\x55\x86\x51\xa9\x2d\
+\xa0\x32\xd5\xc0\x44\xa5\x8e\xb8\x5c\x46\x14\x95\x00\xc5\x02\x56\
+\x91\x46\x96\x66\xc2\xa9\xc8\x9c\x40\xbf\x4a\xf2\x9d\x43\xf9\xb8\
+\x73\xc0\x2d\x46\xc3\xed\xcd\x02\x04\x19\x29\x0c\x84\x07\x20\x22\
+\x64\x26\x07\x20\xe5\x72\xa9\x40\x11\xfb\xdd\x62\x77\x14\x88\xd8\
+\x70\xfa\x26\x87\x51\x7e\xd0\x01\x89\x55\x08\x25\x63\x44\x70\x64\
+\x42\x93\x23\xc4\x12\xac\x5f\x3a\x87\x17\xbe\xf2\x69\x9c\xff\xe6\
+\x97\xd0\x1c\xaa\x63\xdf\xd8\x28\xb4\xd6\x77\x44\xfe\xaf\x66\x01\
+\x8a\x3f\x73\x57\x6e\x21\x86\xf6\x18\x45\x4e\xdf\xf2\xad\xe6\x7e\
+\x4e\x91\x13\x70\xaa\x95\xd0\xd7\xde\x82\xdc\x22\xf9\xa3\x94\x0a\
+\x21\xa2\x31\x06\x97\x96\xaf\xe3\xf2\x46\x07\x97\xbb\x31\x92\xf2\
+\x30\x4a\xd5\x7d\x28\x8f\x37\xd1\xaa\x0d\x41\x45\x25\x94\xe2\x32\
+\x74\xa9\x24\xd5\xd8\x92\x3f\x91\xb5\xd1\x24\xd4\xaf\x45\x5e\x2d\
+\x45\x80\x73\x26\xcc\x56\xca\x6b\x1f\x15\x8c\xcd\x5e\x9b\x02\x84\
+\xc5\x71\x96\x29\x59\x31\x59\x7d\x99\x4b\x07\x05\xc4\x71\x49\xd6\
+\x85\xe3\x62\x67\xad\xf0\xd4\xda\x9f\x56\x1d\x92\x41\x3e\x84\x33\
+\x72\xaa\x75\xa8\x67\xd3\x39\x6f\x20\x01\x04\xc8\x1a\x5c\x79\xf1\
+\x69\x3c\xfd\x99\x8f\x61\xf3\xca\x59\x8c\x8e\x8e\x62\x7a\xdf\x24\
+\x4a\xa5\x12\xaa\xd5\x2a\x1e\x79\xe4\x91\x3d\xc5\xfd\xb7\xfb\x5d\
+\x51\xd3\x89\xfc\x79\x3d\x9c\x7f\x60\x98\xe2\xcf\x31\xe0\x5e\x7d\
+\xad\x34\xbb\x82\xc8\xef\x01\xde\xd5\xed\x76\x3b\x1c\x8e\x59\x04\
+\x6f\x17\x2f\x5f\xc5\xd5\x8d\x6d\x5c\xed\x38\xac\x53\x03\x71\xad\
+\x89\xca\xd0\x0c\xea\x93\x2d\x34\xcb\x65\x69\xe4\xac\x70\x6f\x5f\
+\xe0\xf7\x15\x1c\x0c\xc8\xe6\xa7\x86\x10\x49\x57\xb4\xe3\x53\x40\
+\x94\x77\x01\xce\x82\x8f\xda\x89\x41\x70\xa1\xc5\x8c\x00\x64\xc6\
+\x76\x5f\x9b\x05\x08\xf3\x79\x01\x43\x72\x00\x71\x14\x61\x90\x66\
+\xc1\x30\x97\x4b\x65\x6e\xc6\xd4\x3c\x9d\x8a\x47\xb9\xc8\x81\x88\
+\x51\x9c\x2f\x72\x38\x6c\x9b\x41\x94\xd2\x25\x9e\xf5\xa5\x24\x77\
+\x00\xf0\x61\x09\x72\xb3\xc6\x1a\x3c\xfd\x99\x8f\x21\xd9\xb8\x8a\
+\xa9\xa9\x29\x1c\x3d\x7a\x14\x47\x8f\x1e\xc5\xfe\xfd\xfb\x31\x33\
+\x33\x13\x0e\xa1\xbc\x1b\xb3\x7f\xe3\xf3\xde\x82\x59\xe9\xb8\x64\
+\x85\x26\x9f\x6e\x90\xee\x7b\x25\xa3\x09\x7c\xde\x9d\x64\x72\x87\
+\xc3\xec\xdb\xdf\x8f\x7e\x67\x1b\xdb\xdb\xdb\xe8\xf7\x07\x78\x69\
+\xe9\x0a\x96\xb7\x33\x2c\x67\x55\x94\x86\x5a\x28\xd5\xc6\xa1\xa6\
+\x6a\x98\x1c\x6a\x02\xca\x8f\x6f\x8d\xe1\x9c\x43\xa9\x5c\x0e\xdd\
+\x4d\xce\xf1\x2c\x24\xed\x73\x1f\xb2\xab\x9d\xb5\x30\xce\xf1\x99\
+\xc2\x82\x4f\xbc\xa0\x75\x1c\x71\xcb\xbc\xcc\x15\x84\x24\xee\x8c\
+\xb1\xc8\xb2\xc2\x29\x93\x77\xa5\x00\x02\x88\x54\x14\x23\x33\x14\
+\x7a\xe6\x92\x4c\x46\x99\x43\x30\x00\x91\x6f\x5e\x07\xa4\x66\x27\
+\x52\xda\x1f\xfe\xc3\x78\xc0\xf2\x91\x66\x2a\x8a\xc2\x40\xe3\x30\
+\x22\x5e\x66\xe3\x41\x3a\x7e\x7c\xf3\x88\xc9\x52\xd4\xeb\x75\x4c\
+\x4c\x4c\xe0\x23\x1f\xf9\x08\x92\x24\x09\xc7\xd2\xee\xa5\xcc\x6b\
+\x37\x16\x20\xa7\x57\xf3\x71\x76\x24\xc0\x8f\x24\xbc\x85\x24\xa2\
+\x74\xc4\x75\x86\x0a\x1a\xa5\x52\x05\xb5\xd1\x49\x1c\xfe\xe1\x9f\
+\xc1\xfa\xa5\x57\xf0\x1f\x9e\x6f\xa3\x52\x9b\x41\x69\xb2\x81\x7d\
+\x8d\x16\x74\xa9\x04\xa5\x78\x62\x17\x03\x61\x15\xb2\xa5\x25\x29\
+\xae\xc9\xdb\xdb\xb8\x7e\xc2\xcf\x10\xb4\x26\x85\x7c\xad\x20\x60\
+\x3f\x41\x8d\x2c\xb7\xc2\xc1\x18\x68\x1d\xf1\xcc\x20\xe7\x42\xb3\
+\x2e\x00\x90\x33\xab\x77\x90\xee\xee\xd3\xc1\x44\xf9\xb4\x8f\x28\
+\x8a\x90\x66\x26\x58\x80\xa8\x14\x87\x8e\x5c\xef\x93\x48\x01\x86\
+\xf2\x5a\xb5\x9c\xbf\x94\x31\x2e\x00\x9c\x52\x20\xeb\xbb\x38\xb9\
+\x22\x98\xbb\x5a\x98\x6a\x35\x19\x1f\x74\x50\x2a\x95\x02\x05\x7d\
+\xab\xc4\xca\xdd\x0a\xfd\x56\x16\xc0\xc7\x30\x3e\xcd\x1c\x26\x92\
+\x53\x3e\xc5\x5c\x15\xd6\x05\x70\xd2\x34\xda\x84\x8a\x2b\xa8\x36\
+\x5a\x12\xdd\xf0\x90\x86\x28\x8a\xa1\xe3\x48\x4c\xb7\xc4\xc5\x61\
+\x51\x65\xc6\x1f\xf8\x54\x10\xeb\x15\x4f\x21\x14\xdf\xf0\x7a\xfa\
+\xb3\x96\xf2\x52\x78\xeb\xe7\x0b\x69\xb9\x0f\xc7\x73\x84\xf2\x9f\
+\x09\x16\xe4\x6c\x3f\xfb\xe2\x6b\x56\x00\x80\x10\x29\x60\x90\xa4\
+\x01\x31\x0f\x52\x13\x96\xa2\x54\xae\x48\xcb\x12\x09\xd5\xcb\x02\
+\xe5\xf1\x2c\x36\x14\x27\xf8\x1e\x41\xe3\x1c\xf7\xb2\x19\xcf\x96\
+\x49\xee\x9f\x3c\xa0\xf2\x03\x10\x49\xda\xbe\x69\x47\xf3\xe5\x9d\
+\x04\xbe\x17\xa1\xdf\x18\x83\x7b\xe0\xe4\x99\x3f\xc1\x80\xf0\x85\
+\x29\xc5\x43\x47\x24\x02\xe6\x7e\x3d\x08\xd0\x8b\x62\x50\xc4\xc7\
+\xc1\x10\xfb\x35\x28\xe5\xc2\x84\x32\x9e\xe7\x2f\x09\x2d\xa2\x10\
+\xe6\xfa\x6c\x1e\x91\xaf\x7a\x22\x3e\x67\x49\x89\x51\x85\x0b\xad\
+\x5e\xd6\x59\xc4\x9a\xfb\x00\x1d\x39\x28\xe2\xa1\xda\xd6\x72\x3b\
+\xb8\xf2\x27\xa9\x10\xc1\x91\xfd\xab\xcf\xff\x1f\x3f\xb3\xf4\xba\
+\x58\x00\x07\xae\xe1\xf3\x0a\x90\x86\xd3\xa9\x72\x9f\xe4\x04\xb0\
+\xb0\x5f\xa7\x9c\xf8\xf1\x26\x14\xec\x11\xb8\xf4\x9b\x4d\xa9\x92\
+\x4a\x56\x02\x71\xfa\xd8\xfa\xc2\x91\x1d\xdc\xca\x5d\xed\xf2\xdd\
+\x32\x73\xfe\x9e\xfc\xcd\x5a\x51\x64\x3f\xb3\x48\x41\xc1\x88\x30\
+\xc3\x24\x12\xb2\xc1\x4c\xc3\xb1\xd3\x73\xf2\x04\x69\x05\x2d\x98\
+\x97\x20\x87\x42\x08\x4f\xef\x67\x17\x16\x93\x65\xd6\x19\x8e\xdf\
+\x81\xc2\x31\xf4\x24\x50\xd4\x71\xae\x5f\x00\xa0\x25\x07\x8a\xe4\
+\xac\x26\x67\x01\xeb\xa4\x56\x93\x31\x59\x24\x45\xba\x49\x67\xeb\
+\x3f\x3d\xfd\xc7\xbf\xf7\x2b\x00\x6a\x00\x12\xe4\x8c\xf5\xdd\x28\
+\x80\x03\x49\x01\x86\x5f\xc0\xd4\xf0\x09\x80\x71\x1c\xcb\x2c\x40\
+\x9e\x55\x13\x4a\xbe\xac\xf3\xf7\x0c\x13\xe2\x69\x6f\xca\xb8\xa0\
+\x93\x08\xd0\xc5\xae\x0e\x0d\x64\xd6\x22\x8e\x3c\x95\xe9\xf2\x2d\
+\x87\x3b\x73\xec\x77\x23\xf4\x62\xc1\x47\x1c\xc7\x58\x59\xdb\x80\
+\x13\x42\x85\x90\x9b\x52\x27\x02\x27\x39\x85\xcb\x9f\xe2\x45\x4a\
+\x21\x82\x86\x81\x0d\x87\x53\x38\xa1\xbb\x8d\xcb\xe0\x7b\x6f\x19\
+\xe7\xf8\xd3\xd3\x48\x68\x71\x17\x9a\x68\x4d\xc6\x40\x12\x5a\xf1\
+\xb9\x01\xc4\x2d\xdf\xe1\x5c\x41\xa2\x10\x8a\x03\x0c\xee\xfc\x0c\
+\x00\x56\x3a\x03\xd8\xd4\xd8\x41\xe7\xd2\xc6\xa5\x33\x9f\x59\xfa\
+\x9b\x4f\x7f\x66\xeb\xec\xb3\x67\xe5\x45\x21\x56\xb9\x6b\x0b\xe0\
+\xd3\x8e\x00\xd0\xed\xf5\x77\x58\x80\x38\x8e\x61\x89\x90\x99\x0c\
+\xb1\x8e\xd8\xf7\x49\x46\x2a\x94\x7b\x09\x7f\xe0\x73\xfe\x4a\x48\
+\x13\x66\xdb\xfc\xdc\x20\xde\x59\xb1\x4c\xff\xe6\x44\xd0\xab\x57\
+\xf4\xee\xc5\xe4\xf3\x0e\xcb\xa9\xd6\x7e\x7f\x80\x8b\x57\xaf\xe2\
+\xd2\x5a\x17\x2b\x49\x0c\x6a\x4d\x61\x74\xaa\x91\x5b\x1f\x07\xf0\
+\x79\x86\x2e\xb4\x89\x29\x10\x9b\x5b\x02\xe2\xa8\xc4\xd3\x4c\x7c\
+\x24\xa2\xfc\x29\x25\xd2\x41\x2c\xd1\x4e\x9a\x5a\x19\x5b\xc3\x60\
+\xcd\x1f\x12\xcd\x13\xce\x18\x43\x90\x94\xc4\xb3\x63\x95\x6e\x1f\
+\xc3\xa7\xa3\x4b\xe4\x1c\x18\x55\xeb\x2c\x60\x0d\x65\x9d\xad\xcd\
+\xce\xf2\x99\x17\x96\xbf\xfd\xe4\xe7\x97\xbf\xfd\x85\x67\x00\xac\
+\x03\xd8\x00\x67\x00\xb7\x01\xf4\xee\xb4\xfb\xf7\x60\x01\x72\xf4\
+\xef\x1c\x1f\x4f\x9a\x1a\x5e\x90\x38\x8e\x79\x56\x1d\x04\xf8\x48\
+\xfb\x32\x40\x70\xc6\xaf\x24\x71\x07\xab\x27\x34\x8c\x15\x44\x6d\
+\xf9\x80\x63\x3f\x18\x59\x29\x58\x63\x78\xe6\xad\x3f\x28\xb2\x20\
+\xc4\x1b\x07\x37\xee\x16\xdc\xf9\x78\x1c\x00\xce\x5f\xbc\x8c\xe5\
+\x8d\x6d\x5c\xdd\x76\xe8\xc4\xc3\x28\x55\x87\x11\xb7\x66\xd1\x1a\
+\x1e\x41\xa9\x52\x83\x8a\x4a\x3c\xd4\x8a\x88\xad\x9c\x03\xe2\x98\
+\x6b\xed\xad\x71\x6c\xae\x25\x27\x92\xa6\x29\x7f\x1f\xe7\xe0\x14\
+\x1f\x08\x9d\x19\x93\x57\x32\xc9\xd1\x77\xd6\x11\x22\x4f\x8b\x93\
+\x9f\x4d\x00\xe8\x48\xe6\x29\x39\x42\x66\xbd\x15\xe1\x36\x79\x4b\
+\x6c\x19\x94\x4c\x0a\x03\x11\xd2\xee\x46\xbf\xbf\x72\xf1\xfc\xd5\
+\xe7\xff\xe6\xcb\x2b\x4f\x3f\xf1\x54\x96\xf5\x56\x00\xac\x01\xd8\
+\x14\x81\x77\x44\xe0\x29\x00\x5b\x10\x3c\xdd\x4e\xb6\xbb\x2e\x09\
+\x23\x01\x69\xfe\xe4\x0a\x23\x42\x8f\x7d\x53\x02\xf8\xc8\x76\x55\
+\xf8\x2f\x92\x62\xd0\xcc\x0f\x6c\xb2\x22\x18\x6f\x93\xb4\x0a\xc7\
+\xa7\x91\x63\x30\xe5\x7d\xb1\x3f\x45\xa3\x38\x91\x74\x37\x16\xa0\
+\xb8\xcb\xa3\x28\xc2\xf5\xd5\x35\x9c\xbf\xb2\x82\xab\xdb\x29\x36\
+\xa8\x0e\x55\xaa\xa1\x3c\xb4\x1f\xd5\x85\x26\xa6\xea\xcc\xbc\xf9\
+\xc9\x1f\x20\x3e\xb0\xc1\x59\x0b\x47\xf2\xdd\xb4\x83\x31\x59\x28\
+\x44\xb1\x7e\x3c\x0b\xc9\x20\x2a\x10\x9c\xb8\x85\x4c\xb2\x82\xd2\
+\xe9\xc6\xef\xe7\xfd\x7c\x9a\x09\xa8\x55\x21\xc2\xb0\x19\x73\x1d\
+\x61\x45\x64\x1d\x8c\x35\x50\xd0\x70\x69\x2f\xed\x5d\xbf\x72\x65\
+\xf5\xa5\xa7\xbe\x76\xf9\xe9\xcf\x7d\x35\xdd\x5e\xbd\x24\x02\xdf\
+\x92\x47\x07\x40\x1f\x40\x06\xc0\x88\xd0\xef\x28\xf0\xbb\xb4\x00\
+\xb9\x09\xf2\xcd\xa1\x99\xec\xd0\x52\xa9\xc4\x37\xab\x18\xec\x68\
+\x1d\xf3\xbf\x85\x4f\x8b\xb4\x66\xa7\x60\x09\xd0\x24\x6c\x9b\xf0\
+\x05\x2e\xff\x00\x27\xb1\x66\x98\x78\x29\xcb\xe2\x88\x9b\x24\x6e\
+\x6c\xbd\xf6\x42\x07\xf2\x6a\x5d\xad\x35\xba\xbd\x1e\x2e\x5c\xb8\
+\x8c\xa5\xd5\x0e\x56\xd3\x18\x59\xb9\x81\x72\x6d\x0a\xb5\xa9\x61\
+\x8c\xd7\x1a\x50\x2a\x46\xa9\x52\x06\xfc\x71\xea\x1e\x8c\xf9\xce\
+\x25\x82\x20\x70\x92\xca\x5a\x07\x93\xb1\xbb\xf3\x83\x9c\x88\x14\
+\xac\x49\x39\x23\xa8\x00\x2b\x4a\x9c\xe7\x01\x04\x37\x81\x23\x99\
+\x70\x68\x13\x15\xbb\xde\x19\x21\x87\xe2\x56\x72\x70\x59\x62\x92\
+\xad\xd5\xb5\xb5\x33\xcf\x7c\xe3\xd2\x37\x3e\xfb\x95\xde\xca\xd2\
+\x59\x70\x57\x8f\x37\xeb\x5e\xe0\x89\x08\xdc\x93\x3c\x7b\x12\xfa\
+\x9e\x14\x40\xc9\x74\x7a\x12\xcd\xf7\x45\x19\x59\xe6\x00\x68\xc4\
+\xa1\x22\x58\x07\xad\xe7\x1a\x3e\x8e\xe5\x19\x3a\xb0\x42\xc8\x48\
+\x5b\xf6\x7f\xd6\x77\xf6\x30\xf2\xd5\x32\xfe\xcc\x82\xb8\xe6\x5f\
+\x8a\x3f\xe3\x28\xc6\xd6\xc6\x16\x1a\x8d\xc6\x4d\xe0\xcd\xbb\xa4\
+\xf3\x17\x2f\xe3\xca\x5a\x1b\x57\xba\x40\x57\xd7\x51\xae\x37\xd1\
+\x98\x3a\x80\xb1\x6a\x0d\x4a\x97\x00\xcd\x55\x3e\x5a\xce\xde\xf3\
+\xc7\xb0\x38\xcb\x14\xb7\x9f\xd2\xed\x4b\xd2\xf8\x36\x38\xcc\xe2\
+\x50\xd5\x01\x2a\xe2\x81\xce\x5c\xb4\x20\xb3\xfc\x6c\xde\x99\x2c\
+\x39\x0b\xe7\x47\xd3\x90\xe3\xf7\xf2\xdf\x59\x1a\x5e\x01\x15\x0e\
+\xb8\x22\x93\x52\xda\x5e\xdf\xdc\xbc\xfc\xc2\x73\x17\x9f\x7a\xfc\
+\x0b\x5b\xe7\xbf\xf3\xa2\xec\xf0\x75\xb0\x59\xef\x80\xfd\xf8\x40\
+\x76\x79\x71\x87\xdf\x95\xc0\xf7\x6e\x01\x88\x14\xb3\x4b\x0c\x40\
+\x7a\xbd\x04\xd5\x12\x27\x86\x80\x18\x71\x89\xcf\xb5\xe1\xd1\x65\
+\xf9\x5c\x5d\x49\xa2\x23\xb3\x2e\x1c\x7a\xe8\x19\x36\x22\xc5\xa7\
+\x64\x87\x5d\x9e\x9f\x88\x11\x90\xbe\x60\x8a\x07\x7e\xf4\x67\xf0\
+\xdc\xe3\x7f\x8a\x95\x95\x8b\x88\xe3\x18\xd5\x6a\x15\x57\xae\x2e\
+\x63\x69\x79\x15\xcb\xed\x0c\xeb\x68\xa0\x54\xad\xa3\x5c\x5f\x44\
+\x75\xa2\x81\x46\xb9\x86\x38\x8e\x11\xc5\xe5\x42\xa3\x29\x2b\x9e\
+\x8a\xb8\xb0\x95\x8c\x09\xe4\x16\x14\xa4\xc3\x28\x92\x1d\x9c\x37\
+\xa6\x82\x80\xcc\x1a\x19\x92\xc5\xaf\xb3\xc6\x01\xe2\x16\x0c\x21\
+\x8c\xa3\xe3\xb0\xcc\x9f\x67\xec\x42\xe6\x93\xb7\x81\xb0\xa0\xce\
+\x92\xed\x6e\x75\xb6\xaf\x9d\x3b\x7b\xe9\xe9\x27\x3e\xbf\xf2\xdc\
+\x57\xbe\x25\x3b\x7c\x15\xec\xc3\xdb\x00\xba\xc8\xcd\xfa\xae\xfc\
+\xf8\x1b\xab\x00\xc8\xc3\x21\xc8\x90\x22\x22\x0d\xe3\x7c\x2a\x38\
+\x86\x23\x1e\x79\x16\xc5\x25\x49\x04\x69\xa6\x33\x25\x2b\xa5\x95\
+\x67\xf7\x10\xc8\x20\xad\x54\x18\x21\xe3\x4d\x30\x77\xb4\x2a\x68\
+\x2d\x75\xef\x14\xa3\x39\x75\x00\x0f\xfe\xfd\x5f\xc4\xda\x4b\x4f\
+\xe3\xcf\x1f\x7f\x12\x2b\xa6\x0a\x5d\x1d\x46\x75\x68\x0e\xa5\x99\
+\x06\x66\x86\x87\xa1\xa3\x92\x1c\x8e\xc0\x87\x28\x38\x70\x66\x4e\
+\x39\x8b\x28\xe2\x91\x35\x99\x75\xd0\x44\xe2\xc2\x34\x87\x59\x12\
+\x96\x66\x02\xb6\x3c\x69\x65\x9c\x91\xe1\x8d\x31\x8c\x05\x74\xa4\
+\x90\x19\x46\xfb\xc6\xc8\x3a\x68\x05\x6b\x18\xb5\x17\x5d\x11\xbf\
+\x87\x92\x33\x7d\x09\xa6\xdf\xee\xf7\xae\x5f\xbd\x72\xed\xf9\xaf\
+\x7c\xe5\xf2\xd7\xff\xfa\x6b\xce\x24\xd7\x44\xe0\xde\x8f\x17\x05\
+\x7e\x57\x7e\xfc\x0d\x55\x00\xd6\x64\xfe\x3e\xc6\xf0\x91\x66\xd5\
+\xb8\xc4\x49\x13\x0d\x94\x4a\x15\xf0\xd1\xbe\x5c\x3a\xa5\x94\x82\
+\x86\x0b\x99\x34\xdf\xc8\xa1\x55\xce\xf6\x29\xad\x19\xf0\x89\x4f\
+\xe5\x68\x50\x21\x8a\x39\x99\xe4\x7d\xad\xd6\x0a\xd5\x7a\x13\x3a\
+\x2e\xa3\xfc\xe0\x7b\x91\x0c\x3a\x98\xa8\xd6\x11\x97\xaa\xd0\x32\
+\x0c\x29\x8a\x63\x79\x0f\x15\xfe\x56\x41\x31\x5b\xe6\x2c\xd2\xcc\
+\xc0\x0f\x60\xb6\x06\xa2\xb8\x56\xc0\x26\x21\xcd\x24\xc4\x53\x32\
+\xf9\x0c\x79\x4d\x40\xe6\x52\x40\xf1\x7c\x44\x7f\x48\xb3\xd2\x0a\
+\xc6\x02\xce\x38\x2e\x82\xf1\xbc\xbd\x73\x88\x94\xc6\xa0\xdf\xc9\
+\x92\xb5\xab\xcb\xab\x67\x9e\xf9\xc6\xa5\xaf\xfd\xe7\x27\xd3\xce\
+\xda\x05\xe4\x48\x7d\x13\x6c\xd2\xbb\x60\xa4\x7e\xa3\xc0\xff\x56\
+\x84\xbe\x27\x05\xf0\x4a\xe0\xcb\x8c\x06\x69\x8a\x5a\x99\xe7\xcf\
+\x42\x03\x91\x98\x4e\x7f\xfc\x3b\x14\x85\xcc\x1e\x59\x2e\xbc\xe4\
+\x38\x59\x85\x7e\x7f\xc0\x9f\xa4\xad\xc2\x01\x8a\x5c\x72\x66\x43\
+\x0e\xdc\x59\xee\x06\xd2\xb1\x46\x49\x57\x10\x97\x2b\xa8\x36\x9a\
+\x61\x64\x5d\xa8\x25\x74\x2e\xef\x26\x26\x39\x46\xdd\x17\xa5\x42\
+\xca\xb6\xf9\x10\x76\x26\x99\x15\x90\x66\x72\xd6\x20\xe5\xe3\xee\
+\x94\x62\x13\xee\x91\x78\x26\xf7\x4b\xce\xf2\xc1\x0d\x82\xe0\x9c\
+\x74\xe1\xf8\xc1\x4c\x99\x49\x6d\xba\xb5\xb1\xbe\xf6\xca\xb3\xcf\
+\x5e\x7c\xea\xd3\x5f\xec\xad\x5c\x38\x0f\xe0\x3a\x18\xb8\x6d\x81\
+\x4d\x7b\x1f\x6f\xa0\x1f\x7f\xc3\x15\xc0\xc9\x54\x0e\x2e\xda\x70\
+\x9c\x09\xf4\x66\x2f\x8e\x91\x9f\x0f\x40\x9c\xb8\x00\x3c\x7d\x5e\
+\x28\x07\xf3\x55\x35\x04\x25\x9c\x36\xf9\x29\x62\x0a\xd0\xb2\xe0\
+\xc6\x5a\xc4\x4a\x5c\x83\x25\x90\x30\x63\x3c\x75\x3c\x82\x92\xc1\
+\x48\x21\x67\x00\x39\x24\x42\x18\x3b\x40\x7c\xba\x98\xe3\x30\x7b\
+\xd0\xf7\x15\x48\x1a\x35\x13\xda\xd6\x53\xb0\xd6\x19\x2e\x3e\x95\
+\xe3\xe7\x6d\x01\xcc\x02\xf9\x68\x3a\x32\x19\xf5\xdb\x5b\xed\xce\
+\xd5\x33\x2f\x5f\xf8\xea\x27\x3f\xbb\xb9\xf4\xfc\x0b\xd8\x89\xd4\
+\x3d\x5a\x2f\x0a\xfc\x0d\xf5\xe3\x6f\xa0\x02\xc8\x98\x38\x20\x98\
+\xcc\x41\x9a\xf2\x44\x0e\xd9\xc9\xa5\x52\x0c\xa7\xb8\x23\x45\x4b\
+\xd9\x52\x88\x75\x24\xb5\xaa\x65\x60\x81\x9f\x6d\x4b\x22\x88\xbc\
+\x8b\xc8\xc1\xd9\xbc\x49\xd4\xda\x42\x45\x8d\x5f\x32\x5d\x9c\x7a\
+\xe1\x93\x1d\x2e\x64\xc8\x42\x92\x08\xbe\xde\x50\x33\x29\x43\xfe\
+\x6f\x3c\xb8\x8c\x64\x90\x34\xbf\x91\x91\x72\xae\x2c\x33\xd0\x91\
+\x86\x25\x0e\xe5\x9c\xf5\xfd\x00\x16\x83\xce\x66\xaf\x7d\xe5\xc2\
+\xf9\xcb\xdf\xfc\xcf\x9f\x5f\xf9\xf6\x97\xbf\x09\x36\xe9\x6b\x05\
+\xa1\xf7\xc1\xa6\xdd\x9b\xf5\xef\x5b\x81\xef\x49\x01\x94\x8c\x89\
+\xf3\xd6\x9d\x0f\x6d\x02\x92\xd4\xc2\x67\xcc\x75\x14\x81\x0c\xef\
+\x46\x52\x14\xfc\xa1\x02\x87\x3e\x5a\x81\x27\x59\x16\x6a\xee\x64\
+\x68\x81\xd4\xfc\xfb\x2e\x60\xa9\x29\xf4\x53\xc2\xc9\xb3\x83\x10\
+\x72\x46\xce\x1a\x90\x8a\x19\x3e\x68\x41\x2a\x62\x25\x9a\x20\x47\
+\x61\x56\x8e\x0d\xbe\x9f\xf1\x05\xd7\x2c\x72\x75\x31\x39\x25\x21\
+\x1b\x57\x37\xfb\xe3\x6d\x2d\x00\x38\xc2\xa0\xdb\x1e\x6c\x5f\xbf\
+\xb8\xbc\xfa\xc2\xd7\xff\x66\xe9\xc9\x4f\x7d\xc9\x99\xc4\x33\x6e\
+\xeb\xc8\x19\xb7\x1e\x78\x87\xdf\x68\xd6\x7f\xa0\xae\x5d\x77\x06\
+\x11\x11\x54\xa4\x60\x6c\x06\x9b\xe5\x03\x46\x4b\x31\x37\x85\xe4\
+\x75\x5c\x7c\x26\x9e\x52\x7c\xe8\x93\xb1\x8e\xc9\x0e\xe7\x51\xb7\
+\x0a\x63\x66\x7c\xfd\x3a\xf9\xa9\x97\x32\x55\x14\xbe\xf9\x24\x35\
+\x92\x08\x51\x88\xe2\x08\xce\x8f\x79\xf5\xd3\xc8\x7d\xed\x01\xc4\
+\xe8\x08\xc7\x90\x19\xc3\x49\x2a\xc5\xb8\xc2\x65\x3e\xa3\xe9\x02\
+\x13\x69\x25\xbe\xb7\x44\x48\x7b\x5d\xd3\xdb\xb8\x76\x6d\xe5\xe5\
+\x67\xbe\x75\xf1\xa9\xff\xf4\x85\x74\x63\xed\x12\xd8\xac\xaf\x23\
+\x67\xdc\x3c\xaf\xee\x81\xdb\x6d\xf9\xf5\x1f\xa4\x6b\x77\x0a\xe0\
+\x4d\xa8\xe5\xa3\xcb\xc8\xe9\x9c\xce\x15\x73\x1f\x45\x31\x8c\x35\
+\x88\xbc\x60\x89\x8f\x3e\xd3\x9a\x05\x0b\xa2\x9c\x48\x91\xd4\xb0\
+\x35\x19\x87\x82\x50\xb0\xd6\x30\x1f\xee\x1c\x62\x20\x24\x5f\x20\
+\xfc\xba\xcf\xcf\x5b\x19\xa8\x6c\x2d\xf3\xe7\xdc\x0a\x9d\x87\x9c\
+\xfe\x3c\xf1\xcc\xb8\x80\x5d\x42\xc1\x84\x75\x70\x2e\x43\x9a\x18\
+\x9b\x76\xd6\xdb\xab\xe7\xbe\xfd\x9d\xa5\x2f\x7d\xe2\x73\xdd\xeb\
+\x17\xcf\x21\xf7\xe3\x3e\x3c\xeb\x63\x67\x3c\x2e\x89\xdf\xbf\x5b\
+\xd7\x9e\xc6\xc4\xf9\x52\xe4\x44\x9a\x11\x00\x48\x21\x22\xf2\x1d\
+\xe9\xb8\xc0\x41\x4b\xc8\x64\xad\x83\xf2\x83\xa5\x40\x21\xe4\xd2\
+\x4a\x4b\x65\x31\x6f\x24\x7b\x03\xcd\xcb\x80\x9c\x42\xce\xdd\x64\
+\x99\x60\x03\x84\x32\x35\x5f\x86\xe6\x88\xf2\x23\xd4\x0a\xdf\x05\
+\xd0\xf2\xbb\x84\x7a\xdb\x9b\xdd\xed\xab\x4b\x67\xce\x7d\xf1\xcf\
+\x3e\xbb\x79\xfe\x39\x0f\xdc\xbc\x1f\xdf\xc6\xcd\xf1\xb8\xff\x72\
+\x7f\xa7\xaf\x5d\x27\x83\x7c\xb2\x22\x49\x33\x0c\x5c\x9e\xd0\xd1\
+\x42\x88\x84\xb6\x2f\x07\x58\xb2\x90\xfd\x2b\x42\xb2\x21\x61\xe2\
+\x87\x18\x19\x6b\x60\x6c\x71\x84\x0b\xf2\x53\x40\x8d\x63\xd3\x2d\
+\x79\x74\x3f\x0e\xce\x9f\xb2\xe5\x19\x25\xa5\xf8\x38\x3b\x6b\x49\
+\x1a\x53\x34\x34\x34\x32\x9b\xa2\xb3\xb1\xd5\xeb\xae\x5d\xbe\x7c\
+\xf5\x99\xcf\x7d\xf9\xf2\x33\x8f\x3f\x85\x1c\xb8\xad\x23\x47\xea\
+\xde\x8f\xff\xad\x13\x30\xdf\x2f\xd7\x8d\x0a\x70\xeb\xc2\x01\xe1\
+\xde\x3d\x92\x4e\x32\xbb\xe3\xa5\x3e\xa7\xad\xa4\x1b\xc8\x9f\xf8\
+\xcd\x71\xb7\x92\xea\x16\xdf\xcc\xe0\xdf\x8f\xd9\x35\x20\x47\xf4\
+\xbe\xee\xc0\x64\x99\x1c\x13\xef\xb3\x87\x32\x63\x00\x08\x21\x9f\
+\x0f\x07\x8c\x1c\xab\xd6\xef\x6e\xa5\xdd\xf5\xe5\xeb\x6b\x2f\x3e\
+\xf3\xf4\x99\x2f\xfe\xd9\xe7\x61\x52\xcf\xb8\x6d\x20\xe7\xd5\x7d\
+\x3c\x5e\x4c\xa4\xfc\x9d\xdf\xe5\x77\xba\x8a\x0a\x20\xb3\xdc\x0a\
+\x92\x75\xa4\x10\x2b\x3e\x33\x08\x0e\x51\x89\x7b\xd1\x53\x5b\x70\
+\x01\x71\x1c\xe6\x3b\xf0\xc1\x92\xfe\xf8\x52\x27\x4d\x93\xbe\xdf\
+\x8f\x42\x2c\x0d\x00\x1a\x16\xa9\xe5\x79\x03\xd6\x77\x01\xeb\x08\
+\xce\x64\x79\x1c\x2f\xb8\x41\x47\x1a\x69\x9a\x72\xef\x9b\x34\x65\
+\x0c\xfa\x1d\xd3\x5e\x5d\xde\xd8\x38\xf7\xed\x6f\x9f\xfb\xe2\x9f\
+\x7f\x2e\x6d\xaf\xfb\x54\xa9\x4f\xa4\x78\xb3\xfe\x7d\x49\xc0\x7c\
+\xbf\x5c\x5e\x01\x7c\xe9\x50\x24\xcf\x29\x00\xca\x11\x69\x0d\x52\
+\xd6\x31\xed\x69\x2c\xb7\x64\xf7\x93\xbc\x73\xd3\x18\x0b\x03\x82\
+\x8e\x23\x29\xf6\xe4\xdd\xc9\x0d\xa4\x56\x66\x0a\x72\x29\xb3\x37\
+\xf7\x0a\x1a\x89\x31\x42\xd4\xc8\xc9\x98\xd6\x80\x88\xcf\xcb\x8d\
+\xe2\x98\x39\x75\x49\x1b\x3b\x4b\x48\x93\x84\x7a\x5b\xd7\xda\x1b\
+\x97\x5e\x78\xf9\xec\x13\xff\xdf\x5f\x77\x57\x2e\x9c\x05\x33\x6e\
+\x37\x0a\xfc\x46\x3f\x7e\x4f\xe0\x77\xb8\x8a\x0a\xa0\x01\x94\x00\
+\x54\xe5\xff\x4a\x91\x8d\x00\x3e\xcf\x8e\xf3\xed\x0c\xec\x82\x0b\
+\x50\x0a\x50\x31\x17\x27\x66\x46\x46\xc8\x68\x2e\x6c\x74\x9c\x31\
+\xf3\x34\x6a\x14\x47\x62\xbe\x1d\x22\xcd\xb3\x6d\x8d\x23\x28\x32\
+\xcc\x12\x2a\x2d\x09\x44\x87\xc4\x18\x64\x49\x8f\xfa\xdb\x9d\x7e\
+\x67\x65\x69\xe9\xfc\x93\x7f\xf9\xb9\xf5\x97\x9f\xfa\x36\x72\x3f\
+\xbe\x89\x7b\x7e\xfc\x75\xb9\xfc\x6e\x07\x58\x01\x2a\x00\xea\xe0\
+\x4a\xd2\x92\x73\xb6\x14\x89\x9f\xf5\xd9\x40\x93\x59\xa9\x07\xd4\
+\xe1\x00\x86\x2c\xcb\xeb\x12\x2c\x0c\x5c\xc6\xff\x26\x70\x1d\x9c\
+\xd2\x8a\x7b\xd7\x25\x3d\x9a\xa6\x86\xb9\x79\x19\x23\x47\xd2\xef\
+\xd6\xdf\xee\x0c\x3a\xab\x17\xae\x5c\x7d\xee\xc9\xaf\x5e\x7c\xf2\
+\x53\x4f\x62\x27\x52\xf7\x99\xb3\x22\xe3\xc6\x67\xa8\xde\x13\xf8\
+\x5d\x5f\x31\x0a\x3c\x8a\x3c\xe7\x15\xa1\x46\xc6\x74\x51\xa2\x38\
+\x33\x16\x91\xd6\x41\x60\x49\xc6\x93\x2a\xb5\xd2\xb0\xd6\xc8\xe4\
+\xef\x9c\xfb\x77\x32\x28\xc2\xb7\x5a\x69\x40\x18\x37\x96\x95\xaf\
+\x21\x4c\xfa\xbd\x6c\x7b\xf5\xea\xf5\xb5\xb3\xdf\xfe\xd6\xd9\xc7\
+\xff\xe8\xaf\x5d\x0e\xdc\x36\xb1\x13\xb8\xf5\x71\x4f\xe0\x6f\xc8\
+\xe5\x5d\x00\xe7\x48\x99\xe9\xf2\x6e\xa0\xea\x92\xde\x25\xd4\x9b\
+\xba\x37\x18\xa0\x5e\x2e\x85\x41\x8e\xa9\x11\x5f\xae\x39\xc3\xc7\
+\x75\x6d\xaa\xc0\xc9\x17\x4a\x9b\x15\x60\x2d\x1f\x77\x92\x0c\xba\
+\xa6\xbb\x79\x7d\xb3\x7d\xf1\xc5\xef\xbe\xf2\xc4\x9f\x3d\x9e\x6e\
+\x2e\x2f\x61\x27\xe3\xd6\xc6\xad\x2b\x60\xfe\x8b\x46\xea\x6f\xe4\
+\x75\xa3\x02\x0c\x90\x03\xc2\xd2\xa0\xbd\xfa\x4c\x75\x74\xea\xa7\
+\xd7\xd7\xd7\x31\x3c\x37\x23\xf3\x7e\x22\x24\x86\x37\x60\x14\xc7\
+\x18\x0c\x0c\xfa\x59\xc6\x8c\x1c\xf9\x7e\x75\x82\x23\x85\x24\xed\
+\x53\xd2\xed\x74\xdb\x97\x5e\x7e\xf9\xec\x57\x3e\xf1\xf9\xf6\xf9\
+\xe7\x9f\xc7\xce\x44\x4a\x11\xb8\xed\xba\x92\xf5\xde\xf5\xfa\x5d\
+\xc5\x30\xb0\xa8\x04\x1a\x40\xb4\xf1\xfc\x93\x5f\x6b\xce\x1d\x6f\
+\xf7\xb6\xb6\x86\x96\x2b\x95\xa8\x5c\x6b\xe0\x5b\x17\xd7\x70\x6e\
+\x65\x00\xa8\x08\xb5\x46\x0b\xfd\x2c\x05\x91\x42\x9a\x5a\xb8\x2c\
+\xa5\xa4\xdf\x1e\x74\xae\x5d\xbc\x70\xf1\x9b\x9f\xfb\xd2\xf2\x33\
+\x9f\x7f\x1a\x3b\x05\x5e\xe4\xd5\x6f\x04\x6e\xc0\x3d\xa1\xff\xad\
+\x5f\xb7\x22\x7e\x34\xd8\x02\x34\x00\x4c\x4d\xbf\xeb\x27\xfe\xdb\
+\xe6\xfe\xfb\x7f\x8b\x40\x14\x29\xdf\xd9\x06\x94\x2a\x15\xcc\x1e\
+\x3a\x81\x24\xe9\x25\xfd\xcd\x95\x6b\xcb\xdf\xf9\xda\x37\x2e\x7c\
+\xe9\xcf\xbe\x80\x1c\xb8\xad\x21\x6f\x50\xf8\xbe\xa9\x80\xb9\x77\
+\xed\xbc\x6e\xd7\x32\xa4\x01\x94\x01\x0c\x03\x98\x19\x7f\xf0\xb1\
+\x9f\x1a\x9a\x3b\xf2\xd3\x71\x5c\x1e\x03\x9c\xad\x54\x6b\xa0\x7e\
+\xfb\xb9\x57\x3e\xfb\xc7\x7f\x65\x7a\x9d\xab\xe0\x78\x7c\x13\xf7\
+\x08\x98\x1f\xb8\x4b\xdd\xe1\x77\x9e\x17\x68\x02\x18\x05\xb0\x0f\
+\xc0\x08\xd8\x6d\xf4\xc1\x42\xf6\xb1\xf8\x3d\x02\xe6\x07\xf4\x52\
+\xbb\xf8\xfd\x8d\x04\x11\xc0\xbb\xba\x58\x0c\x71\x8f\x80\xf9\x01\
+\xbd\x5e\x4d\x01\x6e\xf5\xda\x7c\x78\xc6\x3d\x81\xdf\xbb\xee\x5d\
+\x3f\xd8\xd7\x5e\x2c\xc0\x6e\xfe\xee\x9e\x45\xf8\x01\xbb\xfe\x7f\
+\xcd\x94\xf1\xb4\xcf\x6a\x61\x95\x00\x00\x00\x25\x74\x45\x58\x74\
+\x64\x61\x74\x65\x3a\x63\x72\x65\x61\x74\x65\x00\x32\x30\x31\x35\
+\x2d\x30\x37\x2d\x32\x35\x54\x32\x31\x3a\x34\x39\x3a\x34\x31\x2b\
+\x30\x38\x3a\x30\x30\x42\x16\x06\x54\x00\x00\x00\x25\x74\x45\x58\
+\x74\x64\x61\x74\x65\x3a\x6d\x6f\x64\x69\x66\x79\x00\x32\x30\x31\
+\x32\x2d\x30\x34\x2d\x30\x35\x54\x32\x33\x3a\x30\x35\x3a\x35\x30\
+\x2b\x30\x38\x3a\x30\x30\x81\x9c\xbb\xab\x00\x00\x00\x4e\x74\x45\
+\x58\x74\x73\x6f\x66\x74\x77\x61\x72\x65\x00\x49\x6d\x61\x67\x65\
+\x4d\x61\x67\x69\x63\x6b\x20\x36\x2e\x38\x2e\x38\x2d\x31\x30\x20\
+\x51\x31\x36\x20\x78\x38\x36\x5f\x36\x34\x20\x32\x30\x31\x35\x2d\
+\x30\x37\x2d\x31\x39\x20\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\
+\x2e\x69\x6d\x61\x67\x65\x6d\x61\x67\x69\x63\x6b\x2e\x6f\x72\x67\
+\x05\x0c\x9c\x35\x00\x00\x00\x18\x74\x45\x58\x74\x54\x68\x75\x6d\
+\x62\x3a\x3a\x44\x6f\x63\x75\x6d\x65\x6e\x74\x3a\x3a\x50\x61\x67\
+\x65\x73\x00\x31\xa7\xff\xbb\x2f\x00\x00\x00\x18\x74\x45\x58\x74\
+\x54\x68\x75\x6d\x62\x3a\x3a\x49\x6d\x61\x67\x65\x3a\x3a\x48\x65\
+\x69\x67\x68\x74\x00\x31\x32\x38\x43\x7c\x41\x80\x00\x00\x00\x17\
+\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x49\x6d\x61\x67\x65\
+\x3a\x3a\x57\x69\x64\x74\x68\x00\x31\x32\x38\xd0\x8d\x11\xdd\x00\
+\x00\x00\x19\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x4d\x69\
+\x6d\x65\x74\x79\x70\x65\x00\x69\x6d\x61\x67\x65\x2f\x70\x6e\x67\
+\x3f\xb2\x56\x4e\x00\x00\x00\x17\x74\x45\x58\x74\x54\x68\x75\x6d\
+\x62\x3a\x3a\x4d\x54\x69\x6d\x65\x00\x31\x33\x33\x33\x36\x33\x38\
+\x33\x35\x30\xdc\x83\xdc\x6c\x00\x00\x00\x11\x74\x45\x58\x74\x54\
+\x68\x75\x6d\x62\x3a\x3a\x53\x69\x7a\x65\x00\x32\x30\x4b\x42\x42\
+\x9c\xc9\x2a\xd5\x00\x00\x00\x5a\x74\x45\x58\x74\x54\x68\x75\x6d\
+\x62\x3a\x3a\x55\x52\x49\x00\x66\x69\x6c\x65\x3a\x2f\x2f\x2f\x68\
+\x6f\x6d\x65\x2f\x77\x77\x77\x72\x6f\x6f\x74\x2f\x77\x77\x77\x2e\
+\x65\x61\x73\x79\x69\x63\x6f\x6e\x2e\x6e\x65\x74\x2f\x63\x64\x6e\
+\x2d\x69\x6d\x67\x2e\x65\x61\x73\x79\x69\x63\x6f\x6e\x2e\x63\x6e\
+\x2f\x73\x72\x63\x2f\x31\x30\x36\x32\x33\x2f\x31\x30\x36\x32\x33\
+\x30\x39\x2e\x70\x6e\x67\x73\x38\xf8\x06\x00\x00\x00\x00\x49\x45\
+\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x05\x3a\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xd6\xd8\xd4\x4f\x58\x32\
+\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
+\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
+\x79\x71\xc9\x65\x3c\x00\x00\x04\xcc\x49\x44\x41\x54\x58\xc3\xb5\
+\x97\x5d\x4c\x5b\x65\x1c\xc6\x77\x6f\xbc\xd9\xe5\x12\x49\x20\x71\
+\xd7\x26\xe3\x4e\x13\xb8\x70\xd1\x85\x44\xbd\x50\xe3\x10\x18\xe5\
+\x2b\x2e\x26\x4a\x04\x27\x86\xaa\x8b\x99\xe0\xd0\xa2\x6c\x19\x86\
+\x39\x17\xdc\x1a\x16\x98\x80\x40\x6c\xa6\x43\xca\x20\x2b\x83\x1e\
+\x28\xcc\xda\xd1\x96\xd2\xd2\x4a\x7b\xfa\x01\xa5\xd0\xef\x16\x1e\
+\xdf\xff\xdb\x1d\xc7\xcc\x04\x2a\x87\x93\x3c\x39\x6f\x21\x9c\xe7\
+\xf7\x3c\xef\x47\x0f\x87\x00\x1c\xca\x46\xcf\xbd\xfa\xe9\xbb\x4c\
+\x5a\x26\x61\x0f\x6a\x60\xca\xd9\xe9\x79\xd9\x9a\x3f\x5d\x50\xf2\
+\xa5\xc1\xe9\x8f\xa7\x57\xc3\x40\x30\x02\x84\xa2\x19\xad\xc7\x32\
+\x8a\x27\x81\x58\x22\x73\xbf\x79\x6b\xda\x4b\x10\x72\x02\x1c\x7b\
+\xe7\xac\xda\x1c\xd8\xc8\x98\x12\x40\x84\x99\x85\xe3\x19\x91\x31\
+\x29\x1a\x4b\x61\x25\x94\x44\x38\x9a\x42\x73\x87\xc6\xbe\x13\xc4\
+\xff\x02\x90\x12\x93\x79\x24\xf1\xc8\x58\x92\xcf\x1f\x84\x5d\x8c\
+\xc2\xe5\x09\x22\x12\x4b\xa3\xf4\xc3\xef\x4d\x34\x75\x59\x01\xb0\
+\xeb\xd8\x36\xd5\x90\x9e\x3a\xfc\xcc\xb9\xe7\x5f\x2e\x11\x3f\x56\
+\x9e\x45\x45\x55\x0d\x2a\x99\xde\xaf\xad\xc3\x9d\xb1\x89\xc7\x00\
+\xac\xb6\x25\xfc\xb9\xe8\x87\x6b\x15\x58\xf6\x04\x10\x08\xc6\xd2\
+\xaf\x9c\xbe\x70\x9f\x41\x1c\xd9\x15\x80\x5d\x87\x99\x1a\x8a\x8a\
+\x8a\xcc\x92\x5a\x5b\x5b\xdd\xa4\xaf\x55\xad\xfe\xaf\x54\xdf\xa6\
+\x06\x06\x06\x31\x39\x35\x85\xd9\xb9\x39\xe8\x26\x26\x50\x50\x50\
+\x80\x21\xcd\x6f\x7c\xde\x49\xa6\xf9\x05\xcc\x98\x5c\x1c\xc0\xe1\
+\x4f\x41\xf4\x85\xf0\x43\xaf\xce\xcd\x00\x6a\xf6\x02\x50\x43\x66\
+\xd8\xe5\x8a\xc7\xe3\xf0\x7a\xbd\x48\xa7\xd3\x98\x9c\x9c\x44\x65\
+\x65\x35\x66\x67\x8d\xbc\x81\x07\x66\x1b\x74\xd3\x16\x0e\x40\x32\
+\x2d\x78\xf0\xdd\x8d\x51\x8f\xac\x00\xe1\x70\x18\x46\xa3\x91\x8f\
+\x53\xa9\x14\x7e\xea\xed\x45\xe3\x27\x9f\x61\x86\x41\x38\x96\xdc\
+\x50\x77\x75\xe3\x4c\x43\x23\xce\x35\x9d\xc7\xed\x91\x71\x5c\xbc\
+\x3e\x2c\x2f\xc0\xc6\xc6\x06\xf4\x7a\xfd\x63\x40\x7d\x7d\xfd\x50\
+\x32\x88\xd0\x46\x1c\x66\x9b\x0b\x82\xc1\x88\xa9\x19\x13\xac\x0e\
+\x11\x97\xba\x64\x6e\x80\x00\xa6\xd8\x3a\xd8\x7e\x45\x22\x11\x94\
+\x2b\x2a\x30\xae\x13\x40\xe7\x04\x6d\x57\xda\xaa\x34\xbe\x7c\x53\
+\xe6\x35\x40\x66\x3a\x9d\x0e\xc3\xc3\xc3\xe8\x65\xf5\xf7\xf7\xf7\
+\x43\xab\xd5\xa2\xaa\xba\x06\x63\x77\xf5\x90\x0e\x2a\x77\x90\xed\
+\x04\xb6\x0e\xda\xbb\x65\x06\xa0\x79\xb7\xdb\xed\x18\x1a\x1a\x42\
+\x67\x67\x27\x7a\x7a\x7a\x38\x50\x49\x69\x19\x6e\x69\xf5\x10\xd7\
+\x00\x6f\x08\xb0\xf9\x00\x67\x00\xb8\xd0\x25\x33\xc0\xd6\xd6\x16\
+\xdf\x09\x81\x40\x00\xa2\x28\xc2\xef\xf7\x63\x6d\x6d\x0d\xa7\x14\
+\x95\xd0\xfc\xae\xe7\xa9\xc9\x7c\xc1\x0b\x98\x3d\x40\x9b\xdc\x00\
+\xdb\x41\x36\x37\x37\xf9\x76\xa4\x56\x14\x15\xd5\xe8\xfb\x55\xe0\
+\xa9\x1d\x81\x47\x00\xe7\x3b\x0f\x00\x80\xcc\x25\x80\x24\x33\x4f\
+\x24\x12\x28\x2b\xaf\xe2\x00\x7f\xb8\x00\x8b\x98\x01\xa0\x36\x5a\
+\xd5\x07\x30\x05\xff\x98\x27\x93\x3c\x3d\x4d\x49\xc9\xa9\x4a\x0e\
+\xa0\xb7\xb3\x03\x89\x3d\xc5\xf8\x17\x30\xb1\x00\x7c\x71\xf5\x00\
+\x00\xa4\xea\xc9\x98\x14\x8b\xc5\x50\xa6\xa8\x82\x7a\x48\xc0\x98\
+\x19\xb8\x6b\x05\xe6\x9c\x99\xfb\xe7\x57\x64\x04\x90\xd2\x53\x6a\
+\x02\x88\x46\xa3\xdc\x3c\x14\x0a\xa1\xb8\xb4\x02\xd7\x06\x05\xdc\
+\x66\x87\xe4\xa0\x01\x1c\x64\xc4\x04\x28\x3b\x64\x06\x48\x3d\x9c\
+\x73\x12\x99\xd3\xb9\x40\x20\xc5\x65\x55\xb8\xd8\x2d\xa0\x7f\x3a\
+\x63\xae\x7d\x90\x69\xe0\xa3\x76\x99\x00\xfe\x5d\x3d\xa5\x26\xad\
+\xae\xae\x72\x88\xb7\x4a\x2a\x70\xb9\x57\xc0\x3d\x1b\xb8\x7e\x9e\
+\x01\xee\xcc\x03\x67\x2e\xed\x13\x40\xaa\x9d\x44\x8b\x8e\x92\xd3\
+\x71\x4c\xdf\x01\x2b\x2b\x2b\x58\x5f\x5f\xe7\x10\x27\x59\x03\xdf\
+\x74\x09\x50\x4f\x00\xbf\xcc\x65\x1a\xb8\x32\x06\x34\xec\xa7\x01\
+\xc9\x58\xda\xeb\x64\x4e\x69\x29\x39\x1d\x44\x04\x40\xf5\xd3\xcf\
+\xde\x7c\x5b\x81\x96\xeb\x02\x4f\x7e\x75\x1c\xb8\x71\x0f\xf8\x71\
+\x2c\x9e\x7e\xbd\x4e\x6d\xa6\x37\xaa\xac\x00\x9e\x64\x2c\x6d\x37\
+\x32\x25\x00\xd1\x23\xf2\xe4\x12\xcc\x1b\x27\x15\x68\xef\x11\xa0\
+\xbc\x66\x5b\x7f\x4f\x35\xe2\x3c\x71\x9a\xbf\x8e\x69\xf7\xfc\x4a\
+\x26\x01\x90\xa9\x24\x69\xb5\x53\x42\x32\x0f\x06\x83\x70\xb9\x5c\
+\xdc\x90\x5e\x4a\xe8\xb3\xc7\xe3\x81\xdb\xed\xc6\xf1\x13\xaf\x25\
+\x9f\x7d\xa1\x9c\x4c\x3b\x98\x8a\x99\x8e\x3e\xc9\x78\x47\x00\x95\
+\x4a\xc5\x01\xa4\x15\x2e\xcd\x37\x19\x52\x52\x3a\xf7\x29\xb5\xc3\
+\xe1\xe0\x22\xe3\xc5\xc5\x45\x0e\xf5\xe2\xf1\x97\x5c\xf4\x1e\xb9\
+\x93\xe9\xae\x00\x2d\x2d\x2d\x6e\xe9\x60\xa1\xd4\xd2\x97\x0d\x8d\
+\x97\x97\x97\xe1\xf3\xf9\x60\xb3\xd9\xf8\x7d\x69\x69\x89\x43\x10\
+\x00\x8d\x0b\x0b\x0b\xcd\xb2\x00\xd0\xa2\x92\x52\x93\x11\x8d\xe9\
+\x4e\xdf\x78\x54\x3b\x35\x60\xb5\x5a\x79\xf5\xd4\x0a\xfd\xce\x60\
+\x30\x24\xf2\xf2\xf2\xee\xb3\x67\x1c\xd9\x17\x40\x53\x53\x93\x5b\
+\x9a\x67\x4a\x4f\x22\x13\xaa\x9a\xc6\x16\x8b\x99\x37\x40\x9f\x47\
+\x47\x47\x23\x6d\x6d\x6d\xde\xfc\xfc\x7c\x13\xfb\xdb\x41\xa6\xb2\
+\xbd\x9a\xff\x27\x40\x73\x73\x33\x9f\x02\x4a\x47\x10\x54\x3f\x55\
+\x3f\x3f\x3f\xcf\xeb\xd6\x68\x34\x91\xba\xba\x3a\xe7\xc3\xb4\x5d\
+\x4c\x1f\x30\x1d\xcd\xc6\x78\x47\x00\xa5\x52\xe9\x76\x3a\x9d\xbc\
+\x62\x4a\x4a\x6f\x3e\x94\xb4\xbe\xbe\xde\x99\x93\x93\x23\x99\x16\
+\x67\x53\x75\x56\x00\x8d\x8d\x8d\x6e\x8b\xc5\x82\x81\x81\x81\x48\
+\x6d\x6d\xad\x33\x37\x37\x57\x56\xd3\xdd\x00\xf8\x7f\x46\x4c\xc2\
+\x41\x99\x6e\xd7\xdf\x43\x39\x56\x18\x85\x70\xc8\x04\x00\x00\x00\
+\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x5d\xa6\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x80\x00\x00\x00\x80\x08\x06\x00\x00\x00\xc3\x3e\x61\xcb\
+\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
+\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\
+\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\
+\x00\x00\x3a\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x00\x06\
+\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\x00\
+\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7\
+\x6f\xa8\x64\x00\x00\x5b\x18\x49\x44\x41\x54\x78\xda\xed\xbd\x77\
+\x98\x5d\x57\x7d\xef\xfd\xd9\xe5\xec\xbd\x4f\xef\xe7\x4c\xef\x45\
+\xbd\xcb\xb2\xe5\x6e\x63\x63\x63\x8c\x63\xc0\x24\x94\x00\x49\x48\
+\x02\x04\x48\xb9\x90\x84\x10\x42\x12\x12\x48\xb9\x81\x7b\x79\x09\
+\x49\x08\x09\x24\xf4\x62\x30\x60\x63\x0c\x36\xb8\xc9\x45\xb6\x7a\
+\x19\x69\x46\xa3\xe9\xe5\xcc\x99\xd3\xfb\xd9\xed\xfd\xe3\x8c\xc6\
+\x92\x65\x59\xc5\x92\xed\xfb\xbe\xf7\xfb\x3c\x7a\xf4\x3c\x67\xf6\
+\x5e\x6b\xed\xb5\xbe\xab\xfd\xaa\xc0\xff\xc5\x59\xb1\xeb\xaf\x3f\
+\xec\xd6\x2b\x95\x77\xe8\x0b\x0b\x37\xa5\x92\xc9\xad\xd1\x48\xa4\
+\x5e\x32\x8c\x05\xd5\xed\x19\x77\xc7\xa2\x5f\x41\x14\x0f\x98\x86\
+\xb1\xb0\xed\x93\xff\xdb\x7a\xb9\xdb\xb6\xe3\x7f\x7f\x52\x10\x05\
+\xf1\xad\xf5\x5a\xf9\xd7\x2c\xdd\x08\x3b\x6a\xf2\x33\x92\xa2\x3c\
+\xa2\x1b\xb5\x1f\x5f\xf3\x89\x4f\x19\x67\x7b\x5f\x78\x65\xba\xf4\
+\xff\x0c\x3c\xf3\xa9\x3f\x51\x6a\xb6\xf9\x9b\xb9\xf1\x89\x3f\x6f\
+\xae\xeb\xad\xed\x1d\x9d\xa8\x9a\x86\x28\x8a\xe8\xf5\x3a\x8b\x8b\
+\x8b\x24\x53\x29\xe6\x8c\xba\x1d\x59\xbf\xfe\xbb\x1e\xc9\xf1\x87\
+\x9b\xff\xf4\x53\xb3\x2f\x6b\x1b\xbf\xf8\x99\xdb\x16\x46\x0f\xdf\
+\xbb\xf2\xea\xd7\x53\xdd\x7d\x8c\x63\x87\x9e\xa6\x94\xcf\xd1\x71\
+\xeb\xb5\xc7\x5d\x81\xf0\xff\xac\xe4\x32\xff\xb6\xfd\x83\x1f\x3d\
+\x23\x31\x5f\xb5\x04\xf8\xe9\xdf\x7c\x64\xd5\x2d\x7f\xfe\x8f\x87\
+\x5f\xa9\xfa\x9f\xfa\x9b\x8f\x38\x4b\x58\x3f\xf1\xd4\xf5\xeb\x06\
+\xdc\x5e\xbc\xad\xed\xe8\xb9\x2c\x7a\x36\x83\xb3\xb5\x1d\x41\x51\
+\xa8\x4c\x8c\x81\x6d\x03\x30\x31\x39\xc1\xb4\x5b\x4b\x84\xda\x3a\
+\xdf\x6f\x55\xab\xf7\x5f\xfe\xd1\xbf\xab\x5c\xea\x36\x3e\xf1\xb9\
+\xbf\x1d\x2c\x67\x92\x3f\x77\xaa\xbe\xf6\xd5\xad\xdb\x50\x7c\x1e\
+\x6c\xd3\x62\x74\xd7\x13\x1c\x1c\x7a\x8c\xd8\xc6\x55\x34\xad\xdd\
+\xbc\xa3\x38\x3f\xf7\xab\x97\xbf\xf7\xc3\x33\x2f\x54\xc6\xab\x96\
+\x00\xaf\x34\x7e\xf9\x97\xbf\xff\x09\x79\x61\xf1\x2f\xb7\x6c\xdc\
+\x8c\x1a\x08\x21\x00\xf5\x6c\x86\xda\xc2\x3c\x4a\x28\x82\xe4\x72\
+\x51\x9d\x99\x3a\xe5\x9d\x72\xad\xca\xa3\xe3\x23\x34\xad\xd9\x78\
+\xaf\x55\xad\xbc\xe9\xda\x8f\xff\x53\xfd\x52\xb5\xef\xe7\x7f\xf9\
+\x07\xb2\x28\xcb\xf7\x56\xb2\x99\xd7\x6e\x5b\x79\x2b\x9e\x68\x0c\
+\x00\xcb\x30\xa9\xa6\x32\x88\x0e\x99\xf1\xe4\x10\xfb\xf6\x3e\x4c\
+\xef\xe6\xad\x15\x57\xb8\xe9\x23\xd9\xd9\xa9\x7f\xbb\xf1\xa3\x9f\
+\x3e\x65\x5b\x10\x5f\xe9\x8e\x7e\x35\xe2\xc1\x3f\xfa\x8d\x9e\xcc\
+\xd1\x23\x7f\xdc\xd3\xd6\x89\x16\x08\x81\x6d\x53\x4d\xcc\x53\x5f\
+\x98\x47\x14\x04\xf4\x4c\x8a\xca\xf4\x24\x08\x02\xa2\xa6\x2d\xaf\
+\x02\x2e\x55\x63\x53\xbc\x8d\xc4\xf8\xb1\xd7\x3b\xdc\x9e\x37\x5e\
+\xca\x36\xca\x9a\xf3\xb6\xb9\xe1\x83\xaf\xed\x6e\x5a\x8b\x64\x49\
+\x98\x75\x1d\xdb\xb6\x31\x4a\x65\x04\x40\x76\x6a\xac\x58\xb1\x9d\
+\x0d\x3d\xd7\x71\xe8\xe7\xbf\x74\x66\x67\xc7\x3f\xaf\xba\x3d\x1f\
+\x78\x7e\x39\xff\xc7\x11\xe0\xeb\xbf\xfd\xc6\xcf\xfc\xdb\x3b\x5e\
+\x37\xf4\x83\x8f\xbc\xe7\x73\xf7\xfc\xf9\xfb\x36\x5d\x8a\x3a\xca\
+\x86\xfe\x01\x29\x95\x75\xc5\x7b\x7a\xb1\x81\xca\xe4\x38\x46\x3e\
+\xcb\xcc\xec\x0c\x4f\x4e\x8f\x33\x92\xcb\x60\x99\x26\x92\xcb\x8d\
+\xab\xa3\x1b\xc9\xeb\x5b\x7e\x57\x71\x28\xf8\x4d\x9b\xba\x69\x7c\
+\xf6\xa1\xbf\xf9\xb0\x7c\x29\xda\xf7\xf3\x4f\x7e\x58\x2b\xe7\x32\
+\x1f\x0f\x45\xdb\xf0\xcb\x01\x10\xa0\x96\xc9\x51\x59\x48\x61\x54\
+\x6b\x20\x08\x18\xd5\x1a\x46\xa5\x4a\x47\xe7\x00\xdb\x37\xbf\x8e\
+\x91\xa7\x76\x52\x2f\x66\x3f\xfd\xc0\x5f\x7f\xe4\x96\x93\xcb\x7a\
+\x55\x13\xe0\x5b\xbf\xf7\x7a\xf7\x8f\x3e\xfa\x0e\xdf\x7d\x7f\xfe\
+\xeb\x81\x07\x3e\xf5\x3b\x32\x40\xa4\x2d\x3e\xdd\xda\xde\xbe\xc2\
+\xdb\xdf\xff\xc1\x5d\x8f\x3f\xfa\xc4\x3d\x1f\xfd\xdd\x7f\x79\xf0\
+\x7f\x7d\xbc\xf5\x62\xd6\xeb\x74\x79\x6e\x69\x6d\x6a\x42\x94\x24\
+\xf4\x6c\x06\xb3\x56\xa5\x5a\xa9\x30\x6c\xd6\xd9\xfa\xb1\xbf\xc7\
+\x75\xc3\xad\xec\x99\x9b\x41\x2f\xe4\xb1\x4d\x13\x35\x16\x5f\x5e\
+\x05\x9c\x8a\x42\x5b\xb4\x89\xe3\xbb\x77\x36\x89\x0e\xe5\xf6\x4b\
+\xd1\x2f\xf5\x7a\xed\xae\x62\x36\xbd\xb9\x3d\x3c\x80\xcb\xe3\x07\
+\x40\x10\x84\xe5\x7f\x00\xb6\x6e\xa0\xe7\x0a\xe8\xba\x8e\x2f\xd4\
+\x82\xd3\x0e\xf2\xec\xfd\xbf\xd0\xdc\x7e\xff\x5f\x3e\xf0\x97\x7f\
+\xbc\xbc\xf5\x5f\x12\x86\xbe\x54\x7c\xeb\x43\x6f\xda\x34\x3d\x39\
+\xf7\xc5\xd1\xc3\x87\x57\xc7\x9a\x82\x62\x45\x8c\x8b\x56\x76\xb2\
+\xf4\x4f\x37\xf7\xd7\x0f\xee\xf8\xb9\xd3\xe5\x6d\xe2\xaa\x9b\xae\
+\xe2\x6d\x7f\xfb\x17\xea\x91\xc7\x9f\x7c\xef\xcc\xbe\xbd\xef\xf9\
+\xe1\x47\x7e\xe3\x7e\x67\x24\xfa\xd9\x9b\xff\xe4\x1f\x7e\xf9\x52\
+\xea\xfe\xd1\xfb\x7f\xcd\x33\x75\xf8\x40\x6f\x47\x7b\x37\x7a\x26\
+\x8d\x9e\x4d\x23\x08\x02\xd3\xb3\xb3\x04\xa3\x31\xbc\xb1\x16\x7c\
+\x37\xb5\x93\x3a\x7e\x84\xca\xdc\x3c\x6e\x43\x47\x52\x35\x04\x87\
+\x03\xdb\x30\x30\x4c\x13\x19\x91\x52\xa5\x4c\xad\x54\x88\x5f\xec\
+\xbe\xf9\xc6\x07\xde\x2e\xd4\x8b\xf9\x5f\x6b\xe9\x5a\x41\x50\x8d\
+\x53\x2e\x97\x31\x4d\x73\x79\xe0\x05\x41\x40\x55\x55\x64\x59\xa6\
+\x56\xaf\x53\x2c\x16\xb1\x6d\x8b\xa1\x63\x07\x90\x2d\x8b\xf9\x43\
+\x47\x1e\x7e\xf3\x17\xbf\x66\x03\xbc\xf6\xba\xab\x85\x57\x1d\x01\
+\xbe\xfd\xa1\xb7\xdc\x30\x3c\x74\xfc\xee\xcd\xeb\xfc\x81\x81\x2b\
+\x6f\xe1\xe9\x1f\x3f\xc3\xea\xcd\x57\xd2\xda\xb5\xda\x1f\xef\x0b\
+\x71\xf0\xb1\x43\xfc\xf2\x1b\x4f\xa3\x78\x3d\x28\x6e\x27\x5b\xee\
+\xbc\x1d\x41\x10\xe5\x9d\x77\xdf\x73\xfb\xa1\xc7\x1f\xbd\xfd\x7b\
+\x1f\xfe\x8d\xaf\x05\x3b\xda\x3f\x7e\xe3\x87\xfe\x7a\xfc\x42\xea\
+\xaf\x57\xab\xb2\x20\x3b\x44\x45\x51\xa9\x25\x13\xcb\x1d\x1b\x0a\
+\x04\x98\x1b\x3a\x84\x69\x1a\x08\xa6\x01\x23\x23\xc8\xfe\x20\xa2\
+\xa2\x36\x5e\x6c\x2c\x00\x18\xa6\x49\xbe\x5c\xc6\xb2\x6c\x0c\xbd\
+\x5e\xbe\xd8\xfd\xa3\x3a\x5d\xd7\x4d\x1e\x3d\xf8\xba\xdc\xd8\x22\
+\xed\xd7\xf4\xa1\xd7\x2a\xcb\x6d\x3c\x81\x6a\xb5\x8a\xa2\x28\xe8\
+\xba\x8e\x20\x08\xec\xdf\xff\x24\xa6\x5e\xa3\xa7\xa3\x2b\x6d\xc9\
+\x8e\xcf\x9c\x78\xee\x81\x87\x1f\xb3\x5f\x55\x04\xf8\xca\x7b\x6e\
+\xff\xd5\x83\x7b\x0f\x7e\xf5\xba\x6b\x7a\x1d\x57\xbf\xe3\x4a\x4a\
+\x99\x02\x87\x0e\x4c\x91\x58\xf8\x11\x91\xa0\x1f\x45\xc8\x51\xae\
+\xeb\xe8\xb2\x87\x52\xba\x4c\x22\x9d\x40\x12\x25\x9c\x4e\x17\xab\
+\x5e\x7b\x03\x6b\x5e\x73\x3d\x23\x8f\x3f\xf9\x8e\xd1\x7d\x7b\xde\
+\xfa\xa5\x77\xde\x76\x24\xde\xd5\xf9\x03\x41\x53\xbf\xf4\xfa\x3f\
+\xfb\xec\xc4\xb9\xb6\xe1\xcd\xff\x79\x4f\xf6\x3f\x7f\xed\xa6\x54\
+\x3e\x9f\x8b\x47\xa2\xd1\xe5\xdf\x7d\x7e\x3f\x4e\xe0\xf8\x97\xbf\
+\x00\xb5\x2a\x24\x12\x78\x07\x57\x82\x6d\x61\x99\x36\x96\xd1\xe8\
+\xec\x52\xb5\xc6\xd0\xe8\x08\x5e\x9f\x2f\x23\xca\xca\x23\x17\xb3\
+\x7f\xfe\xe5\x9d\xaf\x97\x12\xd3\x53\x7f\x91\xc8\xe4\x59\xb3\xfa\
+\x72\x8c\xa5\x3a\x9f\x0f\x41\x10\xd0\x75\x1d\x00\xdb\xb2\x38\x70\
+\xf0\x69\xba\x07\xba\x6b\xdd\xdb\xaf\x7a\xef\x4d\x1f\xfb\xd4\xc2\
+\xc9\xcf\xbe\x6a\x08\xf0\x8d\xf7\xde\xe9\x3d\x7e\x7c\xf2\xdf\xbb\
+\xfd\x96\xe3\x9a\x77\x5d\x8d\x2c\x0a\x38\xfd\x6e\x34\x59\x62\xf5\
+\xb6\xed\x5c\xf5\x81\x8f\x91\x1a\x39\xcc\xbe\x07\xef\xa3\xbc\xef\
+\x59\x76\xfc\xdb\x17\x71\x04\x9c\x34\x6d\xde\x80\xbf\xb3\x8d\x42\
+\xb1\x00\xb6\x4d\x6c\xe3\x2a\x06\x6e\xbc\x56\xb2\x2a\xd5\xd5\xbb\
+\x7e\x78\xdf\xea\xe4\x9e\xa1\x0f\xfc\xe4\x6f\xff\xe0\xdf\x05\x55\
+\xfd\xf6\xad\x1f\xfe\xfb\x5d\xe7\xd2\x16\x53\x96\x12\x86\xc0\x29\
+\xcb\xb7\x2c\xcb\x6c\xda\x7a\x19\xe3\xcf\x3e\x89\x69\x9a\xac\x59\
+\xbd\x06\xc9\xed\x41\x10\x44\xea\xd9\x24\x82\x20\x50\xac\x54\x18\
+\x19\x9f\x60\x2a\x93\x65\xdd\xea\x55\x9f\x7e\xdd\x27\xff\x9f\x73\
+\x26\xde\xb9\x40\xd3\x9c\x97\x1f\x1e\xd9\x77\x5d\xd0\xe7\x23\xd2\
+\xdc\x46\xbd\x5e\xc5\x21\x2b\x08\xa2\xc4\xf2\x12\xf4\x3c\x0c\x0f\
+\xef\x41\x09\xa8\xb4\xaf\x1e\xd8\x7b\xd3\xc7\x3e\xf5\xdd\xe7\xff\
+\xfd\x55\x43\x00\xcb\x34\x6e\x08\x0a\x25\xef\xca\xcb\xfb\x90\x25\
+\x11\x6c\x1b\xd1\xe1\x21\xd2\xd4\x46\xb5\x5a\xc3\x15\x0c\xe3\xba\
+\xec\x6a\xda\x2f\xbb\x1a\xa3\x5a\xe6\xd0\x83\xf7\xb1\xef\xbe\xef\
+\x71\xf8\x27\x3f\x47\xd7\x0d\xfa\xb6\x6c\x22\xd0\xdb\x81\x1d\x8f\
+\x52\xa9\x54\xb0\x6d\x9b\xee\x1b\xaf\xa2\xef\xda\x2b\x02\xc9\xa1\
+\x23\x1f\x19\xdf\xb3\xf7\xc3\xff\x74\xe7\xd5\x47\x5a\xfb\xfb\xfe\
+\x5d\x97\xa4\xaf\xfc\xfa\xa7\xbf\x94\x39\xb9\xfe\x7b\xde\xff\x76\
+\xe9\x57\xbe\xf0\x75\x13\xc0\x2d\x4a\x4f\x4c\xe7\xb3\xeb\x3a\x2a\
+\x15\x34\xa7\xb3\xf1\x80\x28\xa2\x45\x62\x0c\x86\xa3\x88\x0e\x07\
+\xb2\xcf\x8f\x20\x08\x18\xc5\x02\x7a\x6a\x91\x4c\xa9\x44\x22\x9d\
+\xe1\xc1\x67\x76\xb1\xed\xe6\xeb\xee\xc9\x26\x92\xff\xf3\x62\xf7\
+\x91\x5e\xaf\xbf\xd7\xa9\x6a\xc4\x83\x0e\x66\x53\x3f\x66\xf6\x48\
+\x99\x90\xb7\x8d\xe6\xf6\x15\x04\x23\x2d\x38\x3d\x7e\x74\x5d\xc7\
+\xb2\x2c\x04\x41\xc0\x34\x0c\x0e\x8e\xec\x24\xd6\x16\x36\x05\x45\
+\xfb\xa7\x17\x2a\xf3\x55\x43\x00\x53\x37\xee\xaa\xeb\x65\xd6\xde\
+\xb2\x19\x1c\x31\x30\x72\x08\x8e\x10\xa9\x42\x9d\x76\x87\xe3\xd4\
+\x46\x6b\x2e\xd6\xbf\xfe\x2e\xd6\xdd\xf6\x66\xe6\x0e\xed\x65\xe7\
+\x8f\xbf\xcb\xd0\x63\xbf\x20\xb1\xff\x30\x9e\xd6\x66\xdc\xcd\x11\
+\x02\x5d\x1d\xc8\x9a\x8a\x33\xe0\xc7\x33\xd0\xcb\xc6\xb5\xab\x85\
+\xec\xcc\xec\xca\xa7\xbf\x7f\xef\x67\x34\x5b\xfa\xf0\x57\xfe\xe8\
+\x1d\x9f\x12\x65\xf9\x5f\xad\x42\xd1\x96\x4c\xe1\xe3\xe9\x74\xf2\
+\x83\x3f\x79\xff\xdb\xef\xd3\x82\x81\x6c\x72\x71\xa1\x65\xbe\x58\
+\x64\x3e\xb5\x48\x57\x5b\xfb\x52\x03\x4d\xac\x7a\x0d\x49\x73\x62\
+\x03\x7a\x36\x8d\x59\xa9\x50\xcb\xe7\x98\x4d\xa7\xd1\x0d\x93\x9f\
+\x3d\xb5\x93\xf6\x95\xfd\xf3\x0e\x45\xfb\xd0\x9b\xbf\xf0\x35\xfb\
+\xfc\x7b\xe1\xcc\xf8\x8f\xdf\xbc\x3d\x30\x3d\x39\xf5\x46\x87\x68\
+\xd0\xde\x24\x72\xd3\x87\x6f\xa7\x5e\xaa\x30\xbd\x6f\x92\xd9\x7d\
+\x87\x79\xe6\xe9\x1d\x0c\xf4\x6e\xa3\xbd\x6f\x1d\x92\xac\xa2\xeb\
+\x3a\xfb\xf6\x3c\x4a\x30\xe6\xa1\xb5\x6f\xc5\xf7\x6f\xfd\xe4\xe7\
+\xbf\xfb\x42\xe5\xbe\x2a\x08\xf0\xcd\xf7\xdf\xe1\x9d\x3a\x3e\xf6\
+\xda\x95\x1b\x7b\x70\x47\xa2\xe0\x59\x09\x85\x7d\xe8\xd5\x0a\x6e\
+\xa7\x86\x3f\x18\x7a\xc1\xf7\x04\x41\xa0\x65\xcd\x46\x7e\x65\xcd\
+\x46\x5e\xff\x47\x15\x66\xf6\xef\xe2\x89\xef\x7d\x8d\xc9\x67\xf6\
+\xa3\x1f\x9b\x26\x53\xc8\xd1\xba\x69\x1d\x86\x5b\x23\xd8\x1c\x47\
+\x0b\xf8\xb9\xf1\xbd\xef\xe6\xc8\x8e\x9d\x2d\x13\x07\x0e\x7f\xde\
+\xa9\x68\x7f\x35\xd8\xdd\xbf\x63\xe6\xc8\xe1\x37\xac\x52\x3c\x04\
+\x74\xe3\x9d\x72\x72\x91\xa0\x05\x5a\x53\x1b\xb1\xe6\x96\xc6\x4c\
+\x97\x65\xea\xa9\x45\x8e\x1f\x3b\x86\xc7\xe9\xc4\xeb\xd4\x28\xd7\
+\x6a\xd4\x74\x83\x42\xa5\x42\xa5\x52\xe5\xb1\xbd\xfb\xb0\x02\xde\
+\xf2\x8a\xc1\x81\xb7\xdf\xf6\xb9\xff\x9a\x3a\xcf\x2e\x38\x2b\x24\
+\x51\xba\x5e\x30\x6a\xae\x95\x5d\x1a\x6d\x1b\x7a\xc0\x30\x51\x54\
+\x85\x9e\xad\x7d\x74\x5e\xd6\x87\xfb\xc9\xc3\x1c\xfb\xe6\x01\x26\
+\x8e\x1d\x60\xc3\xe5\xb7\xe0\x8b\x34\x71\x6c\x76\x1f\x3d\x6b\x57\
+\x14\x2d\xd3\xfe\xb3\x33\x95\xfb\xaa\x20\x40\xa9\x6a\x7e\xc4\x51\
+\xcf\x47\xae\x7a\xd3\xed\x8d\xd9\x6f\xeb\xa0\x67\xb0\x75\x0f\xf5\
+\x6a\x95\xaa\x61\x9e\xb5\x0c\x59\x75\xd2\xb9\xf5\x2a\x3a\xb7\x5e\
+\x85\xa5\xd7\xa9\xe4\x32\x1c\x7d\xe4\x67\x8c\x3d\xf3\x04\xc3\xbf\
+\xfc\x05\x65\xbd\x4e\x53\x5b\x33\xad\xdd\x1d\xc8\xb6\xc9\xc6\x5b\
+\x6f\x44\xf5\x7a\xc2\xfb\xbf\xfb\x93\x37\x2c\x1c\x39\x4e\x7b\x67\
+\x07\x6b\x56\xae\xa4\x58\x28\x60\x9a\x06\xe1\xa6\x66\xbc\xbd\x03\
+\x8d\xa5\xb4\x52\x41\xc8\xa4\xf1\xb9\x5c\xc8\xb2\xc4\xcc\x62\x1a\
+\xd3\x32\x61\xe9\x00\x26\x8a\x02\x41\x45\x26\x16\xf0\x1b\x6a\x36\
+\x77\xcd\xc3\xef\xff\xf5\xd1\xeb\xbe\xf0\xd5\x8b\xb6\xff\xff\xeb\
+\xdb\xaf\x57\x16\x93\x8b\x9f\x6c\x89\x08\x0c\x6e\xeb\xa7\x79\x45\
+\x1b\x36\x4b\x72\x7c\x01\x0a\xb9\x22\xde\xb8\x8f\xed\x6f\x5f\xcf\
+\xd1\x9f\x1e\x64\xcf\xee\x1f\xa1\xac\xe8\xa4\x6a\xd7\x71\x47\x5b\
+\x3e\x76\xfd\x1f\xff\xed\xb1\x33\x95\xfd\x8a\xeb\x02\xbe\xfa\x9e\
+\x5b\xfd\x85\x4c\xee\x58\xbc\x45\x8c\xdc\xf9\x87\x77\x20\xd8\x02\
+\x08\x32\xd8\x3a\x33\xa3\x69\xbe\xf5\x99\x07\xb9\xea\xad\xef\x66\
+\xdb\x3b\xdf\x7f\xc1\x75\x18\x95\x32\xc3\x3b\x7e\x49\x62\xe4\x30\
+\x93\x47\x0f\x23\xe9\x45\x46\x87\x8f\x82\x69\xe1\xd1\x3c\xdc\xda\
+\xde\x45\x73\x6b\x1b\x5a\x20\x80\x51\x2c\x52\x2a\x15\xa9\x55\x6b\
+\x98\x80\xdb\xe5\x42\x91\x65\x1c\x8a\x02\x34\x8e\x5a\x89\x4c\x96\
+\x62\xa5\xa1\xeb\x39\xf9\x14\x5e\x2e\x97\x59\x58\x48\xa0\x62\xd7\
+\x3c\xcd\x2d\x3f\x52\x83\xa1\x7f\xbd\xec\xef\xbf\xf0\x8b\x97\xda\
+\x47\xff\xfe\xee\x5b\xde\x76\xfc\xc8\xd0\xd7\xaf\xbf\xae\x07\xcb\
+\x30\xf1\x7a\x9c\x44\xba\xe3\x34\xad\x68\xc3\x19\x70\x33\x9f\xcc\
+\x50\xaf\xeb\xd8\xd8\xa4\x26\x16\x99\xd9\x31\xc2\xf8\x9c\x40\x57\
+\x77\xef\xac\xc3\x1b\x58\xf7\x86\x4f\xff\x4b\xea\x4c\x65\xbf\xe2\
+\x2b\x80\xe4\x70\x7d\x30\x97\x3c\x1a\x79\xc3\x6f\xdd\x8e\x20\x7a\
+\xc0\xb7\x11\xf2\x7b\xc0\xd4\x29\x66\x6b\xb8\x5d\x1a\xa1\xce\xde\
+\x97\x54\x87\xec\x74\xb1\xea\x35\xb7\xb1\xea\x35\xb7\x01\x8d\xab\
+\x51\x72\x6a\x1f\x8f\x7d\xe9\x0b\x54\xf6\x1f\xa1\xa5\xad\x0d\x4f\
+\x57\x2f\xb2\xd3\x45\x6d\x71\x01\x41\x10\xf0\x78\xbc\x00\x54\x2a\
+\x15\x2a\xd5\x0a\x95\x6a\x15\x49\x14\x51\x54\x95\x78\xc0\x4f\xd8\
+\xeb\xa1\x58\xa9\x92\x2b\x97\x31\x96\x04\x31\x2e\x97\x8b\xae\xae\
+\x6e\x4c\xcb\x52\x0b\xb9\xec\x5d\x89\xc9\xc9\xbb\x9e\xf8\xd0\xbb\
+\x9f\xb4\xfc\x81\x3f\xbc\xea\x93\xff\xeb\xe9\x0b\x69\xfb\x97\xde\
+\x79\xb3\xbb\x90\x2d\xfc\xcd\xda\xc1\x30\x37\xbe\xef\x56\x44\x41\
+\xa0\x56\xac\x72\x6c\xc7\x10\x07\x7f\xba\x0b\x4f\x53\x10\xc3\xa7\
+\xe2\x0e\x79\x90\x1d\x32\x82\x28\x92\x5c\x34\x89\x06\xc2\x7a\x6c\
+\x60\xd5\xe7\xae\xfe\xd0\xc7\x53\x2f\x56\xfe\x2b\x2a\x0a\xfe\xce\
+\xef\xbf\x2d\x98\x4e\xa6\xff\x78\xeb\xe5\xbd\xb4\x0c\xb6\x82\xb3\
+\x1b\x44\x05\x84\xc6\x2d\x40\xb7\x02\x64\xf3\x05\x5a\x57\x6f\xbc\
+\xa8\xf5\xda\xb6\x85\x61\x15\x98\x18\x3a\xc2\x86\xee\x5e\x14\xb7\
+\x17\xd9\xe5\x6e\xfc\xcd\x3a\x55\x75\xee\x74\x3a\xf1\xf9\xfc\xf8\
+\x7c\x3e\x14\x45\xa1\x56\xad\xb2\x90\x48\x50\x2a\x14\x70\x29\x0e\
+\x3a\x63\x51\x9a\x43\x41\xbc\x4e\x27\x0b\xa9\x14\x07\x8e\x1c\x01\
+\xdb\x26\x10\x0c\xd1\xdc\xd3\x4b\xe6\xf8\xf1\x2b\x8a\xa9\x85\x27\
+\x7f\xfe\x89\x3f\xdc\x70\x21\x6d\x15\x1c\xce\x3f\x44\xcf\x74\x6f\
+\xbd\x65\x03\x82\x0d\x58\x36\xaa\x4b\x65\xf5\xcd\x1b\x58\x7f\xe7\
+\x15\x8c\xec\x1f\x67\xe4\xf1\xa3\x4c\xee\x19\x27\x39\xb6\x40\x39\
+\x5d\xc2\x34\x21\xd4\xd9\xfb\xc0\xd5\x1f\xfa\xf8\xdf\x9f\xad\xfc\
+\x57\x74\x05\x30\xaa\xb5\xf7\xc9\x22\xde\xde\xad\x3d\x08\x82\x03\
+\x94\x08\xd8\x26\x18\x39\x6c\x41\x60\xf6\xf0\x2c\xe1\xa6\x66\x54\
+\x5f\xe0\xa2\xd6\x5b\xab\x66\x29\xa7\xd3\xd4\x53\x59\x7c\x5d\x0a\
+\xb2\xd7\x07\x96\x05\x82\x80\x59\x2c\x9e\xf1\x3d\x87\xa2\x20\x3b\
+\x1c\x78\xbc\x5e\x4c\xd3\x64\x31\xb9\x80\x69\x9a\x84\xc3\x11\xe2\
+\xc1\x00\x4f\xed\xde\x4d\x21\xfb\xdc\xed\x52\x96\x24\x54\x97\x8b\
+\xf4\xe2\xa2\x10\x1b\x5c\xd1\x05\xec\x3d\x9f\x76\x7e\xe5\x83\x6f\
+\x1e\x98\x38\x7c\xec\xcf\x34\x3d\xcf\x93\xf7\x3d\x8b\x59\x33\x68\
+\x59\xd3\x81\x37\xe2\x03\x1b\x9c\x5e\x27\xeb\xef\xdc\xca\xc4\x9e\
+\x71\x8e\x3c\x39\x82\xa6\x39\xd0\xcb\x75\x7c\xfe\x58\xde\xa1\xe9\
+\xef\x39\x97\x3a\x5e\x51\x02\x94\xaa\xb5\x37\xba\x54\x68\x5e\xdd\
+\x01\x6a\xbc\x71\xa8\xaa\x25\xc0\x86\xdc\x62\x91\xd9\xe3\x13\xb4\
+\xae\xdb\x82\xb4\xb4\xff\x5e\x2c\xd4\xab\x79\xc6\xf6\x1e\xa0\xbf\
+\xad\x03\x87\xc3\x81\xe4\x74\x2e\x1f\xe8\x24\x8f\x77\x59\xfe\xff\
+\x42\x38\xf1\xbb\x24\x49\xc4\x9b\x9a\x19\x9d\x99\x65\x7c\x7a\x8a\
+\xd6\xa6\x66\xc6\x53\x0b\x38\x6c\x91\x5c\x3e\x4f\x28\x18\x04\xe0\
+\xf0\xd8\x04\x79\x07\x94\x8f\xec\xff\xeb\xaf\x7c\xe0\x2d\x6f\x13\
+\x04\xa1\xe2\x75\x7b\x72\x0e\xd9\x51\x92\x35\xad\x68\xd8\x46\x5e\
+\x10\xa5\xba\x6d\x59\x96\x20\x8a\xba\x5e\xaf\x3b\x4c\xdd\x28\x8a\
+\x02\x99\xe1\xfd\x07\x3f\x1b\x5d\xd9\xe2\x8c\xbc\xe6\x4a\x46\x1e\
+\x1f\x62\xea\xe7\xfb\x59\xbd\x73\x98\xf5\x37\xae\xa3\x65\x4d\x27\
+\xb3\xa3\x73\x8c\x1c\x9a\xa4\x6b\x5d\x27\xbe\xb8\x9f\x1d\xff\xfd\
+\x28\x9d\x9d\x51\xd6\xdc\xb2\xfe\x0b\x03\x77\x7d\x3e\x71\x2e\x7d\
+\xf1\x8a\x11\xe0\xee\x0f\xff\xa6\x7b\x76\x78\x68\x7d\xdb\xca\x28\
+\xaa\x53\x01\xb5\xb9\xf1\x87\xda\x3c\x08\x02\x93\x47\x13\x2c\xa6\
+\xd3\xbc\xe6\xc6\xd7\x5d\xf4\xba\x6d\xcb\x24\x71\xec\x18\x5a\x2e\
+\x8f\x6b\xd0\xdd\x58\xf6\x6d\x1b\x1b\x50\x63\x71\x04\x49\xa4\x9e\
+\x5a\x3c\x23\x09\x4e\x46\xc0\xeb\xc5\xf6\x7a\x18\x9d\x98\xa0\x7d\
+\xd3\x7a\xe6\x46\x47\x18\x1a\x39\xca\xaa\xfe\x41\x02\x81\x00\x1e\
+\x45\xa2\xd4\x11\xa1\xef\xce\x9b\xd7\x7a\xbc\xbe\xb5\x9a\xa2\x22\
+\x8b\x12\x0e\x87\x82\x6d\x43\xb5\x90\xa7\x92\x2f\x20\x8a\x22\x0e\
+\x4d\x43\xaf\x55\xa9\xe4\x0b\x3c\xf5\xed\x1f\x50\x29\x17\x18\x7c\
+\xd3\xd5\xa8\x01\x37\x1b\xbb\xe2\x4c\x3f\x71\x98\x03\x87\x67\x28\
+\xde\xb7\x8b\xb6\xbd\xb3\x0c\x55\x4c\xca\xed\x71\x66\x0b\x1a\x2d\
+\x05\x9d\x5a\xdd\x24\x10\xf5\x9a\x95\x92\xfe\x5f\xe7\xda\x17\xaf\
+\x18\x01\x0c\xbd\x7e\xb3\x20\x2b\x72\xd7\xda\x56\x40\x03\xd9\x0f\
+\xb6\x01\x7a\x1a\x5b\x80\xc4\x70\x86\x58\x3c\x4e\xeb\x86\xcb\x2e\
+\x7a\xdd\xa2\x24\x51\x4f\xa7\xe8\xef\xef\x47\x96\x24\x6a\xc9\x04\
+\xa6\xc7\xd7\x50\xa7\xca\x32\x92\xd3\x85\x23\x10\xc4\xc8\x66\x1a\
+\xd7\xad\x33\x10\x41\x37\x4c\x72\xe5\x32\x61\xaf\x97\xe1\xb9\x39\
+\xc2\x57\x6e\x60\xdd\x5d\xaf\x67\x7e\xdf\x7e\x26\x1e\x78\x9c\xbd\
+\x07\x0f\x50\xf5\xa8\x6c\x5a\xbf\x85\x52\x62\x11\xbd\x5e\x47\x56\
+\x1c\x58\xa6\x85\x24\x49\xa8\xaa\x86\xaa\x39\x71\x35\x45\x51\x94\
+\x86\x06\x0f\x60\xe1\xd8\x18\xf9\xc5\x34\x2b\x7f\xf3\x4a\xd4\x40\
+\xe3\x6c\x52\x9c\x5e\xa4\xb2\x90\x63\xfd\xdb\xaf\x45\x94\x45\xee\
+\xfd\x87\x1f\x32\x37\x95\xa6\x75\x45\x8e\x5a\xb6\x48\x6a\x36\x41\
+\xb9\x66\x22\xbb\xc3\x0f\xaf\x7f\xf7\xbf\x1d\x39\xd7\xbe\x78\xc5\
+\x08\x50\x2b\x15\xdf\xa4\xaa\x12\xb1\xae\xc0\xd2\xec\xb7\x97\x96\
+\x7f\x9b\x62\xaa\x40\x66\x26\xcb\xd6\x37\xfd\x26\x82\x78\xf1\xcf\
+\xa9\xa2\xa4\x50\x37\x2c\xe6\x05\x1b\xd7\xf4\x14\x5e\x55\xc3\x1f\
+\x28\x21\x49\x12\xa2\xd8\x38\x80\xda\x82\x80\x20\x8a\xb8\x3a\xbb\
+\x4f\xb1\xfd\xab\xd6\x75\x1c\xb2\x84\x61\x9a\x2c\xe6\x0b\x58\x96\
+\x85\x22\x89\xe4\x8a\x39\x7a\x3a\xda\x08\xf7\xf6\x34\xfe\xad\x18\
+\x64\xe7\xd7\xbf\x45\xbc\xbd\x83\xf2\xc2\x22\xf6\xd4\x14\xb3\xa5\
+\x02\xce\xa6\x28\x78\xdd\xa8\x41\x1f\xaa\xcf\x8b\xea\x76\xe3\x70\
+\x6a\x8d\x76\x89\x22\x8a\xe8\x60\xc7\x57\xbe\xc1\xe0\x35\x9b\xf1\
+\xae\x69\x01\x1b\x2c\xdd\x60\xe6\xe9\x23\x38\xdc\x1a\x82\xd8\x68\
+\x57\x68\x65\x37\x9e\xce\x56\x92\x33\x8b\x4c\xdf\xff\x34\x2b\x3d\
+\x5e\x5a\xe2\xad\xd5\x74\x4e\x3a\xa7\xbd\xff\x15\x25\xc0\x7f\xff\
+\xce\x9b\x3c\xf3\x13\xe3\x6f\xdc\xb8\x75\x25\xbe\x88\x0f\xb4\x56\
+\x1a\x66\x2d\xb3\x20\x08\x1c\x7d\x7a\x18\x64\x8d\x8e\xcb\xaf\xbd\
+\x24\xf5\x0b\x88\xbc\xe6\xf7\xde\xcb\xd1\x5f\x3c\xcc\xd1\x99\x39\
+\x12\x07\x77\x11\x0a\x04\x50\x2d\x81\xee\x40\x04\x87\x28\x12\x0c\
+\x05\xf1\x78\xbc\xd4\x66\xa7\x97\x07\x1f\x60\x2e\x9d\xc6\x7c\xde\
+\x4d\xe1\xd8\xc4\x04\xcd\x7d\xdd\x38\x83\x81\xe5\x67\xa3\x7d\xbd\
+\xdc\xfa\xb1\x3f\xc1\x15\x88\x10\x0c\xaf\xa6\x92\x4b\x33\x7f\x60\
+\x17\xc5\xf9\x19\x4a\xe9\x14\xd9\xb1\x29\xca\x95\x71\x16\xaa\x65\
+\x70\x69\x54\x4c\x1d\x35\xe8\xc7\xce\x57\xa8\xe7\x72\xf8\xae\x69\
+\xc5\xb2\x01\xdb\x66\xf1\xf0\x14\xaa\xdf\x4d\xb0\xb7\x05\x49\x91\
+\x49\x4d\xe7\x51\xfc\x5e\xfc\x3d\x3e\x5a\x2f\x5f\xcd\xd3\x9f\xfd\
+\x3e\x2e\x87\x8b\x81\x2b\x6e\x78\xe2\x86\x8f\xfe\xc3\xf8\xf9\xf4\
+\xc5\x2b\x42\x00\x55\x51\x36\xeb\xa6\xe5\x8c\xb6\x39\x90\xdd\x31\
+\x10\x55\x30\x2b\xa0\xe7\xb0\x45\x91\x99\x03\xd3\xf8\x3a\x2e\xc7\
+\x1d\xb9\xe8\xf6\x14\x00\x88\xb2\x82\xea\x71\xb1\xfe\x8e\xd7\x23\
+\x48\x12\xb6\x61\x90\x9b\x9b\x27\x3d\x39\xc9\xd8\xf0\x31\xe6\x0f\
+\x1c\xc1\x71\xe4\x20\x3e\xb7\x87\xae\x8e\x4e\x82\xaa\x93\x70\x30\
+\x88\xe6\x74\xd2\x19\x8f\x91\xce\x17\xc8\x95\xcb\x60\xdb\x28\x0e\
+\x07\x23\x53\x53\x28\xab\x7b\x09\xf7\x74\x2f\xd7\x21\x39\x1c\x48\
+\x0e\x07\x82\x20\xa3\xb8\x3d\x28\x6e\x0f\xfe\x96\x0e\xa0\x71\xd5\
+\xac\x15\xf2\x94\x33\x49\xf2\xd3\x93\xd4\x8a\x79\xaa\xd9\x45\xc6\
+\x76\x3d\xc5\xee\xbd\x07\x69\xbd\xbe\x17\x3b\xe4\xc0\xe7\xf2\x91\
+\x9a\x99\x63\xf1\xf0\x24\x4d\x5b\xfa\xf1\xb4\x36\x44\xe2\xa9\xb1\
+\x45\x44\x87\x8c\xe2\x71\x91\x9b\x98\xe7\xda\x55\x6b\x88\xb6\xf7\
+\x1e\xaa\x1a\xe6\x79\xcd\xfe\x57\x8c\x00\xf9\x4c\xfa\x2e\xb7\xa6\
+\xe0\x0d\x2b\xa0\x9c\x58\xfe\x1b\xe6\xf4\xf3\x23\xb3\xcc\x27\x2a\
+\xdc\xf1\xc1\xb7\x5e\xb2\xfa\x9d\xee\x08\x2e\x6f\x13\xe5\x42\x02\
+\xcc\x86\x48\xd7\xdf\xd2\x8c\xbf\xa5\x99\xee\xcb\xb7\x21\x08\x02\
+\x95\x6c\x96\xb9\xc3\x47\x98\x3c\x74\x84\x5d\xa3\xa3\xf8\xa6\x2c\
+\xfa\xa2\x2d\x84\x54\x17\xf1\xd6\x56\x82\x5e\x0f\xd9\x62\x11\x97\
+\xa6\x51\x15\x6c\x7c\x41\x2f\xaa\xc7\xb3\x5c\x87\x6d\xdb\x88\x92\
+\x83\x40\x74\xe0\xb4\xfa\x05\x51\x44\xf3\x07\xd0\xfc\x01\x42\x5d\
+\xfd\x8d\xe7\x2d\x8b\x67\x1e\xf9\x05\x4e\x9f\x4a\xcb\x2d\x6b\xf1\
+\x6b\x7e\x82\xc1\x18\x73\xcf\x0c\xe3\xef\x8a\xe3\x6d\x0d\x21\x39\
+\x64\x66\x76\x8d\x61\x18\x16\xde\xd6\x30\x08\x02\xb9\x7d\xc7\x68\
+\x77\xb6\xe0\x0a\x85\xff\xe4\x9a\x0f\x7c\x6c\xec\x7c\xfb\xe2\x65\
+\x27\xc0\x7f\xbf\xe7\x57\xdc\x66\xbd\x7e\xa7\x26\x99\xb4\xaf\xef\
+\x03\x65\xc9\xe8\xa2\xda\x58\xfe\x8f\x3d\x3b\x82\x23\xd4\x4c\x6c\
+\xe5\x86\x4b\xda\x8e\x60\x7c\x05\x8a\xe6\xa3\x5a\x5a\xa4\x5a\xce\
+\x72\xf2\x39\xcf\xb6\x6d\x34\xbf\x9f\xee\x2b\xb6\xd1\xbd\xfd\x72\
+\x8c\x4a\x85\xc9\x3d\xfb\x18\x3b\x70\x80\x7d\x93\xc7\x69\xf2\xc9\
+\x0c\x18\x12\x4d\x4e\x2f\xa6\x20\xa2\xfb\xdc\x88\x4b\xfb\xf8\x09\
+\x38\x54\x0f\xb1\xb6\x4d\x88\x92\xe3\x9c\xda\x33\xfc\xe8\xcf\x49\
+\x1f\x1f\x21\x7c\x4b\x1f\xb2\xa6\x10\x08\x45\xb1\x0c\x93\xf1\x5d\
+\x87\xe9\xbe\x79\x23\x0e\x97\x46\xbd\x50\x26\x39\x99\xc5\xdf\xdb\
+\x86\x28\x49\xd4\xb2\x05\xa2\xa6\x82\x2f\x1a\xc7\xaa\xd7\xf3\x17\
+\xd2\x0f\x2f\xbb\x24\x30\x10\x0a\xbf\x6b\x62\x6a\xaa\x65\xcd\xf6\
+\x7e\x1c\xae\x96\x86\xd4\x4f\xcf\x80\x55\xc5\x16\x45\x8e\xef\x3d\
+\xce\xe0\xe6\xed\x88\x92\xf4\x82\xef\x17\xe6\x67\x4e\x93\xd6\x5d\
+\xd0\x87\x8b\x32\xde\x60\x07\xd1\xb6\x4d\x34\x75\x6e\x43\xd1\x7c\
+\xd8\xf6\x0b\x94\x6b\xdb\xc8\x9a\x46\xf7\xe5\x97\x71\xcd\xfb\x7e\
+\x97\x1b\xfe\xc7\x1f\x52\xa8\x94\xf9\xfe\xee\x27\x78\x20\x79\x9c\
+\x9f\x64\x66\x51\xa2\x41\xfc\xf1\xd8\xf2\xfe\x6f\xdb\x36\xa1\xf8\
+\xaa\x73\x1e\xfc\x6a\x21\xcf\x8e\xff\xf8\x5f\x84\x06\xe3\xb4\x5c\
+\x35\x88\x6d\xdb\x94\x2a\x05\x46\x9f\xdd\x4b\x68\xb0\x15\x57\xc4\
+\x87\x6d\xdb\x64\xa6\x73\xb8\x9a\x23\x28\x9e\x86\x8d\x42\xee\xc8\
+\x38\x1d\xb1\x76\xea\xb5\x1a\xde\x70\xf4\x1f\x1e\xfb\xdc\x5f\x9f\
+\xf7\x84\x7e\xd9\x57\x80\x6c\x3a\xfd\xab\x61\xa7\xc8\xc0\x96\x96\
+\xa5\xc3\x1f\x4b\xb3\x5f\xa4\x9c\x29\x50\xc9\x95\xe9\xdc\xf6\xc2\
+\x87\x3f\xdb\xb6\xd9\xff\xdd\x2f\x23\x48\x12\x4d\x6b\x36\xd1\xbc\
+\x76\x33\x9a\x3f\xf4\x92\x6f\x0a\x0e\xd5\x4d\xb4\x6d\x33\xb5\x4a\
+\x96\x72\x7e\x8e\x5a\x25\x83\xa1\x57\x01\x4e\x31\xb6\xb4\x4d\x13\
+\x67\x30\xc0\xf5\xef\xff\x1d\xca\xd9\x1c\x23\x4f\x3c\x85\x59\xc8\
+\x21\x4a\x21\x3a\xb6\x6e\x01\x41\xc0\xb6\x6d\x3c\x81\x76\x14\xcd\
+\x7b\xce\xf5\x1f\xfc\xc9\xdd\x64\x53\x8b\xb4\xdc\xb1\x15\xd1\x21\
+\x23\x00\xf3\x73\x53\x4c\x1f\x1e\x21\xbe\xb1\x17\x41\x12\xd1\x8b\
+\x55\x92\xe3\x29\xfc\xbd\x1d\x60\x83\xa9\xeb\x44\xca\x20\xa9\x16\
+\x6d\x9b\x37\x92\x39\x3e\x71\xb9\xb7\xa5\xe3\x23\xc0\xa7\xcf\xe7\
+\xdb\x5f\x56\x02\x7c\xfd\x7d\x6f\x09\x4c\x1f\x1f\xdd\xde\xd5\x24\
+\x13\xe9\xef\x05\xd9\xd7\x10\xfd\xd6\x1b\x42\xab\xf9\xe1\x19\x42\
+\xf1\x66\x42\xdd\x03\x2f\xf8\xbe\x20\x08\x6c\xff\xc0\x9f\x91\x9f\
+\x9d\xa2\x38\x3f\xc3\xc1\xef\x7f\x15\xd3\x30\x08\x76\xf4\xd0\xb6\
+\xf5\x2a\x5c\xe1\x28\x82\x70\x61\x64\x10\x04\x01\xcd\x15\x44\x73\
+\x05\xb1\x6d\x1b\xcb\xac\x53\xab\xe4\xa8\x96\x53\xd4\x2a\x59\x8c\
+\x25\xfb\x4e\x61\x69\x90\x9d\x7e\x1f\xeb\x6e\xbd\x79\x59\x82\x78\
+\x62\xf6\x8b\xa2\x84\x2f\xd4\x75\x4e\x75\xda\xb6\x4d\x25\x9b\xe6\
+\xe7\x5f\xf9\x57\xa2\x1b\x5b\xf1\xf5\x35\xa1\xc8\x0a\x86\xa9\x93\
+\x1a\x9a\xc2\xe1\x76\xe2\x0c\x35\x88\x94\x5f\x28\x20\xb9\x5c\x88\
+\x52\xe3\xfb\xf2\x07\xc7\xe8\x34\x9c\x6c\xfc\x95\x0d\xf8\x5b\x34\
+\xbe\x7d\xef\x21\x7a\x25\xe9\x35\xbc\x9a\x09\x60\x1b\xf5\x6d\x96\
+\x55\x97\xe3\x3d\x6d\x08\x8e\x26\x1a\x87\xbf\xf9\x46\xe7\x49\x22\
+\x47\x9e\x18\xc2\xdf\xda\xdb\xf0\xc6\x39\xe3\x40\x89\xf8\x5b\x3b\
+\xf1\xb7\x76\xd2\xb4\x6e\x0b\xe9\xb1\x61\x72\x93\x63\xec\xfb\xd6\
+\x97\xa8\x55\xca\x74\x6c\xbd\x8a\xf8\xca\xf5\x38\x9c\xae\x0b\xd6\
+\x21\x08\x82\x80\x24\xab\xb8\xbc\x31\x5c\xde\x18\xb6\x6d\x63\x1a\
+\x35\x2a\xa5\x24\xd5\xe2\x22\xf5\x6a\x0e\xcb\x32\x00\xe1\x14\x7d\
+\xba\x6d\xdb\x04\xe3\x2b\x90\xe4\x73\x11\x5d\xdb\xd4\x4b\x45\x1e\
+\xfe\xe7\xbf\x43\x91\x20\xf2\x9a\x01\xfc\x9e\x20\xa1\x40\x94\xa1\
+\xdd\xcf\x52\x5e\xc8\x11\xdf\xd0\x8d\x20\x0a\x58\xba\xc1\xfc\xd1\
+\x04\xbe\x9e\x36\x00\x2c\xd3\x44\x1e\x4e\xd1\x71\xdd\xeb\x88\x77\
+\x3a\x10\x55\x1b\x97\xc7\x8b\xa1\xeb\x57\x3f\xf4\xf7\x1f\x8d\xde\
+\xf8\x27\x9f\x4e\x9e\xeb\xb7\xbe\xac\x04\xd0\x0d\xfb\xbd\x92\x51\
+\xa1\x73\x4d\xe7\x73\xa2\xdf\xea\x34\x08\x02\x7a\x55\xa7\x5e\xa8\
+\xd0\xba\xfd\xda\x33\xee\xff\xcf\x87\xe4\x50\x88\x0e\xac\x21\x3a\
+\xb0\x86\xde\x1b\x6f\xa3\x92\x5e\x64\x76\xef\xd3\x0c\xdd\xf7\x1d\
+\xd2\xe3\xc7\x68\x5e\xb3\x99\xc8\xc0\x2a\xe2\xab\x36\x22\x48\xd2\
+\x39\x97\xfb\x7c\x08\x82\x80\xec\xd0\xf0\x06\xda\xf1\x06\xda\xb1\
+\x6d\x1b\xbd\x5e\xa2\x5e\xc9\x52\xaf\x15\xd0\xab\x79\x2c\xcb\x40\
+\x73\x85\x71\x79\xcf\xed\xea\x6a\x5b\x36\x13\xfb\x9e\xe1\xd8\xce\
+\x1d\xc4\x6f\xe8\x27\xde\xd5\x49\xc0\x17\xa6\x5a\xab\x30\xb7\x7b\
+\x18\x5f\x47\x0c\x57\x2c\x00\x40\x72\x74\x01\x41\x73\x22\x2e\x49\
+\x0a\xb3\x47\x26\x68\x76\x68\xf8\x23\x32\x92\xa8\x83\xec\xa4\x56\
+\x29\x33\xb9\x67\xa7\xdc\xbe\xe9\xf2\x0d\xc0\xcf\xcf\xf5\xdb\x5e\
+\x36\x02\xfc\xe7\xdb\x6f\x94\x2b\xb9\xf4\x0d\x51\x9f\x44\xdb\xe6\
+\x2d\x8d\xbb\xbf\x91\x05\xa3\x00\x08\x64\xe7\x33\x54\x0a\x06\x6d\
+\x9b\xaf\x7c\xf1\x8e\xb3\x6d\x6c\xcb\x3a\x6d\x30\x05\x41\xc4\x15\
+\x8e\xd1\x77\x63\xc3\x19\xa7\x92\x49\x51\x4e\x27\x59\x18\xda\x4f\
+\x7e\x76\x8a\x6a\x2e\x83\x33\x18\x46\x71\x7b\x71\x45\x62\x44\x7a\
+\x57\x5e\xb0\x92\x49\x10\x04\x14\xd5\x83\xa2\x7a\x2e\xe8\x7d\x00\
+\xa3\x5a\xe1\xe7\xff\xfc\x8f\xe0\x75\x10\xb9\x61\x10\xbf\xb7\xb1\
+\xea\xcd\xed\x1f\xa1\x9c\xcc\xd3\x79\xc3\x86\xc6\x73\x35\x9d\x42\
+\xce\xc4\xd3\x14\x06\xa0\x5e\xac\x50\xdd\x33\x4a\x7c\xc3\xd5\x0c\
+\x5c\xb9\x02\xa1\x76\x84\x5a\x7e\x9e\xa9\xa9\x29\xbc\x1e\x37\x92\
+\xa2\x9c\x97\x57\xf2\xcb\x46\x00\x55\x51\xae\x5a\x9c\x9f\xf5\xf5\
+\xad\x8f\x23\x7b\x3a\x00\x1b\x2a\x0d\x07\x4b\x6c\x9b\xc2\x42\x16\
+\x77\x53\x27\xc1\x8e\xee\x17\x2d\xa7\x30\x37\x4d\x31\x39\x47\x25\
+\x93\xc2\xe1\x74\xe1\xf4\x87\x10\x24\x89\x50\xf7\xc0\xf2\x0c\x01\
+\x70\x06\xc3\x38\x83\x61\xc2\xbd\x2b\x1a\x33\xb6\x5c\xa4\xb8\x30\
+\x47\x69\x31\x41\xe2\xc0\x2e\x8e\xfe\xe4\x7b\x38\xdc\x1e\xa2\x7d\
+\xab\x88\xae\x58\x8b\x16\x08\xa1\xb8\xbd\xe7\xa4\x00\xba\x18\x78\
+\xe4\x3f\x3e\x87\x59\xc8\xd2\xf2\xb6\x8d\x84\x82\xb1\x46\xbd\x82\
+\xc0\xc2\xd4\x34\xd1\x35\x9d\x48\xaa\x03\xdb\x34\x99\xd9\x33\x81\
+\xa1\xcb\x38\x15\x19\x04\x98\x7b\x72\x3f\xab\x9a\x7b\x59\xf5\x9a\
+\xab\x91\x64\x11\x6a\x02\x46\xad\x4c\x93\x4f\xa6\x26\xca\xe8\xb5\
+\xea\xf4\xf9\xb4\xe3\x65\x23\x80\xe5\xd0\xd6\xbb\x55\x81\xe6\x35\
+\x3d\x20\x85\x1a\x92\xbf\xda\x42\x83\x00\x92\x48\xf2\xd8\x2c\xc1\
+\x8e\x35\x88\x8e\x17\x9f\x95\xde\xe6\x36\xbc\xcd\x6d\x98\xf5\x1a\
+\x7a\xb9\x44\x25\x9b\x62\xe1\xc8\x7e\x16\x86\xf6\x03\x36\xee\x70\
+\x8c\x60\xcf\x00\x9e\x68\xf3\x32\x21\x04\x41\x40\x71\x7b\x09\x75\
+\x7b\x09\x75\x0f\xd0\xbe\xf5\x6a\xea\xa5\x22\x85\xb9\x69\x66\xf7\
+\x3f\xc3\x81\xef\xfd\x17\x96\x69\x10\x68\xef\x41\xf3\x07\x89\xaf\
+\xde\x80\xea\xf5\xa3\xf9\x83\x97\xa4\x2f\xca\x99\x45\xf6\xde\x77\
+\x37\xf1\x8d\xdd\x04\xd6\x77\xe2\x71\x37\x9c\x4b\x87\x1f\x7a\x8a\
+\xcc\x64\x82\xfe\x3b\xb6\x81\x6d\x51\x2f\x54\x28\x64\x6a\x04\xfa\
+\x1b\xdb\x4a\x71\x2e\x85\x33\x5d\xa1\x65\x73\x0f\xb1\xde\x76\x10\
+\xd2\x00\x54\xcb\x35\x6a\xa5\x34\x96\xc7\xa5\xd7\x2b\xe5\x73\x52\
+\x03\x9f\xc0\xcb\x46\x00\xa3\x5e\x7f\x83\x5b\xd4\x69\xdb\xb8\xb5\
+\x71\xf7\xaf\x8c\x2d\x9f\xa0\x0d\xdd\x24\x3d\x57\x66\xed\xbb\x5e\
+\x7f\xc6\x19\x68\x59\x06\xa6\x5e\xc3\xa1\x36\xb4\x63\xb2\xaa\x21\
+\xab\x1a\xce\x60\x98\x60\x57\x1f\x7a\xb9\x4c\xad\x90\x25\x37\x3d\
+\x41\x7a\xf4\x28\xe3\x8f\x3d\x88\xe8\x70\xa0\xf9\x83\xb4\x6d\xb9\
+\x0a\xd5\xe3\x3d\xe5\xba\xa8\xb8\x3d\x84\xfb\x56\x10\xee\x5b\x81\
+\x59\xaf\x51\x5c\x98\x27\x37\x33\x41\xe2\xd0\x6e\xe6\x0f\xee\x42\
+\xf3\x07\x71\x87\x63\x04\x3a\x7a\x08\xf7\xad\x44\xf5\x05\x2e\xda\
+\xea\xf0\xd8\xd7\xbf\x04\xb2\x4c\xe0\xb5\xfd\x84\x7c\x11\x04\x04\
+\x2c\xd3\x62\x76\x6c\x9c\xf8\x86\x1e\x24\x87\x8c\x59\xd7\x99\x3b\
+\x38\x83\xab\x39\xba\xb4\x3a\xc0\xdc\x8e\x3d\xac\xf4\x77\xb0\xf6\
+\xc6\x5e\x14\xa7\x0a\x35\xc0\xb6\x19\xde\x73\x1c\x87\x68\xe3\x8d\
+\x46\xa7\xde\xf0\xb7\xff\xf2\xea\xdb\x02\xbe\xf3\xbe\x3b\x9b\xca\
+\xa9\xc5\x2b\x9d\x01\x27\xbe\xd6\x7e\x30\xcb\x50\x9d\x5b\x5a\xfe\
+\x21\x33\x9d\x44\xb7\xbd\x04\x97\xc4\xa2\x2f\x04\x41\x90\xc8\x26\
+\x87\xf1\x85\xba\x50\x5d\xc1\xe7\xfd\x4d\x5c\x96\xb7\x7b\x9b\xda\
+\xb0\x4c\x13\xdb\x34\x28\x2f\x1d\x0a\x8f\xff\xf2\xbe\x25\xf1\x6b\
+\x08\x7f\x5b\x27\xbe\xb6\x2e\xe4\x13\x3e\x7d\x80\xa4\xa8\xf8\xdb\
+\x3a\xf1\xb7\x75\xd2\x7e\xd9\xd5\x98\xf5\x1a\xa9\x63\x43\x94\x16\
+\x13\xe4\xa6\xc7\xa9\xe4\xd2\x54\x32\x69\xa2\x83\x6b\xf0\xc4\x9a\
+\x71\x06\x23\x48\x8e\x73\x13\xf2\x3c\x1f\xf9\xc4\x2c\x87\x1e\xf8\
+\x11\xfe\x15\x61\xbc\xcd\x61\x9c\x5a\x83\xd0\x23\x8f\xef\x44\x0d\
+\x79\x70\x86\x1b\xd7\xbe\xd2\x42\x1e\x53\x71\xa3\xb8\x54\xb0\x6d\
+\xca\x0b\x59\x94\x8c\xce\xaa\xab\x56\xe2\x8f\x2c\x11\xd9\x6e\x88\
+\xb1\x33\x33\x29\x4a\xba\x49\xdc\xe7\x3b\x27\xcf\xa7\x97\x9d\x00\
+\xaa\xdb\x77\x59\x71\x61\x5a\x6d\xee\x6d\x45\x54\x43\x90\x3b\xf0\
+\xdc\xfd\x59\x14\x18\x7d\xf2\x08\xa1\xc1\xcb\x70\x85\xa3\x67\x2c\
+\xc3\xd2\xeb\x54\xd3\x25\x8a\xe9\xa7\x68\xee\xbd\x0c\xcd\x1d\x3e\
+\xe3\xb3\xa2\x24\x81\x24\xe1\x6d\x6a\xa5\xff\xa6\x3b\xb0\x0c\x9d\
+\xd2\x62\x02\xa3\x5a\x65\x61\x68\x1f\xc7\x1f\xfd\x19\x9d\xdb\xaf\
+\x47\xaf\x94\x89\xad\x58\x87\xac\x3e\x27\xc6\x15\x04\x01\x59\xd5\
+\x88\x2f\xd9\x21\x1a\xb5\x1a\xb6\x65\x50\x5c\x98\xa7\x98\x98\x65\
+\xec\xd1\x9f\x61\xd4\xaa\x44\x07\x56\xe3\x6b\xeb\x44\x71\x7b\x51\
+\x3c\x5e\x44\xf1\xdc\x6e\x18\x3b\xbf\xfb\x5f\x58\xba\x4e\xe4\x96\
+\x55\x04\xbc\x8d\x6f\xc8\xcf\x25\x99\x19\x19\x23\xba\xa6\x13\x2d\
+\xe8\x01\x01\x32\xf3\x45\x44\xc5\xb9\x7c\xd8\x3d\x76\xef\xe3\xdc\
+\xbc\xe1\x2a\xba\xd7\x7a\x90\x64\x8d\x86\x9e\xb8\x8a\x25\xc0\xd1\
+\x3d\xc7\xa9\x5b\x02\x8a\xaa\x4e\xbe\x2a\x09\x60\x9a\xf6\xeb\x8a\
+\xb9\x34\xad\x6b\x2e\x87\x6a\x12\xea\xc9\xe7\x96\x7f\xd3\x22\xbb\
+\x68\xb0\xea\xc6\x6b\x5f\x74\x89\x15\x65\x07\x99\xf1\x71\xb2\xa9\
+\x31\xa6\xf7\xee\x61\xf0\xca\xdb\xf1\xc7\x3a\x50\x96\x0c\x39\x5e\
+\x8c\x0c\xa2\x24\xe1\x6f\xed\x04\xc0\xd7\xda\x4e\x35\x93\x26\x39\
+\x7c\x90\x4a\x66\x91\xf9\xfd\xcf\x12\x68\xef\xc1\xd7\xd2\x4e\xa8\
+\x77\x10\x51\x3a\xb5\x4b\x64\x55\x05\x54\x82\x9d\xbd\x04\x3b\x7b\
+\x69\xdd\xb2\x9d\xdc\xe4\x71\xf2\xb3\xd3\x0c\x3f\xf0\x03\x64\xd5\
+\x89\xac\x39\x89\x0e\xac\xc6\x13\x6b\x69\x08\xa3\xce\x20\x99\xcc\
+\xcd\x4e\xb1\xef\xbe\xef\xb3\xf5\x2d\xb7\x63\xb6\x6a\xa8\x4a\x83\
+\x78\xc3\x3b\xf7\x20\x08\x02\xee\xe6\xc6\xca\x56\x4c\x16\x29\x64\
+\xaa\x04\xba\x1b\x37\x83\xdc\xf8\x2c\x83\xcd\x6d\x78\x7c\x2e\x82\
+\x71\x15\x24\xf7\x52\xc7\x56\x98\x3b\x36\x87\xa3\x56\x47\xf5\xf9\
+\xc8\x2d\xcc\xec\x79\x55\x12\x20\xb3\x30\x7f\x33\xa2\x45\x53\x7f\
+\x1c\x8a\x07\x39\x59\xf3\x92\x9f\x4b\x61\xcb\x11\x22\x7d\x2b\x5e\
+\xb4\x0c\x41\x14\x59\xf9\xda\x37\x32\x33\xf2\x08\xf9\xf9\x04\xe3\
+\x7b\x1e\xc2\xe3\x6e\xc6\x13\x8c\xe3\x6d\x6e\xc7\x19\x08\x9d\xd3\
+\x3e\xed\xd0\x5c\x38\x9a\x5d\xcb\x07\xc9\x42\x62\x96\xec\xc4\x28\
+\x33\x7b\x9e\xe2\xf8\xa3\x0f\xe0\x6b\x6e\x27\xd4\x33\x80\xbf\xad\
+\x0b\xc5\xe3\x3d\x4d\xb2\x28\x8a\x12\xc1\xae\x7e\x82\x5d\xfd\xb4\
+\x6f\xbb\xa6\x61\x62\x7e\xf4\x20\xc5\x85\x59\x26\x9e\x7c\x18\x87\
+\xd3\x45\x74\xc5\x5a\x14\xa7\x1b\x5f\x6b\xc7\x29\x07\xc9\x1d\x5f\
+\xfd\x37\x7c\x5e\x2f\xd5\x41\x91\xe8\xd2\xec\x9f\xd8\x73\x98\x6a\
+\xb5\x4c\xeb\xf6\x95\xcb\xb3\x7d\x71\x2a\x8f\xe2\x71\x3d\x27\x86\
+\x4e\x65\x88\xc8\x01\xda\x07\xfd\xc8\x92\xd5\x90\xa0\x22\x80\x59\
+\x64\xff\x8e\x21\xbc\x01\x17\xe9\x92\x41\x30\x1e\x7f\xf5\x69\x03\
+\xbf\xfb\xc1\xb7\x34\x4f\x8f\x1c\xe9\x08\x85\x3c\xb8\x82\x2e\x30\
+\x1a\x12\x34\x00\x5b\x80\x89\xdd\x63\x28\x91\x3e\x5c\xe1\xd8\x59\
+\xcb\x72\xa8\x2e\x42\x2d\x8d\xfb\xbb\xd0\xd9\x81\x6d\xdb\x28\x0e\
+\x37\x08\x36\xb9\x99\x09\xca\xfb\x9e\xc1\xe1\x72\xe3\x89\xb7\xe0\
+\x6b\x6e\x43\x94\x5f\x7c\x9f\x96\x14\x95\x40\x7b\x37\x81\xf6\x6e\
+\x4c\x43\x27\x3f\x33\xc9\xe2\xc8\x21\x32\xe3\xc7\x28\xcc\xcf\x60\
+\x54\xab\x78\x62\xcd\x44\x57\xac\xc1\xe1\xf2\x9c\x46\xae\x13\x5b\
+\x4d\xd3\x9a\x8d\x58\xe6\x3a\x3a\x2e\xbf\x9e\xc2\xfc\x34\x73\xfb\
+\x9e\xa1\x9c\x5e\x44\xf3\x05\x96\xdb\x62\xd4\x6b\xec\x7f\xf4\x41\
+\x06\x6f\x58\x8f\x1c\x54\x70\x6a\x1e\x74\xbd\xc6\xd8\xbe\x83\xb8\
+\xa2\xfe\x65\x05\x4f\x6a\x22\x4d\x25\x57\xc1\xd7\x1e\x07\x1b\x04\
+\xa3\x8a\x36\x91\xa7\xfd\x8a\x0d\x74\xaf\xf3\x03\xe6\x92\x08\xdd\
+\xc2\x32\xcb\xcc\xee\x1b\x43\x55\x64\x34\xb9\x8e\x51\x2b\xa4\x5f\
+\x75\x04\x40\x74\xbc\x5d\x15\x0d\xa9\x63\x45\x27\x58\x32\x68\x2d\
+\xcb\xf7\xff\x52\xaa\x40\x21\x2b\xd1\x73\xc3\x75\xe7\x5c\x9c\x2f\
+\xd4\x85\xa9\x57\x28\xe6\x66\x1b\x7e\xf0\x46\x1e\xc3\x2a\xe3\x89\
+\xb6\x13\xe8\xe8\xa1\xbc\xb8\xd0\x58\xda\x0f\xec\xc2\x13\x6b\xc6\
+\xdb\xd4\x86\x33\x14\x41\x59\xb2\xfb\x3f\x23\x19\x64\xc7\xf2\x32\
+\x6f\xd4\x6a\x94\x52\x09\xf2\xd3\xe3\x94\x16\xe7\x49\xdf\x3f\x0c\
+\x40\xf3\xba\x2d\xb8\xa3\x4d\x68\x81\xe0\xe9\x2b\x83\x24\x21\x3a\
+\x5d\x84\xba\x07\x08\x75\x0f\x50\xcd\x65\x38\xfe\xc8\x4f\x31\x6b\
+\x55\x12\x43\xfb\xd9\x75\xdf\xdd\xb4\x75\x74\xa2\x5e\xd9\x42\x38\
+\x10\x03\x6c\x8e\xee\x78\x16\xcb\xb0\x08\xaf\x6c\x07\x01\x8c\xaa\
+\xce\xc2\xf1\x34\xaa\x7f\x49\x91\x24\x02\xf3\x8b\x34\xf9\x9b\xe8\
+\x5a\xa9\x22\x0a\x16\x48\x4e\x10\x1d\x60\xe4\x99\x1b\x99\xa1\x5a\
+\xac\xd0\xb1\xba\x83\xf2\x58\xb2\x2e\x4a\xc2\xfc\xab\x8e\x00\xe9\
+\xe4\xe2\xef\x28\xa2\x41\xff\xd6\x7e\xf0\xac\x06\xd9\xdb\x20\x00\
+\x30\x3f\x32\x43\x21\x67\x10\x5b\xb5\xfe\xbc\xca\x54\x5d\x21\x8a\
+\xb9\x19\x1a\x2b\x89\x80\x6d\x99\xe4\x33\x63\xd4\xaa\x19\x22\xed\
+\xeb\x08\x88\xbd\xf8\x5b\x3b\xa9\x97\x4b\x94\x16\xe7\xa9\x66\x53\
+\xe4\xe7\xa6\x1b\x82\xa1\x9e\x41\x54\x7f\xe0\xb4\xbd\xfe\x94\x4e\
+\x51\x55\xfc\x2d\x1d\xf8\x5b\x3a\xb0\x2d\x93\xd2\xe2\x02\xc5\x85\
+\x39\x2c\xd3\xe0\xd8\x2f\xee\xc5\x15\x8a\xa2\x05\x82\xf8\x5b\xbb\
+\x71\xb8\x5c\x28\x2e\xcf\x69\xfb\xbe\xe6\x0f\xb2\xea\x0d\x6f\xc5\
+\xb6\x6d\x66\x0f\xef\x63\x61\x7c\x94\xc1\x5f\xbd\x0e\xd5\xe7\x44\
+\x55\x34\x0a\xe9\x0c\xd3\xfb\x8e\x12\x5d\xd5\x81\x28\x4b\x60\xdb\
+\xcc\x1e\x9e\x03\x51\x44\xf5\xbb\x1b\x0a\x27\xc5\x26\xbd\x63\x8a\
+\xd5\xd7\x5d\x4f\xbc\xb3\xb1\xd2\xe1\x08\x02\x36\xe8\x19\x86\x9e\
+\x1e\xa1\x66\xda\x84\xda\x22\xcc\xe5\xdc\x3b\x6f\xfb\xbb\x6f\xe5\
+\x5e\x55\x04\xf8\xc6\xef\xbd\xc5\x9b\x9c\x9b\x6b\x8d\xb8\x15\x9a\
+\x57\x0f\x34\x1a\x6f\xe4\x00\x1b\x5b\x10\x99\x39\x30\x8e\xbb\x6d\
+\x3b\xee\x73\x58\xfe\x4f\x86\xd3\x13\xc3\xe9\x89\x51\x29\x26\x4f\
+\x51\xd7\xd6\x2a\x59\x16\xa6\x77\x13\x6f\xdf\x8a\x2b\x1c\xc3\x15\
+\x86\x40\x7b\x37\xb5\x62\x9e\x60\x77\x3f\x89\xc3\xfb\x98\xda\xf9\
+\x28\xa5\x74\x92\x40\x7b\x37\xa1\x9e\x15\xa8\x5e\x1f\xaa\xd7\x7f\
+\x66\x3f\x00\x51\xc2\x13\x6b\xc6\x1d\x6d\x6a\xa8\x83\x43\x11\x6c\
+\xd3\x64\xfa\x99\xc7\x49\x1d\x3b\x8a\x33\x10\x42\x74\x38\xc0\xb6\
+\x89\xf4\xaf\xc2\xdb\xdc\x76\x1a\xb9\x1e\xfe\xea\x17\x89\x34\xc7\
+\xb1\x06\x54\x82\xfe\x08\x00\x13\x7b\x0e\x61\x54\xea\x04\xfb\x5a\
+\x10\x44\x81\xec\xc4\x02\xc5\x4c\x15\x87\xb7\xb1\x52\x09\xb6\xc5\
+\xcc\x0f\x9e\x64\xcb\xda\xad\x74\x0e\xda\x48\xa2\xdd\x50\x9a\xc9\
+\x01\x00\x6c\x2b\xcb\xd0\xee\x51\x6c\x87\x4c\x5d\x96\x08\xc6\xa3\
+\xf7\x5f\xc8\x18\x5d\x52\x02\xb8\xdd\x9e\x77\xcc\xd4\xca\xce\xb6\
+\x4d\x5d\x88\x82\xd8\xf0\xfa\x5d\x5a\xfe\x6d\xcb\x62\xea\x58\x92\
+\xeb\xdf\x7c\xeb\x79\x97\x2b\x08\x02\xe1\xa6\x35\x2c\x4c\x3f\x8b\
+\x5e\x6b\xe8\x12\x4e\xfc\xae\xd7\x8a\x24\xa6\x9e\x21\xdc\xbc\x06\
+\x87\xd2\xe8\x4c\xd5\xd3\x90\xb4\xb5\x6f\xbd\xb2\x61\x8b\x9f\xcb\
+\x50\x5a\x5c\x20\x3b\x39\x4a\x31\x31\xbb\xac\x23\x50\x7d\x01\x3c\
+\xd1\x38\x5a\x20\x7c\x1a\x21\x4e\x98\x8c\x7b\xe3\x0d\x1b\x86\x15\
+\xaf\x7f\x0b\x66\xbd\x4e\xad\x90\x23\x33\x31\x8a\xa5\xd7\x39\xf6\
+\xd0\xbd\x38\x5c\x6e\x8a\xc9\x79\xda\x36\x6f\xa7\x63\xdb\xb5\xcc\
+\x0d\x1d\x60\x7e\xdf\x4e\x02\x57\x77\x11\x8c\xc5\x71\xaa\x2e\xca\
+\x85\x02\x33\x87\x8f\xd1\xb6\x7d\x25\xa2\xa3\x71\xf0\xcb\xa7\x6a\
+\xa8\x7e\x2f\x5a\xd0\x8b\x0d\xcc\x3f\xb5\x8f\x81\x40\x07\x2e\x57\
+\x85\x68\x47\xcb\x52\x2b\x6c\x50\x1a\x71\x0b\x67\x0f\x1e\x62\x6e\
+\x26\x43\x5b\x7b\x08\xd1\xed\x45\x94\xb9\xa0\xc8\xa4\x97\x94\x00\
+\xe5\x62\xf9\xdd\xf5\x7c\x4a\xe8\xdf\x7a\x0d\xe8\x45\x48\x3d\x72\
+\xa2\x37\xc9\x4c\x27\x89\x75\xf5\xa1\xb8\x2e\x4c\xa1\x22\x88\x22\
+\x91\x96\xf5\x24\x26\x9f\xc1\x32\x9f\x0b\xc8\x29\x08\x02\x46\xbd\
+\x44\x62\x62\x27\xbe\x50\x27\xde\x50\xd7\x49\xfb\xb5\x80\x20\x80\
+\x33\x10\xc2\x19\x08\x11\xea\xee\xa3\x9a\xcb\x52\x2b\xe4\x58\x18\
+\xda\x47\x61\x6e\x8a\xa3\xf7\xdf\x8d\x37\xde\x82\x16\x08\x11\x19\
+\x58\x4d\xb0\xb3\x17\x41\x94\x5e\xe0\x00\x28\x23\x3a\x65\x1c\x4e\
+\x17\xee\x68\x13\x00\xad\x9b\xae\x60\xe1\xc8\x7e\x8c\x5a\x95\x4a\
+\x3a\x85\x6d\xdb\x3c\xf8\x85\xbf\x47\xf4\x6b\x34\xdd\xb2\x86\xc0\
+\x92\xc2\x67\x78\xe7\x6e\x14\x97\xd6\xb0\xeb\x03\x8a\x89\x1c\xd9\
+\x44\x91\x60\x6f\x63\xa0\x25\xc1\xc2\x1a\x9d\xa7\xe5\x9a\xcb\x51\
+\xec\x21\x24\xc7\x40\xc3\x2d\x59\x72\x82\xe8\x02\x33\xcf\x33\x3f\
+\x7b\x16\x97\x5b\x65\xd3\x4d\xeb\x19\x3f\x9a\xb1\x23\xe1\x96\x1d\
+\xaf\x2a\x02\x7c\xe7\x43\x6f\xf7\x99\xc5\xfc\x26\xbf\x62\x13\x6c\
+\x09\x9f\x72\xf5\x03\xc8\xcf\xa7\x71\x46\xba\xf0\xb5\x75\x5e\x70\
+\x1d\x92\xac\x12\x6d\xdd\xc8\xc2\xd4\xb3\xd8\xf6\xf3\x63\x08\xd8\
+\xe4\x52\x63\x94\x0a\xf3\x04\x22\xfd\x68\xee\xc8\x0b\x0e\xa2\x2b\
+\x14\xc1\x15\x8a\xe0\x6f\xed\xc4\xa8\x57\xe9\xb8\xa2\x4c\x21\x31\
+\x4d\x69\x61\x8e\x99\x5d\x4f\x90\x1c\xda\x4f\xbd\x98\x27\xd0\xd9\
+\x8b\x2b\x1c\xc3\x19\x0c\xa3\xf9\x43\xa7\x48\x02\x4f\x94\x2b\x6b\
+\x4e\x5a\x36\x6c\x5b\x16\x22\x25\x0e\xee\x26\x3b\x71\x9c\xf8\x5b\
+\xd6\xe0\x75\xfb\x91\x65\x07\xe9\xb9\x04\xb9\xd9\x24\xc1\x81\x56\
+\x24\xb5\xb1\x75\xcc\x1c\x9a\xc3\x13\x0f\x2e\x5f\x03\xb3\x87\x8e\
+\x11\x96\x82\x54\x93\xc7\x19\xb8\xbe\xab\xe1\x14\x0a\xe0\x88\x00\
+\x16\x56\x35\xc9\x81\x9d\xa3\xb8\xdc\x0a\xcd\xbd\x9d\xec\xfa\xc5\
+\xce\x42\xac\xa5\x6f\xf7\xab\x8a\x00\xa2\xc0\xca\xd1\xf1\x31\xb9\
+\xbf\x2b\x82\xea\xd6\x4e\xb1\xad\x47\x10\x98\x3a\x34\x89\xbb\xe7\
+\xb6\xe5\xe5\x19\xa0\x9c\x4a\x52\xcd\x67\xf1\xb5\x76\x9c\x22\xaa\
+\x7d\x31\x38\x54\x37\xd1\xf6\xcd\x24\xa7\x77\x63\x5b\xa7\x46\x47\
+\x17\x04\x01\x53\xaf\xb2\x38\xbb\x1f\xd5\x19\x20\x10\xed\x47\xd1\
+\x7c\x2f\x58\x8e\x28\xcb\x28\xb2\x07\xc5\xe5\xc1\x15\x8e\x62\xaf\
+\x58\x8f\xa9\xd7\xc9\x1c\x1f\x26\x33\x31\x4a\x31\x31\x47\x76\x6a\
+\x0c\xb3\x5e\xc7\xac\xd7\x08\xf7\xae\xc0\x1d\x6b\xc2\xd7\xdc\xde\
+\x38\x43\x9c\x74\x08\x94\x1c\x0a\xa6\x5e\xe7\x47\xff\xf8\x09\xac\
+\x80\x84\x7f\x55\x0b\x7e\x5f\x08\x41\x10\x18\xdf\x7d\x10\x6c\x1b\
+\x6f\x5b\x18\xdb\x86\x7c\xa2\x88\x61\x49\xa8\x4a\x83\x50\xb2\x64\
+\xe3\x5a\xac\x13\x69\xed\x20\x10\xb6\x88\xf4\x34\x91\xc9\x95\xf0\
+\x79\x9d\x48\x4a\x18\x10\xc8\xce\x1c\x43\xaf\xeb\x08\x2e\x07\xde\
+\xb6\x0d\xa8\xca\x9e\x42\xb5\x58\xbe\x20\x43\xc9\x4b\x46\x00\xb3\
+\x5e\x5b\xeb\x10\x0c\xfa\x36\xad\x46\xb0\x4f\x0d\x97\x63\xdb\x36\
+\xd8\x2a\x5a\x30\x72\x6a\x63\x34\x0d\xb1\x2c\x33\xf3\xec\x0e\x42\
+\x3d\x83\xb8\xa3\x4d\xe7\x64\xc4\xa1\xa8\x1e\xe2\x1d\x5b\x49\xce\
+\xec\xc5\xa8\x97\x5f\x70\xff\xae\x57\x73\x24\x26\x9f\xc1\xe5\x8d\
+\xe1\x0b\xf7\x2c\x9f\x0f\x5e\x08\x82\x20\x2c\x19\x90\x38\x89\xad\
+\x5a\x4f\x6c\xd5\x7a\x6c\xcb\xa2\x5e\x2a\x92\x9d\x1c\xa5\x92\x49\
+\x51\x2b\xe4\x48\x3c\xbc\x17\xb3\x5e\x43\x72\x38\x08\x76\xf5\xe3\
+\x6b\x69\xc7\xd7\xda\x85\xea\xf5\x71\xf8\xfe\xef\x53\x48\xce\xd1\
+\xf6\xbe\xed\x38\x14\x15\xc5\xa1\x91\x99\x4d\x90\x99\x4d\x10\xec\
+\x6d\x46\x72\xc8\xd8\xc0\xec\x50\x02\x49\x91\x71\x38\x55\xb0\xc1\
+\x98\x99\x43\x4b\xd6\x90\xe3\x12\x8a\xd3\x24\x57\xa8\x90\x4e\x17\
+\x1b\xd2\xcc\x48\x10\xac\x3a\x87\x77\x3c\x8b\x3f\xec\xa5\x6b\xa0\
+\x89\xe1\x5d\xa3\xb4\xf4\x74\x7f\xf5\x75\x9f\xf8\xc2\xab\x8b\x00\
+\xb2\x43\xbd\xd5\x21\xea\x78\xe2\x01\x9e\x8b\x67\xd2\x80\x5e\xd3\
+\xc9\x66\xeb\x0c\xf4\x0c\x9e\x3a\x90\x6e\x2f\x8a\xdb\x8b\xb7\xa9\
+\x8d\xcc\xf8\x30\x99\xf1\x11\xb4\x40\x08\x67\x20\x8c\xb7\xa9\xf5\
+\x2c\xf5\x39\x89\xb7\x6f\x25\x35\x7f\x90\x6a\x29\x75\xc6\xf8\x79\
+\x95\xe2\x02\x95\x42\x12\xa7\x37\x86\x2f\xd4\xbd\xac\x5d\x3c\x1b\
+\x04\x51\x44\xf5\xfa\x96\x97\x77\xbd\x52\xa6\x56\xc8\x61\xd6\x6b\
+\x94\xd3\x8b\xa4\xc7\x86\x99\xdb\xf7\x0c\x33\x7b\x9e\xa2\x94\x49\
+\xf3\xd4\x4f\x7e\x48\xf4\xda\x1e\x7c\x1d\x51\x04\xc0\xb4\x74\x0e\
+\x3f\xfa\x14\xaa\xcf\x45\xb0\xb7\x61\x0d\x35\x7b\x38\x41\xbd\x58\
+\xc1\xdf\xd5\xdc\x10\x6a\x89\x3a\xfa\xfe\x45\x42\xad\x9d\x24\xc6\
+\x87\xb8\xfa\xce\x6b\x29\x95\x1a\xc6\xa9\x8a\x33\xd4\x88\x9c\x62\
+\xce\x71\xf4\xe9\xa3\x88\x86\x41\xf7\x96\x7e\x86\x9e\xdc\x45\x28\
+\x16\xfd\xd9\x05\x8f\xd3\xa5\x18\xfc\xef\xfe\xfe\xdb\xdc\x18\xf5\
+\xdb\xf4\x6a\x85\x78\x4f\xf3\x69\x81\x68\x66\x0f\x4f\xe0\x6b\x1e\
+\xc4\xdb\xdc\xf6\x82\xef\x4b\x0e\x07\x91\xfe\xd5\x94\x42\x0b\xcc\
+\xee\x7e\x92\xc5\xa3\x07\xb1\x4c\x83\xee\xab\x6f\xc6\x19\x8a\x9e\
+\x71\x55\x10\x25\x99\x48\xcb\x7a\xf2\xa9\x31\xf2\xe9\xb1\x33\x5c\
+\xed\x1a\xaa\xd5\x4a\x71\x81\x72\x21\x81\xd3\x1d\xc1\x1b\xec\x40\
+\x71\x9e\x9f\xba\xd7\xe1\x74\xe1\x70\xba\x00\xf0\xb7\x75\xd1\xb4\
+\x66\x13\xa6\x5e\xa7\x9a\xcf\xf2\x8b\xcf\xfe\x15\xba\x64\x11\xba\
+\xb6\xa1\xdd\x34\x4c\x83\xd1\xa3\x07\xa9\xe6\x8a\x04\xfa\x5b\x10\
+\x24\x91\x72\xa1\x4e\x2e\x51\x44\x0b\x7a\x71\xb8\x34\x64\x45\x64\
+\xf1\x81\x67\x58\x11\x1c\x00\x6f\x90\xb6\xf6\x69\x5c\x21\x2f\xd9\
+\x44\xc3\x67\x41\xf5\x34\x48\x33\x7d\x78\x1f\x43\x47\xe7\xe9\xef\
+\x8d\xa1\x69\x2a\xf9\x4c\x65\x28\x10\xd5\x2f\x38\x20\xe5\x25\x21\
+\x80\x43\x55\xbb\xc7\x0e\xef\x51\xdb\x56\x75\xe0\x0e\x79\x68\x38\
+\xb9\x3d\xd7\xff\x99\xe9\x34\xb6\xd8\x83\x2b\x14\x7d\xd1\x72\xdc\
+\xe1\x18\xbd\xd7\xdf\x86\x6d\x59\x24\x0e\xed\x21\x71\x78\x1f\xd5\
+\x5c\x86\xd8\x8a\xb5\xf8\x5a\x3b\x51\xdc\xa7\xdf\x20\x04\x41\xc0\
+\x1f\xe9\x41\x75\xfa\x49\xcd\x1f\x3a\xed\x5c\xf0\xfc\x67\xab\xe5\
+\x14\x95\xd2\x22\x0e\xc5\x8d\xcb\xd7\x84\xcb\x1b\x47\x76\x38\xcf\
+\xfb\x9b\x05\x51\x44\x56\x35\xb2\x53\x63\x8c\xec\xdd\x45\xe4\xc6\
+\x7e\x54\x6f\x83\x20\x96\x69\x31\xfb\xf4\x30\xa2\x2a\x13\xec\x6b\
+\xc6\x34\x4c\x8e\x3f\x31\x4a\x39\x95\xa7\x75\xdb\xea\xc6\xf1\x28\
+\xb3\x88\x6b\xae\xce\x8a\x0f\xde\xc9\xf0\x2f\x7e\x82\x65\x55\x11\
+\x1d\x12\x16\xa0\x29\x12\xa2\x1a\x05\x5b\xe7\x99\x9f\x3f\x8a\xaa\
+\x48\xb4\xad\x6a\x67\x74\xf7\x18\x3d\x2b\xfb\xfe\xfd\xb5\x1f\xff\
+\xfc\x05\x3b\x4a\x5c\x12\x02\xc8\x8a\x76\xa7\x65\x56\xe9\xdb\xb8\
+\x11\xc1\xb4\x4e\xb9\x01\x54\x4b\x35\xf2\x29\xe8\xbc\xf1\xba\x73\
+\xb2\xe7\x3f\x61\xd5\xd3\xbc\xe1\x32\x2c\xbd\x4e\x39\x93\x62\xe1\
+\xf0\x5e\x16\x8e\xec\x47\x94\x1d\x78\xa2\x4d\x34\x6f\xb8\x0c\xe9\
+\x79\x96\x44\x9a\x3b\x4c\xbc\xe3\x32\x52\x73\xfb\xa9\x57\x0b\x2f\
+\x3a\xbb\x05\x41\xc0\xd0\xcb\xe4\x16\x47\xc9\x2d\x8e\x22\x2b\x2e\
+\x14\xcd\x8f\xa2\xb8\x91\x55\x37\x0e\xc5\x8d\x24\xab\x67\x35\x39\
+\x37\xeb\x35\x7e\xf2\xb9\x4f\xe3\xef\x8e\xd0\x74\xcd\xca\xa5\xc2\
+\x21\x35\x34\x85\x28\x4b\xc4\x37\xf4\x20\x08\x02\xb3\x87\x13\x98\
+\x86\x49\xf3\xe6\x86\xb9\x9a\xdb\x05\xb9\x87\xc6\x59\x7d\xf5\x2d\
+\x74\x6c\xbd\x9a\x5f\xfe\xf3\x27\xd9\xfe\xda\x5e\x1c\xb2\x84\xd7\
+\xa3\xe1\xf7\x07\x40\x72\x63\x56\xa6\x19\x7a\xe2\x08\x21\xaf\x46\
+\xef\xd6\x01\x0e\xff\x7c\x08\xcd\x69\x9e\xb7\xf8\xf7\x92\x12\xe0\
+\xbf\x7e\xe3\x56\xd7\xec\xb1\xe1\xf7\x17\xca\x55\x56\x6e\x1b\x3c\
+\xed\xfa\x97\x9b\x4b\x91\xce\x98\xac\x88\x36\x9f\x57\xb9\x82\x20\
+\x20\x29\x2a\x9e\x58\x33\xaa\xc7\x4b\x25\x93\x66\xe1\xc8\x3e\x26\
+\x9f\x79\x8c\xd9\x7d\x3b\x31\xf5\x3a\x7d\x37\xde\x8e\xff\xa4\x95\
+\x41\x76\x68\xc4\xda\xb7\x90\x59\x18\xa6\x94\x9b\x39\xeb\x12\x7f\
+\xe2\xef\xa6\x5e\xa1\xa2\x57\x28\xdb\x36\x27\x42\xb0\x8a\xa2\x8c\
+\xa2\xf9\x50\x9c\x81\xc6\xc3\xb6\x8d\x6d\x99\x08\xa2\xd4\x20\x8b\
+\xd3\xc7\xe3\x5f\xff\x12\x95\x5c\x8a\xd8\x6d\xeb\x1a\x57\x3c\xa0\
+\x9a\x2d\x51\x98\x59\x24\xd0\x15\x47\x0d\xb8\xa9\x95\xea\x64\xa6\
+\x32\x78\x5b\x63\x0d\x11\xb0\x20\x30\xf9\xc0\xb3\xac\x0f\xf6\xb1\
+\xe5\x9d\xef\x63\x61\xf8\x10\xb5\xfc\x22\xc1\xb6\x6d\x88\x82\x40\
+\x53\xd4\x0f\x6a\x43\xce\x70\xe8\xc1\x5f\xb0\x98\x29\xb3\x66\x55\
+\x0b\x5e\xbf\x8b\x85\xe9\x62\xd2\x1b\x29\xdf\xf3\xaa\x22\x80\x6e\
+\x58\x37\xe7\x16\xa6\x9a\x56\xad\xeb\xc0\x15\xf4\x80\x79\xd2\xea\
+\x24\x08\xcc\x1e\x9c\xc0\xdf\xdc\x4d\xa4\x7f\xe5\x05\x95\x7f\xc2\
+\xbe\x4f\x71\x7b\xf1\xb7\x75\xd2\x79\xc5\xf5\x14\x13\xb3\xa4\x8e\
+\x0f\x33\xb1\xe3\x21\x6a\xc5\x3c\x81\xf6\x6e\x62\xab\x36\x2c\x5d\
+\xd1\x7c\x84\xe2\x2b\x50\x9d\x01\x32\x0b\x43\xa7\x5e\x47\xcf\xa1\
+\xae\x65\xcd\xa5\x6d\x51\xab\x64\xa9\x55\xb2\xa7\x3d\x27\xca\x2a\
+\x82\x2e\xf3\xd4\xb7\xbf\x4c\x60\x63\x13\x81\x81\x96\x46\x3d\x02\
+\xcc\xec\x38\x8c\xb7\x35\x82\xaf\x2b\x8e\x69\x58\xcc\x1e\x4d\x21\
+\xbb\xb4\x65\xed\x5f\xbd\x50\x66\xe6\xe8\x2c\xbf\xf2\xa1\xf7\xe2\
+\x0a\x45\x79\xe2\x5b\x5f\x26\xde\xe2\x5f\x76\x08\xc1\xb6\xc1\x11\
+\x06\x5b\x67\xec\xe0\x41\x34\x59\xa4\x6d\x55\x07\x0b\x47\xa7\x89\
+\xb7\xb7\xfc\xf0\xe6\xbf\xf8\xaf\x97\x94\x9b\xe8\xa2\x13\xc0\xe9\
+\xf6\xdd\x39\x5f\x2d\x71\xf5\x9d\xaf\x3b\x75\xf0\x01\x53\x37\x48\
+\x4e\xa6\x08\xae\xbf\xee\xb4\x25\xfb\x04\x2c\xd3\xa4\x96\xcf\xa2\
+\x7a\x7d\x67\x55\xe7\x42\xe3\xe6\x10\xea\x19\x24\xd4\x33\x48\xad\
+\x90\xa7\x92\x5d\x24\x71\x68\x2f\x63\x8f\xfe\x8c\xd8\x8a\xb5\x54\
+\x72\x69\x3c\xd1\x66\xa2\x2b\xd6\x35\xb6\x84\xd9\x03\xe8\xf5\xd2\
+\x45\xb5\xfe\x35\xf5\x2a\xcf\x7e\xfb\x1e\x02\x61\x2f\xb1\x9b\x56\
+\x36\x06\xcd\x86\xe4\xa1\x09\x1c\x2e\x0d\xd5\xef\x42\x52\x64\x12\
+\xe3\x25\x4a\xa9\x3c\xae\x68\x70\xd9\x0a\xf8\xf8\x43\xcf\xd2\xda\
+\xdd\x4b\xf7\x55\x37\x61\xdb\x36\xa9\x63\x07\x70\x39\x1d\x54\x97\
+\xfb\x6e\x49\x01\x64\x2c\x32\x3a\x34\x8d\xcf\xab\x11\xeb\x69\x62\
+\x72\xf7\x28\xde\x50\xc7\x05\x49\xff\x4e\xc6\x45\x75\x0e\xfd\xda\
+\x6f\xdf\x11\x49\x4e\x4f\xde\xd9\xd1\x16\x24\xd2\xd3\x74\xda\xdf\
+\x2b\xf9\x32\xa5\xbc\x4e\xf3\xda\xcd\x67\x2c\xc3\x32\x74\x2c\x43\
+\x27\x35\x7a\x94\xc5\xe1\x43\x98\xf5\x5a\x43\x6e\xf0\x22\x30\xf4\
+\x2a\xf3\xe3\x4f\x61\x58\x45\x44\xb7\x48\xcf\x0d\xb7\xb0\xfa\xce\
+\xb7\xe3\x8e\xc4\xb1\x0c\x83\xdc\xf4\x38\xc7\x1f\xfe\x09\xa3\x0f\
+\xde\x8f\x5d\x90\x91\x05\xf7\x69\x5b\xd3\xf9\xc0\xb6\xed\x86\xfb\
+\xb7\xe8\x40\x75\x85\x71\xa9\x4d\x0c\x3d\xfa\x38\xf5\x3e\x37\xcd\
+\x3d\x3d\x28\x8e\x86\x10\x2b\x3f\xb1\x80\xec\x54\xf0\x75\xc4\xc8\
+\x2c\xd4\x28\x26\x73\x38\x83\xbe\xe5\xc3\x61\x76\x62\x1e\x33\x57\
+\xe6\xaa\x2d\x37\xa0\xfa\x02\xd4\x8b\x79\x66\x0f\xed\x42\xf2\x3a\
+\x71\x68\x4b\x13\x44\x72\x82\xa8\x61\xe4\xc6\x29\x67\x8a\xa8\xaa\
+\x4c\xb8\x39\xc8\xfc\x78\xca\x96\x5d\xce\x97\x1c\x84\xf2\xa2\xae\
+\x00\xb6\x69\xfd\xae\x88\xe1\x6d\xdb\xd0\x83\x2c\x9f\x7e\x55\x1b\
+\x7b\x66\x18\x41\x0b\x2d\xdf\xa5\x5f\xb0\x41\xaa\x86\x1c\x6d\x42\
+\xf1\xf8\x30\xf5\x3a\x8b\x23\x87\xb1\x4c\x03\x4f\xac\x05\x67\x20\
+\xd4\xc8\xce\xf1\xbc\xc1\x93\xa4\x46\x67\xa5\x13\x43\x08\x82\x40\
+\x6e\x71\x14\xb7\xaf\x99\x60\xdf\x00\x91\xc1\x35\x54\x73\x19\x0a\
+\x73\x53\x54\xd2\x29\xf2\xd3\x13\xe8\x95\x32\x95\x72\x06\x4b\x35\
+\x89\xad\x18\x44\x71\x3a\xcf\x4a\xb2\x13\x03\x2f\x3b\x5c\xb8\xfd\
+\xcd\xb8\xfd\xad\x88\x62\xa3\xfb\xbe\xf7\x67\xbf\x87\xad\xda\xf4\
+\xbd\x76\x33\x01\x6f\x88\x6a\xa5\x44\x61\x2e\x45\x35\x53\x22\xbe\
+\xb1\x97\x52\xc1\xa0\x98\xa9\xa2\x57\x6a\xf8\xda\x9e\xd3\x7c\x2e\
+\xec\x1b\x61\xa5\x2f\xce\x8a\x6b\x1b\x0a\xb1\xd1\x27\x1f\x26\xe8\
+\x11\xf1\x77\x3c\xe7\x69\x8c\xec\x07\xb3\xc0\xec\x91\x23\xd4\x0c\
+\x8b\xd6\x88\x8f\x7a\xa1\x8a\x6e\x79\xf7\x5d\xff\x91\x2f\x9c\xb7\
+\x0d\xe0\x25\x25\x40\xcd\xb0\xdf\xec\x75\x18\xac\xde\x76\xba\x73\
+\xa7\x61\x98\xcc\x1c\x9e\x64\xe0\x86\x5f\xc7\xa1\x9d\xfd\x9a\x75\
+\xe2\x9e\xad\xae\xda\x40\x35\x97\x21\x3b\x79\x9c\xd2\x62\x02\x51\
+\x96\xd1\x2b\x65\x22\xfd\xab\x96\xc5\xc8\x82\x28\x12\x6d\xdb\xc4\
+\xe2\xec\x3e\xea\xd5\x3c\x82\x20\x50\x2e\xcc\x51\x2e\x24\xf0\x06\
+\x3b\xf0\x86\x3a\x71\x06\xd6\x63\xdb\x16\xf5\x62\x81\xec\xe4\x18\
+\x96\x51\x67\x7a\xff\x4e\x8e\xfe\xec\x41\xca\xe9\x14\x9d\xdb\xb6\
+\xe1\x0a\x85\xf0\x44\xa3\x08\x4b\xe1\xea\x4f\x0c\xba\x20\x88\xa8\
+\xae\x20\xa2\x28\x13\x8c\xad\x38\x45\xdd\x3b\xb1\xeb\x29\x8e\xed\
+\x7a\x12\xff\xf5\x9d\xb4\xf5\xf6\xa1\x1b\x3a\x55\xbd\x42\x62\xf7\
+\x28\x81\xde\x26\xd4\x70\x80\x85\xa9\x32\x95\x54\x0e\x59\x7d\x6e\
+\xdb\x4b\x1f\x9f\x25\x5c\x12\xb8\xe1\xbd\x1f\x22\xdc\xdb\x30\x87\
+\x9b\x7a\x76\x07\x5e\xaf\x42\x6c\xa0\xf5\xc4\xc9\x03\x24\x0f\x54\
+\x26\x18\xd9\x3f\x81\x24\x89\x04\x9b\x82\x64\x66\x53\xa8\xaa\x78\
+\xf4\x62\x8c\xd9\x45\x23\xc0\xb7\x3f\xf0\x6b\x9e\x74\x62\x61\xd0\
+\xa3\x42\xb8\xf3\x74\xfd\x7e\x29\x53\x44\xc4\xc6\xdb\x36\x78\x5e\
+\xe5\x0a\x82\xb0\xac\xbd\x33\xeb\x75\x2a\xb9\x34\x7a\xa9\xc0\xf4\
+\x33\x8f\x23\x88\x22\x8a\xc7\x47\xb0\xb3\x17\x57\x28\x4a\xac\x6d\
+\x33\xd9\xe4\x51\x8a\xb9\x99\xa5\x2b\x9b\x4d\x3e\x3d\x4e\x31\x37\
+\x83\x2f\xd4\x85\xc7\xdf\x86\xea\xf5\x13\x5f\xbd\xa1\xe1\xc3\xdf\
+\x33\x48\xad\x9c\x67\x6c\xf7\x43\x64\x67\x26\x48\x0e\x8f\x10\xe8\
+\x68\x27\x3f\x37\x47\xb4\xaf\x9f\xf8\xc0\x6a\xbc\x91\x76\x5c\xbe\
+\xa6\x17\x74\xf8\x34\xf5\x3a\x3f\xfd\xfc\xdf\xe3\xee\x09\xb2\xfe\
+\xae\x1b\x90\x25\x07\xd9\x7c\x8a\x5a\xae\x8c\xec\x54\x88\xac\xee\
+\x24\x35\x5b\xc1\xb2\x2c\xf4\x72\x15\x6f\xcb\x73\x72\x8f\xe4\x63\
+\x07\xb9\x61\xdd\x76\xba\xae\xba\xa9\x71\x0d\xad\x55\x49\x1e\xdc\
+\x49\xe7\x8a\x26\x44\x59\x44\x96\x97\x76\x67\x41\xc2\xaa\xcd\x71\
+\xe8\x91\x83\x48\x96\x49\xeb\x9a\x0e\xa6\xf7\x4d\x10\x6d\x69\x7b\
+\x75\x11\x40\x73\x7b\xaf\x92\xc5\x05\x67\x1d\x0b\x49\x96\x4e\x3b\
+\x00\xe6\x66\x53\xe8\xa6\x83\x70\xff\xba\x0b\xae\x43\x52\x14\x3c\
+\xd1\x26\xac\x60\x04\x67\x30\x42\xbd\x54\x20\x35\x7a\x94\x99\x5d\
+\x4f\x22\xc9\x32\xde\xe6\x76\x3c\x4d\xad\x68\x2d\x51\xb2\xc9\xa3\
+\x18\x7a\xb5\xe1\xce\x6d\x19\x64\x93\x23\x14\x32\x93\xf8\x42\x5d\
+\xb8\x7d\xcd\x08\xa2\x84\xea\xf5\xa3\x7a\xfd\xac\xbb\xf5\x5d\xd8\
+\x96\x45\x25\xbd\x48\x71\x61\x8e\x4a\x6b\x0a\x87\xe6\x64\xe6\x91\
+\xa7\xf1\x36\xcf\xa1\x05\x82\x34\xad\xdd\x8c\xe2\x72\x9f\x72\x30\
+\x7d\xe2\xeb\xff\x4e\x76\x7a\x82\xee\xdf\xbd\x12\xbf\xa7\x61\xfc\
+\x59\x28\xe6\xc8\x1c\x9b\x43\x0b\x78\x28\x16\x05\x4c\xd3\xa6\x94\
+\x48\x37\xa4\x7d\x4b\xfb\x7a\xe2\xd9\x23\xac\x0b\x34\xb1\xea\xb6\
+\xbb\x96\xac\x8e\x61\xfe\xc8\x01\x4a\xc5\x0c\xb1\xc1\x01\x6c\xcb\
+\x46\x92\xa4\xc6\x0d\x54\x4f\x93\x38\x3a\x4d\xa5\x5c\xa7\x6b\x45\
+\x1b\x81\xe6\x10\x4f\x7e\xe7\x19\xbd\x67\x63\xcb\xbf\xbe\xaa\x08\
+\x20\x88\x62\x7f\xa1\x98\x63\x70\x7b\xe7\x69\x83\x8f\x20\x50\x5c\
+\xc8\xe1\x6a\xea\xc3\x15\x0a\x5f\x58\x05\x27\x41\x94\x65\x34\x7f\
+\xb0\x61\x74\x19\x6b\xa1\x9c\x4e\x92\x3a\x36\xc4\xfc\xa1\xdd\x70\
+\x68\x37\xa1\xae\x7e\x54\xaf\x1f\x59\xf3\x50\x37\x73\xd8\x96\x81\
+\x20\x08\x58\x66\x9d\xcc\xc2\x51\x72\xa9\xe3\x78\xfc\xad\xb8\x7d\
+\xcd\xc8\x8a\x13\x01\x01\x41\x94\x70\x47\xe2\xb8\x23\x71\xaa\xb9\
+\x0c\x46\xb5\x82\x65\x9a\x94\x53\x0b\xa4\xc7\x46\x98\x7a\xfa\x51\
+\x9c\xc1\x30\xa6\x5e\xa7\x75\xd3\x15\x58\xa6\xc1\xce\xef\x7d\x95\
+\xd5\x57\x5e\x43\x6c\xf3\x3a\x1c\xb2\x42\xa9\x5c\x20\x9f\x48\x51\
+\xcd\x14\x08\xad\x1f\x24\x97\x31\xc0\xb6\x28\x4c\x25\x89\x6f\x6c\
+\x88\x85\xeb\xc5\x0a\xda\xd1\x04\x03\xb7\xdc\x45\xc7\x49\x81\x30\
+\xf6\xfd\xe4\x07\xb4\xb7\xfb\xf1\x34\x87\x29\xeb\x06\x0e\x87\x04\
+\x92\x13\xdb\xae\xb0\xf7\x17\xfb\xa9\xea\x26\x6d\xab\x3b\x98\x3e\
+\x32\x8d\xc7\x17\x3b\x72\xfb\x27\xbf\x36\xf7\xaa\x22\x40\x66\x66\
+\xfa\xbd\x46\xa5\x40\xac\x7b\xd3\x69\xca\x9f\x5a\xb9\xca\xcc\xe1\
+\x49\xa2\x97\xff\xea\xc5\xaa\xae\x01\x41\x40\x94\x65\x3c\xb1\x66\
+\x5c\x91\x18\x2d\xf5\x1a\x46\xa5\x8c\x59\xaf\x53\x4c\xcc\x51\x98\
+\x9a\xa1\x9a\x4b\xa3\xc6\xfc\xa0\x5a\x28\x6e\x17\xb2\xaa\x62\x9b\
+\x3a\xf9\xf4\x38\xf9\xf4\x38\x0e\xd5\x83\xd3\x1d\xc1\xe9\x89\xe2\
+\x50\x1b\xce\xa1\x9a\x3f\x08\xfe\x20\x9e\x78\xcb\x92\x63\x69\x89\
+\xdc\xf4\x18\x7a\xa5\xcc\xc2\xe1\x7d\x64\xc6\x46\x78\xf4\xdb\x5f\
+\xa1\x29\x1a\xa5\xe5\x8e\xcb\x10\x94\x1a\x00\xd9\x7c\x8a\xc2\x64\
+\x12\x77\x6b\x8c\x7c\xd6\x40\x10\xa0\x38\x9f\x21\xd4\xdf\x8a\xe4\
+\x68\x74\x75\xe9\xe0\x28\x03\x1d\x03\x6c\x7e\xf7\x07\x97\x25\xa1\
+\x66\xbd\xc6\xf1\xa7\x1f\x65\xf3\xe6\x00\x75\xdb\x46\x96\x44\x1c\
+\xb2\x04\xa2\x93\x42\x62\x9c\xfd\x4f\x1e\xa5\x6f\xb0\x99\xd6\xd5\
+\x1d\x3c\xf1\xe3\x9d\x44\x9a\xdb\x0f\x5e\xac\x2e\xbc\x28\x04\xb8\
+\xfb\x8f\xde\x1d\xca\xce\x4d\xaf\x54\x25\x8b\xae\x0d\xdd\xa7\x29\
+\x7f\x16\xc7\x17\xa8\x57\xaa\x74\x6d\xbf\xf9\xe2\x12\xe0\x24\x88\
+\xa2\x84\xa8\xb9\x70\x68\x2e\xb0\x6d\xdc\xd1\x26\x42\xbd\x83\x14\
+\x93\x73\xa4\x46\x86\xa0\x26\x32\x77\xf8\x30\x4a\xc8\x85\xec\x54\
+\x08\x75\x75\x21\x88\x22\x46\xbd\x44\xbe\x56\x24\x9f\x1a\x6b\x84\
+\x8f\xd3\xfc\xa8\xce\x00\x0e\xcd\x8b\x43\x71\x23\x4a\x0e\x14\xb7\
+\x87\xe8\xe0\x5a\xa0\x61\x19\xfc\xcc\x0f\xbe\x49\xb9\x5a\xe5\x8a\
+\x77\xbf\x83\x8c\x3a\x4d\x8b\xda\x41\xa5\x5a\xa2\x98\xce\x52\xcd\
+\x96\x90\x3d\x61\x04\x40\x2f\xd7\xa8\x17\xca\xb8\x9b\xdb\x1b\x72\
+\xa1\x7a\x05\x75\x34\x43\xe7\x5d\xbf\x72\x8a\xbd\x43\x6a\xfc\x18\
+\x1e\x4d\xc2\xd7\x16\xc2\x34\x2d\xfc\x5e\x67\xa3\x0b\xf5\x34\x93\
+\x07\x27\x09\x05\xdd\xc8\x4e\x05\x59\x55\x48\x27\x72\xf8\xbb\x5e\
+\xfa\xfd\xff\xa2\x12\x40\x73\xb9\x7f\x55\xd7\x0d\xa1\x6f\x5d\x1b\
+\xaa\x4b\x7d\x9e\xf4\x0f\xca\x99\x02\x92\x2b\x80\x3b\xde\x71\xc9\
+\x08\x70\x0a\x96\x32\x68\x2a\x6e\x0f\x21\x77\x1f\x81\xf6\x1e\xcc\
+\x5a\x95\x96\xf2\xe5\xe4\x66\x26\x28\x2c\xce\x32\xbf\x77\x08\x5b\
+\x32\x71\x05\x83\xb8\x42\x21\x14\x8f\x0b\xdb\x32\xa8\x96\x53\x54\
+\xcb\xa9\xa5\x6b\xa1\x8d\x20\x48\x88\x92\x63\xc9\x2c\x4c\xc4\x36\
+\x6c\x1e\xf8\xe2\xff\x66\xe5\xda\x35\x14\x7a\x2b\x78\x96\x62\x01\
+\x25\x17\xe6\x58\xd8\x77\x1c\x31\x10\x42\x90\x1d\x98\xba\x41\x6e\
+\x62\x8e\x40\x77\x73\x63\x30\x6d\x13\xe9\xe8\x3c\x1b\xb6\xdf\xc8\
+\x8a\xd7\xdd\x75\x4a\x73\x8f\x3e\xf2\x33\x7c\x7e\x09\x47\xc8\x07\
+\xb6\x8d\xc7\xad\x71\x42\x6b\x99\x4a\xe6\x29\x16\x2a\xc4\x02\x1e\
+\x4c\xdd\x20\x3b\x9b\xb6\xac\x3e\x1e\xb8\x58\x5d\xf5\x92\x09\xf0\
+\xed\x0f\xbe\x4d\x28\xa4\x17\x7f\xb3\x58\x2c\xb2\xe6\x86\xed\x60\
+\x98\xa7\x08\x59\x2c\xcb\x66\xf6\xd0\x24\x6a\xbc\x1f\x87\xa6\xbd\
+\x84\x9a\x2e\x14\x42\xc3\x66\xdf\xe5\xc6\xe1\x72\xe3\x0a\xc7\x68\
+\xb2\x2c\xea\xa5\x02\x0b\x43\x7b\x49\x4e\x0c\x91\x9d\x9c\xc6\xb4\
+\x0c\x02\xad\xad\x78\xe3\x71\x14\xb7\xeb\x24\x31\x70\x23\x5e\x10\
+\x4b\x16\x67\x4f\x7f\xf3\x6e\x3c\xaa\x42\xec\xf5\x6b\x29\x56\x53\
+\x84\x42\x7d\x14\x4b\x39\xa6\x9e\x3a\x84\x25\xc8\x48\x81\xc6\x61\
+\x30\x3b\x36\x87\xa7\x39\x82\xac\xa9\x0d\xa1\x51\x36\x8d\x32\x55\
+\xa5\xf7\x03\xb7\x3d\xcf\xed\xdc\x66\x62\xf7\x53\x74\xb5\x06\x11\
+\x34\x05\x49\x12\xd1\x54\x19\xbc\x6b\xc0\x2c\x93\x99\xbb\x17\xaf\
+\xd7\x89\x33\xe0\x21\x9b\xc8\x20\x2b\x9e\x42\xb5\x52\xbe\x68\xe9\
+\x68\x5e\x32\x01\x5c\x1e\xef\x9d\x93\x47\x8f\x6c\x09\xf8\x15\x5a\
+\x07\x5a\x4f\x93\xb0\x95\x52\x05\xca\xd9\x22\x5d\x97\x6f\x7b\xd1\
+\x72\x6c\xdb\xa6\x98\x98\x45\xf3\x07\x97\xf5\xec\x97\x02\x27\xac\
+\x7d\x34\x5f\x80\xf6\xad\xd7\xd0\xbc\xfe\x32\x6a\xf9\x1c\xa9\x89\
+\xa3\xcc\x0f\xef\x65\xf1\xd8\x28\xa6\xa1\xe3\x0a\x85\x89\xf6\xf7\
+\x22\x39\x14\x9c\xc1\x00\xb6\x69\xa2\x97\xca\x4c\x3e\xbb\x07\xdb\
+\x09\xa5\x60\x09\x45\xd2\x10\x45\x91\xa9\xa3\x23\x58\x86\x85\xd2\
+\xde\x89\x65\x41\x7e\x6a\x01\x87\x4b\x5d\xb6\xef\xd7\x34\x81\xd2\
+\x13\xe3\x6c\xbc\xe1\x2e\x5a\x36\x5e\x7e\x4a\x7b\xb2\xd3\x13\x94\
+\x12\xb3\x08\xed\x61\x24\x45\xc6\xe5\x52\x11\x04\x09\x94\x18\x76\
+\xe9\x08\x33\x23\xb3\xf8\x3d\x2a\x91\xf6\x08\xa3\x87\xa7\x69\xed\
+\x69\xfb\xf1\x3b\xfe\xf7\x0f\xf5\x8b\xd5\x1f\x2f\x99\x00\x7a\x21\
+\x7f\x63\x38\xde\xc4\xc0\x7a\x3f\xd2\x0b\xa8\x77\xeb\x95\x3a\xaa\
+\xd7\x45\x78\xf0\x2c\x59\x3f\x04\x70\x85\x22\x14\x17\xe6\xb1\x0c\
+\x1d\x6f\x73\x1b\x92\xa2\x5e\xd2\x88\x1d\x82\x28\x36\x7c\x05\xb5\
+\x86\x65\x6f\xb8\x6b\x05\x60\x93\x4f\x4c\x53\x48\xcd\x52\xcb\x64\
+\x99\xda\xfb\x30\x0e\x97\x1b\x7f\x73\x33\x53\xfb\x0f\x93\xcb\x15\
+\x58\xfd\x9b\xd7\x61\x5b\x16\x6e\x9f\x8f\xc5\xe4\x1c\x8b\x47\x26\
+\x71\x44\xa3\xcb\x3b\x5f\x79\x31\x4b\x74\x75\xf7\x52\xb0\x29\x11\
+\xe3\xf0\x18\x1d\xb1\x3e\x56\xdd\xf1\xf6\xd3\xbe\x67\xe6\xf0\x7e\
+\xbc\x7e\x17\xe1\xfe\x38\xb6\x65\xe3\x76\xa9\x80\x05\x95\x71\x92\
+\xc7\x0e\x20\xd5\x75\x2c\x87\x1b\x5f\xd4\xcf\xd8\x81\x1d\x74\x0e\
+\x74\xde\x73\x31\xfb\xe0\x25\x13\xc0\xe1\xf1\x86\xf2\xd3\x13\x28\
+\xaa\xfb\xb4\xd3\x3f\x82\xc0\xd8\xd3\x47\x90\xdc\x71\xc2\x7d\xab\
+\x5f\x7c\x30\x68\xa8\x7b\x7d\x2d\xed\x94\x92\xf3\x18\xd5\x0a\xf9\
+\x99\x49\x9c\xc1\x30\xaa\xcf\xff\xa2\x9e\x3c\x17\x03\x82\x20\xe0\
+\x59\x32\xef\xf6\x44\x9b\x31\xf5\x3a\xa2\x24\xd3\xb7\xed\x56\x16\
+\x8e\x1d\x60\x6e\x68\x37\xf3\xc3\xc7\x08\xae\x8e\xe2\xe9\x8e\x62\
+\x5b\x36\xf5\x5a\x95\xf1\x67\x0f\x52\xc8\xeb\xf8\x5a\x5c\x08\x80\
+\x51\xad\xe1\x6b\x8f\x21\x29\x0e\x6c\xdb\x46\x2a\x66\x91\xc7\x6c\
+\xba\x5e\x77\x23\x9a\xcf\x7f\x5a\xbd\x13\xbb\x9f\xc4\xe9\x04\x47\
+\xc0\x0b\x82\x80\xf3\x84\x0e\xa0\x3c\xca\xc8\x33\x47\xa9\x18\x16\
+\xad\xbd\x2d\x4c\x0d\xcf\x62\x56\xaa\x96\x33\xe0\x79\xfc\x62\x7e\
+\xf7\x4b\x52\x06\x7d\xef\x83\x6f\x13\xcd\x6a\x79\x63\x72\x6e\x96\
+\x50\x7b\xf0\xb4\xd3\x7f\x29\x5b\x24\x39\x9e\xa0\xe3\x8a\xd7\x22\
+\xc9\xe7\x36\x80\x82\x28\xe2\x8e\x35\xd2\xc4\x04\xbb\xfa\xa8\x15\
+\x72\x94\x92\x09\x4a\xc9\x04\x96\x69\x9c\x53\x19\x17\x03\x92\x43\
+\x69\x84\x8b\x0f\xc5\xe8\xd8\x7c\x1d\xf9\x6c\x9d\x8a\x5e\xa1\xf9\
+\xb6\x35\x60\x37\x42\xbb\xe7\xd2\x69\xe6\x46\xd3\xa8\x4d\x4d\xcb\
+\x33\xbb\xbc\x98\x6d\xe8\xf9\x01\xc5\xe5\xc0\x73\xac\x46\xd7\xda\
+\x8d\x0c\xde\xf2\xc6\xd3\xea\xb0\x2d\x8b\xca\xf4\x18\xde\x80\x03\
+\x64\x09\x4d\x75\x20\x89\x8d\x72\x2c\x60\xf8\xc9\x23\xd4\xeb\x06\
+\xf1\xee\x18\xa9\x44\x96\x48\x73\x74\xf2\x8e\x3f\xff\xde\x79\x85\
+\x80\x39\x1b\x5e\x12\x01\x64\x55\x5d\x5d\x4c\x2d\x0e\x86\x82\x12\
+\xb1\xae\xd3\xc3\xa3\x2d\x8e\xce\xe1\xf2\x68\x44\xd7\x5e\x73\x5e\
+\xe5\x0a\x4b\xa7\x78\x41\x14\x71\x86\x22\xc8\xaa\x46\xb5\x90\x65\
+\x7e\xff\x2e\x16\x47\x0e\x37\x34\x84\x17\x21\x5c\xec\xb9\xa2\x9a\
+\xcf\xb0\xe7\xfe\x7b\x50\x56\x06\xf0\xb6\x45\xc0\xb6\x31\x0c\x8b\
+\xa3\x8f\x8e\x20\xfb\x7c\x68\xc1\xe7\xa2\x82\xda\x86\x85\x16\xf0\
+\x62\x63\xe3\x9b\x13\xf0\xda\x3e\xd6\xbe\xe9\x5d\x2f\xa8\xfe\x2e\
+\x2e\xcc\xb2\x30\x33\x85\x3b\xd2\x30\x9b\x77\xba\x96\x9e\xb1\x61\
+\xea\xf0\x24\x73\x73\x19\x3a\x07\x9a\x09\xb6\x86\x99\x3e\x32\x43\
+\x28\x16\xb8\xa8\xc9\xa8\xe1\x25\x12\x40\xf3\x78\x6f\xad\x94\x8b\
+\x74\xae\x6d\x41\x12\x04\x40\x5a\x56\xa2\xd4\x6b\x3a\x47\x1f\x3b\
+\x44\x78\x70\x15\xee\xa6\xae\x0b\xae\x43\xf5\xf8\xd0\x02\x21\x42\
+\xdd\xfd\x04\x3a\x7a\xb0\x4d\x93\xfc\xec\x14\xd3\xcf\x3c\x4e\x31\
+\x31\x4b\x35\x97\xbd\xe4\x64\x78\xe6\xee\xaf\x23\xf9\xa1\xe9\x8a\
+\x7e\x82\xbe\x28\xad\xcd\xdd\xcc\x8e\x64\xa9\x15\x6b\x78\x5b\x1a\
+\xa6\xed\x96\x61\x52\x4e\x66\x70\x37\x85\x1b\x91\x46\x0b\x35\xf4\
+\x9d\x47\xe8\xba\xf2\x46\xbc\xf1\x96\x17\x2c\x77\x6a\xcf\xd3\x44\
+\x42\x9e\x25\x1f\x01\x1b\xb7\x73\x49\x36\x20\x0a\xec\x7f\xf4\x30\
+\xf1\x88\x97\xe8\x8a\x76\xea\xe5\x3a\x0b\x13\x0b\x04\x5a\xa3\x17\
+\xed\xfe\x7f\x02\x17\xbc\xb1\xde\xfd\xfb\xbf\xa6\xe4\xe6\x67\xdf\
+\x67\x63\xb3\xfe\xc6\xf5\xa0\xb5\x83\xab\x1b\x52\x0f\x03\x02\xc7\
+\x77\x0e\xa3\xd7\x74\x9a\x37\x5d\x77\xc1\xe1\x5b\x4f\xe0\xc4\x95\
+\xcc\x15\x8e\xe2\x0a\x45\xa8\x15\xf3\x38\xdc\x1e\xea\x85\x3c\xd5\
+\x5c\x86\xcc\xf8\x30\x92\xaa\x35\xcc\xc1\xce\x12\x31\xe4\x7c\x51\
+\x48\xcc\xf1\xcb\xef\xfd\x37\xde\xcd\x61\xbc\xed\x11\xdc\x4e\x0f\
+\xba\x6e\xb1\x70\x68\x0c\x6f\x6b\x14\x49\x71\x34\x9c\x75\x2b\x55\
+\x1c\x6e\x27\xb2\xa6\xa0\x97\xab\x94\x1f\xd8\xcd\xe6\x9b\xef\xa2\
+\xef\xc6\xd7\x9f\xb1\xec\xa1\xc7\x7f\x89\xcb\x6d\x21\x7b\x9c\x48\
+\x92\x88\xa2\xc8\x14\x4a\x55\x3c\x7e\x37\x73\x63\xf3\xe4\xcb\x75\
+\x36\xb6\x47\x39\xfa\xec\x31\xba\x06\x9b\xb1\x10\x2e\xfa\x0a\x70\
+\xc1\x04\x90\x24\xf9\xcd\x89\xb9\x63\x5d\xbd\x3d\x2e\x22\xad\xa1\
+\x86\xdf\xbf\xd1\x48\xb9\x66\x03\xa9\xf1\x79\x54\x97\x03\xff\xc0\
+\xd5\x17\xb7\xc5\x82\xb0\xac\xc4\xb1\x23\x71\x8c\x4a\x99\xe4\xf0\
+\x41\x6a\xf9\x1c\xe3\xe3\x0f\xe1\x6f\xeb\x42\xf5\xf8\xf0\x34\xb5\
+\x9e\x93\xda\xf9\xc5\x60\xdb\x36\x3f\xf8\x87\xbf\xa0\x24\x97\xd8\
+\x78\xeb\xcd\x94\xf3\x06\xfb\x67\x87\xa9\x16\x2b\x88\xb2\x84\x2b\
+\x1a\x00\xc0\xb2\x4c\xf4\x72\x0d\x4f\xbc\xe1\xfb\x37\xf2\x93\xa7\
+\x78\xed\xe0\x15\xac\x7d\xf3\x6f\x9c\xd1\xf0\xd5\xb6\x2c\xec\x5c\
+\x8a\x48\x97\x17\x87\xa6\xa0\x69\x0a\xba\x6e\x30\x9f\xc8\x12\xa9\
+\xe9\x4c\x8c\x2d\xd0\xd6\x19\x41\x73\x6b\xa4\x66\xd3\x74\xaf\xea\
+\x1e\x2b\x67\x0b\x23\x17\xb7\x33\x2f\x90\x00\xdf\x7a\xef\xaf\x28\
+\x85\x74\xfa\x13\x5e\x47\x99\x35\xb7\x5e\xd3\x90\xfc\x09\x0e\xa8\
+\x1e\x07\x41\xa4\x92\x2b\x91\x9e\x49\xb3\xf2\xa6\x6b\x90\xdd\x2f\
+\x1e\x3a\xd5\xac\xd7\x98\x1d\x79\x12\xc5\x11\xc0\x13\x6c\xc8\xf4\
+\xcf\x75\x06\x0b\x82\x80\xc3\xe5\xa6\x79\xfd\x65\xd8\xa6\x49\x39\
+\x9d\x44\x94\x1d\x64\x27\x8e\x31\x7f\xe0\x59\x10\x25\x42\x5d\x7d\
+\x04\x3a\x7a\x51\xdc\x9e\xf3\x8e\x2a\x7e\xfc\x89\x5f\x32\x72\xe8\
+\x09\xd6\xbc\x6d\x3b\xd5\xba\x48\x3e\xdd\xd0\x2e\xe6\xa6\x17\xf0\
+\xb6\x44\x9f\x3b\xf8\x25\xb3\x78\x9a\xc3\x60\x43\x39\x95\xa3\xb9\
+\x2a\xd1\xb1\xf5\x4a\x54\xaf\xef\x8c\x65\xa7\x8e\x1f\xa1\x38\x7b\
+\x14\x6d\x73\x43\xc4\xec\xd4\x1c\x54\xaa\x3a\xa2\x28\x92\x1c\x9d\
+\xc3\x1f\x70\x13\x88\x05\x90\x55\x99\xc9\xa1\x69\x36\xbf\x66\xf3\
+\xe3\x37\xbf\xf5\x0b\x17\x35\x23\x39\x5c\x20\x01\x04\x9b\xd7\x16\
+\x53\x73\x03\x2d\xed\x01\x5a\x06\x5a\x1b\x59\x37\x32\x4f\x2c\x87\
+\x2d\xcb\x2f\xe4\x50\x34\x07\xde\xee\x6d\x9c\x2d\x3d\xb1\xa4\xa8\
+\x68\xfe\x00\x0b\xa3\x87\x98\xd9\xff\x14\x81\x68\x37\xc1\xae\x3e\
+\x5c\xe1\xe8\x39\x47\xee\x3c\xe1\xba\xed\x89\x35\x3c\x6c\x1c\x4e\
+\x17\x9e\xa6\x36\x6c\xcb\x60\x6e\xdf\xb3\xcc\xec\x7e\x92\x40\x5b\
+\x17\x08\x22\xf1\xd5\x1b\x90\x54\x0d\xd5\xe3\x7b\x51\x42\xe8\xd5\
+\x0a\xf7\x7e\xf6\x6f\x08\xad\x6c\x41\x8c\xc4\xc9\xa7\xeb\xcb\x91\
+\xc2\x4d\xc3\x40\x0b\x34\x2c\x8f\x6d\xcb\x46\x0b\xfa\x4e\x18\x0f\
+\x93\xdd\x7d\x9c\x2b\xb7\x5e\x4d\xcf\x35\xb7\xbc\x68\x9b\x77\x3f\
+\x70\x2f\xaa\x4b\xc0\xdb\x11\xc7\xb2\x1b\xf7\xff\x54\xba\x88\xe2\
+\x90\x99\x18\x5f\x40\xd7\x4d\x82\xad\x21\x0e\x3e\x71\x94\xb5\x9b\
+\xba\xa8\xd7\xed\x1f\x5d\xec\xc1\xbf\x60\x02\xb8\x83\x91\x9b\x67\
+\x8e\x1d\xa4\x75\xe5\x00\x18\x27\xec\xfe\x1b\xff\xdb\xa2\xc0\xf1\
+\xa7\x8f\x10\xed\x8c\x12\x5e\x75\xdd\x39\x95\x17\x88\xf5\x53\xab\
+\xa4\xa0\xa5\x19\x49\x72\x53\x4a\xce\x31\xbb\xf7\x29\x04\x04\x82\
+\xdd\x03\x78\xe2\xcd\x78\x62\x2d\xe7\x4c\x86\x93\xbd\x76\x7c\x2d\
+\x9d\xd4\xf2\x59\x4a\x8b\x09\x32\x13\xc7\x98\xdd\xfb\x34\x92\xaa\
+\x61\xe9\x06\x8a\xdb\x4d\xb0\xb3\x0f\xc5\xe3\x3b\x6d\x85\xd8\xfb\
+\xed\x2f\xa1\x39\x45\x8c\x35\x7d\x54\xcb\xc6\x72\xdd\xd5\x6c\x01\
+\xcd\xd7\x78\xd6\x36\x2d\x8c\x5a\x1d\x79\xe9\xf0\x96\x1b\x9f\xa3\
+\xbd\x26\xb1\xfe\xae\x77\xbf\xe8\xec\xb7\x2d\x93\x89\x27\x1e\x64\
+\xcb\xb6\x1e\x6c\x01\x14\x87\x8c\xec\x90\xa9\x54\xeb\x78\x7d\x2e\
+\x66\x86\xa6\xd1\x54\x19\x57\xd0\xc3\xd8\x33\xa3\x74\xf6\x35\xcf\
+\x26\xc6\x12\xf7\xbd\x6a\x08\x50\x2a\x14\x56\xb4\xc4\x9c\x34\xf5\
+\xc4\x1b\x21\x5f\xcc\x52\x83\x00\x40\x35\x57\xa6\xb8\x98\x27\xba\
+\xe2\x7a\x64\x57\xe4\x9c\xca\x73\x28\x6e\xdc\xbe\x16\x8a\xb9\x59\
+\x0c\xa3\x88\x1a\x0b\x30\xb8\xee\x4d\x2c\x0e\x1f\xc2\x32\x4c\x92\
+\x47\x0e\x32\xfd\xcc\xe3\x38\x03\x61\x9c\xa1\x08\x91\xfe\x55\x67\
+\xb4\x2a\x7e\x21\x42\x68\xfe\x20\x9a\x3f\x48\xa0\xb3\x17\xbd\x54\
+\x44\x2f\x97\xc8\xcf\x4f\x53\xcb\x65\x98\xdb\xff\x2c\xa5\xd4\x02\
+\xee\x48\x8c\x40\x47\x2f\x9e\x58\x33\x7a\xb9\xc0\xe3\xdf\xfa\x2f\
+\x32\xad\x6e\x3a\x82\xbe\xe5\x9b\x8d\x5e\xa9\xa1\x17\x2b\xcb\x27\
+\x7d\x53\x37\x10\x65\xb9\xe1\x7c\x5a\xaa\x50\xd8\x39\xc4\x0d\xb7\
+\xbf\x67\xd9\xc4\xeb\x4c\x28\x26\xe6\xc8\xcd\x8c\x20\xf9\x1a\xf6\
+\x00\x1e\xb7\x86\x5e\x37\x30\x0c\x0b\xab\xa6\x33\x36\x3c\x43\xb8\
+\x3d\x82\x3f\x16\x64\xec\xc0\x04\xfd\xeb\xd6\xbe\xf1\xb6\xff\xf1\
+\xe5\x97\x64\xfe\x7d\xd1\x08\x70\xcf\x1f\xbc\x45\xb5\xf5\xea\xe6\
+\x4a\xdd\x20\xdc\xd3\x0e\x81\xad\x50\x38\xd0\x88\xfd\x07\x24\x8f\
+\xcf\x53\x48\xe5\x88\x6d\x7e\xfd\x79\x95\xeb\x8f\x0e\x34\x12\x33\
+\xe8\x15\x6a\xd5\x2c\xa9\xf9\x83\x44\x07\xd7\x62\x54\xab\xd4\x8a\
+\x79\x72\x53\xe3\xb8\xc2\x51\x92\x47\x0e\x90\x9d\x3c\x4e\x74\x60\
+\x0d\x5a\x20\x84\xa4\x28\xa7\xb8\x98\xbf\x18\x24\xd9\x81\xb4\x44\
+\x06\x4f\x53\x2b\xb6\x65\x61\xd6\x6b\x18\xb5\x2a\x89\x83\xbb\xc9\
+\x4d\x1d\x27\x7d\xfc\x28\x43\xbf\xbc\x9f\xb1\x7c\x96\x8e\x1b\x57\
+\x2c\xe7\x14\x96\x64\x81\xc5\x89\x39\x7c\x6d\xb1\x86\x67\xef\x89\
+\xdf\x95\x46\x17\xe6\x0e\x8f\x72\xcd\xd5\xb7\xb1\xfa\xce\xb7\x9f\
+\xf5\xac\x31\xf6\xd4\xc3\xf4\xf6\x45\x90\x02\x1e\x6c\xdb\xc6\xeb\
+\xd1\x28\x97\xeb\x88\xa2\x40\x72\x74\x0e\xd9\x21\xa3\x78\x9c\x28\
+\x2e\x05\x9f\x4b\xb3\x8a\x59\xe3\xa2\x1f\xfe\x2e\x98\x00\x92\xe2\
+\xdc\x50\x4c\xcf\x04\x42\x1d\x31\xd4\x40\x07\x20\x82\xde\x88\x4d\
+\x64\x03\x93\xfb\x8f\x13\xea\x59\x8d\xbb\x7d\xc3\x79\x95\x2b\x8a\
+\x12\x91\xd6\x0d\x2c\x4c\x3e\x8b\x65\xe9\xe8\xb5\x3c\x73\xe3\x4f\
+\xe0\x09\xb4\xe3\x8b\x77\xe1\x6d\x6a\x38\x92\xba\xc2\x31\xaa\xb9\
+\x0c\xc5\xf9\x19\x32\xe3\x23\x54\x0b\x79\x42\x5d\xbd\x4b\xe1\x5d\
+\x9a\x1b\x5e\x41\xe7\x7a\x6e\x58\x8a\xec\xe5\x70\xba\x68\xbf\xfc\
+\x5a\xea\xc5\x02\xe9\xe3\x47\x59\x98\x99\x41\x6b\xf5\xe2\xef\x6a\
+\x5e\x1a\x64\x11\x8f\xaa\x53\xf2\xa9\x28\x9e\xc6\xd6\x52\x4a\xa4\
+\x71\x2f\x85\x70\x2f\x2f\xa4\xd1\x16\x4a\x6c\x7c\xdf\x3b\x51\xdc\
+\x67\x4f\x15\x33\xf3\xcc\x83\x38\xa3\x7e\x34\x9f\x0b\x55\x91\x71\
+\xc8\x12\x95\x5a\x1d\xcd\xa9\x70\x64\xdf\x18\x51\x9f\x46\xbc\x27\
+\x4e\x66\x3e\x4b\xb8\xa3\x67\xf8\xce\x4f\x7e\xf5\xbc\xc3\xbf\x5d\
+\x32\x02\x54\x2b\xf5\x77\x2d\x2e\x24\x85\xbe\x2d\xeb\x11\x1c\x71\
+\xb0\xaa\x8d\x7f\x82\x88\x51\x37\xd0\x8b\x15\x22\x5b\xef\x3c\xe7\
+\x00\x0f\xa7\x34\xc6\xe1\x6c\x64\xf2\x2a\x9f\x48\x79\x6f\x53\xc8\
+\x4c\x50\xce\xcf\xe1\x0d\x75\xe1\xf1\xb7\x2e\x1b\x88\xfa\xdb\xbb\
+\xa8\x17\x0b\xd4\xf2\x59\x0a\x73\xd3\xe4\x67\xa7\x48\x1e\x6d\x18\
+\xca\x84\xba\x07\x70\x45\xe2\xb8\xc3\xd1\x73\xae\x5b\x92\x1d\x38\
+\x03\x21\xe6\xc7\x46\x11\xb0\x59\x73\xdd\x06\x72\xc9\x45\x6a\xe3\
+\x0b\x34\x4b\x0e\x8c\xa6\x10\xce\xb6\x26\x6c\xbb\xe1\xec\xa9\xfa\
+\x3d\xcb\xce\x1d\xf9\x83\x47\xb9\x66\xcb\xad\x04\xda\xbb\xcf\x5a\
+\x4f\x7a\xfc\x18\x53\x43\xbb\xd8\x70\xeb\xfa\xc6\xec\xf7\x36\xae\
+\xaa\xb5\x9a\x8e\xdb\xad\x32\x79\x68\x12\x45\x16\x09\x34\x87\xd8\
+\xff\xf8\x10\xc1\x60\xe8\x82\x5d\xbf\xcf\xa9\xcf\xcf\xe7\xe1\x6f\
+\xfc\xf6\xed\x4a\x31\x9b\xbd\xb9\x5e\x2e\xb3\xfa\x86\xcd\x8d\xfd\
+\xbf\x36\xc7\x89\x93\xfe\xfc\xd1\x69\x92\xf3\x45\xd6\xac\xbf\xe2\
+\x82\x1b\xe4\xf2\x35\x51\x29\xa7\x96\xef\x0e\x82\x20\x60\x59\x3a\
+\xd9\xe4\x30\xf5\x6a\x96\x60\x7c\x55\xc3\xfa\x47\x6c\xa8\x74\x35\
+\x5f\x00\x6f\x73\x1b\xd5\x5c\x16\xa3\x5a\xa1\xb4\x38\x4f\x76\xf2\
+\x38\x89\x43\xbb\x09\x75\x0f\x2c\x87\x74\x71\x06\xcf\x6e\x8b\x58\
+\xce\xa4\x78\xfa\xde\xbb\xe9\xe8\xe8\x20\x7d\x68\x1e\x9f\x55\x67\
+\xcb\x2d\x37\xb0\xef\xc7\x3f\x63\x6a\x22\x81\x22\xad\xc2\xd3\x14\
+\xc6\xac\xeb\xb8\x03\x8d\x8c\xe3\xf5\xe4\x02\xb1\xba\x87\x75\xb7\
+\xbf\xf5\x9c\xae\x99\x47\x1f\xbe\x1f\x49\xb2\x50\x43\x8d\x1b\x8e\
+\xc7\xa3\x61\x5a\x36\xf5\xba\x89\x95\xcf\x90\xcc\x94\xe8\x5a\xd5\
+\x46\xa0\x39\x48\x7a\x36\x6d\x47\xd6\xb5\xbc\x7a\x08\x20\x69\xde\
+\xdf\xce\x27\x46\x7a\xd7\x5f\xd6\x87\x33\xdc\xde\xf8\xb1\x9e\x6e\
+\x9c\xfe\x05\x81\xb1\x9d\x47\x69\x5e\xb1\x16\x5f\xcb\x85\x5b\xfe\
+\xb8\xbc\x71\x44\x49\x21\x35\xbb\xff\x94\xb8\x3f\x0d\x5b\xff\x05\
+\xf4\x5a\x91\x58\xfb\x96\x53\x52\xb2\x9d\x88\xf5\x03\x8d\x7c\x02\
+\x7a\x5f\x09\xa3\x52\x26\x3d\x36\x42\x66\x6c\x84\xc5\xd1\x23\x44\
+\xfa\x56\xe1\x8a\xc4\xf0\xb5\x34\xc2\xca\x0a\x2f\x10\xdc\xf9\xc8\
+\x23\x3f\x63\xee\xf8\x08\xb5\x85\x29\xb6\xdc\x7c\x39\xab\x6f\xbb\
+\x09\xc9\x21\x21\xcb\x0e\x0e\x7e\xee\x8b\x78\x17\x73\x78\x9a\xc2\
+\x88\x96\x8e\xb0\x98\xc5\xeb\xf5\x33\xf5\xf0\x08\x6f\xfc\xfd\x7f\
+\x3c\xa7\xd9\x6f\x99\x26\x47\x1e\xf8\x0e\x91\xe6\x20\x8a\x53\xc5\
+\xed\x52\x91\x04\x81\x72\xad\xb1\xff\xcf\x1f\x99\x26\xea\xd3\x50\
+\x5c\x1a\x46\xcd\xc0\xe7\x8e\x4e\xbd\xe9\x1f\x7f\x78\x49\x4e\xff\
+\x17\x44\x00\x6c\xee\x70\x08\x06\xbd\x57\xac\x00\x71\x29\xb1\x93\
+\x91\x01\x40\xaf\xd6\x99\x3e\x32\xc5\x9a\x37\xbf\x01\xd5\xeb\x3f\
+\xaf\x62\x9f\x0f\xcd\x15\x24\xd6\xb1\x95\xc5\xe9\x3d\x98\x66\x6d\
+\xf9\x77\x41\x10\xd0\xeb\x65\xca\x85\x04\x9e\xc0\x0b\x07\x97\x10\
+\x04\x01\xc5\xb5\x14\xeb\x27\x14\x45\xaf\x56\xf0\x77\xf4\x50\x98\
+\x9b\x22\x3f\x33\x41\xea\xd8\x10\xaa\xc7\x8f\x16\x0c\x11\x5f\xb5\
+\x01\x59\xd5\x10\x44\x11\xcb\x34\x79\xfa\x7b\x5f\xa5\x29\xe0\xe5\
+\xfa\xdf\xfa\x0d\x5a\xd7\x2f\x45\x24\xb1\x6d\x0c\x43\x67\x43\x7f\
+\x0f\x47\x46\x67\x58\x18\x9f\x27\x22\x09\xa8\xaa\xc5\xf8\xf8\x22\
+\x7d\xab\xae\xa4\x79\xfd\xd6\x73\xfa\xae\xe2\xdc\x24\xb5\xc5\x09\
+\xdc\xeb\x36\xe1\x70\x2a\xf8\x7c\x4b\xcb\x7f\xdd\xc0\xe5\x75\xb2\
+\x70\x64\x0a\xdc\x4e\x02\xf1\x00\xc7\xf7\x8d\xd1\xdc\xd2\x7a\xc9\
+\x0e\x7f\x27\x70\x5e\x04\x90\x05\x61\x85\x6a\xd5\xf1\x37\x05\x41\
+\x09\x37\xae\x7f\x66\x63\xff\x3f\xf6\xd4\x11\x42\xf1\x10\x2d\x5b\
+\x6e\x7c\xd1\x32\x6c\xdb\xa6\x5e\x2a\x60\x5b\x16\x0e\xcd\x89\xe8\
+\x50\x5e\xf0\x7e\xef\x50\x5c\xc4\x3a\xb6\x90\x9c\xde\x8b\x5e\x2f\
+\x9e\x12\x10\x32\x93\x3c\x8a\x69\xd4\xf0\x85\xbb\x5f\x5c\xcf\xb0\
+\x24\x13\x08\xf7\xae\x20\xd8\xdd\x8f\x51\x29\x93\x9b\x99\x24\x37\
+\x3d\x4e\x29\x39\xcf\xbe\x6f\x7d\x09\xcb\x34\x09\xf5\x0c\x10\xec\
+\xea\x23\x18\x6b\xa2\x58\xaf\xe0\x0e\xbb\x4f\x29\x23\xdc\xd5\x8e\
+\xcb\xe7\xe5\xb2\x78\x8c\x15\xd7\x6c\xc1\xa1\xa6\xd8\x7b\xef\x13\
+\xe4\x0f\x26\xe9\xbe\xf2\xc6\x73\x4e\x46\x35\xfa\xc8\x8f\x70\x85\
+\xfc\x04\x3b\x22\xc8\x92\xb8\xac\xfb\xd7\xeb\x06\x92\x6d\x33\x31\
+\xb6\x80\xa0\x2a\x04\x5b\xc3\x1c\xdc\x31\x4c\x6b\x53\xcb\x81\x57\
+\x0d\x01\x7e\xfc\xd1\xdf\x0e\xa5\x27\x27\xe2\x2e\x0d\xbc\xcd\xed\
+\x8d\x78\x35\xf5\x34\x20\x50\x29\x55\x99\x3b\x38\x4e\x68\x60\x33\
+\x91\xfe\x55\x2f\x5a\xce\x09\xf7\xee\x5a\x3e\x43\x71\x61\x9e\x6a\
+\x2e\x8d\xc3\xed\xc5\x19\x0c\xa1\x38\xdd\x48\x27\x27\x72\x90\x55\
+\x62\x1d\x9b\x49\xcd\x1e\xa0\x5a\x4e\x3f\x47\x02\x04\xf2\xe9\x71\
+\x2a\xa5\x14\xa1\xa5\x14\xb0\x67\x83\x28\x4a\x28\x6e\x2f\x91\xfe\
+\x55\xf8\xdb\x3a\x29\xa7\x92\x38\x83\x61\x92\x43\xfb\x31\xaa\x15\
+\xc6\x1f\x7b\x90\xc5\xf1\x63\xf8\x34\x05\xbd\x9a\x03\x02\xcb\xef\
+\x3a\x03\x7e\xae\x79\xdf\xbb\xb1\xf4\x0a\x85\xd9\x3d\x58\x86\x49\
+\x62\xbe\x80\xdf\xeb\xa5\x6d\xcb\x95\x67\xad\x1b\x00\xdb\x66\x6a\
+\xd7\x43\x28\x7e\x17\xbe\x58\x00\xdf\x09\xcb\x5f\xa0\x5e\x37\x28\
+\xcf\x67\xc8\x94\xeb\x34\x07\x3d\x84\xda\x22\xd4\x72\x07\x31\xe2\
+\xfa\x39\x67\xff\xba\xe4\x04\xa8\x17\xf2\xaf\x31\xeb\x15\xa5\x77\
+\x73\x2f\xb2\x7b\x49\xbd\x59\x4f\x62\x0b\x02\xb3\x07\xc6\xd1\x75\
+\x83\x8e\xab\xdf\x70\x4e\x65\x35\x84\x33\x21\x54\x5f\x10\x5f\x4b\
+\x1b\xb5\x62\x81\xd2\xc2\x1c\xd9\x52\x01\x59\x73\xe1\x6b\xed\x40\
+\x94\x1a\x41\x18\x45\x51\x26\xd2\xba\x81\x5c\x72\x84\x42\x76\x72\
+\x79\xc6\x37\x02\x42\x16\x49\x4c\x3e\x83\xc7\xdf\x8a\x3f\xd2\x7b\
+\x4e\xa9\x5a\x4f\xde\x22\xfc\xad\x9d\xc4\x57\x6f\xa4\x92\x4e\x52\
+\x4e\xa7\xa8\x7c\xf7\x6b\x44\x43\x41\xdc\xa1\xd3\xb7\x30\xcb\x34\
+\x29\x25\x0e\x62\x5b\x06\xb2\x16\x22\x39\x5f\xa5\x29\xdc\xd4\x98\
+\x0c\xe7\x80\xf4\xb1\xbd\x24\x86\x0f\xd1\xb2\x79\x00\x51\x12\xf1\
+\x7a\x1a\x06\xb2\x36\x60\x5a\x16\xd3\x07\x27\xf0\x7a\x35\x5a\x56\
+\xb6\x93\x5f\xcc\x83\xe9\x4c\xd6\xf5\xca\x43\x97\x74\xf4\x39\x0f\
+\x02\xc8\x9a\x76\x79\xb5\x56\xc4\xd9\xd4\x03\x72\x04\x6c\x03\x8c\
+\x2c\x7a\x4d\x67\xe4\x89\xc3\x04\xda\x7b\x89\xad\xbf\xee\xbc\x2a\
+\x6f\x5c\xa3\xa4\x25\x2f\x1e\x27\x7a\xa9\x88\x65\xe8\x8d\xfb\x7d\
+\x36\xdd\x08\x21\x2f\x88\x44\xfa\x57\x12\x88\x0d\x20\xab\x6e\xb2\
+\x0b\x47\x4f\x2b\xa3\x94\x9b\xa1\x5c\x48\xe0\x0b\x77\xe3\x09\xb4\
+\x9d\xb3\xfa\x59\x10\x45\x54\x8f\x0f\xd5\xe3\x43\x52\x9d\x28\x02\
+\xa4\xd3\x49\x2c\xd3\x6c\xa8\x77\x9d\x1a\xb6\xa9\x23\x48\x0a\xd5\
+\xec\x71\x4c\xbd\x82\xc3\xe9\x63\xe8\xc9\x29\x2a\x85\x1a\x7d\xb7\
+\x5c\x75\xce\x0a\xa6\xdd\xf7\x7c\x0d\x87\x53\x23\xd2\x1d\x47\x59\
+\xba\xfb\x03\x98\xa6\x85\x43\x71\x30\x71\x68\x82\x9a\x6e\x11\x68\
+\x09\xb1\xf7\xd1\x43\x74\xaf\x5c\xf9\xc3\xd7\x7d\xea\x3f\x6a\xe7\
+\x54\xf8\x4b\xc0\x39\x11\xe0\x9b\xbf\xfb\xa6\x60\x2e\x93\xfb\x6d\
+\x97\x0a\x03\xdb\x2f\x03\xc9\xd5\xb8\xfe\xd9\x36\x7a\x55\xa7\x66\
+\x38\xb1\x3c\x2b\x5f\x30\xa0\x83\x5e\xad\x20\x4a\xf2\x8b\xe6\xd8\
+\x11\x04\x01\x59\x51\x97\x65\x07\xae\x48\x9c\x72\x6a\x01\x51\x92\
+\xc9\xcf\x4d\x31\xf9\xe4\xc3\x40\x23\x15\x9c\xc3\x11\xc4\x90\x8a\
+\xd8\x96\xbe\x14\x85\x43\x58\xca\xd9\x6b\x92\x4d\x8e\x50\xcc\x4e\
+\xe1\x3d\xe1\xff\x77\x1e\x76\x08\x95\x4c\x8a\x64\x2e\x4f\xd0\xa5\
+\xb0\xef\xde\x5f\xd0\xb2\xa2\x1b\x87\x66\xe1\x90\x33\xb8\xc2\x11\
+\x6c\xbd\x82\x24\xab\x8c\x1f\xce\x73\xf0\xe7\x3b\xb9\xe5\xad\xef\
+\x62\xfd\x5b\x7e\xf3\x1c\x35\x97\x36\xa5\xa9\xfd\x14\xcb\x75\x9c\
+\x5e\xd7\x92\xe1\x67\x03\x86\x61\x52\x9a\x4b\x93\x59\x2c\x60\x03\
+\x9e\x90\x17\xc1\x00\xd3\x30\x4a\x97\x7a\xf0\xe1\x1c\x09\x20\x4a\
+\xf2\xeb\x72\x0b\x0b\x9e\xb6\x76\x1f\x4a\x68\xc9\xf5\xbb\x3a\xd5\
+\xe8\x7c\xcb\xc4\x15\xe9\x38\x63\xc2\x07\x49\x76\x60\xea\x35\xea\
+\xc5\x3c\x96\xa1\x63\xea\x75\xbc\xcd\xed\x67\x0d\xda\xe4\x8e\x34\
+\xd4\xc8\xaa\xd7\x4f\xad\x98\x47\x2f\x97\x28\xa7\x12\x88\xa6\x83\
+\xd4\x81\x51\x2c\xcd\x40\x54\x65\xfc\xcd\x4d\xc8\x9a\x86\x6d\x59\
+\x8d\xc8\xa0\x46\x8d\x4c\xe2\x08\xf9\xf4\x38\xbe\x60\x27\x6e\x5f\
+\xcb\x39\xcd\xd2\xb9\xb1\x63\x88\x92\x84\x29\xfb\x98\x4f\x6a\x4c\
+\x4f\x1d\xc1\xe7\xae\xd1\xd2\x15\x24\xd6\x27\x63\xea\x75\x46\x0f\
+\x4d\x32\xbb\xe7\x38\x77\xfe\xc5\xff\xa4\x69\xed\xe6\x73\xb6\x37\
+\x28\xce\x0c\x51\x9c\x9f\x21\xd0\x16\xc6\x15\xf4\xe0\x3a\x89\x00\
+\xa6\x65\xb3\x30\x34\x85\x2e\x08\x74\xf4\x36\xe1\x6b\x0a\x62\x56\
+\x4d\x6c\xc9\x7e\xea\x55\x43\x00\x87\xaa\xce\x79\x55\x85\xce\x81\
+\x0e\x90\xc3\xa0\x67\x1b\xe2\x5f\x41\x64\x6a\xff\x38\xb2\x3b\x4e\
+\xeb\xf3\xec\xdd\x4f\x40\x94\x65\x44\x59\x46\x56\x9d\x18\xd5\x0a\
+\x99\x89\x51\x16\x47\x0e\x23\xca\x0e\x62\x2b\xd7\xa3\xf9\x02\xa7\
+\x24\x7c\x7c\xa1\xf7\x4f\x48\xff\xbc\xcd\x6d\x98\xb5\x2a\x81\x8e\
+\x1e\x0a\xf3\x33\x24\xa7\x0e\x71\xec\xe1\x47\x01\x1b\xc5\xe3\x21\
+\xd0\xd6\x8a\xe2\xf1\xe0\x0a\x06\xb1\x8c\x1a\x99\x85\xa3\xe4\xd3\
+\x63\x78\x03\x1d\xb8\x03\xcf\x05\x74\x78\x21\x2c\x1e\x1f\xc6\xef\
+\x72\x63\x38\xbc\x48\x92\x84\xe4\x0e\x91\x2b\x97\x98\x7a\x7c\x86\
+\xb6\x89\x34\xd3\xa3\x63\xb8\x5d\x41\xee\xf8\x8b\xcf\x9e\xf1\x5b\
+\xcf\x84\xb9\x7d\x0f\x93\xc8\x56\x59\xb7\x75\x05\xa2\x20\xa0\x3a\
+\x9e\x6b\x87\x51\xab\x33\xf6\xcc\x30\xaa\x5b\xa3\x75\x75\x07\x95\
+\x6c\x89\xe4\x54\xc6\x6e\xee\x71\x9c\x77\x06\xb0\x4b\x46\x00\x49\
+\x14\xdf\x98\xcd\x67\x09\xf4\xdc\x46\xc3\xea\xa1\x61\xf8\x81\x00\
+\xb9\x45\x13\x41\x92\x97\x93\x32\x9d\x09\x82\x28\xe2\x70\xb9\x08\
+\x75\xf7\xa3\x05\x42\x24\x8f\x1c\x60\xfe\xc0\xb3\x58\xa6\x81\xe6\
+\x6b\x68\xea\x9c\x81\xd0\x8b\x6a\xf9\x04\x41\x40\x5e\x9a\x75\xe1\
+\xde\x15\x84\xba\x07\x68\x5a\xbd\x91\xcc\xdc\x10\xc5\xe4\x22\xb5\
+\x42\x81\x7a\xb9\xc2\xec\xde\x7d\x44\x07\x06\x90\x55\x05\xcd\xeb\
+\x23\xab\x37\x0e\x90\x1e\x7f\x1b\x9e\x60\xc7\x69\x19\xbe\x6c\xdb\
+\x66\xe4\xe9\xc7\x29\x95\x4b\x34\xb7\x3d\x67\xbe\xae\xb9\xdc\xa8\
+\xce\x1e\x9e\x7d\xe2\x67\xb4\xb7\x46\xb9\xe5\x03\x7f\x7a\xde\x83\
+\x0f\x36\xc7\x9f\x7c\x90\x60\xd0\x4d\xb4\x2b\x8e\xa6\xca\xa7\xa8\
+\x2a\xa6\xf6\x8f\x53\xa9\x19\xb4\xf6\xb7\xd0\xd4\xdf\xc2\xc2\x44\
+\x92\xf6\x95\xeb\x13\xd5\x6a\xf5\xbc\xf3\xff\x5c\x08\xce\x89\x00\
+\xb5\x5a\xed\xf5\x8a\x43\x26\xb6\x6a\x43\xc3\xec\x4b\x4f\x81\x20\
+\x62\x99\x16\x55\xdd\x83\x16\x0e\xa2\x78\xce\xae\x04\x81\xc6\x00\
+\xfa\x9a\xdb\xf0\xc6\x5b\x30\xeb\x35\x4c\x43\x67\x61\xa8\xe1\x71\
+\x3b\x93\x5a\x40\x0b\x84\x70\x47\xe2\x04\x3a\x7a\x4e\x49\xe7\xf6\
+\x82\xa5\x89\x22\x81\x68\x0f\x9a\x3b\x48\xca\x7d\x00\x53\xaf\x61\
+\x54\x6b\xf8\x5b\x9a\xc9\xcf\xcd\x53\x2b\x14\x98\x7a\x76\x37\xa2\
+\x43\xc6\x1b\x8b\x61\xd6\x9f\xc2\x13\x89\xd3\x3a\x78\x05\xae\x40\
+\x14\x87\xcb\x8d\x24\x3b\x30\xaa\x15\x66\x27\x27\xf0\xba\xdc\xa8\
+\x9a\x76\x4a\xb8\x98\xe9\xd1\xbd\xb4\xc4\x03\xbc\xed\xd3\xff\x4a\
+\x6c\xe5\xf9\x65\x36\x01\xb0\x8d\x1c\xc5\xe3\xc3\xc8\x1e\x17\x9a\
+\x47\x43\x55\x9f\x3b\x0b\xd9\xa2\x40\x72\x78\x1a\xc3\xb2\x70\x38\
+\x55\x14\x97\xca\xec\xd4\x22\xe1\xe6\xc1\x1f\xdf\xf6\x89\xcf\xbf\
+\x2c\x36\xf0\x67\x25\xc0\x7d\x7f\xfe\xfe\x75\x33\x23\x47\x9a\xfb\
+\x36\xac\xc1\x15\x0a\x41\x76\x77\x63\xf6\xdb\x36\x99\xb9\x3c\xe5\
+\x92\x40\xeb\xf6\x35\xe7\x5d\xb1\x20\x8a\xc8\x9a\x13\x19\x27\x2d\
+\xeb\x2f\xa3\xb4\xb8\x80\xbf\xad\x93\xec\xe4\x18\xf3\x07\x76\x91\
+\x9b\x99\xc0\x36\x0d\x5c\xa1\x18\x91\x81\xd5\x38\x5c\xee\x33\x9e\
+\x1b\x34\x57\x90\xa6\xce\x6d\x2c\xce\xee\x47\x10\x1b\x21\x62\x34\
+\x5f\x43\x36\x10\x68\x6f\x6b\x44\x04\xcd\xe7\xa9\x15\x8a\x14\x53\
+\x0b\x1c\xdf\xf3\x33\xcc\x7c\x0d\x4d\xf1\x13\x1b\x5c\xcb\xe4\xc1\
+\x3d\x38\x44\x01\x49\xf5\x3e\x37\xf8\xb6\xcd\xb1\xa1\x3d\xf4\xb5\
+\xb9\x79\xdd\x9f\x7d\x91\xe8\xc0\xb9\x7d\xa3\x51\xab\x9e\x42\xdc\
+\xec\xd8\x2e\xb2\xf9\x1a\xc1\x96\x18\xf2\x92\xed\xdf\x73\xcf\xea\
+\x8c\xed\x1b\x47\xd4\x14\xda\x56\x77\x20\x20\x90\x9d\xcb\xe1\x6d\
+\xc9\x5d\x54\xe7\x8f\x97\x44\x00\x11\xe1\x56\x59\x76\x28\xc1\xce\
+\x76\x04\x53\x07\xbd\xa1\x99\x34\x81\x23\x8f\x8f\xa3\xf9\xda\xe8\
+\xb9\xfa\xa5\xb9\x7d\x9f\xf0\x08\xb2\x6d\x0b\x6f\x53\x1b\x46\xb5\
+\x42\x31\x39\x47\x7e\x66\x92\x4a\x26\xc9\xf8\x8e\x07\xb1\x0c\x1d\
+\xcd\x17\xc4\xdb\xd4\x4a\xa0\xa3\xe7\x34\x09\xa2\x24\xab\xc4\xda\
+\x37\x93\x5b\x1c\xa5\x90\x99\x5c\x32\xdf\xb2\x50\xdc\xee\x25\xe1\
+\x93\x1b\x9a\x4f\x8c\xad\x4d\xbd\x54\x26\x3f\x37\xc7\xf4\xc8\xd3\
+\x8c\x3f\xfd\x24\xb2\x2c\xa3\x78\x1a\xe2\x6d\xbd\x56\xe3\xe0\x9e\
+\xa7\xb8\x62\xdb\x1a\x5e\xfb\xc7\x7f\x4b\xa0\xbd\xf7\x9c\xbf\xe5\
+\xf9\x24\x3d\xb2\xe3\x97\xe0\x54\xe9\x58\xd7\x8d\x6d\x59\x0d\xc7\
+\xcf\x46\x23\x18\xdb\x37\x86\xe2\x52\xa9\xeb\x26\xaa\x47\xa3\x56\
+\xae\x51\x4f\x9b\x95\x7a\xbc\x76\x49\x15\x40\x27\xe3\x45\x09\xf0\
+\x93\x3f\xff\x3d\xc1\xe1\x74\x5d\x2f\x89\x22\x2d\xab\x56\x80\x6d\
+\x35\xfe\x09\x02\x23\x4f\x0c\x31\x33\x56\xe0\x35\x7f\xf6\x9e\x73\
+\x16\x85\x9e\xbd\xf3\x1a\xe7\x0a\x87\xab\x61\xaa\x15\xec\xec\xc3\
+\x32\x0c\x0c\xbd\x46\x76\x62\x94\xfc\xcc\x24\x85\xc4\x2c\x89\xc3\
+\xfb\x96\x93\x3c\x48\x9a\x13\x57\x38\x8a\xac\x34\x42\xb9\x06\xa2\
+\xfd\x78\xfc\xad\x54\x8a\x49\x54\x57\x08\xcb\xac\xa3\xd7\x8a\xd4\
+\xeb\x45\x8c\x5a\x09\xc3\xa8\x82\x65\xa2\x79\x7d\xf8\xe3\x5d\x80\
+\xcd\xee\x1f\xdf\x4f\xc0\xed\xc4\x1d\x89\x31\x7e\x6c\x98\xc9\x89\
+\x11\xde\xf5\x9e\x77\xe3\x50\x55\x92\x43\x07\x58\x1c\x1e\xc2\x1d\
+\x89\x9f\x93\xcc\xff\x64\x49\x26\xb6\xc9\xf4\xae\xc7\x41\x96\xf0\
+\xc5\xfc\xc8\xb2\xf4\x9c\xff\xa4\x28\x32\xb9\x6f\x8c\xb1\x64\x91\
+\xb6\x8e\x30\xee\xa0\x87\xdd\x3f\xdf\x4b\xac\xb5\xed\xe7\x6f\xfa\
+\x87\xef\xbc\xa4\xf0\xaf\x17\x8d\x00\xaa\xc7\xeb\x2d\xa7\x16\x6e\
+\x96\x31\x89\x76\xc7\x40\x94\x40\x90\xd0\xf5\x3a\x47\x9f\x1c\xa1\
+\x75\xed\x6b\x09\x76\x9e\xfb\xec\xb8\x10\x34\x12\x39\xc8\x44\x07\
+\xd7\x12\x1d\x58\x8d\x65\x98\x54\xf3\x19\xca\xa9\x24\xe5\xcc\x22\
+\x66\xad\x4a\x6a\xe4\x30\x8a\xd7\x87\x6d\x1a\x0d\x49\x62\x73\x1b\
+\x4e\x6f\x53\xc3\xbd\x4b\x10\x4e\x49\x33\xbb\xec\xf7\x4f\x43\x7e\
+\x50\x5e\x5c\x20\xbf\xb0\x40\x28\x18\x20\xb3\x38\x49\xcc\xef\xe0\
+\x77\xbf\xf1\x5d\x3c\x4d\xad\xd4\x0a\x39\x72\xd3\x13\xd4\x8b\x79\
+\xaa\x85\xec\x79\xb7\xdd\xae\x2d\x30\xb2\x7f\x84\x35\x57\xad\x46\
+\x72\xc8\x38\x9d\xcf\x2d\xff\x85\x6c\x91\xa3\x4f\x1e\x21\xe0\xd1\
+\xe8\xde\xd4\x8b\x20\x08\x2c\x8e\x66\xe9\x1c\xe8\xbc\x24\xc6\x9f\
+\x67\xc2\x8b\x12\x40\x10\x45\xc9\xb6\x6d\xea\xd5\x05\x1c\xe6\x38\
+\xb0\x11\x24\x8d\x62\x22\x4d\x20\xe4\xe2\xd8\x8e\xfb\xa8\x55\x4a\
+\xac\xb8\xe9\x0e\x9a\x56\xaf\x45\x34\x53\x0d\xff\x00\xe1\xe2\x3b\
+\x72\x9e\x90\x1a\x4a\xca\x73\xb1\x7c\x1a\x82\xa8\x46\x48\x98\xc5\
+\xe1\x43\x58\xa6\x41\x35\x9b\x26\x79\xf4\x00\x58\x36\x92\xaa\xe2\
+\x8e\x36\x21\x2b\x2a\xfe\xb6\x2e\x9c\xc1\xf0\xd2\x0c\x7d\x6e\x99\
+\x2e\xa5\x12\x94\x6b\x75\x4a\x89\x24\xdb\x6e\xdc\xc4\x0d\x1f\xfa\
+\xd8\xb2\x36\xd3\x1d\x89\x13\xec\xea\x5f\xb6\x06\x3e\x5f\xa4\x86\
+\x9e\x42\x10\x24\x3c\xa1\x46\x22\x28\xe7\x49\xfb\xff\x53\x3f\xde\
+\x49\xbc\x25\x48\xc6\xb0\x69\x5e\xd1\x46\x79\x21\x4b\x31\x67\x56\
+\x74\xb3\xf2\xcd\x4b\x32\xd2\x67\xc0\x8b\xaf\x00\x6e\xef\x40\xba\
+\x7c\x8c\x68\x73\xa4\xa1\xf8\x11\x27\x00\x89\x60\x3c\xc0\xe6\x37\
+\x5f\x49\xfd\x81\x3d\xa4\x8e\x3f\xc2\x63\xff\xfc\x2c\x6e\x8f\x45\
+\xcb\x40\x84\x78\x6f\x37\xa1\xc1\x6b\x51\x9a\xae\x40\xd2\x02\x17\
+\xad\xa1\x96\x65\x92\x9c\xde\x8d\x37\xd8\x81\xd3\x13\x5d\xda\x2e\
+\x04\x1c\x4e\x37\x0e\xa7\x9b\xb6\x2d\x57\x36\x2c\xb3\x6d\x0b\xd3\
+\x30\xb0\x4d\x93\xf4\xf1\xa3\x14\x17\x1a\x67\x89\xf4\xe8\x51\xb4\
+\x40\x08\xd9\xe9\xc4\xe1\x74\xe1\x6f\xeb\x46\x0b\x84\x28\x65\x33\
+\x68\xaa\xca\xc6\x6b\x6f\xe0\xfa\x3f\xf8\xc4\x69\xb1\x09\x4e\xd6\
+\x42\x9e\x2f\x26\x9e\x7a\x04\xb7\x4b\x21\xd4\x1e\x05\xdb\xc6\x75\
+\x62\x05\x10\x05\x16\x8f\xcf\x33\x3e\x91\x62\xed\xf5\x6b\x90\x55\
+\x07\x07\x1e\xd8\x43\xf7\x40\xdf\xf7\xef\xf8\xd4\xd7\xca\x97\x72\
+\xc0\x9f\x8f\x17\x25\x40\x29\x93\x3e\x28\x39\x94\x5a\x4d\x77\x69\
+\xb5\x62\x15\xd5\x18\x3e\xd1\x2b\x54\x4d\x8b\x9e\xad\xfd\xd8\x9b\
+\x7b\xc9\x27\xf3\x2c\x1c\x9b\x63\x64\x68\x96\x67\x1e\x3e\x8c\x5d\
+\xfd\x3e\x2e\x45\xa2\x73\xd3\xd5\xb4\x6c\xb9\x99\xe6\x0d\x57\xe2\
+\x89\x9d\x5f\x74\xf0\xe7\x43\x14\x25\x9c\xee\x08\xa9\xd9\x03\x08\
+\x92\x8c\xaa\xf9\x91\x15\x17\x0e\xc5\x8d\x43\xf5\x20\x2b\x6e\x44\
+\x51\x46\x10\x25\x64\xa5\x71\x26\x89\xad\xda\x40\x6c\xd5\x06\xf4\
+\x72\x91\x6a\x2e\x43\x7e\x6e\x1a\x87\xe6\xa2\x9a\x4b\x33\xb5\xf3\
+\x51\x8c\x6a\x05\xc9\xa1\xf0\x96\x3f\xfb\x1b\x9a\xd6\x6d\x45\x52\
+\xce\xcd\xd2\xf8\x5c\x60\x5b\x3a\x89\xe1\xfd\xc8\xaa\x03\xcd\xeb\
+\x44\x55\x64\x64\xa9\xb1\xff\x5b\xa6\xc5\xcc\x54\x0a\xa7\x26\xe3\
+\xf2\xbb\x11\x6c\x9b\x99\x83\x53\xe6\xc0\xf6\xee\x7f\xba\x94\x83\
+\xfd\x42\x38\x2b\xad\x1f\xfa\xa7\x4f\xfc\x62\xfe\xd0\x9e\xeb\xb7\
+\xde\xdc\x4e\xff\xd6\xae\xe5\xdf\xe7\x12\x59\x4a\x95\xfa\x69\x05\
+\xd8\xb6\x4d\x39\x53\x24\x33\x9b\x26\x31\x3a\x47\x21\x91\xc1\xe5\
+\xf1\xd1\xbc\xfa\x3a\xd6\xbe\xe1\xd7\x09\xf5\x0c\xbe\x24\xdf\xbd\
+\x6a\x39\x43\x3e\x35\x46\xbd\x92\xe1\xb9\x45\xb9\x11\x98\x40\x92\
+\xd5\x65\x42\x38\x54\x0f\x8a\xea\x45\x72\x68\xcb\x12\x40\xdb\xb6\
+\xb1\x74\x9d\x6a\x2e\x8d\x51\xab\x22\x88\x22\x99\x89\x63\x14\x12\
+\xb3\x14\xe7\x67\x09\xb4\x77\xe1\x8e\xb5\xe0\x6f\xe9\xc0\xdb\xdc\
+\x76\xde\x9e\x44\x27\xa3\x30\x75\x80\xaf\xbf\xe7\x76\x3c\x9d\x4d\
+\x6c\x7f\xdb\xb5\x04\xfc\x2e\x42\x7e\x77\x23\x4b\xd8\xb1\x39\xbe\
+\xff\x3f\x7f\x80\xcb\xef\x64\xfd\x1d\x57\x30\x37\x3a\x4f\x79\x46\
+\xdf\xf9\x6b\x5f\xfa\xf9\xb6\x0b\xae\xf0\x02\x71\xd6\xcd\x3a\x97\
+\x98\xfd\xeb\x62\xa5\x7a\xfd\xf0\x93\xd3\x38\x1c\x26\x9d\x1b\x7b\
+\x11\x6c\x88\x84\xbd\x68\xa5\x1a\x86\x69\x51\xaf\xe9\x54\x6b\xfa\
+\xf2\x3e\xe9\x0a\x7a\x70\x87\xbc\xb4\xae\x6a\x27\x33\x93\xa2\xb0\
+\x98\x67\xf8\xa9\x1f\x31\xf4\xcb\xef\xd1\xbe\x61\x3b\x7d\x57\xdd\
+\x41\xf7\xf6\x1b\xce\xd9\x9c\xfb\x64\x68\xae\x20\x9a\x2b\x88\x69\
+\xd4\xa9\x96\x53\xd4\xca\x99\x65\x73\x72\xd3\xa8\x62\x1a\x35\x6a\
+\x95\xcc\x49\x41\x9e\x44\x24\x59\x6b\x90\x42\x71\x37\x56\x0d\x9f\
+\x07\xa7\xa3\xb1\x8d\x78\x62\x2d\x14\x17\xe6\x90\x14\x85\xf4\xf1\
+\x61\x2a\x99\x14\xa3\xbf\xbc\x8f\x48\xff\xaa\xa5\x4c\xe2\x83\x68\
+\xfe\xe0\x59\x85\x52\xcf\x47\x62\xff\x53\x78\x62\x41\x3a\xd7\x77\
+\x63\x99\x16\x5e\xf7\xd2\xfb\x82\xc0\xc2\xe8\x2c\x6e\xb7\xd2\xb0\
+\xfe\x69\x09\x71\xf8\x97\x07\xf0\xb9\x63\x8f\xbe\xdc\x83\x0f\x70\
+\xd6\xfb\xdb\xb7\x77\xec\x1e\x7f\xf3\xf6\x0d\xad\xa2\xe4\xdc\x3c\
+\xb1\xe3\x49\x2c\xdd\x24\x36\xd0\x86\x2c\x0a\x38\x35\x07\x6e\xa7\
+\x82\xcf\xeb\x24\x18\x70\x13\xf0\xbb\xf0\xf9\x5c\x38\x1c\x32\x96\
+\x69\x61\x98\x16\x4e\x9f\x8b\x40\x4b\x88\xe6\xfe\x56\x44\x49\x22\
+\x3d\x35\xce\x53\xf7\x7e\x97\x43\xf7\x7e\x0b\xab\x5c\x42\xf3\x35\
+\x02\x3e\xbe\x90\x8d\xde\x8b\x41\x14\x25\x14\xd5\x8b\xd3\x13\xc5\
+\x1b\x6c\xc7\x13\x68\x47\x73\x47\x50\x54\xcf\x52\xf0\xe8\x86\x86\
+\xd0\xb6\x4d\x2c\x4b\xc7\xa8\x97\xa9\x57\x73\x54\x8a\x49\x4a\xd9\
+\x29\x8a\xd9\x49\xca\x85\x04\x7a\xad\x80\xa4\x39\x70\x38\xdd\xf8\
+\x5b\x3b\xf1\xb7\x75\x11\xec\xe8\xc5\xdb\xdc\x46\x39\xb5\xc0\xd8\
+\xa3\x3f\xa3\xb4\x98\x40\x2f\x97\x30\x6a\x35\xf4\x52\x01\xd5\x17\
+\x38\x6b\xfb\x9e\xfe\xfa\x7f\x32\x7b\xfc\x08\x9d\x1b\x7b\xf0\x04\
+\x3d\x84\x82\x9e\x46\xc8\x29\x41\xe0\xa1\xff\xf8\x19\x0e\xd5\x41\
+\xa0\x33\x4e\xb8\x25\xc4\xee\xfb\x9e\xad\xb7\xae\x5a\xfd\x8e\xaf\
+\x3d\xbc\xef\xbc\x73\xff\xbe\x54\x9c\xd3\x5a\x7c\xf7\x1f\xbd\x53\
+\x4b\x25\x92\x4f\xb7\x85\x6b\xeb\x8e\x4f\x27\xf0\xbb\x15\xd6\x5c\
+\x3e\xc0\xe0\xd5\x6b\x70\xba\xcf\x3c\x33\x0c\xd3\xa2\x52\xad\x53\
+\xaf\x1b\xd4\x75\x83\x6a\xcd\xc0\x34\x2c\x16\xc7\x13\xe4\x17\xb2\
+\xcc\x0c\x4d\x91\x9b\xcb\xe3\x0a\xb7\xd1\xda\xbf\x96\xc1\xeb\x6f\
+\xa1\xeb\xca\x1b\xcf\x7b\xb6\x9d\x09\xb6\x6d\x61\xea\x35\xf4\x7a\
+\x11\xbd\x5e\xc2\xa8\x97\xd0\xeb\x15\x4c\xbd\x8c\x79\x42\x9d\xdc\
+\xb8\x10\x2e\x6d\x27\x36\x92\xac\xa1\x68\x3e\x64\xc5\x05\xa6\x80\
+\x59\xae\x51\xcb\x17\x29\x2d\xcc\xb3\x38\x72\x18\x87\xcb\xcd\xaa\
+\xdb\x7f\x0d\xd7\x8b\x98\x9c\x5b\xba\xce\x7f\xfe\xfa\xeb\x70\xfb\
+\x75\x2e\xfb\xd5\xcb\x70\x3a\x15\x5a\xe2\x81\x86\x55\xd0\xd0\x14\
+\x77\xff\xd3\x0f\xf0\x45\xfd\xac\xb9\x6d\x2b\x87\x1e\x1b\x22\x1a\
+\x08\xfd\xf3\xed\xff\x74\xff\x07\x5e\xb6\x51\x3f\x09\xe7\x74\x5f\
+\x7b\xd3\x67\xfe\xbb\xfa\xbd\x3f\x78\xcb\x8d\x93\x89\xe2\x8e\xe8\
+\xa6\x81\x81\x63\xcf\x0c\x93\x7d\xe8\x00\xfb\x1f\x39\xc4\x86\x1b\
+\xd6\xd1\xb5\xa9\x17\x5f\xc4\x7f\x5a\x36\x0e\x59\x12\x1b\x4b\x9f\
+\xfb\xc4\x80\xd8\x94\x2a\x75\x34\xcd\x41\xb5\x3b\x46\xc7\xfa\x6e\
+\xea\xe5\x1a\xb9\xf9\x0c\xc9\xe3\x47\x78\xf4\x5f\x9f\xe5\x17\xff\
+\xfe\xbf\x58\x79\xcd\x4d\xac\xbe\xf5\x4e\x82\x9d\x7d\x2f\xe9\xbc\
+\x20\x08\x22\xb2\xe2\x44\x56\x9c\x38\x79\x6e\xc0\x6c\xdb\xc6\xb2\
+\x74\x4c\xbd\x8a\x5e\x2f\x61\xea\x55\x0c\xa3\x8a\x65\xea\x58\x66\
+\x7d\x69\xb5\xc8\x63\xdb\x0d\x77\x37\x5b\xb3\xa9\x4b\x45\x9a\xd6\
+\x6e\x42\x56\x34\x9c\xa1\x17\x77\x79\x4b\x8f\x8f\x90\x4d\xa7\xe8\
+\xbf\xa2\xe1\x22\xe6\xd4\x96\xe4\xff\xa2\xc8\xbe\x87\xf6\x23\xcb\
+\x12\x81\xf6\x28\x91\xce\x18\xb3\xff\xf6\x53\x62\xd7\xb6\x7c\xfb\
+\xe5\x1d\xf6\x93\xfa\xe8\x7c\x1e\xfe\xfa\xef\xdf\x75\x63\x25\x3b\
+\xfd\xe3\xc1\xdb\x36\x39\x87\x9e\x18\x62\x71\x7c\x01\xd1\xd0\xd1\
+\xaa\x35\x06\xd6\x77\x33\xb0\xa5\x97\x60\x5b\x04\x7f\x53\x08\x49\
+\x16\x4f\xcd\x16\xf6\x3c\x54\x6b\x3a\xe9\x6c\x89\x72\xb9\xb6\x3c\
+\xc8\xd9\xb9\x34\x73\x07\xa7\x29\xa5\x4c\x72\xa9\x32\xb1\xde\x55\
+\xf4\x5d\xfb\x5a\x7a\xb6\x5d\x83\x33\x1c\x7d\x49\x64\x78\xe9\xb0\
+\x1b\x89\x40\x2c\xeb\xac\x92\xcf\x3d\xdf\xf9\x0a\xfb\xef\xff\x3e\
+\xeb\x6f\x6d\xc7\x1d\x72\xd1\xde\x16\x46\x53\x64\x2c\xe0\xf3\xbf\
+\xf3\x79\xfc\x61\x2f\xfd\x37\xae\x27\x18\xf6\xf1\x93\x2f\x3e\x32\
+\xdf\xb3\xa6\xa7\xfd\x8d\x9f\xb9\xf7\xe5\x0b\x80\x74\x12\xce\x6b\
+\xe3\xfd\xfe\xd3\x87\xc7\xde\xb8\x7d\xe3\x54\x69\x72\xfa\xce\x8d\
+\x37\xad\x25\x36\xd0\x86\xed\x70\x80\xc7\xc5\xf8\x78\x92\xa7\x1f\
+\x3e\xcc\xee\x9f\xed\x65\x64\xc7\x21\x4a\xb3\x69\xca\xc5\x2a\xaa\
+\x4b\xc5\xe1\x52\x97\x85\x29\xcb\x79\x76\x97\x32\x62\xb9\xdd\x5a\
+\xe3\x20\x59\x37\x70\x7a\x5d\x44\xfb\xe2\x44\xfb\x23\x78\xa2\x0a\
+\xa9\xa9\x63\xec\xf9\xc5\xfd\x3c\xfd\x8d\xff\x64\xe2\xd9\x27\xb1\
+\x6b\x15\x9c\x67\x49\xf7\x7e\xe9\xf0\x5c\xdc\xa2\xb3\x61\x62\xc7\
+\x83\x94\xd2\xf3\xb4\xaf\x0b\x22\x3b\x24\x22\x61\x2f\x02\x30\x77\
+\x7c\x9e\xe9\x67\x8e\x82\xdb\x49\xcf\x65\x83\x1c\xdf\x39\x8c\xcf\
+\x13\xf8\xfc\x9b\x3e\x77\xff\x25\x37\xfe\x3c\x13\xce\x5b\x64\xf7\
+\xee\x7f\xf9\xf1\x7f\x7f\xf5\x03\x77\xb5\x3e\xf1\x95\x27\xfe\x6a\
+\xc5\x15\xed\x8e\x4d\xdb\xfb\xc9\xe4\xaa\x94\xca\x75\xca\xb9\x32\
+\xa5\x4c\x81\x72\xb6\xc4\xa3\xbb\xc6\x11\x1f\x1d\x42\x32\x0d\x3a\
+\xdb\xc3\x34\xf7\x36\xb3\xfa\x35\x1b\x08\xb5\x47\x11\x9f\xdb\x74\
+\x51\x15\x99\xe6\x98\x9f\x6a\xcd\x45\x3a\x53\xa2\x5c\xa9\x21\x2b\
+\x0e\x9a\xfa\x5a\x68\xea\x6b\xc1\xa8\xeb\xcc\x1d\x9d\xe1\xf8\xae\
+\x23\x3c\xf4\x85\x27\xa8\xd4\x21\xde\xb7\x96\x55\x57\x5c\x4f\xef\
+\xf6\x1b\x08\xf7\x0c\x2e\xdb\x08\xbc\xdc\x38\x99\xd0\x27\x60\x99\
+\x26\xe3\x7b\x9f\x25\xd2\x12\x44\x94\x44\x9c\x4e\x75\xe9\x8c\x61\
+\x93\x3c\x3e\x4f\xd9\xb0\x89\x35\x05\x31\x74\x83\x03\x3b\x86\xea\
+\x1b\xaf\xdd\xf6\x6f\xaf\x48\xe3\x97\x70\xc1\xd3\xe8\x47\x1f\x7b\
+\xd7\x8a\xd9\xf1\xc9\x8f\xd9\xe5\xe4\x3b\xae\xb8\x63\x33\x6a\x34\
+\x48\xcd\x82\x42\xa9\x46\xb9\x6a\x60\x1a\x26\x66\x5d\x27\x35\xb5\
+\xc8\xec\xe1\x49\x1c\x85\x22\x9a\x04\xd1\x58\x80\x70\x7b\x94\xc1\
+\x6d\x03\x44\x7a\x9b\x71\x7a\x9d\x4b\xb1\x85\x1b\xb1\x71\x75\xc3\
+\xa4\x5c\xa9\xa3\xeb\x06\xb5\xba\x41\xb5\xfa\xdc\xf5\xd2\xa8\xe9\
+\xe4\x13\x59\x16\xa7\x53\xa4\xa7\x17\x99\x19\x5d\x40\x73\x06\xe8\
+\x5a\x77\x19\xad\xab\x37\xd1\xbe\x7e\x4b\xc3\x75\xfc\x02\xfc\x12\
+\x2f\x04\xb6\x6d\x37\x3a\xf0\x24\x12\xe4\xe7\xa6\xf9\xda\x7b\x7f\
+\x95\x2b\xde\x78\x25\xbe\x0e\x81\x68\xc8\x83\xcf\xeb\xc4\xb2\x6d\
+\x7e\xf0\x37\xdf\x62\x76\x3e\xcb\xfa\xdb\x2f\x23\x35\x9b\xc1\x98\
+\xaf\x3e\xf1\x96\xff\x78\xe4\x1c\xed\xca\x2f\x0d\x5e\xf2\x3a\x7a\
+\xcf\x9f\xbe\xe3\x86\xc5\xa9\xf9\x4f\x55\xb2\x93\xdb\x7a\x36\x74\
+\x11\x1b\x6c\xc5\x13\x0b\x50\xd1\x6d\x8a\xa5\x1a\xe5\x8a\x8e\x20\
+\x0a\x94\xd2\x45\x72\x73\x69\x2a\x89\x34\x76\xb6\x80\x55\xaa\x10\
+\x8d\xf9\xf1\xc5\x03\xb4\xaf\xee\xa0\x75\xa0\x0d\x5f\x4b\xa8\xa1\
+\x2d\xb3\x9e\x4b\x36\x69\xd9\x36\xb5\x5a\xe3\x16\x51\xa9\xd6\x29\
+\x97\x6b\x27\x0e\xef\x54\x0b\x15\x72\xf3\x19\xb2\xb3\x69\x12\x63\
+\x69\x32\xb3\x39\x42\x91\x26\x36\xbc\xf1\x9d\x74\x6f\xbb\x0e\x5f\
+\x7b\xe7\x4b\x0e\x50\x75\xbe\x18\x7d\xf8\x7e\x0e\xff\xe4\x6e\x7a\
+\xb6\x38\x50\xc3\x1e\xba\x3a\x22\xc8\x92\x44\x76\x3e\xc3\x7f\xfd\
+\xf9\x57\xd1\x02\x6e\xae\xfb\xed\x5b\xd8\xf9\xdd\xc7\xf0\xb8\x9b\
+\x3f\xf9\xc6\xcf\xdf\xfb\x17\x2f\x6b\x03\x9f\x87\x8b\xb2\x91\x7e\
+\xe7\x43\x77\x08\x9a\xdb\x77\xc5\xc2\x6c\xf2\xdd\xa5\x74\xe6\xad\
+\x51\xbf\xec\x29\x19\x25\xd6\x5e\x35\x88\x1a\x0b\x52\x15\x65\x0a\
+\xa5\x1a\x96\x65\x23\x88\x22\xa6\x6e\x90\x9a\x58\xa0\x9a\x2f\x31\
+\x79\x60\x02\x97\x6d\xa0\x89\x02\x1d\x6d\x21\x7a\x36\xf7\x13\xeb\
+\x6d\x22\xd4\x11\x43\x75\x6b\xa7\x65\x1e\xb7\x2c\x9b\x7c\xa9\x4a\
+\xa1\x50\xa1\x56\x6b\x9c\x9b\x04\xe1\x84\x04\xb2\x44\x62\x74\x96\
+\xc3\x8f\x1d\x26\x97\xab\xd3\xbf\x7a\x1d\xb1\x15\x5b\x58\x71\xcd\
+\x4d\x0d\x81\x8e\x2f\xf0\x92\xa4\x7b\xe7\x82\x07\x3e\xf3\x57\xa4\
+\x0f\xec\x60\xcb\x5b\x56\xa3\xb8\x55\x3a\xda\x22\x08\xc0\xb3\x3f\
+\xde\xc9\x83\xdf\xdd\x41\xef\x65\xfd\xac\xbd\x69\x23\x3f\xfd\xc7\
+\xbb\xcd\xde\x2b\xae\x5e\xff\x86\x4f\x7d\xe3\xd0\x25\x6d\xd0\x59\
+\x70\xd1\x4f\x52\x3f\xf8\xf0\xdb\x34\xb0\xda\x25\xc5\xb5\xad\x9a\
+\xc9\xfd\x7e\x7a\x72\x64\x83\x28\x19\x72\xe7\x86\x0e\x0c\xa7\x86\
+\xb3\x39\x8c\x2e\x88\xd8\xd6\xd2\xfe\x29\x40\x25\x57\xa6\x30\xb5\
+\x40\x2d\x91\xa6\x3c\x9f\xc6\xa3\xca\x28\xb2\x88\xa7\x25\xcc\xe0\
+\x65\x03\xb4\xae\xec\xc0\x1d\xf1\x21\x3e\x8f\x0c\x86\x61\x52\x2c\
+\xd7\x28\x14\xab\xd4\x6a\x8d\xf8\xc9\x0d\x6f\x62\x8b\x72\xa6\xc8\
+\xb1\x9d\xc3\x2c\x4c\xa5\x10\x4d\x93\x52\xde\x22\xd8\xd2\x49\xcf\
+\x86\x2b\xe8\xda\x76\x0d\xf1\x55\x1b\x2e\xfa\x61\xd2\x32\x74\xfe\
+\xfb\xb7\xee\x64\xf5\xd6\x2e\x82\xab\x5c\x8d\x1c\x7f\x61\x1f\x88\
+\x02\xff\xf5\xd1\xff\x26\xb5\x98\x67\xdd\x4d\x1b\x39\x3c\x34\x83\
+\x17\xef\xd7\x7e\xf3\x2b\x0f\xfd\xfa\x25\x1e\xdf\xb3\xe2\x92\x1f\
+\xa5\x7f\xfc\xc7\x6f\x8f\x23\x3a\x5e\xa3\x57\xaa\xaf\x4f\xce\xce\
+\xdd\x50\xc8\xcc\xc7\x9a\x57\x34\xe1\x89\xf9\x70\xb7\x84\xb1\x14\
+\x05\xcb\xb4\x96\x7d\xed\x05\xdb\x86\x4a\x95\xfc\xe8\x2c\x89\xa1\
+\x09\xca\x85\x2a\xaa\xea\xa0\xa9\x39\x40\xd7\x86\x6e\x3a\xd6\x74\
+\x11\xee\x8c\x21\x2b\xf2\x52\x74\xb2\xa5\x74\xaf\x96\x45\xb5\xaa\
+\x53\xa9\xe9\x54\xca\x35\x6a\x75\x13\x41\x04\x53\x37\xa9\x97\x6b\
+\xa4\xa6\x16\xa9\xe4\x4b\x4c\x1e\x99\x21\x33\x97\x27\x1a\x8a\x13\
+\xea\x5e\x8d\xe2\x0b\xd2\xd4\xd5\x43\x7c\xd5\x06\xc2\xbd\x83\x2f\
+\x89\x14\x89\xa1\x7d\x3c\xfd\xef\x9f\x65\x70\x7b\x08\x29\x28\xd1\
+\x1c\x0f\xe0\x76\xa9\x64\x12\x19\x7e\xf4\x77\xdf\x43\x8a\x06\x58\
+\xf1\x9a\x0d\x7c\xe9\x53\x77\x73\xd9\xf5\x57\xbd\xe1\xb7\x3e\xf7\
+\xc3\x1f\xbf\xbc\xc3\x7d\x3a\x5e\xd6\xbb\xd4\x37\xdf\x77\xbb\xe4\
+\x50\x5c\xaf\x41\xb7\xde\x59\xd7\xf5\x5b\x53\x73\x13\xc1\x58\x8f\
+\x0f\xdd\xa9\x12\xe8\x88\xe3\xf0\x68\x9c\xa4\xe1\x69\x2c\xed\xc5\
+\x0a\xc6\x62\x86\xc5\xe1\x69\x66\x27\x17\xf1\x2a\x12\x2e\xb7\x46\
+\xef\x86\x6e\x7a\xb7\x0d\x12\xeb\x6d\xc6\xa1\x38\x4e\x13\x42\x99\
+\x96\x45\xa9\x5c\xa3\x54\xae\x51\xad\xea\x98\x27\x48\x06\xd4\x2b\
+\x35\x16\xc7\x13\x48\xb2\x4c\x6a\x36\x47\x29\x59\xa6\xb4\x58\xa2\
+\x8e\x4a\xac\xab\x8f\xbe\xcb\xae\x26\xd8\xd1\x4b\xa0\xb5\x03\x67\
+\x28\x82\xc3\xe9\x3e\xa7\xef\x3b\x7c\xef\x77\x98\xd9\xf5\x38\xbd\
+\x5b\x05\x6c\x4d\xa5\xbb\x33\x8a\x28\x08\x3c\x75\xf7\x0e\x46\x9f\
+\x1d\xc1\xd3\xd7\x8a\xdc\x12\xe3\x87\x5f\x7c\xc0\xda\x74\xf5\x96\
+\xb6\xf7\xfd\xf3\xfd\x17\x25\xef\xcf\x4b\xc1\x2b\x26\x59\xf9\xce\
+\x07\xef\x52\x65\x59\xbe\xc9\xb2\xd8\xbe\x98\x4c\xdd\x21\x94\x93\
+\xab\x4a\xd4\xe8\xbd\x62\x25\x9e\xe6\x30\xfa\x49\x03\x66\xdb\x76\
+\xc3\x9d\xca\x32\x30\x33\x05\xa6\xf7\x8f\x31\x3f\xd6\xc8\xc0\x1d\
+\x09\x7a\xe8\x5b\xdb\xc1\xca\x1b\x37\x12\xe9\x88\x22\x58\xf6\x69\
+\x5f\x65\x03\xb5\xba\x4e\xb9\x5c\xa7\x58\xaa\x52\xaf\x1b\xa7\xce\
+\xf2\xa5\x03\x65\x7a\x6a\x91\xe4\x54\x92\x7c\xba\x48\x66\x6a\x91\
+\x42\xb1\x86\x2d\xc9\x34\xb7\x36\xd1\xb2\x72\x15\xa1\x96\x0e\xda\
+\xd7\x5f\x41\x6c\xe0\x32\x54\x6f\xe0\xb4\x6f\x7a\xe4\xb3\x7f\x09\
+\xd5\x0c\xed\x97\x39\xd0\x9c\x1a\x2d\x4d\x01\x6c\x49\xe4\x1b\x7f\
+\xfc\x65\x2c\xdb\xc6\xbb\xb6\x87\xe3\x93\x69\xea\x39\x7d\xf7\x47\
+\xbf\xbb\xf3\xcc\xe9\x53\x5f\x46\xbc\x92\xa2\xb5\x65\x7c\xe3\x7d\
+\x77\x08\x9a\xc7\xbb\xba\x56\x58\xbc\x2d\x3d\x39\xfe\x47\xf9\x6a\
+\x25\xb6\xe1\xda\x35\x78\x7a\x5b\xa9\x23\xa0\xeb\xe6\x29\x56\x39\
+\x6e\xa7\x03\xc9\x30\xc8\xcd\x24\x99\xda\x37\xc6\xc2\x44\x92\xa6\
+\xa0\x8b\xfe\xb5\x9d\xb4\x6f\xec\xa3\x75\x75\x27\x0e\x97\xd2\x20\
+\xc3\xf3\x60\x03\xba\x6e\x50\x28\x56\x29\x95\x6a\xe8\x86\x89\x75\
+\xe2\x3a\xc7\x73\x86\x1f\x46\x5d\x47\xaf\xd6\x49\x1c\x9b\x63\x72\
+\x78\x0e\xb7\x5b\x65\x7a\x78\x96\xc5\x85\x1c\xfe\x80\x9f\x81\xb5\
+\x97\xb3\xfd\x3d\x7f\x44\x6c\xe5\x3a\x04\x41\xc4\xd4\x75\xee\xf9\
+\x1f\xef\xa6\x63\x4d\x3b\xc1\x5e\x93\x48\xd8\x47\xc0\xe7\xa4\x90\
+\xca\x73\xf7\x27\xbf\x85\x23\xe4\xc5\xbd\x61\x80\xfb\xbe\xfc\x10\
+\x9b\xae\xde\xf4\x8e\xf7\xff\xf3\x03\x5f\x7f\xa5\xfb\x1d\x5e\x25\
+\x04\x38\x19\xdf\x7c\xef\x6b\xdc\xa2\x2d\x7f\xc4\xcc\x2d\xbe\x27\
+\x99\x5a\x6c\x6d\xdf\xd8\x43\xd3\xea\x2e\x2c\x55\xa5\x5c\x37\x97\
+\xcf\x0b\x8d\xdc\xbd\x02\xb1\x90\x9b\xca\x7c\x8a\xa1\xa7\x86\x99\
+\x1c\x9e\xa1\x5c\xaa\xd3\x12\xf5\xd2\xbf\xa2\x85\x8e\x35\x9d\x44\
+\x3a\xa3\x04\x5b\x22\x8d\x5c\x46\x2f\xb0\x3a\x58\xb6\x8d\x6e\x98\
+\x18\x86\x89\xae\x9b\x54\xaa\x3a\xf5\xba\xd1\x08\x03\x67\x5a\x0d\
+\x4b\x83\xa5\x77\x6c\xdb\xa6\x9a\x2f\xb3\xf3\xa7\x7b\x38\xba\x67\
+\x8c\xbe\xb6\x38\x4a\xb0\x9d\xae\xcb\x6f\xa4\x6d\x70\x35\x07\xee\
+\xf9\x3a\xfe\x16\x91\x8e\x4d\x11\x3a\xdb\x1a\x31\x00\x8e\xec\x38\
+\xcc\xd3\xdf\x7b\x1c\x33\x16\xa6\xac\x39\xc9\x27\x0a\x93\xee\x80\
+\xb7\xef\x0f\xfe\xfd\x97\x17\x2d\xeb\xc7\x4b\xc1\xab\x8e\x00\x27\
+\xf0\xad\xdf\x7d\x8d\xac\xb9\x5c\x97\x17\xd2\xe5\xbf\xaf\xe6\x12\
+\xdb\x4d\xbd\x82\x1a\xf2\x12\x5d\xd9\x49\xd5\xb0\x90\x9d\x2a\xd1\
+\x8e\x08\x6e\xb7\x8a\xc7\xe5\x40\x40\xc0\x58\xba\x5e\xce\x0e\xcf\
+\x32\x7d\x74\x86\x5a\xbe\x4c\x40\x11\xd1\xfc\x6e\x9a\x07\x5a\xe9\
+\x5d\xdf\x8d\x27\xe4\xc5\xdf\x14\x44\x79\x81\x2b\xe6\xf3\x61\x5a\
+\x16\xf9\x62\x95\x7c\xbe\x82\xae\x1b\x27\xad\x0e\x06\x85\x64\x8e\
+\x5c\x22\xcb\xf0\xae\x51\xa6\x8e\x27\xa8\x9b\x02\xab\x57\xaf\x64\
+\xfd\x2d\x7d\xc4\x3b\x22\xb4\x36\x07\xb1\x05\xf8\xc6\x5f\x7e\x93\
+\x4a\x3a\x8f\xb2\xba\x97\x43\x4f\x1e\x65\xcd\xd5\x1b\xff\xee\x9d\
+\x7f\xfb\x83\x8f\xbe\xd2\xfd\x7b\x02\xaf\x5a\x02\x9c\xc0\x77\x7f\
+\xef\xf5\xa2\xe6\x8b\x6c\xa8\x95\x4a\x5b\x6b\xba\xb9\xb5\x34\x37\
+\xfd\x16\x97\x5b\x75\x6a\x0e\x53\xae\x9b\x35\x2c\x45\xc2\x19\x74\
+\xe3\x0e\xba\xf1\xc5\x82\x78\xa3\x3e\x9c\x4b\xd9\xb9\xab\xc5\x0a\
+\x8b\x13\x0b\x4c\x1e\x9a\xa2\x30\x9f\x21\x57\xaa\x31\x35\x9f\x27\
+\xe8\x56\x58\xb3\xb2\x95\x81\x75\x9d\x84\x5a\xc3\x34\x0d\xb6\xe1\
+\x70\x29\xc8\xb2\x7c\xda\x61\x12\x1a\xdb\x46\xb5\xa6\x53\x2c\x56\
+\x29\x96\xaa\x8d\x03\xe5\x09\xc9\x65\xb5\x4e\x7a\x2a\x49\x39\x57\
+\x26\xd0\x12\x22\xd0\x1c\x22\x1e\xf3\xe3\x75\x6b\x24\xa7\x17\xb9\
+\xe7\xef\xbe\x4b\xc5\xe5\x22\xbe\xa9\x9f\x23\x8f\x1d\x2e\x76\x6d\
+\x5c\x33\xf8\xee\x4f\xdf\x3d\xfb\x4a\xf7\xeb\x09\xbc\xea\x09\xf0\
+\x7c\xfc\xe0\x8f\xde\xa6\xc9\xb2\xa8\x0a\x22\x71\xdb\x16\x3a\x8a\
+\xf9\xca\x1b\x7d\xfe\x40\x17\xe8\xde\x4a\xb9\x5c\xa8\x2c\x2e\x5c\
+\xaf\xb9\x50\xfb\xaf\xe8\x17\x14\xbf\x8c\xec\x75\x21\xa9\x32\xd8\
+\x8d\xb8\xbe\x73\x53\x29\x26\x46\x17\x98\x1f\x4b\x60\x17\x4a\xc8\
+\xf9\x22\xaa\x26\xe3\x71\xa9\x74\xac\xea\xa0\x7d\x6d\x27\xed\x6b\
+\xbb\x71\xa8\x8e\x33\x93\xa1\xaa\x53\x2c\x57\xa9\x56\x75\x74\xdd\
+\x68\x08\xb8\x4e\x28\xb9\x24\x91\x8e\xf6\x30\x82\x20\xf2\x8b\xff\
+\xfc\x19\x93\x47\xa6\xa9\x46\xc3\xd4\x0d\x0b\xc1\xd0\xfe\xfe\x43\
+\x5f\x7e\xe8\x4f\x5f\xe9\x3e\x3c\x19\xff\xc7\x11\xe0\x6c\xb8\xff\
+\xe3\xef\x72\x09\x82\x74\x63\x31\x53\xfe\x2d\xb3\x52\xbe\x45\x92\
+\x0c\x55\x94\x2b\xb8\x9b\x3d\x04\xdb\x23\x04\x9a\x43\xd8\x82\xc0\
+\x62\xb6\x42\xa1\x54\xa7\x9a\x2b\x53\x59\xcc\x92\x99\x58\x20\x71\
+\x7c\x0e\xbf\x26\xd3\x1c\xf3\xd1\xb7\xa1\x87\xb6\x75\xdd\x78\xa2\
+\x3e\xdc\x01\xcf\x19\x3b\xca\xc6\x66\x76\x2e\x4b\xa5\x5a\x47\xd3\
+\x14\x62\x51\x1f\x8a\x2c\x71\xf0\xf1\xc3\xfc\xf2\x1b\x0f\x23\xc6\
+\xc3\xb4\x6c\xec\xe7\xb1\x6f\x3d\x56\x5d\x77\xd9\x96\x2d\xbf\xf1\
+\xff\xdc\xf3\x8a\x4a\xfe\x9e\x8f\x97\x85\x00\x3f\xf9\xcb\x3f\xd8\
+\xea\xf2\x07\x46\xaf\xfb\xc3\xbf\xbc\x64\x11\x2f\x5f\x08\x0f\x7c\
+\xe2\x77\x9a\x34\xaf\x4f\x31\x75\xf3\x57\x40\x7e\x5b\x62\xf4\xc8\
+\x0a\xbd\x9e\xf3\x3b\x03\x22\x91\xee\x30\xa1\xee\x66\xca\x06\xe4\
+\x0a\x8d\x30\xf0\xa6\x6e\xb0\x38\x36\x4f\xe2\xe8\x34\x85\x64\x0e\
+\xc5\x86\xb0\xdf\x49\x5b\x57\x94\xe6\xee\x28\xf1\xbe\x16\x3c\xb1\
+\x20\xbe\xa6\x20\xe2\x49\x59\x4a\x6c\xdb\xc6\x5a\x5a\x2d\xa6\xf7\
+\x8d\x11\xea\x6b\xe1\x9b\x1f\xff\x2a\x05\x44\xfa\x6e\xda\xc2\xde\
+\x5f\x1e\x20\x16\x08\x7e\xf1\xfd\x5f\x7e\xe4\x77\x5f\xce\xef\x3f\
+\x17\xfc\x7f\x6e\x05\x78\x31\x3c\xf0\x57\xef\x55\x34\x6f\xe8\x37\
+\xb2\x8b\x99\x5b\x65\xab\xbe\x7d\x61\x72\x38\xea\x0e\xcb\xc4\x07\
+\xe3\x68\x4d\x21\x72\x25\x63\x59\xc5\x6b\x59\x16\x95\x5c\x85\xcc\
+\x5c\x9e\xf9\xc9\x14\xf9\x64\x9e\x4a\x36\x47\xd0\xe7\xc4\x15\x0e\
+\x71\xf9\xb6\x4e\xba\x06\xe3\xf8\x22\x5e\x7c\x4d\x41\x6a\xc5\x0a\
+\x4f\xdd\xf3\x34\x07\x9f\x1c\xa2\x56\xae\x53\x77\x38\x08\xaf\xe8\
+\x40\x0b\xf9\x38\xf6\xf4\xf0\x58\xe7\x40\xff\x65\xef\xf9\xdc\x8f\
+\x17\x5f\xe9\x3e\x78\x3e\xfe\x7f\x45\x80\x93\x71\xff\x5f\xbd\x4f\
+\x96\x65\xc7\xf6\x4a\x3a\xfb\xce\x4a\xb1\xf8\x46\x41\xac\x05\x65\
+\x0f\xc8\x2d\x5e\x1c\x3e\x37\xa2\x2c\x9e\x22\x95\x44\x10\x28\xa5\
+\x4b\xcc\x8d\xce\x93\x9e\xcf\x91\x9c\xcd\x60\xd6\x75\xa2\x01\x05\
+\xd3\xb4\x48\xa4\x0a\xb8\x55\x19\x5f\xc0\x4d\x6b\x4f\x9c\xf0\x40\
+\x1b\xae\xa0\x87\x9f\xfe\xe7\x83\x6c\x5e\xb7\xe9\x7f\xbc\xf3\x0b\
+\x3f\xf8\xcc\x2b\xfd\xcd\x2f\x84\xff\xdf\x12\xe0\x64\x3c\xf0\x57\
+\xbf\xe7\x73\xa8\xee\xf7\x54\x73\xb9\x37\x97\x17\xa7\xd6\x8c\x4f\
+\x1c\xf3\x4a\x31\x2f\xf1\xc1\x76\x82\x2d\x61\x24\x59\x6c\x98\x83\
+\xd9\xcf\x29\xb0\x6c\xcb\xa6\x56\xac\x50\x2d\x55\x31\x6b\x06\x95\
+\x42\x19\x7f\x3c\x88\xe6\x75\xe2\xd0\x14\x6c\xdb\x66\xef\x4f\x77\
+\x63\x2d\x94\xf4\xd6\x55\xab\x7a\xde\xf5\xcf\x3f\x98\x7e\xa5\xbf\
+\xf3\x85\xf0\x7f\x09\xf0\x3c\xfc\xf0\x4f\xdf\xad\x5a\xba\xf1\x76\
+\x87\x24\x7d\x70\xe2\xc8\x81\x0d\x96\x06\xb9\x4a\x05\x2d\xe8\xa5\
+\xa5\xaf\x85\x48\x67\x6c\x29\x54\x3c\xbc\xa0\xcc\x59\x80\x6a\xa9\
+\xca\x33\x3f\x7a\x1a\x29\x5f\x60\xc5\x86\x6d\xff\xf8\xd6\x7f\xb9\
+\xe7\x8f\x5f\xe9\xef\x3a\x13\xfe\x2f\x01\xce\x80\x6f\x7f\xf0\xcd\
+\x92\x43\xd1\x36\x09\xb2\xdc\x56\x2f\xe7\x7b\x6a\x86\x79\xcd\x9e\
+\x5d\x7b\x5f\xeb\xf1\x29\x6a\xef\x96\xf5\xf8\x9a\x83\x28\x2e\x09\
+\x87\xc3\x3c\x91\x63\x9a\x4a\xbe\xcc\xe2\xd8\x3c\xf5\x99\x2c\xdd\
+\x1d\x6d\xb6\x2e\x87\xfe\x3c\x99\x98\xf9\x87\xdf\xfa\xf2\xcf\x5e\
+\x11\x83\xcf\x73\xc1\xff\x25\xc0\x79\xe0\xeb\x7f\xf8\xb6\x88\x55\
+\xa9\x7d\xb8\x96\xcb\xbd\x59\x34\x8d\xde\x7c\xa5\x82\x16\x10\xc8\
+\x94\xca\x78\x35\x09\xbb\xaa\x13\x08\x76\x11\xef\xe8\x3d\x2e\x28\
+\xd2\x9f\xde\xf4\xd1\xcf\x7c\xf7\x95\x6e\xf3\xd9\xf0\xff\x02\x14\
+\xde\x6f\x51\xdc\x5b\xdb\x3d\x00\x00\x00\x25\x74\x45\x58\x74\x64\
+\x61\x74\x65\x3a\x63\x72\x65\x61\x74\x65\x00\x32\x30\x31\x35\x2d\
+\x30\x37\x2d\x32\x35\x54\x32\x31\x3a\x35\x30\x3a\x33\x37\x2b\x30\
+\x38\x3a\x30\x30\x16\x98\xce\x7d\x00\x00\x00\x25\x74\x45\x58\x74\
+\x64\x61\x74\x65\x3a\x6d\x6f\x64\x69\x66\x79\x00\x32\x30\x31\x31\
+\x2d\x30\x35\x2d\x31\x38\x54\x32\x33\x3a\x31\x38\x3a\x30\x30\x2b\
+\x30\x38\x3a\x30\x30\x9d\x7a\x45\xbd\x00\x00\x00\x4e\x74\x45\x58\
+\x74\x73\x6f\x66\x74\x77\x61\x72\x65\x00\x49\x6d\x61\x67\x65\x4d\
+\x61\x67\x69\x63\x6b\x20\x36\x2e\x38\x2e\x38\x2d\x31\x30\x20\x51\
+\x31\x36\x20\x78\x38\x36\x5f\x36\x34\x20\x32\x30\x31\x35\x2d\x30\
+\x37\x2d\x31\x39\x20\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x69\x6d\x61\x67\x65\x6d\x61\x67\x69\x63\x6b\x2e\x6f\x72\x67\x05\
+\x0c\x9c\x35\x00\x00\x00\x18\x74\x45\x58\x74\x54\x68\x75\x6d\x62\
+\x3a\x3a\x44\x6f\x63\x75\x6d\x65\x6e\x74\x3a\x3a\x50\x61\x67\x65\
+\x73\x00\x31\xa7\xff\xbb\x2f\x00\x00\x00\x18\x74\x45\x58\x74\x54\
+\x68\x75\x6d\x62\x3a\x3a\x49\x6d\x61\x67\x65\x3a\x3a\x48\x65\x69\
+\x67\x68\x74\x00\x31\x32\x38\x43\x7c\x41\x80\x00\x00\x00\x17\x74\
+\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x49\x6d\x61\x67\x65\x3a\
+\x3a\x57\x69\x64\x74\x68\x00\x31\x32\x38\xd0\x8d\x11\xdd\x00\x00\
+\x00\x19\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x4d\x69\x6d\
+\x65\x74\x79\x70\x65\x00\x69\x6d\x61\x67\x65\x2f\x70\x6e\x67\x3f\
+\xb2\x56\x4e\x00\x00\x00\x17\x74\x45\x58\x74\x54\x68\x75\x6d\x62\
+\x3a\x3a\x4d\x54\x69\x6d\x65\x00\x31\x33\x30\x35\x37\x33\x31\x38\
+\x38\x30\x3e\x73\xe3\x36\x00\x00\x00\x13\x74\x45\x58\x74\x54\x68\
+\x75\x6d\x62\x3a\x3a\x53\x69\x7a\x65\x00\x32\x31\x2e\x35\x4b\x42\
+\x42\x5f\x07\xf3\xb3\x00\x00\x00\x58\x74\x45\x58\x74\x54\x68\x75\
+\x6d\x62\x3a\x3a\x55\x52\x49\x00\x66\x69\x6c\x65\x3a\x2f\x2f\x2f\
+\x68\x6f\x6d\x65\x2f\x77\x77\x77\x72\x6f\x6f\x74\x2f\x77\x77\x77\
+\x2e\x65\x61\x73\x79\x69\x63\x6f\x6e\x2e\x6e\x65\x74\x2f\x63\x64\
+\x6e\x2d\x69\x6d\x67\x2e\x65\x61\x73\x79\x69\x63\x6f\x6e\x2e\x63\
+\x6e\x2f\x73\x72\x63\x2f\x35\x30\x30\x32\x2f\x35\x30\x30\x32\x36\
+\x31\x2e\x70\x6e\x67\x85\x12\x09\x19\x00\x00\x00\x00\x49\x45\x4e\
+\x44\xae\x42\x60\x82\
+\x00\x00\x08\x19\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xd6\xd8\xd4\x4f\x58\x32\
+\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
+\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
+\x79\x71\xc9\x65\x3c\x00\x00\x07\xab\x49\x44\x41\x54\x58\xc3\xad\
+\x57\x5b\x50\x93\x67\x1a\xf6\xca\xce\xec\xcc\xf6\x62\x2f\xbc\xd9\
+\xe9\xce\xec\x6e\xbd\xda\xd9\x9b\xb5\xce\xba\x3b\x7b\xb0\xad\xcc\
+\x7a\xb1\xce\xce\x3a\xb3\x76\x54\x70\x75\xdb\xe2\x81\xd6\xb6\x54\
+\x04\xbb\xa5\x20\x6d\xc1\x82\x06\x08\x07\x51\x42\x80\x80\x80\x02\
+\x21\x81\x10\x92\x40\x48\x10\x73\x24\x21\x67\x72\x80\x04\x42\x20\
+\x9c\x09\x47\xb5\x54\x78\xf6\xfb\x7e\x13\x16\x30\x58\x8b\x7d\x67\
+\x9e\xf9\x2f\x92\xfc\xcf\xfb\x3e\xcf\xfb\xbe\xdf\x97\x5d\x00\x76\
+\xfd\x98\x20\xf1\x0b\x82\x14\x02\x03\xc1\x75\x82\x03\xcf\xfd\xfe\
+\x8f\x48\xbc\x9b\x20\xe1\x57\xaf\xef\xb5\x2a\x8c\xd6\x65\xdb\x02\
+\x60\x19\x1e\x5b\x09\x27\xf1\x33\xfa\x19\x81\x22\xfc\xdc\x3e\x76\
+\x48\x7e\x8a\xa0\xb9\xb6\x59\x1c\x32\xcf\xad\x42\x39\xfe\x1d\x44\
+\xf6\x51\xd8\xc7\xe6\xe8\x87\x86\x3d\x7b\xf6\x58\x53\x52\xae\x2c\
+\xca\x3a\x3a\x10\x4e\xe2\xe5\x49\xc3\xc4\x31\x04\xb7\x3e\x49\xf9\
+\x2c\x60\x9b\x5d\x59\x53\x4d\x03\x4d\xb6\x11\x34\xeb\xfb\x20\x31\
+\x79\x60\x19\x9d\xc5\xbb\xef\xbe\x3f\xc5\xab\xbe\x83\xf1\x89\x29\
+\x4c\x4f\xcf\xae\x92\xef\xd7\xbc\x74\x02\x11\x9f\x0f\xbe\x1d\xe3\
+\xb2\x04\x43\x4f\xb4\x33\x40\x8b\x7b\x06\xcd\x3d\x2e\x34\xeb\xec\
+\xa8\x57\xf6\x20\x87\x53\x85\x32\x5e\x35\x43\xbc\xb0\xf4\x90\x81\
+\xc1\x60\x5c\x26\xbf\x4b\x7c\xe1\x04\x48\x1c\x24\x38\x41\xfd\xdd\
+\xea\x73\x27\xf1\xb9\x27\x04\x48\x87\x97\xc1\xd7\xbb\x20\x22\x55\
+\x37\xdc\x37\xa2\xb8\x4e\x88\x2c\x56\x3e\xcc\x56\xdb\x3a\x71\x04\
+\x2c\x16\x6b\x2c\xfc\xce\xe7\x27\x10\x91\x36\x93\x95\x3f\x46\x7d\
+\xa5\xfe\x12\xc4\x6f\xf4\x59\x31\xb6\x02\x7e\xef\x20\x5a\x7b\x9c\
+\xe0\x3f\x30\xa1\x4c\x28\x43\x46\x0e\x1b\xb2\x0e\xf9\x26\xd2\xf9\
+\xc5\x65\xcc\x2d\x2c\x21\x34\xbf\x88\xbd\x7b\xf7\x5a\xc9\x3b\x7e\
+\xba\x6d\x02\x24\x7e\x43\x90\x46\x3d\x35\x13\x69\x75\xb3\x80\xd2\
+\x3f\x0f\xcb\xc4\xe2\x9a\x50\xa1\x5a\xb4\x6c\xf1\x59\xa0\xb6\xa0\
+\xa6\x5d\x8d\x2f\xb2\x73\x71\xb7\x9e\xff\x0c\x31\x25\x9d\x09\xcd\
+\x63\x62\x6a\x06\x83\x43\x81\x27\xe4\xdd\xbc\x2d\xd3\xb0\x3b\x92\
+\x03\x33\x26\xd4\x53\xb5\xd3\xfb\x58\x4f\x88\xc5\x03\x21\x88\x2c\
+\x43\x50\xba\x46\xd0\xed\x09\x42\xe5\x9b\x42\x9b\x73\xfc\xa9\xcf\
+\x5a\x1b\xee\x2a\x74\xc8\xbc\xc9\x45\x09\xa7\x6c\x93\xcf\x9b\x88\
+\x27\xa7\x11\x18\x1d\xc3\x80\x6f\x08\xa2\xd6\xd6\x25\xc2\x51\xdb\
+\x28\x12\x87\xc6\x1f\xaf\x82\x2f\x62\x94\x4d\x89\x24\x90\x22\xea\
+\x52\x2d\x9a\x42\xab\xe8\x18\x79\x04\xa1\xc5\xcf\x10\x53\x74\xf6\
+\x0d\xa3\xd3\xe1\x87\xd4\x3c\x80\x16\xbd\x03\x0d\x5d\x06\x14\xd5\
+\x0a\x90\x91\x95\x0d\x2f\x79\xf1\xc6\xaa\xa9\xd4\xb3\x73\x0b\x4c\
+\xc5\x94\xd8\xdd\xef\x85\xc9\x62\x05\xb7\xbc\x12\xa5\xe5\x95\x4b\
+\x13\xf3\xcb\xab\x23\x0f\x01\x37\xd9\x11\xe6\xd9\x15\x84\x97\x15\
+\x13\x06\xcb\x3c\xd0\x68\xf2\xa3\xdd\xee\x5f\x27\x96\x3b\x86\x20\
+\xb3\x78\xd7\x7d\xe6\x08\xa4\xf8\x3c\x33\x1b\x2a\x8d\x36\xaa\xdc\
+\x53\x33\x21\x8c\x8e\x8d\x33\x15\xd3\x26\xe4\x37\x09\xf1\xc1\xc5\
+\x8f\x51\x73\xaf\x01\xbe\x65\x60\xfc\x11\xa0\x23\x13\x23\xf2\xce\
+\xa1\xbe\x5d\xb9\xb8\x51\x01\x83\x81\x74\x74\x4d\xa7\x1e\x0a\x67\
+\x80\xa9\xb8\xdd\xea\x83\xd8\xe8\x42\x93\xca\xcc\xf8\x7c\xe5\xcb\
+\x2c\x88\xda\x24\x51\x89\xa7\x67\xe7\x18\x1b\x86\x86\x47\x60\x77\
+\x38\x49\x82\x3a\x24\x7c\xf8\x21\xae\xb3\x0b\xe1\x99\x5c\x80\x6f\
+\x09\xd0\x90\xde\xe1\x0f\x2c\x81\xab\x1f\xc4\x7d\xef\x04\xdd\x07\
+\x1d\x61\xeb\xff\x9f\xc0\x1d\xb9\x16\x1d\xf6\x21\x48\xcc\xfd\x4f\
+\x7d\xee\xd4\x22\x9d\x55\x84\xaa\x9a\xba\x4d\x3e\x47\xe4\x8e\xf8\
+\x3c\x3c\x12\x84\xd3\xdd\x0f\xbd\xc1\x88\xc2\xe2\x62\x9c\x7e\x2f\
+\x1e\x3d\x03\x01\xf4\x2f\x02\x83\x84\xbc\xc5\xff\x2d\xee\x3a\x43\
+\x28\x51\x91\xf7\xf6\x05\xf1\x4e\xdc\xbf\x7d\x84\x33\x69\xe3\x20\
+\x18\xf4\x33\xab\xe0\xc9\x54\x68\x35\x38\xd1\xd8\xdd\x0b\x9e\x58\
+\x89\xac\x5c\xf6\x33\x3e\x47\xaa\x9e\x9c\x9e\x65\xe4\xee\xf7\x0e\
+\xa2\xd7\x6c\x41\x43\x03\x1f\x27\x62\xe3\x20\xe9\xd6\xc0\x45\xcf\
+\x01\x52\x90\x24\xb8\x86\xb2\x9e\x00\x6e\xb4\xdb\x50\xd1\x1b\x44\
+\x85\xce\x8b\x4a\x7e\x0b\x6d\xbe\x9b\x5b\x27\xd1\xa0\x99\xf8\x16\
+\x65\x22\x05\xee\x29\xf4\x28\x13\xc8\x90\x78\x35\x0b\x1a\xad\x3e\
+\xaa\xdc\x63\x13\x93\xf0\x0d\x0d\xc3\x66\xef\x83\xb4\x5d\x8e\xc4\
+\x4b\x97\x90\xc3\xca\xc3\xd4\x63\xc0\x4e\x7a\x49\x31\x4e\xfa\x89\
+\x94\x7f\x5b\x3b\x84\x7c\x85\x13\x25\x6a\x1f\x4a\xd5\x03\xe8\xf2\
+\x30\xa3\x28\x22\xf8\xf9\x33\x09\x74\x8f\x2e\xa1\xa8\xbe\x15\xa5\
+\x7c\x09\xb2\x4a\x2a\xf0\xcf\xe3\x71\x51\xe5\xf6\x07\x46\xd1\xe7\
+\xf2\x40\xab\x37\x20\xfd\x6a\x06\x92\xbf\x48\x83\xcd\x37\x02\x27\
+\xa9\xda\x40\x1a\x4c\xe0\x7b\x88\x52\x9d\x1f\x45\xdd\xfd\x0c\x71\
+\x41\x97\x1b\xc5\xdd\x1e\x88\x9c\x41\xfc\xf9\xcd\xb7\x5d\x84\xeb\
+\x6c\xb4\x43\xd0\x28\xf7\x4e\x23\xa7\xfc\x1e\xb2\x4b\xab\xf1\x51\
+\xea\x57\x48\xfe\x6f\xea\xfa\x58\x51\xb9\x47\x82\xe3\xf0\x0c\xf8\
+\x60\x34\x99\x51\xc9\xab\xc2\xfb\x67\xcf\x41\xfe\x40\x03\x3f\xe9\
+\x6e\xb2\x8d\x19\xb9\x6f\x69\x06\x19\xd2\x9b\x2a\x2f\x72\xe5\x0e\
+\xe4\x75\xf6\xa1\xf0\xbe\x1b\x1c\x95\x1b\xf9\x9c\xca\x29\xc2\x53\
+\xb8\xdd\x29\xdc\x2b\x76\x04\x90\x51\xc8\xc5\x95\x6b\x79\x38\x11\
+\x9f\x80\x9b\xb7\x6e\x33\x63\x15\x91\xdb\x6a\x73\x40\x22\x6d\xc7\
+\x85\x84\x0f\x50\x74\xbb\x0c\xf3\x2b\x80\x9f\x34\x58\xf7\x24\x20\
+\x1c\x7c\x84\x4a\xd3\x18\x38\xfa\x61\x86\x9c\x56\xfd\x55\xb3\x1e\
+\xac\x0e\x3b\xb8\x3a\x1f\xd9\x21\x1e\x7a\x2f\xe0\x13\xbc\xba\x5d\
+\x02\x26\xbe\xc1\x83\x94\x6f\xd8\x38\x9f\x9c\x8a\x03\x7f\x3d\x04\
+\x63\xaf\x99\xe9\x6e\x2a\xb7\x46\xd7\x83\xa4\xcb\xc9\x48\xff\x3a\
+\x8b\x8c\xd5\x3c\x53\xb5\x71\xf6\xa9\xdc\x35\xf6\x69\x5c\x97\x59\
+\x19\xd9\xbf\x6e\x21\xa7\xa0\xd4\x82\x74\xbe\x1a\x57\x9b\x34\x60\
+\xc9\xcc\x10\xbb\x82\xf8\xe5\xaf\x5f\xa7\x67\xc0\x3b\xe1\x75\x1f\
+\x35\xcc\x35\xdd\x66\x7c\x94\x96\x85\xb8\x73\x17\xf1\x97\x43\x31\
+\x4c\xd5\x74\x99\xf0\xaa\xaa\x71\xfa\xf4\x19\x68\xcc\x0e\x8c\x92\
+\x2d\x36\x14\x1e\xab\x5a\xc7\x0c\x78\xe6\x71\x70\x0d\x23\x4c\xa3\
+\x65\x8a\x0c\x8c\xec\xb4\xfa\x9c\xb6\x5e\x94\x74\x39\xd0\x66\xf7\
+\xaf\x1e\x3d\x11\x4b\x47\x2e\x6f\xc3\x79\x13\x35\x2c\x5c\x99\x1a\
+\xf1\x97\x3e\xc7\xd1\xd8\x33\xf8\x38\x31\x09\x86\x5e\x13\x1a\x9b\
+\x04\xf8\xdd\x1b\xfb\x51\x4f\xd4\xf1\x90\x99\xee\x9a\x00\xaa\xad\
+\x93\x60\x2b\x5d\x0c\x39\xf5\xbc\xf0\xbe\x67\xbd\xea\xcc\x16\x3d\
+\x4a\x55\x1e\x08\x6d\x01\x94\xd4\xf1\x43\xe1\x65\x53\x40\xf0\xca\
+\xf7\x25\x60\x2b\x6e\x6a\xc7\xa9\x84\x44\xc4\x1c\x39\x8a\xdc\x7c\
+\x36\x5a\x5a\xc5\x38\x14\x13\x83\x2f\x39\x35\xc8\x14\x6a\x98\xe6\
+\xa2\xd5\xd2\x27\xf5\x9a\x7a\x4c\x13\xa1\x49\x64\xb7\x99\x90\xdb\
+\x6e\x46\xb9\xda\x8d\x06\xa5\x76\x39\x2c\x39\x3d\xf9\x4e\x13\xec\
+\xd9\x72\xd4\x47\x0d\x3b\xab\x46\x88\x63\xff\x39\x8f\xdf\xee\xfb\
+\x3d\x1a\xf9\x02\x9c\xbf\x90\x80\x93\xf1\x17\x70\xa3\xad\x07\x19\
+\xc4\x4f\x4a\x14\xe9\x6e\xba\x58\xa8\xef\x2c\xfa\x94\x98\x50\x28\
+\xb7\x40\xe9\x0e\x3c\xf9\x57\xec\x29\x2a\x77\x2d\xc1\x67\x04\xfb\
+\xb6\xb9\xe4\x44\x8d\xbe\xcc\xb2\x5a\xfc\xe3\xe4\x19\x1c\x3c\xf4\
+\x37\xb0\x72\xf3\xb0\xef\xc0\x1f\x50\x20\xd1\x21\x89\x27\x65\x2a\
+\xa6\x4b\x85\x3e\xbf\x21\xd5\x46\xe4\x2e\x90\x5b\x21\xb0\x0c\xae\
+\xe5\xdc\xe2\xd2\x11\x13\x13\xe4\x87\x6f\x3c\xaf\x3c\xe7\x96\x15\
+\x35\x9c\x69\x45\xe5\xf8\xfb\xb1\x58\x1c\x3f\x19\x87\x37\xf6\xef\
+\xc7\x8d\x3a\x11\x92\xab\xa4\x0c\x21\xed\x70\xea\x35\x55\x21\x8b\
+\x34\x5b\xc9\x03\x37\x2a\x34\x6e\xd4\x49\x3a\x17\xc3\x72\x73\x08\
+\x8e\x6d\x95\xfb\x87\x24\xe0\x4a\x65\x73\x70\xe4\xf8\x29\x1c\x3e\
+\x7c\x98\x8c\x63\x2e\x32\x05\x2a\x5c\x22\xd5\xd3\x5d\x7e\x4d\xdc\
+\x0b\x36\xe9\x74\x76\xa7\x1d\x77\x8c\xe4\x88\xb6\xf9\x9e\x84\xb7\
+\x1a\x95\xfb\x22\xbd\x49\xfd\x80\x0b\x6d\xf4\x04\x32\x4a\x78\x4c\
+\x0f\x9c\x4b\x49\xc3\xb5\xa6\x2e\x7c\xc2\x6d\x65\x36\x59\xf1\x83\
+\x01\x5c\x97\x9a\xc1\x51\x7b\x20\xf3\x04\xd7\xce\x25\x26\x05\x36\
+\xc8\xfd\xc7\x9d\xc8\x1d\xd5\x82\xdc\x1a\x01\xce\x5e\x4e\x45\x81\
+\x58\x85\x78\xf6\x5d\x5c\xa9\x55\x90\xaa\xfb\xc0\x96\xdb\x50\xad\
+\x75\xe3\xae\x54\x41\x2f\x10\xca\x0d\x72\xbf\xba\xd3\x6a\xa3\x05\
+\xb7\xa2\x51\xf8\x1d\xaf\x43\x8d\x4f\xb9\x2d\x88\xcb\xe6\xe1\x9a\
+\x48\x8f\xaa\x1e\x2f\x9a\x35\xe6\xc7\x7f\x7a\xf3\x2d\x57\x78\xac\
+\xa8\xdc\xaf\xbd\xac\xdc\xd1\xe2\x08\xdd\x05\x5c\x75\x1f\xde\xcb\
+\xaf\x45\xb9\x76\x00\x32\x67\x60\xf5\xc2\xa7\x97\xa9\xdc\xf7\x08\
+\xd2\xa9\xdc\x3b\xf8\x03\xf3\xc2\xf1\x13\x82\xca\x1c\xee\x9d\x50\
+\x0b\x39\x94\xb8\x0d\xc2\xc8\x16\xa3\x17\x87\xc3\x2f\x22\xf7\x0e\
+\xff\xda\x6d\x8a\xdd\x61\x99\xd5\x1b\xb6\xd8\x6b\xbb\x5e\x32\xbe\
+\x2f\x89\xff\x01\x66\xb9\x5f\xfc\x11\x80\x3d\xcf\x00\x00\x00\x00\
+\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x2b\x28\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x80\x00\x00\x00\x80\x08\x06\x00\x00\x00\xc3\x3e\x61\xcb\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x00\x48\x00\x00\
+\x00\x48\x00\x46\xc9\x6b\x3e\x00\x00\x00\x09\x76\x70\x41\x67\x00\
+\x00\x00\x80\x00\x00\x00\x80\x00\x30\xe1\x31\x9a\x00\x00\x2a\x51\
+\x49\x44\x41\x54\x78\xda\xed\x7d\x77\x98\x24\x57\x75\xef\xef\xdc\
+\xaa\xae\x9e\xee\xe9\x49\x3b\xb3\x79\xb4\xda\x9d\xd5\xac\xb4\x4a\
+\x2c\xb2\x92\x25\x04\xb2\x24\x78\xa0\x07\x08\x09\x49\x2c\x98\x67\
+\x92\x64\x82\x0d\x3c\x07\x30\x0f\x63\x6c\x78\x7e\xc6\xdf\x23\x07\
+\x05\x04\x06\xc9\xd8\x96\x8c\x16\x21\x40\x02\xf9\x23\xca\x48\xb2\
+\x41\xc2\x28\x21\x69\xc3\xec\xb2\x39\x4c\x9e\xee\xe9\x50\x55\xf7\
+\x9e\xf7\x47\xa7\x0a\xb7\xaa\xab\xa7\x67\x03\x0f\x9d\xef\xab\x99\
+\xae\x9b\xea\xde\x73\xce\x3d\xe9\xde\x5b\x05\x3c\x0f\xcf\xc3\xf3\
+\xf0\xdb\x0b\x74\xbc\x3b\x70\xb4\xe1\xc7\x07\x8a\x46\xc1\x56\x43\
+\x4a\xf1\x52\x47\xaa\xbe\x8a\xe4\xee\x8a\xab\xd2\x87\xf2\x4e\x8f\
+\xed\xa8\x6e\x47\x2a\xe1\x4a\x2e\x9b\x84\x59\x83\x68\xde\x95\x6a\
+\x5e\x2a\x2e\x48\xc9\x33\xae\x54\x53\x9f\x79\xd5\xba\xc2\xf1\x1e\
+\xc3\xd1\x84\xff\xaf\x18\xe0\x89\x19\x7b\x8d\x45\x38\x7d\xde\xe5\
+\x0d\x15\xc9\x67\x82\x79\x54\x2a\x5e\x5d\x91\x3c\x54\x72\x54\xb6\
+\xe4\x2a\xab\xe4\x28\x2a\x39\x0a\x25\x5b\xa2\xec\x28\x54\x6c\x05\
+\x5b\x2a\xb8\x92\x21\x25\x43\x2a\x05\x29\xd9\x91\x8a\xe7\x95\xe2\
+\x71\xa9\x78\xbf\x52\xbc\x4b\x29\xfe\x55\x77\xda\x78\x42\x2a\xde\
+\x63\x0a\xda\xf3\x85\xab\xd7\x97\x8f\xf7\x78\x17\x03\x7e\xa3\x19\
+\xe0\xd9\x82\xbb\xa2\x47\xd0\x25\x25\xc5\x2f\xef\x36\xe8\x22\x83\
+\x70\xb2\x64\xee\xb2\x25\x53\x45\x32\xca\x92\x51\x76\x19\x25\x57\
+\x55\x2f\x47\xa1\xe8\x54\xff\x57\x1c\x85\x8a\xab\x50\x76\x14\xca\
+\xb6\x82\x23\x15\xdc\x3a\x23\x28\x86\xaa\x33\x83\x62\xa8\xc6\x05\
+\x28\xc5\x05\xc5\xbc\x8b\x81\x27\x2c\x53\x7c\x2f\x65\xd0\xa3\xa6\
+\x41\xbb\x6e\xb9\xe6\x14\xf7\x78\xe3\x63\x21\xf0\x1b\xc7\x00\x4f\
+\xce\x38\xc3\x19\x93\x5e\xd5\x9b\xa2\xd7\xf7\x99\x74\xae\x41\x94\
+\x91\xcc\x70\x15\xe0\x30\x60\x2b\x86\xa3\x18\xae\xaa\xa5\x29\x05\
+\xa5\x00\x66\x80\x01\x48\x55\x25\xb0\xab\x50\x2b\xa3\xe0\x48\xc0\
+\x96\x0a\xb6\xcb\xa8\xb8\x55\xe9\x90\xaf\x48\xcc\x95\x1c\xcc\x95\
+\x65\x53\x5a\xb8\x0a\x4a\x31\x98\x19\x8a\x1b\x5d\x9a\x03\xf0\x14\
+\x80\xfb\xbb\xd3\xc6\x77\x4c\x83\xb6\xde\x72\xcd\x29\xce\xf1\xc6\
+\x53\x52\xf8\x8d\x60\x80\x47\x27\x2a\xe9\x8c\x49\x97\x5b\x86\xf8\
+\xc3\xa5\x69\xba\x22\x63\x50\xb7\x41\x04\x83\xaa\x84\x95\x0c\x48\
+\x66\x38\xaa\x5a\xde\x61\x46\xc9\x65\x54\x5c\x46\xd1\x05\x0a\x8e\
+\xc2\xbc\x5b\x95\x08\xae\xaa\x96\x57\x0c\x28\xa0\xca\x15\x54\x45\
+\x04\x01\x10\x04\x08\x00\xa6\x00\x0c\x30\x0c\x02\x1c\x57\xa1\x6c\
+\xbb\xc8\x97\x1c\x4c\xcf\x3b\x38\x3c\x5b\xc1\x4c\xc9\xc5\xbc\x2d\
+\xbd\x8c\x00\x00\x45\x00\x3f\xb7\x4c\xf1\xb5\x94\x41\xdf\xfb\xd2\
+\x75\xa3\x07\x8f\x37\xee\x5a\xc1\x09\xcd\x00\x3f\x39\x50\xec\x49\
+\x99\xe2\x75\x4b\xd2\xc6\x7b\xfb\x52\xb4\xd1\x32\xc8\x48\x09\x42\
+\x8a\x00\x93\x08\x0c\x86\x00\x21\xef\x2a\x14\x6c\xc6\x44\x59\x61\
+\xa2\xdc\x24\xb6\x2d\xab\xf4\xed\x14\xea\x0c\x61\x0a\x82\x45\x80\
+\x49\x0c\x25\x25\x66\x0a\x15\x1c\x9a\xad\x60\xff\x74\x19\xb3\x25\
+\x17\xb6\xf4\x3d\x6d\x2f\x80\xbb\xba\xd3\xc6\x97\xbe\x74\xdd\xe8\
+\xf6\xe3\x8d\xcb\x28\x38\x21\x19\xe0\x5b\x3b\xf3\x7d\xe9\x94\x78\
+\x7d\x7f\xda\xf8\x9f\xb9\x94\x18\xed\x32\x48\x58\x06\x21\x6b\x56\
+\x89\x6f\x09\x42\xc1\x61\x8c\x97\x15\xf6\x15\x24\xa6\x2b\x0a\x25\
+\x97\x17\x85\xd8\x49\x41\x00\xb0\x0c\x42\x5a\x00\x16\x31\xf2\x45\
+\x1b\x07\xa7\x4b\xd8\x3d\x59\xc2\x74\xd1\x85\xdb\x14\x0d\x13\x00\
+\xb6\xe4\xd2\xc6\xe7\x6f\xbb\x6e\xf4\x99\xe3\x8d\xdb\x20\x9c\x50\
+\x0c\x70\xc7\xaf\xa6\x73\x29\x53\xbc\xae\x37\x6d\xfc\x79\x36\x25\
+\x4e\xcd\x98\x44\xdd\x29\x81\xde\x94\x40\xaf\x25\x60\xbb\x8c\x23\
+\x65\x85\x3d\x79\x89\xa9\x8a\x82\xa3\x4e\x8c\x01\x30\x00\x4b\x00\
+\x19\x83\x60\x91\xc2\x74\xbe\x8c\x5d\xe3\x45\xec\x9d\x2a\xa3\x54\
+\xd7\x4b\xc0\x2c\x80\xaf\xe7\xd2\xc6\xa7\x6e\xbb\x6e\xf4\xb9\xe3\
+\xdd\xe7\x3a\x9c\x08\xf8\xc3\x2d\xbf\x9c\x20\x97\xf1\xd2\xac\x65\
+\x7c\xa4\xdb\x12\xe7\x67\x4c\x21\x72\x96\xc0\x50\xc6\xc4\x50\xda\
+\x40\xd1\x65\xfc\x7a\xce\xc5\xe1\x92\x42\x45\x26\xef\xf9\x62\x0d\
+\x2e\xb1\x64\xa9\x15\xec\x32\x80\xac\x09\xd8\x15\x07\xbb\x8e\x14\
+\xb0\xf3\x48\x09\x05\xbb\xde\x71\x4c\x00\xb8\x75\xa0\xdb\xfa\xdc\
+\x4d\x57\x8f\x8c\x1f\x23\x14\x1f\x75\x1c\x2d\x18\xfe\xfe\x91\xc3\
+\xab\x99\xf0\xd1\xac\x65\xbc\x3e\x93\x12\x99\x5c\x5a\x60\x38\x97\
+\xc2\xaa\x5c\x0a\x25\x17\xd8\x39\x27\x31\x59\x56\x41\x63\xeb\xb8\
+\x0c\xac\x5d\x15\x63\x0a\x20\x67\x02\xec\xba\xf8\xf5\x91\x02\xb6\
+\x1f\x2e\xa2\xd0\xe0\x60\x3c\x6b\x99\xe2\x43\xd9\xb4\xf1\xed\x9b\
+\xaf\x5e\x7f\xdc\x5c\xc8\xe3\xc6\x00\x1f\x7d\xf0\x80\xe1\x28\x7e\
+\x2d\x40\x1f\x4b\x5b\x62\xa4\xdb\x32\xb0\xa6\xcf\xc2\xe8\x40\x1a\
+\x0e\x13\x76\xcd\x55\x75\x3b\x47\x75\x92\x62\x6f\x8f\x3a\x70\xc2\
+\x44\x06\x60\x12\xd0\x6d\x12\x84\x74\x31\x76\x38\x8f\xed\x87\x8b\
+\x75\xd5\x50\x01\x70\x77\x77\x97\xf9\x81\x2f\x5d\x7b\xca\xfe\x63\
+\x3c\x04\x00\xc7\x89\x01\x3e\xfc\xa3\xfd\x83\xf3\xb6\xfc\x98\x69\
+\xd0\x1f\x18\x86\x48\x2f\xcb\xa5\xb0\x69\x45\x16\x19\xcb\xc4\xee\
+\xbc\xc2\x74\xa5\xa1\x37\xa3\x3b\x48\x68\x5d\xe6\x28\x03\xb7\x4c\
+\xf0\x27\x19\x04\xf4\xa4\x00\xb7\x62\xe3\x99\x7d\x73\xd8\x33\x5d\
+\x81\xac\x8a\xb6\x6d\x96\x29\xfe\xec\xf6\xcd\x1b\xee\x3b\xd6\x63\
+\x38\xe6\xb8\xfb\x93\xfb\x77\x9f\xaf\xc0\x37\x19\x42\x9c\xdb\x95\
+\x12\x38\x6d\x59\x06\xa7\x0c\x66\x70\xb8\xcc\x18\x2f\xb5\x16\xf5\
+\xd4\x41\x8f\xdb\xa9\xba\x50\x8f\x82\x13\x54\xb4\x0c\x42\xaf\xc9\
+\x18\x9f\x29\xe2\xc9\xbd\x79\xcc\x96\x5c\x00\x98\x07\xf0\x89\x81\
+\x5c\xea\xe3\x37\xbd\x66\xfd\xfc\xc2\x47\x79\xf4\x70\xd2\x31\xbc\
+\xfb\xdb\xbb\xde\xa0\x18\x9f\x35\x0c\x1a\x1a\xec\x4e\xe1\x9c\xe1\
+\x1c\xac\x54\x0a\x7b\xe7\x25\x6c\xe9\xe9\x4c\xc2\x5e\x75\xdc\xf9\
+\x7a\x03\x1d\xfa\x8f\x6d\x55\xe7\x66\xf9\x5c\x0a\x48\xb1\xc4\xb3\
+\x7b\xe7\xb0\x6b\xa2\x08\xc9\x50\x00\xbe\xb3\x24\x67\xbd\xfd\x0b\
+\xaf\x19\x39\xdc\xe9\xf0\xda\x41\xc1\x51\x85\x3f\xbd\xef\xd7\xe9\
+\xb9\xb2\xfb\x7e\x43\xd0\xff\x32\x0d\xca\x8c\x0c\x66\x70\xe6\xea\
+\x1e\x4c\xd8\xc0\x8c\x47\xdc\x27\xea\xd8\x31\xb4\xfe\x75\x90\x88\
+\xd8\x9c\x3c\xd9\x20\x42\x7f\x8a\x31\x3e\x5d\xc4\xe3\x7b\xe6\xea\
+\xb6\xc1\x7f\x59\xa6\x78\xcb\xed\x9b\x37\x3c\x79\x14\x87\x72\xd4\
+\x71\x05\x00\x78\xef\x77\x76\xf5\xcc\x15\xdd\x4f\x0a\x81\xb7\x76\
+\xa5\x0c\x63\xd3\x70\x0e\xcb\xfb\xb3\x38\x54\x52\xf0\xd2\x3e\xae\
+\x23\x14\x79\xb3\xb8\x03\x5f\xb4\x40\x12\xb7\x6e\xcf\x9b\x47\x00\
+\x72\x26\x01\x8e\x8d\x5f\xfe\x7a\x06\xe3\x05\x07\x00\xf6\x5a\xa6\
+\x78\xf3\xed\x9b\x37\xfc\x68\xb1\xba\x95\x14\x0f\x8b\x06\xef\xfe\
+\xd6\xce\xfe\xd9\xa2\xf3\x65\x41\x74\x4d\x2e\x6d\xd0\xf9\xeb\xfa\
+\x90\xca\xa4\x31\x51\x52\xa8\xd3\x3e\x49\x07\x28\x41\xc1\x13\xc2\
+\x0b\x08\x96\x49\x50\xc8\x5b\xa4\x4b\x10\xba\x0d\x85\x67\xf6\xcc\
+\x60\xf7\x64\x19\x0c\x4c\x5a\xa6\x78\xeb\xed\x9b\x37\x7c\xfb\x68\
+\x8d\xe3\xa8\xe1\xed\x8f\xef\xdd\xd9\x3f\x5d\xb0\xef\x10\x82\x5e\
+\x3d\xd8\x9d\xc2\x79\xeb\xfa\x51\x11\x26\x66\x6d\xd6\x1a\x72\xb1\
+\x1d\xe9\xc0\xe5\xeb\x74\x80\xed\x4a\x05\x4e\x58\x39\xca\x8d\x34\
+\x04\xd0\x9f\x02\x76\x1f\x9a\xc3\xd6\x43\xf3\x90\x8c\x19\xcb\x14\
+\x6f\xbb\x7d\xf3\x86\x7b\x3a\x1c\xca\x51\xc1\x8f\x16\xfe\xe8\xde\
+\x9d\x7d\xd3\x05\xfb\x0e\x02\xae\x5a\xde\x6b\xe1\x9c\x91\x01\xe4\
+\x95\x40\xc9\xe5\xc8\xa7\x52\x44\x46\x92\xd9\x7f\x4c\x06\x85\x05\
+\xaa\x08\x8e\xaa\xc7\x91\x6e\x24\x01\x18\x48\x13\xc6\x27\xe7\xf1\
+\xd4\xbe\x3c\x5c\xc5\x33\x35\x75\xf0\xad\xc5\x1e\xd3\xa2\xe3\xea\
+\x5d\xdf\x1c\xeb\x9e\x99\x77\xbe\x04\xe0\xf5\x2b\x7a\x2d\x6c\x5a\
+\x37\x80\x19\x97\x60\x7b\xf5\x7d\x4c\x64\x27\x2a\xeb\xb8\x87\x2c\
+\xdb\x04\x6e\xfc\xd1\xa4\x23\x3a\xd3\x9b\x3a\x90\x26\xcc\xce\x54\
+\x8d\x43\x57\xf1\x94\x65\x8a\xd7\xdd\xbe\x79\xc3\x0f\x16\xb3\x9f\
+\x8b\x8a\xd7\x77\x7d\x73\xcc\x9c\x99\x77\x3e\x05\xe0\x8f\x97\xf7\
+\x5a\x74\xf6\xda\x3e\xcc\xb8\x02\x6e\xc0\xd0\xd7\xcd\x6a\xd2\xfc\
+\x0a\x26\xb5\xea\xec\xb1\x64\x92\x56\xd2\x80\x63\x0b\xb2\x3e\x4b\
+\x23\x2d\xfa\x2d\x42\x3e\x5f\xc2\xe3\xbb\xe7\xe0\x2a\xde\x9f\x32\
+\xc5\x2b\xef\xd8\xbc\xe1\xf1\xc5\x1a\xc7\xa2\xe2\xec\x4d\x77\x6d\
+\x7b\xaf\xe3\xaa\x8f\x2f\xed\xb1\x52\x75\xe2\x4b\x9d\x97\x17\x49\
+\x50\x4a\x64\xf1\x2f\xb4\xd3\x0b\x0d\x04\x31\x33\x9c\x7c\x1e\xd2\
+\xae\x80\x5d\x17\x24\x04\x44\x57\x06\x56\x4f\x0e\x44\x42\x5b\x27\
+\xb2\x31\xe8\xc9\xcf\x31\x65\xfb\xd2\x84\xc2\x5c\x11\x4f\xec\xc9\
+\x43\x2a\x7e\x6a\xa0\xc7\x7a\xd9\x4d\x57\x8d\x1c\x5a\x20\x1a\x16\
+\x05\x97\x21\x78\xd3\x5d\xdb\x5e\xe9\xb8\xea\xce\x81\x8c\x99\xdb\
+\x34\x32\x80\x59\x49\xda\xe5\xda\xb8\x48\x9e\x4f\x09\x74\x18\xea\
+\x5d\x8c\x81\x29\xd7\x41\xf9\xd0\x41\x74\xdb\x25\xac\x1a\xcc\x62\
+\xa8\x3f\x87\x6c\x97\x05\xdb\x71\x71\x64\xba\x80\x83\x13\x05\xcc\
+\x99\x19\x58\x2b\x56\xc0\x48\x59\xda\x36\x38\xe2\x47\x1c\xb3\xb0\
+\xa6\x8d\x81\x34\x61\x7a\xba\x88\x5f\xed\xcf\x43\x31\xee\x1f\xc8\
+\x59\x9b\x6f\x7a\xcd\x48\xc7\x3b\x96\xcd\x45\xc0\x13\x6e\xd8\xb2\
+\xe3\x94\x62\xd9\xbd\x25\x9b\x12\xb9\x33\x4f\xee\xc3\xac\x24\xd4\
+\x57\x3f\xeb\x83\x09\x06\xdd\xf4\x7e\xb8\x5e\x11\x04\x7d\xe6\x24\
+\xd0\xa9\x4f\x6f\x4f\x4f\xa1\x6f\x7e\x12\x97\x9d\x71\x12\xd6\x0f\
+\x0f\xa2\xcb\x32\x41\x01\xee\xb5\x1d\x17\x3b\xf6\x4d\xe2\xe1\xa7\
+\xf7\x60\xae\x77\x19\x52\x3d\xbd\xd1\xcf\x6e\x10\x96\xb4\x25\x74\
+\x12\xc0\x5b\x6a\xaa\xcc\x58\xd2\x9f\xc5\x7a\x47\x62\xfb\xe1\xe2\
+\x95\xd3\x05\xfb\xaf\x00\xfc\x45\x87\xc3\xec\x7c\xa2\xbc\xf3\x9b\
+\x63\xb9\xd9\x79\xe7\xde\x94\xa0\xcb\xcf\x59\xd7\x07\x37\x65\xa1\
+\x24\x9b\x43\x8d\x7a\x2a\x85\x93\xc2\x77\x0b\x90\x02\x8b\x31\xf3\
+\xed\x23\x87\x71\x66\x2f\xf0\x92\x73\x46\x90\xed\xb2\x5a\x96\xcf\
+\x17\x2b\xb8\xef\x91\xad\x38\x90\x19\x82\x91\xc9\x00\x88\x5b\x28\
+\x8a\x96\x00\xad\x0c\x47\x02\x30\x68\x11\xc6\xf6\xcf\x62\xff\x4c\
+\xa5\x94\x32\xc5\xef\xdf\xb1\x79\xc3\x37\x3b\x19\xab\xe8\xa4\x32\
+\x00\xcc\xce\x3b\xef\x23\xc2\x65\xa7\xad\xce\x81\x2d\x0b\xf3\xae\
+\x02\x73\x7d\xe7\x6c\x75\xf7\x2c\x6b\x2e\xa5\xb9\x6f\xa6\x71\xe8\
+\x52\x81\x8b\x23\x2e\x15\x73\x71\x82\xcb\x99\x9a\xc2\x0b\x07\x0d\
+\xbc\xf4\x82\x0d\x89\x88\x0f\x00\x3d\xd9\x34\x5e\x71\xc1\x28\x72\
+\xb3\xe3\xd5\xed\xe3\xb1\xfd\x6b\x35\xf6\x60\x7a\xb3\xae\x64\xc6\
+\xa4\xcd\x18\x59\xd5\x83\xfe\x8c\x99\x71\x5c\xf5\xe9\x1b\xb7\xec\
+\x38\xf9\xb8\x31\xc0\x9b\xee\xda\xf6\x22\x00\x7f\x3a\xdc\xdf\x45\
+\xb9\x5c\x17\x66\x6d\xa5\x1d\x90\xef\x1e\xf1\x03\x6f\xa4\x41\xcf\
+\x38\xc1\x72\x51\xc8\x4b\x52\x27\x78\x49\x47\x62\x8d\x28\xe3\xc5\
+\x9b\xd6\xc1\x34\xda\x43\x4d\x7f\x4f\x06\x17\x6d\x58\x0e\x59\xc8\
+\xeb\x9f\x8d\x68\x22\xb7\x9a\x20\xde\x31\xba\x8a\x31\xed\x00\xa7\
+\xae\xee\x41\xca\xa0\x93\xe7\xcb\xee\x27\xde\x75\xef\xce\xd4\x31\
+\x67\x80\x77\x7e\x73\x67\xce\x71\xd5\xa7\xfa\xba\xcc\xdc\x9a\xe5\
+\x39\x4c\x55\x14\x58\xb1\xef\xaa\x1d\xa4\xf0\xdc\xb7\x9e\xb5\xcc\
+\x0c\x46\xfb\x33\x77\xa1\x33\xde\x7b\x89\xd9\x49\x5c\xf2\x82\x35\
+\xb0\x52\x0b\x33\x8d\x4e\x39\x69\x10\x39\x65\x6b\xfb\x15\x3b\xde\
+\x60\x9e\x07\x5f\x4a\x21\x84\xd7\x8a\xcb\xb0\x85\x81\x53\x57\xe6\
+\x40\xc0\x55\xf3\x65\x77\xf3\x31\x67\x80\xd9\x79\xfb\xdd\xa6\xa0\
+\x73\x47\x57\xe5\x30\x65\x57\xf7\xdb\x47\xcd\xca\x46\x1a\x5a\xcf\
+\x5c\x5d\x7e\xd4\x8c\xed\x74\xc6\x07\xaf\xb5\xdd\x84\x15\x4b\x72\
+\x0b\x45\x09\xba\x2c\x13\x03\x69\x8a\xee\x3f\xa2\x25\x5e\xab\xf1\
+\x05\xf3\xe6\x6c\x46\xb6\x3b\x8d\x15\x7d\xe9\x94\xe3\xaa\x8f\xde\
+\xb0\x65\xc7\x8a\x85\xf4\x79\x41\xac\x7e\xc3\xdd\x3b\x36\x14\x2b\
+\xee\x9f\xae\x19\xcc\x90\x6b\x18\xa8\x54\x6a\x86\x4d\xc0\x76\x63\
+\xb0\xdf\xb3\xaf\x5b\xc2\xd4\xc2\x2b\xf0\x57\x69\x26\x07\x2c\xbc\
+\xa0\xbd\xd4\x89\x01\xc8\xb6\x8d\x53\x87\xfb\x43\x96\x7e\x3b\x40\
+\x44\xc8\xa5\x4d\xb0\xe4\xe8\x85\xa0\x98\x95\x42\x9d\x11\xc8\x31\
+\xf1\x82\xa9\x32\x63\xcd\xb2\x6e\xcc\x14\x9d\xb5\xc5\xb2\xfb\x41\
+\x00\xef\x69\xb7\xcf\x0b\x92\x00\xc5\x8a\xfb\xa1\xde\x2e\x73\x68\
+\xb0\x3f\x83\x99\x32\x6b\x75\x7b\xa4\x9e\x87\x3e\x3d\x89\xee\xaf\
+\xaa\x14\xd4\xc4\x62\xf8\x52\x09\x2e\x8e\xb8\xe0\x38\x18\xe8\xc9\
+\x2c\x98\xf8\x0d\x84\x0a\xd1\x3c\x8a\x16\x23\x95\x92\xa7\x51\x64\
+\x19\x57\x01\xb3\x2e\x61\xdd\xb2\x6e\x00\x78\xf3\x8d\x5b\x76\x6c\
+\x6a\xb7\xbf\x6d\x4b\x80\x1b\xee\xde\x71\x41\xd9\x76\xaf\x5d\xbb\
+\x2c\x8b\x29\xbb\xba\xac\x4b\x80\x6f\x21\x03\x68\x4a\x03\xd4\xa4\
+\x80\x97\x73\x7d\x3e\x7e\x30\x24\xac\x99\x1a\xba\x49\x99\xc4\xcf\
+\x6f\x67\xcd\xdf\x00\x23\x65\x1a\xed\xa2\x23\x04\xf3\x8a\x1a\xb3\
+\x36\x4a\x0a\x70\xe4\x4d\x20\x02\xa9\xc9\x0c\x36\x59\x74\x19\x4b\
+\x32\x29\x0c\xe5\x52\x3d\x13\x05\xe7\xaf\x01\x5c\xdd\x4e\x7f\xdb\
+\x96\x00\xc5\x8a\xfb\xa1\x65\x3d\x56\x46\x99\x06\x6c\x37\x6c\xe8\
+\xc4\x19\x3d\x71\x86\xd1\x42\x8d\xa6\x76\x0d\xc3\xa8\xcb\x15\x46\
+\x7d\x83\xe6\x82\xc1\x95\x0a\x13\x15\x2c\xcc\xf0\xd3\xe2\x10\xa1\
+\x72\x21\x3c\x29\xc6\x4c\x99\x31\x3c\x98\x85\x41\x78\xc5\x0d\x5b\
+\x76\xbc\xa8\x9d\x3e\xb7\x25\x01\x6e\xd8\xb2\xe3\x62\xdb\x96\x57\
+\x2c\x5f\x92\xc1\x64\xc5\xaf\xe7\x82\xf1\x2d\xff\xec\x63\x84\xe2\
+\xfc\x88\xd7\xd9\xd4\x66\x7a\xc7\x60\x5a\x28\x94\x6d\x2c\xef\xa0\
+\x89\x03\x53\x05\x4c\xaa\x14\x94\x77\x5a\xb1\xf6\xa7\x1f\x38\x38\
+\xf3\xf5\xa5\x39\xa2\x2d\xa5\x18\x65\x53\x60\x79\x5f\x3a\x7d\x60\
+\xa6\xf2\x01\x00\xaf\x4c\xda\xe7\xb6\x24\x40\xb1\xec\xfe\xd9\x8a\
+\xbe\x74\x57\x51\x51\xf5\xdc\xbc\x86\x6b\xe3\xdc\xb1\x56\xb3\x50\
+\x3b\x2b\x90\xfc\x39\x0b\x71\xfd\x1a\x17\x80\x6d\x53\xf6\x82\x89\
+\xaf\x14\xe3\xe1\xbd\xf3\x90\x44\x2d\xdd\xd2\x64\x63\x80\xbf\xac\
+\x8a\x90\x14\xb5\xf4\xd9\x8a\xc2\xd2\xfe\x2e\x98\x82\x2e\xbf\x61\
+\xcb\x8e\x0b\x16\x9d\x01\xde\x76\xf7\x8e\x17\x98\x82\x5e\xb6\xa4\
+\x37\x8d\x39\x5b\x35\x0d\x12\xd5\x3a\xc0\xa1\x1a\xa2\x2c\xde\xf8\
+\x69\xe5\xde\x25\x71\x01\xdb\x75\xfd\xbc\xd7\x53\x53\x12\x85\x52\
+\xfb\x4c\xc0\xcc\xf8\xc5\xde\x19\x6c\x2d\x50\xa2\xfe\xb5\x32\x00\
+\xab\xe9\xfe\x28\xaa\x42\xeb\x40\x51\x5e\x12\x56\xf4\xa5\xbb\x8a\
+\x65\xf7\xdd\x8b\xce\x00\xa5\x8a\xfb\xb6\x65\xbd\x56\xf7\x9c\x5b\
+\x27\xa6\x0a\x71\xa3\x4e\xb7\xf9\xb9\x5e\x81\x5b\x94\x6b\x65\x23\
+\xb4\x1b\x1a\x6e\xe7\x9a\x87\x81\xfb\x9e\x9b\x86\x54\x2a\x29\x5a\
+\xc0\xcc\x78\xe6\x50\x1e\xdf\xfd\x75\xa9\x46\xa4\xa0\x64\x89\x97\
+\x02\xfa\xb1\xa9\xd8\x72\x2a\xf4\x5b\x81\x59\xa1\x60\x4b\xf4\xf5\
+\xa4\x61\x0a\xfa\xef\x6f\xdb\xb2\x63\x7d\x92\xfe\x27\x32\x7b\xdf\
+\x7e\xcf\xd8\x12\xe9\xaa\x9b\x86\x87\xba\x73\xd3\x4e\x78\x2b\x13\
+\x33\x1a\x7a\xac\x9a\x47\x8d\x1b\xd6\xe8\xb7\x90\x15\xac\x29\xd7\
+\xc8\x62\x4f\x25\xad\x12\x25\x5f\xbb\x51\x57\x52\x18\xaf\x00\x93\
+\xf9\x12\x46\x07\xbb\x60\x88\xf8\xf9\xe1\xb8\x12\x3f\x18\x9b\xc6\
+\xf7\x76\x97\xa1\xea\xd6\x89\xe7\xa1\xf5\x19\xaa\x19\xae\xb6\x73\
+\xc1\xbe\x06\xc7\x5e\xfd\xc7\xbe\xf6\x83\x6d\x83\x80\x34\xd0\x55\
+\xa8\xc8\xc3\x4f\x6c\xf9\xfc\x4f\x5b\x8d\x37\x91\x4d\xf5\x07\x77\
+\x6e\xfb\x1f\x03\x59\xf3\x8e\x6c\x4f\x17\xe5\x1d\xe5\xab\x44\x81\
+\x25\x3b\xad\xa1\x17\x88\xf2\x44\x1a\x83\x49\x36\x80\xb4\xbb\xa1\
+\x74\x81\xd0\x9b\x02\x2e\x5e\x9d\xc5\x19\xcb\xb2\xe8\xcb\x34\x97\
+\x82\x99\x19\x87\xf2\x15\x3c\x37\x51\xc6\xa3\x07\x4b\x98\xd5\xbd\
+\x0c\x66\x01\x86\x5f\xb3\x6c\xbc\xeb\x17\x0e\x16\x35\x27\x24\xd7\
+\x70\xb1\xd4\x22\x6c\x3b\x90\x7f\xae\x3b\x6b\x9d\xfd\xc5\xab\x47\
+\x62\x5f\x57\x93\xc8\x0b\x70\xa5\x7a\x73\x7f\xb7\x45\x53\xb6\x8a\
+\x5b\xc9\xf6\x74\x22\x8e\x24\x9d\xb9\x5a\x7e\x38\x7a\x9b\xc0\x66\
+\x6d\xe0\xbb\xbb\x8a\xf8\xde\xae\x79\x64\x0c\xc0\x32\xaa\x33\xae\
+\xe4\x02\xb6\x27\x78\x11\x22\x5a\x8c\x5f\x1f\xcc\xd0\x33\x40\x5c\
+\x39\x0e\x31\x40\x48\xba\x32\x50\x52\x40\x6f\xc6\x3c\xa5\xec\xaa\
+\x17\x01\xf8\x71\xdc\x38\x5b\x32\xc0\x5b\xef\xde\xbe\xd6\x04\xce\
+\x75\x88\xe0\xaa\xea\xec\xe7\xd0\x3a\x7d\xed\x6f\x8d\x05\xeb\x3c\
+\xa9\x77\x0d\x29\x34\xd0\x56\xee\x61\x34\xcb\x70\xc4\xf6\x8a\xc5\
+\x85\x82\x0b\xc0\x77\x80\x3b\x22\x3c\x1b\xdf\x59\x6d\xb9\xa8\x09\
+\xc5\x71\x65\xd8\xcf\x78\x1c\x68\x33\x6f\x03\x03\xdd\x96\xb9\x6b\
+\xbc\x78\x35\x5a\x30\x40\x4b\x23\xd0\x71\xd5\xe5\xbd\xd9\x54\x4f\
+\xde\x56\xa8\xaf\x67\x87\xad\x51\x9d\x31\x17\x65\xe5\xb7\x0e\xfe\
+\x24\x37\xee\x92\x2f\xa6\x74\x7a\xb5\x7e\x4e\xc2\x95\xce\x16\x46\
+\xa0\x6e\x11\x89\x03\x38\x56\x9a\xb2\x5e\xfc\xba\x4a\x81\x0d\x01\
+\xcb\xa0\x2b\x6f\xbc\x67\x2c\x76\x53\x43\x4b\x09\xa0\x14\x5f\x9b\
+\x4e\x1b\x34\x57\xae\x59\xc6\xe4\x0f\xd7\x12\x05\x66\x79\x60\xca\
+\x13\xc2\xc6\x4a\x30\xb4\xdb\x08\x1f\xeb\x66\x4f\xd0\xae\x60\x6f\
+\x2d\xf6\xd5\x0f\xde\x1c\x35\xc9\xa0\x15\xc1\x31\xca\x91\x5b\x36\
+\xd3\xbc\xd7\x94\x65\x4f\x86\xd6\x00\x0f\xd5\x67\xcc\xbb\x8c\x9e\
+\x4c\x6a\x4d\xde\x96\xe7\x03\x78\x28\x6a\x28\xb1\x0c\xf0\xb6\x6f\
+\xec\xe8\x35\x98\x7f\xa7\xe4\x46\xc7\xb5\x4f\x28\xe8\x44\x1f\x38\
+\x36\xc8\xae\x80\x94\x04\xd5\xdc\x40\x36\x0c\xa8\x74\x06\x08\x6e\
+\xf8\x4c\x62\xe4\x61\xb1\x19\xa0\x3a\xb8\x96\x0c\x50\xfb\x51\x74\
+\x14\x06\x33\x66\x6a\xa6\xe4\x5c\x82\x85\x32\x80\xeb\xf2\x05\x7d\
+\x59\x73\xb0\xe0\x54\x7d\x7e\xaa\x3d\x91\xa9\xa9\xf9\x99\xfd\x33\
+\xba\xde\x09\x02\x03\x4c\x60\x8a\xd6\xe9\x2d\x37\x8a\xd6\x08\x1a\
+\xb6\x23\x42\x4f\x8a\x84\x48\x33\xd1\x75\x60\x16\xf3\xc8\xd8\x25\
+\x2c\x49\x29\x2c\xc9\xa5\xd1\x3f\x94\x41\x2e\x93\x41\x97\x55\x45\
+\x4b\xa1\x54\xc1\xa1\xc9\x69\xec\x9b\xac\x60\x2a\xd5\x03\xb7\xa7\
+\x0f\x0d\x17\x57\x3b\xa2\x68\x43\x2e\xe6\xd6\x9f\xa6\x25\x68\xc4\
+\xec\xf7\x24\x36\x4a\x78\xee\x5d\x08\x08\xe0\x4a\x00\x1f\x8b\x42\
+\x43\x2c\x03\x48\xa9\x2e\x30\x53\x86\x70\x6a\xc7\x78\xeb\xc8\xa4\
+\x80\x38\xf2\xee\xe5\xf5\x13\x55\x23\xa2\x51\x37\x16\x5b\x1b\x83\
+\x75\xbf\x26\x6a\x87\x70\x34\xc6\x9a\xf5\x82\xe5\x8d\x62\x01\xb9\
+\xf2\x1c\xd6\xf6\x18\x38\xf5\xd4\x65\x38\x79\xc5\x5a\x2c\xe9\xcd\
+\xc2\x4a\x19\xda\xbd\x00\xcc\x8c\x99\x42\x09\xbf\xdc\x7a\x00\x0f\
+\x8f\x1d\xc2\x54\xdf\xf2\xb6\xde\x52\xa1\x9b\xd5\xd1\x9e\x81\x7f\
+\x86\xc7\x32\x45\x94\x47\xe0\x61\x80\x92\xab\x90\xb5\x8c\x8d\x6f\
+\xd9\xb2\xa3\xef\xab\xd7\x9e\x32\xab\x7b\x64\x2c\x03\xa4\x04\x5d\
+\x56\x96\xd5\x15\xa7\x3a\xe3\x7b\x75\x7a\xdd\xc7\x6f\xde\xfb\xa5\
+\x43\xbd\x27\x0d\x46\xf1\xc4\x4a\x1a\xcb\xc2\x51\x9b\x3f\x34\xf5\
+\xbd\xcf\x4c\x82\x79\x6f\x3d\xa3\x5c\xc4\x60\x65\x06\x9b\x86\xfb\
+\xb0\x69\xc3\x69\x58\xbe\xa4\x07\x46\x82\x7d\x7f\x44\x84\x81\x9e\
+\x2c\x7e\xef\x77\xd6\x63\xe5\xe0\x11\xdc\xfd\x8b\xfd\x98\xca\x0d\
+\x45\x3f\x36\xa9\x17\x10\x48\xf4\x92\x3e\xaa\x0d\xef\x2c\x0f\x7a\
+\x14\x3a\xc6\x29\x3a\x8c\x81\xb4\xd9\x3f\x3f\x6f\x9f\x83\x08\x6f\
+\x20\x92\x01\xde\x7c\xf7\xf6\x74\x97\xa0\xd3\x4a\xb2\x2a\xfe\x7d\
+\x04\xf0\xfd\x0e\xee\xe5\xd7\xcd\x7a\xdd\xb9\xbf\xba\x4a\x81\x96\
+\xa0\xc9\x57\x03\xe3\xb9\x81\xa4\x8b\xfe\xc2\x38\xce\x59\x99\xc3\
+\x85\x67\x9d\x81\x65\x03\xb9\x05\xed\xfa\x21\x22\x9c\xb6\x76\x19\
+\x2e\x9f\x2b\xe2\x1b\xbb\x2b\x70\x53\x69\x0d\xca\x3b\x61\x00\x44\
+\xb4\xa1\x51\x2f\x21\x06\x88\x91\x1c\x82\x0c\x25\xf9\x2c\xb4\xcb\
+\x00\x52\xf2\xa9\x56\xda\x18\x2c\x38\x8d\x2d\x1f\x8d\x36\xc9\xf7\
+\x9b\x35\x79\x14\x50\x0f\x7a\x95\x51\x67\x95\x56\x1b\x37\xe2\x54\
+\x40\x9c\x05\x60\x15\xf3\x18\x4d\x95\x70\xc5\xc5\xeb\x31\xb2\x7a\
+\x10\x42\x74\x16\x38\x22\x22\x9c\x3d\xba\x0a\x0f\xee\xd9\x8e\x83\
+\x6c\x69\xfb\x93\x58\xdc\xd7\xf3\x03\x72\xbc\x95\xca\xe0\x00\x87\
+\x69\x8d\xc0\xda\x0d\xa3\xfa\xb6\xf4\x94\xc0\x45\x00\x3e\xa7\x7b\
+\x7e\x24\x03\x30\x63\x94\x04\xa5\x14\x2b\x54\x67\x6b\x1c\x13\x04\
+\x3b\xd1\x2c\xaf\x9b\xe0\x89\x8d\xc0\x04\xf9\x5a\xcf\x91\x19\xbd\
+\x85\x29\x5c\xb2\xa6\x1b\x2f\x7e\xe1\x0b\xd0\x9d\x49\xb6\xbf\x3f\
+\x09\xe4\x32\x16\x56\xe5\x4c\xec\x2f\x46\xcb\xe9\x24\x8e\x88\x5f\
+\xbf\x33\x22\x26\x7d\x60\x66\x87\x1b\x67\x8d\x04\x69\xa6\x33\x2a\
+\x8a\x61\x99\xe2\xf4\xa8\x7e\x44\x32\x00\x31\x6f\x28\x4b\x26\xa5\
+\x6a\xbe\x7e\x50\xef\x37\xca\x35\x17\x21\xbc\x5b\xc3\x6a\x76\x9e\
+\xaf\x73\xc1\x18\x41\x30\xdd\xd7\x4e\x4b\xa4\x79\xfa\xe3\x2b\xa4\
+\xb0\xb2\x34\x8e\x2b\x5f\x38\x8c\x17\x9c\xb2\x32\x91\x9e\x6f\x07\
+\x88\x08\x4b\xb2\x16\xd8\x73\x2a\x2f\xa9\xe7\xa9\x9f\xdd\x7a\x0a\
+\x86\x44\x7a\x5b\x33\xbf\x99\x5a\x72\x14\x06\x4c\xb1\xea\x8d\x77\
+\x6e\xed\xfe\xa7\xd7\x9f\x1a\x7a\xfb\x58\x24\x03\x58\x06\x6d\x70\
+\x64\x73\xb3\x44\xdc\x8c\xaf\x13\x9e\x23\x2c\x76\x6d\x5d\xcf\x8d\
+\xaf\x1c\xeb\x42\xcd\x2d\x90\x5a\x03\xa1\x5c\xac\x75\xa6\xf0\xda\
+\x8b\x4f\xc1\xc8\xea\x25\xa0\xda\xe6\x8c\x7d\x33\x65\x3c\x33\x51\
+\x86\x25\x08\x17\x9f\xdc\x03\xab\xc3\xbd\x7f\x56\xca\x40\x55\x32\
+\x26\x83\x56\xd6\xbc\xe6\x9f\xa6\xae\x5e\x4d\x44\x19\x83\x5e\x69\
+\x21\x84\xe8\x61\x60\x15\x80\xd0\x5b\xcb\x23\x19\xc0\x10\x34\x52\
+\x94\xd5\xf0\x6f\x90\xb8\x7a\xb1\xef\x77\xbb\xb4\x4c\x12\x91\x8f\
+\x98\xbc\x28\x5b\x20\x08\x42\x49\x8c\xaa\x69\x5c\xff\x92\xd3\xb0\
+\x6a\x69\x2f\x88\x08\x25\xdb\xc5\x37\x9e\x1e\xc7\x43\xfb\x4a\x8d\
+\x76\xa6\xe7\x8a\xb8\x7a\xd3\xca\x8e\xb6\x7f\x97\x6b\x7b\x21\xa3\
+\x20\x2a\x47\x5f\x85\xb5\x79\x61\x95\xc0\x3e\x46\x6a\x27\x26\xe0\
+\x32\xa7\x98\xb1\x06\x49\x19\xe0\x0d\x77\x6e\x15\x24\x68\x75\xc5\
+\xf6\xf8\xff\x75\x4b\x93\xa8\x29\xf6\x11\x08\x02\x79\xd4\x04\x53\
+\x95\x6b\xc2\xbb\x84\x3d\x8c\x52\xfb\x43\x01\xb9\x1f\x15\x3a\x8e\
+\x42\xac\x50\x12\x1b\x30\x83\xd7\xbd\xe4\x34\xac\x1a\xaa\x9e\xd0\
+\x3d\x3c\x5b\xc2\x17\x7e\x76\x18\x87\x8b\xfe\x99\x3a\x36\x5e\x00\
+\x33\x77\xc4\x00\x33\xb5\x23\x70\x71\x7d\x8a\x22\x94\x3f\x8f\x83\
+\x49\xda\x1b\xaf\x9a\x68\x4d\xf8\x26\x02\xeb\xf7\xb6\x64\x12\xc0\
+\x49\xba\x6e\x68\x19\x80\x15\x67\x04\x61\xa0\x1e\xfd\xf3\xcf\x78\
+\xae\x3b\x70\x9a\xbc\x66\x47\xa8\x51\xb6\x66\xe7\x47\x89\x7c\x4f\
+\x29\xa0\xb5\xa1\x17\x0e\x2a\x49\x8c\xaa\x19\xbc\xee\xd2\x26\xf1\
+\xf7\x4d\x15\xf1\xd9\xff\x3c\x84\xe9\x0a\x87\xca\x67\xd9\xed\x88\
+\xf8\x4a\x31\x8e\x14\x25\x14\xeb\x6d\x0b\x8e\xbc\x09\x24\x7b\x28\
+\x17\x25\x18\x7c\xb9\x0b\x24\x3e\x50\x3d\x4f\x98\x12\x18\xd6\x3d\
+\x46\xcf\x00\x80\x25\x19\x5d\xac\xb8\x21\xfa\x7d\x06\x9b\x87\x90\
+\x71\x62\x1f\x31\xf9\xc1\x4e\x36\x97\x92\x3d\x69\xde\x82\x3a\x29\
+\xc0\x8c\x51\x39\x83\xd7\xbd\x64\x03\x56\x0e\xf6\x00\x00\x8e\xcc\
+\x96\xf0\xd9\xff\x38\x88\xa9\x4a\x18\x11\x82\x15\x4e\x5f\xda\xd5\
+\x11\x03\xe4\x8b\x15\xec\x9b\x97\x60\x8e\x0f\x41\x07\x1f\x1e\x76\
+\x17\x39\xb2\xbe\xdf\x58\x6c\xb1\x07\x20\x6c\x2d\x7a\xec\x80\x2a\
+\x38\x92\x91\x21\xd2\x9e\x79\xd3\xdb\x00\x8c\xb4\x54\xca\xac\xea\
+\x39\x0a\x11\x93\x3c\x0b\x00\xb5\x22\x61\x42\x07\x08\x1a\xbf\x6d\
+\xdc\x27\x2b\xb4\x03\x25\x8d\xa8\x39\xc9\x99\xc1\x75\x17\x8f\x60\
+\x78\x59\x1f\x88\x08\xb3\xc5\x0a\x3e\xfb\x1f\x07\x31\x51\xd6\xa3\
+\x76\xa9\x2a\xe1\x8c\xb5\x89\xb6\xca\x45\xc2\x9e\x89\x02\xf2\x2a\
+\x81\x11\x19\x21\xfe\x75\x16\x7d\x70\xac\xba\xe8\x60\x92\x80\x51\
+\xd4\xc2\x90\x0d\x89\x6c\xca\xc8\xea\xba\x19\x21\x01\x38\xe3\x48\
+\x16\x8a\x9b\x4f\xf1\x6e\x04\xf1\xba\x7b\x75\xca\x7a\xb7\x75\xf9\
+\x66\x6e\x3d\x39\xc0\x01\xda\x90\xae\xd7\xd5\xf4\x15\x0c\x3c\x13\
+\xc0\x80\x5b\xc0\x55\x2f\x5c\x89\xf5\xc3\x83\x20\x22\xd8\x8e\x8b\
+\x9b\x1f\x39\x80\x7d\x05\x89\x28\x38\x7d\xc0\xc4\x50\x7f\x37\x16\
+\x0a\xcc\x8c\x47\xf7\x17\xa0\x22\xcd\x70\xed\x70\x34\xb3\x97\xb5\
+\x85\xc3\xbe\x7c\x04\xa3\x70\xf8\x77\xb0\x65\x6f\x55\xe5\x32\xd8\
+\x84\x76\xe0\x5a\x06\x20\x20\x2b\x19\x54\x5d\x03\x20\x5f\xc3\xe4\
+\x79\x54\xd2\xe0\x50\xd0\x6e\x08\xb6\x87\x40\x2b\x3a\x49\xe1\x4d\
+\x4b\x29\x07\x97\x0d\x77\x61\xd3\xe8\x2a\x10\x11\xa4\x52\xf8\xf2\
+\xcf\x0e\xe0\xd9\xe9\xe8\xef\x2e\x64\x65\x19\xe7\xad\x5f\xd6\x51\
+\x34\xb0\x54\x71\xf0\xe4\x91\x32\x98\x8d\x70\xa7\x10\xc1\x0b\x21\
+\xc2\x6a\x88\x1a\x31\x73\xb5\xb5\x38\x4a\x5a\xe8\xdb\xab\x4b\x06\
+\x46\x3b\x0c\x40\xc8\x2a\x66\x52\x60\x80\xfd\xa4\x6b\x10\xb7\xb6\
+\xf5\x8b\xbc\xfb\xe3\x3c\xd2\x20\x14\xd4\x09\xaa\x93\xc0\x52\x6f\
+\x53\x22\x04\x4c\x4e\x4d\xd0\x67\xad\x59\xc6\x8b\x37\x6d\x84\x61\
+\x08\x28\xc5\xb8\xe7\xf1\x43\x78\xe4\x40\xd9\x57\x26\x08\x6b\xd3\
+\x12\x27\xaf\x5c\x82\x4e\xe0\xd9\xfd\xb3\x98\x70\x04\x92\x4c\xfb\
+\x58\x27\x31\x4a\x3d\x68\xa8\xaf\xd5\xff\x11\x1e\x82\x2f\x2b\x60\
+\x0f\x10\x71\x1b\x0c\xc0\x6c\x48\x06\xb1\xc7\xa2\x0c\xc7\xfc\xbd\
+\x76\xbe\x97\x76\x14\x0a\x0e\x35\xf2\xc3\xe1\x0f\xff\xda\x41\xc3\
+\x9e\xd0\xa3\xaf\x9e\x3a\xb2\x34\x87\xbe\x5c\x17\x14\x33\xfe\xed\
+\xd9\x23\xf8\xd6\xf6\x7c\xc8\xf0\xf1\x82\xa1\x14\xce\x1b\xe9\x41\
+\xb6\x6b\xc1\x2f\xd2\x00\x33\xe3\xe1\xdd\x73\xd1\x62\x59\x47\x9d\
+\xa8\x31\xc4\x10\x30\xd4\x66\x1d\x8f\x9a\x9b\xf0\xac\xd7\x33\x43\
+\xd5\x6e\xd3\xd3\x3a\xca\x08\x74\x14\x98\x95\xaa\x29\x00\x6a\x34\
+\x52\x05\xaa\x22\x84\x7c\x0a\xda\xd7\x13\x30\x51\x64\x68\x18\xa1\
+\x74\xbf\x99\xef\x95\x32\x3a\xf8\xe5\x0c\xb0\xe9\xc0\x1c\x9e\x3c\
+\x38\x8f\xfb\xb6\xcf\x85\x0b\x06\x6e\x97\x52\x19\x67\x8e\x0c\xa3\
+\x13\x98\x29\x94\xf1\xc4\xb8\x0d\x56\x61\xf7\x8f\x35\xbf\x74\x05\
+\x82\xaa\x20\x76\xe5\x50\x3b\xeb\xf5\x92\x41\xc7\x44\x41\x95\xc1\
+\x60\xed\x91\x27\x2d\x03\x28\xe6\x92\x02\x98\x03\xae\x8a\xd7\xb8\
+\xa3\xc6\xee\x5f\xf2\xcc\x5c\x4f\x59\xcf\xec\x0f\xd5\x0f\xdc\x73\
+\x83\xbb\x02\x8b\xc8\xba\x20\x03\x80\xfd\xf3\x12\x7f\xfb\xe0\x01\
+\xe8\x2d\x04\x84\x8c\x90\xb3\x86\x52\x58\xda\xbf\xf0\x37\x7f\x00\
+\xc0\xcf\x77\x4d\x63\x5e\xc6\xed\x39\x4b\xe2\xd3\xeb\x13\xc3\xc6\
+\x9f\xae\x0d\xcd\x92\x6f\xd0\x00\x8c\x51\x15\x52\xb1\xf6\x2b\x24\
+\x5a\x06\x90\x8a\x0b\x20\x28\xae\x5b\x3b\xf1\xd1\x9e\x68\x08\x94\
+\xd1\x6d\x1f\xa3\x56\xed\x69\xd2\x93\x3c\xba\x3e\xf8\x6e\xb6\x71\
+\xde\xfa\x15\x1d\x19\x7f\xae\x54\x78\x64\x4f\x3e\x26\xfc\xdb\x26\
+\xf1\x75\xb3\xb9\x45\xf9\x50\xd4\x30\xa1\x0b\x58\x07\xa5\x58\xfb\
+\x52\x49\x3d\x03\x30\x8a\x00\x94\x52\x9e\x30\x6d\x5d\x34\x87\x76\
+\xf5\x34\xa7\xbf\xd7\xc0\x6b\xd8\x06\x81\x18\x70\xd4\xaa\x62\xb5\
+\x6c\xc0\x00\x0c\x4c\x70\xaf\xab\xe9\x47\x79\x70\x53\x4a\x13\x46\
+\x32\x0a\xeb\x56\x0d\xa0\x13\x38\x38\x59\xc0\xb6\x19\xd9\xf0\x64\
+\x22\x45\x7e\x9c\x01\x18\xe1\xae\xd5\x6f\x38\xa2\x7c\xb0\xb4\x3f\
+\xf0\x13\x6e\x2b\x2a\x30\xa4\x18\x79\x5d\xb7\xa2\x16\x83\x6c\x66\
+\x76\x99\x39\x1d\x9c\x6d\xde\xc0\x4f\xfd\x19\x71\xc2\x41\xef\xee\
+\x79\x18\x28\xb4\x25\x2c\xf0\x5e\xa1\x28\x1c\x86\x8c\xcb\x20\x71\
+\x00\x83\x15\x2e\x58\xd3\x83\x4c\x7a\xe1\xc6\x1f\x00\x3c\xb4\x73\
+\x1a\x8e\xd6\xc0\xf3\x10\x20\xce\xf6\xd3\x19\x7d\x41\x9c\x6a\xca\
+\x73\xb0\x56\x80\xb8\xda\xb5\x84\x88\x32\x44\x54\xd2\x75\x2d\x2a\
+\x14\x5c\x01\xf3\xbc\x62\x74\x03\x5c\x33\xfe\x3c\x18\x67\xbf\x91\
+\x46\x0d\x16\x26\x7f\x3e\xd0\xb0\x1c\x29\x34\xdd\x7d\xd9\xfe\xb4\
+\x06\x06\x62\xf6\x8a\x85\x82\x46\x1c\x6c\x04\x2b\x85\x8d\xb3\x46\
+\x4e\xee\x6c\xe5\xcf\x76\xf1\xf0\x9e\x02\x94\xd2\xdb\x1b\x51\x33\
+\x57\x87\xd5\xe8\xc0\x90\xbe\x9e\x77\x49\x57\xe7\x69\x04\xeb\x86\
+\x19\xd1\xc3\x38\x8c\x69\x5d\xaf\xb4\x0c\xf0\xcd\xb7\x9c\x59\x79\
+\xed\x57\x9e\x98\x64\xa5\x96\x55\xe9\xe6\x79\xcb\x4f\xc3\xee\xa3\
+\x50\xfc\xbe\xc1\x08\x5e\x5a\x33\xf9\x54\x42\x83\x44\x1e\x97\xb1\
+\x91\x1e\xac\xeb\x75\x31\xbd\x49\x1e\xee\x8b\x74\xca\x18\xd8\xb4\
+\x3c\x85\xa5\x03\x0b\x8f\xfc\x01\xc0\xb6\x03\x33\xd8\x5f\x64\x44\
+\x47\xee\x3d\xcf\xd5\x12\x51\x93\x16\x93\xa8\x57\x0d\x61\x8e\x49\
+\xea\x02\x02\x0c\x01\xe2\xa2\xed\x68\x3f\x4c\x19\xbd\x1f\x00\xd8\
+\xad\x98\x37\xb6\x8a\xee\x25\x9a\x5b\x09\x0d\xbc\x08\x67\x20\x5c\
+\x3d\xaa\xa0\x07\x72\xec\xe0\xc2\xd1\x55\x2d\x8f\x78\xc7\x76\x9b\
+\x19\x0f\x8e\xcd\xf8\x36\xc5\xc6\x14\xd6\x0e\x2f\x41\x31\x3d\xf1\
+\x7d\x65\xa3\x88\x0b\x3f\x93\xe8\x24\x0b\x18\x86\x20\x66\xa5\xf6\
+\xe9\xba\x1d\xbd\x27\x10\x78\x8e\x19\x2f\xe7\xba\xa1\x17\x08\xf0\
+\xd4\x4b\x35\xfc\x7d\x78\x82\x3e\x41\x31\x54\x5b\x48\x08\x6d\x27\
+\xf3\xaa\x0e\x6f\x5e\xc0\x50\xd4\x22\x93\x3d\xaa\x42\xc3\x08\xa3\
+\x3d\xc0\xba\x55\x9d\x45\xfe\xf2\xc5\x0a\x7e\xbe\xbf\x08\xe6\xa8\
+\x4e\x34\x13\x63\x24\x7f\x4b\xa3\x90\x35\xe9\xb1\x44\x0d\xa9\x05\
+\x8d\x59\xea\x61\x2a\xc3\x40\xc5\x91\xbc\x4b\xd7\x8d\x48\x06\x50\
+\xa0\xed\xec\xe3\xcc\xfa\xde\x80\xe0\xba\xbd\x2f\x16\x18\xb3\xfc\
+\xdb\x5c\x0f\x08\x96\x8b\x32\xfc\x1a\xcc\x10\xb1\x45\x2c\x3c\x6c\
+\xaa\x0d\x4a\xe1\xa2\xb5\xbd\x1d\x1b\x7f\xbf\xd8\x35\x85\x19\x47\
+\x87\xe0\x78\x89\xc0\x91\x37\xcd\x34\xad\x31\xe8\x2b\xcf\x9e\xb2\
+\x81\x72\xb1\x65\xc2\x31\x01\x41\x98\x71\x18\xda\x0f\x4c\x44\x32\
+\x80\xe3\x38\x3b\x05\xa0\x64\x7d\xe7\x43\xc8\xcd\xab\xfd\x0e\x18\
+\x71\xba\x32\x7e\xa3\x30\x80\x97\x86\xdd\xc8\x3e\xa3\xcf\x57\x5e\
+\x37\x0b\xb4\x4c\x51\xe5\x96\x15\x29\x07\x67\xad\x5f\xd6\x91\xf1\
+\x27\x95\xc2\x8f\x77\xce\x42\x85\x5e\x1d\x17\xe9\x04\x46\x12\x5b\
+\x9f\x1d\xe3\x41\xb4\x54\x09\xcd\x8a\x61\x75\x10\xd6\x13\x06\xf8\
+\xd7\xf7\xbf\xe3\x1c\xed\x32\x69\x34\x03\x48\xf5\x74\x4a\x88\x92\
+\x2b\x6b\x8b\x08\x5e\xf9\xef\xd9\x20\xe8\x77\xc0\xf4\xab\x83\xcd\
+\x7b\x7f\x5d\x84\x9a\xd3\xb4\x96\xc0\x7e\xf0\xcf\x7f\xc6\x39\xcb\
+\x2d\x2c\x1b\xe8\x2c\xf2\x37\x3e\x53\xc4\x93\x47\x2a\x35\xf1\xdf\
+\x42\xbf\x47\x09\x84\xa3\x4c\xfc\x60\x39\x66\xfd\x03\x05\xf8\xb1\
+\xa8\x71\x46\x32\xc0\xf7\xde\x75\xde\xbe\x97\xdf\xf4\xd8\x61\xc5\
+\x6a\x84\x02\x98\xe6\xda\xa6\xc0\xa6\xee\xaf\x89\xff\xc0\xd2\x9d\
+\x4f\xb0\x7b\x82\x37\x21\xd7\xcf\xbb\xbb\x86\x9a\x8a\xc2\x2f\xe9\
+\x28\x24\x45\x74\x71\x98\x1e\x72\xf1\xbb\x1b\x86\x3b\x32\xfe\x00\
+\xe0\xdf\xb7\x4f\xa2\x2c\xab\xfe\x53\x4b\x07\x20\x80\xf4\x38\x35\
+\xa1\x3d\xf5\xa3\x33\xee\x10\x7c\xb4\xce\x1e\x08\xb8\x89\x7a\x03\
+\x93\x2b\x92\x1e\x8d\xea\x72\xec\xd9\x40\xc1\xfc\x18\x2b\x8c\xf8\
+\x56\x81\xea\x0f\x0a\x99\xe5\x80\xce\xa4\xaf\x16\xd5\xad\xfa\xfb\
+\xcb\x35\xea\x6b\x84\x44\xbd\x60\x53\xed\x68\x16\xa1\x6a\x70\x6a\
+\x1f\x30\xb2\x6a\x10\x9d\x80\xed\x48\x3c\x38\x36\x8b\x36\x76\x7e\
+\x7b\x08\x11\xcd\x2d\x71\xc4\x0f\xfc\x0c\xbb\x80\xad\x88\xaf\x69\
+\x80\x01\x58\x82\x6c\xe9\xca\xa7\xa2\xfa\xd4\xe2\x05\x11\xfc\x7d\
+\x66\xbe\x9e\x35\xf4\xd5\xe9\x75\xd2\x94\x01\x6a\xab\x7d\x81\x90\
+\xb0\x96\x7f\x6a\xde\x86\xaf\xed\x60\x9b\xf0\x84\x9f\x03\xb8\x36\
+\xc0\xb8\x64\xa4\xbf\xa3\x65\x5f\x00\xd8\x79\x68\x16\x3b\x66\x1d\
+\xa8\x60\x20\xaa\xa5\x24\x88\x3e\xe1\xd3\xb8\xe5\xe8\x86\x42\x5b\
+\xc3\x23\x4f\x89\x86\x83\x4a\x1c\xd1\x50\x2a\x45\x87\x6d\xc9\x91\
+\x1f\xa1\x8e\x65\x80\x8a\xe3\x3e\x66\x90\xa8\x38\x8a\xd3\xa1\x6d\
+\x60\xd0\xe9\xf9\xda\x06\x91\x20\xde\x3c\xf5\xf4\xfb\x04\xc2\x48\
+\xf3\xf1\x8b\xe6\xb9\xc1\xa7\x13\x80\xd5\x69\x07\x67\xad\x5f\xde\
+\x91\xf1\xc7\xcc\xf8\xd1\xb6\xc9\xda\xe7\xee\xe2\xc5\x3f\xc7\xdc\
+\x69\xab\x72\x4c\x2d\xd6\x15\xd3\xd8\x1e\x81\xa0\x4f\xd4\x33\xea\
+\xe9\x06\xab\x9f\xff\xf0\x4f\x2e\x8c\x94\x65\xb1\x8a\xf2\x87\x7f\
+\x72\xd1\xe3\x69\x03\xfb\x9a\x5f\xfb\xa8\xbd\xc0\xb0\xfe\xf5\x8a\
+\xfa\xfb\x6a\xbc\xaf\x6c\x0f\xe4\xfb\x2e\xef\x57\x43\x3c\x5f\x15\
+\xf1\xbf\x8f\xc7\x9f\xcf\xde\x57\xd2\x36\xd2\xea\xcf\xf3\xbf\x73\
+\xe7\xdc\x55\x19\x2c\xef\xd0\xf8\x2b\x96\x1d\xfc\x74\xd7\x5c\xe4\
+\x18\x42\xef\xfc\xd1\xf5\x49\x05\xfb\xeb\x6d\xab\x39\x56\x15\x1c\
+\x47\x1d\x3f\x2a\x8c\x37\x5f\x9e\x17\xd7\xc1\x7e\xf8\x71\xc5\x2e\
+\xe3\xbe\xb8\xf1\xb6\x7c\x47\x90\x60\xe7\x7b\x0c\xfa\xe3\x06\xf7\
+\x79\x02\x3f\x75\x65\xed\xd3\xf4\xde\xd9\x1d\x11\xa7\x69\xac\x08\
+\xd6\x2a\xb0\x47\x1c\x68\xe7\x6e\x48\x2a\x34\x67\x7f\xfd\x19\xbd\
+\xc2\xc5\x8b\x4e\x5d\xdd\xf1\x59\xc0\xc7\x77\x4f\xe1\x50\xa9\x85\
+\xf2\x8f\x88\xb8\xe9\x7e\x46\x56\x0d\xfc\x60\x8e\x28\xc9\x88\x11\
+\xf7\x61\x0b\xd0\xab\x36\xd2\xa6\x28\xb8\x8e\xfd\xef\x71\x43\x69\
+\xc9\x00\x92\xc5\xfd\xc4\xfc\x4e\x55\x7f\xab\xa8\x77\xc9\xd6\x7b\
+\x44\x28\xb8\x44\x58\xfb\xd7\xdc\x0d\xcc\x08\x51\xd8\x37\xb2\xe6\
+\x92\x72\xc8\xda\xd7\x22\xd6\x13\x9e\x22\x60\x43\x9f\xd1\x71\xe4\
+\x4f\x31\xe3\xfb\xcf\x4d\x26\x32\xfe\xea\x51\xcc\x44\x0e\x82\x56\
+\x4f\x7b\xc7\xa0\x4f\xaf\xdf\xeb\x5d\x42\xd6\x36\xec\x45\xa9\x45\
+\xfc\xd4\x4f\xfe\xfc\xc5\xda\x08\x60\x1d\x5a\x32\x40\xa9\xe2\xfc\
+\x24\x6d\xa6\x0e\x16\x1d\x35\xdc\xd4\xc1\xb5\xd8\x9f\x4f\xdf\xcb\
+\x86\x84\xa8\x22\xc8\xd3\x59\xaf\xbe\x67\x00\xb5\xcf\xad\x06\xb5\
+\x61\xe8\xd5\x31\x3e\x49\x11\x8d\x5d\x62\xc6\x85\x6b\xfa\x3a\x3e\
+\x06\x3e\x35\x5b\xc4\xcf\xf6\xce\xa3\xd5\x67\x03\x7a\xc8\xc5\x25\
+\x43\x12\x8a\x81\x1f\x8e\x9b\x70\x10\x73\x4a\x48\x33\xb3\xa3\xf7\
+\x95\x34\x89\x1a\x69\x1b\x68\x39\x42\xe3\x7d\x30\xc0\x4a\xdd\xd9\
+\x6a\xcc\x2d\xe5\xe5\xcf\x3e\x78\x69\x99\x64\xe5\x5b\x1c\xa5\xdb\
+\x83\x69\x4a\x45\x97\x51\xde\x32\xe1\x72\x2a\x22\x4f\xa9\x28\x7d\
+\x5a\xbd\x06\x4d\x89\x4d\xa7\x74\x16\xf9\x03\x80\x9f\x6e\x9b\x40\
+\xc1\xd1\x3c\xcb\x73\xf5\xc2\xc1\xf5\xa3\x19\xbc\xe3\xd5\xe7\xe2\
+\x8d\x57\x9c\x85\xa5\x96\x7e\x9c\x3e\x5d\xde\x48\x8f\xc2\x4d\x6d\
+\xcc\x35\x1b\x4b\xe9\xc6\x19\xc2\xa1\xf7\x5e\x85\xd2\x4c\x81\x7c\
+\xc5\x76\xee\x6f\x35\xe6\x44\xaf\x8a\x55\x10\xff\x4a\xc0\x8d\x52\
+\xb1\xe5\x3d\xc8\xc9\x35\x7f\xcd\xbf\x40\x54\x0b\xec\x06\x43\xb5\
+\xe4\xd9\xf9\x0b\xcf\xde\x9a\xa0\x7d\x40\x1e\x3d\xc2\x14\x8e\xf9\
+\x04\x4e\x8a\x12\x80\x33\x87\x52\x58\xbd\xb4\xb7\x23\xe2\x3b\xae\
+\xc4\x03\xcf\x4e\xc6\x9e\xfa\xcd\x92\xc4\x35\xa3\x19\x5c\x73\xe9\
+\xe9\xe8\xc9\xa6\xe1\x4a\x85\x39\x97\xe0\x7b\xb9\x78\xe4\xaa\x60\
+\x4c\xc4\x26\x4a\x95\x04\x8f\x8f\xb1\xa6\x45\xd6\xb5\xc3\xb0\x4c\
+\xf5\xd0\xc3\x7f\x79\x79\xac\xf8\x07\x12\x32\x40\xa9\xe2\x3c\x9c\
+\xb6\xac\xa7\xe7\x25\x9f\xc3\x1e\x51\xdd\x78\xa8\x4f\xb5\x7b\x2c\
+\x36\x9f\xbb\x18\x0c\xd8\x46\x84\x7a\x7d\x16\x22\x87\xb2\xfd\xcd\
+\x54\xf7\x29\x5c\x3c\x32\x88\x2e\xab\x33\xdf\x7f\xc7\xc1\x59\x3c\
+\x33\x5e\x8e\xd4\xe9\x16\x14\x5e\xb9\xce\xc2\xd5\x2f\xde\x88\x9e\
+\x6c\x1a\xcc\x8c\x1f\x3c\x3b\x8e\x19\xbb\x1e\x2d\x6c\x11\x2e\xf6\
+\x8e\x2d\x88\x2a\x5d\xcd\x20\x53\xe8\x5c\x48\x8d\x71\x50\x23\x8d\
+\x64\xd7\xfd\x72\x92\x71\x27\x32\x99\x7f\xf9\x37\x2f\x55\x90\xce\
+\xcd\x35\x69\x54\x7d\x25\xa9\xf2\xb8\x34\x4a\xf7\x7a\xd6\x9a\xbb\
+\xe2\x71\x79\x82\x1f\x8e\x68\xbc\x6e\x55\xf7\xd1\x09\xa5\x29\xe7\
+\xb9\xea\xee\xd3\xa0\xa5\xb0\xf1\xe4\xa1\x24\xc3\x88\x04\x66\xc6\
+\x03\x4f\x1f\x81\xeb\xed\x8f\xe7\x12\x8a\xf1\xb2\xd5\x06\x36\x5f\
+\x7a\x7a\xe3\xcb\x62\x87\x67\x8a\xf8\xea\xcf\x0f\x79\xc4\x70\x8b\
+\x57\xd5\x7a\xf1\xe5\x19\x73\xf8\xd5\xbb\x1c\xc6\x87\x6a\xe2\xcd\
+\x8b\x33\x7f\x7b\xcd\xd7\xf8\x76\x19\x34\x36\xef\xa8\xef\x26\x19\
+\x7b\xe2\x6f\x06\x95\x5c\xbe\x3b\x9d\xc2\x87\xcb\x0e\xaf\xf1\x73\
+\x25\xe2\xd6\x80\x43\x65\x1a\xd2\x20\xee\x23\x80\x91\x16\xa4\xbf\
+\x38\x01\xd8\x38\x68\x61\x59\x07\x1f\x7b\x04\x80\x62\xc5\xc1\xc3\
+\x3b\xa7\xab\xaf\xc3\x0b\x80\x20\xc6\xa5\xcb\x81\x37\x5e\xb6\xb1\
+\xf1\x1c\xc7\x95\xf8\xbb\xef\x6e\xc7\x6c\xc9\x0d\x75\x3d\x3c\x1e\
+\xbd\x7b\xd8\x52\xe4\x47\x84\x14\xf5\xfb\x07\xfd\xc7\x48\x59\xc9\
+\x5b\x9f\xf8\xc8\xcb\xca\x49\xc6\x9e\xd8\x69\x7e\xe2\x23\x2f\x9d\
+\x23\xe9\xdc\xe2\x0f\x8c\x78\x8c\x0f\xaf\xc1\x16\xcc\x0f\x96\x09\
+\xdc\x87\x5e\x36\xed\x33\x80\x14\xa2\x0c\x50\xc5\x8c\x17\x0e\xf7\
+\x76\x2c\xfe\x77\x1f\xce\x63\x5f\x5e\x86\x8c\x33\x28\xc6\x8b\x86\
+\x18\x6f\xb9\x7c\x23\x86\x97\xf5\x01\xa8\xce\xb4\x5b\x7e\x34\x86\
+\x9f\xed\xc9\xeb\x5f\xf8\xac\xeb\xbb\x67\xbc\xd1\x75\x94\x7f\xfc\
+\xac\xc1\x8f\xce\x80\x0c\xb4\x67\x09\x3e\x58\x71\xd4\x1d\x49\xc7\
+\xde\xd6\x57\xc3\x6c\x97\xbf\x92\x12\x78\x8f\x2d\x79\x25\x00\xfd\
+\x69\xe1\x46\x3a\x85\x0d\x3d\xdf\x0c\x60\x7f\x50\xc9\x57\xb7\xd6\
+\x2a\x7b\x2d\x06\x78\x1e\x56\x85\xac\xc1\x38\x73\x4d\x67\xbe\x3f\
+\x50\x0d\xfe\x78\xd7\xfd\x19\x80\x41\x8c\x17\x2f\x03\x6e\xb8\x62\
+\x23\xd6\x79\xde\x37\x74\xcf\x63\x7b\xf1\x4f\x8f\x1d\x8a\x3d\xd5\
+\xa3\x5d\x03\xf0\xfe\x4a\x18\xf6\xf5\x57\xe1\x88\xb6\xfd\xe9\x24\
+\xd4\xad\x4f\x7e\xf4\xa5\x53\x49\xc7\xde\x56\xd8\xec\xc9\xff\xfd\
+\xb2\x23\xc4\xce\x17\xb8\x0a\x0d\x17\x44\xcb\xd1\xdc\x9a\xa3\xeb\
+\x5c\xaf\x34\x5c\xdd\x70\x89\x62\x66\xd8\xca\x2c\x61\x79\x87\xe2\
+\x1f\x00\x26\xf2\x65\x5f\x88\xd7\x22\x89\x97\xae\x22\xbc\xfd\xbf\
+\x9d\x81\xd1\x93\x86\x1a\xc4\x7f\xe0\xc9\x03\xf8\xf8\xf7\x77\x45\
+\x7e\x04\x3b\x28\xa5\x9a\x63\xab\xb9\x78\x9a\x7c\xaf\xfb\xa7\x6d\
+\x8f\x3d\xdf\x10\x0a\x49\x40\x7f\x7a\x4a\xf0\xfe\x8a\xab\x6e\x6d\
+\x67\xec\x6d\x7f\x39\xd4\x76\xd5\xad\x29\xc3\xb8\xd1\x96\x58\xdb\
+\xdc\x02\xce\x8d\x88\x9c\x87\x35\xe1\x8b\xfe\xe9\x74\x3c\xe0\xd7\
+\xf3\x21\x68\x46\xfb\x48\x63\x5b\xac\x1d\xe8\x42\x5f\xae\xab\x63\
+\x06\xd8\x30\xd4\x85\x6e\xa1\x50\x92\x84\xd5\x19\x89\xcb\xd7\x76\
+\xe3\x35\x97\x9c\x86\xd5\xb5\x97\x4d\x31\x33\x1e\x78\xe2\x20\xfe\
+\xe6\xfe\x1d\x70\x13\x2e\x11\xb3\x5e\x99\x87\xa5\x60\x44\x9e\x17\
+\x87\xad\x16\x7c\xea\x68\x22\x76\x3f\xfd\xab\xbf\x7d\xf9\x78\x3b\
+\x63\x6f\x9b\x01\x9e\xf9\xbb\x57\x4c\x9d\xfd\xc1\xfb\x3f\x06\xb6\
+\x6e\x66\xae\x86\x87\x19\x68\x84\x85\x83\x07\x46\xb9\xe1\xcf\x34\
+\x37\x85\x6a\xa3\x63\x5a\xd1\x5f\x4f\xf2\x46\xcf\x9a\x39\x6b\x96\
+\x74\x2d\xca\xe7\x5e\x2f\x3c\x63\x18\xef\x2d\x96\x91\x9f\x2f\xe3\
+\x94\x93\x96\xe2\x05\x1b\x56\x22\x97\xa9\xbe\x0a\x56\x31\xe3\xde\
+\xc7\xf6\xe2\x63\x0f\xec\x84\x8c\x92\xd2\x31\x71\x7c\x4d\x6a\x64\
+\xbe\x3f\x8b\xe3\xd3\x03\xd9\x5d\x26\x6f\xad\x38\xf2\xb6\x76\xc7\
+\xbe\xa0\xaf\x87\x57\x5c\xfe\x5a\x2a\xe5\xbe\xa9\x2c\x8d\x8b\xbc\
+\x1d\xd4\x1d\x18\xad\x43\x43\x4a\xc4\x79\x0b\x35\x63\xc2\xf7\xad\
+\x61\xef\x60\x03\x81\x83\x35\x4b\x3a\xff\xd8\x33\x00\xf4\xe7\x32\
+\xb8\xe6\xf7\xce\x0a\xa5\x4b\xa5\x70\xcb\x0f\xc7\xf0\x0f\x8f\xec\
+\x8b\xb5\xf4\x43\x84\x0d\xfc\xf4\x27\xc5\x2c\x20\xe8\x02\x3d\xa1\
+\xb6\xc2\xa1\x64\x41\x70\x94\x5b\xf9\xf0\x73\x7f\xff\xaa\x3c\xda\
+\x84\x05\x2d\x9d\x6d\xfd\xbf\xaf\x2c\x49\xbb\xfc\x7e\x01\x2e\x7a\
+\x3f\xdf\xc2\x9a\xe5\x4d\x5f\x68\x34\x32\x3c\x0c\x5f\x7d\xed\x92\
+\xa8\x66\x79\xf5\xa4\xa1\xce\x0e\x7d\xc4\x41\xbe\x64\xe3\x03\x5f\
+\x7f\x0a\x5f\x7a\x68\xaf\x3e\x14\x5d\x5f\xa6\x8e\x0a\x1b\x07\xfa\
+\xed\x5b\xca\xf5\xc6\x06\xb4\x75\x10\x0e\x07\x7b\xea\xd7\xe3\x4e\
+\xf5\xf2\x29\x76\xee\x77\x5c\x7c\x63\x21\xe3\x5c\xb0\xfc\x9c\x78\
+\xe4\x5f\xf7\xae\xb8\xe8\xba\xa5\x0e\x1b\x17\x46\x8a\xb2\xa0\xf1\
+\x1e\x48\x6b\x96\xe5\x50\x1e\xc7\x95\x07\x43\x00\xf8\xfd\xf3\x57\
+\x63\xb0\x4f\xfb\xee\xa3\x8e\x60\xfb\xc1\x39\xbc\xeb\x6b\x8f\xe3\
+\xd1\xdd\x73\xfa\x31\xd5\x03\x7f\x11\xbe\xba\x0e\x07\x1c\x6a\x23\
+\xa6\x7c\x30\x1e\xa0\x2d\x5a\xc5\x99\x25\xe8\x08\x4b\xfb\x0d\x5b\
+\x3f\xfe\xea\x89\x85\x8c\x75\x41\x2a\xa0\x0e\x15\x49\x1f\xb1\x4c\
+\x75\x59\x45\x8a\xb3\x9b\x9d\x26\xff\xaa\xaf\x17\x01\x8d\x97\x02\
+\x6b\x36\x78\x86\x17\xfd\xeb\xa6\x43\x08\x01\x04\x40\x12\xa3\xec\
+\x44\xbf\x10\x6a\x21\xa0\x14\xe3\xce\xff\xd8\x8d\x4f\xff\x60\x27\
+\xca\x0e\xb7\x28\x9d\x34\xac\x8b\x78\x46\xd1\x19\x85\x71\x1e\xa1\
+\xc7\x65\x14\x04\x17\xaa\xf2\x57\xcf\x7d\xfc\xaa\x6d\x0b\x1d\x73\
+\x47\xbb\x27\x76\x7c\xf2\xd5\x33\xca\x2e\xbe\x5b\x90\x9a\xf3\x06\
+\x7f\xa0\x54\xac\x9b\x84\xba\x5b\xc4\x9a\xd5\x31\x6f\x9e\x36\xbf\
+\xd9\xd6\xb3\x07\xdb\x56\x79\x91\x30\x76\x38\x8f\x1b\xbf\xf2\x18\
+\xfe\xee\xbb\x3b\x50\xb2\x55\x7c\x9f\x82\x01\x1e\x4d\x40\xc6\x9f\
+\xa7\xa9\x17\x72\x79\xf5\xae\x5e\x18\xaf\xcd\x36\x52\xb0\xef\x75\
+\x5c\xf5\xd5\x4e\xc6\xdd\xb1\x09\x3d\xf9\x9f\x5f\xdf\xbd\xf4\x77\
+\xaf\x97\x92\xc5\x65\xcc\x10\xf0\x1e\xa3\x0a\x89\xaf\x5a\x58\x87\
+\x35\xf9\xbe\x34\x4d\xdc\x37\x24\x7e\x09\x8e\x2b\x71\xe5\xa6\x55\
+\x1d\xbd\xfc\x61\x66\xde\xc6\xcd\x3f\xd8\x8e\xbf\xbc\xe7\x59\xec\
+\x9e\xf2\x44\x4f\x39\xe1\x05\x6f\x9f\x38\x62\xdc\xf5\x72\x1c\x39\
+\x6e\xad\x4a\x09\x8e\xbb\x51\x9e\x91\x36\xb1\xcd\x91\xf2\xfa\x9d\
+\x9f\x7a\xcd\x1c\x3a\x80\x8e\x54\x40\x1d\x1c\x57\x7d\xce\x34\xec\
+\xf3\x6d\xa4\xae\xf5\x04\xfc\xe1\x5b\x0e\x04\xf4\x67\xc1\x7d\xf9\
+\x81\xc1\x37\x8a\xea\x37\x89\x3f\xbc\x73\x16\x3f\x7e\xfa\x20\xae\
+\x38\x7b\x55\xdb\x7b\x01\x66\xe6\x2b\xb8\xeb\x3f\xf7\xe0\xf6\x87\
+\xf6\x62\xb6\xec\xb6\x55\x37\x18\xb9\x8b\x55\x16\x51\xba\x5e\x9b\
+\x14\xa5\x02\xd8\x87\x12\x53\x60\x4e\xd9\xc5\x77\xec\xfc\xcc\x75\
+\xda\xe3\x5e\xed\x40\x67\x3b\x28\x3c\xb0\xf6\x3d\xf7\x0c\x09\xc3\
+\x78\xc0\x65\xe3\x77\xb4\x8f\x08\x6d\xed\xa6\x64\x4f\x8f\xda\x1f\
+\x56\xbb\xcd\x59\x02\x1f\x79\xcd\x46\x5c\x79\xce\x30\x44\x0b\x26\
+\x50\xcc\xf8\xc5\xce\x29\x7c\xfb\xbf\x0e\xe0\xbe\x27\x0e\xa1\xe4\
+\xb4\xb3\xf1\xbf\x0e\xac\xbf\x4b\xe6\x27\xc6\x34\x19\xb5\xf6\xef\
+\xbf\x21\x82\x6d\xb2\xfd\x9e\xb1\xcf\x5c\xf3\xc5\x05\x74\x3e\x04\
+\x8b\xc6\x00\x00\xb0\xee\x3d\x5b\x36\x42\xa4\xff\xcd\x61\x6a\xbc\
+\x99\xda\xb7\x71\x3b\xea\x69\xc1\x0f\x4d\xb5\xec\x69\x98\x19\x5e\
+\x30\xdc\x83\xab\xce\x59\x8d\x4d\x6b\xfa\x30\x90\x4b\xa3\x27\x63\
+\x62\xaa\x60\xe3\xc0\x54\x11\x3b\xc7\x8b\x78\x6a\xdf\x1c\x1e\xda\
+\x36\x81\xf1\x82\x8d\x45\x03\x6e\x91\xc0\x09\xaa\xc6\x4a\x08\x7f\
+\x3c\x80\x00\x95\x11\x95\xcf\x54\x24\xde\xb7\xfb\x73\xaf\x5d\x08\
+\xf7\xc6\xa3\x75\x31\xe0\xe4\x3f\xba\xeb\x72\x36\xb2\x5f\x57\x4c\
+\x4b\x12\x3d\x21\x8a\xf8\x94\xa4\x72\x92\x22\x9d\x0e\x91\x3b\xca\
+\xf6\x15\x8c\xe2\x0f\x6e\xfd\x0c\x06\xd0\x65\x38\x77\x39\x2e\xbf\
+\x6d\xcf\x17\x5e\x5b\xec\x70\x50\x8b\x86\x1d\x2d\xac\x79\xd7\x5d\
+\xd7\xb0\x91\xfd\xaa\x62\xea\x6d\xa9\x9a\x03\x22\x3e\x7a\xa2\x53\
+\xc2\x76\x8e\x21\x70\x1b\x99\xa1\x20\x61\x72\xf5\xc0\x00\x2c\xe1\
+\xdc\xef\x2a\xf5\xfb\x7b\xbf\x70\xed\xec\x62\x0e\xe1\xa8\xa1\x6d\
+\xf8\x9d\x77\xbd\x01\x46\xe6\x56\x66\xea\x49\xfa\x44\x8a\xb0\x17\
+\x42\x95\x8f\x07\xb1\x93\x42\x3b\x4b\xbb\x31\x65\xbc\x90\x12\xee\
+\xf7\x5d\xa9\x5e\xbf\xef\xe6\x6b\x27\x17\xbb\xbb\x47\x15\x95\xab\
+\xdf\x71\xe7\x1b\x60\x64\x6e\x61\x50\xaf\xf6\x71\x11\x4f\xa7\xe0\
+\x5d\x22\x29\x72\xac\xb9\x82\x93\x89\x7f\x0f\x43\x24\x17\x18\x4d\
+\xe9\x90\x32\x9c\x07\x5c\x97\xdf\xb8\xff\x96\xeb\x16\x9d\xf8\xc0\
+\x31\xc0\xda\xea\xb7\xff\xcb\x35\x6c\x64\x6e\x63\x26\xff\x91\xdd\
+\x08\xeb\x3e\xb9\x37\x77\x82\x48\x83\x78\x37\x40\x5f\x25\xd9\xea\
+\x21\x5b\xc2\xb9\xd7\x91\x7c\xc3\x81\x5b\xaf\x4f\xbc\xc1\xa3\x5d\
+\x38\x26\xe8\x5b\x75\xe3\x3f\xfd\x1e\x99\x99\x7f\x90\x2c\xd6\x35\
+\x1e\x1b\xe9\x11\x34\xbb\xd5\x2e\x2f\x1c\xbd\x21\x72\x5b\xc9\xd1\
+\xc5\x5a\x48\x8d\x9a\xb4\x20\x82\x63\x91\xfd\x15\x47\xd2\xfb\x0e\
+\x7c\xf1\xfa\xc5\x0b\x77\x1e\x25\xec\x24\x82\x15\x37\xfe\xf3\x06\
+\x12\xe6\x3f\x2a\xa4\x2e\x68\x3c\x3a\x96\x09\xfc\x37\x89\x3a\x7a\
+\xac\x46\xb3\x10\xc2\xb7\xaa\x57\x13\x0b\x42\x60\x9e\xb8\xf2\xd7\
+\xac\xe8\xf3\x07\x6f\xdb\xbc\x88\x3e\xab\x1e\x8e\xa9\x00\x5d\x7e\
+\xe3\x5d\x43\x02\xea\x73\x52\x74\x5d\x87\xc6\xeb\xcb\xa3\xed\x02\
+\xd2\x65\x1c\x6f\x91\x9f\x04\x34\x86\x60\x92\x20\x8f\x69\xf0\x3e\
+\xc8\xd2\x7b\x0f\xdc\xf6\xc6\x7b\x8e\x55\x57\x8f\x39\x3a\x97\xdd\
+\xf0\x2f\x69\x02\xff\x21\x8b\xf4\x47\x19\xd4\x1f\xee\x50\x24\x07\
+\x44\x0f\xe1\x78\x32\x45\x9c\xd5\xef\x2b\x53\xff\xa9\x0f\x19\xa6\
+\x84\xfb\x13\xb7\x38\xf7\x8e\x23\xff\x78\xe3\x82\x57\xf6\x16\x02\
+\xc7\x0d\x75\xcb\xde\x72\xfb\x45\x64\x74\x7d\x4a\xd6\x54\x42\xdb\
+\xc6\xdf\x71\xed\xbd\x06\x16\x68\x0c\x1a\x02\x79\x92\xf9\x4f\xdb\
+\xd3\x87\x3f\x39\x75\xcf\x5f\x74\xb4\xb0\xb3\x10\x38\xae\x28\x1c\
+\x7a\xeb\x3f\x0f\x90\x72\xfe\x0c\x46\xf7\xbb\x15\xa8\xb7\x63\x6f\
+\xae\xc3\xc3\xa1\x6d\x41\xab\xe8\x5d\x6c\xdd\xea\x5f\x93\xec\x47\
+\xdd\xe9\xbd\x1f\xb0\x27\xf7\x3e\x58\x3f\x95\x32\xf7\xe0\xcd\x1d\
+\x34\xdc\x3e\x9c\x10\x73\x68\xe8\x4d\x5f\x3d\x9f\x0c\xeb\xff\x28\
+\x58\x97\x02\x64\x76\xdc\xab\x76\x22\x88\x2d\x21\x7e\x9f\xdf\x42\
+\x9a\x33\x84\x1c\x57\x93\x3b\x3e\x9f\x7f\xe2\xfe\xdb\xc8\xb4\x66\
+\x44\xa6\x4f\x41\xb9\x8a\x95\x52\x00\xa3\xf4\xab\x07\x8e\x19\x13\
+\x9c\x10\x0c\x00\x00\x4b\x36\xdf\x94\x21\x21\xae\x45\xba\xf7\xfd\
+\xa0\xd4\x19\xbe\xe9\x7c\xc2\xf4\x72\x01\xe0\x51\x0d\x44\x3c\xcf\
+\x85\x83\xdf\x2d\xfc\x62\xcb\xa7\x2b\x3b\x1e\xda\x0a\xc0\x05\x20\
+\xa9\xab\x57\xa6\x06\xd7\x49\x96\xb6\x62\x69\x2b\x77\x7c\xec\xb7\
+\x8f\x01\xfa\xaf\xfe\x04\x71\xa5\x40\x00\x2f\x11\xd9\xfe\xeb\x45\
+\xf7\xd0\x1f\x41\xa4\x4f\x03\x20\x7e\xa3\x3c\x00\x20\x64\xe5\x13\
+\xe4\xbc\x9a\xdb\xff\xe3\xf9\xc7\xef\xfd\x6a\x65\xec\xa1\xc7\x01\
+\x38\x9e\xcb\x05\xe0\x92\x95\x75\x61\x5a\x12\x8e\x2d\xd9\x29\xfe\
+\xf6\x31\x40\xef\x2b\x3e\x4c\xaa\x3c\x2b\xe0\xda\x46\xe1\xa7\xb7\
+\x18\xc6\xe0\xc9\x4b\x32\x67\x5c\x79\x95\xb5\xe6\xbc\x1b\x61\x66\
+\xcf\x02\x28\xbc\x7b\xe9\x58\xea\xfc\x56\xa0\xb1\x09\x04\x3b\x73\
+\xee\xe4\xd8\x4f\x8b\x4f\x7d\xe7\x5f\xed\xdd\x8f\x3d\x03\xa0\x82\
+\x2a\xd1\xeb\xff\xbd\x97\x04\x09\x17\xac\x24\x80\x45\x59\xea\x4d\
+\x02\x27\x0c\x06\xbb\x2f\xbe\x91\x54\x39\x2f\x20\x5d\xa3\xf4\xf8\
+\x16\x03\xd5\xdd\x4a\xa6\xd1\xb7\xb2\x2f\x7d\xea\xe5\x97\x5b\xeb\
+\x2e\x7a\xa3\xe8\xea\x3f\x8f\x61\x34\xf7\x82\xeb\xd7\x90\x8f\x11\
+\x44\xd9\x06\xac\xe0\xe4\x0f\xcb\x43\x4f\x3f\x54\x7a\xf6\xfb\xff\
+\xe6\x1c\x7c\x66\x0c\x80\x8d\x2a\xd1\xe3\x19\xa0\xa6\x12\xf0\xdb\
+\xc8\x00\xd6\xda\x0b\x08\x4a\x12\xc8\x10\x72\x76\xbf\x21\x67\xf6\
+\x99\xa8\x31\x01\x00\x0b\xc2\xb0\xac\xb5\xe7\x9f\x9e\x1e\xbd\xf4\
+\x15\xc6\xc0\xba\x2b\x60\xe5\x46\x40\x22\x9d\x6c\x34\x9d\x0c\x33\
+\xd1\x96\x2e\x26\xb7\x38\x27\x67\xf7\x6e\xb5\xc7\x1e\x7e\xd0\xde\
+\xfb\x8b\xc7\x55\x61\x72\x0a\x4d\xa2\xdb\x81\x2b\xa4\x02\xd0\x24\
+\xbe\xc4\xe2\x98\x9b\x89\xe0\x84\x61\x00\x00\xa0\xae\x5e\x22\xb3\
+\x4b\x50\x2a\x2d\x64\xfe\x88\x01\xb7\x62\xa0\xba\x71\xb5\xce\x08\
+\x29\x00\x29\x91\xe9\xef\x36\x57\x9e\xb1\x31\xbd\xee\xc2\x97\x88\
+\x81\xb5\x17\x89\xae\xfe\xf5\x4a\xa4\x7a\x63\xc7\xb3\x90\x91\xc6\
+\x90\x81\x58\xba\x5c\x99\x9b\xe4\xd9\xfd\x63\xf6\x9e\x9f\x3d\xea\
+\x1c\xde\xfa\xac\x9c\xda\x73\x08\x4d\x22\x07\x09\xef\xd4\xfe\xbb\
+\xf0\x13\x5e\x7a\x2e\x55\xbb\x7e\x3b\x19\x00\x00\x81\x04\x20\x52\
+\x82\x52\x16\x81\x21\xd8\x29\x1b\x50\x8e\x40\x95\x11\xbc\xcc\x50\
+\x67\x08\xd3\x5c\x7d\xf6\xc9\x46\xcf\xb2\x51\x6b\xcd\xb9\xe7\x22\
+\xb7\xfc\x74\x61\xe5\x56\x91\xd9\xb5\x44\x91\x99\x41\x87\x5b\xdf\
+\xab\x9d\x92\x2e\xdc\xca\xbc\xaa\xe4\xa7\x30\x3f\x71\xc0\x3d\xfc\
+\xcc\x73\xee\xf8\xd8\x98\x3b\xb1\x73\x37\x57\xf2\x79\xf8\x67\x75\
+\x70\x86\xc7\xcd\x74\x2f\xd1\xeb\x17\xf0\x5b\xcc\x00\x9e\x3e\x11\
+\x20\x84\x80\x30\x89\x0c\x8b\x58\xda\x02\x4a\x09\x0f\x33\x04\x99\
+\xa2\xc1\x1c\x22\xbb\xa4\x5b\x0c\x0c\xaf\xa0\x74\xcf\x72\xd1\x3d\
+\xb8\x2a\xb5\xec\xd4\x51\xca\x0e\xac\x82\x91\x19\x84\x61\x66\x41\
+\x22\x4d\x86\x99\x26\x12\x29\x80\x88\x59\x29\x56\xae\x0d\xe9\xda\
+\xac\x9c\x0a\xdc\xca\x3c\x2a\xb3\x13\x6a\x66\xff\x7e\x67\x62\xe7\
+\x3e\xae\xe4\x27\xb9\x38\x35\x29\x67\x0f\x4c\x83\xd9\x4b\xc4\xfa\
+\xef\xba\x0e\x0f\xce\xec\x20\xb1\x83\x04\x67\xcf\x7f\xef\x46\xf1\
+\x63\x8d\xec\x13\x12\xbc\x31\x5f\x82\x30\x08\xc2\x24\x32\x2d\x02\
+\x33\x81\x95\x60\xe9\x10\xa4\x2d\x50\x65\x86\xfa\x55\x67\x8a\xe8\
+\xdf\x24\x0c\xea\xca\x59\x94\xca\xa6\x01\x08\x48\x87\x55\xa5\xe0\
+\xc2\xad\x78\x09\xe1\x25\x50\xfd\xb7\xf4\xfc\x57\xf0\x13\x35\x98\
+\xc6\x9e\xfb\x60\x3b\xba\xd3\x03\xc7\x94\xf0\x1a\x24\x9f\xd0\xe0\
+\x5f\x00\x20\x41\x10\x06\x60\xa4\x88\x0c\x8b\x60\x5a\x04\x25\x01\
+\xe9\x10\x84\x21\x48\x98\xc4\x4e\xb1\x16\x57\x80\xa8\xd5\x0f\xfe\
+\xf6\x5e\x3a\x7c\x44\x1e\x5b\xd1\x5c\x2a\xe2\x1e\xf0\x8b\xf5\x20\
+\x91\x8f\x0b\xd1\x23\x10\xfb\x9b\x0a\x54\x7d\x7b\x84\x30\x00\x61\
+\x12\x84\x09\x32\x52\x44\xa6\x05\x18\x69\x22\x23\x05\x18\x26\x20\
+\x4c\x62\x7b\x1e\xa8\x14\xa8\x7a\x8a\x24\x10\x2f\xae\x1d\xcd\xa9\
+\x1f\xc1\xaa\x1e\xe3\x95\xcc\x4a\x01\x2c\xd1\x38\xb6\x0c\x05\x08\
+\x93\x1b\x65\x9a\x01\x80\xe0\x6c\x3e\xe1\x88\xad\xc5\xde\xf1\xee\
+\xc0\xd1\x1d\x9d\x51\x65\x0e\xa2\xea\xeb\x69\x49\x80\xc8\x00\x44\
+\x5d\x10\x04\x8e\x27\xd5\xce\xe8\x41\xd5\x08\x5e\x3f\xc7\x0d\xc5\
+\x09\x17\x7f\x4e\x48\x22\x3f\x0f\xcf\xc3\xf3\xf0\x3c\xe8\xe1\xff\
+\x01\x41\x8d\x65\x88\x8c\xfd\xf5\x8b\x00\x00\x00\x25\x74\x45\x58\
+\x74\x64\x61\x74\x65\x3a\x63\x72\x65\x61\x74\x65\x00\x32\x30\x31\
+\x30\x2d\x30\x32\x2d\x31\x30\x54\x31\x32\x3a\x30\x31\x3a\x35\x38\
+\x2d\x30\x36\x3a\x30\x30\x13\xc7\x51\xbc\x00\x00\x00\x25\x74\x45\
+\x58\x74\x64\x61\x74\x65\x3a\x6d\x6f\x64\x69\x66\x79\x00\x32\x30\
+\x30\x39\x2d\x30\x31\x2d\x30\x34\x54\x31\x34\x3a\x32\x37\x3a\x30\
+\x30\x2d\x30\x36\x3a\x30\x30\x29\xdb\x16\x21\x00\x00\x00\x00\x49\
+\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x19\x60\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x00\x07\x74\x49\x4d\x45\x07\xd8\x0a\x1d\x0c\x19\
+\x30\x6e\xb9\xc3\xd1\x00\x00\x19\x02\x49\x44\x41\x54\x78\x9c\xed\
+\x9b\x69\x74\x65\x57\x95\xdf\x7f\xe7\x4e\x6f\x1e\x24\xbd\xa7\xa9\
+\xa4\x1a\xa4\x2a\xa9\xaa\x54\x93\x55\x83\xc1\x2e\xdb\x14\x6e\x46\
+\x7b\x75\xc0\x18\x62\x83\x6d\xa0\xe9\x04\x4c\x02\x2c\x92\xee\x5e\
+\x24\xcc\xe0\xd0\x09\xdd\x10\x16\xa4\x93\x40\xc7\x2c\x9a\xa2\x6c\
+\x08\x06\x43\xd3\x4d\xc0\x60\xca\x2e\x63\x63\xe4\x9a\x5c\xa3\x6a\
+\x94\x54\x9a\xf5\x06\xbd\xf9\xbd\xfb\xee\x70\xf2\xe1\x3d\xc9\xaa\
+\xd1\x65\x4b\x74\x7f\x48\xf6\x5a\x67\x5d\xad\xfb\xee\x39\xe7\xbf\
+\xff\x77\xef\x7d\xf6\x3e\xf7\x08\xfe\xbf\xfc\xbf\x27\x03\xf7\xd0\
+\x79\xf8\x5f\xd2\x03\xa0\xfd\x73\x02\x39\xfe\x4e\x82\x55\x0f\x9b\
+\x5c\xc1\x06\x21\x69\x40\xa0\x23\x09\x02\x48\xc9\x94\x10\x8c\x2a\
+\x2e\xa3\x15\xc1\xe0\x6b\xf6\x90\x5b\x8a\x39\x07\xee\xa1\x53\xd3\
+\x38\x29\x05\x1f\x07\x4e\xff\x93\x13\x70\xe0\x01\x36\xe1\x72\xbf\
+\xa2\x2a\x77\x9b\x8e\xbb\x02\x10\xde\x60\xb8\xe2\x89\xb5\xa0\xf9\
+\x7c\x42\xe8\x7e\x05\xd7\xa6\x3c\x33\x6a\x57\x67\x53\x8a\x5d\xb5\
+\x3d\x86\xc0\x39\xf4\x5e\x71\x10\x47\xfe\xa3\x23\xf8\xc5\xb6\xdd\
+\xfc\xfe\xd5\xcc\x5d\x57\xfe\x0c\xe0\x91\x2e\x1d\x00\x62\x29\x95\
+\xbb\x9a\x48\x10\x87\xee\xe3\x1e\x45\x11\x9f\x75\x5d\xd9\xeb\x6f\
+\xed\xac\x36\xdf\x7a\xb7\x11\x58\x79\x03\x5a\x7c\x0d\x4a\xa0\x0d\
+\x84\x72\x79\x3f\xbb\x0c\xe5\x24\xe6\xd4\x49\x0a\x83\xbf\x25\x75\
+\xf0\xc9\x6a\x69\x6a\xd4\x10\xaa\x38\x8e\x2b\xff\x3a\x18\xe5\xd1\
+\x35\xdf\xc0\xbc\x1e\x0c\x03\xf7\xd0\xa9\xe9\x0c\x7a\x62\xab\x7c\
+\x56\x76\x5a\xb8\x76\xe9\x9b\xfd\xdf\xe5\x43\x7f\x70\x02\x0e\xde\
+\xcf\x6d\x42\x88\xff\x2a\x25\x5b\xda\x76\xdd\x4d\xd3\xcd\xef\x11\
+\x7a\xdb\x16\xa4\x53\x81\xf4\x71\x64\x7e\x18\xf2\x23\xc8\xd2\x24\
+\x38\x26\x38\x56\x8d\x0c\x4f\x04\xe1\x8d\x81\xbf\x0d\xd1\xb8\x01\
+\x1a\xd6\x22\x54\x03\x3b\x31\x48\x6a\xdf\x77\xe4\xd4\x53\x3f\x94\
+\xd2\x71\x66\x25\xf2\x53\x37\xec\xe6\x9b\x02\xe4\x35\x95\xd7\x18\
+\xf4\xc4\x57\xf9\x7a\x3f\xf3\x1b\x71\xfa\x4b\x6f\x91\x95\xa9\xc1\
+\xc7\xfb\x77\xf3\x8e\x3f\x18\x01\x12\xc4\xe1\x07\xf8\xac\x74\xf9\
+\x4c\xd3\x0d\xb7\xc9\xf6\xbb\x3e\xa9\x68\xb1\x5e\x64\xe2\x10\x72\
+\xf2\xb7\xc8\xe4\x21\x70\xad\xeb\x1f\x50\xd1\x10\xd1\x1e\x44\xc7\
+\x1b\x10\xf1\xad\xb8\x66\x96\xec\xf3\x7b\xb8\xf0\xa3\xaf\xba\xb8\
+\xce\x80\x6d\xc9\xf7\x6f\x7b\x94\xc1\x4b\xbb\xcd\x2b\x1f\x5b\xe9\
+\x5b\xfb\xa5\xfd\x42\xd1\x0c\xce\x7e\xf9\x0e\x59\x38\xf9\xcc\x53\
+\x37\xec\xe1\xf5\x7f\x10\x02\x8e\xbf\x93\x60\xd5\x27\xf6\x20\xd4\
+\x3b\xd7\xfc\xab\xff\xac\x04\x36\xbf\x0b\x39\x7b\x12\xf7\xf4\x1e\
+\xc8\x0f\x2f\x7e\x02\x7f\x1b\x62\xd5\x1f\x23\xda\x5f\x87\xcc\x4f\
+\x32\xba\xfb\xdf\xdb\xe9\x23\x4f\x23\xe0\x3f\x6c\xf9\x1e\x5f\x99\
+\xb3\x86\x97\xde\xfc\x4a\x5f\xef\x67\xf6\x0a\xd5\x17\x06\x45\x67\
+\xf8\x9b\xef\x93\x99\x81\x1f\x1f\xbe\x61\x37\xfd\x4b\x4e\xc0\xfe\
+\x7f\x8d\x5f\xad\x88\x5f\x1b\x91\xd8\xb6\x35\x1f\x79\x58\xd7\x9a\
+\xd7\x21\x4f\x3e\x8c\x9c\x7a\x6e\xe9\x26\xd1\x02\xe0\x89\x22\x22\
+\xab\x11\x5d\x77\x41\xb0\x93\xd2\xd1\x9f\x70\xf6\xbf\x7f\xc8\x95\
+\xae\xfb\x58\xb9\xec\xbe\x4f\x53\x89\x2d\x34\x7b\xd5\xf0\x22\x67\
+\x06\x10\xcb\x76\x31\xfe\xe8\x9f\xc9\xe9\x5f\x7f\xeb\xfc\xd6\xdd\
+\xac\xbe\x3c\xf2\x2c\x42\x24\x08\xb5\x22\x1e\xd1\x03\xa1\xad\xbd\
+\x7f\xfe\x03\x5d\x8b\xb6\xe3\xbe\xf0\xf9\xa5\x55\x1e\x6a\xee\xa0\
+\x18\x50\xcd\x21\x87\x7e\x0a\x33\x03\x04\x36\xdd\x45\xdf\x43\xbf\
+\x55\xb4\x60\xe4\x2e\xaf\x57\xbc\xa0\x69\x9c\xb9\x48\xf9\xe9\xdf\
+\x83\x5d\x06\xd7\x46\x0b\x34\x0a\x51\x5f\x6e\x97\x94\x80\x83\xf7\
+\xf3\x61\xa1\x69\x77\xf4\x7e\xec\xdb\x86\xe2\x09\xe1\xbe\xf0\x39\
+\x28\x5c\x58\xca\x29\x40\xd1\x40\xd1\x2f\xba\xca\xdc\x10\x72\xfa\
+\xf7\x68\x4d\x6b\x58\xff\xc5\xdf\x69\x7a\xa4\xb5\xcf\x88\xad\xf4\
+\x5c\xa4\xbc\x53\xa9\xf5\x77\x2d\xb4\x50\x13\x0a\xf8\x61\x09\x13\
+\xa1\x81\x7b\xe8\x14\x42\xfc\xf5\xea\x07\x3e\xab\xa9\x2d\x1b\x70\
+\xf7\x7f\x01\xaa\x4b\x92\xbb\x5c\x2c\x62\x4e\xf1\xb9\x66\xd4\xae\
+\xd5\x2c\x72\xea\x59\x94\x96\x1d\xac\xff\xcb\xfd\x08\x04\x42\x11\
+\x17\x2b\x0f\xe0\x5a\xa8\x81\x28\x2e\x78\x60\x09\x09\xd0\x0d\xf1\
+\xd5\x48\xcf\x26\xd5\xbf\xf9\x6e\xe4\xd1\xff\x06\x85\xb1\xa5\x1a\
+\xfa\x62\x11\x0a\xa8\x0b\x09\xd0\x10\x8a\x5e\xfb\xcd\x2e\x21\x27\
+\x9f\x45\x04\x97\x03\x20\x0b\x17\x2e\x5f\x69\x5c\x0b\xd5\x1f\x05\
+\x51\xd3\x7d\x49\x08\x38\x70\x3f\xeb\x90\xf2\xae\x65\x77\x3c\xa8\
+\x30\xf5\x3b\x64\xea\xc8\x52\x0c\x7b\x65\xb1\x4b\x50\x49\x83\xd1\
+\x50\x77\x83\xba\x05\xcc\x89\x6b\x41\xee\xdc\xd5\xfb\xbb\x16\x9a\
+\x3f\x0a\xb2\xe6\xfe\x4b\x42\x80\x90\x7c\x2c\xb4\x7a\x9d\xa3\xc7\
+\xba\x15\xf7\xf8\xb7\xae\xfe\xa0\x16\x40\xb4\xdf\x5a\x4b\x6c\x82\
+\x1d\xa0\xf9\xc0\xa9\x42\x25\x01\x85\x31\x64\xea\x45\x64\xea\x68\
+\x2d\x21\xba\x96\x58\x05\xe4\xec\x09\x84\xba\x19\x7c\xcd\x35\x22\
+\xae\x57\x5c\x1b\xd5\x17\x02\x60\xef\xfb\x88\x2e\x9a\x80\x33\x1f\
+\xc1\x93\xcf\x8a\xfb\xe3\xfd\xbb\x74\x99\x39\x05\xe5\xe9\x2b\x3e\
+\x27\x3a\xdf\x84\xe8\xbe\x1b\x5c\x17\x73\xe4\x79\xca\x47\x9e\xc4\
+\x2d\xa6\x40\xd1\x30\xe2\xcb\xf1\x2d\xdf\x8a\xb6\xf1\xa3\x48\xbb\
+\x8c\x1c\xfb\x15\xf2\xc2\x2f\xc1\xca\x5f\x43\x11\x0b\x39\xb3\x1f\
+\x61\x97\xa1\xed\x96\x2b\xa6\xd2\x57\x12\xe9\x5a\x08\x4f\x00\x80\
+\x40\x95\x95\x8b\x26\x20\x9f\xe5\x16\x5c\xe9\x0b\x74\xf4\x38\xa4\
+\x8e\xa9\x97\x3f\x21\x10\x3d\xef\x46\xb4\xdd\x4a\x6e\x60\x0f\x23\
+\x3f\xfe\x9a\xed\x96\xf2\x2e\x8a\x72\x00\xe4\xb0\x40\x36\x80\xd8\
+\xe8\x3a\xee\x32\xa3\x21\x6e\x75\xdc\xf1\x21\x3d\xbc\xed\x5d\x88\
+\x8e\x37\x20\xcf\x3c\x82\x9c\xd8\xc7\x35\xb2\x5c\x64\xfa\x38\xb2\
+\x9a\x45\xe9\x7c\x13\xa8\x9e\x97\x07\xec\x5a\x28\x9e\x46\x00\x74\
+\x9d\x65\x8b\x26\x40\xba\xec\xf2\x35\xb7\x96\x84\x2a\x6c\x4a\x63\
+\x0e\xa0\x53\x8b\xb0\x06\x80\x68\xdb\x89\x88\xf4\x30\xf6\x9d\x07\
+\x9d\xc4\xa1\xa7\x2d\x21\xe5\x27\xfd\x06\x7f\xbb\xf6\xdb\xce\x82\
+\xd7\x2b\xd9\x7f\x2f\x6b\xab\xe9\xc4\x7b\xce\x3f\xf2\xd0\x47\xb5\
+\xc7\xbf\xe6\xef\xba\xef\xf3\x5a\x60\xf3\x07\x90\xcd\xdb\x70\x8f\
+\xfd\x8f\x9a\xef\x5f\x4d\x0a\x63\xb8\xe7\x7f\x84\x58\x71\x07\xc2\
+\x88\x5c\x1b\xb0\x6b\x21\x74\x5f\xed\x4f\x87\x8e\x45\xe7\x01\x42\
+\x11\x37\x04\x9a\x5a\x4c\x61\x17\x67\xdd\x6a\x7e\x06\x48\xce\x35\
+\xe1\x6b\x2e\xd0\xbc\xcd\x4d\x3c\xf1\x75\x37\x75\xf8\xe9\xbc\x86\
+\xdc\xde\xff\x3d\xbe\xba\xf6\xdb\x5c\x66\xdb\xdb\x1e\x65\xb0\x7f\
+\x0f\x9f\xf6\x94\xe5\x32\xbb\x90\xff\xab\xd3\xdf\xfc\x77\xce\xc8\
+\xff\xbc\xcf\x91\x81\xe5\x28\x3b\xbe\x00\xfe\xb6\x6b\x03\x31\x33\
+\xc8\x73\x3f\x42\x96\x93\xd7\x7e\xce\xb5\x10\x9a\x17\x00\x29\x96\
+\x82\x00\x44\xa7\x1e\x0c\x64\xa8\xa4\x12\x42\xca\x04\x90\x10\x88\
+\x84\x14\x24\x69\xee\x2f\x3a\xc9\xf3\x85\xf1\xbd\x3f\x91\x52\xca\
+\xb7\x6d\xde\xcd\xb1\x97\x1b\xaf\xef\x87\x14\xfa\xf7\xf0\x1f\xa5\
+\x42\xff\xec\xb1\x67\x2f\x9c\xfa\xd2\x9d\x96\x53\xcc\xa0\x6c\xfb\
+\x14\x04\x96\x5d\xbb\xb3\x53\x41\x0e\xff\x04\x59\x9a\xba\xc6\x33\
+\x16\x42\x28\x28\x86\x1f\x55\xd2\xbc\xf8\x4c\x50\xe0\xaa\x9a\x92\
+\x70\xab\xf9\x19\x64\xed\xcd\x4b\xdc\x84\x50\xbc\x29\xe1\x69\x2c\
+\x4f\x3f\xf3\x23\x47\x11\x3c\xd5\xbf\x9b\xa7\x5f\xc9\xb0\x5b\xbf\
+\xcb\x11\xa7\x2c\x6f\x30\x53\x13\x4f\x9d\xfc\xf2\xdd\xb6\x3d\x3b\
+\x8a\xb2\xf5\x53\xe0\x6b\xb9\x76\x47\xa7\x8a\x1c\xfe\x19\xb2\x38\
+\x71\xe5\xdf\xa5\x05\x42\xa0\x07\x9b\x24\x10\x5f\xbc\x05\x08\x51\
+\x41\xd8\xd3\x58\x85\x29\x04\x09\x20\x81\x50\x92\xf8\xe3\x39\x69\
+\x15\x67\x67\x07\x0f\xab\x8e\x2b\xf7\xbc\x9a\xb1\xb7\xfd\x90\xac\
+\x51\x91\x77\xda\xc5\xfc\xc0\x89\x2f\xbd\x03\xa7\x94\x46\xac\x78\
+\xcb\xcb\x77\x74\x2d\xe4\x85\x9f\x23\xaf\xb4\x22\x39\xb5\xc4\x48\
+\x8b\xb6\x00\x34\x2c\xde\x02\x14\x31\x81\x99\x9b\x12\xd5\xe2\x94\
+\x94\x32\x29\x25\x09\xa4\x9b\x40\xf1\x65\xcc\xc9\x73\x39\xd7\x32\
+\xf3\x52\xe1\xc9\x57\x3b\x7c\x51\xa5\x05\xe8\xd7\xfc\x21\x14\x23\
+\xf0\xf2\x39\xc2\x9c\x38\x55\xe4\xc8\xcf\x91\xe6\xec\xc5\xf7\x65\
+\x8d\x00\x3d\x12\xc7\x81\xe8\xa2\x09\x50\x84\x18\x12\xd5\x4a\x0a\
+\x2b\x33\xae\x08\x12\x8a\x42\x52\x40\x02\x85\x64\x25\x3d\x99\x47\
+\x11\xe3\xf9\x0b\x5c\xc5\x1e\xaf\x2d\xb5\x6d\x2c\x71\xca\x88\xb6\
+\x78\xd7\x7e\xe2\x71\x04\x36\x72\xf8\x1f\xae\x7f\x00\xbb\x8c\x1c\
+\xfe\x7b\xa4\x55\x7c\xe9\x5e\xdd\x02\x8c\x86\x16\xa1\x40\x68\xf1\
+\x2e\x20\x39\x6d\x3a\x6e\x4e\x4a\x92\x52\x8a\x84\x74\x49\x80\x92\
+\x14\x76\x69\xca\x2d\x66\xd2\x02\x71\x6e\xd7\x53\xd8\xaf\x74\xdc\
+\x81\x7b\xe8\xd4\x75\x71\xca\xd3\xd8\xea\x5b\xfb\x89\x1f\xa3\xe8\
+\x3a\xee\x81\xff\x74\xed\xe4\xe8\x4a\x62\x15\x91\x23\xff\x08\xee\
+\x1c\x04\x09\xae\x83\xa7\xa1\x05\x21\xc4\xe2\x09\x70\x4d\x79\xc6\
+\xad\x58\xb3\x52\x88\x84\x54\x64\x12\x45\x24\xa4\x70\x13\xb2\x3c\
+\x3b\x26\x9d\xe2\x14\x0a\x89\x57\x3a\xe6\xe1\x07\x58\x66\xe8\xe2\
+\xb8\xd1\xd8\xe2\xeb\xfd\xf8\x77\x51\x14\x6a\xca\x5f\x6a\xce\xd7\
+\x2b\x95\x24\x72\xec\x49\xe6\x13\x2a\xd7\x42\x8f\xc6\x41\x88\xc0\
+\xa2\x13\x21\x5b\xd8\x23\x56\xa9\x12\x76\x55\x2b\x21\x2c\xc5\x83\
+\xc0\x63\x4b\xc5\xbb\xe7\xb9\x6c\x73\x21\x65\xfa\xe3\xa5\xb0\x03\
+\xa9\xeb\x1e\x6f\xff\x7d\xb4\x81\x38\xa2\x47\x63\xc1\x9e\x0f\x7d\
+\x0d\x05\x13\xf7\xe0\xd7\xa1\x9a\x5d\x14\x4e\x99\x3b\x07\x33\x2f\
+\x20\x9a\x77\xd4\x4b\xe2\x06\x84\xc0\x58\x7c\x26\x68\x92\x28\x57\
+\xca\xa3\x46\x45\x4f\x61\xb8\xfa\x07\x1f\xb1\x5f\x7f\x78\xcc\xfd\
+\x74\xa5\xea\x74\xd7\x12\xc2\x6e\xb6\x6c\x5f\x73\x93\xe5\x88\x77\
+\x1f\x3f\xf8\xbb\xb3\xd7\x1a\xeb\xe8\xbd\xb4\x38\xaa\x38\xa4\x05\
+\x1b\x1b\xd6\xfc\xc9\xe7\x84\x2a\xaa\xb5\x2c\xf0\x95\x9a\xfd\xd5\
+\xb0\xce\x1c\x00\x5f\x33\xa2\xe5\x46\x54\x5f\x04\x29\xd1\x16\xbd\
+\x27\x28\x3f\x87\x72\xe0\x14\x8d\x4d\x1e\x0a\x0f\x9c\xdb\x7e\x77\
+\xb6\x2c\xfe\xae\x6f\x7d\xaf\x58\xd1\xd1\x2e\x5c\xd7\x65\x36\x9d\
+\xe1\xc4\xe9\xb3\x76\xa1\x58\x4a\x69\xae\x7d\xc3\x81\x03\x07\x26\
+\x37\x6d\xdf\xfe\x66\x55\xd1\xfe\x5c\x4a\xb9\x55\x4a\xa9\x29\x42\
+\x39\xb1\x4c\x2f\x7c\xf7\x8b\xdd\xc7\x3e\xa1\x07\x22\xed\x3d\x7f\
+\xfa\x79\xa1\xfa\x43\xb5\xb2\xd7\x2e\x82\x94\x20\x04\xb8\x0e\x48\
+\xa7\x36\xb1\x53\xa9\xf9\xb5\x6b\xd5\xfc\x5c\x5a\xb5\xca\xd2\x2e\
+\xd5\xee\x5d\x6d\xb5\x50\xbd\x28\x3b\xbf\x86\x95\x1e\xe3\xc4\xe7\
+\xdf\xb4\x74\x1f\x46\xd6\xee\xd8\xd1\xe4\x95\xe2\xdc\xa6\x8d\xeb\
+\xc3\xf1\x58\x93\x18\x3c\x75\x86\x62\xa9\x84\xaa\xaa\x08\x21\x48\
+\xcd\x66\x1c\xc7\x72\xbe\x07\x72\x02\x21\x3e\xb1\x66\x75\x97\xdb\
+\xd3\xd3\xad\xe6\x72\x59\x26\xce\x9f\x95\x9f\x0e\xff\x42\x00\xb4\
+\x6e\xbf\x19\x5f\x7b\x37\x5a\xb0\xa1\x96\xb1\x79\xfc\x28\xbe\x28\
+\x8a\x27\x04\x9e\x20\xaa\x37\x0a\x46\x10\xe1\x6d\x00\xd5\x5b\x4f\
+\x6b\xaf\xac\x86\xb4\xcb\x75\x32\x2a\x35\x42\xdc\x2a\xd8\x65\x44\
+\x6c\x0b\x76\x76\x8a\xa3\x7f\xd1\xbf\x84\x3b\x42\x2e\x9f\x33\x3c\
+\x46\x20\x3d\x9b\x11\x2f\x1e\x3d\xc1\x9a\xd5\x5d\xc4\xe2\x31\x4c\
+\xd3\xa4\x54\x2e\x93\xcd\xe5\x55\xd7\x76\x1e\x40\x28\xbc\xfe\x75\
+\x37\x8b\xdb\x6e\xb9\x49\x75\xa5\xcb\xf8\xd8\x38\xbb\xcc\xe7\xc4\
+\x5c\x75\x30\x34\x30\x80\x26\x9e\x47\xc7\x79\xd9\x39\x35\x6f\x40\
+\x2a\x86\x17\x3d\x18\x41\xf1\x07\xd1\x0c\x0f\x5a\xb0\x01\xc5\xe3\
+\x13\x8a\xee\x45\x0b\x44\x51\x0c\x0f\x8a\xee\x43\xf1\x05\x51\x74\
+\x2f\xc2\xf0\xa1\xce\x26\xa9\xce\xd6\xd2\xe5\x57\x4c\x40\xef\xcd\
+\x37\x87\x7c\xa6\xb9\xc9\x11\xc2\x37\x77\xcf\x95\xa2\x5d\xc0\x87\
+\x6d\xc7\x56\x2a\x66\x95\x3f\xfb\xf8\xbf\xa1\xa5\x39\xce\xec\xec\
+\x2c\x99\x4c\x86\xd9\xd9\x0c\xa9\x54\x8a\xbd\xfb\x7e\x27\xda\xdb\
+\xdb\x58\xb3\x7a\x15\xae\xeb\xe2\x4a\x17\xc7\x75\x19\x88\xec\xe2\
+\xe7\xd6\x26\x26\xa7\x93\x4c\x4c\x25\xf8\xe8\x83\x7f\x4a\xe7\xf2\
+\x0e\x0c\x61\x93\x9e\x99\x26\x3b\x33\xc1\xe4\xc8\x10\xc7\x8e\x1f\
+\x03\x33\x8f\x86\x23\xfb\x43\xd9\xef\xb7\x94\x4a\x52\x08\xd3\xeb\
+\x49\x4c\x79\x3d\xb8\xfe\x26\xdd\xac\x1a\x8a\xf4\x48\x08\x81\xf0\
+\x29\x0a\x41\x84\xf0\x49\x30\x04\x78\xa4\x44\x05\xa9\x48\x57\xce\
+\xaf\x7e\xd7\x4d\x40\x5f\xdf\xeb\x82\xba\xaf\xfc\x37\xae\x69\xdd\
+\xe7\xa2\x28\x62\x41\x89\xae\x02\x5e\x8f\x87\x9b\x5f\xbb\x83\x37\
+\xbe\x61\x17\x5e\xaf\x87\xf1\x89\x09\xa6\xa6\xa6\x48\x26\x53\xa4\
+\x53\x29\xa4\x0b\x55\xcb\xa6\x6b\xe5\x72\x0c\xdd\x20\x1c\x6a\xa4\
+\x21\x1a\xc5\xab\x07\xb0\x2d\x87\x6c\x36\x4f\x43\x34\xc4\xf8\xe4\
+\x0c\x89\x54\x9a\x50\x38\x80\x3f\xe0\x27\x5d\x71\x48\x55\x35\xaa\
+\x0d\xcb\x69\xdb\xd4\xc0\xc8\xe8\x38\xa7\x46\xc6\xc4\xe1\x42\xc3\
+\xbd\x57\x80\x29\x05\xfc\xd4\x54\x78\xc7\xe0\xc0\x40\x7d\xe9\xb9\
+\xf2\x5e\xc2\x73\x1f\xa0\xd1\xb0\x08\x5e\x2f\x01\x42\xf7\x57\x7e\
+\x66\x78\x3c\x3b\xff\xe8\x75\xb7\x28\x6d\x6d\xcd\x68\xea\xc5\x5d\
+\x43\xa1\x20\x91\x48\x18\xdd\xd0\x48\x24\x13\xe4\xb2\x59\x4a\xc5\
+\x12\xa5\x62\x91\x42\xa1\x48\xa9\x5c\x0b\x4a\xdd\xab\x56\xb2\x66\
+\x75\x2f\xb9\x5c\x8e\xc3\x87\x0f\x52\x28\x16\xf1\x79\xbd\xb4\xb6\
+\xb4\xe0\xba\x2e\x86\xae\x73\x61\x74\x94\xe5\xcb\xdb\x50\x14\x05\
+\x55\x55\x71\xa5\x4b\x66\x76\x96\x42\xa1\x48\xe7\xb2\x56\x56\x74\
+\xb6\x63\xdb\x0e\x72\x81\x6e\x52\xba\xe4\xf2\x79\x31\x78\x66\xe8\
+\x0e\x2a\x95\x5f\xf7\xf5\xf5\xdd\x78\xfc\xf8\xf1\xea\xd5\x14\xba\
+\xe9\x61\xd2\x40\xfa\xba\x08\xd8\xb4\xfd\xc6\x8f\x4a\xe4\x6d\x77\
+\xbf\xed\xad\x22\x1a\x89\x50\xae\x54\x30\x2f\x89\xb2\x5e\xdb\xc0\
+\x76\x1d\x4c\xd3\xc4\x75\x25\xba\x61\x10\x08\x06\xc9\x17\x0a\x58\
+\x96\x45\xb1\x54\xa6\xa5\x39\x8e\xe1\xf1\xf0\xab\x5f\x3d\xc1\x85\
+\xd1\x8b\xbf\x17\xf8\xbc\x3e\xbc\x5e\x0f\x81\x80\x8f\xa9\xe9\x04\
+\x8e\xe3\xa2\xaa\x2a\x81\x80\x9f\xa6\xa6\x26\x34\x55\x23\x9d\x4e\
+\x31\x3d\x93\xc4\xb6\x2c\x54\xf5\xe2\xcd\x27\x21\x04\x91\x50\x88\
+\x6d\x5b\x36\xea\xcf\xfd\xfe\xc0\x26\xd5\x17\xf8\x0c\xf0\xa9\x97\
+\xd3\xed\x0a\x5b\x58\x17\xcb\xc6\xad\x5b\x37\x2a\x88\xc7\x76\xde\
+\x74\xa3\xda\xb5\x6a\x25\x99\x6c\x86\x6a\xb5\x8a\x6d\xdb\xf3\xcd\
+\xeb\xf3\xd0\xd6\xda\x8a\xdf\xef\x47\x55\x55\x7c\x3e\x1f\xd1\x68\
+\x84\x96\x96\x66\xba\xbb\xbb\x58\xdd\xdd\xcd\x91\x63\x27\xc9\x64\
+\x73\xc4\x9b\xc2\xa4\xd3\x69\x5c\xd7\x45\x51\x94\xf9\xe6\xf1\x18\
+\x18\x86\x87\x91\xd1\x09\xfc\x5e\x2f\xb7\xec\x7c\x0d\xaa\xaa\xe2\
+\xf5\x7a\x89\x46\xa3\xb4\xb6\xb6\xb0\x6a\xd5\x2a\xfa\xfa\xd6\x13\
+\x0e\x87\x18\x1d\x1d\xa7\x58\x2c\x50\xad\x56\xe7\x5b\xb9\x5c\x26\
+\x1a\x8d\xe0\xf5\x78\xc4\x4c\x32\xb5\xb3\xb5\xad\x63\xef\xf4\xe4\
+\xf8\x35\xbf\xcc\x5c\x73\x19\xec\xe8\xe8\xf0\x35\xb6\x75\x1c\x8c\
+\x44\x82\x3d\x0d\xd1\xa8\x92\x48\x24\xb1\x2c\x0b\x5d\xd3\xf0\x07\
+\x7c\xb4\x35\x37\xb3\x69\xe3\x7a\x36\x6d\xda\x00\xc0\xc9\x93\xa7\
+\x38\x78\xf0\x00\x95\x4a\xcd\x3a\x14\x45\x21\x1c\x0e\xb3\x7d\xfb\
+\x56\x02\xc1\x00\xdf\xfa\x5f\xdf\xa3\xa5\x39\xc6\xf2\x8e\x36\x72\
+\xb9\x1c\x63\x13\xd3\x20\x60\x59\x6b\x33\x8d\x0d\x8d\x0c\x8d\x5c\
+\x60\x3a\x91\xe6\xc3\x1f\xfc\x13\x54\x5d\xb0\xff\x85\x03\x0c\x9d\
+\x1f\xc6\x75\xdd\xda\xdb\x52\x15\x3a\x3a\x3a\xb9\xf1\xb5\x3b\xf0\
+\xfb\x7c\xec\x7d\xea\x19\x0e\x1d\x3a\x42\xa9\x62\x62\x59\x36\xae\
+\xeb\xa2\x2a\x2a\xe1\x70\x90\x8a\x59\x75\x0b\x85\xd2\x64\xd6\xaa\
+\x6c\x18\x3e\x7c\x38\xf3\x8a\x09\xe8\xe8\xe8\xf0\xb5\x76\x74\x3e\
+\xe5\xc2\x0e\x10\x74\x77\xad\x20\x1c\x0e\x21\x5d\x97\x52\xa9\x44\
+\x36\x9b\x27\x3d\x9b\xa1\x62\x56\xe9\xee\x5a\x81\xa1\x09\x1c\xfb\
+\xea\x35\xcf\x8a\xe5\xcb\xb1\x2c\x87\xbd\xbf\x7d\x9e\x3b\xdf\xfc\
+\x7a\x32\x99\x2c\x67\xcf\x8f\x00\xd0\xb5\xb2\x93\x86\x86\x06\x7e\
+\xf9\xe4\xd3\xbc\xf5\x2d\x6f\xa4\xb9\x29\xca\xb3\xcf\x3e\x37\xaf\
+\xf8\xa5\xe2\x4a\x49\xd9\x74\x18\x9f\x98\xa2\x21\x1a\x61\xe5\xca\
+\xe5\x04\x7c\x1e\x1c\x09\xc5\x62\x91\x44\x22\xc9\xf4\x4c\x12\x81\
+\x40\x51\x95\xe3\x53\x17\x46\xb6\x8f\x8d\x8d\x95\xaf\x34\xd6\x15\
+\x63\x40\x6f\x6f\x6f\x7b\x24\xde\xfc\x3b\xdb\x76\x96\xdf\xbe\x6b\
+\x27\x7d\xeb\x7b\xb0\x2d\x9b\x42\xb1\x48\xb1\x50\xa4\x58\x0f\x6c\
+\xc5\x62\x13\x53\xd3\x09\x46\x47\xc7\xb0\x1d\x49\x7b\x6b\x23\x7e\
+\xaf\xf7\x8a\xa0\xa7\x67\x66\x88\xc7\xe3\x08\x21\x70\xa5\x24\x12\
+\x09\x11\x8b\x35\x00\x10\x8d\x86\xb1\xac\x2a\xb6\xed\xd0\xda\x1c\
+\xe3\xc2\xc8\xc8\x55\x95\x2f\x97\x4d\x26\x67\x52\x84\xc3\x61\xde\
+\x7b\xdf\xbb\x58\xbd\x7a\x15\xc5\x3a\xae\x39\x7c\x9d\xed\x2d\x64\
+\x32\x59\x86\x2f\x8c\x31\x39\x95\xec\x5b\xb6\xb2\xeb\x4c\x20\x10\
+\xd8\x71\xea\xd4\xa9\xcb\xca\xf2\xcb\x08\xe8\xe9\xe9\x89\xf9\x22\
+\x8d\xbf\x09\x05\x83\xcb\xef\xbf\xef\x9d\x34\x36\x44\x29\x16\x8b\
+\xd8\xd6\x95\xdf\x6e\x30\xe0\xc7\xeb\xf5\x30\x9d\x48\x33\x36\x91\
+\x64\x45\x47\x0b\x1e\x43\xbf\xec\x39\x5d\xd7\x71\x9c\xba\x52\x52\
+\xe0\xf7\xfb\x69\x6d\x8e\x23\xa5\x24\x18\x0c\x93\x4a\xa7\x01\xb0\
+\xaa\x16\x52\x5e\x79\xe9\x32\x4d\x8b\xb1\xa9\x24\x3d\xab\xbb\x78\
+\xfb\xdb\xdf\x4a\x24\x1c\xc6\xbe\x8a\xd5\x69\x9a\x46\x5b\x4b\x0c\
+\x8f\xae\x31\x36\x95\x58\xe6\x0b\x47\x7f\xd3\xd3\xd3\xb3\xf3\xf4\
+\xe9\xd3\x17\xed\x9a\x5e\x1a\x04\xb5\xe5\xdd\xab\x1f\x0b\x05\xfd\
+\xdb\xde\xff\xde\x7b\x94\xe6\x78\xbc\xf6\x90\xaa\x11\x0c\x05\x88\
+\x36\x44\x89\xc5\x62\xc4\x62\x4d\xf8\xfc\x7e\x1c\xc7\x21\x33\x5b\
+\x73\xaf\x50\xc0\x4f\xb5\x6a\x91\xce\xe6\x89\x84\x83\x08\x71\xb1\
+\x77\x85\x82\x21\xca\x65\x93\x89\xa9\x69\x14\x21\xe8\x58\xd6\x4e\
+\x20\x18\x20\x14\xaa\x3d\x3b\x7c\x61\x94\xe9\x99\x24\x9d\x1d\x6d\
+\x28\x8a\x20\x5d\x27\x64\x4e\x5c\x29\x19\x9f\x4c\xb2\x72\x79\x07\
+\x77\xbc\xe5\x76\xbc\x5e\x2f\x86\x61\xbc\x2c\xbe\x7c\x2e\x47\xc0\
+\xef\xa3\x50\x2c\x35\x28\x86\xb1\x79\x7a\x62\xfc\x07\xc0\xbc\x79\
+\x2d\xb4\x00\xa5\xef\x86\x6d\xef\x44\x88\xdb\xef\x7a\xdb\x9d\x6a\
+\x28\x14\x42\x53\x55\x1c\x21\x38\x39\x38\xc8\x91\x43\x47\x49\x26\
+\x93\x28\x8a\x4a\x3c\x1e\x63\xdd\xfa\x5e\xb6\x6c\xde\x44\xd7\xaa\
+\x95\x1c\x3c\x70\x88\x54\x3a\x4d\x6b\x73\x23\xc3\xa3\xd3\x14\x0a\
+\x65\x62\x4d\xd1\x8b\x14\x08\xf8\x03\x24\xc7\x26\x00\x59\x3c\x7d\
+\x7e\xc8\x1d\x9b\x9c\xf6\xad\x59\xbd\x52\xe0\x48\xe5\xdc\xf0\xb0\
+\x93\x2f\x94\x24\x92\xc2\xd4\x4c\xa2\x61\x65\xc7\xb2\x79\xe5\xe6\
+\x24\x99\xce\xa2\xeb\x1a\xb7\xdd\xf2\x1a\x84\x10\xa8\xaa\xfa\x8a\
+\xf0\x49\xd7\x55\x87\xc6\x26\xff\x68\x43\x7f\xff\x5d\xc7\x0e\x1e\
+\x7c\x6c\x8e\x84\x79\x02\xba\xba\xba\x42\x86\xae\x7d\x63\xc7\xb6\
+\x1b\xd4\xd6\x96\x38\x3e\x9f\x97\x81\x81\xfd\xfc\xed\x37\x1f\x26\
+\x99\x4c\xe1\xf1\x78\x6a\x51\x56\x55\xf1\xfb\xfd\xec\x7b\xfa\xb7\
+\xb4\xb6\xb6\xf0\xd6\x3b\xdf\xc2\xce\xdb\x76\xb2\x7f\xe0\x00\xe3\
+\xe3\xe3\x34\x36\x84\x48\xa4\x66\x69\x69\x6e\x42\x51\x6a\x19\xa7\
+\x10\x02\x8f\xd7\x4b\xae\x90\x77\x1d\xdb\x7d\xe1\xc2\xb9\xc1\x4f\
+\xb6\x74\x76\xbe\x21\x93\xc9\x6c\x12\xa0\x5b\xb6\x7d\x32\x31\x3d\
+\xf9\x8b\xb6\xf6\xce\x7f\x3b\x39\x39\xf3\xc7\x6b\x56\xad\xd4\xbc\
+\x5e\x2f\x8e\x53\xab\x07\x5c\xd7\x25\x91\x9a\x65\xfb\xd6\xcd\x68\
+\x9a\x86\xc7\xe3\x79\x55\xf8\x0a\xc5\xb2\x9a\x48\x65\xfe\xa6\xab\
+\xab\xeb\x97\xe7\xcf\x9f\xcf\x2e\x24\x40\xf3\x47\x1a\xde\xad\xa8\
+\x6a\x78\xeb\x96\x8d\x22\x1c\x09\xf3\xd3\xc7\xff\x81\xbf\xfb\xce\
+\x6e\x84\x10\x98\xa6\x49\xb1\x58\x9c\xf7\xad\x7c\x3e\x8f\xae\xd7\
+\xfc\xfc\xf1\x1f\xfd\x94\xdb\xdf\xb0\x8b\xed\x3b\xb6\x51\xd9\x57\
+\xc1\x71\x5d\xa6\x13\xb3\x54\xaa\x55\xa2\xe1\xda\x47\x48\x8f\xc7\
+\x83\xa6\xa9\x64\x32\x79\xc7\xb2\xaa\xc7\xf3\xf9\x7c\x31\x7f\xe2\
+\xc4\xe3\xc0\x4f\xa9\xad\x44\x0e\xa0\x34\x35\xc5\x8f\xcf\x24\x66\
+\xfe\x85\xa2\x28\x04\x83\x01\xca\xe5\x5a\xe0\xce\x64\xf3\x38\x8e\
+\x4b\xe7\xb2\x76\x3c\x1e\x0f\xaf\x16\x5f\xb9\x5c\x16\xc9\xd9\x5c\
+\xc4\x1b\x6d\xbc\x07\xce\x3f\x0c\xd8\x5a\x1d\x80\xaa\x1b\xfa\x47\
+\xd6\xf6\x74\x6b\xf1\x96\x38\x03\x03\x2f\xb0\xfb\xbb\x7b\x70\x5d\
+\x97\xe6\xe6\x66\xba\xba\xba\xd0\x34\x8d\xf1\xf1\x71\x12\x89\xc4\
+\xbc\x7f\x67\xb3\x59\xa4\x94\x3c\xff\xdc\x00\xb1\x58\x13\xdb\xb6\
+\x6f\xe3\x89\x5f\x3e\x81\xc7\xd0\x29\x95\x4c\xe2\x4d\x4d\x00\xf8\
+\x7d\x01\x40\x52\x31\x4d\xbd\x52\xa9\x1c\xad\x9b\x9f\xc3\xc5\xcb\
+\xb0\xac\x94\x8b\xc7\xaa\xd5\x90\x6a\x59\x16\x7e\x7f\x00\xdb\xae\
+\x59\x40\xa9\x6c\x12\x09\x87\xf0\x78\x0c\x9a\x62\x8d\xaf\x1a\xdf\
+\xf6\x1d\xdb\x39\x73\x6e\x58\x4b\xa6\xb3\x1f\x03\xbe\x03\x38\x2a\
+\xa0\x76\xf7\xf5\xad\xd0\x54\xfd\x0b\x6f\x7e\xe3\xeb\x44\x24\x12\
+\xe1\x4b\x0f\xfd\x17\xca\xe5\x32\x2b\x56\xac\xe0\xa1\x87\x1e\x62\
+\xc3\x86\x0d\xd8\xb6\x4d\x6f\x6f\x2f\x52\x4a\x4c\xd3\x9c\x0f\x42\
+\x96\x65\x21\x84\xa0\x58\x2c\xd3\xb7\x7e\x1d\x8e\x6b\x73\x61\x6c\
+\x12\x5d\xd7\x68\x69\x8e\xa1\xaa\x2a\xd1\x48\x94\x62\xa9\xc4\xb9\
+\xa1\x11\x39\x79\x61\xfc\x2f\xab\xd5\x72\x11\xa8\xd6\x49\x70\xa1\
+\xb6\x69\x6a\x96\xcb\xb3\xf1\xd6\xb6\x0f\xac\x5a\xd9\xa9\x06\xfc\
+\x01\x2a\x66\x05\x55\x55\x99\x99\x49\xa1\xe9\x3a\x5b\xb6\x6c\xc0\
+\xeb\xf5\x2d\x0a\x9f\x10\x52\x9c\x1f\x1e\x8d\x87\xfc\x0d\xdf\x49\
+\xa7\x67\xb2\x0a\xa0\x7a\x34\xcf\x2d\x8a\xa2\x38\x2b\x96\x77\xf2\
+\xd4\xde\xa7\xb1\x2d\x9b\x52\xa9\x44\x7f\x7f\x3f\xeb\xd7\xaf\x67\
+\xcd\x9a\x35\x74\x76\x76\xf2\xf6\xb7\xbf\x9d\x2f\x7f\xf9\xcb\x6c\
+\xd9\xb2\x85\x86\x86\x06\xc2\xe1\x30\xa1\x50\x88\x42\xa1\x80\xeb\
+\xb8\x8c\x8d\x8d\xb3\xba\xbb\x1b\xa5\x1e\xa4\xc2\xe1\x10\xf1\x58\
+\x8c\x40\x30\xc0\x99\x73\xc3\x2e\xc8\xa1\x7c\x3e\x9d\x02\xcc\x3a\
+\x01\xd5\xfa\xdf\x26\x60\x56\xab\x55\xd3\x75\xdc\x17\x8f\x0f\x9e\
+\x71\x7c\x3e\x2f\xcd\xf1\x38\x91\x70\x18\x45\x53\xd1\x75\x8d\xc6\
+\xc6\x86\x45\xe3\x5b\xb7\x6e\x2d\x42\x08\xc7\x13\xd4\x76\x02\xaa\
+\x06\x28\x8a\xaa\xac\x6b\x6d\x6d\x76\x0d\xc3\x50\x5f\x18\xd8\x8f\
+\x69\x9a\x18\x86\x41\x30\x18\xe4\xe1\x87\x1f\xa6\xbd\xbd\x9d\x7b\
+\xef\xbd\x77\x3e\x32\x6f\xd9\xb2\x85\x8e\x8e\x0e\x0e\x1d\x3a\x44\
+\xa5\x52\x41\xd3\x34\x0a\x85\x02\x93\x93\xd3\xac\xea\x5a\x49\x28\
+\x1c\xc4\xeb\xf1\xd2\xd4\x14\xa3\x54\x2a\x32\xb0\xff\xa0\x1c\x1a\
+\x19\x95\xf9\x4c\xee\xb3\x75\x65\xed\x7a\x9b\x73\x01\x59\xb7\x04\
+\x37\x3b\x9b\xfc\xe2\xd0\xb0\xf2\x58\x24\x14\x14\xfd\x5b\x36\x2a\
+\xa1\x50\x08\xaf\xc7\x8b\x50\x05\x86\x6e\xb0\x14\xf8\x62\xb1\x46\
+\x77\x7a\x3a\xd1\x47\xfd\x68\x85\x10\x52\x34\xc7\x63\x31\x01\x90\
+\x4a\xd6\x0a\x15\xc7\xa9\x55\x76\xa1\x50\x88\x1b\x6f\xbc\x11\xc3\
+\x30\x10\x42\x50\x2a\x95\xd0\x75\x9d\xb6\xb6\x36\x12\x89\x04\x53\
+\x53\x53\x08\x21\x90\x52\x52\x35\x6b\xd5\x67\x30\x18\xe4\xf4\xe9\
+\xf3\x9c\x3d\x3f\x3c\xe7\xdf\x33\xc5\x42\xee\x13\x43\x67\x4f\x3d\
+\x0d\x58\xf5\x76\x69\xaa\x67\x03\xfa\x85\xa1\xa1\x17\x55\xd5\xb8\
+\xff\xf0\xd1\x13\x5f\x39\x74\xe4\x78\xc7\xdc\x8f\x5b\x36\xd7\xea\
+\x8d\xa5\xc0\xd7\x10\x09\x2b\x33\x53\xc9\x66\x6a\x47\xae\x50\xa4\
+\xc0\xe7\xf3\x1a\x0a\xd4\x96\x2c\x21\x04\xba\xae\x73\xe4\xc8\x11\
+\x6e\xbf\xfd\x76\x22\x91\xc8\xfc\x20\x87\x0e\x1d\xc2\xef\xf7\x03\
+\xd0\xd4\xd4\x44\x2e\x97\xc3\x71\x1c\x34\x4d\x43\xaf\x67\x80\x5e\
+\xdd\x70\x1d\xc7\xd9\x5f\x2e\x95\x1e\x71\x2c\x73\x74\x6a\x7c\xfc\
+\x45\xd3\x34\x2b\x75\x93\xb7\xeb\x57\x79\x89\x05\x88\x39\x2b\x18\
+\x3a\x7b\xea\x59\xe0\xd6\xce\x55\xab\x36\x1a\x86\xb1\xd2\xeb\x0f\
+\xbe\x47\xd3\xd4\x6d\x80\xb2\x24\xf8\x3c\x1e\x45\x0a\xe9\x9d\xb3\
+\x00\x24\x6e\x72\x36\x9b\x73\x00\x25\x1a\x8d\x92\xcd\x66\xb1\x2c\
+\x8b\xe9\xe9\x69\xf6\xed\xdb\x47\x77\x77\x37\x6b\xd6\xac\x61\x64\
+\x64\x84\x4a\xa5\x82\xcf\x57\x3f\x60\xe0\xba\x78\x3c\x1e\x4c\xd3\
+\xc4\xe7\xf3\xcd\x4f\x9c\xcd\x17\x1d\xdb\xb2\x0e\x9c\x3f\x75\xf2\
+\xff\x2c\xf0\x77\xb3\xfe\xe6\xe7\x48\xb8\xb4\x10\x93\xf5\xfb\x46\
+\xfd\xea\x8e\x0e\x0d\xbd\x08\x0c\xf6\x6e\xd8\xb4\x2e\x93\xc9\xf6\
+\x2f\x15\xbe\x7c\xb1\x64\xcb\xda\x19\x86\xda\x49\x29\xd7\x91\x67\
+\xc7\xc6\x26\x90\x48\x7a\xd7\xf6\xd0\x54\x5f\xbe\x00\xf2\xf9\x3c\
+\x7b\xf6\xec\xe1\xc9\x27\x9f\x24\x93\xc9\xa0\x28\x0a\x9a\xa6\x91\
+\xcb\xe5\xa8\x54\x2a\xf3\x16\x13\x8f\xc7\x69\x6a\x6a\xc4\x91\x0e\
+\x89\xc4\x8c\xe2\x3a\xd6\x70\x5d\x11\x67\x41\xb3\x17\xdc\xb3\x2f\
+\x69\x97\xfe\x3e\xdf\xc7\x71\x9c\xe1\x89\x89\x69\xe1\x2e\x11\xbe\
+\x99\xe9\x19\x5c\xc7\x3d\x07\xf5\x44\xa8\x58\xcc\x3d\xa1\xeb\xda\
+\x57\x52\xa9\x59\xb6\xef\xd8\xca\x85\x91\x51\x26\x26\x26\x90\x52\
+\xd6\x7c\xa7\x5a\xe5\xc0\x81\x03\x74\x77\x77\x13\x8d\x46\xb1\x6d\
+\x9b\x5c\x2e\x57\x2f\x70\x1c\x54\x55\xa5\xb9\xb9\x99\x58\xbc\x91\
+\x99\xe9\x04\xc5\x52\x45\xcc\x24\x12\xbf\xb9\x86\x52\x57\x93\x4b\
+\xc9\x52\x00\x75\x76\x66\x6a\xaf\x3f\x10\x10\xc9\x64\x6a\xf1\xf8\
+\x66\x12\x14\xcb\x15\xad\x94\xc9\xff\x02\x6a\xc5\x90\x9e\x4d\xa7\
+\x4b\x6d\x1d\x9d\xb7\xba\x8e\xbd\xec\x35\xaf\xd9\x2e\x26\x27\xa6\
+\xd0\x75\x83\x64\x32\x59\xf3\x1d\x5d\x47\x55\x55\x4a\xa5\x12\xb9\
+\x5c\x8e\x52\xa9\x44\xb5\x5a\x25\x1c\x0e\x33\x33\x33\x43\x6f\x6f\
+\x2f\xb1\x78\x8c\xa6\x58\x94\x5f\xfc\xea\x29\x27\x95\x9a\xdd\x37\
+\x7a\xee\xec\xa3\xbc\x14\xf0\x16\xb6\xab\x9f\x78\x7a\xc9\x15\xc4\
+\xc2\x56\x2e\x97\x2b\x2d\xed\xed\xfd\xb6\x6d\x77\xde\xf4\xda\x1d\
+\xca\x62\xf0\x3d\xf1\xab\xa7\x9d\x74\x3a\xf3\xdc\xe9\x93\x47\xbf\
+\x45\x3d\x11\xd2\x00\xd5\x1f\xf0\x9f\x4a\xa4\xb2\xf7\x6f\xda\xb8\
+\x5e\xac\xdf\xb0\x96\xb1\x0b\xe3\x84\xc3\x11\x52\xa9\xda\xe6\xea\
+\x5c\x76\x25\xa5\xc4\xb2\x2c\x4c\xd3\x24\x9d\x4e\xd3\xdb\xdb\x4b\
+\x3c\x1e\xa7\xbd\xb3\x99\xf1\xf1\x49\xf6\x3d\xf3\x3c\xa9\x99\xa9\
+\x07\xf3\xb9\xdc\x54\xfd\x2d\x2e\x54\xfe\xe5\x37\xfb\x5f\x22\x68\
+\x21\x09\x18\x86\x71\x3a\x57\x28\xbf\x67\x43\xdf\x5a\x65\xfd\xc6\
+\x75\xaf\x0e\xdf\xc4\x24\x4f\x3f\xf3\x3c\xd9\x4c\xf6\xfd\xd9\xd9\
+\xd4\xe4\x1c\x01\x2a\xa0\xcf\xa6\x52\x99\x78\x73\x4b\xdb\xc9\x53\
+\x67\xd7\xdd\x7c\xd3\x8d\x6a\x4f\x4f\x37\xb3\xe9\x0c\x9d\x9d\xcb\
+\x71\x5d\x17\xd3\x34\xb1\x2c\x0b\xd7\x75\xd1\x34\x8d\xa6\xa6\x26\
+\x36\x6e\xdc\x48\x43\x63\x03\x6d\xcb\x9a\xa9\x56\x6d\x1e\xf9\xc1\
+\xe3\x76\xa5\x5c\xda\x7d\xfe\xf4\xe9\xc7\x79\x29\xe0\x59\x0b\x88\
+\xb8\x5e\x71\x79\x29\x48\x0a\x40\xcd\x65\x32\xd9\x86\x58\x3c\x36\
+\x78\xea\x6c\xdf\xce\x9b\x6e\x54\x7a\x7a\x56\xbf\x32\x7c\x96\xcd\
+\xa3\xdf\x7f\xdc\xaa\x98\xe6\x23\x67\x4e\x1c\xfd\xfe\x1c\x26\x41\
+\x2d\xea\xfa\x01\xaf\xc7\xe3\x89\xac\xdd\xb0\xf9\x07\x4d\xb1\xc6\
+\xbe\x07\x3f\xf8\x3e\xcd\xe7\xf3\x70\xf6\xf4\x10\x23\xc3\x17\x10\
+\x42\x99\x37\xb7\xb9\x16\x8b\x35\xe2\x0f\xfb\xc8\x65\xb2\x7c\xff\
+\x87\x7f\x6f\x67\x32\xd9\x23\xa7\x8e\x1d\x79\xa0\x5a\xad\xe6\x81\
+\x0a\x50\xe6\xa5\x8c\xef\xe5\x4c\xff\x52\x99\xc3\x66\x00\x3e\xc0\
+\x6b\x18\x46\x68\xed\xa6\xcd\xbb\x63\x8d\x4d\x1b\x1f\xfc\xd0\x2b\
+\xc4\xf7\xd8\xcf\xec\x6c\x26\x7b\xec\xd4\xb1\x23\xf7\x98\xa6\x99\
+\xad\xe3\x2b\x09\x6a\xe7\xfa\x7c\x80\x17\xf0\xf9\xfd\xd1\xc6\xee\
+\xb5\xab\xbf\x66\x78\x3d\x3b\xdf\xf1\xb6\x3b\xc4\xe6\x4d\x7d\x42\
+\x4a\x28\x16\x8a\x54\xcc\xda\x66\xa7\xae\xe9\xe8\x86\x86\x59\xa9\
+\xf0\xfb\x81\x03\xf2\xd9\xe7\x0f\x60\x9a\x95\xbd\x43\xa7\x06\xff\
+\xa2\x54\x2a\xcd\xd6\x15\x37\xeb\xd7\xca\xab\x50\x7e\x21\x09\xde\
+\x3a\x3e\x4f\x0d\x5f\xa4\xb1\xab\x77\xcd\x5f\x79\xbc\x9e\x5b\xdf\
+\xf1\xb6\x3b\xc4\xe6\xcd\xd7\x85\x4f\x56\xcd\xca\x33\xe7\x4f\x9d\
+\xff\x78\xa9\x94\x49\x2f\xc0\x55\x9e\x33\x33\x7f\x7d\xa2\xf9\xd6\
+\xbd\x6e\xdd\x3d\xc1\x60\xf8\x23\x8a\xa2\x44\xfa\xb7\x6c\x70\xbb\
+\xba\x57\xa9\x01\x5f\xad\x46\x9f\xcd\x64\x39\x7b\x76\xc8\x19\x3c\
+\x7d\x4e\x71\x5d\x77\xb6\x54\x28\x7c\xe3\xec\xe0\x89\x1f\xd6\x07\
+\xad\x2c\x50\xbe\xb4\x08\xe5\x17\x92\xe0\x5f\x40\x82\x17\xf0\xae\
+\x5e\xbb\xfe\x9d\x81\x48\xe8\xa3\x0a\x4a\xf4\x9a\xf8\xa4\x9b\x29\
+\xe5\x0b\x5f\x3f\x3b\x78\xe2\x7f\x2f\xc0\x37\xd7\x4a\x73\x04\x28\
+\xbc\x64\x05\x73\xa7\x3c\x0d\xdd\xef\x0f\x2e\x6b\xef\xbc\xd5\x1f\
+\xf4\xef\xd2\x75\x63\xa3\x80\x26\x00\x57\xca\x94\x55\xad\x1e\x29\
+\x97\x8b\x7b\xc7\xc7\xc7\xf7\x59\xa5\x52\x81\x9a\x8f\xcf\x15\x36\
+\x73\xe6\xbf\x58\xe5\x17\x92\xb0\x10\x9f\x07\xd0\xeb\xf8\x6e\xbb\
+\x12\xbe\x6a\xb5\x7a\xb4\x52\x2a\xef\x1d\x9f\x18\x9d\xc3\xb7\xb0\
+\xf8\x9a\xc3\xe7\x2e\xcc\xc6\x94\x05\x83\x1b\xd4\x56\x07\xbd\x7e\
+\x55\xb9\xf8\xbf\x4b\xe6\x8a\x97\xb9\xf5\x7a\x61\x8a\x3b\x97\xf2\
+\xfe\x21\xc4\xa0\x46\xc2\x1c\xbe\xb9\xeb\x1c\xbe\x85\xfa\x2c\xc4\
+\x37\x17\x88\x17\x56\x9f\x2e\x5c\x9e\x8e\x8a\xfa\x60\x3a\x97\x2b\
+\x2f\xb8\xbc\x7a\x5b\x98\xe8\xcc\x45\xfd\x7f\x0a\x31\x16\xe0\xbb\
+\x12\x01\xf2\x0a\x18\x17\x2e\xc5\xf3\x96\x79\xb5\x0f\x23\xca\x82\
+\x26\xb8\x9c\xdd\xf9\xf2\x75\xc1\x24\xff\x1c\x32\xa7\xf8\x42\xac\
+\x73\x32\x87\xf1\x52\xac\x17\xc9\xf5\x9c\x10\xb9\x28\x21\xe1\x25\
+\x76\x97\xca\xbf\x97\x4a\x5e\x15\xce\xff\x0b\xe5\x7e\xe4\xc4\x29\
+\xee\x9e\x77\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x07\xbf\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95\x2b\x0e\x1b\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\
+\x8e\x7c\xfb\x51\x93\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\
+\x25\x00\x00\x80\x83\x00\x00\xf9\xff\x00\x00\x80\xe9\x00\x00\x75\
+\x30\x00\x00\xea\x60\x00\x00\x3a\x98\x00\x00\x17\x6f\x92\x5f\xc5\
+\x46\x00\x00\x07\x35\x49\x44\x41\x54\x78\xda\xec\x9a\x5b\x6c\x1b\
+\x55\x1a\x80\xff\xb9\xd8\x33\xbe\x8e\x63\x1b\xdf\x70\x62\xc7\xb9\
+\xb6\xa9\x1c\xda\x72\xa9\x42\xab\x02\xbb\x81\x92\xdd\x42\x01\xd1\
+\x25\x55\xb5\x5b\x75\x77\xc5\x16\x10\xed\x0b\x52\x90\x2a\x10\xa8\
+\x08\x0a\x22\x5c\x1e\x68\xa4\x76\x1f\x60\x91\x28\x88\x42\x85\x50\
+\x4a\xa0\x0d\xb4\x22\xa1\x29\x59\xc2\x66\x49\x71\x12\x94\x38\xb1\
+\x9b\xc6\x6e\xec\xfa\x92\x78\x7c\x99\x0b\x0f\x4d\xcb\x64\xe2\x82\
+\xe2\xb8\x65\x9c\xf8\x97\xf2\xe0\x93\xdf\xc7\xf3\x7f\x73\xce\x7f\
+\x3b\x07\xe1\x79\x1e\x96\xb3\xa0\xb0\xcc\xa5\x08\xa0\x08\xa0\x08\
+\x60\x79\x0b\x9e\x87\x39\xa8\x2c\x63\xd1\xe5\x00\x80\x9a\x9c\x19\
+\x5e\x77\x72\xfc\xdd\x57\x7d\xb1\x81\x3a\x8e\x67\x40\x86\x12\x60\
+\x54\x96\xf9\xad\xea\xea\xee\x52\xcd\xca\x2f\x6d\x9a\x9a\x6e\x8d\
+\xdc\x38\x26\x65\x30\x48\x2e\x79\x00\x0f\x9c\xfe\xe4\xf8\x3b\xad\
+\x5f\xfb\xde\xfb\x1b\xcb\x33\xbf\xb1\xc7\x50\x50\xc8\xb4\x60\x54\
+\x94\x05\x2d\xea\xca\x1e\x9b\xba\xba\xbb\x4c\xbb\xea\xb8\x8e\xb4\
+\x0e\x4b\x01\x4c\x2e\x00\xa8\x93\xe3\xef\xb4\x9e\x1a\xff\xcf\x4e\
+\x0e\xb8\xdc\x7f\x18\x10\x20\x71\x0d\x94\x90\xd6\x69\x9b\xa6\xba\
+\xcb\xac\x74\xf5\x3a\x75\x37\xb5\x1b\x14\x76\x0f\x02\x28\x7b\xbd\
+\xc0\x2c\x18\x40\x30\x31\x72\xe7\xbb\x3f\xb4\x74\xc6\xd3\xa1\x6b\
+\xf3\x40\x80\x00\x81\x29\x41\x47\x5a\xd2\x66\x95\xab\xd7\xa2\xae\
+\x3a\xed\xa4\xdc\x9f\xdf\xa0\x74\xf6\x61\x88\x2c\x95\xef\x55\xb3\
+\x60\x00\x3d\x13\x1f\xbd\xdc\x31\x72\xe0\x29\x7e\x11\x6f\x3f\x57\
+\x21\x30\x25\x68\xe4\x06\x30\xa9\xca\xfb\xad\xea\xea\x6e\x87\xd6\
+\xdd\x61\x56\xb9\x7a\xe5\x98\x22\x9e\x2b\x94\x05\x03\xf8\x64\xf8\
+\x95\x53\x7d\x81\xcf\x36\x48\xc9\x91\xc9\x51\x12\x1c\x94\x7b\x64\
+\x5b\xdd\x8b\x15\xd7\x3c\x0f\x60\x79\x16\x93\x9a\x27\x4f\x73\x49\
+\x48\xb2\x33\xba\x62\x22\x54\x04\xf0\xfb\x64\x82\xbf\x2a\x1a\xb9\
+\x01\x6a\x0c\x0d\x1d\x14\x61\x1e\xc5\x11\x59\x22\xc1\xc4\x4c\x13\
+\xf1\xc1\x0d\xfe\xf8\x59\x47\x8a\x4d\x2c\x5d\x00\x0a\x5c\x03\x77\
+\x3a\x76\xbc\x74\xb3\xf5\xbe\x57\x66\xe3\xba\xd0\x43\x53\x2c\x9f\
+\x21\xbe\x1a\x7b\xfb\xf5\x9e\x89\x8f\x9b\x33\x5c\x72\x69\x6d\x01\
+\xa5\x8c\x82\x07\xaa\x5b\xfe\x7e\x8b\x75\xcb\x4b\x08\xa0\xe1\x2c\
+\xe1\x29\x8a\x21\xb2\xe0\x1f\x9c\xff\xd8\xb5\xb3\xfe\x8d\x46\x3d\
+\x69\xcb\x3a\x0f\x86\xe0\xb0\xc9\xf5\x58\xeb\xa3\xab\xdb\x36\xdd\
+\x53\xbe\xab\x55\x86\x92\xd2\x07\x80\x02\x0a\xeb\x6c\x0f\x1d\xac\
+\xd2\xaf\x3b\x22\x30\xdc\x29\xfa\xbb\x02\xc2\xa2\xaa\xfc\xf6\xe1\
+\x15\xcf\x36\xaa\x65\xfa\xf9\x71\x1f\x57\x81\x93\x5a\xfd\xa9\x45\
+\x55\xd5\xe1\xd4\xd5\x7f\x8e\xa3\x72\xe9\x03\x28\xd5\xae\x0a\xae\
+\xbb\xf1\xa1\xe7\x85\xc6\x7f\x7b\xfe\xe8\xee\xfd\xa7\xef\x1f\xdd\
+\xd7\x75\xcf\xe8\xfb\x3f\x3e\x73\x2c\xcd\xd2\x75\x62\x08\xeb\x4b\
+\x1f\x69\x45\x45\x8f\x43\x11\x26\x5a\xaf\xb0\x0d\x17\xcc\x16\xc0\
+\x10\x1c\xdc\xa6\x3f\xb6\xc9\x50\xd2\x7f\x79\x6c\x28\xfc\xcd\x96\
+\xe3\xde\x43\x7b\x92\xcc\x34\xb0\x3c\x03\x9e\x50\x57\xed\x71\xef\
+\xc1\xd7\xc4\x2b\xc1\x6d\x6a\x6c\x33\x28\x4b\xe7\xcc\x77\x83\xd2\
+\xd9\x27\x9c\x4b\xf2\x00\xd4\x72\x03\x94\xeb\x56\xb7\x0b\xc7\x06\
+\xa6\x4e\x36\xa7\x59\x7a\x8e\xde\x70\xb8\xa7\x31\x92\x9a\x74\xcd\
+\x75\x9a\xda\x60\x39\x75\xe9\xbb\x72\x94\x04\x05\xae\x01\xbb\xa6\
+\xf6\x54\x41\x45\x01\x1d\x61\x0e\x96\x90\x36\x8f\xa0\x6c\x76\x85\
+\x69\x7f\xad\x58\x6f\x26\x73\x11\x26\xe2\x83\xb7\xea\x08\x4b\xa7\
+\x70\x15\x94\x6a\xeb\x4e\x7c\x17\x68\x6f\xda\x50\xb6\xbd\x6d\xbd\
+\xbd\xb9\x45\xbc\x1a\x76\xb8\x5f\xbd\xeb\x22\x7d\xbe\x66\x34\xda\
+\xd7\xf4\xdd\xe4\xb1\xcd\xf9\x88\x1e\x79\x05\xa0\x57\xd8\x06\x85\
+\x1e\x7f\x3a\x1d\xb6\xd1\x4c\x5c\x2b\xd6\xcb\x70\x29\xb8\x90\x18\
+\xab\x13\x8f\xdf\xa8\xa9\xed\x52\xc9\x4a\xb2\x56\x7b\x18\x22\x0b\
+\x9a\x94\xae\xa0\x49\xe9\xfa\x92\x22\x4d\xa3\xfd\xc1\x13\x79\x01\
+\x80\xe6\x17\x80\x7d\x40\xf4\xa6\xcd\x89\x4c\x2c\xab\x6e\x88\xf6\
+\xd5\xcd\xdf\x42\xfa\x73\x4a\x99\x96\xfe\x95\x56\x9b\x74\xb7\x00\
+\x8e\xca\x41\x47\x98\xe7\x78\xec\x30\x3d\x51\xc5\x70\xa9\xac\xfa\
+\x91\x54\xc0\x29\x1e\x93\xa1\xa4\x5f\x89\x6b\x83\x27\xbc\x87\xfe\
+\x35\x14\xfe\x66\xeb\x4e\xf7\x9b\x06\x61\x1f\xe2\xd3\x9f\x5e\xff\
+\x10\x43\xf0\x14\xc3\xa5\x95\x62\xbf\x22\xc9\x54\x98\xe3\x59\x8c\
+\x87\x85\x95\xdb\x2a\xb9\xfe\x1c\x00\x38\xb2\xcc\x25\x9f\x4a\xf8\
+\xf4\x34\x13\x93\x66\x14\xc0\x51\x39\x08\x1d\x60\xae\x42\x62\xaa\
+\x48\x41\xa6\xc2\x08\xa0\x80\xa1\x18\xbb\xe8\xe2\x89\x30\x8e\x17\
+\xcb\xe1\x22\x80\x02\x04\x90\xe1\x92\x30\x95\x98\x1f\xda\x16\x2a\
+\x17\x12\x63\xee\x25\xb3\x02\x50\x04\x63\x11\x40\x96\xc7\x0a\x60\
+\x39\x06\x66\x32\x11\x8b\x28\x33\x1c\xc6\x51\x62\x41\xf3\x44\x93\
+\x81\xca\x82\x04\xc0\x03\x07\x49\x66\xda\x30\xb7\x31\xa2\x0b\x28\
+\x70\x75\x56\xfd\x12\x72\x7e\x99\x4b\x33\xb1\x2a\x9a\x89\x1b\x0a\
+\x76\x0b\x84\x68\x9f\x7b\x6e\x66\x47\x24\x71\x94\xc8\x1a\x1a\xf5\
+\xa4\x6d\x68\x5e\x91\x94\xbe\x68\x49\x64\xa2\x58\xc1\x02\x98\xa2\
+\x7d\x75\x19\x2e\x69\x17\x94\xb8\xbd\x1a\xb9\x7e\x62\x5e\xd2\x84\
+\xc8\x20\x5b\xa3\x23\x98\xf0\xae\x49\xb1\x33\x85\x1b\x06\x23\xc9\
+\x80\x42\xec\xc5\x1d\x54\x7d\xe7\xbc\x6c\x0f\xd7\x80\x55\x55\xd5\
+\x2b\x1a\xa6\xc6\xa2\xfd\x77\x67\xae\x52\x3b\xe0\x88\x3c\x81\x21\
+\xb8\xb4\x01\xd0\x4c\x0c\x3c\xa1\xaf\xb7\x0b\x2b\xb9\x95\xc6\x8d\
+\x87\x75\x84\x79\x8e\x9e\xab\x64\xed\x19\xa3\xd2\x71\x56\xf4\x5d\
+\xd3\x68\xb4\xaf\xe9\xf2\xe7\x14\x93\xa0\x68\x26\x56\x75\xf9\xb3\
+\x41\x59\x3a\x70\x87\xe3\xaf\x2f\xd4\x1a\x6e\x1f\xf8\x53\xc5\xee\
+\x17\xec\x9a\x15\x51\xc9\x01\x00\x00\xf8\x7f\xb0\xb3\x39\x92\x9a\
+\xfc\xe5\xc1\x15\x76\x4f\x63\xf9\xa3\x4f\x2b\x65\x14\x20\x80\x80\
+\x43\xeb\x9e\x6a\x74\xfe\x73\x0f\x00\x78\x85\x6f\xff\xfb\x40\xc7\
+\xe3\x53\x09\xdf\x95\x81\x78\x3a\x84\x5d\x4c\x9e\xaf\x12\xa4\xda\
+\xe1\xb5\x96\xcd\x7b\xff\xb2\xe2\xf9\x55\x37\x5b\xef\xdb\x8b\x20\
+\x28\x9b\x8f\xe7\xcd\xfb\x9a\x8a\xa4\x26\xa1\xdb\xff\xc1\x73\x4d\
+\x15\x4f\x6e\x9b\x6d\x6a\x78\x57\x1a\x37\x1e\x5e\x69\xdc\x78\x58\
+\xa0\xe6\x9d\xeb\x3c\xfd\x75\x67\x26\x3e\xde\x2d\x3c\x71\xa6\x99\
+\x18\x9c\x3e\x77\xe4\x99\x07\x6a\x5a\x4e\xcf\xb6\xd6\xaf\xc0\x62\
+\xf9\x0c\xc1\x71\xac\x5c\x92\x00\x00\x00\xfa\x02\xc7\x9a\x28\xc2\
+\xb4\xef\x76\xfb\x23\x7b\x2f\x43\xb8\x8a\x2a\x35\x9d\x0e\xd9\x8f\
+\x0e\xed\x6f\x8f\xa4\x02\xf3\xfe\xf9\xc3\x85\xce\xdb\x62\xe9\x0b\
+\x3f\xae\x31\x37\xbd\x56\x42\x5a\x3d\xa3\x91\xbe\xcd\xde\xe8\xf7\
+\xf7\xfa\xe3\x1e\x6b\xbe\x0e\x53\xae\x09\x00\x86\x4b\x43\xa7\xf7\
+\xdf\x4f\x84\x68\x5f\xfd\x26\xd7\x13\xdb\x66\xcf\xef\xa3\xa2\xbc\
+\x41\x3f\x18\xea\xde\xda\x31\xf2\xd6\x81\x6c\xc6\x5f\xd2\xe1\x61\
+\x2c\xda\x6f\x1a\x8b\xf6\xbf\x58\x70\xa9\x30\x07\x1c\xf4\x05\x3e\
+\xdb\xd0\x7a\x66\xab\xef\xe8\xd0\xfe\x76\x61\x78\x04\x00\xf8\x5f\
+\xe0\x8b\x5d\x1f\x7a\xf6\x5d\xd5\xf8\x25\x53\x0d\xa6\xd8\x04\x78\
+\x42\x5d\x0d\xe7\xe2\x9e\x06\xe1\xb8\x53\x57\xdf\xa1\x91\x1b\xf2\
+\x68\x08\xc6\x48\xb6\x1c\x4e\xb1\x33\x30\x12\xf9\xef\x16\x61\x78\
+\xd4\x11\x96\xe1\x3f\x57\xee\xd9\x51\xa1\x5b\x3b\x66\x54\x94\x2d\
+\xfa\x37\x28\xd2\xfc\x93\xa4\xfb\x01\x67\xa7\x4e\x35\xc7\xd3\x53\
+\xc2\x5e\x5f\xb4\xa2\xe4\x96\xb7\xb7\xaf\x7a\xb9\xbe\xde\x7c\x77\
+\xdb\x62\xbb\x51\x36\x75\x75\x97\xa4\x01\x84\x68\x3f\x9c\xf0\x1e\
+\x3a\xc0\x03\x27\x3e\x05\x5d\x74\x42\x43\x11\x26\xa8\x31\x34\x7c\
+\x20\xf9\x8e\x50\x7f\xf0\x78\xc3\xfb\x67\x9f\xed\x0a\xd1\xfe\x86\
+\xd9\xed\x40\xb1\x7c\xc6\x94\x64\xa6\xf5\xb9\xef\x7d\x14\xd6\x58\
+\x9a\x0e\xea\x08\x4b\x4e\x87\xa8\xf8\xf5\x04\xc0\x03\x0f\x83\xe1\
+\xee\xda\xc1\x70\x77\x57\x3e\xe6\xc3\x10\x1c\x6e\xb3\x3d\x78\x64\
+\x7d\x69\x73\x4b\xae\x2b\xe9\xba\x02\x58\xbc\xa7\xff\xe5\xda\xad\
+\x5d\xbb\xe2\xab\xd5\xe6\xa6\x37\x0c\x97\x4e\xa3\x72\xde\x46\xb8\
+\xd4\x0d\xb5\xa8\x2b\x7b\xca\xa9\x9b\xda\xcd\x2a\x57\xef\xb5\xb8\
+\x5f\x8c\x4b\xc9\xd0\xdf\xe3\x22\x35\xbe\x5c\x0c\xbd\x2e\x00\xa4\
+\x7e\x35\x3e\x6f\x00\x0a\xd1\xd0\xab\x26\x51\x0b\xbd\x2c\x9d\xe1\
+\x92\x76\x19\x4a\xc6\x0b\xcd\xd0\xbc\x01\x58\x6a\x52\x3c\x1b\x2c\
+\x02\x28\x02\x28\x02\x58\xd6\xf2\xf3\x00\x82\xee\xd8\x4f\x3e\x64\
+\xa5\x0f\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x1b\xfc\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x80\x00\x00\x00\x80\x08\x06\x00\x00\x00\xc3\x3e\x61\xcb\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x00\x07\x74\x49\x4d\x45\x07\xd6\x05\x02\x09\x22\
+\x0f\x52\x86\x72\x57\x00\x00\x1b\x9e\x49\x44\x41\x54\x78\x9c\xed\
+\x5d\x6d\x6c\x1c\xc7\x79\x7e\x66\x67\x3f\xee\x8e\x47\x52\xa4\x24\
+\x8b\xa4\x44\x8a\x52\x05\x09\x55\x01\x23\x8d\x1c\xc0\x50\x10\x34\
+\x48\xad\xd0\x50\x6c\x28\x8d\x81\x04\x30\xfc\xb7\xfe\xe9\xe6\x47\
+\x50\xa0\x40\x03\x18\xc8\x9f\xfe\x2d\x1c\x04\x2e\x90\xa6\x05\x5a\
+\x14\x88\x11\x24\x70\x6c\xa8\x15\x1d\x43\x0e\x12\x28\x4e\x2c\xc7\
+\x80\xad\x44\x76\x2c\xc7\x8e\x65\x4b\x34\x25\x7e\x88\x22\x79\xc7\
+\xbb\xdd\x99\xfe\xb8\x9b\xbd\xd9\xb9\x99\xfd\xb8\xdb\xfb\xa0\xe2\
+\x87\x58\xdc\x72\x76\x77\x76\x76\xdf\x67\xde\x79\xe7\x7d\x67\x66\
+\x81\x4f\xf1\x29\x3e\xc5\x9f\x2f\xc8\xa0\x0b\xd0\x2f\x70\xce\xc9\
+\x2b\xaf\xbc\x72\xc0\xf7\xfd\x69\x00\x33\x9c\xf3\x12\xe7\xbc\xc2\
+\x39\xbf\x01\xe0\xe6\xc2\xc2\xc2\x12\x21\x84\x0f\xba\x9c\xfd\xc6\
+\x3d\x41\x80\xe7\x9f\x7f\x7e\xb4\x54\x2a\x1d\x62\x8c\x4d\x13\x42\
+\x0e\x02\x98\x41\x43\xc8\x07\x09\x21\xd3\x00\x0e\x01\x98\x06\xe0\
+\x98\xf2\x20\x84\xdc\xe5\x9c\xff\x16\xc0\xeb\x9c\xf3\xd7\x38\xe7\
+\x97\x17\x16\x16\xde\xbb\xd7\x49\x31\xd4\x04\x38\x7f\xfe\xbc\x47\
+\x08\x99\xa6\x94\x86\x42\x25\x84\x1c\xe4\x9c\x0b\xa1\x4e\x01\x98\
+\x05\x30\xd2\xa3\x22\xac\x00\xf8\x5f\x00\x3f\xf5\x7d\xff\xc2\xd9\
+\xb3\x67\x37\x7a\x74\x9f\x81\x61\x20\x04\x78\xfa\xe9\xa7\xad\x07\
+\x1f\x7c\xf0\x00\x21\x24\x14\x2a\x80\x69\x42\xc8\x21\xce\xb9\x10\
+\xea\x14\x80\xfd\xdd\xdc\x87\x52\x8a\x62\xb1\x88\x91\x91\x11\x94\
+\x4a\x25\xd8\xb6\x0d\xc6\x18\x08\x21\xe0\xbc\x51\xb1\x39\xe7\xe0\
+\x9c\xa3\x5a\xad\x62\x63\x63\x03\x5b\x5b\x5b\xa6\xec\x6a\x00\x7e\
+\x4e\x08\xf9\x29\x63\xec\xf9\x85\x85\x85\xeb\xdd\x94\x6d\x58\x90\
+\x3b\x01\x5e\x7c\xf1\xc5\x09\xdb\xb6\x67\x2c\xcb\x3a\xc8\x39\x9f\
+\xb6\x2c\xeb\x10\xe7\x7c\x8a\x73\x3e\x4b\x08\x99\x42\xa3\xe6\x1e\
+\x00\x60\x77\x7a\x0f\x42\x08\x0a\x85\x02\x4a\xa5\x52\xb8\x15\x0a\
+\x05\x78\x9e\x07\xc7\x71\xe0\x38\x0e\x6c\xdb\x06\x21\xad\xc7\x0b\
+\x82\x00\xef\xbf\xff\x3e\x7c\xdf\x0f\x85\x0e\xb4\x08\x20\xa7\xb9\
+\xae\x0b\x4a\x29\xee\xde\xbd\x8b\xd5\xd5\xd5\x30\x5d\x02\xe3\x9c\
+\x2f\x5a\x96\xf5\xfd\x89\x89\x89\x9f\x3e\xf0\xc0\x03\xf5\x4e\x9f\
+\x65\xd0\x48\x4d\x80\x8b\x17\x2f\x16\x76\x76\x76\x0e\x01\x08\x85\
+\x6a\x59\xd6\x2c\xe7\x7c\xaa\x59\x73\xa7\x01\x1c\x04\x50\xec\xa6\
+\x40\xb6\x6d\xa3\x54\x2a\x61\x64\x64\x04\x23\x23\x23\xa1\x60\x5d\
+\xd7\x0d\x05\x4b\x29\xcd\x9c\xef\xca\xca\x0a\xd6\xd7\xd7\xb5\x02\
+\x57\xd3\xe4\x8d\x10\x02\xc7\x71\xe0\xfb\x3e\x56\x56\x56\x50\xab\
+\xd5\xd4\xac\x97\x01\xfc\x07\x63\xec\xfb\x0f\x3f\xfc\xf0\xb5\x6e\
+\x9e\x7d\x10\x48\x24\xc0\x85\x0b\x17\x9e\x22\x84\xfc\x33\xba\x54\
+\xc7\x84\x90\x88\x3a\x2e\x16\x8b\x6d\xb5\x96\x52\x1a\xa9\xb5\x59\
+\x21\x84\xc6\x18\x03\x63\x2c\xdc\x0f\x82\x20\xac\xc9\xba\x4d\xbe\
+\x36\xe9\x38\xa5\x14\x9c\x73\x2c\x2f\x2f\xc3\xf7\x7d\xe5\xf6\xfc\
+\x65\x42\xc8\xbf\x7c\xf9\xcb\x5f\x7e\xb9\x8b\x57\xd5\x57\x24\xbe\
+\xed\xc5\xc5\xc5\x4d\x24\x18\x59\xae\xeb\x86\x35\xb6\x58\x2c\xa2\
+\x58\x2c\xc2\x75\xdd\x48\xad\xb5\x2c\xab\xab\x82\xca\x02\xd5\x09\
+\x59\xec\xeb\x50\xaf\xd7\xc3\x9a\x9b\x07\x09\xc4\x66\x59\x16\xb6\
+\xb7\xb7\x43\xcd\x22\xe1\x35\xce\xf9\x77\x16\x16\x16\x5e\xe8\xea\
+\xa1\xfb\x80\x34\x1a\xe0\x66\xb3\xed\xc6\xb1\x63\xc7\x30\x36\x36\
+\xd6\xa6\x8e\x7b\x51\x6b\xd5\xfd\x6e\x50\xaf\xd7\x23\x04\xc9\x2a\
+\xe8\xa4\x63\x22\x5d\xa3\x15\x7e\x69\x59\xd6\x3f\x3e\xf4\xd0\x43\
+\xbf\xea\xea\x01\x7a\x88\x34\x1a\xe0\x32\x80\x53\x93\x93\x93\x38\
+\x75\xea\x54\xa6\xcc\x93\x6a\x6b\x5c\xad\xcd\x13\xe2\x3e\xdd\xd4\
+\xf6\xb4\x44\x20\x84\x60\x69\x69\x49\xb5\x15\xfe\xdb\xb2\xac\x6f\
+\x3d\xf4\xd0\x43\x9f\xf4\xfc\x61\x33\x22\x8d\x25\xbe\xa4\x4b\x0c\
+\x82\x20\x51\xb8\xc3\x00\x42\x08\x6c\xdb\xce\x4d\xc8\x69\x8e\x4f\
+\x4d\x4d\x81\x10\x82\x1b\x37\x6e\xa0\x5e\xaf\x03\xc0\x13\x8c\xb1\
+\xaf\x5c\xb8\x70\xe1\x5b\x0b\x0b\x0b\x3f\x18\xd0\xab\xd0\x22\x35\
+\x01\x64\x46\x57\x2a\x15\xec\xec\xec\xf4\xaa\x4c\xb9\x82\x52\x0a\
+\xcb\xb2\x72\x17\x72\x9a\xe3\xb3\xb3\xb3\xa8\xd5\x6a\xf8\xf8\xe3\
+\x8f\xc1\x39\x9f\x20\x84\xfc\xfb\xe2\xe2\xe2\x02\x21\xe4\xc9\x33\
+\x67\xce\xdc\x19\xd8\x4b\x91\x90\xc6\x32\xbb\x01\x34\x08\x20\xab\
+\xb9\xdd\x02\xdb\xb6\x8d\x1b\xa5\x14\x94\xd2\xd8\xe3\x49\xd7\xc7\
+\x1d\xb7\x2c\x0b\x85\x42\x01\xc7\x8e\x1d\xc3\xe8\xe8\xa8\x28\xd2\
+\xd7\x39\xe7\x6f\xbc\xf4\xd2\x4b\x7f\x3d\xc8\xf7\x22\x90\x86\x00\
+\x9f\x00\x51\x0d\xd0\xad\x45\xdf\x4f\x74\x2b\xc8\x3c\x48\x62\x59\
+\x16\xa6\xa7\xa7\x31\x3b\x3b\x2b\x2a\xcf\x11\x00\x3f\x5f\x5c\x5c\
+\xfc\xdb\x01\xbf\x9e\x64\x02\x10\x42\x6e\x8a\x7d\x61\xe1\xee\x26\
+\x0d\x20\x04\xd8\x6d\x6d\xce\x83\x24\xe5\x72\x19\xc7\x8f\x1f\x17\
+\xae\xe8\x51\x00\xe7\x2f\x5c\xb8\xf0\xa5\x41\xbe\x9f\xd4\x4d\x00\
+\xd0\xe8\x4e\x71\xce\x77\x15\x01\x54\x10\x42\x60\x59\x96\x56\x60\
+\xfd\x20\x89\xe3\x38\x38\x79\xf2\xa4\xd0\xa2\x2e\x21\xe4\xb9\x97\
+\x5f\x7e\xf9\x2f\x06\xf5\x3e\x12\x8d\x40\xdf\xf7\x97\x84\xeb\xb5\
+\x56\xab\xa1\x58\x2c\xee\xaa\x26\x20\x09\x84\x90\x08\xa1\xbb\xf1\
+\x07\x64\x39\x7e\xe2\xc4\x09\x5c\xbd\x7a\x15\x00\xf6\x06\x41\xf0\
+\xaf\x00\x1e\xe9\xe7\x73\x0b\x24\x4a\x92\x73\x1e\x36\x01\xc2\x0e\
+\xd8\x4d\x1a\x20\xab\x9f\x41\x68\x08\x93\x96\xc8\xcb\x2e\x28\x16\
+\x8b\x98\x99\x99\x11\xb7\xfd\xca\xe2\xe2\xe2\x03\xb9\x3f\x7c\x0a\
+\x24\x6a\x80\xb3\x67\xcf\xee\x2c\x2e\x2e\xae\x00\xd8\x5b\xad\x56\
+\xc3\x74\x39\xa4\x7a\xaf\xc3\xa4\x25\xe4\xda\xbe\xbe\x59\xc1\xca\
+\xdd\x2d\xdc\xdd\xde\xc1\x46\xa5\x8a\x8d\xed\x1d\x6c\xd7\xea\xb0\
+\x2c\x8a\xcf\xce\x8c\xc2\x73\x1a\xaf\xba\x5c\x2e\x63\x64\x64\x04\
+\x41\x10\x60\x6a\x6a\x0a\x37\x6e\xdc\x10\x79\x3c\x06\xe0\x72\xbf\
+\x9f\x2d\x6d\x48\x76\x09\xc0\xde\x4a\xa5\x12\x26\x58\x96\x85\x20\
+\x08\x72\x2b\x48\xcd\x67\xe0\x00\x02\xc6\x51\x0f\x02\x04\x8c\xc3\
+\x67\x1c\x01\xe7\xad\x7d\xd6\xda\x67\x1c\xa8\x07\x0c\x01\xe7\x60\
+\x8c\xa3\x2e\x8e\x05\x01\x02\x0e\x30\xce\x51\xf7\x19\xfe\xe6\x24\
+\xc5\xec\xe4\x68\xe2\xfd\xb3\x80\x10\x82\xe5\xf5\x4d\x7c\xb8\xbc\
+\x8a\x0f\x6f\xad\xe3\xa3\xdb\xeb\xd8\xac\xd6\x42\xa7\x93\x88\x85\
+\x38\x8e\x07\x02\x02\x6f\x64\x0c\xe3\xc5\xd6\x60\x24\x4a\x29\x3c\
+\xcf\x43\xa1\x50\x00\xa5\x14\x41\x10\x80\x10\xf2\x30\x80\x7f\xca\
+\xb5\xa0\x29\x90\x8a\x00\x9c\xf3\x9b\x84\x90\xbf\x52\x35\x80\xc0\
+\xea\x76\x0d\x1b\x55\x1f\x8c\x73\xf8\x01\x8b\x0a\x88\xb1\x88\xb0\
+\xfc\x80\x35\x04\xc4\x78\x33\xad\x21\xac\x5e\x61\x6d\x6b\x27\x37\
+\x02\xdc\xd9\xaa\xe0\xcd\xf7\x6f\xe0\xad\xf7\x6f\x60\xe5\xee\x36\
+\x2c\xcb\x0a\xb5\x43\xb1\x58\x44\xa9\x54\x82\xe7\x79\x6d\xd7\x55\
+\xea\x41\x84\x00\xf5\x7a\x3d\xf4\x13\x8c\x8f\x8f\x63\x75\x75\x15\
+\x00\xca\xb9\x14\x32\x23\x52\x11\x80\x10\x72\x0b\x00\x64\x02\xc8\
+\x86\xe0\x07\xab\x5b\xf8\xd3\xea\x76\xde\x65\xcb\x05\x6b\x5b\xd5\
+\xe4\x93\x62\xc0\x39\xc7\xd5\xeb\x9f\xe0\xb7\xef\x5e\xc7\x07\xcb\
+\x6b\xa1\xc0\x85\x00\x1d\xc7\xc1\xe8\xe8\x28\x6c\xdb\xfc\x2a\xab\
+\x7e\x54\x53\xca\x4d\x67\xb9\x5c\x16\x04\x98\xea\xaa\xa0\x1d\x22\
+\x6d\x13\x70\x07\x88\x3a\x83\x64\x0d\x50\xb0\xb3\x0f\xd0\xe8\x17\
+\x3e\xb9\xd3\x39\x31\xaf\x7c\x70\x13\xbf\xb8\xf2\x1e\x56\x37\x2b\
+\x20\x84\x84\x4e\x1d\x61\x28\x8a\x01\x2b\x02\x22\x16\xa2\x46\x48\
+\x2b\x75\x33\x01\x24\xe2\x94\x2f\x5d\xba\x54\x3c\x7d\xfa\x74\x05\
+\x7d\x44\x26\x02\xc8\x7e\x00\xf9\x01\x5d\x7b\x30\xdd\x42\xe1\x98\
+\x92\x43\xc6\xc2\x2e\x11\xc1\xaa\x75\xce\xb1\x7c\x67\x06\xf7\x8d\
+\xa7\xd7\xb0\xef\x7e\xb4\x84\xe7\x5e\x7e\x15\x1f\xdc\xbc\x05\xa0\
+\x41\x76\x91\x3f\xe7\x8d\x41\x21\xae\xeb\x86\x82\x54\x42\xc0\x38\
+\x76\xec\x18\xf6\xed\xdb\x17\xfe\x5f\xad\x47\x03\x63\x72\xa0\x4c\
+\x26\x50\xa5\x52\x99\x01\xf0\x5e\xea\x82\xe6\x80\xb4\x4d\xc0\x3a\
+\xe7\x3c\x62\xf4\x45\x08\x60\x45\xbb\x85\x9b\x9b\x9b\xa8\x54\x2a\
+\x6d\x2f\x48\x08\x45\xec\xcb\x69\xaa\x10\x85\x95\x2d\xd2\x74\xc2\
+\x4e\x8b\x57\xca\x14\x5f\xff\xd2\x83\x89\xe7\x55\x76\x6a\xf8\x9f\
+\x0b\xbf\xc0\xcb\xaf\xbd\x09\xa0\x45\x72\x99\xf0\x8e\xe3\x80\x10\
+\x22\xa2\x7c\xa9\x10\xd7\x04\x38\x4e\xcb\x36\x60\x8c\xed\xc7\x30\
+\x12\x00\x4d\x0d\x00\x40\xab\xe2\x0a\x6e\x34\x9b\xa5\xa5\x25\xdc\
+\xbe\x7d\x3b\x97\x02\xe6\x81\x5f\xbd\xf5\x2e\x1e\xfd\xfc\x67\x51\
+\xf4\x5c\xe3\x39\xef\x5e\xbf\x89\x67\x7e\x78\x1e\xb7\xef\xdc\x05\
+\x21\x56\x44\xe8\xe2\xd7\xf3\xbc\x8e\x9c\x60\x55\x4d\x13\x20\x34\
+\xa9\xeb\xba\x72\xfa\x74\xe6\xcc\xbb\x44\xda\xa7\x09\x09\xa0\xeb\
+\xfa\xb9\x74\xb8\x3d\x83\xdb\x3b\x35\xfc\xec\xf2\x15\xe3\xf1\x17\
+\x7f\xf9\x3a\xbe\xf3\x83\x1f\x61\xf5\xee\x56\xd8\xce\xcb\x6d\xbd\
+\x88\xea\x75\xea\x01\x55\x6d\x00\xa0\xa5\x05\x64\x0d\xc0\x39\xef\
+\x6a\xdc\x65\x27\xe8\x98\x00\xc3\x60\x03\x64\xc1\x85\x5f\xbf\x89\
+\x4f\x56\xa3\x21\x78\x3f\x60\xf8\xb7\x9f\xbc\x84\x1f\xfe\xec\x12\
+\x38\x47\x44\xe8\x72\xcc\xc0\x75\xdd\xae\xbc\x9f\x35\x9f\xb5\x75\
+\x75\x05\x01\xe4\x11\xce\x96\x65\xf5\x5d\x03\xa4\xf5\x03\xac\x8b\
+\x7d\x1d\x01\xbc\x21\xd2\x00\xc2\x5a\x17\x90\xbb\x67\xff\xf5\xd2\
+\xaf\xf0\xd4\x63\x67\xe0\xda\x14\x35\xdf\xc7\x7f\xfe\xdf\x25\xfc\
+\xfe\xfa\x32\x26\x27\x27\xc3\xe7\xb1\x6d\x3b\x14\xbe\x18\xad\xac\
+\xe6\x23\xef\xeb\xee\x55\x2c\x46\x47\xc6\x73\x00\xb5\x80\x45\x7a\
+\x4b\xa2\x29\x55\xba\x8f\xf7\x75\xfc\xe0\x1d\x22\x2d\x01\xee\x88\
+\x17\xa4\x23\x00\xb5\x08\x2c\x02\xb0\x26\xc9\xcb\xe5\x86\xc5\x2d\
+\xbf\x1c\xb1\x2f\x0b\x48\x15\x56\xa7\xe7\x00\x88\xed\x87\xcb\xb8\
+\x78\xf5\x23\x7c\xe1\xc4\x41\xbc\x72\xf5\x3a\x9c\xb1\xbd\xb8\xff\
+\xfe\x09\x6c\x6f\x6f\x87\x6d\xbe\x5c\xfb\x05\x19\xf2\x40\xa5\x16\
+\x44\x08\x20\x34\x80\xdc\xac\xf0\xc6\xac\xa8\xbe\x22\xb3\x11\x28\
+\x66\xd6\xa8\x2f\xa6\xe0\x50\x6c\xd7\x1a\xe4\x98\x9a\x1a\x88\x4f\
+\x23\x15\x6e\xac\x6d\xe2\x47\xbf\xf9\x03\x02\xd6\x12\x40\xa1\x50\
+\x10\xee\xd8\x88\xa3\x27\x4f\x54\xfd\x68\xcf\x45\x8e\x25\xb8\xae\
+\x2b\x7c\x2c\x07\x72\xbd\x69\x0a\xa4\x7a\xca\x20\x08\xee\x88\x17\
+\xa2\xf6\x79\x05\x1c\x6b\xf7\x44\x08\x85\xf0\x05\xe4\x9a\x2e\x34\
+\x40\xde\x50\x7b\x02\x72\x57\xb6\x54\x2a\x09\x02\xf4\xbd\x09\x48\
+\xd5\x78\x37\x67\xc5\x32\x00\x91\xfe\x6f\xc4\x0e\x18\x62\x6f\x60\
+\x1a\x88\x10\x6f\xaf\x42\xdd\x71\xde\x40\xc9\x19\x34\xb4\xdd\x40\
+\x40\xf2\x06\x0a\xec\xb6\x9e\xc0\x20\xa1\xf3\x05\x08\x48\x04\x28\
+\x5f\xba\x74\xa9\xab\xb9\x95\x59\x91\xa5\xa1\xbb\x0b\x60\xc2\x44\
+\x00\x67\x88\x7a\x02\xdd\x60\x7a\xac\x80\x07\xe7\xf7\xf6\xfc\x3e\
+\x72\x13\x20\x47\x10\x37\x37\x37\x27\x00\xf4\x2d\x1e\x90\x9a\x00\
+\x84\x90\x0a\xe7\xdc\x6c\x03\x0c\x98\x00\xb2\xab\x5a\x18\xaa\xc2\
+\x6d\xac\x6e\xe2\xdc\xf1\xf1\x71\x94\x4a\xa5\x68\x3e\x7d\x2c\xaf\
+\x80\xec\x0c\x22\x84\x8c\x43\x1a\x87\xd9\x6b\xa4\x26\x00\xe7\xbc\
+\x06\xc0\x18\x0f\xa0\x4a\xdb\x29\x5e\xb2\x1c\x07\x30\x09\x43\xec\
+\xcb\x71\x01\x71\xbd\xe9\x17\x68\x09\xba\xd3\x81\x29\xc7\x8e\x1d\
+\x6b\x23\x40\xdd\xef\xcf\x8c\x26\x99\x00\xca\x74\xf7\xf1\xbe\x14\
+\xa0\x89\x2c\x4d\xc0\x0e\x00\x63\x20\xc6\xa6\x51\x02\xac\xac\xac\
+\xe0\xda\xb5\x5d\x37\x5d\x1e\xc1\x00\x86\xb9\xc9\x5d\x4e\x42\xc8\
+\x9e\x7e\xde\x3b\x8b\xde\xae\x02\xe6\x6e\xa0\xbd\x8b\xba\x81\x71\
+\xe8\xa7\xfc\x75\xee\xe0\x20\x08\xfa\xaa\x01\x52\x13\x80\x10\x52\
+\x07\xa2\x1a\x20\xae\x09\xd8\xad\xa8\xf7\x69\x52\xab\xec\x08\x92\
+\x09\xd0\x6f\x0d\x90\xc5\x06\xd8\x06\xf4\xd1\x40\x60\xf8\xbb\x81\
+\x22\xaa\x07\xb4\xdc\xc8\xba\xa5\x66\x54\x27\x51\xde\x90\xdb\x7e\
+\x9d\x3b\x18\x43\x6c\x03\x04\x40\xf4\x01\xd4\x78\x80\x0c\xcf\xf3\
+\xb0\x77\x6f\xab\x3b\x65\x0a\xa0\xe8\x04\xa3\x3b\x4f\x76\xd2\xc8\
+\xd7\xa8\xe7\xa9\xf7\xc9\xea\xd8\xe9\x25\x01\xd4\x61\xf4\x06\x02\
+\x0c\xad\x06\xd8\x14\x43\xa3\x74\xb1\x00\xb5\x09\x18\x1d\x1d\x95\
+\x67\xc4\xee\x1a\xf4\x82\x00\xa6\xf9\x13\xe2\x5d\xca\x04\x68\x76\
+\x03\xfb\x86\xd4\x04\xb0\x2c\x8b\xcb\x43\xb4\xda\x32\xba\x47\x1c\
+\x41\x1c\xc0\x4f\xde\xfc\x38\xd3\x35\x7f\x77\xff\x41\x7d\x5e\x31\
+\x16\xa5\x6c\x03\xc8\x04\x60\x8c\x0d\x67\x2f\x80\x31\xb6\x01\x98\
+\x1f\xea\x5e\xe9\x05\xe4\x01\x59\xb8\x71\xc7\xe4\xf5\x16\xa4\x66\
+\x70\x38\x09\x20\x20\xaf\xb7\x23\x37\x03\x9f\x12\xa0\x81\x34\x82\
+\xd7\x9d\x2b\x8d\x0d\x1c\xda\x6e\xe0\x5d\xc0\xfc\x80\xbb\x69\xc2\
+\x68\x2f\x60\xaa\xf5\x49\xda\x40\x40\x22\xc0\x70\x6a\x00\xce\x39\
+\x03\xcc\xae\xe0\x3f\x57\x0d\x90\x56\xc0\xba\x6b\x0c\x04\xe8\xab\
+\xe5\x9c\xeb\xb0\x97\xdd\x4a\x01\x79\x1e\x82\x3c\x5f\x01\x40\x5b\
+\x00\xc9\x75\x5d\x8c\x8e\x8e\xb6\xda\x6f\x4d\x7e\x69\x09\x61\x38\
+\xcf\xb8\xa4\x7d\x2f\x90\x2f\x01\x52\x32\x40\x5e\xb0\x59\x37\xf1\
+\x43\x27\x0c\xdd\xe4\x11\x71\xbe\x2c\x20\x53\x9a\x7a\x4c\xbe\x67\
+\x16\xec\xdb\xb7\x0f\xa3\xa3\x65\xed\xb3\x26\x59\xfd\x71\x90\x22\
+\x82\xa5\xb8\xf3\xf2\x46\xae\x04\xb0\x10\x0d\xa7\x7e\xf0\xc1\x07\
+\xb8\x7d\xfb\x76\x9b\x40\x87\x05\x1d\x69\x2c\xce\xdb\xae\xeb\x44\
+\xf0\x6a\x33\x20\x35\xa7\xed\xd3\x8b\x7b\x88\x8e\x08\xa0\x73\x04\
+\x01\x00\xa5\x16\xea\x41\xcb\x4f\x50\xf7\x7d\xd4\x32\x4c\xa1\xda\
+\x15\x20\x24\xa2\xea\x3a\x69\xff\x75\xfb\x92\x07\xb3\x80\x3e\x22\
+\x57\xef\x0d\x51\x36\x51\x5b\xee\xc5\x0d\x9c\x1b\xb5\x41\x97\x36\
+\x00\x2e\x5e\xbc\xd8\x37\x12\xe4\x6e\x03\xc8\x8a\xa1\xb1\x7f\xaf\
+\x2d\x23\xc3\x01\xf0\x4c\x36\x40\x9a\x74\x39\x86\xe1\xfb\xbe\x87\
+\x66\xf8\xbd\xd7\xc8\x95\x00\x94\x10\xf8\x52\x9d\x18\x2d\x8f\x02\
+\x5c\x3f\x69\x43\x17\x89\x53\x83\x3c\x40\x7b\x80\x48\xbe\x5e\x6d\
+\x86\xb2\x5e\x9f\x26\x4d\x5e\x6b\xd8\x84\xac\x82\xd7\x1d\x53\xbe\
+\x6e\x52\x82\x34\x17\xa3\x97\xe8\xd8\x06\xd0\x81\x5a\x24\x52\x33\
+\x66\x66\xa6\x31\x80\x91\xce\xb9\xa3\x61\xf3\xe8\xd3\x4d\xe7\xc7\
+\xe5\xa5\xdb\x57\x22\x9f\x7d\xeb\x0a\x76\xa5\x01\xda\x58\x8c\xdd\
+\xeb\x0b\xd0\xc1\xd4\xd7\xcf\xc3\x07\xa0\xa6\xc9\x1a\x80\x10\xd2\
+\xb7\xf5\x82\x72\x6d\x02\x38\x90\xde\x19\x30\x04\x48\xea\x9b\xeb\
+\x9e\x85\x73\x6e\x4e\xcf\x78\x0f\xd3\xa8\x20\xce\x79\xdf\x66\xd9\
+\xe4\xee\x09\xdc\x0d\xe2\x8f\xab\xc1\x9d\x5c\xd3\x8d\xf1\x27\x20\
+\x6b\x00\xc6\x58\xdf\xdc\xc1\xf9\xce\x80\x24\xc3\xad\x00\xc6\x0a\
+\x36\x8e\x4c\xea\x3f\x7f\xd4\x49\x0d\x36\xa1\x93\xbc\x64\xe3\xd5\
+\xea\xe3\x5a\xbc\x1d\x13\x40\xdf\xa6\x11\x90\x21\xd4\x01\xa2\xac\
+\x1e\xa5\x98\x1a\x2b\x6a\x8f\x99\xae\xc9\x72\xac\xd3\x6b\x34\x4e\
+\xb5\xbe\x85\x84\xf3\xd5\x00\x86\xfe\xf1\x20\x21\x5b\xf0\xcc\x60\
+\x81\xeb\xae\xc9\x23\xbd\xd3\x6b\xfa\x89\x7c\x8d\xc0\x2e\x1f\x4a\
+\xcc\x0e\x12\xfb\xea\xf7\x87\xe4\x80\x91\x1a\x28\x92\x63\x0d\x13\
+\x13\x13\x18\x19\x69\x57\xf5\x2c\xa1\x8c\x83\xd4\x06\x83\x1a\x4f\
+\x91\x65\x4c\xa0\xa7\x0e\x60\x6c\x03\xb1\x40\x24\xcf\xdf\xf5\xeb\
+\xd7\xc3\x6f\xea\xe9\xa2\x7d\xba\xe5\xe3\xf2\x80\xe7\x79\xe1\x2a\
+\x25\x32\xfc\x40\x3f\x9e\x71\x18\x9a\x81\x41\x21\x35\x01\x18\x63\
+\x05\x79\x05\x0d\x40\xef\xdb\x96\x79\xbc\xbd\xb5\x85\xf5\xb5\xb5\
+\x54\xf9\xe7\xc9\x7f\xb5\x37\xd2\x1a\x83\x17\x3d\x6f\xd0\x02\x16\
+\x15\x41\x5d\x78\xb3\x9f\xe8\xf1\x78\x00\x8e\x41\xc4\x02\x44\x4c\
+\xa2\x15\x6a\x15\xa5\x49\xb6\x01\x06\xa5\x0d\x86\x9e\x00\xc2\x3b\
+\x15\xf7\xe1\x66\xb5\x07\x40\x30\x98\x5e\x01\x01\x01\x78\x7b\x79\
+\x82\x20\xfb\xf0\xad\xb8\x63\xfd\x32\x24\x7b\x89\x2c\x13\x43\x68\
+\x1c\x4b\x7d\xc6\xa0\xd6\xf6\x43\x87\x0e\x62\xdf\xbe\xde\x2f\xb6\
+\x20\x83\x73\x8e\xb1\xb1\xb1\x36\x6d\xc4\x39\x87\xce\x02\x18\xb4\
+\xe0\x07\x8d\x2c\x1a\x80\x34\x7f\xc3\xb4\x68\x60\xa3\xfd\x9a\x7e\
+\xce\x0e\x4a\xf3\xe2\x19\xe3\xf8\xdd\xd2\x46\xe2\x35\x2a\x4e\x1e\
+\x68\x3d\x43\x3f\x9a\x8e\x7e\x22\x8b\x0d\x30\x06\x98\x57\xd1\x62\
+\x7c\x30\xed\x98\x66\x48\x55\xe4\x98\x9a\x7e\x6b\xd3\xfc\xc5\x53\
+\xa3\x40\x0e\x8c\xde\xb3\xda\x20\x37\x23\xd0\x67\xac\xaf\xad\x7d\
+\x1a\xdf\x7c\x56\x5f\xbf\x29\xaf\xbc\x6a\x7d\x52\x44\x70\x10\xc8\
+\x42\x00\x17\x30\x37\x01\x8c\xf7\x2f\x10\x14\x27\x2c\x20\x9f\x20\
+\x4f\x9e\xc1\x9f\xa4\x63\x69\x8e\xf7\x0a\x59\x08\x50\x04\xcc\x4b\
+\xb2\x32\x96\x8f\x1b\x38\xcd\x8b\xd0\x19\x78\xba\xf4\x34\xf9\x99\
+\xae\xe9\xc5\x00\x90\x2c\xe5\xea\x17\x72\x6b\x02\xf2\x58\x5b\xa7\
+\x5f\x91\xb7\x3c\xf3\xca\xeb\x9a\xdd\xa0\x01\xca\x40\x54\x03\xc8\
+\x85\x6e\xcc\xab\xef\x4c\x05\xb4\xf2\x49\x7f\xbd\xe9\x9a\x3c\xf3\
+\x8a\x1e\xeb\x2e\xdd\x74\x4c\x7c\x7f\x51\x99\x72\x67\xb6\x54\x73\
+\x46\x16\x02\x14\x80\x86\x23\x48\xf7\x20\x81\x46\x6d\xca\x8b\x4a\
+\xaa\x9f\x8b\x11\xc6\x95\x3c\x53\x47\x8e\x0f\x00\xd1\x99\x3b\x69\
+\xf3\x92\x5f\xa4\xb8\x5e\xbc\x60\xf5\x1a\xb1\xcf\x18\xc3\xfe\xfd\
+\xfb\x71\xe2\xc4\x89\xf0\x5a\x53\xb3\xd2\x27\x6d\xd0\x97\x11\xc1\
+\x40\x36\x02\x94\x00\xb3\x27\x90\xb1\xa8\x61\xb6\xb6\xb6\x86\x37\
+\xde\x78\x23\x73\x81\xf2\x54\xdd\x59\xc0\x82\x00\x44\xca\xcb\x64\
+\x14\x66\xb9\x7f\xd2\x35\xca\x48\xe0\x70\x9f\x10\xd2\xb7\x29\x54\
+\x59\x08\x30\x0a\xb4\x7d\xe2\x24\xdc\x6f\x18\x81\xad\x07\x52\x3f\
+\x9a\x90\x16\x59\x7c\x09\x26\x1f\x40\x37\x84\x30\xf9\x13\xe2\xee\
+\x9f\xe5\x58\x9a\x74\xce\xf9\x66\x5c\x19\xf3\x44\xe6\x26\x40\xf9\
+\xc0\x41\xb8\xaf\x76\x03\x0b\x9e\x07\x8b\x24\x7f\x5f\xb8\x17\x35\
+\x3e\xab\x25\x22\xba\x95\x69\x6b\x7d\x5e\x82\x37\x69\x80\x7e\x22\
+\x73\x37\xd0\x34\x1e\xa0\xce\x58\xa4\xbd\xa4\xd4\xc2\x91\x23\xf3\
+\xd8\xd9\x69\xd9\x33\x72\x9b\xce\x18\x8b\xfc\x2f\xb7\xcb\xea\xa7\
+\xe1\xe4\xd9\xc4\xaa\xc1\x24\xd0\x5d\xad\x8f\xce\x6a\xea\xa4\x5b\
+\xd9\x2d\x29\xe4\xe7\xb5\x2c\x6b\x43\x77\x7e\x2f\x90\x8a\x00\xe7\
+\xcf\x9f\x1f\x0b\x2f\x30\xf8\x01\x1a\x83\x2d\xa2\x4e\xa2\x23\x47\
+\x8e\x6a\xcf\xcd\xb3\xd6\xcb\xc6\xa1\xc9\x08\x04\x5a\xc6\x9e\xc8\
+\x4b\x25\xa3\xe7\x79\x52\x3c\xa3\x3f\xcd\x80\x51\x9b\xb2\x1e\x2f\
+\x56\x28\x21\xad\x06\x08\xa7\x2c\x9b\x3c\x81\x81\xe4\x08\x4a\x72\
+\xa4\x64\x71\x18\x25\x59\xe3\x8e\xd3\xfe\x08\x79\xfb\x00\xfa\xe1\
+\x0a\x96\x35\x40\xbd\x5e\x1f\xae\xe5\xe2\x1d\xc7\x29\x8a\x82\x1a\
+\x7b\x01\x1c\x61\x48\x30\x0f\xb7\xaa\x80\xe9\x9a\x7e\xba\x82\x5f\
+\xfb\x70\x0d\x04\x8d\x66\x4d\x1c\x93\xd7\xc6\x26\x84\x80\x5a\x2d\
+\x7b\x87\x12\x69\x24\x02\x21\xa0\x04\x28\x7b\x14\xf7\x95\xcd\x53\
+\xff\xe5\xf7\xe0\x38\x4e\xcd\x78\x62\xce\x48\x45\x00\xc6\xd8\x98\
+\xa8\xf9\x82\x00\x8a\xd5\x8a\x5a\xf3\xa3\x4b\x2a\xd4\xee\x8e\x9c\
+\x0e\xe4\x6b\xf5\x67\xb1\xe0\x05\xb2\x94\x59\x1e\x53\xa8\x7c\xff\
+\xc3\x98\xbf\x7c\xff\xfb\xca\xd1\x74\x65\x32\x48\xb8\x5f\xad\x56\
+\xfb\xb6\xa8\x42\xda\x6f\x07\x17\xa4\xfd\x30\x3d\xda\x6e\xe9\xc7\
+\xe1\x65\xd1\x06\x26\x24\x69\x90\x41\x06\x86\xd2\xe6\x25\xf3\x49\
+\xeb\x48\x93\x6c\x97\x47\x1f\x7d\xb4\xf3\x4f\x9e\x67\x44\x6a\x02\
+\xa8\x4d\x40\xb4\x0b\xc8\xc1\x1a\x63\xb0\x5a\xe9\x26\x1b\xa0\x83\
+\x80\x4d\xec\x35\x26\x4f\x5d\x07\x76\x46\x2f\xcb\x2c\x8f\x51\x6c\
+\xa5\xb5\x06\xd7\x4a\x1a\xa0\xaf\xfd\xc1\xb4\x46\x60\x38\x53\xc5\
+\xb2\xac\x36\xc3\x28\x60\x3c\xd4\x82\xba\x31\x80\xad\xda\x60\x50\
+\xdd\x1d\xf8\xed\x4d\xf7\x89\xbb\xbf\x09\xfd\x28\x33\xd7\x18\xf6\
+\x44\xf2\x93\x48\xbd\x92\xbb\xa9\x33\xce\x01\x69\x6d\x80\xb2\xbc\
+\x52\xb7\x0a\x3f\x88\xfa\x00\xde\x7a\xeb\x2d\x2c\x2f\x2f\x87\xe7\
+\x8a\x6f\xf0\x8a\x7d\xf5\x33\xad\x40\x74\xc1\x07\x39\xdd\xf4\xc9\
+\x56\xd9\x23\x29\xe7\xad\xfb\xb2\xa8\xbc\x70\x84\xf8\x38\x34\xe7\
+\x3c\x72\xbe\x40\x92\x0f\xa0\xd3\x90\x73\x92\xb7\x52\x6a\x02\xfa\
+\xe6\x03\x00\x52\x12\xc0\xb2\xac\x31\x5d\x13\x20\xd2\xea\x4a\x1c\
+\x00\x9c\x83\x05\x01\x58\x06\x87\xcd\xa0\x62\x00\x02\x3a\x92\x88\
+\x7d\x01\x95\x98\xe2\xfe\xf2\x27\xe0\x6d\xdb\xc6\x81\x03\x07\xda\
+\x26\xa6\x88\xf7\x23\x97\x59\x26\x85\xe4\xcf\x18\x3e\x02\x40\x6a\
+\x02\x74\x36\x80\x1f\xf0\x48\x7b\x16\x67\xd9\x67\xb1\xe0\x4d\xe8\
+\xe6\x1a\x13\xb2\xac\x1f\x98\x94\x57\xb9\x5c\x6e\x1b\x0c\xab\xf3\
+\x27\xc8\xef\x6c\xa8\x09\xc0\x39\x0f\x3d\x81\xba\x59\x41\x75\x65\
+\x6a\x97\x69\x5f\x93\x6f\x86\xa2\x76\x86\xbc\xef\x9f\xf6\x9a\xb6\
+\xf3\x0c\x5c\xdd\x15\x36\x00\x9a\x1a\x40\x6e\xa7\x45\xc1\x39\xe7\
+\xa8\x2b\x36\xc0\xfc\xfc\x61\x1c\x38\x70\x1f\xea\xf5\x7a\xe8\x76\
+\x15\x35\x4c\xec\x8b\xdf\x20\x08\x42\x37\xad\x7a\x4c\xee\x1b\xf7\
+\x24\x68\x94\x83\x47\xd2\x70\x76\xdb\x79\xba\xee\xb3\xfc\x2e\xa5\
+\xb2\x0e\x2f\x01\x64\x03\x4e\x2e\xb4\xaf\xd8\x00\xe3\x63\x63\x18\
+\x1f\x1b\x6b\xcb\xa4\x93\xda\xa8\x23\x85\x89\x44\x42\x95\x8a\x34\
+\xf1\x2b\x82\x49\x82\x90\x6a\x5a\x1c\x3a\xd2\x52\x9c\x87\x5e\xd1\
+\x48\x9a\x92\x9f\x78\x97\xca\x87\xb8\x86\xaf\x09\x40\x73\x4e\x80\
+\xd0\x00\x6a\x7b\xe6\x37\xc7\x02\x74\xe3\xa9\x33\xb5\xe7\xc2\xda\
+\x97\x3f\xaf\x9a\x67\x60\x06\x40\x1b\x61\xd4\x4d\x8e\x5c\xd6\x6a\
+\xb5\x90\x44\xf2\x31\x99\x7c\xae\xeb\xa6\xf2\x4a\x8a\x73\x64\x27\
+\x10\xe7\x7c\x78\x35\x80\xb2\x90\x51\xb8\x5f\xf7\x03\x20\xc6\x23\
+\x37\x48\x4f\x5d\xd2\x35\x00\x60\x11\x02\xcb\x10\xe5\x34\x5d\x93\
+\xf6\x58\x9c\x3f\x41\x54\x1a\x45\x03\x0c\x2f\x01\xe4\xbe\x37\xd0\
+\x7a\x38\xdd\x78\x40\x53\x9b\x99\xd4\xcf\x8e\x43\x27\x7d\xf3\x2c\
+\xd7\x98\x90\xa6\xcc\xc9\xcf\xd9\x6e\x18\xeb\x34\x80\xf8\x34\x4f\
+\xbf\x90\xa9\x09\x90\x1d\x31\x61\x6c\x1d\x40\x23\x46\xa2\xf6\x0e\
+\x4c\x2a\x30\x4e\x35\x76\xd2\xad\x33\x39\x58\xd2\xdf\x27\xb9\x9d\
+\xcf\x56\x66\xed\x73\x6a\x46\x47\x19\x6c\x80\xe1\xd5\x00\xba\x21\
+\xe1\x0d\x1f\x40\x5e\xb5\xa4\xfd\x98\x09\x79\x68\x83\x6c\x96\x7d\
+\xf2\x35\x71\xf7\x69\x7e\x70\x25\x02\x41\x00\xd9\xef\x30\xd4\x46\
+\xa0\x6e\xcd\x5c\x9f\xb1\xd8\xf6\x1f\x18\xce\x28\x5e\xd2\xfd\x4d\
+\xe8\xc4\xce\x20\xd0\xc7\x0e\x74\x04\x60\x8c\xa5\x5b\x52\x25\x27\
+\x24\x12\xe0\xfc\xf9\xf3\x1e\x9a\x03\x42\x55\x0d\xc0\x39\x47\xcd\
+\x8f\x8e\x03\xb8\x76\xed\x1a\xee\xdc\xb9\x03\xc7\x71\xc2\xcd\x75\
+\x5d\xb8\xae\x1b\x49\x73\x1c\x47\x3b\x24\xaa\xd7\x31\x7d\xdd\x7d\
+\x4a\x0e\xc5\x58\xc1\x06\xe3\x1c\x3e\xe3\x60\x8c\x23\x60\x8d\xf5\
+\x04\x02\xc6\x11\x30\xd6\x48\x6f\xeb\xd9\xc5\x97\x59\x59\xfe\x35\
+\x72\x8d\x88\x47\x00\x51\x02\x50\x4a\x6f\xc7\x3e\x6c\xce\x48\x24\
+\x00\xa5\x34\x74\x03\xeb\x6c\x00\x75\x34\xf0\xd6\xe6\x26\x96\x3f\
+\xf9\xa4\x2d\x1f\x9d\x10\x6d\xdb\x86\x6d\xdb\x11\x82\xb8\xae\x1b\
+\xa6\xa9\x84\x11\xc7\xe2\xd0\x89\x36\xa0\x04\x18\x2f\xa4\x1b\x5a\
+\xc6\x18\x47\xc0\x9b\x04\x69\x12\x86\xf3\x26\x51\xe4\xf4\xa0\xf1\
+\xcb\x78\x4b\x4b\x46\x7a\x1e\x12\xf9\x6b\xb5\xd6\x00\x20\x42\xc8\
+\x6a\xec\x03\xe6\x8c\x44\x02\x70\xce\x63\x47\x03\xf9\x8c\x45\xd7\
+\xde\x69\xfe\xb5\x41\xf3\xe6\xfd\xc0\x87\x1f\xf8\xa8\xee\x44\x27\
+\xc2\x24\xd5\x78\x41\x06\x95\x18\x6a\x9a\x49\xdb\xa8\xf7\xb1\x94\
+\x2f\x9e\xc5\xdd\x9f\x10\xc0\x26\xa4\xed\x2b\x69\x59\xbb\x88\xb2\
+\x76\x90\x35\xc0\xe6\xe6\xe6\xb2\x31\xa3\x1e\x20\x91\x00\xf2\xb7\
+\x6c\x75\xe3\x01\xeb\x41\x34\x06\x2f\xaf\x0b\x94\xd5\x8b\x96\xf6\
+\xfc\x7a\xad\x8e\x7a\x2d\x79\xd4\x94\x9c\x1f\xa5\x14\x67\xce\x9c\
+\x89\xa4\x8b\x72\x5a\x86\x51\x4e\x69\xca\xd6\xa9\x6f\xc0\x10\x09\
+\xdc\x39\x77\xee\xdc\xd0\xf5\x02\xb4\x91\xc0\xd0\x07\xa0\xac\x0d\
+\x54\x2a\x15\x31\x32\x52\x42\xb5\x5a\xcd\x34\xd9\x21\xc9\x82\xcf\
+\x02\xdd\x35\x41\xe0\x87\xe5\x6c\xf7\xd3\xe7\x2f\xe0\xa4\x6b\x64\
+\x1b\x40\x34\x01\x9c\xf3\x55\x34\x64\x22\x5e\x6a\xcf\xa3\x65\x69\
+\x08\x10\x3a\xf5\x85\x1a\x95\xfb\xad\x81\x12\x07\x38\x71\xfc\x38\
+\x4e\x1c\x3f\x0e\xa0\xa1\xda\xaa\xd5\x2a\x76\x76\x76\x22\x5b\xb5\
+\x5a\x45\xbd\x5e\x8f\x1c\x6b\xf3\x9d\x37\x91\x47\x6f\x20\x2e\x2f\
+\xce\x39\x48\x4e\xb5\x3e\x0b\x59\x74\x1a\x80\x73\xbe\x8c\x28\x01\
+\xe4\xdf\x9e\x20\xb3\x06\x50\x1f\x24\x60\xe6\xf8\xbf\xe3\x38\xb0\
+\x6d\x5b\xbb\x6a\xa7\x9c\x0f\xe7\x1c\xb5\x5a\x0d\xb5\x5a\x2d\x24\
+\x85\x4a\x9c\x5a\xad\x86\x4a\xa5\xd2\xd5\xac\x20\x53\x44\x2e\xed\
+\xdc\xc2\x3c\xb5\x81\x7c\x4f\x45\x03\x50\xb4\xbe\xc0\xa7\x23\x42\
+\xae\x5a\x21\x91\x00\xf2\x68\x20\xa1\x01\xe4\x87\xf2\x6c\x0b\x34\
+\x68\x84\x84\x99\xe6\x61\xd3\x58\xe3\x84\x10\x14\x3c\x0f\x9e\xeb\
+\x62\x34\x81\x2c\x41\x10\xb4\x69\x14\x55\xbb\x08\xc2\xb4\xd5\x3a\
+\x29\x3f\xf9\xfe\x16\x89\xb7\x59\xf2\x6e\x06\x80\xa8\x36\x0d\x9b\
+\xd3\x20\x58\x43\x43\x26\x42\xfd\x9b\x08\x90\x1b\x19\x12\x09\xc0\
+\x18\x1b\x57\x7b\x01\xb6\x6d\xc3\xf3\x3c\x30\xc6\x30\xb7\xd7\x0e\
+\xc3\xb4\x01\x63\xa8\xf9\x8d\x3e\xb3\xdf\xec\x3b\xfb\x01\x43\x3d\
+\x60\x08\x44\x77\x48\x83\xf0\x65\x99\x6c\x00\x29\x9d\xda\x14\x25\
+\xbb\x84\x62\x49\x3f\xfb\x58\x7e\xf1\xb5\x5a\x2d\x42\x0e\x0e\xfd\
+\x7d\x38\x67\x3d\x55\xf7\x3a\x08\x02\xc8\x3d\x80\x5a\xad\x26\x6c\
+\x80\x2c\x04\xe8\xca\x5e\xc8\xd4\x04\x00\xad\x87\x53\x03\x43\xe2\
+\x98\xba\xca\xb7\x1c\x6a\x05\x1a\x03\x48\x1b\x64\xe0\xa8\xfb\x41\
+\xe3\xb7\xe9\x78\xf1\x9b\xbf\xf2\x7d\xb2\x8c\xca\x6d\xd4\xec\x56\
+\xba\xe7\x7a\xf0\x5c\x2f\xf6\x73\xcc\x59\x8d\xcf\x6e\x05\x2f\xa0\
+\x0b\x04\xd5\x6a\xb5\x0d\x34\xa6\xe1\x31\xcd\x96\x44\x00\xf9\x58\
+\xea\x82\x24\x11\x80\x40\x22\xc0\x1f\xff\xf8\x47\xcc\xcc\xcc\xc0\
+\xb2\x2c\x38\x8e\x13\x19\x3c\x29\x1e\x8a\x52\xaa\xed\x2e\x8a\x9e\
+\x83\x4a\x0a\x99\x30\x40\x63\x8e\x81\x20\x83\x1f\x34\xb4\x48\xd0\
+\x74\xac\x08\x4d\x12\x28\x2e\xb9\x24\x5f\x7f\xec\x03\x92\x28\x99\
+\x7a\xa1\xee\x75\xd0\x69\x80\xad\xad\xad\x0d\x34\x3e\x1e\x2d\x04\
+\x2a\xb6\x00\x51\x22\x64\xd1\x0e\xb1\x30\x11\x80\x48\x5b\x88\x5b\
+\xb7\x6e\xe1\xd6\xad\x5b\xe1\xff\xc2\xe1\x52\x2c\x16\x51\x2c\x16\
+\x51\x28\x14\x50\x28\x14\x42\xc7\x8c\x3c\xd2\x56\x5e\x69\x9c\x52\
+\xaa\x0d\x2d\xeb\x88\xa1\xce\xf8\x05\x10\x7a\xd7\xea\x3e\x0b\xbd\
+\x6f\x82\x30\x01\x6f\x68\x19\x96\xc1\xd7\x6f\xc5\x74\x03\x4d\xd7\
+\xc4\xa5\x27\x81\x10\x12\xbe\x17\x79\x44\xd2\xfa\xfa\xfa\x1a\x1a\
+\xcb\xf1\xa9\xb5\x9f\x22\x4a\x84\x24\x02\xf8\xcd\x2d\x11\x3a\x02\
+\xc8\xc2\x27\x9b\x9b\x9b\xcf\x96\xcb\xe5\x53\x84\x90\xbf\x44\x73\
+\x8d\x00\x81\x7a\xbd\x8e\x7a\xbd\x8e\xad\xad\xad\xb6\x4c\x2c\xcb\
+\x82\xeb\xba\xf0\x3c\x0f\xa5\x52\x29\x42\x0e\xd7\x75\x53\x69\x0f\
+\xf9\x05\xab\x84\x90\x7f\xd5\x1e\x05\x20\x7c\xf8\x0d\xed\x51\x67\
+\x0d\x0d\xd2\xd0\x24\x2d\x92\x24\x21\x2f\x75\xaf\xc2\xe4\x06\xbe\
+\x79\xf3\xe6\x2a\x1a\x1a\x40\xd7\x04\x30\x34\x7a\x07\xa6\x66\x41\
+\xa4\x55\x90\x52\xf8\x40\x94\x00\x44\xfa\x0d\xb7\xc7\x1e\x7b\xec\
+\x0a\x80\xd3\x00\xf0\xdd\xef\x7e\x77\x6a\x62\x62\xe2\x68\xb1\x58\
+\x9c\xa7\x94\x1e\xa5\x94\x1e\xa1\x94\xce\x5b\x96\x75\x98\x10\x32\
+\x03\xe9\x5b\xc4\x8c\x31\x54\xab\x55\x54\xab\x55\xdc\xb9\x13\xfd\
+\x08\xa6\xf8\x1a\xa7\xeb\xba\x21\x39\x3c\xcf\x0b\x09\x22\x88\x20\
+\x77\x95\x74\x5f\x05\x15\xe0\x9c\xb7\x91\x42\xd6\x24\x05\x8d\xb0\
+\x38\x47\x48\x88\x6e\xdd\xba\x59\x61\x22\xc0\xbb\xef\xbe\x6b\x22\
+\x40\x80\x86\x90\x55\x02\xc8\x44\xd8\x6e\x6e\x99\x0a\x48\x94\x7d\
+\x75\x33\xa5\xb7\x1d\x3f\x7d\xfa\x74\xe1\xdc\xb9\x73\x73\x53\x53\
+\x53\xf3\x9e\xe7\x1d\xf1\x3c\x6f\xce\xb6\xed\x79\x4a\xe9\x3c\xa5\
+\x74\x8e\x10\xd2\x3e\x4a\xd4\x00\xd1\x44\x14\x0a\x85\xb0\x69\xf1\
+\x3c\x2f\xf4\xef\x0b\xed\x21\x8f\x43\x8c\x83\x4c\x06\x79\x2c\x9f\
+\xee\x4b\x25\x79\xab\x7b\x1d\x3c\xcf\x0b\xe7\x0d\x5c\xbb\x76\x0d\
+\x2b\x2b\x2b\x00\xc0\xbf\xf1\x8d\x6f\x7c\x61\x6d\x6d\xad\x8a\x56\
+\x8d\x0e\x10\x25\x40\xa0\x39\xb6\x03\x60\x1d\x40\x47\x33\x8a\x93\
+\x08\x90\x89\x04\x71\xe7\x3c\xf1\xc4\x13\x93\x9f\xf9\xcc\x67\xe6\
+\x27\x27\x27\x0f\x8f\x8c\x8c\x1c\x76\x5d\x77\xce\xb6\xed\xc3\x94\
+\xd2\xc3\xb6\x6d\xcf\x20\xfd\x44\xd5\x50\x7b\x14\x0a\x05\x94\x4a\
+\xa5\x70\x5f\xd8\x1e\x72\x1b\x9b\x04\x75\xa4\x71\x5c\xf3\x92\x17\
+\x8a\xc5\x62\xf8\x4d\xa3\x2b\x57\xae\x60\x6b\x6b\x0b\xbe\xef\xaf\
+\x9e\x3d\x7b\xf6\x51\x44\xdb\x79\xd9\xf8\x93\x89\xc0\xd0\x10\xf8\
+\x2a\xba\x9c\x48\x92\x9b\x06\xe8\xe6\xda\xa9\xa9\x29\xe7\x6b\x5f\
+\xfb\xda\xcc\xd1\xa3\x47\x0f\xef\xd9\xb3\x67\xae\x5c\x2e\xcf\x79\
+\x9e\x37\xe7\x38\xce\x2c\xa5\x74\x8e\x52\x3a\x91\xf6\x81\x84\xf6\
+\x90\x8d\x53\xa1\x3d\x5c\xd7\x0d\x9b\x12\xd3\x67\x6f\x64\xc8\x86\
+\xa9\xae\x89\xe9\x94\x1c\x23\x23\x23\xe1\x2a\x6a\xaf\xbf\xfe\x3a\
+\x7c\xdf\xc7\xf6\xf6\xf6\x1f\xbe\xfa\xd5\xaf\xfe\x3d\xda\x85\xae\
+\xd3\x00\x1b\x00\x96\xd0\x61\xad\x97\xa1\xd6\x3a\xf5\x89\x48\xcc\
+\x31\xf9\x78\xd6\x63\x11\x2c\x2d\x2d\xd5\xbf\xf7\xbd\xef\x7d\x08\
+\xe0\x43\x68\x88\xf2\xc0\x03\x0f\x94\xbf\xf8\xc5\x2f\x1e\x3e\x78\
+\xf0\xe0\xdc\xc4\xc4\xc4\x6c\xb1\x58\x9c\x6d\x12\xe4\x90\x6d\xdb\
+\x87\x08\x21\xe1\xe4\x3c\x21\xac\x6a\xb5\x8a\x8d\x8d\x68\xe5\x20\
+\x84\x84\xe1\x61\x61\x94\xca\xcd\x8b\xdc\xb4\xc8\x3d\x16\xf3\xda\
+\x88\xed\xc3\xc9\x55\xbf\x87\x0e\xb2\x17\x50\x74\x03\xab\xd5\xaa\
+\x70\x03\x8b\x77\x27\xb7\xf7\xa4\xf9\xeb\x03\xf8\x18\x39\x7e\x59\
+\x5c\x26\x00\x6f\xde\x28\x2b\xad\xc5\x75\xa6\x74\x95\x44\xb2\x70\
+\xd5\xff\xa1\xfb\xff\xf2\xe5\xcb\x77\x2f\x5f\xbe\x7c\x05\xc0\xef\
+\x94\x73\xe0\x79\x1e\x39\x77\xee\xdc\xd4\xc9\x93\x27\x67\xf7\xef\
+\xdf\x3f\x37\x36\x36\x36\x5b\x2c\x16\x0f\x79\x9e\x37\x6b\xdb\xf6\
+\x1c\xa5\x74\x7f\x78\x73\x29\xe6\xa0\xeb\xb9\x50\x4a\x43\x3b\x43\
+\xb6\x3d\x3c\xcf\x0b\xc7\x14\xc8\xcd\x4b\x92\x61\xaa\x23\x46\x10\
+\x04\x21\xa1\x14\x1f\xc0\x0a\xa2\x04\x50\xdf\xdf\x6d\x00\x1f\xa1\
+\xb5\x7e\x40\x2e\x6d\x53\x92\x06\x10\x69\x6d\x3e\x01\x4d\xba\x2a\
+\xcc\xd4\x02\x8e\xd9\x8f\x4b\x03\x00\xec\xec\xec\x90\xe7\x9e\x7b\
+\xee\x23\x34\x5e\xce\xab\x6a\xe1\x4f\x9c\x38\xe1\x3d\xf2\xc8\x23\
+\x73\x87\x0e\x1d\x9a\x9d\x9c\x9c\x9c\x2d\x14\x0a\x73\x92\xf6\x98\
+\x23\x84\x94\xc4\xb9\x41\x10\xa0\x52\xa9\xa0\x52\xa9\xa4\xd6\x1e\
+\xa2\xab\x9b\x55\x7b\x00\x51\x1f\xc0\xe6\xe6\xa6\xac\x01\x44\xed\
+\x07\x80\x2d\x00\xef\x01\xd8\x44\x17\x2e\x5f\x13\x4c\x86\x97\xb8\
+\x51\x9c\x80\x81\x78\x81\xab\xc7\x91\xb0\x1f\x97\xa6\xfb\x55\xf7\
+\x75\xff\xe3\x9d\x77\xde\xf1\xdf\x79\xe7\x9d\xab\x00\xae\x6a\x9e\
+\x11\x8f\x3f\xfe\xf8\xfe\xfb\xef\xbf\x7f\x76\xff\xfe\xfd\x73\xe5\
+\x72\x79\xd6\xf3\xbc\xc3\x4d\xcd\x71\x98\x52\x3a\x85\xa6\x50\x92\
+\xb4\x87\x6d\xdb\xa1\xed\xa1\x76\x6b\xc5\x4c\x21\x55\x63\xc8\x0e\
+\xae\x95\x95\x95\x55\xb4\xba\xd1\xa2\xdd\xff\x13\x1a\xc4\xce\x3d\
+\x0a\x28\xa0\x53\xdd\x71\xe7\x75\x53\x9b\x3b\x11\x72\x57\xc2\x4f\
+\x01\xf5\xa5\xca\xff\xf3\xe3\xc7\x8f\xbb\x8f\x3f\xfe\xf8\xc1\xe9\
+\xe9\xe9\xc3\x7b\xf6\xec\x99\x73\x5d\x77\xde\x71\x9c\x39\xd1\xb5\
+\x05\xb0\x27\xcd\x4d\x84\xf6\x10\xda\xa2\x50\x28\xc0\xb2\x2c\xdc\
+\xbc\x79\x33\x6c\x06\x7e\xfc\xe3\x1f\x3f\xfd\xec\xb3\xcf\xbe\x8e\
+\x86\xe0\x97\x01\xfc\x1e\x0d\xa7\x4e\x4f\xd1\xc9\x4b\xcb\x53\xd8\
+\x69\x04\x6c\x12\xba\xae\xec\x59\x9e\xc7\xd4\xdc\xc5\xed\x47\xd2\
+\x9e\x7c\xf2\xc9\x3d\x9f\xfb\xdc\xe7\x0e\x8f\x8e\x8e\x1e\x29\x16\
+\x8b\x73\xb6\x6d\xcf\x5b\x96\x35\x6f\x59\xd6\x3c\x21\x64\x0e\x0d\
+\xa7\x4e\x2a\x3c\xf3\xcc\x33\xff\xf0\xc2\x0b\x2f\xbc\x0d\xe0\x4d\
+\x34\x2c\xfc\xbe\xa0\x13\x02\x98\xf2\xe8\x56\xa5\x67\x11\xbe\xee\
+\x7f\x53\x9a\x09\x49\x04\x50\xff\xd7\x92\xc0\xf4\x7b\xea\xd4\x29\
+\xfa\xcd\x6f\x7e\x73\x66\x64\x64\xe4\x88\xeb\xba\xc2\x63\x7a\x04\
+\xc0\x51\x42\xc8\x3c\x80\xfb\xe4\x1b\x3d\xf5\xd4\x53\x9f\x7f\xfb\
+\xed\xb7\x7f\x83\x0c\x6e\xdc\x3c\x90\x07\x01\x92\xf2\xee\xb4\x5d\
+\xef\x44\xdd\x77\x4b\x00\x5d\x7a\xc7\x24\x68\xfe\x32\xe5\x7f\x00\
+\xc0\xc5\x8b\x17\xcb\xbe\xef\x1f\x01\x30\xf7\xea\xab\xaf\xbe\xfd\
+\xed\x6f\x7f\xfb\xbd\x54\xa5\xce\x19\xbd\x24\x40\x9a\xfb\xca\xe4\
+\x40\xca\x7d\xdd\xff\x69\x8f\x09\xc4\x19\x54\x69\x08\x20\xef\x73\
+\xe8\x89\xb1\x2b\x30\x28\x02\x64\x45\x1c\x01\xb2\x36\x05\x71\x02\
+\x4e\xf3\xff\x3d\x85\xff\x07\xe4\xb4\xe0\x03\xc6\x32\x48\x3f\x00\
+\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x2d\x02\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x80\x00\x00\x00\x80\x08\x06\x00\x00\x00\xc3\x3e\x61\xcb\
+\x00\x00\x20\x00\x49\x44\x41\x54\x78\x9c\xed\x9d\x79\x94\x1d\x55\
+\xbd\xef\x3f\x7b\x57\xd5\x39\xa7\xc7\x8c\x9d\xce\x1c\x32\x30\x04\
+\x42\x42\x08\x86\x21\x82\x10\x91\x3c\x02\x08\x88\xe8\x05\x7c\x5e\
+\x35\x8a\x38\x81\x08\xde\xbb\x54\xde\x15\xd4\x80\x20\xf8\x14\x16\
+\xae\x0b\x8a\x70\x35\xa0\x4b\x40\xf0\x06\xbc\x82\x32\x24\x81\x20\
+\x09\x60\x42\x08\x10\x08\x19\x49\x27\xe9\x24\x9d\x4e\x77\x9f\xb9\
+\x6a\xef\xf7\xc7\x39\x75\x7a\x9f\xea\xd3\x67\xea\xd3\x09\xf2\xf8\
+\xae\x55\xdd\xa7\xaa\xf6\xfc\xfb\xed\xdf\xb4\x77\x55\x09\x0e\x32\
+\x8e\x3f\xfe\x78\x96\x2d\x5b\x46\x2c\x16\x43\x6b\x9d\xbb\x2e\x84\
+\x28\xbb\x0c\x33\x9f\x9f\x37\x1c\x0e\x73\xe3\x8d\x37\x72\xcb\x2d\
+\xb7\xd4\xac\xad\xc5\x10\x8d\x46\xe9\xee\xee\x46\x6b\x5d\x93\x7e\
+\x08\x21\x10\x42\xd0\xd4\xd4\x44\x43\x43\x43\x4d\xdb\x5a\x0c\xf6\
+\x41\xab\x29\x8b\xb3\xce\x3a\x0b\xa5\x14\x42\x08\xa4\x94\xb9\xdf\
+\x5a\x6b\x94\x52\xff\x4b\x08\x71\x12\xa0\x0a\x64\x15\x40\x8f\xd6\
+\x7a\xa9\x65\x59\x6f\x41\x66\x00\xa5\x94\x68\xad\x11\x42\x90\x4c\
+\x26\x0f\x5a\x3f\xcc\xf6\x4b\x29\x73\xd7\x5d\xd7\x1d\x03\x5c\x06\
+\x34\x00\xba\x40\x56\x09\xac\x95\x52\x3e\x62\x59\x56\xee\xa2\xdf\
+\x97\x4a\x18\xa8\x16\x38\xe8\x0c\xe0\x13\xcb\x3f\xb2\x04\x9c\xe4\
+\x79\xde\x5f\x81\xc3\x83\xb3\xbb\x00\x6e\xf5\x3c\xef\x6e\xcb\xb2\
+\xbe\xec\x97\x01\x90\x4e\xa7\xf9\xd9\xcf\x7e\xc6\xcf\x7f\xfe\xf3\
+\xc1\xee\x02\xd0\x3b\xd3\x2d\xcb\xca\x31\xb1\xeb\xba\x3f\x04\xae\
+\x2b\x27\xbf\x52\x6a\x17\xf0\x31\xcb\xb2\x5e\xd3\x5a\x63\x59\x56\
+\x6e\x6c\x0e\x26\x0e\x09\x03\xf8\x9c\x9e\xed\x6c\x83\x52\x6a\x8d\
+\x6d\xdb\x43\x2b\x28\xe3\x72\x00\xcb\xb2\xbe\xec\x5f\x13\x42\xe0\
+\x79\x5e\xed\x1b\xdc\x0f\x82\x4c\xec\x79\xde\xf7\x85\x10\xd7\x55\
+\x40\xc0\xd1\xc0\x4b\xc0\x61\x52\xca\x5d\x7e\xbe\xf7\x3d\x03\x08\
+\x24\x42\x48\x53\x6c\xde\x20\xa5\x1c\x5a\x69\xc7\xb5\xd6\x97\xa3\
+\xb9\x4d\x48\xf1\x96\x5f\x96\x25\xac\x12\xb9\x6a\x07\x4b\xda\x66\
+\x1f\x5a\xa4\x94\xd7\x57\x41\xbc\xb0\xd6\x7a\xb1\x10\x62\x91\xcf\
+\x4c\x96\x3c\xb8\x24\xa9\xa8\xb6\x6b\xaf\xb9\x96\xdd\xd1\xed\x44\
+\xdd\x2e\x12\x5e\x0f\x69\x95\xc4\xd5\x69\x94\x76\x51\x5a\x93\x52\
+\x71\x3c\x9d\xc6\x55\x2e\x85\xd4\x9f\xe7\xb9\xd8\xd3\x0e\xd0\xde\
+\xb3\x8d\x90\xa8\xc3\x92\x0e\x21\x19\xb9\xc0\xd4\x85\x95\xc0\xc3\
+\x3b\x4f\x29\xf7\x36\xa5\x5d\x12\x5e\x9c\xad\xbb\x5e\x67\xfa\x85\
+\xc3\x08\x87\x22\x55\x95\x57\x2e\x12\xa9\x04\x1b\x3b\xd6\x52\xa7\
+\x87\xe0\x58\x11\x1c\xe9\x9c\x67\x59\x55\x13\xee\x92\xb4\x4a\x2e\
+\xf2\x94\x22\xed\x25\x68\xef\xd8\xc2\x51\x17\x0e\x23\x52\xa4\x0f\
+\x12\x81\x94\x16\x8e\xac\x23\x2c\xeb\x90\x42\x62\x09\x1b\x5b\x86\
+\x08\xc9\x3a\x22\x56\x23\xcd\xce\x08\x86\xd6\x8d\xe0\x27\xb7\x16\
+\x37\x8a\x4b\xb2\xec\xb7\xae\xfe\x16\xb3\x4f\x9c\xc5\x51\x73\x27\
+\xf2\x6e\xe7\x46\x3a\xd2\xed\x44\xd3\xfb\x89\x7b\x3d\xa4\x54\x9c\
+\x94\x4a\x90\xf4\xe2\xa4\x54\x9c\xa4\x97\x61\x00\x55\xd0\x86\x03\
+\x8d\x66\x88\x33\x92\x13\x5b\xcf\x66\x5c\xe3\x11\x34\x87\x47\x30\
+\xa9\xe9\x48\xad\x0b\xda\x4a\xa5\x21\x10\x77\xbd\xdb\xb3\xf1\x8a\
+\x9e\xd4\x7e\x76\xc7\xb6\xb3\x6e\xef\x0a\xde\xe9\x59\x83\x64\x70\
+\x25\x81\xd2\x1e\xc7\x0d\x9f\xcf\x91\xc3\xe6\x30\xa2\x6e\x0c\xad\
+\x0d\x93\xbe\xdf\xe8\x0c\xbd\xbe\xba\xd2\x04\xbb\xa3\x5b\x44\x4f\
+\xfa\x00\xfb\xe2\x3b\xd9\xb0\xff\x25\xd6\x74\x3c\x8d\x2c\x21\xcd\
+\x24\x16\xb6\x15\xa2\x4e\x36\x10\xb6\x1a\xa9\xb3\xea\x71\x64\x84\
+\x88\xac\xa7\xce\x6e\x66\xa8\x33\x92\xa1\xe1\xd1\x4c\x18\x7a\x38\
+\xaf\xaf\xda\xc8\x0f\x6f\xf8\x21\x6b\x5f\x5d\xdb\xa7\x9c\xa2\x6c\
+\xfb\xf0\x1f\x1f\x66\xca\xcc\xb1\x6c\x3a\xb0\x8e\x57\xda\x9e\x25\
+\xe1\xf6\x10\xf7\x62\xa4\x54\x9c\xb4\x4a\x92\xd6\x49\x52\x2a\x86\
+\x8b\x07\x78\xd8\xc2\xc6\x96\x4e\x46\x2f\x8a\xac\x9e\x37\x78\x4c\
+\xa3\xa9\xb3\x1b\x48\xe9\x38\x71\xef\x00\x21\xcf\x41\x4a\x0b\xdd\
+\x0f\xc3\x94\x1e\x3a\x19\x49\xa8\x6e\x62\x5e\x17\x09\xd5\x8d\x6d\
+\x5b\x34\x3b\xc3\x91\x42\x96\xce\x3c\x00\x28\xad\x10\x96\x22\xae\
+\xba\x89\xa9\x46\x3c\x95\xd6\x52\x5a\x14\x36\xfa\x8b\x43\x20\x49\
+\xa8\x28\x71\xd5\x4d\x5c\x75\x21\x2c\x45\x73\xa8\x70\x1f\x34\x1a\
+\xad\x15\x4a\x69\x3c\xad\x91\x5a\xe0\x7a\x2e\x9e\xd7\x85\x2b\x12\
+\xd8\xa2\x8e\xb8\x8c\x12\x95\xdd\xf4\x58\xfb\xd9\x13\xdb\x49\x5b\
+\xd7\x46\x46\x4e\x19\xc7\x43\x7f\x7e\x80\xdb\x6f\xbe\x8b\x3b\xee\
+\xb8\x3d\xaf\xcc\x82\x0c\x30\x73\xe6\x2c\x9e\x79\xe6\x29\xd6\xb6\
+\xad\xe0\xcd\x7d\x2f\xd2\x99\x6a\x27\xe6\x76\x93\x52\x09\x52\x2a\
+\x81\x87\x8b\x27\x93\x08\xe1\x11\x91\x11\x2c\x69\x63\x5b\x16\xb6\
+\x65\xe3\xd8\x0e\x96\x65\x63\x09\xab\x0f\x03\x00\x84\xac\x3a\x9a\
+\x22\xcd\x84\xc3\x21\x1c\x3b\xa3\x47\xab\x9b\xff\x60\x09\x5b\xdb\
+\xb6\x45\x04\x87\x06\x51\x4f\x8b\x1c\x4d\xa4\xc1\xea\x53\x67\xad\
+\xa1\xd1\x0c\x0f\x8f\xa0\x2e\x12\x21\xec\xd8\x48\x5b\x6a\x21\xa0\
+\xb4\x03\xd3\x17\x42\x08\x6c\xdb\x22\x24\x6c\xea\x44\x84\xe1\x72\
+\x04\x2a\x3c\xad\x4f\x1f\x74\xf6\xaf\xd2\x0a\x4f\x79\xa4\xbd\x14\
+\xae\xeb\xa2\x3c\x85\xab\x3c\x3c\xd7\x43\xeb\x14\x0a\x41\x4a\x6b\
+\xb4\xe7\xe1\xea\x14\xae\x8a\x93\x8e\xc6\x89\xa6\x0e\xf0\xb9\xab\
+\x3e\xc5\xfc\xf9\x67\x70\xe1\x85\x17\xe6\xca\x2d\xc8\x00\xff\xe7\
+\xff\x7c\x8f\xb5\x6d\x2b\x78\x37\xfa\x26\x3d\x6e\x27\x31\xaf\x2b\
+\x33\xeb\x75\x12\x4f\x28\x90\x1e\x87\xd5\x1f\x1d\x71\x64\xdd\x71\
+\x3b\x62\x1b\xc6\xc4\x55\xb4\x31\xea\x75\x21\x84\x85\xcc\x59\xf7\
+\x7d\x89\xa0\xd1\x58\xd8\x74\x38\x1d\xd4\xcb\x46\x84\xb0\xdd\xa3\
+\x87\xcf\xc3\x55\xa9\xca\x07\x0e\x41\x5b\xcf\xa6\x69\x2b\xb6\xff\
+\xe9\x52\x97\xb4\x95\xf2\xa2\x44\xbd\x2e\x52\x6e\x62\xd0\x2d\x69\
+\xad\x35\x5d\xf6\x01\x76\xca\xad\xd8\x32\xa2\xe6\x8e\xd6\xb3\x47\
+\xb6\x8c\x43\x51\xb9\x17\x62\xcb\x10\xcf\x6e\x7b\xf8\x12\x25\x5c\
+\x3b\xe5\x66\x24\x41\xcc\x8d\x16\xee\x83\x20\xcb\x09\x1a\xa5\x33\
+\xd2\x40\x68\x68\xb4\x5a\x12\x23\x1a\xc6\xec\x3c\xac\xfe\xd8\xb5\
+\x2b\x3b\x1e\xea\x46\x29\x3c\xad\x40\x7b\x68\xe5\x82\xe7\xa1\x71\
+\xd9\xd8\xa1\x99\x76\xcc\x6c\x1e\x7d\xe4\x51\x2e\xb8\xf0\x82\x4c\
+\xfd\xc1\x3a\xbe\xf1\x8d\x2b\x99\x70\x5c\x33\x9b\x3a\x5e\xa5\xc7\
+\xdd\x43\xc2\x8b\x91\x26\x46\x8a\x04\x63\xea\xa7\x32\x32\x3c\xf1\
+\x5f\x5c\x8f\xab\x5e\xe9\xf8\xeb\x49\xbb\xe2\xef\x64\x75\x95\xc8\
+\x46\xc4\x14\xe5\xe8\x73\x9d\xed\x44\xc2\x8d\xf1\xf5\xd9\xff\x17\
+\x4f\xa7\x2b\x1e\x38\x29\x2c\x36\x77\xad\xff\xf0\x73\xdb\x96\x7e\
+\xd8\x91\xe1\xec\xf8\x88\x32\xac\x9a\xda\xc0\xef\x83\xab\xd2\x8c\
+\xa9\x9f\xca\xf1\xad\x1f\x45\xeb\xca\x55\x99\x2d\x6d\x96\x6d\x7b\
+\xe4\x81\x88\x55\x9f\xbd\x22\x28\x87\x7f\x05\x02\x91\x55\xb3\xbb\
+\xd9\xc9\xdb\x7a\x0d\x6f\x38\xab\x39\x6e\xd8\xfc\xf5\x87\x0f\x39\
+\xe1\xee\x37\xba\x97\xdd\xde\x16\xdb\x00\xda\x23\xa9\x14\x08\x85\
+\xe5\x4a\xb6\x74\xad\xe3\xd8\x39\xa7\x31\x6b\xe6\x71\xac\x7d\x75\
+\x4d\xdf\xe1\xda\xb4\xf3\x75\x56\xbd\xfb\x18\x07\xd2\x7b\x88\xba\
+\x9d\xa4\x54\x82\xb8\xd7\xc5\xd8\xba\xe9\xe3\xa6\x35\x9c\xf2\xdf\
+\x0f\x6e\xfd\xc9\xf1\x71\xef\x00\x52\xd8\x08\x04\x4a\x2b\xb4\x52\
+\x4c\x68\x99\xc2\xd8\x61\x13\x19\xde\x30\xa2\x4f\xa8\xb6\x3f\xb8\
+\x3a\xc5\xa7\xc6\x5d\x5f\x95\x04\x90\xc2\x62\x5b\xfc\x35\x56\x77\
+\xfe\x09\xeb\xe0\x7b\xb3\x39\x28\x3c\xa6\x37\x9e\xca\xf4\xa6\xd3\
+\xd0\x55\x48\x00\x4b\x38\xfc\x61\xc7\xf5\xd8\x22\x54\x51\xbe\x68\
+\x2a\xca\xf6\x7d\x9b\xd9\xda\xbe\x11\xd0\xf8\x36\x88\xa7\x33\x6d\
+\x38\x77\xec\x57\x76\xd6\x85\x22\xe7\xaf\xda\xff\xc8\xea\xb0\xa8\
+\x27\x24\x23\x44\xac\x06\x9a\xec\xe1\x8c\xae\x3f\x9c\xce\x0d\x16\
+\xff\x72\xf1\xa5\xf9\x0c\x70\xf5\xd5\xdf\xe2\x9c\x2f\xcd\x61\x5b\
+\xd7\xab\xf4\xb8\x9d\x24\xbc\x8c\x48\x3a\x7f\xcc\x77\x4f\x78\xa5\
+\xe3\x89\x15\xcb\xf6\x3c\x10\x09\xc9\xba\x5c\xe8\xd6\x53\x69\x66\
+\x4e\x3c\x89\x93\x8f\xf8\x28\x8d\x91\xe6\x8a\x3b\xaf\x70\x39\x3c\
+\x79\x36\x5a\x54\x13\xc0\x11\xf4\x88\x36\x76\x3b\xeb\x11\x0c\xae\
+\xd1\x57\x0c\x1a\xcd\xb0\xf4\x64\x86\x79\x53\xaa\x32\x66\x25\x36\
+\x1b\x23\x4f\x54\xee\xb9\x68\x40\x40\x2a\x9d\x64\xf5\xa6\xe5\xac\
+\xda\xf8\x2c\x08\x90\x42\xa2\xd1\xa4\x55\x92\x23\x9b\x4e\xe2\xcc\
+\xd6\x7f\x3d\x7f\xe9\xce\x5b\xfe\xbb\xce\x6a\x22\x2c\xeb\xa8\xb3\
+\x9b\x19\xe2\xb4\x30\x6b\xf4\x99\x1c\x33\xe1\xa4\x7c\x06\xb8\xef\
+\x77\x77\x11\x39\x6a\x1f\x1d\x89\x6d\x24\x54\x94\x84\x1b\xa5\x25\
+\x3c\xa5\x35\xcc\xb0\x2d\xcb\xf6\xfc\x26\xe2\xc8\x48\xae\x76\x4b\
+\x3a\x7c\x62\xee\x97\x18\x33\x74\x12\x3d\xc9\x2e\xde\x6c\x7b\x99\
+\x6d\x7b\xde\xa6\x23\xb6\xa7\x6c\x09\x90\xf2\xe2\xdc\x7e\xfa\xcb\
+\xa4\x54\xa2\xb2\xce\x93\x71\x83\x5e\x6e\xff\x0b\xbf\xdb\xf0\x43\
+\x6c\x59\xd9\xec\xa9\x25\x3c\x95\xe6\x63\x93\xbe\xc0\x82\x49\x8b\
+\xf0\xb4\x5b\x71\xfe\x90\x8c\x70\xe5\xb3\x73\x08\x59\x75\xe5\x67\
+\xd2\x9a\xe1\x8d\x2d\x8c\x1e\x32\x89\x23\xc7\xcf\x66\x64\xc3\x68\
+\xba\xe2\xfb\x79\x64\xf5\x3d\xec\x8f\xb6\xe7\x3c\x08\x4f\xa7\x99\
+\xda\x38\x97\xb3\x5a\x2f\x3f\x6d\xe9\xae\xc5\x2b\xea\xac\x66\x22\
+\x56\x03\x8d\xf6\x30\xc6\x37\x1d\xc3\x9f\xff\x73\x6d\xbe\xec\x3c\
+\xf1\xb4\x99\xbc\xd8\xf6\x30\x9e\x4e\xe0\x91\xc6\x25\xca\x91\x8d\
+\x67\xfc\x69\xc9\xb6\x6f\x46\xea\x43\xf5\xd9\xba\x35\x52\xda\xfc\
+\xef\x53\xff\x0d\x5b\x86\x78\xea\xb5\xdf\xf3\xda\xbb\xab\xb0\x84\
+\xcc\xe9\xa4\x72\x91\xf2\x62\x68\xfa\xae\xee\x95\x35\x06\x64\x24\
+\x50\xda\xed\x42\x67\x6d\x80\x43\x01\x57\xa5\x51\x55\xa8\xb0\x1c\
+\x04\xa4\xdc\x2e\x44\x85\xcc\xb3\xeb\x40\x37\x3b\x3b\x37\xf2\xd2\
+\xe6\x27\x98\x3a\xea\x58\x4e\x9b\xfe\x09\x2e\xfb\xf0\x37\x79\xe8\
+\xc5\xdb\xd9\xd7\xbd\x33\x13\x28\xc2\x61\x4b\xfc\x05\x36\x46\x67\
+\x3d\x3c\xb6\xee\x88\x31\x7b\x53\x9b\x3d\x57\x0b\x92\xda\xe2\x80\
+\xd7\xc6\xfe\x78\x5b\xbe\xec\xdc\x9d\x78\x8b\x94\xee\xc6\x25\x81\
+\xab\xa3\xcc\x1e\x72\xfe\xb9\x8f\xed\xfe\xd1\x89\x11\x3b\x84\x10\
+\x0a\x21\x3c\x34\x09\x3e\x79\xe2\x37\x48\xbb\x49\xee\x7f\x7e\x31\
+\x1b\x76\xad\x22\xec\x58\xd8\xb6\xc4\xb2\x40\x4a\x5d\xf6\x61\x59\
+\x0a\xad\x74\x6e\x49\xb5\xd2\x43\x88\xf2\xeb\x1a\xac\xc3\xb2\x14\
+\x52\x52\x75\x1f\xb4\x22\x5b\x46\x85\xf5\x4a\xb0\x2d\x49\xd8\x09\
+\xb1\xad\xe3\x75\x1e\x58\x79\x23\x6d\x1d\x1b\x39\xff\x84\xaf\x10\
+\x0e\x39\x08\xe1\x21\x84\x22\x64\x39\xac\xd8\x77\x57\xcb\xd4\x86\
+\x93\xff\xdd\x25\x86\x4b\x92\x94\xee\x21\xaa\xda\x89\x7a\x7b\xf3\
+\x25\x40\xa7\xbb\x99\xa4\xee\xc6\x15\x71\xd2\xaa\x1b\x4b\x44\xbe\
+\x94\xd0\x7b\xb0\xed\x10\xe0\xe1\x29\x8f\x13\x0e\x3b\x93\x90\xed\
+\xf0\xd0\x8b\xb7\xe0\xea\x34\x21\x47\x50\x78\xf5\xb6\x34\x3c\x4f\
+\xf5\x59\x4f\x2f\x17\x19\x6f\x43\x63\xd9\x0a\x5b\x1e\xbc\x45\xa0\
+\x3e\x50\x0a\xa1\xbd\xea\xfb\xa1\x33\x4c\x64\x5b\x03\xeb\x83\xd6\
+\x8a\xc7\xd7\xde\xc9\xb9\xb3\xbf\xc1\x19\xd3\x3f\xc5\x5f\xd7\xff\
+\x1a\xdb\x72\x00\xf0\xb4\x62\x7b\x7c\xcd\x55\x29\xdd\x7d\xa3\x23\
+\x6c\x5c\xad\x49\x7a\x9d\x24\x75\x57\x3e\x03\xc4\xf4\x5e\x3c\x1d\
+\xc7\xd5\x3d\x8c\x8e\x4c\x67\x7d\xec\xbf\xcf\x73\x2c\x0b\x29\xb2\
+\x62\x5a\x6a\x66\x4f\x3a\x8b\x3f\xbe\xfc\x63\xb4\x48\xe1\xc8\x81\
+\x19\x5f\x56\x66\x0f\x40\x75\xab\x78\x22\xc3\x78\x76\x76\x36\x1c\
+\x2a\x68\x34\xc2\x90\x00\x15\xe7\xd7\x1a\xab\x46\x7d\xb0\xa4\xc3\
+\x5f\xd7\xff\x27\x97\x9d\xbc\x98\xe1\x8d\xad\xf4\x24\xf6\x66\x16\
+\xde\xb4\xc5\x9b\xb1\xbf\x8c\x3a\x75\xf8\x97\xa7\xac\xea\xfa\xaf\
+\x4d\x42\x0c\xc1\x15\x36\xae\x4e\xe4\x33\x40\x52\xf7\xe0\x12\x27\
+\x4d\x0f\xc3\x43\xe3\xa7\xbc\xdd\xf9\x37\xe1\x58\x19\xf7\x42\x29\
+\x8f\xa9\xad\x73\x78\xbd\x6d\x19\xf1\xe4\x5e\x1c\xcb\xa1\x9a\xd0\
+\xa7\x09\xbb\xca\x41\x03\xdf\x6e\xf0\x07\x6f\x60\xed\x18\x18\x34\
+\x5a\x68\xb4\xae\xd2\x96\xd1\xb5\xed\x83\x52\x1e\x2b\xdf\xfe\x1d\
+\x47\x8e\x99\xcb\x2b\x5b\x96\x62\xc9\x8c\x4d\xe6\xe9\x1e\xde\x89\
+\x3f\x33\x4b\x93\xda\xe4\xd2\x83\x87\x83\xc2\xcd\x67\x00\x45\x1c\
+\x97\x18\x1a\x8f\x1d\xa9\xd5\x63\x2d\x4b\x23\xb2\xe2\x5d\x48\x8f\
+\xd6\x21\x53\xf9\xc7\x96\x47\xb0\x6d\x09\x55\xf8\xbc\x41\x48\xa9\
+\xf0\x94\x42\xa9\x6a\x54\x88\x00\xad\x90\x32\x63\x9b\x1c\x2a\x08\
+\xa9\x90\x78\x78\x9e\x97\xf3\xc1\x2b\x81\x87\xc2\xaa\x61\x1f\x2c\
+\x0b\xb6\xec\x5b\xcd\x94\xd6\x13\x90\xd2\xeb\xdd\xb8\x22\x60\xaf\
+\xbb\xa1\x11\x91\x89\x57\xba\x84\xfb\x32\x40\x9a\x28\x1e\x31\x10\
+\x29\xf6\x7a\xaf\x6b\xdb\xee\x8d\x48\x7b\x4a\x93\x4c\x77\xe2\x11\
+\xc7\xb6\x6b\x13\x78\x51\x1e\x28\x4f\xa1\xaa\x88\xa0\x65\x42\x7e\
+\x0a\xcb\xd2\xd8\x87\x50\x05\x08\xe5\xcf\xfe\xea\xf2\x67\x6c\x00\
+\x8d\x5d\xc3\x05\x4c\xa1\x24\xfb\xa3\xdb\xb0\x2c\x0c\xd5\xa2\x51\
+\x3a\x86\x94\x36\x5a\x2b\x5c\xba\x01\x95\xcf\x00\x2e\x3d\x68\x91\
+\x04\xe9\x22\x95\x40\x0b\x2f\xc7\x00\x42\xc0\x9e\x9e\xb7\xb0\x2d\
+\x6a\xc6\xad\x12\x0f\xad\x74\xf5\x0c\xa0\x35\x52\x2a\xe4\x21\x34\
+\x02\x35\x19\x29\xa4\x94\xd7\xef\x32\x78\x31\xa8\xc1\xe8\x83\xd0\
+\x1c\x48\xec\xc0\xb2\x34\x32\x4b\x2b\x0d\x48\x34\x42\x2b\xb4\x90\
+\xb8\x5a\x91\x26\x9a\xcf\x00\x09\xd5\x81\x12\x89\x4c\x42\x4b\xa3\
+\xd0\xb9\x55\x29\xad\x21\xe9\xed\x47\x4a\xca\x8a\x55\x97\x03\x0b\
+\xc1\xde\xf8\x6e\x1a\x9c\xfa\x8a\xf5\xa7\x25\x04\x7b\x63\x3b\x33\
+\xae\xe7\xc1\xdd\x45\x95\x07\x2d\x20\xe6\x76\x67\x18\xb9\x0a\x06\
+\x48\x91\x44\x5a\x30\x40\x7b\x3a\x0f\x42\x43\x22\xbd\x0f\x2b\x40\
+\x2b\x8d\x22\xb3\x4c\xe7\xa1\x85\x87\x47\x32\x60\x03\xc8\x28\xd2\
+\x52\xa8\x2c\xbf\xc8\x6c\xb6\x4c\xa1\x9a\xb4\xea\x44\x4a\x5d\xb3\
+\x05\x17\x5b\x08\x36\x74\xbc\xc2\xf1\x2d\xa7\x56\x1c\x46\x15\x42\
+\xb2\xb1\x7b\x0d\x76\x48\x32\x50\x63\x74\x20\xb0\x11\xbc\xbe\xef\
+\x65\xe6\x8f\x90\xb8\x5e\x65\xc1\x1c\x29\x2c\xde\xee\x5c\x8b\x6d\
+\x09\x84\xa8\x5d\x1f\x84\x86\x98\xbb\x2b\xc3\x54\x46\xb9\x19\xb2\
+\x65\x6d\x3a\x4b\x03\x5e\x3e\x03\x08\xa9\x40\x2a\x24\x19\x71\x11\
+\x84\xd6\x69\x6c\x2b\xb7\x26\x59\x03\x58\x3c\xb9\xe3\x3e\x4e\x18\
+\x79\x3a\xe9\x0a\xa2\x69\x12\x8b\xcd\x5d\x1b\xd8\xd4\xb3\x8a\xf1\
+\x23\x6b\xd9\x9e\x6a\x20\x68\x4f\xbd\xc5\xda\xf6\x17\x38\x7a\xc4\
+\xec\x8a\xc2\xc1\x21\x19\xe6\xf1\x2d\xbf\xa2\x71\x54\x75\x9b\x49\
+\x8a\xa1\x3f\x5a\xf9\x52\x5d\xca\xcc\x0e\xe4\x3c\xc1\x23\x85\xc6\
+\x82\x2c\x03\x78\x05\xa2\x5e\x95\x45\xfa\x4a\x1f\x02\x2f\xb4\x89\
+\x5f\xbc\x76\x3d\x52\x5b\xe8\xac\x51\xe8\x79\x5e\xc1\x43\x79\x1a\
+\xa1\x24\x7b\x62\x3b\xb9\x7d\xdd\x77\x19\x33\xdc\x3d\xe4\x91\x40\
+\x29\x35\x2d\x43\x5c\x7e\xf9\xfa\x62\xda\xba\xb7\x62\x61\xa3\x15\
+\xa8\xac\x77\x13\x3c\xb4\xd2\xa0\x04\x0e\x21\xfe\xeb\xcd\x9f\xb2\
+\x4f\xbd\x84\x65\xc9\x41\x88\x50\x16\xa0\x15\x5e\x6e\x72\x4b\x91\
+\x89\xa4\xe6\x49\x00\x29\x35\xd2\xf2\xf7\x9e\x68\x64\xb5\xa6\x6d\
+\xb9\x10\x9a\xf1\xa3\x7a\x78\x75\xe3\xdf\xb9\xfe\xe5\x2f\xf2\xd1\
+\x31\x17\x72\x58\xd3\xd1\xd4\x5b\xf5\x7d\xf6\x15\x08\x04\x7b\x92\
+\x3b\x79\xbd\x73\x35\xcb\xdb\xfe\x87\xb1\xa3\xa2\x44\x42\x0a\xad\
+\x0e\xb5\x04\x00\xcb\xd6\xb4\x8e\xdc\xc3\x0f\x56\x7f\x85\x33\xc6\
+\x9f\xcb\x8c\xe1\x73\x69\xad\x9f\x50\xe0\x09\x26\x48\x7a\x09\xb6\
+\x74\x6d\xe0\xe9\xb6\x47\x69\x8f\x6f\x65\xf6\x91\x51\x04\xfa\xa0\
+\x6c\x63\x50\x96\xce\xad\x39\xfa\xb6\x5c\x3e\x03\x08\x8d\x34\x74\
+\xb1\xb6\x06\x7f\x60\x25\x9a\x59\xd3\x76\xf3\xc6\x66\xc1\x43\x5b\
+\xee\x21\x23\xa4\x0a\xd7\x9b\x31\x48\x2d\x26\xb4\xf6\x30\x7e\x74\
+\x27\x9e\x92\x70\x10\xda\x58\x0a\x1a\x18\x37\xaa\x0b\x4b\x0a\x96\
+\xef\xfc\x0b\xcb\xda\x1e\x2f\xd1\x07\x49\x53\x9d\xcb\xac\x69\x7b\
+\x33\xeb\x21\x1c\x1c\x26\xb6\x94\xce\xd5\x23\x85\x40\xd0\x47\x02\
+\x80\xb4\x4c\x5e\x3c\x48\x83\x6b\x69\x66\x1e\xd1\x46\x57\x4f\x84\
+\x9e\x58\x04\xa5\x0b\xec\xec\xd1\xe0\x38\x1e\xc3\x1b\xa3\xd8\x8e\
+\x42\x6b\x81\x55\x43\xc3\x69\xe0\x10\x8c\x19\x79\x80\x96\x61\xdd\
+\x74\xf6\xd4\x91\x4c\x39\x05\xfb\x20\x85\xa6\xa1\x2e\xc9\x90\xa6\
+\x38\x4a\xf9\x5b\xe7\x0e\xd6\x38\xf7\x36\xa8\xa0\x04\x10\x59\xbd\
+\x90\x6d\xeb\xe0\xab\x00\x13\x0a\x9a\x1b\x12\x0c\x69\xe8\x7f\x6f\
+\x80\x36\x7e\x88\x43\x2c\xf6\xfb\x83\x63\x7b\xb4\x0c\xed\x29\x2a\
+\xd2\x35\x80\xf2\x0d\xed\x83\xd7\x0f\x25\x44\x5e\x5c\xa7\x20\x03\
+\x20\x32\x2a\xc0\xd2\x70\x48\x57\x59\x0a\xe0\x10\xba\xfb\x35\xc5\
+\xa1\xea\x87\xa5\x14\x2a\x5b\x79\x26\x44\x1c\x50\x01\x96\xc8\x04\
+\x58\x72\x10\xd5\x2d\xf3\x7e\x80\xf7\x28\x84\xc8\x69\x01\x59\x48\
+\x02\x20\x34\x3a\x4b\x74\x29\x00\xfd\xde\x92\x00\x1f\x60\x80\x90\
+\x46\xac\x32\x3b\xd1\xf3\x55\x00\x20\x75\x36\xf4\x2b\x41\x7e\x20\
+\x01\xde\x57\x50\x08\x64\x96\xa4\xbe\xf9\x19\xb0\x01\xc0\x7f\x22\
+\x49\x68\x10\x87\x32\xc8\xfe\x01\x6a\x0e\xa9\xc0\x0f\xfd\xf9\xcf\
+\xee\xf4\x2b\xe3\x07\x62\x9b\x6a\xad\xb3\x4f\x0c\x0f\xfe\x2a\x5d\
+\xa6\x2e\x2f\xcf\xef\x56\xda\x3b\x28\x75\xff\xb3\xa1\xbf\xd7\x95\
+\x14\x44\xb5\x73\x5f\x6b\x85\x10\x36\x53\x1a\x17\x32\xc2\x39\x02\
+\xb7\x8a\x2d\xdf\xe5\xd7\xa5\xb1\x45\x1d\x63\x23\x1f\x42\x65\x1f\
+\x49\xf7\x74\x8a\xb1\x91\x93\x18\xee\x1c\x89\xaa\x62\x9b\xf6\xfb\
+\x19\x85\x68\x9a\xa7\x02\x34\xc6\xf6\xce\xac\x78\xa8\x4c\x12\x68\
+\x3c\x9d\xe6\x4b\x93\xd7\xd2\x60\x8f\x02\xe0\xf9\x3d\x3f\x62\x75\
+\xe7\xcf\xb0\x44\xed\xb7\x6e\xbb\x3a\xce\xa2\xc9\xaf\x51\x67\x0f\
+\xe7\xef\xfb\x6e\xe6\xef\xfb\x6e\x61\x74\xe4\x04\x2e\x9a\xf0\x28\
+\x00\x77\xbd\x73\x24\x29\xd5\xd5\xab\xd7\xfe\x3f\x86\x80\x9c\x0b\
+\x08\xbd\x33\x3f\xdf\x0b\xd0\x01\xcf\x4f\xe6\xad\x26\x96\x84\xa7\
+\xd3\x1c\x3f\xec\x6b\x39\xe2\x03\xcc\x6b\xb9\x8e\x57\x3b\x7f\x8d\
+\xab\xe2\x79\x4f\xf0\xb8\x3a\x01\x68\x2c\x11\xce\xa8\x8b\xec\x16\
+\x33\x81\xc0\x12\x0e\x22\x1b\xb5\xd6\x28\x5c\x9d\xcc\xbd\x59\xc4\
+\x9f\xd5\x52\x58\x58\x84\xf8\x9f\x9d\x5f\x64\x5c\xdd\xc9\xac\x3f\
+\x70\x3f\x02\x0b\xdb\x60\x34\x9b\x30\x29\x5d\x59\x1f\xde\xb7\x10\
+\x01\xda\x66\x63\x50\x7d\x24\x40\xd6\x09\xc8\xed\x20\x29\x57\x17\
+\x68\x0d\x42\x84\x38\xb5\xe5\xfb\x00\x3c\xbb\xfb\x3b\x9c\x34\xf2\
+\x3b\x44\xac\x66\x4e\x69\xf9\x3e\x4f\xef\xbe\x1a\x3b\xfb\x64\x91\
+\xab\x92\x9c\x3b\xe6\xd7\x34\xd8\x63\x79\x6c\xe7\xe7\x39\x7e\xe8\
+\x97\x99\x54\xff\x11\x14\x1e\x1d\xa9\x8d\xfc\xbd\xe3\x56\x0e\xa4\
+\x37\x21\xb1\x89\x58\xc3\xf8\xd4\xb8\xfb\xd9\x9b\x58\xcf\xd6\xd8\
+\x72\x3e\x34\xec\xeb\xb8\x24\x79\xbb\xe7\x31\x56\x77\xfc\x9c\x31\
+\x91\x13\x39\xac\xe1\xa3\x6c\x8b\x3f\x47\x77\x7c\x67\x9e\xc4\x52\
+\xd9\x7e\x7c\xc0\x01\x19\x98\x91\x40\x3f\x06\x99\xbf\x21\x44\x83\
+\xbf\x3f\x53\xa2\x51\x52\x96\xad\x03\x3c\x9d\xe4\x94\x11\xff\x8e\
+\x10\x12\xad\x15\x6b\xf6\xdf\x0b\x58\x9c\xde\xfa\x23\x66\x0d\xfd\
+\x57\x5e\xdc\x7b\x1b\x71\x6f\x2f\x20\xf1\x94\xc7\xe1\xcd\xe7\x03\
+\xf0\xa5\xa9\xaf\xd1\x9d\xde\xc1\xbb\xb1\x95\x8c\x89\xcc\x61\xfa\
+\x90\x8b\x99\x3e\xe4\x62\x1e\xde\x76\x11\x5b\x63\xcb\x98\xdc\xb4\
+\x80\xd6\xc8\x6c\x5a\x23\xb3\x39\x66\xe8\x67\x68\x8f\xbf\xca\xa8\
+\xf0\x71\x8c\x0a\x1f\xc7\xca\x3d\x37\x33\x7b\xf8\xe5\x44\xac\x61\
+\x4c\xaa\x3f\x83\x6d\xd1\xe7\xf2\x1f\x51\xd0\x02\xad\x05\xfa\x83\
+\x78\x46\x56\x02\xa8\xec\x9e\x20\xf0\x37\x21\xf7\x89\x03\xf8\x6b\
+\x01\x39\x8f\xa1\x0c\x09\xa0\xb5\x22\x2c\x9b\x39\xa9\xe5\x5a\x00\
+\x9e\xdf\x73\x13\x69\x1d\x63\x55\xc7\xed\x9c\x34\xf2\xdf\x88\x58\
+\xcd\x7c\xb4\xf5\x56\x1e\xdd\xf1\x2f\x38\xb2\x3e\x2f\x6f\x5b\xf4\
+\x45\xee\xdf\x76\x26\xb6\x08\xe3\xea\x24\xff\x3a\xe9\x39\x5a\xeb\
+\x67\xf1\xd1\xd6\x5b\xf9\xe5\xa6\x59\x79\xcf\xdc\x3f\xb5\xf3\xdb\
+\xbc\xd2\x79\x17\x42\x64\x5e\x02\xe1\xc8\xfa\xdc\x06\x0c\x7f\x47\
+\x91\xc9\xaf\xfe\xef\x83\xfc\xe2\xad\xf7\x2c\x94\x30\xd7\x50\x0a\
+\x04\x82\xcc\xd9\xa2\x75\xf9\x81\x40\x57\x25\x39\xad\xf5\x87\xb9\
+\xf3\xd6\xc8\x71\x9c\x3b\xf6\x5e\x34\x8a\x68\x7a\x37\x11\xab\x99\
+\xa9\x4d\x67\x31\x2a\x74\x1c\x7b\x53\x6f\xe4\xed\xa0\x5d\x7f\xe0\
+\x01\x6c\x51\x8f\x25\x1c\xc0\x62\x4d\xe7\xaf\x59\x50\xff\x73\x86\
+\x86\x27\x67\x1e\x3d\x37\xd2\xbe\x13\xfd\x2b\x8e\x68\x44\x64\x8d\
+\xba\xb4\x8a\xf5\x76\x4e\x65\x77\xe6\x1a\xe9\x07\xb2\x5b\xf7\xfd\
+\x08\xad\x64\x6e\x42\xfb\x63\x93\xc7\x00\x9e\x06\xcf\x57\x01\x32\
+\x73\x5e\x46\xa9\x34\xda\xe3\x98\x3d\x7c\x11\x00\x29\xaf\x87\xf1\
+\x0d\x27\xe7\x36\x93\x2a\xed\xa1\x94\x87\x94\x16\x67\x8e\xb9\x95\
+\xff\xda\x34\x3f\x4f\xa8\xb4\x44\x66\x92\xda\x7f\x1f\x8e\x94\xa4\
+\x55\x82\xd1\xf5\x73\x80\x0c\x71\x95\xce\x5f\xf3\xeb\x49\xb7\x63\
+\x8a\x24\xcf\x30\x51\xb4\xc8\xaa\x30\xb3\x69\x64\xae\x7d\x80\x0c\
+\x84\xe8\xa5\xaf\xd0\x05\x6c\x80\x8c\xc1\x94\x35\x10\x72\x7f\x8a\
+\xc3\xd5\x29\x3e\xd2\xf2\x83\xdc\xf9\x2f\xde\x3e\x86\x84\xdb\x95\
+\x93\xbb\x4a\xa7\x38\x63\xd4\x0f\x38\x79\xd4\xb7\x18\x53\x77\x3c\
+\xd3\x9b\x2f\x60\xfd\x81\x87\x73\xe9\x67\x0f\x5f\x44\xd2\xeb\xe2\
+\x9d\x9e\x27\x99\xd2\xf8\x31\x66\x0d\xfd\x2c\x00\x2f\x77\xfc\x0a\
+\xa1\x1d\x84\xee\x25\x78\xca\x8b\x11\x92\x0d\xb9\x76\x65\xb8\x58\
+\xf4\x76\x48\x83\x36\x3c\x0d\x9f\xcb\xc5\x07\x62\x00\x00\x2d\x04\
+\xfe\x56\x0b\x7f\x44\x02\x2a\x20\xfb\x8c\x5b\xf6\x77\x39\x7b\x95\
+\x95\x86\x51\x91\x63\x01\x58\xb5\xf7\x17\x24\xbd\x18\x8e\xd5\xd8\
+\x5b\x26\xf5\x2c\xdf\x73\x13\xc7\x0f\xff\x22\x61\xbb\x99\x46\x7b\
+\x7c\xde\x2c\x7d\xbe\xfd\x56\x4e\x6e\xb9\x8a\x93\x5a\xae\xce\x5d\
+\x7b\x71\xef\x2f\x58\xb6\xeb\x07\x58\x32\x42\x47\x7a\xab\x51\x96\
+\x44\x9b\x3e\xbd\x96\x44\xbd\x76\x1a\x9c\x91\x44\xdd\xbd\x80\x45\
+\x34\xbd\x37\x77\x3b\xe1\x75\x65\x18\xe2\x03\x23\x20\x03\xa5\x7a\
+\xbd\x3c\x2d\x32\x93\xc3\xbc\xff\xb3\x4d\x13\x48\xc5\x72\xb3\x6b\
+\x9e\x94\x3c\x57\xaa\xcc\x0c\xc3\x68\x1a\xed\x56\xba\xd2\xdb\x73\
+\xae\x5e\x30\x8d\x40\x10\xb1\x86\x12\x75\xdb\xf1\x74\x8a\xef\x1e\
+\xbb\x1f\x80\xdf\x6e\x3a\x87\xad\xd1\x15\x0c\x0f\x4d\x05\xa0\x3b\
+\xbd\x0b\x8d\x87\x25\x43\x08\x04\x9e\x76\x89\xc8\xa1\x78\x3a\x89\
+\xa7\x53\x79\xef\x1f\xc8\x94\x2b\xa9\xb7\x47\xd2\x9d\xde\x81\x25\
+\x43\x28\xed\x11\x96\x43\xd1\xa4\x49\xab\x58\xce\x5e\xf8\x00\xa0\
+\x14\x9f\x15\x82\xdf\x02\x58\x0e\x3c\xf6\x93\x03\x05\xdc\xc0\xac\
+\x04\x90\xba\x4c\x1b\x00\x00\x41\x77\x7a\x37\x42\x84\xf1\xfa\x15\
+\xb7\x9a\xa8\xdb\x01\xc2\xc9\x7b\xa1\x82\x20\x84\x2d\x1a\xe9\x4e\
+\xb7\x67\x2f\x58\x08\xac\xac\xee\xd6\x80\x45\xc2\xeb\x02\xff\x05\
+\x50\x7d\xca\x57\x74\xa7\x77\x83\x70\xb2\x75\x4b\x12\xde\x81\x6c\
+\xfa\x2a\xdf\xdd\xf6\x3e\x85\xd0\x99\x27\x3a\x05\x20\xb2\x12\xa0\
+\x0f\x03\x78\xd9\x78\xa1\x16\x20\xbd\xc1\x11\x9d\x52\x87\x59\xb9\
+\xfb\x76\x9a\x9c\x71\xec\x8a\xbd\x06\xca\xe2\xfd\xb3\xdf\xe7\xbd\
+\x0b\x4f\x64\x5e\x48\x01\x59\x06\x08\xee\x08\x72\x68\xca\x3c\xde\
+\x24\x40\xa9\x14\x9e\x48\x0d\x0a\x59\x84\x70\x78\x7a\xe7\x8d\x99\
+\xf7\x06\x8a\x50\x66\xa2\xbe\x47\xf7\xf8\xbd\x5f\xa0\x01\x4b\x85\
+\x90\x32\x94\x0d\x01\x0b\x64\xf0\xd9\xc0\x46\x31\x0e\x47\x78\x20\
+\x20\x2e\x3b\x48\x7b\xfb\x06\xed\xa5\x8b\x42\x84\x73\xd6\xe8\x07\
+\x52\x7a\xf0\xa1\xb5\x26\x62\x35\x53\x27\x86\x03\x99\xad\x7f\x21\
+\x62\xf9\x0c\xd0\x20\xc7\x60\x5b\x69\x40\x92\xf2\x92\x28\xbd\xb7\
+\x50\x59\x1f\xe0\x9f\x11\x5a\x63\xd1\x40\x83\x1c\x03\x28\x2c\x69\
+\x61\x8b\x9d\x41\x09\x30\x16\x5b\x66\x18\xa0\xcb\x6d\x27\xad\x92\
+\xd5\x59\xd1\x03\x9c\xd1\xef\x67\x81\x30\x60\x79\x5a\x65\x01\x5a\
+\x2b\x2c\x5d\x4f\x83\x1c\x0b\x4a\x61\x0b\x49\x48\x34\x06\x18\x40\
+\x8e\x41\x92\x04\xa9\x99\x59\x77\x19\x75\x0d\xdf\xcc\x73\xa1\xcd\
+\xba\xfb\xa8\x06\xe3\x3c\x78\x4f\x04\xd2\xf5\xe9\x43\xa1\xf4\xa2\
+\xef\x6e\x84\xfe\xfa\x2e\x0a\xa4\xed\x9b\xa8\x1a\x46\x2e\xbd\x27\
+\x52\x67\xdf\x54\xd2\xf7\x7a\x9f\x06\x80\x56\x7d\xaf\x07\xf4\x9f\
+\x0e\x5c\x0b\xa6\xcf\x7b\xdc\x2c\x98\xb7\xbf\x7c\x5a\xa3\x11\xc4\
+\x55\x3b\x51\xaf\x1d\x2c\x81\x23\x6d\x1c\xd1\x10\x64\x80\x71\x58\
+\x76\x02\xad\x15\x43\xed\xc3\x18\x6a\x4d\xc9\x67\x80\x62\x44\x2e\
+\xf3\x5e\x39\xe7\x95\x5c\x2b\x76\xbd\xdc\xfb\xc5\x50\xea\xbd\x05\
+\xfd\xdd\x2f\xf7\x7a\x2d\xcf\xfb\xfb\xad\xb2\x71\x98\x4e\x6f\x33\
+\x02\x0b\xa1\x25\xb6\xb4\x70\xfa\x48\x00\x7b\x0c\x96\x8c\xa3\xb5\
+\x22\x24\x1a\xd0\x39\xaf\x31\x53\xa0\xff\x06\x4a\xf3\x77\x25\xf7\
+\xca\x3e\x97\xb2\x8f\x57\x10\x4c\x57\xea\x7a\xb9\xf7\x4b\x41\x69\
+\x55\x9c\x81\x04\xb9\x8f\x46\x95\x73\x3d\x58\x5e\x9f\xf2\x03\xf9\
+\x4a\xa5\x37\xcf\xfb\xfb\xad\xb5\x02\x21\x08\x89\x7a\x1a\xe5\x68\
+\xb4\x90\x84\x2c\xbb\xaf\x0a\x68\x92\x63\xb1\x64\x14\xb4\xc0\xaa\
+\xf0\xe5\xc5\x83\x09\x9f\x29\xca\xbd\x5e\x4b\x98\x9f\xb6\x3b\x14\
+\xa8\x65\xfd\x21\xd1\x8c\x25\x23\x68\xa1\x71\xa4\x43\x28\xa8\x02\
+\xc2\xb2\x09\x57\xe6\xcf\xc6\x52\x15\x57\x42\x84\x83\x41\xb0\x43\
+\x59\x5f\x35\x38\x98\x0c\x66\x89\x10\x96\x95\x99\xd8\x21\x19\xc2\
+\x12\xa1\x43\xf8\x9a\xed\x0f\x70\x48\xe1\xab\xd8\x43\xf7\xa2\xfd\
+\x2a\x50\xed\x4b\x25\x0f\x06\x0a\x7d\xce\xf6\x9f\x01\x07\x95\x01\
+\x84\x10\x7d\x3e\xb5\xda\x1f\x0a\x59\xbb\x85\xf2\xf9\x65\x16\xba\
+\x3e\x58\x28\xf4\xad\xe0\x60\xdb\xfc\x36\x95\xfa\xae\xf0\xa1\xb4\
+\x2f\xa0\x06\x0c\x50\x09\x51\x4b\xc1\x1f\xac\x20\xb1\xcd\x6f\x04\
+\x17\xaa\xbf\x50\xdd\x3e\x01\x06\xda\x36\xf3\xdb\xc6\x3e\x82\xe5\
+\x05\xef\xfb\x69\x82\xc4\x35\x99\xe2\xbd\x22\x21\xde\x33\x2a\xc0\
+\x24\x72\xf0\xbf\xf9\x8d\xe0\xfe\xbc\x01\xc8\x97\x06\xb5\x34\xfe\
+\x0a\x31\xa4\x59\x47\xb0\x6d\x3e\xe1\xcd\xcf\xc1\xfa\x8c\xe8\xdf\
+\x2b\x77\xe6\x0f\xb6\x84\x78\x4f\x30\x40\x90\xe8\x66\x87\xfd\xaf\
+\x8a\x5a\x96\x95\x37\xa8\x66\x5e\xe8\x7d\x2b\x97\xf9\x31\x67\x9f\
+\x19\x06\x3a\x80\xa6\xf4\xf1\x89\x6c\xb6\xd7\xb6\xed\x82\xed\x72\
+\x5d\x37\xd7\x36\xbf\x5d\xe6\x17\xc7\x0b\xa9\xae\x4a\x08\x5e\x0b\
+\xe6\x38\xa4\x0c\x60\x12\x3c\x28\x16\x1d\xc7\xc9\x1d\xa9\x54\x8a\
+\x0d\x1b\x36\xb0\x63\xc7\x0e\x76\xec\xd8\x91\x37\xd3\x26\x4e\x9c\
+\x48\x4b\x4b\x0b\x47\x1d\x75\x14\x0d\x0d\x0d\x78\x9e\x47\x3a\x9d\
+\xc6\x75\xdd\xdc\x17\xb9\xcd\x81\xae\x74\xc0\x4c\x29\xe4\xd7\x1b\
+\x0a\x85\x70\x1c\x07\xdb\xb6\xd9\xb6\x6d\x1b\x6f\xbd\xf5\x16\xdb\
+\xb6\x6d\xcb\xbd\xf6\xde\xb2\x2c\x26\x4e\x9c\xc8\xd1\x47\x1f\xcd\
+\x98\x31\x63\x48\xa5\x32\xdf\xf8\x73\x5d\x17\xcf\xf3\x72\xfd\xf5\
+\xcb\x3e\x94\x76\x40\x55\x0c\x50\x0b\xbd\x1f\x9c\xf5\x3e\x23\xd8\
+\xb6\x4d\x5d\x5d\x1d\xeb\xd7\xaf\x67\xc9\x92\x25\x3c\xf2\xc8\x23\
+\x6c\xda\xb4\xa9\xac\x32\x0f\x3b\xec\x30\x4e\x3b\xed\x34\x2e\xb9\
+\xe4\x12\xe6\xcf\x9f\x4f\x3a\x9d\x26\x95\x4a\xe5\x49\x8e\x4a\x06\
+\x3b\xd8\xb6\x70\x38\x8c\xd6\x9a\xdf\xfd\xee\x77\x3c\xfc\xf0\xc3\
+\xfc\xf9\xcf\x7f\x2e\x59\x46\x7d\x7d\x3d\x0b\x17\x2e\xe4\x0b\x5f\
+\xf8\x02\x0b\x16\x2c\xa0\xa7\xa7\x07\xd7\x75\xf1\xbf\x2f\x10\x54\
+\x0d\x07\x1b\x65\x53\xb0\x3f\x6b\xbb\xda\x74\xe6\xcc\xf2\xcf\x9b\
+\x9a\x9a\x58\xbe\x7c\x39\x73\xe6\xcc\x61\xf6\xec\xd9\xdc\x76\xdb\
+\x6d\x65\x13\x1f\x60\xcb\x96\x2d\xfc\xe6\x37\xbf\xe1\xec\xb3\xcf\
+\x66\xdc\xb8\x71\x3c\xf0\xc0\x03\x0c\x1d\x3a\x34\x27\xa2\x2b\x71\
+\x23\x4d\xbd\x6f\xdb\x36\xe1\x70\x98\xc5\x8b\x17\xd3\xd4\xd4\xc4\
+\xa2\x45\x8b\xca\x22\x3e\x40\x2c\x16\xe3\xa1\x87\x1e\x62\xe1\xc2\
+\x85\x4c\x9d\x3a\x95\xa7\x9f\x7e\x9a\xa6\xa6\xa6\x1c\x53\x99\xd2\
+\x60\x20\xa8\x96\x81\x8a\xd6\x5a\x2e\x31\xab\x29\xc3\x27\xbe\x65\
+\x59\x38\x8e\x83\xe7\x79\x2c\x58\xb0\x80\xf3\xce\x3b\x8f\x75\xeb\
+\xd6\x0d\xa8\x4e\x80\xbd\x7b\xf7\x72\xf9\xe5\x97\x33\x7b\xf6\x6c\
+\x12\x89\x04\x76\xf6\x33\xb5\xa6\x3e\x2f\xf4\x26\x4f\xbf\x6d\x3e\
+\x41\xea\xeb\xeb\x59\xb3\x66\x0d\xa3\x47\x8f\xe6\x47\x3f\xfa\x51\
+\x75\x5f\x37\xc9\x62\xcb\x96\x2d\x5c\x78\xe1\x85\x9c\x7b\xee\xb9\
+\x38\x8e\x93\x63\x82\xfe\x3c\x9c\x20\x06\xc3\x70\xac\x89\xa9\x5c\
+\x2e\xa3\x04\xc5\xbe\x65\x59\xd8\xb6\x4d\x5b\x5b\x1b\x93\x26\x4d\
+\xe2\x99\x67\x9e\xa9\x45\x73\xf2\xb0\x76\xed\x5a\xc6\x8f\x1f\xcf\
+\x8e\x1d\x3b\x72\x86\x64\xb0\xed\xa6\x14\x32\x89\xdf\xd8\xd8\xc8\
+\x7d\xf7\xdd\xc7\xa9\xa7\x9e\xca\x81\x03\x07\x6a\xd6\xa6\x27\x9f\
+\x7c\x92\xa9\x53\xa7\xe6\x18\xd3\xac\xdb\x44\x2d\xd4\x42\xc1\x05\
+\x29\xa5\x7a\x8d\xda\x01\x95\x5e\x25\xfc\x41\x97\x52\xd2\xde\xde\
+\xce\x71\xc7\x1d\x47\x2c\x16\x2b\x9d\xb1\x4a\xa4\xd3\x69\x4e\x3c\
+\xf1\x44\xd2\xe9\x74\x1f\xb1\xeb\xeb\xe2\x20\xf1\x1b\x1a\x1a\xb8\
+\xeb\xae\xbb\xb8\xe2\x8a\x2b\x06\xa5\x4d\xed\xed\xed\x2c\x5c\xb8\
+\x90\xba\xba\xba\xb2\x25\x80\x89\x5a\xd9\x0c\x55\x33\x40\xb1\x59\
+\xdf\xdf\xbd\xa0\xab\xd7\xd8\xd8\xc8\x99\x67\x9e\x49\x2a\x35\x80\
+\xef\xee\x95\x89\x03\x07\x0e\x70\xe1\x85\x17\xd2\xd8\xd8\x98\x27\
+\x76\x4d\xb5\xe0\xb7\xcb\x71\x1c\x96\x2d\x5b\xc6\x37\xbe\xf1\x8d\
+\xb2\xcb\x6f\x68\x68\xe0\xc4\x13\x4f\x64\xce\x9c\x39\x65\xe7\x59\
+\xb3\x66\x0d\x77\xde\x79\x27\xa1\x50\x28\xd7\x8e\x6a\x98\xa1\x12\
+\x04\x19\x27\x8f\x01\x82\x2e\x53\x10\xb5\xb0\x09\x4c\x8b\xfa\x86\
+\x1b\x6e\x60\xdb\xb6\x6d\x65\xe5\x3b\xe1\x84\x13\xb8\xf7\xde\x7b\
+\x79\xf3\xcd\x37\x49\xa7\xd3\xec\xd8\xb1\x83\xa7\x9e\x7a\x8a\x2f\
+\x7e\xf1\x8b\x65\x1b\x50\xcb\x97\x2f\xe7\xd9\x67\x9f\xc5\x71\x9c\
+\x82\x83\xec\xdb\x25\x9e\xe7\xe5\x7d\x62\xbd\x18\xe6\xcd\x9b\xc7\
+\xaa\x55\xab\xe8\xe9\xe9\x61\xc5\x8a\x15\xbc\xf0\xc2\x0b\x78\x9e\
+\xc7\x92\x25\x4b\x68\x6c\x6c\x2c\x99\xff\x7b\xdf\xfb\x5e\x4e\x0d\
+\x04\x03\x5a\xc1\x28\x62\x7f\x33\x7e\x20\xd2\xa0\xcf\xc8\x05\x89\
+\x5c\x6b\xeb\xdf\xec\xe4\xe2\xc5\x8b\xcb\x6a\xe4\x92\x25\x4b\x58\
+\xb5\x6a\x15\x17\x5f\x7c\x31\xa3\x47\x8f\xa6\xa7\xa7\x87\xfa\xfa\
+\x7a\xe6\xce\x9d\xcb\x9d\x77\xde\xc9\x8e\x1d\x3b\x98\x31\x63\x46\
+\x59\x65\x7d\xff\xfb\xdf\x27\x1c\x0e\xe7\xcd\x36\x73\xf6\xd7\xd5\
+\xd5\x71\xf5\xd5\x57\x13\x8d\x46\x4b\x96\x75\xc7\x1d\x77\xf0\xdc\
+\x73\xcf\x31\x7d\xfa\x74\xf6\xef\xdf\x4f\x34\x1a\xa5\xa7\xa7\x87\
+\xee\xee\x6e\x3e\xf1\x89\x4f\xb0\x79\xf3\x66\x46\x8f\x1e\x5d\xb4\
+\x8c\x64\x32\xc9\x8b\x2f\xbe\x58\xb3\xc8\x65\xa5\x8c\x32\x68\x36\
+\x40\x21\x86\xf0\x07\xda\x71\x1c\x1e\x78\xe0\x81\xb2\xca\x79\xf2\
+\xc9\x27\xb9\xe8\xa2\x8b\xe8\xec\xec\xcc\x05\x54\xfc\xef\x07\xa4\
+\x52\x29\xe2\xf1\x38\x0d\x0d\x0d\xbc\xf4\xd2\x4b\x8c\x1f\x3f\xbe\
+\x64\x79\xcf\x3f\xff\x3c\x3d\x3d\x3d\x79\xed\xf1\x19\xc1\xb2\x2c\
+\xda\xda\xda\xb8\xf7\xde\x7b\x4b\x96\x73\xc7\x1d\x77\x70\xc5\x15\
+\x57\xd0\xd9\xd9\x89\xeb\xba\xb9\xef\x1f\xfa\xff\x13\x89\x04\x91\
+\x48\x84\xc7\x1e\x7b\xac\x64\x59\xaf\xbe\xfa\x6a\x45\x0c\x50\x8d\
+\x37\xd0\x5f\x9e\x82\xb5\xd6\x7a\xd6\x07\x61\x59\x56\x59\x16\xff\
+\x17\xbe\xf0\x05\x4e\x3f\xfd\xf4\x9c\x81\x18\x74\xc1\x7c\xd7\xcd\
+\x8f\xb2\xdd\x7d\xf7\xdd\x65\xd5\xff\xf4\xd3\x4f\xe7\xdc\x42\x53\
+\x02\x84\x42\x21\x6e\xbd\xf5\xd6\x92\xf9\xe7\xcc\x99\xc3\xd7\xbf\
+\xfe\xf5\x1c\x23\x99\xd1\x3d\x33\xde\x90\x4a\xa5\x98\x39\x73\x26\
+\x67\x9d\x75\x56\xd1\xf2\x4e\x39\xe5\x94\xa2\xe3\x38\x58\xe2\x1f\
+\xca\x94\x00\xc1\xb8\x7a\xa5\xc6\x5f\xa1\x74\x6f\xbd\xf5\x56\xc9\
+\x74\xd7\x5c\x73\x4d\x8e\xf8\xbe\xeb\x62\x46\xd0\xb4\xd6\x39\xa6\
+\x70\x5d\xb7\xe4\x40\xfb\xd8\xb5\x6b\x57\xae\xcc\xe0\xba\xc3\x5d\
+\x77\xdd\x55\x32\xff\x0d\x37\xdc\x40\x34\x1a\xcd\xd5\xdf\x9f\xda\
+\x14\x42\x10\x8d\x46\xb9\xef\xbe\xfb\x18\x35\x6a\x54\xc1\xb2\xce\
+\x3b\xef\x3c\x8e\x3e\xfa\x68\x5c\xd7\xad\x2a\x5a\x69\xa2\x9a\x7c\
+\xfd\xbf\x27\xb0\x86\x41\x20\x73\x55\xac\x5c\xcc\x9d\x3b\x97\x69\
+\xd3\xa6\xe5\x89\x7c\xe8\x35\x54\x83\x2b\x6d\xfe\xb5\xfe\x06\xda\
+\x84\xb9\x9e\xe0\xc3\xb6\x6d\xfe\xf6\xb7\xbf\xe5\x16\x70\xfa\x43\
+\x73\x73\x33\xe7\x9c\x73\x4e\xce\xa5\x0c\x7a\x10\x3e\x83\xfa\x6d\
+\x85\x8c\x87\xf0\xe6\x9b\x6f\x72\xc5\x15\x57\xe4\xda\xd7\xd2\xd2\
+\xc2\xb5\xd7\x5e\xcb\xef\x7f\xff\x7b\x62\xb1\x58\x1e\x53\x9b\xa8\
+\xc4\x18\x2c\x96\xaf\x3f\x1c\xd4\xfd\x00\x66\xa4\x6d\xe2\xc4\x89\
+\xbc\xfc\xf2\xcb\xfd\xa6\x5d\xbc\x78\x31\x89\x44\x22\x2f\x5c\x6c\
+\x2e\xf5\x06\xeb\xf4\xdb\xd1\xde\xde\x5e\xb2\x1d\x93\x26\x4d\xea\
+\xb3\xf7\xc0\xb2\x2c\x1e\x7d\xf4\xd1\x92\x79\x17\x2e\x5c\x98\x73\
+\x5b\xcd\xa5\x6a\xbf\x0c\x53\x15\xe4\xbe\x13\x94\xad\xe3\xa7\x3f\
+\xfd\x29\xb7\xdf\x7e\x7b\xce\xd3\x48\xa7\xd3\xc4\x62\xb1\x9c\x14\
+\x01\xf2\x7e\x97\xc2\x40\x98\xc1\x67\xd4\xb2\x19\xc0\x24\x74\x31\
+\xa2\x07\xef\x99\x52\xc0\x9f\x2d\x89\x44\x82\xeb\xae\xbb\x8e\x47\
+\x1e\x79\xa4\x60\x5d\x97\x5d\x76\x19\xf3\xe6\xcd\xcb\x13\xff\x7d\
+\xac\x57\xc3\x5f\xf6\x23\x8a\x4f\x3c\xf1\x44\x59\x7d\x99\x3c\x79\
+\x32\x9e\xe7\xe5\x18\x49\x6b\x8d\xe3\x38\x3c\xf5\xd4\x53\x25\xf3\
+\x7e\xe8\x43\x1f\xca\xf5\xcf\x5f\x0a\x0e\x85\x42\xbc\xf6\xda\x6b\
+\x6c\xde\xbc\x99\xb6\xb6\x36\x84\x10\x44\x22\x11\xa6\x4e\x9d\xca\
+\x31\xc7\x1c\x43\x73\x73\x33\xa9\x54\x8a\x74\x3a\x9d\x63\x6a\xc8\
+\x10\xdb\x64\x96\x20\x0e\x86\x2b\x58\x94\x01\xca\x9d\xdd\xe5\xa4\
+\x33\x45\xb6\xe7\x79\x4c\x99\x32\x85\x95\x2b\x57\x72\xd5\x55\x57\
+\xb1\x7a\xf5\x6a\x00\x22\x91\x08\x8b\x16\x2d\xe2\x96\x5b\x6e\xc9\
+\x9b\x19\x26\x13\x15\xda\x99\x23\x84\xa0\xbe\xbe\x9e\x9b\x6e\xba\
+\xa9\xac\x4e\x9f\x74\xd2\x49\x79\xb1\x7f\x21\x04\xa9\x54\x8a\x77\
+\xde\x79\xa7\xac\xbc\x00\x4d\x4d\x4d\x3c\xf1\xc4\x13\xdc\x7d\xf7\
+\xdd\xfd\x32\xb2\x8f\x23\x8f\x3c\x92\x8b\x2e\xba\x88\xaf\x7d\xed\
+\x6b\x0c\x1b\x36\x2c\x8f\x09\x4c\x89\x51\xab\xd9\x5f\xca\xfa\x37\
+\x99\xad\xa2\x40\x90\x89\x4a\x8c\x41\x53\x1c\xfa\xd7\x93\xc9\x24\
+\x47\x1e\x79\x24\xcf\x3c\xf3\x0c\xf1\x78\x9c\x78\x3c\xce\xfe\xfd\
+\xfb\xb9\xe9\xa6\x9b\x72\xc4\x0f\xb6\x27\x18\xbe\x35\xad\xf7\x87\
+\x1e\x7a\x88\xe7\x9f\x7f\xbe\x64\xbb\x17\x2c\x58\x40\x38\x1c\xce\
+\xb5\x0b\x32\x8c\xb4\x7e\xfd\xfa\xb2\xfa\x3d\x6b\xd6\x2c\x36\x6e\
+\xdc\xc8\xac\x59\xb3\x38\xfb\xec\xb3\x4b\x12\x1f\x60\xc3\x86\x0d\
+\xdc\x78\xe3\x8d\x8c\x1b\x37\x8e\xab\xae\xba\x0a\xc8\x48\xad\xe0\
+\xc2\x54\xf0\xbc\x1a\xdd\x5f\x0a\x45\x23\x81\x50\x3c\x10\x34\x50\
+\x0f\xc0\x9c\xcd\x90\xb1\xdc\x63\xb1\x18\x5d\x5d\x5d\xb9\xc3\x9f\
+\x1d\xa6\x7e\x35\x45\xae\x69\x70\xf9\xa2\x7f\xc7\x8e\x1d\x7c\xfa\
+\xd3\x9f\x2e\x6b\x00\x6e\xba\xe9\x26\x92\xc9\x64\xce\x67\xf7\xeb\
+\x28\xc7\x2b\x11\x42\xf0\xc7\x3f\xfe\x91\x63\x8f\x3d\xb6\xea\x15\
+\xcb\x5f\xfe\xf2\x97\x8c\x1f\x3f\x9e\xf5\xeb\xd7\x13\x0e\x87\xf3\
+\x6c\x88\x6a\x51\x8e\xbf\xdf\xdf\xbd\x01\x05\x82\xaa\x91\x02\xe6\
+\xec\x35\xad\x7b\x1f\xa6\x5e\x2c\x94\xd7\x1f\x28\xcb\xb2\x08\x85\
+\x42\xb4\xb5\xb5\x95\x1d\x05\xbc\xe8\xa2\x8b\x38\xe6\x98\x63\x72\
+\x2e\x97\xc9\x5c\xdb\xb7\x6f\x2f\x99\x5f\x6b\xcd\x67\x3f\xfb\xd9\
+\xb2\xea\x2a\x86\x58\x2c\xc6\xbc\x79\xf3\x58\xba\x74\x29\x75\x75\
+\x75\x7d\x24\x5a\xa9\xd9\x7f\x48\x03\x41\xd5\x10\x3d\x78\x6e\x12\
+\x14\xc8\x1b\x00\x5f\x27\x16\x12\xfd\x26\xf1\x1b\x1a\x1a\x58\xb6\
+\x6c\x19\x47\x1d\x75\x54\x59\x8b\x49\xc3\x87\x0f\xe7\xbe\xfb\xee\
+\xcb\x85\x78\x83\x36\x40\x2d\x97\x7b\xcb\xc5\xa5\x97\x5e\xca\xda\
+\xb5\x6b\x09\x85\x42\x05\x97\xaa\x0b\xa1\x18\x33\x0c\x5a\x1c\xa0\
+\x16\xc1\x9f\x60\x7a\x73\x06\x9a\xfa\xde\xf4\xe9\x7d\x26\x31\x3b\
+\xe5\x38\x0e\x4d\x4d\x4d\x7c\xf7\xbb\xdf\xe5\x9c\x73\xce\x29\xbb\
+\xde\x65\xcb\x96\xf5\x29\xdf\xc4\xfe\xfd\xfb\xcb\x2e\xab\x10\x66\
+\xce\x9c\xc9\xdc\xb9\x73\x39\xfa\xe8\xa3\x2b\xca\xb7\x70\xe1\x42\
+\xa0\x77\x7b\x7b\x70\x0b\xfc\x60\x07\x85\xaa\x52\x01\x03\x91\x02\
+\x85\xd2\x07\x03\x46\x85\x74\xbd\x3f\xeb\x37\x6c\xd8\xc0\xb4\x69\
+\xd3\xb8\xed\xb6\xdb\xca\x6e\xef\xe3\x8f\x3f\xce\xe4\xc9\x93\x49\
+\xa7\xd3\x40\xe1\x60\x52\x47\x47\x47\xd9\xe5\xf9\x18\x36\x6c\x18\
+\x77\xdf\x7d\x37\xf1\x78\x9c\xd5\xab\x57\xb3\x6c\xd9\x32\xd6\xac\
+\x59\x43\x77\x77\x37\x37\xdf\x7c\x73\x59\x65\x74\x75\x75\xf1\x1f\
+\xff\xf1\x1f\xb9\xfd\x86\x26\x2a\x51\x05\x95\xea\xfe\xb2\x36\x84\
+\x54\x2b\x05\x2a\x3d\x37\xaf\x05\x37\x66\xf8\x33\xa3\xb1\xb1\x91\
+\x1b\x6e\xb8\x81\x13\x4f\x3c\x91\xad\x5b\xb7\x16\x6b\x76\x1e\x1e\
+\x7f\xfc\x71\x4e\x3f\xfd\x74\x92\xc9\x64\x9e\xb4\x19\xe8\x6e\xdc\
+\x33\xce\x38\x83\x77\xdf\x7d\x97\x4b\x2f\xbd\x94\x78\x3c\x4e\x77\
+\x77\x77\xce\xa0\x4d\xa7\xd3\x5c\x79\xe5\x95\xbc\xf3\xce\x3b\x0c\
+\x1d\x3a\xb4\x64\x59\x77\xdc\x71\x07\xc9\x64\xb2\x8f\xa1\x5b\x0c\
+\x03\x89\x09\xf4\xeb\x06\x9a\x7a\xb1\x14\x2a\x15\xfd\xa5\xf2\x9b\
+\x06\x50\xd0\xd0\x4b\x26\x93\xcc\x9b\x37\xaf\xec\x59\x05\xd0\xda\
+\xda\xca\xba\x75\xeb\xf8\xc8\x47\x3e\x42\x22\x91\xc8\x33\x2e\xcd\
+\x99\xef\xf7\xb9\xa9\xa9\xa9\xec\xb2\x27\x4f\x9e\xcc\xd2\xa5\x4b\
+\x73\x81\x1d\xbf\x0c\xdf\xb3\x50\x4a\x11\x8d\x46\x69\x69\x69\xe1\
+\xd9\x67\x9f\x2d\xab\xcc\x7b\xee\xb9\x87\x50\x28\x94\x37\x0e\x26\
+\xaa\x25\x78\x29\x29\x92\xc7\x00\x41\x37\xcd\xbf\x36\x18\x52\x20\
+\x78\x2d\xb8\x4b\xd8\xb2\x2c\x22\x91\x08\x6f\xbd\xf5\x16\xd3\xa6\
+\x4d\xe3\xa5\x97\x5e\x2a\x58\x6f\xff\x05\xe2\x6e\x00\x00\x0c\xbd\
+\x49\x44\x41\x54\x21\x2c\x5c\xb8\x90\x8d\x1b\x37\x32\x61\xc2\x84\
+\x9c\xcb\x17\xb4\x25\x82\x28\x67\x0d\xc1\xc7\xaf\x7e\xf5\x2b\x94\
+\x52\x79\xcb\xc0\x26\x7c\x46\x48\xa5\x52\x1c\x75\xd4\x51\x5c\x7c\
+\xf1\xc5\x25\xcb\x5c\xba\x74\x69\x2e\x36\x30\x10\x2f\xa0\x26\x6e\
+\x60\xb9\x84\xae\x85\xe8\x07\xf2\x3c\x00\x53\xdf\x3f\xf0\xc0\x03\
+\xcc\x9d\x3b\xb7\xac\xcd\x19\x3e\xee\xbc\xf3\x4e\xfe\xf4\xa7\x3f\
+\xe5\xf6\x0e\x98\x86\xa4\xff\xdb\x34\x32\x7d\xaf\xa3\xb9\xb9\xb9\
+\xac\xf2\x5b\x5b\x5b\x39\xfd\xf4\xd3\x73\x8b\x46\xfd\xb9\xb5\xbe\
+\x8e\x4d\x26\x93\x5c\x7e\xf9\xe5\x25\xcb\x5d\xb9\x72\x25\x8e\xe3\
+\xe4\x5d\x0b\xda\x46\x50\x3d\x33\xf4\x97\xae\xdf\x50\xb0\xa9\x93\
+\xcd\xdf\xc5\xd2\x55\x7a\x6e\x1a\x7a\xd0\x1b\x1d\x1b\x3a\x74\x28\
+\x57\x5f\x7d\x35\x77\xdc\x71\x47\x7f\xcd\xeb\x83\x49\x93\x26\xb1\
+\x74\xe9\x52\xa6\x4c\x99\x42\x57\x57\x57\x9e\xae\xf7\x89\x6c\xae\
+\xd4\x05\x07\x6a\xc2\x84\x09\x65\xd5\xf3\xe1\x0f\x7f\x98\x64\x32\
+\x59\xd0\x75\x0d\x5a\xee\x5a\x67\x1e\x0f\x3b\xe1\x84\x13\x4a\x96\
+\xab\xb5\xa6\xbd\xbd\x3d\x17\xa5\x2c\x07\xb5\x70\x09\x6b\xee\x05\
+\x54\x82\x20\xf1\xfd\xc8\xde\xc2\x85\x0b\x2b\x22\xfe\xe7\x3e\xf7\
+\x39\xde\x78\xe3\x0d\x26\x4e\x9c\x48\x3c\x1e\xcf\x9b\x85\xa6\x9e\
+\x37\xf5\x7f\x70\x6f\xc1\x11\x47\x1c\x51\x56\x5d\x53\xa7\x4e\xcd\
+\x73\x59\x83\xe5\x43\xbe\x2a\x55\x4a\xd1\xd8\xd8\x98\xdb\xf7\x57\
+\x0c\xdd\xdd\xdd\x79\x51\xc1\xc1\x14\xfd\x05\x57\x03\x8b\x59\xe6\
+\xc5\x66\x72\xa5\x52\xc0\x6f\x80\x69\xec\xd9\xb6\x4d\x3c\x1e\xe7\
+\xac\xb3\xce\x2a\x3b\x2e\x0f\xf0\xd0\x43\x0f\x71\xee\xb9\xe7\x12\
+\x8d\x46\xf3\x16\x53\x82\x9d\x0e\xfe\xf6\xdb\xe3\xeb\xf0\x59\xb3\
+\x66\x95\x55\xdf\xbb\xef\xbe\x9b\x47\x68\x73\x37\x90\x09\x93\xe1\
+\xaa\xd9\xe5\x5b\xca\x08\x1c\x88\xe8\xef\xd7\x0b\x28\x54\xb1\x89\
+\x5a\x19\x81\xa6\xbb\x23\x44\x66\x1b\xf6\xde\xbd\x7b\x39\xfe\xf8\
+\xe3\xcb\x26\xfe\xd4\xa9\x53\xd9\xbc\x79\x33\x0b\x16\x2c\xa0\xbb\
+\xbb\x3b\x27\xf2\x4d\xd1\x5f\x08\x66\xc8\xd5\x4c\xa3\xb5\x2e\x4b\
+\x54\x6f\xd9\xb2\x25\x4f\x8a\x04\xd5\x62\xb0\x9f\x90\xb1\x03\x4a\
+\x6d\x34\x81\xcc\x0a\x63\xa1\x05\xb9\x5a\xc6\x03\x8a\x7a\x01\x66\
+\x07\x06\xcb\xf2\x87\xfc\xc7\xc2\x22\x91\x08\x9b\x36\x6d\x62\xc6\
+\x8c\x19\xec\xde\xbd\xbb\x60\x3d\x41\x7c\xfa\xd3\x9f\x66\xc3\x86\
+\x0d\x0c\x1d\x3a\x94\x54\x2a\x95\xa7\x8b\xfd\xf2\xfd\xd9\x6d\xda\
+\x1b\xc1\x90\xb2\x29\xaa\xd3\xe9\x74\x59\x5b\xca\x56\xae\x5c\xd9\
+\x67\x33\x69\xb0\x6f\xd0\xab\xde\x2c\xcb\xe2\x1f\xff\xf8\x47\xc9\
+\x72\x43\xa1\x10\x23\x47\x8e\x2c\xb8\x10\x56\x4b\x23\xb0\x6c\x2f\
+\x20\x78\x5e\x0b\xcb\xbf\xd0\x03\x18\xff\xf8\xc7\x3f\x98\x33\x67\
+\x4e\xd9\x0f\x87\xdc\x7c\xf3\xcd\xdc\x7f\xff\xfd\x39\x43\xcf\x27\
+\xb0\x29\x51\x82\x87\x7f\xdd\x64\x0a\xf3\xd0\x5a\x93\x4e\xa7\xf9\
+\xcc\x67\x3e\x53\x56\x1b\x7e\xfb\xdb\xdf\x12\x0a\x85\x72\x65\x9a\
+\x12\xc5\x7c\xe8\x53\x88\xcc\xf3\x0f\xf7\xdf\x7f\x7f\xc9\x32\x4f\
+\x3d\xf5\xd4\x9c\xd7\x52\x2e\x2a\x61\x86\xfe\xd0\x27\x0e\x60\xfe\
+\xae\x76\xe6\x17\xad\xd0\x18\xa8\x7d\xfb\xf6\x71\xc6\x19\x67\x94\
+\xdd\xd8\x07\x1f\x7c\x90\x6b\xae\xb9\x86\x68\x34\x9a\xdb\x82\xe5\
+\x2f\xa2\xf8\xbb\x73\xfc\xc3\xb7\x2b\xcc\x73\x20\x2f\xbd\xb9\x8f\
+\x4f\x29\xc5\xe4\xc9\x93\x99\x39\x73\x66\xc9\x76\x5c\x73\xcd\x35\
+\x79\xf6\x86\x59\xb6\xf9\xdf\xef\x63\x39\x1b\x4d\x3f\xfe\xf1\x8f\
+\x93\x4e\xa7\x0b\x1a\xae\x3e\xaa\x0d\xf8\xf4\x67\x04\x42\xf0\x83\
+\x11\x55\x1a\x81\x41\xf4\x97\xd6\x7f\x61\x83\x94\x92\x86\x86\x06\
+\xce\x3f\xff\xfc\x92\x03\xe3\xe3\x27\x3f\xf9\x09\xa7\x9c\x72\x0a\
+\x5b\xb6\x6c\x29\xe8\xcb\xe7\x19\x36\x81\x36\x29\xa5\x18\x36\x6c\
+\x58\x6e\x6b\x96\xef\xc6\x05\x07\x2c\x91\x48\xf0\xbd\xef\x7d\xaf\
+\xe4\xde\x82\x9e\x9e\x1e\xce\x3e\xfb\x6c\x56\xac\x58\x41\x57\x57\
+\x57\x9e\x74\x34\xf7\x18\xda\xb6\xcd\xc7\x3e\xf6\xb1\xb2\xfa\x77\
+\xd9\x65\x97\xe5\x36\x9a\x16\x32\x2c\x07\xcb\x08\xec\xe3\x9b\x04\
+\x0d\x18\x13\xd5\xc6\x03\x4c\x11\xe9\x0f\xcc\xca\x95\x2b\x79\xe1\
+\x85\x17\xfa\x1f\x91\x00\xbe\xfd\xed\x6f\xf3\xed\x6f\x7f\xbb\xec\
+\xf4\x85\x30\x61\xc2\x04\xae\xbe\xfa\x6a\xbe\xf2\x95\xaf\xd0\xd5\
+\xd5\xd5\x47\x65\xa4\xd3\x69\x2e\xb8\xe0\x02\x8e\x3b\xee\x38\xd6\
+\xac\x59\x53\xb4\xac\x17\x5e\x78\x81\x19\x33\x66\xf0\xc8\x23\x8f\
+\x30\x79\xf2\xe4\xdc\xee\x65\xff\xc1\x97\x4d\x9b\x36\xf1\xf1\x8f\
+\x7f\x9c\x8d\x1b\x37\x96\x6c\xd7\x77\xbe\xf3\x1d\x6c\xdb\xce\xb3\
+\x67\x4c\x06\xad\xa5\x11\x08\xf9\x92\xbe\x0f\x03\x98\x05\x0d\x96\
+\xfb\x17\x0a\x85\x2a\xf2\xf3\x6b\x85\xed\xdb\xb7\xf3\xad\x6f\x7d\
+\x8b\x4d\x9b\x36\xb1\x78\xf1\x62\xe2\xf1\x78\xde\x6c\xb0\x2c\x8b\
+\xee\xee\x6e\x96\x2c\x59\x52\xd6\x26\x93\x37\xdf\x7c\x93\xe9\xd3\
+\xa7\x73\xf2\xc9\x27\x33\x6f\xde\x3c\x26\x4c\x98\xc0\xf6\xed\xdb\
+\x79\xfe\xf9\xe7\xcb\x66\xee\x89\x13\x27\x72\xdd\x75\xd7\xd1\xdd\
+\xdd\x0d\xe4\x07\x91\xcc\x73\x1f\xb5\x94\x04\x40\xfe\x1b\xd8\xdb\
+\xda\xda\xcc\xc7\xb4\xe7\x69\xad\x9f\xf3\x89\x67\xba\x3c\x41\xf7\
+\xa7\x9c\x73\x53\x2f\x36\x37\x37\x33\x65\xca\x14\xf6\xec\xd9\x53\
+\x64\x68\x06\x17\x3b\x77\xee\xec\x13\x77\xf7\xdb\x19\x89\x44\x78\
+\xf0\xc1\x07\x59\xb4\x68\xd1\xa0\xb7\x63\xdd\xba\x75\x8c\x1e\x3d\
+\x9a\x54\x2a\x95\x33\x48\x4d\x3b\xa0\x12\xe2\x17\x23\x78\xf6\xfc\
+\xb3\x90\xf9\x6a\x98\xe3\x38\xdc\x74\xd3\x4d\xd5\xbd\x22\xa6\x1a\
+\xf7\xcf\x74\x43\xfc\x8e\x1e\x4a\xbc\xf2\xca\x2b\x79\x52\xcc\x9c\
+\x79\xc9\x64\x92\x4b\x2e\xb9\xa4\xec\x5d\xc6\xd5\xe2\x99\x67\x9e\
+\x61\xdc\xb8\x71\x79\xfb\x14\xaa\x75\xff\xca\x20\x7e\x5e\xdd\x39\
+\xb7\x38\x78\xb1\x5c\xc2\x56\xeb\x0e\xfa\xf1\xf1\xf3\xce\x3b\xaf\
+\xac\x41\x1a\x2c\x1c\x7b\xec\xb1\x79\x6e\xa0\xb9\x98\xe3\xba\x2e\
+\xdd\xdd\xdd\x5c\x79\xe5\x95\xdc\x73\xcf\x3d\x35\xaf\x7b\xec\xd8\
+\xb1\xac\x5b\xb7\x8e\x99\x33\x67\xe6\x96\x93\x83\xdb\xe1\xaa\x25\
+\x7e\x10\x85\xd2\xe6\x19\xcc\xc1\x0c\x83\x11\x08\x32\x89\xef\xcf\
+\xb0\x1b\x6f\xbc\x91\x96\x96\x96\xfe\x47\x69\x10\x71\xe9\xa5\x97\
+\x32\x64\xc8\x90\xbc\xc1\x31\x63\x06\x90\x19\xa8\x68\x34\xca\x27\
+\x3f\xf9\x49\xd6\xad\x5b\x57\x56\x94\xb0\x1c\x7c\xf3\x9b\xdf\xe4\
+\x8d\x37\xde\xa0\xb5\xb5\x35\x27\xf6\xa1\x77\x46\x0e\x94\xf8\xe5\
+\x48\x02\xf3\xda\x41\x0b\x04\x99\x03\xec\x2f\xd6\xbc\xfa\xea\xab\
+\x7c\xfe\xf3\x9f\xef\xb3\x0c\x3a\x58\xb0\x6d\x9b\xaf\x7e\xf5\xab\
+\xdc\x75\xd7\x5d\xb9\xed\xe7\x26\x83\x06\x5d\x4a\xdf\x35\x1c\x3d\
+\x7a\x34\x2b\x56\xac\xe0\x2f\x7f\xf9\x0b\x0b\x16\x2c\xa8\xb8\xde\
+\xc6\xc6\x46\xae\xbd\xf6\x5a\xb6\x6c\xd9\xc2\xf5\xd7\x5f\x4f\x3c\
+\x1e\x27\x9d\x4e\x1f\x12\xe2\x07\x91\x77\x65\xc7\x8e\x1d\xfd\x1a\
+\x81\x7e\x43\x07\x62\x08\x9a\x51\x32\xc8\x58\xdd\xe1\x70\x98\x48\
+\x24\xc2\xd6\xad\x5b\x2b\x8a\x64\x15\x0a\xc3\x16\x82\x29\x7d\xa6\
+\x4e\x9d\x4a\x32\x99\xec\xb3\x49\x24\x68\x08\x06\xfb\x68\xba\xaf\
+\xfe\x0e\xa5\xe5\xcb\x97\xb3\x7c\xf9\x72\xde\x7e\xfb\x6d\xda\xdb\
+\xdb\x69\x6b\x6b\x23\x91\x48\xd0\xd2\xd2\xc2\x90\x21\x43\x38\xfc\
+\xf0\xc3\x99\x31\x63\x06\xf3\xe7\xcf\x67\xc6\x8c\x19\xa4\x52\xa9\
+\x1c\xd3\x99\xeb\x15\x85\xda\x50\xc8\x5d\xab\x11\x33\xe4\x8c\x40\
+\xdb\xb6\xf9\xf1\x8f\x7f\x5c\xd9\xa3\x61\x03\x71\x01\xfb\x3b\x4f\
+\x24\x12\xc4\xe3\x71\x86\x0f\x1f\xde\xa7\xd3\xa5\x50\x49\x5a\xad\
+\x35\x07\x0e\x1c\xe8\x63\x69\x07\x37\x70\x40\xef\x7b\x08\xa4\x94\
+\x39\xdf\xde\xf7\xf3\x53\xa9\x14\x52\x4a\x4e\x3b\xed\x34\xe6\xcf\
+\x9f\x9f\xb7\xb6\xe0\xc3\x97\x26\xbe\x3d\x51\x68\x7f\x82\xd9\xae\
+\x62\x3e\x7f\xa1\x6b\x03\x95\x04\x26\x02\x5f\x0f\xef\x35\x02\xcb\
+\x21\x64\xb9\x44\xf6\xcb\x0b\xde\x37\x03\x45\xe9\x74\x3a\x6f\xe6\
+\x99\xe8\x6f\x83\xa4\x99\xae\xdc\x4d\x94\x41\x6f\xa4\x18\x13\x99\
+\xed\x33\x67\xaa\x7f\xcf\x5c\xbf\x30\xeb\x0f\xda\x3d\xc1\xba\xcc\
+\x77\x0a\x94\x12\xd3\x83\xad\x06\x8a\x05\x82\xc4\x40\xc2\xbe\xe6\
+\xb9\x39\x98\x41\xa6\x30\x8d\xae\x42\xd7\xfd\x7b\x3e\xfa\x13\xfd\
+\x41\xce\x2e\xd4\xd6\x20\x31\x4a\x49\x10\xd3\x28\x84\x5e\xc9\x60\
+\x32\x46\xa1\xfa\x7d\xc9\x12\xb4\x9d\x4c\xb1\x1f\x9c\xf5\xe6\x58\
+\x15\xbb\x56\x6b\x1b\xa0\xd8\x96\xb0\x0d\xb5\x9a\xf9\x85\xf2\x9b\
+\x9d\x0c\xce\x7c\x5f\xec\x16\x5a\x6f\x0f\xae\xe1\x17\x93\x0e\xfd\
+\x79\x2f\xc1\x72\x2a\x45\x39\x4c\xe8\x13\x3c\x28\x35\xfc\x7b\x66\
+\x9e\x52\xb3\xbe\xd0\xb5\x2a\x89\xdf\xe7\x53\xb0\xc5\x6c\x80\x3d\
+\x42\x88\x2e\xa5\x54\x73\x31\x26\xf0\x07\xa4\xd0\xb9\x5f\x79\x31\
+\x95\x60\x0e\x4c\x50\x8c\x42\xbe\x3e\x86\xbe\x84\x33\x77\xe4\x16\
+\xda\x9c\x31\x18\x28\xc5\x5c\x3e\xf1\xcd\x34\x85\x16\x9f\x0a\xb5\
+\xb1\x3f\x9d\x5d\xa3\x99\xff\xf7\x60\x5b\xf3\x46\xac\xc0\x6c\x7a\
+\xb0\x98\x9b\x67\xea\xd2\x42\xe7\xc1\xf4\xc5\xd2\xf8\xd7\x82\x65\
+\x05\xef\x05\xaf\x17\x4a\x63\x96\x53\x2b\x04\xcb\x2e\xa7\x1d\xc1\
+\xeb\x66\x39\x41\x15\x64\x5e\x37\xaf\xf5\x97\x37\x98\x26\xf8\xbb\
+\xc0\xf9\x5a\x60\x3f\xe4\x7f\x63\xc1\x9e\x32\x65\x0a\xb3\x67\xcf\
+\x26\x99\x4c\xb2\x75\xeb\x56\x1c\xc7\xc9\xed\xce\x75\x1c\xe7\x36\
+\xdb\xb6\x17\x95\x2b\xf2\xab\x51\x09\xc1\x6b\x7e\xc3\xcc\xeb\x85\
+\xee\x05\xef\x9b\x69\xcc\x01\xa8\x15\x4a\x49\x93\x20\x43\xf7\x77\
+\xbf\xbf\x36\x56\x23\xf2\xcd\x7c\xa5\x18\x03\xb8\xcd\xdc\x96\xa6\
+\xb5\x66\xfa\xf4\xe9\x88\x3f\xfc\xe1\x0f\x79\x62\xb4\xb9\xb9\x99\
+\x48\x24\x92\xdb\x44\xd1\xda\xda\xfa\x9f\x5a\xeb\x2f\xfb\x99\xaa\
+\xf1\xfd\x4d\x14\xd3\xeb\xe5\x5e\x0f\xde\x2f\x96\x66\x30\x51\x8a\
+\xe8\x66\x9a\xfe\x98\xa2\x1c\x86\x18\x88\x27\x90\xc5\x2b\x9d\x9d\
+\x9d\x73\x7c\xb5\xe4\x79\x1e\xc9\x64\x92\x7d\xfb\xf6\x61\x07\x5f\
+\x78\x14\x8b\xc5\x70\x5d\x37\xf7\xb5\x8e\xf6\xf6\xf6\xaf\xb5\xb6\
+\xb6\xce\x57\x4a\x1d\x7e\x30\x66\x7e\x25\xb3\xbe\xd0\x8c\x30\x51\
+\x6b\xa6\x08\xd6\x51\x4c\x2a\x94\x22\x7c\xf0\xde\x60\x78\x02\x59\
+\x74\xee\xdb\xb7\x6f\xa1\xff\x78\x9c\xff\x72\xaa\x78\x3c\x4e\x32\
+\x99\xec\x35\x02\x7d\xc3\xc5\xdf\x94\xa0\x94\x12\x4a\x29\x5c\xd7\
+\x55\x9e\xe7\x9d\x34\x66\xcc\x98\xe7\xb4\xd6\xd3\x2b\x25\x7a\x7f\
+\xc6\x60\xf0\x5a\x30\xaf\x9f\xbf\xbf\x41\x29\xc7\xe0\xab\xb5\x1d\
+\x30\x98\x6a\xa0\xd6\x9e\x40\x36\x7a\xb9\x67\xe7\xce\x9d\x27\x25\
+\x93\xc9\xdd\xfe\xcb\x34\xd3\xe9\x74\xee\x80\x80\x17\x20\x84\x90\
+\x4a\x29\xcb\x75\x5d\x2b\x95\x4a\x59\x5a\x6b\x4b\x6b\x6d\xb5\xb7\
+\xb7\x8b\x5d\xbb\x76\x9d\x7e\xd8\x61\x87\xfd\x70\xd8\xb0\x61\x97\
+\xfb\xcc\x62\x86\x77\x2b\xf5\x00\x8a\x5d\x0b\x0e\x58\x29\xa9\x10\
+\x4c\x13\x4c\x3b\x58\x28\x47\x22\x14\x63\x8a\xc1\x92\x04\x42\x08\
+\xe2\xf1\xf8\xd2\xb7\xdf\x7e\xfb\xab\xd1\x68\xb4\x33\x14\x0a\x35\
+\x58\x96\xe5\x29\xa5\x3c\x21\x84\xe7\xba\xae\xca\x19\x98\x4b\x96\
+\x2c\x81\xcc\x9a\x80\x03\x44\x80\x3a\xad\x75\x1d\x10\x11\x42\x84\
+\x81\x30\x10\xd2\x5a\x3b\x4a\x29\xd1\xd4\xd4\x34\xb1\xa5\xa5\xe5\
+\x13\x23\x46\x8c\x38\xde\x71\x9c\xb1\x22\x83\xa2\x03\x51\x68\x60\
+\xfa\x23\x4e\x31\xa2\x55\x42\xd0\xc1\x20\x7e\x25\xb1\x83\x62\x69\
+\xfb\xbb\x57\xe8\x7a\xf0\x5a\xb1\xf3\x74\x3a\xbd\x63\xff\xfe\xfd\
+\x6b\xf6\xed\xdb\xf7\x70\x47\x47\xc7\xeb\x52\x4a\x25\x84\x48\x69\
+\xad\x93\x40\x02\x88\x67\x8f\x84\x10\x22\x0d\x68\x5f\x02\x38\x40\
+\x23\x30\x02\x68\x11\x42\x8c\x00\x9a\xb2\x47\x3d\x59\x66\xb0\x2c\
+\x2b\x14\x8d\x46\xc3\x3d\x3d\x3d\xdb\x37\x6d\xda\xb4\x0b\x10\xa1\
+\x50\xa8\xde\xb6\xed\x3a\xad\x75\x08\x08\x09\x21\x1c\xa5\x94\x8d\
+\xb1\xd0\x94\x95\x18\x16\x19\x89\x13\xce\xfe\x97\x94\xff\x68\x9a\
+\x04\xfc\xfc\x56\xf6\xd0\x15\xe4\x1f\x6c\x28\x32\xfd\xf5\xb2\x87\
+\x9b\xfd\x5f\xae\x0e\xd2\xd9\xb4\x1e\x90\x06\x52\x42\x08\x17\xd0\
+\x06\x81\xb5\x10\x42\x65\xcb\x4e\xf9\x87\x10\x42\x2b\xa5\x52\xf1\
+\x78\xbc\x43\x08\x91\x14\x42\x24\x84\x10\x13\x2d\xcb\x1a\x4d\x86\
+\xe8\x31\x21\x44\x37\xd0\x0d\xec\x03\xf6\x64\xff\xf7\x00\x29\x9f\
+\x10\x21\x60\x08\x30\x1e\x98\x02\x8c\x05\x46\x92\x61\x80\x46\x32\
+\x92\xc1\x27\x70\x38\x2b\x19\x6c\xc0\x72\x5d\x57\xb8\xae\x2b\xb3\
+\xe7\x0e\xbd\xc4\x0d\x4e\x41\x9f\xe0\x3e\x01\x85\x71\x94\x03\xbf\
+\x4c\xb3\xec\xc1\x95\xf1\xe5\x43\x1b\xff\x95\xf1\xbf\x92\xfc\x9a\
+\x5e\xa6\xf1\xff\x07\x45\x82\xc9\x24\x26\x93\x29\xdb\xb6\xd3\x64\
+\x98\x22\x69\xfc\x4f\x90\x21\x74\x37\x99\x28\x60\x1b\x99\x09\xe8\
+\x33\x91\xeb\xcf\x54\x8b\x0c\x91\x9b\xc8\x48\x81\x56\xa0\x85\x0c\
+\x53\xd4\x03\x75\x64\x18\xc0\xc9\xfe\x0f\x91\x25\x68\x56\xfe\x9b\
+\x84\x35\x89\x1b\x44\x90\x88\x95\x12\xd0\xcc\xf3\x5e\x21\xbe\x0f\
+\x93\x09\x2a\x8d\x33\x6b\xe3\x50\x14\x2e\xc3\xbc\xef\x4b\x19\x93\
+\xd9\x14\x59\xe9\x91\xfd\x9f\x24\x23\xee\x63\xc0\x01\x32\x74\x49\
+\x92\x91\x00\x91\xec\xb9\xb0\xe9\xe5\xbc\x04\xbd\x62\x22\x9c\xbd\
+\x16\x25\x20\x01\xb2\xf7\x72\x12\x80\x7c\xf1\xec\x18\xd7\x4c\x98\
+\x4c\xe2\xff\xaf\x94\x01\xfe\x59\x24\x40\x31\x22\x16\xcb\x3f\x10\
+\x09\xa0\xe9\x9d\xd5\x49\xe3\x88\x93\x2f\x01\xf6\x65\x7f\x27\xb2\
+\x79\xb5\x9d\x2d\x20\x45\x86\x4b\xde\xcd\x66\x6c\x27\x60\x03\x90\
+\x35\x06\xb3\xbf\x7d\x89\xe0\x13\xd3\xa1\x97\x31\x1c\xfa\xaa\x00\
+\x5f\x45\xf8\x4c\xe4\xab\x09\x28\x8f\x88\x66\x3d\x41\x15\xf3\x5e\
+\x60\x02\x73\x06\xfb\xb3\x33\x4d\x61\x22\x16\xca\x4b\x36\xad\xa9\
+\xdf\xfd\x19\x6e\xa6\xf3\x67\xb9\x4f\x60\xbf\x0e\x3f\xaf\x4f\xf4\
+\x04\xbd\x46\x5f\x8c\x0c\xd1\x4d\x1b\xe0\x40\xb6\x0e\xe5\x1b\x81\
+\x69\x32\x9c\xe2\x02\x5d\x64\x74\x85\x4f\x74\x9f\xf0\x0e\xbd\x9e\
+\x82\x4f\x68\x5f\xe4\xfb\xd7\xfd\x7b\x26\x81\x34\xbd\xd2\xc1\x4f\
+\x13\xa2\xb0\x9d\x50\x08\xbe\x8a\x32\xdb\x62\x1a\x99\xef\x25\x06\
+\xe8\x8f\x40\xe5\xe4\xf7\x27\xa2\x4f\x3c\x7f\x96\x8b\x40\x9a\x64\
+\x20\x8d\xc9\x00\x7e\x7e\xd3\x0e\x48\x1a\x79\x72\x5e\x40\x36\x6f\
+\x2e\x0e\xa0\xe9\xe5\xba\x38\xf9\xfa\xdc\x3f\xfc\x59\x1c\x14\xf5\
+\x82\xc2\xb3\x3b\x28\x01\xfa\x93\x12\xa5\x08\x68\x32\x80\xcf\x40\
+\xa6\x04\x39\xb4\xfb\xcb\x33\x10\x14\x27\x50\x31\x94\xcb\x3c\x7e\
+\x1a\x53\x4a\x98\x2a\xc0\xf7\x40\x4c\xf5\xe0\x1a\xd7\xcd\x23\x57\
+\x6e\x70\x39\xd8\x34\x26\xcc\x19\x66\x1e\xa6\x2e\x86\x7c\xfd\x6e\
+\x05\xee\x99\x03\x14\xb4\x13\x2a\xb1\xfe\x7d\x06\xf2\x99\xcc\x32\
+\xca\x7d\xaf\xa0\x14\x81\xca\xc9\x1f\x24\x60\x21\x1b\xc0\x24\xb6\
+\x59\xb6\xc9\x48\xa6\x0d\x62\xde\xef\x03\xdb\x8f\xea\xf5\xd3\xa0\
+\x7e\x33\x66\x21\x02\xbf\x8b\x89\xe5\x42\xcc\x53\x0e\x4c\xc6\x2b\
+\xe5\x65\x1c\x6a\x14\x23\x50\x25\xf9\xfb\xcb\xd7\x9f\xa7\x51\xb5\
+\x14\xb4\xd7\xae\x5d\xcb\xac\x59\xb3\xaa\xdd\x21\x33\x90\x46\x54\
+\x43\xc0\xf7\xb2\x1b\x08\x03\x77\x05\x0f\x3a\xfe\x1f\x38\x7e\x62\
+\x00\xf2\x27\xa7\xc2\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
+\x82\
+\x00\x00\x04\xa3\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xd6\xd8\xd4\x4f\x58\x32\
+\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
+\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
+\x79\x71\xc9\x65\x3c\x00\x00\x04\x35\x49\x44\x41\x54\x58\xc3\xe5\
+\x97\xcd\x8f\x54\x45\x14\xc5\x7f\xb7\xea\xd6\x7b\xaf\xdb\x6e\xc7\
+\xf9\x40\x9d\x89\x46\x4d\x34\x99\x44\x8d\x1a\x48\x98\xc4\x8c\x1f\
+\x1b\xfe\x02\x4c\x5c\xf1\x07\x18\x16\x2e\x4d\x5c\x6b\x58\xc3\x8e\
+\xc4\x8d\x1b\x17\xce\x82\x68\x74\x41\x5c\x18\x0d\xe2\xc4\xc6\x00\
+\x3d\x60\x50\x51\x19\x60\x02\xa2\x0e\x0c\x83\xd3\xfd\x5e\xf7\x94\
+\x8b\xaa\xee\xf9\x60\xe6\x0d\x84\x51\x16\x56\x52\xa9\xce\x7b\xb7\
+\xeb\x9e\x3a\xf7\xd4\xa9\x7a\xea\xbd\xe7\x7e\x36\xe5\x3e\xb7\x3e\
+\x80\x5d\xbb\x76\xbd\x03\xec\xfd\x8f\xf2\x4e\x35\x1a\x8d\x03\xeb\
+\x19\xd8\xbb\xef\xbd\xa3\x3b\x1f\x1f\x76\x00\x9c\x3c\x3a\xcf\xcc\
+\x97\x37\x58\x9c\xef\xdc\x53\xa6\xda\xa0\xf2\xdc\x6b\x03\xbc\xb8\
+\x67\x10\x80\x8b\x7f\x16\x7c\xf8\xee\x1e\x80\xdb\x00\x70\xfc\xec\
+\x1c\xdf\x3f\x30\x04\x78\x2e\xfd\xb8\xc0\xfe\xb7\xce\x6f\xcb\x72\
+\x0f\x1d\x79\x9a\x0b\x23\x96\xd3\x9f\x1f\x64\xfc\xd5\x7d\x9b\x6b\
+\x40\x45\xb0\x16\x40\x78\x70\x2c\x23\xcb\xb2\x6d\x01\x30\x30\x96\
+\x61\x8d\x50\x1b\x7c\x14\x23\x25\x22\x14\x2b\xd8\x18\x91\xd5\x95\
+\x73\xe7\xce\x83\x2a\xb8\x04\xd2\x14\xb2\x0c\xd2\x2c\x8c\x49\x0a\
+\x49\x12\xde\x77\x3a\x90\xe7\x90\xb7\xa1\xd5\x82\x76\x2b\x8e\x6d\
+\x28\x72\xb2\xfa\x38\xd6\x0a\xe3\xaf\xbc\x49\x6b\xf1\xfa\xe6\x00\
+\xac\x15\xac\x15\x04\xb0\x46\xd8\xbd\x7b\xe7\x16\x6b\xeb\x86\xae\
+\x80\x5a\xa8\x56\x81\xea\x6d\x51\x8d\xaf\x04\xb5\x82\xf7\xa0\xa6\
+\x84\x01\x67\x05\x35\x82\x08\xa8\x0a\x95\x2c\xc3\x23\x20\x1e\x08\
+\xc0\xf0\x1e\x2f\x02\xde\x23\x12\x26\x15\x7c\x88\x23\xc4\x21\x1e\
+\x3c\x21\x5e\x40\x4d\x58\x18\x40\xd7\x4a\x89\x06\xac\xa0\xda\x63\
+\x00\x9a\x33\xbf\x05\x8a\x53\x07\x69\x02\x95\x04\xb2\x34\xf6\x04\
+\x12\x07\x4e\xa1\xe8\x40\x5e\x40\x2b\x8f\xbd\x05\x4b\x39\xb4\x73\
+\xc8\x0b\x54\x87\x71\x3d\x00\x2a\xe5\x25\x70\x31\x40\xd5\x30\x39\
+\xf9\xd2\xd6\x0a\xf3\x3e\xd0\xaf\x16\xaa\x1b\x8b\xf6\xd8\x27\x61\
+\x61\xbd\x1c\x25\x25\x20\x00\xf0\x81\x8d\x34\x4d\xa3\x3a\xc3\xb3\
+\x98\x11\x89\x6c\x07\xda\x63\x09\x56\x98\x5f\x29\x46\xfc\x61\xcd\
+\x72\x7f\x61\x1d\x2d\xd1\x80\x3a\x09\x54\x49\x18\x4f\x34\x2f\xe0\
+\x9d\x85\xc4\x21\x89\xc3\x67\x09\x92\x69\xd8\x11\x89\xe2\x13\x87\
+\x58\x8b\xef\x76\x91\xbc\x80\xbc\x03\xed\x02\xdf\x6a\x23\xed\x02\
+\xf2\x02\x9f\x77\x50\x1d\x45\xd5\x20\x78\x3a\xeb\x54\x78\x9b\x06\
+\x9c\x33\x78\x0f\x03\x8f\x24\xbc\xfe\xf2\xf3\x77\x68\xe8\x36\x68\
+\xa4\xbe\xf1\xeb\xc6\xfc\xdf\xb1\x04\x52\x5e\x82\x44\x4d\x5f\x84\
+\x8f\x0d\xa5\x38\xe7\xb6\xc5\x88\x9e\x18\x4b\xb9\x76\xb3\x03\x08\
+\x9d\x52\x11\xaa\x90\xb8\x50\xef\x5a\xc5\x30\x7d\xb1\xcb\x40\xc5\
+\xb0\x0e\xf4\x26\xad\x57\xf9\x55\x2e\xe1\xe1\xc6\xd2\x32\xf5\xcc\
+\x70\x7d\xc9\x84\x2d\xe9\x4a\x19\x10\x9c\x1a\xc0\x73\xe5\x66\x97\
+\x2b\x37\xbb\xac\x51\x57\x3f\xd7\xaa\x64\x7e\xc5\x27\xa2\x29\xac\
+\x05\x15\xc3\x9c\x0b\xb5\x77\xa6\x6c\x17\xa8\xc1\xa9\x20\xc8\x1a\
+\x35\xaf\x9b\x35\x1a\x8f\x59\x31\x9e\xfe\x7b\xe9\xef\x14\x00\xf1\
+\x82\xef\x9b\x58\x30\x2b\x57\x56\x02\x55\x21\xd1\x90\xfc\xe7\x53\
+\xdf\xf2\xeb\x99\x13\x2c\x2d\xde\xb8\xa7\xfa\x57\x6a\x03\x3c\xf5\
+\xec\x4e\x9e\x79\x61\x02\x0f\xa8\x33\x5b\x31\x10\x03\x7c\x87\xf7\
+\xf7\xbf\xc1\xc2\xc2\x02\xb7\x6e\xdd\xa2\x28\x0a\x44\x04\x6b\x2d\
+\xd6\x5a\x54\x15\x55\xc5\x39\x87\xaa\x62\xad\xc5\x98\xf0\xdf\xe5\
+\xe5\x65\xf2\x3c\xef\xf7\x23\xcd\xf9\xb8\xf2\x2d\x18\x70\x56\x50\
+\x17\x18\xdc\x31\x3a\xb6\x72\x4f\x38\x7e\x9c\xe9\xe9\x69\x8c\x31\
+\x78\xef\x99\x98\x98\x60\x72\x72\xf2\x8e\x59\xd8\x31\x3a\xd6\xdf\
+\x86\xae\xd4\x09\x55\x70\x36\xac\xa2\x56\xaf\xf7\x6b\x39\x33\x33\
+\xc3\xd0\xd0\x10\xd6\x5a\xbc\xf7\x34\x9b\xcd\xbb\x02\x50\xab\xd7\
+\x70\xd1\x88\xb4\xd4\x88\x14\x9c\x0b\x27\x5c\xa0\x2a\x00\xa8\x56\
+\xab\x64\x59\xd6\xa7\xb8\x37\xde\x69\x73\x1a\xa9\x17\x41\x4b\xad\
+\x38\x1e\xc7\xbd\x23\xb4\xd7\x8c\x31\x88\x44\xdf\x8f\x3a\xb8\xab\
+\x9b\xaf\x35\xa8\x0d\xf3\xf6\x18\x2e\x3d\x8e\x83\x29\x6d\xe3\xd5\
+\xdb\x12\xa9\xf7\xe5\x56\x6c\xad\xf4\x91\x0e\x8e\x0c\xc3\xf2\xef\
+\xdb\x02\xe0\xa1\x91\x61\xd4\xc2\xb5\x2b\x97\x59\x9c\xbf\xbe\x05\
+\x03\x36\xf8\xc0\x60\xad\x02\x0b\xdb\xc3\xc0\x50\xad\xc2\xec\xc5\
+\x4b\x9c\xfd\xee\x1b\xce\x9f\x9c\x9e\x03\xa6\x36\x04\x60\x24\x5e\
+\x4a\x05\x12\x0b\xed\x91\x27\xa9\x3d\x0c\x6f\x1f\x38\xc8\x66\xc7\
+\x81\x27\x3a\xf1\x2a\xe7\x35\x1e\x32\x81\x14\x28\xba\x70\xf9\xea\
+\x55\xce\x34\x8e\xd1\xfc\xfa\x8b\xb9\xd9\x1f\x4e\x1d\x02\x0e\x6f\
+\x08\xe0\xb3\x8f\x3e\xe0\xa7\xd3\x27\x57\x99\xe9\xda\xa3\x86\x55\
+\xe6\xbb\x1e\x04\x1b\x3c\x5f\x1d\x6f\x7c\x77\xee\x8f\xd9\x5f\x0e\
+\x01\x87\x1b\x8d\xc6\x5f\x1b\x01\x98\x9a\xfe\xf4\xe3\x7f\xf5\x73\
+\x6c\x7d\xf2\x35\x00\xe2\xb7\xda\x81\xff\xdd\xd7\xf1\x3f\x4d\xf0\
+\x4b\xb9\xe8\x46\x89\xaf\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\
+\x60\x82\
+\x00\x00\x0b\x4d\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
+\x00\x00\x0b\x14\x49\x44\x41\x54\x68\x81\xd5\x9a\x7b\x8c\x5c\xf5\
+\x75\xc7\x3f\xe7\x77\xef\x9d\x99\x3b\x33\x3b\x3b\xbb\x3b\xf6\x3e\
+\xfc\x80\xc5\x31\xbb\x25\x21\x0e\xae\x4b\x1f\x51\x4a\x69\x15\x48\
+\x94\xa0\x84\x18\x29\x0f\x25\x90\x44\x0a\x8d\x94\x8a\xa8\x6a\x1a\
+\xa8\x54\x45\xa6\x0f\xa9\x55\x1b\xa4\x28\xad\xd4\x92\x50\xa5\x21\
+\x95\x88\x83\x49\x2c\x87\x42\x10\x35\x04\x1a\x28\x32\x98\x98\x60\
+\x63\xf0\xb2\x5e\xb3\xde\xe7\xec\x63\xde\x73\xe7\xbe\x7e\xfd\xe3\
+\xde\xd9\x1d\xdb\x60\x0c\x46\xcd\xf4\x48\x77\xe7\xde\x79\xdc\xf9\
+\x7e\xcf\xf9\x9e\xf3\x3b\xe7\x37\x2b\xfc\x1f\xd8\xf8\x4d\xfb\xae\
+\xd5\x81\xa7\x40\x4b\x18\x7a\x27\x4f\xec\xbf\xf9\x24\xa0\xe3\xe3\
+\xa2\x4c\x2e\x1e\xde\x99\x36\xbe\x7b\xdf\x8d\xa0\xaf\x45\x78\x9f\
+\x88\xf9\x01\xa5\x14\x96\x65\x01\x12\x21\xd6\xe0\xf9\x2e\xe8\x70\
+\x5a\x87\xfe\x93\x3a\xf0\x9e\x68\x14\x8f\xfe\x64\xfa\xbf\xff\xa6\
+\x08\x84\x6f\x99\xc0\xf6\x8f\xdc\x9b\x3f\xf1\xe0\xe7\xca\x5c\x84\
+\x37\xc6\x6e\xdc\x3b\x2a\xca\xd8\x83\xc8\xc7\x7a\xb2\xe9\xde\x74\
+\xba\x87\x44\x2a\x4d\x2a\x95\x21\xd4\x42\x28\x16\xa1\x86\x30\x84\
+\x20\xd0\xf8\x81\x8f\xef\xb6\x08\x7c\x07\xd7\xa9\xe0\xba\x4d\x02\
+\xaf\x79\x9f\xb3\xfa\xea\x5f\x4f\xfd\xd7\xed\xaf\x00\xc1\x85\xe2\
+\x91\xed\x1f\xf9\xfe\x2f\x6b\xf3\x87\x3e\x34\xf7\xdc\xb7\x97\x01\
+\xef\xad\x01\xff\xe1\xa8\x28\x73\x4f\x22\x91\xb8\x79\x60\x20\x4f\
+\x3e\x5f\x40\xcc\x14\x75\x27\xa0\xe9\x04\x34\x5d\x9f\x20\x0c\x09\
+\x43\x0d\x02\x4a\x40\x44\x30\x0d\x13\xa5\x14\x96\x69\x90\x48\x98\
+\x68\xdf\xc1\x69\x54\xa8\x54\x56\x70\x9b\xa5\xef\x54\x5e\x7b\xf2\
+\xce\xb9\x43\xff\x3c\x1f\x13\x79\x13\x02\x1f\xfd\x81\x46\xfb\xc7\
+\x8a\xc7\xee\xfb\x78\xe9\xe4\xc3\x53\x17\x42\x62\xfc\xa6\x07\xf2\
+\x68\xbd\xc7\x30\xcd\xaf\x6e\x1a\xda\x40\x7e\x60\x03\xae\x6f\xb0\
+\x5c\x71\xa9\xd4\x5c\x42\x1d\x01\x96\xe8\x0f\x12\x03\x97\xf8\x5c\
+\x89\x20\x4a\x50\x02\x4a\x09\xc9\x84\x45\x26\x95\x40\x87\x2e\xa5\
+\x95\x45\x4a\xab\xcb\x33\x8d\xc5\xa3\x9f\x9b\x3a\xf8\x17\x4f\x01\
+\x2e\xe7\x89\x86\xb1\xfd\xea\xcf\xee\x19\xe8\xcf\x6d\xf0\x53\x97\
+\x5d\x17\x06\xce\x43\xce\xea\x44\x95\xf3\x68\x71\xec\x13\x3f\xba\
+\x4a\x44\x3d\xbe\xa1\x90\xbf\x7e\x74\xf4\x52\x2c\x3b\xcf\xfc\xb2\
+\xc7\xec\x52\x13\xc7\xf5\xcf\xf8\xa0\x96\x88\x00\x67\x10\x10\x50\
+\xf1\xb5\x8a\x5e\x0f\x75\x88\xeb\xf9\x18\x96\xc9\x40\x7f\x1f\x76\
+\x32\x91\x73\x55\xee\x96\xdc\x25\xd7\xac\xae\xbc\x72\xe0\x08\xe7\
+\x91\x94\xb1\xf9\xbd\x9f\xdc\xf3\x3b\xbf\xfd\x1e\x6a\x35\xa7\xe0\
+\xdb\x97\x5d\xa7\x83\xd6\x1b\x92\x18\xdf\x7d\xff\x17\x4c\x2b\xf1\
+\x9f\xa3\x97\x0c\xe7\x37\x0e\x6d\x65\xa9\x12\x32\x53\x6c\xd2\x74\
+\x7d\x74\x1b\x29\xac\x83\xa6\x03\xb4\x10\x6b\x08\x44\xc9\xda\x73\
+\xa2\x24\xbe\x86\x20\x0c\xf1\x83\x90\x7c\x3e\x47\x4f\x26\x49\x2b\
+\xb0\xae\x4f\x8f\xfc\x5e\x79\xf5\xc4\x4f\x8f\x00\xfe\xeb\x91\x30\
+\x36\xef\xf8\xd4\x9e\xd1\x4b\x36\x33\x34\xd8\x47\xbd\xee\x14\x02\
+\x7b\x5b\x4c\xe2\xc4\x19\x24\xc6\x77\xef\xbb\xd3\xb6\x53\x77\x8d\
+\x6d\x1f\x25\x61\xf7\x73\x72\xae\x4e\xb9\xe6\x11\x6a\x62\xf0\xa0\
+\x3b\x80\x23\x31\x19\x15\x3d\x8a\x02\x44\xce\x88\x44\x04\xbe\xf3\
+\x5c\xd0\x68\x5c\x2f\x20\x9f\xcf\xd2\xdb\x63\x53\x75\x8c\x0f\xda\
+\x85\xf1\x17\x4b\x27\x0f\x4e\xc6\x24\xce\x26\xf0\xe9\x3d\x97\x6c\
+\x1d\x66\x62\xa6\xc5\xf8\xb6\x41\xea\x0d\xa7\x10\xa4\xb7\x5d\xa7\
+\x7d\x67\x8d\xc4\xf8\xee\x07\xbe\x97\xb6\x53\x5f\x1d\xbf\xfc\x5d\
+\xf8\x62\x33\x39\x5b\xa3\xe5\x9f\x19\x20\x2d\x1d\xae\x8f\x4d\x04\
+\x0c\x65\x60\x59\x16\x96\x69\x92\x4a\x58\x24\x12\x26\x96\x65\x62\
+\x9a\x0a\x11\x8d\x26\x22\xa1\x3a\x72\x42\x04\x5a\x5e\x40\x5f\x6f\
+\x86\x5c\x26\x41\xd9\xcd\x5c\xef\xd5\xe6\xf7\x39\xab\x93\x95\xb3\
+\x49\x98\x00\xa1\x16\x16\x4b\x2e\x1a\x61\xc7\x95\x63\x68\x64\x4c\
+\xe4\xb3\x07\x10\xb9\x61\xe3\x95\x37\x7f\x2c\x6d\x27\x6f\x19\x1f\
+\xdb\x46\xc5\x31\x39\x5d\xac\xa1\xb5\x46\x10\xb4\xc4\x11\xd5\x91\
+\xd7\x35\x1a\x88\xbc\x9c\xb0\x2c\x2c\x33\x81\x21\x21\x68\x17\xb4\
+\x8f\xdf\x6c\x62\x28\x45\x22\x65\x93\x4a\x25\x49\x24\x6c\xb4\x08\
+\x2d\xd7\xc7\xf1\x7c\x50\x6d\x1f\x08\x21\xb0\x5c\x69\x31\x52\xc8\
+\x33\x3c\x54\xcb\x06\xbb\x6e\xfd\xa7\xd2\xe4\xa3\x9f\x8c\x09\xf8\
+\x1d\x04\x84\xb8\x68\xb0\x5c\x76\x01\x78\xcf\x15\x97\xa3\x39\x31\
+\x26\xc6\xcd\x8f\x67\x32\xd9\x91\xf1\xcb\xb7\x51\x6d\x99\xcc\x2c\
+\x35\xda\xbe\x05\x89\xa5\x13\x61\x46\xeb\xe8\x8b\x2d\xd3\x22\x95\
+\x48\x42\xe0\xe2\x36\xe6\x69\x7a\x0d\x02\xaf\xb1\xe8\x35\x96\x5e\
+\x08\xdd\xda\x3c\x88\xb6\x7a\x86\xdf\xab\xcc\xd4\x50\xd2\xce\x0e\
+\xe6\x7a\xb2\xf4\xf5\xf7\xd1\x97\xcb\x50\x6e\xb4\xf0\xfc\x60\x3d\
+\x27\xb4\xa6\xda\xf4\xd9\x76\xd9\x30\x2b\xa5\xc6\x35\x5b\xae\xf9\
+\xc6\x87\xa7\x7f\xfe\x57\x0f\x00\xd5\x76\x3e\x98\x6b\x18\x62\xcd\
+\xae\x54\x22\x5d\x8f\x8f\x6d\x47\xa9\xc9\x91\x42\xa1\x80\x4f\x92\
+\xd9\xa5\xda\x9a\xac\xdb\x99\x24\x3a\x92\x8e\xc4\x32\x48\xa7\x6c\
+\x4c\x01\xa7\x5e\xc4\x6d\x55\x68\x55\xa6\x1f\x5d\x3c\x72\xef\xbf\
+\x97\xa7\x1e\x3b\x05\x34\x01\x27\xf6\x9e\x00\x89\xc1\x9d\x5f\xbc\
+\xb2\x3e\xfa\x47\x9f\x29\x95\x47\x3e\x3c\x3c\x34\xc0\xe0\x60\x81\
+\x52\xdd\xa3\xd9\xf2\xd7\x72\xa3\xda\xf4\xc9\x65\x6c\xb6\x8f\x6e\
+\xc4\xa9\xef\xbc\x0d\x38\x18\xdf\xc7\x05\x30\x36\xed\xf8\xcc\x9e\
+\x2d\x9b\x87\x99\x5d\x72\xd6\x2a\x43\xa3\x15\xe2\x06\xb0\x65\x64\
+\x03\xca\xb2\x99\x9c\xab\x11\xea\xb6\xe7\xe5\x9c\x47\xa5\x14\x3d\
+\xe9\x34\x12\xba\x34\x2a\xb3\x38\xd5\x99\x5f\xcd\x3c\x7d\xd7\x9f\
+\xcf\x3e\xf3\xad\x1f\xb7\x4a\x53\x53\xc0\x1c\x50\x04\x56\x80\x12\
+\x50\x01\xca\xf5\xb9\xe7\x27\x97\x5f\x7a\xe0\x61\x23\xd9\xfb\x94\
+\x6b\x14\xae\xf2\xbc\x60\x60\xd3\x50\x1e\x2d\x82\x1f\xe8\x38\x2f\
+\x84\x50\x6b\x06\x37\xa4\x99\x2b\x36\x86\x51\xe9\xff\xa9\xcd\x1e\
+\x3a\x75\x06\x81\x4d\x9b\x86\x98\x5f\x6e\xd1\x59\x3c\x9a\x6e\x88\
+\xeb\x43\xa5\xee\xe1\x78\x1d\x09\x2b\x1d\x44\x04\x0c\xc3\x20\x97\
+\x49\x13\xb8\x35\x6a\xe5\x39\xaa\xb3\x87\xee\x9e\xf8\xe9\x97\xff\
+\xa1\x55\x9a\x3a\x05\xcc\x02\x8b\x31\xe8\x06\xd0\x22\x5a\x28\xbd\
+\xf8\xdc\x01\x9a\xd5\x99\x67\x5e\xf3\x9b\xcb\x0f\x49\xef\xf8\x15\
+\x2d\x8f\x4b\xb7\x8c\xe4\x09\x01\x3f\x04\x43\x09\x81\x86\xde\x6c\
+\x82\xd0\xf7\xa8\xf9\x99\xec\xf2\xb1\xfb\x1f\x89\x23\x1a\x2a\x00\
+\xad\xdb\x2b\x66\xbb\x8a\x08\x02\x54\xea\x2e\x75\xc7\xef\x58\x49\
+\xdb\x4b\x69\x8c\x5f\x29\x72\xe9\x34\x9e\x53\xa5\x5a\x9a\xa9\x2f\
+\x1d\xfd\xe1\x1d\x53\x8f\xde\xf1\x7d\x60\x06\x78\x2d\x06\x5f\xe3\
+\x0d\x6a\x78\xfc\x9c\x07\x54\x57\x27\x7e\x76\xa2\x78\xe4\xde\x5b\
+\x57\x56\x56\x5f\x9e\x99\x2d\x32\xd8\x97\xc0\x34\xd6\xd7\x88\x5a\
+\xd3\x67\xeb\xe6\x7e\x12\x99\x8d\x1f\x00\x72\x40\x02\x22\x28\x84\
+\x7a\xdd\xf3\x67\x2c\xfd\xaa\xa3\x66\x4b\x54\xcb\x95\x44\x61\x55\
+\x31\x78\xb7\x59\xa1\x56\x9e\xa9\x2f\x3c\x7f\xcf\xd7\xe7\x0f\x7f\
+\xf7\xe7\xc0\xe9\xd8\xf3\xe5\x18\xdc\x85\x34\x65\x1a\x70\x97\x8e\
+\xed\x9b\x9a\x3f\x7c\xcf\x47\xa7\x67\x57\xab\x8d\x7a\x93\x8d\x7d\
+\xc9\x48\x46\x4a\x68\xb4\x42\x32\x99\x24\x99\x4c\x2a\x3b\xb4\xeb\
+\x4b\x3b\x81\x14\x20\x2a\x6a\x71\xe3\x52\xd2\x01\x7e\xcd\xcb\x12\
+\xd5\xe7\xf6\xea\x29\x2a\x3a\xb7\x53\x49\x42\xdf\xa5\x56\x5d\x60\
+\xf5\xd5\x47\xef\x5a\x3a\x76\xff\xe1\xd8\xf3\x8b\xb1\x5c\xde\x72\
+\x6b\x0c\x78\x4b\x2f\xee\x3d\xe5\xd5\xe6\xbe\xf1\xf2\xab\x8b\x28\
+\xd1\x38\x9e\xa6\xdc\x08\xa8\x34\x43\x1c\x5f\xe8\xcb\xdb\x64\x86\
+\xde\x77\x75\x4c\xc0\x88\x23\x10\xaf\x96\x67\xf5\x2c\x6b\x87\x6a\
+\x7b\x3d\xae\xf1\xa6\x89\x21\x8a\x6a\x69\x8e\xea\xec\xe1\xbb\x67\
+\x9e\xfe\xe6\x23\xc0\x02\xb0\x44\xa4\xeb\x8b\x19\x54\xbc\xe3\x7b\
+\x3f\xfd\xaf\xb5\xba\x73\xba\x5a\x69\x90\xb1\x4d\x2a\x8d\x90\x62\
+\xd9\x67\x6e\xc5\x25\x9d\x4e\x62\xa5\x07\x2e\x07\x6c\xc0\x54\x1a\
+\x08\x43\xbd\xd6\x29\x4a\xec\x6d\xd5\xd1\xfe\x76\x7a\x5e\x19\x42\
+\x32\x91\xc2\xa9\x97\xf0\xfd\x66\x7d\xe1\xf9\x7b\x1e\x24\xaa\x30\
+\x45\xa2\xc4\xbc\xe8\x29\x0b\x68\xf9\xce\xca\xdf\x2f\x14\xcb\xf4\
+\xe7\xcc\x48\x46\x86\xe0\x05\x60\xdb\x49\x8c\x64\x76\x08\x48\x02\
+\xe6\x5a\x0e\xac\x55\x17\x3a\x80\x2b\x41\x29\x50\x6d\xf0\xb1\x9c\
+\xbc\xc0\xc5\xce\xe6\x49\xa6\x72\x99\xd1\xeb\xff\xf1\x9b\xf9\xd1\
+\x3f\x4c\x12\xe9\xfd\xed\xc8\xe6\xf5\x2c\x6c\x2e\xbd\xf2\xa3\xd5\
+\x8a\x8b\x41\x40\x5f\xce\x42\x29\xc1\xf1\x34\x3d\x3d\x49\x94\x95\
+\x1e\x02\x2c\x40\x45\x11\xd0\x67\xb5\xbb\x1d\x72\x69\x37\x59\x91\
+\x84\x40\x29\x85\xeb\xfb\x54\x1c\x8f\x74\xef\x08\x3d\xf9\x91\x77\
+\x6d\x7a\xff\xd7\xf6\x0e\xfc\xc6\x27\xb6\xc6\x37\x7d\x47\xec\xe4\
+\xcf\x6e\x2f\xfa\xbe\xfb\x54\xb5\xea\xd0\x9b\x35\x51\x86\x22\x04\
+\x12\x09\x13\x65\xa5\x06\xe3\xef\x32\x14\x44\xa3\x5e\x67\x04\xd6\
+\xaa\x65\xec\xfd\xb6\xfe\x03\x0d\xe5\xba\x4f\xa5\x11\xd0\x74\x3d\
+\x1a\x9e\x4f\xba\x77\x23\xf9\xfe\xe1\xb1\xa1\x5d\x5f\x3a\x30\x70\
+\xc5\xee\x4b\xdf\x41\x12\x21\x61\xf0\x44\xa5\xd6\x22\x6b\x1b\xb1\
+\x1a\x22\x27\xc6\x38\x0d\x62\x71\x10\x4f\x7c\xf1\xe2\xba\xde\xa7\
+\xb7\x57\x42\x04\xaa\x8d\x80\xa5\xb2\x87\xe7\xeb\xb5\x3c\x71\x7d\
+\x9f\x5a\xcb\x25\x93\x2f\x30\x50\x18\x1e\x1b\xde\x75\xeb\x81\xc2\
+\xbb\x6f\x7a\xc7\x48\x04\x7e\xf3\xf1\x5a\xbd\x45\x6f\xd6\x40\x19\
+\x51\x1e\x44\xca\x50\x10\xb5\x7e\x98\x1a\x08\xc2\x35\x56\x31\x7e\
+\x89\x09\x09\x8e\x1f\xb2\x5c\xf6\xf1\x02\xdd\x31\x7c\xac\xcb\xab\
+\xe5\x07\x54\x1d\x8f\xfe\xfe\x02\x86\xa1\xc6\xd8\x75\xeb\x01\xe0\
+\x86\xa5\xa3\xf7\x4f\xf1\x16\x67\xec\x73\x4c\xd4\x4a\x10\xae\x2b\
+\x40\xc5\x03\x91\xd6\x7e\x9d\xb5\x66\x4e\x47\x11\xd8\xd8\x97\x25\
+\xd0\x42\x18\x46\x39\x11\x6a\xa8\x3b\x21\x8d\x66\x40\x3a\x99\xc4\
+\x30\x24\x3e\x40\x19\x82\xa1\xe2\x6b\x15\x5f\x1b\x42\x6f\xa1\x80\
+\x61\xca\x18\x57\x7f\xf9\x40\x6e\xcb\xef\x7e\x65\xf2\xe1\x3f\x7b\
+\x92\x0b\x5f\xcc\xce\xb1\xa3\xdf\xfb\xd0\xe1\xab\xbe\xf2\x2c\xe8\
+\x80\x6c\xda\x20\x6b\x1b\x94\x2b\x0e\x41\xab\x36\x49\x3c\x66\x9a\
+\x2d\xcf\xe3\xf8\x4b\xc7\x88\xf6\x6d\xda\x93\x95\x74\x5c\x47\x32\
+\xf2\x54\x47\x82\x77\xd4\xdc\xb3\x93\x5f\x44\x30\x4c\x7b\x2c\xbb\
+\xe5\xea\x1f\x5f\x7a\xdd\xdf\xdd\x34\xf5\xc8\x1d\x4f\xf0\xf6\xcb\
+\x6b\xd8\x2e\x28\x96\xa9\xb0\x2c\x41\x3c\x8d\x28\xd1\x44\xed\x49\
+\x60\x1e\xbd\xef\x86\x5e\x60\x0b\xd0\xfb\x76\xbc\xf4\x06\xa6\x89\
+\xba\xc5\x12\x51\xcf\x72\xde\x9d\x85\xf3\xde\x27\x26\x60\x18\x42\
+\x3e\x63\x32\xf3\x9a\x4b\xab\x3a\xf7\x02\x11\x81\xd0\x24\xea\xea\
+\xa6\x81\xf9\x77\x08\x7c\xa7\xf9\x5c\xe4\xca\xbc\x56\xca\x0d\x45\
+\xd6\x56\x34\x9b\x1e\xad\xd5\x53\x13\x44\x51\x0d\x4c\xd6\xdb\xdb\
+\x2e\xb5\xa8\x74\x66\x6d\x85\x22\xa4\x54\xf5\xa8\x9e\x7e\xe6\x65\
+\xe2\xe1\x48\xfd\xba\xe1\xbd\x99\xa5\x92\x06\x86\x69\x90\x30\x15\
+\x8d\x86\x4b\xa3\xde\x58\x5c\x39\xfe\xe0\x34\x71\x04\xba\x9a\xc0\
+\xce\xdb\x9e\xbf\xd6\x4e\x9a\x98\x09\x93\xfe\x9c\xc1\xdc\x42\x83\
+\x56\x79\xfa\x69\x22\xf0\x2d\xda\x03\x4d\xb7\x9a\x0e\x7d\x65\xdb\
+\x51\x33\x67\x9b\x30\xbb\xd0\x60\xf5\x95\x87\x1f\x22\x1a\x92\x5c\
+\x40\x77\x35\x01\x31\xac\x3f\xc8\x64\x13\x88\x82\x95\xe5\x06\x95\
+\x6a\x7d\x71\xfe\xd9\x7f\x3b\xc6\x3a\x01\xba\x9b\x80\x32\x76\x6c\
+\x18\x48\x21\xc0\xab\xa7\xaa\x94\xa7\x7e\xf1\x1f\x40\x3d\x3e\x7c\
+\xe8\x76\x02\xa2\x76\xf4\xe5\x53\x94\x56\x9b\xcc\x15\x1b\xf5\x85\
+\x67\xef\x79\x8c\x68\x54\x6d\x12\x97\xe6\xae\x25\xb0\xf3\x4f\x8f\
+\x8c\xa6\x52\xd6\xd6\x94\x6d\xf2\xd2\x89\x32\xf5\xf9\xa3\xfb\xeb\
+\xf3\x2f\x2e\x10\x6d\xc9\xb8\xed\xf7\x75\x2d\x01\xa5\xcc\x6b\x07\
+\x37\xa4\xa8\x56\x5d\x66\x8b\x8d\xfa\xf4\x63\x7f\xbb\x97\xc8\xfb\
+\x75\x3a\x06\xa7\xae\x25\x80\xa8\x8f\x17\xfa\x92\x3c\xf7\xc2\x0a\
+\xe5\x89\x83\x77\xd7\xe7\x5f\x9c\x05\x56\x89\xca\xe7\x9a\x75\x2d\
+\x01\x31\x8c\xdf\x77\x1d\x9f\xa5\xc5\xa5\x23\x13\xfb\x6f\xdb\x4f\
+\xb4\xab\x57\xe5\xac\x9f\x9d\xba\x92\xc0\xae\xaf\xbf\x7c\x63\x2a\
+\x69\xf6\x1e\x9f\x76\x98\x3f\xf4\xdd\x7f\x21\x6a\x0a\x57\x38\xcb\
+\xfb\x10\x6f\xaf\x77\x9b\x89\xf0\xf9\x96\xab\xa9\x9d\x7e\xee\xdb\
+\x73\xcf\x7c\xe7\x08\xd1\x76\x4d\x8d\xd7\xd9\x34\x90\x73\x3e\xfd\
+\x6b\xb6\xdf\xba\x7d\x22\x2f\xc2\xaa\xdf\x2c\x1f\x3c\xfc\xad\xdf\
+\xfc\x4b\x22\xf0\xb3\x44\x9b\x65\xe7\x74\xb5\x5d\x17\x01\x1d\xfa\
+\x5f\xd4\x22\xd3\x13\x3f\xf9\x93\x3b\x89\x4a\x66\x91\x8e\xba\x7f\
+\xb6\x75\x1d\x01\x81\x5b\x56\x8e\x3f\xf4\xc7\x95\x53\x4f\x17\x81\
+\x65\xde\x40\x3a\x5d\x69\xbb\xbe\x76\xec\x0b\xef\xfe\xfc\xfe\xf7\
+\x03\x5b\x81\x41\xa2\xdd\xb7\xf3\x5a\xb7\xe5\x80\x49\xb4\xe7\x69\
+\x10\x0d\x2c\x6f\x3a\x4b\x77\x1b\x01\x45\x04\x5e\x73\x81\xff\x2f\
+\x21\xd1\xd6\xfa\xff\x5f\xfb\x5f\xf7\x23\xdc\x26\xc8\xbc\x66\x93\
+\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x06\x6d\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x06\x34\x49\x44\x41\x54\x78\x5e\xad\x97\x5b\x6c\x54\xc7\
+\x1d\xc6\x7f\x73\xce\xd9\x8b\xbd\xf6\xfa\x16\xa0\xbe\x00\x0e\xb2\
+\x69\x63\x24\x42\x4a\x21\x22\xa1\x2d\x95\x62\xa5\x2f\xee\x4b\x68\
+\x2b\x95\xa6\x55\xa5\xc6\x60\x55\xaa\xda\xb4\xaa\xfa\x56\x09\x55\
+\xca\x03\x94\x27\xda\x07\x84\x14\x29\xad\xc4\x8b\xa5\x52\x83\x79\
+\x08\xc5\x18\x39\x0e\x69\xd3\x84\x9a\x9b\x63\x6a\xec\xb2\x04\x1b\
+\x3b\xbb\xf6\x7a\x8f\xbd\xbb\xde\xb3\x67\xa6\xc3\x68\x85\xe5\x72\
+\x6c\x88\xc9\x27\x7d\xfa\x9f\x9d\x87\xfd\x7e\xf3\x9f\x99\x73\x11\
+\x4a\x29\x82\x24\x84\x78\x05\x78\x9e\xc7\x6b\x48\x29\xf5\x77\xd6\
+\x28\x27\x20\xb8\x43\xbb\x01\x68\x97\x52\xbe\xc6\x63\x64\x59\xd6\
+\x07\x1a\xf6\xbb\x40\xb7\x06\x39\xff\x14\x00\x26\xfc\xb7\xed\xf5\
+\xe2\x60\x5d\x44\x44\x6e\xce\x89\x8a\x2b\x57\xae\x50\x5d\x53\x8d\
+\x40\x00\xa0\x50\x08\x65\x28\x41\x29\x66\xd3\x69\x5e\xa9\x17\x2f\
+\xbc\xb4\x4e\x6c\x3b\xf1\x1f\xb9\x47\x83\x7c\x5b\x43\x4c\x3c\x4d\
+\x07\xf6\xff\x60\x8b\xdd\x2c\x25\xf8\x4a\x32\x3c\x3c\x4c\x65\x65\
+\x25\x2b\xc9\x75\x5d\x1e\xc0\x6e\xa9\xb0\x22\x1b\xa2\x2a\x72\x3f\
+\xa7\xea\x81\xb5\x03\x08\x2d\x05\x48\xa1\x0d\xf4\x5d\xbc\x48\x2e\
+\x97\xc3\x2f\x16\x51\x4a\x91\xcf\xe7\x59\x5c\x5c\xa4\x50\x28\x50\
+\xd4\x63\xb5\xb5\xb5\x94\x01\x58\x80\xf8\x82\xf6\x80\x01\x00\x36\
+\x44\x05\x1f\x0f\xbc\x4b\x3e\x3b\x8f\x85\x44\x95\x32\xe2\xb6\xc4\
+\xb6\x04\x21\x21\x70\x3e\x53\x6c\x8c\x3b\x80\x44\x2a\x04\xf0\x9c\
+\x10\x02\xe0\xcb\x40\x05\x50\x0f\x34\x60\xc4\x48\x69\x9f\x24\x02\
+\x01\x4e\x9c\x38\x21\x00\x81\x05\xd2\x87\x96\x96\x67\x09\x65\x6d\
+\x14\xe5\x28\xa5\xb4\x41\x08\x58\x57\x19\x25\xe2\xd8\x44\x42\x16\
+\xc3\x13\x73\x5c\xbc\x3d\x41\xf7\x58\x8e\x5c\x24\xbe\xa9\xbd\x7d\
+\xf7\xef\x2d\xcb\x5a\xdc\xb1\x63\x47\x59\x55\x55\x95\xd3\xd8\xd8\
+\x18\x7e\xe0\x86\x86\x86\xd0\xa5\x4b\x97\xdc\xae\xae\xae\x08\xf0\
+\xd6\xaa\x1d\x00\x13\x44\x55\x2c\xc2\x73\xd5\x31\xf2\x9e\x4f\xa1\
+\x28\x91\x4a\x61\x09\x41\xd8\xb1\x88\x86\x6c\xe6\x72\x05\x12\xa2\
+\x8e\x3f\x9f\xff\x2b\x0d\x4d\x1b\x01\x22\xc0\x66\x96\x84\xef\xfb\
+\x78\x9e\x47\x75\x75\xb5\x9e\x50\x4b\xf4\xea\xd5\xab\x87\x84\x10\
+\x28\xa5\xde\x5a\x11\xc0\xb2\x41\x00\xb6\x2d\x90\xda\xb6\x14\x38\
+\x08\xa4\x12\x58\xc2\x8c\x1b\x8f\x4c\xb9\xec\x7b\xf5\x3b\xd4\x37\
+\x36\x11\x7c\x2f\xc1\x84\x67\x32\x19\xca\xcb\xcb\xcd\x66\x3e\x76\
+\xec\xd8\x26\xbd\x7f\x0e\x2e\x41\x2c\x01\xd0\xd9\xd9\xa9\x0e\x1d\
+\x3a\xa4\x6c\x21\x08\x59\x10\xb6\x2d\x1c\xc7\xc6\x42\x50\xb4\xcd\
+\x1a\x1b\x00\xc7\xb2\x88\x38\x96\xae\x02\x60\x59\x78\x10\xc0\xdc\
+\xdc\x1c\x35\x35\x35\x06\x20\x1a\x8d\x72\xe4\xc8\x91\xcd\xc0\x03\
+\x88\x1b\x1a\xa2\xc7\x62\xb9\xb0\x6d\x74\x30\x66\x8d\xcb\x23\x36\
+\xb1\xa8\xa3\xc7\x2c\x32\x8b\x1e\x93\x99\x1c\x63\xa9\x79\xee\xcc\
+\x2e\xe8\xdf\x45\x72\xf9\x3c\xab\xc8\x2c\x41\x36\x9b\x35\xa7\x66\
+\xe9\xff\x6d\x0e\x1c\x38\xb0\x1e\xe8\x00\x58\x06\xa0\xb4\x74\x16\
+\x8e\x0d\xe1\x90\xc0\x53\x8a\xb1\xa4\xcb\x8d\x8c\x83\xd3\xb2\x97\
+\xa6\x7d\xaf\xb3\xb5\xe3\x17\xac\xdb\xfb\x3a\x0d\x2f\xb4\x73\xfb\
+\xce\x24\xfd\xfd\xfd\x24\x93\x49\x94\x52\xe6\xfa\xf8\xf1\xe3\xe8\
+\xba\xac\x33\xe7\xce\x9d\xe3\xe8\xd1\xa3\x1c\x3e\x7c\x98\xde\xde\
+\x5e\x12\x89\x84\x04\x2c\xa1\x15\xdc\x01\xed\xff\xce\xe6\xf8\xe7\
+\x94\x4f\x6b\xc7\xcf\xf8\xe6\x2f\xdf\x26\xf6\xf5\x37\x99\x7c\xa6\
+\x83\x6b\xfe\x2e\xae\xf1\x2d\x64\x6b\x17\xad\x7b\x7f\x4e\x5e\x56\
+\x73\xfa\x6f\x67\xd1\x77\x4d\xee\xdc\x9d\xe2\x1b\xaf\x76\x72\xfd\
+\xfa\x75\x03\xa0\x67\x6b\xd6\x3f\x16\x8b\x99\xeb\x78\x3c\x8e\xe3\
+\x38\x25\x38\x04\xc0\x23\x00\x96\x25\x98\xca\x41\x3a\xde\xca\xfe\
+\xdf\xbd\x4d\xd5\xae\xd7\x28\x84\x62\x08\xdb\x42\x59\x82\x6c\x41\
+\x72\x7f\x66\x91\x4f\xee\x66\x18\xb8\xea\x72\xfa\x1f\x61\x64\xd5\
+\x5e\xae\x8f\xdc\x67\x32\xd7\xc6\x85\x0f\xee\x9b\x00\xed\x87\xa1\
+\xcd\xcd\xcd\xb4\xb5\xb5\x19\x37\x35\x35\xa1\xa1\x14\x20\x83\x1f\
+\x46\x16\xdc\x71\x15\xdf\xff\xe9\x6f\xa8\x6c\xd8\x48\xe2\xec\x3b\
+\x4c\x8f\x5e\xc3\x89\x94\xb1\xb5\x79\x07\x9b\x5b\xb6\xf3\x49\x79\
+\x25\x63\x09\x97\xcf\x66\xf2\xdc\x9d\xce\x32\xa1\xed\x88\x0d\x4c\
+\x27\xe7\xd8\xb7\x2b\xca\xfa\x25\x00\x33\x7b\x3d\x6b\xea\xea\xea\
+\x00\xcc\x75\x2a\x95\x32\x00\x4a\x2b\x10\xa0\xb9\x5a\x70\xe1\x9d\
+\x63\x28\x2c\xca\xe6\xc6\xd9\x10\x8f\x52\x94\x92\x7b\xc3\x7d\x24\
+\x65\x05\xdb\xda\x7f\x4c\x4d\xdb\xcb\x7c\x3c\x9c\x66\xd2\x5f\xc0\
+\xcd\x78\x2c\xcc\x6b\x2f\x78\x20\x00\xb5\x74\x3a\x42\xa1\x90\x09\
+\x2d\xdd\xea\x1f\x8e\x01\x2a\xf8\x3e\x60\xc1\xc6\xb8\xa0\x50\x1c\
+\x23\x1c\x8b\x53\xb7\xa5\x96\x92\x78\x76\x7d\x05\xe9\xac\xc7\x68\
+\xff\x9f\x98\xae\xbc\x4c\xcb\xf6\x83\xb8\x0b\x61\xbc\x82\xa4\x58\
+\x94\x78\xda\x21\xc7\x42\x2d\xaa\x80\xe3\x69\xa0\x96\xd5\x15\x01\
+\x00\xd6\xc7\x43\x84\xca\x23\xfc\xbf\x6a\x63\x21\x9e\xa9\x0c\x73\
+\xe1\xdf\x83\xec\xd9\xf9\x13\xca\xa3\x0e\xb9\x32\x47\x03\x28\x03\
+\x61\x6b\x00\x16\x4b\x21\xa5\x1c\x25\x30\x2a\x15\xa4\x5c\x05\x40\
+\x58\xa5\x2a\xcc\xf5\x23\xfa\x70\x6c\x86\xf1\x59\x8f\xef\xfd\xfa\
+\x8f\xdc\xca\xd4\xe0\x44\x5c\xa2\x11\x1b\xcf\x93\x14\x3d\x07\xd3\
+\x01\xa5\x90\x52\xf2\x50\x6a\x59\x01\x56\x05\x10\x08\x4c\x0d\x04\
+\x18\x9d\x76\xf9\xd5\x5f\x86\x18\xbd\xb7\x80\x3d\x93\x67\xd3\xba\
+\x32\xf2\x79\x5f\xbb\x68\xea\xce\xaf\xd4\x70\xf9\xdd\xe0\x25\x00\
+\x9e\x78\x09\x4c\xb8\x10\x3c\xa2\xd6\x2f\x55\xf2\x87\x1f\x3e\xcf\
+\xf5\x4f\x33\x44\x1b\xb7\xb1\xf3\xc5\x97\x59\x12\x5c\x4e\x60\x8e\
+\xdb\x53\x01\x28\xc0\x12\x25\x00\x6d\xd4\x52\x7d\xb1\xb5\x96\xdd\
+\x5b\xe2\x74\xbf\x97\xa5\x6a\xf7\x57\xf9\xd1\x1b\x6f\x10\xa0\xb5\
+\x03\x98\xb5\x37\xd5\xd8\x08\x01\xd2\xcb\x53\x70\x53\x78\xf3\x33\
+\x14\xb3\x69\x0a\x19\x1f\x25\xfd\xd5\x82\xd6\x08\xf0\xf0\x29\xe7\
+\xe3\xe7\x33\x14\xe6\x75\xa8\x0e\xd6\x00\xcb\xf7\x89\x10\xc1\x33\
+\x7d\xfa\xd7\x72\x8c\xb2\x13\x37\x03\xc7\x01\xb2\x1e\xfe\xad\x94\
+\xcc\x6f\xf7\x44\x54\x03\xd8\x5f\x70\x07\x08\x92\x09\xfd\xd7\x3d\
+\x3f\xfd\x7e\x42\xa6\xcf\xdf\xf6\xef\x02\xee\x76\x3b\xfc\x92\x06\
+\xa8\xe3\x73\xca\x75\x5d\x1f\x70\x57\xed\x00\x40\x32\xab\x0a\x1f\
+\x7e\x2a\xd3\xbd\xb7\xfc\xd4\xcd\x69\x39\x05\xf4\x03\x97\x74\x68\
+\xbf\x10\xa2\xd3\xb6\xed\xaf\x7d\x9e\x25\x58\x58\x58\xf0\x07\x06\
+\x06\xd2\x27\x4f\x9e\x9c\x06\xba\x83\x00\x3e\x1a\x49\xca\xad\xe3\
+\xb3\x2a\xd7\x3b\xe2\xa7\x6e\x4c\xcb\xd1\x52\xe8\x59\x1d\x74\x8b\
+\x00\x3d\x09\xc0\xd0\xd0\x90\xdb\xd3\xd3\x93\xd2\x4e\xcf\xce\xce\
+\x9e\x2e\xbd\x1d\xdf\x08\x02\xe8\xee\xea\x29\x00\x8c\x04\x84\x06\
+\x85\xaf\x08\x30\x35\x35\x55\xd0\x2f\x22\xa9\x53\xa7\x4e\x25\xc7\
+\xc7\xc7\x2f\x03\x67\x81\x7e\x1d\xec\xae\xb8\x09\x4b\xdf\x76\xda\
+\x4f\x26\x85\x01\x40\x08\x40\x61\x5a\xfc\xde\xe0\x60\xba\xbb\xbb\
+\x3b\xa5\xdf\x8a\xcc\x24\xd0\x5e\xed\x73\xcd\x61\xed\x9a\x77\x33\
+\x6e\x11\x60\x70\xf0\xfd\x74\x5f\x5f\x5f\xfa\xcc\x99\x33\xa6\xc5\
+\xa5\xd0\x8f\x78\x02\x89\xb5\x9e\x63\x21\x44\x18\x78\x13\xd8\x4f\
+\x69\x73\x06\xb4\xf8\xb1\xfa\x1f\xbd\xfa\x2a\x5f\xf2\xd8\x15\x9d\
+\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x05\x2b\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xd6\xd8\xd4\x4f\x58\x32\
+\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
+\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
+\x79\x71\xc9\x65\x3c\x00\x00\x04\xbd\x49\x44\x41\x54\x58\xc3\xed\
+\x57\x6b\x4c\x93\x57\x18\x3e\x23\x71\xc9\x32\xe9\x16\x97\xa8\x54\
+\x65\x38\x9d\x02\x15\xf6\x03\x87\x32\x93\x01\x66\x2c\x5b\x70\xc4\
+\x30\xff\x60\xa2\x2e\x1a\x3a\x1d\x4e\x03\xba\x31\x89\x5b\xb3\x80\
+\xd9\x0c\x84\x02\x19\x58\x1c\x14\x8b\x85\xb2\x82\x95\x5e\xe4\x66\
+\x0b\x8e\x31\xf8\xc3\x46\xcb\x2d\x81\x15\xdc\xa8\xc2\x1c\x1b\xb7\
+\x6a\x69\x91\xf2\xee\xbc\x87\xaf\x0c\xdc\xb8\x0d\x61\xd9\xb2\x93\
+\x3c\xed\x97\xf3\x7d\xfd\xde\xe7\xbc\xef\xf3\x5e\x4a\x00\x80\xfc\
+\x93\x20\xff\x0a\x02\x74\x09\x28\x44\x14\xd9\x14\x71\x14\x01\x2b\
+\x46\x80\xae\xdd\x64\xdd\xc6\x66\x22\x4c\xf8\x95\xc4\x8b\x47\xc8\
+\xa1\xd3\xf7\xc8\x8e\x97\x3b\x38\x32\x61\x2b\x41\x20\x85\x9c\xbe\
+\x30\x48\x2e\xdd\x80\x19\x40\x32\xab\x79\x4d\xf4\xbe\xfb\x72\x13\
+\x68\x64\x06\x91\x04\x5e\xa3\x51\xf4\x06\xee\x85\x47\xf5\xd0\xbd\
+\x83\xcb\x4d\x20\x9b\x9d\xf6\x40\x74\x2f\xbd\x16\x32\x3d\x20\x89\
+\x3f\x48\xa5\x2c\x1b\x01\x8c\x31\x79\xc1\xbb\x9d\x88\x4b\xc6\xd7\
+\xc6\x26\x0e\xa0\x10\xb9\xfd\x42\xfe\xc5\x2b\x36\x46\x8c\x12\x5c\
+\x4e\x02\x93\xa7\xa7\xa7\x0d\xcc\xd3\x39\xb9\x98\x63\x36\x14\x0a\
+\xd2\xe4\xa3\x2b\x41\x20\x8c\x29\x9e\x2a\xdf\x37\x47\xeb\xdc\x7b\
+\xb5\xcc\x89\x9e\x40\x44\x96\x54\x83\x2b\x2c\x0b\x36\x46\x48\x08\
+\x13\xf5\x64\x2a\x7b\x2e\x54\x03\x01\xf8\x03\x37\xbf\xc0\x0e\x34\
+\x2a\x54\xdf\x62\x88\x52\xd5\x2c\x58\x03\x74\x1d\x16\x08\x04\x7a\
+\x45\x55\xf5\xc8\xa0\x6d\x74\xc2\xd4\x73\xf7\x21\xbe\x73\x51\x95\
+\x90\xae\x8f\xd0\x13\xcf\xe5\x94\x83\x87\xb4\x02\x9e\xcc\x2e\x03\
+\xd4\x06\xdd\xaf\x99\xcb\xb0\xaf\xaf\xaf\x3e\xbf\xd2\x60\xb5\xdb\
+\xed\x80\xf8\x79\xe4\x3e\xc4\x5e\xab\xb4\xb9\x88\x2f\x86\x80\x27\
+\xd3\xc0\x67\xf9\x8e\x19\xf5\x60\xd7\x5e\x33\xba\x76\xda\x73\xee\
+\x68\xd8\xc7\xc7\x47\x9f\xab\xab\xb0\x0e\x0f\x0d\xc1\x10\x87\xb2\
+\xf6\x2e\xe7\x96\x37\xf7\x77\x73\x61\xd8\xbd\xe8\x5e\x80\x2f\x66\
+\x9a\xa0\x86\xdf\xa9\x36\x42\xf7\xf0\x03\xd8\x19\x9f\xd4\xcf\xa5\
+\xe7\x1a\x8a\x98\x2d\x7e\xfe\x6d\x97\x54\x1a\x6b\x5f\x5f\x1f\xb8\
+\xd0\xd1\x73\x07\x62\x72\x15\x56\x4e\xc4\x87\x97\xd4\x8c\x30\x14\
+\xe9\x15\xb7\x1e\x38\x1c\x0e\x40\xa4\xd6\x19\x31\x9e\x85\x9b\x05\
+\x7e\x6d\xa9\x25\x1a\x5b\x97\xd9\x0c\xe6\x2e\x0a\xf3\x24\x14\xdf\
+\x36\x8e\x7b\xbd\x1e\xd1\xcd\x42\xc8\x09\x6f\xa9\x04\x3c\xd1\xbd\
+\x56\xab\x15\x10\x77\x7f\x1b\x84\xf3\x92\x5c\xbb\x52\xa9\x84\xfa\
+\xfa\x7a\x30\x99\x4c\x0c\x75\xdf\x35\xc1\x51\xb1\x64\x18\xc9\x51\
+\x44\x3e\xb6\x76\xcc\xb4\x40\x4f\x93\x5f\x7e\xd3\xd6\xdf\xdf\x0f\
+\x32\x99\x0c\x44\x22\x11\xa8\x54\x2a\x90\x4a\xa5\xa0\xd1\x68\x20\
+\x4b\x5b\x39\xbe\xe9\x95\xe0\x1f\xb8\x53\xaf\x79\x2c\xf3\x00\x97\
+\x8e\x22\x9e\xc7\x86\xe6\x53\x29\x19\xf6\x82\x82\x02\xe6\xe2\xa0\
+\xa0\x20\xe0\xf1\x78\x60\xb1\x58\x40\x5b\x5e\x01\xfb\xcf\x26\x0c\
+\x2d\xa6\x53\xce\x67\x94\xcf\x09\x4c\x83\xe2\x5b\x7b\xe6\xc2\x60\
+\x9a\xb2\x14\x14\x0a\x05\x88\xc5\x62\xc8\xcc\xcc\x84\xa2\xa2\x22\
+\x50\xab\xd5\xd0\xd9\xd9\xc9\x60\xec\xfe\xc9\xb9\xc9\xdb\xa7\x75\
+\x2e\xb7\xcf\x4b\x80\xae\xb7\xd8\x29\x70\x0e\xc0\x6a\x97\xac\x78\
+\x88\xca\x7f\x82\xe2\x29\x89\x0e\x3e\x97\x2b\x21\x5b\x96\x0f\x07\
+\x63\xe3\x47\x84\x1f\x26\xd8\x92\x72\x64\x8e\x6f\x1a\xbf\x07\xa3\
+\xd1\x08\x2d\xad\x2d\xf0\xcb\xc0\x20\x1c\x38\xf1\xbe\x05\xb3\x62\
+\xc1\x04\x5c\x69\x84\x85\x85\x84\x46\xdc\x26\xe7\x32\xac\x2c\xcf\
+\x33\xb5\x13\xec\x3b\xe3\xba\xd3\x33\xaf\x82\xe5\xfe\x7a\x89\x06\
+\x9e\xde\xfc\x62\x1b\xf7\x3c\x92\x8d\x7b\x66\xab\x4f\x5b\xca\x35\
+\xed\x58\x43\x43\x3d\x34\x34\x34\x80\xa5\xb7\x17\x32\x14\xc5\xc3\
+\xf3\xe9\xc0\x65\x3c\x92\xe5\x28\x9e\x36\x5d\xe5\x9c\x2a\x32\x78\
+\x7d\xf4\x83\x2e\x5a\x6c\x12\x31\x0c\x1b\x25\xea\x71\xf7\x2f\xcb\
+\x27\xef\x05\x87\x5f\xfe\xd3\xe4\x44\x0b\x4c\x68\xf4\xc9\x3e\x75\
+\x95\x1e\x0c\x06\x03\xb4\xb7\xb7\xc3\xd7\xc6\x96\x31\xae\x81\x09\
+\x66\xf1\x36\x6d\x38\x68\x3c\x49\x3a\x3a\x65\xf8\x62\x81\x83\x44\
+\xbd\x57\x43\xb6\x0a\x5e\x9b\x2a\xc3\x94\x5c\xb0\x42\x0f\xab\x24\
+\xb4\x04\x9f\x4a\xaa\x9b\x43\x37\x31\x28\xd4\x4f\xf2\x0a\xc7\x74\
+\x3a\x1d\xd4\xd6\xd6\x82\xc9\x7c\xdb\xb9\x61\x9b\xf7\x5f\xea\x62\
+\xb2\xe5\x7e\x9c\x75\x1f\x0d\xf3\xb2\xd4\x4e\xf2\xf6\xb1\xeb\x2e\
+\xb6\xae\x94\xc3\x90\x6c\x97\x55\xc1\x4b\x57\xab\x80\x9c\x4d\x6e\
+\x5a\xd0\x1c\x49\xbd\xb1\xe7\x88\xb0\xef\xca\x57\xc5\x50\x5a\x5a\
+\x0a\x1d\x3f\xf6\x4c\x04\x06\x87\x74\x3c\xaa\x0b\xc2\x84\x46\x8d\
+\x07\xc8\x6f\x02\xd9\xf9\xaa\x7e\x9a\xf1\x30\x46\x8e\x36\x20\xaf\
+\xbc\x4a\x78\x43\x69\x00\x92\x28\x1d\x98\xcd\x95\xb3\x79\xc3\x7d\
+\x3d\xbf\xf9\x44\x6a\xa6\x5d\x2e\x97\x43\x53\x4b\x2b\x44\x1c\x7b\
+\xf7\xce\xf4\x14\x25\xae\xf1\x8a\xf5\x77\x9c\xf5\x70\x02\xc2\xd9\
+\x0f\x89\xd1\x81\x03\x4f\x8e\xf7\xdc\xd2\x69\xe7\xf3\xdf\x75\xfc\
+\x6f\x14\x2e\x36\xd2\xef\xd8\x17\x69\x49\xbe\x2c\x9d\xc8\xd3\x96\
+\x3b\xa7\x0f\x31\x8c\x25\xc6\xdf\x9f\xba\x77\x5f\x71\x35\xa0\x41\
+\x6c\xb5\x08\x8c\xf9\x94\xf1\xe0\xf0\x33\x4b\x9a\x7c\x68\x13\x5a\
+\xbd\xce\xa3\xd9\x6b\x4f\x48\xf7\x0c\x0f\xb0\x0f\xfe\xf3\x87\xc8\
+\xf9\x2f\xee\xb9\x49\x6e\x00\xf6\x7b\x3e\xed\xf7\x08\x1e\x2a\x3e\
+\x5d\xe5\x58\xaa\xf1\x47\x5a\xf5\xb6\x59\x0b\x11\x1d\xb3\x43\xc9\
+\x91\x38\x09\x39\xf9\xa9\x96\x21\xfa\x5c\x1a\x0d\xcf\xb3\xff\xff\
+\x37\xfc\x4f\x13\xf8\x1d\xe7\x87\x19\xb9\x44\xc3\x01\xcf\x00\x00\
+\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x2c\xfd\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x80\x00\x00\x00\x80\x08\x06\x00\x00\x00\xc3\x3e\x61\xcb\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x00\x07\x74\x49\x4d\x45\x07\xd6\x05\x02\x09\x22\
+\x0e\x25\x81\x42\xc1\x00\x00\x20\x00\x49\x44\x41\x54\x78\x9c\xed\
+\x9d\x69\x8c\x25\xd7\x75\xdf\x7f\xb7\xea\xad\xfd\x7a\x9b\x9e\xe9\
+\xe9\x6d\x38\xdd\xd3\x9c\x8d\xa3\x19\xce\x90\x12\x25\x92\xa2\x28\
+\x51\x94\x29\x59\xb1\xe5\x58\x81\x19\x41\x31\x02\x27\x08\x10\x38\
+\x41\x12\x7f\x10\x23\x51\x91\x91\x06\x8c\x09\x69\xc0\xa0\x83\x20\
+\x91\x40\x07\x30\x04\xc5\x0a\x62\xc8\xb2\x2d\xdb\x90\xe9\x38\xb4\
+\x62\x5a\x62\x48\x51\x1c\x52\x5c\x35\x4b\x0f\x7b\x99\xe9\x6d\x7a\
+\x7b\x4b\xbf\xad\xaa\xee\xcd\x87\x7a\xb7\x5e\xbd\xea\xaa\xf7\x5e\
+\x4f\xf7\x74\x8f\x60\xfd\x1b\x85\xda\x6e\xd7\xbb\x75\xcf\xb9\xe7\
+\x9c\x7b\xee\x39\xb7\xe0\x67\xf8\x19\x7e\x86\xbf\xbf\x10\x7b\x5d\
+\x81\xad\xe2\xb7\x7f\xfb\xb7\xbb\x2c\xcb\xea\x8e\xc7\xe3\xdd\x52\
+\xca\x0e\x00\x21\x44\x5a\x29\x95\xd2\x65\xa4\x94\x8e\x61\x18\xb9\
+\xda\xbd\x32\x90\x2f\x97\xcb\xeb\x13\x13\x13\xb9\x3d\xaa\xf6\x6d\
+\x8b\xdb\x86\x01\x94\x52\xe2\xfc\xf9\xf3\x87\x84\x10\x47\x0d\xc3\
+\x38\x06\x8c\x03\x43\x4a\xa9\x21\x21\xc4\x30\x30\x00\xec\x67\x7b\
+\x75\x76\x80\x75\x60\x19\x98\x07\x66\x95\x52\xd7\x85\x10\xd7\x81\
+\x2b\xc0\xa5\x3b\xef\xbc\x73\xfa\xf1\xc7\x1f\x77\xb6\xf7\x36\x3f\
+\x3d\xd8\x13\x06\x78\xe6\x99\x67\xd2\x96\x65\x9d\x95\x52\xde\x2b\
+\x84\x38\xa7\x94\xba\x17\x38\x05\xa4\xf7\xa2\x3e\x01\x54\x80\x4b\
+\x4a\xa9\xb7\x81\x57\x95\x52\xaf\x9a\xa6\x79\xe1\x4b\x5f\xfa\x52\
+\x76\xaf\x2b\x76\x2b\xb0\x2b\x0c\xf0\xcc\x33\xcf\xa4\x2b\x95\xca\
+\x87\x81\x87\x81\x47\x80\xfb\x80\x64\xab\xff\x13\x42\x90\x4e\xa7\
+\xe9\xee\xee\xa6\xa3\xa3\x83\x74\x3a\x4d\x32\x99\x24\x91\x48\x90\
+\x48\x24\x88\xc5\x62\x98\xa6\x09\x80\x69\x9a\xde\xb1\x65\x59\x28\
+\xa5\x50\x4a\xe1\x38\x0e\x95\x4a\x85\x6a\xb5\x4a\xa5\x52\xa1\x52\
+\xa9\x50\x2c\x16\xc9\xe7\xf3\xe4\xf3\x79\xa4\x94\xed\xbc\x82\x02\
+\xde\x55\x4a\x7d\x4f\x08\xf1\xbd\x78\x3c\xfe\xb7\x5f\xf8\xc2\x17\
+\x96\x6f\xb2\x39\x6e\x2b\xdc\x32\x06\xf8\x9d\xdf\xf9\x9d\x03\x96\
+\x65\xfd\x02\xf0\x19\xe0\x93\x40\x47\x54\xd9\x4c\x26\x43\x7f\x7f\
+\x3f\x7d\x7d\x7d\x74\x75\x75\xd1\xdd\xdd\x4d\x26\x93\x21\x9d\xbe\
+\x75\x02\x41\x4a\x89\x52\x8a\x4a\xa5\xc2\xc6\xc6\x06\xf9\x7c\x9e\
+\x5c\x2e\x47\x3e\x9f\x67\x6d\x6d\x8d\xf5\xf5\x75\x1c\x27\x52\x13\
+\x28\xe0\x82\x10\xe2\x8f\xa5\x94\x7f\xfa\xe5\x2f\x7f\xf9\x9d\x5b\
+\x56\xd1\x5b\x8c\x1d\x65\x80\x67\x9f\x7d\x36\xbe\xba\xba\xfa\x19\
+\xe0\x9f\xe3\x12\xdd\x0c\x96\x89\xc7\xe3\x0c\x0f\x0f\x33\x3c\x3c\
+\xcc\xfe\xfd\xfb\xe9\xe9\xe9\x21\x99\x6c\x29\x0c\x76\x14\x5a\x3a\
+\x28\xa5\x3c\x46\x08\xee\x6d\xdb\xa6\x50\x28\xb0\xbe\xbe\xce\xda\
+\xda\x1a\x4b\x4b\x4b\xe4\x72\x39\x94\x52\x61\x8f\xbc\x08\x7c\xd3\
+\x71\x9c\xaf\x7f\xe5\x2b\x5f\x99\xdd\xd5\x97\xd9\x26\x76\x84\x01\
+\xce\x9f\x3f\x3f\x64\x9a\xe6\x6f\x28\xa5\x7e\x0d\x38\x18\xbc\x3f\
+\x34\x34\xc4\xf8\xf8\x38\x03\x03\x03\xf4\xf4\xf4\x60\x18\xc6\x4e\
+\xfc\xec\x4d\x23\x8a\xf8\xc1\xe3\x60\x99\x72\xb9\xcc\xfa\xfa\x3a\
+\xcb\xcb\xcb\xcc\xcf\xcf\xb3\xb1\xb1\x11\x7c\xb4\x03\xfc\x95\x10\
+\xe2\xf7\xca\xe5\xf2\x9f\x4f\x4c\x4c\xb4\xa5\x5f\xf6\x12\xdb\x62\
+\x80\xdf\xfa\xad\xdf\x3a\x12\x8b\xc5\xfe\x3d\xf0\xcf\x08\xe8\xf4\
+\xb1\xb1\x31\xc6\xc7\xc7\x19\x1a\x1a\x22\x95\x4a\x85\x3f\xa0\x4d\
+\x04\x89\x12\xdc\x82\x10\x42\x6c\x3a\xf7\x6f\x7e\x84\x11\x3b\x78\
+\x2d\xec\xba\xe3\x38\x14\x0a\x05\x16\x17\x17\x99\x9f\x9f\x27\x9b\
+\xdd\x64\x23\xbe\x2d\x84\x78\xba\x5c\x2e\xff\xaf\x89\x89\x09\x7b\
+\x5b\x0d\x70\x0b\x71\x53\x0c\x30\x31\x31\xd1\x99\x4a\xa5\xfe\xa3\
+\x52\xea\xdf\x02\x09\x7d\xbd\xb7\xb7\x97\x53\xa7\x4e\x31\x36\x36\
+\x46\x47\x47\xa4\xca\xdf\x04\xdd\xd0\x8e\xe3\x6c\xda\x47\x88\xdc\
+\xd0\x67\xc0\x66\xe2\x47\x95\xd5\x44\x54\x4a\x79\x8c\x61\x18\x06\
+\x42\x08\x4c\xd3\xf4\xa4\x54\x98\x94\x08\x93\x0e\xb9\x5c\x8e\xf9\
+\xf9\x79\xe6\xe6\xe6\x28\x97\xcb\xfe\x9f\xbb\x22\x84\xf8\xc2\x97\
+\xbe\xf4\xa5\xef\xb4\xdd\x20\xbb\x88\x2d\x33\xc0\xd3\x4f\x3f\xfd\
+\x39\xa5\xd4\x33\xc0\x90\xbe\x36\x34\x34\xc4\xb9\x73\xe7\x18\x1e\
+\x1e\x6e\x8b\x00\x52\x4a\x2c\xcb\xc2\x71\x1c\x6c\xdb\xf6\x8c\x2d\
+\x4d\x44\x3f\xd1\xa3\x8e\xb7\x0a\x7f\xbd\x82\x3d\x3b\x6c\x2f\xa5\
+\xc4\x30\x0c\x4c\xd3\x24\x91\x48\x10\x8f\xc7\x31\x0c\x23\x92\x09\
+\xf4\xb1\x6d\xdb\x2c\x2e\x2e\x32\x33\x33\x13\x94\x0a\xcf\x29\xa5\
+\xfe\xdd\x97\xbf\xfc\xe5\x4b\x37\xfd\x12\xb7\x00\x6d\x33\xc0\xc4\
+\xc4\x44\x67\x32\x99\xfc\x1a\xf0\xab\xfa\xda\xe0\xe0\x20\x1f\xfa\
+\xd0\x87\xe8\xef\xef\x8f\x24\xbc\x6e\x1c\xcb\xb2\xb0\x2c\xcb\x23\
+\x78\x90\xd8\xad\xf6\x3b\x89\x66\xc6\x9f\x26\x7e\x58\xcf\x37\x0c\
+\x83\x44\x22\x41\x32\x99\x24\x95\x4a\x21\x84\x88\x54\x4f\xb6\x6d\
+\xb3\xba\xba\xca\x95\x2b\x57\xc8\xe5\x3c\x07\x64\x09\xf8\x8d\x27\
+\x9f\x7c\xf2\xf7\x76\xfc\xa5\x6e\x12\x6d\x31\xc0\xf9\xf3\xe7\xef\
+\x36\x0c\xe3\x0f\x81\x93\x00\x1d\x1d\x1d\x3c\xf8\xe0\x83\x8c\x8d\
+\x8d\x85\x12\x5e\x37\x82\x1e\x7b\xdb\xb6\x1d\xaa\xb7\x9b\xf5\xf8\
+\x9d\x94\x02\x61\x7a\x3f\x48\xf0\x28\xa9\x10\x76\xac\xcf\x93\xc9\
+\x24\x99\x4c\x86\x4c\x26\x83\x10\x22\x54\x32\x38\x8e\xc3\xc2\xc2\
+\x02\x57\xae\x5c\xa1\x52\xa9\xe8\x2a\x7c\xab\x52\xa9\xfc\x8b\xdb\
+\xc1\x35\xdd\x92\x01\x9e\x7a\xea\xa9\xc7\x80\x3f\xa1\x36\x8e\x3f\
+\x7e\xfc\x38\x0f\x3c\xf0\xc0\xa6\xa1\x9b\x26\x8c\x65\x59\x94\xcb\
+\x65\xaa\xd5\x6a\x68\xef\xf0\x97\xbf\xd9\xde\xbf\x55\x26\x68\xc5\
+\x00\x61\x3d\x3f\x8a\x09\xb4\xf4\xf2\x5f\x07\xd7\x97\xd1\xd3\xd3\
+\x43\x3a\x9d\x0e\x95\x08\x95\x4a\x85\x4b\x97\x2e\x31\x3f\x3f\xaf\
+\xeb\x30\xe9\x38\xce\xcf\xfd\xe6\x6f\xfe\xe6\x7b\x5b\x7a\x99\x1d\
+\x46\x53\x06\x78\xfa\xe9\xa7\x7f\x51\x29\xf5\x2d\x20\x19\x8b\xc5\
+\xf8\xe8\x47\x3f\xca\x9d\x77\xde\xe9\x35\x68\xf0\x05\x4b\xa5\x52\
+\x83\x17\x2e\x8c\xe0\x41\xc2\x37\xeb\xfd\xcd\x7a\x7e\xbb\x4c\x10\
+\x36\x22\x68\xa6\xff\xa3\x8e\xa3\xa4\x43\xf0\x3c\x91\x48\xd0\xd7\
+\xd7\x47\x6f\x6f\xef\xa6\xf7\x74\x1c\x87\xc5\xc5\x45\xde\x7d\xf7\
+\x5d\x6c\xdb\x06\x98\x33\x0c\xe3\x13\x5f\xfc\xe2\x17\xdf\x6d\xeb\
+\x65\x6e\x01\x22\x19\xe0\xe9\xa7\x9f\x7e\x48\x29\xf5\x3c\x90\x48\
+\xa7\xd3\x7c\xe2\x13\x9f\x60\x78\x78\x18\x68\x24\x50\xa5\x52\xa1\
+\x50\x28\x34\x88\x79\x7d\x2f\x6c\xd3\x88\x62\x84\x9d\x96\x02\xcd\
+\x54\x54\xb0\x57\x37\x23\x6c\xd4\x70\x30\x4a\x9a\x24\x12\x09\x86\
+\x86\x86\xe8\xee\xee\xde\xd4\x1e\xd9\x6c\x96\x37\xde\x78\x83\x52\
+\xa9\x04\xb0\x04\x3c\xf0\xe4\x93\x4f\x5e\x6d\xeb\x85\x76\x18\xa1\
+\x0c\x70\xfe\xfc\xf9\x01\xc3\x30\x2e\x00\xc3\x99\x4c\x86\x4f\x7d\
+\xea\x53\xf4\xf7\xf7\x03\x78\x22\xcf\xb6\x6d\xb2\xd9\x2c\xd5\x6a\
+\xb5\x2d\xa2\xb7\xba\xae\xb1\x93\x52\x20\xac\xf7\xeb\x77\x08\x23\
+\x6c\x2b\x29\x10\xc6\x24\xfe\xde\xad\xeb\xe4\x2f\x93\xc9\x64\x18\
+\x1d\x1d\x25\x99\x4c\x36\xbc\x53\xb1\x58\xe4\xc2\x85\x0b\xda\x99\
+\xf4\x5a\xa5\x52\x79\x68\x62\x62\xa2\xd8\xf4\x85\x6e\x01\x62\x61\
+\x17\x0d\xc3\xf8\x3a\x30\x9c\x4c\x26\x79\xe4\x91\x47\x38\x78\xf0\
+\x60\xc3\x8b\x95\xcb\x65\xb2\xd9\x6c\xe4\xd8\x18\xa2\x99\xe1\x66\
+\xa4\x80\xbf\x7c\x10\x51\x4c\x10\xd6\xf3\x83\x0c\x10\xd4\xe7\x61\
+\x04\x0e\x2b\x13\xf6\x3f\x51\x8c\x91\xcb\xe5\x78\xeb\xad\xb7\x18\
+\x1b\x1b\x63\xff\xfe\xfd\x5e\x5d\x32\x99\x0c\xf7\xdc\x73\x0f\xaf\
+\xbc\xf2\x0a\x95\x4a\xe5\x9e\x64\x32\xf9\xbb\xc0\xbf\x0c\x7d\x99\
+\x5b\x88\x4d\xad\x74\xfe\xfc\xf9\x47\x0d\xc3\xf8\x3f\x00\x0f\x3e\
+\xf8\x20\x77\xdf\x7d\x37\x50\xef\xf9\x7a\x16\xad\x59\x6f\xb8\x19\
+\x29\xa0\xd1\x8a\x11\xda\x65\x82\xa8\xde\xaf\xdf\x25\x4c\x7c\xeb\
+\x67\x45\x11\xb4\xd9\xfb\xb6\x52\x0f\x4a\x29\xee\xb8\xe3\x0e\xee\
+\xb8\xe3\x0e\x94\x52\x5e\x7d\xe6\xe7\xe7\x79\xed\xb5\xd7\xc0\x9d\
+\x60\x7a\xff\x93\x4f\x3e\xf9\x5a\x24\xb5\x6e\x01\x36\x49\x00\xc3\
+\x30\xce\x03\x0c\x0c\x0c\x70\xd7\x5d\x77\x79\x46\x13\x40\xa1\x50\
+\x20\x9b\xcd\x46\xf6\xf6\x60\x23\xf8\xef\xb5\x62\x08\xff\xb9\x3e\
+\xf6\xef\x35\xa2\x7a\xbc\xbe\x1e\xe5\x8f\x08\x1a\xae\xed\x10\xf8\
+\x66\x08\xde\xac\xcc\xd4\xd4\x14\x86\x61\x30\x32\x32\xa2\xdb\x9a\
+\xa1\xa1\x21\xe6\xe6\xe6\x58\x5c\x5c\x14\xc0\x7f\x02\x7e\xbe\x25\
+\xd5\x76\x10\x0d\xad\xf5\xd4\x53\x4f\xdd\x03\x5c\x00\x78\xec\xb1\
+\xc7\x38\x7a\xf4\xa8\xd7\x1b\xca\xe5\x32\x37\x6e\xdc\x68\x20\x7c\
+\x58\x4f\x82\xf0\x46\xf6\x5f\x6f\x46\xf8\xe0\x79\xbb\x52\xa0\xe5\
+\x8b\x86\x78\x02\xc3\xea\x13\x74\x52\xed\x14\xf1\xfd\xdb\xb9\x73\
+\xe7\xe8\xeb\xeb\x03\x5c\x26\x58\x5a\x5a\xe2\xa5\x97\x5e\xd2\xe7\
+\x27\xbf\xf8\xc5\x2f\x5e\xdc\xf2\x0b\xde\x24\x82\x12\xe0\x97\x00\
+\x52\xa9\x14\xa3\xa3\xa3\x0d\xce\x8d\xd5\xd5\x55\xcf\xd0\x89\x22\
+\x7c\xf0\x3a\xb4\xb6\x05\xda\x91\x02\x1a\x37\xcb\x04\x41\xa9\xd0\
+\xaa\xa7\x87\x31\x73\x3b\x4c\x1d\xd6\x31\xfc\x6d\xa3\xf7\x3f\xf9\
+\xc9\x4f\xb8\xff\xfe\xfb\x31\x4d\x13\x21\x04\x07\x0f\x1e\x24\x95\
+\x4a\x51\x2e\x97\x51\x4a\xfd\x32\xf0\x74\xdb\x2f\xb7\x4d\x34\x30\
+\x80\x10\xe2\x17\x95\x52\x8c\x8d\x8d\x91\x4c\x26\xbd\x17\x29\x16\
+\x8b\x9e\xb5\xdf\xce\xe4\x48\x58\x23\x84\x35\x46\x14\x43\xf8\xef\
+\x05\xaf\x69\x6c\x87\x01\xc2\x98\xd4\x6f\xc5\x37\xab\x77\x54\x9d\
+\x9b\xf5\xf8\xe0\x3b\xe7\xf3\x79\x96\x96\x96\x18\x19\x19\xf1\x26\
+\xa0\x86\x86\x86\x78\xef\xbd\xf7\x50\x4a\xfd\x12\xbb\xc8\x00\xde\
+\xc4\xfc\xc4\xc4\x44\xaf\x52\xea\x1e\xc0\x1b\xef\x83\xdb\x78\x95\
+\x4a\x25\x74\x96\x4e\xab\x07\xc7\x71\xbc\x7b\xfe\xf3\xb0\xeb\x7a\
+\x2e\x40\xef\xc3\x36\xdb\xb6\x43\xcb\x05\x7f\x2b\xea\xff\x83\xbf\
+\x1d\xf5\x3f\x7a\xf2\xc6\xb6\xed\x96\xcf\xd3\xf5\xf0\x7b\x0c\xc3\
+\xde\xbd\x99\x93\xc9\xdf\x86\xd9\x6c\xb6\x61\x16\xb2\xa7\xa7\x47\
+\x37\xf9\x07\x27\x26\x26\xba\x77\x8b\x01\x3c\x09\x90\x4a\xa5\x46\
+\x94\x52\x02\x5c\x5f\xbf\xbf\xd7\xf8\x27\x70\x82\xbd\x3d\x28\xf6\
+\x5a\x59\xc3\xd0\x9e\x5a\xf0\x97\x0b\x5e\xd3\x68\x47\x0a\xf8\xdf\
+\x43\xab\x34\x7f\x7d\xa3\xd4\x95\x3e\x8f\x12\xf9\xed\xbe\x47\xd4\
+\xfb\x5b\x96\xe5\xf5\x7e\x21\x84\xdf\xb5\x6e\x24\x12\x89\x43\xc0\
+\xae\x84\x99\x79\x0c\xa0\x94\x1a\xf2\xdf\xd0\xfa\x49\x4a\x89\x69\
+\x9a\x6d\xb9\x4a\x9b\xe9\xcb\x56\x5b\xb0\xc1\xfc\xd7\x7d\x75\x6c\
+\xd8\x07\x8f\x83\x08\x12\x3f\xf8\x1b\xcd\xec\x14\x20\x94\x69\x83\
+\xc7\xad\xca\x44\x3d\x37\x95\x4a\x61\x18\x86\xc7\x04\xd5\x6a\xd5\
+\x5f\xd7\x61\xf6\x80\x01\x52\xba\x91\x2c\xcb\xf2\x38\x52\x4a\x49\
+\x47\x47\x47\x24\xb1\xc3\xc6\xcc\xdb\x61\x06\xdd\x78\xc1\x46\x0c\
+\x5e\xf7\xd5\x3b\xf2\xe5\xc2\x18\x40\xbf\x93\xfe\xdf\x20\x13\x44\
+\x5d\x6f\x87\xc8\x51\x75\x0f\xfb\x9f\xc1\xc1\xc1\x86\x20\x14\x7f\
+\xec\x80\x52\xaa\xfd\x68\x9a\x6d\xc2\x63\x00\xc3\x30\x66\x75\x25\
+\xfd\xd1\x3c\x7a\xca\xb3\xb3\xb3\x93\xf5\xf5\xf5\x48\xc2\x47\x49\
+\x82\x76\x1c\x24\xfe\x86\xd9\x29\x29\x10\xe5\x08\xf2\xf7\xc2\x66\
+\xbf\x1b\xfc\xad\x76\x89\xde\xac\x8c\x3e\x1e\x19\x19\x61\x60\x60\
+\xc0\x25\x40\x2c\x86\x6d\xdb\x2c\x2d\x2d\xf9\xeb\x3a\x1f\x4a\xad\
+\x5b\x00\xff\x28\x60\x4a\x1f\xf8\x83\x36\x63\xb1\x18\xb1\x58\x8c\
+\xa1\xa1\x21\xf2\xf9\x7c\xc3\x68\x20\x4c\x12\x40\xb4\x3d\xd0\x4a\
+\x0a\xf8\xc5\x29\xb4\xd7\xd8\xed\x40\x13\x3f\x38\x67\x1f\x46\x9c\
+\x30\x89\x10\xfc\x5d\x7f\x99\x60\x5d\xfc\xcf\x09\x7b\x7e\x32\x99\
+\xe4\xbe\xfb\xee\x6b\x08\x3d\x5b\x58\x58\xc0\xb2\x2c\xef\x19\x86\
+\x61\x5c\x6f\xfb\xe5\xb6\x09\x8f\xd2\xb5\xcc\x97\x2c\xe0\xf5\x74\
+\x8d\x74\x3a\x4d\x2a\x95\x62\x7c\x7c\x1c\xc3\x30\x36\x59\xba\x61\
+\xe7\x41\xcb\x38\xec\xbc\xd5\x68\xc1\x3f\x1a\x08\x8e\x42\xc2\x9e\
+\xe1\x2f\xdf\xca\x9a\x8f\x7a\x46\xab\xba\x07\x67\x0e\x83\xef\xad\
+\x94\xf2\xca\x07\x99\x2d\x16\x8b\xf1\xe8\xa3\x8f\x92\xc9\x64\xbc\
+\x8e\x05\x30\x3d\x3d\xed\xa7\x89\x53\x2a\x95\x96\xd8\x25\x04\x1d\
+\x41\x53\xc0\xd9\x95\x95\x15\xc0\xe5\x5c\xad\xa7\xb4\x5a\x38\x7a\
+\xf4\x28\x97\x2e\x5d\x6a\x68\x94\xad\xa8\x85\x28\xeb\x3b\xcc\x79\
+\xd2\x8e\x68\x6e\x07\x7e\x09\x00\x8d\xbd\x3c\xf8\x3b\x1a\x61\x92\
+\x28\xea\xb7\x5b\x3d\x47\x29\x45\x3a\x9d\xe6\xe3\x1f\xff\x38\x07\
+\x0e\x1c\xf0\x7a\xbf\x10\x82\xcb\x97\x2f\xb3\xb1\xb1\xe1\xd5\x09\
+\xb8\xb1\x9b\x51\xc4\x41\x06\x98\x01\xce\x2e\x2f\x2f\x7b\x95\xd7\
+\x8d\xa6\x99\xc0\x30\x0c\x4e\x9f\x3e\xcd\xc5\x8b\x17\x37\xcd\x0b\
+\x04\xd5\x40\x94\x5a\x08\x5e\x0b\x32\x43\x14\x43\xe8\xfb\x61\xfb\
+\x28\x04\x89\xdf\x8e\x7e\x6f\xf7\xb7\xa2\xd4\x55\xb0\xcc\xc1\x83\
+\x07\x79\xe4\x91\x47\xbc\xd0\x31\x4d\xfc\x85\x85\x05\x26\x27\x27\
+\x3d\xa9\x5a\x2b\x7f\xad\xe9\x0b\xed\x30\x1a\x18\x40\x29\x35\x15\
+\xb4\x48\xa5\x94\x0d\x0e\x8b\x74\x3a\x8d\x69\x9a\x9c\x39\x73\x86\
+\xb9\xb9\x39\xa6\xa7\xa7\x3d\x47\x51\x18\xf1\xdb\x91\x0e\xfa\x7f\
+\xc2\x6c\x81\x56\x3a\xbb\x5d\xe8\x77\x68\xf5\x1c\x7d\x2d\x58\xd6\
+\x7f\x3f\x78\x1c\xc5\x20\xc9\x64\x92\x7b\xef\xbd\x97\x53\xa7\x4e\
+\x79\xbf\xaf\xf3\x17\x17\x16\x16\x78\xf5\xd5\x57\xbd\x51\x80\x6e\
+\x87\xdd\x34\x00\x21\x5c\x02\x50\x28\x14\x90\x52\x7a\x61\xd0\x9a\
+\x09\x74\x65\x75\x62\xe6\xe8\xe8\x28\x83\x83\x83\x4c\x4f\x4f\x33\
+\x3d\x3d\xdd\xb6\x37\x2c\x4a\x2d\xb4\x32\x12\xa1\xb5\x38\xf6\x23\
+\xd8\xfb\xfd\x8e\xa0\xb0\xe7\xf8\x11\x54\x13\x41\x34\x53\x05\xb1\
+\x58\x8c\x33\x67\xce\x70\xee\xdc\x39\x6f\x38\xad\xc7\xfc\x4a\x29\
+\x2e\x5f\xbe\xcc\x6b\xaf\xbd\xe6\x45\x16\x07\x18\x6d\x4f\x19\x60\
+\x0a\xdc\x17\xa9\x54\x2a\x0d\xc9\x99\x9a\x38\x5a\x7c\x99\xa6\x49\
+\x32\x99\x24\x16\x8b\x71\xfc\xf8\x71\x46\x47\x47\x99\x99\x99\x61\
+\x6a\x6a\x8a\x62\xb1\xd8\x40\xb8\x30\x43\x29\x78\x1e\x35\x82\xf0\
+\x5f\xbb\x59\x29\x10\xcc\x08\x8a\xea\xd9\x9a\x18\xba\x47\x06\xd5\
+\x46\x10\xc1\xeb\x1d\x1d\x1d\x9c\x39\x73\x86\xd3\xa7\x4f\x7b\x84\
+\xf7\xf7\x7a\xcb\xb2\x78\xf5\xd5\x57\xb9\x7a\xd5\x8d\xfe\xd2\xa3\
+\x00\xff\x08\x00\x98\x6b\xeb\xa5\x76\x08\x0d\x0c\x60\x9a\xe6\x8c\
+\x26\x44\xa9\x54\xda\x94\x9d\xab\x09\x16\x8b\xc5\x36\x65\xd2\xc4\
+\xe3\x71\x4e\x9c\x38\xc1\xf8\xf8\x38\x0b\x0b\x0b\xcc\xcc\xcc\x30\
+\x3f\x3f\xdf\x92\xf8\xed\xa8\x85\x28\x9f\x81\x3e\xf6\xef\xfd\xf0\
+\xf7\xfc\x30\x15\x10\x84\x26\x7a\xd0\x1e\x69\x16\x57\x68\x18\x06\
+\x63\x63\x63\x9c\x3c\x79\xd2\x1b\x25\xe9\xdf\xd4\xed\x03\xb0\xb8\
+\xb8\xc8\xcb\x2f\xbf\x4c\x3e\x9f\xf7\xb7\x77\x83\x54\xaa\x61\xd7\
+\x86\x80\x10\x60\x00\xc3\x30\xa6\xf4\xcb\xe7\xf3\x79\x6f\xce\x5a\
+\x43\x57\x56\xfb\xb1\xf5\x0b\xf8\x6d\x04\xad\x1a\x0e\x1d\x3a\x44\
+\xb9\x5c\xe6\xda\xb5\x6b\x5c\xbf\x7e\x9d\x85\x85\x85\x4d\x93\x48\
+\xad\x6c\x84\x56\x2a\x21\x4c\xfc\xfa\xeb\x1a\x3c\xf7\xf7\xf0\xad\
+\xd8\x10\xc1\xb2\xa6\x69\x32\x3a\x3a\xca\xf8\xf8\x38\xc7\x8e\x1d\
+\xf3\x42\xc1\x83\x29\x66\x4a\xb9\x33\xa9\x6f\xbe\xf9\x26\x57\xaf\
+\x5e\xf5\x5b\xfa\xde\x73\x80\x86\xeb\x7b\x6a\x03\x3c\xf1\xc4\x13\
+\x4b\x4f\x3d\xf5\x54\x09\x48\xfb\xb2\x59\x42\xa1\xc7\xcd\x7a\x61\
+\x06\xbf\x98\xd5\xcc\xa1\xa5\xc2\xb1\x63\xc7\xb0\x2c\x8b\xf9\xf9\
+\x79\xe6\xe7\xe7\x59\x58\x58\x60\x65\x65\x25\x52\x15\x34\x33\x1a\
+\xa3\xec\x02\xff\x1e\xc2\x7b\xff\x56\x10\x74\x23\xf7\xf7\xf7\x73\
+\xe8\xd0\x21\x0e\x1f\x3e\xcc\xe8\xe8\xa8\x37\x86\xd7\xf7\xfd\xbd\
+\x1d\xa0\x5c\x2e\x73\xe9\xd2\x25\x2e\x5d\xba\x14\x14\xf1\x5e\x1b\
+\xf9\xf3\x0f\x35\x94\x52\x7b\xa7\x02\x6a\x98\x06\x4e\xae\xae\xae\
+\xb6\xf5\x00\xed\x7c\xd1\xbd\xdf\x3f\xc3\xa5\x45\xa4\x52\xae\x13\
+\xe4\xc8\x91\x23\x8c\x8d\x8d\xa1\x94\x1b\x58\xba\xb8\xb8\xc8\xf2\
+\xf2\x32\x37\x6e\xdc\x60\x69\x69\xc9\x1b\x56\x86\x39\x96\xc2\x6c\
+\x8a\x28\x29\x10\xd6\xfb\xfd\xde\xcd\xa8\x80\x51\xdd\x8b\x7b\x7a\
+\x7a\x18\x1c\x1c\x64\x60\x60\x80\x81\x81\x01\x46\x46\x46\x36\x65\
+\x38\xfb\x19\xcb\x2f\x51\x72\xb9\x1c\x97\x2f\x5f\x66\x6a\x6a\xca\
+\x9b\x66\xf6\x43\x97\xd3\x9d\x06\x1a\x19\x40\x4a\xb9\xb7\x0c\xa0\
+\x94\x9a\x16\x42\x9c\xf4\xfb\xa6\x5b\x41\x29\xe5\x31\x82\x10\xc2\
+\xf3\x72\x85\x8d\xc1\x75\x03\x64\x32\x19\x8e\x1c\x39\xc2\x91\x23\
+\x47\xbc\x6b\xd5\x6a\x95\xd5\xd5\x55\xd6\xd6\xd6\x58\x5b\x5b\x23\
+\x9b\xcd\x7a\x2b\x77\x14\x0a\x05\x6f\x49\x97\x56\xa3\x84\x28\xdd\
+\xaf\xaf\x77\x76\x76\xd2\xd9\xd9\x49\x77\x77\x37\x9d\x9d\x9d\xf4\
+\xf6\xf6\xb2\x6f\xdf\x3e\xfa\xfa\xfa\xd8\xbf\x7f\x3f\x89\x44\x82\
+\x30\x44\x49\x13\xcb\xb2\x98\x9d\x9d\x65\x76\x76\x96\xe5\xe5\xe5\
+\x86\x21\x71\xb0\x9d\x34\xfc\x12\xa0\x96\x24\x52\x7b\x94\x75\xa3\
+\xed\x86\xdf\x01\x6c\x62\x00\x21\xc4\x34\x80\x96\x00\xad\x2c\x61\
+\xdf\xff\x79\xbd\x53\xaf\xc5\xa3\xd5\x83\xce\xac\x0d\xea\xde\xa0\
+\xe8\x4e\xa7\xd3\x8c\x8c\x8c\x34\x04\xa4\x04\x7b\x79\xb9\x5c\xf6\
+\xb6\x52\xa9\xe4\x45\xf2\x54\xab\x55\xef\x58\x67\xf4\xea\xe3\x54\
+\x2a\xe5\xb9\xb3\xdb\x59\xab\x20\x6c\xf8\x18\x44\xa9\x54\x62\x69\
+\x69\x89\x85\x85\x05\x96\x96\x96\x42\x7b\xbb\x1f\xc1\xf6\xd3\xd2\
+\x12\xf0\x2f\x45\xb3\xb8\xdb\x8b\x4a\x84\x32\x80\x52\xca\x0b\xfd\
+\x8e\xd2\x9d\xed\x18\x52\xb6\x6d\x7b\xb9\x82\xda\x2e\xf0\x4b\x87\
+\x66\x0d\x0c\xe1\x9e\xb7\x4c\x26\xb3\xa5\xb5\x07\xa2\x10\x35\x55\
+\x1c\x05\xcb\xb2\x3c\xc9\xb4\xbc\xbc\x4c\x2e\x97\x6b\x98\x27\x68\
+\x86\xb0\x76\xf2\xaf\x41\xa0\x25\xc0\x6e\xeb\x7f\x88\x50\x01\xe0\
+\xea\xa5\x6a\xb5\xba\x63\xeb\xf7\xe8\x89\x18\xbd\x78\x82\x66\x08\
+\xcd\x14\xfe\x55\xbe\x34\xb6\x62\xb8\x35\x1b\x06\x6e\x15\xd5\x6a\
+\xb5\x61\x25\xb1\x5c\x2e\xe7\xf9\xeb\x83\x36\x49\xab\x3a\x45\x95\
+\xf1\x4b\x00\xcd\x00\xc2\x5d\xaf\x70\x57\x11\x29\x01\xc0\x15\xb7\
+\x7e\x87\xc6\x56\x86\x4e\xad\xa0\x19\x22\xa8\xbb\xfd\x92\x42\xeb\
+\x49\xcd\x1c\xcd\xd6\x16\xda\x0a\xb1\xb5\xbd\xa2\xd7\x2c\xa8\x54\
+\x2a\x9e\x4a\x29\x16\x8b\x58\x96\xb5\xc9\xab\xe9\x47\x3b\xed\xd0\
+\xaa\x8c\x96\x82\x7e\xbf\xc7\x6d\x21\x01\x6c\xdb\x9e\xd6\x3d\x71\
+\x63\x63\xc3\x1f\xac\x78\xcb\xa1\x1b\xdb\x9f\x61\x0c\x8d\xf3\x01\
+\xfe\x51\x46\x33\x31\x1e\x9c\x69\x94\xb2\x31\x00\x34\x6c\xbb\x59\
+\x71\x7e\x33\x65\x34\x83\xfb\x43\xc1\x0c\xc3\x58\x68\xf9\x8f\x3b\
+\x8c\x4d\x0c\x70\xfc\xf8\xf1\xb9\xc9\xc9\x49\x0b\x88\xe7\x72\xb9\
+\x06\x83\xac\x5d\x6c\x45\x5a\x34\x2b\x1b\xbc\xa7\xbd\x74\xad\xbc\
+\x82\x51\xd8\x8a\x91\x76\x2b\xcb\x00\x9e\x61\xec\x5f\x8b\x50\x4a\
+\xb9\xeb\x2a\x60\x93\x4c\x7d\xfc\xf1\xc7\x1d\x21\xc4\x35\x80\xb5\
+\xb5\x35\xa0\xb5\x78\xdd\x8a\xf8\xbd\x59\xbd\x7c\x2b\xb1\xdb\xc4\
+\x87\xba\x04\xf0\x33\x80\x61\x18\xbb\xae\x02\x42\x95\xaa\x36\x04\
+\x6f\xdc\xd8\xd5\x21\xe9\x9e\x60\x37\x89\xaf\xcb\x68\xa3\xd7\x30\
+\x0c\xbf\x0f\x00\x76\x79\x22\x08\x22\xd2\xc3\x71\xbd\x81\xe8\xc0\
+\x10\xd8\x79\x23\x70\xaf\xb1\x5d\x2b\x7e\x3b\x65\xc2\x46\x00\xb5\
+\xeb\xbb\x3a\x0f\x00\x2d\x24\x40\x30\x36\x70\x6f\xa1\x58\x2e\xcd\
+\x52\x71\x36\xad\xce\xb9\xf5\x27\xed\x41\xaf\xf7\xc3\xef\x07\xf1\
+\x19\x81\x95\xbd\x58\x80\x3a\x54\x02\x68\x6f\xa0\x0e\xa0\xf4\x4f\
+\x7c\xd4\xee\xdf\x32\x23\x2f\xaa\xec\xa5\x95\x97\x78\x67\xf9\xfb\
+\x18\x22\xc6\xd9\xfe\x4f\x70\x47\xcf\xfb\x6e\x8a\x39\xf7\x9a\xf8\
+\x50\x37\x00\xa1\xc1\x07\xb0\xeb\xe2\x1f\x22\x24\x00\xbe\x10\xf1\
+\xc0\xaa\x97\x2d\x71\xab\x8c\xbc\x6c\xd5\x9d\x9b\xb0\x9c\x32\x2f\
+\xcf\xfd\x29\x2f\x5e\xfb\x23\xaa\x4e\x69\x4b\xcf\xb8\x1d\x88\x0f\
+\x75\x06\xf0\x07\x83\x28\xa5\x76\x5d\xfc\x43\x34\x03\xcc\xe8\x83\
+\xda\x42\x46\x7b\x6e\xbd\x1b\x35\x61\x25\x10\x18\xc2\xe0\x5a\xee\
+\x1d\xbe\x7b\xe5\xbf\x71\xbd\xd0\xde\xc2\x9b\xb7\x0b\xf1\x01\x12\
+\x89\x84\xc7\x00\xbe\xb5\x03\x6f\x1f\x06\xa8\x54\x2a\x33\x80\x04\
+\x1a\x22\x58\xf6\x92\x09\x84\x70\xab\x6a\x1a\x26\x77\x1d\xfa\x10\
+\xc9\x58\x07\x65\x3b\xcf\x0b\x53\xff\x83\x97\xae\xff\x31\x55\xa7\
+\xd2\xe2\x09\xcd\xb1\x9b\x0c\xe2\x57\x01\xbe\x58\x81\x5d\x8d\x06\
+\xd6\x08\x65\x80\x89\x89\x89\x2a\xb0\x00\xae\x21\x78\x3b\xc0\x14\
+\x71\x00\xa4\x92\xc4\x0f\xa6\x39\x75\xec\x41\x0e\x74\x1d\x02\x60\
+\x72\xf5\x47\xfc\xc5\xe5\xdf\x65\x61\x63\x72\xcb\xcf\xdd\xed\xd1\
+\x00\xb8\xd1\xc2\x42\x88\xe0\x07\x29\x6e\x1f\x09\x50\xc3\x14\x34\
+\x0e\x05\xc3\xb0\x53\x4e\xa0\xb0\x20\x0e\x3f\x8c\x9a\x04\x50\x4a\
+\x21\x71\x90\x9d\x36\xa3\x47\x4f\x71\xe7\xc8\x39\x62\x66\x9c\x42\
+\x75\x95\xff\x3d\xf9\x2c\xaf\xcc\xfd\x39\x8e\x6c\x2f\xaf\x62\xaf\
+\xd4\x82\x56\x01\xfe\x48\xa1\xdd\x0e\x05\xd3\x88\x64\x00\xa5\xd4\
+\x0c\x10\x4c\x5a\xdc\x23\xaf\x9f\x22\x5b\x5d\x46\xd4\x96\x34\xb2\
+\x9c\x2a\x8e\x72\xb0\xe2\x55\xba\x0f\x1d\xe0\xf4\x89\x87\xe8\x4e\
+\xef\x47\x29\xc9\xdb\x37\xfe\x2f\x7f\x76\xf9\x19\x56\x4a\xcd\x3f\
+\xdc\xb1\x97\x36\x41\x32\x99\xdc\xc4\x00\x8e\xe3\xec\xba\x1b\x18\
+\xa2\x1d\x41\x50\x93\x00\xed\x86\x86\xed\x34\x0a\xd6\x3a\x73\xb9\
+\x8b\x2c\x6d\x4c\xb1\x5e\x5e\xc2\x72\x6a\xa3\x11\x01\x8e\xb2\x10\
+\x18\xf5\x78\x85\x5e\xc1\xf1\x53\xf7\x31\x3f\x3d\xc9\xec\x8d\x9f\
+\x90\x2d\x2f\xf2\x17\x97\xfe\x0b\x67\x07\x7e\x8e\xb3\x83\x9f\x40\
+\x04\xf8\x7c\x2f\x89\x1f\x8f\xc7\xbd\x69\x6f\xff\x44\x50\x2c\x16\
+\xdb\x93\x61\x60\x24\x03\x18\x86\x31\xa3\x94\x1b\xbb\xa7\x93\x44\
+\x6e\x35\x14\x8a\x85\xc2\x15\xa6\xb3\x6f\x91\x2d\x2f\xe1\x48\x1b\
+\xa9\x1c\x94\xb2\x11\x08\x4c\x33\x46\x22\x99\xc2\x16\x16\x86\x32\
+\x41\x29\x14\xee\x52\x67\x2a\xe5\x70\xf0\xe8\x28\xdd\xbd\xfb\xb9\
+\xf2\xde\x6b\x94\xad\x0d\x5e\x5f\xfc\x2b\x66\x73\x6f\xf3\x91\xc3\
+\x9f\xa7\x27\xe9\x7e\xc9\x66\xaf\x47\x03\x11\x06\x20\xa5\x52\x69\
+\x4f\x54\x40\x4b\x09\x00\x2e\xa7\xea\x2c\x96\x5b\x85\xe5\xe2\x2c\
+\x57\xd7\x2e\x50\xa8\xae\x79\x3a\x3c\x66\xc4\x88\x27\x3a\x31\x53\
+\x09\x12\xe9\x14\x22\x21\x90\x09\x07\x25\xc0\x51\x0e\xa0\x3c\x26\
+\x00\x85\x10\x10\x3f\x98\xe4\x54\xe7\x03\xcc\x4e\x5e\xe4\x46\x76\
+\x96\x95\xd2\x35\xfe\xfc\xf2\xef\x72\xcf\xc1\x4f\x71\xa2\xef\xc1\
+\xa6\x75\x68\xc7\x90\xd3\xe5\x6e\xb6\x4c\x22\x91\xf0\xda\xd1\x37\
+\x04\x2c\x4d\x4c\x4c\xec\x89\xb5\xdd\x8c\x01\x3c\x5f\x40\xb9\x5c\
+\x6e\x3b\x96\x6e\xab\x1e\x42\x47\xd9\x5c\x59\x79\x85\xc5\x8d\xf7\
+\x70\xa4\xdb\xd3\x53\x89\x0c\x66\x47\x12\x33\x63\xe2\x24\x5c\x66\
+\x90\x38\x28\x14\xb2\x46\x74\xdc\xa3\x1a\x7c\x41\x25\x08\x44\x87\
+\xc1\x1d\xa7\x4e\xd0\x3d\xbf\x9f\xe9\x99\xb7\xb1\xa5\xc5\x2b\xf3\
+\x7f\xc6\x4c\xf6\x2d\xee\x1f\xf9\x15\x3a\xcc\xcd\x31\x0e\xed\x12\
+\x75\xbb\xa3\x01\xad\xff\xa1\x81\x01\xf6\x64\x08\x08\x4d\x8c\x40\
+\xd3\x34\xa7\xf4\x71\xc8\xd7\xb1\x80\xed\x8f\x00\x36\xac\x75\xde\
+\x5c\x7c\x9e\xe5\xd2\x2c\x86\x10\xa4\x13\x9d\x74\xf6\xed\x27\x3e\
+\x94\x86\x7d\x60\x27\x6c\x24\x0e\x0e\x36\x8e\x92\x38\xca\x46\xe2\
+\xaa\x05\x47\x39\x38\xca\xc6\x51\x16\x76\x6d\xd3\xe7\x8e\xb2\xb0\
+\x0c\x8b\xce\x43\xfb\xb8\xeb\xcc\xfd\x74\x67\xdc\x04\x97\xc5\xe2\
+\x55\xbe\x3b\xf9\x9f\xb9\xba\xfe\xa3\x86\x7a\xec\xa6\x5a\xf0\x3b\
+\x81\x7c\x5e\xd6\x3d\x11\xff\xd0\x84\x01\x9e\x78\xe2\x89\x0d\x60\
+\x05\xf0\x96\x34\x83\x9d\xb3\xec\xd7\xcb\x8b\xbc\x73\xe3\xef\xa8\
+\x38\x1b\x24\xcc\x14\xa9\x4c\x37\xf4\x1b\xd8\x5d\x36\xd2\x70\xdc\
+\xa1\x1e\x36\x52\x49\x1c\xe5\x20\x95\x5d\xdb\x3b\xd8\xfa\x18\x07\
+\x5b\x39\x38\xb8\xcc\xe0\x32\x82\x5d\xbb\xef\x32\x02\x5d\x06\xe3\
+\x67\xce\x32\x32\x7c\x0c\x21\x04\x96\xac\xf0\xf2\xc2\x1f\xf3\xc2\
+\xb5\x6f\x50\x96\x85\x5d\x8f\x05\xd0\x12\xc0\xcf\x00\x7b\x11\x0a\
+\xa6\xd1\xca\xb2\x9b\x02\xd0\x0b\x46\xec\x14\xd6\x2b\x8b\x4c\xae\
+\xbe\x8a\x10\x82\x64\xbc\x03\xd1\x69\x62\xf5\x5a\x38\x66\x8d\xd0\
+\xb8\x84\x96\xb5\x5e\x2e\x6b\x44\x76\x09\xae\xcf\xdd\x5e\x2f\x7d\
+\x52\xc0\xc1\xc6\xc1\xaa\x11\xdf\xc6\xa6\x76\xcf\xb4\xd8\x3f\x3e\
+\xcc\xf1\x53\x1f\x20\x15\xcf\x00\x30\xb7\x71\x91\x17\xae\x7d\xa3\
+\x65\x5d\x77\x9a\x41\x74\x8c\xa5\x52\xca\x1b\x05\xec\x95\x0f\x00\
+\x5a\x33\xc0\x0c\xb8\xb9\xec\x3b\x85\x0d\x6b\x9d\xf7\xd6\x5e\x47\
+\x18\x02\xd3\x88\x61\x75\xd8\x54\x3b\xaa\x35\x6b\x5f\xe2\x28\xe9\
+\x23\x7e\xed\x18\x2d\xee\x6d\x8f\xe0\x6e\xaf\xd7\xea\xc1\xf6\x98\
+\x45\x4b\x00\xdb\xc7\x08\x4e\x4d\x8d\xa4\x93\x9d\x1c\x1b\xb8\x87\
+\x98\xe9\xe6\x0c\xac\x57\x9a\xb7\xfb\xad\x72\x02\x01\xde\x27\x75\
+\x6a\xd8\x13\x1f\x00\x34\x37\x02\xc1\xe7\x0d\xd4\x2f\xd1\xae\x0a\
+\x08\x33\x08\x6d\x59\x65\x6a\xfd\xc7\xb8\x46\x9b\xc2\xea\xb0\xb1\
+\xd3\x16\x4a\xc9\x9a\xc8\x77\xff\x94\x72\x90\x4a\xd6\x4c\x3e\x55\
+\x63\x0e\x85\x14\x0e\x28\x6a\x65\x24\x28\xe9\x4e\x58\x08\xd9\x30\
+\x24\x14\x18\x28\x0c\x14\x26\x0a\x05\x52\x61\x2f\x59\xcc\x2f\x4c\
+\xb2\x56\x5c\x44\x4a\xc9\x81\xf4\x28\xef\xdb\xf7\x48\x64\xfd\x6f\
+\x95\x6a\xd0\x0c\xe0\x33\x00\xf7\x54\x02\x34\x65\x80\x76\x93\x44\
+\x6a\x65\x5b\x36\xc8\x6c\xee\x6d\x6c\xe9\x8a\x3d\x2b\x61\x53\x4d\
+\x55\x90\xd2\x76\x09\x0a\x2e\xc1\x95\xc4\x11\x9a\xf8\x3e\x46\xd0\
+\x2e\x60\xa5\x40\xb8\xe5\xdc\x9f\xab\xff\xb7\xcb\x04\x0a\x21\x4c\
+\x0c\x65\x50\x55\x25\x8a\xf9\x1c\x95\xe9\x12\xc5\x82\x9b\xec\x2a\
+\x30\xb8\xbb\xff\x31\x4e\xee\xfb\x08\x4a\xaa\xd0\x90\xef\x5b\x39\
+\x37\xa0\x55\x80\x9f\x01\xf6\xd2\x06\x68\x4b\x02\x80\xeb\xb4\xf0\
+\x8f\x61\xb7\x8a\xf5\xf2\x12\x85\xaa\x1b\x64\xaa\x62\x0a\xd9\xe9\
+\x4b\x88\x54\xd2\x27\xca\xa5\xd7\xd3\xa9\x0d\xfc\x74\x19\xe5\x49\
+\x08\x50\xd4\x96\xae\xc5\x1d\x12\x4a\x25\xb1\x54\x99\xb2\x2a\x52\
+\x91\x25\xca\xce\x06\x6a\x4e\x92\x58\xa9\x27\xb6\x74\x27\xfb\x79\
+\x60\xe8\x57\xd8\x97\x1c\x71\xa3\x8b\x69\x24\xd0\xad\x36\x08\xfd\
+\xc9\x2f\x7a\x9a\xbd\x56\xfe\xf6\x64\x00\x3d\x1f\x00\xae\x2f\x20\
+\x2a\x69\xb2\x15\x24\x92\x45\xdf\x4c\x9d\xdd\x29\x6b\xee\x3b\x7d\
+\x45\x78\x7b\x85\xf4\xf4\xb9\x1e\xd6\xb9\x76\x80\xc4\xc6\xae\xb1\
+\x84\xe5\x9e\xab\x2a\x96\xb4\xb0\xa9\x60\xcb\x0a\x16\x16\x12\x1b\
+\xa3\x1c\x23\x35\x9b\xc2\xac\xd4\x89\x7f\xbc\xef\x7e\xee\x1d\xf8\
+\x05\x0c\xcc\x96\x89\x9b\x51\xd8\x6e\x19\x7f\xfb\xf9\x25\x40\x3c\
+\x1e\xbf\xbd\x6d\x00\x80\x62\xb1\xe8\x7d\x01\x6b\xab\x01\xa2\xeb\
+\xa5\x79\x4f\xf4\xcb\x94\x84\x98\x02\x85\x37\xb9\xd3\x0c\x86\x6d\
+\x40\x45\x21\xaa\x80\x34\xa8\xa6\x2a\x58\xa9\x6a\x4d\x62\x58\xde\
+\x70\x50\xe1\x3a\x81\x12\xcb\x49\x92\x8b\x29\x70\xd7\xbd\x26\x15\
+\xeb\xe4\xc3\x77\xfc\x63\x86\x33\x27\xda\xca\xda\x8d\xc2\x4e\x94\
+\xf1\xa7\xd9\xf9\x7c\x00\xf9\xda\x90\x7b\x4f\xd0\x74\x14\xf0\xe4\
+\x93\x4f\xae\x01\x79\x60\xd3\xd7\xb1\xdb\x55\x05\x4a\x49\x56\x4b\
+\x35\x09\x27\xc0\x49\x07\x1b\xa9\xe6\x5f\xf0\x49\x01\x61\x09\xe2\
+\xd9\x38\xc9\x85\x24\xc9\xf9\x14\x89\xe5\x04\xf1\xf5\x38\xf1\x6c\
+\x82\xd4\x7c\x1a\x21\x8d\x86\xff\x05\x30\x1c\x83\xf4\x74\x86\xe4\
+\x42\xda\x23\xfe\xa1\xae\xbb\xf8\x87\x27\x9f\xe0\x50\xd7\x5d\x4d\
+\xea\xb7\xbb\x4e\x20\x0d\x1f\x03\xec\x99\xf8\x87\xd6\x12\x00\x5c\
+\x29\x70\x46\x27\x89\xb4\x03\xbf\x84\xc8\x57\x57\xb0\x95\xaf\xf7\
+\x7b\x34\xdb\xcc\x40\x86\x05\x66\x3e\x06\x45\x13\x47\xda\x38\x0a\
+\x1c\xe4\x26\x49\x21\x6c\xc3\xf7\xcd\x72\x88\xe5\xe3\xc4\xe7\x3a\
+\x90\xb6\x3b\xe4\x33\x8d\x38\xf7\x0d\x7f\x86\x13\xfb\x1f\x40\x10\
+\x2e\xad\x76\xca\xd8\xd3\xe5\xda\x29\x13\xc1\x00\x7b\x26\xfe\xa1\
+\x3d\x06\x98\x01\xce\x04\xe3\x02\xda\x55\x01\xb9\x4a\x2d\xb9\x44\
+\x80\x93\x6c\xfc\x1f\x4d\x56\x43\x81\x91\xab\x13\x5e\xe2\xfa\xff\
+\x13\x46\x8a\xbe\x8e\x11\xf6\x77\x1c\x62\xb1\xf0\x1e\xd3\xd9\x37\
+\x1b\xff\x57\x0a\x52\x4b\x29\xc4\x9a\x40\x4a\x37\xba\x66\x7f\x7a\
+\x84\x87\x47\x7f\xd5\x9b\xfd\x0b\xc3\x4e\x12\x75\x2b\x4c\x14\xa1\
+\x02\x6e\x6f\x09\xa0\x6a\x8b\x47\xde\x4c\x96\x90\x2d\xab\x14\x6d\
+\x77\xf8\x25\xe3\xee\x6c\x5d\x50\xf7\x0b\x4b\x10\x5f\x8f\x23\x6d\
+\xd7\x5d\x23\x80\x9e\xd4\x00\x63\x3d\x77\xd3\x93\x1c\xf4\x7a\x70\
+\xa1\xea\x9b\x2c\x53\x20\xca\x26\x1d\xf3\x49\x54\xc5\xf5\x21\x08\
+\x21\x38\x7d\xe0\x51\xce\x0d\xfe\xdc\xa6\xf9\xff\xc0\xfb\xb4\xac\
+\x77\x54\x99\xa2\xb3\x86\x54\x92\x14\x3d\xdb\xf2\x01\xe8\x69\xf6\
+\x1a\xf6\xcc\x07\x00\xed\x4b\x00\xd6\xd6\xd6\x3c\x5f\x40\xbb\xfa\
+\xbf\x50\xd5\xc1\x24\x02\x99\xd8\xdc\xfb\x8d\x8d\x18\xe6\x86\x51\
+\x9b\xfe\x15\x74\x27\x0e\x70\xb8\xfb\x34\xbd\xa9\xc1\x4d\xbd\xcb\
+\x14\xf5\xaa\x26\x56\xe2\xb0\x11\xaf\xb9\x8d\x25\x1d\xf1\x1e\xee\
+\x1f\xf9\x47\x1c\xcc\x8c\x35\x25\xcc\x76\x88\xbf\x64\x5d\xe6\xed\
+\x8d\xbf\x04\x25\x38\x97\x7e\x9c\x14\xcd\xbf\xea\x12\xf6\x1c\xcd\
+\x00\x3a\xdf\xa2\x56\xee\xf6\x96\x00\x86\x61\x4c\x29\xa5\xbc\xf4\
+\xea\x78\x3c\xbe\xa9\x4c\x94\x4a\xd8\xb0\x6a\xbd\x56\x28\xf7\x97\
+\x74\xef\x57\x10\xcb\x9b\xa8\xb2\xac\xe9\x78\x83\xb1\xde\xf7\x31\
+\xdc\x79\x1c\x7c\x3a\xdb\xff\x5c\x43\xd4\x17\x8f\x88\x95\x62\x38\
+\xc2\x06\x05\x63\xbd\x67\xb9\x77\xe0\xd3\xc4\xcd\xe4\x2d\x23\xbe\
+\x42\xb9\xc4\xc7\x75\x56\x59\x6a\xa3\x29\x03\x44\x3d\x27\xcc\x09\
+\xb4\x17\x09\xa1\x7e\xb4\x64\x00\x21\xc4\x8c\x7e\xa1\x6a\xb5\x4a\
+\x3c\x1e\x6f\x4b\x02\x48\xe5\x50\xb2\x0b\x08\x04\x32\xe6\x6b\x10\
+\x05\xb1\x5c\x0c\x55\x75\x70\x50\x24\xcc\x0e\x8e\x1e\xf8\x00\x99\
+\xf8\x3e\xf7\x76\x44\xe3\x89\xc0\x68\x21\x61\xa4\xb8\x7b\xe8\x31\
+\x0e\x77\xb7\xce\x10\xda\xae\xce\xbf\x5e\x79\xb3\xe1\xbc\xdb\x18\
+\x42\x45\x64\x9a\xb7\xe3\x07\x08\x24\xdb\xdc\xf6\x0c\x30\xa5\x8f\
+\x8b\xc5\x22\x99\x4c\xa6\xad\x07\x97\xed\x02\x9e\xa7\x27\x56\x1f\
+\xe2\xc5\x36\x4c\x94\xed\xe0\xe0\x8e\xd1\x8f\xed\xfb\x20\x09\x33\
+\xdd\x92\x48\xa9\x78\xa7\x77\xdc\x9b\x3a\xc8\x07\x87\x3f\x4b\x47\
+\xbc\x7b\x4b\xfe\x88\x30\xb4\x32\xe4\x4a\x32\xcb\xc5\x8d\xbf\xf1\
+\xce\x33\xc6\xfe\xda\x5c\xc3\xd6\xfc\x09\x86\x61\x78\xd2\x33\x20\
+\x01\xf6\xd4\x06\x68\x19\xe8\xf7\xc4\x13\x4f\x2c\x02\x15\x68\x4c\
+\x12\x69\x85\xb2\xbd\xe1\xf5\x56\x65\xba\x0d\x63\x16\x0d\x84\xe5\
+\x5e\x4b\xc6\x3a\x39\xb9\xff\x01\x92\xb1\xf6\x16\x7c\x3a\xd8\x31\
+\xc6\xfb\x87\xfe\x01\xf7\x0d\x7f\x86\x8f\x8d\xfe\x1a\x99\xc4\xf6\
+\x57\x2e\x69\x29\x39\x90\xbc\x99\x7f\xae\xe1\xda\x50\xe2\x4c\xe8\
+\x73\x5a\x3d\xcb\x3f\x04\xf4\xbb\x81\x8b\xc5\xe2\x9e\x0e\x03\x5b\
+\x32\x80\x10\x42\x51\x4b\x17\xf7\xfb\x02\x5a\xa9\x01\x2f\x8b\x57\
+\xb8\x0c\x60\x54\x0d\x8c\xaa\x81\x00\xe2\x66\x8a\xe3\x7d\x1f\x24\
+\x66\x6c\x6d\x01\xaa\x91\xae\x13\x0c\x77\x1d\xdf\x91\xa0\x94\x76\
+\x24\xc7\x4f\x72\x7f\x43\xce\x6e\x94\xd0\x7d\xc6\xe1\x2d\x3f\x27\
+\xe8\x03\xd0\x12\x40\x29\xb5\x3a\x31\x31\xb1\xb5\xe4\xcb\x1d\x46\
+\x5b\xa1\xbe\xaa\x96\x2e\xde\x2a\x49\x04\xea\x8c\x51\xad\x85\x71\
+\x4b\x13\x84\x14\x98\x25\xbd\x88\xb2\xc1\x58\xef\x39\xe2\x66\xf3\
+\x20\xd3\x56\x89\x22\xed\xde\x0b\x43\x3b\x44\x9b\x2e\xbe\xc6\x6c\
+\xe5\xc7\x0d\xd7\x7a\xcc\x61\x92\x46\x5d\x15\xdd\x4c\x20\x08\xd4\
+\x6d\x80\xbd\x9c\x06\xd6\x68\x8b\x01\x74\xba\xb8\xdf\x17\xd0\x2c\
+\x44\x4c\xd6\x42\xb8\xdc\x5f\x50\x75\xe2\x03\x43\x9d\xc7\xc8\xc4\
+\x77\x6f\xe1\xa9\x20\xda\x21\xda\x6c\xf1\x4d\x7e\x52\xf8\x9b\x4d\
+\xd7\x07\x62\x27\xb6\xf4\x9c\xb0\x40\x10\xe0\xb6\x08\x05\xd3\x68\
+\xc7\x0f\xe0\xc5\x05\xe8\x05\x9e\x5b\xf5\x38\x4b\xfa\x82\x1d\x1c\
+\x81\x70\xdc\xf2\x99\x44\x1f\xfb\x3b\x0e\xc1\xf6\xec\xb6\x4d\x28\
+\xdb\x05\x26\x57\x5f\xe5\xea\xda\x6b\x08\x61\xf2\xe8\xd8\xaf\x91\
+\x30\x37\xdb\x16\x6d\x11\x7f\xe3\xc7\xbc\x9d\x7b\xce\x0d\x38\xf1\
+\xc1\x10\x26\x07\xe2\x47\x6b\x61\x07\xdb\x73\x02\xf9\x32\xae\xf7\
+\x54\xff\x43\x9b\x0c\x20\xa5\x9c\x16\xc2\xfd\x86\xb0\x5e\x30\xa2\
+\x19\x13\x48\xe5\xa0\x1d\xbd\x86\x14\x48\xc0\xc0\x60\xa4\xf3\x98\
+\xeb\xd9\xdb\x01\x0e\x50\x4a\xb2\xb8\xf1\x1e\x57\x56\x7e\xc4\x4c\
+\xf6\x2d\x6c\xe9\x86\x80\x49\xe9\xb0\x50\xb8\xca\xe1\x9e\xd3\xbe\
+\xb2\xad\x8d\x34\xa9\x24\x97\x72\x7f\xc7\xa5\xdc\xf7\xdd\xfa\x09\
+\xb0\x7a\x6c\xe2\xeb\x6e\x13\xed\x8f\x8d\x63\x12\x47\x46\x8d\xff\
+\x1a\xea\x16\x1d\x08\x02\x0d\x19\x41\x7b\xae\x02\xda\x62\x00\xc3\
+\x30\xbc\xc5\x23\xab\xd5\xea\xa6\x15\x43\x82\x70\xe4\xe6\xe5\xd1\
+\xfb\xd2\x23\x24\x62\x1d\xdb\x1e\xb6\x95\xac\x02\x53\xd9\x1f\xf3\
+\x9e\x2f\x89\x44\x33\x94\x1e\x75\xf4\xa5\x47\xbc\xf2\xed\xfc\x5e\
+\xd9\x2e\x70\x61\xf9\xcf\x58\x2c\x5f\x71\x2f\x08\x45\xb9\xdf\xf2\
+\x54\x17\xc0\x70\xfc\x74\xc4\x7f\xd7\xd1\x8c\xd1\xb4\x04\x70\x1c\
+\xe7\xb6\x08\x06\xd5\x68\x8b\x01\xfc\x8b\x47\x96\xcb\xe5\x4d\x1f\
+\x97\x0e\xc2\x95\x00\x75\x82\x18\x98\xae\xe8\xf7\x61\x2b\xcb\xc3\
+\x28\x14\x4b\x85\xf7\x98\x5a\x7f\x83\x85\xc2\x15\x6c\x69\x37\x64\
+\x00\xf7\xec\x3b\x40\xa5\xb0\x41\xbe\xbc\x46\x26\xde\x4b\x67\x62\
+\x5f\x3b\xaf\x85\x52\x92\xe9\xc2\xeb\xbc\xb1\xf2\x57\xde\x6a\x23\
+\x2a\xa6\x28\x0f\x5a\xc8\x98\x24\xb9\xe4\x8e\xdb\x3b\xcd\x7e\x7a\
+\x63\x23\xdb\x5a\x67\x30\x2c\x16\x70\x2f\xd6\x05\x0c\xa2\x5d\x06\
+\xb8\x6e\x9a\xa6\x0d\xc4\x0a\x85\x82\xf7\x25\x91\x28\x22\x3a\xaa\
+\x51\x02\xf4\xa6\x0e\x36\xf8\xf2\xdb\x45\xc9\xce\x73\x2d\xfb\x2e\
+\x33\xd9\xb7\x29\x59\x39\x1c\x55\xef\xed\x66\x2c\xce\xc1\xc1\xc3\
+\x0c\x1e\x18\xa7\x33\xde\xcd\xdf\xbe\xf4\x2d\x00\x06\x3a\xef\x6c\
+\xf9\x5c\x85\xe2\x7a\xe1\x5d\xde\x5e\xfd\x5e\x43\x64\xb0\xd3\xe1\
+\x50\x1e\xb4\xc0\x80\xf8\x0d\x13\x51\xd3\xf7\x87\x92\xe7\x9a\x3f\
+\x6f\x0b\xb1\x00\x7e\x06\x30\x4d\xf3\xa7\xc3\x08\x9c\x98\x98\xb0\
+\x9f\x7a\xea\xa9\xeb\xc0\xe8\xfa\xfa\x3a\x87\x0f\x1f\x6e\x5a\x5e\
+\x29\xe5\x9f\xef\xa3\x37\x35\xd8\x76\x85\x94\x92\xdc\x28\xcd\x70\
+\x2d\xfb\x13\x56\x4a\xd7\x70\x1c\xcb\xed\xed\xb5\x99\xc4\x74\x77\
+\x17\x7d\xfd\x43\xec\xef\x1e\x42\x08\x13\x85\x64\x39\x3f\x57\xcb\
+\x1e\x16\x0c\x64\x8e\x44\x3e\xbb\x64\xe7\xb9\xbc\xfa\x32\x93\xd9\
+\x1f\x51\xb4\xea\x2b\xa0\x29\xa1\xa8\xf4\x5b\xd8\x3d\xb6\x1b\x4c\
+\xe2\x08\x62\x59\xb7\x69\xd2\x66\x0f\x83\x89\x13\x37\xe5\xfa\xf5\
+\x23\xcc\x0d\xfc\x53\x33\x0a\xa8\x61\x1a\x18\xf5\x27\x89\x44\x89\
+\x6d\xbf\x78\x8e\x1b\xc9\xb6\x5c\xbd\x25\x3b\xcf\x7c\xfe\x0a\x0b\
+\x85\x49\xca\x56\x01\xa7\x96\x27\x00\x80\x29\xe8\x39\xd0\x4f\x6f\
+\xef\x41\x3a\x12\x9d\x48\xa5\x6a\x59\x43\x16\x52\x49\x56\xb2\xf5\
+\x76\xec\x4a\x1e\xa0\xea\x94\xb1\x55\x15\xdb\xa9\xb0\x52\xba\xce\
+\x62\xe1\x2a\x8b\x85\xab\xac\x95\xe7\x1b\x8d\x38\x01\x56\xb7\x8d\
+\xd5\x67\x23\xcd\xfa\xf5\xc4\x72\x0c\x51\xab\xee\x91\xd4\x07\x6f\
+\xca\xf5\xeb\x2f\xe3\x9f\x3f\xf1\x33\x40\xb9\x5c\xde\xf5\xb5\x81\
+\x83\xd8\x2a\x03\xb4\x15\x17\x50\xf7\x02\x0a\x3a\x13\x7d\x91\xe5\
+\xa4\x72\x58\x2d\xcd\xb1\x58\xb8\xca\x7a\x79\x11\x5b\xda\x48\x1f\
+\xf3\x24\x32\x29\x32\x7d\xbd\x74\x66\x7a\xdd\x75\x82\x95\xa2\xa2\
+\x2a\x6e\xe0\xa8\xac\xe5\x12\x28\xc9\xda\xfa\x12\x7a\xd4\xf1\xd7\
+\x57\x9f\xc5\x91\x0d\x4b\xaf\x6c\x22\x94\x32\x14\x56\xb7\x83\xd5\
+\x53\x45\xe9\xc9\x4d\x05\x28\x81\x28\x1b\xc4\x72\xae\xf1\xd7\x61\
+\xf6\x31\x94\x3a\x85\x74\x36\x47\x0f\x6f\x25\x10\x24\x22\x12\x68\
+\xa9\xb6\x14\xcf\x9e\xa2\x6d\x06\x50\xee\xa7\x64\x1a\x7c\x01\x51\
+\x86\xa0\x36\x02\x01\xba\x92\x9b\xed\x05\xa9\x1c\x66\xb3\x6f\xb3\
+\x5a\x9a\xa3\xea\x94\x7d\x46\x23\x08\x13\x52\x7d\x5d\x74\x74\x77\
+\x92\x88\xa7\x70\xa4\x9b\xd5\x23\xa5\xe3\x25\x89\xc8\x5a\x18\xb8\
+\x1b\x4e\x6e\x51\x30\x5a\x87\xab\x29\x43\x61\x77\x38\x38\x19\x07\
+\xbb\xcb\x76\xc3\x06\x95\xf2\xe2\x07\xdd\x42\x90\xbc\x51\x6f\x92\
+\x93\x99\x47\x6a\xf7\xeb\xc4\xbe\x19\x1f\x40\x44\x24\xd0\x9e\x8f\
+\x00\x60\x6b\x12\x60\x06\xf0\x3e\x9c\x10\xfc\xb8\x83\x1f\xbd\xa9\
+\x41\x56\x4a\xd7\x89\x8b\x24\x49\xb3\x83\x60\x9b\x2d\x6e\x4c\xb2\
+\x5a\x9e\xc3\x51\xf5\xde\x2e\xd2\x06\x1d\xdd\xdd\x24\xd3\x69\x40\
+\x20\x91\x58\xb2\xea\xa5\x89\x49\xea\x69\x62\xee\x35\xe5\x9d\xdf\
+\x31\x76\x17\xeb\xfd\xcb\x94\x0b\x05\xac\x4a\x19\xe5\x54\x10\x26\
+\x18\xa6\x49\x2c\x96\x20\xde\x91\x62\x55\x2d\x51\x71\x4a\x2e\x71\
+\x54\x20\x2a\xbd\x86\xc4\x5a\x0c\xb3\x62\xa0\x50\x1c\x4c\x1e\xa5\
+\x2f\x7e\x38\xf8\x45\xaf\x96\x8d\xd4\x2c\x10\x04\x6e\x9f\x50\x30\
+\x8d\x76\x18\x40\x00\xc2\x71\x9c\xd9\x58\x2c\xe6\xad\xe7\xef\xff\
+\xea\x55\x10\xdd\xc9\x7e\x12\x46\xba\x36\xd9\xb3\xb9\xa9\x93\x66\
+\xdd\x9f\x9e\x8c\x77\x20\x0e\x08\xcc\x78\xcc\x23\xae\x3f\x27\x50\
+\xa7\x82\x07\x99\xc0\x91\xfa\xdc\x1d\x19\x74\x76\xf4\xd0\x91\xee\
+\xf2\xf2\x0a\x74\xd5\x95\x52\x2c\x56\x66\x28\x55\x0b\x9b\x2b\xea\
+\xeb\xfd\x46\xd1\x24\xbe\xea\x36\x47\xdc\x48\x71\xb2\xf3\xd1\xc6\
+\xa2\xdb\x88\x29\xf0\x7b\x01\xf5\x28\xc0\x71\x9c\x25\x20\x8e\xbb\
+\x1c\x9f\xdc\xd4\x48\xbb\x84\x56\x0c\x20\x70\xe7\x0b\x8c\x6c\x36\
+\x7b\x6d\xff\xfe\xfd\x40\x7b\x0b\x46\xa4\xe2\x9d\x91\xba\xb2\x2f\
+\x3d\x4c\xae\x72\x83\xe5\xe2\x2c\x8e\xb4\x49\x6e\x74\x60\x77\x57\
+\x6a\x09\x9f\x5a\xb7\xfb\xb2\x82\x95\x2f\x5b\x18\xf7\xa3\x0e\x3a\
+\x1f\x40\xca\x7a\x19\x25\x75\x22\xa9\xeb\x89\x54\x28\x96\x2a\xd7\
+\xd8\xb0\x7d\xdf\x40\x0c\x6b\x66\x5b\x90\x9a\xaf\xf7\xd2\xd3\xdd\
+\x9f\x24\x65\x74\xb6\xfc\x7e\xb0\x1f\xed\x26\x84\x68\x09\x50\x2e\
+\x97\x97\x81\x1e\xc0\xa1\xce\x04\x50\x67\x06\x7d\xae\x7c\xd7\x82\
+\xdb\xb6\xd1\x6c\x32\xc8\x00\x4c\xbd\xbd\xf4\xd2\x4b\xd7\xf5\x8f\
+\xea\x05\x23\xb6\x33\x2d\x7b\xb8\xe7\x34\x99\x78\x0f\x08\xb5\xe9\
+\x3b\x00\x00\x0c\x93\x49\x44\x41\x54\x8e\xb4\x28\xe4\xd6\xa8\xae\
+\x57\x6a\x29\xde\x55\xd7\x82\x57\x55\x2c\x55\x75\x33\x7e\x54\x05\
+\x4b\x56\xa9\xaa\x0a\x96\xac\xb8\x7b\x55\xa1\x2a\xcb\x54\xf5\x5e\
+\x96\xa9\xa8\xfa\x56\x70\xb2\x5c\x2b\x5f\x61\xc3\xc9\x6e\xfa\xed\
+\x86\x5a\x4b\x48\xcf\x25\x10\xb5\xe6\x3e\x9c\xbe\x87\x81\xe4\x71\
+\xef\xf6\x4e\x26\x84\xe8\xef\x30\x01\x58\x96\xb5\x8c\xdb\xb6\x31\
+\xea\xed\x0c\xb5\x0e\x57\xbb\xae\xb7\x44\x6d\x4b\xd6\xb6\x54\x6d\
+\xd3\xe7\x71\xdf\x73\x8c\xe0\x2b\x36\x43\x14\x03\x18\xbe\xcd\x04\
+\xcc\xef\x7f\xff\xfb\xb6\x52\x6a\x09\xdc\x8f\x23\x6a\xdc\xcc\xc2\
+\x11\x42\x08\x0c\x61\x32\xbe\xef\x03\xc4\x8c\x24\x4a\x49\xaa\xd9\
+\x12\x1b\xb9\x1c\x65\xa7\xe8\x12\x5c\x55\xeb\x7b\x59\xc1\x52\x65\
+\x97\xf8\xb2\x4c\x55\x96\xa8\xca\x12\x96\xd2\xc7\x65\x2a\xb5\x7d\
+\xc9\xd9\x60\xad\xba\xc0\x72\xf5\xba\x97\x8f\x10\x09\x09\xe9\xeb\
+\x49\x8c\x8a\xdb\x0c\xfb\x13\xa3\x9c\xea\x71\x45\xff\x4e\xe5\x0d\
+\x28\xa5\x3c\x06\xa8\x56\xab\x5e\xf9\x62\xb1\xb8\x44\x9d\x60\xfe\
+\xbd\xf0\x6d\x44\xec\xf5\xa6\x89\xad\x19\x48\x33\x4c\x9c\x36\x99\
+\x22\x4c\x05\xf8\x09\xef\x67\x04\x43\x4a\x39\x6b\x9a\xe6\xc0\x56\
+\x97\x8e\x8b\xf2\x17\x24\xcc\x14\x47\xfb\xee\xe3\x9d\xa5\x17\xdc\
+\x55\xc0\x56\x4d\x4a\xc6\x06\x76\xa2\x8a\x16\xe1\x20\x71\x64\x7d\
+\x79\x18\x47\xea\x75\x01\xac\xda\xb1\xab\x2a\xaa\xb2\x42\x45\x96\
+\xb1\x64\x09\xdb\xe7\x31\x0c\x5a\xf9\x1e\x6c\x83\xd4\xb5\xb8\x47\
+\xfc\x9e\xc4\x00\xef\xef\xfb\x65\x04\x46\xc3\x28\x26\x0a\x5b\x91\
+\x0c\x3a\x14\xcc\xef\x03\x58\x5b\x5b\x5b\xa6\xde\x01\x35\x41\xf5\
+\x0f\x6b\x91\x2f\x7c\xfb\x86\x47\x07\xee\x45\x95\xf5\x1b\x60\x7a\
+\xef\x57\x27\x9b\x24\x80\xd1\x64\x33\xf5\x62\x86\xc1\x0f\x49\x6c\
+\x07\x9d\xf1\x7d\x1c\xe9\x3d\xe7\x3d\x2b\xb1\x92\x44\xd8\x02\x5b\
+\x55\xa9\xca\x12\x65\xa7\x48\x45\x6e\x50\xd1\x59\xbf\xb2\xd8\x70\
+\x5c\x92\x05\x36\x64\x8e\x8a\x2c\xe2\xa8\x6a\xd3\x99\x46\x2f\xc2\
+\xb8\x62\x90\x9e\x4d\x62\x7a\xc4\x1f\xe4\x81\x03\x9f\x27\x6e\xa4\
+\x76\x34\x69\x44\x23\x2c\x1a\x78\x76\x76\xf6\x06\xf5\x9e\x1b\x94\
+\xb8\xfe\x1e\xdb\x4a\x1a\xf8\xcb\xb4\x23\x39\xfc\xaa\x5d\xf8\x19\
+\xc0\x5f\x60\x13\xf1\xa9\x49\x00\xc0\xf3\x05\xec\x14\xfa\x33\xa3\
+\x0c\xd6\x7c\xf8\x42\x0a\xe2\xcb\x09\x90\xb5\xa9\x24\xe1\xfa\xee\
+\x55\x6d\xad\x20\x85\xac\x65\x0d\xd7\x0c\xbf\x06\x82\x37\x67\x46\
+\xa1\x20\xb9\x92\x20\x3d\x93\xc4\xa8\xc5\x26\xf6\xa7\x8e\xf0\x60\
+\xff\xe7\x89\x1b\xad\xbd\x95\xb0\x75\xe2\xfb\xd7\x05\xf4\x49\x00\
+\xe7\xc2\x85\x0b\x6b\xb8\x12\x38\x54\xda\x52\x67\x82\xed\x12\x9d\
+\x26\x65\x0c\xbf\x0a\xf0\xeb\x14\xff\xde\xdb\x2a\x95\xca\x5c\x2a\
+\x95\xf2\xbe\x9a\xd9\x6c\x28\xb8\x55\x8c\xf6\x9e\xa5\x50\x5d\x67\
+\xb5\x34\x87\x61\x99\x24\x56\x92\x94\x0f\x6c\x9e\x56\x76\x2b\xda\
+\x18\x22\xde\xd2\xe6\x91\x10\xcb\x99\xc4\x57\xe2\x1e\xe1\x51\x70\
+\xbc\xf7\x21\xee\xea\xf9\x18\x4a\xaa\xe0\xc2\xcd\xa1\xd8\x4e\x20\
+\x08\xd4\x83\x41\x1d\xc7\x59\xcb\xe7\xf3\x8a\x3a\xf1\x6b\x35\x6a\
+\x7c\x14\xcd\xc5\x7b\xb3\x32\xed\x96\x55\x41\x1d\x14\xc5\x04\x02\
+\x30\x8a\xc5\xe2\x35\x70\x8d\x99\xc0\xc7\x8e\x1a\x70\x33\xb1\x7e\
+\x02\xc1\xc9\x03\x0f\x90\x8e\xb9\x3e\x82\x58\x39\x46\x3c\x9b\xac\
+\x35\x4b\x90\xe0\x34\x34\x97\x50\xc2\x77\xcf\xf0\xee\x1b\x1b\x06\
+\x89\x1b\x71\x32\x57\xd3\xa4\x16\xeb\xbd\x3e\x15\xeb\xe6\xc1\xa1\
+\xcf\x73\x7a\xdf\xa3\x44\x25\x8f\x06\xb1\x13\x4e\x20\x3d\x02\xa8\
+\xf9\x00\xfc\x06\x9c\xdf\x00\x0c\xb6\xfb\x4e\xab\x02\x70\xed\x00\
+\x07\x90\xb1\x88\x7f\x0c\x65\x82\xe5\xe5\xe5\xf9\xa1\xa1\x21\xc0\
+\xd5\x67\x7a\xd9\xf3\x9d\xfa\xa0\x94\x29\x12\x9c\xea\x7f\x98\xd7\
+\xe6\x9f\xa3\xe2\x94\x88\x65\xe3\x98\xb1\x18\x4e\xda\xdf\x3b\x05\
+\x28\x88\x67\xe3\x60\x99\x98\xca\xc0\x31\x2c\x6c\x25\x30\x6c\x81\
+\xb4\x62\xa8\x6a\x0c\xb1\x21\xbc\xe9\x5c\x0d\x43\xc4\x38\xbe\xef\
+\x41\xee\xda\xf7\x51\x0c\x65\xe2\x38\xce\x8e\x59\xfa\x51\x65\xfc\
+\x79\x14\xc5\x62\x11\x00\xdb\xb6\x6f\x50\xb7\xbf\x1c\x5c\xe2\x2b\
+\xdf\xde\x80\x5a\x20\x55\xdd\x1f\x00\xdb\x93\x0a\x36\x8d\xfe\x06\
+\xa0\x71\x14\x10\x64\x82\x4d\xcc\xf0\xc6\x1b\x6f\x5c\x3f\x73\xc6\
+\x8d\x8b\x5f\x5b\x5b\xf3\x16\x8c\xd8\x49\x74\xc4\x7b\x38\x71\xe0\
+\xc3\xbc\xb9\xe4\x06\x65\x26\x97\x93\xd8\x03\x16\x4e\xbc\xfe\x9e\
+\xf1\x6c\x1c\x73\xc5\xcd\x24\x16\xca\xc0\x94\x06\xa6\xb4\x71\xa4\
+\x59\x0b\x0b\xa3\x61\xd6\x2f\x65\x76\x71\x6c\xdf\x07\x39\xd2\xfd\
+\x01\x52\xa6\xeb\xe0\x09\x4e\x18\x85\x61\x27\x24\x83\x6e\x23\xa5\
+\x94\x17\x56\xef\xf3\x01\x68\x62\x37\xdb\xc3\xf6\x88\xee\x50\x1f\
+\x5d\x6c\x82\x5f\x02\x04\xb1\x89\x19\xde\x7a\xeb\xad\xa2\x94\x72\
+\xc6\x30\x8c\xc3\x97\x2f\x5f\x66\x74\x74\x14\x60\xd3\x07\x10\xb7\
+\x8b\xfd\xe9\x11\x8e\xf4\x9e\xe3\xf2\xca\x0f\x01\x41\x62\x29\x89\
+\x3d\x64\xd5\xd5\x85\xb3\x79\x81\x88\x7a\xa5\x05\xc9\x58\x86\xae\
+\xc4\x01\x86\x32\x47\x39\xd8\x71\x84\xfe\xf4\x28\x4a\x89\x86\x0f\
+\x3f\xb7\xc2\x4e\x94\x89\xc5\x62\x5e\xf0\x4c\x2e\x97\xf3\x54\x40\
+\x2e\x97\x9b\xa4\xde\xb9\x94\xef\x58\xfa\x5e\xca\xdf\xf6\x61\xc4\
+\x6f\x46\x74\x4d\xf8\x96\x2f\xa1\x19\x40\xff\x73\x98\x0e\x69\xa8\
+\x4c\xa9\x54\xfa\x7f\x99\x4c\xe6\xf0\xeb\xaf\xbf\xce\xc7\x3e\xf6\
+\x31\xef\x03\x88\x3b\xc9\x00\x00\x87\xbb\x4f\x93\x2b\xaf\x30\x5f\
+\xb8\x84\xe1\x18\x24\x97\x92\x14\x0f\xba\x76\x87\x59\x32\xbd\xf9\
+\xf9\x4f\xdf\xf9\xaf\x6b\x33\x8a\x92\x84\x91\x26\x15\xcb\x20\x6a\
+\x76\x95\x4e\x6a\x75\x89\xbe\x33\x6e\xdd\xad\x94\x19\x1e\x1e\xf6\
+\xe2\x27\x67\x67\xeb\xdf\x2f\xb8\x72\xe5\xca\x6b\x6c\x26\xba\xff\
+\xdc\xdf\xfb\xa1\x75\x8f\x77\x00\x8b\xba\x98\x6f\x1b\xfe\x61\x60\
+\x98\x8f\x79\x13\x43\x2c\x2e\x2e\x3e\x07\xae\x5b\x73\x72\xb2\xbe\
+\xf0\x53\xd4\xec\xe0\x76\x92\x3f\xee\x3a\xf0\x61\xba\x12\xee\xfc\
+\x83\x59\x8e\x91\x58\x49\x62\x28\x81\x61\xb9\x5a\x69\xb8\xeb\x18\
+\x99\xc4\x3e\x7a\x53\x83\xf4\xa5\x87\xc9\x24\x7a\x31\x44\x74\xc4\
+\xf2\x6e\x12\x3f\x9d\x4e\x7b\x91\x53\x96\x65\x31\x35\x35\x05\x80\
+\x6d\xdb\xf3\xdf\xfb\xde\xf7\xae\x12\x6d\xec\x41\x38\x0d\x08\xec\
+\x25\x50\x05\x36\x6a\x5b\x95\x2d\x12\x1f\xea\x0c\x10\x24\x7c\xd4\
+\x84\x83\xf8\xc6\x37\xbe\xf1\x03\xcb\xb2\xae\x00\x7c\xf7\xbb\xdf\
+\xf5\xc4\x9a\xfe\xcc\xfb\x4e\x2e\x29\x6f\x1a\x31\xce\x0e\x3c\x46\
+\xc2\x4c\x03\x10\xcb\xc7\x48\x2c\x26\xbd\x5a\xf5\x77\x8c\xb6\xfd\
+\xac\xdd\x24\xbe\x61\x18\xdc\x75\xd7\x5d\xde\xf8\xff\xe2\xc5\x8b\
+\xde\xa8\x69\x7e\x7e\xfe\xdb\xbe\xef\x04\x84\x11\xdd\x4f\x70\xbf\
+\xc8\xd7\x3d\xbe\x0a\x14\x70\xd7\x6e\x2a\xd3\x44\xbf\xb7\x83\x20\
+\x03\x84\x11\xbe\xe1\x5a\xa5\x52\x51\xf3\xf3\xf3\x5f\x03\x97\xb3\
+\x9f\x7b\xee\x39\xaf\x51\xfc\xeb\xe0\xed\x14\x52\xb1\x0c\xe7\x06\
+\x3f\xe9\x56\x55\xb8\xe2\x5f\xb7\x49\x7f\xc7\x1d\x2d\xff\x7f\x27\
+\x7d\xfa\xed\x94\x31\x0c\x83\xd3\xa7\x4f\x7b\xd6\xff\xf2\xf2\x32\
+\x57\xae\xb8\xe1\xe6\x52\xca\xfc\x77\xbe\xf3\x9d\x3f\xf5\xff\x4b\
+\x6d\x1f\x24\x3a\xd4\x55\x83\xc2\x15\xef\x05\x60\x1d\x28\x02\xed\
+\x7d\x14\xa9\x0d\xf8\x55\x80\xa4\x71\x6e\x3a\x38\x05\xa9\x2b\xa7\
+\xbe\xf6\xb5\xaf\xfd\x45\xa9\x54\xfa\x5b\x70\xb9\xfb\x07\x3f\xf8\
+\x41\xdd\xcd\x6a\x18\x2d\xf3\x06\xb6\x8a\xde\xe4\x00\xa7\xfb\x3f\
+\xda\x70\x4d\x08\x41\x57\x93\x75\x80\x60\x77\x7b\xbd\x4e\x00\x3d\
+\x73\xe6\x8c\x67\xf9\x17\x0a\x05\x7e\xf8\xc3\x1f\x7a\x65\x26\x27\
+\x27\xbf\x7a\xfd\xfa\xf5\x62\xed\x34\xd8\xfb\x83\x5b\x05\xb7\x97\
+\xeb\x95\xda\x6e\x49\xf8\x58\xb0\xbb\xb6\x1c\x0a\xea\x6b\xa5\x52\
+\xe9\x95\xe3\xc7\x8f\x7f\xda\x30\x8c\xce\x6b\xd7\xae\x61\x9a\x26\
+\x23\x23\x6e\x42\x86\x10\x02\xd3\x34\xdb\xea\x35\xed\xa2\x3b\xd5\
+\x8f\xe5\x94\x59\x2f\x2f\x20\x95\xa4\xbf\x63\x8c\xc3\x3d\xef\x6b\
+\xfa\x3f\xfa\xf7\xa3\x36\x3d\x22\xd8\x89\x32\x7d\x7d\x7d\x9c\x3c\
+\x79\x92\x74\xda\x55\x57\x85\x42\x81\x17\x5f\x7c\xd1\x73\xff\xe6\
+\xf3\xf9\x97\xbf\xfa\xd5\xaf\xfe\x57\x29\xa5\x26\xb0\xe3\xdb\x6b\
+\xc7\x8c\x26\xfa\x3a\x50\x62\x9b\xe2\xbd\x1d\x04\x19\x20\xa8\x73\
+\x22\x19\xe2\xfa\xf5\xeb\x25\xe0\x85\x23\x47\x8e\x7c\x5a\x08\x91\
+\x9e\x99\x99\x61\x6d\x6d\x8d\xf1\xf1\x71\x0c\xc3\xf0\x98\x40\x3b\
+\x89\x74\x1c\x61\x14\xda\xc9\x06\xde\x9f\xbe\xa3\x16\x3c\x5a\xe5\
+\x7d\xfd\x0f\xd3\x51\x4b\x32\x6d\x66\xf4\xdd\x6a\xe2\x27\x93\x49\
+\xc6\xc7\xc7\x19\x19\x19\xf1\x74\xfe\x8d\x1b\x37\x1a\x88\x5f\x2a\
+\x95\x2e\x7e\xfd\xeb\x5f\xff\xf2\xfa\xfa\x7a\x19\x9f\x17\xae\xb6\
+\xf9\xc5\xfb\x8e\xe8\xf5\xad\x20\x4c\x61\xfb\x87\x25\x51\x6e\x48\
+\x01\x88\xf7\xde\x7b\x2f\x17\x8b\xc5\x5e\x38\x74\xe8\xd0\x47\x4c\
+\xd3\xec\x5e\x5e\x5e\xe6\x9d\x77\xde\x61\x74\x74\x94\x74\x3a\xed\
+\x79\x09\xf5\x50\x71\xbb\x12\x41\x20\x18\xe9\x3a\xc1\xd1\xbe\x0f\
+\x78\xc4\x6f\x86\x5b\x49\xfc\x74\x3a\xcd\xc8\xc8\x08\x63\x63\x63\
+\x5e\xaf\x97\x52\x72\xf1\xe2\x45\x2e\x5c\xb8\xe0\x19\x7d\x95\x4a\
+\x65\xf2\x0f\xfe\xe0\x0f\xbe\x38\x3d\x3d\xbd\x4e\x9d\xf8\x7e\xa2\
+\xaf\xe3\x12\x5d\x0f\xe3\x76\x8d\xf8\x10\xce\x00\xd0\x38\x9c\x08\
+\x25\xbe\x3e\x9f\x9c\x9c\xcc\x2e\x2e\x2e\xfe\xe5\xf1\xe3\xc7\x4f\
+\xc7\xe3\xf1\x91\x4a\xa5\xc2\xeb\xaf\xbf\x4e\xb5\x5a\x65\x70\x70\
+\xd0\xb3\x07\xf4\x28\x41\x4b\x85\x66\x69\x56\x3b\x85\x9d\x26\xbe\
+\x10\x82\xde\xde\x5e\x0e\x1d\x3a\xc4\xf0\xf0\x30\x1d\x1d\xf5\x0c\
+\xe4\xf5\xf5\x75\x5e\x7e\xf9\x65\xa6\xa7\xa7\x3d\x26\x5f\x5f\x5f\
+\x7f\xf1\xd9\x67\x9f\xfd\x0f\xd7\xaf\x5f\xcf\xe2\x12\x78\x03\x57\
+\xa7\xaf\xe1\x1a\x73\x16\x2e\xc1\x6d\x6e\x72\x18\xb7\x5d\xb4\x1a\
+\xb3\xf9\xa3\x4c\xa2\x36\x13\x88\xc5\xe3\xf1\xc4\xaf\xff\xfa\xaf\
+\xff\xd3\xc1\xc1\xc1\x7f\x25\x84\x48\x82\x2b\x9a\x1f\x7a\xe8\x21\
+\xee\xbe\xfb\x6e\x2f\x86\xd0\x2f\x01\x1c\xc7\xc1\xb6\x6d\x6c\xdb\
+\xde\xd4\xe8\xba\x6c\xd8\x79\xb3\x7b\xfe\x73\xed\x04\x92\x52\xe2\
+\x38\x4e\xc3\x79\xd8\x16\x56\x46\x08\x41\x26\x93\xa1\xab\xab\x8b\
+\xae\xae\xae\x06\x95\x06\xae\x87\xef\x9d\x77\xde\x61\x66\x66\xc6\
+\xff\xdb\xd5\xa9\xa9\xa9\x6f\xfc\xfe\xef\xff\xfe\x1f\xda\xb6\x5d\
+\xc0\xed\xed\x05\xea\xbd\xdc\xbf\x59\xb5\x6d\x67\x8c\xa5\x2d\xa2\
+\x9d\x41\xbb\xa0\x1e\x5e\xd4\x72\xfb\xf8\xc7\x3f\x7e\xe7\x43\x0f\
+\x3d\xf4\x95\x74\x3a\x7d\xaf\xff\x21\x67\xcf\x9e\xe5\xde\x7b\xef\
+\xa5\xb7\xb7\xd7\xd3\xd9\x7e\x66\xd0\x0d\xae\xd7\xd0\xb3\x6d\xfb\
+\xa6\x18\xc0\x7f\x7c\x33\xc4\x37\x0c\x83\x64\x32\x49\x2a\x95\x22\
+\x9d\x4e\x37\x30\xae\x7f\x5b\x5e\x5e\xe6\xf2\xe5\xcb\x0d\x84\x07\
+\x28\x16\x8b\x97\x9e\x7f\xfe\xf9\xa7\x5f\x7c\xf1\xc5\xb7\xa8\x5b\
+\xef\x41\xa2\xeb\x4d\xdf\xdb\x33\x6c\xc5\x6b\x63\xd2\x9a\x11\xbc\
+\xfb\x9f\xfb\xdc\xe7\x3e\x72\xf2\xe4\xc9\x7f\x93\x4c\x26\x8f\xfa\
+\x1f\xd2\xd5\xd5\xc5\xfd\xf7\xdf\xcf\xd8\xd8\x18\x9d\x9d\x9d\x0d\
+\x3f\xe0\x6f\x48\x4d\x40\xc7\x71\x1a\x08\xa8\xcf\xdb\x61\x86\x66\
+\xbd\x5a\x08\xe1\xa9\x25\xbd\x82\x97\xfe\xa2\x57\xd8\x33\xa5\x94\
+\x14\x0a\x05\xae\x5d\xbb\xc6\xe4\xe4\xe4\xa6\xc5\xb3\x2d\xcb\xba\
+\x71\xf5\xea\xd5\xff\xfe\xcd\x6f\x7e\xf3\xdb\x96\x65\x95\x08\xef\
+\xed\x7e\xc2\xef\x59\xaf\xf7\xe3\x66\xdc\x76\x0d\x84\x8e\x38\x8f\
+\x51\x53\x0b\x9f\xfd\xec\x67\x3f\x7c\xec\xd8\xb1\x7f\x92\xc9\x64\
+\x3e\x10\xfc\xbd\x4c\x26\xc3\xd9\xb3\x67\x19\x1d\x1d\xa5\xb7\xb7\
+\xb7\x21\x83\x26\x68\x2c\x06\xcf\xfd\x13\x3b\x41\xdd\x1d\x14\xd3\
+\x7a\xaf\x89\xee\xbf\xe6\x0f\xfd\x0e\xfe\x8f\x6d\xdb\xac\xad\xad\
+\x31\x37\x37\xc7\xec\xec\x6c\xe8\x67\x74\x2b\x95\xca\xb5\xb9\xb9\
+\xb9\xff\xf9\xed\x6f\x7f\xfb\x8f\x56\x56\x56\x36\x08\x17\xf1\xfe\
+\xe3\x3d\xd1\xf5\x51\xd8\x8e\xdf\x36\x48\xf8\xa6\x4c\xf1\xf0\xc3\
+\x0f\x1f\x3d\x77\xee\xdc\xcf\x1f\x38\x70\xe0\xe7\xe3\xf1\x78\xa8\
+\x07\xa7\xb7\xb7\x97\xf1\xf1\x71\x86\x87\x87\xe9\xeb\xeb\x23\x93\
+\xc9\x78\x89\x95\xcd\x18\x22\xea\x5e\x50\x6c\x87\x5d\xd3\xd7\x1d\
+\xc7\xa1\x50\x28\x90\xcd\x66\x59\x59\x59\x61\x61\x61\x81\x85\x85\
+\x85\xd0\x51\x8b\x94\xb2\x9a\xcf\xe7\x5f\x9c\x99\x99\xf9\x93\x6f\
+\x7d\xeb\x5b\x2f\x58\xae\x6f\x37\x48\x6c\xff\xb9\xee\xf1\xb7\x0d\
+\xe1\x35\x76\xc2\x71\x6f\xd0\x18\x86\xdc\x8c\x11\xe2\xb1\x58\x2c\
+\xf1\xc9\x4f\x7e\xf2\xcc\x9d\x77\xde\xf9\x70\x5f\x5f\xdf\x83\xc9\
+\x64\xf2\x48\xd3\x87\x1b\x06\xfd\xfd\xfd\x1c\x38\x70\x80\xde\xde\
+\x5e\xba\xbb\xbb\xe9\xec\xec\x24\x91\x48\x10\x8b\xc5\x3c\x11\xee\
+\x17\xe7\x41\xf5\xe1\xdf\x8a\xc5\x22\x1b\x1b\x1b\x14\x0a\x05\xf2\
+\xf9\x3c\xf9\x7c\x9e\x5c\x2e\x47\x36\x9b\x6d\x3a\x44\x95\x52\x96\
+\xf3\xf9\xfc\x2b\x37\x6e\xdc\x78\xe1\xf9\xe7\x9f\xff\xeb\xa9\xa9\
+\xa9\x35\xc2\x7b\xb9\xdf\xb0\xab\xd0\xe6\xb4\xec\x5e\x61\xe7\x66\
+\x6e\x5c\x98\xb8\x09\x0c\xcd\x24\x43\xc3\xb5\x33\x67\xce\x0c\xde\
+\x7d\xf7\xdd\xef\x3f\x78\xf0\xe0\xd9\x9e\x9e\x9e\xd3\xc9\x64\xf2\
+\x30\xd1\xc3\xd3\xd6\x15\x30\xcd\xb6\xe7\xfc\x9b\xc1\x71\x9c\x72\
+\xa1\x50\xb8\x9c\xcd\x66\x7f\x3c\x3f\x3f\xff\xf2\xf3\xcf\x3f\xff\
+\x6a\x3e\x9f\x8f\xd2\xed\x7e\x09\x50\xe1\x26\xa6\x65\xf7\x0a\x3b\
+\xcd\x00\x7e\x68\xa3\x31\x41\x9b\x23\x08\x20\xd6\xd3\xd3\xd3\x71\
+\xdf\x7d\xf7\x1d\x3b\x74\xe8\xd0\x89\x4c\x26\x33\x92\x4e\xa7\x07\
+\xd3\xe9\xf4\xc1\x44\x22\x31\x10\x8b\xc5\x76\x74\x7d\x39\xa5\x94\
+\xb4\x2c\x2b\x5f\x2a\x95\x56\x4a\xa5\xd2\xda\xc6\xc6\xc6\xfc\xea\
+\xea\xea\x95\xd9\xd9\xd9\x77\xde\x7a\xeb\xad\xb7\x4b\xa5\x52\x99\
+\x68\x43\xce\x6f\xd0\xdd\x36\x46\xdd\x56\x71\x2b\x19\x20\xf8\x3b\
+\x51\x0c\x11\xf4\x35\x98\x21\x7b\x13\x30\xf7\xed\xdb\xd7\x71\xe2\
+\xc4\x89\xe1\xfe\xfe\xfe\xfe\x64\x32\xd9\x9d\x48\x24\xd2\xb1\x58\
+\x2c\x19\x8f\xc7\x3b\xe2\xf1\x78\x87\x61\x18\x29\xd3\x34\xd3\x80\
+\xa8\x56\xab\x15\x29\xa5\xb4\x6d\xbb\xe2\x38\x8e\x63\xdb\x76\xd5\
+\xb6\x6d\xab\x5a\xad\x6e\xac\xae\xae\x2e\xcd\xcd\xcd\x2d\xcd\xcc\
+\xcc\x2c\x57\xab\xd5\x0d\xdc\x5e\x5b\xa2\xee\x91\xd3\xce\x19\x7f\
+\x74\x8d\x3e\xae\x50\x1f\xbe\xfd\x54\xf4\xf2\x66\xd8\x2d\x06\x08\
+\x83\x8e\x84\x8d\xfb\x36\xd3\xb7\xf9\xd3\x9a\x82\x09\x14\xc1\x08\
+\xda\xb0\x28\xa6\xe0\xec\x9a\x9e\xdd\xf4\xfb\xe1\x1d\x1a\x27\x63\
+\xfc\x31\x74\xda\x62\xdf\x52\x88\xd5\x4f\x1b\xf6\x92\x01\xc2\xe0\
+\x9f\x7d\xd4\x09\x92\x41\x49\xe0\x4f\x9a\x88\x4a\x9e\x80\xc0\x14\
+\x36\x8d\xd3\xdc\x9a\xc8\x76\x60\xbf\xa7\xa9\xda\x7b\x81\xdb\x8d\
+\x01\xb6\x82\x30\xa2\x07\x83\x2a\x08\x9c\xff\xbd\x21\xec\xcf\xf0\
+\x33\xfc\x0c\x3f\x43\x6b\xfc\x7f\x31\x12\xc4\x35\xeb\xad\xf4\x69\
+\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x3f\x66\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x80\x00\x00\x00\x80\x08\x06\x00\x00\x00\xc3\x3e\x61\xcb\
+\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
+\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\x25\x00\x00\x80\x83\
+\x00\x00\xf9\xff\x00\x00\x80\xe9\x00\x00\x75\x30\x00\x00\xea\x60\
+\x00\x00\x3a\x98\x00\x00\x17\x6f\x92\x5f\xc5\x46\x00\x00\x00\x06\
+\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\x00\
+\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\x00\
+\x9a\x9c\x18\x00\x00\x3c\xd6\x49\x44\x41\x54\x78\xda\xed\x7d\x79\
+\x90\x5e\x57\x75\xe7\xef\xbc\xf7\xad\xdd\x52\x4b\x6a\xb5\xb6\xd6\
+\x66\x5b\x06\xb3\xc4\xd8\xc6\x0b\x24\x6c\x89\x59\x82\xc3\x62\x8c\
+\x09\x43\xc8\x32\x54\x52\x4c\x15\x95\xc2\x26\xc9\xa4\x6a\x6a\xfe\
+\x48\x51\xf3\xd7\x54\x25\x33\x55\x49\xc5\x96\x13\xe2\xd8\xc1\xd8\
+\x66\x09\x03\x84\x21\x80\xcd\x2e\xc0\x18\xbc\x60\x03\x16\x78\xd3\
+\x6a\xb5\xba\xa5\xde\x97\x6f\x79\xef\xde\x33\x7f\xbc\xbb\x9c\x7b\
+\xdf\xfb\x5a\x12\x92\x6c\xa6\x66\x9e\xaa\xd5\x5f\xbf\xe5\xbe\x7b\
+\xef\xf9\x9d\x73\x7e\xe7\xdc\xe5\x03\xfe\xff\xf1\xff\xf4\x41\x2f\
+\x74\x05\xce\xe4\x78\x62\xea\x03\xc8\xb8\x89\x26\xad\xd4\x12\xe2\
+\x3a\x11\xea\x00\x25\xc5\xef\xa2\x39\x64\x9a\x54\x6a\x18\x01\x04\
+\x36\xf7\xb0\x3d\x01\x80\x01\x06\x80\x14\xc5\x5f\xda\x9d\xe3\xa0\
+\x94\xe2\x19\x06\xc0\xc5\x03\x00\x28\xd3\x60\x0d\x20\x03\x73\xa6\
+\x90\xe5\x09\x6a\xb8\x64\xec\x13\x2f\x74\x57\x9d\xf6\xf1\x2b\x0b\
+\x80\x9f\x4d\xfd\x01\x00\xa4\x04\x1a\x21\xc2\x28\x80\xed\x04\x5c\
+\x00\x60\x27\x81\x77\x11\x61\x03\x40\xeb\x88\xd0\x04\x30\x42\x20\
+\x2a\x1a\x24\x01\x20\x04\xcd\x30\x77\xc8\x46\xc7\xcd\x27\x01\x00\
+\x72\x62\x96\x87\x00\x00\x83\xb1\xa0\x81\x1e\xc0\xf3\x0c\x9e\x05\
+\x70\x98\x81\x23\x60\x3a\xc8\xe0\xe7\x00\x9a\x61\xc6\x02\x08\xea\
+\x65\x9b\xee\x7a\xa1\xbb\xb4\xf2\xf8\x95\x01\xc0\xe3\x53\xef\x07\
+\xc0\x04\x24\x23\x04\xda\x45\xe0\x2b\x00\xba\x8a\xc0\x97\x13\xd1\
+\x45\x04\x1a\x06\x30\x44\x40\x83\xc0\x20\x21\x4d\xaf\xf7\xf6\x14\
+\x85\x00\xb0\xe7\xa9\x7c\x07\xa8\x10\xb6\x31\x03\x4e\xbb\xb9\x42\
+\xfa\x2c\xee\xb2\xa8\xd2\x2c\x9f\x23\x30\xa3\xcf\xc0\x0a\x80\x65\
+\x00\xcf\x6a\xc6\x8f\x19\xfc\x10\xc0\x8f\x32\xf4\x61\x00\x0b\x00\
+\xf8\xd2\xcd\xf7\xbe\xd0\x5d\x6e\xbb\xef\x85\x3b\x7e\x7c\xfc\xfd\
+\x00\x27\x00\xe9\xb5\x44\x78\x39\x11\xfd\x36\x80\x37\x10\xf0\x52\
+\x02\x36\x00\xd4\x24\x14\x82\x93\x9a\x6d\xcf\x15\x27\xc8\x9d\x43\
+\x74\x4f\xa9\xb1\xe2\x24\x21\x31\x9f\x24\x48\xf8\x14\x00\x20\x73\
+\x9d\xdd\xa3\xda\x60\x87\xcd\x43\xe2\x6a\xf1\x99\x01\x06\xf7\x01\
+\xcc\x30\xb0\x9f\xc1\xdf\x06\xf0\x55\x66\xfe\x59\xc6\x6a\xb1\x46\
+\x09\x2e\xdf\xf2\xc2\x81\xe1\x05\x01\xc0\xc3\xc7\xdf\x0f\x06\x6a\
+\x09\x70\x11\x01\x6f\x26\xe0\x3a\x22\xbc\x8a\x88\x36\x02\x20\xef\
+\xab\xc9\xe9\x2a\x91\x35\xbc\x1a\xcc\x1a\x71\x57\x17\xf7\x24\xee\
+\x5c\x0c\x02\x81\x97\x81\x4d\x67\x69\xf4\x19\x81\x0b\x90\x6f\x2b\
+\xee\xb4\x6f\x60\x00\x89\xa9\x6f\xe2\x1c\x91\xe3\x0b\xec\xcb\xd5\
+\xd6\x75\x00\xd3\xcc\xfa\x41\x66\x7c\x99\x41\xf7\x03\x78\x16\x40\
+\x7e\xc5\xd6\x7b\x9e\x77\x59\x3c\xaf\x00\x78\xf8\xf8\xef\x81\xc1\
+\x35\x42\xf2\x52\x00\xef\x27\xe0\x46\x02\x2e\x24\x70\x0d\x20\x24\
+\x89\xd7\x44\x30\x81\x59\x43\x71\x0e\x66\x05\x86\x86\x66\x05\x66\
+\x0d\x40\x9b\xca\x7b\x57\x20\xad\x40\x2c\xec\x12\x18\x56\x69\xb5\
+\x13\x11\xca\x9a\x1c\x9e\x13\x96\x82\xc8\x5d\x27\x4a\x41\x94\x80\
+\x28\x45\x42\x29\x12\xaa\x21\x41\x5a\xb8\x1a\x63\x41\x8a\xf2\x18\
+\x60\xe4\x0c\x1c\x60\xe0\xb3\x0c\xdc\xa3\x81\xfd\x04\xe4\x57\x3d\
+\x8f\x40\x78\x5e\x00\xf0\xc3\x89\xf7\x01\xa0\x1a\x80\x5f\x23\xe0\
+\x0f\x89\xe8\xdd\x04\xec\xb6\x3c\xdc\x1b\xe3\x42\xe0\xb9\xce\xa0\
+\xb4\x82\x36\xc2\xf6\x6e\xc0\x57\x5a\x9e\x73\xee\xc1\xb9\x0a\x16\
+\x3e\x7e\x80\x35\x18\xd4\x72\x8e\x04\x5f\x3a\x5f\x68\x3f\xb3\xbf\
+\x4b\x9b\xbf\xd9\x3d\x23\x2d\x04\x21\xa1\x1a\x52\x4a\x90\x26\x75\
+\xd4\x92\x1a\xc8\x00\xc6\x16\xa1\x8b\xc7\x0e\x31\xf0\xbf\x34\xe3\
+\x2e\x80\x7f\x0a\x50\x7e\xcd\xb6\xf3\x0f\x84\xf3\x0a\x80\x1f\x1c\
+\xfb\x5d\x68\x74\x90\x60\xcd\x85\x09\xe1\x8f\x51\x08\x7f\x17\x31\
+\x39\x0e\x07\x66\x28\xce\x90\xa9\x0c\x39\x67\xd0\xac\x60\x05\xe8\
+\x05\x4d\x42\xd8\xbe\xe2\x09\x08\x20\x71\x2f\xc9\x06\x51\x20\x68\
+\xf9\x9c\x37\xdd\x45\xd9\xd6\x77\xdb\x3b\x9c\x76\xdb\x53\x4c\x81\
+\x7b\xb0\x1a\x2c\xad\x81\xae\x00\x0e\x0b\x6e\x60\x6d\x56\x92\x24\
+\xa8\x51\x1d\xb5\xa4\x81\x1a\xa5\x00\x25\xf2\x39\xd6\x8c\xc3\x00\
+\xdd\xc5\xd0\xff\x9c\x29\x75\xa0\x96\xa4\x78\xf5\xf8\xf9\xe3\x08\
+\xe7\x0d\x00\x0f\x1c\x7b\x1f\x18\x3c\x4c\xa0\x1b\x08\xf8\x73\x02\
+\x2e\x03\x21\x49\x2c\x3f\x67\x46\x5f\xf7\xd0\x57\x7d\x68\xce\x01\
+\xd6\x42\xd0\xf6\x9f\x11\x2e\xa1\x12\x00\xee\x9a\x13\x78\xe1\x12\
+\x2a\xb5\x9d\x11\x91\x40\xe1\x6e\x22\xc1\xbb\xb3\x15\xae\xc0\x0a\
+\xdc\x5e\x67\xa7\xfd\x83\x08\xa0\xbd\xaf\x00\x81\x76\xa6\xa4\xb0\
+\x0c\x8d\xb4\x81\x7a\xda\x44\x42\x45\x1e\x42\x17\xc0\xd2\x60\x7e\
+\x8c\x81\xff\x09\xf0\xe7\x00\x2c\xbf\x7a\xfc\x93\xff\x77\x00\x60\
+\xdf\x73\xef\xc3\xe5\x04\x3c\xce\x78\x11\x11\xfe\x0b\x80\xf7\x26\
+\xc0\x1a\x2b\x24\x0d\x46\x5f\x75\xd1\xcf\xfb\xd0\xc8\x85\x30\x21\
+\x04\x4d\x86\x56\x19\x41\x51\x6c\xf2\x05\x08\xc8\xc7\x07\x09\xd8\
+\x85\x85\x5e\xcc\x56\xd3\x3d\x12\xca\x8d\x96\x51\x80\x38\x38\x26\
+\x7f\x01\xb3\x37\x7f\x7b\x00\xb8\xeb\xf2\x59\x51\x86\x16\x34\x50\
+\x5a\x8c\x02\x08\x4d\x34\x0c\x10\x18\x6c\x5d\xcc\x12\x03\x9f\x66\
+\xc6\x7f\xc7\xc8\xfa\xa7\xb0\x30\x8b\xdf\xd8\x7e\x6e\x81\x70\x4e\
+\x01\xb0\xef\xe8\x7b\x00\xe4\x29\xa8\xf5\xa6\x04\xf8\x6f\x04\x5c\
+\x6d\x64\x0a\x0d\x8d\x9e\xea\xa1\xa7\xfa\x50\x5a\x39\x61\x26\x42\
+\xa8\x55\xe6\x3e\x21\x00\x2c\x34\xbd\x04\x02\x0a\xb4\xde\x5d\x8b\
+\x2c\x83\x77\x09\x42\xad\xa5\x79\x60\xff\xd9\xc6\x11\x91\x23\x30\
+\x02\xf5\xa1\xa0\xd3\xf6\xc0\x1d\x84\x42\x2f\xd4\xd9\x5a\x00\x9b\
+\x2b\xe0\x10\x18\x6c\x81\x90\xa2\x99\xb6\xd0\x48\x1b\x48\x8c\x6b\
+\x28\xb0\xc6\x3f\x62\xe0\xaf\x34\xf0\x35\x02\xd4\x6b\xcf\x21\x08\
+\xce\x19\x00\xbe\x73\xf4\xbd\x00\x68\x84\x80\x0f\x82\xf0\x17\x04\
+\xda\x96\x10\xc0\xac\xd1\x57\x39\x3a\x79\x07\x4a\xe7\x00\x09\xed\
+\x16\xa6\xdd\x12\xc1\xe2\x1c\x39\x1f\x6f\xdd\x80\xb4\x02\x52\xd0\
+\xd6\x0d\x84\x7a\x2f\xca\x5a\xb5\xc1\x86\x43\x04\xf2\xa7\x48\xe3\
+\x05\x00\x38\x74\x03\xa8\xd2\x7e\x4f\xec\x9c\x8b\xd0\x10\x2e\xc2\
+\x08\xdf\xde\xaf\x85\xa5\x30\xf6\x01\x69\x52\x47\xbb\xd6\x42\x23\
+\x69\x14\x8d\x28\x38\xc4\x04\x03\xff\x03\xd0\x1f\x03\x68\xe1\x75\
+\xdb\x3f\xf5\xab\x01\x80\x6f\x1d\xb9\x11\x84\x14\x0c\x1e\x27\xa2\
+\x8f\x12\xf0\x87\x04\x6a\x11\x11\x14\x2b\x74\xf2\x0e\x7a\x79\x0f\
+\xcc\x5c\x68\x3b\xf9\xd8\x3e\x21\xeb\xb7\x63\x37\x50\x54\x4b\xba\
+\x81\x40\xfb\x2b\x40\xe0\x13\x42\x42\xdb\xc5\xbd\x85\x28\x12\x51\
+\xf3\xb2\x2b\xf0\x67\xbc\x15\x70\x7f\x47\x24\x0f\x46\x98\xf6\x6e\
+\x49\xfc\x24\x18\x6c\xf2\xa8\xd0\xff\xb2\xf6\xdb\xcf\x9a\x45\x39\
+\x06\x8d\xcd\x5a\x13\x43\xb5\x96\x71\x0b\x00\x83\xbb\xcc\x7c\x17\
+\x03\x1f\x05\x70\x8c\x99\xf0\x9b\x3b\xcf\x0e\x08\x67\x05\x80\x6f\
+\x1c\xf9\x0f\x48\x8a\x4a\xbf\x88\x80\xbf\x21\xe0\xed\x44\x94\x10\
+\x18\x3d\x9d\x63\x39\xeb\x40\xe9\xac\x14\xb2\x79\xc1\x87\xec\xdd\
+\x5b\x01\x0a\xef\xb7\x82\x25\xaa\xd4\xee\x10\x04\x22\x04\x74\xe7\
+\x3d\x30\xa4\x08\xe5\x7d\x91\xf7\xf7\xe7\x39\x74\x05\xa1\x8f\x2f\
+\x03\x00\x56\xa8\xc2\x12\x48\xc1\x32\xec\x40\x93\xb9\x16\x58\x80\
+\xa2\x34\x69\x15\x6a\x69\x0d\xc3\xb5\x21\xd4\xd3\xba\x2d\x5b\x33\
+\xf8\x7f\x33\xeb\xff\x0c\xe0\x29\x20\x39\x2b\x10\xfc\xd2\x00\xf8\
+\xda\x91\xf7\xa2\x56\xc4\xc0\x2f\x07\xf0\xb7\x09\xf0\x46\x1b\x5c\
+\x75\xf2\x2e\x56\xf2\x0e\xb4\xd5\x7a\x63\xa6\x13\xc7\xea\xc9\x09\
+\x5c\x0a\xd2\xf1\x01\xa2\x92\x96\xdb\xe8\xc1\xba\x0d\xc3\xf7\xc4\
+\x7d\xd6\x4a\xc8\xd4\xb0\x6c\x28\xb9\x64\x4c\x35\x00\xec\xff\xa1\
+\xd6\x87\xd7\x43\xed\xaf\x8e\x0a\x8a\x92\xe3\xc8\xc0\x01\xc0\x3c\
+\x67\x73\x07\x80\x70\x03\xa2\x5c\xcf\x0f\x18\x44\x09\x86\x6a\x6d\
+\xb4\x6b\x4d\x00\x89\x49\x86\xf1\x37\x18\x74\x53\x02\xfe\x99\x02\
+\xe1\xda\x9d\x9f\x7e\xfe\x00\xf0\xf5\xc3\x37\x82\x93\x3a\xc0\xfa\
+\xe5\x04\xdc\x4a\xc0\xeb\x09\x80\x66\x85\xa5\xac\x8b\x5e\xde\x03\
+\x8c\x86\x27\x42\x93\x29\xfa\x1c\x70\x01\xf9\x1b\x28\x91\xc1\xb2\
+\x80\x3d\xbb\x0f\x08\xa1\x3d\x89\xd0\x42\x94\x9a\x4b\x1c\xc5\x04\
+\x76\x50\xc8\x8a\xb4\x7c\x48\xcd\x0f\x00\xe1\x84\x46\x4e\xa0\x12\
+\x18\x81\x05\xe0\xd0\x5d\x14\x6e\x41\xde\xe3\xc6\x23\xdd\x79\x6d\
+\x5d\x42\xda\xc0\x9a\xfa\x90\x21\x88\x0c\x06\xf6\x31\xf0\xa1\x04\
+\xfa\x67\x0a\x0d\xbc\x69\xe7\x99\x27\x8e\xce\x18\x00\x5f\x3d\xf2\
+\x6e\x24\x5c\x03\xc0\x2f\x26\xa2\xbd\x00\xae\x4d\x00\xe4\x5a\x61\
+\xb1\xbf\x8c\xbe\xca\x84\x40\x3d\x00\x12\x22\x80\xa5\x96\xbb\x3c\
+\x99\xb8\xdf\x26\x75\xb8\xe4\x06\x7c\x5e\xc0\x73\x04\x72\x61\x9f\
+\x15\xbf\xf7\xff\x92\x38\x9e\x5e\xb3\xab\x5d\x40\x28\x78\x69\xf6\
+\x05\x50\x98\x9c\x50\x25\x40\xaa\x84\x0f\x48\xd3\x2f\x2d\x05\x05\
+\x00\xf0\x6e\xc2\xb8\x04\x53\x6e\x3d\x6d\x60\xa4\x3e\x84\x5a\x92\
+\x5a\x37\xf2\x0d\x00\x1f\x62\xd0\x93\x75\xd6\xf8\xcd\x5d\x9f\x39\
+\x23\x79\x26\x67\x74\x37\x00\x70\x02\xc5\x7a\x5c\x83\xff\x9a\x99\
+\xaf\x05\x80\xbe\x56\x98\xeb\x2d\xa3\x9b\x67\x42\x13\x6c\xc2\xa7\
+\x82\x1c\x05\x3f\xe2\x93\x20\x5a\x08\xc8\x92\x34\xa7\x2c\xc8\x57\
+\x98\x6d\xf3\x84\xcb\xde\x17\xbe\x2b\x14\x69\xf5\x15\x0b\x90\x92\
+\xe9\x8e\xea\x00\x2b\x14\x71\xcd\xb7\xc6\x0b\xd3\xdf\x83\x72\x9d\
+\xdd\xbd\x24\xc0\x20\xc1\xe6\x5d\x8a\xbd\xb7\x97\x67\x98\xeb\x2d\
+\xa1\xaf\x73\x5b\xc6\xb5\x0c\xfc\xb5\x66\x3d\xde\x3f\x63\x61\x9e\
+\x21\x00\xbe\x7c\xf0\x77\xa1\x34\xad\x63\xe0\xa3\xcc\xf4\x76\x80\
+\x90\x29\x85\xd9\xde\x32\x7a\x2a\x73\x0d\x74\x26\xb1\x14\x36\x49\
+\x81\x79\xda\xc7\x22\xf4\x8a\x7d\xa0\xf7\xc3\xf6\x7c\xc1\x24\x34\
+\x7b\xa0\xb1\xb1\xde\x21\x29\x63\x07\x16\xc7\xb4\x03\xb1\x8b\x8e\
+\x2f\xf9\x6a\x29\x60\xcb\xe1\x25\x4f\x88\xb5\x3c\x1c\xf9\x73\xff\
+\x08\x51\x9f\xf8\x77\xba\x7a\xb3\x1d\x37\x88\xea\xe0\x40\x4c\x90\
+\x50\x60\x43\xb0\x67\x7b\xcb\xe8\x6b\x65\xcb\x79\x3b\x80\x8f\x6a\
+\xf0\xba\xaf\x1e\x7e\xcf\xf9\x01\xc0\x97\x0e\xde\x88\x1c\xaa\x06\
+\xf0\x87\xc0\xf8\x23\x00\x49\x5f\xe7\x98\xed\x2d\xa1\xa7\x32\x5f\
+\x45\x0e\x3b\xca\x7e\x0a\x74\xcd\x76\x94\x69\xbc\x64\xc3\x10\xc2\
+\xb1\x27\x98\x65\x98\x24\xc4\xcc\x0c\x37\x30\xec\x4c\x2a\xb9\xf8\
+\xdb\x95\x0d\xa1\x89\x42\xb0\x9a\x39\x10\xb6\x66\x4f\xc8\x6c\xec\
+\xae\xdd\x1b\x85\x90\x9d\xc9\xb7\x02\x95\xe7\xc2\x28\xc0\xf7\x49\
+\xe2\xc1\x25\xed\x05\x19\x70\x70\xd8\x6b\x81\xc8\x19\x21\x2f\x60\
+\xa0\xaf\x72\xcc\xf5\x96\xd1\x57\xb9\x95\xe3\x1f\x31\xe3\x43\xb9\
+\x4a\x6a\xff\x7e\xf0\x77\xcf\x2d\x00\xfe\xed\xe0\x7b\x0c\x61\x4b\
+\xde\xc1\xc0\x9f\x33\xd0\xcc\x8c\xf0\xbb\x42\xf3\x65\xe5\xe3\x0a\
+\x97\xd1\x1d\x3f\xe3\xcd\x5c\x55\x9c\x1c\xfa\x54\x49\x94\xa8\x74\
+\xaf\x8e\x88\x95\x16\x26\x5d\xc3\x87\x66\x71\x5d\xe1\xee\x67\x71\
+\x5e\x98\x67\x0e\xaf\x3b\xe1\x4a\x97\xe4\x7e\x28\x64\xf7\x02\xa4\
+\x10\x9f\x83\xfa\x0b\x05\xb2\x6d\x83\x28\xcf\x8f\x40\x16\xe7\xba\
+\x2a\xc3\x6c\x6f\x19\x99\xce\xc1\x8c\x26\x33\xfd\x39\x88\xdf\x91\
+\x22\xc1\x17\x0f\x9e\x9e\x25\x38\x6d\x0b\xd0\x07\xbd\x84\x81\xbf\
+\x02\xb0\x49\x31\x63\xb6\xbf\x82\x8e\xf3\xf9\x5c\x12\xa8\x6c\x88\
+\x6f\x70\xec\xbb\x19\x9e\x04\x85\x19\xb2\xe0\x7e\x1e\x04\x86\x88\
+\x67\xa0\xdc\xe1\xf6\x43\xfc\xcf\x0e\xcc\xd8\xfa\xfb\xbf\xab\x62\
+\x7a\xe9\xdb\x85\x19\x67\x21\x9c\x0a\x50\xdb\xe7\x2d\xb4\x7c\x7b\
+\x04\x69\xa4\x41\x60\x8f\x5c\xe6\x00\xc5\xe9\xaa\x0c\xb3\xfd\x15\
+\xe4\xac\xc1\xc0\x26\x06\xff\x55\x0f\xea\x25\xa7\x2b\xd7\x53\x02\
+\xe0\xf3\x07\xdf\x03\x5d\xcc\xc7\xfb\x4b\x06\x2e\x57\x60\xcc\xf7\
+\x57\xd0\xc9\xfa\xc2\x4f\x45\x15\xac\x40\xbe\xbd\xae\x6d\x63\x48\
+\x34\x54\xf8\x68\xcd\xa2\xbb\x98\xbc\x76\x06\xee\x80\xa3\x8e\xa2\
+\x81\x96\x26\xb6\x44\xb1\xa9\xf2\x31\x7c\x04\xce\xa0\x3c\x0a\xf8\
+\x03\x2a\xde\xe5\x2c\x8b\x14\xb8\xe4\x1e\x41\x1f\x09\x93\x6f\x5d\
+\x42\x54\x1e\x38\x26\xa2\xbe\x9f\x42\xa5\x02\x56\xf2\x3e\xe6\xfb\
+\x1d\x0b\xe8\xcb\x01\xfc\xa5\x06\x86\xbf\x70\x1a\x56\x60\x55\x00\
+\x7c\xee\xd9\xf7\x02\x69\x1f\xcc\xfa\x06\x06\xde\xcb\x00\x96\xb2\
+\x1e\x16\xb2\x9e\xe8\x10\x1a\x28\x74\x9b\xd2\x8c\x4d\xb8\x0e\xae\
+\x4b\x10\x58\x8d\xae\x22\x67\xf1\x98\x3b\x23\x24\x8c\xd2\x47\x57\
+\x11\xaa\x0a\x40\x20\x14\xb4\x66\xe9\x7e\x2a\xac\x5a\x55\x3b\x8d\
+\x70\xd8\x14\x24\x95\x22\x4c\xed\x86\xee\x0d\x91\x9b\xaa\xb6\x60\
+\xd1\x20\x93\xf8\xac\x45\xbf\x30\x33\x16\xb3\x2e\x96\xb2\x9e\xbd\
+\xef\xbd\x00\x6e\x20\xd2\xf8\xfc\x81\xd5\xf9\xc0\xaa\x00\xd0\x50\
+\x50\x59\xfd\x22\x06\xfe\x8c\x99\xd7\xf4\x54\x8e\xb9\x7e\xd7\x6b\
+\x20\xd3\x60\xf3\xeb\x3a\xd1\x87\x36\x28\xdd\x4b\x45\xa7\x0b\x93\
+\xea\xfd\x71\xd8\xe1\x5a\x32\x67\x90\xd1\x90\xc2\xcf\x5a\x53\x0e\
+\x51\x6e\x4c\xc4\xc2\x61\x59\xff\x1e\x1d\xfd\x1d\x03\xca\x69\x3b\
+\x4b\x82\x18\x0b\x49\xf0\x17\x63\xb9\x42\xeb\xc7\x51\x1d\x48\xf4\
+\x4f\x99\x07\x84\xd6\x82\x9c\xe5\x92\xdc\x20\x8c\x6c\x08\x8a\x81\
+\xf9\x7e\x07\xbd\x82\x14\xae\xd1\xc0\x9f\x29\x4d\x17\xb1\xb3\xb9\
+\x67\x08\x80\x7f\x7d\xf6\x46\x28\x24\x29\x83\xff\x04\xcc\x97\xe7\
+\xac\x31\xdb\xeb\x20\xd3\xaa\xac\xf1\x1c\x76\x68\xd9\x7f\xca\x44\
+\x09\x95\xc4\x25\xf9\x36\x6c\x47\x07\x16\xc1\xde\xed\xcd\xa6\x83\
+\x16\x89\xf7\x54\x68\xbe\x2f\xcb\x97\x23\x41\x11\x1f\xb1\x0b\x88\
+\x81\xe1\x2d\x08\x0b\xce\x20\x35\xbf\x18\xfd\xd3\x46\x50\x0e\x18\
+\x25\x8b\x53\x0e\x95\x6d\x05\x0a\x6b\xc7\x41\xef\x04\x3d\x46\xc2\
+\x9d\x3a\xa0\x33\xfa\x5a\x61\xb6\xd7\x41\x5e\x34\xfa\x72\xcd\xfc\
+\x27\x19\xeb\xf4\x5f\x9f\x7d\xf7\x99\x03\xa0\x10\x9b\xba\x82\x81\
+\x3f\xd0\x40\xb2\xd4\xef\x62\x25\xcf\xa2\x0e\xf6\x15\x75\x19\x2b\
+\x71\xdd\x6b\x30\xa3\x64\xfe\xa4\x06\x46\x26\x1f\xe4\x49\x61\xd8\
+\xe1\x02\x68\x6c\xb5\x2d\x24\x72\xa7\x8a\x38\x5c\xa8\xc7\x9e\x73\
+\xc8\x9f\xd8\x52\xc8\xcf\xb6\x41\xcc\xc5\xd4\x0e\x3f\xda\x87\x20\
+\x5b\xe7\x2c\x9e\x04\x54\x50\xb7\x70\x70\xa8\xe4\x6e\x5c\xb9\x66\
+\xba\x5a\x50\x27\x31\xff\xb0\x94\x36\x06\x3a\xaa\x8f\xc5\xbc\x07\
+\x0d\x24\x0c\xfa\x03\x02\x5d\x51\x81\xf3\xd5\x01\xf0\xa9\x67\x6e\
+\x84\xd6\x54\xd7\xa0\x0f\x00\xb4\xab\xa7\x14\xe6\xb3\x5e\x10\xfe\
+\xc8\x74\xa6\xae\x6c\x64\x6c\x26\x05\x08\x44\x47\x5b\xb0\x85\x43\
+\xa7\x3e\xbe\xf6\xa6\x8f\xbc\x39\x8e\x34\x15\x56\xf8\x60\x68\x32\
+\xf9\x01\xe9\xdb\x51\x65\xe2\x57\x01\x09\x2a\xcc\x3c\x17\xe4\x53\
+\xc3\x9a\xfc\x72\xf8\x19\xd7\xd9\x02\xcc\x01\x4f\x6a\x74\x65\x3f\
+\x09\x21\x3b\xb0\x45\xc2\x8f\xeb\x27\xae\x5b\x85\x5b\x30\xae\x80\
+\xc1\xbb\x00\xfa\x80\x06\xd5\x3f\xfd\xec\x8d\xa7\x0f\x00\x63\x66\
+\xae\x00\xe3\x06\xc5\x1a\x73\xfd\x0e\xfa\x81\xe9\x37\x83\x1e\xa2\
+\x83\x10\x08\x3a\xf2\xe5\xce\x15\x84\x88\x2f\x93\xba\xa8\xc3\x81\
+\x92\x20\xfd\x73\x1e\x28\x36\x2b\x18\xe6\x10\xac\x45\x60\x21\xc0\
+\x6a\x61\xc7\xe7\x10\x3c\xc7\x42\x70\x1e\x98\x92\xc8\x7a\xf3\x5f\
+\x91\xb4\x11\xbf\x61\x1d\x1d\x4b\x0e\x30\xf8\xde\x4a\x50\xda\xeb\
+\xc2\xdd\x69\x61\x09\x34\x01\x7d\xad\x31\xdf\xef\xda\x7b\x6f\x00\
+\x70\x85\x77\x22\xa7\x00\xc0\x3d\xcf\xdc\x00\x85\x2c\x65\xe0\x7d\
+\x0c\x8c\x77\xf2\x1c\xcb\x79\x26\x84\x18\x09\x59\x66\xf3\x0c\x4a\
+\xab\x84\xe6\x4d\x96\x67\xbf\x0e\x6c\x15\x1d\xe1\x4d\x6c\x85\x2f\
+\x77\xd7\xbc\x46\x4a\x81\x71\x55\xb9\xe6\x9f\x16\x80\x90\x9a\x2d\
+\x33\x81\xde\xff\x96\x23\x18\xc7\x1d\x5c\x8a\x98\x5d\x5d\x03\x97\
+\x21\x2c\x9d\xe4\x47\xa8\xc8\x19\xc8\x9c\x88\x0b\x93\x59\xf4\x17\
+\x64\x59\xa2\x8d\x25\x4b\x5a\xf0\x0e\xcd\xc0\x52\xde\xc7\x4a\x91\
+\xa4\x1b\x67\xc6\xfb\x94\xa2\xf4\xde\xa7\xcb\x56\xa0\x04\x80\xa2\
+\xb0\xe4\x45\x0c\x7e\x87\x62\xc6\x7c\xbf\x87\x5c\x32\x5d\xe1\x2b\
+\xe1\xb4\x34\xd2\x5e\x07\x10\x2a\x35\x12\x4e\x60\xd2\x8c\x57\x65\
+\xff\xa2\xa4\x4c\xa0\x21\x51\xa7\xb0\x25\x5f\xc2\x22\xb0\x07\x69\
+\x18\xb2\x92\x4b\xfa\xc8\xf3\xd2\xbd\x49\x81\x4b\x6d\xf6\xe5\x72\
+\x08\x74\xae\x12\x68\x0c\x1c\x2d\x48\xb1\x70\x03\x1c\x69\xb6\xb4\
+\x3e\x81\x95\x22\xff\x8c\x68\x97\x46\x75\xbf\xe5\x9a\xb1\xd0\xef\
+\x41\x15\xe5\xbc\x13\x09\x5e\xc4\x15\x83\xa0\x01\x00\x3e\xf1\xf4\
+\x0d\x06\x41\xf4\x56\x06\x2e\x5c\xc9\x33\x2c\xab\x2c\x24\x4c\xc2\
+\xd4\x94\xcc\x69\xec\xef\x84\x10\x42\xc4\x7a\x4b\xe0\x1a\x42\x42\
+\x4b\x85\x99\xb4\xe4\xd2\x76\xd2\x60\xa2\xc7\x41\xf9\x9e\x6f\x88\
+\xf3\x1c\x82\x2a\x74\x49\x65\xeb\xa6\x03\x70\x7a\x1e\x23\x01\x16\
+\x6a\x5f\x05\xc9\x74\x56\x23\x72\x1d\x81\x55\x90\x2e\xac\xc2\x8a\
+\xb9\xf7\xfb\xdf\x31\xe9\xd4\x16\xd8\x22\xb4\x59\x56\x19\x96\xf3\
+\x0c\xcc\xb8\x00\xcc\x6f\x25\x4e\x70\xf7\xd3\xef\x1a\x0c\x00\x0d\
+\x86\x82\xde\x00\xe0\x9d\x8a\x75\xba\x90\xf5\xa0\x74\x85\x66\xb0\
+\x41\xb3\x03\x41\x39\x1f\x30\x30\xbe\x16\x0d\xac\x9a\x12\x15\xa3\
+\x1d\x15\x2e\x22\x60\xed\x25\x8d\x15\x66\x5d\x96\x25\xeb\x79\x1a\
+\x3f\x41\x52\x47\xd4\x35\xcc\x42\x0a\xc0\xcb\x67\x03\x70\xc5\xfc\
+\x27\x54\x12\x00\x15\x80\x26\x63\x61\x28\x70\x1f\x2e\xe2\x62\x94\
+\xca\x93\x03\x63\xf6\xba\xd2\x8c\xc5\x7e\x0f\x1a\x9c\x6a\xf0\x3b\
+\x33\x64\x1b\xe2\xac\x40\x00\x00\x05\x82\x62\xba\x4c\x03\x57\x74\
+\x94\xf1\xfd\xb1\xa6\x1b\x13\xac\x1d\xd3\x26\xef\x07\x65\xe5\x84\
+\x9f\xd2\x8e\x23\x78\xd3\x2d\x49\xcc\xc0\x18\x59\x9a\x79\xf1\x0e\
+\xdb\x69\xb1\xb6\x95\x05\xc3\xa1\x7f\x0f\xcc\x7e\xdc\x89\x82\x61\
+\xb3\xcf\x0a\xca\x32\x02\x6d\xaf\xa8\x43\x68\xb2\x23\xd7\x25\x00\
+\x58\xca\x95\x44\xca\xe1\x47\x22\x6d\xff\xc2\x11\x5d\x49\x06\x25\
+\x29\x2e\x59\x46\xf3\x79\x59\x65\xe8\xa8\x1c\x1a\x74\x05\x23\xb9\
+\x4c\x47\x5e\xdf\xfd\x75\xfb\x53\xef\x02\x78\x18\x0c\xbc\x51\x31\
+\xd6\x2f\x67\x19\x72\xd6\x01\xea\xc2\x64\x0f\x47\x26\x48\x68\x47\
+\xec\x0a\xa4\x89\x72\x61\x63\x64\xea\xe2\xca\x47\xbc\x00\x15\x1d\
+\x2c\x81\xc0\xba\x1a\x0c\x81\x36\xda\x0e\x66\x4f\x06\x1d\xe9\x13\
+\xe7\x42\x67\x50\xb6\x6c\xb1\xe0\xe3\x7b\x02\x80\xb8\xf6\x84\xed\
+\x45\xd0\x3f\x0c\x6d\xac\x6a\x18\xe9\x84\xa0\x8d\x67\x07\x01\xde\
+\xb5\xc4\x51\x84\x7d\x26\xd7\x8c\xa5\xbc\x0f\x0d\x5e\xaf\xc1\x6f\
+\xdc\x30\x9c\xe2\xf6\xa7\x6e\x70\x00\xa8\xc1\x75\x12\x21\xc7\xf2\
+\x06\x02\xde\x90\x6b\x8d\xa5\x2c\x73\xbe\xda\xce\xa5\x64\x2e\x7c\
+\x75\xc2\x80\xb6\x33\x33\x91\x80\xd8\x4f\xed\x66\x66\x68\xb2\x13\
+\xb0\x19\xda\x30\x8f\x84\xec\x04\xc7\x02\x75\x0c\x98\xf9\xf8\xec\
+\x67\x76\x9a\xf7\xb8\x3f\xdc\x42\x71\x7f\x3f\x00\x10\x69\xd8\xf1\
+\x75\x12\xd7\x2d\x48\x48\x14\x65\x89\xcf\xa0\x49\x60\xf6\xfc\xa0\
+\x84\xa9\x04\x1a\xaa\x3e\xbb\xdf\x56\x24\x76\xa5\x70\x6c\xfe\x05\
+\x50\x38\x02\xa8\xf9\xc3\x6a\x3c\x13\x87\xca\xc6\x22\x2a\x62\xeb\
+\xea\x24\xe7\x2a\x76\x36\xa9\xb2\x84\x1a\x8c\xe5\xac\x8f\xe1\x7a\
+\x13\x69\x92\xbc\x61\x6a\x29\xdf\x40\xc0\x6c\x09\x00\x86\x2d\x5e\
+\x94\x10\x5e\xd2\x51\x19\xfa\x5a\xb9\x0e\xd4\x60\x24\xc6\x14\x25\
+\xb6\x53\x2d\x07\x60\x36\xeb\x2b\x08\xda\x48\x88\xb8\xe8\x5a\x3b\
+\x13\xd8\x4e\x6a\x4c\x44\xbe\xdf\x4e\xd5\xb6\x42\x8d\x41\xc0\xa6\
+\x1c\x39\xc9\xd3\x76\x2b\xb1\x99\xff\x47\x76\x26\x8d\x9d\x0e\x6a\
+\xe6\xd6\xb0\x5c\xe1\x23\xe7\x01\x87\xeb\x03\xa5\x00\x83\x73\x7c\
+\x8a\xbf\x2b\x7e\x4b\x00\x16\x1f\xa4\xcb\x4a\xcc\x32\xb8\x04\xc1\
+\x28\x1f\x4b\x90\x08\x52\xcc\xe5\xe8\xc9\x4f\x34\x95\x96\xc3\xe7\
+\x13\xe2\x10\x54\xf2\xa3\x9e\xd6\xe8\xe4\x39\xd6\xd4\x1b\x2f\x01\
+\xb0\x87\x81\x87\x6c\x5b\x12\x00\xf8\xfb\x9f\x5f\x6f\x91\x76\x8d\
+\x62\x8c\x2e\x67\x19\x14\x7b\xed\xb5\xbe\x07\x22\x07\x1d\xfb\x1e\
+\xff\x5b\x4c\x6e\x94\x88\x64\x76\xe6\xac\x44\x10\x05\xb9\xaa\x4a\
+\xfe\x04\xa6\x59\x9a\x38\x96\x7f\x0b\xbf\x29\x38\x04\x38\x24\x7e\
+\x5a\x1b\x77\xb1\xca\x0f\x73\x39\x63\xe9\x35\xca\x47\x27\x2e\x49\
+\x24\xc3\x60\xd7\x46\xc6\x48\xe3\x25\x78\xd9\xe8\x07\x70\xf9\xd8\
+\x87\x30\x3e\xf4\x7a\x24\x68\x46\x33\x98\x3c\x08\x6c\x5f\xc5\xa4\
+\x4f\x02\xc2\xba\x2e\x4d\x00\x13\x09\xb7\xcb\x25\x17\x20\xad\x92\
+\x62\xc6\x4a\x9e\x41\x01\xa3\x8a\x71\xb5\x62\xe0\x9f\x9e\x7c\x97\
+\xb0\x00\x09\x21\x07\xa5\x09\xf1\x65\x5a\xeb\xb4\x23\x73\xfe\xc2\
+\xf6\x6a\x26\xb3\x56\x0f\x62\xbe\x9b\x71\x13\x16\xeb\x26\x79\xe1\
+\xa6\x5d\x33\x84\x65\x30\xcf\x1b\xd7\x40\x46\x83\x13\xa3\xd5\x1a\
+\x62\xb9\x9e\xb0\x06\x52\x13\x49\xaa\x9e\x9d\x35\xe6\x2c\x85\xb0\
+\x12\x6e\x84\xce\x1a\x66\x6f\x0b\xca\x5a\x4f\x15\x57\xe2\x41\x2b\
+\x3b\x97\xcf\xf3\x02\x18\x01\xba\xbf\x9d\x79\x66\x6c\x6e\x5f\x85\
+\x57\x6e\xfa\x53\xac\x6f\xee\x00\x00\x5c\x38\xf2\x16\xfc\x74\xfa\
+\x73\xf8\xc5\xdc\xa7\x90\xf3\x0a\xec\x40\x91\xcd\xed\x6b\x30\x98\
+\x04\x49\xb4\x0a\x63\x95\xd0\x01\x8c\x22\xf0\x84\x63\x30\x81\xcb\
+\x80\x07\x71\x27\xcf\x91\x69\x9d\x26\x44\x97\xf5\x81\xb4\x06\x28\
+\x07\x00\xd6\x0c\x06\xaf\x63\xa2\x57\xf4\x94\x42\x66\xec\x0d\x53\
+\x81\xcc\x62\x5a\x77\x51\x28\xb8\x30\xe5\x1a\x6c\xfc\x7a\x31\x9d\
+\xdb\xf3\x02\x04\x60\x28\x1a\x55\x10\x84\x04\x96\x07\x98\x85\x21\
+\xe6\x19\xb7\x6c\x8c\xb9\xd8\x26\xca\xdc\xef\xb0\x47\x12\x0b\x2c\
+\x3e\x87\xf6\xdc\xfa\x5e\xc7\x01\x24\x78\x44\xbd\xbc\x53\xf0\x8c\
+\x81\x03\xb4\xd9\xc4\x17\x99\x2e\xb5\x7e\x5d\xbb\xb2\x42\xa1\xdb\
+\x3a\x16\xe2\xdf\xd4\xbe\x1a\x57\x6e\xfe\x30\xd6\x35\xc6\xdd\xfb\
+\x1b\xe9\x10\x2e\xdd\xf8\x1e\x10\x52\x3c\x31\x7b\x37\x72\xac\x80\
+\x91\x04\xec\xde\x67\x04\xa5\x6f\xf7\x16\x56\x8e\x05\x48\xd7\x10\
+\x5b\xe3\x2a\xb2\x9c\x69\x8d\xae\xca\xd1\xaa\xd5\x5f\x91\x68\x5e\
+\xa7\x89\x66\x3c\x00\x8a\x0e\x1e\x63\x60\x77\x47\xe5\x50\xe0\xc2\
+\xd7\xb3\xf1\xb3\x96\xfc\xb9\x82\x0b\xdf\x4d\xa2\x2f\xd9\x10\x06\
+\x76\x1a\xee\xaf\x11\xf9\xbf\x09\x04\x62\x46\x62\x4c\x18\x71\xb1\
+\xea\x47\x1b\x2d\x4e\x5c\x97\xfb\xd5\x41\x2c\xde\x15\x92\x42\xa3\
+\xdd\x92\x3f\x38\xe1\xfb\x3c\x42\xb0\x67\x58\x40\x08\x24\x20\xbc\
+\x54\x43\x1d\x17\x8c\x3b\x44\x53\x39\x7b\x07\x8d\xcd\xed\xab\x71\
+\xd5\xa6\x50\xf8\xf6\xa8\xa7\x4d\xfc\xda\x58\x31\x34\xfb\x93\xd9\
+\xbb\x91\xeb\x15\x30\x25\x95\xe3\x07\x71\xcc\xaf\x19\x60\x92\x59\
+\xd4\x88\x28\xca\x67\xe5\xdf\xe6\x9c\xe2\x82\x07\x34\xd2\xfa\x6e\
+\x26\x1a\x03\xe0\x01\x60\xe2\xdc\x3d\x4c\xbc\xb6\xa7\x54\x80\xa0\
+\x44\x34\xda\xb2\x53\xbb\x4c\x4b\x1b\x7c\x24\xe6\x73\x62\x04\x9d\
+\x18\x69\xd9\x4a\x27\x5c\x2c\x0c\x09\xef\x37\x2b\x87\xa4\xc0\x4d\
+\x67\x27\x42\xad\x18\x5c\x12\x70\x4c\xe9\x99\xbd\xc9\x0f\x2e\x39\
+\xeb\xe1\xdd\x40\x40\xe8\x38\x5e\x44\xe6\x5f\xe0\xc9\x5c\xf9\xaa\
+\x34\xf7\xfe\x3c\x63\x53\xeb\xaa\x42\xf8\xcd\xb2\xf0\x1d\x08\x92\
+\x06\x2e\x1d\x7b\x37\x34\x08\x8f\xcf\xdc\x8d\x3e\xaf\xc0\x2f\x25\
+\x93\x21\x20\xf9\x1c\x86\xcd\xc5\xb0\x1d\xf8\x2a\xfb\xfd\x12\xfb\
+\x2f\xf1\x28\xa0\xa7\x14\x34\xf3\x5a\x00\x7b\x00\x3c\xe9\x00\x90\
+\x2b\x06\x18\x17\x22\xc1\x70\x5f\x29\x57\xa0\x0d\xdd\xec\xaa\x1e\
+\x0d\x32\xae\xc0\x6b\x6a\x22\x4c\xa0\xbd\xd7\x83\x00\x9e\xf5\x43\
+\x94\x63\xad\x89\x71\x11\x6e\x9d\x20\xbc\x37\x2e\x22\x04\x76\xec\
+\x22\x11\xd2\xb5\x16\x81\x83\x95\x3f\xa1\x96\x92\xf1\x9d\x14\x09\
+\xb0\x78\x4e\x46\x1f\x1c\x00\xcb\x72\x8a\x18\x47\x1e\x33\x1c\xe3\
+\x02\x9a\x35\xb6\xb4\xaf\xc6\xd5\x9b\x57\x17\xbe\x3d\x6a\x49\x03\
+\x97\x8d\xdd\x00\x80\xf0\xe8\xcc\x27\x90\xe9\x65\x40\xe6\x47\x9c\
+\xf0\xe5\xe0\x99\x27\x85\xb0\xe7\xc1\x25\xc6\x1f\x8f\xcd\xc8\xfc\
+\x4c\x5f\x2b\x28\xe6\x61\x62\x5c\x64\x7b\x2e\xfd\x9b\x5f\x5c\x5f\
+\x74\x74\x42\xef\xc8\xb4\xfe\x4d\x3b\xaf\xcc\x76\x88\x5c\x8f\xe7\
+\x64\x60\xfe\x23\x79\x9f\x5c\x76\x47\x46\xb3\xc8\x0a\x50\xdc\x40\
+\x76\x2c\x9d\xc3\x90\x4c\x86\x7a\x62\xd7\x2d\x47\x36\x29\x5a\xb7\
+\xef\x8c\x82\x0c\xf4\xc5\x8a\x24\x21\x3c\x2e\xc1\x24\xd4\x16\xf9\
+\x83\xd2\x75\x8e\xae\x87\xef\x60\xd6\xd8\xdc\xbe\x0a\xd7\x6c\xbe\
+\xe9\xb4\x84\x6f\x8f\x84\x52\x6c\x6e\xbf\x18\xe0\x26\x26\x3b\x4f\
+\x20\xe7\x3e\x82\x41\x2e\x84\xa1\x5e\x90\x34\x32\xf5\x28\x67\x20\
+\xc3\xba\x4a\xe1\xdb\xbe\x6a\xd7\x1b\x94\x24\xe9\xa3\x04\xfa\xc6\
+\x6f\xdf\x74\x09\x6a\x4a\x31\x32\x45\xb5\x56\x9d\xb6\x64\x5a\x41\
+\x69\x21\x18\x6b\x09\x50\x24\x77\x52\x48\x52\xe8\x47\x08\xfd\x0e\
+\x17\x5e\x83\x12\x62\x80\x13\x68\x03\x22\xc7\x01\x98\x8d\x36\x53\
+\x90\x18\xb2\x3c\xc2\x7d\xb6\x9a\x6f\x99\x20\x7b\x43\x5e\x10\x46\
+\x80\x29\x71\xf6\x82\x04\x01\x0c\xfd\x80\x04\x44\x35\xff\x8f\xd9\
+\x7f\xe8\x6b\x22\xe6\x6f\xfe\xb3\x1d\xbe\xa5\x7d\xd5\x69\x6b\x7e\
+\x7c\xd4\x92\x3a\x2e\x1b\xbb\x1e\xbd\x7e\x0f\x8f\xcd\xdf\x8b\x0c\
+\xbd\xc0\x6f\xcb\xa1\x60\x19\x6e\x03\x5e\xcb\xad\x25\x90\x83\x44\
+\xd6\x42\x71\xe9\xb7\x46\x5f\x29\xd4\x92\x64\x73\xa7\x97\xd5\xea\
+\xf5\x34\xaf\x75\x96\x72\x64\x3d\xdd\xa8\x8d\xd6\xc7\x32\x93\xfa\
+\x2d\x04\xec\x37\x5d\x2c\x4c\x7d\x01\x02\x19\xa1\x69\x13\x6e\x25\
+\x06\x8d\x30\xe4\xd1\xee\x9e\x99\x58\xf3\x4a\xe4\x2a\x6d\x05\x44\
+\x6c\x56\x00\xbb\xa4\x51\x61\x96\xb5\x01\x87\xe5\x1e\x05\x51\xf4\
+\xfb\x08\x00\x80\x62\x1b\x94\x69\xcf\x1d\xc8\x3b\x10\x12\x42\x92\
+\x09\xa3\xaa\x83\x11\xd8\x32\xc9\x16\x22\xa1\xcb\xf8\xc2\x9a\xfd\
+\xab\x70\xcd\xe6\x0f\x63\x7d\x73\xfb\x19\x0b\xdf\xbd\x2f\x07\x76\
+\xe2\x75\x98\x49\x8f\xe1\x99\xfc\x3e\xc8\x39\x00\x71\x64\x50\xe4\
+\x51\xe2\x4d\x26\xb8\x92\xf4\xb9\xc9\xb2\xd2\x42\x30\x90\x69\x05\
+\x95\xd7\x36\x76\x16\xf2\x46\xde\xe4\x3c\xc9\x33\x0d\x9d\x73\x23\
+\xcf\x79\x43\xa6\xa3\xc9\x12\xa2\x60\xcd\x2e\x5b\xe8\xf3\xef\xae\
+\x02\xe5\x64\x86\x46\x71\xbf\x4b\x68\x38\xb4\x7a\xd3\x65\x7d\x9a\
+\x02\xfb\xa4\x87\x40\x7a\x50\x96\x11\x7c\x30\x86\x6f\xca\x28\x92\
+\x56\x3a\xc8\xf3\x07\x83\x27\x5c\x84\x54\x72\x90\x27\x48\x0e\x05\
+\x3f\xfe\x79\x3b\xec\x2b\x93\x53\xb6\x1f\x36\xb7\xaf\xc4\x35\x5b\
+\xce\x4e\xf8\xfd\x7e\x1f\x27\x4f\x9e\x84\xea\x33\xc6\xd3\x6b\x50\
+\xc3\x70\x29\x05\x2c\x27\x9d\xf8\xa4\x93\x87\xbf\x1c\x97\xd1\x95\
+\xc2\x97\x83\x5c\x8c\x5c\x6b\xe4\x8a\x47\x95\x46\x23\xcf\x19\x35\
+\x4d\x04\x4e\x91\x2a\xc6\xb0\xd2\x05\xc2\xac\xa9\x97\xc4\xcb\x7e\
+\x74\x04\x4f\x10\x45\x18\x6b\x60\xa3\x01\x9f\x83\xb7\x66\x9e\x02\
+\x33\xef\x35\xdb\x97\xad\x89\x8c\x55\x30\x2e\xc6\x80\xad\xb4\x01\
+\x14\xcb\x3d\x03\x7c\x79\x2e\x6d\x6c\x6e\xa4\xa8\x7c\xd7\x14\x92\
+\x31\x41\xa0\x8b\xee\x97\xdf\x3b\xda\xe4\x00\x44\xde\xa0\xd0\xfc\
+\x57\xe2\x55\x9b\x3f\x8c\x0d\xe7\x40\xf8\xdd\x6e\xb7\x08\x9f\x39\
+\x81\x8a\x58\xbb\x1b\xc0\x92\x80\x88\x42\x40\xc9\xf8\x21\x94\x30\
+\xce\x07\xd8\x1b\x72\x66\xe4\xcc\x43\x94\x24\x29\x13\x15\x51\x00\
+\x11\x25\x1a\x68\xe4\x22\xf6\xb4\xb1\x7b\xe2\x98\xa0\xe0\x03\xec\
+\xfd\x70\x01\x82\xc2\x90\xda\x8c\x60\xc2\x36\x51\x64\xcc\xa8\x19\
+\xed\x20\x13\xf3\x06\x9b\x43\x48\x81\x92\x17\x24\x3b\x21\xfa\xbd\
+\x02\x2d\x8b\xaf\x02\x84\x0b\xdd\x2c\x3f\x10\x42\x75\x1e\x80\xd8\
+\x45\x07\xbe\xb4\xf2\x11\x86\x8a\x72\x12\x89\xc6\xd6\xf6\x95\xf8\
+\xf5\x2d\x37\x61\x43\x6b\xc7\x59\x0b\xbf\xd3\xe9\x98\x57\x68\x3c\
+\xb2\xf8\x7d\x3c\x95\x4d\x60\xc7\xd0\x1a\x53\x3b\x9f\x6a\x76\xbb\
+\x89\xb0\x5c\xa1\x64\x65\x15\x9a\xf9\x98\xb8\xba\x29\x64\x46\x56\
+\xb9\x66\xe8\x04\x0d\x18\x9d\xac\x91\xc9\xc4\x30\x73\x6a\x4d\x36\
+\x20\xb7\x6f\x0d\x95\x44\x93\x07\x01\x4a\x20\xf0\x8c\x3b\xe1\x30\
+\xa1\xe3\xc7\xef\xe0\x32\x83\x52\x93\xad\xe0\x03\x8e\x60\x42\x47\
+\x32\xac\x26\xdc\x18\x32\x7c\xde\xfe\x0d\x01\x28\x0f\x08\xaf\xdd\
+\x83\xf7\x00\x0b\xe9\x5f\x00\x06\x02\x60\x34\xff\xdc\x0b\x9f\xf1\
+\xa3\xa5\x6f\xe2\xcb\xf3\x9f\x46\x1f\x0b\x58\xd7\x68\x62\x4d\xad\
+\x1e\x4e\x3c\x61\x04\x33\x8a\xac\x88\x4b\x93\x62\x38\x1c\x53\x09\
+\x78\x01\xdb\x84\x10\x43\x03\x29\x52\x22\x4e\x80\x5a\xce\xba\xe8\
+\x18\xf6\x89\x07\x9b\x02\x76\x43\xb8\x30\x3b\x7c\x58\x10\xa0\xb0\
+\x10\x10\x63\x03\xf6\x5c\x62\x10\x0b\xc3\xcc\xfd\xae\x1e\x5e\x00\
+\x44\x85\x2f\x76\x5a\x8f\xd8\x1a\xb0\x93\x88\x0a\x2c\x84\x00\x82\
+\x78\xd6\x09\x3f\x02\x04\x50\x0a\xf3\x5d\x67\x95\x74\x9f\x42\xcd\
+\x0f\xc2\x45\xd6\xd8\xd6\x7e\x25\x7e\x63\xeb\x4d\x18\x3d\x4b\xe1\
+\x9f\x38\x71\x02\x9d\x4e\xc7\x45\x1f\x3f\x5a\xfa\x26\x3e\x33\x73\
+\x1b\x16\xd4\x0c\x12\x24\x98\xeb\x77\x31\x5c\xab\x7b\xae\x04\x88\
+\xa8\xa0\x62\x66\x94\xad\xab\x10\x7e\x08\x9c\x30\x63\xa8\x2d\xdf\
+\x32\xe9\xdf\x9a\x36\x2d\x67\x58\x82\xc1\x2e\xe1\xe3\xd1\x6f\x05\
+\x2c\x33\x83\x66\xf8\xd7\x6c\xe2\x98\x58\x1f\x64\x4c\xbf\xb6\x36\
+\x46\xe4\x8a\xb5\x71\x03\xc5\xfc\x01\x03\x0c\xa6\x10\x04\x01\x10\
+\xa2\x14\x30\xdb\xcc\x34\xbb\xfb\x80\x30\x42\x90\xda\x1f\x0b\xb9\
+\xda\xe0\x97\x81\x22\x8f\xc2\xec\x5b\xe1\xef\x3c\x27\xc2\x2f\xca\
+\x65\x3c\xb4\xf4\x2d\xfc\xeb\xcc\x6d\x98\x53\xd3\x20\x4e\x3c\x71\
+\xb6\x84\x3b\x5e\x32\x66\x9e\x93\xf1\x3f\x10\x6a\xb8\x9d\xe0\xaa\
+\x0d\x02\x02\xf7\x20\x89\xaf\xd6\x20\x02\x6a\x96\x29\xca\x09\x8c\
+\xb6\x50\x25\x7c\x75\x62\xd0\x50\xb8\x00\x61\x0d\xc8\xf8\x7c\xf2\
+\x02\x82\xe5\x10\x36\x0d\x24\xb5\xdd\x08\x3f\x31\xc2\x93\x7e\x3d\
+\xde\x2e\x8e\x85\x05\x81\x7b\x3e\x71\x91\x2f\x79\xe7\xee\x32\x92\
+\x12\x34\x2e\x02\x14\x00\x18\xec\xf9\x63\xc1\x17\x9a\x3f\x3e\xf4\
+\x4a\xbc\x76\xeb\x4d\xd8\x78\x0e\x85\x0f\x00\x0f\x2d\x7d\x0b\x9f\
+\x9e\xd9\x8b\xb9\x7c\x1a\x64\x06\x85\x1a\x49\x8a\xe1\x5a\xd3\x47\
+\x2b\x90\xc1\xac\x88\xb4\x84\xf0\x75\x00\x14\x3f\xa8\x64\x95\x36\
+\x06\x90\x5f\xdc\x52\x6c\x4b\x59\x93\xa8\x72\x05\xdb\x98\xdf\xfe\
+\x2d\x12\x3c\x6c\x1c\xb4\x1c\x23\xd0\x86\x5c\x91\x4b\xd0\x14\x16\
+\x21\xd4\x6c\x36\x03\x3f\xbe\x32\x89\x65\xf8\x26\xb7\xcb\x6c\x63\
+\xfa\xc8\x02\xb0\xe4\x24\xda\x65\x1a\xdd\x0c\x21\x30\x14\x20\x88\
+\x22\x05\xea\x41\x15\x22\x0f\xbf\x38\xc2\xa3\xc7\xd3\x05\x8d\xf1\
+\xf6\x15\x78\xdd\x79\x14\xfe\xac\x10\x3e\x03\x18\x6b\x0e\x61\xb8\
+\xd6\x30\xd1\x40\x3c\x33\x38\x9e\x10\x0a\x37\xe7\x22\x34\xfb\x3e\
+\x67\x50\xe5\x0e\x24\x49\x04\xa8\x00\x80\x9c\xa5\x62\xf7\xf6\x2b\
+\xb4\x87\x5c\x38\x68\xf3\xff\x26\x89\xeb\x32\x7c\xd6\x14\xdb\x67\
+\x02\x0d\x02\x23\x41\x31\xc5\xc9\xba\x03\x6d\xde\x57\x0c\x1c\x89\
+\x5d\x42\x8d\xd5\x80\xc9\x7d\xc7\xfc\x40\xc1\xbb\x19\xb8\xe7\x3c\
+\x99\x04\x64\xd8\xe7\x67\x12\xf9\x99\x0a\x92\x09\xc0\x91\x45\x49\
+\x03\xed\x14\x35\x66\xc6\x78\xfb\x0a\xbc\xfe\xbc\x08\xff\xdb\xf8\
+\xf4\xf4\x6d\x98\x55\xd3\x28\xf6\xfc\x2b\x6a\x36\xda\x68\x63\xc7\
+\xd0\x3a\xc7\x0d\xca\x2b\x90\xc3\x24\x8f\xfc\x5b\x86\x89\x70\x93\
+\x54\xe2\x7c\x82\xb0\x00\xc6\xea\x17\x1c\xc0\x5c\xf4\x9a\x49\x22\
+\xdc\x33\x20\xb0\xd7\x9d\x2f\x36\x1a\x9f\x98\xb0\x0f\x72\x74\xcf\
+\x86\x84\xf0\x8e\xdb\x0c\x13\xbb\x8d\x22\x4d\x14\xe1\x2c\x03\xbc\
+\xf5\x00\x24\x28\xc2\x2d\x62\xa5\xf9\x76\xf7\x0a\x33\x1f\x0c\x21\
+\x03\x4e\x9d\x43\xfd\x37\x36\x42\x0c\x17\xdb\x72\x6d\x52\x65\xbc\
+\x7d\x39\xde\xb0\xed\x26\x8c\xb5\x77\x9d\x5b\xe1\x2f\x7e\x1b\x9f\
+\x9a\xd9\x8b\xd9\xfc\x24\xfc\xac\x49\xc6\x68\xa3\x8d\x8b\xd7\x8e\
+\xa2\x99\xd6\xc2\xf8\xde\x58\xa6\xaa\xe1\x62\x9f\xe4\xf1\x53\xe1\
+\x2d\x31\x04\x2a\x84\x1f\x59\x0b\x3b\xf9\xa6\x66\x93\x04\x4a\x10\
+\x04\x00\x6e\x5c\xdf\x66\x5a\x6c\x7a\xd7\x09\xc2\xf8\x71\x16\x9b\
+\x32\x26\x06\x7d\xd2\xa7\x6b\x11\x7a\x69\xb7\x95\xab\xb4\x1e\x64\
+\xc0\xe7\xa3\x05\x66\x46\x9d\xda\xd0\xc8\xa0\xa1\x8c\xdf\xf7\x65\
+\x42\x3c\x6f\x31\x66\x9b\x1d\x46\x05\xe6\xff\x12\x0f\x10\xa3\x81\
+\xe6\x4c\xd1\x59\x1a\xdb\x87\xae\xc0\x6f\x6d\xbb\x09\x9b\x9e\x0f\
+\xe1\x33\x63\x43\xa3\x85\x3d\x6b\x37\xa2\x95\xd6\x23\xad\x47\x99\
+\xc0\x45\x9f\x6d\x6a\x18\x8e\xed\x7b\x5b\x17\x58\x01\xf6\x6c\x22\
+\x2e\xa3\xe6\xc7\xb4\xbd\xd9\x29\x62\x7b\x3f\x7d\xcb\x12\x01\x69\
+\xf6\x6d\xd8\x91\x24\x70\xb3\x80\x1d\xf3\x77\x3c\xc0\x8f\xfa\xf9\
+\x90\xb0\xcc\xfa\xbd\x10\x19\xed\x64\x2d\x2e\xdd\xf0\x26\x5c\x30\
+\x7c\x39\x16\xf3\x93\xf8\xe9\xdc\xd7\x31\xd1\xd9\x6f\xf8\x82\xf0\
+\xfb\x11\x10\x9c\x38\x85\x1b\x72\xe1\x24\x0b\x62\x28\xae\xfa\x61\
+\xa2\xc2\x2b\x6e\x6f\x5f\x8e\x6b\xb7\xdd\x84\x4d\xed\xdd\xe7\x4e\
+\xf8\x5c\x98\xfd\x4f\x4d\xef\xc5\xac\x2a\x84\x6f\xa7\x72\x6d\x68\
+\xb4\xb1\x67\x64\x0c\xad\xb4\x0e\x05\x69\xe6\x43\xf6\x0e\x27\xc8\
+\x28\x1a\xb0\xd7\x98\x2b\x42\x40\x3b\x5c\x6c\xe7\x0e\xf8\xdd\xcc\
+\x2c\xe1\x07\x93\x8d\x02\xcc\xb8\xbe\x7c\x29\xbc\xf6\xfa\x30\xcf\
+\x8c\xd0\x89\x8e\xd4\x6c\xa7\x83\x59\xa1\x78\x10\x68\x0a\x36\x62\
+\x2d\xe5\x05\xec\xf0\x8d\x15\xc4\x50\xba\x0e\x6f\xdc\xf6\x41\x5c\
+\xb1\xf1\xad\xa8\x25\xc5\x74\xc5\x3d\x6b\xaf\xc1\x57\x9e\xfb\x3b\
+\x1c\x5c\x7e\x48\x30\x7c\x49\x00\x43\xe1\xae\x1a\xfa\xb1\xfc\xdb\
+\x23\xa5\xd0\xfc\xcb\x71\xed\xf8\xb9\x15\x3e\x33\xe3\xe1\xa5\xef\
+\xe0\x53\xd3\x7b\x31\xa3\x4e\x16\xce\xcf\xcc\xff\xdf\xd0\x68\xe3\
+\xe2\xb5\x56\xf8\x32\xac\xf3\x59\x3b\x2b\x03\x48\x60\x88\xfc\x80\
+\xed\xff\x78\x1d\x21\x58\x84\x8b\x0e\x0c\xde\x95\x68\xa1\x24\x49\
+\x38\x0b\xd5\x0f\xd0\x84\xe9\x45\x11\x5e\x20\x5c\xb2\xe4\x18\xa7\
+\xf0\x55\x2a\x2e\x8f\x2d\x52\xa3\x7d\x7c\x0c\x72\x15\x2b\xb4\x92\
+\x11\xbc\x69\xdb\x07\x71\xe5\xd8\x75\x4e\xf8\x00\xb0\xa9\xbd\x13\
+\xd7\xed\xf8\x08\x2e\x18\xbe\xba\x18\x34\x82\x37\x77\x7e\x06\x6e\
+\x38\xa0\x23\x4d\x68\xbc\xa0\xa5\x34\xc8\xc4\x1a\xdb\xda\x97\xe3\
+\xcd\xe3\x37\x63\x73\xfb\x82\xb3\x12\xfe\xd4\xd4\x14\x56\x56\x56\
+\x5c\xdb\x1e\x5e\xdc\x87\x4f\x4e\xdf\x86\x99\xfc\x44\x41\x85\x74\
+\xd1\x17\xeb\x8d\xe6\x37\x6b\x75\x13\xef\x5b\x2d\x65\x3f\xe0\x25\
+\x42\x41\x3f\xc8\x66\xfa\x9d\xec\xf5\x50\xf3\xbd\xf0\x81\x78\x16\
+\xb5\x77\x0b\x45\xdf\x29\x86\x9d\xfa\xc7\x80\x2c\xa4\x0a\x04\xec\
+\x05\x2d\x4d\x4a\xd8\xf9\x7e\x14\x31\x58\xaf\x6e\x58\x7d\x01\x0a\
+\x0e\x50\x58\xfc\x68\xb4\xd2\x11\xbc\x79\xbc\x10\xbe\xfd\xee\x1c\
+\x79\x8c\xb5\xb6\xe3\xba\x1d\x37\xe3\xc2\xe1\xab\xc5\x08\xa3\x01\
+\xa2\x18\xb9\x73\xd3\xce\x39\x12\xb4\x05\x06\x87\x40\x51\xac\x31\
+\x3e\x74\x19\xde\xb2\xfd\x66\x6c\x1e\x3a\x7b\xe1\x4b\x9f\xff\xf0\
+\xe2\x77\xf0\xc9\xe9\x5b\x31\x93\x4d\x02\x6e\x24\x12\x58\xd7\x68\
+\xe3\xa2\x91\x31\x34\x6a\x35\x31\xef\xcf\x4f\xa1\xb7\x5a\x2f\xa7\
+\x9b\x07\xd3\xe8\x1d\x90\xc4\x84\x50\x48\xd0\x70\xd0\xde\x98\x4f\
+\x84\xd3\xf8\xa9\xb0\x00\x7e\x48\x91\x03\x0d\x0d\x17\x1f\xc4\xfe\
+\xc9\x83\x20\x08\x31\xb4\xb7\x06\x0a\xa1\x10\x98\xed\xd0\xaf\x1f\
+\x2e\x6e\xa6\x23\x78\xcb\xb6\xff\x84\xab\xc6\x7e\x07\x69\x85\xf0\
+\x25\x08\x7e\x67\xc7\xcd\xb8\x70\xcd\xd5\xc8\xb5\x0e\xd0\x1f\x0b\
+\x5a\x31\xdc\x10\x71\x09\x0c\xb0\x1a\xa0\x31\xde\xbe\x0c\x6f\x19\
+\xbf\x19\x5b\xce\xb9\xf0\xf7\xe1\xde\x93\xb7\x62\x26\x9f\x02\x4c\
+\x9c\xef\x35\x7f\x23\x5a\xb5\x7a\x38\x74\x8d\x10\x98\xa5\x21\x71\
+\x21\xc8\x58\xeb\x03\xc2\xe7\x06\xae\xa2\x94\x31\xca\x80\xb2\x24\
+\xd2\xba\x6b\xcb\xf3\x0a\xdf\xed\x04\xc6\x41\xa5\xe4\x30\xa5\xfd\
+\x0d\xf9\x02\x77\x0f\x43\x6e\x9b\x26\xa7\x32\x15\x8b\x2e\x0a\x01\
+\xb4\xd2\x11\xbc\x75\xfc\x83\xb8\x66\xd3\xea\xc2\x97\x20\x78\xdb\
+\x8e\x9b\xb1\x67\xcd\x35\x50\xac\xa1\x98\xa1\x74\x34\x86\x0f\x3f\
+\x7e\xae\x4c\x5a\xd4\xb6\x43\x19\x13\x9b\x33\x63\xbc\x7d\x19\xde\
+\xba\xfd\x66\x6c\x1d\xba\xf0\xdc\x09\x9f\x81\x87\x9c\xf0\x4f\x00\
+\x9c\x80\x35\x9c\xcf\xbf\x68\xc4\xb0\x7d\xcd\x41\x9f\x32\x7b\xf3\
+\x6e\xa3\xb1\x70\xf1\x0c\x07\x2e\x33\xec\x6b\x1b\x05\x40\x58\x46\
+\x04\x96\x30\x08\x03\x9d\x3b\x2e\x3e\x24\x39\x53\xa1\xa9\x62\x1d\
+\xbc\xfd\x3f\x58\x07\x2f\xcd\x48\x04\x0e\xe9\xff\x03\x6b\x60\xcc\
+\x95\x6c\xa0\xd5\xfc\x76\x32\x82\xeb\xc6\x3f\x88\x57\x6d\x7a\xdb\
+\x69\x09\x5f\x82\xe0\xed\x3b\x3f\x82\x3d\x6b\x5e\xe5\x04\xae\xa4\
+\xf6\xd8\xce\x75\xab\x7b\xfd\x24\x0e\x6d\x80\xb7\xbd\x7d\x29\xae\
+\xdb\x71\xd3\x39\x11\xbe\xf4\xf9\x0f\x2d\x7e\x07\xf7\x9e\xbc\x15\
+\xd3\x46\xf3\x6d\xbf\xac\x97\xc2\x67\x0b\x50\x31\x31\xc6\x29\x4d\
+\xc4\xc7\xa4\xd6\xea\xb2\xbf\x77\x89\x1f\xcb\xc3\x84\xd6\x87\x61\
+\xa3\xcc\x01\xc8\x95\x45\x84\x24\x9c\x6e\x84\xc0\xb4\x78\x61\x57\
+\x24\x22\x2c\x32\x11\x02\x23\xd8\xc8\x48\x98\x39\xb9\xf4\xb9\x4e\
+\x43\xb8\x76\xe3\x1f\xe1\xd5\x9b\xcf\x4c\xf8\xf6\xd8\xd8\x1a\xc7\
+\x3b\x76\xde\x8c\x3d\x6b\x5f\x15\xf8\x41\xcb\x39\xa4\x2b\x08\x7f\
+\x33\x76\xb4\x5f\x81\xb7\xed\xf8\x08\xb6\x0d\x5d\x74\x4e\x84\x6f\
+\x8f\xc2\xec\xef\xc5\x74\x76\x02\x64\x34\xbf\xf0\xf9\x2d\x5c\x38\
+\x32\x8a\x66\x5a\x0f\x39\x4a\x64\xfa\x03\x5f\x6e\x7f\x74\xe8\x26\
+\x24\x38\x02\x9f\x1e\x25\x82\xca\xcb\xee\x2a\x92\x48\xe6\xc7\x4d\
+\xc1\xf7\x5a\x4c\x66\x38\x97\x03\x6d\xb6\x29\xc6\x80\x64\x49\x93\
+\x6b\x59\x3e\x17\xa6\x37\x04\x91\xb7\x16\xc4\x09\x5e\x51\x7f\x23\
+\x2e\xc6\x35\xd0\xb9\x3e\x55\x5f\x9f\x02\x04\x37\xe1\xe2\xb5\xc2\
+\x1d\x54\x90\x3f\x7b\x2e\x67\x6d\x84\x7f\xf3\x39\x11\xfe\xf2\xf2\
+\x72\x71\xc2\x98\xfd\x7b\x4e\xee\xc5\xc9\x7c\xca\x2d\x71\x63\x14\
+\xc2\xbf\x60\xdd\x46\x34\x6b\x0d\x37\xca\x27\xfb\x2e\x36\xf5\x81\
+\x2f\x77\x8a\xe3\x79\x98\x82\xdf\x54\x32\x20\xbe\xb2\x4c\xf8\xdc\
+\x41\x38\x70\x64\xe5\x49\x41\xa4\x96\xc4\x82\x72\x26\x9b\xa9\xc2\
+\x12\x44\xd3\x93\xe4\x6f\xe3\xe5\xbd\x7b\xa0\x08\x89\x05\x29\x6b\
+\x62\x2d\x2e\xae\x5d\x85\xee\x4a\x17\x93\x93\x93\xc8\xb2\xec\x97\
+\x16\xc6\x58\x6b\x1c\xef\xdc\x79\x33\x2e\x5e\xfb\x2a\x41\xee\x44\
+\x87\x90\x10\xfe\xd0\xa5\x78\xfb\xce\x9b\x31\x3e\xbc\xe7\xac\x84\
+\x3f\x39\x39\xe9\x84\x5f\x98\xfd\xef\xe2\xde\x13\x7b\x31\x9d\x4d\
+\x15\x9a\xcf\x00\x6b\xab\xf9\x1b\xd1\xae\x35\x82\xf9\x8e\x95\x1a\
+\x1f\xf9\xe6\x32\xc1\xf5\x93\x41\xa5\xe0\x83\xc9\xa1\x5c\xd6\x7a\
+\x17\xb1\x41\xc8\xc3\xf1\xb3\x62\x0e\x65\x90\x07\x90\x3e\x23\x60\
+\xfd\x90\xa8\x65\x80\xcb\x26\xc5\x9b\x9e\x70\x6d\x9b\x9c\x0c\xca\
+\x00\x94\x06\x12\x2e\x58\xf0\xc2\xc2\xc2\x59\x83\x60\x63\x6b\x1c\
+\xd7\xef\xbc\x19\x2f\x5e\xfb\xaa\x62\x62\xa8\xed\x30\xeb\xf3\xa1\
+\xb1\xb3\x7d\x29\xae\xdf\xf9\x11\x6c\x3f\x07\xc2\x97\x66\xff\x91\
+\xc5\xef\xe1\xde\x13\x7b\x71\xd2\x9a\x7d\xf6\xa1\xde\x05\x23\x63\
+\x85\xe6\x6b\x21\x34\xc9\xc0\x25\x7f\x32\x7d\xae\x75\x04\xe0\xa8\
+\xdf\x8b\x7b\x75\x18\x1e\x46\xe5\xca\xad\xed\xe0\x64\x2b\x37\xe5\
+\xb0\xf7\x9a\xa4\x9e\x9b\x95\x0b\xef\xbf\x59\xbc\xd0\xc6\xda\x32\
+\x1d\x59\x15\xbe\xd8\xe7\x20\xae\xfb\xe5\xd3\x7e\x56\xef\x81\x85\
+\x63\x78\x7c\xe1\x51\xd8\x9c\xdc\xb9\x00\xc1\x58\x6b\x1c\xef\xda\
+\xf9\x11\x5c\xb2\xf6\xd7\x9d\x3b\xd0\xac\xa1\xb4\xc2\xce\xd6\xaf\
+\xe1\xfa\x9d\x37\x9f\x17\xe1\xdf\x3d\xb5\x17\x27\xb2\x29\x80\x93\
+\xa2\x9f\x34\xb0\xb6\xd1\xc2\xee\x75\xa3\x68\x9a\x38\xbf\x6a\x64\
+\xae\x6a\x1a\x97\x1f\xa7\x17\x84\xd9\xb8\xd5\xd0\xdc\x87\x0a\x19\
+\x4e\xfd\xf2\x9a\xee\x2d\x89\x27\x8b\x32\x62\x53\x28\x5c\x4a\xcd\
+\x8f\x38\xf9\xcc\x9a\x8b\x0d\x8b\x04\x2e\x40\x7e\x1c\xc0\x9d\xb5\
+\x04\xc2\x24\xe5\x99\xc3\x21\x5c\x70\xb1\xd2\x97\xec\x04\x51\x10\
+\x96\x7a\x7d\x3c\xb7\x78\x12\x5f\xec\x7c\x12\x63\xf5\xcd\x78\xe9\
+\x9a\x57\x80\x51\x58\x02\x66\xc6\xd6\xad\x5b\x51\xaf\xd7\x7f\x29\
+\x21\x6d\x6c\x6d\xc3\xbb\x76\x7d\x04\xed\x63\x23\xf8\xf9\xc2\x83\
+\xd0\xac\xb1\x7b\xf8\xe5\xb8\x6e\xfb\x07\xb1\xe3\x1c\x0b\xff\x61\
+\x23\xfc\x93\xd9\x54\x91\xdb\x37\x5e\x76\xa4\xd1\xc2\x85\xeb\x2c\
+\xdb\x0f\xc3\xeb\x22\x8b\x6a\xfa\xcf\x59\x58\xeb\x9d\xad\x9f\xf6\
+\xc2\xb3\xc3\xe2\x92\x70\x43\xf0\x01\x39\xea\x27\x95\xd3\xda\xec\
+\xf0\xdb\x4c\x3c\x08\x93\xe0\x7d\x6c\x56\x07\x07\x28\x82\x13\x76\
+\x62\x25\x1b\x65\xd0\xfd\x2a\x61\x99\xdb\xf7\xdb\xa4\xba\x6f\x06\
+\x33\x48\xb1\xe7\x17\x7b\x5d\xe4\x8a\x71\x54\x1d\xc6\xbf\x4c\xdc\
+\x82\xff\xb8\xed\x4f\x1d\x08\x16\x17\x17\x01\xe0\x2c\x41\xb0\x15\
+\x37\xee\xfe\x08\x26\x56\x0e\x41\x71\x8e\xad\xed\x5d\x18\xae\xaf\
+\x3b\x6b\xe1\x2f\x2f\x2f\x9b\xaf\x99\x07\x1e\x59\xfc\x3e\xee\x9e\
+\xba\x0d\x27\xf3\x49\xb8\x71\x4c\x06\xd6\x35\xdb\xb8\x60\xfd\xa8\
+\x49\xef\x9a\xbe\xb2\x43\xd3\x42\x4a\xd2\xb5\x06\x7d\x0f\x0f\x12\
+\x36\x0f\xc5\xa9\x5c\xe9\x76\xe5\x7d\x6e\xdf\x64\x77\x8f\xdc\xe9\
+\x3c\x1a\x24\x82\xb7\x3a\x6e\xa6\x97\x4f\x34\x44\x3e\xdc\x3d\x20\
+\xcc\xb9\x3d\x4f\xd1\x22\x11\xf6\xe3\xeb\x01\xd1\x71\x6c\xb7\xd8\
+\xbc\x50\x1b\x08\x1d\xea\x1d\xc0\x9d\x13\xb7\xe0\x89\xa5\xc7\xdc\
+\x70\xd0\xe2\xe2\x22\x8e\x1f\x3f\x7e\x56\xee\xa0\x99\x0e\xe1\x82\
+\xb5\x2f\xc5\x9e\x91\x4b\xcf\x5a\xf8\xc7\x8f\x1f\xc7\xd2\xd2\x52\
+\xd1\xd9\x9a\xf1\xd0\xc2\xf7\x70\xd7\xd4\x5e\x9c\xc8\x26\x41\x9c\
+\x3a\x85\x19\x69\xb4\xb1\x6b\x5d\x21\xfc\x20\x2c\x35\x84\xb0\xf0\
+\xef\x36\x1c\xf5\x8b\x3c\xdc\x62\x17\xb6\xdb\xe6\x87\xa1\x73\x9c\
+\x80\x8b\x5d\x87\x1d\x3b\xf0\x61\xa0\xc8\x15\x54\x09\xdf\xde\x03\
+\x76\xb3\xbc\x22\x12\x28\xdc\x41\x94\x66\xb5\x39\x68\x49\x3e\xbc\
+\xf0\x45\x22\x49\xa0\x38\xe6\x07\xad\x7a\x03\x09\x27\x80\x2e\xc2\
+\xc1\xc3\xdd\x03\xb8\xf3\xd8\x2d\x78\x62\xf1\x31\xf7\xde\x73\x01\
+\x82\xb3\x3d\xac\xf0\x3d\xdb\x07\x1e\xb6\x9a\xdf\x9f\x2c\x26\x70\
+\x1a\xc0\xaf\x6d\xb4\xb0\x6b\xfd\x28\x5a\x52\xf8\x56\xd0\xba\x48\
+\x3c\x05\x51\x00\xc4\x8a\x1e\xf1\x9d\x07\xb1\xcf\x2e\xc5\xfd\x88\
+\x35\x38\x54\x32\xcf\xe1\xc8\xf9\xfc\x38\xaf\x20\x23\x8e\x22\x6c\
+\x36\x51\x80\x72\x4b\x8d\x10\x20\xa8\x9c\x70\x90\x51\x40\x38\x0e\
+\xe0\xb7\x34\x09\xc3\x1c\x86\xcd\xcd\x03\xc3\xcd\x26\xd6\x34\x5b\
+\x45\x19\x16\x04\xbd\x83\xb8\x73\xe2\x16\xec\x5f\x7a\xdc\x0c\x97\
+\x16\x9c\xe0\x85\x02\x41\x2c\x7c\x80\xf0\xc8\xe2\x03\xf8\xc4\xe4\
+\x6d\x98\xea\x1f\x37\xa4\xac\x68\xe7\x9a\x46\x0b\xbb\xd6\x8d\xfa\
+\x0c\x9f\x11\x7a\x25\xa9\x93\xa9\x5c\xf6\x66\xda\x6f\xf3\xe2\x47\
+\x05\x65\xbf\x49\x17\x20\x09\xb6\xdc\x02\x46\x12\x41\x17\x4a\x4a\
+\xc1\x3b\xe5\xf5\xa0\xb0\x03\xe9\x89\xcf\xed\x7b\xe7\x22\x43\x13\
+\xe9\x87\xe4\xa0\x02\x44\x66\x2f\x1c\x0b\x30\x20\xd0\x61\xe5\x19\
+\x00\x25\x09\x36\xaf\x5b\x87\x76\xc3\x6f\x96\x94\x70\x82\xc3\xdd\
+\x83\xb8\xf3\xd8\xad\x0e\x04\x00\x5e\x10\x10\xf4\xfb\x7d\x4c\x4c\
+\x4c\x08\xe1\x03\x8f\x2c\x3e\x80\xbb\x26\xf7\x62\x2a\x3b\x0e\x3b\
+\xe1\x8d\x01\xac\x6d\xb6\x9c\xd9\x57\x1c\x9b\x6c\x33\x6e\x6f\x87\
+\xce\x9d\xc2\x90\x1b\x1d\x75\xe9\x69\x08\xa5\x13\x82\x54\x1c\xfe\
+\x6d\xb5\x56\x66\xf1\xe2\x8c\x9f\x8b\x28\x10\x3f\x2b\xd7\x15\x86\
+\xdc\x23\xb1\x28\x87\xab\x1c\x45\x68\xf2\x42\x95\xa6\x44\x8e\x01\
+\x04\x16\x02\xde\x27\xe9\xa8\xc2\x85\x1b\x68\x62\x7c\xc3\x28\x86\
+\x1a\x4d\x97\xea\x24\x18\x77\xf0\xdc\xad\xd8\xbf\xf8\xc2\x80\x40\
+\x0a\xdf\x5a\xb9\x47\x16\x1e\xc0\x5d\xc7\xf7\xe2\x44\xdf\x08\xdf\
+\x34\x50\x86\x7a\x4e\x88\x62\xac\x23\x8e\xcf\x83\xdf\xcc\xd0\xd0\
+\xb0\x8b\x59\xa5\xab\x55\xe2\x19\xc0\x58\x09\xf6\xcf\x49\x8d\x0f\
+\x13\x48\x62\x4e\x01\xbc\xd6\x07\xf9\x83\x20\x82\xf0\x59\xc6\x44\
+\x12\x87\x20\xd6\x77\x48\xb6\x40\xe0\x92\xc0\x65\xea\x12\xd2\x2f\
+\x09\x62\xa2\xdd\x68\x9d\x2d\x9f\xd1\x6e\x34\xb0\x6d\xc3\x28\xda\
+\x8d\xa6\x23\x49\x00\xe1\x50\xef\x00\xee\x98\xb8\x15\x4f\x2c\x3d\
+\xee\xde\x39\x3f\x3f\x8f\x89\x89\x89\xf3\x0a\x82\x58\xf3\xc9\x98\
+\xfd\xbb\x8e\x17\x66\x9f\x0c\x6f\x61\x63\xf6\x77\xac\x1f\x45\xa3\
+\x56\x87\xdc\xcf\x57\xae\x2e\x66\xed\x27\xd0\xc8\xf8\x3d\xd8\xaa\
+\x5e\x08\x4a\x09\x12\x18\x13\x6b\x5d\xa1\xf5\x31\x9b\x8f\x13\x47\
+\x92\xd8\x97\x12\x7c\xec\x27\xe3\x31\x80\x44\xe5\x0c\x95\x31\x2b\
+\xad\x75\x3c\x8e\x1c\xef\x6d\x5b\x5a\x2a\x2d\x5e\x28\x2b\x1a\x54\
+\x86\x24\x43\xf5\x8d\x6b\x37\x1a\x18\x1f\xb5\x96\x00\x01\x31\xbc\
+\xe3\xb9\x5b\x4a\xee\xe0\x7c\x81\xa0\x6c\xf6\x09\x0f\x2f\x3c\x80\
+\x8f\x1f\xbf\x0d\x93\xfd\xe3\x20\x26\x27\x88\x35\x8d\x26\x76\x88\
+\x50\x2f\x26\x61\x25\x81\xc3\xce\xd8\x35\x2e\xd6\xb9\x86\x70\x9c\
+\xc2\xc7\xee\xd2\x94\x8b\x01\x23\xe2\xb2\x80\xb5\x74\x1d\x51\xbc\
+\x6f\x04\x2d\x15\x56\x5a\x00\xc5\xd0\x2a\xd3\xac\x72\x46\x92\x65\
+\x0a\x59\x2f\x67\xad\x8b\xef\x1a\x2a\x65\xa9\xa2\x4a\x49\x4b\xe0\
+\x2c\x86\x00\x08\x82\x74\x23\x22\x74\xb2\xf3\x63\x9a\x81\x76\xbd\
+\x00\x41\xc1\x09\xcc\xf3\x9a\x70\xb8\x73\x10\x77\x3c\x57\x58\x82\
+\xf3\x09\x82\x5e\xaf\x87\x63\xc7\x8e\x61\x69\x69\x29\x30\xfb\x1f\
+\x9f\xb8\x0d\x93\xbd\x89\x42\xf8\xa6\x0d\xc3\x8d\x16\xb6\xaf\x17\
+\xa1\x9e\xd0\x3e\x29\x78\xa9\x0c\xf1\x7c\x3d\x25\x9f\x89\x34\x99\
+\xb9\xd8\xdd\xdb\xce\x6f\xb0\x79\x80\x78\x92\x88\x25\x73\xa1\xb2\
+\x72\x20\x7c\xe7\xef\x4d\x3b\x43\x10\x30\xb4\xd2\x79\xbf\xa7\x38\
+\xef\x2b\x24\x79\x57\x23\x5b\x51\x4a\x29\xdd\x0d\xbe\x5e\x25\xaa\
+\x5c\x68\x19\x2c\x5b\x95\x04\x51\x4e\x11\x0b\xad\x41\xc0\x1b\x0c\
+\x10\x6c\x5c\xdc\x6c\x34\xb0\xcd\x80\xc0\x96\x45\x20\x1c\xea\x1e\
+\xc0\x1d\x47\xcf\x1f\x08\x7a\xbd\x1e\x26\x26\x26\x5c\x9c\x4f\x20\
+\x3c\xb2\xf0\x03\xfc\xcb\xc4\x6d\x98\xcc\x26\x9c\xcf\xd7\x1a\x58\
+\xd3\x6c\x61\xc7\xfa\x62\x54\x2f\x18\x8c\x71\xda\xad\xc1\x22\xdc\
+\x73\x3c\xc8\x2a\x40\xac\x58\xf0\xac\x5e\x86\x74\xd6\x45\xfa\x74\
+\x6d\x85\x66\xcb\x32\x85\x92\x06\x3b\x86\x46\x2e\xa6\x34\x42\xaa\
+\xb9\xdb\x5f\x56\x2a\xeb\x6a\xa4\x3b\xde\xb2\x0d\xdd\x13\xbd\x7a\
+\x6b\x73\xf3\x7a\x45\xea\x62\xad\xe5\x10\x2d\x45\x73\xae\xfd\x47\
+\x86\xfc\xec\xa7\xe4\xca\xf3\xfe\x46\x5f\x0e\xc7\xe5\x30\x50\x4f\
+\x6b\x68\x35\x1a\xe8\xf4\x33\x64\x4a\x39\x81\xcc\xe7\x73\x38\xb0\
+\xf2\x14\x76\xb4\x76\x61\x73\x63\xab\x13\x5c\x96\x65\x18\x1a\x1a\
+\x42\x9a\x9e\xf9\x5c\x02\xc0\x9b\xfd\x50\xf8\x0f\xe2\xe3\x13\xb7\
+\x61\xaa\x5f\x08\xdf\x36\x64\xb8\xd9\xc4\x8e\x0d\x1b\xd1\xaa\x37\
+\xc0\x1c\x7c\x6b\xb0\xf8\x24\xda\x1d\x09\x7a\xe0\x35\xa9\xd5\x51\
+\x79\x01\x40\x60\x39\x92\x38\x4f\x70\x13\x43\xe1\x94\x50\x6c\xac\
+\x05\x94\x3e\xb3\xe9\xec\x24\x4d\x40\x3a\x79\x62\xe1\xa9\xe5\x4f\
+\x31\xd0\x4f\x3a\x27\xba\x98\xf9\xe9\x7c\xa6\x99\xe7\x6c\xa1\xf1\
+\x77\xea\xc4\xa6\xaa\xdc\x08\x3f\xed\xaa\x44\x12\x11\x5a\x04\x89\
+\x4a\x65\xaf\x83\xd1\x6a\xd4\xb1\x6d\xc3\x28\x5a\xf5\xa6\x8b\x93\
+\x09\x09\x0e\x75\x0f\xe2\x8e\xa3\x7b\xf1\xc4\xe2\xb9\xb1\x04\xfd\
+\x7e\xdf\x99\x7d\x2b\xfc\x47\x8d\xf0\x27\xad\xf0\x0d\xe1\x1b\x6e\
+\x36\xb1\x7d\x74\xd4\x4c\xe0\xd4\x51\xb8\x1b\xb3\xfb\xf2\x68\x5f\
+\xa8\xbd\x21\x49\x0e\xb7\xa6\x1f\x14\xd2\xa1\xd2\x22\x6b\xc3\x01\
+\x82\x3e\xb7\x20\x89\x65\x20\x40\xe4\xe6\x06\x68\x9e\x9b\x7d\x62\
+\x2e\xeb\x9c\xec\x20\x65\xc5\x38\xf0\xf9\xa3\xea\x45\xbf\xbf\xfb\
+\x35\x3a\xc5\xab\x95\x52\xf0\x8b\x26\xec\x61\x56\xf1\x56\x68\xb1\
+\x1b\x20\x12\x6b\xb8\xd8\x3f\x16\x59\x8a\xea\x87\xed\x3d\xf5\x5a\
+\x8a\x56\xb3\x81\x6e\x3f\x43\x96\x2b\x87\xe2\xf9\x7c\x16\xcf\xae\
+\x3c\x85\xed\xcd\x5d\xd8\xd4\xd8\x02\x06\xa3\xd7\xeb\xa1\xdf\xef\
+\x63\x78\x78\xf8\xb4\x2d\x41\x95\xf0\x1f\x59\x78\x10\xff\x72\xec\
+\x36\x4c\xf6\x8f\x21\x21\xfb\x15\xef\x84\x35\xad\x42\xf8\xad\x7a\
+\xbd\xe8\x50\x8a\xc0\x2f\xda\x54\xd5\x46\x2b\x00\xa9\xf5\x90\x7e\
+\x79\x80\xb6\xc3\x2a\x94\x2c\x4f\xbc\xbb\x38\x57\x90\x49\xbb\xa6\
+\x53\xbe\x57\x47\xe5\x49\x60\x00\x8c\xb4\x56\x03\xf2\xe4\xeb\xdf\
+\xff\x8b\x47\xbf\x94\x36\x53\xa4\x8b\x07\x97\xf1\x5f\xf9\xc3\x38\
+\xba\x7f\xf2\x32\x5d\xe7\x37\x2b\xad\x42\xf1\x3b\x21\x92\x10\xb4\
+\x68\x70\xb4\xda\xc6\x57\xb3\xaa\x0c\xd9\x59\xe5\xeb\x6c\x40\xd0\
+\x6e\x34\xd0\xcd\x32\xe4\x06\x8c\x20\xc2\x6c\x36\x8b\x03\x2b\x4f\
+\x63\x47\x6b\x67\x09\x04\xed\x76\x1b\xb5\x5a\x0d\xab\x1d\xdd\x6e\
+\xb7\x10\xfe\xf2\x92\x59\x8c\x42\x78\x64\xbe\x10\xfe\xf1\xfe\x04\
+\x12\x6b\xf6\x19\x18\x6e\xb5\x30\x3e\x3a\x8a\x66\xbd\xe1\xc6\xce\
+\xdd\x3a\x23\xb6\xcd\x2c\xea\x55\xfa\xfa\x7a\xae\x12\x2a\x07\x6d\
+\xd7\x90\xc2\xf6\x42\xf7\xf7\x88\x5c\x8c\x14\xba\x1c\xe4\x91\x7d\
+\x59\x41\x2a\x5d\x99\x91\x8b\xa1\x34\x05\x7a\xf8\xfc\x07\xee\x79\
+\xcf\x77\x3f\xf7\xfb\xf7\x21\x05\x80\xd6\x95\x6d\xe4\x4b\xf9\x05\
+\x49\x9b\xde\xa6\xb4\xaa\xf9\x8d\x21\x43\x61\xae\x06\x84\x4a\x6d\
+\xaf\x58\x96\xe9\x86\x46\x9d\xf6\xfb\x07\x2d\x7c\x6a\x69\x8a\x66\
+\xc3\x5b\x02\xbb\x82\x68\x2e\x2f\x40\xb0\xb3\xb9\x0b\x9b\x9a\x5b\
+\x00\x14\x9c\x60\x65\x65\x05\x92\xbb\x28\xa5\xa0\x94\x42\x9e\xe7\
+\xe8\xf5\x7a\x98\x9d\x9d\x0d\x66\xef\x16\x66\xff\x47\xb8\xf3\xb9\
+\xdb\x70\xdc\x68\xbe\x1d\x7e\x2d\x84\xbf\x11\xad\x46\xc3\x93\xaa\
+\x68\x34\x54\x46\x46\xb1\x10\xdc\x1f\x11\xe8\xab\x04\x64\x85\x13\
+\x2b\x87\xff\xca\x59\x09\x8e\xf0\xcb\xa6\x21\xca\xaa\x12\x3c\x8b\
+\x02\xd8\xf4\x33\x03\x48\x28\xed\xe5\x33\xea\xee\xe7\x8e\x4e\x3d\
+\xfe\xcc\xdd\x07\x8b\xe1\xe0\xfe\x6c\x1f\xdd\xa9\xde\xa1\xb5\x63\
+\x6b\x96\x01\x6a\x5a\x9f\xe3\x37\x60\xf0\x40\x60\x66\xbf\x41\x84\
+\x10\x7c\xd5\xbe\xcb\x60\x98\x6d\x59\xfd\x2a\x5f\x59\x29\xab\x57\
+\xc5\x46\x8f\xec\x22\x00\x46\x11\x1d\x6c\x1d\x1d\xc5\xf1\x99\x19\
+\x74\x7a\xfd\xa2\x68\x4a\x70\xa8\x73\x10\xb7\x1f\xdd\x8b\x3f\xde\
+\xf1\x21\xbc\x6c\xed\xa5\x60\x30\x3a\x9d\x0e\x3a\x9d\x0e\xd2\x34\
+\x45\x92\xf8\xef\xc4\xb1\xdc\x44\x19\x62\x69\x85\xff\xc8\xc2\x0f\
+\x71\xe7\xb1\x7f\x28\x42\x3d\x4a\x9d\x79\x1c\x6e\xb6\xb0\x75\x74\
+\x14\x8d\x7a\x1d\x4a\x87\x70\xae\x76\x65\xc1\x87\x92\x39\xe6\xea\
+\xdb\x42\x0d\x75\xe6\xdd\x2f\x81\xb6\xc0\x0b\xcb\x8a\x88\x60\x54\
+\xbe\x24\x7a\x55\xc2\xd7\x9e\x3d\x2e\xaf\x1c\xeb\x1e\xd4\x79\x71\
+\x43\x02\x00\xbd\xb9\x3e\x3a\x53\xdd\xa3\xaa\xaf\x27\x82\x89\x08\
+\xce\xa7\xf8\x6f\xf7\x2e\xfc\x8c\x8f\x73\xe3\x81\x1f\x47\x52\xe0\
+\x1b\x22\x49\x4f\x69\xe9\x16\xe0\xe7\xbc\x41\x90\x23\x0d\x34\xeb\
+\x75\x6c\xde\xb0\xc1\x30\x70\xab\x58\x05\x08\xfe\xf9\xe8\x5e\xfc\
+\x4c\x10\x43\xab\xf9\x59\x96\xb9\x9f\x3c\xcf\x9d\xf0\xed\x62\xf4\
+\x47\xe6\x7f\x88\x3b\x8f\xfe\x03\x26\xba\xc7\xe0\xe6\xed\x6b\x46\
+\xbb\xd1\xc4\xd6\x0d\x26\xce\xd7\xd1\x54\x78\x17\x1e\x8b\x1f\xf8\
+\x81\x1b\x39\xc9\x32\x4e\xd8\x80\x11\xf4\x41\xd0\x0f\x14\xf7\x95\
+\x9c\x08\xea\x09\x76\x30\x62\xcb\x52\x2e\x92\x2c\xc2\x8d\xd6\x4a\
+\x0e\x22\xd3\xf8\x20\x82\xee\xeb\x89\xce\x54\xef\x68\x6f\xbe\x20\
+\xd0\x29\x00\x0c\xed\x1a\xc2\xec\xe3\x0b\xf9\xfa\xcb\xd6\xfe\x16\
+\xb5\x70\x89\x4d\x46\x4b\x62\x27\x0f\x4b\x3d\x28\xd8\x19\x8c\xca\
+\x6e\x20\x22\x79\x1c\x3c\x1d\xde\x2b\x37\x83\x91\x13\x29\x6a\xb5\
+\x1a\x9a\x8d\x06\x7a\xfd\x0c\x59\x9e\xc3\x2e\x27\x9d\xcb\x67\xf1\
+\xe4\xf2\x7e\x0c\xa7\x6b\xb1\xa5\xb9\x15\x8d\xa4\xe1\x0a\x25\xbb\
+\x92\xd8\xfc\x4b\x90\x60\x45\xad\x60\xdf\xcc\x37\x70\xcf\xc4\x1d\
+\x98\x34\x03\x3b\xf6\x18\x6a\xb6\x30\xbe\xd1\x10\xbe\xb0\xa9\x25\
+\xf3\x5d\x35\x75\x7e\x55\x2d\x97\x7f\x93\xf8\x16\xf5\x60\x6d\xb2\
+\x17\x1a\x22\xed\xaf\xf2\xf3\xb1\x65\x60\x71\xc1\xda\x51\x0f\x10\
+\x2f\x3c\x22\x82\x5e\xe4\x1f\x1c\xf9\xc2\xb1\x4f\xb0\xd6\xfd\xe9\
+\x87\x67\x0a\x00\xcc\xef\x5f\xc4\xc2\xd3\x0b\xf9\x8e\xdf\x19\x7f\
+\x69\xb2\x26\x79\x7d\xb1\x74\x20\x8c\x05\x24\x79\x0f\x09\x5c\xb0\
+\xc8\x3b\x10\x60\x24\xdf\x32\x08\x64\x3e\x20\x26\x97\xe2\xbc\x07\
+\x41\x1f\x79\xae\x5c\x81\x0b\xf9\x02\x7e\xb2\xf8\x63\x1c\xee\x1c\
+\x42\x4f\x77\x01\x0d\x64\xc8\xd0\xd1\x1d\xac\xa8\x15\x2c\xe6\x8b\
+\x98\xec\x4e\xe0\xa1\xf9\x07\xf1\x85\xe3\x9f\xc1\xfd\x27\xff\x1d\
+\x0b\x6a\x21\x10\x7e\xbb\xd9\xc4\xb6\x8d\x1b\xd0\x68\xd4\x03\x21\
+\x57\x09\x9f\x63\x74\x08\x41\x48\x7f\xce\xa6\xe2\x56\x18\xbe\x6d\
+\x71\xaa\x7d\x15\x22\x17\x9f\x37\xdd\xcb\xf1\xb9\x18\x68\x32\x79\
+\x14\x81\x11\x00\xab\x59\xf5\x99\xfd\x7f\xf7\xe4\xfd\xf3\xfb\x17\
+\x58\x67\xda\x8b\xe0\xed\xbf\xb8\x0e\x87\xef\x3d\xf2\xae\xb5\x57\
+\xae\xb9\x0b\xa4\xd7\x80\xec\x0e\x1d\x72\x0f\x16\x94\xd6\xf6\xc7\
+\x90\x20\x33\x31\xd0\x6d\xe6\xc0\xd1\x06\x0d\x95\xeb\xfa\xc9\xed\
+\x1a\x66\x2d\x49\x1c\x86\x12\x80\x6e\xbf\x8f\xc9\xe9\x19\x74\x7b\
+\x7d\x31\x3f\xb1\xf8\xd7\x48\x1a\x18\x4a\x86\x51\x4b\x6a\xf0\x14\
+\x96\x91\x73\x8e\x65\xb5\x8c\x9c\xb3\xc2\x1e\x88\xca\x0c\xb5\x9a\
+\xd8\xb2\x71\x03\x5a\x8d\x46\xb5\x74\x63\x21\x07\xe7\xac\x44\xd8\
+\x68\x76\xc8\xf4\xe3\xe7\xaa\xc9\x22\x1c\xb1\x1b\x74\x4f\x40\xee\
+\xdc\x33\x5c\x21\xf8\x41\x24\xd3\xfe\xd6\x20\x4e\x96\x16\x1f\x5d\
+\xfa\xc3\xdd\xbf\xb7\xf3\xf3\xff\xf6\xa2\x2f\x03\x30\x2e\x00\x00\
+\x1a\xeb\x1a\x58\x7a\x66\x99\x87\x5e\x34\xfc\xdb\xa8\xd3\x66\x57\
+\x17\xfb\x7d\x3f\xb1\x35\x10\x52\xb7\x7b\x7d\x49\x81\x3a\xe4\x59\
+\xd4\x56\x58\x05\xa9\xf5\x55\xee\x41\xbe\xa7\x88\x0e\x6a\x68\x36\
+\xea\xe8\xf6\xbc\x3b\x28\xf6\x0a\x20\x68\x68\xf4\x74\x17\x2b\x6a\
+\x05\x1d\xb5\x82\x95\x7c\x05\x1d\xbd\x82\x9e\xee\x42\x7e\xa1\x84\
+\x2d\xbc\xdd\x6c\x62\xcb\xe8\xa8\xe1\x17\x15\xf3\xe6\xc0\x4e\x9b\
+\x7c\x6f\x92\xd9\x26\x87\x43\x8d\x25\x0a\x34\xce\xee\x56\x15\x9b\
+\x76\x19\x4a\xfa\x77\x84\x60\x88\x85\x1a\x68\xbb\x2d\x89\x83\xa6\
+\x94\x35\x3e\x42\x93\x9b\x02\xd6\xc1\x53\xd3\xfb\x66\x6f\x5d\x3e\
+\xb4\x72\x72\x6a\xdf\x89\x10\x00\xac\x80\x89\x7f\x9f\xec\x6e\x7e\
+\xe3\xd8\x55\xe9\xda\xf4\x15\x55\x42\x2b\xda\x15\xee\x18\xee\xe9\
+\xbd\xb8\x4f\x36\xca\x3c\xc8\x55\x17\x51\x0d\x0e\xb9\x2b\x37\x22\
+\x67\x54\xab\xa5\x68\x36\xea\xe8\xf5\x32\xe1\x0e\xcc\xad\x36\xda\
+\xb0\xa6\xaa\x64\xa7\x8a\xc3\x6a\x7e\xb3\xd1\xf0\x9d\x25\x53\x18\
+\x4e\x64\xe4\xf6\x45\xf2\xc9\x20\xf2\xd7\x82\xbb\x43\x89\x9c\x52\
+\xb0\x91\xa0\x64\x3d\x02\xad\x17\x28\x70\x5f\xd7\x57\x21\xfc\xd2\
+\xbb\xdc\xe8\xa3\x57\xae\xfe\x64\x76\xdf\x2f\xfe\xfa\xc9\x7b\xb4\
+\xe2\x6c\xe5\xf0\x4a\x08\x80\x95\x23\x2b\x60\x70\xbe\xfe\xb2\x0d\
+\xa3\x8d\xad\x8d\x37\x13\xa1\xee\x02\x35\xe9\x02\x20\x04\x12\x91\
+\xbc\xaa\xb1\x00\xb9\x57\x4f\xa9\xf1\x03\xfc\x7e\x55\x0c\xed\x3e\
+\x33\xa1\x56\xab\xa1\xd5\x6a\x20\xcb\x15\x32\x09\x02\xae\x78\x40\
+\x38\x74\x02\x61\x78\xa8\x8d\xcd\x1b\xd7\xa3\x61\x84\x6f\xbf\xb5\
+\x24\xb4\x02\xe5\x6f\x08\xab\x26\x60\x56\x28\x82\xff\x38\x12\x27\
+\x57\x56\x71\x80\xad\xd8\x4d\xc4\x1a\x5d\x16\x64\xb9\xef\x62\x53\
+\xef\xcb\x62\xbf\xbf\x93\xe8\x33\xe4\xe8\x2c\xfd\x7c\xf9\xb6\xa9\
+\x6f\x4f\xfd\xd0\x0a\x3f\x00\x00\x00\xbc\xf8\xcf\x5e\x8c\x85\xc7\
+\xe6\xf3\x35\x2f\x5d\x7b\x2d\x35\x93\xcd\x55\xc9\xa0\x4a\xf1\x0a\
+\x20\xd8\x3d\xfe\xb8\xea\x09\x99\xfc\x11\x56\xa1\xec\x0a\xaa\x01\
+\x21\xdb\x5b\x4b\x6b\x68\xb7\x5b\xa8\xd5\x52\x68\x65\xf7\x25\xb0\
+\x31\xb0\xaf\x33\x01\x48\xd3\x04\xad\x66\x13\xa3\x1b\xd6\x61\x74\
+\xfd\x48\x91\x35\xac\xa2\xfb\x31\xe8\x44\x5c\x1e\xf6\x01\x7b\x76\
+\xed\x3a\x7f\x80\xfb\x8a\x04\x1c\x93\x3d\x50\xe8\x16\x9c\xab\x38\
+\x0d\xc1\x07\xa6\xde\x01\x58\x0e\x03\xfb\xc8\x4a\x2d\xaa\x27\x4f\
+\x7c\x65\xea\xef\xb6\x5f\x3f\x3e\x39\xfd\xc0\xb4\x2b\x3b\xc8\x9f\
+\x1e\xfb\xfc\x31\x2c\x1d\x58\x7a\x76\xe3\xb5\x63\xfb\x86\xd7\x0e\
+\xbf\x8c\x0d\x03\x24\x51\xe9\x82\xdc\xf9\x1a\x90\x68\xb8\xed\x1e\
+\x2d\x84\x16\x6c\x06\x15\x43\x9d\xe0\x12\x45\x0e\x30\x14\x42\x8e\
+\x11\x6e\xfc\xe4\x01\x56\x8c\x6c\x8d\x8c\xac\xc1\xf0\xf0\x10\xb2\
+\x2c\x43\xaf\x9f\x41\x9b\x2f\xbd\xb2\x7b\x09\x15\x59\xc5\x3a\x1a\
+\xf5\x3a\xd2\xb4\xc8\xf5\x6b\xb6\x8b\x57\x22\xd9\x97\x88\x9e\x14\
+\x5a\xe0\x23\x22\xef\xed\xef\xe6\x41\xe5\x30\xcc\x8e\x6a\x21\xe1\
+\x63\x99\x70\xe2\x90\x0e\xc6\x44\x70\x75\x22\xe9\x6b\x15\xba\x8f\
+\xe2\x63\xf7\x58\x6f\xdf\xc4\x57\x8f\x3f\xbb\xf0\xe4\x52\x50\xb7\
+\x00\x00\x4b\x07\x96\x00\x60\x69\xe1\xa7\x8b\xf7\xb5\x2e\x68\xbf\
+\x3b\x69\x27\x9b\xe5\x75\x62\x38\x73\x49\x66\xcb\x37\x36\xdf\x0b\
+\x14\xd8\x74\x42\x08\x9a\xc8\x75\xb8\xb5\xc7\x4e\x0d\x24\x93\x1e\
+\x34\x10\x15\x32\x5f\x79\x4f\x92\x26\x68\xa5\x4d\xb4\x5a\x2d\xdf\
+\x6d\x04\x51\xaf\xe2\x29\xf9\xfd\x39\x14\xd8\xa9\x50\xdb\xdc\x19\
+\x96\xd7\xca\x1a\x59\x05\x1a\xd9\xf1\x72\x67\x7a\x67\x99\x38\x82\
+\xd1\x00\xd0\x55\xfa\x77\x71\x83\x1b\x0a\x0e\x34\xde\x00\x35\x02\
+\xb6\xee\xe8\x13\x0b\x3f\x59\xb8\x0f\xc0\xd2\xf2\x81\x10\x00\xe1\
+\x77\x89\x03\xd8\xf8\x9a\x31\x4c\xdd\x37\xf5\xa3\xee\xf1\xde\x83\
+\x65\x04\x46\x5f\xc3\xea\xa6\x1d\xb1\xa8\x8a\x69\xa4\xf9\x81\xbb\
+\x17\xe1\x34\x32\xc4\xa8\x35\x9d\x21\xb6\x98\xd1\xa2\xec\xaa\x0c\
+\xa2\xab\x8b\x86\x1b\x1e\x95\xe7\x82\x29\xda\x1c\xbe\xd7\x4f\x61\
+\x2f\x4f\xb7\x92\x43\xac\xb2\xbd\x95\x3f\xf6\x19\x50\x30\xfc\x5a\
+\x9e\x49\x25\xeb\xed\x27\xde\x20\xa8\x53\x38\x39\x54\x6a\xb2\xcc\
+\xf0\xf9\xe9\xe3\x71\xc6\x12\x25\xe1\x03\x40\xf7\x78\xef\xc1\x13\
+\xf7\x4d\xfd\x68\xec\x35\x63\x25\xb0\x96\xc6\x51\x3b\x47\x56\x90\
+\x2f\xe7\x2b\xad\xf1\xd6\x70\x7b\x77\xfb\xf5\x54\x4f\x5a\x40\x14\
+\xcb\x47\xa3\x7e\xde\xa7\x8b\xd7\x52\xac\xc7\x11\x92\x25\x1f\xa8\
+\xb8\xc7\xff\x2d\x23\x7e\x2a\xf1\x85\x12\x49\x14\xc9\x92\x30\x5c\
+\x89\x7a\x25\x32\x23\x54\x71\x4b\xd5\x09\x0e\x0d\x86\x23\x8d\x21\
+\xe9\xf2\x57\x07\x26\x8f\x2a\xda\x50\xc5\xe6\xdd\xfd\x82\x8b\x84\
+\x44\x91\x44\xb6\x4f\x44\x5b\xa6\x7d\xaa\xa7\xe7\x67\xbf\x37\x73\
+\xcb\xf4\xbe\x93\xfb\x56\x8e\xac\x94\x36\x64\x28\x59\x00\x00\xd8\
+\x7a\xc3\x78\x3e\xf5\x95\xa9\x6f\x75\x8e\x75\x1f\x74\xe4\x4a\x36\
+\xca\x75\x99\xff\x02\x23\xb9\xd8\xa1\x40\xb9\x98\xf6\x2c\x27\x96\
+\x44\x56\x41\x73\x39\x8f\x1e\x74\x0a\xc4\xf3\xcc\x6e\xab\xb5\x58\
+\x3b\xc3\x59\xca\x72\x75\x6d\xa8\x5d\x2c\xea\x59\x4c\x9c\xb4\x75\
+\xf6\xf3\xf7\x9d\x46\xda\x72\xed\x17\x35\xbb\x71\x92\xf0\xbb\x8f\
+\x56\xb5\x14\x51\x7b\x64\x5e\x5f\x89\x3a\xc6\x73\x31\x65\x6f\xfb\
+\x6d\xf1\xbc\x05\xf0\x1b\x72\x44\x6d\x42\xd8\xe6\xce\x73\xdd\x07\
+\x4f\x7c\x65\xea\x5b\xdb\xde\xbd\x3d\xaf\x92\x75\xe5\x4c\x8a\xa5\
+\x9f\x2f\x22\x5f\xcc\x17\x1b\x1b\x1b\xed\xa1\x8b\x86\x5e\x83\x1a\
+\xb5\xcb\xba\x62\xff\xac\xda\x8b\xdb\x6b\x79\x59\xf9\xa8\x52\xf3\
+\x9c\x36\x54\x68\x78\x7c\x54\xbd\x2f\x08\x85\x50\x51\x86\x48\xce\
+\xb8\xd8\x3e\xfa\x09\x42\x37\x2e\x97\xed\x04\x12\x5c\xaf\xaa\xe1\
+\x00\xa3\xc3\xd5\xf5\x8b\x2d\x8a\xbf\xd7\x3b\x49\xeb\xdb\x4b\x3c\
+\xc0\xae\xce\x2e\xf5\x1b\x43\x75\xd4\xec\xf4\x37\x4e\xde\x32\xfb\
+\xfd\x99\x6f\x2e\xed\x5f\x0c\x93\x26\xe6\x18\x38\x95\x66\xeb\xbb\
+\xc7\xd5\xc9\xfb\xa6\xe6\xd7\xbc\x7c\xed\x8b\xeb\x63\x8d\x4b\x00\
+\xff\xcd\x2b\x36\xcf\x5b\x35\x34\x20\x79\xbf\x1c\x24\xf2\xf5\x96\
+\x16\x24\x7a\xb6\xca\xbc\x47\xf3\x07\x06\x75\xb9\x0f\x59\xa9\x5c\
+\x58\xa9\xa7\x2b\x21\x14\x10\xb5\x98\x1c\xae\xf6\xee\xb8\xce\xa5\
+\x4d\x37\xb8\x02\x10\x1c\x13\x4e\x04\xe2\x76\xb7\x59\x62\x17\xdc\
+\x13\x26\xb9\xe4\xe0\x99\x58\xcd\xc5\x2b\x4f\x2f\x7f\xf5\xb9\x3b\
+\x8f\xfc\xe3\xe6\xb7\x6d\x3d\xb1\xb4\x7f\xb1\xb2\xce\x03\x01\xb0\
+\xb4\x7f\x11\xba\xab\x97\x40\xc4\xc3\x97\xac\xb9\x26\x69\xa7\xeb\
+\xe2\x06\xc4\xbb\x30\x57\xfb\x70\x44\x40\x28\xb3\x6e\x97\xed\x5b\
+\xbd\xef\x43\x50\x44\xe7\x08\xa2\xa3\xce\xe3\x51\xb2\x2e\x1c\x02\
+\x35\xce\xd6\x49\x01\x97\xfb\xaf\x28\x20\x54\x0c\x6b\x61\xc4\x0c\
+\xa4\x28\x3e\x1a\x6c\x35\xd8\x25\x82\xf2\xf9\xfc\xc8\xd4\x17\x8e\
+\xff\xed\xd2\x13\x8b\x0f\x0c\xd2\x7e\x60\x15\x00\x00\x40\x6b\x67\
+\x5b\x2d\xfe\x78\x7e\xb6\x7d\xc1\xd0\x58\x6b\x47\xfb\x72\x4a\xc2\
+\xb0\xd1\x21\xd5\x86\x5c\x15\x4a\x1d\xfc\xcd\x91\x5c\x2b\x87\x8b\
+\x81\x78\x68\x30\xc0\xcd\x2a\x49\xa3\x41\x84\x90\x2b\xae\x0f\x12\
+\x6e\xe9\x87\x7d\x39\x31\x3f\xa9\x74\x3b\x83\x48\x5f\x00\x80\xb2\
+\xae\xb3\x19\x58\x8a\xfb\xc0\x0f\x3a\x55\x8c\xa0\x5a\xa1\x23\x0c\
+\x71\x59\x71\x6f\xfe\x87\xf3\xf7\x4c\xdc\x73\xf4\x9e\xd6\xce\xf6\
+\x5c\xbe\x50\xe9\xfe\x01\x9c\x02\x00\xe6\xc1\xe5\xfe\x44\x6f\x69\
+\xf8\xe5\x6b\x2f\xa9\xad\xaf\xef\xae\x10\x6b\xc4\x74\x09\x83\x15\
+\xd1\x7d\xdd\x93\xfb\x2e\x60\x2e\x17\x57\xf9\x5c\x10\x60\xc8\x0f\
+\xb1\xaa\x09\x97\x31\x48\xe8\x03\x81\xb1\x0a\x3a\xdc\x6b\x62\x10\
+\x73\x88\xcb\x2a\x20\xc4\x3a\x0e\xeb\xd3\x21\x4c\xbc\x65\xf4\x71\
+\xdf\x46\x1d\x13\x68\xbb\xf9\x1d\xde\x4b\xe8\x1e\xee\x3c\x70\xec\
+\xce\x23\x7f\x9f\xcf\x67\x4f\xe4\x0b\xf9\x6a\x98\xc7\xe9\x4c\xa7\
+\xe5\x7c\x3e\x9b\x85\x62\x3d\x7c\xc9\x9a\xcb\x92\x66\xb2\xae\x4a\
+\x66\x25\x72\x02\x8a\x23\xc1\x0a\x19\xfb\xc1\x1b\x9f\x7f\x47\x90\
+\x31\xb3\xc5\x96\x39\x59\x79\xe0\x41\xba\x1c\x27\x94\x01\xee\xa4\
+\xba\xa5\x03\x6a\x2b\xca\xe0\x55\x9f\x91\xc2\x16\x84\x31\xaa\x97\
+\x0c\xdb\xe4\xcc\x5e\x7b\xce\x8c\x30\x57\x8e\xfa\xc1\xcd\x48\xaa\
+\xaa\x06\x21\x5f\xc8\x0f\x4f\x7e\xf6\xd8\x2d\x0b\x8f\xcc\x7f\x0d\
+\x40\xf7\x54\x4d\x4e\x4e\x75\x03\x00\x5c\xb9\xef\x35\x0b\xd3\xf7\
+\x9f\xb8\x7f\xee\x7b\x33\x9f\xd1\x7d\x5e\x72\x82\x72\x82\xf3\x95\
+\x70\x53\x9e\xb4\x0e\xf3\xf3\xa8\xd6\xc8\xf2\xba\x36\x32\xeb\xde\
+\xc4\xd2\xea\x28\xcf\xed\x93\x20\x72\x4d\x9d\x4f\xf8\xc8\x8c\x1b\
+\xc7\xbf\x83\x77\x61\x70\xc8\x16\x87\x76\xc1\x73\xe1\xd4\x30\x0d\
+\x6d\xa6\xb5\xd9\xaf\x63\xf2\x75\x95\x53\xc0\xec\x7c\x7e\x44\xe5\
+\x4a\x20\x85\x51\x80\x75\x3d\xc6\xc4\x9b\x3d\x92\xa5\x95\x90\x11\
+\x8c\xee\xeb\xa5\xb9\xef\x4d\x7f\x66\xfa\xfe\x13\xf7\x5f\xb9\xef\
+\xb5\x0b\xa7\x23\xdb\xd3\x9a\x50\x3f\x71\xc7\x11\x00\x58\x5c\xfe\
+\xc5\xf2\xfc\xd0\x9e\xa1\x4d\x8d\x2d\xcd\x4b\x00\x24\x25\x15\x47\
+\x39\x24\x0c\x1a\x89\x41\x91\xc3\xc0\x53\xe2\x89\x48\x53\x88\x42\
+\x81\x05\xa0\x92\x3f\xf1\xa8\xfb\xa0\xb7\x56\x33\xfe\xaa\x77\x54\
+\x4d\xd0\x8c\x85\xe1\x7e\x02\xd3\x1e\x16\x5e\x5c\xf2\x0e\xa4\x4c\
+\x30\xe3\x1c\x8c\x57\xbc\xb0\x4f\x08\xac\x39\x5f\x7a\x7c\xf1\x8b\
+\x47\x3f\x76\xe8\x76\xee\xeb\xfd\x13\x77\x1c\x3e\x2d\xbb\x77\x26\
+\x6b\xab\x98\xfb\x7a\xa6\x7b\xa4\xbb\x38\x74\xf1\xf0\x8e\xda\x86\
+\xfa\x6e\x80\xc4\x04\x1b\x31\x16\x5f\xd1\xa5\x6c\x55\x28\xe8\xa4\
+\x28\x61\x28\x9c\x69\x75\x1e\x51\x84\x96\xb1\x23\x16\x21\x11\x07\
+\xa7\x6c\x48\x1a\x9a\x64\xd7\x71\x08\xc1\x62\x3b\xd8\x7b\x6d\x0a\
+\xdf\xc1\xf2\xba\x14\xb4\x0c\x7d\x65\x07\xc4\x61\x70\x7c\x08\x0b\
+\x2a\x18\x7f\xd5\x68\x20\x2a\x95\x81\xc0\x0c\xee\x1c\x5c\xf9\xee\
+\xb1\xdb\x0f\xdd\xd6\x9f\xec\xfd\x00\x40\xff\x74\x85\x7a\xa6\x8b\
+\xeb\xb2\x7c\x2e\x9b\xce\x4e\xf4\x97\x87\x2e\x59\x73\x61\x6d\x4d\
+\x6d\x2b\x38\xd2\x7b\x8a\xed\x40\x99\xc4\x04\x94\x28\x66\xfc\x31\
+\xb1\x8b\x1e\xa6\x4a\x85\x0d\xc3\x23\x1a\x88\x7d\x39\x41\x84\x2a\
+\x05\xc2\x15\x75\x77\x60\x09\xcc\xf4\x60\xd6\x5a\x49\x28\xa3\xf0\
+\xd0\xdf\x2b\x97\xcd\xc5\xb6\x4a\xba\xd7\xea\xfc\x06\x33\xd0\x9b\
+\xe8\x3e\x36\x71\xc7\x91\xdb\x96\xf7\x2f\x7d\x1d\xc0\x69\x99\x7e\
+\x7b\xfc\x32\xab\x2b\x3b\xfd\xe3\xbd\x69\xb5\x98\x77\xda\x17\xaf\
+\xb9\x30\x1d\x4a\x37\xb9\x68\x30\xe8\x3b\x99\xe3\x5f\x6d\x5c\xa0\
+\x68\xbd\xe6\xaa\xab\x15\xd1\x5f\x39\x11\x29\x12\x45\xe6\xcb\xa1\
+\x07\xa6\x0a\xa3\x51\xcb\x38\xae\x3c\xcd\x3c\x42\x29\x22\xa0\xf2\
+\x45\x5e\xe5\x59\xbf\xca\x97\x4b\x44\x2f\x06\x69\x68\x55\xa2\x79\
+\x08\x0c\xf4\x4f\xf6\xf7\x4f\xde\x73\xf4\x1f\x17\x7e\x38\xfb\x65\
+\x00\x93\xa7\xd5\x00\x71\xfc\x72\xcb\x6b\x81\xc5\xee\xe1\xce\x8c\
+\x5e\x51\xcb\xad\x3d\xc3\x17\x26\x43\xe9\xc6\xaa\x16\xfb\xdc\x80\
+\x6c\xd4\xea\x9d\x2d\xf7\xb1\x71\x9d\x42\x65\x2b\x31\xc8\x9c\x0e\
+\x2c\x9e\xab\x80\x45\xa5\xb2\x82\xa0\xa1\x32\xbe\xab\xa8\x73\xc5\
+\xfb\x82\x16\x04\x24\xb2\xca\xb4\xfb\xb7\x7b\x27\x19\x4f\x38\xf1\
+\x6d\xb0\xcf\x65\x33\xfd\x27\x27\x3f\xf9\xdc\xc7\xe6\xbe\x7d\xf2\
+\x4b\x00\x0e\xe1\x97\x38\x7e\x59\x00\x00\xc0\x5c\xe7\xc0\xca\xb4\
+\x5a\x52\x8b\xed\x8b\x86\x77\xa6\xc3\xe9\x26\xd9\x32\x9f\xfc\x11\
+\x96\xa0\x34\x4f\xaf\x7a\x1c\xc1\x87\x86\x72\xa8\x58\x10\x2f\xc6\
+\xc0\x31\x88\xaa\x43\x0a\xb9\x94\xb5\x66\x44\x52\x37\xa7\x44\xff\
+\x9f\x06\x06\x7c\x88\xe6\xee\x13\x03\x58\x03\x9f\x5f\x2d\xde\xaf\
+\x1c\x48\x71\xd6\x2e\x3b\xd9\xdf\x3f\x79\xef\x73\xff\x34\xfb\xcd\
+\x13\x5f\x02\xf0\xcc\x29\xaa\x37\xf0\x38\x1b\x00\x30\x80\xb9\xee\
+\xc1\x95\x99\x6c\xb6\x3f\xd7\xbc\x60\x68\x6b\xb2\x26\xdd\x62\xbb\
+\xce\xca\x3d\xf0\xc7\x81\xaa\xd9\xe9\xa5\x24\x4f\x55\xda\xfa\x2a\
+\x01\xc4\x03\x2b\x01\x99\xa3\xf0\xf9\x0a\x19\x57\x36\x06\x15\x65\
+\x21\xfe\x1c\xcd\x20\x96\x9b\x30\x33\x4e\xa5\xdd\xb1\x25\xf4\x26\
+\x3e\x4c\x30\x89\x81\x9f\x72\x9d\xb8\x77\xbc\xfb\xd8\xe4\xdd\x47\
+\x6e\x9f\xfb\xce\xf4\x57\x00\x3c\x05\x3f\xf3\xf1\x8c\x8f\xb3\x01\
+\x80\xad\xd7\x4c\xef\x48\x67\xa6\x77\x78\xe5\x64\x73\x77\x7b\x24\
+\x5d\x57\xdb\xce\x09\x52\xf7\x85\x93\xa5\x6e\xb0\x4f\x1a\x91\xd8\
+\xef\x01\x06\xa1\x34\x93\x97\xe3\x64\x52\x95\x1b\xa9\x08\xf2\x18\
+\xe5\x38\xbe\x62\x02\x46\x39\x22\xe0\x70\xa2\x49\x1c\xf3\x47\x83\
+\xfb\xab\xab\x5c\x3c\x28\x56\x7d\x4f\xd5\x7c\xc1\x40\xe3\x2d\x79\
+\x24\x80\x35\x67\xdd\x83\x2b\xdf\x3d\x7e\xfb\xa1\x3b\x16\x1f\x9e\
+\xff\x1a\xce\x52\xf8\xc0\xd9\x03\xc0\x56\x77\x36\x9b\xea\x9f\x5c\
+\xd9\xbf\x34\x55\x1f\x6b\xa8\xfa\x58\x63\x27\xd5\xd0\x8a\x19\xac\
+\x33\xad\x96\x34\x0e\x9a\x0d\x2a\xa9\x83\x0c\xb3\x02\x17\x1f\xb3\
+\xe2\xc1\x9d\x2c\x1d\x80\x34\xd1\x81\x9b\x41\x98\x60\x19\x1c\x8a\
+\x0c\xee\x84\xf2\x3b\x2b\xd2\xe5\x04\x17\x32\x06\xe7\x2d\x47\x15\
+\x20\x75\x1b\x48\x11\xa0\x7b\x7a\x7e\xe9\xc7\xf3\x5f\x3c\xfe\xb1\
+\x83\xf7\x74\x9e\x5e\xf9\x16\x80\x03\x38\x4b\xe1\x03\xe7\x06\x00\
+\xb6\xbe\x73\x6a\x21\x3f\xb1\xf4\xd0\xdc\x09\xa4\x34\xdd\x1c\x6f\
+\x6f\xa3\x56\xb2\xc1\x77\xbb\xef\xcc\x92\x6b\x13\xbd\x47\xe5\xde\
+\x84\xfc\x82\x60\xef\x26\xca\xec\xdd\x8b\xda\xfe\x6d\xd7\x1e\xdb\
+\xd7\x50\x85\x63\x09\x1b\x11\x33\x0b\xfb\x6d\xc7\xe5\x6a\x51\xe9\
+\x27\x7c\x3e\xd2\x6e\x53\x00\x47\xa6\xa7\xd2\x85\x89\xb7\x31\x18\
+\x6a\x3e\x7f\x76\xe6\x2b\x53\x77\x4f\xde\x79\xf8\x0b\xf9\x4c\xf6\
+\x7d\x00\x47\x71\x2a\x03\x74\x9a\xc7\xb9\x02\x80\x3d\x96\x58\xf1\
+\xf1\x95\x9f\x2e\xce\xf4\x4f\xf4\x8e\x35\xc6\xdb\x43\xe9\xda\xda\
+\x56\xa4\x54\x0b\x9b\x59\x9d\x88\x09\xba\xde\x9c\x2c\x46\x4c\x29\
+\xfa\xae\x5f\x2a\x39\x75\xfb\xad\xa5\xde\x52\x48\xe6\x17\xfb\x5e\
+\xc9\x0a\xa4\x85\x89\x92\x10\x81\xd5\x89\xcc\x39\xcb\x08\xa2\x22\
+\x1e\x0c\xd8\x7b\x58\xd7\x6a\x17\x14\xe7\x17\x09\xac\x74\xaf\x77\
+\xb8\xfb\xc0\xd4\xdd\x47\x3f\x3e\xfb\xe5\xa9\xfb\x39\xe7\x87\x00\
+\xcc\x9c\x4b\x81\x9d\x6b\x00\x00\x45\x16\x6a\xb2\x7f\xb4\x3b\xbd\
+\xfc\xe3\x85\xe7\x92\x76\x3a\x57\xdf\xd8\x18\x4b\x9a\xe9\xba\x60\
+\x61\x1e\xc2\xcc\x9c\xef\xe4\xb2\x85\xf0\xbc\x41\x9c\x34\xc6\x6f\
+\x70\x48\x08\x7f\x43\xf9\xa4\xff\x1d\xc7\x80\xc1\xb9\x28\x2d\x39\
+\x20\x57\x61\xb7\x6b\x89\x2b\x3e\x88\x58\x4a\xaa\xc8\xa5\x3b\x8b\
+\x13\xf9\x42\x7e\x78\xe1\xfb\xb3\x9f\x9d\xfc\xa7\xc3\x9f\xed\xfc\
+\x62\x69\x1f\x80\x9f\x01\xe8\xe0\x1c\x1f\xe7\x03\x00\x40\x21\x9e\
+\x69\xbd\xac\x4e\x2c\x3d\x3c\x37\xd5\x3f\xda\x3d\x50\x5b\xdf\xc8\
+\x6a\x23\xf5\x4d\xa8\x25\xed\x78\x89\x59\xdc\x1d\xae\x53\xa3\x0e\
+\x8b\x3b\x90\xaa\x4e\xca\x1e\x87\x71\x19\xc2\xf4\x52\x7c\xaf\x10\
+\x96\xbf\xe6\x4d\xba\xe3\x23\xb6\x0c\x44\x95\x01\x4a\xc9\x9c\x01\
+\xaf\x28\xb5\x50\x7e\xb2\xeb\x2b\x74\x57\xcf\x74\x7e\xbe\xf4\xf5\
+\x13\x77\x3f\x77\xef\xcc\x17\x8f\x7f\x43\x2f\xab\x1f\xa2\x88\xf1\
+\x07\x4e\xea\x38\x9b\xe3\x74\x43\xe9\xb3\x39\x5a\x00\x2e\x48\xda\
+\xe9\x4b\xd6\xbd\x6e\xe3\x2b\xd6\xfd\xd6\xd8\x1b\x1a\x3b\x5b\xaf\
+\x4c\x9a\xe9\x7a\x2f\xa5\xb8\x32\xa1\x37\xf7\xeb\x86\x07\x8d\x10\
+\xc8\x8e\xac\x6e\x60\xd5\xb5\xd5\x8e\x2a\x3c\x55\x64\xa6\x57\xc9\
+\xf8\xf1\x2a\xa5\x95\x43\x3e\xdd\xd3\x73\xfd\x23\x9d\x47\xe6\xbe\
+\x79\xf2\xdb\x0b\xfb\xa6\x1f\xd7\x1d\xf5\x73\x00\x07\x71\x1a\x43\
+\xba\x67\x73\x3c\x1f\x00\xb0\xef\x59\x07\x60\x4f\xba\xb6\xb6\x67\
+\xe4\xb5\xa3\x2f\x1b\x79\xcd\xc6\x57\x37\x76\xb6\xaf\x48\x5a\xc9\
+\x18\x25\x94\x44\x5d\xe2\x2c\x31\x0d\x2c\x6e\xd0\x80\x51\x75\x03\
+\x07\x09\x70\xd0\x93\xa7\x62\x58\x36\x86\x18\x7c\xaf\xbd\x16\xd7\
+\x40\x32\x3f\xd2\xba\xa3\x4e\x76\x8f\x74\x1e\x5d\xfc\xde\xcc\x0f\
+\x16\xbe\x3b\xfd\x84\x5a\xcc\x9f\x41\x91\xd8\x99\x3f\x8d\x6a\x9c\
+\xf5\xf1\x7c\x01\xc0\x1e\x09\x80\x51\x14\x16\x61\xf7\xf0\xe5\xeb\
+\xf6\x8c\xbc\x66\xf4\xb2\xd6\x9e\xe1\x2b\xd2\x91\xda\xee\xa4\x9e\
+\xb4\x7d\x9d\x38\x54\x71\x6b\x2c\x68\x35\xc1\x0d\x18\x5a\x5c\xa5\
+\xf1\x3c\xe0\x5c\x75\xf6\x2f\x7e\x73\x64\xc6\x6d\x28\x27\xef\x09\
+\x42\x1d\x02\x18\xac\x33\xee\xa8\x85\xec\x50\xf7\x99\xe5\x47\x17\
+\xbe\x37\xf3\xd8\xf2\x8f\xe7\x9f\xd1\x1d\x75\x08\x85\xc6\xcf\xe0\
+\x1c\x84\x77\xa7\x7b\x3c\xdf\x00\xb0\x47\x82\xc2\x22\xec\x04\x61\
+\x47\x73\x47\x7b\x7c\xf8\xaa\xf5\x17\x0d\x5f\x3a\xf2\xf2\xfa\xb6\
+\xd6\x8b\x6b\x6b\x6b\xdb\xa8\x46\xc3\x48\xa9\x46\x1c\x89\x43\x0e\
+\x07\xc6\x03\x43\x15\x2f\x0a\x43\xb3\x41\x39\xc1\x53\x41\xc1\x64\
+\x62\xa8\x62\x78\xd8\x7e\x8c\xd8\x24\xb3\xb0\x64\x8a\x73\xce\x79\
+\x59\x2d\xe6\x13\xfd\x89\xee\x93\xcb\x3f\x59\xf8\xd9\xf2\x43\x73\
+\xcf\xf6\x8e\x76\x8e\x81\x71\x14\xc0\x11\x14\x1a\xff\xbc\x09\x7e\
+\xb5\x3e\x7b\xbe\xdf\xdf\x06\xb0\x19\xc0\x36\xaa\xd1\x96\xfa\x96\
+\xe6\x58\xeb\xe2\xe1\x2d\x43\x2f\x1b\xd9\xdd\xd8\xd9\xba\xa0\xbe\
+\xb1\xb1\x3b\x19\xaa\x6d\xa2\x14\x4d\x4a\xa8\x81\x84\x6a\x56\x26\
+\x72\xda\x94\x27\xfb\x91\x96\x0e\x1c\x19\x3c\xdd\xe6\x5b\xa6\x57\
+\xe5\x40\x3c\x00\xdc\x8a\x21\xcd\x39\x6b\xee\xb3\xe2\x9e\x5e\x51\
+\x27\xf2\x93\xfd\xc3\xbd\xa3\xdd\x03\x2b\x4f\x2c\x1e\xea\x3e\xbd\
+\x34\x99\x4d\xf6\x4e\x72\xce\x93\x00\x26\x00\x4c\xa1\x60\xf6\xe7\
+\xdd\xd4\xaf\x26\x80\x5f\x95\x23\x05\x30\x04\x60\x23\x0a\x37\x31\
+\x4a\xcd\x64\x43\x7d\x53\x73\x7d\x63\x6b\x73\x5d\x63\x47\x7b\xb4\
+\xb1\xb5\x39\x56\x1b\x6d\x8c\xa6\x23\xb5\x8d\x49\x33\x1d\xa2\x06\
+\x0d\x51\x42\x35\xaa\x53\xdb\x05\xf1\xf1\x00\x8f\x04\x8b\x7b\x15\
+\x3b\xd6\x5d\xb6\x0d\xa5\xb8\xb0\x2a\x4a\x23\x80\x98\x33\xdd\x61\
+\xcd\x39\xf7\x79\x45\xf7\xd4\x8a\x5a\xc8\xa7\xf3\x99\xfe\x4c\xff\
+\x78\xef\x64\xff\x68\x67\x26\x3b\xde\x9b\xcf\x4e\xf4\xe6\x74\x4f\
+\xcf\xa2\x30\xed\x33\x00\xa6\x01\xac\xe0\x3c\xb1\xfa\x33\x3d\x7e\
+\x95\x00\x10\xd7\xab\x0e\x60\x18\xc0\x7a\x00\x23\x28\x2c\xc5\x30\
+\x80\xa1\xa4\x95\x0c\x25\xad\xb4\x4e\xad\xb4\x4e\x29\x25\x49\x93\
+\xea\x2f\x44\x53\x74\x4f\x67\xac\x58\x73\x57\x65\xba\xab\x32\xdd\
+\xd5\x2b\x28\x84\xbb\x8c\x42\xb3\x17\x00\xcc\x99\xbf\x33\xbc\x80\
+\x9a\x3e\xe8\xf8\x55\x05\x40\xd5\x91\xa2\x58\xce\x5e\x43\x61\x29\
+\x9a\x00\x1a\xe6\x7c\xfd\x05\x68\x0b\xa3\x10\xaa\x42\x91\xfc\xea\
+\xa1\x10\x7e\x6e\x7e\x7e\x25\x34\xfc\x54\xc7\xff\x01\x0c\x57\x22\
+\xdb\x0d\x59\xdd\xa4\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\
+\x65\x3a\x63\x72\x65\x61\x74\x65\x00\x32\x30\x31\x35\x2d\x30\x37\
+\x2d\x32\x35\x54\x32\x31\x3a\x34\x39\x3a\x33\x36\x2b\x30\x38\x3a\
+\x30\x30\x8d\x74\x31\xc3\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\
+\x74\x65\x3a\x6d\x6f\x64\x69\x66\x79\x00\x32\x30\x31\x32\x2d\x30\
+\x39\x2d\x31\x39\x54\x30\x30\x3a\x30\x38\x3a\x30\x32\x2b\x30\x38\
+\x3a\x30\x30\xe0\x16\x0f\x81\x00\x00\x00\x4e\x74\x45\x58\x74\x73\
+\x6f\x66\x74\x77\x61\x72\x65\x00\x49\x6d\x61\x67\x65\x4d\x61\x67\
+\x69\x63\x6b\x20\x36\x2e\x38\x2e\x38\x2d\x31\x30\x20\x51\x31\x36\
+\x20\x78\x38\x36\x5f\x36\x34\x20\x32\x30\x31\x35\x2d\x30\x37\x2d\
+\x31\x39\x20\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x69\x6d\
+\x61\x67\x65\x6d\x61\x67\x69\x63\x6b\x2e\x6f\x72\x67\x05\x0c\x9c\
+\x35\x00\x00\x00\x18\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\
+\x44\x6f\x63\x75\x6d\x65\x6e\x74\x3a\x3a\x50\x61\x67\x65\x73\x00\
+\x31\xa7\xff\xbb\x2f\x00\x00\x00\x18\x74\x45\x58\x74\x54\x68\x75\
+\x6d\x62\x3a\x3a\x49\x6d\x61\x67\x65\x3a\x3a\x48\x65\x69\x67\x68\
+\x74\x00\x32\x35\x36\xe9\xc3\x44\x19\x00\x00\x00\x17\x74\x45\x58\
+\x74\x54\x68\x75\x6d\x62\x3a\x3a\x49\x6d\x61\x67\x65\x3a\x3a\x57\
+\x69\x64\x74\x68\x00\x32\x35\x36\x7a\x32\x14\x44\x00\x00\x00\x19\
+\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x4d\x69\x6d\x65\x74\
+\x79\x70\x65\x00\x69\x6d\x61\x67\x65\x2f\x70\x6e\x67\x3f\xb2\x56\
+\x4e\x00\x00\x00\x17\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\
+\x4d\x54\x69\x6d\x65\x00\x31\x33\x34\x37\x39\x38\x34\x34\x38\x32\
+\xb0\xb6\xc4\xfe\x00\x00\x00\x13\x74\x45\x58\x74\x54\x68\x75\x6d\
+\x62\x3a\x3a\x53\x69\x7a\x65\x00\x36\x32\x2e\x35\x4b\x42\x42\x2d\
+\xdc\xa5\x0e\x00\x00\x00\x5a\x74\x45\x58\x74\x54\x68\x75\x6d\x62\
+\x3a\x3a\x55\x52\x49\x00\x66\x69\x6c\x65\x3a\x2f\x2f\x2f\x68\x6f\
+\x6d\x65\x2f\x77\x77\x77\x72\x6f\x6f\x74\x2f\x77\x77\x77\x2e\x65\
+\x61\x73\x79\x69\x63\x6f\x6e\x2e\x6e\x65\x74\x2f\x63\x64\x6e\x2d\
+\x69\x6d\x67\x2e\x65\x61\x73\x79\x69\x63\x6f\x6e\x2e\x63\x6e\x2f\
+\x73\x72\x63\x2f\x31\x30\x38\x33\x38\x2f\x31\x30\x38\x33\x38\x34\
+\x32\x2e\x70\x6e\x67\x0e\xa3\x42\x57\x00\x00\x00\x00\x49\x45\x4e\
+\x44\xae\x42\x60\x82\
+\x00\x00\x06\xfb\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xd6\xd8\xd4\x4f\x58\x32\
+\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
+\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
+\x79\x71\xc9\x65\x3c\x00\x00\x06\x8d\x49\x44\x41\x54\x58\xc3\xed\
+\x57\x79\x54\x8d\x69\x1c\xbe\x46\xe6\x18\x63\x16\x63\x3b\x0d\x33\
+\xd9\xc2\xd1\x62\x89\x44\x1b\x52\x88\x5b\x42\x8b\xf6\xb2\x84\xb4\
+\x58\xba\x2a\x57\x8b\xa5\xba\x15\xe9\xa6\x28\x7b\x22\xd7\x70\x42\
+\xf6\x90\xce\xb1\x4b\x24\x0d\x47\x0d\x31\xb2\x9e\x28\xe4\x4a\xcb\
+\x33\xcf\xc7\xe5\xcc\x41\xca\x31\x73\x66\xfe\xf0\x9d\xf3\x9c\x7b\
+\xce\xfd\xbe\xf7\xf7\x3e\xdf\xf3\x3c\xbf\xdf\x7b\xaf\x08\x80\xe8\
+\xbf\x84\xe8\x0b\x81\xff\x15\x01\x53\x87\x10\x6b\x13\xdb\xe0\x08\
+\x63\xdb\xe0\x54\xe3\x09\x81\x69\x86\xe3\x24\xc9\x83\xac\xfc\x03\
+\xf4\x46\x4c\x19\x2a\x12\x89\xbe\x21\xbe\xfa\xe4\x0d\x1a\x73\x99\
+\xda\x4b\x6d\x4d\x1d\x16\xfc\xe6\x13\x9a\x79\x3b\x58\x76\xa9\x42\
+\x2a\x2b\x51\x4a\x63\x4a\x94\x61\x71\x57\x2b\x25\x91\xd9\x8f\xdd\
+\x66\xaf\x2b\x35\x1a\x3f\x2f\x8f\x64\xe4\xba\x43\x9c\x8c\xb9\xa4\
+\x05\xd1\x44\xf4\x4f\x5c\xa6\xf6\x0b\x34\x2c\xdd\xa3\x0a\x16\xc5\
+\xdf\x57\xba\xcd\x06\x46\xb9\x01\x66\x2e\x80\x85\x3b\x20\x9e\x06\
+\x38\xcd\x05\x7c\x16\x01\x8b\x12\x95\x75\xe1\xf2\xbc\x4a\x7b\xef\
+\x84\xdb\x24\xb2\xb3\xaf\x99\x87\x33\x97\x7f\x47\x34\xfd\x4c\x02\
+\x52\x49\x90\x2c\xb7\xcc\x6e\x06\xa0\x6b\x09\x68\x5a\x10\xa3\x81\
+\x5e\x36\x80\x8e\x1d\xa0\xe7\x0c\x18\x79\x92\x98\x37\xe0\x12\x04\
+\x04\xc5\x01\x51\x2b\xaf\x57\xb9\xcd\x5a\x73\xcf\x40\xec\x9b\xd9\
+\x67\x98\x9b\xeb\x67\x11\xa1\xf4\xc7\x83\xa2\x5e\xd4\x0e\xb6\x05\
+\x34\xcc\x81\xce\x63\x80\x9e\x13\x81\xde\x1e\xc0\x40\x92\x1a\x38\
+\x13\xd0\xe7\xe6\x06\x54\xc3\x90\x30\xf7\x01\x1c\x83\x49\x64\x39\
+\x10\xbd\xfa\x7a\x95\xdd\x8c\xf8\xbb\x7a\x16\x53\x52\xba\xf6\xb5\
+\x18\xc8\x72\xcd\x3f\xd9\x9a\x51\x6e\x91\x85\x7e\x94\x78\x80\x3d\
+\xd0\xcd\x1a\xd0\x76\xe5\x1b\xfb\x03\x56\x0b\xb9\x11\xdf\xd6\x3d\
+\x01\x70\xe6\xa7\x4d\x14\x6d\x91\x02\x26\x73\x08\x3f\x2a\x32\x8b\
+\xf7\x42\x69\x4d\x32\x10\x1a\x77\xa2\xd2\xdc\x39\xbc\x84\x44\x64\
+\x2c\xd9\x8e\x50\x6b\x34\x01\x4f\xc9\xc6\x1b\xfe\x91\xc0\x20\x7a\
+\xaf\x45\xef\x0d\x59\xd8\x2e\x06\x98\xb7\x05\x48\xcc\x02\x36\x1c\
+\x07\x56\xe7\x00\xb2\x3d\xc0\x9c\x34\x92\x21\x21\xcb\xc5\xc0\xb0\
+\x79\xcc\x0a\xc9\x8c\x0d\x04\x66\x92\x5c\x7c\x9a\xb2\x6e\x6a\xd0\
+\xa6\xb2\x3e\x66\xee\xa9\x9d\x75\x87\x19\x36\x5a\x0d\x13\x3b\xe9\
+\x65\xa9\x1c\x18\x4e\x69\x0d\x28\xb5\xd5\x12\x20\x30\x1d\xd8\x96\
+\x0b\x2c\x49\x39\x50\xe5\x31\x37\xa1\x32\x44\x9e\xa1\x4c\x3f\x52\
+\x5c\xbd\xab\x00\x90\x1f\x05\xe6\x6e\x65\x38\x13\x49\x84\xcf\x0e\
+\x67\x2e\x46\x91\x8c\x73\x38\xb0\x38\x05\x08\x8f\xa7\x1a\x4e\x61\
+\x37\x75\x4d\x9d\x02\x58\xbe\x75\x83\x6a\xb0\xef\xcf\x2c\xdd\xf4\
+\xa2\xd6\x36\x84\xfe\xd2\x5b\xf7\x24\x20\xe9\x08\xb0\x72\xfb\xd9\
+\x97\xdd\x07\x8c\xbe\xd6\xfa\x67\xcd\xcc\x4e\xda\xa6\x07\x7a\x0f\
+\x75\x29\x14\x7b\x2e\x7c\xac\x38\x56\x5c\xbd\x23\x9f\xfe\x1f\x02\
+\xbc\xa9\x88\x5d\x3c\x09\x50\x91\x11\xb4\x47\xa8\x31\x87\xd9\x88\
+\xdf\x58\x5a\x2d\xf6\x88\xbc\xcb\x35\x89\xdc\xa2\xc3\xdf\x49\x70\
+\xd6\x68\xf3\xa5\x17\xf7\x33\x9f\x64\xf0\xaa\x9d\x07\x59\xcf\x5e\
+\x2e\x5b\x7d\xe1\x99\xff\x0a\x16\x8b\x06\x7c\x53\x01\xc5\x39\x16\
+\x0f\x5d\xf3\xbc\x9d\x86\xce\x41\x3e\xe4\x4b\x58\x12\x56\x1a\x5a\
+\xc6\x72\xa6\xfe\xa2\xcf\xc2\xf5\x4f\x77\xe7\x3d\xaa\x5d\x77\x1a\
+\x90\x66\x02\x1e\xeb\x98\x91\xa5\xc0\x48\xe6\xc6\x86\x24\xa6\xb3\
+\x8e\x7c\xb3\xb2\xce\xc5\x6f\x55\x19\x9f\xdf\xc4\xb5\x1a\x44\xb3\
+\x57\x9b\x73\xd0\x25\xa5\x16\x3c\xd6\x1b\x31\x75\x03\xbf\xd3\x12\
+\x09\x83\xc5\x7a\x72\xf4\xad\x15\xbb\xb8\x29\x25\x0c\xdc\x06\xec\
+\xb8\xc0\xa2\x01\x09\x95\x6d\x3a\xf6\x48\x17\x72\x4a\xb4\x27\x7e\
+\x22\xba\x10\x43\xbb\x0f\x18\xb3\x61\xb8\xe3\xfc\x07\x69\x87\x0a\
+\x5e\x66\x14\x02\xb1\xd9\x9c\x15\x0a\x60\xe2\x4a\x60\x34\xf3\x60\
+\x4d\x3b\x3c\xf9\x19\xbd\x91\x35\x17\x28\x2a\xf4\x2d\xbd\x8f\xf5\
+\x1e\xe6\xea\xc5\xc9\x1a\x13\xbf\xb6\xa0\x3c\xe7\x24\x30\x78\xec\
+\xec\x3b\xac\x65\x2f\xa8\xd2\xa2\xff\x48\xaf\xa4\x88\x94\x93\xcf\
+\xa2\x77\xd2\x43\x12\x51\xd0\xff\xd0\x84\x0c\x65\x27\xed\x21\xfb\
+\x84\x0d\x89\x96\x2a\x05\x9b\xaa\x7a\xbe\x1b\xd5\x90\xe8\x0e\x71\
+\x3e\x11\x18\xbb\xf5\xe9\x81\x42\x65\xdd\xaa\x33\x24\xcf\xa0\xba\
+\xaf\xa7\x0a\xec\x1a\x31\x6d\x71\x89\x60\x98\x99\x95\x85\x89\x7f\
+\xbe\x34\xb0\xf2\xbf\xe2\x1d\x9a\xff\x24\x96\x2f\xb9\x9f\x84\x0d\
+\xc4\x7e\x8f\x58\x67\x8e\x50\xb4\x89\xa6\xde\xa8\x01\x16\x2e\xe1\
+\x25\x9b\x0e\x3f\xaa\x4d\x60\xf2\xd3\x58\x2c\x75\x7f\x41\xb5\xb6\
+\xb1\xfd\x45\xde\x17\x13\xad\xde\x89\x8e\x9a\x4a\x95\xc1\xbd\x06\
+\x8f\xdf\xe2\xe8\xbf\xac\x6c\x7f\xc1\xa3\xda\x54\x2a\x17\xc6\x6c\
+\x4c\xdd\x4c\x3b\x69\xa9\x15\xbb\x6b\x3c\x89\x4c\x24\x26\x48\x9e\
+\xd6\x8d\xf5\x05\x66\x84\x51\xe1\xfd\x9c\x2f\x62\xdf\x72\xae\x97\
+\xbe\x29\xd8\x9c\xed\x13\xe2\xe0\x13\xf7\x60\xfb\x29\x65\xdd\x56\
+\x66\xe0\xc4\x0d\xbe\x05\x43\xd7\xee\x57\xed\x50\x95\x87\xef\xb6\
+\xd4\x57\xc4\xb7\x82\x1a\x24\x21\x37\x77\x92\xde\xcf\x3c\x5f\x5a\
+\xa3\xa0\x25\x11\xec\x94\x69\xb4\xd2\x69\xf5\x6b\x35\x46\xd2\x12\
+\x63\xb6\xb7\xd1\x74\x5a\xcb\xd9\xb1\xfd\xe0\xfb\x04\x84\xe2\x6d\
+\x29\xe9\xca\x00\xd9\xb6\xf2\x23\x57\x80\x9c\x22\x60\xdd\xae\x73\
+\x55\x5a\x86\xb6\x39\xbc\x37\x48\x75\x00\x7d\xe8\x12\xd4\xe8\xd8\
+\x73\xa0\x75\x84\x85\x93\xf4\x5e\x32\xd7\xa4\x93\xc4\x12\xce\x0e\
+\x5f\x5a\xea\xca\x1c\xd8\xb0\x53\xcc\xc2\x5e\xcf\x0e\x2f\x06\x34\
+\xe3\xe8\xfb\x04\xde\x16\x12\x52\x2b\x91\x29\x2a\xf2\x6e\x02\x85\
+\x77\x01\x07\x9f\xd8\xf2\x6e\xfd\x46\xca\x55\x2a\xa8\x7d\x84\x84\
+\x7a\x07\x4d\x7d\x2f\xe6\x29\x5f\x71\xa6\xb4\x3a\xf9\x22\x10\x42\
+\xaf\x67\x32\x53\xee\x6c\xd7\xf1\xb4\xc4\x9a\x9b\xfb\x73\x72\x66\
+\x9e\xf8\x30\x81\x37\x85\x34\xd8\xbf\x5b\x24\xd1\x8a\x8a\xc2\x3b\
+\x40\x16\x65\xed\x67\x31\xf9\xf7\xef\xdb\x74\x1c\xc7\x7b\x3f\x7e\
+\x64\xba\x09\x6b\xdb\x6a\x19\xd9\xcd\x27\x89\x0b\xf1\xd9\xa5\xd5\
+\x51\x6c\xd3\xf9\x7c\x5b\x3f\x86\x73\x32\x87\x9b\xdb\x5a\xb6\x2d\
+\xbb\xe5\xc0\xf9\xfa\x09\x08\x57\x33\xa2\x93\x40\xc2\xc1\x67\x59\
+\xd9\xb9\x3f\x94\x75\x31\xeb\x0f\x3d\xef\xa1\x6f\xa5\x78\xd5\xb7\
+\x22\xd1\xd7\xf5\x0d\x35\xc3\x71\x01\x9d\x0d\x6d\xe6\x2e\x4d\xde\
+\x97\xff\x44\x51\x0c\xac\xe2\xe4\x8c\x63\x47\x45\x72\x9c\x2f\x60\
+\x38\x83\x39\x33\x12\x38\xe4\x8e\x5f\xf9\x38\x81\xb7\x24\x74\x4c\
+\x26\xae\xb1\x9a\xb4\xf8\xe1\xa1\xb3\xa5\x35\x81\x4b\x15\x15\xec\
+\x96\x28\xc1\xa6\xfa\x8e\x5e\xe1\x68\xdf\xb0\x37\xb7\xec\x52\x19\
+\x90\x5d\x0a\xec\xa3\x8d\xbb\xaf\xd3\x73\xe6\x49\x08\xa7\x82\x13\
+\xf4\xf0\x55\xe0\xd2\xad\x86\x09\xbc\x21\xa1\xd1\x43\x5f\x2c\xe3\
+\x4f\xb2\xcb\xd1\x6b\xb3\x2a\x1d\xfd\xe2\x1e\xaa\x77\xe9\x3b\x99\
+\xdf\xb7\x79\xd7\x0a\x1e\xeb\x3d\x3c\x83\x53\xae\x65\xe5\x95\x3c\
+\x3f\x98\x7b\xbd\x6a\xef\xd9\xe2\xea\x3d\x67\x8a\x6a\xf6\x9c\x2e\
+\xaa\xc9\x3c\x55\x54\xb3\x9b\xd8\x75\x9c\x9f\x44\x46\x4e\x51\x8d\
+\xb6\xb1\x43\x09\x97\x49\x1a\x3a\xab\x04\x5f\x3b\xfc\xd0\xe6\x97\
+\xb1\x4c\x79\x7a\xab\xf6\x9d\x85\x30\x3a\x09\xea\x7c\x40\x85\xa6\
+\xbd\x87\xba\xba\x71\xc4\xe6\x08\xe7\x86\x8e\xa9\x63\x91\x8e\x89\
+\x63\x71\x7d\x50\xef\xda\x6f\x0f\xd7\xb8\x37\xe6\xc4\x56\x53\x85\
+\x4f\xf0\x7f\x08\xd1\xb7\x9e\x30\x36\x51\x9d\x7e\x46\x84\x0b\xe1\
+\xd5\x00\x1c\x89\xfe\x8d\xfd\xd9\xd0\x44\x15\xbe\x96\x0d\x9c\xf3\
+\x6f\x46\xb5\xba\x2a\x2b\x1f\x83\xba\xea\xd9\x7f\xf7\xfa\xf2\xcf\
+\xe8\x0b\x81\x86\xf0\x17\xce\x95\x4e\x3d\xa5\x4e\x62\x58\x00\x00\
+\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x4f\x63\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x80\x00\x00\x00\x80\x08\x06\x00\x00\x00\xc3\x3e\x61\xcb\
+\x00\x00\x20\x00\x49\x44\x41\x54\x78\x9c\xec\xbd\x77\xbc\x1d\xd5\
+\x75\xf7\xfd\xdd\x33\x73\xfa\xb9\xbd\xeb\x16\xe9\xea\xaa\x5c\xd4\
+\x51\x41\x08\x01\x42\x14\x83\x01\x13\x63\x07\x1b\x8c\x63\x1b\xb7\
+\xc4\xe6\x79\x4c\xf2\x60\x44\x9e\xbc\x36\x60\x27\xf9\x24\xa8\xd8\
+\xb1\x1d\x9b\xf8\x71\x4d\xec\x38\x31\xd8\xc1\x26\x18\x21\x8a\xb1\
+\xe8\x6a\x80\x2a\xea\xed\x36\xdd\x5e\x4e\x3f\x53\xf6\xfb\xc7\xcc\
+\x9c\x76\xcf\x55\xe3\xca\xe6\xf1\xfb\xae\xcf\x67\xce\xcc\x39\x67\
+\xce\xcc\x9c\xbd\x7e\x7b\xad\xb5\xd7\x5a\x7b\x6d\x21\xa5\xe4\xff\
+\xa7\xff\xef\x92\x36\x59\x17\x12\x42\x4c\xd6\xa5\x26\x95\x54\x55\
+\xd5\x80\xf2\xf3\x7d\x3e\xcb\xb2\x10\x42\x0c\x98\xa6\x09\x20\x80\
+\x77\x65\x8f\x39\xdf\x8e\x3c\x69\x00\xf8\x43\x53\xb1\x06\x98\x3d\
+\x7b\xf6\x92\x7b\xef\xbd\x77\x43\x6d\x6d\xed\xa2\x48\x24\x72\xce\
+\x8d\xa4\x28\x0a\xa5\xa5\xa5\x72\xff\xfe\xfd\x4f\x7f\xfb\xdb\xdf\
+\xfe\xcb\x13\x27\x4e\xf4\x4e\xd6\xf3\xbe\x5b\xe8\x8f\x06\x00\x85\
+\xe4\xf1\x78\x4a\xbf\xf5\xad\x6f\xfd\xf0\xd3\x9f\xfa\xd4\x02\x45\
+\x55\x39\x57\x00\x48\x29\xd1\x34\x8d\x50\x28\xc4\xaa\x55\xab\x6e\
+\x8f\x44\x22\x31\x55\x55\xff\xdc\x74\x44\xc1\x1f\x0b\xfd\xd1\x01\
+\x40\x08\x21\xa4\x94\xd2\x34\xcd\x8a\xe9\xd3\xa7\xcf\x50\x54\x15\
+\xcb\xb2\x08\x04\x02\xee\xf7\xb9\x27\x73\x36\x8a\xa1\xac\xac\x8c\
+\x59\xb3\x66\x5d\xaa\x28\x4a\x09\x30\x72\x41\x1e\xfc\x0f\x44\x7f\
+\x74\x00\x00\x10\x42\xa8\x9a\xa6\x79\xfa\xfa\xfa\xcc\x8e\xce\x0e\
+\x40\xc1\x34\x0d\x14\xa1\x20\x14\x81\x10\x0a\x42\x08\x14\x45\x64\
+\x00\x21\x84\xc8\xdb\x9c\x2b\xe1\xf1\x68\x0c\xf4\xf7\x33\x38\x38\
+\xa8\x29\x8a\xe2\xf9\x83\xfd\xa9\x0b\x44\xca\x1f\xfa\x01\x2e\x14\
+\xa9\xaa\x2a\x46\x47\x47\xe9\xef\x1b\xc0\x95\xda\x12\xb0\xb5\x80\
+\x04\x24\x52\x66\x6d\x07\x57\x3b\xe4\x7e\x06\x12\xcb\xb2\xe8\xed\
+\xeb\x23\x91\x48\x20\xde\xad\x96\xee\x3b\xa0\x3f\x5a\x00\x40\xb6\
+\x57\x2b\x8a\x00\x04\x42\xb8\x2a\xc0\xed\xe9\xd9\xf7\xf6\x39\xe4\
+\x7c\x96\xbf\x57\x94\x3f\xce\xa6\xfa\xe3\xfc\x57\xb9\x24\xec\x17\
+\x91\xb3\x77\x8f\x9d\x2f\x71\xfb\x75\x7e\x07\xcf\x1e\x0b\x21\x50\
+\x55\xf5\xbc\x87\x5a\xef\x66\xfa\xa3\xb4\x01\x00\x4c\xd3\x94\x52\
+\x4a\x9b\xcd\x05\x20\xc8\x05\x82\x2b\x01\x5c\xca\xf6\xfa\xec\xb5\
+\xfe\xe8\xe4\x7e\x0e\xfd\xb1\x02\x40\x56\x57\x57\x7b\x3d\x1e\x8f\
+\x62\x49\x49\xd6\x7f\x93\x2b\x01\xb2\x94\x2b\xf6\x9d\x4f\x72\xbe\
+\x13\x58\x96\x85\x69\x9a\x52\xd7\x75\xc3\x1d\x65\xfc\x1e\xfe\xc3\
+\x38\xda\xf3\xe0\x82\x09\xbf\x9b\xf7\x95\x5d\xe7\x75\xcd\x3f\x3a\
+\x00\x38\xcc\x91\x2b\x57\xae\x6c\xaa\xab\xab\xf3\x87\x43\x61\x47\
+\x74\x8b\x1c\xc6\xe7\xf7\xfa\x2c\x15\x57\x09\x15\x15\x15\x54\x57\
+\x57\xd7\x37\x37\x37\x4f\x39\x71\xe2\xc4\xd0\xf9\x3e\xdb\xab\x77\
+\xcd\xc2\x32\x25\x08\x81\x56\xa2\x91\x1a\x48\x13\xa8\xf7\x92\x1c\
+\x33\xb1\x7a\x75\x4a\x1b\x7d\xf8\x9a\xbc\x48\xf3\xf7\x87\xaf\x3f\
+\x18\x00\xa6\x4d\x9b\xd6\xdc\xde\xde\x7e\xbd\x65\x59\xfa\xbe\x7d\
+\xfb\x9e\xec\xec\xec\x1c\x64\x12\x5c\xad\x7e\xbf\x3f\xb8\x60\xc1\
+\x82\x85\xb7\xdc\x72\xcb\x43\xd3\xa7\x4f\x57\x03\x41\x3f\x96\x25\
+\x33\x46\x5e\x3e\x93\x0b\xc5\xff\xf8\xeb\x49\x29\xa9\xad\xab\x63\
+\xf9\xf2\xe5\xe5\x5f\xf8\xc2\x17\xfe\x65\xda\xb4\x69\x9f\xeb\xe9\
+\xe9\x79\x3b\x95\x4a\x19\xe7\xfa\x6c\x97\xfd\xe8\x60\xce\xbd\x6c\
+\x49\xd2\xd6\xd6\xd6\x3e\x7b\xf6\xec\xab\x75\x5d\x1f\xda\xfb\xe4\
+\xde\x27\xbb\xbb\xbb\xa3\x13\x49\x99\xd3\x49\x80\xf3\x25\x31\x59\
+\xd2\xec\x5c\x46\x48\x6d\x6d\x6d\xcb\xbe\xfc\xe5\x2f\xff\xe7\x0d\
+\x37\xdc\x30\xdd\xb2\x2c\x9e\x7f\xfe\xf9\x37\x1f\x78\xe0\x81\x3f\
+\x3d\x76\xec\xd8\x51\xce\x11\x04\xaa\xaa\xd2\xd8\xd8\x58\x3f\x7b\
+\xf6\xec\xab\x96\x2e\x5d\x7a\x4d\x4b\x4b\xcb\xe5\xd3\xa6\x4d\x9b\
+\xd9\xdc\xdc\xac\xd6\xd6\xd6\x12\x4f\x24\x70\xad\xfc\xc2\xf1\x7f\
+\x76\xcc\x2f\xf2\xd4\x40\xe1\x5e\x51\x14\x54\x45\xa1\xa3\xa3\x83\
+\x7d\xfb\xf6\xa5\x7a\x7a\x7a\xde\x78\xeb\xad\xb7\x36\xbf\xfd\xf6\
+\xdb\x4f\xbd\xf9\xe6\x9b\xdb\x13\x89\x44\xe2\x6c\x9e\xd5\x95\x00\
+\x57\xfc\xe4\xb0\x78\xed\xee\x8b\xe4\x97\x0f\x34\xde\x74\xf7\xdd\
+\x77\xff\x70\xe5\xca\x95\xb5\xa9\x54\x8a\x5f\xff\xfa\xd7\xcf\x3d\
+\xfc\xf0\xc3\x1f\x79\xea\xae\xf2\xfe\xf9\x5f\xdd\x2d\x76\x3f\x30\
+\xff\xac\xdb\xe1\x7c\x55\xc0\xef\x1d\x00\x6d\x6d\x6d\xcb\xee\xbb\
+\xef\xbe\xff\x7a\xef\x7b\xdf\xdb\xd4\xd2\xd2\x02\x40\x4f\x4f\x0f\
+\x8f\x3f\xfe\xf8\xde\xf5\xeb\xd7\xff\xc9\xb1\x63\xc7\x8e\x70\x16\
+\x20\x08\x04\x02\xde\x25\x4b\x96\x5c\x79\xe5\x95\x57\x7e\x74\xee\
+\xdc\xb9\xef\x6d\x6b\x6b\xab\xad\xac\xac\xa4\xac\xac\x8c\x50\x28\
+\x84\xdf\xef\x67\x2c\x12\x61\x78\x78\x04\x4d\x53\x1d\x66\x2b\xe3\
+\x98\x9f\xeb\xf8\xc9\x05\x43\xbe\xca\x80\x60\x20\x80\xaa\xaa\x24\
+\x12\x09\x22\x91\x08\xa3\xa3\xa3\xf4\xf4\xf4\x58\x87\x0e\x1d\xda\
+\xb3\x65\xcb\x96\x5f\xed\xda\xb5\xeb\x17\x3b\x76\xec\xd8\x7d\x16\
+\xed\x24\xa4\x94\xf2\x9a\x6b\xae\x79\xdf\x27\x3f\xf9\xc9\x9f\x5c\
+\x7f\xfd\xf5\x65\xd5\xd5\xd5\x00\xec\xdb\xb7\x8f\x27\x9e\x78\x62\
+\xf3\x23\x8f\x3c\xf2\xa1\x13\x27\x4e\xf4\x15\x4a\x82\x0b\x61\x03\
+\xfc\x5e\x01\xd0\xd6\xd6\xb6\x6c\xcd\x9a\x35\xff\xb5\x7a\xf5\xea\
+\xa6\xa6\xa6\x26\x92\xc9\x14\x42\x11\xf8\x7d\x3e\x3a\x3a\x3a\x78\
+\xfe\xf9\xe7\xf7\xae\x5d\xbb\xd6\x05\x41\x51\x6a\x68\x68\x28\x5d\
+\xb5\x6a\xd5\x87\x57\xac\x58\xf1\xc9\xf9\xf3\xe7\x5f\xda\xd8\xd8\
+\x48\x55\x55\x15\x25\x25\x25\x78\x3c\xb6\xa3\x4e\xd7\x75\xc6\x22\
+\x51\x22\x91\x08\x42\xd8\x3d\x78\xa2\xde\xef\xfa\x03\x40\x29\x2a\
+\x05\x72\xff\x9f\xdf\xef\xc7\xef\xf3\x21\x84\xc0\x34\x0c\x92\xa9\
+\x14\xa3\xa3\xa3\x0c\x0c\x0c\x70\xe2\xc4\x89\xe4\x1b\x6f\xbc\xf1\
+\xd4\xf3\xcf\x3f\xff\xbd\xad\x5b\xb7\x3e\x9b\x4c\x26\xc7\xc5\x0c\
+\x84\x10\xe2\xa5\x3f\x9b\x21\x1f\xec\x6a\xb9\xe5\x53\x9f\xfa\xd4\
+\x4f\x56\xae\x5c\x59\x3a\x65\xca\x14\x2c\xcb\x42\x55\x55\x52\xa9\
+\x14\xfb\xf7\xef\xe7\xd9\x67\x9f\xdd\xfc\x9d\xef\x7c\xe7\x43\x4f\
+\xdd\x55\xde\x77\xb6\x92\xe0\x5d\x0f\x00\x97\xf9\x57\x5f\x7d\x75\
+\x53\x73\x73\x33\x83\xc3\x23\x0c\x0e\x0e\x82\x10\xd4\xd7\xd6\x52\
+\x5a\x12\xe6\xe4\xc9\x93\x3c\xff\xfc\xf3\x7b\xbf\xf5\xad\x6f\x7d\
+\x78\xdf\xbe\x7d\x7b\x73\x7f\x5f\x5f\x5f\x5f\xb2\x6a\xd5\xaa\x3b\
+\xae\xbd\xf6\xda\xff\x31\x6f\xde\xbc\xf9\x8d\x8d\x8d\x54\x56\x56\
+\x66\x7c\xfc\xd1\x68\x8c\x58\x3c\x4e\x22\x91\xc8\x78\xfe\x54\x55\
+\x45\x51\x94\x8c\xf8\x9f\xa8\xf7\x9f\x09\x00\xee\xb1\x94\xd2\x56\
+\x07\xaa\x8a\xd7\xe3\xc1\xe3\xf1\xa0\x28\x0a\x86\xae\x13\x8d\xc5\
+\x18\x18\x18\xe0\xe4\xc9\x93\x6c\xdb\xb6\xed\xb9\xdf\xfc\xe6\x37\
+\xff\xb4\x75\xeb\xd6\xa7\x92\xc9\x64\x5e\x03\x5f\x7b\xed\xb5\x37\
+\x7f\xee\x73\x9f\xfb\xe9\xb2\x65\xcb\xca\xa6\x4c\x99\x42\x3a\x9d\
+\x26\x95\x4e\x03\x10\x0e\x85\xd0\x75\x9d\xb7\xdf\x7e\x9b\x67\x9f\
+\x7d\x76\xf3\x23\x8f\x3c\x72\xdb\x89\x13\x27\xfa\x5d\x49\xf0\x7f\
+\xed\x28\x20\x97\xf9\x53\xa7\x4e\x65\x60\x70\x88\xa1\xa1\x21\x54\
+\x55\x05\xa0\xb7\xaf\x0f\x80\x96\x96\x16\x56\xaf\x5e\x3d\xb7\xa2\
+\xa2\xe2\xb7\x6f\xbc\xf9\xd6\x83\xdf\xf9\xf6\x3f\xff\x30\x9d\x4e\
+\xb3\x62\xc5\x8a\x5b\x3f\xf8\xc1\x0f\xfe\xef\x65\xcb\x96\x2d\x6c\
+\x69\x69\xa1\xb2\xb2\x12\x9f\xcf\x47\x32\x99\xa2\xb7\xaf\x9f\x48\
+\x24\x42\x2a\x95\x42\x51\x14\x34\x4d\x45\x51\xd4\x73\xf4\xdc\x9d\
+\x9d\xfa\x12\x42\x20\xa5\xc4\x30\x0c\x0c\xc3\x40\x24\x93\x68\x9a\
+\x86\xd7\xe3\xa1\xac\xac\x8c\xd2\xd2\x52\xea\x6a\x6b\x69\x6d\x6d\
+\xbd\x76\xd9\xb2\x65\xd7\xbe\xf6\xda\x6b\x4f\x2f\x5b\xb6\xec\x6f\
+\x77\xee\xdc\xb9\x15\xb0\xae\xb8\xe2\x8a\x5b\x3e\xff\xf9\xcf\xff\
+\x78\xf9\xf2\xe5\x65\xf5\xf5\xf5\x19\xe6\xbb\x00\x8b\xc6\xe2\x84\
+\x42\x41\x2e\xba\xe8\x22\x80\x55\x42\x88\xc7\xa6\x4e\x9d\x7a\xdb\
+\xee\x07\xe6\xf7\x0b\x21\xce\xc9\x26\x38\x5b\xba\xe0\x00\x68\x6b\
+\x6b\xbb\x64\xcd\x9a\x35\xbf\x74\x99\xdf\x3f\x38\xc4\xe0\xd0\x10\
+\x6a\x0e\x83\x14\x45\xc9\x80\x60\xda\xb4\x69\x98\xa6\x59\x1b\x0e\
+\x87\x1f\x69\x6e\x6a\xfa\xb8\x69\x1a\xea\x82\x05\x0b\x96\xb5\xb5\
+\xb5\x51\x53\x53\x83\xdf\xef\x27\x1e\x8f\x73\xb2\xa3\x83\x78\xdc\
+\xee\xed\xae\xab\xd6\x16\xf5\xf9\xba\xbb\x38\xbd\x33\xd7\x4e\xae\
+\x74\xd0\x75\x1d\x5d\xd7\x51\x14\x05\xaf\xc7\x43\x28\x1c\x26\x18\
+\x0a\x51\x55\x55\x45\x73\x73\xf3\x0d\xf3\xe7\xcf\x5f\x7d\xf8\xf0\
+\xe1\x2d\x42\x08\x66\xcc\x98\xb1\x62\xd1\xa2\x45\x9e\xba\x22\xcc\
+\x77\x29\x16\x8b\x11\x0a\x85\x32\x20\x90\x52\x3e\x76\xd3\x23\x8f\
+\x7c\x48\x4a\xd9\x77\x21\x40\x70\x41\x55\x40\x61\xcf\x2f\xc6\xfc\
+\x5c\xb2\x2c\x8b\xda\x9a\x1a\x2a\xca\xcb\x18\x1d\x1d\x25\x95\x4a\
+\xa1\xaa\x2a\xe1\x70\x98\x60\x30\x48\x22\x91\x64\x70\x68\x90\x58\
+\x2c\x8e\x94\x32\xd3\x23\x21\x57\x3c\x2b\x05\x3a\xff\x6c\x54\xc0\
+\xc4\x23\x81\x62\xff\x6d\x22\x75\xe7\x3e\x93\xd7\xeb\xc5\xef\xf3\
+\x61\x59\x16\x91\x48\x84\x78\x3c\x8e\x10\x82\x60\x30\x48\x38\x1c\
+\x9e\x90\xf9\xee\x35\x00\x42\xa1\x10\x46\x81\x3a\xf8\xcd\x27\xca\
+\x26\x1c\x1d\xbc\xeb\x54\x40\x2e\xf3\x1b\x1a\x1a\xd8\xf4\xcc\x33\
+\x34\x36\xb7\xe0\xf3\x7a\x27\xfc\x8d\xa2\x28\xf4\xf5\xf7\x23\xa5\
+\x45\x75\x55\x55\x46\x8c\x27\x53\x29\xba\xba\xbb\x89\x46\xe3\x80\
+\xcc\x30\xcd\x6e\xf0\x6c\x24\xcf\x25\x29\x8b\x8f\xe9\x27\x26\xd7\
+\x5b\xf8\xce\xc8\x65\x68\x2a\x95\x22\x9d\x4e\xe3\xf3\x7a\x29\x2f\
+\x2f\xa7\xa2\xa2\xc2\x79\x2e\x49\x3c\x91\x20\x3d\x01\xf3\x73\xa9\
+\x50\x12\x00\x8f\xdd\xf4\xc8\x23\xb7\x6d\xbe\x6b\x56\xff\xfc\xaf\
+\xee\x16\x3b\x3e\xd3\x2e\x27\xc3\x69\x74\x41\x00\x50\xd8\xf3\x8f\
+\x1c\x39\xca\xbc\x39\x73\xd8\xb2\x65\x2b\x33\x66\xcf\xce\x18\x6e\
+\xc5\x48\x51\x14\x06\x06\x87\x18\x19\x1d\xc3\xa3\x69\x58\x52\x92\
+\x4e\xa7\xb1\x2c\xcb\xee\xcd\x42\x61\xe2\x11\xa2\xcc\x63\x7e\x61\
+\x1b\x9f\x3b\x30\x26\xb8\xcb\x19\xae\xe3\x32\x37\x99\x4a\x91\x76\
+\xd4\x03\xd8\x12\xce\xc9\x31\x3c\xab\xfb\x44\xa3\x31\xc2\x8e\x4d\
+\x20\x84\x58\xe5\xf1\x78\x1e\xfb\xe8\x37\xbe\xf1\xa1\x17\x6e\x6c\
+\xed\x5b\xf2\xbd\xfd\x62\xcf\x57\x16\xbc\x63\xf1\x3d\xe9\x00\x28\
+\x64\xfe\xe1\x23\x47\x98\x3d\x6b\x16\x8a\xa2\x30\xad\xb5\x95\x4d\
+\x4f\x3f\x4d\x22\x99\x62\x56\x7b\xfb\x84\xd7\x10\x42\x64\x0c\x2d\
+\xf7\x7d\xa6\x11\xa5\xdd\x80\xc5\x9a\xf0\xf4\xda\xec\x74\xbd\x3c\
+\x1b\x2b\x70\x99\x7b\x7a\x26\x9f\x9d\xc4\x70\xa5\x54\x6e\x16\xd9\
+\xe9\x98\x5f\x4c\x1d\x47\x62\x31\x4a\x42\x21\xda\x2f\xba\x08\xaf\
+\xd7\xbb\x0a\x78\xf4\x63\xdf\xf8\xc6\x87\x76\x7c\xa6\xbd\x6f\xde\
+\x83\xbb\xde\xb1\x4d\x30\xa9\xe1\xe0\x59\xb3\x66\x2d\xbd\xff\xfe\
+\xfb\x8b\x32\xdf\xa5\xeb\x6f\xb8\x81\xd6\x69\xd3\xd8\xfa\xda\x6b\
+\x44\xa3\xd1\x09\xaf\x35\x3e\x3b\x27\x4b\x52\x4a\xac\x4c\x63\x4d\
+\xd4\xa0\x32\x2f\xc9\x23\xfb\xdb\x22\x67\x16\x6d\x42\x79\x86\xef\
+\x2f\x3c\x09\x61\xff\xbb\x48\x2c\x86\xa6\xaa\x4c\x9f\x3e\x9d\xeb\
+\xaf\xbf\x7e\xd5\x5f\xfd\xd5\x5f\x3d\x7a\xeb\xa6\x78\xdd\x64\x48\
+\x80\x49\x03\x40\x20\x10\x08\x7f\xe6\x33\x9f\xf9\x3f\x2b\x57\xae\
+\x6c\x6a\x99\x3a\x95\x43\x87\x0e\xd3\x3e\x7b\x76\xd1\xe1\xd8\x82\
+\x85\x0b\xb8\xe1\x86\xeb\x39\x7a\xf8\x10\x6f\xef\xdb\x77\xde\xf7\
+\x94\xce\x96\xdf\x55\xdd\x6c\x1f\x99\xf3\x9e\xbc\xe3\xfc\xec\x9f\
+\xe2\xe7\x8c\xbf\x53\xc1\x27\x93\x8c\x8a\xe2\xc0\xb4\x3f\x14\x40\
+\x24\x12\x41\xd5\x34\xa6\x4f\x9f\xce\xf2\xe5\xcb\x57\x7d\xf8\xc3\
+\x1f\x7e\x68\xe1\x57\xf7\xbe\x63\xfe\x4d\x1a\x00\x66\xcd\x9a\x35\
+\xb5\xae\xae\x6e\x21\xc0\xe8\x58\x84\x5d\xbb\x77\x4d\x28\xee\x2c\
+\xd3\x24\x14\x0c\xb1\xea\xca\x55\x04\x7c\x5e\x5e\xda\xbc\x99\xb1\
+\xb1\xb1\x77\x74\x7f\xe1\xc8\x6d\x29\xdd\x9e\xef\x3a\x6f\x20\x57\
+\x1a\xe4\xa6\x83\x65\xdf\x3b\x47\xe7\xc8\xd4\xc9\xc5\xc0\x19\x2e\
+\x26\x04\xd1\x68\x14\xa1\x28\xa4\xd3\x69\xa6\x4c\x99\x72\x95\xa6\
+\x69\xe5\xef\xf4\xae\x93\x02\x00\x21\x84\x38\x78\xf0\xe0\xe0\xd0\
+\xd0\x50\xa7\xaa\xaa\x18\x7a\x9a\xa6\xa6\x66\xb6\x6f\xdf\x5e\xfc\
+\x7c\x77\xbc\xae\x08\xda\x67\xcf\x66\xde\x9c\x8b\xd8\xfa\xea\x2b\
+\xec\xd8\xb6\xed\x9d\x3c\x04\x08\x5b\x87\x3b\x2f\x39\x0c\xb5\x5d\
+\xc0\x8a\xa2\xa2\xaa\x2a\x9a\xa6\xa1\xaa\x59\xcf\x9f\x9b\xf1\xe3\
+\xf1\x68\x68\x9a\x56\xd4\x91\x54\x1c\x1c\x93\x83\x80\x62\xd7\xce\
+\x57\x5b\xf6\x1b\x4d\xd3\x48\x25\x93\x04\x83\x41\x7a\x7b\x7b\x0f\
+\x18\x86\x91\x9c\xff\xd5\xdd\xef\x88\x87\x93\x65\x04\x2a\x89\x44\
+\x62\xe8\xe7\x3f\xff\xf9\x9a\xc6\xc6\xc6\xef\x2d\x5f\x7e\x69\x49\
+\x5b\x5b\x1b\x2f\xbf\xfc\x12\x2d\xcd\xcd\xd4\xd6\xd5\xe5\x9f\x2c\
+\x04\x8a\xea\x82\x40\xa1\xb4\xac\x8c\x25\x4b\x97\xb2\x69\xd3\x26\
+\x9a\x9a\x9b\xa9\xab\xaf\x3f\xbf\xa7\x10\x02\x09\x58\x52\xa2\x60\
+\x33\x55\x08\xdb\x59\x13\x8d\x26\x89\xc7\x13\x18\x86\x89\x61\xe8\
+\x98\x96\x85\x69\x98\x19\x13\xc2\xa3\x69\x28\xaa\x8a\xc7\xe3\xc1\
+\xef\xf3\x11\x0a\x85\x08\x87\xed\xa0\x92\xa2\x28\x58\x96\x35\x01\
+\xa3\xe4\x39\x45\x42\x8b\xfd\x7e\x82\x6f\xf2\xbe\xd7\x34\x0d\x21\
+\xa1\x7f\x60\x80\xed\xdb\xb7\x1f\xf8\xd9\xcf\x7e\xf6\x77\xce\x1c\
+\x85\x77\x34\xae\x99\x14\x47\x90\x10\x42\x05\xbc\x80\xba\x74\xe9\
+\xd2\x0f\xae\x59\xb3\xe6\x5b\x2b\x56\xac\x28\x51\x35\x0f\xcf\x3d\
+\xfb\x2c\x77\xde\xf9\x91\x71\x3d\x2a\x99\x48\x10\x8d\xc5\x88\xc7\
+\x62\x44\xa3\x51\x0e\x1e\x3c\x48\x57\x57\x17\xf1\x44\x92\x9b\xde\
+\xf7\xbe\xf3\x7e\x16\xf7\x3e\x89\x44\x82\x68\x34\x4a\x32\x91\x44\
+\x08\x85\x70\x38\x48\x28\x18\x22\x18\x0a\xe2\xf7\xf9\xf0\xf9\x7d\
+\xf8\xbc\xbe\x4c\xf3\xa5\x53\x69\x52\xa9\x34\xc9\x54\x92\x78\x3c\
+\x4e\x2c\x16\xb7\x1d\x38\x8a\x20\x1c\x0a\x51\x5d\x53\x4d\x59\x69\
+\x29\xaa\xaa\x61\x59\x66\x51\xc6\x9d\x0b\x10\xc6\xdb\x1e\xb9\xdf\
+\xe5\xab\x25\x8f\x66\xf7\xd3\xbe\xbe\x3e\x36\x6e\xdc\x78\x70\xed\
+\xda\xb5\x1f\xef\xec\xec\xdc\x05\x98\x80\xbe\xfb\x81\xf9\xd6\xbb\
+\x21\x18\xe4\x01\xfc\xd8\x20\x78\xff\x9a\x35\x6b\xbe\xb9\x62\xc5\
+\x8a\x12\x4b\xc2\x2b\x2f\xbf\xc4\x1d\x77\xdc\x91\x77\x7e\x3a\x95\
+\x22\x16\x8f\x13\x8d\x46\x38\x72\xf8\x08\x91\x48\x04\x9f\xcf\xc7\
+\x81\x03\x07\xb8\xec\x8a\x2b\x4f\xeb\x2b\x28\x46\xaa\xaa\x62\x18\
+\x06\x43\x43\x43\x8c\x8d\x45\xf0\xfb\x7d\xd4\xd5\xd6\x52\x53\x53\
+\x43\xc0\xef\x03\xc0\xb2\x24\xba\xa1\xe7\xf4\xe6\xac\xa7\xd0\xf6\
+\x22\x6a\x68\x9a\xa3\x22\x14\x05\x5d\xd7\x89\x27\x12\x9c\x3a\xd5\
+\xcb\xc0\xe0\x20\x86\x6e\x50\x5d\x5d\xc5\x94\x86\x06\xfc\x01\x3f\
+\xa6\x79\xee\x40\x38\x53\x7b\x17\x32\x5f\x55\x55\x04\xd0\xdf\xdf\
+\xef\x32\xff\x13\x9d\x9d\x9d\xbb\xb1\x99\x9f\xde\xfd\xc0\x7c\x13\
+\xde\x1d\xd1\x40\x81\xad\x52\x42\x00\x4b\x97\x2e\x7d\xff\xfd\x6b\
+\xd6\x7c\xf3\xd2\x4b\x57\x94\x74\x76\x77\xa3\x00\x97\x2c\xbf\x24\
+\x73\xbe\x65\x98\x44\xa2\x51\x8e\x1d\x3f\x46\x22\x1e\x27\x18\x0c\
+\x02\x82\xa1\xa1\x01\xa2\xb1\x04\x6d\x33\x67\x9e\xd5\x7d\x15\x45\
+\xc1\x34\x4d\x7a\x7b\xfb\x88\xc5\x62\xd4\xd5\xd6\x32\x75\x6a\x33\
+\x01\xbf\x9f\x74\x5a\x67\xcc\x09\x14\xb9\x8d\xa9\x69\x5a\x26\x60\
+\x64\xab\x88\xfc\x64\x91\xdc\x74\x30\x55\xb5\xcf\xf1\x79\xbd\x20\
+\x04\xb1\x68\x8c\x13\x27\x4f\xd2\xd7\x3f\x40\x55\x55\x25\x53\x5b\
+\x9a\xf1\xf9\x7c\x13\x02\xe1\x5c\xa9\x90\xf9\xc2\x71\x4f\x0c\x0d\
+\x0d\xf1\xf4\xd3\x4f\x1f\x78\xf8\xe1\x87\xef\x72\x98\x6f\x01\xa9\
+\x3d\x5f\x59\x60\xba\x9e\xc0\x77\x03\x00\xc0\x16\xa8\x1a\x10\x04\
+\x58\xba\x74\xe9\xad\x7f\xfd\xd7\x7f\xfd\x4f\x8b\x17\x2f\x2e\xdb\
+\xba\x75\x1b\x57\xad\xba\x32\xa3\xdf\x2d\xcb\xa2\xf3\x64\x07\xa9\
+\x74\x9a\x70\x38\x8c\x2b\x0e\x2d\xcb\xe2\xad\xb7\x76\xd2\x3a\x63\
+\xc6\x19\xef\xa7\x28\x82\xfe\xfe\x41\x86\x87\x87\x69\xa8\xab\x63\
+\xc6\x8c\xe9\x28\x8a\xc2\xf0\xc8\x08\x89\x44\x32\xe3\x80\x11\x02\
+\xa7\x77\x6b\x39\x11\x43\xa5\x20\x80\xa4\xe4\xcc\x0d\xc8\xdf\x4b\
+\x09\x42\x11\x78\x34\x0d\xbf\xcf\x47\x5a\xd7\x39\x76\xf4\x38\x9d\
+\x5d\x5d\x34\x34\xd4\x33\x75\x6a\x4b\xe6\xd9\xcf\x97\xc6\xf3\xc1\
+\x1e\xa9\x0c\x0d\x0e\xb2\x71\xe3\xc6\x83\xeb\xd6\xad\xfb\xb8\xc3\
+\x7c\x09\xa4\x76\x7c\xa6\xdd\xcc\x75\x05\x9f\x2f\x00\x26\x7b\x5e\
+\x80\x04\x0c\x20\x0e\xc8\xed\xdb\xb7\xff\xf2\xb1\xc7\x1e\xfb\x49\
+\x2c\x16\x63\xf1\x92\x25\x6c\xdc\xb4\x09\xcb\xb2\x99\x12\x19\x1b\
+\xa3\xa4\xb4\x84\x69\xad\xd3\xa8\xa9\xa9\xa6\xba\xba\x9a\xaa\xea\
+\x6a\x6a\x6b\xeb\x58\xb2\x64\x31\x91\xd3\x0c\x0b\x55\x55\x45\xd7\
+\x75\x0e\x1d\x3a\x8a\x61\xe8\xac\x5c\xb1\x9c\x79\xf3\xe6\x12\x8b\
+\x27\xe8\x39\xd5\x4b\x22\x91\xb4\xff\x9c\xc3\x5c\x72\x26\x82\x64\
+\x27\x89\xe4\x4f\x01\xcb\xed\xf9\xb9\x7b\xfb\x3a\xb6\xe7\xd1\x30\
+\x0c\x22\xd1\x28\x96\x65\x71\xd1\x9c\x76\x2e\xbf\xfc\x32\x12\xf1\
+\x04\xdb\xb6\xef\x20\x1a\x8d\x9d\xd7\xe4\x91\xfc\x99\x48\xee\x67\
+\xae\x57\x52\xd2\xdb\xdb\x2b\x7f\xfe\xf3\x9f\x7f\xad\xb3\xb3\xf3\
+\x2d\x9c\x9e\xff\xc2\x8d\xad\x93\x36\x41\xf5\x42\x4c\x0c\x71\x41\
+\x90\x04\xd2\xc7\x8e\x1d\x7b\x23\x1e\x8f\xa3\x28\x0a\x8b\x97\x2c\
+\xe5\xa7\x3f\xf9\x77\x86\x87\x86\xf1\xf9\xfc\x54\x54\x56\xe2\xf1\
+\x78\xd0\x3c\x1e\x3c\x5e\x2f\x5e\xaf\x17\x8f\x47\x63\x64\x78\x98\
+\xb1\xa1\x21\xd2\x4e\xa2\x44\x2e\xa9\xaa\xca\xf0\xf0\x30\x47\x8f\
+\x1e\x63\xe6\x8c\x36\x56\xae\xb8\x14\x29\x71\x82\x45\xb1\x3c\x31\
+\x2e\x1d\xbf\x40\x6e\xc4\x2f\x6b\x34\x67\x19\x5d\xa8\xb2\xcf\x14\
+\x09\x34\x0c\x83\xb1\xb1\x31\x14\x21\x58\xbe\x7c\x29\x17\xcd\x9e\
+\xcd\xf0\xc8\x08\xc9\x54\xea\xac\x07\x86\xee\xb3\x15\x1a\x82\xb9\
+\x53\xd5\x04\x90\x48\x24\xac\x44\x22\x71\x14\x9b\xf9\xe9\xcd\x77\
+\xcd\x9a\xd4\xd9\xc9\x17\x6a\x66\x90\x04\x4c\x21\x84\x7e\xd1\x45\
+\x17\x2d\x09\x06\x83\x58\x96\x85\xa6\x69\xb4\xcd\x9c\xc9\xcf\x7f\
+\xfe\x73\x76\xee\xdc\x59\xf4\x87\xb1\x58\x8c\xce\x93\x1d\xc4\x63\
+\x31\xfa\xba\xbb\x49\xa7\x52\x99\xef\x54\x55\xa5\xab\xbb\x9b\xa1\
+\xa1\x61\xae\xb8\xfc\x32\x5a\x5a\x1a\x39\xd5\xdb\xc7\xf0\xc8\x88\
+\x13\x2c\xca\x32\x2b\xb7\x53\x15\x06\x87\x1c\x97\x01\xaa\xaa\xe1\
+\xf5\x7a\x9d\xc4\x94\x73\x1f\x4d\x25\x53\x29\xc6\x22\x51\xea\xea\
+\x6a\x99\x3d\x73\x06\x01\xbf\x1f\x55\x28\x19\xe6\xba\x9e\x46\xb7\
+\x97\xe7\x6e\xe3\x1a\x6c\xdc\xe7\xb6\xbb\xbb\xa2\xa2\x42\xad\xac\
+\xac\x6c\xff\xdd\x87\xdb\xd2\xd8\x20\x98\x54\xba\x90\x53\xc3\xcc\
+\x79\xf3\xe6\x2d\xbb\xf5\xd6\x5b\x3f\x1e\x2e\x29\xc1\x70\xf4\x71\
+\x45\x65\x25\x57\xae\x5e\x4d\xff\xe0\x20\xdf\xff\xde\xf7\x39\x7e\
+\xfc\x78\xde\x8f\x82\xa1\x10\xf3\x16\x2c\x20\x14\x0a\x91\x88\xc7\
+\x33\x20\x50\x14\x85\x93\x27\x3b\x10\x12\x56\xaf\xba\x02\x8f\xe6\
+\xa1\xb7\xb7\x3f\x13\x5a\xcd\xef\xa8\x85\xcc\x2c\x4c\xf4\xb4\x0d\
+\xbc\xde\x53\xa7\xd8\xb1\x7d\x3b\xdd\x5d\x5d\x19\xbf\x44\xde\xaf\
+\xce\x30\xac\x13\xc2\x9e\x34\x12\x8d\x46\x31\x0c\x83\x50\x30\x48\
+\x38\x1c\x22\xe0\xf7\xe7\xf4\xee\xf1\xbd\x3c\x97\x0a\x55\x80\xfb\
+\xde\x8d\x75\x54\x55\x56\xf2\xbe\xf7\xbd\xef\xb3\xb7\x3e\x33\x54\
+\xb9\xe5\x9e\x8b\xfe\xef\xc9\x08\x52\x14\x45\xdc\x7c\xf3\xcd\x5f\
+\x68\x6f\x6f\x0f\x7b\x7d\x3e\x62\xf1\x44\x5e\x83\x4e\x6f\x6b\x63\
+\x7a\x5b\x1b\x6f\xed\xdc\xc5\xd6\xad\x5b\x49\x27\x53\x4c\x9d\x3a\
+\x95\x2b\x56\x5d\x49\xfd\x94\x06\x84\x80\xdd\x3b\x77\x13\x8b\xc5\
+\xe8\xeb\xe9\xc1\x44\x50\x52\x52\xc2\x25\xcb\x96\x10\x8b\xc5\x18\
+\x1d\x8b\x64\x42\xab\xe3\x75\x68\x36\xa2\x97\xa5\xec\xbd\x35\x4d\
+\xe5\xe4\x89\x13\x74\x74\x74\xb0\x60\xfe\x02\xf6\xed\xdb\x47\x3c\
+\x9e\xa0\xfd\xa2\xf6\x4c\x04\xf2\x9c\x48\x08\x52\xe9\x34\xa6\x65\
+\xe1\xf3\x7a\x09\x04\x02\x08\x45\x21\x16\x8b\x4d\x10\xcc\x82\x33\
+\xc6\x17\x1c\x3b\xa0\xac\xbc\x9c\x8b\x2f\xbe\x78\xde\x75\xd7\x5d\
+\xf7\x67\xb0\xfb\x1b\xe7\xfe\x70\xa7\xa7\x0b\x26\x01\x16\x2d\x5a\
+\x74\xc9\xc5\x17\x5f\xfc\x01\x37\x93\x67\x22\x9a\x35\x7b\x36\xb3\
+\x2f\x9a\xc3\x8e\x1d\x3b\xf8\xc6\xd7\xbf\xce\xeb\xaf\xbe\x0a\x40\
+\x5d\x43\x03\xf3\x17\x2e\x20\x14\xb6\x25\x81\x30\x0d\xe6\xb4\xcf\
+\x26\x16\x8b\x33\x16\x89\x00\x13\xf7\xd0\x62\x49\x22\xd9\x06\xb7\
+\xbf\xec\xe9\x39\x85\x6e\x5a\x9c\xea\xed\x25\x99\xb6\xfd\x07\xe7\
+\x12\xab\x2f\x46\xba\xae\x93\x4c\x26\x49\xa7\xd3\xf8\x7d\x3e\x5c\
+\xd5\x37\x5e\xfc\x8f\xef\xf1\xb9\xba\x3f\x7b\x6c\xab\x4d\xbf\xdf\
+\xcf\xca\x95\x2b\xef\xbd\xf5\xb1\xd1\xf3\x74\x91\x4e\x4c\x17\x02\
+\x00\x42\x55\x55\xf5\xfa\xeb\xaf\xff\x42\x53\x53\x93\x5f\x51\xec\
+\x74\xe7\xd3\x35\xac\xc7\xe3\xe1\x93\x9f\xf9\x0c\x33\x66\xcd\x62\
+\xfd\xda\x75\xbc\xf6\x8a\x0b\x82\x7a\x1b\x04\xa1\x10\xe9\x54\x8a\
+\x37\x77\xec\xa0\xbf\xbf\x1f\x10\x45\x54\x76\x61\x44\x90\x22\xef\
+\xed\xc6\xb7\x24\x54\x57\x57\xe3\xf5\x78\x19\x1e\x19\x45\xd3\x54\
+\x2a\x2b\x2b\x73\xa2\x83\xce\xd9\xe7\x21\x70\x75\xc3\x20\x95\x4e\
+\x93\x4e\xeb\xf8\x7d\xbe\x1c\x75\x90\x7f\xdd\x42\x30\x64\x19\x2f\
+\xf3\xbe\x4f\xe9\x3a\xb5\xb5\xb5\x34\x35\x35\x35\x5f\x7e\xf9\xe5\
+\xb7\x03\xac\x7e\xea\xd8\x24\xa4\xb5\xd8\x74\x41\x46\x01\x73\xe6\
+\xcc\x59\x74\xc9\x25\x97\x7c\x60\xca\x94\x29\xc4\x93\xc9\xb3\x72\
+\x92\xa8\x9a\xc6\xc7\x3e\xf9\x49\xe6\x2d\x5c\xc8\xfa\xb5\x6b\xb3\
+\x20\xa8\xcf\x82\x20\x16\x8d\x72\xe2\xd8\x31\x92\xc9\x24\xc8\x33\
+\x65\xe5\xe4\x3c\x90\x2c\xdc\x2c\x1a\x1b\x1b\x99\x31\xbd\x95\xa9\
+\x2d\xcd\xcc\x9e\x35\x93\xa6\xe6\x26\xa4\xb4\x38\x73\x68\xf8\xf4\
+\x24\x84\x40\xd7\x75\x52\xe9\x14\xba\x61\xe0\xf3\xf9\x50\x15\xf5\
+\x8c\x12\x20\xdf\xf7\x9f\x95\x08\x86\x6e\x50\x5a\x5a\xca\x94\xc6\
+\x29\x2c\x5d\xba\xf4\x53\xd7\xff\xc7\xc9\x77\x1c\x01\xcc\xa5\xc9\
+\x06\x80\x00\x58\xb1\x62\xc5\x9d\x2d\x2d\x2d\x7e\x55\xd3\xce\x2a\
+\xff\x2d\x97\x3e\x74\xc7\x1d\x2c\x58\xb4\x88\x0d\x05\x20\xc8\x18\
+\x86\xb1\x18\x27\x8f\x1d\x23\x95\x48\x66\x74\xfd\xf8\xcb\xe7\x0e\
+\xf1\x44\x41\xc3\xdb\x55\x3f\x34\x8f\x87\x9a\xba\x5a\x6a\x6b\x6b\
+\xa8\xa9\xad\xc5\xe7\xf3\xe5\x88\xde\x7c\x06\x9d\x0f\xa5\xd3\x69\
+\x52\xa9\x14\xa6\x69\xe2\xf1\x78\x0a\x46\x05\xb9\x60\xb0\xb2\x86\
+\x9f\x65\x9f\x93\xbb\x07\x89\x61\x9a\x34\xd4\x37\x30\x7d\xfa\xf4\
+\x79\xcb\x97\x2f\xbf\xfe\x85\x1b\x5b\x27\xcd\x18\x9c\x74\x47\x50\
+\x75\x75\x75\xfd\x8a\x15\x2b\x3e\x58\x5e\x5e\x4e\x22\x99\x3a\xf3\
+\x2f\x8a\xd0\xed\x1f\xfd\x28\x2d\xd3\xa7\xe7\x83\xa0\xa1\x00\x04\
+\x27\x8e\x93\x4a\x26\x33\x0c\x2a\x0e\x84\x9c\x07\x93\x12\xcb\x72\
+\x1b\xd5\x96\x02\x96\x65\x39\x21\x64\x2b\xe7\xf3\x71\xbf\x3c\x2b\
+\x10\x14\x93\x72\x76\x70\x29\x85\x10\xe4\xb8\x8b\xad\xcc\x7d\xb2\
+\xb9\x0b\xd9\xbd\xfd\x7d\x76\x2f\xa5\x6d\x5b\x04\x82\x41\xea\xea\
+\xea\xb8\xf4\xd2\x4b\x6f\x5f\xfd\xd4\xb1\x49\x33\xde\x27\x13\x00\
+\x02\x60\xe1\xc2\x85\x57\xcf\x98\x31\xa3\x45\xd3\x3c\xe8\xba\x7e\
+\xce\x46\x95\xa2\x28\x8c\x8c\x8c\x72\xfd\x7b\x6f\xe4\xb2\xcb\x2f\
+\x67\xc3\xda\xb5\xbc\xfa\xca\x2b\x40\x01\x08\xa2\x31\x3a\x8e\x9f\
+\x20\x99\x01\x41\xbe\x87\x2f\xd7\xd3\x37\x5e\xdf\xe6\xa6\x8b\x65\
+\xed\x83\xf1\xa2\x98\x82\xef\xc6\x53\xe1\xf8\xbd\xf0\x77\x7a\x5a\
+\xc7\x30\xec\xa8\x6d\x32\x69\x4f\x54\xb5\xc1\x66\x51\x28\x0d\x72\
+\xa5\x84\x65\xe5\x4b\x0b\xcb\xb2\xa8\xae\xae\x66\x46\x5b\xdb\x35\
+\xd3\xa6\x4d\x9b\x38\xa1\xf2\x1c\x69\xb2\x25\x80\x7a\xd9\x65\x97\
+\xdd\x52\x59\x59\x49\x5a\xd7\xcf\x4a\xf7\x17\x92\x94\x92\xbe\xbe\
+\x3e\x66\xcd\x9a\xc9\x5d\x9f\xfe\x14\x17\x2f\x5d\xca\x86\xb5\xeb\
+\x0a\x40\xb0\x90\x50\x49\x98\x78\x2c\x46\xc7\xb1\x63\x24\x12\x31\
+\xce\xa4\xaf\xed\x86\xb4\x72\x44\xad\xe5\xec\x65\x66\x9f\x65\x40\
+\x31\x10\x14\x63\xd6\x44\x5e\xbc\xec\xe7\x96\xb4\x48\xa5\x52\x78\
+\x3c\x1a\xd1\x68\x2c\x33\xcc\x1c\xaf\x0a\xc6\x5f\xdb\x7d\x5e\x5b\
+\x0a\x18\x84\x42\x61\x9a\x5b\x5a\x4a\xda\xdb\xdb\x6f\x00\x98\xf7\
+\xe0\xae\x77\x6c\x0c\x4e\x26\x00\x64\x75\x75\x75\xc3\xdc\xb9\x73\
+\xaf\x0e\x06\x43\xb6\xee\x87\x62\x16\xd8\xf8\xcd\x39\x4f\x55\x14\
+\x86\x87\x87\x29\x2b\x2d\xa5\xbc\xbc\x8c\x68\x34\xc6\x9d\x7f\xf6\
+\x31\x16\xbb\x20\x78\xd9\x05\x41\x1d\xf3\x16\x2c\x20\x5c\x12\x26\
+\x99\x48\xd2\x75\xa2\x83\x44\x3c\x5e\xf4\xa1\x72\xed\x00\xd3\xb4\
+\x32\x01\x22\x8f\xc7\x83\xcf\x19\xaa\xf9\xfd\xfe\xcc\x3c\xbf\x5c\
+\x60\xd8\x8f\x35\x71\xef\xcf\xfb\xf3\x05\xcc\xcf\xfd\x9d\x29\x2d\
+\x4c\xc3\x40\xd3\x34\xfa\xfb\x07\x1c\x07\x52\xbe\xc5\xef\xea\x7d\
+\x97\xf1\x85\x80\x70\xd5\x55\x7d\x7d\x3d\xcb\x96\x2d\xbb\x6e\xe9\
+\xf7\x0f\xf8\xce\x8f\x4d\xf9\x34\x29\xba\xc4\x09\x05\xcb\x59\xb3\
+\x66\x2d\x6f\x69\x69\xae\x91\x52\x9e\xdb\x54\x0b\xa7\xa1\x2c\xcb\
+\x62\x68\x68\x98\x39\x17\xb5\x93\x70\xa6\x7d\x21\x04\x77\x7e\xec\
+\x63\x00\xac\x5f\xb7\x8e\x2f\x4a\xb8\xec\x8a\x95\xd4\xd5\xd7\x01\
+\x0b\xd8\xbb\x6b\x17\x91\x48\x94\xae\x93\x1d\x4c\x69\x6e\xc6\x1f\
+\x08\x64\xbc\x7d\x2e\xb9\x63\xf1\x70\x28\x44\x6d\x6d\x1d\xf1\x78\
+\x34\x11\x89\x44\x8e\x0e\xc7\x87\x4e\x8d\x8d\x8d\x0d\x05\x02\x81\
+\x70\x79\x79\x79\x63\x69\x69\x69\x4b\x55\x65\x65\x79\x22\x99\xc4\
+\x9d\xf2\x9f\xe5\xfd\xd9\x83\x20\xcb\x5c\x9b\xb1\x48\x48\x1b\x3a\
+\xc1\x80\x9f\x81\x81\x01\xd2\xe9\x94\x93\x58\x92\xab\x7e\xc6\xef\
+\xf3\x87\x85\x16\xa6\x69\x51\x59\x59\xc5\xdc\xb9\x73\x2f\x69\x68\
+\x68\x68\x7a\xe6\xcf\xab\x8f\xbc\xab\x26\x86\xcc\x98\x31\x63\x65\
+\x45\x45\x25\xba\xa1\x9f\xb3\x67\x5d\x51\x14\x46\x47\x47\x33\x63\
+\xe7\x64\x2a\x95\x27\x21\x3e\xf2\x67\x7f\x86\x94\x92\xf5\xeb\xd6\
+\x72\x2f\xf7\xb1\xf2\x8a\xcb\xa9\xab\xaf\x43\xb0\x80\x3d\xbb\x76\
+\x11\x89\x44\xe8\xee\xe8\xa0\xa1\xb9\x09\xbf\x3f\x9b\x4c\x62\x59\
+\x16\xa1\x60\x90\xba\xfa\x3a\x0e\x1f\x3a\xf4\xca\x0f\x7f\xf8\x83\
+\x27\x37\x6d\xda\xf4\xda\xbe\x7d\xfb\x7a\x0c\xc3\x48\xea\xe9\x74\
+\x5a\xd5\x34\xd5\xeb\xf5\x86\x9a\x9b\x9b\x2b\xaf\xbf\xfe\xfa\x85\
+\x1f\xfc\xe0\x07\x6f\x9e\x33\x77\xee\x7b\xa4\x25\xbd\xaa\xa6\x64\
+\x0c\xb8\xd3\x4d\xe5\xca\x1e\xe7\x4b\x80\x8c\x18\x77\x3e\xf3\xfb\
+\x03\x0c\x0d\x0d\x53\x5b\x5b\x93\x09\x1f\x67\x0d\xc0\xe2\xfe\x80\
+\x2c\x98\x40\x51\x24\x53\xa7\x4e\x2d\x6f\x6f\x6f\xbf\x06\x06\x8e\
+\x9c\x6b\x21\x89\x42\x9a\xb4\x7c\x80\xe6\xe6\xe6\x69\x0f\x3e\xf8\
+\xe0\x73\x57\x5f\x7d\x75\x5b\x2a\x7d\xee\xfa\x5f\x55\x55\x8e\x1f\
+\x3f\x41\x5d\x5d\x1d\x95\x15\xe5\x99\xd8\x41\xe6\x41\x9d\xfd\xcf\
+\x7e\xf2\x13\x76\x6c\xdf\xce\xbd\xf7\xd9\x20\x00\xe8\x3b\xd5\x9b\
+\x01\x81\x3f\x10\x70\x40\x60\x97\x86\x69\x68\xa8\x27\x1a\x89\xec\
+\x7d\xf8\xe1\x87\x37\xfc\xf0\x87\x3f\xfc\x6d\x2c\x16\x1b\xc6\x56\
+\x7d\x12\x3b\xab\x26\xf3\x08\xce\x66\xa9\xaa\xea\xbf\x6a\xf5\xea\
+\x65\xd7\xae\xbe\xfa\x7f\x5d\x71\xe5\x15\x57\xcd\x99\x37\xdf\x91\
+\x22\xe3\x3d\x85\xf9\xcc\x93\x79\x52\x20\xab\xc3\x6d\xf5\x63\x18\
+\x3a\xba\x6e\x30\x30\x30\xc8\xb4\x69\x2d\x45\x7b\x7d\xf1\xde\xef\
+\xee\x4d\x84\x50\x40\x5a\x3c\xff\xfc\xf3\x5d\xeb\xd6\xad\xbb\xf3\
+\xf1\x8f\x04\x36\xc3\x05\x4e\x08\x69\x6d\x6d\x6d\x9b\x33\x67\xce\
+\x6a\xd3\x34\x35\x31\xbe\x7c\x8d\x25\x84\x28\xbd\xe1\x86\x1b\x3e\
+\x71\xcd\x35\xd7\xcc\x2b\x29\x29\x25\x3a\x81\x0f\x7c\xc2\x87\x10\
+\x60\x18\x26\x27\x3b\x3a\x98\x3d\x6b\x56\xd1\x99\x3f\x32\x73\xae\
+\xe0\x3f\xce\x02\x04\xf5\x8d\x8d\xb4\xb7\xcf\xe6\xb9\xe7\x9e\x7b\
+\xf4\xbe\xfb\xee\xfb\xca\xdb\x6f\xbf\xdd\xe9\x5c\xc2\x70\x36\x8b\
+\xfc\xe8\x9a\xe2\x6c\x9a\xb3\x09\xa0\xe4\x4f\x6e\xb9\xe5\x9e\xfb\
+\xef\xbf\xff\xaf\xda\xe7\xcc\x51\x0b\xeb\x44\x17\xf6\xdc\xac\xde\
+\x26\x8f\xf9\xf6\x94\x30\x7b\x5a\xb9\x69\x9a\xf4\x0f\x0c\x52\x53\
+\x5d\x45\x30\x18\xc8\xb3\x05\x26\x02\x81\x2d\x28\xb2\x06\x61\x55\
+\x65\x25\x63\x63\xa3\x6c\xdf\xbe\x3d\xb6\x69\xd3\xa6\x9f\x74\x76\
+\x76\xbe\xc9\x78\x8d\xab\x08\x21\xc6\xf6\xee\xdd\xfb\x9b\x93\x27\
+\x4f\x4e\x58\xdf\xf8\x8c\x2a\x60\xe6\xcc\x99\x8b\xbe\xf5\xad\x6f\
+\x3d\xbe\x72\xe5\xca\x69\x91\x48\x84\x64\x32\x59\xa4\x17\x48\x7c\
+\x3e\x1f\x35\xd5\xd5\xf4\xf6\x0f\x9c\xe9\x92\xe3\x48\x08\x85\x48\
+\x64\x94\x60\x20\x98\xcd\xc0\xcd\x3f\x21\xf3\xef\xa4\x65\x71\xfb\
+\x47\x3f\x8a\x94\x92\x0d\x6b\xd7\x21\xa5\xe4\xf2\x2b\xaf\xa0\xb6\
+\xbe\x8e\x79\x2c\x60\xf7\xae\x5d\x44\x23\x11\x7a\xbb\xbb\x39\x7e\
+\xfc\xd8\x33\x7f\xfa\xa7\x7f\xfa\x97\x86\x61\xc4\x70\x72\xe8\x00\
+\x73\xe3\x53\x4f\xe5\x87\x55\x5d\x8e\x01\xef\xbd\xf9\x66\x03\x1b\
+\x08\x5e\x20\xfa\xeb\x27\x9e\xf8\x87\x40\x30\xd8\xff\xd0\x43\x0f\
+\xfd\x7d\x55\x75\x8d\xe6\x26\xb4\x14\x52\xfe\x08\x22\x77\x64\x61\
+\x33\xdf\xb5\x43\x4c\xd3\x44\x53\x55\x22\xd1\x28\xc1\x60\xc0\x01\
+\x4a\xf6\x1a\xb9\x20\xc8\x32\x3e\x2b\x5d\x4c\xd3\x24\x9e\x88\xd3\
+\xd4\xd4\x44\x38\x1c\x0e\x2d\x5a\xb4\xe8\x2f\x0a\xd5\x93\x94\x92\
+\x70\x38\x8c\xd7\xeb\x65\xe3\xc6\x8d\x2f\x36\x37\x37\x7f\xa0\xa3\
+\xa3\x63\xb0\xd8\x73\x9f\x11\x00\xb7\xdd\x76\xdb\xe7\xde\xfb\xde\
+\xf7\x4e\x53\x55\x95\x8a\x8a\x8a\x09\x75\x21\xc0\xc0\xe0\x60\x66\
+\x2a\xf4\xb9\x90\x10\x82\x78\x3c\x4e\x28\x1c\xc2\x34\x0c\x44\x61\
+\x66\x8d\x0b\x08\x37\x5b\x47\x4a\xee\xf8\xe8\x47\x01\xf8\xda\xba\
+\xf5\x00\x19\x10\x2c\x10\x0b\xd8\xb5\xd3\x06\x81\xe6\xf1\x5c\xfa\
+\x2f\x8f\x3c\x72\xc9\xa7\x3f\xf3\x99\x4d\x80\xbe\xf1\xa9\xa7\xce\
+\x98\x4c\xb1\xf1\xc9\x27\x2d\xc0\x7a\xef\xcd\x37\xbb\x2a\x22\xf0\
+\x9f\xff\xf9\x9f\x3f\x98\x31\x63\x46\xed\x3d\xf7\xfc\xe5\xbd\x36\
+\x6f\x72\x8d\x37\xc1\xf8\x9e\x5b\x38\xdc\xb4\x0d\x38\x7b\x6f\xa0\
+\x69\xaa\x63\xe4\xe6\x06\x8a\x9c\x2b\xe6\x0d\x09\xc7\x1b\x82\x52\
+\x4a\x46\x47\x47\x51\x84\x42\x5d\x5d\x2d\x35\xd5\x35\xe3\xfa\x7e\
+\x2e\x8f\xae\xbb\xee\xba\x2b\xff\xed\xdf\xfe\xed\x16\xe0\x47\xc5\
+\xfe\xef\x69\x01\xe0\xf1\x78\xc4\x97\xbf\xfc\xe5\xf0\x91\x23\x47\
+\xa8\xa9\xa9\xc5\x30\x8d\xe2\xcc\x95\x10\x8f\xc7\x89\x44\xa3\xe7\
+\x15\x4d\xb3\x2c\x8b\x64\x2a\x45\x55\x55\xa5\x9d\xd3\x3f\x91\x5a\
+\x92\x76\xe5\x4f\x0b\x1b\x34\xb7\xdf\x79\x27\xe0\x82\x40\x72\xf9\
+\x95\x57\x52\x53\x57\xc7\x82\x85\x0b\xd9\xbd\x73\x17\x91\xc8\x58\
+\x69\x43\x5d\xfd\x8f\xff\xfb\x89\x27\x3e\xa4\x69\xda\xb3\xe7\xf2\
+\x4c\x4f\x3d\xbd\xc9\xbc\xf1\x86\xeb\x5d\xb7\x5c\xe0\xe1\x87\x1f\
+\xde\x70\xd5\xaa\xab\x96\x2c\x59\xb6\xf4\xaa\x78\x26\xb4\x5d\x28\
+\xbe\xf3\xfd\x0a\x6e\xaf\x77\x0a\x4d\x66\x8c\x3e\x21\x04\x86\x69\
+\x92\x4e\xa7\x9d\x12\xb4\x16\x76\x0a\x98\x95\xc3\xf4\x89\xfd\x0e\
+\x8a\xa2\x32\x3c\x32\x42\x3c\x1e\xa7\xb4\xb4\x14\x55\x53\x11\x6e\
+\x80\x2c\x67\xf8\xa5\x2a\x0a\x27\x4f\x9e\x44\x4a\x59\xe1\xdc\x77\
+\x9c\xfe\x3e\x93\x04\x10\x96\x65\xc9\x8e\x8e\x0e\x74\x23\xfb\x07\
+\x8a\x9e\x28\xce\xaf\xa0\xb2\x1b\x3c\x41\xca\x4c\xc9\x98\x62\x76\
+\x89\x0b\x2b\xcb\x51\x07\xee\x39\xb7\xdf\x79\x27\x12\xd8\x90\x91\
+\x04\x57\x52\x53\x57\xcb\xfc\x85\xf6\xe8\x60\x6c\x6c\xac\xdc\xe3\
+\xf5\x3e\x2a\xa5\xbc\x4d\x08\xf1\xdc\xb9\x3c\xdb\xb3\x3f\xfc\x9e\
+\xbc\xee\x93\x9f\xd1\x01\xa1\xeb\xba\xfe\x8d\x6f\xfc\xd3\x3f\xfe\
+\xfb\xcf\x7e\x76\x29\x48\x7f\xa1\x05\x9f\xed\xa1\x90\xef\x64\xb2\
+\xb0\x2c\x33\xd3\xdb\xdd\xe4\x53\x69\x49\x92\xa9\x24\xc1\x40\x30\
+\x3b\x5c\x2c\xa8\x62\x5e\xcc\xe1\xe4\x76\x30\x55\x55\xd1\x0d\x83\
+\x81\xc1\x7c\xc9\xee\x7e\xaf\x28\x0a\xe9\x74\x8a\x9e\x9e\x9e\xd3\
+\x76\xca\xd3\x72\xcc\xbd\xb9\x9b\x3d\xeb\xa6\x49\x17\xdb\x84\xa2\
+\xe4\xe5\xbf\x9c\xed\xe6\x26\x53\xd8\x0d\xa3\xb8\x37\x1e\xb7\x65\
+\x2c\xb6\x9c\xf8\xba\xfb\xf9\xed\x1f\xf9\x08\x8b\x97\x2c\x61\xc3\
+\xda\x75\xbc\xf4\xe2\x8b\x00\xd4\xd4\xd5\x32\x6f\xc1\x02\x4a\x4b\
+\x4b\xd1\xd3\xe9\x72\x69\x5a\x8f\x49\x29\xaf\x3d\xdd\xff\x2d\x46\
+\x6f\xdc\x32\x5b\x62\x1b\x8d\xf2\xa9\x8d\x1b\x5f\xdb\xb3\x67\xcf\
+\x33\x7e\xbf\x3d\x27\xc0\xee\xd5\x66\xc6\xc1\x64\x9a\xd2\xd9\x5b\
+\x39\x9f\x19\x18\x86\xe9\xb4\xa3\x70\x9c\x4d\x76\x52\x4a\x2a\x99\
+\xca\x91\x14\x36\x68\x4c\x53\x62\x59\x66\xa6\x96\x80\xcb\xfc\xac\
+\x7b\x3b\x3f\x71\x35\x97\x07\xf6\x94\x37\x15\x4d\xb3\xdf\x2b\x62\
+\x7c\x96\x53\x21\x9d\x97\x27\xb0\x28\x23\xdf\x01\x25\x93\xb6\xab\
+\xd4\x55\x84\x56\xe1\x26\x25\x58\x96\x53\xf8\x5b\xe4\x31\xdf\xb5\
+\x0f\x6e\xbb\xe3\x0e\x2e\x5f\xb5\x8a\xaf\xad\x5d\xc7\x4b\x9b\x27\
+\x17\x04\x7b\xfe\x74\xa6\x09\xe8\xa6\x69\xc6\x7f\xf5\xab\x5f\xfd\
+\x57\x49\x49\x09\x86\x91\xcb\x78\xd3\x61\x9a\x91\xa3\xf3\x0d\xc7\
+\xea\xcf\x8a\x7d\x77\x22\x0a\x80\xa2\x2a\xa4\xd3\x7a\x8e\x7d\x60\
+\xe6\x6c\x72\x02\xc6\x43\x61\xa4\xb3\xd8\xf1\xb9\xe4\x37\x9e\x35\
+\x00\x26\x8b\xd9\x85\x24\x84\xc0\x34\x4c\x54\x55\xcd\xce\xf9\xb7\
+\xc3\x76\xd9\x0d\x50\x9c\x3a\x7a\x6e\x41\x26\x17\x14\xb9\x46\xd9\
+\xdd\x5f\xf8\x9f\x66\x24\x1a\xfd\xf5\xd7\xd6\x4d\x3e\x08\x70\x4c\
+\x8f\x4d\x9b\x36\xed\x18\x19\x19\x19\x01\x32\xcc\xcf\xf6\x72\x18\
+\x19\x1e\x61\x74\x74\xd4\x4d\x3c\xca\xa8\xc6\x5c\x26\xd9\x95\x4e\
+\xc0\x30\xb3\x3d\xbd\x38\xd3\xc7\x97\xb7\x2f\xac\x99\x50\xec\x38\
+\x23\x25\xce\xc2\x1e\x7b\x57\xac\x17\x60\x5a\x86\x9d\xd1\xeb\xea\
+\x3c\xc6\x03\xae\xb3\xa3\x83\xa3\x87\x0f\x73\xf8\xe0\x41\xfa\xfa\
+\xfa\x6c\x51\x0a\x19\x49\xe0\xa4\x8b\xc7\x3a\x4f\xf5\xfc\x75\x6f\
+\x6f\xef\xd7\x6d\x10\x6c\x06\x26\x0d\x04\x12\x90\x87\x0e\x1d\x1a\
+\x88\x46\x22\xc7\x00\xa7\x8a\x89\x89\xe1\xd8\x47\x47\x8f\x1c\xa1\
+\xbf\xaf\x8f\xbe\x53\xa7\x38\x71\xec\xb8\x33\x03\x39\xbf\x97\xba\
+\x60\x50\xdc\x24\x11\xfb\xcb\x71\x11\xcc\x6c\xa2\xeb\xc4\x8c\x1f\
+\xc7\x70\xb2\x60\x29\x96\xee\x5e\x8c\xde\x15\x00\x00\xdb\x73\x66\
+\x15\xb1\x7a\x85\x10\x8c\x8c\x8c\xd0\xd9\xd9\x45\x63\x53\x13\x0d\
+\x53\xa6\x70\xe4\xf0\xe1\x8c\xaf\xde\x55\x03\x8a\xa2\x90\x4a\xa6\
+\x7a\xbb\xbb\xbb\xa3\xaf\x6d\xdf\xb6\xa6\xaf\xaf\x6f\xc3\xd7\xd6\
+\xad\xe7\xc5\x1c\x10\xcc\x5f\xb8\xf0\xbc\x41\xb0\xff\xe3\x73\x24\
+\x20\x85\x10\xb1\xb4\xae\x77\x43\x56\x02\x80\x5d\xc0\xa1\xbb\xbb\
+\x9b\xba\x86\x06\x14\x55\xa5\xb3\xb3\x8b\x58\x2c\x56\xb4\x7c\x9d\
+\xfb\x3e\x77\x54\x50\x0c\x04\x67\x62\x7c\xe6\xb7\x39\x6a\x21\x5f\
+\xfc\xff\x5f\x22\x01\x00\xe4\x38\x1f\x7a\x56\x24\xea\xe9\x34\x42\
+\x51\xe9\xe9\x39\x45\x77\x4f\x2f\x42\x51\xb3\xd9\xbb\x6e\x2f\x92\
+\x12\x21\x30\x55\x55\x95\x80\xf4\x7a\xbd\x5f\xec\xeb\xeb\xdb\xf0\
+\xf5\x75\xeb\x79\xf1\x05\x1b\x04\xd5\xb5\x35\xef\x08\x04\x80\x34\
+\x4d\x33\x99\x4e\xa5\x46\x5d\x5d\xee\xf6\x6a\x45\x08\x3c\x5e\x1f\
+\xaf\xbd\xf6\x3a\xa3\xa3\x11\x4a\x4b\xcb\x10\xb8\xcc\x76\x19\x97\
+\x55\x05\x96\x94\x13\xf6\xd0\xf1\x40\x18\xcf\x78\x17\x1c\xf6\x77\
+\x45\xc4\xff\x59\xd2\xbb\x67\xbd\x00\x47\xd6\xdb\x56\x72\x7e\xe3\
+\x94\x97\x97\x63\x59\x96\x1d\x1f\x90\x50\x51\x5e\x86\xd7\xeb\xcd\
+\x1b\x96\x5a\xf6\x50\x2a\xa0\xeb\x7a\x06\xd4\x0e\x08\xf8\xda\x86\
+\xf5\xf7\x02\x5c\xb9\x7a\x55\x06\x04\xbb\x77\xee\x74\x87\x88\x8f\
+\xa1\x88\xdb\x04\x9c\x71\x88\xb8\xf7\x7f\xce\xb5\x2e\xfd\xf1\x49\
+\x7f\x30\x18\xac\x70\x47\x47\x6e\xa8\x39\x10\x0c\xd2\x38\xa5\x81\
+\xa6\xa6\x26\x87\xd1\xf6\x67\x20\xc7\xf5\x52\x29\x25\xaa\xa2\x4e\
+\xd4\x04\xf9\x7d\x78\x1c\x33\x73\xa7\xb1\x8d\x3b\x3b\xef\x77\x67\
+\x03\x84\x77\x09\x00\x04\x9a\xa6\x38\x13\x37\xb5\x02\x3f\x80\x44\
+\x0d\x04\xa8\xab\xaf\xc3\x72\x2d\x6a\x67\x7e\x5f\xae\x94\x30\x0c\
+\x83\xf2\xb2\xb2\x9a\x85\x0b\x17\x96\xbe\xfa\xea\xab\xae\xdf\x1f\
+\xaf\xd7\xfb\xc5\xfe\x0c\x08\x24\x57\xae\xbe\x2a\x0b\x82\x5d\x3b\
+\x19\x1b\x75\x40\x20\xc4\x6d\x42\x9c\x19\x04\x86\x61\xf8\x55\x4d\
+\x6b\xb4\x2c\x7b\x4c\x0f\x20\x84\x44\xd5\x34\xa6\x34\x4e\xc9\x8c\
+\xe7\x15\x45\x2d\xb0\xcc\xf3\x7b\xa7\x9d\x82\x9e\x05\x50\x2e\x59\
+\x8e\xea\xcb\x28\x02\x01\x52\x4e\xcc\xf8\xfc\xd1\x81\x73\x7c\x96\
+\x52\xe0\xf7\xa3\x02\x4e\x13\x70\x92\x52\x3a\x4c\x77\xac\x63\x45\
+\x45\x55\x73\x7d\x0e\x76\x39\x17\xaf\xd7\x87\xcf\xef\xc7\xe7\xf7\
+\xa1\x69\x9e\x9c\x42\xd0\xf6\x5f\x30\x0c\x83\xd2\xb2\xd2\xc0\xca\
+\x95\x2b\x2f\xba\x6a\xe5\xe5\xf2\x77\xaf\xbc\x9c\x69\x01\x07\x04\
+\x1b\xbe\xb6\x61\x03\x9b\x5f\xf8\x1d\x90\xa3\x0e\xca\x1c\x75\x20\
+\xe5\x63\x52\x72\x5a\x75\x20\xb1\x58\x79\xc9\x92\xa6\x92\x80\x6f\
+\xa6\x61\x18\xce\xb8\xde\x11\xed\x64\xc7\xe5\x9a\xa6\x8d\x33\xfe\
+\x5c\x15\xa0\x28\x02\x89\xed\x22\x3e\x9d\xe3\x2c\x5f\x0d\x16\x5f\
+\xe3\xa8\xd8\xfb\xcc\x31\x67\x87\x81\xc9\x01\x40\x11\xc7\x4d\xde\
+\x76\x86\x73\x54\x55\xc1\x30\x4d\x87\xe1\xae\x73\x43\xc9\x6c\x6e\
+\xcd\x9e\xac\x43\x4a\x19\xe7\xf8\x50\x14\x85\xc8\x58\x44\xac\x58\
+\xb1\x62\x75\xb1\x47\x74\x41\xf0\xf5\x0d\x1b\xd8\xfc\xc2\x0b\x00\
+\x54\xd7\xb8\x20\x28\x3b\x23\x08\xda\xff\x75\x9f\x08\x26\xd5\xbb\
+\xfe\xcf\xa2\xe0\x2f\xf5\x87\x3f\x17\x88\xfc\x7c\x03\xc6\x48\x6f\
+\x01\x83\xf3\x45\x7d\xee\xf0\x2f\x3b\xa4\x53\x90\x96\xed\xfa\x55\
+\xd5\xd3\x37\xbf\xc4\x96\x06\x66\x46\xd5\x4d\xcc\x78\xf7\x7d\xd6\
+\xde\xb8\xd0\x12\xa0\x90\xc1\xe7\x7d\x19\x89\xdf\xe7\xc7\xcc\x4c\
+\xc9\x12\x0e\xc3\xb3\x5b\x16\x10\xf9\xef\x73\xbd\x93\x9a\xa6\x31\
+\x3a\x36\xc6\x8d\x37\xde\x78\xf3\x48\x2c\x3a\xe5\xaa\x95\x97\x8f\
+\x7b\x30\xaf\xd7\xfb\xc5\x81\xbe\x0a\xfd\x5d\x9b\x00\x00\x20\x00\
+\x49\x44\x41\x54\xbe\x0d\x5f\x5f\x5f\x08\x82\x05\x94\x15\x80\x20\
+\xb7\xf9\xcc\x64\x8c\x8e\x35\xb7\x3c\x30\xf5\xb3\xff\xfc\xc3\xd6\
+\x3f\xff\x87\x19\xf5\x8b\xaf\x62\xd6\xe1\xc3\xa4\xff\xf9\xff\x41\
+\x1f\xec\xca\x63\x72\xf1\xba\xc4\xd9\xde\xe9\xf6\x68\xd3\x59\x23\
+\xe0\x6c\xdb\xc8\xcc\xab\x32\x3a\x31\xe3\x33\xaa\x41\x40\xf1\x72\
+\x9a\xf9\x74\x56\x00\x90\x52\x22\x2d\x2b\x7f\x9b\xc0\x57\x7d\x3e\
+\xe4\xf1\x68\x19\x77\x28\x90\xd7\xfb\x5d\x46\x67\x55\x43\xee\x7b\
+\x35\x23\x21\x54\x55\xc5\xb2\x4c\x74\xc3\x68\xf9\xf8\xc7\x3e\xf6\
+\x29\x80\x5c\x35\x90\xb9\x97\xd7\xfb\xc5\xfe\xfe\xfe\x0d\x5f\x5b\
+\xbf\x81\xdf\xfd\x36\x0b\x82\x79\x0e\x08\x8c\x74\xba\xdc\x92\xf2\
+\x31\x4b\xca\x6b\xa5\x22\x30\x13\x11\x4a\x66\x2d\x7b\xa8\xf1\xbe\
+\xef\x3f\xa4\xb4\xcc\x86\x93\xc7\x90\x91\x51\x3c\xd5\xa5\x34\x8f\
+\x8d\x92\xfe\xce\x83\xe3\x40\x50\x7c\x53\xf2\x0c\x5c\xd3\x34\xf1\
+\x7a\xbd\x67\xdd\x76\x2e\x08\x8c\x82\xec\xa4\x62\xd9\x43\xf6\x17\
+\x38\xaa\xe6\xf4\xd7\x3f\x23\x00\x14\x45\x51\xbc\x5e\x2f\xc1\x40\
+\x00\xbf\xcf\xe7\x6c\xfe\xbc\xcd\x5d\xa9\xe3\x7c\x60\x20\xa5\xb4\
+\x27\x4e\x40\x26\x60\x62\x1b\x50\x4a\x66\xcb\xd5\xb5\xf9\x6a\x20\
+\xcb\x7c\x7b\x59\x18\x85\xb1\xb1\x31\xda\x67\xcf\xfe\xcb\x03\x47\
+\x0e\xcf\x2f\xb4\x05\x5c\xf2\x7a\xbd\x5f\x1c\xe8\xef\xdf\xf0\xf5\
+\xf5\xeb\xc7\x81\xa0\xb4\xbc\x1c\x43\xd7\xcb\xa5\xe4\x31\x6d\x74\
+\xec\xba\x8a\xf6\x4b\xef\x9f\x76\xdf\x23\x0f\x8a\xb1\x28\xfc\xee\
+\x19\xe4\x8e\xd7\x48\xbc\xfe\x22\xe9\xee\x0e\xbc\x65\x01\x9a\xc7\
+\x46\x48\x7d\xfb\x01\x8c\xa1\xae\xbc\x61\x5e\xb6\x67\xe6\x6f\xa6\
+\x69\x22\x9d\xfc\x00\x7b\xc2\xc8\xb9\xb5\x97\x65\x59\xe8\x86\xe1\
+\xa8\x4c\x0d\x9f\xcf\xe7\x6c\x5e\x7b\xef\xf5\xe1\xf3\x7a\xf1\x7a\
+\x3d\x84\x42\x21\xbc\x76\x71\xee\x09\xf9\x3c\xe1\x28\x40\x08\x21\
+\x14\x45\x91\xc3\xc3\xc3\xf1\xea\xea\x6a\x4a\x4b\x4b\x1d\xcf\x55\
+\xfe\x13\x0b\x47\xac\xa5\x52\x29\xc6\x22\x91\x1c\x31\x75\xf6\xa4\
+\x28\x0a\x3e\xaf\x97\x58\x2c\x46\x69\x69\x49\x46\x6c\xe6\xde\xc5\
+\x76\xab\xda\xe2\x33\x37\x99\x52\x51\xdc\xd4\x2b\x05\x55\xb5\x67\
+\xe4\xb4\xcf\x99\x53\xb9\xe6\xbe\xfb\xfe\x65\xdd\xfa\xf5\x37\x5d\
+\xb5\xf2\xf2\xa2\xd9\x30\x5e\xaf\xf7\x8b\x03\x03\x03\x7c\x7d\xbd\
+\x3d\x3a\xb8\xea\xea\xab\x33\x20\xd8\xb5\x67\x2f\x81\x03\x27\xcb\
+\xe7\x8e\x59\x4f\x95\xac\xf9\xa6\x26\x46\x63\xf0\xda\x0b\x98\x07\
+\x76\x32\xbc\x67\x07\xaf\xbf\xbe\x97\xea\x70\x90\x79\x97\x4e\xc5\
+\x57\x1e\xa0\x79\x64\x84\xce\x7f\xfe\x32\xfc\x8f\xbf\xc7\x57\xd3\
+\xe4\xb4\xdf\x78\xef\x9c\xa2\xd8\x00\x70\x5d\xde\x9a\xa6\x9d\x77\
+\x59\x19\xbf\xdf\x4f\x30\x18\x40\x11\x85\x82\xde\x51\x07\x8a\x6d\
+\x6b\x54\x54\x54\x60\x9a\xe6\x84\x35\x79\x4f\x2b\x01\x2c\xcb\x12\
+\xbf\xfd\xed\x6f\x7f\xb6\x7d\xfb\xf6\xfe\xde\xde\x53\x8c\x8c\x0c\
+\x33\x32\x9c\xbf\x0d\x0d\x0d\x32\x32\x32\x8c\x10\x82\xd2\xd2\xd2\
+\x8c\x98\x3b\x17\x92\x52\x52\x52\x12\x26\x12\x89\xb9\x9f\x8c\xab\
+\xed\x9f\xbf\xea\x57\x56\xc7\xe6\x4b\x07\xdb\xbd\xea\xf1\xfa\xb8\
+\xfd\x8e\x3b\x2e\xfb\xdb\xaf\x7e\xf5\x07\x9d\xa7\x7a\x26\x9c\x4b\
+\xe7\x80\x60\xc3\xd7\xd7\x6f\xe0\x85\xdf\xfe\x16\xb0\x27\x8d\x2e\
+\x9d\xd9\xce\x82\xe1\x08\xa5\x77\x7c\x48\x13\x5a\x00\xde\x7a\x0b\
+\xf3\xed\x7d\xa4\x76\xef\xe0\x77\x5b\xf7\xf2\xd2\x40\x84\xb7\x4e\
+\x0e\xb1\xe7\x95\xe3\x90\x30\xf0\x95\x07\x68\x1a\x1d\x21\xf5\x9d\
+\x2f\x91\x1e\xe8\x2c\x62\xf8\x09\x67\x28\x67\x83\x38\x95\x4e\xe3\
+\xf3\x9d\x5f\x56\xb7\x94\xd2\xae\xa4\xa2\x69\xa4\x93\x49\x22\x91\
+\x88\x11\x8d\x46\xad\x58\x2c\x46\x3a\x9d\x26\x9d\x4e\x11\x8b\xc5\
+\x18\xe8\xef\xe7\xf8\xf1\xe3\xbc\xf2\xf2\xcb\x6f\xec\xdb\xb7\xef\
+\x19\x61\x57\x71\x1b\x47\x13\xe6\x04\x0a\x1b\xbe\x1e\xc0\xd3\xd2\
+\xd2\xb2\x68\xce\x9c\x39\x37\x0b\x21\x4a\xa5\x9d\x02\x93\x4b\x66\
+\x6d\x6d\x6d\xd5\x2d\xb7\xdc\xf2\x81\xc5\x8b\x17\xfb\x2c\x89\xbb\
+\xd2\xf6\x39\xff\xb1\xe3\xc7\x4f\x70\xd1\x45\xb3\x09\x06\x83\x79\
+\xfa\xd1\x8d\xb9\xe7\x1e\xe7\x66\xd2\x14\xa6\x5e\x99\xa6\x49\x28\
+\x18\x24\x18\x0c\xb0\x77\xcf\x9e\x57\xef\x5b\xb3\xe6\xb3\x9a\x64\
+\xef\x44\xf7\x4e\xa7\xd3\xeb\xab\xab\xab\xef\xbd\xe7\xfe\x35\x5c\
+\x7d\xd9\xe5\xf0\xd2\x56\x98\xda\x04\x4d\xcd\xb0\x75\x1b\x6c\x79\
+\x99\xf8\xd6\x17\x30\x07\x3b\x39\xd1\x37\xc8\xcf\xf6\x75\xa0\x22\
+\x68\x14\x2a\x8b\x1a\x2b\x98\x73\x69\x33\x4a\x28\x80\xea\x29\xe3\
+\xa8\x02\xc1\x7b\x37\xa0\xf9\x43\x14\x1a\x6b\xba\x6e\x38\x31\xfa\
+\x5e\xca\x2b\xca\xcf\xc9\x06\xc8\x25\xbf\xcf\x87\x65\x1a\xe6\xf1\
+\xe3\xc7\xad\xe1\xe1\xe1\xe1\x91\x91\x91\x9e\x58\x2c\xb6\xe7\xc8\
+\x91\x23\x1d\x03\x03\x03\xc9\x48\x24\x42\x3a\x9d\xc6\x34\xcd\xe8\
+\xee\xdd\xbb\x9f\xee\xef\xef\x3f\x0e\xa4\xa5\x94\x7a\xe1\xb5\x4e\
+\x9b\x14\x2a\x6c\x4f\x87\x97\xac\xaa\xd0\x18\x2f\x35\x24\xa0\x2e\
+\x59\xb2\xe4\xfd\xf7\xdf\x7f\xff\x86\xa5\x4b\x97\x96\xc6\x4f\x53\
+\x0f\x60\x22\x52\x55\x95\x8e\x8e\x4e\x2a\x2a\x2b\x68\x6e\x6c\x44\
+\xf3\x68\x45\x8c\x1d\x32\xc7\xb9\x40\xc8\xcf\xbf\xb3\xed\x08\x5d\
+\x37\x08\x04\xfc\xd4\xd6\xd4\x10\x8f\xc5\xfa\x9f\xfc\xcd\x6f\xfe\
+\xe9\x3b\xdf\xf9\xce\xf7\x4d\x55\xeb\x2b\x76\xff\x94\xae\xaf\x9b\
+\x9e\xb6\xfe\xd7\x37\x6e\xb9\x4d\x69\xfc\xf8\x1d\x30\xb5\x01\xba\
+\x06\x61\xdb\x76\xac\x2d\x2f\x92\x3c\xb2\x17\x23\x32\x8c\xc7\x4a\
+\xb0\xb7\xa3\x9b\xc7\xf6\x77\xa3\x21\xa8\x97\x70\xdd\xb2\x56\xa6\
+\xaf\x5a\x84\x08\x97\x93\x1a\x19\xa3\xe7\xaa\x1b\x09\x2c\xbd\x8e\
+\x5c\x67\x8d\xa2\x08\x92\x49\xbb\x5a\x69\x5f\xff\x00\x0d\x0d\xf5\
+\xe7\xc5\x7c\x45\x08\x82\x01\x3f\x2f\xbd\xf4\xd2\x9e\x47\x1f\x7d\
+\xf4\xa9\xce\xce\xce\xad\x7b\xf6\xec\x39\xa0\xeb\x7a\x54\x4a\x69\
+\xaf\xa8\x61\x93\x05\xe8\xce\x7b\x1d\x1b\x00\xe3\xf4\xcd\x69\x3d\
+\x81\x52\x4a\x4b\x08\x91\xc6\xce\x8d\x73\xcf\x2d\x8c\x38\x00\x88\
+\x1d\x3b\x76\xfc\xe7\x13\x4f\x3c\xb1\x74\xce\x9c\x39\x7f\xee\xf5\
+\xf9\x9d\x79\x81\xe4\x9c\x9a\xdb\x83\xed\xf7\xb9\xff\x5f\x4a\x8b\
+\xca\xca\x0a\xfa\xfa\xfb\x69\x6a\xcc\x2e\xa5\xe6\x3c\xc7\x38\x89\
+\xe2\x8a\x54\x00\x45\x71\xa3\xc6\x8a\x73\x6c\x3b\x97\x12\x89\x24\
+\x9d\x5d\xdd\xd4\xd4\x54\xd7\x7c\xe4\x23\x1f\xf9\xfb\x3b\xee\xb8\
+\xfd\x2f\x9e\x7a\x6a\xe3\xe3\xdb\xb7\x6f\x7f\xf6\x85\x17\x5e\xd8\
+\xfd\xd6\x5b\x6f\x0d\x39\x0f\x26\xe6\xcf\x9f\xff\x4f\xb7\x7a\xd5\
+\x3f\xa9\xbe\xfe\x86\x99\x94\x57\xc0\xd1\x53\x90\x48\x40\x2c\x8e\
+\x31\x98\x46\x0d\xd5\x22\x14\x0d\x63\xb4\x9f\xb9\xcd\x53\x50\x15\
+\x85\x5f\xef\xef\xa2\xac\x2c\x4c\xc3\x8c\x56\x90\x3e\xd4\x86\x56\
+\xc2\x33\x02\x78\x15\xd7\x11\x94\x95\x00\x76\x0d\x23\x95\xb1\x48\
+\x84\x50\x28\x54\xd4\x03\x78\x36\xe4\xf5\x7a\xe9\xee\xea\xe2\xbb\
+\xdf\xfd\xee\xd7\x5e\x7a\xe9\xa5\x9f\x60\xa7\xb2\xbb\x59\xcc\xee\
+\xe6\x0e\x07\x4c\xec\x64\x16\xb3\x18\xf3\xe1\x0c\x12\x20\xdb\xd8\
+\x99\xd6\xcf\xbd\x41\x2e\x69\x00\x8b\x16\x2d\xba\x69\xfd\xfa\xf5\
+\xbf\x9c\x31\x73\xa6\x48\x26\x27\x2a\x0a\x31\x7e\xc2\x83\xfb\x5e\
+\x51\x14\x8e\x1c\x3d\x46\x6b\xeb\x34\x1a\xea\x6a\x11\x8a\x18\x67\
+\x25\x17\xaa\x85\xdc\xa1\x68\xa1\x24\xb0\x2c\xcb\x49\xdc\x30\x08\
+\x04\x02\x54\x56\x54\x12\x0a\x05\xdd\x4b\x45\x47\x47\x47\xfb\x90\
+\x32\x81\x10\xde\xe4\xcf\x1f\x6d\xa9\x5b\x78\x99\x0f\x4f\x00\x0e\
+\x1e\x84\xc8\x28\x48\x13\x52\x60\x1c\xed\xc4\xe8\xed\x44\x78\x13\
+\x98\xc9\x61\xcc\xb1\x7e\x14\x3d\xce\xd0\xe8\x08\x81\xfa\x3a\x4a\
+\xea\x6b\x51\xa7\xcd\x40\xbb\xf1\xfd\xa4\x77\xbe\xc6\x9b\x27\xfb\
+\x69\xfa\xd4\x3d\x79\x46\xa0\x61\x18\xa4\x92\x29\x8e\x9f\xec\xa0\
+\xa1\xa1\xfe\x9c\x55\xa4\x4b\x41\xbf\x8f\xdf\xfd\xee\x77\xdd\xf7\
+\xdc\x73\xcf\xea\xb1\xb1\xb1\x13\xd8\x4c\x2e\x64\x6e\x2e\x08\x28\
+\xcc\x03\xcc\xa5\xb3\x8a\x05\xe4\x5c\xa0\xe8\x85\x84\x10\x06\xa0\
+\xee\xdb\xb7\x6f\xc7\xd1\x23\x47\x8e\xcf\x98\x31\xa3\x55\xd3\x34\
+\xe7\xf4\xe2\x12\x20\xd7\x7f\xe0\x32\x0d\x04\xd5\xd5\x55\x9c\x38\
+\x71\x92\x29\xf5\x75\x99\x73\x73\x7b\x4b\xb6\xe1\xec\x6b\xdb\x86\
+\x95\xfd\x49\x56\x12\xb8\x06\x23\xce\x28\x41\xb5\x4b\xcb\x8c\x45\
+\xf0\x78\x3c\x84\x43\x21\x82\xc1\x40\xd8\xeb\xf5\x86\x55\x4d\xa3\
+\xe7\x07\x3f\xa2\xa5\xfd\x52\x38\xd1\x8b\xb5\x75\x2b\xe6\x40\x2f\
+\x66\x62\x0c\x43\xf1\xe0\xa9\x6d\xc4\xd7\x32\x0d\x54\x05\xa3\xeb\
+\x04\x6a\xa0\x02\xa4\x85\x19\x15\x54\x4f\xab\x41\x6a\x02\xb5\xaa\
+\x11\xed\xf2\x1b\x00\x85\x83\x3f\xfd\x29\x47\x76\xed\x25\x78\xf1\
+\x52\xaa\x97\x5e\x91\x79\x56\x55\x55\x19\x18\x1a\x22\x18\x0c\x3a\
+\x3e\x8b\x73\xb7\xfe\x55\x55\x25\x9d\x4e\xf3\xc6\x1b\x6f\x6c\x1e\
+\x1b\x1b\xeb\xc4\x66\xbc\xb9\xfb\x81\xf9\xf2\x0f\xbd\x68\x94\x04\
+\xa4\xae\xeb\xbd\xaf\x6d\xd9\xf2\xc2\x95\xab\x56\xb5\xfa\x03\x41\
+\x67\x48\xe8\x9c\x20\xf3\x4f\xcf\x1a\x6f\xae\x24\xb0\x87\x77\x55\
+\x95\x95\x0c\x0e\x0e\xd1\xd5\xdd\xc3\xb4\x69\x53\xed\x84\x51\xc8\
+\xb1\x05\xec\xdf\xbb\xa0\xc8\xed\x49\xb9\x43\x45\xd7\xf0\x72\x47\
+\x25\xb6\x3a\xb1\xd7\x1f\x1a\x4a\xa7\x19\x1a\x19\x41\x11\x82\xc4\
+\x2f\x7e\xc9\xa2\x65\xef\x41\xe9\xec\x25\xf5\x9b\x27\x19\x3e\xb4\
+\x87\xa1\xfe\x2e\x02\xa1\x20\x15\xcd\xad\xc4\xe2\x49\x2a\x84\x82\
+\xb7\xb9\x05\x24\x18\xdd\x27\xd0\xca\xeb\xf1\xd4\x34\x20\xd3\x71\
+\x94\xf2\x32\xb4\x55\x37\x60\x79\xbd\x1c\xfd\xeb\x7b\xe8\xda\x77\
+\x80\xb0\xd7\xcf\xb1\xbf\xff\x12\xe1\xef\xff\x9c\x40\x75\x3d\x20\
+\x88\xc7\x13\xc4\x62\x71\x1a\x1a\xea\xcf\x7b\xe8\xe7\xf5\x68\xf4\
+\x74\x77\xb3\x63\xc7\x8e\x67\x80\x14\xc0\x3b\x5d\x32\x66\x52\x00\
+\x20\xa5\x94\xc2\xce\x38\x36\xde\x7a\xf3\xcd\xa7\xbb\xbb\xbb\x3f\
+\x39\x6b\xd6\x2c\xcc\x71\x36\x40\xae\xde\x2b\xb4\xe2\xa5\xc3\x3c\
+\x68\x6e\x6c\xe4\xc8\xd1\xa3\xd4\xd7\xd7\xe1\xf3\xf9\xf2\x2a\x77\
+\xe5\xba\x54\x6d\xe6\xbb\xb9\xf9\xb9\xc1\x10\x99\x37\xfc\x72\x87\
+\x8b\x96\xa5\x38\x12\x41\xa2\x08\xc1\xe8\x6f\x9f\x67\xea\x18\xa8\
+\xc3\x51\x92\x8f\xff\x9a\xae\xdd\xdb\x38\x78\xea\x20\x86\x99\xa6\
+\x3a\x5a\x8a\xa2\x68\x84\xea\xa7\x30\x78\xf4\x10\x95\x52\xe2\x6b\
+\x6c\x46\x94\x06\x50\xca\x35\x44\x22\x8a\xf4\x7b\x11\x8b\x2e\x46\
+\x5a\x69\xba\x1f\xb8\x97\xa1\x43\x07\x08\x97\x84\xd1\x0c\x93\x64\
+\x57\x0f\x07\xd7\xfe\x0d\x0b\xff\xe1\xff\xa0\x7a\xbc\x74\x77\xf7\
+\x50\x5a\x5a\x92\x99\xf8\x72\x3e\x24\x80\x43\x87\x0e\xf5\xec\xdd\
+\xbb\xf7\x55\x6c\xdd\x3f\xce\xaa\x3f\x57\x9a\xcc\x68\xa0\x05\xa8\
+\x7b\xf6\xec\x79\x65\xe7\xce\x9d\x7b\x0c\xc3\x70\x8a\x31\x67\x5d\
+\xb7\x8a\x22\x72\x5c\xb9\xf9\x1e\x3d\x37\xba\x27\x84\xa0\xa4\xb4\
+\x84\xb2\xb2\x72\x0e\x1d\x3a\x62\x57\x12\xd5\xc6\xe3\x34\x3f\xda\
+\x46\xce\x26\x9c\xbf\x35\x7e\x2c\x6e\xfb\x0b\xec\xdf\x4b\x60\x70\
+\xf3\x66\xbc\x27\x7b\xd1\x7f\xf3\x14\x27\x77\x6e\x61\x77\xd7\xdb\
+\x8c\x9a\x29\x74\x21\x18\xd2\x63\x74\xf7\x74\x10\xeb\xed\xc6\x1b\
+\x1f\x21\x72\xfc\x08\xc6\x48\x3f\xea\x65\x8b\x11\xb3\x67\xc3\xbc\
+\x85\x88\x1b\x6e\xc6\x34\x74\x46\xd6\xfd\x1d\xa2\xaf\xd7\x56\x2d\
+\xaa\x4a\x48\xd3\x08\xfa\x3c\x58\x2f\xbe\xc2\xd1\x6f\x7c\x85\x53\
+\xbd\x7d\xe8\x86\x49\x38\x1c\x3e\x6f\xe6\x6b\x9a\x46\x2a\x95\xe6\
+\xa5\x97\x5e\x7a\x66\x74\x74\xb4\x13\x90\xef\xaa\x35\x83\x70\x82\
+\x57\xba\xae\x0f\x6c\xde\xbc\xf9\x17\x83\x83\x83\x19\x06\xbb\xce\
+\x1a\x37\x2d\x3a\xbb\x15\x46\xf9\x6c\xdf\xbe\x94\x92\xa6\xc6\x29\
+\xf8\xfd\x3e\xc6\xc6\xc6\x72\xaa\x79\x9e\x8e\x0a\x83\x24\x59\x89\
+\x50\x2c\x34\xab\x28\x82\xc1\xe8\x18\x7b\x77\xbc\x42\xc7\xf6\x57\
+\xd8\xd9\xb3\x9f\xbd\xe9\x38\xa3\x96\x44\x13\x02\x43\x4a\x1b\x04\
+\xdd\x1d\x44\xba\x3b\xf0\xa5\xa3\x08\x0c\x18\x1e\x81\x96\x69\xb0\
+\x7a\x15\xe6\xc9\x13\x0c\xfd\xed\x3f\x12\x39\x31\x8c\x2f\x5c\x43\
+\x65\x49\x29\x41\x55\x23\xa8\xa9\x04\x3d\x1e\x82\x1e\x8d\xb1\x5f\
+\x3c\xc6\xd1\x6f\xfd\x2d\x35\xb5\xd5\xef\xa8\x61\xbd\x1e\x8d\x93\
+\x27\x4f\x98\xaf\xbf\xfe\xfa\x2f\xc8\xce\x6d\x7c\xc7\x34\xd9\xf9\
+\x00\x16\x20\xb6\x6c\xd9\xf2\xeb\xfd\xfb\xf7\x0f\x58\xa6\x99\x49\
+\x8c\xcc\xfa\xf6\x0b\x23\x66\x2e\x00\x72\x01\x62\x87\x84\x4b\x4b\
+\x4b\xb1\x4c\x0b\x5d\xd7\x33\x05\x1c\x72\xa9\xb8\x14\x10\x45\xbe\
+\xb3\xef\xe3\x1a\x87\x8a\xa2\x70\xfc\xd8\x71\x3c\xb3\xda\x79\xf6\
+\xe8\x5b\xbc\x72\x7c\x27\x23\xd2\x20\x21\xe1\xa4\xae\x73\xca\x30\
+\x50\x85\x20\x25\x25\x83\xe9\x28\xbd\xfd\x3d\xe8\xb1\x38\x56\x7f\
+\x3f\xc4\x62\x50\x5b\x8b\xb5\x75\x1b\xfa\x4f\x1f\x25\x50\xd2\x84\
+\x2f\x5c\x4f\x22\xaa\xa2\xa9\x61\xca\x43\x25\x04\x55\x95\x80\xa6\
+\x10\xf4\x78\x08\x6b\x1a\xfe\xe7\x9e\x61\xf4\x7b\x0f\x63\xa5\x13\
+\xe7\xd5\xa8\x9a\xaa\x60\x99\x26\xdb\xb6\x6d\x7b\xe3\xc0\x81\x03\
+\x5b\x21\x33\x41\xea\x1d\xd3\x85\xa8\x16\x2e\x7b\x7a\x7a\xf6\x3f\
+\xfb\xec\xb3\x8f\x0f\x0f\x0f\x67\x5c\xb4\x2e\x73\x8b\x83\x20\x37\
+\x5f\x4e\x41\x08\x35\xf3\x79\x2a\x9d\x06\x09\xa6\x65\xe2\xc9\x49\
+\xb4\x38\x1d\x15\x02\xa3\xd0\x23\x67\x9a\x26\x43\x43\x43\x68\x2b\
+\x2e\xa3\xe5\xd6\xf7\xb3\x23\x15\x67\xd4\x30\x69\xf6\x78\x48\x4b\
+\xc9\x09\x5d\xa7\xdb\x99\xad\x94\xb4\x2c\x40\x25\x35\x3a\x8a\xb4\
+\x04\x4c\x9b\x81\xb1\x79\x33\x91\x0d\xdf\xc2\x3f\x63\x01\xc1\xc5\
+\x17\x53\x32\x65\x2a\x5e\x4f\x39\x89\xa8\x8a\xaa\x86\x28\x09\x97\
+\x12\x52\x35\x82\x9a\x66\x83\xc0\xeb\x21\xf9\xe4\x7f\x33\xf8\xb5\
+\xfb\x31\x06\xba\xcf\xb9\x51\xfd\x7e\x3f\x7d\x7d\x7d\x6c\xda\xb4\
+\xe9\xc7\x86\x61\x8c\x00\xd6\x8e\xcf\xb4\xbf\x63\xf1\x0f\x17\x06\
+\x00\x16\x20\x9f\x79\xe6\x99\x7f\xdd\xbb\x77\x6f\xcc\x34\xf4\x1c\
+\x29\x50\xe8\xd3\xcf\xcf\x94\xc9\xda\x09\xf6\xe7\xaa\xaa\x62\x9a\
+\x26\x63\x63\xd9\x55\x44\xbd\x5e\x6f\x1e\x08\x26\x06\x44\xee\x39\
+\x05\xd9\x32\x42\x50\x5b\x57\x87\x3f\x14\xa6\xec\x8e\x3b\x69\xbb\
+\xe9\x26\xba\x0c\x83\xa8\x65\xd1\xea\xf5\x62\x01\xc7\xd3\x69\x86\
+\x2d\x93\x32\xcd\x8f\xd4\x4d\x84\xc7\x8f\x77\xfe\x42\x52\xc7\x0e\
+\xb3\x75\xcd\x7d\xf4\xf4\x0d\x93\xea\xe8\x40\x09\x85\xf0\xcf\x9f\
+\x4b\x49\xe3\xb4\x2c\x08\x44\x80\x70\xb0\x84\xa0\xa2\x12\xd0\x54\
+\x82\x9a\x46\xc8\xe3\xc1\x78\x69\x1b\x7d\x5f\xfa\x9f\xa4\x76\xbf\
+\x72\x76\x8d\xe9\x64\x4b\x61\x59\xbc\xfe\xfa\xeb\x07\x77\xee\xdc\
+\xf9\x14\xb6\xf1\x37\x69\x15\xc3\xd5\x87\x1e\x7a\x68\x52\x2e\xf4\
+\x95\xaf\x7c\xc5\x3d\x94\x80\x16\x89\x44\xfa\x42\xa1\x50\xc3\xa2\
+\x45\x8b\x96\x86\xc3\xe1\xcc\xb8\x3c\x3f\x54\x4a\xce\xde\xa5\xdc\
+\x04\x07\xfb\xfc\x74\x3a\x8d\x69\x98\x84\xc3\x21\x4c\xcb\x42\x53\
+\xd5\x3c\x3f\x42\xfe\x6f\xc7\xbb\x8c\x0b\x47\x1b\x60\x4f\x67\x0f\
+\x87\xc2\xd4\xd6\xd6\xd2\x70\xf9\xe5\x68\xd1\x28\x07\x77\xee\x24\
+\xa8\x28\xd4\x68\x1a\x9a\x10\x34\x7b\xfc\x84\xf1\x30\x65\x4a\x1b\
+\x4d\xef\xfb\x00\xa9\x90\x8f\x9d\x7f\xff\x37\x1c\xea\x3a\x41\xd4\
+\x02\x9f\x61\x11\x54\x14\x3c\x0d\x53\x50\x2b\xca\x51\x13\x69\xcc\
+\x58\x92\x54\x32\x85\xd7\xa7\xa2\x79\x04\x98\x46\x4e\xe0\x4a\xc1\
+\x1a\x8d\x10\x7d\xf1\x59\x84\x15\xc3\xdb\x76\x11\xc2\x33\x71\x50\
+\x48\x08\x41\xd0\xef\xa7\xa3\xe3\x24\xdf\xfc\xe6\x37\x1f\x38\x74\
+\xe8\xd0\x66\x40\xbe\x70\x63\xab\xe1\x2b\xd5\xd0\x4a\xd5\xcc\xdf\
+\xad\x5d\xfd\xb9\xf3\xe2\xdb\x85\x5c\x2f\xc0\xda\xb8\x71\xe3\x77\
+\xb7\x6f\xdf\xde\x9b\x4c\x24\xf2\x98\x3f\x3e\xca\x37\xde\x16\xc8\
+\x8d\xad\x6b\x9a\x4a\x2c\x1e\xa7\x7f\x60\x10\xd5\x99\x15\xe4\xa6\
+\x83\x9d\x8f\x3b\xd5\xce\x41\xf0\x12\x0c\x06\xf0\x7a\x3d\x94\x96\
+\x95\x71\xe9\x43\x5f\xe1\xd2\x8f\x7e\x94\x2e\x5d\xc7\x90\x92\xb9\
+\xfe\x20\xa5\xc2\x4b\x63\xe3\x2c\x5a\xff\xe4\x43\xa4\xca\x4a\x78\
+\xe5\xe1\x2f\xd1\xdd\xd7\x45\x63\x30\x40\x64\xb8\x87\x3d\x47\xdf\
+\xa6\xf3\xed\x7d\xa4\x0e\x1d\x40\x09\x87\xf0\xcf\x9f\xe7\x48\x82\
+\x0a\x47\x12\x04\x09\x06\x4b\x08\x68\x1e\x7b\x64\xa0\xa9\x04\x7d\
+\x1a\x3e\x4b\x30\xfa\x1f\xff\x49\xdf\x83\x9f\xc7\x38\x54\x7c\x69\
+\x3d\xb0\x1d\x3f\xc9\x64\x92\x67\x9e\x79\xe6\xc5\xd7\x5f\x7f\xfd\
+\xbf\xb0\x7b\xff\x79\x54\xb3\x9e\x98\x2e\x84\x04\x00\x27\x40\x14\
+\x8b\xc5\x06\x15\x45\x09\x2f\x59\xb2\xe4\xca\xf2\xf2\xf2\xcc\xc4\
+\xc8\xf1\x69\x4c\xf9\x8e\x9e\x7c\x0b\xde\xbe\xa0\xa2\x88\xcc\xaa\
+\x5e\x7e\x9f\x0f\xe9\x24\x91\xba\x80\x28\xe6\xac\x2c\xec\xf9\xd9\
+\xcd\xa2\xd0\x89\x04\x50\x7f\xd5\x6a\x3c\xc3\xc3\x44\xf6\xee\xa5\
+\x4a\x0d\x30\x7b\xc6\x22\xa6\x5d\x7f\x0b\xd1\x90\x97\xcd\xdf\xfc\
+\x3b\x06\x07\xba\x51\x7d\x7e\x24\x92\x4a\x55\x61\x30\x1e\x65\x24\
+\x91\xc4\x67\x42\x48\x51\xf0\x4c\x69\x40\x2d\x2b\x43\xb3\x40\xd1\
+\x05\xc2\x02\x6f\x49\x08\x7f\xd0\x8f\x4f\xd3\xf0\x7a\x7d\x76\xf2\
+\x8a\xaa\x92\x4a\xe9\xe8\x7d\x43\x8c\xfe\x6e\x13\xa4\x46\xf0\x4e\
+\x6f\x47\xf8\xf2\x17\xca\xf2\xfb\xbc\xf4\x74\x77\x5b\xdf\xfd\xee\
+\x77\xbf\xd4\xd1\xd1\xf1\x26\x60\x6e\xbe\x6b\x96\x29\x63\x16\x93\
+\x25\x01\x2e\x54\x5a\xb8\x1b\x81\xa2\xb3\xb3\x73\x57\xd2\x99\xc5\
+\x63\xf7\x78\x37\xb8\x03\xb9\xae\x5c\xd7\x8b\xa7\xe4\xf8\xff\x6d\
+\xd7\x6e\x7e\x80\x47\xd7\x0d\xfa\xfa\xfb\x09\x05\x43\x68\x1e\x0d\
+\x8f\x47\xc3\xe3\xf1\x64\xa6\x69\x65\x1e\xe0\x34\x82\xe1\x74\xdf\
+\x5d\xfc\xc0\x83\xec\x0d\x04\x38\xfe\xf8\x7f\x13\x10\x3a\xdd\x5b\
+\x9e\x61\xdf\x1b\xaf\x90\x4e\x27\x28\xf3\xf9\xed\xd5\xcc\xa5\x04\
+\x05\xa6\x68\x0a\xdd\xa3\xa7\xd8\x7b\x14\x10\xd0\x6c\x49\xfc\x4b\
+\x96\x10\x68\x6e\xc6\xf3\xd6\x2e\x92\x87\xf6\x63\xc6\x86\x51\x42\
+\x02\x4f\x40\x41\x35\x92\x04\x02\x01\xba\x4e\x0d\xd1\xd1\x19\xc3\
+\xe3\x57\xa9\xa9\xf1\x33\xf2\xe8\x2f\x88\xee\xd8\x42\xed\x27\x3f\
+\x87\x77\xe1\xea\x4c\x03\x0a\xa1\x90\x48\x24\x8c\x58\x2c\x76\x9c\
+\x49\x1c\xfa\xe5\xd2\x85\x4c\x0b\xb7\x00\x73\xce\x9c\x39\x57\x94\
+\x96\x95\x8d\x33\xdc\xc6\x67\xb1\xda\x8f\x33\x51\x2a\x95\xed\xd7\
+\x17\x8e\x9f\x40\x30\x16\x19\x63\x78\x78\x84\x81\x81\x41\x86\x47\
+\x46\x10\x42\xe0\xf5\x7a\x40\xb8\x00\xca\xf5\x38\x32\x4e\x55\x88\
+\x82\x7d\xae\x21\x32\x77\xcd\xfd\xac\xfc\xd5\x2f\xa8\xf8\xea\x7d\
+\x58\x9f\xfc\x30\xfa\xac\x19\x24\x14\x95\x98\x65\x65\xb8\x90\xb6\
+\x2c\xe2\xd2\x62\x8a\x26\x88\x8e\x9e\x62\xef\x91\x7d\xf4\x1c\x3d\
+\x0c\xc3\xc3\x50\x5d\x85\xb6\xe4\x62\x7c\x33\x2f\x42\xf1\x55\x62\
+\xc6\x54\xa4\xe5\x43\xf5\x04\x30\xe2\x29\x8e\x1e\x39\x85\x86\x20\
+\x95\x30\xe9\xeb\x4d\xe2\x41\x45\x1e\xeb\xe2\xe8\xff\xbe\x9f\xa1\
+\xef\x3d\x88\x39\xd8\x65\x8f\xf3\x2c\x8b\x92\x92\x12\x6f\x65\x65\
+\xe5\xdc\xdf\x7d\xb8\xcd\x20\x57\xbc\x4d\x12\x5d\x28\x00\x08\x40\
+\xae\x5e\xbd\xfa\xd6\x5b\x6f\xbd\xf5\x53\x55\x55\x55\xb6\xbe\x86\
+\x02\x20\x14\x1f\xb2\x29\x4a\xbe\x1b\xb7\x98\xdd\x60\x2f\x17\x67\
+\x91\x4c\xa6\xe8\xed\xed\x67\xff\xfe\x83\x9c\xea\xed\x73\xd2\xcc\
+\xed\x49\x19\x85\x89\x92\xd9\xa0\x93\x7d\xf3\x71\x26\xa4\x94\x48\
+\x61\xa7\x58\x05\xea\x1b\x08\x5d\x34\x87\xba\xd5\x57\x73\xd5\xbf\
+\xff\x3b\xd3\x3f\x72\x27\x51\xd3\x2c\x0a\x82\x06\x8f\x20\x32\xdc\
+\xc3\xe1\xce\x23\x8c\xed\xdd\x03\x87\x8e\x40\x65\x05\x9e\xe5\x4b\
+\x08\xb4\xcf\x45\x0d\xd4\x60\xc5\x54\xa4\xe5\xc5\x17\x2c\xa1\xba\
+\x24\x88\x47\x4a\xfc\xaa\x42\x3a\x65\xd2\xd9\x1d\x43\xea\x1a\x55\
+\xa1\x30\xfd\xbf\xd8\xc8\xf1\x35\x9f\x25\xb1\x6d\x13\x69\x5d\xa7\
+\xa6\xa6\x86\xdb\x6f\xbf\xfd\xfe\xbb\xb6\x5a\xb3\xb7\xdc\x73\x91\
+\x5c\xf5\xa3\x83\xe7\x17\x46\x9c\x80\x2e\x84\x0d\x20\x00\xb9\x78\
+\xf1\xe2\x6b\xef\xb9\xe7\x9e\x9f\x5d\x72\xc9\x25\xe1\x72\x3b\x2f\
+\x2d\x67\xa6\x4b\xb1\x09\x8e\xe3\xc1\xe1\xd6\xdf\x29\xa4\xdc\x9c\
+\x02\x21\xdc\xdc\x3a\x93\xfe\xfe\x01\x06\x06\x06\x33\x8e\x23\xcd\
+\x29\x9d\x92\x5b\xb2\xcd\xb2\x2c\x2c\x69\x21\xdc\xa4\x69\x45\xb1\
+\x7b\x81\xc3\x78\x77\x2f\x84\x40\x38\x43\x53\xcd\xeb\xa3\xea\x8a\
+\x2b\xd0\xca\xcb\xe8\xdb\xb2\x05\x69\x9a\x68\xce\x79\x96\xb4\xb3\
+\x24\x2b\x35\x95\x48\x4a\x27\x9e\x48\xd9\xc1\x23\xbf\x1f\x9a\xa6\
+\xa0\x54\x55\xa1\xea\x16\xd6\x68\x1c\x33\x1a\x47\xf5\x6b\x54\x57\
+\x97\x92\x8c\x44\x89\x26\x52\x68\xaa\x82\x29\x25\x43\xa3\x49\x84\
+\x54\xa9\xab\x75\x92\x4a\x36\x6d\x42\x89\x9d\xa4\x76\xf1\xa5\xb4\
+\xcc\x68\xaf\x68\x68\x68\xb8\xea\xaf\x7e\xb8\x79\xd3\xaf\x6f\xad\
+\x1d\xbe\xea\xb1\x23\xe2\xcf\x97\x54\xbf\x2b\x6d\x00\x01\xc8\x19\
+\x33\x66\xac\xbc\xfb\xee\xbb\xff\x75\xf9\xf2\xe5\x65\xb5\x35\x35\
+\xa4\x0d\x63\x82\xa4\x0e\xd7\xf0\x1b\x1f\xdd\xcb\x8d\xec\xb9\x86\
+\xa3\xcd\xf8\xf1\x12\x01\x2c\x02\x81\x00\xc1\x60\x90\x64\x32\xc9\
+\xe8\xe8\x28\x03\x83\x83\x78\xbd\x1e\x82\x81\x20\xa1\x50\x10\x4d\
+\x53\x6d\xc3\x51\x08\xa4\x28\x98\xaf\xef\x58\x9d\x42\x08\xfb\x7b\
+\x9c\xec\xdb\xa4\x4e\x22\x61\x47\xf1\x52\xe9\x14\xbe\xab\xaf\x61\
+\x4e\x4d\x2d\xfb\xff\xe6\x7f\x43\x2a\x45\x48\x51\xd0\xb0\x25\x81\
+\x50\xa0\x41\x93\x0c\xf6\x76\xb0\x67\xb7\x60\xbe\xaa\x12\x52\x35\
+\x98\x35\x03\x6d\xf9\x62\x02\xaa\x42\x62\x1f\x18\x91\x5e\xb4\xd2\
+\x20\x73\xe7\xcd\x44\xee\x39\x44\xf7\x48\x04\xbf\xa2\x20\xb0\xe8\
+\x1f\x8a\x10\x4f\xe9\x4c\x6d\xae\x24\x10\xf0\xd3\xf3\xd8\x46\x46\
+\x76\xee\x61\xe9\xdf\xfe\x23\xd7\x5c\x73\xcd\x3c\xe0\x89\x4f\xac\
+\x5d\xfb\xfe\x17\x6e\x6c\x3d\xbc\xe4\x7b\xfb\xc5\x64\xc4\x02\x26\
+\x7b\xe5\x50\xb9\x7a\xf5\xea\x9b\xef\xba\xeb\xae\xef\x5f\x71\xc5\
+\x15\x75\x0d\x0d\x0d\x98\x96\x35\x6e\xc5\x90\x62\xf7\xcc\xcf\x0d\
+\x80\xfc\x74\xaf\xfc\xaa\x5b\xd9\x8a\x5b\x6e\x89\x16\x33\x93\x29\
+\xec\x32\xd6\x34\x4d\x92\xc9\x14\x89\x64\x32\x53\x83\x08\x91\x33\
+\xeb\x48\xb1\xcb\xda\x64\x7a\xbd\x20\x53\xf1\xc3\x30\x0c\x67\x1e\
+\xa2\x44\xf3\x78\x08\x06\xfc\xf8\xfd\x01\x1b\x44\xc0\xd0\xcb\x2f\
+\xb1\xeb\xde\x7b\xf1\xe6\x80\x40\x15\x82\x0a\x55\x25\xe8\x0b\xd3\
+\x27\x3d\x54\x4f\x69\x65\xe1\x92\x65\x04\x2e\x5e\x0c\x33\x67\xc0\
+\xe8\x18\xe6\x8e\x37\x49\xec\xde\x85\x11\xed\x41\x2b\x91\x98\x7a\
+\x9c\x3d\x0e\x08\x2c\x45\x21\x2d\x25\x71\xd3\x44\x55\x14\xa6\x4f\
+\xab\xc5\x17\x56\xe9\x19\x18\x24\x65\x1a\x2c\xb8\xef\xaf\xf0\x5d\
+\x7b\x07\xbf\xdd\xfc\xd2\xde\xb5\x6b\xd7\xfe\xc9\x2f\xae\xf5\x1d\
+\x99\x8c\x85\x23\x27\x75\xe5\xd0\xf7\xbc\xe7\x3d\x37\x7d\xfa\xd3\
+\x9f\xfe\xf7\xa5\x4b\x97\x96\x35\x36\x36\xda\x4c\x98\x60\xb9\x98\
+\xf1\x39\x7e\xee\x7b\x37\xc4\x5b\x98\xe9\x93\x23\xc2\x2d\x99\x07\
+\x00\x63\x82\x02\x56\x2e\x18\xa4\x74\x6a\xf7\x58\x16\xe9\xb4\x9e\
+\x37\xaf\x3f\x97\xdc\x79\x06\x5e\x47\x7d\xb8\x73\x0d\xc6\x39\x9d\
+\x84\x60\xf8\x95\x97\x78\xf3\x9e\xbf\x24\x60\x9a\x19\x10\x84\x14\
+\x85\xb0\xaa\xe2\xf3\x86\xe8\xc3\x43\x5d\xd3\x74\xe6\x2f\x5e\x8e\
+\x7f\xf1\x12\x98\x39\xdd\x06\xc1\xb6\xb7\x48\xee\xd9\x85\x3e\xd6\
+\x85\xa7\xc4\xc2\x28\x02\x82\x84\x69\x61\x48\x49\x4b\x63\x25\x35\
+\x75\x61\x7a\x07\x87\x18\x89\xc5\x69\xfd\xe0\x0d\xd4\x7c\x62\x0d\
+\x2f\xbd\xb1\x67\xef\xc3\x0f\x3f\xfc\xfe\x5f\x7f\x2c\x74\xf8\x9d\
+\x02\x60\xd2\x6c\x80\x75\xeb\xd6\x55\xdd\x7d\xf7\xdd\x8f\x2f\x5b\
+\xb6\xac\x7e\xfa\xf4\xe9\x98\x4e\xe9\xb7\xd3\xf9\xee\x73\x7b\xbd\
+\xbb\xb7\x75\xbf\x53\x1d\xbb\x20\xe3\x27\x57\xf7\x4f\x38\x23\x66\
+\x82\x7b\xd8\x0e\x25\x7b\x9d\xc0\x40\xc0\xce\xa9\x2f\xdc\xfc\x7e\
+\x3f\x7e\xaf\x37\xb3\xc4\x6c\xb1\xd1\x83\x73\x31\x02\x2d\x53\xf1\
+\x96\x84\xe9\xdc\xfc\xa2\xed\xb6\x16\x02\xcd\x51\x21\x98\x3a\x65\
+\x9a\x4a\xdf\xd8\x18\x89\x44\x8a\x2a\xd5\x83\x16\x08\x40\xe3\x14\
+\x94\xea\x2a\x34\x29\x90\xa3\x71\x8c\xb1\x08\x9a\x5f\xa3\xba\xa6\
+\x94\xc4\x98\x6d\x13\xb8\xb5\x06\x24\x82\x81\x91\x28\x56\xda\xa2\
+\x71\x4a\x35\xaa\x0a\xdd\x3b\xf6\x91\x3c\xfc\x26\x4d\xcb\x2f\xab\
+\x0d\xd7\x37\x37\xdc\xf9\x77\xff\xf5\xab\xbf\xb8\xa2\xc6\x82\x77\
+\x81\x0d\xd0\xd6\xd6\x36\xa5\xb4\xb4\xb4\xc5\x8d\xe9\x17\xab\x28\
+\x5a\x48\x42\x88\x4c\x16\x6f\x61\x8a\x98\xbd\xcf\x5d\x5d\xc3\xca\
+\xf9\x6e\xfc\x30\xb2\xd0\x0d\x5c\x8c\x0a\xaf\x5f\xf4\x99\xce\xfc\
+\x57\x33\xd4\x78\xc7\x9d\x0c\xef\xda\x45\xd7\x93\xbf\x01\x4d\xc3\
+\x23\x04\x3e\x29\x49\x20\x11\xa9\x18\xb5\xbe\x10\xa7\x4e\x1e\x46\
+\x28\x0a\xf3\x54\x15\xaf\xaa\xc2\x8c\x19\x28\xcb\x97\xe0\x57\x04\
+\xec\x14\xe8\xc3\x1d\x68\xe1\x20\xf3\xe6\xcf\x84\xdd\xb6\x24\xf0\
+\x2a\x0a\x28\x20\x3c\x1a\x3d\x03\x63\x24\x75\x93\x59\x6d\x75\x68\
+\xaa\xc6\xa9\x1d\x7b\x88\x77\x7d\x89\xb6\x3f\xf9\xc0\x25\xaa\xaa\
+\x86\x81\xe1\x73\x78\xe4\x71\x34\x29\xc3\x40\x21\x84\x38\x74\xe8\
+\x50\x4f\x7f\x7f\xff\x7e\x9f\xcf\x47\x22\x91\x28\x9a\xc4\x31\xc1\
+\xaf\xf3\xde\x65\x8b\x26\xe5\xe8\x79\xd3\xc8\xe8\xe7\xdc\xea\x9b\
+\xc5\x7e\xff\xfb\xa6\xd9\x6b\xfe\x1a\x75\xca\x14\x22\xa6\x49\xd4\
+\x34\x19\xb3\x2c\x0e\xa7\x52\x1c\xd7\x53\xa4\xd2\x31\x6a\x48\xd3\
+\x73\xfc\x20\x6f\x6f\xdf\x8a\xb1\x73\x27\x1c\x3b\x06\x95\x15\x28\
+\xcb\x97\xe2\x5f\xb4\x04\x4f\xd5\x54\x8c\xa8\x8a\xaa\xda\x20\x98\
+\x52\x5e\x82\x62\x59\x78\x85\xc0\x27\x04\x01\x8f\xc6\xd0\x68\x8c\
+\x3d\xfb\xbb\x08\x7a\x02\x34\xd5\x55\x63\xf4\x0e\xe2\xf9\x8f\x7f\
+\x6b\xfc\xcd\x47\x9b\xaf\x9e\xff\xd5\xdd\xca\x3b\x69\x82\x49\x51\
+\x01\x5f\xf9\xca\x57\x54\xc3\x30\xd2\x47\x8f\x1e\xdd\x3f\x75\xea\
+\xd4\xeb\xea\xea\xeb\x4b\x82\xc1\xe0\x69\x67\x09\x15\x4a\x87\xc2\
+\xde\x59\x08\x04\x5b\xef\x9b\x40\x6e\x05\x4e\xe9\x94\x72\xcf\x56\
+\xd9\x3a\xad\xd4\x39\x83\x44\x82\xb3\x84\x53\xce\x75\xd4\x40\x80\
+\xb2\x99\x33\x38\xf2\xdf\x4f\x82\x94\x99\xdf\x0f\x9b\x16\x49\xcb\
+\xa2\x54\x58\x94\xaa\x0a\x7d\x63\x23\xa4\x13\x69\xaa\x54\x2f\x4a\
+\x20\x00\x4d\x53\x10\xd5\x95\x68\x96\x40\x46\x12\x18\x63\x11\x54\
+\x9f\x4a\x4d\x81\x3a\x10\xd8\x2e\xef\x58\xda\x60\x70\x38\x4a\x7d\
+\x45\x19\x65\xe5\x41\x22\x43\x63\x8a\xd1\xab\xdf\x74\xdf\x1d\xad\
+\x3b\x35\xbf\x72\xf0\x7c\x55\xc0\x64\x01\x40\x00\xda\xd0\xd0\xd0\
+\xc9\x5d\xbb\x76\xed\x6e\x69\x69\xb9\xa6\xae\xbe\x3e\x7c\x26\x10\
+\x40\xb1\x58\x40\x16\x08\xc5\xa4\x41\xb6\x2e\x9f\x3b\x09\x24\x5b\
+\x9d\x33\x57\x67\x17\x05\xc2\x05\x00\x00\x40\xb0\xa9\x19\x7d\x78\
+\x88\x9e\x9d\xbb\xa8\xd4\x34\x02\xb6\x27\x8b\x51\xd3\x24\x69\x99\
+\x94\x0a\x49\x89\x22\xe8\x1d\x19\xc1\x70\x6c\x02\x25\x18\x74\x40\
+\x50\x65\x83\x60\x2c\x81\x31\x7a\x3a\x10\x08\x52\xba\x49\xff\x50\
+\x94\xda\x8a\x72\xca\xcb\x82\x8c\x8d\x44\xbd\xd1\x9e\xc4\x7b\x84\
+\xa9\xbe\x34\xf5\xc3\xf7\x74\x16\x7f\xd8\x33\xfc\x95\x49\x1c\x05\
+\xa8\xd8\xb3\x88\x44\x6b\x6b\xeb\x55\x5f\xfe\xf2\x97\x7f\xb0\xfa\
+\xea\xab\xeb\xab\xaa\xaa\x00\x8a\x5a\xdd\x2e\x65\xcb\xae\xba\x3d\
+\x5a\x62\x39\x93\x28\x4d\xd3\x44\xd7\xf5\xa2\xd2\x20\x7f\xd9\x15\
+\xdb\x68\x74\xc3\xae\x02\x32\x45\xa7\x33\x60\x98\x00\x00\xb9\x6d\
+\x90\x7b\xc6\x84\xd2\xa4\xc8\xe7\x46\x34\xca\xa6\xdb\x3f\x84\x38\
+\xd9\xc1\x4c\xaf\x97\x84\x65\x11\x91\x92\x88\x69\x52\xa9\x2a\xb4\
+\xf9\xfc\xf8\xbc\x41\x86\xd4\x00\x2d\x33\xe6\xd1\x7e\xe9\x4a\x94\
+\xa5\x4b\x60\x46\x2b\x0c\x8f\x22\x5f\xdf\x41\xf2\xad\x37\x49\xf7\
+\x1f\x43\x0d\xea\x98\x66\x9c\x3d\xbb\xf3\x47\x07\x29\x29\x49\x98\
+\x26\x8a\x10\xcc\x6f\x6f\xc4\x1b\x10\x74\xf7\x0d\xa0\x86\xbd\x7d\
+\xf5\x0b\x2a\x6f\x5e\xfe\xd3\x03\xdb\x26\x6c\xe4\x09\x68\x32\x3d\
+\x81\xae\x29\xae\x8d\x8c\x8c\x1c\xdb\xb5\x6b\xd7\xce\x96\x96\x96\
+\xab\xcf\x46\x1d\x40\xbe\xcb\x57\xd5\x34\x02\x7e\x3f\x1e\xaf\x17\
+\x8f\xc7\xe3\x24\x86\xb8\xd5\x34\xed\x2a\x9c\x6e\x49\x56\x5d\xb7\
+\x17\x61\x70\x3f\xcb\x0c\x1d\x73\x87\x6e\xb9\x43\x09\x5c\xa7\x92\
+\x63\x78\xe6\x94\x71\xb7\x9c\xa5\xba\xf2\x47\x25\xe3\xbd\x94\xc5\
+\x00\xa0\x78\xbd\x94\x35\x35\xf1\xe6\x13\x4f\x10\x12\x82\x5a\x4d\
+\xc3\x74\x7e\x3f\x6a\x5a\x79\x92\xe0\xd4\xc8\x08\x46\x32\x4d\x95\
+\xea\x41\x04\x43\xb6\x24\xa8\xaa\x42\xb3\x70\x24\xc1\x18\x9a\x23\
+\x09\x92\x05\x92\x40\x08\x81\x6e\x59\xf4\x0d\x8c\x51\x53\x51\x4a\
+\x65\x79\x88\xe8\x48\x34\x94\x88\x1b\xd7\x8d\xec\xf8\xd1\xc6\xc6\
+\xf7\xdd\x5d\xb4\x2c\xfc\x44\x34\xd9\xae\x60\x37\x23\x48\x75\x40\
+\xb0\xeb\x5c\x40\xe0\x66\xc0\x78\x34\x8d\x74\x2a\x95\x59\x87\x57\
+\x55\x14\xbc\x1e\x0f\xaa\xa6\x61\x38\x5e\x45\xcb\xb4\x8b\x25\x98\
+\xce\xcc\x9f\x74\x5a\xcf\x2c\xc8\x90\xab\x26\xf2\x46\x18\x4e\xd8\
+\x31\xeb\x5f\xb0\x17\x73\xd2\x0d\x03\x5d\xd7\x9d\x88\x62\x3e\x90\
+\x0a\xc1\x20\xb2\xb1\xea\x71\x14\x6a\x99\x4a\xb2\xa7\x9b\xfd\x7b\
+\xf6\x30\xc5\xeb\xa5\x54\x55\xd1\xa5\x93\x82\x9e\xb1\x09\x24\x25\
+\x02\x7a\x47\x47\x90\x49\x9d\x4a\xd5\x83\x08\x85\xa1\xb9\x11\x51\
+\x55\xe1\x80\x20\x89\x3e\x12\x41\xf3\x29\x13\x83\x40\x4a\x7a\x07\
+\x22\xd4\x54\x94\x52\x51\x16\x20\x3a\x18\x2b\x37\x53\xd6\x35\x91\
+\x7d\x3f\xfe\x65\xfd\x7b\x3e\x1f\x2b\xfa\x80\x45\xe8\x42\x65\x04\
+\xb9\x92\xe0\xf8\xb9\x80\xc0\x1d\x39\xf4\x9e\x3a\xc5\x5b\x6f\xbd\
+\x65\x6d\xd9\xb2\xe5\xc4\xfe\xfd\xfb\x07\x47\x46\x46\x4a\xfc\x7e\
+\xbf\x1a\x0c\x06\x09\x04\x02\x28\x8a\x9a\xb5\x0b\x0a\x3c\x82\x85\
+\x20\xc8\xd8\x0b\x8e\x4a\x71\x19\xaf\x1b\x06\xe9\x74\x9a\x64\x32\
+\x49\x32\x99\x20\x99\x4c\x91\x72\x00\x97\x0b\x84\xc2\x82\xcd\xce\
+\x41\x51\xcf\xa6\xc7\xe3\x61\xea\xf2\x4b\xd8\xf3\xe4\x7f\xd3\x37\
+\x32\xca\xec\x50\x10\xcd\x92\x18\x19\x10\x98\x19\x10\x84\x05\x9c\
+\x1a\x19\x81\x54\x9a\x0a\x45\x43\x84\x42\xd0\xd2\x84\xa8\xaa\x44\
+\xb3\x24\x72\x34\x61\x83\xc0\xaf\x52\x53\x53\x32\xa1\x24\xe8\x1f\
+\x88\xd0\x58\x53\x49\xb8\xc4\xcb\x58\x5f\xb4\x46\xea\x2c\x89\x1c\
+\xfa\xd7\xc7\xea\x56\xff\xc5\x59\xcd\x19\xb8\x90\x09\x21\x2e\x08\
+\x4e\x9c\x4e\x1d\xb8\x7b\xb7\x3c\x5c\x7f\x5f\x1f\x1b\x37\x6e\x3c\
+\xb4\x76\xed\xda\xcf\xff\xf4\xa7\x3f\xfd\xc6\xd3\x4f\x3f\xfd\x1f\
+\xdb\xb7\x6f\x7f\x3e\x12\x89\x04\x83\xc1\xe0\xac\x80\xdf\x2f\x42\
+\xc1\x20\xc1\x40\x00\xcd\xe3\xc9\xb8\x7d\xdd\x8a\xdc\x36\x83\x73\
+\xc0\xe0\xf4\x70\xc3\x79\x6f\x98\x76\x6f\x4f\xa5\x6c\xe6\xc7\x63\
+\x31\xe2\xf1\x38\xf1\x44\x82\x54\x32\x49\x2a\x95\xca\xd4\x24\xd6\
+\x75\x3d\xaf\xce\x7f\x46\x25\xe4\xc6\x11\x14\x05\x9f\xd7\x47\x28\
+\x14\x22\x14\x0a\xa0\x05\x83\xf8\x4b\x4b\xd8\xf6\xf4\x26\x4c\x29\
+\x99\x5b\x56\x8a\xa1\x1b\x98\x45\x41\x20\x39\x35\x3c\x8c\x4c\xea\
+\x54\x08\x35\x0b\x82\x4a\x47\x12\x8c\x26\xd0\x47\x46\xd1\xfc\x5a\
+\x51\x10\x28\x42\x90\x36\x2d\xfa\x06\x22\x4c\xa9\x2e\x27\x18\xd4\
+\x88\xf4\xc6\x5b\x31\xc5\xf4\x96\xdb\xef\xf9\xe5\x1f\x12\x00\x90\
+\x55\x07\xae\x24\xd8\xd9\xd2\xd2\x72\x6d\xee\xe8\xc0\x35\x0c\x35\
+\xcd\xae\x14\xee\x30\xff\xe0\xba\x75\xeb\x3e\x71\xf8\xf0\xe1\xd7\
+\x2c\xcb\x8a\x59\x96\x15\x1b\x1a\x1a\x3a\xbe\x65\xcb\x96\x8d\x7b\
+\xf6\xec\xd9\x16\x89\x44\x4a\x35\x4d\x9b\x16\x08\x04\x94\x60\x20\
+\x40\x28\x14\xc4\xe7\xf3\x39\xd2\x43\x64\x86\x87\xd9\xc9\xa1\x76\
+\x6f\xd6\x75\x1d\xdd\x59\xd5\xdb\x65\x7e\x32\x99\x20\x99\x4a\x66\
+\x54\x4d\x3a\x9d\x46\x4f\xa7\xd1\x75\x9d\x74\x3a\x45\x3a\xed\x82\
+\x20\xab\x16\xc0\x4e\xd5\xf2\x7a\xbd\xf8\xfd\x7e\xc2\xa1\x20\x3e\
+\x9f\x17\xd3\x30\xe8\xe9\xee\xe6\xb5\xd7\x5e\xeb\xfd\xd5\xcb\xaf\
+\xfc\x6b\xe9\xe1\x83\xa9\xae\x64\x6a\x6a\x99\x47\x65\x56\x59\x29\
+\xc9\x64\x0a\xd3\x61\x5a\x2e\x08\x42\x42\x72\x6a\xc4\x56\x07\x15\
+\x28\x36\x08\xa6\x36\xdb\xea\xc0\x74\x25\xc1\x58\x51\x49\x00\x20\
+\x14\x41\x52\x37\x19\x8e\x24\x69\xa9\xab\x40\xd3\x20\xda\x17\x9f\
+\xdf\xff\xdb\xef\x7a\x9b\x3e\xf4\x85\xdf\xfe\x21\x01\x00\xf9\x36\
+\x81\x2b\x09\xae\xa9\xab\xaf\x0f\x07\xfc\xfe\xcc\x82\x8d\xa6\x69\
+\xd2\xdb\xdb\xcb\xd3\x4f\x3f\x7d\x70\xed\xda\xb5\x9f\xe8\xec\xec\
+\xdc\xed\xfc\x2e\x89\xbd\xce\x8f\x05\x98\xbd\xbd\xbd\x47\x5e\x7b\
+\xed\xb5\xa7\xde\x7c\xf3\xcd\x97\x3a\x3a\x3a\xa4\x10\x62\x8a\xcf\
+\xe7\x0b\x06\x02\x01\xc2\xa1\x10\xa1\x50\x88\x60\xc0\xce\xf3\xcb\
+\x3a\x8e\x1c\x3d\xef\xf4\x68\xb7\x8a\x46\x2a\x95\x22\x9d\x4a\xa3\
+\xa7\x75\x5b\x42\xe8\x6e\x8c\x20\x0b\x18\xc3\xf9\xdc\x55\x07\x1e\
+\x8f\x87\x60\x30\x48\x28\x18\xc0\xef\xf7\x21\x90\x8c\x8d\x8d\x71\
+\xe4\xf0\x61\x9e\x7b\xee\xd9\x5d\x3f\xfa\xd1\x8f\xfe\xe5\xc7\x3f\
+\xfe\xf1\x43\x5b\xb6\x6c\x79\x3c\x26\xc4\xcb\x8d\x52\xde\xd6\x93\
+\x48\x06\x9b\x42\x01\x5a\x4a\x4b\x88\xc7\x13\x76\x63\x08\xc1\x48\
+\x2e\x08\x90\x9c\x1a\xc9\x91\x04\xc1\x10\x4c\x6b\x46\x54\x96\xa3\
+\x99\x20\x47\xe3\x0e\x08\x8a\xdb\x04\xaa\x22\x88\x26\xd3\x44\x62\
+\x69\xa6\xd6\x57\x20\x84\x45\x72\x28\x7d\xf9\xd0\x1b\x3f\x38\xd4\
+\xf0\xbe\xbb\x77\x9f\x8e\x6f\x93\x1a\x0c\x3a\x0d\xa9\x80\x0f\xa0\
+\xb5\xb5\xf5\xaa\x2f\x7d\xe9\x4b\x3f\xb8\xf1\xc6\x1b\xeb\xeb\xeb\
+\xeb\x01\x38\x75\xea\x14\x8f\x3e\xfa\xe8\xc1\x75\xeb\xd6\xdd\xe5\
+\x30\xdf\xc4\x9e\xfc\x98\xeb\xee\x53\x70\x2a\x96\x38\xef\xbd\xf5\
+\xf5\xf5\x6d\x73\xe7\xce\xbd\x76\xe5\xca\x95\xd7\xce\x9d\x3b\x77\
+\x59\x6b\x6b\x6b\x30\x1c\x0e\xe3\xf1\x78\x49\xa7\xd3\xf4\xf5\xf7\
+\x13\x8d\x46\x48\xa5\xb2\x7a\xdd\x72\x9d\x46\x4e\x5e\x80\xe5\x44\
+\x16\x2d\x69\x21\x2d\x99\x35\x12\x1d\xb7\xb2\x22\xec\xea\xa5\x65\
+\x65\xa5\x94\x97\x97\xa3\x79\x3c\x48\xcb\x22\x12\x89\x70\xf2\xe4\
+\xc9\x53\x3b\x77\xee\x7c\x79\xfb\xf6\xed\x1b\xf7\xed\xdb\xb7\xc5\
+\x30\x8c\x3e\xe7\x99\x4d\x20\x79\x93\xd7\xf3\xe1\xda\xb4\xfe\xe3\
+\x6a\x45\xe1\xf6\xb6\x66\x82\xa6\xe4\x60\xcf\x00\x51\x24\x71\x29\
+\x19\x33\x4d\x2a\x55\x95\x36\x9f\x0f\x9f\x37\xc8\xa8\xb7\x84\xd6\
+\xf6\x85\xb4\x5d\xba\x12\xb1\xe2\x52\x98\xd5\x06\xbd\x7d\xc8\x57\
+\xb6\x92\xdc\xbe\x9d\x74\xdf\x31\xb4\x50\x1a\xd3\x4c\xb0\x67\xd7\
+\x41\xba\x86\x23\x58\x6a\x76\x88\x18\xd3\x0d\x1a\x6b\x4a\x99\x37\
+\xb3\x92\x48\x22\x85\xe1\x15\xb1\xc0\xa2\xf0\x0d\x8b\xbe\xbd\xf7\
+\xe5\x09\xf9\xf6\x7b\x02\x00\x64\x41\x20\x5b\x5b\x5b\xaf\x7a\xf0\
+\xc1\x07\xbf\xfb\x9e\xf7\xbc\xa7\x59\x4a\xc9\x53\x4f\x3d\xb5\xef\
+\xa1\x87\x1e\xfa\x74\x57\x57\x97\xdb\xf3\x53\x14\xcf\x7d\xcf\x5d\
+\xda\xcd\xe3\x5c\x53\x2a\x8a\x52\xde\xd0\xd0\xd0\xd6\xde\xde\xbe\
+\x72\xd1\xa2\x45\x97\x5d\x7e\xf9\xe5\xef\x99\x3e\x7d\xba\x92\x48\
+\xa6\xe8\xef\xef\x23\x91\xb0\x43\xc2\x86\x69\x62\x39\x51\x41\x77\
+\x08\x68\xb9\xcb\xbb\x39\xa0\x90\x64\xeb\x0c\x90\x23\xf2\xed\x65\
+\x6a\xe3\x1c\x3b\x76\x7c\x6c\xef\xde\xbd\xdb\x0e\x1c\x38\xf0\xea\
+\xc9\x93\x27\xdf\x48\xa5\x52\x1d\x40\x14\x3b\x67\x2f\xe1\x3c\xbb\
+\x0e\xa4\x34\x41\xea\x3d\x42\xfc\xa4\xda\x92\x1f\x9d\xe9\xf5\xf0\
+\xe1\x39\xad\x18\x63\x49\x0e\xf7\x0c\x10\x39\x13\x08\x96\xaf\x44\
+\xac\xb8\xc4\x01\x41\x3f\xf2\xd5\x6d\x45\x41\xd0\x3d\x1c\xc1\xcc\
+\x01\x41\x3c\x6d\x30\xbd\xa1\x8c\x59\x6d\xe5\x8c\xc5\x75\x64\x89\
+\x72\xd4\xbf\x38\x7c\xe5\xfc\xf5\xbb\xbb\x8a\xf2\xed\xf7\x08\x00\
+\xb0\x19\xe6\x05\x94\xa6\xa6\xa6\x85\x73\xe6\xcc\x79\xaf\x65\x59\
+\xe6\xee\xdd\xbb\x9f\xe8\xed\xed\x3d\xe4\x34\xa2\x5b\x91\x64\xc2\
+\x5b\x39\x7b\xc5\xb9\x9e\x87\x6c\xe9\x1a\x29\x84\x28\x59\xb6\x6c\
+\xd9\x07\x3e\xfb\xd9\xcf\xfe\xdd\xac\x59\xb3\xc2\x43\xc3\xc3\x36\
+\x00\x0c\xdd\x1e\x32\xe6\xd4\x39\x74\xa5\x01\x52\xe6\x79\x15\x2d\
+\xd3\xcc\xd4\xd8\xb3\x93\x51\x55\xd2\xa9\x14\xcf\x3d\xf7\xdc\xee\
+\x17\x5f\x7c\xf1\x67\xc9\x64\xb2\x03\x88\x39\xcf\x9a\x00\xe2\x64\
+\x99\x9f\x76\x36\x03\x88\x37\xa8\x4a\xd5\xd5\x92\x4d\xd2\xb2\x66\
+\x5d\x12\xf0\x73\xdb\xc2\x99\x8c\xf4\x8e\x70\xe4\xd4\xe0\xe9\x41\
+\x30\x7b\x21\x6d\x97\x5e\x66\x83\xa0\xad\x15\xfa\x06\x90\xaf\x6f\
+\x27\xb9\x6d\x07\xe9\xfe\xd3\x80\xc0\x92\x24\x0c\x93\xb9\xad\x15\
+\x4c\x6d\x2e\x63\x2c\x9a\x42\x6d\xf4\x3d\xe3\x6d\xf3\xdf\xd4\xbe\
+\x7e\xd7\xb8\x94\xf2\x0b\x6d\x03\x14\x92\x3b\x3a\x10\x63\x63\x63\
+\xfd\x47\x8e\x1c\x79\xe9\xe8\xd1\xa3\xaf\x3a\xab\x79\xea\xce\x96\
+\x2b\xf6\x73\x37\x85\xf1\xb9\x9c\x12\x1b\x2c\x6e\x95\x0c\x15\x50\
+\xba\xba\xba\xde\x4e\x26\x93\x65\x73\xe6\xcc\x59\xa6\x69\x1a\xc9\
+\x54\xca\xae\x41\x98\xb3\xc2\x48\x66\x8c\x2f\xe5\x78\x15\x40\x36\
+\xef\x00\x29\xd1\x54\x8d\xc3\x87\x0f\xc5\x1f\x7f\xfc\xf1\x1f\xa4\
+\x52\xa9\x5e\xb2\x8b\x4b\xba\x92\xc8\x07\x04\x80\x20\x10\xca\xd9\
+\xc2\x51\x29\xa3\xa6\x22\x0e\xd5\xc3\xcd\xdd\xba\xe1\x31\xe3\x49\
+\x96\xcd\x6e\x41\x33\x25\xf1\x68\x02\x29\x6c\xc3\xb0\xa8\x4d\x90\
+\x48\x53\x81\x8a\x08\x04\xa1\xb1\xc1\xb6\x09\x0c\x89\x1c\x4b\x64\
+\xfd\x04\xb5\x65\x24\xc6\xa2\xc4\xe2\x8e\x4d\xe0\xb4\x56\xef\x48\
+\x92\xd2\x80\x87\x9a\xaa\x10\xc9\xe1\x54\x9b\xea\x51\x82\x35\x1f\
+\xfc\x1f\xe3\x56\x4e\xfb\x7d\x03\x00\xb2\x4c\x73\x19\xed\x16\x33\
+\xca\xcd\x7a\x75\x99\x5d\xc8\xfc\xdc\xe3\xc2\x73\x72\x93\x02\x3c\
+\x83\x83\x83\x91\x65\xcb\x96\xfd\x69\x65\x55\x95\xe6\xae\xdb\x93\
+\x61\x7e\xee\xc3\x38\x92\xc0\x4e\x29\x70\xa5\x42\xd6\x4e\x40\x08\
+\xd2\xa9\x24\x87\x0f\x1f\x1e\xda\xbd\x7b\xf7\x66\xe7\x39\x5d\x35\
+\xe4\xc5\x66\x7e\x10\x08\xe3\x30\xdd\xd9\x4a\x80\x52\xa0\x6a\x10\
+\xba\xbc\x8a\x12\x2b\x85\xcb\x3b\x13\x29\xbc\x69\x9d\x25\xed\xcd\
+\x28\x29\x8b\x78\xec\x34\x20\x18\x1e\xc6\x4a\xa4\xa8\x44\x45\xf8\
+\xfc\x30\xa5\xde\x1e\x1d\x18\xd2\x31\x0c\x23\x68\x81\x6c\xec\x20\
+\x0b\x02\x81\x25\xa1\x7b\x28\x4e\x43\x45\x80\xd2\xb0\x8f\xd4\xa8\
+\xb1\xa2\x6f\xdb\xe1\x97\x16\x9d\x00\x00\x0f\x12\x49\x44\x41\x54\
+\xf7\xf6\xd6\xde\xf4\xf9\x7d\xb9\xcc\xf8\x43\x95\x8b\x77\x47\x07\
+\xc5\x6a\xdb\x8c\xcb\xd8\x26\x1b\xb6\x16\x45\xce\x29\x3c\x5f\x00\
+\x44\x22\x91\xb1\x48\x24\xa2\x9b\x86\xe1\x2b\x29\x2d\x25\x11\x8f\
+\xe3\x71\x7c\x02\xa6\x69\x64\x3c\x89\x96\x30\xc1\x14\x08\x0c\x4c\
+\x29\x72\xb2\xc9\x1d\x43\xd0\xb2\x17\x6a\xd4\xd3\x69\x21\x84\xf0\
+\x4a\x29\x7d\xce\x73\xe7\x4a\x24\xf7\xff\xb8\xc7\x2e\x98\x75\xc0\
+\xb4\xa4\xac\x7b\xd3\xb2\x5e\xd3\xe0\x89\x26\xb8\xe5\xc9\xee\x01\
+\x7c\x5e\x8d\xd5\x17\xb5\x22\x25\x1c\xed\x1b\xb4\xaf\xa4\xaa\x0c\
+\x99\x26\xa4\x52\xb4\x01\x65\x12\x8e\x1d\xd8\x85\x85\x64\xa6\x65\
+\xa1\x98\x16\xb4\x4d\x45\x5c\xb2\x18\xbf\x94\xf0\x86\x24\x3d\x70\
+\xdc\xce\x27\x58\x30\x1b\x76\x1d\xa0\x7b\x38\x82\x57\x55\x40\x55\
+\x18\x33\x0c\x5e\x79\xbb\x8f\x1b\x97\xb6\x10\x56\x35\x91\x3c\x9c\
+\xfe\xce\xbe\x2f\xcc\xdf\x35\xe7\x9b\xbb\x0f\xba\x0d\xfb\x87\x00\
+\x40\x2e\x63\x25\xe3\x45\x3d\x45\x3e\x3b\x53\xef\xcf\xdd\x34\xc0\
+\xa3\xaa\xaa\x16\x08\x04\x44\x28\x14\xc2\xeb\x0c\x37\x75\x3d\x8d\
+\xa1\xdb\x4e\x21\xdb\x51\x64\xdb\x05\xb9\xde\x3f\x5d\xd7\xc9\x2d\
+\xa7\x97\x71\x58\xd9\xd7\x0e\x90\xa3\xc6\x0a\x9e\x59\x16\x1c\xbb\
+\x9b\x09\x58\xa6\x94\xfa\x36\x78\x1a\x68\x98\x02\xcb\x7e\x79\xfc\
+\x14\x1e\x8f\xca\xaa\x85\xd3\x60\xa7\xe4\x68\xdf\x50\x51\x10\x94\
+\x03\xc7\xf6\xef\x44\x4a\xc9\x2c\x29\x51\x2c\x03\x5a\xa7\x21\x2e\
+\xb9\x18\xbf\x94\xc8\x1d\x16\xfa\xe0\x49\xd4\xd2\xf1\x20\x28\xd3\
+\x34\xba\x63\x69\x5e\xdb\xd7\xcb\x35\x8b\x9b\x10\x49\xa3\x26\x75\
+\xca\xfc\xde\xae\xfb\x17\x5c\xbf\xe0\xe1\x5d\x49\xf8\xc3\x49\x80\
+\x5c\x86\x16\xbe\x2f\xc6\x6c\xf7\x58\x2d\x38\x16\x45\xbe\x53\x00\
+\x8f\x10\x22\xa0\x69\x1a\x3e\xbf\x9f\x40\x30\x84\x47\xf3\x60\x5a\
+\x81\xcc\x28\xc0\x34\x0d\x0c\xdd\xf1\x0a\xa6\x6d\x9f\x40\x3a\x9d\
+\x26\x9d\x4a\x91\x4e\x2b\xa4\x48\x21\x75\x99\x31\x06\x11\x28\xd8\
+\xa2\xdd\x2e\x36\x34\x3e\x72\x5c\x08\xec\xdc\x63\x09\x58\x26\x18\
+\x3b\x04\x4f\x69\x88\x12\x29\x65\xfb\x63\x87\xba\xf0\x7a\x34\x56\
+\x2c\x9c\x0a\x3b\x99\x10\x04\x95\x02\x8e\x1f\xd8\x85\xb4\x2c\x66\
+\x99\x26\xaa\x69\x42\x5b\x2b\x62\xe9\x22\x02\x96\x65\x4b\x82\xa1\
+\x93\x78\x4a\x83\xcc\x5b\x30\x0b\x1c\xc3\x50\xa8\x0a\x35\x5e\x0f\
+\x6f\xf7\x8e\x52\x77\xc4\xc7\xe2\xf6\x06\x46\x86\x52\x57\x12\xb0\
+\x1e\x00\xfe\x06\xfe\xb0\x00\x70\xf7\x85\xbd\x5a\x29\xb2\xa9\x39\
+\x7b\xb5\xc8\xfb\xcc\x39\x42\x08\x57\x02\x94\x0a\x21\x84\xc7\xe3\
+\xc9\x54\x18\xc9\x0d\x0e\xb9\xf1\x01\x37\x10\xa4\xa7\xec\x0c\xe2\
+\x64\x32\x41\x32\x91\xb4\x97\xa9\x13\xf6\xe8\xc1\x59\x10\x42\x15\
+\x76\xa5\x54\x4f\x4e\xee\x42\x6e\x4f\xcf\x25\x59\xb0\x77\x8f\xa5\
+\x2e\x49\x6f\x15\x3c\xb9\x4c\x08\x0d\x29\x67\xfc\x74\xdf\x09\x24\
+\x70\xd9\x19\x40\x50\x2e\x25\xc7\x0f\xec\xc2\x32\x2d\x66\x9b\x26\
+\x9a\xe1\x80\x60\xc9\x22\xfc\xa6\x09\x6f\x59\xe8\xc3\x9d\x68\x05\
+\x20\x08\xa9\x0a\xff\x6f\x75\xd7\x16\x23\xc7\x71\x5d\xcf\xad\x47\
+\xbf\xe6\xb5\xb3\x0f\x2e\x37\xe2\x8a\xd4\x72\x49\x8b\x2f\xf1\x21\
+\x8b\xb6\x13\xc1\x02\x1c\xd8\x1f\x36\xf2\x80\xf2\xe1\x00\xfe\x36\
+\x02\xfd\x04\xf9\xc8\x57\x90\xaf\x04\x09\x02\x04\x48\x02\x04\x81\
+\x3e\x92\x8f\xc4\x71\x9c\x00\x74\x0c\x25\x16\x82\x58\xb1\x24\xd3\
+\x02\x1c\x98\xf4\x43\x24\xc5\x85\xb4\x14\x49\x91\x12\xb9\xda\xe1\
+\x72\x1f\xb3\xf3\xea\xee\xaa\xba\xf9\xe8\xae\xd9\xd9\xcd\x46\x4a\
+\x9c\x40\xab\x14\x50\xe8\xae\xea\x99\xe9\x9e\xbe\xa7\x6e\xdd\x7b\
+\xeb\x54\x55\x43\x6b\xfc\xe0\xe6\x0a\x66\xc6\xab\xd8\xbf\xaf\x06\
+\xb9\x62\x7e\xfb\xcd\xe7\x4e\xbe\xfc\xf8\xf3\x6f\xbc\xbc\x97\x5d\
+\xc0\xce\x96\xed\x85\x3f\x2a\x54\x6f\x6c\x49\x59\xac\x11\xa3\x00\
+\x28\x21\x84\x04\x20\x99\xb9\x64\x64\x93\xff\x8e\x12\x42\x28\x6b\
+\x6d\xa0\x94\x6a\x14\x54\xf5\x82\x0c\x4a\x00\x78\xc7\x40\x14\x33\
+\x23\xf4\x40\x88\x63\x44\x69\x8a\x41\x3f\x42\x2f\xe8\x41\x6b\x8d\
+\x9e\x94\x18\xa4\x69\xb9\x3a\x89\x14\x42\x88\x2a\xb6\x1a\x8d\x2b\
+\x81\xc0\x00\x1c\x6f\xfd\xf0\xa8\x5d\xe3\xca\xfb\x8c\x02\x25\xc8\
+\x98\xcd\x65\xa2\xef\x3c\x55\x8c\x4b\x1f\xfe\xdb\x85\x3b\x60\x30\
+\x9e\x3e\x7d\x10\x74\x05\xb8\xb9\x0b\x08\xe6\x98\xd1\x0c\x80\xbb\
+\x37\xae\xc3\x31\xe3\x98\x73\x50\xd6\x02\x87\xe7\x20\x9e\x3a\x8b\
+\x88\x1d\xf0\x3a\x23\x5f\xbb\x07\xd5\x18\x01\xc1\xfa\x26\x9a\x4a\
+\xa2\x9f\x5a\xbc\x7c\xe5\x3d\xfc\xda\x2f\x1c\x46\x35\x0e\x34\x2d\
+\xe7\xcf\x5f\xfd\xcd\x93\xe7\x3f\x6a\x00\xec\x26\xfc\x51\x10\x0c\
+\x5b\x33\x11\x49\x29\xa5\x24\x22\x25\x84\xf0\x42\x57\xbe\xcc\xcc\
+\xaa\x6c\xed\x4a\x08\x31\x3c\x0a\x21\x02\x6b\xad\x0e\xc3\xb0\x5a\
+\xad\x54\xe4\xf4\xbe\x29\x44\x71\xbc\xb5\x29\x25\x30\x54\xe0\x3b\
+\x39\x01\xa6\x1c\x21\xec\xf7\xfb\xe8\x75\xbb\xe8\x74\xba\xe8\x74\
+\x3b\x10\x04\x2c\x2e\xbe\x05\xad\x75\xe8\x9c\x2b\xa4\xce\xec\x4a\
+\x99\x0f\x01\xc0\x05\x2b\x65\x5b\x3d\xb6\x1b\x87\x28\xcb\xba\x04\
+\xc1\x4b\x67\x81\x67\x00\x1c\xff\x9b\x85\xbb\x48\x1d\xe3\x73\x27\
+\x67\x81\xeb\x84\x9b\xcb\x3b\x0c\xc3\x2c\xc3\x1c\x80\x66\x00\xbc\
+\xf7\xf6\x75\x38\x67\x71\xdc\x5a\xe8\xb2\x3b\x10\xe7\xce\x20\xb4\
+\x0e\x7c\xc5\xc1\x6c\x2c\x6d\x03\xc1\xdd\xb5\x36\x1a\x5a\x61\x6d\
+\x90\xe3\xd5\xd7\xdf\xc3\x17\xce\x1f\x44\xbd\x3a\x79\x04\x1b\x9d\
+\x3f\xdd\xeb\x4d\xa3\x76\x1a\x52\x00\x40\x5a\x6b\x92\x52\x0a\x29\
+\xa5\x20\x22\x51\x9e\x4b\x21\x84\x94\x52\x7a\x10\x68\x22\x1a\x9e\
+\x0b\x21\x02\x0f\x00\xe7\x5c\x40\x44\xb4\xbe\xb1\xb1\x2e\x84\xd8\
+\x27\x85\xd8\xda\x91\xdc\x4f\x01\x2b\xd3\xe8\xa8\xa4\x56\x0a\x61\
+\x10\x20\x0a\x43\x24\x71\x8c\x38\x8e\x11\xc7\x11\xf2\x2c\x43\xa7\
+\xd3\x59\x0b\x82\xc0\x12\x91\xda\xc1\x33\x70\xcc\xec\x9c\x73\x1e\
+\x04\x1e\x10\x8e\x99\x05\xb6\xb4\x83\xbf\x46\xcc\xcc\x44\x14\xe4\
+\x80\xb9\x0c\x7c\xff\x1c\xc1\xce\x32\x4e\x7d\xfd\xcd\x77\xb1\x39\
+\xc8\xf1\xcb\xc7\x1e\x03\x11\xf0\xf6\xfb\xbb\x83\x60\x3c\x20\x2c\
+\xdf\x79\x0b\xce\x39\x1c\xb7\x16\x61\xd9\x1d\xc8\x27\xcf\x20\x72\
+\x0e\xfd\xab\x8c\x7c\x63\x09\xba\x04\x01\x5f\x5d\x44\xe7\xe1\x06\
+\xaa\x5a\xe1\xee\x4a\x1b\xeb\x3d\xe0\xc0\xd1\x19\x54\x1f\xbe\xff\
+\xe5\xbd\x04\x00\xef\x96\xa3\x28\x62\xa5\x14\x94\x52\xac\xb5\x46\
+\xd9\x87\xfb\x3a\x2a\x39\xfb\x54\x2e\x2b\x47\xa2\x48\xb2\x04\x89\
+\x2a\x01\x12\x64\x59\x96\x5f\xbc\x78\xf1\x9f\xe3\x38\xfe\xd2\xf4\
+\xf4\xf4\x78\xf1\xce\x47\xa7\x93\xf9\xc9\x4c\x5b\x0c\x21\x94\x91\
+\x51\x6b\x0c\xac\x73\x9c\xe7\x39\x06\x83\x01\x5d\xbb\x76\xad\xb5\
+\xb4\xb4\xf4\xc6\xd4\xd4\x54\xe6\x9c\x13\x79\x9e\x4b\x63\x0c\x59\
+\x6b\xc9\x39\x27\x46\xe8\x6a\x5c\x02\x81\x98\x99\x4a\xa0\x50\x99\
+\xdd\x28\xd8\x4a\xac\x28\x26\xb2\x3f\x06\xbf\x96\x0b\x1a\x1c\x76\
+\xfc\xd4\x0b\xef\xbc\x8f\x7e\x66\xf0\xec\xf1\x43\x10\x44\xb8\xb1\
+\xb4\xb2\x2b\x08\xc6\x04\xa1\x75\x77\x11\xce\x5a\x9c\x30\x16\x51\
+\x6e\x80\x23\x73\x90\xe7\xce\x20\x76\x16\xfd\xab\x16\xf9\xc6\x83\
+\x02\x04\xa7\xe6\xd1\x7b\xfd\x4d\xdc\x5b\xef\xe0\xf4\xa9\xc3\x98\
+\x3e\xf8\x28\x4c\x66\x91\x24\x49\xf6\x51\x87\x82\x81\x0f\x30\xfa\
+\xb4\xd6\x32\x49\x12\x19\x04\x81\x48\x92\x44\xc7\x71\x2c\xe3\x38\
+\x56\x51\x14\xe9\x30\x0c\x95\xd6\x5a\x07\x41\xa0\x55\x91\xb4\x6f\
+\xf9\x52\xca\x40\x29\x35\x3c\x0a\x21\x42\x00\x49\x9a\xa6\xa1\x10\
+\xa2\x49\x44\x55\x21\x84\x2a\xb5\x88\x1a\xcd\xbe\x8e\x88\xe4\x08\
+\xa1\xc4\x1a\x63\x5c\x9e\xe7\x36\xcf\x73\xee\xf5\x7a\xbd\x2c\xcb\
+\x4c\xd9\x3d\x88\x7e\xbf\xaf\xfa\xfd\xbe\xcc\xb2\x4c\xa6\x69\x4a\
+\xe5\xf7\xb8\x1c\x7d\x74\xd6\xda\xa1\x46\x18\x39\xf2\x8e\x2a\x0f\
+\x02\x00\x70\x0c\x98\xa3\x44\x27\x4e\x39\xf7\xb4\x00\xd4\xa7\xc7\
+\xab\xf8\xf2\x27\x0e\xa1\xd3\xda\xc4\xe2\xfd\x15\x6c\xc2\x6d\x0b\
+\x1b\x3f\x16\x04\x88\xa3\x2a\x56\x45\x88\x89\x99\x43\x38\x79\xf6\
+\x3c\xe2\x27\x9e\x00\xe6\xe7\x80\xcd\x2e\xec\xa5\x1f\xa3\x7f\xfd\
+\x1a\x4c\xef\x01\x74\xdd\xa1\xb7\xb1\x84\xde\x20\xc7\xbe\xc3\x87\
+\xe0\xb4\x44\xb8\x6f\x06\xfd\xf4\xde\xbf\xef\x85\x06\xf0\x2e\xd4\
+\xa8\xf5\xcc\x44\xc4\x49\x92\x70\xa5\x52\xe1\x5a\xad\x26\x1b\x8d\
+\x06\x35\x1a\x0d\xae\x56\xab\x88\xe3\x98\xe2\x38\xa6\x28\x8a\x48\
+\x6b\x4d\x41\x10\x08\xa5\x94\x95\x45\x72\x42\x08\x96\x52\xb2\x52\
+\x8a\xcb\xa5\x63\x98\x8a\xf5\x8b\x15\x33\x6f\x32\x73\x2a\xa5\xd4\
+\x52\x4a\x0f\x1a\x55\x96\x95\x94\x52\xed\x00\x80\xcb\xf3\xdc\x18\
+\x63\xac\xb5\xd6\xe6\x79\x6e\xd3\x34\x35\x79\x9e\xbb\x4e\xa7\xe3\
+\xda\xed\x36\xb5\xdb\x6d\xd5\x6e\xb7\xd5\xe6\xe6\xa6\xee\xf7\xfb\
+\x72\x30\x18\x88\xc1\x60\x40\x79\x9e\xb3\xb5\x96\x4a\x30\x38\x6b\
+\xed\x50\xf0\xd6\x5a\xe7\x27\xc2\x00\x45\x7f\xe0\x4a\x56\x6b\x19\
+\x92\x96\x8b\xcc\xd7\xfa\x44\x9d\x4f\x32\x7f\xee\xd2\x6a\x27\x59\
+\xfb\xc9\x5b\xf8\xca\xd1\x47\x71\x74\xff\x38\x6e\xb4\x56\x8b\x85\
+\x90\x47\x34\xc1\x63\xe8\x60\x22\x02\x56\xee\xdd\xc6\x15\xe7\x70\
+\xca\x5a\x54\x8c\x01\x8e\xcc\x43\x9e\x3b\x8d\xc8\x5a\xf4\xaf\xbf\
+\x01\xdb\x5b\x43\x32\xf9\x08\xaa\xa1\x86\xc9\xfa\xd0\x63\x13\x50\
+\x53\x33\xf8\xf6\xbf\xbd\xf6\x9d\xbd\x8c\x04\x6e\x03\x02\x11\x71\
+\xbd\x5e\x77\xf5\x7a\xdd\x4d\x4f\x4f\xf3\xf8\xf8\x38\xc6\xc7\xc7\
+\xb9\xd9\x6c\x22\x49\x12\x8a\xe3\x98\xc2\x30\xa4\x30\x0c\x49\x29\
+\x25\x94\x52\x24\xa5\xb4\x42\x08\x2b\x84\x30\xde\x4e\x90\x52\xda\
+\x91\xfa\x0c\x80\x5f\x85\x94\x77\x64\x10\x11\x4b\x29\x59\x08\xc1\
+\x00\xac\x57\xe1\xd6\x5a\x33\x9a\xb3\x2c\xcb\xb3\x2c\xb3\xbd\x5e\
+\xcf\x6d\x6e\x6e\xf2\xea\xea\xaa\x58\x5d\x5d\x95\x2b\x2b\x2b\x7a\
+\x7d\x7d\x5d\x6f\x6c\x6c\xa8\x6e\xb7\x2b\xd3\x34\x95\x69\x9a\x52\
+\x96\x65\x43\x30\x94\x40\x18\xfd\xcf\x0c\x80\xcb\xad\x75\x86\x2a\
+\x80\x8a\x42\xf0\x2e\xf3\xed\x3e\xd1\xb7\x3f\x45\xf8\xc5\xdb\x69\
+\x3e\xf9\x57\x0b\xb7\xf1\x2b\xb3\x53\x98\x6b\x56\x71\x7b\xad\x0b\
+\x72\x0e\x90\xd8\x06\x82\xc9\xa8\x8a\x95\xa5\x3b\xb8\xea\x1c\x4e\
+\x59\x83\xaa\xb1\xc0\x91\x79\xa8\xb3\xa7\x11\x5b\x07\x46\x1b\x24\
+\x06\xc8\xd7\x5a\xd0\x51\x05\xe1\xd1\x33\x48\xdb\xf7\xfb\x7f\xf6\
+\xd3\x3b\xdf\xda\x4b\x00\xf8\xe4\xca\x17\x80\x89\x89\x09\x39\x33\
+\x33\xe3\xf6\xef\xdf\x6f\xf6\xed\xdb\xc7\x53\x53\x53\x5c\xaf\xd7\
+\x51\x6a\x01\x94\x36\x01\xfb\xad\xe2\x4a\x21\xd2\xe8\x4a\xa3\x25\
+\x2d\xdc\x0b\xd9\x0a\x21\x1c\x11\xd9\xd2\x68\xd4\x44\xa4\xbd\xb1\
+\x88\xd2\xab\xa0\x62\x15\x49\x01\x00\xcc\x6c\x9d\x73\xd6\x39\x67\
+\x9c\x73\xc6\x18\x93\x97\xe7\x79\x96\x65\xa6\xdf\xef\xbb\x76\xbb\
+\xcd\x0f\x1f\x3e\xa4\x56\xab\x25\x5a\xad\x96\x7e\xf0\xe0\x41\xb0\
+\xb6\xb6\xa6\xdb\xed\xb6\xee\x74\x3a\x43\xaf\x25\xcb\x32\x62\x66\
+\xe1\x85\x2d\x84\xf0\x5d\xee\xd0\x55\x1c\x61\x28\xfb\x06\x11\xac\
+\x30\xaf\x7c\x0f\xf4\xe2\xa7\x09\x9f\x95\xd6\xcd\x7d\xe3\x9d\x65\
+\x7c\xbe\x59\xc3\xa1\x4a\x00\xd7\x4d\x01\x47\x20\x29\xb1\xb6\x13\
+\x04\xad\xbb\xb8\xf2\x93\xc2\x26\x18\xb3\x06\x38\x72\x18\xea\x57\
+\x3f\x0f\xb4\xde\x05\xbf\xbd\x08\xaa\x8f\x41\x8e\x37\x81\xd9\x03\
+\x78\xe1\x2f\x2f\xfc\xc3\xa5\xb5\xc1\xb5\xbd\xec\x02\xfc\xb9\x6f\
+\x01\x38\x78\xf0\x20\x0e\x1c\x38\x40\xb3\xb3\xb3\x3c\x33\x33\x83\
+\x5a\xad\x86\x4a\xa5\x82\x38\x8e\x11\x45\x11\x6b\xad\x9d\x52\xca\
+\x09\x21\x9c\x94\xd2\x13\x2f\x1c\x11\x99\x91\x9c\x0b\x21\x34\x8a\
+\x68\xa0\x1e\x11\xbc\xf2\x00\x40\xe1\x66\x6a\x1f\x3f\x20\x22\xc1\
+\xe5\x8a\xd3\xde\xaa\x07\x60\x98\xd9\x38\xe7\x0c\x33\x1b\x66\x36\
+\xbe\x6b\x68\x34\x1a\xb6\xd1\x68\xb8\xb1\xb1\x31\x34\x9b\x4d\xd9\
+\x68\x34\xe4\xf2\xf2\xb2\x6e\xb5\x5a\x61\x10\x04\x61\xbb\xdd\x0e\
+\x3b\x9d\x8e\x76\xce\x05\xce\x39\x65\xad\xf5\xc3\xd5\xfe\x3e\x1e\
+\x08\x34\x22\x78\x9f\x04\x80\xa0\xcb\x9c\x7d\x0f\x78\xf9\x49\xa2\
+\xf5\xc7\x99\xcf\xbe\xb4\xb6\x49\x9f\xac\xc4\x38\x1a\x04\xc8\x33\
+\x83\x41\x39\x2b\x79\xcd\x5a\x88\x2c\xc3\xa1\x12\x04\xab\x0f\xef\
+\xe3\x8d\x2b\x8c\xe3\x26\xc7\xf8\xcc\x04\x30\x37\x03\xb8\x69\x90\
+\x50\x90\x71\x04\x4c\x4d\xa2\xfd\xca\x0b\xed\x3f\xf8\xc1\xeb\xcf\
+\xff\x3a\x91\xfe\x38\x68\x00\x00\xc5\x06\x55\xf5\x7a\x9d\x8f\x1c\
+\x39\x82\x99\x99\x19\x37\x3b\x3b\x0b\xad\x35\x6b\xad\xb9\x52\xa9\
+\x70\x10\x04\x16\x85\x9a\xb6\xa5\x11\x98\xa3\x18\x8a\xcd\x46\x62\
+\x02\x7a\x34\x26\x50\x06\x8a\x14\x00\x59\xd6\xfb\x58\xc2\xb6\x88\
+\x22\x6d\xcd\x2e\xf5\x2d\xd1\x16\x8f\xe4\x2c\x33\x5b\x14\x60\xb0\
+\x71\x1c\x1b\x63\x8c\xab\x54\x2a\xa6\x52\xa9\x70\xa3\xd1\x70\xf5\
+\x7a\x9d\x6b\xb5\x9a\xac\x56\xab\x32\x8e\xe3\x20\x0c\xc3\x40\x29\
+\x15\x02\x88\x00\xc4\xce\xb9\xc8\x18\x13\x12\x91\x77\x4f\x75\xe9\
+\x1e\x2a\x0f\x86\xf2\x15\xf8\xb0\xb8\x07\x84\xb4\x00\x2e\x01\x97\
+\xd7\x05\xad\x7f\x8a\xf1\x99\x1f\x75\xfb\xf1\x4a\x96\xe3\x89\x28\
+\x86\x05\xd0\xca\x73\x38\x66\xbc\x93\xe7\xe8\x31\xe3\x13\x60\x34\
+\xc3\x1a\xdc\x46\x0b\xe9\xea\x12\xdc\xcd\x45\x88\xac\x0f\x9c\x3c\
+\x09\xcc\xcd\x01\xcd\x06\xb0\x70\x15\x7f\xf2\xf7\x5f\x7b\xfe\x5a\
+\x37\xbf\x01\x20\xd9\xeb\x38\xc0\x30\x31\x33\xcf\xcf\xcf\xf3\xb3\
+\xcf\x3e\x4b\x44\x44\x95\x4a\x85\xdb\xed\x36\x6b\xad\x39\x0c\x43\
+\x27\x8b\x7d\x56\x05\x11\x19\x21\x84\x74\xce\x0d\xa3\x84\xcc\x2c\
+\x89\x68\x18\x11\x2c\x5f\xf0\xb0\x75\x97\x79\x78\x8d\x99\xc5\x88\
+\xda\xa7\xa1\x3f\x88\x6d\x51\x3b\x57\x16\xbd\x46\xb0\xce\x39\x1b\
+\x86\xa1\xcb\xf3\xdc\xc5\x71\xec\x2a\x95\x8a\x8b\xa2\x88\x2b\x95\
+\x0a\x92\x24\x21\xad\xb5\x37\x28\x03\xe7\x5c\x94\xe7\x79\x98\x65\
+\x59\x25\xcb\xb2\x98\x88\x12\x22\x8a\xf3\x3c\x8f\x9c\x73\xa1\x73\
+\x2e\x40\xb9\x1f\x93\x07\x04\xb6\x22\xa2\x5b\x99\x39\x58\x64\xdc\
+\x5a\x27\xda\x78\x5a\xd0\xcf\xcb\xdc\x4c\x77\x6d\x17\x27\xa2\x08\
+\x53\x5a\x63\x39\xcb\xd0\x75\x0e\x6f\xa5\x29\xba\xce\x61\xde\x18\
+\x3c\x52\x05\xc2\x7e\x07\xe9\xc2\x02\x42\x1d\x40\x1c\x3b\x06\xcc\
+\xff\x1c\xb0\xd9\xc5\x85\x3f\xfc\xdd\x8b\xbf\xbf\x70\xf7\xef\x50\
+\x0c\x61\x77\x3f\x36\x00\xa8\xd5\x6a\x78\xee\xb9\xe7\x30\x35\x35\
+\x05\x94\x5d\xc3\xd8\xd8\x18\xa8\x58\x27\xc6\x0f\xbf\xa2\x3c\x52\
+\x9e\xe7\x12\xc5\xbe\x96\xa2\xf4\xc9\xa5\x10\x82\x50\xa8\x59\x51\
+\xfa\xfd\xbe\x75\x7b\x41\x0b\x14\x6a\x97\x9c\x73\xbe\x0c\xec\x32\
+\x90\xe3\x03\x3a\x18\x31\xdc\x84\x10\x16\x00\x82\x20\x70\x00\x38\
+\x49\x12\x17\x04\x01\x92\x24\xe1\x66\xb3\x89\x5a\xad\x86\xd2\x5b\
+\x51\x42\x08\x6d\x8c\x09\x07\x83\x41\x58\x4e\xe3\x8e\x01\x54\x88\
+\xa8\x5a\x1e\x13\xe7\x5c\xec\x9c\x0b\x51\x00\xc1\x6f\xce\x35\xa4\
+\xba\x8d\xfc\xdf\xa0\xc5\xbc\xfe\x2f\xa0\xef\x7e\x46\xd0\xb9\xe3\
+\xce\x1d\xfb\x69\xbf\x8f\xb9\x20\xc0\x84\x52\x90\x44\x80\x31\x58\
+\x36\x06\x47\xc2\x18\xc4\x12\x2b\xcb\xef\x63\x7f\xb5\x8e\x48\x07\
+\x40\x7d\x0c\xb8\xbb\x84\x6f\xfe\xd6\x6f\x5c\xfa\xea\xbf\xbe\xf2\
+\x7b\xae\x60\x30\x59\x00\xf6\x63\x03\x00\x22\x42\x14\x45\xc0\x88\
+\x8d\x40\x44\x0e\x5b\xc2\xf1\x86\x93\x00\x00\xad\xb5\xf5\xd7\x4a\
+\xed\xf0\x41\xc3\xc9\xd8\x79\xcd\x5a\xbb\x1b\xef\xc0\xa7\xdd\x8c\
+\x54\xef\x2d\xf8\xeb\x8c\x02\x04\xc3\x3a\x63\x8c\x37\x48\x29\xcb\
+\x32\xd1\xef\xf7\x65\xb7\xdb\xd5\x59\x96\x05\x69\x9a\x46\x69\x9a\
+\x26\x44\x94\x30\x73\x95\x99\xab\x25\x18\x3c\x8b\x28\x2e\x73\x58\
+\x66\xdf\x7d\xf9\x67\x54\x03\x66\xf3\x2a\xe8\x87\xf7\x04\x2d\x3f\
+\xc3\x38\x7f\x3b\x4d\x93\x29\xad\x31\x29\x25\xac\x92\x98\x93\x01\
+\x26\x65\x02\x93\x5b\x08\xa1\x11\x4e\x4c\x83\xea\x4d\xe0\xd5\xef\
+\xe2\xcf\xff\xfa\x2f\x5e\xfa\x9d\xab\x57\xff\xb8\x03\x2c\xa1\xa0\
+\xac\xa5\x00\xcc\xc7\x06\x00\xc0\xd6\x24\x51\x6c\x77\x11\x77\xd6\
+\x79\xbe\xa0\x07\xc0\xae\x84\x90\x0f\x38\xf7\xa0\xf9\xa0\x47\xd9\
+\x69\x98\xfd\x57\xa3\x7b\xdb\xce\x4f\x9c\x38\xc1\x00\xf0\xe0\xc1\
+\x03\x31\x37\x37\xc7\xb7\x6e\xdd\x22\x21\x84\x0c\xc3\x50\xe6\x79\
+\xae\xaa\xd5\x6a\xd0\x6e\xb7\x43\x29\x65\x9c\xa6\xa9\xa7\x90\x79\
+\xf6\x50\x05\x5b\x60\x48\x50\xd8\x10\x11\xb6\x98\xd0\x05\x20\x98\
+\xc5\x22\xe3\xe6\x43\x21\x56\x9e\x21\x9c\x17\xc6\x3c\x6a\xd9\x61\
+\x56\x47\x98\xd6\x11\x0c\x3b\x4c\x8c\xef\xc7\xc1\xc7\x4f\x43\x45\
+\x31\x2e\x7f\xf3\x6b\xf7\xff\xe8\xf2\xc5\xaf\x7f\xab\x97\xfe\x13\
+\x80\x55\x14\x5c\xc6\x0e\x4a\x00\xec\x45\x24\x70\xd7\xd4\x68\x34\
+\x70\xe7\xce\x1d\x34\x1a\x8d\xff\xd6\xed\x46\x8e\xbc\x4b\xfd\x6e\
+\x9f\xfd\xb0\xdf\x1a\x4d\x1f\xf6\x52\x3e\xf4\xfa\x85\x0b\x17\xc4\
+\xf5\xeb\xd7\x19\x00\x16\x16\x16\xe8\xc2\x85\x0b\x3b\x19\xcd\xa3\
+\x74\xb2\x18\x3b\xb8\x84\xd8\x02\x42\x82\x2d\xad\x10\x60\xcb\x4e\
+\x70\x44\xc4\x4f\x12\x3d\xfe\x45\x41\x9f\x3d\x13\xc4\x51\x22\x14\
+\xa6\xe2\x26\x26\xc7\x27\x71\x83\x07\xef\x7d\xe3\xfe\xad\x17\xff\
+\xb1\xd3\x7d\x71\x03\xb8\x85\x82\x9d\xd4\x41\x31\xd7\xc2\x33\x97\
+\xdd\xff\x57\x00\xfc\x8f\xef\xcf\xff\x79\xc7\xd3\x9f\xe5\x1e\x3f\
+\xeb\xcb\xda\xe9\xe6\x8d\xf2\x1c\x7c\xff\xef\x3d\x87\x51\x4d\xe0\
+\xf9\x85\xbe\xec\x35\x82\x57\x5f\x39\x80\xee\x23\x82\xa6\x7f\x49\
+\xaa\x2f\xcc\x4b\xd5\x4c\xeb\x8d\xbb\xaf\x6d\xac\x5d\x7c\x25\x4d\
+\xbf\x9f\x01\xf7\x50\x08\x3b\x45\xc1\x5a\x1e\xa0\xdc\x47\xb0\xcc\
+\xff\x77\xb4\xf0\xbd\x4e\xff\x5b\x00\x7e\x04\x69\x37\x06\x91\x37\
+\x50\x7d\x9c\xc0\xab\x7b\x0f\x08\xcf\x36\x1e\x2d\x7b\xf7\xd5\x1b\
+\xa9\x06\x40\xaf\x29\xa8\xd6\x00\x45\xbd\x30\x5c\x6e\x0d\xfa\xf7\
+\xc0\xc3\x5d\x43\x47\x69\xea\x7e\x91\xd3\xa1\xa1\xfb\x1f\x16\xf0\
+\xeb\x28\x45\x9d\x2d\x30\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\
+\x60\x82\
+\x00\x00\x28\x2e\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x80\x00\x00\x00\x80\x08\x06\x00\x00\x00\xc3\x3e\x61\xcb\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\
+\x01\x00\x9a\x9c\x18\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\
+\x9e\x61\x4c\x41\xf7\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\
+\x25\x00\x00\x80\x83\x00\x00\xf9\xff\x00\x00\x80\xe8\x00\x00\x52\
+\x08\x00\x01\x15\x58\x00\x00\x3a\x97\x00\x00\x17\x6f\xd7\x5a\x1f\
+\x90\x00\x00\x27\xa4\x49\x44\x41\x54\x78\xda\xec\x7d\x79\x9c\x54\
+\xd5\x95\xff\xf7\xdc\xfb\x5e\xbd\xaa\xde\x1b\x68\x76\x44\x40\x16\
+\x05\x05\x44\x11\x14\xd7\x28\x46\x54\x34\xc6\xb8\x47\x93\x18\x67\
+\xa2\x99\x64\xe2\xcc\xc4\x8c\xf9\xcd\x24\x33\xf1\x33\x49\x66\x26\
+\xf9\x24\x13\x8d\x9a\x60\x14\x8d\x04\xe3\xbe\x6b\xa2\x80\x0a\x0a\
+\x2e\x18\x15\x65\x11\x59\x44\xf6\x6e\x7a\xef\xae\xaa\xf7\xde\xbd\
+\xe7\xf7\xc7\xbd\xaf\xea\x75\xd1\xec\xdd\xd0\x2d\x7d\x3f\x9f\xfa\
+\xbc\x57\x45\x51\x5d\xf5\xce\xf7\x7c\xcf\xf7\x9c\x7b\xee\x7d\xc4\
+\xcc\xe8\x19\x87\xef\x10\x3d\x97\xa0\x07\x00\x3d\xa3\x07\x00\x3d\
+\xa3\x07\x00\x3d\xa3\x07\x00\x3d\xa3\x07\x00\x3d\xa3\x07\x00\x3d\
+\xa3\x07\x00\x3d\xa3\x07\x00\x3d\xa3\x07\x00\x3d\xa3\x07\x00\x3d\
+\xe3\xf3\x3e\x9c\x3d\xbd\x81\x88\x0e\xe4\xf3\xa9\xe0\x18\x0d\xb6\
+\x8f\x9e\xd1\xf1\xa3\x3d\x83\xb5\xb9\xd6\xf1\xf9\x1f\xa7\x13\xbf\
+\x40\xdc\xc8\x5c\x00\x3a\x8a\xfd\xbb\xee\x01\x43\x87\x1a\x9a\xdb\
+\x61\x79\x19\xbb\xce\xbc\x4f\x0c\xb0\x9f\x86\x87\x03\xf4\x3d\x5e\
+\x88\x09\x15\xc5\x45\xc7\x94\x54\x56\x0e\xf4\xd3\xe9\x74\x53\x43\
+\xc3\xba\x95\x7e\xf0\xfe\x36\xe0\x33\x00\x0d\xf6\xcb\x39\x00\xd4\
+\xae\xbe\x60\xcf\xd8\xa3\x73\x09\x09\x94\x11\x50\xdc\x1f\xe8\x33\
+\x00\xa8\x08\x01\x16\x00\x29\x21\xb2\xab\xb5\xde\xd6\x0a\xd4\x30\
+\x90\x2d\xb8\xce\x1d\x06\x80\xf8\x97\xf2\x8e\x07\x4e\x3b\x75\xe4\
+\x51\x5f\x3e\x7b\xea\xd4\xb3\xc7\x8e\x1f\x3f\xac\xdf\x11\x43\x44\
+\x22\xe9\x41\x67\x7d\xd4\x6e\xdc\x88\xd5\xcb\x57\x34\x2f\x7b\xef\
+\xbd\xf7\xe6\x2f\x5f\xb1\xe0\x8d\xe6\xe6\xe7\xb7\x00\x2b\x00\x64\
+\x00\xb8\xf6\x0b\x86\x3d\x40\xd8\xbd\xd1\x13\x40\xd5\x38\x60\x6c\
+\x2f\xe0\xa4\xf1\xc0\x31\x03\x09\x63\x4a\x92\xc9\x23\xcb\x5d\xb7\
+\xb4\xbc\xb2\xd2\x91\x65\xa5\xf0\xb7\x6d\xa7\x70\xc7\x0e\xe7\x6d\
+\x47\xbe\xf5\x3f\xa1\xba\x24\x00\xea\x62\x8c\x9b\xff\xf0\x3d\xf5\
+\x03\xec\x46\x03\xe4\xbe\x98\x00\x92\x53\x04\xcd\xf8\xea\xe9\xa7\
+\x7f\xfb\xec\xf3\x2f\x38\x73\xf8\x09\x13\x49\x94\x95\x02\x61\x08\
+\xf8\x59\x20\x0c\x00\x15\x02\xac\x01\x0d\xa8\xc6\x26\x34\x6e\xd8\
+\x84\x0f\xde\x7c\xab\xe9\xc5\xc5\x4b\xe6\x3d\xbb\x61\xc3\x83\x1f\
+\x02\xaf\x01\x68\xb6\x9f\x1b\xb6\x87\xd6\xc3\xd8\xf0\xe8\x0d\x0c\
+\x3a\x1a\x98\x36\x11\x98\x3e\x46\x8a\x69\xc3\x7a\xf7\x1e\x3e\x60\
+\xcc\x18\xa7\x78\xc4\x08\x14\x1d\x39\x14\x45\x43\x8f\x44\x62\xf0\
+\x60\x20\x0c\x51\x37\x7f\x3e\x56\xcd\x9d\x8b\x85\x1b\x37\xbd\xf7\
+\x20\xf0\xb3\x35\xcc\xaf\x03\x68\x01\xd0\x0a\x20\xe0\x98\xd1\xf7\
+\x17\x00\x51\x0c\xc7\x71\xc0\x19\x37\x4c\x39\xe9\xdf\x2f\xba\xee\
+\xba\xb3\x86\x9c\x34\x19\x70\x25\x90\x6e\x05\x82\x00\x1c\x06\x40\
+\xa8\x8c\xf1\xed\x83\xc3\x10\x82\x35\xa0\x35\x10\x2a\xa4\xb7\xd5\
+\x60\xf5\xbb\xef\xf3\xd3\xaf\x2d\x7a\xe9\xe1\xb5\x6b\xef\x5b\x06\
+\xcc\xb7\x40\x00\x80\xc0\x02\xe1\x70\x62\x84\xdc\xb5\x95\x40\xd1\
+\x71\xc0\x94\x89\xc0\x65\x27\x3b\x72\xc6\xc8\x41\x83\x87\xf4\x9d\
+\x38\x01\x65\xc7\x1e\x8b\xa2\x51\x23\x21\x7b\xf5\x82\x28\x2e\x86\
+\x48\x26\x01\x10\x9a\xde\x79\x07\x6b\xe7\xcc\xc1\xc2\x25\x6f\x7e\
+\xf6\x14\xf3\xa3\x8b\x09\xcf\x68\xc6\x36\x6b\xfc\x7a\x00\xe9\x8e\
+\x00\x80\x00\xa0\xcb\x81\xb2\x4b\xfb\xf4\xf9\xe1\x77\x6f\xfc\xd6\
+\xf7\x8e\xbd\x68\xa6\x47\xa9\x24\x90\x69\x05\x07\x3b\x1b\x3d\xfe\
+\x9c\xc3\x10\x50\x01\x10\x86\x20\xa5\x40\xac\x00\xa5\x90\xad\x6e\
+\xc0\xaa\xa5\xef\xe3\xf1\x45\x6f\xfc\xf5\x4f\x9b\x36\xdd\xb9\xda\
+\x30\x82\x6f\x59\x20\xb0\x47\xfd\x39\x36\x3a\x45\xbf\xaf\x3f\x30\
+\x78\x1c\x30\xf3\x2c\xe0\xca\x89\xbd\x7b\x9d\x3c\x64\xfc\x71\xa2\
+\x72\xf2\x64\x24\x47\x8e\x84\x2c\x2f\x03\x0b\x09\x06\x43\x7a\x49\
+\x90\xeb\x22\xf3\xc9\x1a\x6c\x7c\xf4\x51\xbc\xf1\xca\x2b\xb5\x4f\
+\x6b\x7e\xf1\x75\xe0\x85\x16\xe0\x53\x6b\xf0\x06\x6b\xfc\x16\x7b\
+\x3d\xd5\x81\x00\x40\x00\xd0\x83\x80\x61\xb7\x4e\x9a\xf8\x87\xab\
+\x7f\xf8\xff\xce\xac\x38\x76\xac\x31\x7c\xd6\x07\x54\xdc\xf0\xca\
+\x52\xbf\x02\xc2\x10\x9c\x03\x83\x3d\x06\x36\x2c\x84\x01\x48\x85\
+\x80\xd6\xa0\x50\xa1\x75\xeb\x0e\xbc\xb7\xe4\xdd\xf0\xfe\xa5\xef\
+\x3e\xfc\x44\x43\xc3\x1d\xd5\xc0\x87\xd6\x23\x02\x1b\x1a\x3e\x4f\
+\x61\xa1\x8d\xe1\x87\x10\x46\x9d\xc1\xb8\xee\x74\x29\xae\x1a\x7b\
+\xe4\x91\x47\xf6\x3d\xf1\x44\x94\x4c\x18\x0f\xa7\xaa\x0f\x20\x25\
+\x58\x33\x20\x25\x84\xe7\x41\x16\x15\xc1\xdf\xb4\x19\x5b\x9e\x7e\
+\x06\x4b\x17\xcc\x4b\x3f\x93\xf1\xe7\x2d\x00\x9e\xaf\x03\x56\x5b\
+\xc3\x37\x59\xe3\x37\xdb\xe7\x7e\xc4\xa6\x71\x9b\xef\x0b\x00\x08\
+\x00\x0f\x01\x46\xfe\xcf\xf4\x73\x9e\xb8\xf4\x3f\xff\x73\xac\xd3\
+\xab\x02\x9c\x6e\xb1\x46\x55\xd6\xd3\x83\x18\x10\x62\xc6\x8f\x74\
+\x40\x18\x81\x20\xb0\xe7\x81\x61\x05\x0b\x04\xc1\x0a\x9c\x09\xb0\
+\x63\xed\x26\xcc\x5f\xf2\xee\xd6\x59\xab\x56\xdf\xfe\xb2\x0a\xe7\
+\x00\xa8\xb5\x17\xca\x8f\xe9\x83\xee\x5e\x84\xd3\x00\x30\x14\x18\
+\xff\x05\xe0\x9b\x67\x39\xf2\xb2\x31\xa3\x47\xf7\xad\x3a\x69\x32\
+\x52\xa3\x46\x81\x4a\x8a\xa1\xb5\x06\x91\x00\xa4\x04\x79\x1e\x9c\
+\xa2\x22\xa8\xc6\x26\xd4\xbc\xfc\x32\x3e\xf8\xcb\x5f\xf5\x0b\x8d\
+\x8d\x8b\x9f\x07\x9e\xd8\x06\x7c\x64\xbd\xbc\x19\x40\xa3\x05\x40\
+\x64\xf8\x36\x8e\xb3\x3f\x00\x20\x00\x28\x03\xca\x7f\x35\xed\x94\
+\x17\xae\xfb\xc5\x2f\xa6\xc8\xca\x32\x70\xba\x35\x46\xef\x2a\x6f\
+\x78\xeb\xf9\x1c\xf7\xf8\xc8\xe8\x41\x98\x7f\x4f\x04\x80\xe8\x79\
+\x10\xe4\x80\x22\x58\x21\x6c\x68\xc5\x9a\x0f\x3e\xc1\x23\xef\x7e\
+\xb0\xe8\xf7\x75\x75\x3f\xdb\x08\xbc\x61\x8d\x1f\xc4\xc2\x02\x77\
+\xd7\x18\x3f\x84\x70\xd4\x39\x8c\x7f\x38\x27\xe1\x7e\x63\xcc\xe8\
+\x51\xa5\xbd\x26\x4d\x82\x37\x62\x04\xc8\x75\xa1\xb5\x06\xa4\x00\
+\x49\x07\xe4\xba\x90\xc5\xc5\x60\xdf\x47\xc3\xdb\xef\x60\xd5\x0b\
+\x2f\xe0\xc5\xad\xdb\xfe\xf6\x2c\xf0\xd4\x3a\x60\xa9\x35\x78\x4b\
+\xcc\xf0\xad\x31\xc3\xab\xdd\x15\x82\xf6\x05\x00\xfc\x8d\x3e\xbd\
+\xff\xe3\x57\xb3\x66\xfd\xb8\x6c\xec\xd1\x31\xcf\xd7\xe6\xa8\xe3\
+\xc6\x56\xe0\xc8\xc3\xe3\xd4\xbf\x0b\xcf\x47\xee\x18\xd8\xd7\xcd\
+\x51\xe8\x10\xf0\x03\x34\x7e\xb6\x03\x0b\xdf\x5d\xde\xf8\xfb\x4f\
+\x3f\xbb\xe3\x59\xa5\x7e\x0f\x93\xd2\xa8\xd8\x8f\xe4\xee\x64\xf8\
+\xfe\x44\x83\xce\x61\xbe\x71\xba\x94\xdf\x3c\x66\xf8\xb0\x7e\xbd\
+\x27\x4f\x86\x37\xf4\x08\xb0\xe3\x00\x9a\x01\x29\x00\xc7\x01\x39\
+\x0e\x44\x2a\x09\x21\x5d\xb4\xae\x5a\x85\xb5\x2f\xbc\x88\x05\x6b\
+\xd6\xac\x7d\x02\x78\x6a\x19\xb0\xc8\xb2\x62\xa1\xe1\xb3\x7b\xd2\
+\x4c\xfb\x5a\x09\x24\x00\x4c\x40\xe5\xcc\xb3\xcf\xb9\xb2\x6c\xcc\
+\x28\x20\x93\x36\x9e\xaf\xb5\x31\xbc\xb6\x9e\xaf\x15\x58\x29\xf3\
+\x9a\x52\xf6\x75\x95\x0b\x05\x71\x20\x70\x5c\x24\xaa\xc0\x02\x23\
+\x6f\x7c\x84\x01\x54\xe0\x83\x54\x88\xb2\x7e\x29\x9c\x3b\xf5\xe8\
+\xb2\x61\xa5\x45\x3f\x3c\x76\xf5\xba\xa9\xf7\xb6\xa6\xff\x63\x1b\
+\xf0\x81\xa5\x51\x3f\xf6\x83\xbb\x74\x3a\xe7\x02\xa5\x5f\x04\xbe\
+\x36\x13\xb8\xf9\xb8\x21\x83\x87\x55\x4d\x3a\x1e\xde\xd0\x23\x00\
+\xc7\x85\xca\x64\xc1\x32\x84\x70\x1d\x80\xcc\x7f\x12\xae\x8b\x60\
+\xf3\x56\x6c\x99\x37\x0f\x6f\xfe\xed\xdd\xba\xc7\x35\x9e\x5f\x08\
+\xbc\x18\x00\x9b\xad\xb1\x1b\x63\xde\x9f\x8d\x89\xe6\xbd\xce\x9a\
+\x9c\x7d\xf8\x15\x45\xa5\xbd\x7b\xf7\x83\x10\xc6\xb0\x91\x71\x73\
+\x21\x40\x1b\xe3\xe7\xc2\x41\x81\xf7\x6b\x9b\x05\xb4\x61\x84\x20\
+\xcf\x0c\x05\x42\x91\x6d\x28\xe0\xc0\x87\x0a\x03\x48\x8f\x71\xcc\
+\xd8\xfe\xf8\xc7\x94\x38\x73\xcc\xf2\x0d\x63\xee\x6a\x6a\xfa\xaf\
+\x25\xcc\x8f\x58\x10\x88\x82\x1f\xdf\xa5\xe2\xbc\x00\x68\x32\x30\
+\xf3\x62\xe0\xd6\xa9\x7d\x7a\x4f\x19\x78\xdc\x38\x24\x87\x0d\x07\
+\x12\x09\x28\x3f\x00\x85\x6c\xd2\x67\x02\x58\x09\x48\x2f\x09\xce\
+\x66\x51\xb3\x70\x11\x3e\x7c\xfd\x0d\xf5\x64\x4b\xcb\x82\x17\x81\
+\x27\xea\x80\x4f\x62\x1e\xdf\x68\xe3\x7d\x26\x26\x90\xf7\x39\x5d\
+\xde\x5b\x00\x08\x0d\xd4\xbf\xbd\xf0\xb5\xd7\x4e\xbb\xf0\xfc\x0b\
+\x9d\x81\xfd\x8c\xf7\x47\x5e\xaf\x0b\xd4\xbf\x7d\xbd\x4d\x08\x88\
+\x1b\x5f\x05\x6d\xbd\x3f\x8c\x3f\xfc\x3c\x0b\x04\xf9\xa3\x0e\x7d\
+\x90\x0a\xd0\x77\x70\x09\xbe\xe4\x0c\x1a\x30\x74\xc5\xe6\xdf\xdc\
+\x5d\xdb\x74\xdc\x13\xd0\xbf\xcc\x32\xb6\xdb\x8b\x9d\x6d\x2f\xe6\
+\x1d\x42\xba\xd7\x43\x09\xe3\x2e\x67\xfc\xdb\x99\xa9\xd4\xe5\x43\
+\xc7\x8c\x42\xf1\xc8\x91\x40\x51\x0a\x2a\x0c\x01\x66\x90\x74\x01\
+\x57\x01\x0a\x86\xf2\xa5\x40\xeb\xaa\x95\x58\xff\xea\x42\xfc\x75\
+\xd3\xa6\x95\x0f\x03\x0f\xaf\x03\xde\xb2\x14\x1f\x29\xfb\xa6\x02\
+\x65\xbf\xdf\xc0\xdf\x1b\x0d\x40\xd1\x84\xc2\x40\x60\xfc\xcf\x4e\
+\x3d\x75\xce\xe5\xff\xf8\x9d\x91\xde\x11\x83\x80\xd0\x87\xf6\xb3\
+\xb1\x2c\x20\x1e\xe3\xf3\xe9\x1e\xab\xf6\x62\x7d\x3b\x71\x3f\xb0\
+\x00\xb0\x47\xec\x74\x34\xe7\x82\x03\x04\xf5\xad\x58\xbb\x72\x3b\
+\xe6\xec\x68\x59\xf8\x3b\xe0\xd6\x1d\xcc\xcb\xed\xc5\xc8\xc4\x54\
+\xef\x21\xa3\xfb\x5e\x44\x15\xe7\x82\x6f\xba\x40\xca\xef\x1d\x33\
+\x68\x50\x55\xd9\xe8\x91\x90\x15\x15\x60\x10\x20\x04\xe0\xb8\x20\
+\xc7\x01\x1c\x09\x92\x0e\x44\x2a\x05\xdd\xda\x8a\x9a\xb7\xdf\xc6\
+\x9b\xef\xbf\xdf\xf8\xb0\xe6\xa7\x5e\x05\x9e\x67\xb4\x29\xe4\x34\
+\xc5\xe8\x7e\xbf\x53\xe2\xfd\x11\x81\xc2\x94\xa0\xe1\xf6\x01\xc6\
+\x7f\x77\xe4\xc8\x9f\x7d\xfd\xab\xd7\x4c\x1b\x3c\xe5\x04\xc0\x73\
+\xc1\xd9\x2c\x38\xf4\x0b\xe2\x7c\x60\x69\xdd\x1a\x3b\x96\xf7\xb7\
+\x79\x04\x41\x1b\x8f\x37\x9f\x13\x18\x63\x47\xc7\xc0\xcf\x03\x23\
+\xf0\x01\xdf\x07\xe9\x00\xc8\x64\xb0\x75\x6d\x03\x9e\xdd\x9e\x59\
+\xf7\x2b\xe0\x87\xab\x99\x5f\xb2\x17\x26\x13\x53\xc0\x07\x3d\xad\
+\x9b\x4c\x98\x71\x39\xf0\x1f\x93\xcb\xcb\x4f\xec\x7b\xd4\x08\x24\
+\xfa\xf5\x85\x96\x12\x20\x61\x0d\xee\x02\x8e\x04\xa4\x03\x91\x70\
+\x21\x12\x1e\xd2\x9f\xae\xc7\x9a\xc5\x4b\xf0\x64\x5d\xfd\xdb\x8f\
+\x03\x73\x6a\xcc\x1c\x49\x64\xf8\x42\xba\x3f\xa0\xa2\xd8\xfe\xd6\
+\x01\x1c\x00\x49\xfb\xe8\x77\x5e\xd2\xbb\xfe\xc6\xd3\x4f\xff\xda\
+\x19\x33\xbe\x58\x59\x7a\xd4\x50\x40\xc0\x02\xc1\xa4\x7a\xac\x82\
+\x82\x38\xbf\x2b\xcf\xf7\x0b\x3c\x3f\xee\xed\x61\xee\x9c\x83\xe8\
+\x7d\x59\x20\xf0\xa1\x7d\x1f\xd0\x0a\x82\x19\x0d\x5b\xd2\x58\xb8\
+\xa9\xb5\xe9\x97\x9a\x6f\x7b\x83\xf9\x41\x4b\x8f\xd9\x83\xa4\x0b\
+\x72\x5e\x3f\x80\x68\xf0\x05\xe0\x5b\x2f\x76\xdd\x6f\x0d\x19\x34\
+\x50\x14\x0d\x19\x0c\x24\x93\xb6\xae\x2b\x41\x8e\x0b\x92\x0e\x20\
+\x25\xe0\x38\x10\x49\x0f\x08\x15\x6a\xdf\x7f\x1f\x8b\x97\x7f\x54\
+\xff\x47\x8d\x87\xdf\x04\xfe\x62\xd5\x7d\xa3\xa5\xfb\xc6\x82\x7c\
+\xfe\x80\xcb\xe2\x07\x52\x08\x8a\x40\x50\x04\x20\xd9\x07\x98\x70\
+\x69\x55\xd5\x37\xaf\x3d\xf5\xd4\xf3\xc6\x9f\x36\x55\x16\x0d\xea\
+\x07\x08\x40\x67\x33\x60\xdf\xdf\x29\xdf\xdf\xd9\xf3\x2d\x6b\x58\
+\x6f\xe7\xc8\xeb\x63\x9e\x9f\x03\x48\x90\xcd\x85\x00\x1d\x04\xe0\
+\x20\x80\xd6\x0c\x68\x06\x11\x23\x5d\x9b\xc5\xb2\x8d\xad\xb8\x3d\
+\xc4\xed\x8f\xb3\xfe\xa5\xbd\x70\x7e\x27\xeb\x82\x48\xe4\x89\xa9\
+\x44\x97\x5e\x4d\xb8\x6d\x52\x79\xd9\xa8\xf2\x21\x83\xe1\x94\x95\
+\x41\x53\x9e\xee\x21\x4d\x5a\x67\x80\xe0\x40\x26\x93\x08\xea\x6a\
+\xb1\x61\xe9\xbb\x78\xba\xba\xe6\x83\xb9\xc0\x6c\x5b\xf5\x6c\xb5\
+\x69\x6e\x54\xc5\xcb\x76\x74\xcd\x63\x7f\x01\x10\x81\x40\xda\x70\
+\x50\x64\xc1\x50\x36\x0c\x38\xf9\x8a\xfe\xfd\xae\xbb\xec\x94\x53\
+\xa6\x8d\x9a\x3c\x01\x45\xfd\xfb\x80\x49\x43\x67\x33\x79\x21\x97\
+\x33\x74\x18\xa3\x7c\x3f\x2f\xfc\x82\x60\xd7\x94\x1f\x8b\xff\xec\
+\x07\x50\x41\x00\xad\x34\xc0\x0c\xad\x34\x58\x33\x88\x80\xb0\x39\
+\xc0\x9a\xcd\x69\xdc\x95\xe5\x47\xe7\x80\x7f\xe4\x33\x6f\xb3\x17\
+\xb0\xa3\x41\x90\x2b\xe1\x0e\x16\x34\xec\x0a\xe0\x27\x67\x3b\xee\
+\x35\x03\xfb\xf6\x46\xb2\x4f\x1f\xb0\xe3\x80\x85\xad\xde\x49\xc7\
+\x0a\x3d\x6b\x7c\xd7\x85\x74\x5d\xb4\x6c\xd8\x80\x65\x1f\x7e\x18\
+\xde\x9f\xf5\x1f\xff\x0b\xf0\x18\x80\x6a\x0b\xda\x3a\x7b\x6c\x8d\
+\x4d\x86\x75\xa8\x9e\x39\x10\x00\x44\x3f\x3e\x6a\xe4\xf0\x2c\x10\
+\x3c\x00\x95\xe3\x80\x2f\x5c\x31\x60\xc0\x95\x17\x4d\x3e\x61\xd2\
+\x51\xc7\x8f\x45\xb2\x6f\x25\x98\x15\x74\x36\x6b\xbd\x39\x6e\xf8\
+\x30\x27\xf0\xb8\x4d\xcc\xcf\xe6\x45\xa0\x1f\x51\xbe\xf1\xf8\xe8\
+\xa1\x42\x05\xd6\x6c\x18\x40\x31\xb4\xd6\x60\x66\x10\x18\x3a\x1b\
+\x62\xf3\x56\x1f\xf7\x67\xf4\x82\x3f\x30\xff\xa0\x9e\x79\x8d\xbd\
+\x90\x99\x0e\x2a\x1a\xe5\x62\xfd\x74\x29\x2e\xbb\x14\xf8\xd9\x71\
+\x45\xa9\xe1\x65\x7d\x7a\x43\x14\x15\x81\x89\x00\xe9\xc4\x62\xbd\
+\x63\xbd\x5f\x42\x24\x12\x00\x33\x6a\x3f\x5e\x85\x85\x9f\x6e\xd8\
+\x76\x37\xe3\xde\x4f\x80\xd7\xad\xc1\x6b\x6d\xbc\x6f\x2e\x10\xb2\
+\x1d\xce\x5c\x07\x0a\x80\xf8\x85\x10\x30\x8d\x1c\x49\x00\x29\xcb\
+\x0c\x55\xc7\x03\xe7\x5e\x35\x70\xc0\x55\x33\xc6\x1f\x7b\xf4\xb0\
+\xe3\x46\x23\x59\x55\x0e\xad\x43\xcb\x08\x7e\x8c\x15\x82\x3c\x30\
+\x22\xaf\xf7\xfd\x9d\x32\x00\x0e\x02\xe8\xc0\xd4\x04\x74\xa0\xc0\
+\x4a\x43\x33\x1b\x10\x28\x0d\x58\x30\x30\x33\xc0\x0c\x0e\x14\x76\
+\xd4\x04\x78\x2c\xad\x97\xfe\x1f\xf3\xcd\x35\xcc\x2b\x6c\x38\x48\
+\x1f\x20\x08\x04\x00\x3d\x80\x68\xe0\x4c\xa2\x1f\x5f\x2c\xc5\xdf\
+\x0d\x2c\x2d\x41\xa2\xac\x14\xec\x48\x30\xc9\x9c\xb8\x23\xc7\x18\
+\x9f\xa4\x04\xb9\x0e\x44\x22\x01\x95\x4e\x63\xcb\xca\x55\x78\xb2\
+\xae\xfe\x83\x07\x09\xb3\x6a\x19\x2b\xad\xc1\x77\x58\xca\x6f\x39\
+\x18\x73\x1d\x1d\x05\x80\x38\x15\xca\x18\x10\x8a\xec\xf9\x80\x53\
+\x89\x66\x5c\xd9\xbf\xdf\x55\x5f\x38\x66\xf4\xb0\xa1\xe3\x46\x20\
+\xd1\xab\x18\xac\x42\xe8\x4c\x7a\x27\xe1\x67\x44\x9e\x6d\x1e\xf1\
+\xf3\x21\x80\x03\x65\x01\x10\x40\x87\x01\x38\x34\x94\x6f\x18\x20\
+\x7f\xce\x6c\xce\x75\x68\x35\x92\x66\x34\xd6\x85\x78\xbe\x55\xaf\
+\xf9\x39\xf3\x4d\xdb\x98\x97\x16\x30\x81\xde\x1f\xaf\x9f\x2c\x68\
+\xc6\xb5\x44\xbf\x38\xc1\x91\x47\x97\x94\x14\x81\x92\x49\x4b\xf7\
+\x4e\x4e\xe8\xb1\xe3\x18\xea\x77\x4c\xbc\x17\xae\x8b\x6c\x7d\x03\
+\xd6\xae\x5d\x83\x07\xd2\xd9\xe7\x9f\x26\x9a\x13\x32\x6f\xb1\x46\
+\xdf\x11\x2b\xe3\x1e\x94\xf9\x8d\x8e\x04\x40\x61\x58\x88\x80\x90\
+\xb2\x60\xf0\x3c\xe0\x88\x33\x84\x98\x79\x45\x55\x9f\x2b\x4e\x1f\
+\x3d\xbc\xff\xc0\x31\x43\x90\xa8\x28\x82\xf6\xb3\x39\x8d\x90\x17\
+\x7a\x7e\x1b\xaf\x57\x41\x18\xa3\xff\x10\x3a\x54\xd0\x5a\x1b\x6f\
+\x57\x0c\x8e\x00\xc0\xb1\x73\xc5\xb9\x1f\x48\x0c\x34\xd6\x87\x78\
+\x29\xad\xd7\xfe\x37\xf3\x3f\x6d\x34\x9d\x31\x41\x8c\x09\xf4\xde\
+\x1a\xbf\x92\xa8\x7c\xa6\xa0\x5b\x2f\x25\xfa\xe7\x41\xae\x74\xdc\
+\x64\x02\x90\x0e\x58\x4a\xa3\xea\x23\xaf\xb7\x62\x8f\x1c\xab\xf4\
+\x5d\x17\xad\xd5\xd5\x78\x7f\xe3\xa6\xf4\xac\x50\x3d\xb8\x18\x78\
+\xd6\x52\x7d\x9d\x35\x7e\xf3\xc1\xae\x5d\x74\x06\x00\xda\xd3\x07\
+\xf1\xd0\x90\x2c\x05\x46\x4c\x17\xe2\xf2\xcb\x2b\x2b\x2e\x3e\x79\
+\xd4\x11\x15\x7d\x47\x0e\x80\x2c\x49\x40\x65\x32\xe0\x6c\xb6\x8d\
+\xe1\x39\xb4\x06\xb7\x9e\x8f\x20\x34\xcf\x23\xea\xb7\xc6\xd7\x39\
+\xe3\x5b\x00\x28\xd3\x72\xc6\x30\x73\x2a\x60\x06\x18\xc8\x34\x2b\
+\xbc\x96\xd6\xdb\x7f\xa2\xf9\xbb\x1b\x98\xe7\xc7\x40\xb0\xbb\x39\
+\x84\x5c\x7a\x37\x5c\xd0\x09\x37\x0a\xfa\xbf\x93\x88\x4e\xae\x48\
+\xb8\x20\x47\x40\x83\x4c\x5e\x6f\xbd\x3e\x8a\xf5\x71\xda\x27\x21\
+\xd0\xb8\x6d\x3b\x16\xed\xa8\xd9\x76\x27\xe3\xee\x75\x8c\x25\xd6\
+\xdb\x6b\x62\xf1\xfe\xa0\x4f\x68\x75\x26\x00\xda\x63\x04\x2f\x0e\
+\x84\xbe\xc0\xb1\xe7\x13\x5d\x7b\x59\x79\xd9\x8c\xe3\x8f\xea\xef\
+\x54\x0e\xaf\x82\x48\x08\x03\x04\xab\xf0\x23\x83\x9b\x98\x1f\x9a\
+\x10\x10\x8f\xf5\x91\xf1\x63\xd4\xcf\xa1\x86\x95\x00\x60\xb0\x39\
+\x6a\x73\x4e\x0c\x64\x5b\x34\x16\x66\x74\xb5\x05\xc1\xbc\x3d\x80\
+\x80\x60\x7a\x1d\xc5\x4c\x29\xfe\xee\x2b\x84\x9f\x8e\x16\xa2\xd2\
+\x4b\x48\x68\x12\x60\x36\xef\x60\x08\x9b\xda\xe5\x53\x3c\x38\x12\
+\xc2\x75\x01\x00\x35\xdb\xab\xf1\x5c\x53\xd3\x8a\x7b\x81\xbb\x6a\
+\x19\x2b\xac\xd8\x8b\xc7\xfb\xe0\x50\x94\xae\x0f\x06\x00\x76\x95\
+\x31\xa4\xec\xb1\xe4\x48\x60\xca\xa5\xc0\xd7\x2f\x29\x4d\x4d\x1b\
+\x33\x6a\x00\x4a\x06\x55\x40\xb3\x42\x98\x31\x46\x8f\x53\xbf\x0a\
+\x43\xa3\xf6\xe3\xde\x6f\x3d\x1f\xcc\x46\x14\xda\x73\x6d\x25\x80\
+\x01\x00\x1b\xcb\x32\x40\xcc\xc8\x66\x34\x16\x65\xb8\xfa\xb6\xdd\
+\x83\x20\x12\x7a\x83\xae\x11\xe2\xe7\xd3\x89\xaf\xa9\x72\x04\x84\
+\x94\xb1\xe0\x4c\x80\xbd\x2e\x2c\x2c\xdd\x47\x4a\xdf\x75\xa1\x95\
+\xc6\x96\x1d\x3b\xf0\x50\x36\xbb\x68\x2e\x68\x96\xcf\xbc\xd1\x7a\
+\xfc\x8e\x58\x61\x27\x38\xc8\x95\xca\x43\x02\x80\xc2\xfa\x41\x21\
+\x10\x7a\x4d\x00\xce\xb9\x1a\xb8\xfe\xdc\xde\xc5\xa3\x86\x0e\xab\
+\x82\x5b\xee\x21\xf4\x03\x28\xdf\x07\xfb\xa6\xac\x1c\xf7\x7e\x6d\
+\x8d\x0f\x1d\x8b\xfb\x51\x4a\x18\x19\x9e\x39\xcf\x06\xd1\x73\x00\
+\x82\x81\x6c\x46\xe3\x0d\x3f\x07\x82\xf9\x96\x82\x5b\xe3\x93\x2a\
+\x13\x85\x38\xeb\x7a\xc2\x1d\xc7\x13\x8e\x2e\x71\x04\x98\x28\x67\
+\x78\x73\x4e\xf6\x19\xd9\xb4\x4f\xe6\x8c\xaf\x94\xc6\xba\xc6\x06\
+\xdc\x17\x84\x4f\x3c\xcb\xf8\x93\xa5\xfb\xda\x98\xd8\x3b\x94\x73\
+\x15\x87\x0c\x00\x85\x19\x83\x13\x4f\x1d\x3d\xa2\x21\x67\x31\x7f\
+\xe5\x2a\x21\xae\x9e\x5a\x55\xdc\xab\xf7\xc0\x52\x90\x03\xa8\x6c\
+\x00\x1d\xaa\x36\xd4\xcf\xda\x30\x41\x2e\xff\x8f\x74\x80\xa5\x7c\
+\x58\xfa\x8f\x34\x00\x5b\x4d\x10\x01\x81\x00\x04\x59\xc6\xeb\x01\
+\xaa\xff\x93\xf5\x37\x37\x6b\x5e\x62\xbd\xb1\x51\x00\xce\xa5\x52\
+\x7c\xef\x4a\xe0\xdf\x8f\x20\x14\xbb\x92\xac\x8b\x1a\x8f\x8f\x83\
+\x00\x20\x10\x59\x46\x10\x12\xd2\x71\x10\x28\x85\xe5\xe9\xd6\xec\
+\xdd\x8a\x1f\x58\xcc\xfc\x4c\xcc\xeb\x6b\x63\x55\xbd\x43\xde\xc0\
+\x72\xa8\x00\xb0\xab\xd4\x31\xca\x18\x92\x7d\x08\xe3\x66\x32\xae\
+\xbf\x2a\x21\x2f\x18\xd3\x3b\x45\xa9\x0a\x0f\x9a\x18\x3a\xd4\x60\
+\x65\x19\x80\xb5\x35\x6c\xac\x06\xc0\x71\xef\xdf\x99\x05\xc0\x80\
+\x46\xfe\x3d\x82\x19\x59\x9f\x31\x5f\xd1\xba\xff\xd6\xfa\x1f\xb6\
+\x32\x2f\xe9\x4f\x34\xe0\x5a\x21\x7e\xfa\x45\xf0\xcc\x5e\x82\x41\
+\x44\x6d\x29\x3f\x47\xfb\x04\x26\xe4\x59\x80\x08\x44\x02\x59\xad\
+\xf0\x6e\x18\xd4\xdf\xa1\x79\xd6\x0a\xcd\x0b\x62\x29\x5e\x5d\x4c\
+\xec\x75\x85\xa9\xea\x43\x0e\x80\xf6\x84\x62\x22\x06\x84\xd2\xa3\
+\x41\x67\x5e\x43\xf8\xfb\xf3\x52\xce\xb1\x03\x7a\x79\x90\x29\x07\
+\x4a\x69\x28\xc5\x60\x44\xe9\x5e\xac\x06\x80\x98\xa1\x77\x02\x43\
+\x5b\x20\x44\xe1\x80\x18\x48\x07\x8c\x97\x34\x7d\xfc\x34\xf8\xfe\
+\x2b\x41\xd7\x4f\x86\x1e\x9e\x12\xc6\xc0\xd1\xe7\xc4\x3d\x1e\x51\
+\x77\x5c\x04\x00\x22\x08\x00\xad\x4a\x63\x11\xab\xcd\xb7\x2b\xbe\
+\x73\x13\xf3\xdb\x36\xce\x57\x5b\x06\x68\xed\x6a\xcd\x2a\x5d\x05\
+\x00\xed\x09\xc5\x28\x2c\x78\x09\xa2\x41\x5f\x00\x2e\xbf\x86\xe8\
+\xda\xc9\xa5\x4e\x45\x71\x59\x02\x5a\xc0\xd6\xfe\xe3\x05\xa0\xf6\
+\x8d\x1d\x65\x03\x51\x5a\xd8\x06\x1c\x31\x61\xd8\x18\x32\x6a\x99\
+\xd0\x8f\x80\x84\x30\xa1\x23\xba\x26\xd1\xa5\xc9\x01\xc0\x5c\x90\
+\xfc\x83\x81\x66\xd6\xf8\x0b\xeb\x35\xb3\x14\xff\xa6\xc6\xf4\x24\
+\x34\xc4\xd2\xbc\x43\x2a\xf6\xba\x0b\x00\xda\x2b\x2d\xa7\x22\x20\
+\xf4\x27\x3a\xfe\x72\xd0\xb7\xbf\xec\xd2\x19\x43\x4a\x1c\xc8\xa4\
+\xc8\x17\x83\xac\x8c\xda\x5b\xaf\xcf\x19\x34\x66\x64\x44\xda\x81\
+\xf2\xff\x0f\xf9\x12\x42\xce\x67\x99\xf2\x94\x0f\x12\x00\x33\xea\
+\x98\xf1\x0c\xf8\x83\x3f\x68\xbe\xa3\xc5\xcc\x39\x44\x31\xbf\xbe\
+\x60\xee\x1e\x3d\x00\xd8\x37\x7d\xe0\xc4\xc2\x82\x07\xa0\x72\xaa\
+\x10\x17\x7f\x0d\xf8\xd6\x54\x8f\x06\x96\x16\x49\x70\xe4\xad\x71\
+\x16\x00\x6c\x6a\xb8\x6b\xaf\x67\xe4\x85\xa1\x41\x4f\x24\x12\x19\
+\x39\x7b\xb7\x07\x14\x11\x09\x3f\xe3\xf9\xdb\xc1\x78\x04\x78\xe3\
+\x41\xad\xef\x0a\x18\x9b\x6c\xac\xaf\xb1\xf4\x7f\xc8\x95\x7e\x77\
+\x05\xc0\xae\xc2\x42\x11\x00\xaf\x92\x68\xf4\x45\x44\x37\x5e\x2d\
+\x70\xd1\x11\x49\x82\x74\x85\x09\xac\x91\x97\xeb\x02\x43\x73\xcc\
+\xeb\x6d\x51\x08\x88\x33\x83\x7d\x2d\x66\xf0\xf8\x11\xcc\xb1\x0d\
+\x0e\x8c\xf1\x19\xc0\x36\x01\xfc\x91\xf1\xd2\xc3\x4a\xcf\xb2\xb1\
+\x7e\x47\x3b\x69\x5e\x97\x6d\x55\xef\x0e\x00\x88\x87\x85\x48\x24\
+\x46\xfa\xa0\x74\x82\xa0\xf3\xaf\x27\xfa\xee\x29\x12\x43\x4a\x3c\
+\x91\x63\x03\x1d\xa3\xfc\x9d\xbc\xbe\x00\x0c\xd8\x9d\xd7\xb7\x41\
+\x81\x39\x25\x1b\x06\x36\x0a\xc2\x2c\xf0\xa3\x2f\x28\x9e\x6b\x8d\
+\x5e\x13\xab\xe9\x67\xd1\x0d\xd6\x29\x74\x27\x00\x14\x66\x0b\x11\
+\x1b\x24\x2a\x88\x46\x5d\x2c\xe8\xdb\x57\x12\x5d\x3c\xd8\x35\x55\
+\x58\x15\xf7\xee\x02\x0a\xdf\x5b\xaf\x8f\x5f\x8f\x9c\x58\x04\xa0\
+\x08\x58\x23\x85\xba\x87\xf1\xa7\x05\x4a\x3f\x66\x73\xfb\x9a\x82\
+\x1c\x5f\xa1\x1b\x2c\x52\xe9\x6e\x00\x28\x14\x89\x71\x6d\x50\x36\
+\x41\x88\x0b\xae\x27\x7c\x77\xaa\xc0\x90\x94\x4b\x6d\x0c\xcf\x1c\
+\xdb\xa3\x66\x17\x5e\xdf\xf6\xd8\xd6\xeb\x23\xf4\x85\x44\x58\x2d\
+\x29\xbc\x93\x31\x7b\x89\xd2\x4f\x5a\xa5\x5f\xdd\x15\x73\xfc\xcf\
+\x33\x00\x76\x35\xb7\x90\xa8\x20\x1a\x73\x85\xa0\x9b\x2f\x21\x9c\
+\xd7\x5f\x18\x91\xae\xb9\x40\xf5\xef\xa5\xd7\x17\x1a\x3f\x43\x84\
+\x0f\x84\x68\xbc\x9d\xf9\xbe\x95\x5a\xcf\xb7\x46\xdf\x86\xfc\xb2\
+\x2c\xbf\xab\xa5\x79\xfb\x02\x80\xee\xb6\x4d\x1c\x23\xbf\x26\xb0\
+\xd5\x8a\xae\xd6\x7a\xe6\xe5\x77\x2b\xfd\x2f\x3f\x61\xdc\xb6\x44\
+\xa1\xba\x29\x6c\x27\xe5\x8b\x87\x05\xb4\x4d\x19\xe3\x86\x2f\xf4\
+\x07\x9f\x80\xad\x84\xa6\x4f\x58\x2f\xb3\x7f\xb3\x1e\x05\xeb\xed\
+\xd1\x8d\x47\x77\xdd\x27\x30\x02\x42\x16\xf9\x15\x33\x75\x8b\x94\
+\x9e\xf5\x63\xe6\x9b\xdf\x02\xed\x68\x56\x9c\x9b\x27\x28\xd4\x00\
+\x39\xa1\x88\x9d\x29\xbf\x90\x6f\xca\x99\x31\x4d\xeb\x41\xd7\x48\
+\x79\x0d\xf2\x1d\x45\x9d\xd2\xac\xd9\x03\x80\xfd\x03\x41\x64\x94\
+\x1d\x95\x44\xa9\x0b\x89\x2e\x1e\xce\x5c\x96\x44\xbe\x81\x7e\x5f\
+\xbd\x3e\x2a\xf8\x45\x20\xe8\xcd\x8c\x8b\x81\x33\xa6\x4b\xf1\x15\
+\x6b\xf4\x84\x15\xa5\xd4\xdd\x01\xe0\xa0\xfb\x0f\x02\xe0\x0f\x11\
+\x74\xcc\x4d\x42\xfc\x61\x1a\xf3\x94\x12\xb0\x99\xb0\x89\x65\x04\
+\xbb\x8b\xf5\xed\x1a\x3e\xf7\xd1\xa6\xb5\x7f\x00\x6b\x5c\x29\xc4\
+\x0d\xeb\x59\x7c\xf4\xb1\xd6\x4f\x5b\xfd\x11\x01\xb0\xdb\xee\x58\
+\xd2\xdd\x44\x60\x7b\x0c\xa6\x27\x4a\x71\xda\x0d\x44\xf7\x1e\xcf\
+\x7a\x84\x47\x6d\xbd\x1e\xbc\x77\x86\xcf\xcd\xf5\xe4\xce\xa9\xcd\
+\x6b\x92\x4c\xd0\x7f\x1d\x62\xeb\x2f\x94\xfe\xc6\x76\xe6\xf7\xac\
+\x26\x68\x45\xf7\xd9\xa3\xa0\xdb\x8b\xc0\xb8\x6b\x12\x00\x7d\xae\
+\x14\x57\xdf\x02\x7a\xea\x44\xd6\x23\x3c\xd8\x82\x90\x8e\x7b\xff\
+\xde\x79\x3d\xc5\x3e\x3a\x6e\xfc\xdc\xbc\x0f\x11\x4a\x09\x98\x04\
+\xee\x7f\xa5\x14\x3f\xf2\x80\xfe\xb6\x2e\x91\xe8\xce\xa1\x54\x74\
+\x53\xe3\x33\x00\x5c\x2e\xc5\xf7\xbf\x0d\xcc\x1e\xc9\xba\x42\x52\
+\xdb\xf9\x56\x53\x07\xe0\x82\xba\x7e\x3b\x5e\xdf\x66\x92\x8f\x40\
+\x22\x0f\x88\xdc\x2c\x30\xd9\xe6\x0f\x41\xa8\x92\xc0\x59\x84\x29\
+\xe7\x4b\xf9\x3d\x00\xc5\xf6\x11\x69\x82\x1e\x00\x1c\x84\xef\xcb\
+\x92\x90\xbc\x4e\x8a\xff\xfb\x06\xf0\x3f\x83\xc0\x8e\xa0\x7d\xf7\
+\xfa\x9c\x87\xc7\x09\xa5\xc0\xeb\x8d\xe1\x63\xa0\x20\x40\x0a\xc2\
+\x11\x0e\x30\x53\xe0\xea\x13\x04\x7d\x39\x56\x98\x72\xba\xa3\x28\
+\x74\xba\x99\xf1\x75\x5f\xa2\xde\x5f\x93\xe2\x77\x5f\x64\xfe\x72\
+\x85\x35\xb4\xde\x07\x91\x17\x37\x3c\xc3\xec\x7d\x23\xa8\x40\x04\
+\x5a\x0d\x40\xd4\xf6\x39\x84\x79\x7f\x8a\x80\x31\x04\x79\x19\xcb\
+\x5b\x36\xb2\xfa\x78\xab\x69\x02\x89\xd2\xc2\x6e\xa5\x07\x44\x77\
+\x32\xfe\x60\x41\x47\xfc\x93\x23\x1e\xbf\x40\x1b\xe3\xe7\xfb\xff\
+\xf7\xcd\xeb\x85\xb5\xd6\x46\x29\xb1\x55\x48\xd3\x30\x5a\xe8\xf5\
+\x54\xc0\x04\xc2\x08\x41\x22\xd3\x21\xd4\xcb\x25\x4c\x72\xd1\xe7\
+\x0a\x29\xfe\xcd\x03\x06\x20\xbf\x34\x4e\x74\x37\x4a\xed\x16\xc6\
+\x1f\x2a\x68\xec\x2d\x42\x3c\x7f\xaa\xd2\xa7\x95\x10\xb7\x9d\x06\
+\xde\x43\xac\xcf\x19\xd2\x7e\x58\x40\x84\xd5\x52\xe8\xbb\x99\x9f\
+\x7c\x88\xf9\xb5\x8d\x64\xa6\x95\xa5\x30\x86\x17\xb6\xe7\x83\x04\
+\x81\x04\x41\x08\x93\x0a\x12\x99\x73\x12\xe6\x43\x87\x24\x09\xa7\
+\x3a\x38\x61\xba\x14\x37\x16\xe8\x81\x6e\x03\x82\xae\x1c\x02\x72\
+\x4a\x7f\xb8\xa0\x53\x7e\x20\xc5\xdc\xe3\xb4\x1e\x12\x29\xfd\xd8\
+\x94\xce\xee\x15\x7e\xec\x5c\x02\xf0\x05\xe1\x63\x21\xd4\x5d\x9a\
+\x67\x2f\x56\xfa\x79\x00\x61\x5a\x8a\xad\x97\x93\xb8\x6c\x04\x18\
+\x9e\x88\xfa\xfd\x72\x3d\x20\x10\x14\x0f\x07\x94\x0b\x0b\x8e\x20\
+\x8c\x2e\x12\xb8\xa0\x99\xaf\x5b\xa3\xf9\xbd\xe5\xcc\x4f\x76\xb7\
+\xfa\x80\xe8\xe2\x00\xd0\xc7\x0b\x71\xde\xad\x42\x3c\x3c\x21\x32\
+\x7e\x14\xeb\xf7\xd2\xeb\x23\x04\x48\x32\xb3\x7a\x9f\x90\xd0\x77\
+\x1a\xe3\x3f\x05\x33\xb1\xb3\xf9\x71\xa5\x7f\xfa\x47\xe6\x3b\x57\
+\x68\xe2\x56\x06\x9c\x9c\xc7\x03\x42\x58\x11\x68\x19\x41\x90\xd9\
+\xa0\x5f\x4a\xa3\x07\xca\x5d\x81\xf1\x45\xc2\xb9\xd4\x11\xff\xda\
+\x8b\x30\x06\xf9\x5d\x54\xba\x85\x28\x14\x5d\xd4\xf0\x02\x80\x3e\
+\x4d\x8a\x8b\xfe\x45\xd0\x43\xe3\xb5\x1e\xe8\x72\xdb\x86\xcd\xbd\
+\xf5\x7a\x10\x19\xe3\x83\xb0\x5e\x10\xee\x63\xfe\xb3\x9d\xd2\xad\
+\x03\xb0\x05\x66\x66\x6f\xc7\xb3\x4a\xff\xe2\x1e\xe6\xdb\x3e\xd4\
+\x14\x36\x30\xe0\x0a\x32\xc6\x2f\xd4\x05\x92\x0c\x23\x08\x82\x90\
+\x80\x26\x60\x70\x11\x61\x4a\x52\x0c\xba\x40\x88\xef\x0b\xa0\x02\
+\xf9\x15\xd2\xa2\x07\x00\xfb\x6e\x7c\x00\xd0\x17\x38\xe2\x6b\x37\
+\x11\x3d\x30\x42\xeb\x32\x73\xbf\x13\xde\x63\x0d\xbf\xd0\xeb\x89\
+\x8c\xc7\x32\x11\xb6\x08\x81\x07\x19\xcf\xcd\x53\xfa\xcf\x30\xb3\
+\x79\xdb\x91\xef\xdb\xaf\x07\xd0\xfc\xaa\xd2\xf7\xdc\xa9\xf8\x96\
+\x77\x42\xb4\xd4\x6a\xc3\x04\x32\xd2\x00\xd2\x7a\x7e\x4e\x0b\x90\
+\xd1\x0c\xc2\xb0\xc4\x31\x65\x12\x67\x25\xc4\xf4\x93\x84\xb8\x02\
+\xf9\x1d\x54\xba\x3c\x0b\x88\x2e\x68\x7c\xbe\xc8\x11\x37\x7c\x1d\
+\x34\x6b\xb8\xd6\x65\x0e\xec\x9a\x40\xde\x37\xaf\xcf\x79\x2c\x80\
+\x6a\x12\x78\x0c\x78\xfd\x69\xa5\xef\x47\xbe\x79\x33\x6a\xe6\x48\
+\xdb\x47\x33\x80\xd6\xa5\x5a\x3f\xf4\x5b\xa5\xff\x79\xa1\xcf\xd5\
+\x5b\xc3\x28\x1c\x50\xec\x61\xe8\x9f\x84\xd1\x06\x52\x9a\xac\xa0\
+\xc4\x25\x4c\xaa\x70\x30\x43\xd2\x77\xfa\x13\x1d\x8f\xfc\xa2\xd8\
+\x2e\x0d\x02\xd1\x15\x8d\x7f\x2d\xf0\xdb\x21\x5a\x39\x32\x5a\xec\
+\xb9\xaf\x5e\x6f\x5f\x17\x04\xd4\x83\xf0\x57\xc2\xc7\x0f\x29\x15\
+\x6f\xe0\x2c\x6c\xe6\x88\x7a\x0c\x5a\x00\x64\x57\x6a\x7e\xe2\xb7\
+\xa1\xfe\xc7\x45\x59\x54\x6f\x0e\xcc\x26\x9e\x26\x1c\x18\xfa\x17\
+\x12\xf6\x48\x16\x04\xa6\x65\x6c\x70\xb1\xc4\xd4\x32\xa7\xe2\x7c\
+\x12\xb7\x48\xa0\x8f\x65\x81\x2e\x9d\x15\x88\x2e\x69\x7c\xa5\x5d\
+\xc1\x6d\x27\xdb\xf7\xc5\xeb\x41\xd1\xe4\x0d\xe1\x2d\xa2\xda\x07\
+\x42\x75\xa7\xcf\xf8\xcc\x1a\x7e\x57\x9d\x3c\x91\x72\x6f\x01\x10\
+\x7c\xca\x3c\xef\x2e\xa5\xbe\x33\x3f\xcd\x1b\xd6\xa4\x19\x0e\x99\
+\xdd\x5f\x48\x5a\xfa\x97\x06\x08\x24\xcd\xb9\x14\x02\x10\xc0\x71\
+\xbd\x1c\x4c\x4b\x89\xa9\xd3\x04\x5d\x83\x7c\xd7\x92\xd3\x55\x41\
+\x20\xba\x92\xf1\xbf\x0a\xfc\x76\xb0\xd2\xae\x40\xbc\xa6\xbf\x7b\
+\xaf\xa7\x02\xaf\x07\x4c\x9c\xf6\x01\x2c\x27\xf2\x67\x69\xfe\x5d\
+\x0d\x23\x5a\xb1\x53\x0b\xd3\x3c\x92\x45\xfb\x9d\x3c\x11\x08\x5a\
+\x01\xf8\x1b\x98\x17\xdc\xa5\xd4\x8d\xf3\xd3\x7a\xdd\xaa\xb4\x86\
+\x23\x08\x8e\xa4\x58\x3d\x80\x6c\x38\x30\x60\x80\x00\x4a\x3d\xc2\
+\xd4\xbe\x2e\xce\x94\xe2\x86\xbe\x84\xf1\xb1\xac\xa0\x4b\xf6\x0f\
+\x88\x43\x6c\x7c\x8a\x1b\x7f\x88\xd2\xae\x44\xdb\x46\x8e\xdd\xba\
+\xbd\x45\x42\x2e\x04\xd8\x6d\xf9\x34\x80\xf5\x10\x78\x50\xf3\x9f\
+\xd7\x68\xbd\x10\x66\xb1\x46\xb4\x68\x63\x4f\xdd\xbb\x3a\x06\x82\
+\xec\x16\xe6\x77\xee\x55\xfa\xa6\x05\x2d\x7a\xed\xf2\x66\x65\x76\
+\x72\x97\x79\x11\x68\x1e\x80\x90\xe6\x5c\x11\x61\x44\xb9\x83\x69\
+\x7d\x12\xe5\xd3\x49\xdc\x2c\x80\x5e\x5d\x39\x2b\x38\xd4\x00\xd0\
+\xe7\x3a\xe2\xf2\x6b\x63\xc6\x8f\x2a\x7c\xd8\x4d\x35\xaf\x3d\xaf\
+\x37\xa2\xcc\x3c\xdf\x06\xc2\xe3\x8c\xd7\x5e\x53\xfa\x09\xeb\xf1\
+\xfb\xba\x68\x23\xaa\xe9\xa7\x01\x64\x37\x33\x2f\xbd\x4f\xe9\x6f\
+\xcf\x6b\xd6\x6b\x97\x35\x2a\xb8\x76\x33\x30\x11\x09\xc4\x28\x0c\
+\x48\x73\x0e\x01\x9c\x58\xe5\xe2\x8c\x22\x79\xfa\x09\x82\x2e\x29\
+\x08\x05\xd4\x03\x00\x9b\xe7\x9f\x2a\xc5\xcc\x6b\x80\xdf\x0d\x52\
+\xda\x95\x51\xcc\xdf\x83\xd7\x53\x81\xd7\xc7\xeb\xf5\x92\x08\x0d\
+\x4c\x58\xc8\xf4\xe9\x93\x4a\xcd\x46\x7e\x63\x86\x06\xec\x7b\xe3\
+\x46\xc4\x04\x69\x00\xfe\x66\xe6\xa5\xb3\x95\xbe\x69\x5e\xa3\x5a\
+\xbf\xbc\x51\x23\xe1\x08\x38\x0e\xd9\xd4\xd0\xa6\x8a\x8e\x49\x3b\
+\x43\x06\x4a\x1c\xc2\xc9\x7d\x13\x38\x47\x88\x6f\x55\x00\xa3\x91\
+\x6f\x65\x97\x87\x3b\x00\xa2\xf2\xee\xb4\x6f\x08\xba\x6f\xa4\xd2\
+\xe5\xce\x2e\x8c\xdf\x9e\xd7\x53\x81\xd7\x23\xca\xc9\xc9\x58\xf8\
+\x03\xa6\xf4\xfd\x5a\xff\x3e\x03\x6c\x40\x7e\x37\xae\x68\x3f\x9e\
+\x7d\x6d\xe2\xe4\x42\x10\x3c\xa8\xf4\x3f\xfd\xb5\x36\xa8\x5e\xd6\
+\xa0\x90\xb0\xb4\x2f\x1d\xe3\xfd\xb9\x46\x05\x06\x7c\xcd\x18\x51\
+\xe6\xe0\xd4\x0a\xb7\xdf\x59\x24\xfe\x1e\x40\x89\x05\x41\x97\x0a\
+\x05\xe2\x10\xfc\x3d\x3e\x52\xd0\xb8\xef\x4b\x31\x77\x74\xa8\x7a\
+\x39\xbc\x0b\xab\xc4\x9a\x32\x77\xe5\xf5\xb0\x85\x1e\x41\x26\xa8\
+\xaf\x67\xc2\x9f\x98\xe7\x6e\xd2\x1c\xdd\x47\x27\xae\xf8\xf7\xb7\
+\x83\x37\x0e\x82\x60\x03\xf3\xa2\xfb\x95\xfe\xce\x0b\xd5\x7e\xcd\
+\xca\x26\x8d\xa4\x4b\x39\x40\xc6\x7b\x10\xb5\x9d\xa1\x9c\x58\xe5\
+\xe2\x1c\x4f\x5c\x38\x86\xe8\xac\xae\x58\x1b\x10\x07\x9b\xf6\x07\
+\x11\x0d\xfa\xae\x14\x0f\x8e\x0b\xf5\xe0\x44\x3b\xc6\xdf\xc9\xeb\
+\xb1\x6b\xaf\x17\xc8\xc7\xfd\xad\x1a\x78\x42\xe3\xd5\xc5\x4a\x3f\
+\x63\xe3\x7d\x6d\x2c\xee\x1f\xe8\xaa\x9d\x36\x20\x58\xcf\x3c\xef\
+\xe1\x50\xdf\xfa\xdc\xe6\x6c\xf3\xea\x46\x85\x84\xa0\xdc\x42\x14\
+\x1d\x9b\xa6\x08\x35\x50\xe9\x09\x9c\xd4\xc7\x75\xa6\x0b\x71\x93\
+\x34\xd3\xc6\x51\x6d\x40\x1e\x4e\x00\x20\x00\xba\x94\xa8\xf4\x06\
+\x47\xdc\x33\x51\xe9\xf1\x49\xe6\x76\x8d\xbf\x4b\xaf\xb7\xc6\x8f\
+\xca\xbb\x88\x75\xe8\xd4\x33\xe1\x75\xa6\x8d\x4f\x29\xf5\x80\xa5\
+\xfc\x5a\x1b\xf7\xd3\xe8\xb8\x25\x5b\x6c\x35\x44\x2b\x80\x70\x25\
+\xf3\xd3\x4f\x06\xea\x47\x2f\x6e\xf4\xc3\x0d\x4d\x06\x04\xb9\x45\
+\xa6\x31\x11\xeb\x6b\xc6\x51\x15\x2e\xce\x28\x96\x63\x4f\x15\x74\
+\x45\x57\xab\x0d\x88\x83\x64\x7c\x10\x41\x5c\x26\xc5\x2f\x4f\x51\
+\xfc\xc5\x52\xcd\xed\xe7\xf5\xed\x79\x3d\xc5\x67\xe2\xa8\x4d\xcb\
+\x96\x23\x08\x19\x00\x1f\x31\xfc\x39\x5a\xdf\x97\x31\x77\xcb\x8c\
+\xdf\x29\xb3\xa3\xd7\xe8\xc7\xb3\x03\xff\x6d\xe6\x87\x9e\xf2\xc3\
+\x9f\xbf\xbc\xd1\x47\x4d\x5a\xc3\xa1\x18\xfd\x73\xbe\x41\xd5\x11\
+\x84\x89\x7d\x5c\x9c\x27\xc5\xb5\xbd\x80\xb1\x16\x04\x5d\x62\x6d\
+\xc1\xc1\x02\x00\x5f\x22\xc5\xcd\x5f\x62\xbe\xa1\x5c\xeb\x36\x77\
+\x3c\xa0\xbd\x88\xf5\x54\xf0\x1a\x6c\xfe\xad\x09\x58\xaf\x80\xc7\
+\x14\x3f\xb5\x4e\xf3\xe2\x18\xf5\xef\xaf\xe8\xdb\xd7\xec\x20\xbd\
+\x40\xf3\xef\x9e\xca\x84\xb3\x16\x6c\xcc\xa2\x35\xe0\x7c\x7b\x59\
+\xec\x47\x06\x9a\x51\x65\xca\xc4\xbd\xa6\x93\xf8\x3b\x00\xa5\xe8\
+\x22\x93\x45\xe2\x20\x7c\xbe\x9e\x28\xc5\xf4\xaf\x80\xfe\xab\xb7\
+\xd2\x88\xaa\x7c\x71\xaf\x8f\x7c\xbe\x4d\x85\x2f\x47\xf7\x6d\xbd\
+\x9e\xac\xe2\x97\x04\x6c\xd7\xc0\x4b\x0a\xcb\x5e\x56\xfa\xd1\x82\
+\xb8\xdf\xd9\x4b\xb5\x23\x26\xc8\x00\x68\x7d\x4e\xeb\xff\x7e\xa1\
+\x25\x7c\xee\x8d\xcd\x3e\x94\xce\xdf\x0b\x36\xae\x09\xb4\x66\x8c\
+\xea\xe5\x62\x86\x27\xbf\x68\x05\x61\xa2\x2b\x08\x42\xd1\xc9\x9e\
+\xaf\x87\x08\x1a\xfe\x75\xc2\xdd\x83\x43\xe5\xb9\xf6\xc2\x14\x7a\
+\x7d\xd4\x75\xdb\x56\x04\x52\xbb\x21\x40\x90\x99\xa1\x6b\x64\x60\
+\xa9\x42\xd3\xe3\x5a\xcf\xe6\xfc\x8e\x5c\x51\xdc\x3f\x18\x8d\x99\
+\x51\xd9\x38\xad\x81\xda\x47\xb5\xfe\xe1\xcb\x8d\xc1\xd2\xf7\xb7\
+\xf9\x36\x80\xc5\x99\x80\xa1\x18\x28\xf6\x04\x26\x56\x3a\xce\x05\
+\x24\x6e\x14\x66\x5d\xc1\x21\x9f\x2c\xea\xd4\x3f\x2c\x08\xde\x55\
+\x42\xfc\x7a\x9c\xe6\x61\x49\x98\x0e\x9a\x76\xbd\x1e\x71\xca\xdf\
+\xb9\x15\x3b\xd7\x92\x65\xe7\xe7\x03\x10\x3e\x09\x09\x8f\x28\x9e\
+\xbb\x9d\x79\x19\xf2\x77\xda\x68\xc5\xc1\xdd\x98\x29\x9a\x45\xf4\
+\x5b\x81\xcf\x1e\xd2\xfc\x83\x57\x6a\x83\x2d\x6b\xea\x02\x38\x64\
+\x7b\x18\xc0\x39\x16\x08\x35\x63\x60\xb9\x83\x33\x8b\xe4\xd8\x53\
+\x88\x2e\xed\x0a\x15\x42\xd1\x89\x9f\xcb\x97\x48\x71\xf3\x34\xc6\
+\x85\x25\x3a\xd6\xb3\xbb\x3b\xaf\xa7\x58\x53\xa6\xa5\x7b\x11\x6b\
+\xd4\x14\x76\x12\x66\x53\x08\xbc\xa0\x78\xf1\xdb\x5a\xbf\x68\xe3\
+\x7d\x7c\xa3\x86\x83\xbd\x62\x57\xdb\x90\x13\x6e\x61\xfe\xdb\x1f\
+\x95\xbe\x65\xd1\xb6\x6c\xcb\xf6\x66\x05\x87\xa8\xcd\x7c\x86\xb9\
+\x1d\x30\xe1\xe8\x5e\x0e\x2e\x92\xf4\xb5\x72\xd0\x68\x1b\x06\x0e\
+\x59\x85\x50\x74\x16\xf5\x0f\x17\x34\xf9\x7c\xd0\xad\x55\x5a\x41\
+\xe6\xe6\xeb\xf7\xde\xeb\xdb\xb4\x66\xdb\xee\x5c\x57\x02\x75\x0a\
+\x78\x2b\xe4\x9a\x67\xb5\xfa\xa3\x35\x7c\x74\x8f\x9d\x8e\xc8\xf7\
+\xf7\x37\x3d\xcc\xdd\xaf\x70\x15\xf3\x8b\x4f\x28\xfe\xd5\x3b\xdb\
+\x7c\xb4\x64\xb5\xe9\x48\xe2\x7c\x23\x6b\xa0\x18\x15\x45\x0e\xa6\
+\x16\xbb\x55\x67\x11\x5d\x8d\xfc\x96\x78\x87\x24\x2d\xec\x94\x3f\
+\x28\x81\xd4\xb5\x42\xfc\xef\x70\xc5\x65\x2e\x4c\xdf\xdc\x5e\x7b\
+\xbd\x7d\x22\x44\x5b\xaf\x77\x04\x90\x65\x60\x65\xc0\x78\x48\xe9\
+\x3f\xd6\x33\x56\xc7\x52\xbe\x56\x1c\xda\x6d\xd9\x38\x26\x0a\x83\
+\x97\xb5\xfe\xfd\x63\x19\xf5\xc8\x47\xdb\x7d\x68\x8d\xdc\x2a\x94\
+\xd8\xd6\x84\x18\x5a\xe9\xe2\x42\x87\x2e\xe9\x67\xba\x87\x0e\xd9\
+\x94\xb1\xe8\x0c\xea\xbf\xd0\x11\xdf\x9e\xc4\x7c\x5a\xb1\xd9\xa1\
+\xb7\xdd\xc5\x96\xbb\xf4\x7a\xbb\x00\x43\x50\xbe\x05\x4b\x58\x06\
+\xf8\x34\x00\x9e\x53\xfc\xca\x72\xe6\x57\x0a\xa8\xbf\x2b\x6c\xc8\
+\x18\x81\x20\xcb\x40\xd3\x93\x5a\xff\x64\x7e\x73\xf8\xc1\xfa\x1d\
+\x3e\x04\xa8\xcd\x14\x77\xa8\x18\x49\x4f\x60\x62\xa9\x93\xba\x90\
+\xe8\xeb\x36\x2d\x3c\x24\x5a\x40\x74\x34\xf5\x0f\x14\x34\x7a\x06\
+\xe8\x5f\xfb\xd8\x9d\xb9\x21\x68\x97\x8b\x2d\xdb\xf5\x7a\x11\x63\
+\x0b\xab\xfe\x5d\x01\xd4\x84\x8c\x37\x03\xde\xfe\x82\xd2\x73\xad\
+\xe7\x47\xd4\xdf\x95\x76\xe7\x8a\x6a\x04\x7e\x06\xd8\x38\x5b\xeb\
+\x1f\xbc\x5e\x17\xd6\xed\x68\x0a\x20\xed\x06\x93\xd1\x97\xd4\xcc\
+\xe8\x5b\xe6\x62\xba\x43\x67\x0e\x25\x9a\x6c\xb3\x01\xef\x60\xb3\
+\x40\x87\x32\x00\x01\x34\x43\x88\xef\x1f\x05\xf4\xf6\x84\x00\x0b\
+\xd1\xbe\xd7\xd3\x6e\xbc\x3e\xea\xb6\xb1\xef\x75\x04\x90\x66\x60\
+\x45\x16\xfc\x98\xd2\x0f\x36\x03\x6b\x62\xd4\x9f\x46\xd7\xdb\x91\
+\x53\x5b\x31\x1a\x6e\x62\xbc\x39\x47\xeb\xdb\x96\x55\xfb\x48\x67\
+\xb5\x89\x04\x16\x04\x4a\x03\x6e\x42\x60\x6c\xa9\xeb\x9e\x47\x74\
+\x25\x80\xf2\x43\x51\x1c\x12\x1d\xe8\xfd\x3c\x4e\xd0\x94\x33\x09\
+\xd7\x94\x48\x61\xee\x9b\x23\x29\x16\xf3\x0b\x96\x5d\xed\xc1\xeb\
+\xe3\xdd\xb7\xeb\xb3\x8c\xe7\x43\xfd\xea\x47\xcc\xaf\xc6\xa8\x3f\
+\x4a\xf9\xba\xda\xea\x9b\xf8\xfe\x45\x6a\x89\xe6\x87\x1e\x09\x78\
+\xee\xfa\x9a\x6c\x6c\xab\x3a\xf3\x2e\xa5\x19\x95\xa5\x2e\xce\x75\
+\xc5\xe9\x43\x89\x4e\x8c\x15\x87\x0e\x1a\x0b\x88\x0e\xfc\x20\x79\
+\xb6\xa0\xef\x0c\x14\xd2\x4b\x48\xb3\x97\xaf\x10\x02\x24\x85\x51\
+\xf1\xfb\xe0\xf5\xd1\x7b\x5c\x41\xa8\x0e\x80\x25\x3e\x6f\xff\x8b\
+\x6e\x43\xfd\x1d\x35\xcb\xd7\xd9\x20\xf0\x01\xb4\x3e\xae\xf9\xbf\
+\xe6\xb7\xea\x8f\x6a\xea\x03\x08\x9b\x1a\x9a\x7d\x8d\x4d\x13\xc9\
+\x98\x22\xe9\xce\x20\xba\x02\x40\xd9\xc1\xd6\x02\xa2\xa3\xbc\x7f\
+\xb4\xa0\x49\x93\x84\xb8\xa4\x3c\xe9\x81\xa4\x30\xc2\x2d\xc7\x04\
+\x22\x26\xf6\x62\x5e\x2f\x76\xf6\xfa\x68\x01\x86\x2b\x81\x0c\x03\
+\x1f\x66\x98\x1f\x53\x7a\x4e\x53\x9e\xfa\x1b\xd0\x0d\xf6\xe3\x8d\
+\xe9\x81\x20\x03\xde\x78\xbf\xd6\x3f\x7a\xb7\x21\x68\x49\xb7\xaa\
+\x36\x20\x50\x9a\x51\x5a\xe2\xe0\x5c\x49\xa7\x0f\xd9\x99\x05\xba\
+\x4f\x08\x98\x0c\x5c\x3b\x28\x99\xf2\xbc\x92\x62\x20\xe1\x9a\x7b\
+\xe7\x09\x61\x7a\xe7\xa5\xb9\xe9\x52\xb4\xce\x2e\x9e\xde\x15\x7a\
+\x7d\x9c\x11\xd6\x64\x18\x2f\x87\xfa\xf5\xe5\x86\xfa\xa3\x3d\xfa\
+\xa2\x06\x8f\xee\xb0\x06\x3f\x62\x01\xf5\x09\xf3\x2b\x73\x95\xbe\
+\x73\x43\xad\x0f\x56\xf9\xad\xeb\x98\x01\x72\x25\x46\x17\x39\xee\
+\x17\x80\x8b\x61\x3a\x87\x92\x07\xab\x2e\xd0\x11\x7f\x80\xfb\x10\
+\x0d\x38\x51\x8a\x2f\x95\x57\x56\x80\x92\x49\xc8\x64\x0a\x22\xe1\
+\x42\x38\xc2\x82\xc0\x3c\xc8\x89\xc2\x01\xe5\x27\x7b\x44\x7e\xb1\
+\xa5\x94\xe6\xb5\x84\x24\x54\x87\x8c\x37\xb3\x7a\xc7\x8b\x86\xfa\
+\xeb\x63\xd4\xdf\x6d\xf6\xe4\x2d\x00\x41\xf8\x9c\xe6\xbb\xe7\x65\
+\xd4\xd2\x86\x06\x3f\xb7\xf3\x38\xdb\x8c\xa0\xa4\xd8\xc1\x0c\x29\
+\xce\xaa\x04\x8e\xb6\xd9\xc0\x41\xa9\x0e\x8a\x0e\xa0\x7f\x8c\x05\
+\xce\x3d\xb2\xa8\x78\x60\x51\xaf\x4a\x50\xd2\x83\x4c\x25\x21\x93\
+\x49\x88\x44\x02\xc2\xb1\x21\xc0\xde\x7a\x4d\x5a\x71\x18\xa5\x80\
+\x51\x8e\x1f\xe9\x04\xc7\x31\x57\x6b\x59\x0b\xe3\x59\xa5\x1f\xa9\
+\x33\x05\x9f\x46\x1c\xdc\x89\x9e\xce\xa8\x0f\xf8\x00\xaa\xe7\x30\
+\xff\x74\x79\x53\x90\x0e\x33\xca\xdc\x75\x2c\xba\x61\x45\x42\xe2\
+\x98\xa4\x2c\x3a\x9d\x68\x46\x41\x61\x48\x74\x75\x06\x10\x13\xc1\
+\x67\x57\xf6\xae\x84\x5b\x52\x0c\x91\xf4\x40\x29\x0f\xb2\x28\x02\
+\x81\x6b\xe9\xdf\x32\x81\x05\x42\x4e\x27\x10\x20\x29\xbf\xda\x46\
+\x0a\xc2\x27\x69\x8d\x97\x02\xfd\xce\xbb\x9a\xe7\x75\x53\xea\xdf\
+\x95\x1e\xd0\xab\x99\x5f\x99\xab\x30\xbb\xba\xce\x37\xf7\x23\xb0\
+\x6d\x71\x1a\x8c\xb2\x22\x89\x19\x82\xce\xf5\x08\x47\x58\x00\xb8\
+\x5d\x1d\x00\xdc\x9b\x30\x70\x98\x23\x4f\x2f\xef\x5b\x05\xe1\x25\
+\x20\x93\x1e\x64\x32\x09\xf2\x92\x10\xa9\x24\x64\x2a\x05\xe9\x25\
+\x0c\xfd\x47\x7a\xc0\x31\xd9\x41\xd4\x4f\x1f\xa5\x86\x42\x9a\x3b\
+\x75\x6d\xf1\x19\xcb\x34\x2f\x62\x33\xbf\xdf\x88\x6e\xb6\x1d\xfb\
+\x1e\xea\x03\xc1\x33\xcc\x77\xbc\x96\x55\xab\xfc\xa6\xc0\xde\x81\
+\xc4\xde\xf7\xd0\x93\x98\xe8\x8a\x01\xe3\x89\x4e\x41\x7e\x43\x6c\
+\xd1\x99\x19\x81\x38\x50\xfa\x1f\x05\x4c\x1d\x5a\x56\x36\xa8\xa4\
+\x5f\x15\x90\x48\x40\x24\x93\x10\x49\x0f\x32\x65\x1f\x49\x0b\x84\
+\x84\x97\x13\x82\x52\x0a\x48\x47\x9a\xb0\x20\xf2\x8b\x2d\xa5\x5d\
+\x6a\x15\x00\xba\xd5\xf4\xf3\x67\xac\xe7\x67\xba\x21\xf5\xef\x2a\
+\x35\x0c\x33\xcc\x9f\xdd\xcb\xfc\xf3\xf5\x8d\x01\xc3\x57\x39\x41\
+\xa8\x88\x50\x95\x94\x38\x1b\x34\x1d\x66\x9f\x81\x4e\x6f\x18\x39\
+\x60\x7a\xe9\xcb\x98\xd4\xbb\x6f\x5f\xb8\x65\xe5\xa0\xa4\x07\x91\
+\x4c\xe6\x35\x40\x32\x09\x51\xe4\x19\x56\x28\x4a\x42\x26\x3d\x73\
+\x87\x4d\x69\x41\x20\xa5\x59\x4c\x21\x85\x5d\x77\x6f\x34\x01\x13\
+\x71\x68\xfb\xee\x70\x08\x6e\xae\x7c\x10\x42\x01\x2f\xd3\xfc\xdc\
+\x5c\xc5\x8f\xa4\x1b\xf3\x0d\x24\xcc\x0c\x91\x72\x70\x8a\xa0\x89\
+\x7d\x08\xa3\x91\xef\x1d\x14\x5d\x12\x00\x12\xf0\x8e\x26\x8c\x4a\
+\x55\xf5\x86\x2c\x4a\xe5\xbc\x5d\x44\x5e\x9f\x4c\xe6\x5f\x4b\x59\
+\x20\x24\x13\x6d\x40\x40\x96\x09\xa4\x23\x4c\x38\x10\xb9\x89\xa3\
+\xa8\xed\x2a\x2a\xf5\x7e\x1e\x00\x10\xcf\x0a\x32\x8f\x31\xff\xf2\
+\xcd\xb4\xda\x8c\x96\x10\x0c\x82\xd6\x40\x28\x05\x46\x26\x84\x37\
+\x05\x74\x06\xf2\x77\x60\xef\xb4\x94\x50\x1c\xe0\x7f\x2e\x2e\x95\
+\xf2\xc8\xa2\xde\xbd\x40\x09\xd7\x1a\xdc\xcb\x7b\x7f\xca\x32\x42\
+\x04\x84\xa2\x88\x1d\x2c\x13\x38\x04\x29\x25\xa4\x23\xad\x38\x34\
+\xe1\x80\x29\x47\x99\x9f\x17\xa3\xb7\x97\x15\xa8\x5a\xe6\x95\xf7\
+\x32\xff\xba\xba\x29\x80\xb4\xcd\x84\x0a\x40\xd2\x93\x38\x9d\x68\
+\x2a\xcc\x1e\x03\x5e\x67\x86\x01\x71\x80\xbf\x24\xe1\x48\x59\x92\
+\xaa\xa8\x00\x79\x1e\x84\x0d\x01\x22\x69\xc4\x60\xc4\x06\x46\x0f\
+\xe4\xd9\xc0\x80\xc4\x83\x70\x24\xa4\x0d\x01\x94\x03\x81\xc0\x61\
+\x30\xd8\xb2\x80\x7e\x85\x79\xee\x33\xa1\x7e\x15\x4d\x3e\x00\x32\
+\xdb\xe0\xb8\x12\x13\x08\xa3\xaa\x88\x86\x5b\x16\x70\xbb\x24\x00\
+\x08\x70\x88\xa8\x38\x4f\xfb\x46\xf8\x51\xca\x1a\xda\x33\xaf\x45\
+\xda\xc0\x18\x3f\x65\xb3\x03\x0f\x22\x99\x00\x39\x8e\x5d\x5b\x67\
+\x84\x21\x4b\x81\x16\xf5\x39\xd8\x88\x7f\xcf\x00\x30\x7a\x80\xd1\
+\x70\x0f\xf3\xcf\x97\xb7\xaa\xe6\x44\x26\x04\x98\x90\x95\x84\xe1\
+\xae\x70\xc7\x11\x8e\x47\xfe\x1e\x8a\x9d\x52\x13\x38\xe0\x2c\x40\
+\x13\x02\x91\x88\xbc\x3d\x4f\xf9\x94\xf4\x6c\x55\xd0\xa6\x82\xd6\
+\xeb\x23\x36\xc8\x69\x04\xcf\x85\x88\xbc\xdf\x91\x10\x52\x40\xb5\
+\x85\x3b\x7f\x4e\x41\x10\x69\x1c\xbd\x89\x79\xf1\x3d\x8c\x3b\x33\
+\x4d\x01\x24\x33\x14\x11\x3c\x57\xe2\x04\xd0\x38\x98\x66\x91\x4e\
+\x5b\x4a\x76\xa0\x1b\x45\x6a\xad\xd9\xd7\x44\x90\xc9\x24\xa0\x43\
+\x40\x08\x70\xae\xcc\x47\x80\xdd\x46\x85\x05\x99\xe9\x61\x99\x7f\
+\x2d\xaa\x10\x52\x20\x40\x2a\x80\x24\x86\x26\xc0\x07\x54\x0d\x73\
+\xe3\x61\x10\x0a\xa2\xda\x80\x78\x8e\xf5\x3d\x67\x84\x98\x7e\x49\
+\xb3\x3f\x21\x28\xf5\xc0\x0e\xe1\x18\xc2\x70\x00\x95\x30\x29\x71\
+\xa7\xe8\x00\xe7\x00\x19\x20\x9b\x09\x83\xda\x4c\x26\x0d\x59\x5c\
+\x04\xd6\x21\x20\x08\x1c\xed\xdc\x20\x61\x3a\x82\xac\xd1\xe1\x98\
+\x15\x1d\xc2\x31\xc6\x87\x43\x20\x87\x20\x5c\x02\x05\x04\x47\x05\
+\x68\xf0\x35\x32\x9a\xd3\x2d\xa6\x02\xc8\x9f\xb3\x0c\x60\x57\xb5\
+\x81\x20\xcb\xd8\x7a\x87\xe6\x9f\x4e\x6a\x0d\x1f\x1c\xe4\x39\x09\
+\xe5\x4a\x0c\x04\x06\x96\x82\x7a\x35\x81\xdd\xce\x02\xc0\x01\xc5\
+\x14\x05\xb4\x54\x2b\xfe\xb4\xa5\xbe\x11\x4e\x51\x11\x84\xe7\x99\
+\x0a\x60\xd2\xb3\x69\x9f\x11\x7c\xc2\x66\x05\x85\x19\x82\x8c\x04\
+\x62\xf4\x9a\xe7\xa1\x3e\xab\xd1\xa4\x78\x3b\x1b\x00\xa8\x18\x00\
+\x3e\xcf\xa1\x20\x00\xa0\x3f\x66\x9e\x77\x37\x63\xb6\x6e\xf6\x01\
+\x22\xf4\x16\xe4\x0e\x25\x0c\x44\xfe\xc6\x99\x1d\x5e\x15\x74\x0e\
+\xf0\x9b\x67\x3e\x02\x56\xd4\x6f\xde\x0c\x76\x1c\x50\x32\x65\x66\
+\xb9\xec\xba\xed\x68\x1d\x5f\x8e\x01\xa2\x49\x9f\xd0\x6e\xa5\xe2\
+\x18\xcf\x87\x20\xb3\x68\x44\x08\xd4\x07\xcd\x58\x17\xea\x4f\x95\
+\x29\x01\x87\xdd\xbc\xfc\xbb\xcf\xa1\xe0\xcf\xcc\xbf\x3e\xd9\xd7\
+\xd3\xbe\xd4\x1a\x1c\x53\x24\x49\x94\x28\x94\x82\x73\x00\xe8\x52\
+\x21\x80\x01\xc8\x3a\xe0\xcd\x0d\xab\x3f\xe1\x49\x59\x9f\xdc\xa2\
+\x14\x98\x38\x6a\xf5\xb1\x71\x5f\x80\x24\x80\x28\xe6\x9b\x4d\x7b\
+\x0d\x00\x02\x02\xdb\x19\x31\x30\xe0\x33\x61\x73\x53\x80\xcf\xc0\
+\xab\x60\x6a\xff\xc1\x61\x02\x80\x5c\x99\xd8\x67\xde\xf8\x6b\xc2\
+\x6d\x13\xd2\xc1\x03\xfd\x19\x2e\x3a\xb9\xe3\xf9\x40\xd3\x0a\xb1\
+\x0a\x58\xb6\x7a\xeb\xf6\x55\xd5\x6b\xd6\x22\x51\x56\x06\xf2\x92\
+\xb6\x26\x60\xd3\x40\x1b\x02\x28\x19\x9d\x9b\xe7\xf0\x3c\xb0\x9b\
+\x00\xbb\x1e\x90\x30\x61\xa0\xc1\x07\x56\x35\x64\xd2\x6b\x80\x0f\
+\x90\x9f\x42\x0d\x0f\x03\x00\xb4\x29\x13\xaf\xd2\xfc\xd7\xdf\x30\
+\x6e\x5f\x0f\x42\x9d\xd9\xea\xa6\xd3\x1a\x5f\x9d\x03\xfc\xc2\xc2\
+\x07\xaa\xdf\xd7\xfc\xf4\x27\xaf\xbd\x3e\xe6\xc8\x69\x53\x20\x52\
+\xc9\x1c\xdd\xc3\xb6\x7a\xc1\x2e\xf1\x82\x6d\x06\x61\xa2\x58\x54\
+\x37\x8d\x11\xd2\x71\xb0\x76\xdb\x46\xbc\x97\x0d\xde\xa9\x37\x3f\
+\x3a\x8b\xee\x3f\x03\xb8\xbf\x65\x62\xf1\x67\xa5\x6f\x5f\x23\xc5\
+\xfa\xb5\x9a\x97\xdb\xeb\xd0\x29\x53\xe1\xa2\x03\xa8\x0b\x6f\x03\
+\x8f\x2c\x5d\xf2\x56\xed\xa6\x65\x2b\xe0\x55\x54\x58\x21\x98\x84\
+\xf0\x92\xb6\x08\x64\x8a\x41\x94\xf0\xc0\x09\xe3\xf1\x9c\xf0\x00\
+\xd7\x3c\x9c\x54\x0a\x75\xe9\x10\x7f\xfb\x74\x7b\xf8\x3a\xf0\x02\
+\xec\xbe\xbd\xf6\x87\xeb\xc3\x08\x00\xb9\xe6\x11\x0d\xd4\xbe\xa5\
+\xf4\xec\x00\xd8\x8c\xb6\x3b\x9b\x72\x97\x03\xc0\x36\x60\xc5\x6b\
+\x7e\xf8\xbb\x25\xf7\xcf\x81\xaf\x14\x9c\xe2\x92\x7c\x69\xd8\xf3\
+\x40\x89\xa4\x31\x76\x22\x01\x58\x00\xc0\x52\x3f\x79\x1e\xe0\x25\
+\xf1\xfe\xb2\x75\x78\xb5\x29\xf3\xc6\x46\xe0\x7d\x6b\xfc\xce\xdc\
+\xe4\xa1\x3b\x84\x82\xa8\xeb\xb9\x09\x9d\xd8\x02\x2f\x3a\xe0\xcb\
+\x86\x00\xb0\x08\xf8\xc3\xa2\x0f\x57\xbc\xbd\x64\xf6\x1c\x88\xd2\
+\x12\x88\xa2\x22\x6b\xec\x64\xfe\xe8\x25\x63\x20\x48\x00\x5e\x12\
+\x6e\x49\x29\x3e\x5e\xf1\x29\xe6\xaf\xda\x50\xfd\x17\xe0\x4f\x30\
+\xea\xbf\x09\xdd\xb3\xfd\xab\x23\x43\x41\x68\x19\x30\x13\xf3\xfe\
+\x0e\x77\x06\xa7\x83\x68\x4b\xb5\x00\xdb\x1f\x07\x6e\x29\xff\xf3\
+\xe3\x7f\x4a\x55\x56\x0c\x38\xf1\xaa\xaf\x00\x52\x42\x35\x37\x9b\
+\xb7\x50\x0c\x32\x4c\x10\x42\x42\x26\x15\x3e\x59\xfc\x2e\x5e\x5c\
+\xf0\x4e\x7a\xae\xe6\xbb\xeb\x81\x8f\x91\xbf\x19\xf4\xe1\x16\xff\
+\xdb\x73\xae\x4e\x1f\x1d\x75\xeb\x58\x09\x7b\x17\xcd\xa1\xc0\x19\
+\x57\x00\xff\x7b\xf6\x05\xd3\x47\x9c\x74\xed\x55\x28\xed\xdb\x1b\
+\xc8\xa4\xc1\xe9\x16\x70\x26\x0b\x0a\x02\x90\x0e\xd1\xba\x6d\x3b\
+\x56\xbc\xbc\x10\x2f\xbf\xb2\xb8\x61\x76\xa0\xee\x5e\x09\xcc\x83\
+\xe9\xfc\xdd\x86\xb6\xcb\xbe\x7a\x46\x47\x0b\x8d\x98\xcd\x3b\x0a\
+\x00\x64\xd9\x24\x05\x20\xd1\x17\x18\x37\x1d\xf8\xfe\x29\xfd\xfa\
+\x9c\x37\xe1\xcc\xd3\x68\xd0\x71\xc7\xa0\xb8\xb4\x18\xec\xfb\xf0\
+\xeb\xeb\xb1\xed\xa3\x95\xf8\x68\xf1\x3b\x58\xb8\xa5\x7a\xd9\xd3\
+\xc0\x03\x5b\x80\xbf\x59\xea\x8f\xb6\x7a\xe9\xaa\xcb\xbe\x7a\x00\
+\xb0\x97\x20\x48\x01\xa8\x18\x03\x9c\x71\x34\x70\xde\x18\x47\x8e\
+\x2b\xf3\xdc\x7e\xc4\x10\x2d\x61\x58\xb3\xce\x0f\xd7\xfd\x0d\x78\
+\xe3\x23\xe0\x2d\x98\x89\x8e\x66\xb4\xdd\xdb\xef\x70\x14\x7f\xdd\
+\x1e\x00\x71\x10\x24\x91\xdf\x1c\xb9\xd4\x01\xfa\x0b\xb3\xfa\xd5\
+\xd1\x80\x1f\xe6\x45\x9e\x6f\x8d\xdf\x64\x8f\x19\x74\xbd\xd5\xbe\
+\x3d\x00\xd8\x57\x5d\x61\x35\x81\x8b\xfc\xde\xb8\x85\x1b\x23\xc6\
+\x53\x9d\x74\xac\xd0\xa1\x7b\x8c\xdf\xfd\x01\x10\x81\x20\x02\x82\
+\xb4\xac\x10\x6f\x6c\xd4\xb1\x54\x27\x8c\x19\xbe\x27\xe6\x1f\x64\
+\x00\x74\xd6\x9d\x43\xe3\x3b\xe6\x46\xfb\xe9\xc5\xef\xd9\x1c\xbd\
+\x47\xc7\x0b\x4a\x3d\xe3\xe0\x8f\xce\xbe\x75\x6c\x04\x02\xda\xcd\
+\xbf\xf7\x8c\x43\x38\xf6\x18\x02\x7a\xc6\xe7\x7b\x88\x9e\x4b\xd0\
+\x03\x80\x9e\xd1\x03\x80\x9e\xd1\x03\x80\x9e\xd1\x03\x80\x9e\xd1\
+\x03\x80\x9e\x71\x98\x8d\xff\x3f\x00\xa7\x04\xa9\x6f\xd3\xc2\x6f\
+\xfb\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x15\xa6\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x48\x00\x00\x00\x48\x08\x06\x00\x00\x00\x55\xed\xb3\x47\
+\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
+\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\
+\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\
+\x00\x00\x3a\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x00\x06\
+\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\x00\
+\x13\x2f\x49\x44\x41\x54\x78\xda\xd5\x9c\x7d\xb0\x5d\x55\x75\xc0\
+\x7f\x6b\x9f\x73\xcf\xbd\xef\x33\x21\x3c\x12\x21\x84\x40\x20\x21\
+\x09\x1f\x82\xa0\x56\xc0\x3a\x8e\x76\x6a\x6d\xcb\xe0\x58\xed\xb4\
+\xd6\x71\x50\x70\x54\x5a\x74\xb4\xea\xa0\x58\x3f\x98\xd1\xda\x6a\
+\x45\x1d\x2d\x6d\x9d\x56\xc7\x51\x47\x8b\x8a\x33\x76\x5a\xaa\x33\
+\x5a\xa1\x3a\xd2\x16\x54\x3e\x84\x48\x08\x04\x78\xf9\x4e\xde\x47\
+\xde\xfd\x38\xe7\xec\xb5\xfa\xc7\x3e\xe7\xdc\x73\x5f\x12\x42\xc2\
+\xbb\x41\xf7\x9b\xf3\xce\xbd\xe7\x7b\xff\xce\x5a\x6b\xaf\xb5\xf6\
+\xde\x57\xbe\xf7\xee\xcb\x6c\x72\x6a\x25\x88\x80\x19\x20\x84\x62\
+\xe1\xa3\x41\xb5\xd5\x0c\x2b\xf6\x99\x81\x14\xeb\xb0\xcb\xc2\x25\
+\x34\xac\x15\x0b\xa7\x5b\x7f\x0d\x32\xf0\x3d\x5c\xde\x10\x0b\xeb\
+\xe2\x42\xd5\xf5\x06\xae\x6b\x54\x0f\x63\x79\xc6\xc2\xc1\xb9\x2f\
+\xdd\xf9\xc3\x5f\x5c\x7d\xc5\x4b\xcf\xb1\x57\x7e\xf6\x61\x86\x55\
+\xe2\xc9\x53\x56\x71\xda\xea\x55\x64\x73\x7b\xa0\x86\xa7\x5e\x2a\
+\x6e\x25\x0d\x06\x1f\xb8\x40\x86\x03\xd4\x0c\x27\xe0\xcd\x70\x48\
+\xf1\xdd\xd0\x92\x77\x01\x46\xcd\x90\x7e\xcd\x6b\x20\xca\xfd\xb5\
+\xe3\xeb\x80\x80\x3c\x35\xd2\x8e\x70\xcb\x7d\x70\xc5\x4b\x87\xc6\
+\x26\x00\x12\x04\xbf\x30\x43\xba\xef\x49\xd4\x06\x77\x3a\x01\x41\
+\xfa\x12\x54\x42\x12\x30\xa4\xff\x55\x06\xd7\x01\x50\x58\x9b\x81\
+\x4a\x5f\x0a\xeb\xac\xa5\xf6\x36\xaa\xf3\x6b\xc7\xf5\x5f\x8e\x04\
+\x09\x33\x10\x27\xe0\x15\xc1\xf0\xc3\x65\x13\x00\x41\x78\x00\x35\
+\x98\x59\xf0\x98\x8b\x10\x01\xef\xd5\xcf\x2e\xf4\x1e\x4b\x53\x3f\
+\x8b\x20\x0e\x01\x09\xef\x51\x44\x0c\xc3\x8a\x0a\x9a\x48\x50\x12\
+\x27\x62\x05\x20\xd3\x00\xd8\x0c\xcc\x15\x48\x44\xc4\x44\x0a\xbe\
+\x60\x2e\x5c\xc0\x0a\xde\x08\x98\x48\xb8\x9e\x19\x16\x09\x86\x60\
+\x4e\xc4\xbc\xda\xd8\xb2\x15\x93\x17\x8f\x27\x6e\x34\xef\x74\x28\
+\xdf\xd7\x89\x01\x44\xa1\xf3\x2e\xe2\xa4\x93\x97\xe1\x9d\xc3\x1b\
+\xb2\x6f\xd7\xfc\xbe\x2f\xfe\x78\xeb\xd7\xee\x7c\x60\xcf\x8e\x38\
+\x12\x44\x50\x82\x40\x28\x22\x2a\xa0\x22\xa8\x80\x0f\xa0\x50\x41\
+\xb4\x3c\xce\x09\x5e\x6a\xc7\x39\x11\xef\x04\xef\x42\xa5\xbd\x13\
+\xd1\xc8\xa1\x91\x13\x1f\x3b\xf1\x91\x43\x1b\x91\xe8\x48\x23\xca\
+\x9b\xb1\xf3\x93\x4d\xe7\x57\x4e\x34\xf2\xf1\x66\x9c\x6d\x5a\xd9\
+\xdc\x30\xb5\xfa\xd4\xaf\x47\x2e\x3b\xc7\xec\xb8\xeb\x7b\xfc\x80\
+\x0a\xc9\xa0\x61\x9e\x58\x73\xb4\x39\xe2\x36\xac\x59\x7e\xe9\xf5\
+\x7f\xb8\x71\x64\x7c\x34\xf9\xf2\x57\xef\x78\x6c\x0b\xc5\x9b\x87\
+\x00\xa0\xb6\xf8\xc3\x6c\x3b\xdc\x76\x7f\x94\x6d\xe5\x3a\xaf\x6d\
+\xcf\x80\xde\x37\xde\xb0\xbe\x8d\x48\xc5\xa6\x7c\x90\x61\x17\x57\
+\xdd\xcc\x0a\x7d\x37\x45\xd2\x1e\x2e\xed\x11\x3b\x91\xb5\xcf\x99\
+\x3c\xff\xfa\x3f\xd8\xf8\xb6\xf7\xbe\x6a\xd3\xa5\xcd\x86\xab\x58\
+\xd6\x96\xa3\x6d\x5b\x5c\x8e\x74\x1e\x8b\xd6\x03\x9f\xeb\x64\xca\
+\x67\x3d\x61\x80\xea\x25\xdc\x5c\xa1\xd7\xc5\x3a\x5d\x30\x63\xe5\
+\x8a\x91\xb5\x7f\xfa\x92\x75\x6f\xf9\xd8\x9f\x5d\xf4\xf2\x15\x13\
+\x49\x44\x78\xcb\xcf\x42\x39\x81\xba\x55\x94\xb8\x2f\xac\xf5\x9b\
+\x0b\x98\x47\xbb\xed\xd0\x2a\x8d\x8f\xb2\x6c\x22\x39\xf9\x95\xcf\
+\x3f\xfd\xea\xa9\x65\xcd\x93\x6e\xfa\xfa\xbd\xdf\xf9\xd5\x8e\x83\
+\x07\x4f\xec\xa3\x2a\x87\x7b\xd6\x2f\x4e\xed\x83\x9b\x89\x68\xb2\
+\x1a\x61\x37\xd0\xe5\x2d\x4b\x77\x57\x77\xa8\x32\x1b\x8d\xf1\xe5\
+\xb8\xe6\x18\xa6\x1e\xeb\x2d\xe0\x17\xda\xf8\xcc\x18\x6d\x35\xc6\
+\x2e\xdf\xbc\xea\x8f\x3e\xf5\xa6\x4b\xdf\x70\xc5\xa6\x53\x56\xc0\
+\x09\x69\x69\x8f\x58\xc6\xc0\xbe\x71\xf0\x80\xb4\x26\x5b\xbf\xd7\
+\x1c\x6d\xde\x88\x31\xb9\xd4\xf7\x70\x56\x28\x75\xbf\x65\x10\xc4\
+\x39\xa2\xd6\x18\x51\x73\x14\xcc\x48\x17\x0e\xd2\x9b\x9d\x23\x4b\
+\x95\x24\x89\x9b\x17\xae\x5b\xf1\x8a\x8f\xbe\xfe\xa2\xeb\xfe\xf8\
+\xf2\x33\xd6\x9c\x48\x48\x7d\x3b\x19\xbe\xef\xb8\x92\x68\x62\xe3\
+\xf8\xab\x2e\x5d\x79\xc9\x67\x36\x2c\xdb\xb0\x91\xee\xd2\x3b\x47\
+\xce\xaa\xf0\x21\x38\x63\x06\xa8\xf7\x64\x0b\xb3\xb8\xa4\x85\x24\
+\xa3\xe1\xc0\xac\x4b\x36\x37\x4b\xda\x55\xa2\x28\x8a\xce\x5e\xbd\
+\xec\x45\xef\x79\xf5\xf9\xef\x7a\xe7\x95\x1b\xcf\xe7\xc4\x35\x2a\
+\x55\xc9\xcd\xa2\xc9\x2b\x27\xff\xe4\x82\x53\x2e\xbc\xf9\xdc\x65\
+\xe7\x9e\x35\x11\x8f\x1b\xbe\x1f\xb1\x2c\x19\x20\xa0\x72\xf7\x73\
+\x1a\xc1\x9b\x16\x30\xf5\x68\x67\x0e\x97\x34\x49\x46\xc7\xc2\xd1\
+\x69\x87\x74\xe6\x00\x69\x57\x41\x22\x4e\x9b\x1a\xdb\x74\xed\x2b\
+\xd6\xbf\xeb\x93\x57\x5f\x7c\xc5\xe4\x68\xa3\xee\x00\x2f\x79\xa9\
+\x37\x69\x1e\xe5\xf6\x55\x07\x5f\x7c\xe1\xaa\xe7\xfe\xcd\x73\x46\
+\x56\xad\xc9\x7c\xba\xf4\x64\x4a\x40\x65\x8c\x93\x9a\x63\xab\x5b\
+\xc7\x4c\xd6\xa8\x80\xa9\xf7\xf8\xf6\x1c\x9d\x4e\x8f\x4c\x43\x3c\
+\x45\xd6\xa5\xbb\x7f\x1f\x69\x27\xc7\x24\xe2\xa4\xc9\x91\x35\x57\
+\x5d\x76\xe6\xf5\x9f\x7f\xcb\xf3\xaf\x5c\x7b\xca\x58\x32\x2c\x48\
+\x4a\x08\x7b\x7a\x78\xbe\x3b\x39\xc7\x43\x9b\x4f\x5f\xbb\x72\x64\
+\xea\xd4\x9e\xef\x2d\x42\xb8\xc4\x80\xca\xc8\xdc\x0c\x3a\x34\xc9\
+\xcb\xc6\x02\x42\x70\xa4\x4a\xb7\xdd\x41\x25\x46\x46\x4f\xc2\x9c\
+\x43\xb3\x0e\x9d\x7d\xbb\xe9\x2e\x64\x18\x0d\x26\x46\x93\x93\x5f\
+\x72\xe1\xa9\xd7\x7e\xf6\xcd\x97\xbe\xee\xcc\x95\x63\xcd\x61\x3c\
+\x68\xcb\x22\xda\x9a\x71\xeb\xf8\x0c\x77\xae\x5b\xc5\xc8\xe4\x14\
+\x69\xde\x43\x24\x38\xb8\x32\xa4\xb8\xc3\x59\x65\xf9\xfa\xa5\x2e\
+\xae\x21\xf8\x82\x24\x8e\x88\x93\x06\x6e\x64\x12\x89\x1a\x68\x96\
+\xd2\xdd\xb7\x8b\xf4\x60\x97\xbd\xb3\x39\xf7\x6f\xd9\x3d\x3a\x3d\
+\x7d\xe0\x77\xce\x58\x96\x4c\xb1\xf4\x7e\x92\xde\xbd\x7c\x2e\xba\
+\xa5\xb5\x3d\xfa\xc9\x69\x2b\x68\x8d\xad\x28\xe0\x48\x7f\x19\x0e\
+\x1f\xe2\xba\x67\x8a\xfa\x81\x16\x4d\x08\x79\x9d\xc8\x85\x37\xe4\
+\xb2\x2e\x3e\x4b\x89\x47\x27\xc9\x16\xe6\xd0\x3c\x23\x9d\x9f\xe1\
+\xfe\xe9\x8c\x1f\xfd\xf4\x21\x3a\xa9\x97\x99\xf9\xce\x52\x3f\xab\
+\xf2\x21\x96\x7f\xf1\xec\xe8\xea\x8d\x27\xaf\x59\x3d\xda\x18\x27\
+\xf3\x69\xc8\x34\x14\x62\x33\xcc\xa0\x35\xb6\xa2\xdd\x8c\xc8\x39\
+\xad\xb7\x95\xf1\x51\x41\x2d\xa9\x0e\x28\x6f\x9e\x79\x0d\x06\x2b\
+\xef\x62\x18\x8d\xd1\x09\xb2\xf6\x3c\xa6\x4a\x9e\x7b\xbc\x6a\x91\
+\x1e\x59\x62\x38\xef\x64\xc5\x9a\xf5\x6b\x6e\xd8\x3c\xb5\xf9\xda\
+\x11\xd7\x6a\xa6\xbe\x87\x13\x41\xc4\x95\x09\x97\x70\xa0\x99\x23\
+\x67\x84\xdd\x8c\xf0\xe1\x43\x23\x84\x43\xca\xd3\xb1\x94\x93\x10\
+\x5b\x61\x83\x1c\x30\x15\xb7\x69\x45\x23\x98\xd6\xa4\x0a\xc1\xab\
+\x61\x66\x78\x55\x04\x41\xb3\x14\xd4\xc8\xb4\x10\xc1\xe1\x14\xcf\
+\xf5\xac\x3c\xf3\x79\x6b\x6f\xdc\x3c\xb5\xe9\x75\x89\x24\xcd\xd4\
+\xa7\x03\x70\x4a\xbb\xe3\x70\x8c\xba\xb1\x73\x37\xac\xdb\xf0\x99\
+\xc8\x45\x3d\x38\xd4\x24\x49\xad\x1d\x5c\xbc\x73\x40\x41\xab\x1c\
+\x98\xf2\xc4\xc2\x74\xa9\x62\x95\x55\xc6\x2c\xa4\x45\xcb\x64\x61\
+\x91\x1f\xa3\xe1\x1c\x91\x08\xb9\x86\x4c\xa0\xcf\x52\x7a\x9d\x8c\
+\x56\x32\xce\x10\xd2\x0f\x39\xd7\xb1\xfa\xec\x17\xac\xfb\xe0\xa6\
+\x95\x1b\x5f\x1d\x13\xc7\x99\x66\x87\x85\x23\x38\x7a\xda\x63\xdd\
+\xc4\xda\x53\xce\x98\x38\xfd\x2a\xa1\x30\xda\xc8\xa1\xeb\x72\x9f\
+\xb8\xca\x6e\xd5\xf7\xbb\xda\xf1\x89\x4b\xf8\xde\xf6\x1f\x10\x97\
+\xa2\x12\x1c\xc6\xfe\x5f\xdd\xf7\x13\x0a\x15\xc3\x16\xd1\xb7\x81\
+\x54\xe8\x92\x49\xce\x75\x9c\xb9\xfe\xb2\xf5\x1f\xd9\x78\xca\x86\
+\xdf\x77\x44\xee\x88\x70\xc4\xe1\x10\xba\x79\x87\x9e\xef\x56\xfb\
+\x5d\xd5\xaa\x39\x9c\x08\xc5\x59\x88\x08\xce\x39\x1c\x2e\xb4\x7e\
+\xf4\x8d\xbc\xc3\xe1\x4a\x70\x22\xb4\xa2\x16\x4d\x49\x0a\x15\xeb\
+\xd7\xb7\x70\xe5\x07\x2b\xac\x66\x78\x35\xbc\xb7\x42\x18\xfb\xf0\
+\x0e\xd7\x0a\x3e\x13\x38\x72\x9d\xac\x3f\xf7\xf2\x0d\x1f\xd9\x30\
+\xb5\xe1\x65\x62\x48\x6e\xf9\x53\xc2\xe9\x4b\x45\xff\x73\x99\x1f\
+\xae\xe0\x54\xad\x9d\x1b\x50\xb5\x70\x31\x41\x70\xc5\x79\x05\x48\
+\xeb\xdb\xd2\x4a\xc5\xac\xa6\x52\xa5\x5a\xd5\x05\xa9\x11\x32\x8a\
+\x55\x32\xbd\xdc\x6e\x03\x71\xdc\x33\x83\x13\xff\x45\xbc\x69\xc3\
+\x8b\xd6\xdf\xb4\x7e\x6a\xfd\xe5\x66\x26\xb9\xf9\x02\x8e\x54\x70\
+\x42\xdd\x17\xc3\x09\x49\xdd\x4a\x02\x6a\x6a\x53\x3e\x6a\xf8\xa0\
+\x68\x01\x8d\xe2\x3f\x22\x88\x58\x1f\x78\x71\xbf\xb2\xc4\x56\x57\
+\xb1\xda\xd2\xef\xad\x08\xb0\xbd\x5a\x48\x3f\x56\x49\xf4\x7a\x79\
+\xc6\x84\x7c\xe3\xcf\x1b\x17\x9e\x7b\xd9\xb9\x37\xad\x9f\x3a\xfb\
+\x52\xaf\x5e\x14\xed\xc3\xa9\xec\xc5\x62\x38\x41\x85\xca\x34\x7f\
+\x6e\x39\xaa\x1e\x6f\x1e\x45\x51\xd3\x9a\x7e\x58\x05\x2e\x92\xa0\
+\x4e\x4e\x1c\x91\x44\xc4\x2e\x22\x72\x31\xb1\xc4\xc4\xc5\xda\x47\
+\xa3\x18\x16\x00\x55\x46\xba\xea\x9f\x0a\x4b\x69\x5f\xcc\x40\x55\
+\x51\x2d\x6d\x50\xb1\x1f\x18\x38\xff\xf8\x4a\xde\x7c\x47\x72\xe9\
+\xc6\x17\x6d\xfa\xf0\xd9\x2b\xce\xba\x30\xd7\x1c\x45\x07\xec\xc3\
+\x62\x38\x45\xb2\x1f\x6f\x39\x1d\x9f\x92\x6a\x58\xbc\x79\x0c\xad\
+\x8c\xaf\x13\x57\xd9\x1c\x27\xc5\x77\x1c\x86\xab\xfe\x14\xc5\x6b\
+\x8e\xb3\xac\xb2\x43\x4e\x1c\xb1\x8b\xc9\x2d\x27\x36\x63\x91\xf4\
+\xd4\xed\x50\x5f\x92\xc2\x43\xf5\x61\x54\x69\xcf\xca\x1c\x1d\x47\
+\xac\x2a\x68\xeb\x5d\xad\xcb\x37\xbf\x70\xf3\x5f\x9d\xb9\x7c\xed\
+\xc6\x4c\x33\x0c\x2d\x44\xdd\xd5\x5a\xaa\xbe\xca\xa8\x79\xda\xbe\
+\x4b\x3b\x6f\xd3\xd3\x1e\x6a\x21\xbf\x21\xe2\x0a\xc9\x10\x84\xa8\
+\x82\x13\xd5\x54\xc7\x49\x54\x01\xa8\x80\xd5\x97\x12\xaa\xf4\xeb\
+\x52\xf9\x41\x55\x3d\x0b\x50\xe5\x21\xa5\x94\x78\xb5\x40\x73\x00\
+\x43\x38\x56\x8f\x5d\x82\x8c\x26\x36\xfa\x8e\xd1\x97\x9e\xf7\x82\
+\xf3\x6e\x58\xb3\xec\xf4\xb3\x33\x9f\x51\x74\x1d\x15\x46\xb3\xf4\
+\x4f\xc2\xff\x4c\x33\x16\xb2\x83\x2c\xe4\x0b\x64\x96\x16\x2f\x2d\
+\x1a\xa8\x68\x24\x0e\x29\xa5\x60\x00\xce\x22\x10\x4f\x09\xa7\xdc\
+\x1f\x21\x10\x9a\xf9\x43\xa5\x67\x70\x6d\x75\x63\x5c\xa6\x43\xa8\
+\xdb\xab\x63\x02\x64\x8c\xe3\xc6\xae\x1f\x7b\xd9\x05\x97\x9e\xff\
+\x9e\xd5\x93\xa7\x9d\x91\x16\x70\x06\x0d\x6c\x40\x93\x59\xc6\x5c\
+\x36\xc7\xc1\x6c\x9e\x5c\x73\x44\x20\x2a\x24\xa1\xb4\x41\xa5\x4d\
+\x29\xe1\x44\xae\x5f\xe9\x23\xc1\xa9\xce\x59\x04\x27\x2a\x0c\xbd\
+\x2b\x9e\xa0\x02\x54\x36\x61\x66\x46\x96\x65\x34\x9c\x52\x37\xc5\
+\x65\xdf\x7c\xdd\x83\xec\xf7\x2e\x1c\x13\x20\xe5\xb5\x3c\x77\xdd\
+\x45\xeb\x6e\x58\xbb\x7c\xed\xea\x76\xd6\xae\x24\x87\x52\x15\x10\
+\x14\x63\x2e\x9b\xe5\x40\x7a\x80\x54\x7b\x38\xdc\x80\x71\x3d\x56\
+\x38\x55\xc5\x9f\x0e\x9c\x62\x9f\x48\x2d\x1f\x54\x97\x88\x5e\xa7\
+\xcd\x42\x3b\xad\x75\x45\x5b\x15\x6e\xd4\x6d\x4f\xdd\x48\x1f\x43\
+\x0c\x26\x6c\xe1\x89\x99\x03\x33\x77\xcc\xa7\xf3\x69\x12\x25\x38\
+\x71\xd4\xfd\x96\x9e\xa6\xec\xec\xec\x60\x57\x67\x27\xa9\x3f\xf1\
+\x70\xfa\x76\x48\x8a\x94\xab\x5a\x25\x09\x66\x46\x2c\xe0\xbd\xa7\
+\xdd\xcd\x43\x0b\xb6\x48\x62\x6a\xca\x32\xe0\x12\x3c\xcd\xe2\xb8\
+\x93\xbd\x8f\x7f\xe1\xf1\x4f\xfc\x6c\xeb\xcf\xbf\xdc\xc9\x3b\x9d\
+\x66\xd4\xac\xdc\xfc\xf9\xfc\x20\x4f\xb6\x9f\x60\x2e\x9d\x2d\xec\
+\xcc\xb3\x01\xa7\x34\xf6\x85\x1f\x54\x0d\xd4\xa8\x49\x46\x23\x72\
+\xa4\xb9\xd2\xb6\xbc\x1a\x61\x51\x4a\x5a\xa5\x65\x55\xb2\xed\x98\
+\x13\x9e\x8e\xff\x61\x6e\xba\x37\xfd\x69\x7d\xb3\x76\x2e\x3e\xe7\
+\xa2\x37\x4e\x26\xe3\xa3\xbb\x3b\xbb\xd9\xd3\xdd\x83\x9a\x1f\x78\
+\xf8\x13\x0e\xa7\xb8\xce\x22\x09\xb2\x22\x8a\xef\xab\x5a\xc3\x09\
+\x59\xe6\xc9\x32\x25\xf7\xc1\x0f\xaa\x5a\xfe\x32\xa0\x35\x3d\x5e\
+\x3f\x48\xf8\x05\xed\x9d\x9f\xde\xf9\xb9\xbb\xb7\xdc\xf3\xf9\xe9\
+\x85\x1d\x0b\xf3\xd9\xfc\x51\xe1\xb8\xa1\x4b\x4e\xed\x9e\x14\x36\
+\x68\x20\x4c\x35\xc3\x35\x5a\x88\x8b\x43\xde\x27\x12\x92\x58\xca\
+\xec\xfe\xa2\x16\xaf\xd6\xb2\x1d\x5f\x11\x7e\x45\x77\xd7\x27\x77\
+\xdd\x72\xef\xc3\xf7\x7f\x32\x57\x3f\x3b\xde\x98\x78\x4a\x38\xd1\
+\xb0\xe1\x94\xc7\x14\xb1\x9a\xeb\x1b\xe7\xbe\xf4\xb8\x28\x26\x6e\
+\x8d\x80\x38\xc0\x88\x9d\xc3\x54\xe9\x74\x0a\xc3\x5d\x8f\xdf\xcc\
+\x8e\xb5\x15\x3b\x54\xdd\x1e\x23\x9b\xf9\xc4\xcc\x3f\x3f\xfa\xe8\
+\xf6\x8f\x66\x3e\xdf\x37\xd1\x18\xaf\xb5\x24\x72\xe2\xe1\xb8\x9a\
+\x04\xa1\x85\x8a\x69\xdf\xe9\x53\xf5\x88\x66\xc4\x49\x13\xc4\xa1\
+\x66\x98\x7a\xd2\x5e\x4a\xbb\x9b\x2d\x82\xf4\x8c\x43\x8d\x20\x49\
+\x4f\x92\xcf\xfc\xcd\xcc\x57\xb6\x6e\xdb\xf6\xe1\x4e\x96\xee\x1c\
+\x2b\x20\x0d\x56\xea\xe8\x70\x9e\x9e\x9f\xe3\x8e\x0e\xa7\x4c\x9d\
+\x68\x5d\x82\x8a\x01\x29\xa6\x8a\x79\x8f\xb3\x9c\xb8\x19\x20\x79\
+\x35\x1a\x0e\xf2\x5c\x69\x77\x73\xb4\xee\x40\x6a\x38\xf9\x19\x62\
+\x12\x76\xa2\x73\x1f\x9f\xfb\xd7\x2d\xdb\x7e\x75\xe3\xc1\x5e\xfb\
+\xf1\xf1\xc6\xf8\x80\x53\x18\xd5\xe1\x48\x1f\x4e\x15\x62\xd4\x25\
+\xad\xac\x20\x45\x0e\xc8\xd5\xd5\xf5\x30\x8b\x8b\xc2\x22\xae\x70\
+\x2b\x82\xe3\xe2\x06\xe2\xb0\x3a\x2c\x42\xe7\xa1\x33\x4f\xa3\xd9\
+\xc4\x08\x92\x14\x3b\xc8\xb2\x9c\x76\x37\x0b\x12\xa7\x46\xd4\x1a\
+\x63\x7c\xfd\x0b\x49\x56\x9e\x85\x69\xfe\xcc\x20\xed\xc6\x0e\x7e\
+\x68\xe1\xdb\x0f\x6d\xdb\xf2\xde\x03\x9d\xd9\x47\xc6\x1a\x63\xc4\
+\x03\x31\x54\xd9\x04\xf7\xe1\x44\x2e\xa2\x19\x35\x69\x45\x4d\x9a\
+\xf5\x25\x0e\x4b\xcb\x35\x69\xba\xfa\xbe\x64\xf0\xb8\x6a\x5b\x52\
+\x1d\xd7\x28\xfc\x33\x67\x3a\x68\x83\x74\x71\xe8\xe1\x03\xa4\x20\
+\x49\x51\xd1\xba\x81\xcf\x73\xbc\x57\x4c\x95\x64\x72\x8a\xe5\x9b\
+\x2e\x27\x5e\x7e\x6a\xe8\x19\x79\xa6\x65\x1e\x59\x78\x5f\xfb\xdf\
+\x1e\x7c\x74\xcb\x3b\x77\x2d\xec\xfd\xe5\xc8\x22\x48\x75\x38\x22\
+\xc2\xb2\xc6\x72\x96\x37\x56\xd0\x90\x96\x35\xa4\xa5\xb1\x34\x35\
+\x26\xd1\x88\x44\x23\x6b\xa8\xd0\x50\xb1\x58\xc5\x22\xc5\x9c\x9a\
+\x3a\x55\x15\x55\x2f\xea\x3d\x9a\x7b\xd3\x3c\x37\xcd\x72\xd5\x34\
+\x57\x4d\x73\xaf\x07\xba\x73\x3a\x97\xcd\x6b\x48\x98\x69\x01\x66\
+\x51\x33\x5f\x8d\x40\xd5\x9c\x48\x22\x48\x12\xb2\x9e\x31\x23\xcb\
+\x98\x33\x63\x42\x67\x68\x7a\xc3\xe3\xe9\x74\x3a\xe4\x59\x56\x24\
+\x9b\x96\xc0\x26\xf5\x88\x3a\x7f\xd9\xf9\xfe\x83\x9f\xda\x32\x6f\
+\x67\xd8\x27\xd6\x4e\x9c\x7e\x71\xa6\x65\x90\x5a\xb7\x31\x42\x23\
+\x8a\xf9\xe5\xfe\x87\x1e\x7a\x60\xcf\x83\x9f\x4b\xe2\x64\x5e\x8a\
+\xd4\x7b\xff\x62\x14\xd9\xc2\x43\xb6\xd6\xfe\xd7\xcf\x0a\xe3\x14\
+\xf6\x77\xf7\xf7\xf3\x41\x61\x91\xca\xa6\x0c\xa4\x9a\x0d\x9c\xf3\
+\x44\x28\x59\x6b\x02\xd9\xf4\x1a\x76\x4c\xcf\x72\xff\x03\x77\xb2\
+\x76\xee\x51\x6c\x59\xca\x63\x7b\x1f\x43\x67\x66\x70\x6e\x09\xc7\
+\x57\x29\xae\xf7\xf6\xde\x9d\x0f\x7e\x7e\xcb\x5b\x31\x6e\x3e\x6b\
+\xd9\x19\xbf\xa5\x96\x63\x05\xa4\xd2\x0e\x85\xa0\x49\x76\xee\xdf\
+\x79\xe0\x6b\x8c\xb2\x97\xb7\x2f\xcd\xed\xa1\xb0\x41\x5a\x84\x1a\
+\x1a\x1a\xb5\x43\xb2\x8b\x95\x87\xad\x0a\xe6\xd9\xbd\x7f\x86\xe9\
+\x3d\xfb\xb9\xff\x89\x59\xee\xda\x36\xcf\x81\xb9\x36\x3b\xa6\xa7\
+\x59\x58\x58\xa8\x92\x59\x4b\x58\x5c\xfa\xb6\xf4\xae\xb9\x9f\x6f\
+\x7d\xff\xae\x6d\x8f\xec\x88\x5c\x42\x23\x6a\xd4\x9a\xe9\x90\x70\
+\x27\x74\x70\x2c\x79\xc7\x5c\x95\x72\xcd\x4d\xd8\x39\xbe\x81\xd8\
+\x3f\xc1\x49\x51\x36\xe0\x00\x1a\x8a\x6a\x48\x66\xc7\xd6\x21\x7b\
+\xe0\x76\xdc\x7e\xe5\xac\x78\x3f\xd6\x30\xbc\x57\x9a\xcd\x26\x0d\
+\x6d\x0c\x63\x94\x85\x00\x72\xed\xf7\xc7\x9f\x9c\x3b\x3f\x9b\xff\
+\x59\xfa\xc8\xa9\xa3\x1b\xcf\x26\x89\x62\xcc\xb4\xf2\x93\x86\xd5\
+\xf9\x5c\xa9\x98\x37\xa1\x1d\x4d\x92\x66\xae\x30\xd6\xf5\x91\x93\
+\xfd\x78\x4b\x80\x0b\x26\xe6\x38\x6f\x42\xd8\x35\x23\x78\x9d\x60\
+\xda\x22\x26\x6c\x92\x58\x0f\x2c\x85\x4f\x74\xd8\xb2\x6c\x79\x2c\
+\xcf\x1b\x5b\x25\x53\xf7\xee\xe5\xf6\x85\xfb\x59\x7e\xc9\x05\x24\
+\x8d\x04\xaf\x7e\xf8\x83\x17\xfa\xce\x9e\xd5\xfc\x9a\xd0\xdd\x53\
+\xb6\x6a\x65\xff\x40\xa9\x8e\xa6\xc6\x68\x0c\x53\x63\x31\x91\x08\
+\x8d\xb8\x81\x73\x6e\x68\x23\x84\xcc\x8c\xb1\xb1\x06\x97\xb4\x26\
+\x78\xd9\x3d\x3d\xf6\xfc\xf4\x67\xdd\xcc\x6b\xd6\x8c\x92\x42\xc5\
+\x86\x34\xfc\xa5\x02\xa4\x83\x76\x47\x17\x7d\x2e\x83\x55\x33\xa3\
+\x74\x2e\xb5\xb0\x5f\xa8\x47\xba\x07\x70\x9d\x03\x98\x1c\xbd\x5b\
+\xfc\xf8\x00\x85\x75\x92\x38\xce\x6b\x8e\x72\xd9\xff\x76\x7f\x70\
+\xcf\xce\x7b\xbf\xd6\xcd\xb3\xac\x19\x35\x87\x37\xba\x43\xb5\xa8\
+\xa4\x79\xc6\xf6\x6f\x21\x69\x76\xc3\x04\x94\x2a\x71\x5f\x9f\x50\
+\x41\x2d\x35\x52\x1a\x6f\x41\x7a\xb3\x8c\xed\xdc\x8e\x4f\x7b\x98\
+\x1b\x0e\x20\x2d\x24\x5a\xd4\x88\x23\x61\x93\x8c\xec\x7c\x78\xfb\
+\xc3\x37\x18\xda\x19\x39\x7d\xe4\x9a\x61\xe9\x58\x65\x83\x9c\x29\
+\x27\xe7\x7b\x68\xb5\x12\x54\x23\xac\xba\xdf\xa2\xb1\x42\xe5\xe7\
+\x9a\xff\x24\x3e\x27\xd2\x1e\x2a\x36\x34\x63\xb9\x38\x1d\xa3\x62\
+\xee\xac\x77\xcb\xae\xad\x37\x3f\xf2\xfe\x8c\xac\x9b\x4a\xba\x99\
+\xb1\xb2\x41\x5b\x62\x40\x5a\x18\x65\xad\x57\xbc\x1a\x83\xdf\x9f\
+\xb2\x04\x0c\xcc\x21\x2b\xbd\xef\xb0\x7d\x78\x86\x12\x8a\xf8\x90\
+\x52\x92\xc2\xb2\x4d\x12\x39\xe5\xe3\xba\x6f\xfb\x9e\xc7\x6f\xa2\
+\xc9\x8b\x69\x90\x2e\xf5\x7d\x07\xa3\x79\xa5\xb2\x33\xd5\x1b\x53\
+\x1d\xf4\x89\xb4\x6e\x9b\x0a\xbb\x54\x4d\x8e\x1a\x26\xa1\x7e\xca\
+\xb3\x7c\x06\x70\x7c\xe0\x87\x6b\x21\x66\x1f\x9e\xef\xa0\xcc\x2e\
+\xf5\xd8\xb6\x78\xd0\x31\xac\xc7\x63\xd4\x24\x47\x6a\x93\xda\xca\
+\xe7\xad\xb5\x7e\x3a\xa4\xa6\xab\x56\x4a\x1b\x44\xed\x59\xa1\x11\
+\x76\xbe\x35\x3c\xd2\x30\xee\x1b\x97\x9e\x74\xbd\xf9\x2e\xa5\xa9\
+\x3f\x1d\xd3\xf0\x16\xf2\x67\xd5\x84\xcd\x1a\xd0\x80\x90\xa1\xca\
+\x50\x95\x83\x52\x8a\xb8\x31\x48\xd0\xb0\x4b\x5c\xe6\x94\x4b\xe7\
+\x50\xcd\x48\x33\x1f\x7a\x16\x8b\xda\x86\xd8\x87\xc2\x37\x2a\x01\
+\x15\xb6\xaa\x78\xf2\x61\xda\x9f\xf0\x0c\xc5\x40\x84\x01\xbf\xed\
+\x04\x00\x1a\xec\x04\x0c\x37\x2e\xc7\x1c\x8e\x36\xe3\x4a\xb5\xac\
+\x36\xe7\xb7\x9c\x53\x1a\xde\xa4\x86\x89\xbc\x54\xd2\xb3\x78\x6a\
+\x13\xb5\xef\xc7\x8f\xb1\x92\xe8\xaa\x9b\x4a\x92\x13\x01\x28\xcb\
+\xb2\x27\x3b\x1d\xa5\x97\x79\xf2\x5c\x9a\xde\xeb\xc9\x0e\x93\x3c\
+\xf3\xb4\x0d\x46\x9a\x11\x08\xe4\x3e\x4c\xd2\x15\xd7\xb7\x97\xaa\
+\x60\x45\x6b\x17\x02\x6a\x88\x9c\x64\x84\x49\x70\x42\x7f\x92\x9c\
+\x71\xe8\x04\xbb\x23\x4d\xc2\x1b\x1c\xde\x56\xf1\x11\xdf\xee\xf4\
+\x76\xd3\xcd\x26\x7a\x99\x92\x9b\xce\x8c\x2e\x3f\x99\x5e\x63\xc8\
+\x80\xe6\xe7\xdb\x2f\xef\x2e\x08\x69\x9a\x69\x92\x34\x56\xa5\xa9\
+\x7e\xac\x11\xd9\xe5\x4e\x84\x34\xcb\x41\x60\xa4\x11\x11\x15\x2f\
+\xbf\xec\xfa\x81\xda\xd0\x97\xd2\x0e\x09\xda\x8c\xa4\x03\xb4\xe9\
+\x0f\xf7\xa8\x57\x5a\x8f\xb2\xa6\x38\xcf\x2d\xfa\x1c\x7d\x73\x4b\
+\x7b\x4f\x3b\xd9\xfd\xe6\x96\xf8\xb8\x25\x3e\x17\x91\x03\x9b\xae\
+\x79\xa1\xcd\x6f\xbf\x7b\xa8\x80\x2a\x91\xff\xc2\x55\xa7\xb3\x6a\
+\x6a\x9c\x03\xb3\xdd\xdf\x6e\x38\xfe\x29\x89\xd9\x00\x90\x2b\x24\
+\x8d\x88\x56\x12\x0d\x8c\xe2\x30\x83\x85\x6e\x4e\x33\x76\x3c\x31\
+\xef\x79\x74\x5f\x87\xcc\xeb\xf4\x5d\x8f\x2f\xbc\xed\x27\xdb\xdb\
+\xdb\x6a\x80\x16\xc3\x79\x3a\x9f\xf5\x08\xfb\xba\x40\x87\x13\x38\
+\xc3\xa8\x52\xe2\x6b\x6e\x7b\x82\xbd\x33\x1d\xf6\x9b\xdd\x91\xaa\
+\x7d\x30\x57\xf6\x20\x42\xec\xa0\x9b\x79\x16\x7a\x79\xd5\x3f\xaf\
+\x6a\x55\x20\x5b\x1f\xe8\x09\xa0\x4a\x83\xd0\xfe\x26\xc5\x72\xb8\
+\xef\xc9\x61\x96\xfa\xf6\x66\x6d\xdd\x24\xcc\xad\x4d\x4f\x34\x9c\
+\x01\x40\x00\x57\xdf\xfa\x18\x93\xae\x61\x19\xc9\x37\x53\x6f\x7f\
+\xe7\xbd\x75\x10\x48\x1c\x64\x99\xd6\xdc\x81\x7e\x7f\x7e\x28\x85\
+\x0d\x02\xf1\x66\x25\x90\x23\x2d\xc9\x11\xbe\x1f\x0e\x68\xa3\x00\
+\x73\x00\x98\x3f\xd1\x70\x0e\x01\x04\xb0\x62\x7a\x0d\x66\x69\xd6\
+\xc9\xe5\xef\x53\x6f\x5f\xf5\x1e\x13\x11\x9a\x11\xf4\x52\x4f\x96\
+\x6b\x5f\x7a\xea\x3e\x50\x31\x7a\xa5\x18\xca\x78\xb8\x8a\x2e\x86\
+\x72\x34\xe9\x52\x60\x1f\xb0\x87\x20\x39\xc3\xf7\x46\x0f\x53\xe2\
+\xc5\x1b\xae\xba\xf3\x07\x00\x7c\xe9\x35\x6b\x67\x73\xb5\x9b\x80\
+\xd3\x11\x7e\x37\x76\xa1\x51\xea\xa6\x46\x2b\x29\xa7\x99\xf5\x93\
+\xd6\x8e\x30\xe2\xd4\xc2\x35\x1b\x1c\x6a\x83\x16\xdb\x94\x23\x6d\
+\x4b\x81\xfd\x05\x98\x1e\xcf\x72\x89\x8f\xb4\x63\xe6\xa4\x98\x15\
+\xbb\xb3\xc7\xd2\x88\xf7\x81\xad\xb2\x88\x8b\x9c\x08\x71\x64\x74\
+\x53\x25\x89\x6b\xfd\x03\x46\x31\xf0\xc9\x44\xad\x92\x0a\x77\x98\
+\xca\x1f\x0e\x50\xb9\x78\x82\x2a\x4d\x03\x73\x3c\x4b\x12\xb3\xb8\
+\x1c\xd1\xd3\x7a\xfb\x3f\x6e\x25\x73\x31\xf7\x6d\xbd\xe4\xee\x5c\
+\xf9\x80\xaa\x3d\x11\xb9\x30\x2c\xc6\x39\x48\xf3\xbe\xf4\x94\x3e\
+\x50\xe1\x54\x96\x12\x74\x24\x7b\x73\x38\x95\x4b\x81\x47\x81\x87\
+\x81\xd9\x5f\x17\x38\x4f\x09\x08\xe0\x8d\xdf\x7a\x84\x0b\xce\xf9\
+\x3f\xda\x2a\xff\xee\x8d\xbf\xf6\xca\x41\x33\xa3\x19\x87\xa0\xcc\
+\x57\x83\xa7\xc2\x2f\xbe\xb8\xf0\xa3\x1b\x25\xa0\x18\x06\x60\x2d\
+\x06\x55\x4e\xbc\x9b\x06\xee\x03\x76\x10\x1c\xcc\x5f\xab\x72\x54\
+\x5f\xfd\xea\x5b\x1f\x63\x04\x7c\x2f\xe3\x5f\x3a\xa9\xbf\xc5\x2b\
+\x39\x40\x33\x16\x46\x1a\x51\x15\x3f\xb8\x30\xa7\x4c\xec\xc8\x50\
+\xea\xc0\x22\x60\x2f\xf0\x0b\xe0\x21\x60\x81\x5f\x23\xa9\x39\x26\
+\x40\x00\x57\x7f\xeb\x51\x5c\x64\xed\x6e\xae\x7f\x9b\x79\xbd\xcd\
+\xab\x99\x13\xa1\x11\xf5\xfb\x25\x9d\x54\x3f\x87\xf3\x54\x52\x93\
+\x10\xbc\xec\xfb\x80\xbb\x81\xdd\x3c\x6b\xbf\xe2\xb0\x84\x80\x00\
+\xae\xbe\x75\x3b\x49\xe4\x76\xf7\x72\xfd\x40\x9a\xeb\x8f\xeb\xdd\
+\x3b\x61\x68\xae\x04\x15\x1b\x94\xa0\xf2\x73\x42\x30\xc2\x0f\x03\
+\x3f\x06\xb6\xc2\xd2\x67\xff\x9e\x55\x40\x00\x91\x17\xf2\x16\x0f\
+\xa6\xb9\xdd\x98\x7b\xab\x7e\x17\x4b\x04\x22\x07\xae\x18\xf7\x58\
+\x5b\x92\xe2\x1e\xd3\xc0\x7f\x03\xf7\x10\x5a\xa8\xdf\x98\x72\x4c\
+\x80\x5e\x7f\xdb\x76\xa2\x8e\xb0\xb7\x9d\xff\x57\x9a\xdb\x47\xb2\
+\xdc\xf6\x87\x5c\x91\x94\x80\xa8\x81\x49\x08\xde\xef\x5d\xc0\x8f\
+\x80\x27\x79\x96\x7f\xca\x62\xe8\x80\x00\xde\xf4\xed\xc7\x39\xa9\
+\x15\xdb\xc1\x9e\xff\x7a\x2f\xf3\x9f\xf2\xde\xba\x8e\xa0\x62\x91\
+\x13\x31\x23\x21\xb4\x46\xf7\x01\xb7\x03\xf7\x13\x82\xcc\xdf\xc8\
+\x72\x5c\x19\xa7\x6b\x6e\x7b\x9c\x56\x83\xb4\xeb\xfd\x67\xd3\x5c\
+\xbf\x0c\xf8\xd8\x09\xb1\x70\x70\x34\x91\xad\xc0\x7f\x00\x77\x10\
+\x3c\xe2\x5f\xcb\xd6\xe9\xe9\x96\x67\x94\x28\xfd\xca\x6b\xd7\x60\
+\xca\x86\x83\xb9\xfd\x43\x27\xb7\xbd\xbd\x5c\xbf\x71\xff\xae\xee\
+\x7f\x5e\xb2\x7a\x64\xf6\x1d\xdf\x9d\x7e\xb6\xeb\xb6\x24\xe5\xff\
+\x01\x70\x06\x42\x8b\x6e\xd0\xbf\x60\x00\x00\x00\x25\x74\x45\x58\
+\x74\x64\x61\x74\x65\x3a\x63\x72\x65\x61\x74\x65\x00\x32\x30\x31\
+\x35\x2d\x30\x37\x2d\x32\x35\x54\x32\x31\x3a\x35\x30\x3a\x34\x31\
+\x2b\x30\x38\x3a\x30\x30\x7f\x8d\xf2\x5e\x00\x00\x00\x25\x74\x45\
+\x58\x74\x64\x61\x74\x65\x3a\x6d\x6f\x64\x69\x66\x79\x00\x32\x30\
+\x31\x30\x2d\x30\x34\x2d\x32\x36\x54\x30\x30\x3a\x30\x30\x3a\x30\
+\x30\x2b\x30\x38\x3a\x30\x30\xa0\x55\x3b\x5d\x00\x00\x00\x4e\x74\
+\x45\x58\x74\x73\x6f\x66\x74\x77\x61\x72\x65\x00\x49\x6d\x61\x67\
+\x65\x4d\x61\x67\x69\x63\x6b\x20\x36\x2e\x38\x2e\x38\x2d\x31\x30\
+\x20\x51\x31\x36\x20\x78\x38\x36\x5f\x36\x34\x20\x32\x30\x31\x35\
+\x2d\x30\x37\x2d\x31\x39\x20\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\
+\x77\x2e\x69\x6d\x61\x67\x65\x6d\x61\x67\x69\x63\x6b\x2e\x6f\x72\
+\x67\x05\x0c\x9c\x35\x00\x00\x00\x18\x74\x45\x58\x74\x54\x68\x75\
+\x6d\x62\x3a\x3a\x44\x6f\x63\x75\x6d\x65\x6e\x74\x3a\x3a\x50\x61\
+\x67\x65\x73\x00\x31\xa7\xff\xbb\x2f\x00\x00\x00\x18\x74\x45\x58\
+\x74\x54\x68\x75\x6d\x62\x3a\x3a\x49\x6d\x61\x67\x65\x3a\x3a\x48\
+\x65\x69\x67\x68\x74\x00\x31\x32\x38\x43\x7c\x41\x80\x00\x00\x00\
+\x17\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x49\x6d\x61\x67\
+\x65\x3a\x3a\x57\x69\x64\x74\x68\x00\x31\x32\x38\xd0\x8d\x11\xdd\
+\x00\x00\x00\x19\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x4d\
+\x69\x6d\x65\x74\x79\x70\x65\x00\x69\x6d\x61\x67\x65\x2f\x70\x6e\
+\x67\x3f\xb2\x56\x4e\x00\x00\x00\x17\x74\x45\x58\x74\x54\x68\x75\
+\x6d\x62\x3a\x3a\x4d\x54\x69\x6d\x65\x00\x31\x32\x37\x32\x32\x31\
+\x31\x32\x30\x30\x09\x29\x0d\xef\x00\x00\x00\x13\x74\x45\x58\x74\
+\x54\x68\x75\x6d\x62\x3a\x3a\x53\x69\x7a\x65\x00\x31\x33\x2e\x31\
+\x4b\x42\x42\xac\x45\xdf\x72\x00\x00\x00\x56\x74\x45\x58\x74\x54\
+\x68\x75\x6d\x62\x3a\x3a\x55\x52\x49\x00\x66\x69\x6c\x65\x3a\x2f\
+\x2f\x2f\x68\x6f\x6d\x65\x2f\x77\x77\x77\x72\x6f\x6f\x74\x2f\x77\
+\x77\x77\x2e\x65\x61\x73\x79\x69\x63\x6f\x6e\x2e\x6e\x65\x74\x2f\
+\x63\x64\x6e\x2d\x69\x6d\x67\x2e\x65\x61\x73\x79\x69\x63\x6f\x6e\
+\x2e\x63\x6e\x2f\x73\x72\x63\x2f\x31\x30\x38\x2f\x31\x30\x38\x38\
+\x35\x2e\x70\x6e\x67\x25\x19\x95\x53\x00\x00\x00\x00\x49\x45\x4e\
+\x44\xae\x42\x60\x82\
+"
+
+qt_resource_name = b"\
+\x00\x08\
+\x0c\xa6\xc7\x95\
+\x00\x72\
+\x00\x65\x00\x73\x00\x6f\x00\x75\x00\x72\x00\x63\x00\x65\
+\x00\x08\
+\x00\x47\x5a\xe7\
+\x00\x66\
+\x00\x69\x00\x6e\x00\x64\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x09\
+\x00\x57\xb8\x67\
+\x00\x70\
+\x00\x72\x00\x69\x00\x6e\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x04\xb2\x58\xc7\
+\x00\x75\
+\x00\x6e\x00\x64\x00\x6f\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x07\
+\x04\xca\x57\xa7\
+\x00\x6e\
+\x00\x65\x00\x77\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x06\x57\x5a\xe7\
+\x00\x66\
+\x00\x6f\x00\x6e\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x06\x7c\x5a\x07\
+\x00\x63\
+\x00\x6f\x00\x70\x00\x79\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0b\
+\x06\x9d\x82\xc7\
+\x00\x6e\
+\x00\x6f\x00\x74\x00\x65\x00\x70\x00\x61\x00\x64\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x06\xc1\x59\x87\
+\x00\x6f\
+\x00\x70\x00\x65\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x09\
+\x06\xc7\x98\x67\
+\x00\x61\
+\x00\x62\x00\x6f\x00\x75\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0b\
+\x07\x69\xd9\x07\
+\x00\x72\
+\x00\x65\x00\x70\x00\x6c\x00\x61\x00\x63\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x06\
+\x07\x87\x57\x47\
+\x00\x71\
+\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0d\
+\x07\xaa\x23\xa7\
+\x00\x73\
+\x00\x65\x00\x6c\x00\x65\x00\x63\x00\x74\x00\x41\x00\x6c\x00\x6c\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x08\xa8\x5a\x07\
+\x00\x64\
+\x00\x61\x00\x74\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x08\xc8\x58\x67\
+\x00\x73\
+\x00\x61\x00\x76\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x09\
+\x09\xc7\xa6\xc7\
+\x00\x72\
+\x00\x65\x00\x73\x00\x65\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x09\
+\x0a\xa8\xba\x47\
+\x00\x70\
+\x00\x61\x00\x73\x00\x74\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x07\
+\x0a\xc7\x57\x87\
+\x00\x63\
+\x00\x75\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x09\
+\x0b\x85\x83\x07\
+\x00\x63\
+\x00\x6c\x00\x65\x00\x61\x00\x72\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x09\
+\x0b\x9e\x84\x87\
+\x00\x63\
+\x00\x68\x00\x65\x00\x63\x00\x6b\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x0b\xb2\x58\x47\
+\x00\x72\
+\x00\x65\x00\x64\x00\x6f\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0c\
+\x0b\xdf\x21\x47\
+\x00\x73\
+\x00\x65\x00\x74\x00\x74\x00\x69\x00\x6e\x00\x67\x00\x73\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0a\
+\x0c\xad\x0f\x07\
+\x00\x64\
+\x00\x65\x00\x6c\x00\x65\x00\x74\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x0f\x07\x5a\xc7\
+\x00\x65\
+\x00\x78\x00\x69\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+"
+
+qt_resource_struct_v1 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x17\x00\x00\x00\x02\
+\x00\x00\x00\x16\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x00\x2c\x00\x00\x00\x00\x00\x01\x00\x00\x28\x96\
+\x00\x00\x00\x44\x00\x00\x00\x00\x00\x01\x00\x00\x2f\x5e\
+\x00\x00\x00\x5a\x00\x00\x00\x00\x00\x01\x00\x00\x36\x4a\
+\x00\x00\x00\x6e\x00\x00\x00\x00\x00\x01\x00\x00\x39\xa2\
+\x00\x00\x00\x84\x00\x00\x00\x00\x00\x01\x00\x00\x89\x6d\
+\x00\x00\x00\x9a\x00\x00\x00\x00\x00\x01\x00\x00\x8e\xab\
+\x00\x00\x00\xb6\x00\x00\x00\x00\x00\x01\x00\x00\xec\x55\
+\x00\x00\x00\xcc\x00\x00\x00\x00\x00\x01\x00\x00\xf4\x72\
+\x00\x00\x00\xe4\x00\x00\x00\x00\x00\x01\x00\x01\x1f\x9e\
+\x00\x00\x01\x00\x00\x00\x00\x00\x00\x01\x00\x01\x39\x02\
+\x00\x00\x01\x12\x00\x00\x00\x00\x00\x01\x00\x01\x40\xc5\
+\x00\x00\x01\x32\x00\x00\x00\x00\x00\x01\x00\x01\x5c\xc5\
+\x00\x00\x01\x48\x00\x00\x00\x00\x00\x01\x00\x01\x89\xcb\
+\x00\x00\x01\x5e\x00\x00\x00\x00\x00\x01\x00\x01\x8e\x72\
+\x00\x00\x01\x76\x00\x00\x00\x00\x00\x01\x00\x01\x99\xc3\
+\x00\x00\x01\x8e\x00\x00\x00\x00\x00\x01\x00\x01\xa0\x34\
+\x00\x00\x01\xa2\x00\x00\x00\x00\x00\x01\x00\x01\xa5\x63\
+\x00\x00\x01\xba\x00\x00\x00\x00\x00\x01\x00\x01\xd2\x64\
+\x00\x00\x01\xd2\x00\x00\x00\x00\x00\x01\x00\x02\x11\xce\
+\x00\x00\x01\xe8\x00\x00\x00\x00\x00\x01\x00\x02\x18\xcd\
+\x00\x00\x02\x06\x00\x00\x00\x00\x00\x01\x00\x02\x68\x34\
+\x00\x00\x02\x20\x00\x00\x00\x00\x00\x01\x00\x02\x90\x66\
+"
+
+qt_resource_struct_v2 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x17\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x16\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x58\x03\x20\xff\x60\
+\x00\x00\x00\x2c\x00\x00\x00\x00\x00\x01\x00\x00\x28\x96\
+\x00\x00\x01\x58\x03\x20\xff\x60\
+\x00\x00\x00\x44\x00\x00\x00\x00\x00\x01\x00\x00\x2f\x5e\
+\x00\x00\x01\x58\x03\x20\xff\x60\
+\x00\x00\x00\x5a\x00\x00\x00\x00\x00\x01\x00\x00\x36\x4a\
+\x00\x00\x01\x58\x03\x20\xff\x60\
+\x00\x00\x00\x6e\x00\x00\x00\x00\x00\x01\x00\x00\x39\xa2\
+\x00\x00\x01\x58\x03\x20\xff\x60\
+\x00\x00\x00\x84\x00\x00\x00\x00\x00\x01\x00\x00\x89\x6d\
+\x00\x00\x01\x58\x03\x20\xff\x60\
+\x00\x00\x00\x9a\x00\x00\x00\x00\x00\x01\x00\x00\x8e\xab\
+\x00\x00\x01\x58\x03\x20\xff\x60\
+\x00\x00\x00\xb6\x00\x00\x00\x00\x00\x01\x00\x00\xec\x55\
+\x00\x00\x01\x58\x03\x20\xff\x60\
+\x00\x00\x00\xcc\x00\x00\x00\x00\x00\x01\x00\x00\xf4\x72\
+\x00\x00\x01\x58\x03\x20\xff\x60\
+\x00\x00\x00\xe4\x00\x00\x00\x00\x00\x01\x00\x01\x1f\x9e\
+\x00\x00\x01\x58\x03\x20\xff\x60\
+\x00\x00\x01\x00\x00\x00\x00\x00\x00\x01\x00\x01\x39\x02\
+\x00\x00\x01\x58\x03\x20\xff\x60\
+\x00\x00\x01\x12\x00\x00\x00\x00\x00\x01\x00\x01\x40\xc5\
+\x00\x00\x01\x58\x03\x20\xff\x60\
+\x00\x00\x01\x32\x00\x00\x00\x00\x00\x01\x00\x01\x5c\xc5\
+\x00\x00\x01\x58\x03\x20\xff\x60\
+\x00\x00\x01\x48\x00\x00\x00\x00\x00\x01\x00\x01\x89\xcb\
+\x00\x00\x01\x58\x03\x20\xff\x60\
+\x00\x00\x01\x5e\x00\x00\x00\x00\x00\x01\x00\x01\x8e\x72\
+\x00\x00\x01\x58\x03\x20\xff\x60\
+\x00\x00\x01\x76\x00\x00\x00\x00\x00\x01\x00\x01\x99\xc3\
+\x00\x00\x01\x58\x03\x20\xff\x60\
+\x00\x00\x01\x8e\x00\x00\x00\x00\x00\x01\x00\x01\xa0\x34\
+\x00\x00\x01\x58\x03\x20\xff\x60\
+\x00\x00\x01\xa2\x00\x00\x00\x00\x00\x01\x00\x01\xa5\x63\
+\x00\x00\x01\x58\x03\x20\xff\x60\
+\x00\x00\x01\xba\x00\x00\x00\x00\x00\x01\x00\x01\xd2\x64\
+\x00\x00\x01\x58\x03\x20\xff\x60\
+\x00\x00\x01\xd2\x00\x00\x00\x00\x00\x01\x00\x02\x11\xce\
+\x00\x00\x01\x58\x03\x20\xff\x60\
+\x00\x00\x01\xe8\x00\x00\x00\x00\x00\x01\x00\x02\x18\xcd\
+\x00\x00\x01\x58\x03\x20\xff\x60\
+\x00\x00\x02\x06\x00\x00\x00\x00\x00\x01\x00\x02\x68\x34\
+\x00\x00\x01\x58\x03\x20\xff\x60\
+\x00\x00\x02\x20\x00\x00\x00\x00\x00\x01\x00\x02\x90\x66\
+\x00\x00\x01\x58\x03\x20\xff\x60\
+"
+
+qt_version = [int(v) for v in QtCore.qVersion().split('.')]
+if qt_version < [5, 8, 0]:
+    rcc_version = 1
+    qt_resource_struct = qt_resource_struct_v1
+else:
+    rcc_version = 2
+    qt_resource_struct = qt_resource_struct_v2
+
+def qInitResources():
+    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
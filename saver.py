@@ -0,0 +1,59 @@
+import os
+import time
+
+from PyQt5 import QtCore
+
+from textcore import commitFile
+from textcore import createTemp
+
+
+CHUNK_SIZE = 1024 * 1024
+
+
+class FileSaver(QtCore.QThread):
+
+    progress = QtCore.pyqtSignal('qint64', 'qint64')
+
+    def __init__(self, filename, text, encoding='utf-8', bom=b'', newline='\n', parent=None):
+        super(FileSaver, self).__init__(parent)
+        self.filename = filename
+        self.text = text
+        self.encoding = encoding
+        self.bom = bom
+        self.newline = newline
+        self.written = 0
+        self.elapsed = 0.0
+        self.error = None
+
+    def run(self):
+        started = time.perf_counter()
+        # запись идёт во временный файл рядом с целевым и заменяет его
+        # одной операцией, поэтому сбой не оставит обрезанный файл
+        temp_name = None
+        # через символическую ссылку заменяется файл, на который она указывает
+        target = os.path.realpath(self.filename)
+        try:
+            fd, temp_name = createTemp(target)
+            with os.fdopen(fd, 'wb') as file:
+                file.write(self.bom)
+                self.written += len(self.bom)
+                total = len(self.text)
+                for start in range(0, total, CHUNK_SIZE):
+                    chunk = self.text[start:start + CHUNK_SIZE]
+                    if self.newline != '\n':
+                        chunk = chunk.replace('\n', self.newline)
+                    # байты, не подошедшие кодировке при чтении, пишутся как были
+                    data = chunk.encode(self.encoding, 'surrogateescape')
+                    file.write(data)
+                    self.written += len(data)
+                    self.progress.emit(min(start + CHUNK_SIZE, total), total)
+                file.flush()
+                os.fsync(file.fileno())
+            commitFile(temp_name, target)
+        except (OSError, UnicodeError) as error:
+            self.error = str(error)
+            if temp_name is not None and os.path.exists(temp_name):
+                os.remove(temp_name)
+        # снимок больше не нужен, память освобождается сразу
+        self.text = None
+        self.elapsed = time.perf_counter() - started
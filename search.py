@@ -0,0 +1,139 @@
+from bisect import bisect_left
+from bisect import bisect_right
+
+from PyQt5 import QtCore
+
+from docstats import changedBlocks
+from longlines import hasSoftBreaks
+from longlines import isContinuation
+from textcore import lastMatch
+
+
+class SearchEngine(QtCore.QObject):
+
+    def __init__(self, document, parent=None):
+        super(SearchEngine, self).__init__(parent)
+        self.document = document
+        # текст блоков, уже прочитанных из документа; None - не прочитан
+        self.blocks = [None] * document.blockCount()
+        # номера первого и последнего блока, среди которых могут быть
+        # непрочитанные; None - прочитаны все
+        self.unread = (0, len(self.blocks) - 1)
+        document.contentsChange.connect(self.onContentsChange)
+
+    def onContentsChange(self, position, removed, added):
+        first, old_last, last = changedBlocks(
+            self.document, position, added, len(self.blocks))
+        self.blocks[first:old_last + 1] = [None] * (last - first + 1)
+        if self.unread is not None:
+            # блоки после правки сдвигаются вместе с прежним диапазоном
+            low, high = self.unread
+            shift = last - old_last
+            low = low + shift if low > old_last else low
+            high = high + shift if high > old_last else high
+            first, last = min(low, first), min(max(high, last), len(self.blocks) - 1)
+        self.unread = (first, last)
+
+    def blockText(self, block, number):
+        text = self.blocks[number]
+        if text is None:
+            text = self.blocks[number] = block.text()
+        return text
+
+    def lineText(self, block, number):
+        # строка файла: блок вместе с продолжениями после мягких переносов,
+        # чтобы находились и совпадения через перенос; starts - начала
+        # отрезков в тексте строки
+        if not hasSoftBreaks(self.document):
+            return block, number, self.blockText(block, number), [0]
+        while number > 0 and isContinuation(block):
+            block = block.previous()
+            number -= 1
+        first, first_number = block, number
+        pieces = []
+        starts = []
+        length = 0
+        while True:
+            starts.append(length)
+            pieces.append(self.blockText(block, number))
+            length += len(pieces[-1])
+            block = block.next()
+            number += 1
+            if not block.isValid() or not isContinuation(block):
+                break
+        return first, first_number, ''.join(pieces), starts
+
+    def lineOffset(self, block, number, position):
+        # смещение позиции документа в тексте строки, начатой блоком block
+        if position <= block.position():
+            return 0
+        if not hasSoftBreaks(self.document):
+            return position - block.position()
+        return (position - block.position()
+                - (self.document.findBlock(position).blockNumber() - number))
+
+    def linePosition(self, block, starts, offset, end=False):
+        # на границе отрезков начало совпадения ставится после разделителя
+        # блоков, а конец - перед ним
+        index = bisect_left(starts, offset) if end else bisect_right(starts, offset)
+        return block.position() + offset + max(index - 1, 0)
+
+    def lineSpan(self, block, starts, match):
+        start = self.linePosition(block, starts, match.start())
+        return start, max(start, self.linePosition(block, starts, match.end(), True))
+
+    def find(self, pattern, position, backward=False, wrap=True):
+        block = self.document.findBlock(position)
+        block, number, text, starts = self.lineText(block, block.blockNumber())
+        offset = self.lineOffset(block, number, position)
+        first_number = number
+        count = len(self.blocks)
+
+        # после перехода через край поиск заканчивается на начальной строке
+        step = 0
+        while True:
+            if backward:
+                end = len(text) if step else offset
+                match = lastMatch(pattern, text, end)
+            else:
+                start = 0 if step else offset
+                match = pattern.search(text, start)
+                if match and match.end() == start and step == 0:
+                    # пустое совпадение в позиции курсора уже найдено
+                    match = pattern.search(text, start + 1) if start < len(text) else None
+            if match:
+                return self.lineSpan(block, starts, match)
+            if step and number == first_number:
+                return None
+
+            if backward:
+                block = block.previous()
+                number -= 1
+                if not block.isValid():
+                    if not wrap:
+                        return None
+                    block = self.document.lastBlock()
+                    number = count - 1
+            else:
+                number += len(starts)
+                if len(starts) > 1:
+                    block = self.document.findBlockByNumber(number)
+                else:
+                    block = block.next()
+                if not block.isValid():
+                    if not wrap:
+                        return None
+                    block = self.document.firstBlock()
+                    number = 0
+            block, number, text, starts = self.lineText(block, number)
+            step += 1
+
+    def match(self, pattern, start, end):
+        # совпадение, точно занимающее диапазон [start, end)
+        block = self.document.findBlock(start)
+        block, number, text, starts = self.lineText(block, block.blockNumber())
+        last = self.document.findBlockByNumber(number + len(starts) - 1)
+        if end > last.position() + last.length() - 1:
+            return None
+        return pattern.fullmatch(
+            text, self.lineOffset(block, number, start), self.lineOffset(block, number, end))
@@ -0,0 +1,181 @@
+import configparser
+import os
+import tempfile
+
+from PyQt5 import QtCore
+
+
+WRITE_DELAY = 1000
+LOCK_TIMEOUT = 5000
+RECENT_LIMIT = 10
+
+
+def readConfig(path):
+    config = configparser.ConfigParser(interpolation=None)
+    try:
+        config.read(path, 'utf-8')
+    except (configparser.Error, UnicodeError):
+        # испорченный файл не должен мешать запуску
+        config = configparser.ConfigParser(interpolation=None)
+    return config
+
+
+def mergeRecent(filenames, added):
+    for filename in added:
+        if filename in filenames:
+            filenames.remove(filename)
+        filenames.insert(0, filename)
+    return filenames[:RECENT_LIMIT]
+
+
+def applyChanges(config, changes, recent=()):
+    # ключ None означает удаление всего раздела
+    for (section, key), value in changes.items():
+        if key is None:
+            config.remove_section(section)
+            continue
+        if not config.has_section(section):
+            config.add_section(section)
+        config.set(section, key, value)
+    if recent:
+        filenames = config.get('Recent', 'files', fallback='').splitlines()
+        if not config.has_section('Recent'):
+            config.add_section('Recent')
+        config.set('Recent', 'files', '\n'.join(mergeRecent(filenames, recent)))
+
+
+def writeConfigFile(path, config):
+    directory, name = os.path.split(os.path.abspath(path))
+    fd, temp_name = tempfile.mkstemp(prefix='.%s.' % name, suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as file:
+            config.write(file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_name, path)
+    except OSError:
+        if os.path.exists(temp_name):
+            os.remove(temp_name)
+        raise
+
+
+class SettingsWriter(QtCore.QThread):
+
+    def __init__(self, path, changes, recent, parent=None):
+        super(SettingsWriter, self).__init__(parent)
+        self.path = path
+        self.changes = changes
+        self.recent = recent
+        self.config = None
+        self.error = None
+
+    def run(self):
+        # чтение, слияние и замена файла под блокировкой: изменения других
+        # запущенных блокнотов не теряются
+        lock = QtCore.QLockFile(self.path + '.lock')
+        if not lock.tryLock(LOCK_TIMEOUT):
+            self.error = 'файл настроек занят'
+            return
+        try:
+            config = readConfig(self.path)
+            applyChanges(config, self.changes, self.recent)
+            writeConfigFile(self.path, config)
+            self.config = config
+        except OSError as error:
+            self.error = str(error)
+        finally:
+            lock.unlock()
+
+
+class Settings(QtCore.QObject):
+
+    def __init__(self, path, parent=None):
+        super(Settings, self).__init__(parent)
+        self.path = path
+        self.config = readConfig(path)
+        self.changes = {}
+        self.recent = []
+        self.writer = None
+        self.timer = QtCore.QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(WRITE_DELAY)
+        self.timer.timeout.connect(self.flush)
+
+    def value(self, section, key, default):
+        return self.config.get(section, key, fallback=default)
+
+    def setValue(self, section, key, value):
+        value = str(value)
+        if self.value(section, key, None) == value:
+            return
+        if not self.config.has_section(section):
+            self.config.add_section(section)
+        self.config.set(section, key, value)
+        self.changes[(section, key)] = value
+        self.timer.start()
+
+    def removeSection(self, section):
+        self.config.remove_section(section)
+        # прежние изменения раздела теряют смысл, удаление идёт после них
+        for key in [key for key in self.changes if key[0] == section]:
+            del self.changes[key]
+        self.changes[(section, None)] = None
+        self.timer.start()
+
+    def recentFiles(self):
+        return self.value('Recent', 'files', '').splitlines()
+
+    def addRecentFile(self, filename):
+        applyChanges(self.config, {}, [filename])
+        self.recent.append(filename)
+        self.timer.start()
+
+    def isPending(self):
+        return bool(self.changes or self.recent)
+
+    def flush(self, force=False):
+        # запись идёт в фоне; изменения, накопленные за время записи,
+        # уходят следующей порцией
+        if self.writer is not None or not (force or self.isPending()):
+            return
+        self.writer = SettingsWriter(self.path, self.changes, self.recent, self)
+        self.writer.finished.connect(self.writeFinished)
+        self.changes = {}
+        self.recent = []
+        self.writer.start()
+
+    def writeFinished(self):
+        if self.writer is None or not self.writer.isFinished():
+            return
+        writer, self.writer = self.writer, None
+        if writer.error is not None:
+            # неудачная порция вернётся в очередь перед более новыми правками
+            changes = dict(writer.changes)
+            for key, value in self.changes.items():
+                changes.pop(key, None)
+                changes[key] = value
+            self.changes = changes
+            self.recent = writer.recent + self.recent
+        else:
+            # в кэш попадают и значения, записанные другими экземплярами
+            self.config = writer.config
+            applyChanges(self.config, self.changes, self.recent)
+        if self.isPending():
+            self.timer.start()
+
+    def sync(self):
+        self.timer.stop()
+        if self.writer is not None:
+            self.writer.wait()
+            self.writeFinished()
+        if not os.path.exists(self.path):
+            # файл удалён: в него попадает всё содержимое кэша
+            for section in self.config.sections():
+                for key, value in self.config.items(section):
+                    self.changes.setdefault((section, key), value)
+        elif not self.isPending():
+            return True
+        self.flush(True)
+        self.writer.wait()
+        self.writeFinished()
+        return not self.isPending()
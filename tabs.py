@@ -0,0 +1,74 @@
+import os
+
+from textformat import DEFAULT_FORMAT
+
+
+MEMORY_BUDGET = 1024 * 1024 * 1024
+# раскладка блока, кэши статистики и поиска: грубая оценка на строку
+BLOCK_OVERHEAD = 256
+
+
+def documentMemory(document):
+    # QTextDocument хранит текст в UTF-16
+    return document.characterCount() * 2 + document.blockCount() * BLOCK_OVERHEAD
+
+
+def byteOffset(position, characters, size, bom_size=0):
+    # оценка по средней длине символа в байтах: точного соответствия
+    # позиции в документе и смещения в файле без полного прохода нет
+    if characters <= 1:
+        return bom_size
+    return bom_size + position * (size - bom_size) // (characters - 1)
+
+
+def tabsToUnload(tabs, current, budget):
+    loaded = [tab for tab in tabs if tab.isLoaded()]
+    total = sum(tab.memoryUsage() for tab in loaded)
+    # сначала выгружаются неизменённые вкладки: их дешевле прочитать заново
+    candidates = sorted((tab for tab in loaded if tab is not current),
+                        key=lambda tab: (tab.isModified(), tab.last_used))
+    unload = []
+    for tab in candidates:
+        if total <= budget:
+            break
+        unload.append(tab)
+        total -= tab.memoryUsage()
+    return unload
+
+
+class DocumentTab(object):
+
+    def __init__(self):
+        self.filename = ''
+        self.text_format = DEFAULT_FORMAT
+        self.document = None
+        self.stats = None
+        self.search_engine = None
+        self.line_index = None
+        self.journal = None
+        self.history = None
+        self.viewer = None
+        self.spill_file = None
+        self.modified = False
+        self.cursor = (0, 0)
+        self.scroll = 0
+        # смещение видимой области в файле для загрузки с неё
+        self.offset = None
+        self.last_used = 0
+
+    def isLoaded(self):
+        return self.document is not None
+
+    def isModified(self):
+        if self.document is not None:
+            return self.document.isModified()
+        return self.modified
+
+    def memoryUsage(self):
+        if self.document is None:
+            return 0
+        return documentMemory(self.document)
+
+    def title(self):
+        title = os.path.basename(self.filename) or 'Без названия'
+        return title + '*' if self.isModified() else title
@@ -0,0 +1,118 @@
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+import unittest
+
+import batch
+from batch import parseArguments
+from batch import runBatch
+
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class TestBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.directory, 'conf', '.git'))
+        self.write('conf/a.ini', b'host = old.example\nport = 1\n')
+        self.write('conf/b.ini', b'host = other\r\n')
+        self.write('conf/.git/c.ini', b'host = old.example\n')
+        self.write('d.ini', b'# old.example\n')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def path(self, name):
+        return os.path.join(self.directory, name)
+
+    def write(self, name, data):
+        with open(self.path(name), 'wb') as file:
+            file.write(data)
+
+    def read(self, name):
+        with open(self.path(name), 'rb') as file:
+            return file.read()
+
+    def run_batch(self, *argv):
+        out = io.StringIO()
+        err = io.StringIO()
+        code = runBatch(parseArguments(list(argv)), out, err)
+        return code, out.getvalue(), err.getvalue()
+
+    def test_arguments(self):
+        arguments = parseArguments(['--replace', 'a', 'b', 'x.txt', 'y.txt', '-r'])
+        assert arguments.replace == ['a', 'b']
+        assert arguments.files == ['x.txt', 'y.txt']
+        assert batch.isBatch(arguments)
+        assert not batch.isBatch(parseArguments(['x.txt']))
+        with self.assertRaises(SystemExit):
+            parseArguments(['--replace', 'a', 'b'])
+
+    def test_replace(self):
+        code, out, err = self.run_batch(
+            '--replace', 'old.example', 'new.example', self.path('conf'), self.path('d.ini'), '-j', '1')
+        assert code == 0
+        assert sorted(out.splitlines()) == [
+            '%s: 1' % self.path('conf/a.ini'), '%s: 1' % self.path('d.ini')]
+        assert self.read('conf/a.ini') == b'host = new.example\nport = 1\n'
+        # скрытые каталоги не обходятся
+        assert self.read('conf/.git/c.ini') == b'host = old.example\n'
+        code, out, err = self.run_batch('--replace', 'old.example', 'x', self.path('conf'), '-j', '1')
+        assert code == 1
+
+    def test_pool(self):
+        batch.FILES_PER_TASK, files_per_task = 1, batch.FILES_PER_TASK
+        try:
+            code, out, err = self.run_batch(
+                '--replace', r'host = (\w+)', r'host: \1', '--regex', self.directory, '-j', '2')
+        finally:
+            batch.FILES_PER_TASK = files_per_task
+        assert code == 0
+        assert self.read('conf/b.ini') == b'host: other\r\n'
+        assert self.read('conf/a.ini') == b'host: old.example\nport = 1\n'
+
+    def test_errors(self):
+        code, out, err = self.run_batch('--replace', '(', 'x', '--regex', self.directory)
+        assert code == 2 and 'ошибка' in err
+        code, out, err = self.run_batch('--replace', 'a', 'x', self.path('missing.ini'), '-j', '1')
+        assert code == 2 and 'missing.ini' in err
+
+    def test_find(self):
+        code, out, err = self.run_batch('--find', 'OLD', '-i', self.directory, '-j', '1')
+        assert code == 0
+        assert sorted(out.splitlines()) == [
+            '%s:1:host = old.example' % self.path('conf/a.ini'),
+            '%s:1:# old.example' % self.path('d.ini')]
+
+    def test_without_qt(self):
+        # пакетный режим запускается из notepad.py и не загружает PyQt5
+        script = ('import runpy, sys; sys.argv = ["notepad.py", "--find", "old", %r, "-j", "1"]\n'
+                  'try:\n    runpy.run_path("notepad.py", run_name="__main__")\n'
+                  'except SystemExit as exit:\n'
+                  '    assert not [name for name in sys.modules if name.startswith("PyQt5")]\n'
+                  '    raise\n') % self.directory
+        result = subprocess.run([sys.executable, '-c', script], cwd=REPO_DIR,
+                                stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        assert result.returncode == 0, result.stderr
+        assert b'a.ini:1:host = old.example' in result.stdout
+
+    def test_workers_without_qt(self):
+        # рабочие процессы пула тоже не импортируют PyQt5 и модули окна
+        environment = dict(os.environ, PYTHONPROFILEIMPORTTIME='1')
+        result = subprocess.run(
+            [sys.executable, 'notepad.py', '--find', 'old', self.directory, '-j', '2'],
+            cwd=REPO_DIR, env=environment, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        assert result.returncode == 0, result.stderr
+        assert b'a.ini:1:host = old.example' in result.stdout
+        assert b'textcore' in result.stderr
+        assert b'PyQt5' not in result.stderr and b'resource_rc' not in result.stderr
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import sys
+
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+
+import unittest
+
+from docstats import DocumentStats
+
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+
+
+class TestDocumentStats(unittest.TestCase):
+
+    def setUp(self):
+        self.text = QtWidgets.QPlainTextEdit()
+        self.stats = DocumentStats(self.text.document())
+
+    def assertMatchesText(self):
+        context = self.text.toPlainText()
+        assert self.stats.characters() == len(context)
+        assert self.stats.lines() == context.count('\n') + 1
+        assert self.stats.words() == len(context.split())
+        assert self.stats.nonSpace() == len(''.join(context.split()))
+
+    def test_empty(self):
+        assert self.stats.characters() == 0
+        assert self.stats.words() == 0
+        self.assertMatchesText()
+
+    def test_setPlainText(self):
+        self.text.setPlainText('hello world\n\tfoo  bar\n\nbaz')
+        self.assertMatchesText()
+
+    def test_edits(self):
+        self.text.setPlainText('one two\nthree four\nfive')
+        cursor = QtGui.QTextCursor(self.text.document())
+        cursor.setPosition(3)
+        cursor.insertText('X Y\nZ')
+        self.assertMatchesText()
+        cursor.setPosition(2)
+        cursor.setPosition(12, QtGui.QTextCursor.KeepAnchor)
+        cursor.removeSelectedText()
+        self.assertMatchesText()
+        cursor.movePosition(QtGui.QTextCursor.End)
+        cursor.insertText('\n\nsix seven')
+        self.assertMatchesText()
+        self.text.selectAll()
+        self.text.textCursor().removeSelectedText()
+        self.assertMatchesText()
+
+    def test_signal(self):
+        calls = []
+        self.stats.changed.connect(lambda: calls.append(1))
+        self.text.appendPlainText('abc')
+        assert calls
+
+
+if __name__ == '__main__':
+
+    unittest.main()
@@ -0,0 +1,98 @@
+import sys
+
+from PyQt5 import QtCore
+from PyQt5 import QtTest
+from PyQt5 import QtWidgets
+
+import unittest
+
+import editor
+from editor import TextEdit
+from history import UndoHistory
+
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+
+
+class TestTextEdit(unittest.TestCase):
+
+    def setUp(self):
+        self.chunked_paste_size = editor.CHUNKED_PASTE_SIZE
+        editor.CHUNKED_PASTE_SIZE = 10
+        self.text = TextEdit()
+        self.requested = []
+        self.text.pasteRequested.connect(self.requested.append)
+
+    def tearDown(self):
+        editor.CHUNKED_PASTE_SIZE = self.chunked_paste_size
+
+    def mime(self, text):
+        mime = QtCore.QMimeData()
+        mime.setText(text)
+        return mime
+
+    def test_small_paste(self):
+        self.text.insertFromMimeData(self.mime('a\r\nb\rc'))
+        assert self.text.toPlainText() == 'a\nb\nc'
+        assert self.text.textCursor().position() == 5
+        assert self.requested == []
+
+    def test_large_paste(self):
+        self.text.insertFromMimeData(self.mime('line\r\n' * 3))
+        assert self.text.toPlainText() == ''
+        assert self.requested == ['line\n' * 3]
+
+    def test_history(self):
+        history = UndoHistory()
+        history.setDocument(self.text.document())
+        self.text.setHistory(history)
+        available = []
+        self.text.undoAvailable.connect(available.append)
+        QtTest.QTest.keyClicks(self.text, 'ab')
+        QtTest.QTest.keyClick(self.text, QtCore.Qt.Key_Backspace)
+        self.text.insertFromMimeData(self.mime('cd'))
+        assert self.text.toPlainText() == 'acd'
+        assert available[-1]
+        QtTest.QTest.keyClick(self.text, QtCore.Qt.Key_Z, QtCore.Qt.ControlModifier)
+        assert self.text.toPlainText() == 'a'
+        # удаление символа — отдельный шаг после набранного слова
+        self.text.undo()
+        assert self.text.toPlainText() == 'ab'
+        self.text.undo()
+        assert self.text.toPlainText() == ''
+        assert not available[-1]
+        self.text.redo()
+        assert self.text.toPlainText() == 'ab'
+
+    def test_copy_plain_text(self):
+        self.text.setPlainText('one\ntwo')
+        self.text.selectAll()
+        mime = self.text.createMimeDataFromSelection()
+        assert mime.formats() == ['text/plain']
+        assert mime.text() == 'one\ntwo'
+
+    def test_line_numbers(self):
+        self.text.setPlainText('line\n' * 8)
+        narrow = self.text.lineNumberWidth()
+        assert self.text.viewportMargins().left() == narrow
+        self.text.setPlainText('line\n' * 200000)
+        assert self.text.lineNumberWidth() > narrow
+        self.text.resize(300, 200)
+        self.text.show()
+        # отрисовка идёт только по видимым блокам
+        self.text.line_numbers.grab()
+        self.text.setLineNumbersVisible(False)
+        assert self.text.viewportMargins().left() == 0
+        self.text.close()
+
+    def test_parse_target(self):
+        assert editor.parseTarget('12') == ('line', 11, 0)
+        assert editor.parseTarget(' 12 : 5 ') == ('line', 11, 4)
+        assert editor.parseTarget('@1024') == ('offset', 1024, 0)
+        assert editor.parseTarget('0') == ('line', 0, 0)
+        assert editor.parseTarget('abc') is None
+
+
+if __name__ == '__main__':
+
+    unittest.main()
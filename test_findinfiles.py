@@ -0,0 +1,68 @@
+import os
+import shutil
+import sys
+import tempfile
+
+from PyQt5 import QtWidgets
+
+import unittest
+
+from findinfiles import FileSearch
+from textcore import iterFiles
+from textcore import searchFile
+from textcore import compilePattern
+
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+
+
+class TestFindInFiles(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.directory, 'sub'))
+        os.makedirs(os.path.join(self.directory, '.hidden'))
+        self.write('one.txt', b'alpha\r\nbeta needle\ngamma\n')
+        self.write('sub/two.log', 'строка needle\n'.encode('utf-8') * 3)
+        self.write('sub/empty.txt', b'')
+        self.write('binary.dat', b'\0needle')
+        self.write('.hidden/three.txt', b'needle')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write(self, name, data):
+        with open(os.path.join(self.directory, name), 'wb') as file:
+            file.write(data)
+
+    def test_iterFiles(self):
+        names = sorted(os.path.relpath(path, self.directory)
+                       for path in iterFiles(self.directory))
+        assert names == ['binary.dat', 'one.txt',
+                         os.path.join('sub', 'empty.txt'), os.path.join('sub', 'two.log')]
+
+    def test_searchFile(self):
+        pattern = compilePattern('needle')
+        path = os.path.join(self.directory, 'one.txt')
+        assert searchFile(path, pattern, b'needle') == [(1, 'beta needle')]
+        assert searchFile(path, compilePattern('NEEDLE', case_sensitive=False)) == [
+            (1, 'beta needle')]
+        assert searchFile(path, compilePattern('zeta'), b'zeta') == []
+        assert searchFile(os.path.join(self.directory, 'binary.dat'), pattern) == []
+        assert searchFile(os.path.join(self.directory, 'sub', 'empty.txt'), pattern) == []
+
+    def test_fileSearch(self):
+        found = {}
+        thread = FileSearch(self.directory, compilePattern('needle'), b'needle')
+        thread.fileMatched.connect(found.__setitem__)
+        thread.start()
+        while not thread.wait(10):
+            app.processEvents()
+        app.processEvents()
+        assert sorted(os.path.basename(path) for path in found) == ['one.txt', 'two.log']
+        assert thread.searched == 4
+
+
+if __name__ == '__main__':
+
+    unittest.main()
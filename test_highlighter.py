@@ -0,0 +1,93 @@
+import sys
+
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+
+import unittest
+
+import highlighter
+from highlighter import LogHighlighter
+from highlighter import highlightLine
+
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+
+
+class TestHighlightLine(unittest.TestCase):
+
+    def test_record(self):
+        ranges, state, sync = highlightLine('2024-01-02 10:11:12,345 ERROR user=bob failed')
+        assert ranges == [(0, 23, 'timestamp'), (24, 5, 'error'), (30, 4, 'key'), (35, 3, 'value')]
+        assert state == highlighter.STATE_ERROR
+        assert sync
+
+    def test_continuation(self):
+        ranges, state, sync = highlightLine('  at main.py:10', highlighter.STATE_ERROR)
+        assert ranges == [(0, 15, 'stack')]
+        assert state == highlighter.STATE_ERROR
+        assert not sync
+        ranges, state, _ = highlightLine('  at main.py:10', highlighter.STATE_INFO)
+        assert ranges == []
+        assert state == highlighter.STATE_INFO
+
+    def test_ini(self):
+        assert highlightLine('[server]', highlighter.STATE_ERROR) == (
+            [(0, 8, 'section')], highlighter.STATE_NONE, True)
+        assert highlightLine('; comment')[0] == [(0, 9, 'comment')]
+        assert highlightLine('name = John Smith')[0] == [(0, 4, 'key'), (7, 10, 'value')]
+
+
+class TestLogHighlighter(unittest.TestCase):
+
+    def setUp(self):
+        self.text = QtWidgets.QPlainTextEdit()
+        self.text.resize(400, 300)
+        lines = []
+        for number in range(5000):
+            level = 'ERROR' if number % 3 == 0 else 'INFO'
+            lines.append('10:00:00 %s line %d' % (level, number))
+            lines.append('  details %d' % number)
+        self.text.setPlainText('\n'.join(lines))
+        self.text.show()
+        self.highlighter = LogHighlighter(self.text)
+        self.highlighter.setDocument(self.text.document())
+        self.highlighter.setEnabled(True)
+        app.processEvents()
+
+    def tearDown(self):
+        self.text.close()
+
+    def formats(self, number):
+        block = self.text.document().findBlockByNumber(number)
+        return [(item.start, item.length) for item in block.layout().formats()]
+
+    def test_viewport(self):
+        assert self.formats(0) == [(0, 8), (9, 5)]
+        assert self.formats(1) == [(0, 11)]
+        # блоки вне видимой области не разбираются
+        assert self.text.document().findBlockByNumber(9000).userState() == -1
+        self.text.verticalScrollBar().setValue(9000)
+        app.processEvents()
+        assert self.formats(9001) == [(0, 14)]
+
+    def test_edit(self):
+        block = self.text.document().findBlockByNumber(0)
+        cursor = QtGui.QTextCursor(block)
+        cursor.setPosition(9)
+        cursor.setPosition(14, QtGui.QTextCursor.KeepAnchor)
+        cursor.insertText('INFO')
+        app.processEvents()
+        # новый уровень записи доходит до строки продолжения
+        assert self.formats(0) == [(0, 8), (9, 4)]
+        assert self.formats(1) == []
+
+    def test_disable(self):
+        self.highlighter.setEnabled(False)
+        self.highlighter.clear(self.text.document())
+        assert self.formats(0) == []
+        assert self.text.document().firstBlock().userState() == -1
+
+
+if __name__ == '__main__':
+
+    unittest.main()
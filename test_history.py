@@ -0,0 +1,168 @@
+import os
+import shutil
+import sys
+import tempfile
+
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+
+import unittest
+
+import history
+from history import UndoHistory
+
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+
+
+class TestUndoHistory(unittest.TestCase):
+
+    def setUp(self):
+        self.text = QtWidgets.QPlainTextEdit()
+        self.document = self.text.document()
+        self.document.setPlainText('one two\nthree')
+        self.document.setModified(False)
+        self.history = UndoHistory()
+        self.history.setDocument(self.document)
+
+    def edit(self, start, end, text):
+        self.history.prepare(start, end)
+        cursor = QtGui.QTextCursor(self.document)
+        cursor.setPosition(start)
+        cursor.setPosition(end, QtGui.QTextCursor.KeepAnchor)
+        cursor.insertText(text)
+
+    def test_undo_redo(self):
+        self.edit(4, 7, 'TWO')
+        self.edit(0, 0, 'zero\n')
+        assert self.document.toPlainText() == 'zero\none TWO\nthree'
+        self.history.undo()
+        assert self.document.toPlainText() == 'one TWO\nthree'
+        self.history.undo()
+        assert self.document.toPlainText() == 'one two\nthree'
+        assert not self.document.isModified()
+        assert not self.history.isUndoAvailable()
+        self.history.redo()
+        assert self.document.toPlainText() == 'one TWO\nthree'
+        assert self.document.isModified()
+        # новая правка отбрасывает отменённое
+        self.edit(0, 3, '1')
+        assert not self.history.isRedoAvailable()
+
+    def test_typing_merge(self):
+        for position, char in enumerate('abc'):
+            self.edit(position, position, char)
+        self.edit(3, 3, '\n')
+        self.edit(4, 4, 'd')
+        assert len(self.history.steps) == 3
+        self.history.undo()
+        self.history.undo()
+        self.history.undo()
+        assert self.document.toPlainText() == 'one two\nthree'
+
+    def unpreparedEdit(self, start, end, text):
+        # правка мимо prepare: удалённый текст истории неизвестен
+        self.history.window = None
+        cursor = QtGui.QTextCursor(self.document)
+        cursor.setPosition(start)
+        cursor.setPosition(end, QtGui.QTextCursor.KeepAnchor)
+        cursor.insertText(text)
+
+    def test_unknown_edit_keeps_steps(self):
+        self.edit(0, 3, 'ONE')
+        self.edit(8, 13, 'THREE')
+        self.history.undo()
+        self.unpreparedEdit(4, 7, 'x')
+        # отменённый шаг отброшен, более ранний сдвинут и отменяется
+        assert not self.history.isRedoAvailable()
+        assert self.history.isUndoAvailable()
+        assert self.document.isModified()
+        self.history.undo()
+        assert self.document.toPlainText() == 'one x\nthree'
+        self.history.redo()
+        assert self.document.toPlainText() == 'ONE x\nthree'
+
+    def test_unknown_edit_shifts_later_steps(self):
+        self.edit(8, 13, 'THREE')
+        self.unpreparedEdit(0, 3, '1')
+        self.history.undo()
+        assert self.document.toPlainText() == '1 two\nthree'
+
+    def test_unknown_edit_overlapping(self):
+        self.edit(0, 3, 'ONE')
+        self.edit(4, 7, 'TWO')
+        self.unpreparedEdit(5, 9, '')
+        # последний шаг задет правкой: он и всё до него недостижимы
+        assert not self.history.isUndoAvailable()
+        assert self.document.toPlainText() == 'ONE Three'
+
+    def test_group(self):
+        self.history.beginGroup(True)
+        cursor = QtGui.QTextCursor(self.document)
+        cursor.beginEditBlock()
+        for start, removed, text in ((8, 'three', '3'), (4, 'two', '2')):
+            cursor.setPosition(start)
+            cursor.setPosition(start + len(removed), QtGui.QTextCursor.KeepAnchor)
+            cursor.insertText(text)
+            self.history.record(start, removed, text)
+        cursor.endEditBlock()
+        self.history.endGroup()
+        assert self.document.toPlainText() == 'one 2\n3'
+        assert len(self.history.steps) == 1
+        self.history.undo()
+        assert self.document.toPlainText() == 'one two\nthree'
+
+    def test_compressed_step(self):
+        text = 'line of text\n' * 20000
+        self.history.beginGroup()
+        self.edit(0, 0, text)
+        self.history.endGroup()
+        step = self.history.steps[0]
+        assert step.changes == []
+        assert step.size < len(text)
+        self.history.undo()
+        assert self.document.toPlainText() == 'one two\nthree'
+        self.history.redo()
+        assert self.document.toPlainText() == text + 'one two\nthree'
+
+    def test_undecodable_bytes(self):
+        text = '\udcf0' + 'line of text\n' * 20000
+        self.history.beginGroup()
+        self.edit(0, 0, text)
+        self.history.endGroup()
+        assert self.history.steps[0].changes == []
+        self.history.undo()
+        self.history.redo()
+        assert self.document.toPlainText() == text + 'one two\nthree'
+
+    def test_budget(self):
+        self.history.setBudget(3 * history.CHANGE_OVERHEAD)
+        for number in range(5):
+            self.edit(0, 0, '%d\n' % number)
+        # старые шаги вытеснены, новые отменяются
+        assert self.history.size <= self.history.budget
+        assert len(self.history.steps) < 5
+        while self.history.isUndoAvailable():
+            self.history.undo()
+        assert self.document.toPlainText().startswith('%d\n' % (4 - len(self.history.steps)))
+        assert self.document.isModified()
+
+    def test_persist(self):
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, 'history')
+            self.edit(4, 7, 'TWO')
+            history.writeHistory(path, (1, 2), self.history.snapshot())
+            stamp, steps = history.readHistory(path)
+            assert stamp == (1, 2)
+            restored = UndoHistory()
+            restored.setDocument(self.document)
+            restored.restore(steps)
+            restored.undo()
+            assert self.document.toPlainText() == 'one two\nthree'
+        finally:
+            shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import os
+import sys
+
+from PyQt5 import QtCore
+from PyQt5 import QtWidgets
+
+import unittest
+
+from batch import parseArguments
+from instance import InstanceServer
+from instance import forwardFiles
+
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+
+
+class TestInstance(unittest.TestCase):
+
+    def setUp(self):
+        self.name = 'notepad-test-%d' % os.getpid()
+        self.received = []
+
+    def receive(self, server):
+        server.filesReceived.connect(self.received.append)
+        timer = QtCore.QElapsedTimer()
+        timer.start()
+        while not self.received and timer.elapsed() < 2000:
+            app.processEvents()
+
+    def test_no_server(self):
+        assert forwardFiles(['a.txt'], self.name) is False
+
+    def test_forward(self):
+        server = InstanceServer(self.name)
+        assert server.listen()
+        try:
+            assert forwardFiles(['a.txt', 'папка/b c.txt'], self.name)
+            self.receive(server)
+        finally:
+            server.close()
+        # пути передаются абсолютными: у процессов разные рабочие каталоги
+        assert self.received == [[os.path.abspath('a.txt'), os.path.abspath('папка/b c.txt')]]
+
+    def test_activate(self):
+        server = InstanceServer(self.name)
+        assert server.listen()
+        try:
+            assert forwardFiles([], self.name)
+            self.receive(server)
+        finally:
+            server.close()
+        assert self.received == [[]]
+
+    def test_arguments(self):
+        arguments = parseArguments(['a.txt', '--new-window'])
+        assert arguments.files == ['a.txt']
+        assert arguments.new_window
+        assert not parseArguments([]).new_window
+
+
+if __name__ == '__main__':
+
+    unittest.main()
@@ -0,0 +1,113 @@
+import os
+import shutil
+import sys
+import tempfile
+
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+
+import unittest
+from unittest.mock import patch
+
+from journal import EditJournal
+from journal import applyRecords
+from journal import compactRecords
+from journal import fileStamp
+from journal import isOrphaned
+from journal import journalPath
+from journal import mergeRecords
+from journal import readJournal
+from journal import writeJournal
+
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+
+
+class TestJournal(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.filename = os.path.join(self.directory, 'file.txt')
+        with open(self.filename, 'w') as file:
+            file.write('hello world\nsecond')
+        self.text = QtWidgets.QPlainTextEdit()
+        self.text.setPlainText('hello world\nsecond')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_mergeRecords(self):
+        assert mergeRecords((10, 0, 'ab'), (12, 0, 'c')) == (10, 0, 'abc')
+        assert mergeRecords((10, 0, 'abc'), (12, 1, '')) == (10, 0, 'ab')
+        assert mergeRecords((10, 2, 'ab'), (9, 3, 'x')) == (9, 3, 'x')
+        assert mergeRecords((10, 0, 'ab'), (20, 0, 'c')) is None
+        assert compactRecords([(0, 0, 'a'), (1, 0, 'b'), (5, 1, '')]) == [
+            (0, 0, 'ab'), (5, 1, '')]
+
+    def test_roundtrip(self):
+        path = journalPath(self.filename)
+        # одиночный суррогат - байт файла, не подошедший кодировке
+        records = [(0, 5, 'привет'), (3, 0, '\n'), (4, 0, 'x\udcf0')]
+        writeJournal(path, (1, 2), records)
+        assert readJournal(path) == ((1, 2), records)
+        with open(path, 'ab') as file:
+            file.write(b'\x01\x02')
+        assert readJournal(path) == ((1, 2), records)
+
+    def test_replay(self):
+        journal = EditJournal(self.text.document(), self.filename)
+        assert journal.start()
+        cursor = QtGui.QTextCursor(self.text.document())
+        cursor.setPosition(5)
+        for char in ', dear':
+            cursor.insertText(char)
+        cursor.deletePreviousChar()
+        cursor.movePosition(QtGui.QTextCursor.End)
+        cursor.insertText('\nthird')
+        journal.flush()
+        stamp, records = readJournal(journal.path)
+        assert stamp == fileStamp(self.filename)
+        assert len(records) == 2
+
+        replayed = QtWidgets.QPlainTextEdit()
+        replayed.setPlainText('hello world\nsecond')
+        applyRecords(replayed.document(), records)
+        assert replayed.toPlainText() == self.text.toPlainText()
+        journal.stop()
+        assert not os.path.exists(journal.path)
+
+    def test_rebase(self):
+        journal = EditJournal(self.text.document(), self.filename)
+        journal.start()
+        self.text.appendPlainText('saved')
+        journal.checkpoint()
+        self.text.appendPlainText('later')
+        journal.rebase()
+        assert readJournal(journal.path)[1] == [(24, 0, '\nlater')]
+        journal.stop()
+
+    def test_idle_flush(self):
+        journal = EditJournal(self.text.document(), self.filename)
+        journal.start()
+        with patch('journal.os.fsync') as fsync:
+            journal.flush()
+            assert not fsync.called
+            self.text.appendPlainText('edit')
+            journal.flush()
+            journal.flush()
+            assert fsync.call_count == 1
+        assert readJournal(journal.path)[1] == [(18, 0, '\nedit')]
+        journal.stop()
+
+    def test_isOrphaned(self):
+        assert not isOrphaned(self.filename)
+        journal = EditJournal(self.text.document(), self.filename)
+        journal.start()
+        assert not isOrphaned(self.filename)
+        journal.stop(keep=True)
+        assert isOrphaned(self.filename)
+
+
+if __name__ == '__main__':
+
+    unittest.main()
@@ -0,0 +1,129 @@
+import codecs
+import os
+import sys
+import tempfile
+
+from PyQt5 import QtWidgets
+
+import unittest
+
+import loader
+import longlines
+from loader import FileLoader
+from longlines import SOFT_BREAK
+
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+
+
+class TestFileLoader(unittest.TestCase):
+
+    def setUp(self):
+        self.first_chunk_size = loader.FIRST_CHUNK_SIZE
+        self.chunk_size = loader.CHUNK_SIZE
+        # маленькие блоки режут и многобайтные символы, и '\r\n'
+        loader.FIRST_CHUNK_SIZE = 3
+        loader.CHUNK_SIZE = 5
+        fd, self.filename = tempfile.mkstemp()
+        os.close(fd)
+
+    def tearDown(self):
+        loader.FIRST_CHUNK_SIZE = self.first_chunk_size
+        loader.CHUNK_SIZE = self.chunk_size
+        os.remove(self.filename)
+
+    def load(self, data, encoding='utf-8', offset=0, first_offset=None):
+        with open(self.filename, 'wb') as file:
+            file.write(data)
+        chunks = []
+        self.prefix = []
+        progress = []
+        thread = FileLoader(self.filename, encoding, offset, first_offset)
+        thread.chunkLoaded.connect(chunks.append)
+        thread.prefixLoaded.connect(self.prefix.append)
+        for signal in (thread.chunkLoaded, thread.prefixLoaded):
+            signal.connect(lambda text: thread.chunkDone())
+        thread.progress.connect(lambda done, total: progress.append((done, total)))
+        thread.start()
+        # блоки принимаются по ходу чтения, иначе загрузчик ждёт
+        while not thread.wait(10):
+            app.processEvents()
+        self.thread = thread
+        app.processEvents()
+        return ''.join(chunks), progress
+
+    def test_multibyte(self):
+        text, progress = self.load('привет, мир\nстрока'.encode('utf-8'))
+        assert text == 'привет, мир\nстрока'
+        assert progress[-1][0] == progress[-1][1]
+
+    def test_newlines(self):
+        text, _ = self.load(b'a\r\nbcd\r\n\r\nef\rg\r')
+        assert text == 'a\nbcd\n\nef\ng\n'
+
+    def test_first_offset(self):
+        data = 'первая\r\nвторая\r\nтретья\r\n'.encode('utf-8')
+        # чтение начинается со строки, следующей за смещением
+        text, progress = self.load(data, first_offset=5)
+        assert text == 'вторая\nтретья\n'
+        assert ''.join(self.prefix) == 'первая\n'
+        assert progress[-1] == (len(data), len(data))
+
+    def test_long_line(self):
+        long_line, line_search_size = longlines.LONG_LINE, loader.LINE_SEARCH_SIZE
+        longlines.LONG_LINE, loader.LINE_SEARCH_SIZE = 10, 100
+        try:
+            data = b'a\r\n' + b'x' * 5000 + b'\r\nb'
+            text, _ = self.load(data, first_offset=4000)
+        finally:
+            longlines.LONG_LINE, loader.LINE_SEARCH_SIZE = long_line, line_search_size
+        # длинная строка режется на отрезки, а в её середине чтение не начинается
+        assert not self.prefix
+        assert text.replace(SOFT_BREAK, '') == 'a\n' + 'x' * 5000 + '\nb'
+        assert text.split('\n')[1].split(SOFT_BREAK) == ['x' * 4096, 'x' * 904]
+
+    def test_undecodable(self):
+        data = b'ascii\r\n' * 3 + 'хвост'.encode('cp1251')
+        text, _ = self.load(data)
+        assert text.encode('utf-8', 'surrogateescape') == data.replace(b'\r\n', b'\n')
+        assert self.thread.invalid_offset is not None and self.thread.ascii
+        data = 'текст\n'.encode('utf-8') + b'\xff'
+        text, _ = self.load(data)
+        assert text.encode('utf-8', 'surrogateescape') == data
+        assert not self.thread.ascii
+        self.load('текст'.encode('utf-8'))
+        assert self.thread.invalid_offset is None
+
+    def test_backpressure(self):
+        pending = loader.MAX_PENDING_CHUNKS
+        loader.MAX_PENDING_CHUNKS = 2
+        with open(self.filename, 'wb') as file:
+            file.write(b'line\n' * 100)
+        chunks = []
+        thread = FileLoader(self.filename)
+        thread.chunkLoaded.connect(chunks.append)
+        try:
+            thread.start()
+            # без подтверждений чтение останавливается на двух блоках
+            assert not thread.wait(300)
+            app.processEvents()
+            assert len(chunks) == 2
+            thread.chunkDone()
+            assert not thread.wait(300)
+            app.processEvents()
+            assert len(chunks) == 3
+        finally:
+            loader.MAX_PENDING_CHUNKS = pending
+            thread.cancel()
+            assert thread.wait(1000)
+
+    def test_bom(self):
+        data = codecs.BOM_UTF16_LE + 'тест\r\nстрока'.encode('utf-16-le')
+        text, progress = self.load(data, 'utf-16-le', len(codecs.BOM_UTF16_LE))
+        assert text == 'тест\nстрока'
+        assert progress[-1] == (len(data), len(data))
+
+
+if __name__ == '__main__':
+
+    unittest.main()
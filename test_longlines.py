@@ -0,0 +1,122 @@
+import sys
+
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+
+import unittest
+
+import longlines
+from history import UndoHistory
+from longlines import SOFT_BREAK
+from longlines import LineIndex
+from longlines import LineSplitter
+from longlines import documentText
+from longlines import hasSoftBreaks
+from longlines import insertText
+from longlines import isContinuation
+from longlines import setText
+from longlines import textRange
+
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+
+TEXT = 'short\n' + 'x' * 250 + '\n' + 'ab, cd; ' * 40 + '\nend'
+
+
+class TestLongLines(unittest.TestCase):
+
+    def setUp(self):
+        self.sizes = longlines.LONG_LINE, longlines.SEGMENT_SIZE, longlines.SEGMENT_SLACK
+        longlines.LONG_LINE, longlines.SEGMENT_SIZE, longlines.SEGMENT_SLACK = 100, 30, 8
+        self.text = QtWidgets.QPlainTextEdit()
+        self.document = self.text.document()
+        self.index = LineIndex(self.document)
+
+    def tearDown(self):
+        longlines.LONG_LINE, longlines.SEGMENT_SIZE, longlines.SEGMENT_SLACK = self.sizes
+
+    def split(self, text, size):
+        splitter = LineSplitter()
+        pieces = [splitter.split(text[start:start + size]) for start in range(0, len(text), size)]
+        pieces.append(splitter.split('', True))
+        return ''.join(pieces)
+
+    def edit(self, start, end, text):
+        cursor = QtGui.QTextCursor(self.document)
+        cursor.setPosition(start)
+        cursor.setPosition(end, QtGui.QTextCursor.KeepAnchor)
+        insertText(cursor, text)
+
+    def test_split(self):
+        split = self.split(TEXT, 1000)
+        assert split.replace(SOFT_BREAK, '') == TEXT
+        # короткие строки не режутся, отрезки кончаются после разделителя
+        lines = split.split('\n')
+        assert lines[0] == 'short' and lines[3] == 'end'
+        assert lines[1].split(SOFT_BREAK) == ['x' * 30] * 8 + ['x' * 10]
+        assert all(segment.endswith(' ') for segment in lines[2].split(SOFT_BREAK)[:-1])
+        # разбиение не зависит от размера порций чтения
+        for size in (1, 7, 64):
+            assert self.split(TEXT, size) == split
+        assert LineSplitter().split('a' * 99 + '\n', True) == 'a' * 99 + '\n'
+
+    def test_document(self):
+        split = self.split(TEXT, 1000)
+        setText(self.document, split)
+        assert hasSoftBreaks(self.document)
+        assert self.document.blockCount() == split.count(SOFT_BREAK) + 4
+        assert documentText(self.document) == TEXT
+        assert documentText(self.document, SOFT_BREAK) == split
+        start = self.document.findBlockByNumber(2).position() - 2
+        assert textRange(self.document, start, start + 4) == 'x' + SOFT_BREAK + 'xx'
+        assert textRange(self.document, start, start + 4, '') == 'xxx'
+
+    def test_index(self):
+        split = self.split(TEXT, 1000)
+        setText(self.document, split)
+        index = self.index
+        assert index.continuations() == LineIndex(self.document).continuations()
+        assert index.count() == split.count(SOFT_BREAK)
+        offset = 0
+        for line, text in enumerate(TEXT.split('\n')):
+            for column in (0, len(text) // 2, len(text)):
+                position = index.position(line, column)
+                assert index.lineColumn(position) == (line, column)
+                assert index.realOffset(position) == offset + column
+                assert index.documentPosition(offset + column) == position
+            offset += len(text) + 1
+        assert index.position(10, 5) == self.document.characterCount() - 1
+
+    def test_edits(self):
+        setText(self.document, self.split(TEXT, 1000))
+        index = self.index
+        # удаление с начала блока: Qt оставляет метку удалённого продолжения
+        first = self.document.findBlockByNumber(1)
+        self.edit(first.position(), first.next().position(), '')
+        assert not isContinuation(self.document.findBlockByNumber(1))
+        assert documentText(self.document) == TEXT.replace('x' * 30, '', 1)
+        # мягкий перенос при вставке становится отрезком, перевод строки — строкой
+        self.edit(2, 2, 'A' + SOFT_BREAK + 'B\nC')
+        expected = TEXT.replace('x' * 30, '', 1)
+        expected = expected[:2] + 'AB\nC' + expected[2:]
+        assert documentText(self.document) == expected
+        assert index.continuations() == LineIndex(self.document).continuations()
+        assert self.document.blockCount() - index.count() == expected.count('\n') + 1
+
+    def test_undo(self):
+        setText(self.document, self.split(TEXT, 1000))
+        history = UndoHistory()
+        history.setDocument(self.document)
+        split = documentText(self.document, SOFT_BREAK)
+        start = self.document.findBlockByNumber(1).position()
+        end = self.document.findBlockByNumber(5).position() + 3
+        history.prepare(start, end)
+        self.edit(start, end, 'y')
+        history.undo()
+        assert documentText(self.document, SOFT_BREAK) == split
+        history.redo()
+        assert documentText(self.document) == TEXT[:6] + 'y' + TEXT[6 + 4 * 30 + 3:]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import sys
+import time
+
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+
+import unittest
+
+from matches import MatchHighlighter
+from search import SearchEngine
+from textcore import compilePattern
+
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+
+
+class TestMatchHighlighter(unittest.TestCase):
+
+    def setUp(self):
+        self.text = QtWidgets.QPlainTextEdit()
+        self.text.setPlainText('foo bar\nFoo food foo\nbar foo')
+        self.document = self.text.document()
+        self.engine = SearchEngine(self.document)
+        self.highlighter = MatchHighlighter(self.text, self.engine)
+
+    def tearDown(self):
+        self.highlighter.setPattern(None)
+
+    def waitCounted(self):
+        while self.highlighter.isCounting() or self.highlighter.restart_timer.isActive():
+            app.processEvents()
+
+    def test_count(self):
+        self.highlighter.setPattern(compilePattern('foo'))
+        self.waitCounted()
+        assert self.highlighter.total() == 4
+        assert len(self.text.extraSelections()) == 4
+
+    def test_currentIndex(self):
+        self.highlighter.setPattern(compilePattern('foo'))
+        self.waitCounted()
+        cursor = self.text.textCursor()
+        cursor.setPosition(17)
+        cursor.setPosition(20, QtGui.QTextCursor.KeepAnchor)
+        self.text.setTextCursor(cursor)
+        assert self.highlighter.currentIndex() == 3
+
+    def test_restart_on_edit(self):
+        self.highlighter.setPattern(compilePattern('bar'))
+        self.waitCounted()
+        assert self.highlighter.total() == 2
+        self.text.appendPlainText('bar')
+        assert self.highlighter.isCounting()
+        self.waitCounted()
+        assert self.highlighter.total() == 3
+
+    def test_scroll_refresh(self):
+        self.text.setPlainText('foo\n' * 5000)
+        self.text.show()
+        self.highlighter.setPattern(compilePattern('foo'))
+        self.waitCounted()
+        self.text.verticalScrollBar().setValue(4000)
+        # подсветка видимой области обновляется сразу, а не через 4000 мс
+        deadline = time.monotonic() + 1
+        while self.highlighter.refresh_timer.isActive() and time.monotonic() < deadline:
+            app.processEvents()
+        assert self.highlighter.refresh_timer.interval() < 1000
+        first = self.text.firstVisibleBlock().blockNumber()
+        numbers = [selection.cursor.blockNumber() for selection in self.text.extraSelections()]
+        assert first >= 3000 and first in numbers
+        self.text.hide()
+
+    def test_edit_reads_changed_blocks(self):
+        self.text.setPlainText('foo\n' * 10000)
+        self.highlighter.setPattern(compilePattern('foo'))
+        self.waitCounted()
+        assert self.highlighter.total() == 10000
+        read = []
+        blockText = self.engine.blockText
+        self.engine.blockText = lambda block, number: read.append(number) or blockText(block, number)
+        cursor = QtGui.QTextCursor(self.document.findBlockByNumber(5000))
+        cursor.insertText('foo ')
+        self.waitCounted()
+        # снимок после правки не обходит весь документ заново
+        assert self.highlighter.total() == 10001
+        assert 5000 in read and len(read) < 1000
+
+    def test_clear(self):
+        self.highlighter.setPattern(compilePattern('foo'))
+        self.highlighter.setPattern(None)
+        assert self.text.extraSelections() == []
+        assert self.highlighter.total() == 0
+
+
+if __name__ == '__main__':
+
+    unittest.main()
@@ -1,9 +1,11 @@
 from notepad import Notepad
 
 
+import codecs
 import ctypes
 import os
 import sys
+import tempfile
 
 import PyQt5
 from PyQt5 import QtCore
@@ -12,14 +14,21 @@ from PyQt5 import QtGui
 from PyQt5 import QtWidgets
 from PyQt5.QtPrintSupport import QPrinter
 
+import replacer
+from longlines import LONG_LINE
+from longlines import hasSoftBreaks
+from textformat import SAMPLE_SIZE
+
 
 import unittest
 from unittest.mock import MagicMock
+from unittest.mock import patch
 
 
 CONFIG_FILE_PATH = 'notepad.ini'
 
-ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID("notepad")
+if sys.platform == 'win32':
+    ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID("notepad")
 QtCore.QTextCodec.setCodecForLocale(QtCore.QTextCodec.codecForName("utf-8"))
 
 
@@ -74,9 +83,11 @@ class TestNotepad(unittest.TestCase):
 
 
 
-    def test_judgeConfig(self):
-        os.remove('notepad.ini')
-        assert self.widget.judgeConfig() is None
+    def test_flushConfig(self):
+        if os.path.exists(CONFIG_FILE_PATH):
+            os.remove(CONFIG_FILE_PATH)
+        # файл настроек не создаётся при запуске, только при записи
+        self.widget.flushConfig()
         assert os.path.exists(CONFIG_FILE_PATH)
 
     def test_closeEvent(self):
@@ -99,6 +110,8 @@ class TestNotepad(unittest.TestCase):
         self.widget.maybeSave = MagicMock(return_value=self.widget.saveFile())
         assert self.widget.newFile() is None
         assert self.text.isVisible() is False
+        # каждый новый документ открывается в своей вкладке
+        assert self.widget.tab_bar.count() == 4
 
 
     def test_openFile(self):
@@ -193,6 +206,188 @@ class TestNotepad(unittest.TestCase):
         print('нажмите отмена')
         assert self.widget.maybeSave() is False
 
+    def waitLoaded(self):
+        while self.widget.loader is not None or self.widget.saver is not None:
+            app.processEvents()
+
+    def test_long_line_then_short_file(self):
+        directory = tempfile.mkdtemp()
+        long_name = os.path.join(directory, 'long.json')
+        short_name = os.path.join(directory, 'short.txt')
+        with open(long_name, 'w') as file:
+            file.write('[' + '1, ' * LONG_LINE + ']\n')
+        with open(short_name, 'w') as file:
+            file.write('short\n')
+        self.widget.openPath(long_name)
+        self.waitLoaded()
+        assert hasSoftBreaks(self.widget.text.document())
+        assert self.widget.closeTab(0)
+        # тот же документ после закрытия последней вкладки — уже обычный текст
+        self.widget.openPath(short_name)
+        self.waitLoaded()
+        assert not hasSoftBreaks(self.widget.text.document())
+        assert 'длинные строки' not in self.widget.stats_label.text()
+        self.widget.text.insertPlainText('edit ')
+        assert self.widget.saveFile()
+        self.waitLoaded()
+        assert self.widget.journal is not None
+        self.widget.stopJournal()
+        for name in (long_name, short_name):
+            os.remove(name)
+        os.rmdir(directory)
+
+    def test_save_during_replace(self):
+        fd, filename = tempfile.mkstemp(suffix='.txt')
+        with os.fdopen(fd, 'w') as file:
+            file.write('foo\n' * 1000)
+        self.widget.openPath(filename)
+        self.waitLoaded()
+        batch = replacer.BLOCK_BATCH
+        replacer.BLOCK_BATCH = 10
+        try:
+            self.widget.replace()
+            self.widget.search_text.setText('foo')
+            self.widget.replace_text.setText('bar')
+            self.widget.replaceAll()
+            assert self.widget.replacer is not None
+            # сохранение дожидается конца замены
+            assert self.widget.saveFile()
+            assert self.widget.replacer is None
+            self.waitLoaded()
+        finally:
+            replacer.BLOCK_BATCH = batch
+        with open(filename) as file:
+            assert file.read() == 'bar\n' * 1000
+        assert not self.widget.text.document().isModified()
+        self.widget.stopJournal()
+        os.remove(filename)
+
+    def test_cp1251_after_sample(self):
+        # образец из одного ASCII не доказывает UTF-8
+        data = b'x' * 100 + b'\r\n'
+        data = data * (SAMPLE_SIZE // len(data) + 1) + 'хвост\r\n'.encode('cp1251')
+        fd, filename = tempfile.mkstemp(suffix='.txt')
+        with os.fdopen(fd, 'wb') as file:
+            file.write(data)
+        self.widget.openPath(filename)
+        self.waitLoaded()
+        assert self.widget.text_format.encoding == 'cp1251'
+        assert self.widget.text.toPlainText().endswith('хвост\n')
+        self.widget.text.document().setModified(True)
+        assert self.widget.saveFile()
+        self.waitLoaded()
+        with open(filename, 'rb') as file:
+            assert file.read() == data
+        self.widget.stopJournal()
+        os.remove(filename)
+
+    def test_undecodable_bytes_kept(self):
+        # UTF-8 подтверждён кириллицей в образце, чужой байт дальше не теряется
+        line = 'текст\r\n'.encode('utf-8')
+        data = line * (SAMPLE_SIZE // len(line) + 1) + b'\xff\r\n'
+        fd, filename = tempfile.mkstemp(suffix='.txt')
+        with os.fdopen(fd, 'wb') as file:
+            file.write(data)
+        self.widget.openPath(filename)
+        self.waitLoaded()
+        assert self.widget.text_format.encoding == 'utf-8'
+        assert 'сохранятся без изменений' in self.widget.statusBar().currentMessage()
+        self.widget.text.document().setModified(True)
+        assert self.widget.saveFile()
+        self.waitLoaded()
+        with open(filename, 'rb') as file:
+            assert file.read() == data
+        self.widget.stopJournal()
+        os.remove(filename)
+
+    def test_viewer_follows_appends(self):
+        fd, filename = tempfile.mkstemp(suffix='.log')
+        with os.fdopen(fd, 'wb') as file:
+            file.write(b'first\n' * 100)
+        self.widget.viewer_threshold = 100
+        self.widget.openPath(filename)
+        viewer = self.widget.viewer
+        # последняя порция индекса приходит сигналом уже после конца потока
+        while not viewer.isIndexed():
+            app.processEvents()
+        count = viewer.lineCount()
+        with open(filename, 'ab') as file:
+            file.write(b'appended\n' * 3)
+        # большой файл в просмотрщике тоже дочитывается при дописывании
+        self.widget.file_watcher.check()
+        while not viewer.isIndexed():
+            app.processEvents()
+        assert viewer.lineCount() == count + 3
+        assert [viewer.lineText(count + i) for i in (-1, 1, 2)] == ['appended', 'appended', '']
+        self.widget.closeTab(0)
+        os.remove(filename)
+
+    def test_utf16_above_threshold(self):
+        fd, filename = tempfile.mkstemp(suffix='.txt')
+        with os.fdopen(fd, 'wb') as file:
+            file.write(codecs.BOM_UTF16_LE + 'строка\r\n'.encode('utf-16-le') * 10)
+        self.widget.viewer_threshold = 100
+        # UTF-16 не открывается в просмотрщике: полная загрузка только с согласия
+        with patch.object(QtWidgets.QMessageBox, 'question',
+                          return_value=QtWidgets.QMessageBox.No) as question:
+            assert not self.widget.openPath(filename)
+        assert question.called
+        assert self.widget.cur_file == '' and self.widget.loader is None
+        with patch.object(QtWidgets.QMessageBox, 'question',
+                          return_value=QtWidgets.QMessageBox.Yes):
+            assert self.widget.openPath(filename)
+        self.waitLoaded()
+        assert self.widget.viewer is None
+        assert self.widget.text.toPlainText() == 'строка\n' * 10
+        self.widget.stopJournal()
+        os.remove(filename)
+
+    def test_restore_session_discards_pristine(self):
+        fd, filename = tempfile.mkstemp(suffix='.txt')
+        with os.fdopen(fd, 'wb') as file:
+            file.write(b'text\n')
+        initial = self.widget.current_tab
+        destroyed = []
+        for child in (initial.line_index, initial.history, initial.document):
+            child.destroyed.connect(lambda: destroyed.append(True))
+        self.widget.writeConfig('Session', 'file0', filename)
+        self.widget.writeConfig('Session', 'current', 0)
+        self.widget.restoreSession()
+        self.waitLoaded()
+        QtCore.QCoreApplication.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+        # нетронутая начальная вкладка удаляется целиком, как при закрытии
+        assert self.widget.tab_bar.count() == 1
+        assert self.widget.cur_file == filename
+        assert len(destroyed) == 3
+        self.widget.closeTab(0)
+        os.remove(filename)
+
+    def test_open_during_load(self):
+        filenames = []
+        for text in (b'first\n' * 100000, b'second\n'):
+            fd, filename = tempfile.mkstemp(suffix='.txt')
+            with os.fdopen(fd, 'wb') as file:
+                file.write(text)
+            filenames.append(filename)
+        self.widget.openPath(filenames[0])
+        assert self.widget.loader is not None
+        # открытие во время загрузки не прерывает её, а ждёт очереди
+        assert self.widget.openPath(filenames[1])
+        assert self.widget.tab_bar.count() == 1
+        assert not self.widget.newAction.isEnabled()
+        self.waitLoaded()
+        while self.widget.open_queue or self.widget.loader is not None:
+            app.processEvents()
+        tabs = self.widget.tabs()
+        assert [tab.filename for tab in tabs] == filenames
+        assert self.widget.text.toPlainText() == 'second\n'
+        assert not tabs[0].document.isModified()
+        assert tabs[0].document.blockCount() == 100001
+        assert self.widget.newAction.isEnabled()
+        self.widget.stopJournal()
+        for filename in filenames:
+            os.remove(filename)
+
     def test_setFont(self):
         print('нажмите ОК')
         self.widget.setFont()
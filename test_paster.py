@@ -0,0 +1,51 @@
+import sys
+
+from PyQt5 import QtWidgets
+
+import unittest
+
+import paster
+from paster import Paster
+
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+
+
+class TestPaster(unittest.TestCase):
+
+    def setUp(self):
+        self.chunk_size = paster.CHUNK_SIZE
+        paster.CHUNK_SIZE = 4
+        self.text = QtWidgets.QPlainTextEdit()
+        self.text.setPlainText('head\nSELtail')
+
+    def tearDown(self):
+        paster.CHUNK_SIZE = self.chunk_size
+
+    def paste(self, start, end, text):
+        finished = []
+        progress = []
+        worker = Paster(self.text.document(), start, end, text)
+        worker.finished.connect(finished.append)
+        worker.progress.connect(lambda done, total: progress.append((done, total)))
+        worker.start()
+        while not finished:
+            app.processEvents()
+        return finished[0], progress
+
+    def test_paste(self):
+        position, progress = self.paste(5, 8, 'one\ntwo\nthree')
+        assert self.text.toPlainText() == 'head\none\ntwo\nthreetail'
+        assert position == 18
+        assert len(progress) == 4
+        assert progress[-1] == (13, 13)
+
+    def test_single_undo(self):
+        self.paste(5, 8, 'x' * 30)
+        self.text.undo()
+        assert self.text.toPlainText() == 'head\nSELtail'
+
+
+if __name__ == '__main__':
+
+    unittest.main()
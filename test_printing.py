@@ -0,0 +1,80 @@
+import os
+import sys
+import tempfile
+
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5.QtPrintSupport import QPrinter
+
+import unittest
+
+from printing import PageLayout
+from printing import PrintJob
+
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+
+
+class TestPageLayout(unittest.TestCase):
+
+    def setUp(self):
+        self.printer = QPrinter(QPrinter.HighResolution)
+        self.font = QtGui.QFont('Monospace', 10)
+
+    def test_lazy(self):
+        layout = PageLayout('\n'.join(str(number) for number in range(10000)),
+                            self.font, self.printer)
+        rows = layout.rows_per_page
+        assert layout.hasPage(1)
+        # размечены только запрошенные страницы
+        assert len(layout.page_starts) == 2
+        assert layout.pageCount() is None
+        assert layout.pageEstimate() == -(-10000 // rows)
+        assert not layout.hasPage(layout.pageEstimate())
+        assert layout.pageCount() == layout.pageEstimate()
+        assert layout.page_starts[1] == len(''.join('%d\n' % number for number in range(rows)))
+
+    def test_wrap(self):
+        text = 'x' * 10000
+        layout = PageLayout(text, self.font, self.printer)
+        end, next_position = layout.nextRow(0)
+        assert 0 < end < len(text)
+        assert next_position == end
+        assert layout.metrics.horizontalAdvance(text[:end]) <= layout.page.width()
+        assert layout.nextRow(len(text) - 1) == (len(text), len(text) + 1)
+
+    def test_empty(self):
+        layout = PageLayout('', self.font, self.printer)
+        assert layout.hasPage(0)
+        assert layout.pageCount() == 1
+
+
+class TestPrintJob(unittest.TestCase):
+
+    def test_pdf_range(self):
+        fd, filename = tempfile.mkstemp(suffix='.pdf')
+        os.close(fd)
+        try:
+            printer = QPrinter(QPrinter.HighResolution)
+            printer.setOutputFormat(QPrinter.PdfFormat)
+            printer.setOutputFileName(filename)
+            layout = PageLayout('\n'.join('строка %d' % number for number in range(1000)),
+                                QtGui.QFont('Monospace', 10), printer)
+            progress = []
+            job = PrintJob(printer, layout, 1, 2)
+            job.progress.connect(lambda done, total: progress.append((done, total)))
+            job.start()
+            job.wait()
+            app.processEvents()
+            assert job.error is None
+            assert job.printed == 2
+            assert progress == [(1, 2), (2, 2)]
+            with open(filename, 'rb') as file:
+                assert file.read().count(b'/Type /Page\n') == 2
+        finally:
+            os.remove(filename)
+
+
+if __name__ == '__main__':
+
+    unittest.main()
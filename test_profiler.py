@@ -0,0 +1,118 @@
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from PyQt5 import QtTest
+from PyQt5 import QtWidgets
+
+import unittest
+
+from profiler import Profiler
+from profiler import ProfilerDialog
+
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+
+
+class Handlers(object):
+
+    def __init__(self):
+        self.calls = []
+
+    def openFile(self):
+        self.calls.append('open')
+
+    def setHighlight(self, enabled):
+        self.calls.append(enabled)
+
+
+def wait(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        app.processEvents()
+        time.sleep(0.005)
+
+
+def blockGui():
+    time.sleep(0.3)
+
+
+class TestProfiler(unittest.TestCase):
+
+    def setUp(self):
+        self.profiler = Profiler()
+        self.handlers = Handlers()
+        self.profiler.instrument(self.handlers, ('openFile', 'setHighlight'))
+
+    def tearDown(self):
+        self.profiler.setEnabled(False)
+
+    def test_timed(self):
+        # лишний аргумент сигнала отбрасывается
+        action = QtWidgets.QAction('open', None, triggered=self.handlers.openFile)
+        action.trigger()
+        assert self.handlers.calls == ['open']
+        assert list(self.profiler.spans) == []
+        self.profiler.setEnabled(True)
+        action.trigger()
+        self.handlers.setHighlight(True)
+        assert self.handlers.calls == ['open', 'open', True]
+        names = [row[0] for row in self.profiler.actionSummary()]
+        assert sorted(names) == ['openFile', 'setHighlight']
+
+    def test_keystroke(self):
+        text = QtWidgets.QPlainTextEdit()
+        self.profiler.watchKeys(text)
+        self.profiler.setEnabled(True)
+        text.show()
+        wait(0.05)
+        QtTest.QTest.keyClick(text, 'a')
+        wait(0.05)
+        text.close()
+        assert self.profiler.keySummary()[0] == 1
+
+    def test_stall(self):
+        self.profiler.setThreshold(100)
+        self.profiler.setEnabled(True)
+        wait(0.1)
+        blockGui()
+        wait(0.2)
+        assert len(self.profiler.stalls) == 1
+        start, end, samples = self.profiler.stalls[0]
+        assert end - start >= 0.2
+        assert any('blockGui' in frame for frame in self.profiler.topStack(samples))
+
+    def test_export(self):
+        self.profiler.setEnabled(True)
+        self.handlers.openFile()
+        self.profiler.addStall(self.profiler.origin, self.profiler.origin + 0.5, [('a.py:1 f',)])
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, 'trace.json')
+            self.profiler.export(path, trace=True)
+            with open(path, encoding='utf-8') as file:
+                events = json.load(file)['traceEvents']
+            assert [event['name'] for event in events] == ['stall', 'openFile']
+            assert events[0]['dur'] == 500000
+            assert events[0]['args']['stack'] == ['a.py:1 f']
+            path = os.path.join(directory, 'profile.json')
+            self.profiler.export(path)
+            with open(path, encoding='utf-8') as file:
+                data = json.load(file)
+            assert data['stalls'][0]['stacks'] == [{'stack': ['a.py:1 f'], 'count': 1}]
+        finally:
+            shutil.rmtree(directory)
+
+    def test_dialog(self):
+        self.profiler.setEnabled(True)
+        self.handlers.openFile()
+        dialog = ProfilerDialog(self.profiler)
+        assert dialog.table.rowCount() == 1
+        assert dialog.table.item(0, 0).text() == 'openFile'
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import sys
+
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+
+import unittest
+
+import replacer
+from history import UndoHistory
+from longlines import LineIndex
+from longlines import SOFT_BREAK
+from longlines import documentText
+from longlines import insertText
+from replacer import Replacer
+from search import SearchEngine
+from textcore import compilePattern
+
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+
+
+class TestReplacer(unittest.TestCase):
+
+    def setUp(self):
+        self.batch = replacer.BLOCK_BATCH
+        replacer.BLOCK_BATCH = 2
+        self.text = QtWidgets.QPlainTextEdit()
+        self.text.setPlainText('foo bar\nFoo food foo\nbar foo\n' + 'o' * 40)
+        self.document = self.text.document()
+        self.engine = SearchEngine(self.document)
+
+    def tearDown(self):
+        replacer.BLOCK_BATCH = self.batch
+
+    def run_replace(self, pattern, replacement, expand=False, start=0, end=None, history=None):
+        counts = []
+        task = Replacer(self.document, self.engine, pattern, replacement,
+                        expand, start, end)
+        task.finished.connect(counts.append)
+        if history is not None:
+            task.replaced.connect(history.record)
+        task.start()
+        while not counts:
+            app.processEvents()
+        return counts[0]
+
+    def test_replace_all(self):
+        context = self.text.toPlainText()
+        assert self.run_replace(compilePattern('o'), '0') == context.count('o')
+        assert self.text.toPlainText() == context.replace('o', '0')
+
+    def test_single_undo_step(self):
+        context = self.text.toPlainText()
+        self.run_replace(compilePattern('foo'), 'x\ny')
+        assert self.text.toPlainText() == context.replace('foo', 'x\ny')
+        self.document.undo()
+        assert self.text.toPlainText() == context
+        assert not self.document.isUndoAvailable()
+
+    def test_history(self):
+        context = self.text.toPlainText()
+        history = UndoHistory()
+        history.setDocument(self.document)
+        history.beginGroup(True)
+        self.run_replace(compilePattern('foo'), 'x\ny', history=history)
+        history.endGroup()
+        assert len(history.steps) == 1
+        history.undo()
+        assert self.text.toPlainText() == context
+
+    def test_groups(self):
+        pattern = compilePattern(r'(f)(o+)', regex=True)
+        self.run_replace(pattern, r'\2\1', expand=True)
+        assert self.text.toPlainText().startswith('oof bar\nFoo oofd oof\n')
+
+    def test_range(self):
+        assert self.run_replace(compilePattern('foo'), 'X', start=4, end=21) == 2
+        assert self.text.toPlainText().startswith('foo bar\nFoo Xd X\nbar foo')
+
+    def test_soft_breaks(self):
+        self.document.clear()
+        index = LineIndex(self.document)
+        text = 'foo,' + SOFT_BREAK + 'bar foo,bar' + SOFT_BREAK + 'x\nfoo,bar'
+        insertText(QtGui.QTextCursor(self.document), text)
+        history = UndoHistory()
+        history.setDocument(self.document)
+        history.beginGroup(True)
+        # совпадения через мягкий перенос тоже заменяются
+        assert self.run_replace(compilePattern('foo,bar'), 'X', history=history) == 3
+        history.endGroup()
+        assert documentText(self.document) == 'X Xx\nX'
+        assert index.continuations() == LineIndex(self.document).continuations()
+        history.undo()
+        assert documentText(self.document, SOFT_BREAK) == text
+
+    def test_soft_breaks_kept(self):
+        self.document.clear()
+        insertText(QtGui.QTextCursor(self.document), 'a' * 40 + SOFT_BREAK + 'a' * 40)
+        # замены внутри отрезков не сливают блоки длинной строки
+        assert self.run_replace(compilePattern('a'), 'b') == 80
+        assert documentText(self.document, SOFT_BREAK) == 'b' * 40 + SOFT_BREAK + 'b' * 40
+
+
+if __name__ == '__main__':
+
+    unittest.main()
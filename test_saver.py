@@ -0,0 +1,90 @@
+import codecs
+import os
+import shutil
+import sys
+import tempfile
+
+from PyQt5 import QtWidgets
+
+import unittest
+
+import saver
+from saver import FileSaver
+
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+
+
+class TestFileSaver(unittest.TestCase):
+
+    def setUp(self):
+        self.chunk_size = saver.CHUNK_SIZE
+        saver.CHUNK_SIZE = 4
+        self.directory = tempfile.mkdtemp()
+        self.filename = os.path.join(self.directory, 'file.txt')
+
+    def tearDown(self):
+        saver.CHUNK_SIZE = self.chunk_size
+        shutil.rmtree(self.directory)
+
+    def save(self, filename, text, encoding='utf-8', bom=b'', newline='\n'):
+        thread = FileSaver(filename, text, encoding, bom, newline)
+        thread.start()
+        thread.wait()
+        return thread
+
+    def test_save(self):
+        thread = self.save(self.filename, 'привет\nмир')
+        assert thread.error is None
+        assert thread.written == len('привет\nмир'.encode('utf-8'))
+        with open(self.filename, encoding='utf-8') as file:
+            assert file.read() == 'привет\nмир'
+        assert os.listdir(self.directory) == ['file.txt']
+
+    def test_format(self):
+        thread = self.save(self.filename, 'а\nб\n', 'utf-16-le', codecs.BOM_UTF16_LE, '\r\n')
+        data = codecs.BOM_UTF16_LE + 'а\r\nб\r\n'.encode('utf-16-le')
+        assert thread.written == len(data)
+        with open(self.filename, 'rb') as file:
+            assert file.read() == data
+
+    def test_undecodable_bytes(self):
+        # байты, не подошедшие кодировке при чтении, возвращаются в файл
+        data = 'текст '.encode('cp1251')
+        self.save(self.filename, data.decode('utf-8', 'surrogateescape'))
+        with open(self.filename, 'rb') as file:
+            assert file.read() == data
+
+    @unittest.skipUnless(hasattr(os, 'symlink'), 'нет символических ссылок')
+    def test_symlink(self):
+        target = os.path.join(self.directory, 'target.txt')
+        with open(target, 'w') as file:
+            file.write('old')
+        os.symlink(target, self.filename)
+        assert self.save(self.filename, 'new').error is None
+        # ссылка остаётся ссылкой, новый текст попадает в её цель
+        assert os.path.islink(self.filename)
+        with open(target) as file:
+            assert file.read() == 'new'
+        assert sorted(os.listdir(self.directory)) == ['file.txt', 'target.txt']
+
+    def test_keeps_mode(self):
+        with open(self.filename, 'w') as file:
+            file.write('old')
+        os.chmod(self.filename, 0o640)
+        self.save(self.filename, 'new')
+        assert os.stat(self.filename).st_mode & 0o777 == 0o640
+
+    def test_failure_keeps_original(self):
+        with open(self.filename, 'w') as file:
+            file.write('old')
+        thread = self.save(self.filename, 'новый', encoding='ascii')
+        assert thread.error is not None
+        with open(self.filename) as file:
+            assert file.read() == 'old'
+        assert os.listdir(self.directory) == ['file.txt']
+
+
+if __name__ == '__main__':
+
+    unittest.main()
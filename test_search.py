@@ -0,0 +1,113 @@
+import re
+import sys
+
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+
+import unittest
+
+from longlines import SOFT_BREAK
+from longlines import insertText
+from longlines import textRange
+from search import SearchEngine
+from textcore import compilePattern
+
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+
+
+class TestSearchEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.text = QtWidgets.QPlainTextEdit()
+        self.document = self.text.document()
+        self.document.setPlainText('foo bar\nFoo food foo\nbar foo')
+        self.engine = SearchEngine(self.document)
+
+    def test_compilePattern(self):
+        assert compilePattern('a.b').search('axb') is None
+        assert compilePattern('a.b', regex=True).search('axb')
+        assert compilePattern('foo', case_sensitive=False).search('FOO')
+        assert compilePattern('foo', whole_word=True).search('food') is None
+        with self.assertRaises(re.error):
+            compilePattern('(', regex=True)
+
+    def test_forward(self):
+        pattern = compilePattern('foo')
+        assert self.engine.find(pattern, 0) == (0, 3)
+        assert self.engine.find(pattern, 3) == (12, 15)
+        assert self.engine.find(pattern, 26) == (0, 3)
+        assert self.engine.find(pattern, 26, wrap=False) is None
+
+    def test_backward(self):
+        pattern = compilePattern('foo', case_sensitive=False)
+        assert self.engine.find(pattern, 12, backward=True) == (8, 11)
+        assert self.engine.find(pattern, 2, backward=True) == (25, 28)
+        assert self.engine.find(pattern, 2, backward=True, wrap=False) is None
+
+    def test_backward_overlapping(self):
+        # ближайшее к курсору совпадение перекрывается с найденным finditer
+        self.document.setPlainText('xaaa\nabab')
+        assert self.engine.find(compilePattern('aa'), 4, backward=True) == (2, 4)
+        assert self.engine.find(compilePattern('aa'), 3, backward=True) == (1, 3)
+        assert self.engine.find(compilePattern('a+', regex=True), 4, backward=True) == (3, 4)
+        assert self.engine.find(compilePattern('aba'), 9, backward=True) == (5, 8)
+
+    def test_unread(self):
+        def edit(start, end, text):
+            cursor = QtGui.QTextCursor(self.document)
+            cursor.setPosition(start)
+            cursor.setPosition(end, QtGui.QTextCursor.KeepAnchor)
+            cursor.insertText(text)
+            # непрочитанные блоки не выходят за диапазон unread
+            low, high = self.engine.unread
+            assert high < len(self.engine.blocks) == self.document.blockCount()
+            assert all(low <= number <= high for number, text in enumerate(self.engine.blocks)
+                       if text is None)
+
+        assert self.engine.unread == (0, 2)
+        self.engine.find(compilePattern('nothing'), 0, wrap=False)
+        self.engine.unread = None
+        edit(22, 22, 'x\ny')
+        assert self.engine.unread == (2, 3)
+        edit(0, 0, '\n')
+        assert self.engine.unread == (0, 4)
+        edit(1, 20, '')
+        edit(0, self.document.characterCount() - 1, 'a\nb')
+        assert self.engine.unread == (0, 1)
+
+    def test_soft_breaks(self):
+        self.document.clear()
+        insertText(QtGui.QTextCursor(self.document),
+                   'ab foo,' + SOFT_BREAK + 'bar' + SOFT_BREAK + 'foo\nfoo,bar')
+        # совпадение через мягкий перенос находится в строке целиком
+        pattern = compilePattern('foo,bar')
+        assert self.engine.find(pattern, 0) == (3, 11)
+        assert textRange(self.document, 3, 11) == 'foo,' + SOFT_BREAK + 'bar'
+        assert self.engine.find(pattern, 4) == (16, 23)
+        assert self.engine.find(pattern, 16, backward=True) == (3, 11)
+        assert self.engine.find(pattern, 3, backward=True) == (16, 23)
+        assert self.engine.find(pattern, 4, wrap=False) == (16, 23)
+        assert self.engine.find(pattern, 17, wrap=False) is None
+        assert self.engine.find(compilePattern('barfoo'), 0) == (8, 15)
+        assert self.engine.match(pattern, 3, 11)
+        assert self.engine.match(pattern, 3, 10) is None
+
+    def test_cache_invalidation(self):
+        pattern = compilePattern('baz')
+        assert self.engine.find(pattern, 0) is None
+        cursor = QtGui.QTextCursor(self.document)
+        cursor.setPosition(8)
+        cursor.insertText('baz\n')
+        assert self.engine.find(pattern, 0) == (8, 11)
+        assert len(self.engine.blocks) == self.document.blockCount()
+
+    def test_match(self):
+        pattern = compilePattern('fo+', regex=True)
+        assert self.engine.match(pattern, 0, 3)
+        assert self.engine.match(pattern, 1, 3) is None
+
+
+if __name__ == '__main__':
+
+    unittest.main()
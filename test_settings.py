@@ -0,0 +1,89 @@
+import os
+import shutil
+import sys
+import tempfile
+
+from PyQt5 import QtWidgets
+
+import unittest
+
+import settings
+from settings import Settings
+
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+
+
+class TestSettings(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'notepad.ini')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def read(self):
+        return settings.readConfig(self.path)
+
+    def test_debounce(self):
+        store = Settings(self.path)
+        store.setValue('Display', 'width', 800)
+        store.setValue('Display', 'width', 900)
+        # запись откладывается и уходит в фоне одной порцией
+        assert not os.path.exists(self.path)
+        assert store.timer.isActive()
+        store.flush()
+        store.writer.wait()
+        app.processEvents()
+        assert store.writer is None
+        assert self.read().get('Display', 'width') == '900'
+        assert os.listdir(self.directory) == ['notepad.ini']
+
+    def test_merge(self):
+        first = Settings(self.path)
+        second = Settings(self.path)
+        first.setValue('Font', 'size', 12)
+        first.sync()
+        second.setValue('Display', 'width', 640)
+        second.sync()
+        config = self.read()
+        assert config.get('Font', 'size') == '12'
+        assert config.get('Display', 'width') == '640'
+        # после записи кэш видит и чужие значения
+        assert second.value('Font', 'size', None) == '12'
+
+    def test_remove_section(self):
+        store = Settings(self.path)
+        store.setValue('Session', 'file0', 'a.txt')
+        store.setValue('Session', 'file1', 'b.txt')
+        store.sync()
+        store.removeSection('Session')
+        store.setValue('Session', 'file0', 'c.txt')
+        store.sync()
+        assert dict(self.read()['Session']) == {'file0': 'c.txt'}
+
+    def test_recent(self):
+        first = Settings(self.path)
+        second = Settings(self.path)
+        for number in range(settings.RECENT_LIMIT + 2):
+            first.addRecentFile('file%d' % number)
+        first.addRecentFile('file5')
+        first.sync()
+        second.addRecentFile('other')
+        second.sync()
+        recent = second.recentFiles()
+        assert len(recent) == settings.RECENT_LIMIT
+        assert recent[:3] == ['other', 'file5', 'file11']
+
+    def test_failed_write(self):
+        store = Settings(os.path.join(self.directory, 'missing', 'notepad.ini'))
+        store.setValue('Display', 'width', 800)
+        assert not store.sync()
+        # неудачная порция остаётся в очереди
+        assert store.changes == {('Display', 'width'): '800'}
+
+
+if __name__ == '__main__':
+
+    unittest.main()
@@ -0,0 +1,63 @@
+import sys
+
+from PyQt5 import QtWidgets
+
+import unittest
+
+from tabs import DocumentTab
+from tabs import byteOffset
+from tabs import documentMemory
+from tabs import tabsToUnload
+
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+
+
+class TestTabs(unittest.TestCase):
+
+    def createTab(self, text, last_used, modified=False):
+        edit = QtWidgets.QPlainTextEdit()
+        edit.setPlainText(text)
+        edit.document().setModified(modified)
+        tab = DocumentTab()
+        tab.document = edit.document()
+        tab.last_used = last_used
+        self.edits.append(edit)
+        return tab
+
+    def setUp(self):
+        self.edits = []
+
+    def test_title(self):
+        tab = DocumentTab()
+        assert tab.title() == 'Без названия'
+        tab.filename = '/tmp/file.txt'
+        tab.modified = True
+        assert tab.title() == 'file.txt*'
+        assert tab.memoryUsage() == 0
+
+    def test_byteOffset(self):
+        assert byteOffset(0, 1, 100) == 0
+        assert byteOffset(50, 101, 200, 3) == 3 + 50 * 197 // 100
+
+    def test_within_budget(self):
+        tabs = [self.createTab('a' * 100, 1), self.createTab('b' * 100, 2)]
+        assert tabsToUnload(tabs, tabs[1], 10 ** 6) == []
+
+    def test_unload_order(self):
+        current = self.createTab('c' * 100, 5)
+        old = self.createTab('o' * 100, 1)
+        recent = self.createTab('r' * 100, 3)
+        modified = self.createTab('m' * 100, 0, modified=True)
+        tabs = [current, old, recent, modified]
+        size = documentMemory(current.document)
+        # неизменённые вкладки уходят первыми, от давно открытых к недавним
+        assert tabsToUnload(tabs, current, size * 3) == [old]
+        assert tabsToUnload(tabs, current, size) == [old, recent, modified]
+        old.document = None
+        assert tabsToUnload(tabs, current, size * 2) == [recent]
+
+
+if __name__ == '__main__':
+
+    unittest.main()
@@ -0,0 +1,110 @@
+import codecs
+import os
+import re
+import shutil
+import stat
+import tempfile
+
+import unittest
+
+from textcore import checkReplacement
+from textcore import compilePattern
+from textcore import createPool
+from textcore import replaceFile
+from textcore import replaceFiles
+
+
+class TestTextCore(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write(self, name, data):
+        path = os.path.join(self.directory, name)
+        with open(path, 'wb') as file:
+            file.write(data)
+        return path
+
+    def read(self, path):
+        with open(path, 'rb') as file:
+            return file.read()
+
+    def test_createPool(self):
+        with createPool(1) as pool:
+            assert pool._mp_context.get_start_method() != 'fork'
+            count, found = pool.submit(replaceFiles, [], compilePattern('a'), 'b').result()
+            assert count == 0 and found == []
+
+    def test_checkReplacement(self):
+        pattern = compilePattern('(a)', regex=True)
+        checkReplacement(pattern, r'\1', True)
+        # без регулярного выражения замена берётся как есть
+        checkReplacement(pattern, r'\2', False)
+        with self.assertRaises(re.error):
+            checkReplacement(pattern, r'\2', True)
+
+    def test_replace(self):
+        path = self.write('mixed.txt', b'foo one\r\nfoo\rtwo foo\nfoo')
+        os.chmod(path, 0o640)
+        assert replaceFile(path, compilePattern('foo'), r'b\1r') == 4
+        # переводы строк остаются как были, права файла тоже
+        assert self.read(path) == b'b\\1r one\r\nb\\1r\rtwo b\\1r\nb\\1r'
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o640
+        assert [name for name in os.listdir(self.directory)] == ['mixed.txt']
+
+    @unittest.skipUnless(hasattr(os, 'symlink'), 'нет символических ссылок')
+    def test_symlink(self):
+        target = self.write('target.txt', b'foo\n')
+        link = os.path.join(self.directory, 'link.txt')
+        os.symlink(target, link)
+        assert replaceFile(link, compilePattern('foo'), 'bar') == 1
+        assert os.path.islink(link)
+        assert self.read(target) == b'bar\n'
+        assert sorted(os.listdir(self.directory)) == ['link.txt', 'target.txt']
+
+    def test_regex(self):
+        path = self.write('regex.txt', b'key = 1\nkey=2\n')
+        pattern = compilePattern(r'^key\s*=\s*(\d)$', regex=True)
+        assert replaceFile(path, pattern, r'key = \1\1', expand=True) == 2
+        assert self.read(path) == b'key = 11\nkey = 22\n'
+
+    def test_encoding(self):
+        data = codecs.BOM_UTF8 + 'ключ: старое\n'.encode('utf-8')
+        path = self.write('bom.txt', data)
+        assert replaceFile(path, compilePattern('старое'), 'новое', needle='старое') == 1
+        assert self.read(path) == codecs.BOM_UTF8 + 'ключ: новое\n'.encode('utf-8')
+        path = self.write('ansi.txt', 'старое \xab\n'.encode('cp1251') + b'\x98')
+        assert replaceFile(path, compilePattern('старое'), 'новое', needle='старое') == 1
+        # байт без символа в кодировке возвращается в файл как был
+        assert self.read(path) == 'новое \xab\n'.encode('cp1251') + b'\x98'
+
+    def test_untouched(self):
+        path = self.write('other.txt', b'nothing here\n')
+        before = os.stat(path)
+        assert replaceFile(path, compilePattern('foo'), 'bar') == 0
+        assert replaceFile(path, compilePattern('FOO', case_sensitive=False), 'bar') == 0
+        assert os.stat(path).st_mtime_ns == before.st_mtime_ns
+        binary = self.write('binary.dat', b'\0foo')
+        assert replaceFile(binary, compilePattern('foo'), 'bar') == 0
+        assert self.read(binary) == b'\0foo'
+
+    def test_dry_run(self):
+        path = self.write('dry.txt', b'foo foo\nfoo\n')
+        assert replaceFile(path, compilePattern('foo'), 'bar', dry_run=True) == 3
+        assert self.read(path) == b'foo foo\nfoo\n'
+
+    def test_replaceFiles(self):
+        first = self.write('a.txt', b'foo\n')
+        second = self.write('b.txt', b'bar\n')
+        missing = os.path.join(self.directory, 'missing.txt')
+        count, results = replaceFiles([first, second, missing], compilePattern('foo'), 'x')
+        assert count == 3
+        assert results[0] == (first, 1)
+        assert results[1][0] == missing and isinstance(results[1][1], str)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import codecs
+import os
+import tempfile
+
+import unittest
+
+import textformat
+from textformat import DEFAULT_FORMAT
+from textformat import TextFormat
+from textformat import detectFile
+from textformat import detectFormat
+
+
+class TestTextFormat(unittest.TestCase):
+
+    def test_bom(self):
+        assert detectFormat(codecs.BOM_UTF8 + b'a\r\nb') == TextFormat('utf-8', codecs.BOM_UTF8, '\r\n')
+        data = codecs.BOM_UTF16_LE + 'а\nб'.encode('utf-16-le')
+        assert detectFormat(data) == TextFormat('utf-16-le', codecs.BOM_UTF16_LE, '\n')
+        data = codecs.BOM_UTF32_LE + 'a\rb'.encode('utf-32-le')
+        assert detectFormat(data) == TextFormat('utf-32-le', codecs.BOM_UTF32_LE, '\r')
+
+    def test_without_bom(self):
+        assert detectFormat('привет\r\nмир\r\n'.encode('utf-8')).encoding == 'utf-8'
+        assert detectFormat('привет\r\nмир'.encode('cp1251')) == TextFormat('cp1251', b'', '\r\n')
+        assert detectFormat('line\nline\n'.encode('utf-16-be')).encoding == 'utf-16-be'
+        assert detectFormat(b'') == DEFAULT_FORMAT
+
+    def test_truncated_sample(self):
+        # образец оборвался посреди символа UTF-8
+        data = 'я'.encode('utf-8')
+        assert detectFormat(data[:1], final=False).encoding == 'utf-8'
+        assert detectFormat(data[:1]).encoding == 'cp1251'
+
+    def test_dominant_newline(self):
+        assert detectFormat(b'a\r\nb\r\nc\nd').newline == '\r\n'
+        assert detectFormat(b'a\nb\nc\r\nd').newline == '\n'
+
+    def test_detectFile_reads_sample(self):
+        sample_size = textformat.SAMPLE_SIZE
+        textformat.SAMPLE_SIZE = 4
+        fd, filename = tempfile.mkstemp()
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                file.write(b'a\nb\r\n\xff')
+            assert detectFile(filename) == TextFormat('utf-8', b'', '\n')
+        finally:
+            textformat.SAMPLE_SIZE = sample_size
+            os.remove(filename)
+
+
+if __name__ == '__main__':
+
+    unittest.main()
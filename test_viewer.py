@@ -0,0 +1,148 @@
+import os
+import sys
+import tempfile
+
+from PyQt5 import QtWidgets
+
+import unittest
+
+import viewer
+from textcore import compilePattern
+from viewer import MappedViewer
+
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+
+
+class TestMappedViewer(unittest.TestCase):
+
+    def setUp(self):
+        self.chunk_size = viewer.INDEX_CHUNK_SIZE
+        viewer.INDEX_CHUNK_SIZE = 7
+        fd, self.filename = tempfile.mkstemp()
+        with os.fdopen(fd, 'wb') as file:
+            file.write('первая\r\nвторая строка\n\nчетвёртая abc\nabc'.encode('utf-8'))
+        self.widget = MappedViewer()
+        self.widget.openFile(self.filename)
+        self.widget.indexer.wait()
+        app.processEvents()
+
+    def tearDown(self):
+        viewer.INDEX_CHUNK_SIZE = self.chunk_size
+        self.widget.closeFile()
+        os.remove(self.filename)
+
+    def test_index(self):
+        assert self.widget.isIndexed()
+        assert self.widget.lineCount() == 5
+        assert [self.widget.lineText(i) for i in range(5)] == [
+            'первая', 'вторая строка', '', 'четвёртая abc', 'abc']
+
+    def waitIndexed(self):
+        while not self.widget.isIndexed():
+            app.processEvents()
+
+    def test_extendFile(self):
+        assert self.widget.extendFile() is False
+        with open(self.filename, 'ab') as file:
+            file.write('def\nпятая\nшестая'.encode('utf-8'))
+        assert self.widget.extendFile() is True
+        self.waitIndexed()
+        assert self.widget.isIndexed()
+        # строка без перевода в конце продолжилась дописанным
+        assert [self.widget.lineText(i) for i in range(4, 7)] == ['abcdef', 'пятая', 'шестая']
+        assert self.widget.lineCount() == 7
+
+    def test_follow(self):
+        self.widget.resize(200, 100)
+        self.widget.follow = True
+        with open(self.filename, 'ab') as file:
+            file.write(b'\nline' * 200)
+        self.widget.extendFile()
+        self.waitIndexed()
+        scroll_bar = self.widget.verticalScrollBar()
+        assert scroll_bar.value() == scroll_bar.maximum() > 0
+
+    def find(self, pattern, backward=False, wrap=True):
+        results = []
+        self.widget.searchFinished.connect(results.append)
+        self.widget.find(pattern, backward, wrap)
+        while not results:
+            app.processEvents()
+        self.widget.searchFinished.disconnect(results.append)
+        return results[0]
+
+    def findLines(self, text, backward=False, wrap=True, case_sensitive=True):
+        pattern = compilePattern(text, case_sensitive=case_sensitive)
+        lines = []
+        while self.find(pattern, backward, wrap) and len(lines) < 5:
+            lines.append(self.widget.lineAt(self.widget.selection[0]))
+        return lines
+
+    def test_cancel_search(self):
+        sizes = viewer.SEARCH_CHUNK_SIZE, viewer.SEARCH_OVERLAP
+        viewer.SEARCH_CHUNK_SIZE, viewer.SEARCH_OVERLAP = 2, 1
+        results = []
+        self.widget.searchFinished.connect(results.append)
+        try:
+            # поиск идёт в фоне и после отмены ничего не выделяет
+            assert self.widget.find(compilePattern('нет такого')) is True
+            assert self.widget.isSearching()
+            self.widget.cancelSearch()
+            assert not self.widget.isSearching()
+            app.processEvents()
+            assert results == [] and self.widget.selection is None
+        finally:
+            viewer.SEARCH_CHUNK_SIZE, viewer.SEARCH_OVERLAP = sizes
+
+    def test_find(self):
+        assert self.findLines('abc', wrap=False) == [3, 4]
+        self.widget.goToLine(0)
+        assert self.findLines('строка', wrap=False) == [1]
+        assert self.widget.decode(*self.widget.selection) == 'строка'
+        # после конца файла поиск продолжается с начала
+        assert self.findLines('abc')[:3] == [3, 4, 3]
+
+    def test_find_backward(self):
+        self.widget.goToLine(4)
+        assert self.findLines('abc', backward=True, wrap=False) == [3]
+        self.widget.goToLine(4)
+        assert self.findLines('abc', backward=True)[:3] == [3, 4, 3]
+        self.widget.goToLine(0)
+        assert self.findLines('вторая', backward=True, wrap=False) == []
+
+    def test_find_backward_overlapping(self):
+        with open(self.filename, 'ab') as file:
+            file.write(b'\naaa')
+        self.widget.extendFile()
+        self.waitIndexed()
+        self.widget.goToLine(5)
+        self.widget.search_offset = self.widget.byteSize()
+        assert self.find(compilePattern('aa'), backward=True, wrap=False)
+        assert self.widget.selection[0] == self.widget.byteSize() - 2
+
+    def test_find_ignore_case(self):
+        # регистр не-ASCII букв сравнивается по декодированному тексту
+        assert self.findLines('СТРОКА', wrap=False, case_sensitive=False) == [1]
+        assert self.widget.decode(*self.widget.selection) == 'строка'
+        assert self.findLines('ЧЕТВЁРТАЯ ABC', wrap=False, case_sensitive=False) == [3]
+        assert self.findLines('СТРОКА', wrap=False) == []
+
+    def test_find_chunks(self):
+        sizes = viewer.SEARCH_CHUNK_SIZE, viewer.SEARCH_OVERLAP
+        try:
+            for chunk_size in (13, 16, 20, 30):
+                viewer.SEARCH_CHUNK_SIZE, viewer.SEARCH_OVERLAP = chunk_size, 12
+                for backward in (False, True):
+                    self.widget.goToLine(0 if not backward else 4)
+                    assert self.findLines('строка', backward, False) == [1]
+                    assert self.widget.decode(*self.widget.selection) == 'строка'
+                self.widget.goToLine(0)
+                assert self.findLines('abc', wrap=False) == [3, 4]
+        finally:
+            viewer.SEARCH_CHUNK_SIZE, viewer.SEARCH_OVERLAP = sizes
+
+
+if __name__ == '__main__':
+
+    unittest.main()
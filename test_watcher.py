@@ -0,0 +1,107 @@
+import os
+import shutil
+import sys
+import tempfile
+
+from PyQt5 import QtWidgets
+
+import unittest
+
+import watcher
+from watcher import FileWatcher
+
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+
+
+class TestFileWatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'service.log')
+        self.write('wb', b'first\n')
+        self.watcher = FileWatcher()
+        self.appended = []
+        self.changed = []
+        self.watcher.appended.connect(lambda filename, text: self.appended.append(text))
+        self.watcher.changed.connect(self.changed.append)
+
+    def tearDown(self):
+        self.watcher.unwatch(self.path)
+        shutil.rmtree(self.directory)
+
+    def write(self, mode, data):
+        with open(self.path, mode) as file:
+            file.write(data)
+
+    def test_append(self):
+        self.watcher.watch(self.path)
+        self.write('ab', b'second\r')
+        self.watcher.check()
+        self.write('ab', b'\nthird\r\n')
+        self.watcher.check()
+        # '\r\n', разрезанный между записями, даёт один перевод строки
+        assert ''.join(self.appended) == 'second\nthird\n'
+        assert self.changed == []
+        self.watcher.check()
+        assert len(self.appended) == 2
+
+    def test_split_character(self):
+        self.watcher.watch(self.path)
+        data = 'тест\n'.encode('utf-8')
+        self.write('ab', data[:1])
+        self.watcher.check()
+        self.write('ab', data[1:])
+        self.watcher.check()
+        assert ''.join(self.appended) == 'тест\n'
+
+    def test_loaded_size(self):
+        # дописанное во время загрузки дочитывается с конца прочитанного
+        self.write('ab', b'late\n')
+        self.watcher.watch(self.path, size=len(b'first\n'))
+        self.watcher.check()
+        assert self.appended == ['late\n']
+
+    def test_rewrite(self):
+        self.watcher.watch(self.path)
+        self.write('wb', b'other\nlonger text\n')
+        self.watcher.check()
+        assert self.appended == []
+        assert self.changed == [self.path]
+
+    def test_truncate(self):
+        self.watcher.watch(self.path)
+        self.write('wb', b'')
+        self.watcher.check()
+        assert self.changed == [self.path]
+        self.write('ab', b'new\n')
+        self.watcher.check()
+        # после перезаписи слежение идёт от нового содержимого
+        assert self.appended == ['new\n']
+
+    def test_removed(self):
+        self.watcher.watch(self.path)
+        os.remove(self.path)
+        self.watcher.check()
+        self.watcher.check()
+        assert self.changed == [self.path]
+
+    def test_slices(self):
+        self.watcher.watch(self.path)
+        self.write('ab', b'x' * (watcher.READ_SIZE + 10))
+        self.watcher.check()
+        assert [len(text) for text in self.appended] == [watcher.READ_SIZE]
+        self.watcher.check()
+        assert [len(text) for text in self.appended] == [watcher.READ_SIZE, 10]
+
+    def test_unwatch(self):
+        self.watcher.watch(self.path)
+        self.watcher.unwatch(self.path)
+        self.write('ab', b'second\n')
+        self.watcher.check()
+        assert self.appended == []
+        assert not self.watcher.poll_timer.isActive()
+
+
+if __name__ == '__main__':
+    unittest.main()
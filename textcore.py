@@ -0,0 +1,233 @@
+import io
+import mmap
+import multiprocessing
+import os
+import re
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+from textformat import SAMPLE_SIZE
+from textformat import detectFormat
+from textformat import isAsciiCompatible
+
+
+MAX_FILE_RESULTS = 1000
+MAX_LINE_LENGTH = 300
+BINARY_SAMPLE_SIZE = 8192
+
+
+def compilePattern(text, regex=False, case_sensitive=True, whole_word=False):
+    pattern = text if regex else re.escape(text)
+    if whole_word:
+        pattern = r'\b(?:%s)\b' % pattern
+    return re.compile(pattern, 0 if case_sensitive else re.IGNORECASE)
+
+
+def lastMatch(pattern, text, end, empty=True):
+    # finditer пропускает совпадения, перекрывающиеся с уже найденным;
+    # ближайшее к концу может начинаться только внутри последнего из них
+    last = None
+    for match in pattern.finditer(text, 0, end):
+        if empty or match.end() > match.start():
+            last = match
+    if last is None:
+        return None
+    for start in range(min(last.end(), end) - 1, last.start(), -1):
+        match = pattern.match(text, start, end)
+        if match is not None and (empty or match.end() > match.start()):
+            return match
+    return last
+
+
+def checkReplacement(pattern, replacement, expand=False):
+    # шаблон замены проверяется до начала правки
+    if not expand:
+        return
+    try:
+        pattern.sub(replacement, '')
+    except IndexError as error:
+        raise re.error(str(error))
+
+
+def substitute(match, replacement, expand=False):
+    if expand:
+        return match.expand(replacement)
+    return replacement
+
+
+def createPool(jobs=None):
+    # рабочие процессы не ответвляются от процесса с потоками Qt:
+    # fork копирует всю кучу и блокировки, захваченные другими потоками
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+    return ProcessPoolExecutor(max_workers=jobs, mp_context=context)
+
+
+def iterFiles(directory):
+    for root, dirs, files in os.walk(directory):
+        dirs[:] = [name for name in dirs if not name.startswith('.')]
+        for name in files:
+            path = os.path.join(root, name)
+            if os.path.isfile(path):
+                yield path
+
+
+def searchFile(path, pattern, needle=None):
+    # файл не читается целиком: байтовая проверка идёт по отображению
+    # в память, а строки разбираются потоком, только если она что-то нашла
+    results = []
+    with open(path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return results
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+            if b'\0' in mapping[:BINARY_SAMPLE_SIZE]:
+                return results
+            if needle is not None and mapping.find(needle) == -1:
+                return results
+        file.seek(0)
+        lines = io.TextIOWrapper(file, encoding='utf-8', errors='replace')
+        for number, line in enumerate(lines):
+            if pattern.search(line):
+                results.append((number, line.rstrip('\r\n')[:MAX_LINE_LENGTH]))
+                if len(results) >= MAX_FILE_RESULTS:
+                    break
+    return results
+
+
+def searchFiles(paths, pattern, needle=None):
+    # возвращает число просмотренных файлов и найденное в них
+    found = []
+    for path in paths:
+        try:
+            results = searchFile(path, pattern, needle)
+        except (OSError, ValueError):
+            continue
+        if results:
+            found.append((path, results))
+    return len(paths), found
+
+
+def currentUmask():
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+def syncDirectory(directory):
+    if not hasattr(os, 'O_DIRECTORY'):
+        return
+    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def createTemp(filename):
+    # временный файл рядом с целевым: замена остаётся в пределах одного диска
+    directory, name = os.path.split(os.path.abspath(filename))
+    return tempfile.mkstemp(prefix='.%s.' % name, suffix='.tmp', dir=directory)
+
+
+def commitFile(temp_name, filename):
+    # записанный временный файл заменяет целевой одной операцией,
+    # поэтому сбой не оставит обрезанный файл
+    if os.path.exists(filename):
+        os.chmod(temp_name, os.stat(filename).st_mode & 0o7777)
+    else:
+        os.chmod(temp_name, 0o666 & ~currentUmask())
+    os.replace(temp_name, filename)
+    syncDirectory(os.path.dirname(os.path.abspath(filename)))
+
+
+def openLines(file, text_format):
+    # переводы строк не преобразуются, а байты, не подошедшие кодировке,
+    # возвращаются в файл без изменений
+    file.seek(len(text_format.bom))
+    return io.TextIOWrapper(file, encoding=text_format.encoding,
+                            errors='surrogateescape', newline='')
+
+
+def splitLine(line):
+    body = line.rstrip('\r\n')
+    return body, line[len(body):]
+
+
+def replaceFile(path, pattern, replacement, expand=False, needle=None, dry_run=False):
+    # файл обрабатывается по строкам, как и документ в редакторе:
+    # совпадение не переходит через перевод строки
+    template = replacement if expand else (lambda match: replacement)
+    with open(path, 'rb') as file:
+        sample = file.read(SAMPLE_SIZE)
+        text_format = detectFormat(sample, not file.read(1))
+        if isAsciiCompatible(text_format) and b'\0' in sample[:BINARY_SAMPLE_SIZE]:
+            return 0
+        if needle is not None and os.fstat(file.fileno()).st_size:
+            try:
+                data = needle.encode(text_format.encoding)
+            except UnicodeError:
+                data = None
+            if data is not None:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+                    if mapping.find(data) == -1:
+                        return 0
+        # файл без совпадений не переписывается
+        lines = openLines(file, text_format)
+        count = 0
+        for line in lines:
+            if pattern.search(splitLine(line)[0]):
+                count = 1
+                break
+        lines.detach()
+        if not count:
+            return 0
+        count = 0
+        lines = openLines(file, text_format)
+        if dry_run:
+            for line in lines:
+                count += len(pattern.findall(splitLine(line)[0]))
+            lines.detach()
+            return count
+        # через символическую ссылку заменяется файл, на который она указывает
+        target = os.path.realpath(path)
+        fd, temp_name = createTemp(target)
+        try:
+            with os.fdopen(fd, 'wb') as output:
+                output.write(text_format.bom)
+                writer = io.TextIOWrapper(output, encoding=text_format.encoding,
+                                          errors='surrogateescape', newline='')
+                for line in lines:
+                    body, ending = splitLine(line)
+                    body, replaced = pattern.subn(template, body)
+                    count += replaced
+                    writer.write(body)
+                    writer.write(ending)
+                writer.flush()
+                os.fsync(output.fileno())
+                writer.detach()
+            lines.detach()
+        except BaseException:
+            os.remove(temp_name)
+            raise
+    # исходный файл закрыт: открытый файл нельзя заменить в Windows
+    try:
+        commitFile(temp_name, target)
+    except BaseException:
+        if os.path.exists(temp_name):
+            os.remove(temp_name)
+        raise
+    return count
+
+
+def replaceFiles(paths, pattern, replacement, expand=False, needle=None, dry_run=False):
+    # возвращает число обработанных файлов и пары (файл, замен или ошибка)
+    results = []
+    for path in paths:
+        try:
+            count = replaceFile(path, pattern, replacement, expand, needle, dry_run)
+        except (OSError, ValueError, UnicodeError) as error:
+            results.append((path, str(error)))
+            continue
+        if count:
+            results.append((path, count))
+    return len(paths), results
@@ -0,0 +1,95 @@
+import codecs
+import os
+from collections import namedtuple
+
+
+SAMPLE_SIZE = 64 * 1024
+FALLBACK_ENCODING = 'cp1251'
+
+# UTF-32 LE проверяется раньше UTF-16 LE: его BOM начинается с того же FF FE
+BOMS = (
+    (codecs.BOM_UTF32_LE, 'utf-32-le'),
+    (codecs.BOM_UTF32_BE, 'utf-32-be'),
+    (codecs.BOM_UTF8, 'utf-8'),
+    (codecs.BOM_UTF16_LE, 'utf-16-le'),
+    (codecs.BOM_UTF16_BE, 'utf-16-be'),
+)
+NEWLINE_NAMES = {'\r\n': 'CRLF', '\n': 'LF', '\r': 'CR'}
+
+TextFormat = namedtuple('TextFormat', 'encoding bom newline')
+DEFAULT_FORMAT = TextFormat('utf-8', b'', os.linesep)
+
+
+def detectBom(sample):
+    for bom, encoding in BOMS:
+        if sample.startswith(bom):
+            return bom, encoding
+    return b'', None
+
+
+def detectUtf16(sample):
+    # текст UTF-16 без BOM выдают нулевые старшие байты ASCII-символов
+    even = sample[0::2].count(0)
+    odd = sample[1::2].count(0)
+    pairs = len(sample) // 2
+    if pairs and odd > pairs * 0.4 and even < pairs * 0.05:
+        return 'utf-16-le'
+    if pairs and even > pairs * 0.4 and odd < pairs * 0.05:
+        return 'utf-16-be'
+    return None
+
+
+def isUtf8(sample, final):
+    # образец может оборваться посреди символа, если это не весь файл
+    try:
+        codecs.getincrementaldecoder('utf-8')().decode(sample, final)
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def detectNewline(text):
+    crlf = text.count('\r\n')
+    counts = (
+        (crlf, '\r\n'),
+        (text.count('\n') - crlf, '\n'),
+        (text.count('\r') - crlf, '\r'),
+    )
+    count, newline = max(counts, key=lambda item: item[0])
+    return newline if count else DEFAULT_FORMAT.newline
+
+
+def detectFormat(sample, final=True):
+    bom, encoding = detectBom(sample)
+    if encoding is None:
+        encoding = detectUtf16(sample)
+    if encoding is None:
+        encoding = 'utf-8' if isUtf8(sample, final) else FALLBACK_ENCODING
+    text = codecs.getincrementaldecoder(encoding)(errors='replace').decode(
+        sample[len(bom):], final)
+    return TextFormat(encoding, bom, detectNewline(text))
+
+
+def detectFile(filename):
+    with open(filename, 'rb') as file:
+        sample = file.read(SAMPLE_SIZE)
+        final = not file.read(1)
+    return detectFormat(sample, final)
+
+
+def isAsciiCompatible(text_format):
+    return not text_format.encoding.startswith(('utf-16', 'utf-32'))
+
+
+def decodeErrors(encoding):
+    # байты, не подошедшие кодировке, становятся суррогатами и при
+    # сохранении возвращаются в файл как были; в UTF-16/32 так не
+    # восстановить байты меньше 0x80, и там они заменяются на U+FFFD
+    if encoding.startswith(('utf-16', 'utf-32')):
+        return 'replace'
+    return 'surrogateescape'
+
+
+def formatName(text_format):
+    return '%s%s  %s' % (text_format.encoding.upper(), ' BOM' if text_format.bom else '',
+                         NEWLINE_NAMES[text_format.newline])
@@ -0,0 +1,385 @@
+import bisect
+import mmap
+import os
+import re
+from array import array
+from itertools import accumulate
+
+from PyQt5 import QtCore
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+
+from textcore import lastMatch
+
+
+INDEX_CHUNK_SIZE = 16 * 1024 * 1024
+MAX_LINE_BYTES = 64 * 1024
+TAB_SIZE = 8
+# поиск декодирует файл порциями по целым строкам; строка длиннее порции
+# режется с перекрытием, чтобы не потерять совпадение на стыке
+SEARCH_CHUNK_SIZE = 1024 * 1024
+SEARCH_OVERLAP = 4096
+
+
+class LineIndexer(QtCore.QThread):
+
+    indexed = QtCore.pyqtSignal(object, 'qint64')
+
+    def __init__(self, mapping, start=0, parent=None):
+        super(LineIndexer, self).__init__(parent)
+        self.mapping = mapping
+        # дописанное в файл индексируется с прежнего конца
+        self.start_offset = start
+
+    def cancel(self):
+        self.requestInterruption()
+
+    def run(self):
+        size = len(self.mapping)
+        start = self.start_offset
+        while start < size and not self.isInterruptionRequested():
+            end = min(start + INDEX_CHUNK_SIZE, size)
+            lines = self.mapping[start:end].split(b'\n')
+            # смещения начала строк, следующих за каждым '\n' блока
+            offsets = array('q', accumulate(
+                (len(line) + 1 for line in lines[:-1]), initial=start))
+            self.indexed.emit(offsets[1:], end)
+            start = end
+
+
+class ViewerSearch(QtCore.QThread):
+
+    progress = QtCore.pyqtSignal('qint64', 'qint64')
+
+    def __init__(self, mapping, encoding, pattern, origin, backward=False, wrap=True,
+                 parent=None):
+        super(ViewerSearch, self).__init__(parent)
+        self.mapping = mapping
+        self.encoding = encoding
+        # ^ и $ относятся к строкам, как в поиске по блокам редактора
+        self.pattern = re.compile(pattern.pattern, pattern.flags | re.MULTILINE)
+        self.origin = origin
+        self.backward = backward
+        self.wrap = wrap
+        self.done = 0
+        self.span = None
+
+    def cancel(self):
+        self.requestInterruption()
+
+    def run(self):
+        size = len(self.mapping)
+        origin = self.origin
+        if self.backward:
+            span = self.searchBackward(0, origin)
+            if span is None and self.wrap:
+                span = self.searchBackward(max(0, origin - SEARCH_OVERLAP), size)
+        else:
+            span = self.searchForward(origin, size)
+            if span is None and self.wrap:
+                span = self.searchForward(0, min(size, origin + SEARCH_OVERLAP))
+        if not self.isInterruptionRequested():
+            self.span = span
+
+    def chunkText(self, start, end):
+        # surrogateescape сохраняет байты один к одному, и смещения
+        # совпадений переводятся обратно в байты файла точно
+        self.done += end - start
+        self.progress.emit(min(self.done, len(self.mapping)), len(self.mapping))
+        return self.mapping[start:end].decode(self.encoding, 'surrogateescape')
+
+    def matchSpan(self, offset, text, match):
+        start = offset + len(text[:match.start()].encode(self.encoding, 'surrogateescape'))
+        return start, start + len(match.group().encode(self.encoding, 'surrogateescape'))
+
+    def searchForward(self, start, end):
+        while start < end and not self.isInterruptionRequested():
+            stop = min(end, start + SEARCH_CHUNK_SIZE)
+            cut = False
+            if stop < end:
+                newline = self.mapping.rfind(b'\n', start, stop)
+                cut = newline == -1
+                if not cut:
+                    stop = newline + 1
+            text = self.chunkText(start, stop)
+            for match in self.pattern.finditer(text):
+                if match.end() > match.start():
+                    return self.matchSpan(start, text, match)
+            start = max(start + 1, stop - SEARCH_OVERLAP) if cut else stop
+        return None
+
+    def searchBackward(self, start, end):
+        while end > start and not self.isInterruptionRequested():
+            low = max(start, end - SEARCH_CHUNK_SIZE)
+            cut = False
+            if low > start:
+                newline = self.mapping.find(b'\n', low, end - 1)
+                cut = newline == -1
+                if not cut:
+                    low = newline + 1
+            text = self.chunkText(low, end)
+            found = lastMatch(self.pattern, text, len(text), empty=False)
+            if found is not None:
+                return self.matchSpan(low, text, found)
+            end = min(end - 1, low + SEARCH_OVERLAP) if cut else low
+        return None
+
+
+class MappedViewer(QtWidgets.QAbstractScrollArea):
+
+    indexChanged = QtCore.pyqtSignal()
+    searchProgress = QtCore.pyqtSignal('qint64', 'qint64')
+    searchFinished = QtCore.pyqtSignal(bool)
+
+    def __init__(self, parent=None):
+        super(MappedViewer, self).__init__(parent)
+        self.file = None
+        self.mapping = None
+        self.indexer = None
+        self.searcher = None
+        self.encoding = 'utf-8'
+        self.line_starts = array('q', [0])
+        self.indexed_bytes = 0
+        self.selection = None
+        self.search_offset = 0
+        self.pending_offset = None
+        self.pending_growth = False
+        self.follow = False
+        self.text_width = 0
+        self.viewport().setCursor(QtCore.Qt.IBeamCursor)
+
+    def openFile(self, filename, encoding='utf-8', offset=0):
+        self.closeFile()
+        self.encoding = encoding
+        self.file = open(filename, 'rb')
+        self.mapping = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        # первая строка начинается после BOM
+        self.line_starts[0] = offset
+        self.startIndexer(0)
+        self.updateScrollBars()
+        self.viewport().update()
+
+    def startIndexer(self, start):
+        self.indexer = LineIndexer(self.mapping, start, self)
+        self.indexer.indexed.connect(self.addLines)
+        self.indexer.finished.connect(self.indexFinished)
+        self.indexer.start()
+
+    def indexFinished(self):
+        if self.sender() is not self.indexer:
+            return
+        self.indexChanged.emit()
+        if self.pending_growth:
+            self.extendFile()
+
+    def extendFile(self):
+        # файл дописан: отображение пересоздаётся по новому размеру,
+        # а индекс строк продолжается с прежнего конца
+        if self.mapping is None:
+            return False
+        if (self.indexer is not None and self.indexer.isRunning()) or self.searcher is not None:
+            # прежнее отображение ещё читается, рост учтётся после этого
+            self.pending_growth = True
+            return False
+        self.pending_growth = False
+        try:
+            size = os.fstat(self.file.fileno()).st_size
+            if size <= len(self.mapping):
+                return False
+            mapping = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return False
+        self.mapping.close()
+        self.mapping = mapping
+        self.startIndexer(self.indexed_bytes)
+        return True
+
+    def closeFile(self):
+        self.pending_growth = False
+        self.cancelSearch()
+        if self.indexer is not None:
+            self.indexer.cancel()
+            self.indexer.wait()
+            self.indexer = None
+        if self.mapping is not None:
+            self.mapping.close()
+            self.file.close()
+            self.mapping = None
+            self.file = None
+        self.line_starts = array('q', [0])
+        self.indexed_bytes = 0
+        self.selection = None
+        self.search_offset = 0
+        self.pending_offset = None
+        self.pending_growth = False
+        self.text_width = 0
+        self.verticalScrollBar().setValue(0)
+        self.horizontalScrollBar().setValue(0)
+
+    def addLines(self, offsets, end):
+        if self.sender() is not self.indexer:
+            return
+        self.line_starts.extend(offsets)
+        self.indexed_bytes = end
+        self.updateScrollBars()
+        if self.pending_offset is not None and self.pending_offset < end:
+            offset, self.pending_offset = self.pending_offset, None
+            self.scrollToLine(self.lineAt(offset))
+        # к концу прокручивает только дописанное, а не первая индексация
+        if self.follow and self.indexer.start_offset:
+            self.verticalScrollBar().setValue(self.verticalScrollBar().maximum())
+        self.viewport().update()
+        self.indexChanged.emit()
+
+    def byteSize(self):
+        return len(self.mapping) if self.mapping is not None else 0
+
+    def isIndexed(self):
+        return self.indexed_bytes >= self.byteSize()
+
+    def lineCount(self):
+        return len(self.line_starts)
+
+    def lineAt(self, offset):
+        return bisect.bisect_right(self.line_starts, offset) - 1
+
+    def lineEnd(self, number):
+        if number + 1 < len(self.line_starts):
+            return self.line_starts[number + 1] - 1
+        if self.isIndexed():
+            return self.byteSize()
+        # строка ещё не проиндексирована до конца
+        start = self.line_starts[number]
+        end = self.mapping.find(b'\n', start, start + MAX_LINE_BYTES)
+        return end if end != -1 else min(self.byteSize(), start + MAX_LINE_BYTES)
+
+    def decode(self, start, end):
+        data = self.mapping[start:min(end, start + MAX_LINE_BYTES)]
+        return data.rstrip(b'\r').decode(self.encoding, 'replace')
+
+    def lineText(self, number):
+        return self.decode(self.line_starts[number], self.lineEnd(number))
+
+    def visibleLines(self):
+        return max(1, self.viewport().height() // self.fontMetrics().height())
+
+    def updateScrollBars(self):
+        visible = self.visibleLines()
+        self.verticalScrollBar().setPageStep(visible)
+        self.verticalScrollBar().setRange(0, max(0, self.lineCount() - visible))
+        self.horizontalScrollBar().setPageStep(self.viewport().width())
+        self.horizontalScrollBar().setRange(
+            0, max(0, self.text_width - self.viewport().width()))
+
+    def scrollToLine(self, number):
+        self.verticalScrollBar().setValue(number - self.visibleLines() // 2)
+
+    def goToLine(self, number):
+        number = max(0, min(number, self.lineCount() - 1))
+        self.selection = None
+        self.search_offset = self.line_starts[number]
+        self.scrollToLine(number)
+        self.viewport().update()
+
+    def currentLine(self):
+        return self.verticalScrollBar().value()
+
+    def find(self, pattern, backward=False, wrap=True):
+        # поиск по всему файлу идёт в фоне, результат приходит в searchFinished
+        self.cancelSearch()
+        if self.mapping is None:
+            return False
+        origin = self.search_offset
+        if backward and self.selection:
+            origin = self.selection[0]
+        self.searcher = ViewerSearch(self.mapping, self.encoding, pattern,
+                                     origin, backward, wrap, self)
+        self.searcher.progress.connect(self.searchProgress)
+        self.searcher.finished.connect(self.onSearchFinished)
+        self.searcher.start()
+        return True
+
+    def isSearching(self):
+        return self.searcher is not None
+
+    def cancelSearch(self):
+        if self.searcher is None:
+            return
+        searcher, self.searcher = self.searcher, None
+        searcher.cancel()
+        searcher.wait()
+        if self.pending_growth:
+            self.extendFile()
+
+    def onSearchFinished(self):
+        if self.sender() is not self.searcher:
+            return
+        searcher, self.searcher = self.searcher, None
+        if searcher.span is not None:
+            self.showMatch(*searcher.span)
+        if self.pending_growth:
+            self.extendFile()
+        self.searchFinished.emit(searcher.span is not None)
+
+    def showMatch(self, start, end):
+        self.selection = (start, end)
+        self.search_offset = end
+        self.showOffset(start)
+
+    def showOffset(self, offset):
+        if offset < self.indexed_bytes:
+            self.scrollToLine(self.lineAt(offset))
+        else:
+            # смещение дальше проиндексированной части, прокрутим позже
+            self.pending_offset = offset
+        self.viewport().update()
+
+    def centerOffset(self):
+        number = min(self.currentLine() + self.visibleLines() // 2, self.lineCount() - 1)
+        return self.line_starts[number]
+
+    def resizeEvent(self, event):
+        super(MappedViewer, self).resizeEvent(event)
+        self.updateScrollBars()
+
+    def scrollContentsBy(self, dx, dy):
+        self.viewport().update()
+
+    def keyPressEvent(self, event):
+        if event.matches(QtGui.QKeySequence.MoveToStartOfDocument):
+            self.verticalScrollBar().setValue(0)
+        elif event.matches(QtGui.QKeySequence.MoveToEndOfDocument):
+            self.verticalScrollBar().setValue(self.verticalScrollBar().maximum())
+        else:
+            super(MappedViewer, self).keyPressEvent(event)
+
+    def paintEvent(self, event):
+        painter = QtGui.QPainter(self.viewport())
+        painter.fillRect(event.rect(), self.palette().base())
+        if self.mapping is None:
+            return
+        metrics = self.fontMetrics()
+        height = metrics.height()
+        left = 4 - self.horizontalScrollBar().value()
+        first = self.verticalScrollBar().value()
+        width = self.text_width
+        # декодируются и рисуются только строки в области видимости
+        for row in range(self.visibleLines() + 1):
+            number = first + row
+            if number >= self.lineCount():
+                break
+            start = self.line_starts[number]
+            end = self.lineEnd(number)
+            text = self.decode(start, end).expandtabs(TAB_SIZE)
+            top = row * height
+            if self.selection and start <= self.selection[0] <= end:
+                prefix = self.decode(start, self.selection[0]).expandtabs(TAB_SIZE)
+                match = self.decode(self.selection[0], self.selection[1])
+                x = left + metrics.horizontalAdvance(prefix)
+                painter.fillRect(x, top, metrics.horizontalAdvance(match), height,
+                                 self.palette().highlight())
+            painter.drawText(left, top + metrics.ascent(), text)
+            width = max(width, metrics.horizontalAdvance(text) + 8)
+        if width != self.text_width:
+            self.text_width = width
+            self.updateScrollBars()
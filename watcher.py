@@ -0,0 +1,134 @@
+import codecs
+import os
+
+from PyQt5 import QtCore
+
+from textformat import decodeErrors
+
+
+POLL_INTERVAL = 1000
+CHECK_DELAY = 100
+TAIL_SIZE = 4096
+READ_SIZE = 1024 * 1024
+
+
+class WatchedFile(object):
+
+    def __init__(self, filename, encoding):
+        self.filename = filename
+        self.encoding = encoding
+        self.decoder = codecs.getincrementaldecoder(encoding)(errors=decodeErrors(encoding))
+        self.size = -1
+        self.mtime = None
+        # последние байты прочитанной части: по ним дописывание отличается
+        # от перезаписи файла той же или большей длины
+        self.tail = b''
+        self.after_cr = False
+
+
+def readBytes(filename, start, end):
+    with open(filename, 'rb') as file:
+        file.seek(start)
+        return file.read(end - start)
+
+
+class FileWatcher(QtCore.QObject):
+
+    appended = QtCore.pyqtSignal(str, str)
+    changed = QtCore.pyqtSignal(str)
+
+    def __init__(self, parent=None):
+        super(FileWatcher, self).__init__(parent)
+        self.files = {}
+        self.watcher = QtCore.QFileSystemWatcher(self)
+        self.watcher.fileChanged.connect(self.scheduleCheck)
+        # уведомления теряются на сетевых дисках и при замене файла,
+        # поэтому файлы ещё и опрашиваются
+        self.poll_timer = QtCore.QTimer(self)
+        self.poll_timer.setInterval(POLL_INTERVAL)
+        self.poll_timer.timeout.connect(self.check)
+        self.check_timer = QtCore.QTimer(self)
+        self.check_timer.setSingleShot(True)
+        self.check_timer.setInterval(CHECK_DELAY)
+        self.check_timer.timeout.connect(self.check)
+
+    def watch(self, filename, encoding='utf-8', size=None):
+        # size — сколько байт файла уже в документе
+        watched = WatchedFile(filename, encoding)
+        try:
+            stat = os.stat(filename)
+            watched.size = stat.st_size if size is None else min(size, stat.st_size)
+            watched.mtime = stat.st_mtime_ns if watched.size == stat.st_size else None
+            watched.tail = readBytes(filename, max(0, watched.size - TAIL_SIZE), watched.size)
+        except OSError:
+            watched.size = -1
+        # последний '\r' уже стал переводом строки, '\n' после него лишний
+        watched.after_cr = watched.tail.endswith(b'\r')
+        self.files[filename] = watched
+        if filename not in self.watcher.files():
+            self.watcher.addPath(filename)
+        self.poll_timer.start()
+        if watched.mtime is None:
+            self.scheduleCheck()
+
+    def unwatch(self, filename):
+        if self.files.pop(filename, None) is None:
+            return
+        if filename in self.watcher.files():
+            self.watcher.removePath(filename)
+        if not self.files:
+            self.poll_timer.stop()
+
+    def scheduleCheck(self, path=None):
+        # пачка уведомлений от одной записи проверяется один раз
+        if not self.check_timer.isActive():
+            self.check_timer.start()
+
+    def check(self):
+        for filename in list(self.files):
+            if filename in self.files:
+                self.checkFile(self.files[filename])
+
+    def checkFile(self, watched):
+        filename = watched.filename
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            if watched.size >= 0:
+                watched.size = -1
+                self.changed.emit(filename)
+            return
+        if filename not in self.watcher.files():
+            self.watcher.addPath(filename)
+        if stat.st_size == watched.size and stat.st_mtime_ns == watched.mtime:
+            return
+        try:
+            grown = (0 <= watched.size < stat.st_size and watched.tail == readBytes(
+                filename, max(0, watched.size - TAIL_SIZE), watched.size))
+            if grown:
+                self.readAppended(watched, stat)
+                return
+        except OSError:
+            return
+        self.watch(filename, watched.encoding)
+        self.changed.emit(filename)
+
+    def readAppended(self, watched, stat):
+        # за раз читается не больше READ_SIZE, остаток — следующей проверкой
+        end = min(stat.st_size, watched.size + READ_SIZE)
+        data = readBytes(watched.filename, watched.size, end)
+        watched.size += len(data)
+        watched.tail = (watched.tail + data)[-TAIL_SIZE:]
+        if watched.size == stat.st_size:
+            watched.mtime = stat.st_mtime_ns
+        else:
+            watched.mtime = None
+            QtCore.QTimer.singleShot(0, self.check)
+        text = watched.decoder.decode(data)
+        if watched.after_cr and text.startswith('\n'):
+            text = text[1:]
+        if text:
+            watched.after_cr = text.endswith('\r')
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+        if text:
+            self.appended.emit(watched.filename, text)